@@ -0,0 +1,17 @@
+
+import sys
+
+
+sys.path.append('/root/package')
+
+
+import langkit.gdb
+
+
+
+langkit.gdb.setup(
+    lib_name='liblktlang',
+    astnode_names=['LK_Node', 'Base_Lexer_Case_Rule_Alt', 'Lexer_Case_Rule_Cond_Alt', 'Lexer_Case_Rule_Default_Alt', 'Decl', 'Base_Grammar_Decl', 'Grammar_Decl', 'Base_Grammar_Rule_Decl', 'Grammar_Rule_Decl', 'Synthetic_Lexer_Decl', 'Base_Val_Decl', 'Node_Decl', 'Self_Decl', 'User_Val_Decl', 'Enum_Lit_Decl', 'Explicitly_Typed_Decl', 'Component_Decl', 'Field_Decl', 'Fun_Arg_Decl', 'Lambda_Arg_Decl', 'Match_Val_Decl', 'Val_Decl', 'Fun_Decl', 'Generic_Decl', 'Lexer_Decl', 'Lexer_Family_Decl', 'Type_Decl', 'Enum_Class_Alt_Decl', 'Function_Type', 'Generic_Formal_Type_Decl', 'Instantiated_Generic_Type', 'Named_Type_Decl', 'Basic_Class_Decl', 'Class_Decl', 'Enum_Class_Decl', 'Enum_Type_Decl', 'Struct_Decl', 'Trait_Decl', 'Decl_Annotation', 'Decl_Annotation_Params', 'Doc', 'Doc_Comment', 'Elsif_Branch', 'Enum_Class_Case', 'Excludes_Null', 'Excludes_Null_Absent', 'Excludes_Null_Present', 'Expr', 'Array_Literal', 'Bin_Op', 'Block_Expr', 'Call_Expr', 'Null_Cond_Call_Expr', 'Cast_Expr', 'Dot_Expr', 'Null_Cond_Dotted_Name', 'Error_On_Null', 'Generic_Instantiation', 'Grammar_Expr', 'Grammar_Cut', 'Grammar_Discard', 'Grammar_Dont_Skip', 'Grammar_List', 'Grammar_Null', 'Grammar_Opt', 'Grammar_Opt_Group', 'Grammar_Or_Expr', 'Grammar_Pick', 'Grammar_Implicit_Pick', 'Grammar_Predicate', 'Grammar_Rule_Ref', 'Grammar_Skip', 'Parse_Node_Expr', 'Token_Lit', 'Token_No_Case_Lit', 'Token_Pattern_Lit', 'Token_Ref', 'Id', 'Def_Id', 'Ref_Id', 'Module_Ref_Id', 'If_Expr', 'Isa', 'Lambda_Expr', 'Lit', 'Char_Lit', 'Null_Lit', 'Num_Lit', 'String_Lit', 'Logic_Expr', 'Match_Expr', 'Not_Expr', 'Paren_Expr', 'Raise_Expr', 'Try_Expr', 'Full_Decl', 'Import', 'LK_Node_Base_List', 'Base_Lexer_Case_Rule_Alt_List', 'Decl_Annotation_List', 'Doc_Comment_List', 'Elsif_Branch_List', 'Enum_Class_Alt_Decl_List', 'Enum_Class_Case_List', 'Enum_Lit_Decl_List', 'Expr_List', 'Full_Decl_List', 'Decl_Block', 'Fun_Arg_Decl_List', 'Grammar_Expr_List', 'Grammar_Expr_List_List', 'Import_List', 'LK_Node_List', 'Lambda_Arg_Decl_List', 'Match_Branch_List', 'Param_List', 'Ref_Id_List', 'Type_Ref_List', 'Langkit_Root', 'Lexer_Case_Rule', 'Lexer_Case_Rule_Send', 'List_Kind', 'List_Kind_One', 'List_Kind_Zero', 'Match_Branch', 'Op', 'Op_Amp', 'Op_And', 'Op_Div', 'Op_Eq', 'Op_Gt', 'Op_Gte', 'Op_Lt', 'Op_Lte', 'Op_Minus', 'Op_Mult', 'Op_Or', 'Op_Plus', 'Param', 'Type_Ref', 'Function_Type_Ref', 'Generic_Type_Ref', 'Simple_Type_Ref', 'Var_Bind'],
+    astnode_kinds={1: 'Lexer_Case_Rule_Cond_Alt', 2: 'Lexer_Case_Rule_Default_Alt', 3: 'Grammar_Decl', 4: 'Grammar_Rule_Decl', 5: 'Synthetic_Lexer_Decl', 6: 'Node_Decl', 7: 'Self_Decl', 8: 'Enum_Lit_Decl', 9: 'Field_Decl', 10: 'Fun_Arg_Decl', 11: 'Lambda_Arg_Decl', 12: 'Match_Val_Decl', 13: 'Val_Decl', 14: 'Fun_Decl', 15: 'Generic_Decl', 16: 'Lexer_Decl', 17: 'Lexer_Family_Decl', 18: 'Enum_Class_Alt_Decl', 19: 'Function_Type', 20: 'Generic_Formal_Type_Decl', 21: 'Instantiated_Generic_Type', 22: 'Class_Decl', 23: 'Enum_Class_Decl', 24: 'Enum_Type_Decl', 25: 'Struct_Decl', 26: 'Trait_Decl', 27: 'Decl_Annotation', 28: 'Decl_Annotation_Params', 29: 'Doc', 30: 'Doc_Comment', 31: 'Elsif_Branch', 32: 'Enum_Class_Case', 33: 'Excludes_Null_Absent', 34: 'Excludes_Null_Present', 35: 'Array_Literal', 36: 'Bin_Op', 37: 'Block_Expr', 38: 'Call_Expr', 39: 'Null_Cond_Call_Expr', 40: 'Cast_Expr', 41: 'Dot_Expr', 42: 'Null_Cond_Dotted_Name', 43: 'Error_On_Null', 44: 'Generic_Instantiation', 45: 'Grammar_Cut', 46: 'Grammar_Discard', 47: 'Grammar_Dont_Skip', 48: 'Grammar_List', 49: 'Grammar_Null', 50: 'Grammar_Opt', 51: 'Grammar_Opt_Group', 52: 'Grammar_Or_Expr', 53: 'Grammar_Pick', 54: 'Grammar_Implicit_Pick', 55: 'Grammar_Predicate', 56: 'Grammar_Rule_Ref', 57: 'Grammar_Skip', 58: 'Parse_Node_Expr', 59: 'Token_Lit', 60: 'Token_No_Case_Lit', 61: 'Token_Pattern_Lit', 62: 'Token_Ref', 63: 'Id', 64: 'Def_Id', 65: 'Ref_Id', 66: 'Module_Ref_Id', 67: 'If_Expr', 68: 'Isa', 69: 'Lambda_Expr', 70: 'Char_Lit', 71: 'Null_Lit', 72: 'Num_Lit', 73: 'String_Lit', 74: 'Logic_Expr', 75: 'Match_Expr', 76: 'Not_Expr', 77: 'Paren_Expr', 78: 'Raise_Expr', 79: 'Try_Expr', 80: 'Full_Decl', 81: 'Import', 82: 'Base_Lexer_Case_Rule_Alt_List', 83: 'Decl_Annotation_List', 84: 'Doc_Comment_List', 85: 'Elsif_Branch_List', 86: 'Enum_Class_Alt_Decl_List', 87: 'Enum_Class_Case_List', 88: 'Enum_Lit_Decl_List', 89: 'Expr_List', 90: 'Full_Decl_List', 91: 'Decl_Block', 92: 'Fun_Arg_Decl_List', 93: 'Grammar_Expr_List', 94: 'Grammar_Expr_List_List', 95: 'Import_List', 96: 'LK_Node_List', 97: 'Lambda_Arg_Decl_List', 98: 'Match_Branch_List', 99: 'Param_List', 100: 'Ref_Id_List', 101: 'Type_Ref_List', 102: 'Langkit_Root', 103: 'Lexer_Case_Rule', 104: 'Lexer_Case_Rule_Send', 105: 'List_Kind_One', 106: 'List_Kind_Zero', 107: 'Match_Branch', 108: 'Op_Amp', 109: 'Op_And', 110: 'Op_Div', 111: 'Op_Eq', 112: 'Op_Gt', 113: 'Op_Gte', 114: 'Op_Lt', 115: 'Op_Lte', 116: 'Op_Minus', 117: 'Op_Mult', 118: 'Op_Or', 119: 'Op_Plus', 120: 'Param', 121: 'Function_Type_Ref', 122: 'Generic_Type_Ref', 123: 'Simple_Type_Ref', 124: 'Var_Bind'},
+    prefix='lkt'
+)
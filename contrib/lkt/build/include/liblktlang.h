@@ -0,0 +1,4954 @@
+
+
+
+
+
+
+
+
+#ifndef LIBLKTLANG
+#define LIBLKTLANG
+
+#include <stdint.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* This type represents a context for all source analysis. This is the first
+   type you need to create to use liblktlang. It will contain the results of
+   all analysis, and is the main holder for all the data.
+
+   You can create several analysis contexts if you need to, which enables you,
+   for example to:
+
+   * analyze several different projects at the same time;
+
+   * analyze different parts of the same projects in parallel.
+
+   In the current design, contexts always keep all of their analysis units
+   allocated. If you need to get this memory released, the only option at your
+   disposal is to destroy your analysis context instance.
+
+   This structure is partially opaque: some fields are exposed to allow direct
+   access, for performance concerns.  */
+typedef struct
+{
+   uint64_t serial_number;
+} *lkt_analysis_context;
+
+/* This type represents the analysis of a single file.
+
+   This type has strong-reference semantics and is ref-counted. Furthermore, a
+   reference to a unit contains an implicit reference to the context that owns
+   it. This means that keeping a reference to a unit will keep the context and
+   all the unit it contains allocated.
+
+   This structure is partially opaque: some fields are exposed to allow direct
+   access, for performance concerns.  */
+typedef struct
+{
+   uint64_t version_number;
+} *lkt_analysis_unit;
+
+/* Data type for all nodes. Nodes are assembled to make up a tree.  See the
+   node primitives below to inspect such trees.
+
+   Unlike for contexts and units, this type has weak-reference semantics:
+   keeping a reference to a node has no effect on the decision to keep the unit
+   that it owns allocated. This means that once all references to the context
+   and units related to a node are dropped, the context and its units are
+   deallocated and the node becomes a stale reference: most operations on it
+   will raise a ``Stale_Reference_Error``.
+
+   Note that since reparsing an analysis unit deallocates all the nodes it
+   contains, this operation makes all reference to these nodes stale as
+   well.   */
+typedef void* lkt_base_node;
+
+/* Kind of AST nodes in parse trees.  */
+typedef enum {
+    
+
+        /* lk_node (abstract)  */
+        /* Root node class for lkt AST nodes.  */
+    
+
+        /* base_lexer_case_rule_alt (abstract)  */
+        /* Base class for the different kind of alternatives allowed in a case
+           rule.  */
+    
+
+        /* Alternative of a case rule which sends the token only if the kind of
+           the previous token is among a given set.  */
+        lkt_lexer_case_rule_cond_alt = 1,
+    
+
+        /* Default alternative of a case rule which sends the token if all the
+           previous alternatives failed.  */
+        lkt_lexer_case_rule_default_alt = 2,
+    
+
+        /* decl (abstract)  */
+        /* Base class for declarations. Encompasses regular declarations as
+           well as special declarations such as grammars, grammar rules,
+           etc.   */
+    
+
+        /* base_grammar_decl (abstract)  */
+        /* Base class for all declarations related to grammars.  */
+    
+
+        /* Declaration of a language's grammar.  */
+        lkt_grammar_decl = 3,
+    
+
+        /* base_grammar_rule_decl (abstract)  */
+        /* Base class for grammar rules inside of grammars/lexers.  */
+    
+
+        /* Declaration of a grammar rule inside of a grammar.  */
+        lkt_grammar_rule_decl = 4,
+    
+
+        
+        lkt_synthetic_lexer_decl = 5,
+    
+
+        /* base_val_decl (abstract)  */
+        /* Abstract class for named values declarations, such as arguments,
+           local value bindings, fields, etc.  */
+    
+
+        /* Synthetic declaration for the implicit "node" variable available in
+           properties.  */
+        lkt_node_decl = 6,
+    
+
+        /* Synthetic declaration for the implicit "self" variable available in
+           properties.  */
+        lkt_self_decl = 7,
+    
+
+        /* user_val_decl (abstract)  */
+        /* Class for user declared val declarations (not synthetic).  */
+    
+
+        /* Enum literal declaration.  */
+        lkt_enum_lit_decl = 8,
+    
+
+        /* explicitly_typed_decl (abstract)  */
+        /* Subset of user declared value declarations for values that have a
+           type that can be syntactically annotated by the user.  */
+    
+
+        /* component_decl (abstract)  */
+        /* Subset of explicitly typed declarations for value declarations that:
+        
+           1. Have an optional default value. 2. Are part of a bigger
+           declaration that can be referred to via a call expression (either a
+           type or a function).  */
+    
+
+        /* Field declaration.  */
+        lkt_field_decl = 9,
+    
+
+        /* Function argument declaration.  */
+        lkt_fun_arg_decl = 10,
+    
+
+        /* Function argument declaration.  */
+        lkt_lambda_arg_decl = 11,
+    
+
+        /* Value declaration in a match branch.  */
+        lkt_match_val_decl = 12,
+    
+
+        /* Value declaration.  */
+        lkt_val_decl = 13,
+    
+
+        /* Function declaration.  */
+        lkt_fun_decl = 14,
+    
+
+        /* Generic entity declaration.  */
+        lkt_generic_decl = 15,
+    
+
+        /* Declaration of a language's lexer.  */
+        lkt_lexer_decl = 16,
+    
+
+        /* Declaration of a token family.  */
+        lkt_lexer_family_decl = 17,
+    
+
+        /* type_decl (abstract)  */
+        /* Abstract base class for type declarations.  */
+    
+
+        /* Alternative for an enum class decl.  */
+        lkt_enum_class_alt_decl = 18,
+    
+
+        /* Function type.  */
+        lkt_function_type = 19,
+    
+
+        /* Declaration of a generic formal type in a generic declaration.  */
+        lkt_generic_formal_type_decl = 20,
+    
+
+        /* Instantiated generic type.  */
+        lkt_instantiated_generic_type = 21,
+    
+
+        /* named_type_decl (abstract)  */
+        /* Explicit named type declaration.  */
+    
+
+        /* basic_class_decl (abstract)  */
+        /* Common ancestor for declarations of regular classes and enum
+           classes.  */
+    
+
+        /* Declaration for a LK class. This only cover node classes for the
+           moment, but might be extended to support regular classes in the
+           future.  */
+        lkt_class_decl = 22,
+    
+
+        /* Declaration for a LK class. This only cover node classes for the
+           moment, but might be extended to support regular classes in the
+           future.  */
+        lkt_enum_class_decl = 23,
+    
+
+        /* Enum type declaration.  */
+        lkt_enum_type_decl = 24,
+    
+
+        /* Declaration for a LK struct.  */
+        lkt_struct_decl = 25,
+    
+
+        /* Trait declaration. For the moment, a Trait can just be used to group
+           behavior for built-in types. It's not usable as a type-bound since
+           we don't have generics, and you cannot implement one either.
+        
+           The reason they're added is to lay down the basics of what we want
+           the LKT type system to be.
+        
+           TODO: Traits are *not* types. They're treated as such in the grammar
+           for convenience for now, but it's probably not a good idea. Migrate
+           away from this.  */
+        lkt_trait_decl = 26,
+    
+
+        /* Compile time annotation attached to a declaration.  */
+        lkt_decl_annotation = 27,
+    
+
+        /* List of arguments for an annotation with a call syntax. This
+           intermediate node is necessary in order to determine after parsing
+           whether there is no param list, or if the list is empty.  */
+        lkt_decl_annotation_params = 28,
+    
+
+        /* Documentation attached to a decl node.  */
+        lkt_doc = 29,
+    
+
+        /* Node for one line of documentation attached to a node.  */
+        lkt_doc_comment = 30,
+    
+
+        /* Elsif branch of an if expression.  */
+        lkt_elsif_branch = 31,
+    
+
+        /* Case branch for an enum class declaration.  */
+        lkt_enum_class_case = 32,
+    
+
+        /* excludes_null (abstract)  */
+        /* Whether the containing cast expression will raise on null cast
+           result or not.  */
+    
+
+        
+        lkt_excludes_null_absent = 33,
+    
+
+        
+        lkt_excludes_null_present = 34,
+    
+
+        /* expr (abstract)  */
+        /* Base class for expressions. Encompasses regular expressions as well
+           as special expressions (grammar expressions, etc).  */
+    
+
+        /* Literal for an array value.  */
+        lkt_array_literal = 35,
+    
+
+        /* Binary operator expression.  */
+        lkt_bin_op = 36,
+    
+
+        /* Block expression.  */
+        lkt_block_expr = 37,
+    
+
+        /* Call expression.  */
+        lkt_call_expr = 38,
+    
+
+        /* Null conditional call expression.  */
+        lkt_null_cond_call_expr = 39,
+    
+
+        /* Cast expression.  */
+        lkt_cast_expr = 40,
+    
+
+        /* Dotted expression.  */
+        lkt_dot_expr = 41,
+    
+
+        /* Null conditional dotted expression.  */
+        lkt_null_cond_dotted_name = 42,
+    
+
+        /* Expression that throws an error if LHS is null.  */
+        lkt_error_on_null = 43,
+    
+
+        /* Generic instantiation.  */
+        lkt_generic_instantiation = 44,
+    
+
+        /* grammar_expr (abstract)  */
+        /* Base class for expressions related to grammars.  */
+    
+
+        /* Grammar expression for a cut.  */
+        lkt_grammar_cut = 45,
+    
+
+        /* Grammar expression to discard the match.  */
+        lkt_grammar_discard = 46,
+    
+
+        /* Grammar expression (error recovery) to ensure that any nested skip
+           parser calls won't skip certain parse results.  */
+        lkt_grammar_dont_skip = 47,
+    
+
+        /* Grammar expression to parse lists of results. Results can be
+           separated by a separator. List can be empty ('*') or not ('+').  */
+        lkt_grammar_list = 48,
+    
+
+        /* Grammar expression to parse a null node.  */
+        lkt_grammar_null = 49,
+    
+
+        /* Grammar expression for an optional parsing result.  */
+        lkt_grammar_opt = 50,
+    
+
+        /* Grammar expression for a group of optional parsing results.  */
+        lkt_grammar_opt_group = 51,
+    
+
+        /* Grammar `Or` expression (disjunctive choice between several grammar
+           options).  */
+        lkt_grammar_or_expr = 52,
+    
+
+        /* Grammar expression to pick the significant parse out of a list of
+           parses (will automatically discard token results).  */
+        lkt_grammar_pick = 53,
+    
+
+        /* Implicit pick operation.  */
+        lkt_grammar_implicit_pick = 54,
+    
+
+        /* Grammar expression for a predicate: Only parse something if the
+           predicate (that is a reference to a node property) returns True.  */
+        lkt_grammar_predicate = 55,
+    
+
+        /* Grammar expression for a reference to another grammar rule.  */
+        lkt_grammar_rule_ref = 56,
+    
+
+        /* Grammar expression (error recovery) to skip a parsing result.  */
+        lkt_grammar_skip = 57,
+    
+
+        /* Expression for the parsing of a Node.  */
+        lkt_parse_node_expr = 58,
+    
+
+        /* Grammar expression for a token literal.  */
+        lkt_token_lit = 59,
+    
+
+        /* Grammar expression for a case insensitive token literal.  */
+        lkt_token_no_case_lit = 60,
+    
+
+        /* Grammar expression for a pattern literal.  */
+        lkt_token_pattern_lit = 61,
+    
+
+        /* Grammar expression for a token reference.  */
+        lkt_token_ref = 62,
+    
+
+        /* Identifier.  */
+        lkt_id = 63,
+    
+
+        /* Defining identifier.  */
+        lkt_def_id = 64,
+    
+
+        /* Reference identifier.  */
+        lkt_ref_id = 65,
+    
+
+        /* Id referencing a langkit module.  */
+        lkt_module_ref_id = 66,
+    
+
+        /* If expression.  */
+        lkt_if_expr = 67,
+    
+
+        /* Isa expression.  */
+        lkt_isa = 68,
+    
+
+        /* Lambda expression.  */
+        lkt_lambda_expr = 69,
+    
+
+        /* lit (abstract)  */
+        /* Base class for literals.  */
+    
+
+        /* Character literal expression.  */
+        lkt_char_lit = 70,
+    
+
+        /* Null literal expression.  */
+        lkt_null_lit = 71,
+    
+
+        /* Number literal expression.  */
+        lkt_num_lit = 72,
+    
+
+        /* String literal expression.
+        
+           Note that in order to reduce the size of the node type hierarchy, we
+           define only one node (StringLit) for all our string literals (only
+           regular strings and pattern string literals at the moment). This
+           will also make it easy to add new string prefixes in the future.  */
+        lkt_string_lit = 73,
+    
+
+        /* Class for logic expressions (any ``basic_expr`` starting with
+           %).   */
+        lkt_logic_expr = 74,
+    
+
+        /* Binary operator expression.  */
+        lkt_match_expr = 75,
+    
+
+        /* Boolean negation expression.  */
+        lkt_not_expr = 76,
+    
+
+        /* Parenthesized expression.  */
+        lkt_paren_expr = 77,
+    
+
+        /* Raise expression.  */
+        lkt_raise_expr = 78,
+    
+
+        /* Try expression.  */
+        lkt_try_expr = 79,
+    
+
+        /* Container for an lkt declaration. Contains the decl node plus the
+           documentation and annotations.  */
+        lkt_full_decl = 80,
+    
+
+        /* Statement to import another source file.  */
+        lkt_import = 81,
+    
+
+        /* lk_node_base_list (abstract)  */
+        
+    
+
+        /* List of BaseLexerCaseRuleAlt.  */
+        lkt_base_lexer_case_rule_alt_list = 82,
+    
+
+        /* List of DeclAnnotation.  */
+        lkt_decl_annotation_list = 83,
+    
+
+        /* List of DocComment.  */
+        lkt_doc_comment_list = 84,
+    
+
+        /* List of ElsifBranch.  */
+        lkt_elsif_branch_list = 85,
+    
+
+        /* List of EnumClassAltDecl.  */
+        lkt_enum_class_alt_decl_list = 86,
+    
+
+        /* List of EnumClassCase.  */
+        lkt_enum_class_case_list = 87,
+    
+
+        /* List of EnumLitDecl.  */
+        lkt_enum_lit_decl_list = 88,
+    
+
+        /* List of Expr.
+        
+           This list node can contain one of the following nodes:
+        
+           * lkt_array_literal
+        
+           * lkt_bin_op
+        
+           * lkt_block_expr
+        
+           * lkt_call_expr
+        
+           * lkt_cast_expr
+        
+           * lkt_dot_expr
+        
+           * lkt_error_on_null
+        
+           * lkt_generic_instantiation
+        
+           * lkt_if_expr
+        
+           * lkt_isa
+        
+           * lkt_lambda_expr
+        
+           * lkt_lit
+        
+           * lkt_logic_expr
+        
+           * lkt_match_expr
+        
+           * lkt_not_expr
+        
+           * lkt_paren_expr
+        
+           * lkt_raise_expr
+        
+           * lkt_ref_id
+        
+           * lkt_try_expr  */
+        lkt_expr_list = 89,
+    
+
+        /* List of FullDecl.  */
+        lkt_full_decl_list = 90,
+    
+
+        /* List of declarations that also introduces a containing lexical
+           scope.  */
+        lkt_decl_block = 91,
+    
+
+        /* List of FunArgDecl.  */
+        lkt_fun_arg_decl_list = 92,
+    
+
+        /* List of GrammarExpr.  */
+        lkt_grammar_expr_list = 93,
+    
+
+        /* List of GrammarExpr.list.  */
+        lkt_grammar_expr_list_list = 94,
+    
+
+        /* List of Import.  */
+        lkt_import_list = 95,
+    
+
+        /* List of LKNode.
+        
+           This list node can contain one of the following nodes:
+        
+           * lkt_full_decl
+        
+           * lkt_lexer_case_rule
+        
+           * lkt_val_decl
+        
+           * lkt_var_bind  */
+        lkt_lk_node_list = 96,
+    
+
+        /* List of LambdaArgDecl.  */
+        lkt_lambda_arg_decl_list = 97,
+    
+
+        /* List of MatchBranch.  */
+        lkt_match_branch_list = 98,
+    
+
+        /* List of Param.  */
+        lkt_param_list = 99,
+    
+
+        /* List of RefId.  */
+        lkt_ref_id_list = 100,
+    
+
+        /* List of TypeRef.  */
+        lkt_type_ref_list = 101,
+    
+
+        /* For the moment, root node of a lkt compilation unit.  */
+        lkt_langkit_root = 102,
+    
+
+        /* Lexer construct to introduce a conditional lexing action.  */
+        lkt_lexer_case_rule = 103,
+    
+
+        /* Lexer construction used by case alternatives to represent the token
+           to send if that alternative was chosen.  */
+        lkt_lexer_case_rule_send = 104,
+    
+
+        /* list_kind (abstract)  */
+        /* Kind for list parser expressions.  */
+    
+
+        
+        lkt_list_kind_one = 105,
+    
+
+        
+        lkt_list_kind_zero = 106,
+    
+
+        /* Branch inside a match expression.  */
+        lkt_match_branch = 107,
+    
+
+        /* op (abstract)  */
+        /* Operator in a binary operator expression.  */
+    
+
+        
+        lkt_op_amp = 108,
+    
+
+        
+        lkt_op_and = 109,
+    
+
+        
+        lkt_op_div = 110,
+    
+
+        
+        lkt_op_eq = 111,
+    
+
+        
+        lkt_op_gt = 112,
+    
+
+        
+        lkt_op_gte = 113,
+    
+
+        
+        lkt_op_lt = 114,
+    
+
+        
+        lkt_op_lte = 115,
+    
+
+        
+        lkt_op_minus = 116,
+    
+
+        
+        lkt_op_mult = 117,
+    
+
+        
+        lkt_op_or = 118,
+    
+
+        
+        lkt_op_plus = 119,
+    
+
+        /* Parameter for function calls or for annotations.  */
+        lkt_param = 120,
+    
+
+        /* type_ref (abstract)  */
+        /* Base class for a reference to a type.  */
+    
+
+        /* Reference to a function type.  */
+        lkt_function_type_ref = 121,
+    
+
+        /* Reference to a generic type.  */
+        lkt_generic_type_ref = 122,
+    
+
+        /* Simple reference to a type.  */
+        lkt_simple_type_ref = 123,
+    
+
+        /* Dynamic var bind expression.  */
+        lkt_var_bind = 124,
+} lkt_node_kind_enum;
+
+/* Reference to a symbol. Symbols are owned by analysis contexts, so they must
+   not outlive them. This type exists only in the C API, and roughly wraps the
+   corresponding Ada type (an array fat pointer).  */
+typedef struct {
+   void *data;
+   void *bounds;
+} lkt_symbol_type;
+
+/* Data type for env rebindings. For internal use only.  */
+typedef void *lkt_env_rebindings_type;
+
+typedef uint8_t lkt_bool;
+
+/* Helper data structures for source location handling.  */
+
+/* Location in a source file. Line and column numbers are one-based.  */
+typedef struct {
+    uint32_t line;
+    uint16_t column;
+} lkt_source_location;
+
+/* Location of a span of text in a source file.  */
+typedef struct {
+    lkt_source_location start;
+    lkt_source_location end;
+} lkt_source_location_range;
+
+
+/* String encoded in UTF-32 (native endianness).  */
+typedef struct {
+   /* Address for the content of the string.  */
+    uint32_t *chars;
+   /* Size of the string (in characters).  */
+    size_t length;
+
+    int is_allocated;
+} lkt_text;
+
+/* Arbitrarily large integer.  */
+typedef void *lkt_big_integer;
+
+/* Kind for this token.  */
+typedef enum {
+   
+      
+      LKT_TERMINATION = 0
+      ,
+      LKT_LEXING_FAILURE = 1
+      ,
+      LKT_IDENTIFIER = 2
+      ,
+      LKT_EXCL_MARK = 3
+      ,
+      LKT_COLON = 4
+      ,
+      LKT_SEMICOLON = 5
+      ,
+      LKT_INT_MARK = 6
+      ,
+      LKT_DIV = 7
+      ,
+      LKT_COMMA = 8
+      ,
+      LKT_TIMES = 9
+      ,
+      LKT_PLUS = 10
+      ,
+      LKT_AMP = 11
+      ,
+      LKT_MINUS = 12
+      ,
+      LKT_PIPE = 13
+      ,
+      LKT_LEFT_ARROW = 14
+      ,
+      LKT_RIGHT_ARROW = 15
+      ,
+      LKT_FAT_RIGHT_ARROW = 16
+      ,
+      LKT_DOT = 17
+      ,
+      LKT_COMB = 18
+      ,
+      LKT_AT = 19
+      ,
+      LKT_L_PAR = 20
+      ,
+      LKT_R_PAR = 21
+      ,
+      LKT_L_BRACE = 22
+      ,
+      LKT_R_BRACE = 23
+      ,
+      LKT_L_BRACK = 24
+      ,
+      LKT_R_BRACK = 25
+      ,
+      LKT_EQUAL = 26
+      ,
+      LKT_GTE = 27
+      ,
+      LKT_LTE = 28
+      ,
+      LKT_GT = 29
+      ,
+      LKT_LT = 30
+      ,
+      LKT_PERCENT = 31
+      ,
+      LKT_LEXER_KW = 32
+      ,
+      LKT_GRAMMAR_KW = 33
+      ,
+      LKT_NOT_KW = 35
+      ,
+      LKT_CLASS_KW = 36
+      ,
+      LKT_STRUCT_KW = 37
+      ,
+      LKT_FUN_KW = 38
+      ,
+      LKT_PUBLIC_KW = 39
+      ,
+      LKT_PRIVATE_KW = 40
+      ,
+      LKT_NULL_KW = 41
+      ,
+      LKT_IS_KW = 42
+      ,
+      LKT_VAL_KW = 43
+      ,
+      LKT_IF_KW = 44
+      ,
+      LKT_THEN_KW = 45
+      ,
+      LKT_ELIF_KW = 46
+      ,
+      LKT_ELSE_KW = 47
+      ,
+      LKT_AND_KW = 48
+      ,
+      LKT_OR_KW = 49
+      ,
+      LKT_BIND_KW = 50
+      ,
+      LKT_MATCH_KW = 51
+      ,
+      LKT_CASE_KW = 52
+      ,
+      LKT_RAISE_KW = 53
+      ,
+      LKT_TRY_KW = 54
+      ,
+      LKT_ENUM_KW = 55
+      ,
+      LKT_GENERIC_KW = 56
+      ,
+      LKT_DISCARD_KW = 57
+      ,
+      LKT_IMPORT_KW = 58
+      ,
+      LKT_IMPLEMENTS_KW = 59
+      ,
+      LKT_TRAIT_KW = 60
+      ,
+      LKT_COMMENT = 61
+      ,
+      LKT_STRING = 62
+      ,
+      LKT_P_STRING = 63
+      ,
+      LKT_CHAR = 64
+      ,
+      LKT_DOC_COMMENT = 65
+      ,
+      LKT_NUMBER = 66
+} lkt_token_kind;
+
+/* Reference to a token in an analysis unit.  */
+typedef struct {
+    /* Private data associated to this token or NULL if this designates no
+       token.  */
+    void *token_data;
+
+    /* Internal identifiers for this token.  */
+    int token_index, trivia_index;
+
+    lkt_token_kind kind;
+    lkt_text text;
+    lkt_source_location_range sloc_range;
+} lkt_token;
+
+
+/* Flat representation of a tree of nodes, as computed by
+   ``lkt_node_export_tree``.
+
+   Nodes are stored in prefix depth-first order, so the root node comes first,
+   and the children of each node come right after it. Null children are
+   skipped. Node data is stored in columns: for each field of this structure
+   (except ``count``), the Nth item in the pointed array contains the
+   corresponding data for the Nth node.
+
+   All columns are allocated as a single memory block that starts at ``nodes``
+   and ends at the end of ``end_columns``. Use ``lkt_destroy_node_tree`` to
+   free it.  */
+typedef struct {
+    /* Number of nodes in the tree.  */
+    int count;
+
+    /* Nodes themselves.  */
+    lkt_base_node *nodes;
+
+    /* Kind for each node.  */
+    int *kinds;
+
+    /* Index of the parent for each node (-1 for the root).  */
+    int *parents;
+
+    /* Number of non-null children for each node.  */
+    int *children_counts;
+
+    /* Indexes of the first/last token for each node (the last token index is
+       0 for ghost nodes).  */
+    int *token_starts, *token_ends;
+
+    /* Source location range for each node.  */
+    uint32_t *start_lines;
+    uint16_t *start_columns;
+    uint32_t *end_lines;
+    uint16_t *end_columns;
+} lkt_node_tree;
+
+/* Columnar representation of the stream of tokens and trivia in an analysis
+   unit, as computed by ``lkt_unit_export_tokens``.
+
+   Tokens and trivia are stored in the same order as in the source: the Nth
+   item in each column (i.e. each field of this structure, except ``count``)
+   contains the corresponding data for the Nth token or trivia. Offsets are
+   0-based indexes in the unit's source buffer: end offsets are exclusive.  */
+typedef struct {
+    /* Number of tokens and trivia in the table.  */
+    int count;
+
+    /* Kind for each token.  */
+    int *kinds;
+
+    /* Offsets for the first character of each token and for the character
+       that follows the last one.  */
+    int *start_offsets, *end_offsets;
+
+    /* Source location range for each token.  */
+    uint32_t *start_lines;
+    uint32_t *end_lines;
+    uint16_t *start_columns;
+    uint16_t *end_columns;
+
+    /* Whether each token is a trivia (1) or a regular token (0).  */
+    uint8_t *is_trivia;
+} lkt_token_table;
+
+/* Diagnostic for an analysis unit: cannot open the source file, parsing error,
+   ...  */
+typedef struct {
+    lkt_source_location_range sloc_range;
+    lkt_text message;
+} lkt_diagnostic;
+
+   typedef enum {
+      LKT_ANALYSIS_UNIT_KIND_UNIT_SPECIFICATION, LKT_ANALYSIS_UNIT_KIND_UNIT_BODY
+   } lkt_analysis_unit_kind;
+   /* Specify a kind of analysis unit. Specification units provide an interface
+      to the outer world while body units provide an implementation for the
+      corresponding interface.  */
+   typedef enum {
+      LKT_LOOKUP_KIND_RECURSIVE, LKT_LOOKUP_KIND_FLAT, LKT_LOOKUP_KIND_MINIMAL
+   } lkt_lookup_kind;
+   
+   typedef enum {
+      LKT_GRAMMAR_RULE_MAIN_RULE_RULE, LKT_GRAMMAR_RULE_ID_RULE, LKT_GRAMMAR_RULE_REF_ID_RULE, LKT_GRAMMAR_RULE_DEF_ID_RULE, LKT_GRAMMAR_RULE_IMPORT_STMT_RULE, LKT_GRAMMAR_RULE_IMPORTS_RULE, LKT_GRAMMAR_RULE_DOC_COMMENT_RULE, LKT_GRAMMAR_RULE_DOC_RULE, LKT_GRAMMAR_RULE_LEXER_DECL_RULE, LKT_GRAMMAR_RULE_GRAMMAR_DECL_RULE, LKT_GRAMMAR_RULE_GRAMMAR_RULE_RULE, LKT_GRAMMAR_RULE_LEXER_RULE_RULE, LKT_GRAMMAR_RULE_LEXER_FAMILY_DECL_RULE, LKT_GRAMMAR_RULE_LEXER_CASE_RULE_RULE, LKT_GRAMMAR_RULE_LEXER_CASE_ALT_RULE, LKT_GRAMMAR_RULE_LEXER_CASE_SEND_RULE, LKT_GRAMMAR_RULE_GRAMMAR_PRIMARY_RULE, LKT_GRAMMAR_RULE_GRAMMAR_EXPR_RULE, LKT_GRAMMAR_RULE_GRAMMAR_PICK_RULE, LKT_GRAMMAR_RULE_GRAMMAR_IMPLICIT_PICK_RULE, LKT_GRAMMAR_RULE_GRAMMAR_OPT_RULE, LKT_GRAMMAR_RULE_GRAMMAR_CUT_RULE, LKT_GRAMMAR_RULE_GRAMMAR_OR_EXPR_RULE, LKT_GRAMMAR_RULE_GRAMMAR_DISCARD_EXPR_RULE, LKT_GRAMMAR_RULE_TOKEN_LITERAL_RULE, LKT_GRAMMAR_RULE_TOKEN_NO_CASE_LITERAL_RULE, LKT_GRAMMAR_RULE_TOKEN_PATTERN_LITERAL_RULE, LKT_GRAMMAR_RULE_PARSE_NODE_EXPR_RULE, LKT_GRAMMAR_RULE_GRAMMAR_RULE_REF_RULE, LKT_GRAMMAR_RULE_GRAMMAR_LIST_EXPR_RULE, LKT_GRAMMAR_RULE_GRAMMAR_SKIP_RULE, LKT_GRAMMAR_RULE_GRAMMAR_NULL_RULE, LKT_GRAMMAR_RULE_GRAMMAR_TOKEN_RULE, LKT_GRAMMAR_RULE_TYPE_DECL_RULE, LKT_GRAMMAR_RULE_GENERIC_DECL_RULE, LKT_GRAMMAR_RULE_GENERIC_FORMAL_TYPE_RULE, LKT_GRAMMAR_RULE_ENUM_LIT_DECL_RULE, LKT_GRAMMAR_RULE_FUN_DECL_RULE, LKT_GRAMMAR_RULE_LAMBDA_ARG_DECL_RULE, LKT_GRAMMAR_RULE_FUN_ARG_DECL_RULE, LKT_GRAMMAR_RULE_FUN_ARG_LIST_RULE, LKT_GRAMMAR_RULE_LAMBDA_ARG_LIST_RULE, LKT_GRAMMAR_RULE_FIELD_DECL_RULE, LKT_GRAMMAR_RULE_BARE_DECL_RULE, LKT_GRAMMAR_RULE_DECL_RULE, LKT_GRAMMAR_RULE_TYPE_REF_RULE, LKT_GRAMMAR_RULE_TYPE_LIST_RULE, LKT_GRAMMAR_RULE_DECLS_RULE, LKT_GRAMMAR_RULE_DECL_BLOCK_RULE, LKT_GRAMMAR_RULE_VAL_DECL_RULE, LKT_GRAMMAR_RULE_VAR_BIND_RULE, LKT_GRAMMAR_RULE_BLOCK_RULE, LKT_GRAMMAR_RULE_EXPR_RULE, LKT_GRAMMAR_RULE_REL_RULE, LKT_GRAMMAR_RULE_EQ_RULE, LKT_GRAMMAR_RULE_ARITH_1_RULE, LKT_GRAMMAR_RULE_ARITH_2_RULE, LKT_GRAMMAR_RULE_ISA_OR_PRIMARY_RULE, LKT_GRAMMAR_RULE_PRIMARY_RULE, LKT_GRAMMAR_RULE_MATCH_EXPR_RULE, LKT_GRAMMAR_RULE_NUM_LIT_RULE, LKT_GRAMMAR_RULE_STRING_LIT_RULE, LKT_GRAMMAR_RULE_CHAR_LIT_RULE, LKT_GRAMMAR_RULE_IF_EXPR_RULE, LKT_GRAMMAR_RULE_RAISE_EXPR_RULE, LKT_GRAMMAR_RULE_TRY_EXPR_RULE, LKT_GRAMMAR_RULE_ARRAY_LITERAL_RULE, LKT_GRAMMAR_RULE_LOGIC_RULE, LKT_GRAMMAR_RULE_BASIC_EXPR_RULE, LKT_GRAMMAR_RULE_TERM_RULE, LKT_GRAMMAR_RULE_BASIC_NAME_RULE, LKT_GRAMMAR_RULE_LAMBDA_EXPR_RULE, LKT_GRAMMAR_RULE_NULL_LIT_RULE, LKT_GRAMMAR_RULE_PARAM_RULE, LKT_GRAMMAR_RULE_PARAMS_RULE, LKT_GRAMMAR_RULE_DECL_ANNOTATION_PARAMS_RULE, LKT_GRAMMAR_RULE_DECL_ANNOTATION_RULE
+   } lkt_grammar_rule;
+   /* Gramar rule to use for parsing.  */
+
+const lkt_grammar_rule lkt_default_grammar_rule = LKT_GRAMMAR_RULE_MAIN_RULE_RULE;
+
+/* Enumerated type describing all possible exceptions that need to be handled
+   in the C bindings.  */
+typedef enum {
+      EXCEPTION_INVALID_FIELD,
+      EXCEPTION_NODE_DATA_EVALUATION_ERROR,
+      EXCEPTION_INVALID_INPUT,
+      EXCEPTION_INVALID_SYMBOL_ERROR,
+      EXCEPTION_INVALID_UNIT_NAME_ERROR,
+      EXCEPTION_NATIVE_EXCEPTION,
+      EXCEPTION_PRECONDITION_FAILURE,
+      EXCEPTION_PROPERTY_ERROR,
+      EXCEPTION_TEMPLATE_ARGS_ERROR,
+      EXCEPTION_TEMPLATE_FORMAT_ERROR,
+      EXCEPTION_TEMPLATE_INSTANTIATION_ERROR,
+      EXCEPTION_STALE_REFERENCE_ERROR,
+      EXCEPTION_UNKNOWN_CHARSET,
+} lkt_exception_kind;
+
+/* Holder for native exceptions-related information.  Memory management for
+   this and all the fields is handled by the library: one just has to make sure
+   not to keep references to it.
+
+   .. todo:: For the moment, this structure contains already formatted
+      information, but depending on possible future Ada runtime improvements,
+      this might change.  */
+typedef struct {
+   /* The kind of this exception.  */
+   lkt_exception_kind kind;
+
+   /* Message and context information associated with this exception.  */
+   const char *information;
+} lkt_exception;
+
+/*
+ * Array types incomplete declarations
+ */
+
+
+
+typedef struct lkt_bare_lk_node_array_record *lkt_bare_lk_node_array;
+
+
+
+typedef struct lkt_lk_node_array_record *lkt_lk_node_array;
+
+
+        
+
+typedef struct lkt_text_type_record *lkt_text_type;
+
+        
+
+typedef struct lkt_semantic_result_array_record *lkt_semantic_result_array;
+
+
+/*
+ * Struct types declarations
+ */
+
+        
+
+
+
+typedef struct {
+} lkt_internal_metadata;
+
+
+
+        
+
+
+
+typedef struct {
+        lkt_internal_metadata md;
+        lkt_env_rebindings_type rebindings;
+        lkt_bool from_rebound;
+} lkt_internal_entity_info;
+
+
+
+        
+
+
+
+typedef struct {
+        lkt_base_node node;
+        lkt_internal_entity_info info;
+} lkt_base_entity;
+
+
+
+        
+
+
+
+typedef struct {
+        lkt_base_node node;
+        lkt_base_entity result_type;
+        lkt_base_entity result_ref;
+        lkt_bool has_error;
+        lkt_text_type error_message;
+        lkt_bool exempt_analysis;
+} lkt_internal_semantic_result;
+
+    /* Increment the ref-count of all components in "r".  */
+    extern void
+    lkt_internal_semantic_result_inc_ref(lkt_internal_semantic_result *r);
+
+    /* Decrement the ref-count of all components in "r".  */
+    extern void
+    lkt_internal_semantic_result_dec_ref(lkt_internal_semantic_result *r);
+
+
+        
+
+
+
+typedef struct {
+        lkt_semantic_result_array results;
+        lkt_bool has_error;
+} lkt_internal_tree_semantic_result;
+
+    /* Increment the ref-count of all components in "r".  */
+    extern void
+    lkt_internal_tree_semantic_result_inc_ref(lkt_internal_tree_semantic_result *r);
+
+    /* Decrement the ref-count of all components in "r".  */
+    extern void
+    lkt_internal_tree_semantic_result_dec_ref(lkt_internal_tree_semantic_result *r);
+
+
+
+/*
+ * Types for unit providers
+ */
+
+/* Interface to fetch analysis units from a name and a unit kind.
+
+   The unit provider mechanism provides an abstraction which assumes that to
+   any couple (unit name, unit kind) we can associate at most one source file.
+   This means that several couples can be associated to the same source file,
+   but on the other hand, only one one source file can be associated to a
+   couple.
+
+   This is used to make the semantic analysis able to switch from one analysis
+   units to another.  */
+typedef void *lkt_unit_provider;
+
+/* Callback type for functions that are called when destroying a unit file
+   provider type.  */
+typedef void (*lkt_unit_provider_destroy_callback)(void *data);
+
+/* Callback type for functions that are called to turn a unit reference encoded
+   as a unit name into an analysis unit.  */
+typedef char *(*lkt_unit_provider_get_unit_filename_callback)(
+   void *data,
+   lkt_text *name,
+   lkt_analysis_unit_kind kind
+);
+
+/* Callback type for functions that are called to turn a unit reference encoded
+   as a unit name into an analysis unit.  */
+typedef lkt_analysis_unit (*lkt_unit_provider_get_unit_from_name_callback)(
+   void *data,
+   lkt_analysis_context context,
+   lkt_text *name,
+   lkt_analysis_unit_kind kind,
+   const char *charset,
+   int reparse
+);
+
+/* All the functions below can potentially raise an exception, so
+   lkt_get_last_exception must be checked after them even
+   before trying to use the returned value.  */
+
+
+/*
+ * Array types declarations
+ */
+
+
+
+
+
+
+struct lkt_bare_lk_node_array_record {
+   int n;
+   int ref_count;
+   lkt_base_node items[1];
+};
+
+/* Create a length-sized array.  */
+extern lkt_bare_lk_node_array
+lkt_bare_lk_node_array_create(int length);
+
+/* Increment the ref-count for "a".  */
+extern void
+lkt_bare_lk_node_array_inc_ref(lkt_bare_lk_node_array a);
+
+/* Decrement the ref-count for "a". This deallocates it if the ref-count drops
+   to 0.  */
+extern void
+lkt_bare_lk_node_array_dec_ref(lkt_bare_lk_node_array a);
+
+
+
+
+
+
+
+struct lkt_lk_node_array_record {
+   int n;
+   int ref_count;
+   lkt_base_entity items[1];
+};
+
+/* Create a length-sized array.  */
+extern lkt_lk_node_array
+lkt_lk_node_array_create(int length);
+
+/* Increment the ref-count for "a".  */
+extern void
+lkt_lk_node_array_inc_ref(lkt_lk_node_array a);
+
+/* Decrement the ref-count for "a". This deallocates it if the ref-count drops
+   to 0.  */
+extern void
+lkt_lk_node_array_dec_ref(lkt_lk_node_array a);
+
+
+
+        
+
+
+
+
+struct lkt_text_type_record {
+   int n;
+   int ref_count;
+   uint32_t items[1];
+};
+
+/* Create a length-sized array.  */
+extern lkt_text_type
+lkt_text_type_create(int length);
+
+/* Increment the ref-count for "a".  */
+extern void
+lkt_text_type_inc_ref(lkt_text_type a);
+
+/* Decrement the ref-count for "a". This deallocates it if the ref-count drops
+   to 0.  */
+extern void
+lkt_text_type_dec_ref(lkt_text_type a);
+
+
+        
+
+
+
+
+struct lkt_semantic_result_array_record {
+   int n;
+   int ref_count;
+   lkt_internal_semantic_result items[1];
+};
+
+/* Create a length-sized array.  */
+extern lkt_semantic_result_array
+lkt_semantic_result_array_create(int length);
+
+/* Increment the ref-count for "a".  */
+extern void
+lkt_semantic_result_array_inc_ref(lkt_semantic_result_array a);
+
+/* Decrement the ref-count for "a". This deallocates it if the ref-count drops
+   to 0.  */
+extern void
+lkt_semantic_result_array_dec_ref(lkt_semantic_result_array a);
+
+
+
+/*
+ * Analysis primitives
+ */
+
+/* Create a new analysis context.
+
+   ``Charset`` will be used as a default charset to decode input sources in
+   analysis units. Please see ``GNATCOLL.Iconv`` for several supported
+   charsets. Be careful: passing an unsupported charset is not guaranteed to
+   raise an error here. If no charset is provided, ``"utf-8"`` is the default.
+
+   .. todo:: Passing an unsupported charset here is not guaranteed to raise an
+      error right here, but this would be really helpful for users.
+
+   When ``With_Trivia`` is true, the parsed analysis units will contain
+   trivias.
+
+   If provided, ``Unit_Provider`` will be used to query the file name that
+   corresponds to a unit reference during semantic analysis. If it is ``NULL``,
+   the default one is used instead.
+
+   ``Tab_Stop`` is a positive number to describe the effect of tabulation
+   characters on the column number in source files.  */
+extern lkt_analysis_context
+lkt_create_analysis_context(
+   const char *charset,
+   lkt_unit_provider unit_provider,
+   int with_trivia,
+   int tab_stop
+);
+
+/* Increase the reference count to an analysis context. Return the reference
+   for convenience.  */
+extern lkt_analysis_context
+lkt_context_incref(lkt_analysis_context context);
+
+/* Decrease the reference count to an analysis context. Destruction happens
+   when the ref-count reaches 0.  */
+extern void
+lkt_context_decref(lkt_analysis_context context);
+
+/* If the given string is a valid symbol, yield it as a symbol and return true.
+   Otherwise, return false.  */
+extern int
+lkt_context_symbol(lkt_analysis_context context,
+                                   lkt_text *text,
+                                   lkt_symbol_type *symbol);
+
+/* Debug helper. Set whether ``Property_Error`` exceptions raised in
+   ``Populate_Lexical_Env`` should be discarded. They are by default.  */
+extern void
+lkt_context_discard_errors_in_populate_lexical_env(
+        lkt_analysis_context context,
+        int discard);
+
+/* Set whether analysis units created from files in this context should be
+   lexed directly from a compact copy of the memory-mapped file. This avoids
+   decoding the file into a wide-character buffer, and thus speeds up parsing
+   and reduces memory usage. It is disabled by default.
+
+   This only applies to files that use a single-byte charset (ASCII or Latin-1)
+   and that do not start with a UTF byte order mark: other files are decoded as
+   usual.  */
+extern void
+lkt_context_use_memory_mapped_files(
+        lkt_analysis_context context,
+        int enabled);
+
+/* Create a new analysis unit for ``Filename`` or return the existing one if
+   any. If ``Reparse`` is true and the analysis unit already exists, reparse it
+   from ``Filename``.
+
+   ``Rule`` controls which grammar rule is used to parse the unit.
+
+   Use ``Charset`` in order to decode the source. If ``Charset`` is empty then
+   use the context's default charset.
+
+   If any failure occurs, such as file opening, decoding, lexing or parsing
+   failure, return an analysis unit anyway: errors are described as diagnostics
+   of the returned analysis unit.  */
+extern lkt_analysis_unit
+lkt_get_analysis_unit_from_file(
+        lkt_analysis_context context,
+        const char *filename,
+        const char *charset,
+        int reparse,
+        lkt_grammar_rule rule);
+
+/* Create new analysis units for all ``Filenames``, or return the existing
+   ones, as ``Get_From_File`` would do for each of them. Units that need to be
+   (re)parsed are lexed and parsed concurrently on ``Jobs`` worker tasks, or on
+   one task per processor if ``Jobs`` is zero. Only lexing and parsing run
+   concurrently: the rest of the processing (for instance lexical environments
+   updates) is sequential.
+
+   ``Filenames`` and ``Units`` must both have ``Count`` elements: store the
+   analysis unit for each filename at the same index in ``Units``.  */
+extern void
+lkt_get_analysis_units_from_files(
+        lkt_analysis_context context,
+        const char **filenames,
+        int count,
+        const char *charset,
+        int reparse,
+        lkt_grammar_rule rule,
+        int jobs,
+        lkt_analysis_unit *units);
+
+/* Create a new analysis unit for ``Filename`` or return the existing one if
+   any. Whether the analysis unit already exists or not, (re)parse it from the
+   source code in ``Buffer``.
+
+   ``Rule`` controls which grammar rule is used to parse the unit.
+
+   Use ``Charset`` in order to decode the source. If ``Charset`` is empty then
+   use the context's default charset.
+
+   If any failure occurs, such as file opening, decoding, lexing or parsing
+   failure, return an analysis unit anyway: errors are described as diagnostics
+   of the returned analysis unit.  */
+extern lkt_analysis_unit
+lkt_get_analysis_unit_from_buffer(
+        lkt_analysis_context context,
+        const char *filename,
+        const char *charset,
+        const char *buffer,
+        size_t buffer_size,
+        lkt_grammar_rule rule);
+
+/* Create a new analysis unit for ``Name``/``Kind`` or return the existing one
+   if any. If ``Reparse`` is true and the analysis unit already exists, reparse
+   it from ``Filename``.
+
+   Use ``Charset`` in order to decode the source. If ``Charset`` is empty then
+   use the context's default charset.
+
+   If the unit name cannot be tuned into a file name, return ``NULL``. If any
+   other failure occurs, such as file opening, decoding, lexing or parsing
+   failure, return an analysis unit anyway: errors are described as diagnostics
+   of the returned analysis unit.  */
+extern lkt_analysis_unit
+lkt_get_analysis_unit_from_provider(
+        lkt_analysis_context context,
+        lkt_text *name,
+        lkt_analysis_unit_kind kind,
+        const char *charset,
+        int reparse);
+
+/* Return the root node for this unit, or ``NULL`` if there is none.  */
+extern void
+lkt_unit_root(lkt_analysis_unit unit,
+                              lkt_base_entity *result_p);
+
+/* Return a reference to the first token scanned in this unit.  */
+extern void
+lkt_unit_first_token(lkt_analysis_unit unit,
+                                     lkt_token *token);
+
+/* Return a reference to the last token scanned in this unit.  */
+extern void
+lkt_unit_last_token(lkt_analysis_unit unit,
+                                    lkt_token *token);
+
+/* Return the number of tokens in this unit.  */
+extern int
+lkt_unit_token_count(lkt_analysis_unit unit);
+
+/* Return the number of trivias in this unit. This is 0 for units that were
+   parsed with trivia analysis disabled.  */
+extern int
+lkt_unit_trivia_count(lkt_analysis_unit unit);
+
+/* Store data for all the tokens and trivia in UNIT into *TABLE_P. Return zero
+   on failure.
+
+   If the columns in *TABLE_P are null, allocate them as a single memory block,
+   which starts at ``kinds``: it is up to the caller to free it with
+   ``lkt_destroy_token_table``. Otherwise, all columns must be provided by the
+   caller, with room for at least TABLE_P->count items (see
+   ``lkt_unit_token_count`` and ``lkt_unit_trivia_count``). In both cases,
+   TABLE_P->count is then set to the number of exported tokens and trivia.
+
+   This is meant to process big token streams efficiently: it is a lot faster
+   than iterating on tokens with ``lkt_token_next``.  */
+extern int
+lkt_unit_export_tokens(lkt_analysis_unit unit,
+                                       lkt_token_table *table_p);
+
+/* Free the memory allocated for TABLE by ``lkt_unit_export_tokens``.  */
+extern void
+lkt_destroy_token_table(lkt_token_table *table);
+
+/* Debug helper: output the lexical envs for the given analysis unit.  */
+extern void
+lkt_unit_dump_lexical_env(lkt_analysis_unit unit);
+
+/* Return the filename this unit is associated to.
+
+   The returned string is dynamically allocated and the caller must free it
+   when done with it.  */
+extern char *
+lkt_unit_filename(lkt_analysis_unit unit);
+
+/* Return the number of diagnostics associated to this unit.  */
+extern unsigned
+lkt_unit_diagnostic_count(lkt_analysis_unit unit);
+
+/* Get the Nth diagnostic in this unit and store it into *DIAGNOSTIC_P. Return
+   zero on failure (when N is too big).  */
+extern int
+lkt_unit_diagnostic(lkt_analysis_unit unit,
+                                    unsigned n,
+                                    lkt_diagnostic *diagnostic_p);
+
+/* Return the context that owns this unit.  */
+extern lkt_analysis_context
+lkt_unit_context(lkt_analysis_unit context);
+
+/* Reparse an analysis unit from the associated file.
+
+   Use ``Charset`` in order to decode the source. If ``Charset`` is empty then
+   use the context's default charset.
+
+   If any failure occurs, such as decoding, lexing or parsing failure,
+   diagnostic are emitted to explain what happened.  */
+extern void
+lkt_unit_reparse_from_file(lkt_analysis_unit unit,
+                                           const char *charset);
+
+/* Reparse an analysis unit from a buffer.
+
+   Use ``Charset`` in order to decode the source. If ``Charset`` is empty then
+   use the context's default charset.
+
+   If any failure occurs, such as decoding, lexing or parsing failure,
+   diagnostic are emitted to explain what happened.  */
+extern void
+lkt_unit_reparse_from_buffer (lkt_analysis_unit unit,
+                                              const char *charset,
+                                              const char *buffer,
+                                              size_t buffer_size);
+
+/* Replace the source text in ``Edit_Range`` with ``Text`` and reparse the
+   analysis unit accordingly. The end of ``Edit_Range`` is exclusive, so an
+   empty range inserts ``Text``.
+
+   When the edit changes only trivia (whitespaces, comments, ...), the unit
+   keeps its current tree, so its nodes remain valid. Otherwise, this is
+   equivalent to reparsing the whole edited source buffer.
+
+   Raise a ``Precondition_Failure`` error if the unit has no source buffer or
+   if ``Edit_Range`` is not a valid source location range for it.  */
+extern void
+lkt_unit_reparse_edit(lkt_analysis_unit unit,
+                                      lkt_source_location_range *edit_range,
+                                      lkt_text *text);
+
+/* Create lexical environments for this analysis unit, according to the
+   specifications given in the language spec.
+
+   If not done before, it will be automatically called during semantic
+   analysis. Calling it before enables one to control where the latency occurs.
+
+   Depending on whether errors are discarded (see
+   ``Discard_Errors_In_Populate_Lexical_Env``), return 0 on failure and 1 on
+   success.  */
+extern int
+lkt_unit_populate_lexical_env(lkt_analysis_unit unit);
+
+/*
+ * General AST node primitives
+ */
+
+/* Return whether this node is a null node reference.  */
+static inline int
+lkt_node_is_null(lkt_base_entity *node) {
+    return node->node == NULL;
+}
+
+/* Return the kind of this node.  */
+extern lkt_node_kind_enum
+lkt_node_kind(lkt_base_entity *node);
+
+/* Helper for textual dump: return the kind name for this node. The returned
+   string is a copy and thus must be free'd by the caller.  */
+extern void
+lkt_kind_name(lkt_node_kind_enum kind, lkt_text *result);
+
+/* Return the analysis unit that owns this node.  */
+extern int
+lkt_node_unit(lkt_base_entity *node,
+                              lkt_analysis_unit *unit_p);
+
+/* Return whether this node is a node that contains only a single token.  */
+extern int
+lkt_node_is_token_node(lkt_base_entity *node);
+
+/* Return whether this node is synthetic.  */
+extern int
+lkt_node_is_synthetic(lkt_base_entity *node);
+
+/* Return a representation of this node as a string.  */
+extern void
+lkt_node_image(lkt_base_entity *node,
+                               lkt_text *result);
+
+/* Return the source buffer slice corresponding to the text that spans between
+   the first and the last tokens of this node.
+
+   Note that this returns the empty string for synthetic nodes.  */
+extern void
+lkt_node_text(lkt_base_entity *node,
+                              lkt_text *text);
+
+/* Return the spanning source location range for this node.
+
+   Note that this returns the sloc of the parent for synthetic nodes.  */
+extern void
+lkt_node_sloc_range(lkt_base_entity *node,
+                                    lkt_source_location_range *sloc_range);
+
+/* Return the bottom-most node from in ``Node`` and its children which contains
+   ``Sloc``, or ``NULL`` if there is none.  */
+extern void
+lkt_lookup_in_node(lkt_base_entity *node,
+                                   const lkt_source_location *sloc,
+                                   lkt_base_entity *result_p);
+
+/* Return the number of children in this node.  */
+extern unsigned
+lkt_node_children_count(lkt_base_entity *node);
+
+/* Return the Nth child for in this node's fields and store it into *CHILD_P.
+   Return zero on failure (when N is too big).  */
+extern int
+lkt_node_child(lkt_base_entity *node,
+                               unsigned n,
+                               lkt_base_entity* child_p);
+
+/* Compute a flat representation of the tree of nodes rooted at NODE and store
+   it into *TREE_P. Return zero on failure. Otherwise, it is up to the caller
+   to free the result with ``lkt_destroy_node_tree``.
+
+   This is meant to process big trees efficiently: it is a lot faster than
+   traversing the tree with ``lkt_node_child``.  */
+extern int
+lkt_node_export_tree(lkt_base_entity *node,
+                                     lkt_node_tree *tree_p);
+
+/* Free the memory allocated for TREE.  */
+extern void
+lkt_destroy_node_tree(lkt_node_tree *tree);
+
+/* Encode some text using the current locale. The result is dynamically
+   allocated: it is up to the caller to free it when done with it.
+
+   This is a development helper to make it quick and easy to print token and
+   diagnostic text: it ignores errors (when the locale does not support some
+   characters). Production code should use real conversion routines such as
+   libiconv's in order to deal with UTF-32 texts.  */
+extern char *
+lkt_text_to_locale_string(lkt_text *text);
+
+/* Encode TEXT into a dynamically allocated buffer, store its address in *BYTES
+   and its size (in bytes) in *LENGTH. It is up to the caller to free it with
+   ``lkt_free`` when done with it.
+
+   If all characters in TEXT are in the Latin-1 range, encode it in Latin-1 and
+   return 1. Otherwise, encode it in UTF-8 and return 0. Compared to UTF-32,
+   these encodings make the buffer up to four times smaller, which makes
+   transferring big texts to languages such as Python cheaper.  */
+extern int
+lkt_text_to_bytes(lkt_text *text,
+                                  char **bytes,
+                                  size_t *length);
+
+/* Free dynamically allocated memory.
+
+   This is a helper to free objects from dynamic languages.  */
+extern void
+lkt_free(void *address);
+
+/* If this text object owns the buffer it references, free this buffer.
+
+   Note that even though this accepts a pointer to a text object, it does not
+   deallocates the text object itself but rather the buffer it references.  */
+extern void
+lkt_destroy_text(lkt_text *text);
+
+/* Return the text associated to this symbol.  */
+extern void
+lkt_symbol_text(lkt_symbol_type *symbol,
+                                lkt_text *text);
+
+/* Create a big integer from its string representation (in base 10).  */
+extern lkt_big_integer
+lkt_create_big_integer(lkt_text *text);
+
+/* Return the string representation (in base 10) of this big integer.  */
+extern void
+lkt_big_integer_text(lkt_big_integer bigint,
+                                     lkt_text *text);
+
+/* Decrease the reference count for this big integer.  */
+extern void
+lkt_big_integer_decref(lkt_big_integer bigint);
+
+/*
+ * Kind-specific AST node primitives
+ */
+
+/* All these primitives return their result through an OUT parameter.  They
+   return a boolean telling whether the operation was successful (it can fail
+   if the node does not have the proper type, for instance).  When an AST node
+   is returned, its ref-count is left as-is.  */
+
+        
+
+
+
+/* Unit method. Return the Node base class.  */
+extern int lkt_lk_node_p_node_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Unit method. Return the character builtin type.  */
+extern int lkt_lk_node_p_char_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Unit method. Return the integer builtin type.  */
+extern int lkt_lk_node_p_int_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Unit method. Return the boolean builtin type.  */
+extern int lkt_lk_node_p_bool_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Unit method. Return the big integer builtin type.  */
+extern int lkt_lk_node_p_bigint_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Unit method. Return the string builtin type.  */
+extern int lkt_lk_node_p_string_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Unit method. Return the string builtin type.  */
+extern int lkt_lk_node_p_symbol_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Unit method. Return the regexp builtin type.  */
+extern int lkt_lk_node_p_regexp_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Unit method. Return the array builtin type.  */
+extern int lkt_lk_node_p_array_gen_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Unit method. Return the ASTList builtin generic type.  */
+extern int lkt_lk_node_p_astlist_gen_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Unit method. Return the Iterator builtin generic trait.  */
+extern int lkt_lk_node_p_iterator_gen_trait(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Run name and type resolution on all relevant entities in this subtree,
+   aggregating and returning the results.
+
+   If you ran this and the result's `has_error` flag is false, then you *know*
+   that you can call semantic properties such as `referenced_decl` and
+   `expr_type`, and those will never raise.  */
+extern int lkt_lk_node_p_check_semantic(
+    lkt_base_entity *node,
+
+
+    lkt_internal_tree_semantic_result *value_p
+);
+
+
+        
+
+
+
+/* Return the lexical parent for this node. Return null for the root AST node
+   or for AST nodes for which no one has a reference to the parent.  */
+extern int lkt_lk_node_parent(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return an array that contains the lexical parents (this node included).
+   Nearer parents are first in the list.  */
+extern int lkt_lk_node_parents(
+    lkt_base_entity *node,
+
+
+    lkt_lk_node_array *value_p
+);
+
+
+        
+
+
+
+/* Return an array that contains the direct lexical children.  */
+extern int lkt_lk_node_children(
+    lkt_base_entity *node,
+
+
+    lkt_lk_node_array *value_p
+);
+
+
+        
+
+
+
+/* Return the first token used to parse this node.  */
+extern int lkt_lk_node_token_start(
+    lkt_base_entity *node,
+
+
+    lkt_token *value_p
+);
+
+
+        
+
+
+
+/* Return the last token used to parse this node.  */
+extern int lkt_lk_node_token_end(
+    lkt_base_entity *node,
+
+
+    lkt_token *value_p
+);
+
+
+        
+
+
+
+/* Return the 0-based index for Node in its parent's children.  */
+extern int lkt_lk_node_child_index(
+    lkt_base_entity *node,
+
+
+    int *value_p
+);
+
+
+        
+
+
+
+/* Return the node's previous sibling, if there is one.  */
+extern int lkt_lk_node_previous_sibling(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return the node's next sibling, if there is one.  */
+extern int lkt_lk_node_next_sibling(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return the analysis unit owning this node.  */
+extern int lkt_lk_node_unit(
+    lkt_base_entity *node,
+
+
+    lkt_analysis_unit *value_p
+);
+
+
+        
+
+
+
+/* Return whether the node is a ghost.
+
+   Unlike regular nodes, ghost nodes cover no token in the input source: they
+   are logically located instead between two tokens. The "token_first" of all
+   ghost nodes is the token right after this logical position, while they have
+   no "token_last".  */
+extern int lkt_lk_node_is_ghost(
+    lkt_base_entity *node,
+
+
+    lkt_bool *value_p
+);
+
+
+        
+
+
+
+/* Return a string containing the filename + the sloc in GNU conformant format.
+   Useful to create diagnostics from a node.  */
+extern int lkt_lk_node_full_sloc_image(
+    lkt_base_entity *node,
+
+
+    lkt_text_type *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_base_lexer_case_rule_alt_f_send(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_lexer_case_rule_cond_alt_f_cond_exprs(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_decl_f_syn_name(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return the symbol corresponding to the name of this declaration.  */
+extern int lkt_decl_p_name(
+    lkt_base_entity *node,
+
+
+    lkt_symbol_type *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_grammar_decl_f_rules(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return the lexer that is associated to this grammar.  */
+extern int lkt_grammar_decl_p_lexer(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_base_grammar_rule_decl_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Get the type of this value declaration.  */
+extern int lkt_base_val_decl_p_get_type(
+    lkt_base_entity *node,
+
+        
+        lkt_bool
+        no_inference,
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_explicitly_typed_decl_f_decl_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_component_decl_f_default_val(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_val_decl_f_val(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_fun_decl_f_args(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_fun_decl_f_return_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_fun_decl_f_body(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_generic_decl_f_generic_formal_decls(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_base_grammar_decl
+
+   * lkt_field_decl
+
+   * lkt_fun_decl
+
+   * lkt_generic_decl
+
+   * lkt_grammar_rule_decl
+
+   * lkt_lexer_decl
+
+   * lkt_named_type_decl
+
+   * lkt_val_decl  */
+extern int lkt_generic_decl_f_decl(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * lkt_full_decl
+
+   * lkt_lexer_case_rule  */
+extern int lkt_lexer_decl_f_rules(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_lexer_family_decl_f_rules(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Traits for this type  */
+extern int lkt_type_decl_f_traits(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Traits implemented by this type.  */
+extern int lkt_type_decl_p_implemented_traits(
+    lkt_base_entity *node,
+
+
+    lkt_lk_node_array *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_type_decl_f_base_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return the chain of base types for this type, if applicable, else null.  */
+extern int lkt_type_decl_p_base_types(
+    lkt_base_entity *node,
+
+
+    lkt_lk_node_array *value_p
+);
+
+
+        
+
+
+
+/* Return the root type of this type, if applicable, else null.  */
+extern int lkt_type_decl_p_root_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return whether ``self`` is a subtype of ``potential_base``.  */
+extern int lkt_type_decl_p_is_subtype(
+    lkt_base_entity *node,
+
+        
+        const lkt_base_entity*
+        potential_base,
+
+    lkt_bool *value_p
+);
+
+
+        
+
+
+
+/* Returns whether this type is an instantiated generic type.  */
+extern int lkt_type_decl_p_is_generic(
+    lkt_base_entity *node,
+
+
+    lkt_bool *value_p
+);
+
+
+        
+
+
+
+/* Return the generic type that ``self`` instantiates.  */
+extern int lkt_instantiated_generic_type_p_get_inner_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return the declaration of types that were passed as generic actuals to
+   create ``self``.  */
+extern int lkt_instantiated_generic_type_p_get_actuals(
+    lkt_base_entity *node,
+
+
+    lkt_lk_node_array *value_p
+);
+
+
+        
+
+
+
+/* Return the instantiated type decl with proper rebindings, that can be used
+   for typing and code generation.  */
+extern int lkt_instantiated_generic_type_p_get_instantiated_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_named_type_decl_f_decls(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_enum_class_decl_f_branches(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_enum_type_decl_f_literals(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_decl_annotation_f_name(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_decl_annotation_f_params(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_decl_annotation_params_f_params(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_doc_f_lines(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_elsif_branch_f_cond_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_elsif_branch_f_then_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_enum_class_case_f_decls(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return whether this is an instance of ExcludesNullPresent  */
+extern int lkt_excludes_null_p_as_bool(
+    lkt_base_entity *node,
+
+
+    lkt_bool *value_p
+);
+
+
+        
+
+
+
+/* Return whether this expression is part of a type reference.  */
+extern int lkt_expr_p_in_type_ref(
+    lkt_base_entity *node,
+
+
+    lkt_bool *value_p
+);
+
+
+        
+
+
+
+/* Return whether this expression is a regular expression that can be evaluated
+   at runtime, in particular:
+
+   * Not part of a type reference.
+
+   * Not part of a declaration annotation.
+
+   * Not a defining identifier.
+
+   TODO: List  to be expanded probably to take into account grammar
+   expressions.  */
+extern int lkt_expr_p_is_regular_expr(
+    lkt_base_entity *node,
+
+
+    lkt_bool *value_p
+);
+
+
+        
+
+
+
+/* Return the type of this expression, if it is a regular expression (see
+   ``is_regular_expr``), null otherwise.  */
+extern int lkt_expr_p_expr_type(
+    lkt_base_entity *node,
+
+
+    lkt_internal_semantic_result *value_p
+);
+
+
+        
+
+
+
+/* Return the type of this expression. Assumes that this is a regular and valid
+   expression. If this is called on a non regular or non valid expression, it
+   will raise an error.  */
+extern int lkt_expr_p_check_expr_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* If the type of this expression can be determined with no bottom up context,
+   return it. This will be used by `expr_type_impl`'s default
+   implementation.   */
+extern int lkt_expr_p_expr_context_free_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return the declaration referenced by this expression, if applicable, null
+   otherwise.  */
+extern int lkt_expr_p_referenced_decl(
+    lkt_base_entity *node,
+
+
+    lkt_internal_semantic_result *value_p
+);
+
+
+        
+
+
+
+/* Return the referenced decl of this expr, raise otherwise.  */
+extern int lkt_expr_p_check_referenced_decl(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_array_literal_f_exprs(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_bin_op_f_left(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_bin_op_f_op(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_bin_op_f_right(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * lkt_val_decl
+
+   * lkt_var_bind  */
+extern int lkt_block_expr_f_val_defs(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_block_expr_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_lit
+
+   * lkt_match_expr
+
+   * lkt_paren_expr
+
+   * lkt_ref_id  */
+extern int lkt_call_expr_f_name(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_call_expr_f_args(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return the type of the called object.  */
+extern int lkt_call_expr_p_called_object_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return the declaration that is called by this call expression.  */
+extern int lkt_call_expr_p_called_decl(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_lit
+
+   * lkt_match_expr
+
+   * lkt_paren_expr
+
+   * lkt_ref_id  */
+extern int lkt_cast_expr_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_cast_expr_f_excludes_null(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_cast_expr_f_dest_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_lit
+
+   * lkt_match_expr
+
+   * lkt_paren_expr
+
+   * lkt_ref_id  */
+extern int lkt_dot_expr_f_prefix(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_dot_expr_f_suffix(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_lit
+
+   * lkt_match_expr
+
+   * lkt_paren_expr
+
+   * lkt_ref_id  */
+extern int lkt_error_on_null_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_lit
+
+   * lkt_match_expr
+
+   * lkt_paren_expr
+
+   * lkt_ref_id  */
+extern int lkt_generic_instantiation_f_name(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_generic_instantiation_f_args(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Get the type designated by this instantiation.  */
+extern int lkt_generic_instantiation_p_instantiated_decl(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_grammar_discard_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_grammar_dont_skip_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_grammar_dont_skip_f_dont_skip(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_grammar_list_f_list_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_grammar_list_f_kind(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_grammar_list_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_grammar_list_f_sep(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_grammar_null_f_name(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_grammar_opt_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_grammar_opt_group_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_grammar_or_expr_f_sub_exprs(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_grammar_pick_f_exprs(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_grammar_predicate_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_dot_expr
+
+   * lkt_ref_id  */
+extern int lkt_grammar_predicate_f_prop_ref(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_grammar_rule_ref_f_node_name(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_grammar_skip_f_name(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_parse_node_expr_f_node_name(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_parse_node_expr_f_sub_exprs(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_token_no_case_lit_f_lit(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_token_ref_f_token_name(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_token_ref_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_if_expr_f_cond_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_if_expr_f_then_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_if_expr_f_alternatives(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_if_expr_f_else_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_isa_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_isa_f_dest_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_lambda_expr_f_params(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_lambda_expr_f_return_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_lambda_expr_f_body(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return whether this string is prefixed or not.  */
+extern int lkt_string_lit_p_is_prefixed_string(
+    lkt_base_entity *node,
+
+
+    lkt_bool *value_p
+);
+
+
+        
+
+
+
+/* Return the prefix of this string, or the null character if there is no
+   prefix.  */
+extern int lkt_string_lit_p_prefix(
+    lkt_base_entity *node,
+
+
+    uint32_t *value_p
+);
+
+
+        
+
+
+
+/* Return the content of the given string literal node.  */
+extern int lkt_string_lit_p_denoted_value(
+    lkt_base_entity *node,
+
+
+    lkt_text_type *value_p
+);
+
+
+        
+
+
+
+/* Return whether this string literal is actually a regexp literal, by checking
+   that this string is prefixed by 'p'.  */
+extern int lkt_string_lit_p_is_regexp_literal(
+    lkt_base_entity *node,
+
+
+    lkt_bool *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_lit
+
+   * lkt_match_expr
+
+   * lkt_paren_expr
+
+   * lkt_ref_id  */
+extern int lkt_logic_expr_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_match_expr_f_match_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_match_expr_f_branches(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_not_expr_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_paren_expr_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_raise_expr_f_except_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_try_expr_f_try_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_try_expr_f_or_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_full_decl_f_doc(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_full_decl_f_decl_annotations(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_base_grammar_decl
+
+   * lkt_field_decl
+
+   * lkt_fun_decl
+
+   * lkt_generic_decl
+
+   * lkt_generic_formal_type_decl
+
+   * lkt_grammar_rule_decl
+
+   * lkt_lexer_decl
+
+   * lkt_lexer_family_decl
+
+   * lkt_named_type_decl
+
+   * lkt_val_decl  */
+extern int lkt_full_decl_f_decl(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_import_f_name(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return the unit that this import statements designates. Load it if
+   needed.   */
+extern int lkt_import_p_referenced_unit(
+    lkt_base_entity *node,
+
+
+    lkt_analysis_unit *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_langkit_root_f_imports(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_langkit_root_f_decls(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Run all legality checks on this tree. Return a list of diagnostics (For the
+   moment, pending on real discriminated records, SemanticResults which
+   necessarily have an error_message).  */
+extern int lkt_langkit_root_p_check_legality(
+    lkt_base_entity *node,
+
+
+    lkt_semantic_result_array *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_grammar_cut
+
+   * lkt_grammar_discard
+
+   * lkt_grammar_list
+
+   * lkt_grammar_null
+
+   * lkt_grammar_opt
+
+   * lkt_grammar_opt_group
+
+   * lkt_grammar_or_expr
+
+   * lkt_grammar_pick
+
+   * lkt_grammar_rule_ref
+
+   * lkt_grammar_skip
+
+   * lkt_parse_node_expr
+
+   * lkt_token_lit
+
+   * lkt_token_no_case_lit
+
+   * lkt_token_pattern_lit
+
+   * lkt_token_ref  */
+extern int lkt_lexer_case_rule_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_lexer_case_rule_f_alts(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_lexer_case_rule_send_f_sent(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_lexer_case_rule_send_f_match_size(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_match_branch_f_decl(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_match_branch_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_param_f_name(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_param_f_value(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return the type designated by this type ref.  */
+extern int lkt_type_ref_p_designated_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_function_type_ref_f_args_types(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_function_type_ref_f_return_type(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_dot_expr
+
+   * lkt_ref_id  */
+extern int lkt_generic_type_ref_f_type_name(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_generic_type_ref_f_params(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_dot_expr
+
+   * lkt_ref_id  */
+extern int lkt_simple_type_ref_f_type_name(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int lkt_var_bind_f_name(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * lkt_array_literal
+
+   * lkt_bin_op
+
+   * lkt_block_expr
+
+   * lkt_call_expr
+
+   * lkt_cast_expr
+
+   * lkt_dot_expr
+
+   * lkt_error_on_null
+
+   * lkt_generic_instantiation
+
+   * lkt_if_expr
+
+   * lkt_isa
+
+   * lkt_lambda_expr
+
+   * lkt_lit
+
+   * lkt_logic_expr
+
+   * lkt_match_expr
+
+   * lkt_not_expr
+
+   * lkt_paren_expr
+
+   * lkt_raise_expr
+
+   * lkt_ref_id
+
+   * lkt_try_expr  */
+extern int lkt_var_bind_f_expr(
+    lkt_base_entity *node,
+
+
+    lkt_base_entity *value_p
+);
+
+
+
+/*
+ * Unit providers
+ */
+
+/* Create a unit provider. When done with it, the result must be passed to
+   ``lkt_destroy_unit_provider``.
+
+   Pass as ``data`` a pointer to hold your private data: it will be passed to
+   all callbacks below.
+
+   ``destroy`` is a callback that is called by ``lkt_destroy_unit_provider`` to
+   leave a chance to free resources that ``data`` may hold.
+
+   ``get_unit_from_node`` is a callback. It turns an analysis unit reference
+   represented as a node into an analysis unit. It should return ``NULL`` if
+   the node is not a valid unit name representation.
+
+   ``get_unit_from_name`` is a callback similar to ``get_unit_from_node``
+   except it takes an analysis unit reference represented as a string.  */
+extern lkt_unit_provider
+lkt_create_unit_provider(
+   void *data,
+   lkt_unit_provider_destroy_callback destroy_func,
+   lkt_unit_provider_get_unit_filename_callback get_unit_filename_func,
+   lkt_unit_provider_get_unit_from_name_callback get_unit_from_name_func
+);
+
+/* Release an ownership share for this unit provider. This destroys the unit
+   provider if there are no shares left.  */
+extern void
+lkt_dec_ref_unit_provider(void *data);
+
+
+
+
+/*
+ * Misc
+ */
+
+/* Return exception information for the last error that happened in the current
+   thread. Will be automatically allocated on error and free'd on the next
+   error.  */
+extern const lkt_exception *
+lkt_get_last_exception(void);
+
+/* Exception information for the last error that happened, or null if the last
+   call to the library succeeded. This holds the same value as what
+   ``lkt_get_last_exception`` returns: bindings can read it directly to check
+   for errors without an additional function call.  */
+extern const lkt_exception *lkt_last_exception;
+
+/* Return a human-readable name for a token kind.
+
+   The returned string is dynamically allocated and the caller must free it
+   when done with it.
+
+   If the given kind is invalid, return ``NULL`` and set the last exception
+   accordingly.  */
+extern char *
+lkt_token_kind_name(lkt_token_kind kind);
+
+/* Return a reference to the next token in the corresponding analysis unit.  */
+extern void
+lkt_token_next(lkt_token *token,
+                               lkt_token *next_token);
+
+/* Return a reference to the previous token in the corresponding analysis
+   unit.   */
+extern void
+lkt_token_previous(lkt_token *token,
+                                   lkt_token *previous_token);
+
+/* Compute the source buffer slice corresponding to the text that spans between
+   the ``First`` and ``Last`` tokens (both included). This yields an empty
+   slice if ``Last`` actually appears before ``First``. Put the result in
+   ``RESULT``.
+
+   This returns 0 if ``First`` and ``Last`` don't belong to the same analysis
+   unit. Return 1 if successful.  */
+extern int
+lkt_token_range_text(lkt_token *first,
+                                     lkt_token *last,
+                                     lkt_text *result);
+
+/* Return whether ``L`` and ``R`` are structurally equivalent tokens. This
+   means that their position in the stream won't be taken into account, only
+   the kind and text of the token.  */
+extern void
+lkt_token_is_equivalent(lkt_token *left,
+                                        lkt_token *right);
+
+/* Return a representation of this entity as a string.  */
+extern void
+lkt_entity_image(lkt_base_entity ent, lkt_text *result);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
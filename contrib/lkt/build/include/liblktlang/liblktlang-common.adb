@@ -0,0 +1,743 @@
+
+with Ada.Strings.Unbounded; use Ada.Strings.Unbounded;
+
+with GNATCOLL.Iconv;
+with GNATCOLL.VFS; use GNATCOLL.VFS;
+
+with Liblktlang.Lexer_Implementation;
+use Liblktlang.Lexer_Implementation;
+with Liblktlang.Private_Converters;
+
+
+
+package body Liblktlang.Common is
+
+   Is_Token_Node_Kind : constant array (LK_Node_Kind_Type) of Boolean :=
+     (lkt_Lexer_Case_Rule_Cond_Alt => False, lkt_Lexer_Case_Rule_Default_Alt => False, lkt_Grammar_Decl => False, lkt_Grammar_Rule_Decl => False, lkt_Synthetic_Lexer_Decl => False, lkt_Node_Decl => False, lkt_Self_Decl => False, lkt_Enum_Lit_Decl => False, lkt_Field_Decl => False, lkt_Fun_Arg_Decl => False, lkt_Lambda_Arg_Decl => False, lkt_Match_Val_Decl => False, lkt_Val_Decl => False, lkt_Fun_Decl => False, lkt_Generic_Decl => False, lkt_Lexer_Decl => False, lkt_Lexer_Family_Decl => False, lkt_Enum_Class_Alt_Decl => False, lkt_Function_Type => False, lkt_Generic_Formal_Type_Decl => False, lkt_Instantiated_Generic_Type => False, lkt_Class_Decl => False, lkt_Enum_Class_Decl => False, lkt_Enum_Type_Decl => False, lkt_Struct_Decl => False, lkt_Trait_Decl => False, lkt_Decl_Annotation => False, lkt_Decl_Annotation_Params => False, lkt_Doc => False, lkt_Doc_Comment => True, lkt_Elsif_Branch => False, lkt_Enum_Class_Case => False, lkt_Excludes_Null_Absent => False, lkt_Excludes_Null_Present => False, lkt_Array_Literal => False, lkt_Bin_Op => False, lkt_Block_Expr => False, lkt_Call_Expr => False, lkt_Null_Cond_Call_Expr => False, lkt_Cast_Expr => False, lkt_Dot_Expr => False, lkt_Null_Cond_Dotted_Name => False, lkt_Error_On_Null => False, lkt_Generic_Instantiation => False, lkt_Grammar_Cut => False, lkt_Grammar_Discard => False, lkt_Grammar_Dont_Skip => False, lkt_Grammar_List => False, lkt_Grammar_Null => False, lkt_Grammar_Opt => False, lkt_Grammar_Opt_Group => False, lkt_Grammar_Or_Expr => False, lkt_Grammar_Pick => False, lkt_Grammar_Implicit_Pick => False, lkt_Grammar_Predicate => False, lkt_Grammar_Rule_Ref => False, lkt_Grammar_Skip => False, lkt_Parse_Node_Expr => False, lkt_Token_Lit => True, lkt_Token_No_Case_Lit => False, lkt_Token_Pattern_Lit => True, lkt_Token_Ref => False, lkt_Id => True, lkt_Def_Id => True, lkt_Ref_Id => True, lkt_Module_Ref_Id => True, lkt_If_Expr => False, lkt_Isa => False, lkt_Lambda_Expr => False, lkt_Char_Lit => True, lkt_Null_Lit => True, lkt_Num_Lit => True, lkt_String_Lit => True, lkt_Logic_Expr => False, lkt_Match_Expr => False, lkt_Not_Expr => False, lkt_Paren_Expr => False, lkt_Raise_Expr => False, lkt_Try_Expr => False, lkt_Full_Decl => False, lkt_Import => False, lkt_Base_Lexer_Case_Rule_Alt_List => False, lkt_Decl_Annotation_List => False, lkt_Doc_Comment_List => False, lkt_Elsif_Branch_List => False, lkt_Enum_Class_Alt_Decl_List => False, lkt_Enum_Class_Case_List => False, lkt_Enum_Lit_Decl_List => False, lkt_Expr_List => False, lkt_Full_Decl_List => False, lkt_Decl_Block => False, lkt_Fun_Arg_Decl_List => False, lkt_Grammar_Expr_List => False, lkt_Grammar_Expr_List_List => False, lkt_Import_List => False, lkt_LK_Node_List => False, lkt_Lambda_Arg_Decl_List => False, lkt_Match_Branch_List => False, lkt_Param_List => False, lkt_Ref_Id_List => False, lkt_Type_Ref_List => False, lkt_Langkit_Root => False, lkt_Lexer_Case_Rule => False, lkt_Lexer_Case_Rule_Send => False, lkt_List_Kind_One => False, lkt_List_Kind_Zero => False, lkt_Match_Branch => False, lkt_Op_Amp => False, lkt_Op_And => False, lkt_Op_Div => False, lkt_Op_Eq => False, lkt_Op_Gt => False, lkt_Op_Gte => False, lkt_Op_Lt => False, lkt_Op_Lte => False, lkt_Op_Minus => False, lkt_Op_Mult => False, lkt_Op_Or => False, lkt_Op_Plus => False, lkt_Param => False, lkt_Function_Type_Ref => False, lkt_Generic_Type_Ref => False, lkt_Simple_Type_Ref => False, lkt_Var_Bind => False);
+   --  For each node kind, return whether it is a node that contains only a
+   --  single token.
+
+   function Wrap_Token_Reference
+     (TDH   : Token_Data_Handler_Access;
+      Index : Token_Or_Trivia_Index) return Token_Reference;
+   function Get_Token_TDH
+     (Token : Token_Reference) return Token_Data_Handler_Access;
+   function Get_Token_Index
+     (Token : Token_Reference) return Token_Or_Trivia_Index;
+   procedure Extract_Token_Text
+     (Token         : Token_Data_Type;
+      Source_Buffer : out Text_Cst_Access;
+      First         : out Positive;
+      Last          : out Natural);
+   --  Implementations for converters soft-links
+
+   Token_Kind_To_Literals : constant array (Token_Kind) of Text_Access := (
+   
+
+         lkt_Excl_Mark => new Text_Type'("!"),
+         
+         lkt_Semicolon => new Text_Type'(";"),
+         
+         lkt_Colon => new Text_Type'(":"),
+         
+         lkt_Int_Mark => new Text_Type'("?"),
+         
+         lkt_Div => new Text_Type'("/"),
+         
+         lkt_Times => new Text_Type'("*"),
+         
+         lkt_Plus => new Text_Type'("+"),
+         
+         lkt_Amp => new Text_Type'("&"),
+         
+         lkt_Minus => new Text_Type'("-"),
+         
+         lkt_Pipe => new Text_Type'("|"),
+         
+         lkt_Left_Arrow => new Text_Type'("<-"),
+         
+         lkt_Right_Arrow => new Text_Type'("->"),
+         
+         lkt_Dot => new Text_Type'("."),
+         
+         lkt_L_Par => new Text_Type'("("),
+         
+         lkt_R_Par => new Text_Type'(")"),
+         
+         lkt_L_Brack => new Text_Type'("["),
+         
+         lkt_R_Brack => new Text_Type'("]"),
+         
+         lkt_L_Brace => new Text_Type'("{"),
+         
+         lkt_R_Brace => new Text_Type'("}"),
+         
+         lkt_Comb => new Text_Type'("|>"),
+         
+         lkt_Comma => new Text_Type'(","),
+         
+         lkt_At => new Text_Type'("@"),
+         
+         lkt_Fat_Right_Arrow => new Text_Type'("=>"),
+         
+         lkt_Equal => new Text_Type'("="),
+         
+         lkt_LTE => new Text_Type'("<="),
+         
+         lkt_GTE => new Text_Type'(">="),
+         
+         lkt_LT => new Text_Type'("<"),
+         
+         lkt_GT => new Text_Type'(">"),
+         
+         lkt_Percent => new Text_Type'("%"),
+         
+         lkt_Lexer_Kw => new Text_Type'("lexer"),
+         
+         lkt_Grammar_Kw => new Text_Type'("grammar"),
+         
+         lkt_Class_Kw => new Text_Type'("class"),
+         
+         lkt_Struct_Kw => new Text_Type'("struct"),
+         
+         lkt_Fun_Kw => new Text_Type'("fun"),
+         
+         lkt_Public_Kw => new Text_Type'("public"),
+         
+         lkt_Private_Kw => new Text_Type'("private"),
+         
+         lkt_Null_Kw => new Text_Type'("null"),
+         
+         lkt_Is_Kw => new Text_Type'("is"),
+         
+         lkt_Val_Kw => new Text_Type'("val"),
+         
+         lkt_If_Kw => new Text_Type'("if"),
+         
+         lkt_Elif_Kw => new Text_Type'("elif"),
+         
+         lkt_Else_Kw => new Text_Type'("else"),
+         
+         lkt_Then_Kw => new Text_Type'("then"),
+         
+         lkt_And_Kw => new Text_Type'("and"),
+         
+         lkt_Or_Kw => new Text_Type'("or"),
+         
+         lkt_Not_Kw => new Text_Type'("not"),
+         
+         lkt_Bind_Kw => new Text_Type'("bind"),
+         
+         lkt_Match_Kw => new Text_Type'("match"),
+         
+         lkt_Case_Kw => new Text_Type'("case"),
+         
+         lkt_Raise_Kw => new Text_Type'("raise"),
+         
+         lkt_Try_Kw => new Text_Type'("try"),
+         
+         lkt_Enum_Kw => new Text_Type'("enum"),
+         
+         lkt_Generic_Kw => new Text_Type'("generic"),
+         
+         lkt_Discard_Kw => new Text_Type'("discard"),
+         
+         lkt_Import_Kw => new Text_Type'("import"),
+         
+         lkt_Implements_Kw => new Text_Type'("implements"),
+         
+         lkt_Trait_Kw => new Text_Type'("trait"),
+         
+      others => new Text_Type'("")
+   );
+
+   Token_Kind_Names : constant array (Token_Kind) of String_Access := (
+          lkt_Identifier =>
+             new String'("Identifier")
+              ,
+          lkt_Excl_Mark =>
+             new String'("Excl_Mark")
+              ,
+          lkt_Colon =>
+             new String'("Colon")
+              ,
+          lkt_Semicolon =>
+             new String'("Semicolon")
+              ,
+          lkt_Int_Mark =>
+             new String'("Int_Mark")
+              ,
+          lkt_Div =>
+             new String'("Div")
+              ,
+          lkt_Comma =>
+             new String'("Comma")
+              ,
+          lkt_Times =>
+             new String'("Times")
+              ,
+          lkt_Plus =>
+             new String'("Plus")
+              ,
+          lkt_Amp =>
+             new String'("Amp")
+              ,
+          lkt_Minus =>
+             new String'("Minus")
+              ,
+          lkt_Pipe =>
+             new String'("Pipe")
+              ,
+          lkt_Left_Arrow =>
+             new String'("Left_Arrow")
+              ,
+          lkt_Right_Arrow =>
+             new String'("Right_Arrow")
+              ,
+          lkt_Fat_Right_Arrow =>
+             new String'("Fat_Right_Arrow")
+              ,
+          lkt_Dot =>
+             new String'("Dot")
+              ,
+          lkt_Comb =>
+             new String'("Comb")
+              ,
+          lkt_At =>
+             new String'("At")
+              ,
+          lkt_L_Par =>
+             new String'("L_Par")
+              ,
+          lkt_R_Par =>
+             new String'("R_Par")
+              ,
+          lkt_L_Brace =>
+             new String'("L_Brace")
+              ,
+          lkt_R_Brace =>
+             new String'("R_Brace")
+              ,
+          lkt_L_Brack =>
+             new String'("L_Brack")
+              ,
+          lkt_R_Brack =>
+             new String'("R_Brack")
+              ,
+          lkt_Equal =>
+             new String'("Equal")
+              ,
+          lkt_GTE =>
+             new String'("GTE")
+              ,
+          lkt_LTE =>
+             new String'("LTE")
+              ,
+          lkt_GT =>
+             new String'("GT")
+              ,
+          lkt_LT =>
+             new String'("LT")
+              ,
+          lkt_Percent =>
+             new String'("Percent")
+              ,
+          lkt_Lexer_Kw =>
+             new String'("Lexer_Kw")
+              ,
+          lkt_Grammar_Kw =>
+             new String'("Grammar_Kw")
+              ,
+          lkt_Or_Kw =>
+             new String'("Or_Kw")
+              ,
+          lkt_Not_Kw =>
+             new String'("Not_Kw")
+              ,
+          lkt_Class_Kw =>
+             new String'("Class_Kw")
+              ,
+          lkt_Struct_Kw =>
+             new String'("Struct_Kw")
+              ,
+          lkt_Fun_Kw =>
+             new String'("Fun_Kw")
+              ,
+          lkt_Public_Kw =>
+             new String'("Public_Kw")
+              ,
+          lkt_Private_Kw =>
+             new String'("Private_Kw")
+              ,
+          lkt_Null_Kw =>
+             new String'("Null_Kw")
+              ,
+          lkt_Is_Kw =>
+             new String'("Is_Kw")
+              ,
+          lkt_Val_Kw =>
+             new String'("Val_Kw")
+              ,
+          lkt_If_Kw =>
+             new String'("If_Kw")
+              ,
+          lkt_Then_Kw =>
+             new String'("Then_Kw")
+              ,
+          lkt_Elif_Kw =>
+             new String'("Elif_Kw")
+              ,
+          lkt_Else_Kw =>
+             new String'("Else_Kw")
+              ,
+          lkt_And_Kw =>
+             new String'("And_Kw")
+              ,
+          lkt_Bind_Kw =>
+             new String'("Bind_Kw")
+              ,
+          lkt_Match_Kw =>
+             new String'("Match_Kw")
+              ,
+          lkt_Case_Kw =>
+             new String'("Case_Kw")
+              ,
+          lkt_Raise_Kw =>
+             new String'("Raise_Kw")
+              ,
+          lkt_Try_Kw =>
+             new String'("Try_Kw")
+              ,
+          lkt_Enum_Kw =>
+             new String'("Enum_Kw")
+              ,
+          lkt_Generic_Kw =>
+             new String'("Generic_Kw")
+              ,
+          lkt_Discard_Kw =>
+             new String'("Discard_Kw")
+              ,
+          lkt_Import_Kw =>
+             new String'("Import_Kw")
+              ,
+          lkt_Implements_Kw =>
+             new String'("Implements_Kw")
+              ,
+          lkt_Trait_Kw =>
+             new String'("Trait_Kw")
+              ,
+          lkt_Comment =>
+             new String'("Comment")
+              ,
+          lkt_String =>
+             new String'("String")
+              ,
+          lkt_P_String =>
+             new String'("P_String")
+              ,
+          lkt_Char =>
+             new String'("Char")
+              ,
+          lkt_Doc_Comment =>
+             new String'("Doc_Comment")
+              ,
+          lkt_Number =>
+             new String'("Number")
+              ,
+          lkt_Termination =>
+             new String'("Termination")
+              ,
+          lkt_Lexing_Failure =>
+             new String'("Lexing_Failure")
+   );
+
+   ------------------------
+   -- Precomputed_Symbol --
+   ------------------------
+
+   function Precomputed_Symbol
+     (Index : Precomputed_Symbol_Index) return Text_Type is
+   begin
+         declare
+            Raw_Text : constant Text_Type := (case Index is
+            
+               when Precomputed_Symbol_Array => "Array",
+               when Precomputed_Symbol_As => "as",
+               when Precomputed_Symbol_Astlist => "ASTList",
+               when Precomputed_Symbol_Bigint => "BigInt",
+               when Precomputed_Symbol_Bool => "Bool",
+               when Precomputed_Symbol_Call => "__call__",
+               when Precomputed_Symbol_Char => "Char",
+               when Precomputed_Symbol_Dedent => "dedent",
+               when Precomputed_Symbol_Dont_Skip => "dont_skip",
+               when Precomputed_Symbol_Family => "family",
+               when Precomputed_Symbol_Indent => "indent",
+               when Precomputed_Symbol_Int => "Int",
+               when Precomputed_Symbol_Iterator => "Iterator",
+               when Precomputed_Symbol_List => "list",
+               when Precomputed_Symbol_Newline => "newline",
+               when Precomputed_Symbol_No_Case => "no_case",
+               when Precomputed_Symbol_Node => "Node",
+               when Precomputed_Symbol_Node_20 => "node",
+               when Precomputed_Symbol_Open => "open",
+               when Precomputed_Symbol_Out => "out",
+               when Precomputed_Symbol_Pick => "pick",
+               when Precomputed_Symbol_Previous_Token => "previous_token",
+               when Precomputed_Symbol_Property => "property",
+               when Precomputed_Symbol_Regexp => "Regexp",
+               when Precomputed_Symbol_Self => "self",
+               when Precomputed_Symbol_Send => "send",
+               when Precomputed_Symbol_Skip => "skip",
+               when Precomputed_Symbol_String => "String",
+               when Precomputed_Symbol_Symbol => "Symbol",
+               when Precomputed_Symbol_When => "when",
+               when Precomputed_Symbol_With_Lexer => "with_lexer"
+            );
+
+            Symbol : constant Symbolization_Result :=
+                  Create_Symbol (Raw_Text)
+            ;
+         begin
+            if Symbol.Success then
+               return Symbol.Symbol;
+            else
+               raise Program_Error with
+                 "Cannot canonicalize symbol literal: " & Image (Raw_Text);
+            end if;
+         end;
+   end Precomputed_Symbol;
+
+   ---------------------
+   -- Token_Kind_Name --
+   ---------------------
+
+   function Token_Kind_Name (Token_Id : Token_Kind) return String is
+     (Token_Kind_Names (Token_Id).all);
+
+   ------------------------
+   -- Token_Kind_Literal --
+   ------------------------
+
+   function Token_Kind_Literal (Token_Id : Token_Kind) return Text_Type is
+     (Token_Kind_To_Literals (Token_Id).all);
+
+   -----------------------
+   -- Token_Error_Image --
+   -----------------------
+
+   function Token_Error_Image (Token_Id : Token_Kind) return String is
+      Literal : constant Text_Type := Token_Kind_Literal (Token_Id);
+   begin
+      return (if Literal /= ""
+              then "'" & Image (Literal) & "'"
+              else Token_Kind_Name (Token_Id));
+   end Token_Error_Image;
+
+   function To_Token_Kind (Raw : Raw_Token_Kind) return Token_Kind
+   is (Token_Kind'Val (Raw));
+
+   function From_Token_Kind (Kind : Token_Kind) return Raw_Token_Kind
+   is (Token_Kind'Pos (Kind));
+
+   -------------------
+   -- Is_Token_Node --
+   -------------------
+
+   function Is_Token_Node (Kind : LK_Node_Kind_Type) return Boolean is
+   begin
+      return Is_Token_Node_Kind (Kind);
+   end Is_Token_Node;
+
+   ------------------
+   -- Is_List_Node --
+   ------------------
+
+   function Is_List_Node (Kind : LK_Node_Kind_Type) return Boolean is
+   begin
+      return Kind in lkt_LK_Node_Base_List;
+   end Is_List_Node;
+
+   ---------
+   -- "<" --
+   ---------
+
+   function "<" (Left, Right : Token_Reference) return Boolean is
+      pragma Assert (Left.TDH = Right.TDH);
+   begin
+      if Left.Index.Token < Right.Index.Token then
+         return True;
+
+      elsif Left.Index.Token = Right.Index.Token then
+         return Left.Index.Trivia < Right.Index.Trivia;
+
+      else
+         return False;
+      end if;
+   end "<";
+
+   ----------
+   -- Next --
+   ----------
+
+   function Next
+     (Token          : Token_Reference;
+      Exclude_Trivia : Boolean := False) return Token_Reference is
+   begin
+      return (if Token.TDH = null
+              then No_Token
+              else Wrap_Token_Reference (Token.TDH,
+                                         Next (Token.Index, Token.TDH.all,
+                                               Exclude_Trivia)));
+   end Next;
+
+   --------------
+   -- Previous --
+   --------------
+
+   function Previous
+     (Token          : Token_Reference;
+      Exclude_Trivia : Boolean := False) return Token_Reference is
+   begin
+      return
+        (if Token.TDH = null
+         then No_Token
+         else Wrap_Token_Reference (Token.TDH,
+                                    Previous (Token.Index, Token.TDH.all,
+                                              Exclude_Trivia)));
+   end Previous;
+
+   ----------------
+   -- Get_Symbol --
+   ----------------
+
+   function Get_Symbol (Token : Token_Reference) return Symbol_Type is
+   begin
+      return Get_Symbol (Token.Index, Token.TDH.all);
+   end Get_Symbol;
+
+   ----------
+   -- Data --
+   ----------
+
+   function Data (Token : Token_Reference) return Token_Data_Type is
+   begin
+      return Convert (Token.TDH.all, Token, Raw_Data (Token));
+   end Data;
+
+   ----------
+   -- Text --
+   ----------
+
+   function Text (Token : Token_Reference) return Text_Type is
+      RD : constant Stored_Token_Data := Raw_Data (Token);
+   begin
+      return Text (Token.TDH.all, RD);
+   end Text;
+
+   ----------
+   -- Text --
+   ----------
+
+   function Text (First, Last : Token_Reference) return Text_Type is
+      FD : constant Token_Data_Type := Data (First);
+      LD : constant Token_Data_Type := Data (Last);
+   begin
+      if First.TDH /= Last.TDH then
+         raise Constraint_Error;
+      end if;
+      return FD.Source_Buffer.all (FD.Source_First .. LD.Source_Last);
+   end Text;
+
+   ----------
+   -- Kind --
+   ----------
+
+   function Kind (Token_Data : Token_Data_Type) return Token_Kind is
+   begin
+      return Token_Data.Kind;
+   end Kind;
+
+   ---------------
+   -- Is_Trivia --
+   ---------------
+
+   function Is_Trivia (Token : Token_Reference) return Boolean is
+   begin
+      return Token.Index.Trivia /= No_Token_Index;
+   end Is_Trivia;
+
+   ---------------
+   -- Is_Trivia --
+   ---------------
+
+   function Is_Trivia (Token_Data : Token_Data_Type) return Boolean is
+   begin
+      return Token_Data.Is_Trivia;
+   end Is_Trivia;
+
+   -----------
+   -- Index --
+   -----------
+
+   function Index (Token : Token_Reference) return Token_Index is
+   begin
+      return (if Token.Index.Trivia = No_Token_Index
+              then Token.Index.Token
+              else Token.Index.Trivia);
+   end Index;
+
+   -----------
+   -- Index --
+   -----------
+
+   function Index (Token_Data : Token_Data_Type) return Token_Index is
+   begin
+      return Token_Data.Index;
+   end Index;
+
+   ----------------
+   -- Sloc_Range --
+   ----------------
+
+   function Sloc_Range
+     (Token_Data : Token_Data_Type) return Source_Location_Range
+   is
+   begin
+      return Token_Data.Sloc_Range;
+   end Sloc_Range;
+
+   ---------------------
+   -- Origin_Filename --
+   ---------------------
+
+   function Origin_Filename (Token : Token_Reference) return String is
+   begin
+      return +Token.TDH.Filename.Full_Name;
+   end Origin_Filename;
+
+   --------------------
+   -- Origin_Charset --
+   --------------------
+
+   function Origin_Charset (Token : Token_Reference) return String is
+   begin
+      return To_String (Token.TDH.Charset);
+   end Origin_Charset;
+
+   -------------------
+   -- Is_Equivalent --
+   -------------------
+
+   function Is_Equivalent (L, R : Token_Reference) return Boolean is
+      DL : constant Token_Data_Type := Data (L);
+      DR : constant Token_Data_Type := Data (R);
+      TL : constant Text_Type := Text (L);
+      TR : constant Text_Type := Text (R);
+   begin
+      return DL.Kind = DR.Kind and then TL = TR;
+   end Is_Equivalent;
+
+   -----------
+   -- Image --
+   -----------
+
+   function Image (Token : Token_Reference) return String is
+      D : constant Token_Data_Type := Data (Token);
+   begin
+      return ("<Token Kind=" & Token_Kind_Name (D.Kind) &
+              " Text=" & Image (Text (Token), With_Quotes => True) & ">");
+   end Image;
+
+   --------------
+   -- Raw_Data --
+   --------------
+
+   function Raw_Data (T : Token_Reference) return Stored_Token_Data is
+     (if T.Index.Trivia = No_Token_Index
+      then Token_Vectors.Get (T.TDH.Tokens, Natural (T.Index.Token))
+      else Trivia_Vectors.Get (T.TDH.Trivias, Natural (T.Index.Trivia)).T);
+
+   -------------
+   -- Convert --
+   -------------
+
+   function Convert
+     (TDH      : Token_Data_Handler;
+      Token    : Token_Reference;
+      Raw_Data : Stored_Token_Data) return Token_Data_Type is
+   begin
+      return (Kind          => To_Token_Kind (Raw_Data.Kind),
+              Is_Trivia     => Token.Index.Trivia /= No_Token_Index,
+              Index         => (if Token.Index.Trivia = No_Token_Index
+                                then Token.Index.Token
+                                else Token.Index.Trivia),
+              Source_Buffer => Text_Cst_Access (Wide_Source_Buffer (TDH)),
+              Source_First  => Raw_Data.Source_First,
+              Source_Last   => Raw_Data.Source_Last,
+              Sloc_Range    => Sloc_Range (TDH, Raw_Data));
+   end Convert;
+
+   --------------------------
+   -- Wrap_Token_Reference --
+   --------------------------
+
+   function Wrap_Token_Reference
+     (TDH   : Token_Data_Handler_Access;
+      Index : Token_Or_Trivia_Index) return Token_Reference is
+   begin
+      return (if Index = No_Token_Or_Trivia_Index
+              then No_Token
+              else (TDH, Index));
+   end Wrap_Token_Reference;
+
+   -------------------
+   -- Get_Token_TDH --
+   -------------------
+
+   function Get_Token_TDH
+     (Token : Token_Reference) return Token_Data_Handler_Access is
+   begin
+      return Token.TDH;
+   end Get_Token_TDH;
+
+   ---------------------
+   -- Get_Token_Index --
+   ---------------------
+
+   function Get_Token_Index
+     (Token : Token_Reference) return Token_Or_Trivia_Index is
+   begin
+      return Token.Index;
+   end Get_Token_Index;
+
+   ------------------------
+   -- Extract_Token_Text --
+   ------------------------
+
+   procedure Extract_Token_Text
+     (Token         : Token_Data_Type;
+      Source_Buffer : out Text_Cst_Access;
+      First         : out Positive;
+      Last          : out Natural) is
+   begin
+      Source_Buffer := Token.Source_Buffer;
+      First := Token.Source_First;
+      Last := Token.Source_Last;
+   end Extract_Token_Text;
+
+
+begin
+   --  Check that we actually have full Libiconv support: as nothing works
+   --  without it, we explicitly check support here instead of letting
+   --  user-unfriendly errors happen during lexing.
+
+   if not GNATCOLL.Iconv.Has_Iconv then
+      raise Program_Error with "Libiconv is not available";
+   end if;
+
+
+   Private_Converters.Wrap_Token_Reference := Wrap_Token_Reference'Access;
+   Private_Converters.Get_Token_TDH := Get_Token_TDH'Access;
+   Private_Converters.Get_Token_Index := Get_Token_Index'Access;
+   Private_Converters.Extract_Token_Text := Extract_Token_Text'Access;
+end Liblktlang.Common;
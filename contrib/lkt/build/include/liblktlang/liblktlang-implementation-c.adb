@@ -0,0 +1,9456 @@
+
+
+
+
+
+
+
+
+with Ada.Finalization;
+pragma Warnings (Off, "is an internal GNAT unit");
+with Ada.Strings.Wide_Wide_Unbounded.Aux;
+use Ada.Strings.Wide_Wide_Unbounded.Aux;
+pragma Warnings (On, "is an internal GNAT unit");
+
+with System.Memory;
+use type System.Address;
+with System.Storage_Elements; use System.Storage_Elements;
+
+with GNAT.Strings;
+
+with GNATCOLL.Iconv;
+
+with Langkit_Support.Diagnostics; use Langkit_Support.Diagnostics;
+with Langkit_Support.Text;        use Langkit_Support.Text;
+
+with Liblktlang.Private_Converters;
+use Liblktlang.Private_Converters;
+
+
+          with Liblktlang.Implementation.Extensions;
+            use Liblktlang.Implementation.Extensions;
+
+
+package body Liblktlang.Implementation.C is
+
+   --  Avoid hiding from $.Lexer
+   subtype Token_Data_Type is Common.Token_Data_Type;
+
+   type C_Unit_Provider is limited new
+      Ada.Finalization.Limited_Controlled
+      and Internal_Unit_Provider
+   with record
+      Ref_Count               : Natural;
+      Data                    : System.Address;
+      Destroy_Func            : lkt_unit_provider_destroy_callback;
+      Get_Unit_Filename_Func  : lkt_unit_provider_get_unit_filename_callback;
+      Get_Unit_From_Name_Func : lkt_unit_provider_get_unit_from_name_callback;
+   end record;
+
+   type C_Unit_Provider_Access is access all C_Unit_Provider;
+
+   overriding procedure Finalize (Provider : in out C_Unit_Provider);
+   overriding procedure Inc_Ref (Provider : in out C_Unit_Provider);
+   overriding function Dec_Ref
+     (Provider : in out C_Unit_Provider) return Boolean;
+
+   overriding function Get_Unit_Filename
+     (Provider : C_Unit_Provider;
+      Name     : Text_Type;
+      Kind     : Analysis_Unit_Kind) return String;
+
+   overriding function Get_Unit
+     (Provider : C_Unit_Provider;
+      Context  : Internal_Context;
+      Name     : Text_Type;
+      Kind     : Analysis_Unit_Kind;
+      Charset  : String := "";
+      Reparse  : Boolean := False) return Internal_Unit;
+
+   function Value_Or_Empty (S : chars_ptr) return String
+   --  If S is null, return an empty string. Return Value (S) otherwise.
+   is (if S = Null_Ptr
+       then ""
+       else Value (S));
+
+   Last_Exception : lkt_exception_Ptr := null;
+
+   ----------
+   -- Free --
+   ----------
+
+   procedure Free (Address : System.Address) is
+      procedure C_Free (Address : System.Address)
+        with Import        => True,
+             Convention    => C,
+             External_Name => "free";
+   begin
+      C_Free (Address);
+   end Free;
+
+   -------------------------
+   -- Analysis primitives --
+   -------------------------
+
+   function lkt_create_analysis_context
+     (Charset       : chars_ptr;
+      Unit_Provider : lkt_unit_provider;
+      With_Trivia   : int;
+      Tab_Stop      : int) return lkt_analysis_context is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         C : constant String :=
+           (if Charset = Null_Ptr
+            then "utf-8"
+            else Value (Charset));
+      begin
+         return Create_Context
+            (Charset       => C,
+             Unit_Provider => Unwrap_Private_Provider (Unit_Provider),
+             With_Trivia   => With_Trivia /= 0,
+             Tab_Stop      => Natural (Tab_Stop));
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return null;
+   end;
+
+   function lkt_context_incref
+     (Context : lkt_analysis_context) return lkt_analysis_context is
+   begin
+      Clear_Last_Exception;
+      Inc_Ref (Context);
+      return Context;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return null;
+   end;
+
+   procedure lkt_context_decref
+     (Context : lkt_analysis_context)
+   is
+      Context_Var : Internal_Context := Context;
+   begin
+      Clear_Last_Exception;
+      Dec_Ref (Context_Var);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function lkt_context_symbol
+     (Context : lkt_analysis_context;
+      Text    : access lkt_text;
+      Symbol  : access lkt_symbol_type) return int
+   is
+      Raw_Text : Text_Type (1 .. Natural (Text.Length))
+         with Import, Address => Text.Chars;
+   begin
+      Clear_Last_Exception;
+      Symbol.all := Wrap_Symbol (Lookup_Symbol (Context, Raw_Text));
+      return 1;
+   exception
+      when Invalid_Symbol_Error =>
+         return 0;
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   procedure lkt_context_discard_errors_in_populate_lexical_env
+     (Context : lkt_analysis_context;
+      Discard : int) is
+   begin
+      Clear_Last_Exception;
+      Discard_Errors_In_Populate_Lexical_Env (Context, Discard /= 0);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure lkt_context_use_memory_mapped_files
+     (Context : lkt_analysis_context;
+      Enabled : int) is
+   begin
+      Clear_Last_Exception;
+      Use_Memory_Mapped_Files (Context, Enabled /= 0);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function lkt_get_analysis_unit_from_file
+     (Context           : lkt_analysis_context;
+      Filename, Charset : chars_ptr;
+      Reparse           : int;
+      Rule              : lkt_grammar_rule) return lkt_analysis_unit is
+   begin
+      Clear_Last_Exception;
+
+      return Get_From_File
+        (Context,
+         Value (Filename),
+         Value_Or_Empty (Charset),
+         Reparse /= 0,
+         Rule);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return null;
+   end;
+
+   procedure lkt_get_analysis_units_from_files
+     (Context   : lkt_analysis_context;
+      Filenames : System.Address;
+      Count     : int;
+      Charset   : chars_ptr;
+      Reparse   : int;
+      Rule      : lkt_grammar_rule;
+      Jobs      : int;
+      Units     : System.Address) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         C_Filenames : array (1 .. Natural (Count)) of chars_ptr
+            with Import, Address => Filenames;
+         C_Units     : Internal_Unit_Array (1 .. Natural (Count))
+            with Import, Address => Units;
+
+         Ada_Filenames : GNAT.Strings.String_List (1 .. Natural (Count));
+      begin
+         for I in Ada_Filenames'Range loop
+            Ada_Filenames (I) := new String'(Value (C_Filenames (I)));
+         end loop;
+
+         begin
+            C_Units := Get_From_Files
+              (Context,
+               Ada_Filenames,
+               Value_Or_Empty (Charset),
+               Reparse /= 0,
+               Rule,
+               Natural (Jobs));
+         exception
+            when others =>
+               GNAT.Strings.Free (Ada_Filenames);
+               raise;
+         end;
+         GNAT.Strings.Free (Ada_Filenames);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function lkt_get_analysis_unit_from_buffer
+     (Context           : lkt_analysis_context;
+      Filename, Charset : chars_ptr;
+      Buffer            : chars_ptr;
+      Buffer_Size       : size_t;
+      Rule              : lkt_grammar_rule) return lkt_analysis_unit is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Buffer_Str : String (1 .. Natural (Buffer_Size))
+            with Import, Address => Convert (Buffer);
+      begin
+         return Get_From_Buffer
+           (Context,
+            Value (Filename),
+            Value_Or_Empty (Charset),
+            Buffer_Str,
+            Rule);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return null;
+   end;
+
+   function lkt_get_analysis_unit_from_provider
+     (Context : lkt_analysis_context;
+      Name    : lkt_text;
+      Kind    : lkt_analysis_unit_kind;
+      Charset : chars_ptr;
+      Reparse : int) return lkt_analysis_unit is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Text_Name : Text_Type (1 .. Natural (Name.Length))
+            with Import, Address => Name.Chars;
+      begin
+         return Get_From_Provider
+           (Context,
+            Text_Name,
+            Kind,
+            Value_Or_Empty (Charset),
+            Reparse /= 0);
+      end;
+   exception
+      when Invalid_Unit_Name_Error =>
+         return null;
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return null;
+   end;
+
+   procedure lkt_unit_root
+     (Unit     : lkt_analysis_unit;
+      Result_P : lkt_base_entity_Ptr) is
+   begin
+      Clear_Last_Exception;
+
+      Result_P.all := (Unit.AST_Root, No_Entity_Info);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure lkt_unit_first_token
+     (Unit  : lkt_analysis_unit;
+      Token : access lkt_token) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         T : constant Token_Reference := First_Token (Unit);
+      begin
+         Token.all := Wrap (T);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure lkt_unit_last_token
+     (Unit  : lkt_analysis_unit;
+      Token : access lkt_token) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         T : constant Token_Reference := Last_Token (Unit);
+      begin
+         Token.all := Wrap (T);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function lkt_unit_token_count
+     (Unit : lkt_analysis_unit) return int is
+   begin
+      Clear_Last_Exception;
+
+      return int (Token_Count (Unit));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return -1;
+   end;
+
+   function lkt_unit_trivia_count
+     (Unit : lkt_analysis_unit) return int is
+   begin
+      Clear_Last_Exception;
+
+      return int (Trivia_Count (Unit));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return -1;
+   end;
+
+   function lkt_unit_export_tokens
+     (Unit    : lkt_analysis_unit;
+      Table_P : access lkt_token_table) return int is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         TDH    : Token_Data_Handler renames Unit.TDH;
+         Count  : constant Natural :=
+           Token_Count (Unit) + Trivia_Count (Unit);
+         Length : constant Storage_Offset := Storage_Offset (Count);
+
+         Table : lkt_token_table := Table_P.all;
+
+         procedure Fill;
+         --  Store data for all tokens and trivia in the columns of Table
+
+         ----------
+         -- Fill --
+         ----------
+
+         procedure Fill is
+            subtype Index_Range is Integer range 0 .. Count - 1;
+            type Int_Column is array (Index_Range) of int
+              with Convention => C;
+            type Line_Column is array (Index_Range) of Unsigned_32
+              with Convention => C;
+            type Column_Column is array (Index_Range) of Unsigned_16
+              with Convention => C;
+            type Flag_Column is array (Index_Range) of Unsigned_8
+              with Convention => C;
+
+            Kinds         : Int_Column with Import, Address => Table.Kinds;
+            Start_Offsets : Int_Column
+              with Import, Address => Table.Start_Offsets;
+            End_Offsets   : Int_Column
+              with Import, Address => Table.End_Offsets;
+            Start_Lines   : Line_Column
+              with Import, Address => Table.Start_Lines;
+            End_Lines     : Line_Column
+              with Import, Address => Table.End_Lines;
+            Start_Columns : Column_Column
+              with Import, Address => Table.Start_Columns;
+            End_Columns   : Column_Column
+              with Import, Address => Table.End_Columns;
+            Is_Trivia     : Flag_Column
+              with Import, Address => Table.Is_Trivia;
+
+            Current : Token_Or_Trivia_Index := First_Token_Or_Trivia (TDH);
+         begin
+            for I in Index_Range loop
+               declare
+                  D    : constant Stored_Token_Data := Data (Current, TDH);
+                  Sloc : constant Source_Location_Range :=
+                    Sloc_Range (TDH, D);
+               begin
+                  Kinds (I) := int (To_Token_Kind (D.Kind)'Enum_Rep);
+                  Start_Offsets (I) := int (D.Source_First - TDH.Source_First);
+                  End_Offsets (I) :=
+                    int (D.Source_Last - TDH.Source_First + 1);
+                  Start_Lines (I) := Unsigned_32 (Sloc.Start_Line);
+                  Start_Columns (I) := Unsigned_16 (Sloc.Start_Column);
+                  End_Lines (I) := Unsigned_32 (Sloc.End_Line);
+                  End_Columns (I) := Unsigned_16 (Sloc.End_Column);
+                  Is_Trivia (I) :=
+                    (if Current.Trivia = No_Token_Index then 0 else 1);
+               end;
+               Current := Next (Current, TDH);
+            end loop;
+         end Fill;
+
+      begin
+         if Table.Kinds = System.Null_Address then
+
+            --  Allocate all columns in a single memory block: first 32-bit
+            --  columns, then 16-bit columns and finally 8-bit columns, so
+            --  that all columns are properly aligned.
+
+            Table.Kinds := System.Memory.Alloc
+              (System.Memory.size_t (Length * (5 * 4 + 2 * 2 + 1)));
+            Table.Start_Offsets := Table.Kinds + Length * 4;
+            Table.End_Offsets := Table.Start_Offsets + Length * 4;
+            Table.Start_Lines := Table.End_Offsets + Length * 4;
+            Table.End_Lines := Table.Start_Lines + Length * 4;
+            Table.Start_Columns := Table.End_Lines + Length * 4;
+            Table.End_Columns := Table.Start_Columns + Length * 2;
+            Table.Is_Trivia := Table.End_Columns + Length * 2;
+
+         elsif Natural (Table.Count) < Count then
+            raise Precondition_Failure with "token table is too small";
+         end if;
+
+         Table.Count := int (Count);
+         if Count > 0 then
+            Fill;
+         end if;
+
+         Table_P.all := Table;
+         return 1;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   procedure lkt_destroy_token_table
+     (Table : access lkt_token_table) is
+   begin
+      Clear_Last_Exception;
+
+      System.Memory.Free (Table.Kinds);
+      Table.all := (Count => 0, others => System.Null_Address);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure lkt_unit_lookup_token
+     (Unit   : lkt_analysis_unit;
+      Sloc   : access lkt_source_location;
+      Result : access lkt_token) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         S   : constant Source_Location := Unwrap (Sloc.all);
+         Tok : constant Token_Reference := Lookup_Token (Unit, S);
+      begin
+         Result.all := Wrap (Tok);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure lkt_unit_dump_lexical_env
+     (Unit : lkt_analysis_unit) is
+   begin
+      Clear_Last_Exception;
+      Dump_Lexical_Env (Unit);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function lkt_unit_filename
+     (Unit : lkt_analysis_unit) return chars_ptr is
+   begin
+      Clear_Last_Exception;
+
+      return New_String (Get_Filename (Unit));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return Null_Ptr;
+   end;
+
+   function lkt_unit_diagnostic_count
+     (Unit : lkt_analysis_unit) return unsigned is
+   begin
+      Clear_Last_Exception;
+
+      return unsigned (Unit.Diagnostics.Length);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   function lkt_unit_diagnostic
+     (Unit         : lkt_analysis_unit;
+      N            : unsigned;
+      Diagnostic_P : access lkt_diagnostic) return int
+   is
+   begin
+      Clear_Last_Exception;
+
+      if N < unsigned (Unit.Diagnostics.Length) then
+         declare
+            D_In  : Diagnostic renames Unit.Diagnostics (Natural (N) + 1);
+            D_Out : lkt_diagnostic renames Diagnostic_P.all;
+         begin
+            D_Out.Sloc_Range := Wrap (D_In.Sloc_Range);
+            D_Out.Message := Wrap (D_In.Message);
+            return 1;
+         end;
+      else
+         return 0;
+      end if;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   function lkt_unit_context
+     (Unit : lkt_analysis_unit) return lkt_analysis_context is
+   begin
+      Clear_Last_Exception;
+      return Unit.Context;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return null;
+   end;
+
+   procedure lkt_unit_reparse_from_file
+     (Unit : lkt_analysis_unit; Charset : chars_ptr) is
+   begin
+      Clear_Last_Exception;
+
+      Reparse (Unit, Value_Or_Empty (Charset));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure lkt_unit_reparse_from_buffer
+     (Unit        : lkt_analysis_unit;
+      Charset     : chars_ptr;
+      Buffer      : chars_ptr;
+      Buffer_Size : size_t) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Buffer_Str : String (1 .. Natural (Buffer_Size))
+            with Import, Address => Convert (Buffer);
+      begin
+         Reparse (Unit, Value_Or_Empty (Charset), Buffer_Str);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure lkt_unit_reparse_edit
+     (Unit       : lkt_analysis_unit;
+      Edit_Range : access lkt_source_location_range;
+      Text       : access lkt_text) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Raw_Text : Text_Type (1 .. Natural (Text.Length))
+            with Import, Address => Text.Chars;
+      begin
+         Reparse (Unit, Unwrap (Edit_Range.all), Raw_Text);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function lkt_unit_populate_lexical_env
+     (Unit : lkt_analysis_unit) return int is
+   begin
+      Clear_Last_Exception;
+      Populate_Lexical_Env (Unit);
+      return 1;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   ---------------------------------
+   -- General AST node primitives --
+   ---------------------------------
+
+   Node_Kind_Names : constant array (LK_Node_Kind_Type) of Text_Access :=
+     (lkt_Lexer_Case_Rule_Cond_Alt => new Text_Type'(To_Text ("LexerCaseRuleCondAlt")), lkt_Lexer_Case_Rule_Default_Alt => new Text_Type'(To_Text ("LexerCaseRuleDefaultAlt")), lkt_Grammar_Decl => new Text_Type'(To_Text ("GrammarDecl")), lkt_Grammar_Rule_Decl => new Text_Type'(To_Text ("GrammarRuleDecl")), lkt_Synthetic_Lexer_Decl => new Text_Type'(To_Text ("SyntheticLexerDecl")), lkt_Node_Decl => new Text_Type'(To_Text ("NodeDecl")), lkt_Self_Decl => new Text_Type'(To_Text ("SelfDecl")), lkt_Enum_Lit_Decl => new Text_Type'(To_Text ("EnumLitDecl")), lkt_Field_Decl => new Text_Type'(To_Text ("FieldDecl")), lkt_Fun_Arg_Decl => new Text_Type'(To_Text ("FunArgDecl")), lkt_Lambda_Arg_Decl => new Text_Type'(To_Text ("LambdaArgDecl")), lkt_Match_Val_Decl => new Text_Type'(To_Text ("MatchValDecl")), lkt_Val_Decl => new Text_Type'(To_Text ("ValDecl")), lkt_Fun_Decl => new Text_Type'(To_Text ("FunDecl")), lkt_Generic_Decl => new Text_Type'(To_Text ("GenericDecl")), lkt_Lexer_Decl => new Text_Type'(To_Text ("LexerDecl")), lkt_Lexer_Family_Decl => new Text_Type'(To_Text ("LexerFamilyDecl")), lkt_Enum_Class_Alt_Decl => new Text_Type'(To_Text ("EnumClassAltDecl")), lkt_Function_Type => new Text_Type'(To_Text ("FunctionType")), lkt_Generic_Formal_Type_Decl => new Text_Type'(To_Text ("GenericFormalTypeDecl")), lkt_Instantiated_Generic_Type => new Text_Type'(To_Text ("InstantiatedGenericType")), lkt_Class_Decl => new Text_Type'(To_Text ("ClassDecl")), lkt_Enum_Class_Decl => new Text_Type'(To_Text ("EnumClassDecl")), lkt_Enum_Type_Decl => new Text_Type'(To_Text ("EnumTypeDecl")), lkt_Struct_Decl => new Text_Type'(To_Text ("StructDecl")), lkt_Trait_Decl => new Text_Type'(To_Text ("TraitDecl")), lkt_Decl_Annotation => new Text_Type'(To_Text ("DeclAnnotation")), lkt_Decl_Annotation_Params => new Text_Type'(To_Text ("DeclAnnotationParams")), lkt_Doc => new Text_Type'(To_Text ("Doc")), lkt_Doc_Comment => new Text_Type'(To_Text ("DocComment")), lkt_Elsif_Branch => new Text_Type'(To_Text ("ElsifBranch")), lkt_Enum_Class_Case => new Text_Type'(To_Text ("EnumClassCase")), lkt_Excludes_Null_Absent => new Text_Type'(To_Text ("ExcludesNullAbsent")), lkt_Excludes_Null_Present => new Text_Type'(To_Text ("ExcludesNullPresent")), lkt_Array_Literal => new Text_Type'(To_Text ("ArrayLiteral")), lkt_Bin_Op => new Text_Type'(To_Text ("BinOp")), lkt_Block_Expr => new Text_Type'(To_Text ("BlockExpr")), lkt_Call_Expr => new Text_Type'(To_Text ("CallExpr")), lkt_Null_Cond_Call_Expr => new Text_Type'(To_Text ("NullCondCallExpr")), lkt_Cast_Expr => new Text_Type'(To_Text ("CastExpr")), lkt_Dot_Expr => new Text_Type'(To_Text ("DotExpr")), lkt_Null_Cond_Dotted_Name => new Text_Type'(To_Text ("NullCondDottedName")), lkt_Error_On_Null => new Text_Type'(To_Text ("ErrorOnNull")), lkt_Generic_Instantiation => new Text_Type'(To_Text ("GenericInstantiation")), lkt_Grammar_Cut => new Text_Type'(To_Text ("GrammarCut")), lkt_Grammar_Discard => new Text_Type'(To_Text ("GrammarDiscard")), lkt_Grammar_Dont_Skip => new Text_Type'(To_Text ("GrammarDontSkip")), lkt_Grammar_List => new Text_Type'(To_Text ("GrammarList")), lkt_Grammar_Null => new Text_Type'(To_Text ("GrammarNull")), lkt_Grammar_Opt => new Text_Type'(To_Text ("GrammarOpt")), lkt_Grammar_Opt_Group => new Text_Type'(To_Text ("GrammarOptGroup")), lkt_Grammar_Or_Expr => new Text_Type'(To_Text ("GrammarOrExpr")), lkt_Grammar_Pick => new Text_Type'(To_Text ("GrammarPick")), lkt_Grammar_Implicit_Pick => new Text_Type'(To_Text ("GrammarImplicitPick")), lkt_Grammar_Predicate => new Text_Type'(To_Text ("GrammarPredicate")), lkt_Grammar_Rule_Ref => new Text_Type'(To_Text ("GrammarRuleRef")), lkt_Grammar_Skip => new Text_Type'(To_Text ("GrammarSkip")), lkt_Parse_Node_Expr => new Text_Type'(To_Text ("ParseNodeExpr")), lkt_Token_Lit => new Text_Type'(To_Text ("TokenLit")), lkt_Token_No_Case_Lit => new Text_Type'(To_Text ("TokenNoCaseLit")), lkt_Token_Pattern_Lit => new Text_Type'(To_Text ("TokenPatternLit")), lkt_Token_Ref => new Text_Type'(To_Text ("TokenRef")), lkt_Id => new Text_Type'(To_Text ("Id")), lkt_Def_Id => new Text_Type'(To_Text ("DefId")), lkt_Ref_Id => new Text_Type'(To_Text ("RefId")), lkt_Module_Ref_Id => new Text_Type'(To_Text ("ModuleRefId")), lkt_If_Expr => new Text_Type'(To_Text ("IfExpr")), lkt_Isa => new Text_Type'(To_Text ("Isa")), lkt_Lambda_Expr => new Text_Type'(To_Text ("LambdaExpr")), lkt_Char_Lit => new Text_Type'(To_Text ("CharLit")), lkt_Null_Lit => new Text_Type'(To_Text ("NullLit")), lkt_Num_Lit => new Text_Type'(To_Text ("NumLit")), lkt_String_Lit => new Text_Type'(To_Text ("StringLit")), lkt_Logic_Expr => new Text_Type'(To_Text ("LogicExpr")), lkt_Match_Expr => new Text_Type'(To_Text ("MatchExpr")), lkt_Not_Expr => new Text_Type'(To_Text ("NotExpr")), lkt_Paren_Expr => new Text_Type'(To_Text ("ParenExpr")), lkt_Raise_Expr => new Text_Type'(To_Text ("RaiseExpr")), lkt_Try_Expr => new Text_Type'(To_Text ("TryExpr")), lkt_Full_Decl => new Text_Type'(To_Text ("FullDecl")), lkt_Import => new Text_Type'(To_Text ("Import")), lkt_Base_Lexer_Case_Rule_Alt_List => new Text_Type'(To_Text ("BaseLexerCaseRuleAltList")), lkt_Decl_Annotation_List => new Text_Type'(To_Text ("DeclAnnotationList")), lkt_Doc_Comment_List => new Text_Type'(To_Text ("DocCommentList")), lkt_Elsif_Branch_List => new Text_Type'(To_Text ("ElsifBranchList")), lkt_Enum_Class_Alt_Decl_List => new Text_Type'(To_Text ("EnumClassAltDeclList")), lkt_Enum_Class_Case_List => new Text_Type'(To_Text ("EnumClassCaseList")), lkt_Enum_Lit_Decl_List => new Text_Type'(To_Text ("EnumLitDeclList")), lkt_Expr_List => new Text_Type'(To_Text ("ExprList")), lkt_Full_Decl_List => new Text_Type'(To_Text ("FullDeclList")), lkt_Decl_Block => new Text_Type'(To_Text ("DeclBlock")), lkt_Fun_Arg_Decl_List => new Text_Type'(To_Text ("FunArgDeclList")), lkt_Grammar_Expr_List => new Text_Type'(To_Text ("GrammarExprList")), lkt_Grammar_Expr_List_List => new Text_Type'(To_Text ("GrammarExprListList")), lkt_Import_List => new Text_Type'(To_Text ("ImportList")), lkt_LK_Node_List => new Text_Type'(To_Text ("LKNodeList")), lkt_Lambda_Arg_Decl_List => new Text_Type'(To_Text ("LambdaArgDeclList")), lkt_Match_Branch_List => new Text_Type'(To_Text ("MatchBranchList")), lkt_Param_List => new Text_Type'(To_Text ("ParamList")), lkt_Ref_Id_List => new Text_Type'(To_Text ("RefIdList")), lkt_Type_Ref_List => new Text_Type'(To_Text ("TypeRefList")), lkt_Langkit_Root => new Text_Type'(To_Text ("LangkitRoot")), lkt_Lexer_Case_Rule => new Text_Type'(To_Text ("LexerCaseRule")), lkt_Lexer_Case_Rule_Send => new Text_Type'(To_Text ("LexerCaseRuleSend")), lkt_List_Kind_One => new Text_Type'(To_Text ("ListKindOne")), lkt_List_Kind_Zero => new Text_Type'(To_Text ("ListKindZero")), lkt_Match_Branch => new Text_Type'(To_Text ("MatchBranch")), lkt_Op_Amp => new Text_Type'(To_Text ("OpAmp")), lkt_Op_And => new Text_Type'(To_Text ("OpAnd")), lkt_Op_Div => new Text_Type'(To_Text ("OpDiv")), lkt_Op_Eq => new Text_Type'(To_Text ("OpEq")), lkt_Op_Gt => new Text_Type'(To_Text ("OpGt")), lkt_Op_Gte => new Text_Type'(To_Text ("OpGte")), lkt_Op_Lt => new Text_Type'(To_Text ("OpLt")), lkt_Op_Lte => new Text_Type'(To_Text ("OpLte")), lkt_Op_Minus => new Text_Type'(To_Text ("OpMinus")), lkt_Op_Mult => new Text_Type'(To_Text ("OpMult")), lkt_Op_Or => new Text_Type'(To_Text ("OpOr")), lkt_Op_Plus => new Text_Type'(To_Text ("OpPlus")), lkt_Param => new Text_Type'(To_Text ("Param")), lkt_Function_Type_Ref => new Text_Type'(To_Text ("FunctionTypeRef")), lkt_Generic_Type_Ref => new Text_Type'(To_Text ("GenericTypeRef")), lkt_Simple_Type_Ref => new Text_Type'(To_Text ("SimpleTypeRef")), lkt_Var_Bind => new Text_Type'(To_Text ("VarBind")));
+
+   function lkt_node_kind
+     (Node : lkt_base_entity_Ptr) return lkt_node_kind_enum is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         K : constant LK_Node_Kind_Type := Node.Node.Kind;
+      begin
+         return lkt_node_kind_enum (K'Enum_Rep);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return lkt_node_kind_enum'First;
+   end;
+
+   procedure lkt_kind_name
+     (Kind : lkt_node_kind_enum; Result : access lkt_text) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         K    : constant LK_Node_Kind_Type := LK_Node_Kind_Type'Enum_Val (Kind);
+         Name : Text_Access renames Node_Kind_Names (K);
+      begin
+         Result.all := (Chars        => Name.all'Address,
+                        Length       => Name'Length,
+                        Is_Allocated => 0);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function lkt_node_unit
+     (Node : lkt_base_entity_Ptr) return lkt_analysis_unit is
+   begin
+      Clear_Last_Exception;
+      return Node.Node.Unit;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return null;
+   end;
+
+   function lkt_is_token_node
+     (Node : lkt_base_entity_Ptr) return int is
+   begin
+      Clear_Last_Exception;
+      return Boolean'Pos (Is_Token_Node (Node.Node));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   function lkt_is_synthetic
+     (Node : lkt_base_entity_Ptr) return int is
+   begin
+      Clear_Last_Exception;
+      return Boolean'Pos (Is_Synthetic (Node.Node));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   procedure lkt_node_image
+     (Node : lkt_base_entity_Ptr; Result : access lkt_text) is
+   begin
+      Clear_Last_Exception;
+      declare
+         Img : constant Text_Type := Short_Text_Image (Node.Node);
+      begin
+         Result.all := Wrap_Alloc (Img);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure lkt_node_text
+     (Node : lkt_base_entity_Ptr;
+      Text : access lkt_text) is
+   begin
+      Clear_Last_Exception;
+      Text.all := Wrap_Alloc (Implementation.Text (Node.Node));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure lkt_node_sloc_range
+     (Node         : lkt_base_entity_Ptr;
+      Sloc_Range_P : access lkt_source_location_range) is
+   begin
+      Clear_Last_Exception;
+
+      Sloc_Range_P.all := Wrap (Sloc_Range (Node.Node));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure lkt_lookup_in_node
+     (Node   : lkt_base_entity_Ptr;
+      Sloc   : lkt_source_location;
+      Result : lkt_base_entity_Ptr) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         S : constant Source_Location := Unwrap (Sloc);
+      begin
+         Result.all := (Lookup (Node.Node, S), Node.Info);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function lkt_node_children_count
+     (Node : lkt_base_entity_Ptr) return unsigned is
+   begin
+      Clear_Last_Exception;
+      return unsigned (Children_Count (Node.Node));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   function lkt_node_child
+     (Node    : lkt_base_entity_Ptr;
+      N       : unsigned;
+      Child_P : lkt_base_entity_Ptr) return int is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Result : Bare_LK_Node;
+         Exists : Boolean;
+      begin
+         if N > unsigned (Natural'Last) then
+            return 0;
+         end if;
+         Get_Child (Node.Node, Natural (N) + 1, Exists, Result);
+         if Exists then
+            Child_P.all := (Result, Node.Info);
+            return 1;
+         else
+            return 0;
+         end if;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   function lkt_node_export_tree
+     (Node   : lkt_base_entity_Ptr;
+      Tree_P : access lkt_node_tree) return int is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         function Count_Nodes (N : Bare_LK_Node) return Natural;
+         --  Return the number of nodes in the tree rooted at N
+
+         -----------------
+         -- Count_Nodes --
+         -----------------
+
+         function Count_Nodes (N : Bare_LK_Node) return Natural is
+            Result : Natural := 1;
+            C      : Bare_LK_Node;
+         begin
+            for I in 1 .. Children_Count (N) loop
+               C := Child (N, I);
+               if C /= null then
+                  Result := Result + Count_Nodes (C);
+               end if;
+            end loop;
+            return Result;
+         end Count_Nodes;
+
+         Count  : constant Natural :=
+           (if Node.Node = null then 0 else Count_Nodes (Node.Node));
+         Length : constant Storage_Offset := Storage_Offset (Count);
+
+         Node_Size : constant Storage_Offset :=
+           Bare_LK_Node'Size / System.Storage_Unit;
+
+         --  Allocate all columns in a single memory block: first the nodes,
+         --  then 32-bit columns and finally 16-bit columns, so that all
+         --  columns are properly aligned.
+
+         Nodes_Addr : constant System.Address := System.Memory.Alloc
+           (System.Memory.size_t (Length * (Node_Size + 7 * 4 + 2 * 2)));
+         Kinds_Addr           : constant System.Address :=
+           Nodes_Addr + Length * Node_Size;
+         Parents_Addr         : constant System.Address :=
+           Kinds_Addr + Length * 4;
+         Children_Counts_Addr : constant System.Address :=
+           Parents_Addr + Length * 4;
+         Token_Starts_Addr    : constant System.Address :=
+           Children_Counts_Addr + Length * 4;
+         Token_Ends_Addr      : constant System.Address :=
+           Token_Starts_Addr + Length * 4;
+         Start_Lines_Addr     : constant System.Address :=
+           Token_Ends_Addr + Length * 4;
+         End_Lines_Addr       : constant System.Address :=
+           Start_Lines_Addr + Length * 4;
+         Start_Columns_Addr   : constant System.Address :=
+           End_Lines_Addr + Length * 4;
+         End_Columns_Addr     : constant System.Address :=
+           Start_Columns_Addr + Length * 2;
+
+         subtype Index_Range is Integer range 0 .. Count - 1;
+         type Node_Column is array (Index_Range) of Bare_LK_Node
+           with Convention => C;
+         type Int_Column is array (Index_Range) of int
+           with Convention => C;
+         type Line_Column is array (Index_Range) of Unsigned_32
+           with Convention => C;
+         type Column_Column is array (Index_Range) of Unsigned_16
+           with Convention => C;
+
+         Nodes           : Node_Column with Import, Address => Nodes_Addr;
+         Kinds           : Int_Column with Import, Address => Kinds_Addr;
+         Parents         : Int_Column with Import, Address => Parents_Addr;
+         Children_Counts : Int_Column
+           with Import, Address => Children_Counts_Addr;
+         Token_Starts    : Int_Column
+           with Import, Address => Token_Starts_Addr;
+         Token_Ends      : Int_Column with Import, Address => Token_Ends_Addr;
+         Start_Lines     : Line_Column
+           with Import, Address => Start_Lines_Addr;
+         End_Lines       : Line_Column with Import, Address => End_Lines_Addr;
+         Start_Columns   : Column_Column
+           with Import, Address => Start_Columns_Addr;
+         End_Columns     : Column_Column
+           with Import, Address => End_Columns_Addr;
+
+         Next : Natural := 0;
+         --  Index of the next node to export
+
+         procedure Export (N : Bare_LK_Node; Parent : int);
+         --  Store data for all nodes in the tree rooted at N in columns, using
+         --  Parent as the index of N's parent.
+
+         ------------
+         -- Export --
+         ------------
+
+         procedure Export (N : Bare_LK_Node; Parent : int) is
+            Index    : constant Natural := Next;
+            Sloc     : constant Source_Location_Range := Sloc_Range (N);
+            Children : Natural := 0;
+            C        : Bare_LK_Node;
+         begin
+            Next := Next + 1;
+
+            Nodes (Index) := N;
+            Kinds (Index) := int (N.Kind'Enum_Rep);
+            Parents (Index) := Parent;
+            Token_Starts (Index) := int (N.Token_Start_Index);
+            Token_Ends (Index) := int (N.Token_End_Index);
+            Start_Lines (Index) := Unsigned_32 (Sloc.Start_Line);
+            Start_Columns (Index) := Unsigned_16 (Sloc.Start_Column);
+            End_Lines (Index) := Unsigned_32 (Sloc.End_Line);
+            End_Columns (Index) := Unsigned_16 (Sloc.End_Column);
+
+            for I in 1 .. Children_Count (N) loop
+               C := Child (N, I);
+               if C /= null then
+                  Children := Children + 1;
+                  Export (C, int (Index));
+               end if;
+            end loop;
+            Children_Counts (Index) := int (Children);
+         end Export;
+
+      begin
+         if Count > 0 then
+            Export (Node.Node, -1);
+         end if;
+
+         Tree_P.all := (Count           => int (Count),
+                        Nodes           => Nodes_Addr,
+                        Kinds           => Kinds_Addr,
+                        Parents         => Parents_Addr,
+                        Children_Counts => Children_Counts_Addr,
+                        Token_Starts    => Token_Starts_Addr,
+                        Token_Ends      => Token_Ends_Addr,
+                        Start_Lines     => Start_Lines_Addr,
+                        Start_Columns   => Start_Columns_Addr,
+                        End_Lines       => End_Lines_Addr,
+                        End_Columns     => End_Columns_Addr);
+         return 1;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   procedure lkt_destroy_node_tree
+     (Tree : access lkt_node_tree) is
+   begin
+      Clear_Last_Exception;
+
+      System.Memory.Free (Tree.Nodes);
+      Tree.all := (Count => 0, others => System.Null_Address);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function lkt_text_to_locale_string
+     (Text : lkt_text) return System.Address is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         use GNATCOLL.Iconv;
+
+         Input_Byte_Size : constant size_t := 4 * Text.Length;
+
+         Output_Byte_Size : constant size_t := Input_Byte_Size + 1;
+         --  Assuming no encoding will take more than 4 bytes per character, 4
+         --  times the size of the input text plus one null byte should be
+         --  enough to hold the result. This is a development helper anyway, so
+         --  we don't have performance concerns.
+
+         Result : constant System.Address := System.Memory.Alloc
+           (System.Memory.size_t (Output_Byte_Size));
+         --  Buffer we are going to return to the caller. We use
+         --  System.Memory.Alloc so that users can call C's "free" function in
+         --  order to free it.
+
+         Input : String (1 .. Natural (Input_Byte_Size));
+         for Input'Address use Text.Chars;
+
+         Output : String (1 .. Natural (Output_Byte_Size));
+         for Output'Address use Result;
+
+         State                     : Iconv_T;
+         Input_Index, Output_Index : Positive := 1;
+         Status                    : Iconv_Result;
+
+         From_Code : constant String :=
+           (if System."=" (System.Default_Bit_Order, System.Low_Order_First)
+            then UTF32LE
+            else UTF32BE);
+
+      begin
+         --  GNATCOLL.Iconv raises Constraint_Error exceptions for empty
+         --  strings, so handle them ourselves.
+
+         if Input_Byte_Size = 0 then
+            Output (1) := ASCII.NUL;
+         end if;
+
+         --  Encode to the locale. Don't bother with error checking...
+
+         Set_Locale;
+         State := Iconv_Open
+           (To_Code         => Locale,
+            From_Code       => From_Code,
+            Transliteration => True,
+            Ignore          => True);
+         Iconv (State, Input, Input_Index, Output, Output_Index, Status);
+         Iconv_Close (State);
+
+         --  Don't forget the trailing NULL character to keep C programs happy
+         Output (Output_Index) := ASCII.NUL;
+
+         return Result;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return System.Null_Address;
+   end;
+
+   function lkt_text_to_bytes
+     (Text   : access lkt_text;
+      Bytes  : access System.Address;
+      Length : access size_t) return int is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Chars : Text_Type (1 .. Natural (Text.Length))
+           with Import, Address => Text.Chars;
+
+         Is_Latin_1 : constant Boolean :=
+           (for all C of Chars => Wide_Wide_Character'Pos (C) < 256);
+      begin
+         if Is_Latin_1 then
+
+            --  Fast path: one byte per character, no need for a transcoder
+
+            Bytes.all := System.Memory.Alloc
+              (System.Memory.size_t (Natural'Max (1, Chars'Length)));
+            Length.all := size_t (Chars'Length);
+            declare
+               Result : String (Chars'Range)
+                 with Import, Address => Bytes.all;
+            begin
+               for I in Chars'Range loop
+                  Result (I) :=
+                    Character'Val (Wide_Wide_Character'Pos (Chars (I)));
+               end loop;
+            end;
+            return 1;
+
+         else
+            declare
+               Encoded : constant String := To_UTF8 (Chars);
+               Buffer  : constant System.Address := System.Memory.Alloc
+                 (System.Memory.size_t (Encoded'Length));
+               Result  : String (Encoded'Range)
+                 with Import, Address => Buffer;
+            begin
+               Result := Encoded;
+               Bytes.all := Buffer;
+               Length.all := size_t (Encoded'Length);
+            end;
+            return 0;
+         end if;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   ----------
+   -- Wrap --
+   ----------
+
+   function Wrap (S : Unbounded_Wide_Wide_String) return lkt_text is
+      Chars  : Big_Wide_Wide_String_Access;
+      Length : Natural;
+   begin
+      Get_Wide_Wide_String (S, Chars, Length);
+      return (Chars.all'Address, size_t (Length), 0);
+   end Wrap;
+
+   ------------------------
+   -- Set_Last_Exception --
+   ------------------------
+
+   procedure Set_Last_Exception (Exc : Exception_Occurrence) is
+   begin
+      --  If it's the first time, allocate room for the exception information
+
+      if Last_Exception = null then
+         Last_Exception := new lkt_exception;
+
+      --  If it is not the first time, free memory allocated for the last
+      --  exception.
+
+      elsif Last_Exception.Information /= Null_Ptr then
+         Free (Last_Exception.Information);
+      end if;
+
+      --  Get the kind corresponding to Exc
+
+      declare
+         Id : constant Exception_Id := Exception_Identity (Exc);
+      begin
+         if Id = Invalid_Field'Identity then
+            Last_Exception.Kind := Exception_Invalid_Field;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Node_Data_Evaluation_Error'Identity then
+            Last_Exception.Kind := Exception_Node_Data_Evaluation_Error;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Invalid_Input'Identity then
+            Last_Exception.Kind := Exception_Invalid_Input;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Invalid_Symbol_Error'Identity then
+            Last_Exception.Kind := Exception_Invalid_Symbol_Error;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Invalid_Unit_Name_Error'Identity then
+            Last_Exception.Kind := Exception_Invalid_Unit_Name_Error;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Native_Exception'Identity then
+            Last_Exception.Kind := Exception_Native_Exception;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Precondition_Failure'Identity then
+            Last_Exception.Kind := Exception_Precondition_Failure;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Property_Error'Identity then
+            Last_Exception.Kind := Exception_Property_Error;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Template_Args_Error'Identity then
+            Last_Exception.Kind := Exception_Template_Args_Error;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Template_Format_Error'Identity then
+            Last_Exception.Kind := Exception_Template_Format_Error;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Template_Instantiation_Error'Identity then
+            Last_Exception.Kind := Exception_Template_Instantiation_Error;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Stale_Reference_Error'Identity then
+            Last_Exception.Kind := Exception_Stale_Reference_Error;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Unknown_Charset'Identity then
+            Last_Exception.Kind := Exception_Unknown_Charset;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         else
+            Last_Exception.Kind := Exception_Native_Exception;
+            Last_Exception.Information :=
+               New_String (Exception_Information (Exc));
+         end if;
+      end;
+
+      Current_Exception := Last_Exception;
+   end Set_Last_Exception;
+
+   --------------------------
+   -- Clear_Last_Exception --
+   --------------------------
+
+   procedure Clear_Last_Exception is
+   begin
+      if Current_Exception /= null then
+         Free (Last_Exception.Information);
+         Current_Exception := null;
+      end if;
+   end Clear_Last_Exception;
+
+   function lkt_get_last_exception return lkt_exception_Ptr
+   is
+   begin
+      return Current_Exception;
+   end;
+
+   function lkt_token_kind_name (Kind : int) return chars_ptr
+   is
+      K : Token_Kind;
+   begin
+      begin
+         K := Token_Kind'Enum_Val (Kind);
+      exception
+         when Exc : Constraint_Error =>
+            Set_Last_Exception (Exc);
+            return Null_Ptr;
+      end;
+
+      return New_String (Token_Kind_Name (K));
+   end;
+
+   procedure lkt_token_next
+     (Token      : lkt_token;
+      Next_Token : access lkt_token)
+   is
+   begin
+      Clear_Last_Exception;
+      declare
+         T  : constant Token_Reference := Unwrap (Token);
+         NT : constant Token_Reference := Next (T);
+      begin
+         Next_Token.all := Wrap (NT);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure lkt_token_previous
+     (Token          : lkt_token;
+      Previous_Token : access lkt_token)
+   is
+   begin
+      Clear_Last_Exception;
+      declare
+         T  : constant Token_Reference := Unwrap (Token);
+         PT : constant Token_Reference := Previous (T);
+      begin
+         Previous_Token.all := Wrap (PT);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function lkt_token_range_text
+     (First, Last : lkt_token;
+      Text        : access lkt_text) return int
+   is
+   begin
+      Clear_Last_Exception;
+      declare
+         FD : constant Token_Data_Type := Data (Unwrap (First));
+         LD : constant Token_Data_Type := Data (Unwrap (Last));
+
+         First_Source_Buffer, Last_Source_Buffer : Text_Cst_Access;
+         First_Index, Ignored_First              : Positive;
+         Last_Index, Ignored_Last                : Natural;
+      begin
+         Extract_Token_Text
+           (FD, First_Source_Buffer, First_Index, Ignored_Last);
+         Extract_Token_Text
+           (LD, Last_Source_Buffer, Ignored_First, Last_Index);
+         if First_Source_Buffer /= Last_Source_Buffer then
+            return 0;
+         end if;
+         Text.all := Wrap (First_Source_Buffer, First_Index, Last_Index);
+         return 1;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   function lkt_token_is_equivalent
+     (Left  : lkt_token;
+      Right : lkt_token) return lkt_bool
+   is
+   begin
+      Clear_Last_Exception;
+         declare
+         L  : constant Token_Reference := Unwrap (Left);
+         R  : constant Token_Reference := Unwrap (Right);
+      begin
+         return lkt_bool (Boolean'Pos (Is_Equivalent (L, R)));
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   procedure lkt_entity_image
+     (Ent : lkt_base_entity_Ptr; Result : access lkt_text) is
+   begin
+      Clear_Last_Exception;
+      declare
+         Img : constant Text_Type := Text_Image (Ent.all);
+      begin
+         Result.all := Wrap_Alloc (Img);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   ----------------
+   -- Wrap_Alloc --
+   ----------------
+
+   function Wrap_Alloc (S : Text_Type) return lkt_text is
+      T : Text_Access := new Text_Type'(S);
+   begin
+      return lkt_text'(T.all'Address, T.all'Length, Is_Allocated => 1);
+   end Wrap_Alloc;
+
+   ----------
+   -- Wrap --
+   ----------
+
+   function Wrap
+     (S     : Text_Cst_Access;
+      First : Positive;
+      Last  : Natural) return lkt_text
+   is
+      Substring : Text_Type renames S (First .. Last);
+   begin
+      return (if First > Last
+              then (Chars        => System.Null_Address,
+                    Length       => 0,
+                    Is_Allocated => 0)
+              else (Chars        => S (First)'Address,
+                    Length       => Substring'Length,
+                    Is_Allocated => 0));
+   end Wrap;
+
+   procedure lkt_destroy_text (T : access lkt_text) is
+   begin
+      Clear_Last_Exception;
+      declare
+         use System;
+      begin
+         if T.Is_Allocated /= 0 and then T.Chars /= System.Null_Address then
+            declare
+               TT : Text_Type (1 .. Natural (T.Length));
+               for TT'Address use T.Chars;
+               TA : Text_Access := TT'Unrestricted_Access;
+            begin
+               Free (TA);
+            end;
+            T.Chars := System.Null_Address;
+         end if;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure lkt_symbol_text
+     (Symbol : access lkt_symbol_type; Text : access lkt_text) is
+   begin
+      Clear_Last_Exception;
+      declare
+         Sym    : constant Symbol_Type := Unwrap_Symbol (Symbol.all);
+         Result : constant Text_Type :=
+           (if Sym = null then "" else Image (Sym));
+      begin
+         Text.all := Wrap_Alloc (Result);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function lkt_create_big_integer
+     (Text : access lkt_text) return lkt_big_integer is
+   begin
+      Clear_Last_Exception;
+      declare
+         T      : Text_Type (1 .. Natural (Text.Length))
+            with Import, Address => Text.Chars;
+         Image  : constant String := Langkit_Support.Text.Image (T);
+         Result : constant Big_Integer_Type := Create_Big_Integer (Image);
+      begin
+         return Wrap_Big_Integer (Result);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return lkt_big_integer (System.Null_Address);
+   end lkt_create_big_integer;
+
+   procedure lkt_big_integer_text
+     (Bigint : lkt_big_integer; Text : access lkt_text) is
+   begin
+      Clear_Last_Exception;
+      declare
+         BI    : constant Big_Integer_Type := Unwrap_Big_Integer (Bigint);
+         Image : constant String := BI.Value.Image;
+      begin
+         Text.all := Wrap_Alloc (To_Text (Image));
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure lkt_big_integer_decref
+     (Bigint : lkt_big_integer) is
+   begin
+      Clear_Last_Exception;
+      declare
+         BI : Big_Integer_Type := Unwrap_Big_Integer (Bigint);
+      begin
+         Dec_Ref (BI);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function lkt_create_unit_provider
+     (Data                    : System.Address;
+      Destroy_Func            : lkt_unit_provider_destroy_callback;
+      Get_Unit_Filename_Func  : lkt_unit_provider_get_unit_filename_callback;
+      Get_Unit_From_Name_Func : lkt_unit_provider_get_unit_from_name_callback)
+      return lkt_unit_provider is
+   begin
+      Clear_Last_Exception;
+      declare
+         Result : constant C_Unit_Provider_Access := new C_Unit_Provider'
+           (Ada.Finalization.Limited_Controlled with
+            Ref_Count               => 1,
+            Data                    => Data,
+            Destroy_Func            => Destroy_Func,
+            Get_Unit_Filename_Func  => Get_Unit_Filename_Func,
+            Get_Unit_From_Name_Func => Get_Unit_From_Name_Func);
+      begin
+         return Wrap_Private_Provider (Internal_Unit_Provider_Access (Result));
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return lkt_unit_provider (System.Null_Address);
+   end;
+
+   procedure lkt_dec_ref_unit_provider
+     (Provider : lkt_unit_provider) is
+   begin
+      Clear_Last_Exception;
+      declare
+         P : Internal_Unit_Provider_Access :=
+            Unwrap_Private_Provider (Provider);
+      begin
+         Dec_Ref (P);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   --------------
+   -- Finalize --
+   --------------
+
+   overriding procedure Finalize (Provider : in out C_Unit_Provider) is
+   begin
+      Provider.Destroy_Func (Provider.Data);
+   end Finalize;
+
+   -------------
+   -- Inc_Ref --
+   -------------
+
+   overriding procedure Inc_Ref (Provider : in out C_Unit_Provider) is
+   begin
+      Provider.Ref_Count := Provider.Ref_Count + 1;
+   end Inc_Ref;
+
+   -------------
+   -- Dec_Ref --
+   -------------
+
+   overriding function Dec_Ref
+     (Provider : in out C_Unit_Provider) return Boolean is
+   begin
+      Provider.Ref_Count := Provider.Ref_Count - 1;
+      if Provider.Ref_Count = 0 then
+         return True;
+      else
+         return False;
+      end if;
+   end Dec_Ref;
+
+   -----------------------
+   -- Get_Unit_Filename --
+   -----------------------
+
+   overriding function Get_Unit_Filename
+     (Provider : C_Unit_Provider;
+      Name     : Text_Type;
+      Kind     : Analysis_Unit_Kind) return String
+   is
+      Name_Access : constant Text_Cst_Access := Name'Unrestricted_Access;
+
+      C_Result : chars_ptr := Provider.Get_Unit_Filename_Func
+        (Provider.Data, Wrap (Name_Access), Kind);
+   begin
+      if C_Result = Null_Ptr then
+         raise Property_Error with "invalid AST node for unit name";
+      else
+         declare
+            Result : constant String := Value (C_Result);
+         begin
+            Free (C_Result);
+            return Result;
+         end;
+      end if;
+   end Get_Unit_Filename;
+
+   --------------
+   -- Get_Unit --
+   --------------
+
+   overriding function Get_Unit
+     (Provider : C_Unit_Provider;
+      Context  : Internal_Context;
+      Name     : Text_Type;
+      Kind     : Analysis_Unit_Kind;
+      Charset  : String := "";
+      Reparse  : Boolean := False) return Internal_Unit
+   is
+      Name_Access : constant Text_Cst_Access := Name'Unrestricted_Access;
+      C_Charset   : chars_ptr := (if Charset'Length = 0
+                                  then Null_Ptr
+                                  else New_String (Charset));
+   begin
+      return C_Result : constant lkt_analysis_unit :=
+         Provider.Get_Unit_From_Name_Func
+           (Provider.Data, Context, Wrap (Name_Access), Kind,
+            C_Charset, Boolean'Pos (Reparse))
+      do
+         Free (C_Charset);
+         if C_Result = null then
+            raise Property_Error with "invalid AST node for unit name";
+         end if;
+      end return;
+   end Get_Unit;
+
+   
+
+
+   ----------
+   -- Wrap --
+   ----------
+
+   function Wrap (Token : Token_Reference) return lkt_token is
+      function Convert is new Ada.Unchecked_Conversion
+        (Token_Data_Handler_Access, System.Address);
+   begin
+      if Token = No_Token then
+         return (Token_Data   => System.Null_Address,
+                 Token_Index  => -1,
+                 Trivia_Index => -1,
+                 others       => <>);
+      end if;
+
+      declare
+         D : constant Token_Data_Type := Data (Token);
+         K : constant Token_Kind := Kind (D);
+
+         Index : constant Token_Or_Trivia_Index := Get_Token_Index (Token);
+
+         Source_Buffer : Text_Cst_Access;
+         First         : Positive;
+         Last          : Natural;
+      begin
+         Extract_Token_Text (D, Source_Buffer, First, Last);
+         return (Token_Data   => Convert (Get_Token_TDH (Token)),
+                 Token_Index  => int (Index.Token),
+                 Trivia_Index => int (Index.Trivia),
+                 Kind         => K'Enum_Rep,
+                 Text         => Wrap (Source_Buffer, First, Last),
+                 Sloc_Range   => Wrap (Sloc_Range (D)));
+      end;
+   end Wrap;
+
+   ------------
+   -- Unwrap --
+   ------------
+
+   function Unwrap (Token : lkt_token) return Token_Reference is
+      use System;
+
+      --  The following unchecked conversion makes it possible to restore the
+      --  Ada type of token data handler accesses from the C API. All
+      --  read/writes for the pointed values are made in Ada through values of
+      --  the same access type. Thus, strict aliasing issues should not arise
+      --  for these.
+      --
+      --  See <https://gcc.gnu.org/onlinedocs/gnat_ugn/
+      --       Optimization-and-Strict-Aliasing.html>.
+
+      pragma Warnings (Off, "possible aliasing problem for type");
+      function Convert is new Ada.Unchecked_Conversion
+        (System.Address, Token_Data_Handler_Access);
+      pragma Warnings (On, "possible aliasing problem for type");
+
+   begin
+      return (if Token.Token_Data = Null_Address
+              then No_Token
+              else Wrap_Token_Reference
+                     (Convert (Token.Token_Data),
+                      (Token  => Token_Index (Token.Token_Index),
+                       Trivia => Token_Index (Token.Trivia_Index))));
+   end Unwrap;
+
+   
+
+
+
+function lkt_bare_lk_node_array_create (Length : int) return Bare_LK_Node_Array_Access is
+begin
+   Clear_Last_Exception;
+   return Create_Bare_LK_Node_Array (Natural (Length));
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+      return null;
+end lkt_bare_lk_node_array_create;
+
+procedure lkt_bare_lk_node_array_inc_ref (A : Bare_LK_Node_Array_Access) is
+begin
+   Clear_Last_Exception;
+   Inc_Ref (A);
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end;
+
+procedure lkt_bare_lk_node_array_dec_ref (A : Bare_LK_Node_Array_Access) is
+begin
+   Clear_Last_Exception;
+   declare
+      A_Var : Bare_LK_Node_Array_Access := A;
+   begin
+      Dec_Ref (A_Var);
+   end;
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end;
+
+
+
+   
+
+
+
+function lkt_lk_node_array_create (Length : int) return Internal_Entity_Array_Access is
+begin
+   Clear_Last_Exception;
+   return Create_Internal_Entity_Array (Natural (Length));
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+      return null;
+end lkt_lk_node_array_create;
+
+procedure lkt_lk_node_array_inc_ref (A : Internal_Entity_Array_Access) is
+begin
+   Clear_Last_Exception;
+   Inc_Ref (A);
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end;
+
+procedure lkt_lk_node_array_dec_ref (A : Internal_Entity_Array_Access) is
+begin
+   Clear_Last_Exception;
+   declare
+      A_Var : Internal_Entity_Array_Access := A;
+   begin
+      Dec_Ref (A_Var);
+   end;
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end;
+
+
+
+   ---------------------------------------
+   -- Kind-specific AST node primitives --
+   ---------------------------------------
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_p_node_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.LK_Node_P_Node_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_p_node_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_p_char_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.LK_Node_P_Char_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_p_char_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_p_int_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.LK_Node_P_Int_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_p_int_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_p_bool_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.LK_Node_P_Bool_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_p_bool_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_p_bigint_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.LK_Node_P_Bigint_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_p_bigint_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_p_string_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.LK_Node_P_String_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_p_string_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_p_symbol_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.LK_Node_P_Symbol_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_p_symbol_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_p_regexp_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.LK_Node_P_Regexp_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_p_regexp_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_p_array_gen_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.LK_Node_P_Array_Gen_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_p_array_gen_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_p_astlist_gen_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.LK_Node_P_Astlist_Gen_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_p_astlist_gen_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_p_iterator_gen_trait
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity_Trait_Decl;
+         begin
+            Result := Liblktlang.Implementation.LK_Node_P_Iterator_Gen_Trait (Unwrapped_Node);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_p_iterator_gen_trait;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_p_check_semantic
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_internal_tree_semantic_result) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Tree_Semantic_Result;
+         begin
+            Result := Liblktlang.Implementation.LK_Node_P_Check_Semantic (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                   Result
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_p_check_semantic;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_parent
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity;
+         begin
+            Result := Liblktlang.Implementation.Parent (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_parent;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_parents
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_lk_node_array) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity_Array_Access;
+         begin
+            Result := Liblktlang.Implementation.Parents (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                   Result
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_parents;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_children
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_lk_node_array) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity_Array_Access;
+         begin
+            Result := Liblktlang.Implementation.Children (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                   Result
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_children;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_token_start
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_token) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Token_Reference;
+         begin
+            Result := Liblktlang.Implementation.Token_Start (Unwrapped_Node);
+
+            Value_P.all :=
+                   Wrap (Result)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_token_start;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_token_end
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_token) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Token_Reference;
+         begin
+            Result := Liblktlang.Implementation.Token_End (Unwrapped_Node);
+
+            Value_P.all :=
+                   Wrap (Result)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_token_end;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_child_index
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access int) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Integer;
+         begin
+            Result := Liblktlang.Implementation.Child_Index (Unwrapped_Node);
+
+            Value_P.all :=
+                   int (Result)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_child_index;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_previous_sibling
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity;
+         begin
+            Result := Liblktlang.Implementation.Previous_Sibling (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_previous_sibling;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_next_sibling
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity;
+         begin
+            Result := Liblktlang.Implementation.Next_Sibling (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_next_sibling;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_unit
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_analysis_unit) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Unit;
+         begin
+            Result := Liblktlang.Implementation.Unit (Unwrapped_Node);
+
+            Value_P.all :=
+                   Result
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_unit;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_is_ghost
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_bool) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Boolean;
+         begin
+            Result := Liblktlang.Implementation.Is_Ghost (Unwrapped_Node);
+
+            Value_P.all :=
+                   lkt_bool (Boolean'Pos (Result))
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_is_ghost;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lk_node_full_sloc_image
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_text_type) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Character_Type_Array_Access;
+         begin
+            Result := Liblktlang.Implementation.Full_Sloc_Image (Unwrapped_Node);
+
+            Value_P.all :=
+                   Result
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lk_node_full_sloc_image;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_base_lexer_case_rule_alt_f_send
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Base_Lexer_Case_Rule_Alt then
+
+         declare
+            
+
+            Result : Bare_Lexer_Case_Rule_Send;
+         begin
+            Result := Base_Lexer_Case_Rule_Alt_F_Send (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_base_lexer_case_rule_alt_f_send;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lexer_case_rule_cond_alt_f_cond_exprs
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Lexer_Case_Rule_Cond_Alt_Range then
+
+         declare
+            
+
+            Result : Bare_Ref_Id_List;
+         begin
+            Result := Lexer_Case_Rule_Cond_Alt_F_Cond_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lexer_case_rule_cond_alt_f_cond_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_decl_f_syn_name
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Decl then
+
+         declare
+            
+
+            Result : Bare_Def_Id;
+         begin
+            Result := Decl_F_Syn_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_decl_f_syn_name;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_decl_p_name
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_symbol_type) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Decl then
+
+         declare
+            
+
+            Result : Symbol_Type;
+         begin
+            Result := Liblktlang.Implementation.Dispatcher_Decl_P_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   Wrap_Symbol (Result)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_decl_p_name;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_decl_f_rules
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_Decl_Range then
+
+         declare
+            
+
+            Result : Bare_Full_Decl_List;
+         begin
+            Result := Grammar_Decl_F_Rules (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_decl_f_rules;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_decl_p_lexer
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_Decl_Range then
+
+         declare
+            
+
+            Result : Internal_Entity_Decl;
+         begin
+            Result := Liblktlang.Implementation.Grammar_Decl_P_Lexer (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_decl_p_lexer;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_base_grammar_rule_decl_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Base_Grammar_Rule_Decl then
+
+         declare
+            
+
+            Result : Bare_Grammar_Expr;
+         begin
+            Result := Base_Grammar_Rule_Decl_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_base_grammar_rule_decl_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_base_val_decl_p_get_type
+     (Node : lkt_base_entity_Ptr;
+
+         No_Inference :
+            
+            lkt_bool;
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+         
+         Unwrapped_No_Inference : constant Boolean :=
+               No_Inference /= 0
+         ;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Base_Val_Decl then
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.Dispatcher_Base_Val_Decl_P_Get_Type (Unwrapped_Node, No_Inference => Unwrapped_No_Inference, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_base_val_decl_p_get_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_explicitly_typed_decl_f_decl_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Explicitly_Typed_Decl then
+
+         declare
+            
+
+            Result : Bare_Type_Ref;
+         begin
+            Result := Explicitly_Typed_Decl_F_Decl_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_explicitly_typed_decl_f_decl_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_component_decl_f_default_val
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Component_Decl then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Component_Decl_F_Default_Val (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_component_decl_f_default_val;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_val_decl_f_val
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Val_Decl_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Val_Decl_F_Val (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_val_decl_f_val;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_fun_decl_f_args
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Fun_Decl_Range then
+
+         declare
+            
+
+            Result : Bare_Fun_Arg_Decl_List;
+         begin
+            Result := Fun_Decl_F_Args (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_fun_decl_f_args;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_fun_decl_f_return_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Fun_Decl_Range then
+
+         declare
+            
+
+            Result : Bare_Type_Ref;
+         begin
+            Result := Fun_Decl_F_Return_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_fun_decl_f_return_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_fun_decl_f_body
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Fun_Decl_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Fun_Decl_F_Body (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_fun_decl_f_body;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_generic_decl_f_generic_formal_decls
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Generic_Decl_Range then
+
+         declare
+            
+
+            Result : Bare_Full_Decl_List;
+         begin
+            Result := Generic_Decl_F_Generic_Formal_Decls (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_generic_decl_f_generic_formal_decls;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_generic_decl_f_decl
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Generic_Decl_Range then
+
+         declare
+            
+
+            Result : Bare_Decl;
+         begin
+            Result := Generic_Decl_F_Decl (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_generic_decl_f_decl;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lexer_decl_f_rules
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Lexer_Decl_Range then
+
+         declare
+            
+
+            Result : Bare_LK_Node_List;
+         begin
+            Result := Lexer_Decl_F_Rules (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lexer_decl_f_rules;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lexer_family_decl_f_rules
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Lexer_Family_Decl_Range then
+
+         declare
+            
+
+            Result : Bare_Full_Decl_List;
+         begin
+            Result := Lexer_Family_Decl_F_Rules (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lexer_family_decl_f_rules;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_type_decl_f_traits
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Type_Decl then
+
+         declare
+            
+
+            Result : Bare_Type_Ref_List;
+         begin
+            Result := Type_Decl_F_Traits (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_type_decl_f_traits;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_type_decl_p_implemented_traits
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_lk_node_array) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Type_Decl then
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl_Array_Access;
+         begin
+            Result := Liblktlang.Implementation.Type_Decl_P_Implemented_Traits (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  Convert (Result)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_type_decl_p_implemented_traits;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_type_decl_f_base_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Type_Decl then
+
+         declare
+            
+
+            Result : Bare_Type_Ref;
+         begin
+            Result := Type_Decl_F_Base_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_type_decl_f_base_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_type_decl_p_base_types
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_lk_node_array) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Type_Decl then
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl_Array_Access;
+         begin
+            Result := Liblktlang.Implementation.Type_Decl_P_Base_Types (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  Convert (Result)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_type_decl_p_base_types;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_type_decl_p_root_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Type_Decl then
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.Type_Decl_P_Root_Type (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_type_decl_p_root_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_type_decl_p_is_subtype
+     (Node : lkt_base_entity_Ptr;
+
+         Potential_Base :
+            access constant
+            lkt_base_entity;
+
+      Value_P : access lkt_bool) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+         
+         Unwrapped_Potential_Base : constant Internal_Entity_Type_Decl :=
+               (if Potential_Base.all.Node = null
+                then No_Entity_Type_Decl
+                else (Potential_Base.all.Node, Potential_Base.all.Info))
+         ;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Type_Decl then
+
+         declare
+            
+
+            Result : Boolean;
+         begin
+            Result := Liblktlang.Implementation.Dispatcher_Type_Decl_P_Is_Subtype (Unwrapped_Node, Potential_Base => Unwrapped_Potential_Base, E_Info => Node.Info);
+
+            Value_P.all :=
+                   lkt_bool (Boolean'Pos (Result))
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_type_decl_p_is_subtype;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_type_decl_p_is_generic
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_bool) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Type_Decl then
+
+         declare
+            
+
+            Result : Boolean;
+         begin
+            Result := Liblktlang.Implementation.Type_Decl_P_Is_Generic (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                   lkt_bool (Boolean'Pos (Result))
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_type_decl_p_is_generic;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_instantiated_generic_type_p_get_inner_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Instantiated_Generic_Type_Range then
+
+         declare
+            
+
+            Result : Bare_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.Instantiated_Generic_Type_P_Get_Inner_Type (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_instantiated_generic_type_p_get_inner_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_instantiated_generic_type_p_get_actuals
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_lk_node_array) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Instantiated_Generic_Type_Range then
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl_Array_Access;
+         begin
+            Result := Liblktlang.Implementation.Instantiated_Generic_Type_P_Get_Actuals (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  Convert (Result)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_instantiated_generic_type_p_get_actuals;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_instantiated_generic_type_p_get_instantiated_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Instantiated_Generic_Type_Range then
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.Instantiated_Generic_Type_P_Get_Instantiated_Type (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_instantiated_generic_type_p_get_instantiated_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_named_type_decl_f_decls
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Named_Type_Decl then
+
+         declare
+            
+
+            Result : Bare_Decl_Block;
+         begin
+            Result := Named_Type_Decl_F_Decls (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_named_type_decl_f_decls;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_enum_class_decl_f_branches
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Enum_Class_Decl_Range then
+
+         declare
+            
+
+            Result : Bare_Enum_Class_Case_List;
+         begin
+            Result := Enum_Class_Decl_F_Branches (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_enum_class_decl_f_branches;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_enum_type_decl_f_literals
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Enum_Type_Decl_Range then
+
+         declare
+            
+
+            Result : Bare_Enum_Lit_Decl_List;
+         begin
+            Result := Enum_Type_Decl_F_Literals (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_enum_type_decl_f_literals;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_decl_annotation_f_name
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Decl_Annotation_Range then
+
+         declare
+            
+
+            Result : Bare_Id;
+         begin
+            Result := Decl_Annotation_F_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_decl_annotation_f_name;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_decl_annotation_f_params
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Decl_Annotation_Range then
+
+         declare
+            
+
+            Result : Bare_Decl_Annotation_Params;
+         begin
+            Result := Decl_Annotation_F_Params (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_decl_annotation_f_params;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_decl_annotation_params_f_params
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Decl_Annotation_Params_Range then
+
+         declare
+            
+
+            Result : Bare_Param_List;
+         begin
+            Result := Decl_Annotation_Params_F_Params (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_decl_annotation_params_f_params;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_doc_f_lines
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Doc_Range then
+
+         declare
+            
+
+            Result : Bare_Doc_Comment_List;
+         begin
+            Result := Doc_F_Lines (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_doc_f_lines;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_elsif_branch_f_cond_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Elsif_Branch_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Elsif_Branch_F_Cond_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_elsif_branch_f_cond_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_elsif_branch_f_then_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Elsif_Branch_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Elsif_Branch_F_Then_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_elsif_branch_f_then_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_enum_class_case_f_decls
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Enum_Class_Case_Range then
+
+         declare
+            
+
+            Result : Bare_Enum_Class_Alt_Decl_List;
+         begin
+            Result := Enum_Class_Case_F_Decls (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_enum_class_case_f_decls;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_excludes_null_p_as_bool
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_bool) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Excludes_Null then
+
+         declare
+            
+
+            Result : Boolean;
+         begin
+            Result := Liblktlang.Implementation.Dispatcher_Excludes_Null_P_As_Bool (Unwrapped_Node);
+
+            Value_P.all :=
+                   lkt_bool (Boolean'Pos (Result))
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_excludes_null_p_as_bool;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_expr_p_in_type_ref
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_bool) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Expr then
+
+         declare
+            
+
+            Result : Boolean;
+         begin
+            Result := Liblktlang.Implementation.Expr_P_In_Type_Ref (Unwrapped_Node);
+
+            Value_P.all :=
+                   lkt_bool (Boolean'Pos (Result))
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_expr_p_in_type_ref;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_expr_p_is_regular_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_bool) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Expr then
+
+         declare
+            
+
+            Result : Boolean;
+         begin
+            Result := Liblktlang.Implementation.Expr_P_Is_Regular_Expr (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                   lkt_bool (Boolean'Pos (Result))
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_expr_p_is_regular_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_expr_p_expr_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_internal_semantic_result) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Expr then
+
+         declare
+            
+
+            Result : Internal_Semantic_Result;
+         begin
+            Result := Liblktlang.Implementation.Dispatcher_Expr_P_Expr_Type (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                   Result
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_expr_p_expr_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_expr_p_check_expr_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Expr then
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.Expr_P_Check_Expr_Type (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_expr_p_check_expr_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_expr_p_expr_context_free_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Expr then
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.Dispatcher_Expr_P_Expr_Context_Free_Type (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_expr_p_expr_context_free_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_expr_p_referenced_decl
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_internal_semantic_result) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Expr then
+
+         declare
+            
+
+            Result : Internal_Semantic_Result;
+         begin
+            Result := Liblktlang.Implementation.Dispatcher_Expr_P_Referenced_Decl (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                   Result
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_expr_p_referenced_decl;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_expr_p_check_referenced_decl
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Expr then
+
+         declare
+            
+
+            Result : Internal_Entity_Decl;
+         begin
+            Result := Liblktlang.Implementation.Expr_P_Check_Referenced_Decl (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_expr_p_check_referenced_decl;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_array_literal_f_exprs
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Array_Literal_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Array_Literal_F_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_array_literal_f_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_bin_op_f_left
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Bin_Op_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Bin_Op_F_Left (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_bin_op_f_left;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_bin_op_f_op
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Bin_Op_Range then
+
+         declare
+            
+
+            Result : Bare_Op;
+         begin
+            Result := Bin_Op_F_Op (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_bin_op_f_op;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_bin_op_f_right
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Bin_Op_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Bin_Op_F_Right (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_bin_op_f_right;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_block_expr_f_val_defs
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Block_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_LK_Node_List;
+         begin
+            Result := Block_Expr_F_Val_Defs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_block_expr_f_val_defs;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_block_expr_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Block_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Block_Expr_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_block_expr_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_call_expr_f_name
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Call_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Call_Expr_F_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_call_expr_f_name;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_call_expr_f_args
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Call_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Param_List;
+         begin
+            Result := Call_Expr_F_Args (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_call_expr_f_args;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_call_expr_p_called_object_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Call_Expr_Range then
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.Call_Expr_P_Called_Object_Type (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_call_expr_p_called_object_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_call_expr_p_called_decl
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Call_Expr_Range then
+
+         declare
+            
+
+            Result : Internal_Entity_Decl;
+         begin
+            Result := Liblktlang.Implementation.Call_Expr_P_Called_Decl (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_call_expr_p_called_decl;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_cast_expr_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Cast_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Cast_Expr_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_cast_expr_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_cast_expr_f_excludes_null
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Cast_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Excludes_Null;
+         begin
+            Result := Cast_Expr_F_Excludes_Null (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_cast_expr_f_excludes_null;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_cast_expr_f_dest_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Cast_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Type_Ref;
+         begin
+            Result := Cast_Expr_F_Dest_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_cast_expr_f_dest_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_dot_expr_f_prefix
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Dot_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Dot_Expr_F_Prefix (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_dot_expr_f_prefix;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_dot_expr_f_suffix
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Dot_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Ref_Id;
+         begin
+            Result := Dot_Expr_F_Suffix (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_dot_expr_f_suffix;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_error_on_null_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Error_On_Null_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Error_On_Null_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_error_on_null_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_generic_instantiation_f_name
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Generic_Instantiation_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Generic_Instantiation_F_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_generic_instantiation_f_name;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_generic_instantiation_f_args
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Generic_Instantiation_Range then
+
+         declare
+            
+
+            Result : Bare_Type_Ref_List;
+         begin
+            Result := Generic_Instantiation_F_Args (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_generic_instantiation_f_args;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_generic_instantiation_p_instantiated_decl
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Generic_Instantiation_Range then
+
+         declare
+            
+
+            Result : Internal_Entity_Decl;
+         begin
+            Result := Liblktlang.Implementation.Generic_Instantiation_P_Instantiated_Decl (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_generic_instantiation_p_instantiated_decl;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_discard_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_Discard_Range then
+
+         declare
+            
+
+            Result : Bare_Grammar_Expr;
+         begin
+            Result := Grammar_Discard_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_discard_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_dont_skip_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_Dont_Skip_Range then
+
+         declare
+            
+
+            Result : Bare_Grammar_Expr;
+         begin
+            Result := Grammar_Dont_Skip_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_dont_skip_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_dont_skip_f_dont_skip
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_Dont_Skip_Range then
+
+         declare
+            
+
+            Result : Bare_Grammar_Expr;
+         begin
+            Result := Grammar_Dont_Skip_F_Dont_Skip (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_dont_skip_f_dont_skip;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_list_f_list_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_List_Range then
+
+         declare
+            
+
+            Result : Bare_Type_Ref;
+         begin
+            Result := Grammar_List_F_List_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_list_f_list_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_list_f_kind
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_List_Range then
+
+         declare
+            
+
+            Result : Bare_List_Kind;
+         begin
+            Result := Grammar_List_F_Kind (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_list_f_kind;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_list_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_List_Range then
+
+         declare
+            
+
+            Result : Bare_Grammar_Expr;
+         begin
+            Result := Grammar_List_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_list_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_list_f_sep
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_List_Range then
+
+         declare
+            
+
+            Result : Bare_Grammar_Expr;
+         begin
+            Result := Grammar_List_F_Sep (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_list_f_sep;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_null_f_name
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_Null_Range then
+
+         declare
+            
+
+            Result : Bare_Type_Ref;
+         begin
+            Result := Grammar_Null_F_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_null_f_name;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_opt_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_Opt_Range then
+
+         declare
+            
+
+            Result : Bare_Grammar_Expr;
+         begin
+            Result := Grammar_Opt_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_opt_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_opt_group_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_Opt_Group_Range then
+
+         declare
+            
+
+            Result : Bare_Grammar_Expr_List;
+         begin
+            Result := Grammar_Opt_Group_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_opt_group_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_or_expr_f_sub_exprs
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_Or_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Grammar_Expr_List_List;
+         begin
+            Result := Grammar_Or_Expr_F_Sub_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_or_expr_f_sub_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_pick_f_exprs
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_Pick_Range then
+
+         declare
+            
+
+            Result : Bare_Grammar_Expr_List;
+         begin
+            Result := Grammar_Pick_F_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_pick_f_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_predicate_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_Predicate_Range then
+
+         declare
+            
+
+            Result : Bare_Grammar_Expr;
+         begin
+            Result := Grammar_Predicate_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_predicate_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_predicate_f_prop_ref
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_Predicate_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Grammar_Predicate_F_Prop_Ref (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_predicate_f_prop_ref;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_rule_ref_f_node_name
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_Rule_Ref_Range then
+
+         declare
+            
+
+            Result : Bare_Ref_Id;
+         begin
+            Result := Grammar_Rule_Ref_F_Node_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_rule_ref_f_node_name;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_grammar_skip_f_name
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Grammar_Skip_Range then
+
+         declare
+            
+
+            Result : Bare_Type_Ref;
+         begin
+            Result := Grammar_Skip_F_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_grammar_skip_f_name;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_parse_node_expr_f_node_name
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Parse_Node_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Type_Ref;
+         begin
+            Result := Parse_Node_Expr_F_Node_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_parse_node_expr_f_node_name;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_parse_node_expr_f_sub_exprs
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Parse_Node_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Grammar_Expr_List;
+         begin
+            Result := Parse_Node_Expr_F_Sub_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_parse_node_expr_f_sub_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_token_no_case_lit_f_lit
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Token_No_Case_Lit_Range then
+
+         declare
+            
+
+            Result : Bare_Token_Lit;
+         begin
+            Result := Token_No_Case_Lit_F_Lit (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_token_no_case_lit_f_lit;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_token_ref_f_token_name
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Token_Ref_Range then
+
+         declare
+            
+
+            Result : Bare_Ref_Id;
+         begin
+            Result := Token_Ref_F_Token_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_token_ref_f_token_name;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_token_ref_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Token_Ref_Range then
+
+         declare
+            
+
+            Result : Bare_Token_Lit;
+         begin
+            Result := Token_Ref_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_token_ref_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_if_expr_f_cond_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_If_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := If_Expr_F_Cond_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_if_expr_f_cond_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_if_expr_f_then_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_If_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := If_Expr_F_Then_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_if_expr_f_then_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_if_expr_f_alternatives
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_If_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Elsif_Branch_List;
+         begin
+            Result := If_Expr_F_Alternatives (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_if_expr_f_alternatives;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_if_expr_f_else_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_If_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := If_Expr_F_Else_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_if_expr_f_else_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_isa_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Isa_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Isa_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_isa_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_isa_f_dest_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Isa_Range then
+
+         declare
+            
+
+            Result : Bare_Type_Ref_List;
+         begin
+            Result := Isa_F_Dest_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_isa_f_dest_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lambda_expr_f_params
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Lambda_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Lambda_Arg_Decl_List;
+         begin
+            Result := Lambda_Expr_F_Params (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lambda_expr_f_params;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lambda_expr_f_return_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Lambda_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Type_Ref;
+         begin
+            Result := Lambda_Expr_F_Return_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lambda_expr_f_return_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lambda_expr_f_body
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Lambda_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Lambda_Expr_F_Body (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lambda_expr_f_body;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_string_lit_p_is_prefixed_string
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_bool) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_String_Lit_Range then
+
+         declare
+            
+
+            Result : Boolean;
+         begin
+            Result := Liblktlang.Implementation.Extensions.String_Lit_P_Is_Prefixed_String (Unwrapped_Node);
+
+            Value_P.all :=
+                   lkt_bool (Boolean'Pos (Result))
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_string_lit_p_is_prefixed_string;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_string_lit_p_prefix
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access uint32_t) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_String_Lit_Range then
+
+         declare
+            
+
+            Result : Character_Type;
+         begin
+            Result := Liblktlang.Implementation.Extensions.String_Lit_P_Prefix (Unwrapped_Node);
+
+            Value_P.all :=
+                   Character_Type'Pos (Result)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_string_lit_p_prefix;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_string_lit_p_denoted_value
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_text_type) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_String_Lit_Range then
+
+         declare
+            
+
+            Result : Character_Type_Array_Access;
+         begin
+            Result := Liblktlang.Implementation.Extensions.String_Lit_P_Denoted_Value (Unwrapped_Node);
+
+            Value_P.all :=
+                   Result
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_string_lit_p_denoted_value;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_string_lit_p_is_regexp_literal
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_bool) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_String_Lit_Range then
+
+         declare
+            
+
+            Result : Boolean;
+         begin
+            Result := Liblktlang.Implementation.String_Lit_P_Is_Regexp_Literal (Unwrapped_Node);
+
+            Value_P.all :=
+                   lkt_bool (Boolean'Pos (Result))
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_string_lit_p_is_regexp_literal;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_logic_expr_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Logic_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Logic_Expr_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_logic_expr_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_match_expr_f_match_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Match_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Match_Expr_F_Match_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_match_expr_f_match_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_match_expr_f_branches
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Match_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Match_Branch_List;
+         begin
+            Result := Match_Expr_F_Branches (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_match_expr_f_branches;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_not_expr_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Not_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Not_Expr_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_not_expr_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_paren_expr_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Paren_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Paren_Expr_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_paren_expr_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_raise_expr_f_except_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Raise_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Raise_Expr_F_Except_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_raise_expr_f_except_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_try_expr_f_try_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Try_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Try_Expr_F_Try_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_try_expr_f_try_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_try_expr_f_or_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Try_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Try_Expr_F_Or_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_try_expr_f_or_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_full_decl_f_doc
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Full_Decl_Range then
+
+         declare
+            
+
+            Result : Bare_Doc;
+         begin
+            Result := Full_Decl_F_Doc (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_full_decl_f_doc;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_full_decl_f_decl_annotations
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Full_Decl_Range then
+
+         declare
+            
+
+            Result : Bare_Decl_Annotation_List;
+         begin
+            Result := Full_Decl_F_Decl_Annotations (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_full_decl_f_decl_annotations;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_full_decl_f_decl
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Full_Decl_Range then
+
+         declare
+            
+
+            Result : Bare_Decl;
+         begin
+            Result := Full_Decl_F_Decl (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_full_decl_f_decl;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_import_f_name
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Import_Range then
+
+         declare
+            
+
+            Result : Bare_Module_Ref_Id;
+         begin
+            Result := Import_F_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_import_f_name;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_import_p_referenced_unit
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_analysis_unit) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Import_Range then
+
+         declare
+            
+
+            Result : Internal_Unit;
+         begin
+            Result := Liblktlang.Implementation.Import_P_Referenced_Unit (Unwrapped_Node);
+
+            Value_P.all :=
+                   Result
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_import_p_referenced_unit;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_langkit_root_f_imports
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Langkit_Root_Range then
+
+         declare
+            
+
+            Result : Bare_Import_List;
+         begin
+            Result := Langkit_Root_F_Imports (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_langkit_root_f_imports;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_langkit_root_f_decls
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Langkit_Root_Range then
+
+         declare
+            
+
+            Result : Bare_Full_Decl_List;
+         begin
+            Result := Langkit_Root_F_Decls (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_langkit_root_f_decls;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_langkit_root_p_check_legality
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_semantic_result_array) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Langkit_Root_Range then
+
+         declare
+            
+
+            Result : Internal_Semantic_Result_Array_Access;
+         begin
+            Result := Liblktlang.Implementation.Langkit_Root_P_Check_Legality (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                   Result
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_langkit_root_p_check_legality;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lexer_case_rule_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Lexer_Case_Rule_Range then
+
+         declare
+            
+
+            Result : Bare_Grammar_Expr;
+         begin
+            Result := Lexer_Case_Rule_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lexer_case_rule_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lexer_case_rule_f_alts
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Lexer_Case_Rule_Range then
+
+         declare
+            
+
+            Result : Bare_Base_Lexer_Case_Rule_Alt_List;
+         begin
+            Result := Lexer_Case_Rule_F_Alts (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lexer_case_rule_f_alts;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lexer_case_rule_send_f_sent
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Lexer_Case_Rule_Send_Range then
+
+         declare
+            
+
+            Result : Bare_Ref_Id;
+         begin
+            Result := Lexer_Case_Rule_Send_F_Sent (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lexer_case_rule_send_f_sent;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_lexer_case_rule_send_f_match_size
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Lexer_Case_Rule_Send_Range then
+
+         declare
+            
+
+            Result : Bare_Num_Lit;
+         begin
+            Result := Lexer_Case_Rule_Send_F_Match_Size (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_lexer_case_rule_send_f_match_size;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_match_branch_f_decl
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Match_Branch_Range then
+
+         declare
+            
+
+            Result : Bare_Match_Val_Decl;
+         begin
+            Result := Match_Branch_F_Decl (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_match_branch_f_decl;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_match_branch_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Match_Branch_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Match_Branch_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_match_branch_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_param_f_name
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Param_Range then
+
+         declare
+            
+
+            Result : Bare_Ref_Id;
+         begin
+            Result := Param_F_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_param_f_name;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_param_f_value
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Param_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Param_F_Value (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_param_f_value;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_type_ref_p_designated_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Type_Ref then
+
+         declare
+            
+
+            Result : Internal_Entity_Type_Decl;
+         begin
+            Result := Liblktlang.Implementation.Dispatcher_Type_Ref_P_Designated_Type (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_type_ref_p_designated_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_function_type_ref_f_args_types
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Function_Type_Ref_Range then
+
+         declare
+            
+
+            Result : Bare_Type_Ref_List;
+         begin
+            Result := Function_Type_Ref_F_Args_Types (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_function_type_ref_f_args_types;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_function_type_ref_f_return_type
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Function_Type_Ref_Range then
+
+         declare
+            
+
+            Result : Bare_Type_Ref;
+         begin
+            Result := Function_Type_Ref_F_Return_Type (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_function_type_ref_f_return_type;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_generic_type_ref_f_type_name
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Generic_Type_Ref_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Generic_Type_Ref_F_Type_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_generic_type_ref_f_type_name;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_generic_type_ref_f_params
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Generic_Type_Ref_Range then
+
+         declare
+            
+
+            Result : Bare_Type_Ref_List;
+         begin
+            Result := Generic_Type_Ref_F_Params (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_generic_type_ref_f_params;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_simple_type_ref_f_type_name
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Simple_Type_Ref_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Simple_Type_Ref_F_Type_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_simple_type_ref_f_type_name;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_var_bind_f_name
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Var_Bind_Range then
+
+         declare
+            
+
+            Result : Bare_Ref_Id;
+         begin
+            Result := Var_Bind_F_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_var_bind_f_name;
+
+
+           
+
+   
+
+   
+   
+
+   function lkt_var_bind_f_expr
+     (Node : lkt_base_entity_Ptr;
+
+
+      Value_P : access lkt_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_LK_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in lkt_Var_Bind_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Var_Bind_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end lkt_var_bind_f_expr;
+
+
+
+         
+
+
+
+
+
+         
+
+
+
+procedure lkt_internal_semantic_result_inc_ref (R : lkt_internal_semantic_result_Ptr) is
+begin
+   Clear_Last_Exception;
+   Inc_Ref (R.all);
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end lkt_internal_semantic_result_inc_ref;
+
+procedure lkt_internal_semantic_result_dec_ref (R : lkt_internal_semantic_result_Ptr) is
+begin
+   Clear_Last_Exception;
+   Dec_Ref (R.all);
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end lkt_internal_semantic_result_dec_ref;
+
+
+         
+
+
+
+procedure lkt_internal_tree_semantic_result_inc_ref (R : lkt_internal_tree_semantic_result_Ptr) is
+begin
+   Clear_Last_Exception;
+   Inc_Ref (R.all);
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end lkt_internal_tree_semantic_result_inc_ref;
+
+procedure lkt_internal_tree_semantic_result_dec_ref (R : lkt_internal_tree_semantic_result_Ptr) is
+begin
+   Clear_Last_Exception;
+   Dec_Ref (R.all);
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end lkt_internal_tree_semantic_result_dec_ref;
+
+
+
+         
+
+
+
+function lkt_text_type_create (Length : int) return Character_Type_Array_Access is
+begin
+   Clear_Last_Exception;
+   return Create_Character_Type_Array (Natural (Length));
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+      return null;
+end lkt_text_type_create;
+
+procedure lkt_text_type_inc_ref (A : Character_Type_Array_Access) is
+begin
+   Clear_Last_Exception;
+   Inc_Ref (A);
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end;
+
+procedure lkt_text_type_dec_ref (A : Character_Type_Array_Access) is
+begin
+   Clear_Last_Exception;
+   declare
+      A_Var : Character_Type_Array_Access := A;
+   begin
+      Dec_Ref (A_Var);
+   end;
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end;
+
+
+         
+
+
+
+function lkt_semantic_result_array_create (Length : int) return Internal_Semantic_Result_Array_Access is
+begin
+   Clear_Last_Exception;
+   return Create_Internal_Semantic_Result_Array (Natural (Length));
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+      return null;
+end lkt_semantic_result_array_create;
+
+procedure lkt_semantic_result_array_inc_ref (A : Internal_Semantic_Result_Array_Access) is
+begin
+   Clear_Last_Exception;
+   Inc_Ref (A);
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end;
+
+procedure lkt_semantic_result_array_dec_ref (A : Internal_Semantic_Result_Array_Access) is
+begin
+   Clear_Last_Exception;
+   declare
+      A_Var : Internal_Semantic_Result_Array_Access := A;
+   begin
+      Dec_Ref (A_Var);
+   end;
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end;
+
+
+
+end Liblktlang.Implementation.C;
@@ -0,0 +1,1182 @@
+
+with Liblktlang.Implementation;    use Liblktlang.Implementation;
+with Liblktlang.Introspection_Implementation;
+with Liblktlang.Public_Converters; use Liblktlang.Public_Converters;
+
+package body Liblktlang.Introspection is
+
+   package Impl renames Introspection_Implementation;
+
+   --  TODO: move implementation of functions dealing with values (Satisfies,
+   --  Eval_Property, ...) to Impl. This is not not done yet as substantial
+   --  work is required in order to convert back and forth public values
+   --  (structures, symbols) to their internal representations.
+
+   function Allocate (Kind : Value_Kind) return Value_Type;
+   --  Allocate a polymorphic value of the given kind
+
+   pragma Warnings (Off, "is not referenced");
+   function To_Internal_Value
+     (Value : Any_Value_Type) return Impl.Internal_Value;
+   function From_Internal_Value
+     (Value : Impl.Internal_Value) return Any_Value_Type;
+   pragma Warnings (On, "is not referenced");
+
+   ------------
+   -- Adjust --
+   ------------
+
+   overriding procedure Adjust (Self : in out Value_Access_Wrapper) is
+   begin
+      if Self.Value = null then
+         return;
+      end if;
+
+      declare
+         Rec : Value_Record renames Self.Value.all;
+      begin
+         Rec.Ref_Count := Rec.Ref_Count + 1;
+      end;
+   end Adjust;
+
+   --------------
+   -- Finalize --
+   --------------
+
+   overriding procedure Finalize (Self : in out Value_Access_Wrapper) is
+   begin
+      if Self.Value = null then
+         return;
+      end if;
+
+      --  If Self is non-null, decrement the reference count of the referenced
+      --  value.
+
+      declare
+         Rec : Value_Record renames Self.Value.all;
+      begin
+         Rec.Ref_Count := Rec.Ref_Count - 1;
+
+         if Rec.Ref_Count = 0 then
+            --  Reference count dropped to 0: time to free the value and what
+            --  is inside.
+
+            case Rec.Kind is
+                     when Text_Type_Value =>
+                        Free (Rec.Text_Type_Value);
+                     when LK_Node_Array_Value =>
+                        Free (Rec.LK_Node_Array_Value);
+                     when Type_Decl_Array_Value =>
+                        Free (Rec.Type_Decl_Array_Value);
+                     when Semantic_Result_Array_Value =>
+                        Free (Rec.Semantic_Result_Array_Value);
+               when others => null;
+            end case;
+
+            Free (Self.Value);
+         end if;
+      end;
+   end Finalize;
+
+   ----------
+   -- Kind --
+   ----------
+
+   function Kind (Self : Value_Type) return Value_Kind is
+   begin
+      return Self.Value.Value.Kind;
+   end Kind;
+
+   --------------
+   -- Allocate --
+   --------------
+
+   function Allocate (Kind : Value_Kind) return Value_Type is
+      Result : Any_Value_Type;
+   begin
+      Result.Value.Value := new Value_Record (Kind);
+      Result.Value.Value.Ref_Count := 1;
+      return Result;
+   end Allocate;
+
+   -----------------------
+   -- To_Internal_Value --
+   -----------------------
+
+   function To_Internal_Value
+     (Value : Any_Value_Type) return Impl.Internal_Value is
+   begin
+      if Value = No_Value then
+         return Impl.No_Internal_Value;
+      end if;
+
+      case Kind (Value) is
+         when Boolean_Value =>
+            return Impl.Create_Boolean (As_Boolean (Value));
+
+         when Integer_Value =>
+            return Impl.Create_Integer (As_Integer (Value));
+
+         when Character_Value =>
+            return Impl.Create_Character (As_Character (Value));
+
+         when Node_Value =>
+            return Impl.Create_Node (Unwrap_Entity (As_Node (Value)));
+
+         when others =>
+            --  For now we use this only to handle default values, so this
+            --  should be unreachable.
+            raise Program_Error;
+      end case;
+   end To_Internal_Value;
+
+   -------------------------
+   -- From_Internal_Value --
+   -------------------------
+
+   function From_Internal_Value
+     (Value : Impl.Internal_Value) return Any_Value_Type is
+   begin
+      case Value.Kind is
+         when None =>
+            return No_Value;
+
+         when Boolean_Value =>
+            return Create_Boolean (Impl.As_Boolean (Value));
+
+         when Integer_Value =>
+            return Create_Integer (Impl.As_Integer (Value));
+
+         when Character_Value =>
+            return Create_Character (Impl.As_Character (Value));
+
+            when Analysis_Unit_Kind_Value =>
+               return Create_Analysis_Unit_Kind
+                 (Impl.As_Analysis_Unit_Kind (Value));
+            when Lookup_Kind_Value =>
+               return Create_Lookup_Kind
+                 (Impl.As_Lookup_Kind (Value));
+            when Grammar_Rule_Value =>
+               return Create_Grammar_Rule
+                 (Impl.As_Grammar_Rule (Value));
+
+         when Node_Value =>
+            declare
+               N : constant Internal_Entity := Impl.As_Node (Value);
+            begin
+               return Create_Node (Wrap_Node (N.Node, N.Info));
+            end;
+      end case;
+   end From_Internal_Value;
+
+   ----------------
+   -- As_Boolean --
+   ----------------
+
+   function As_Boolean (Self : Value_Type) return Boolean is
+   begin
+      return Self.Value.Value.Boolean_Value;
+   end As_Boolean;
+
+   --------------------
+   -- Create_Boolean --
+   --------------------
+
+   function Create_Boolean (Value : Boolean) return Value_Type is
+   begin
+      return Result : constant Value_Type := Allocate (Boolean_Value) do
+         Result.Value.Value.Boolean_Value := Value;
+      end return;
+   end Create_Boolean;
+
+   ----------------
+   -- As_Integer --
+   ----------------
+
+   function As_Integer (Self : Value_Type) return Integer is
+   begin
+      return Self.Value.Value.Integer_Value;
+   end As_Integer;
+
+   --------------------
+   -- Create_Integer --
+   --------------------
+
+   function Create_Integer (Value : Integer) return Value_Type is
+   begin
+      return Result : constant Value_Type := Allocate (Integer_Value) do
+         Result.Value.Value.Integer_Value := Value;
+      end return;
+   end Create_Integer;
+
+   --------------------
+   -- As_Big_Integer --
+   --------------------
+
+   function As_Big_Integer (Self : Value_Type) return Big_Integer is
+   begin
+      return Result : Big_Integer do
+         Result.Set (Self.Value.Value.Big_Integer_Value);
+      end return;
+   end As_Big_Integer;
+
+   ------------------------
+   -- Create_Big_Integer --
+   ------------------------
+
+   function Create_Big_Integer (Value : Big_Integer) return Value_Type is
+   begin
+      return Result : constant Value_Type := Allocate (Big_Integer_Value) do
+         Result.Value.Value.Big_Integer_Value.Set (Value);
+      end return;
+   end Create_Big_Integer;
+
+   ------------------
+   -- As_Character --
+   ------------------
+
+   function As_Character (Self : Value_Type) return Character_Type is
+   begin
+      return Self.Value.Value.Character_Value;
+   end As_Character;
+
+   ----------------------
+   -- Create_Character --
+   ----------------------
+
+   function Create_Character (Value : Character_Type) return Value_Type is
+   begin
+      return Result : constant Value_Type := Allocate (Character_Value) do
+         Result.Value.Value.Character_Value := Value;
+      end return;
+   end Create_Character;
+
+   --------------
+   -- As_Token --
+   --------------
+
+   function As_Token (Self : Value_Type) return Token_Reference is
+   begin
+      return Self.Value.Value.Token_Value;
+   end As_Token;
+
+   ------------------
+   -- Create_Token --
+   ------------------
+
+   function Create_Token (Value : Token_Reference) return Value_Type is
+   begin
+      return Result : constant Value_Type := Allocate (Token_Value)
+      do
+         Result.Value.Value.Token_Value := Value;
+      end return;
+   end Create_Token;
+
+   -----------------------
+   -- As_Unbounded_Text --
+   -----------------------
+
+   function As_Unbounded_Text (Self : Value_Type) return Unbounded_Text_Type is
+   begin
+      return Self.Value.Value.Unbounded_Text_Value;
+   end As_Unbounded_Text;
+
+   ---------------------------
+   -- Create_Unbounded_Text --
+   ---------------------------
+
+   function Create_Unbounded_Text
+     (Value : Unbounded_Text_Type) return Value_Type is
+   begin
+      return Result : constant Value_Type := Allocate (Unbounded_Text_Value)
+      do
+         Result.Value.Value.Unbounded_Text_Value := Value;
+      end return;
+   end Create_Unbounded_Text;
+
+   ----------------------
+   -- As_Analysis_Unit --
+   ----------------------
+
+   function As_Analysis_Unit (Self : Value_Type) return Analysis_Unit is
+   begin
+      return Self.Value.Value.Analysis_Unit_Value;
+   end As_Analysis_Unit;
+
+   --------------------------
+   -- Create_Analysis_Unit --
+   --------------------------
+
+   function Create_Analysis_Unit (Value : Analysis_Unit) return Value_Type is
+   begin
+      return Result : constant Value_Type := Allocate (Analysis_Unit_Value) do
+         Result.Value.Value.Analysis_Unit_Value := Value;
+      end return;
+   end Create_Analysis_Unit;
+
+   -------------
+   -- As_Node --
+   -------------
+
+   function As_Node (Self : Value_Type) return LK_Node is
+   begin
+      return Self.Value.Value.Node_Value;
+   end As_Node;
+
+   -----------------
+   -- Create_Node --
+   -----------------
+
+   function Create_Node
+     (Value : LK_Node'Class) return Value_Type is
+   begin
+      return Result : constant Value_Type := Allocate (Node_Value) do
+         Result.Value.Value.Node_Value := Value.As_LK_Node;
+      end return;
+   end Create_Node;
+
+      function As_Analysis_Unit_Kind
+        (Self : Value_Type) return Analysis_Unit_Kind is
+      begin
+         return Self.Value.Value.Analysis_Unit_Kind_Value;
+      end As_Analysis_Unit_Kind;
+
+      function Create_Analysis_Unit_Kind
+        (Value : Analysis_Unit_Kind) return Value_Type is
+      begin
+         return Result : constant Value_Type := Allocate
+           (Analysis_Unit_Kind_Value)
+         do
+            Result.Value.Value.Analysis_Unit_Kind_Value := Value;
+         end return;
+      end Create_Analysis_Unit_Kind;
+      function As_Lookup_Kind
+        (Self : Value_Type) return Lookup_Kind is
+      begin
+         return Self.Value.Value.Lookup_Kind_Value;
+      end As_Lookup_Kind;
+
+      function Create_Lookup_Kind
+        (Value : Lookup_Kind) return Value_Type is
+      begin
+         return Result : constant Value_Type := Allocate
+           (Lookup_Kind_Value)
+         do
+            Result.Value.Value.Lookup_Kind_Value := Value;
+         end return;
+      end Create_Lookup_Kind;
+      function As_Grammar_Rule
+        (Self : Value_Type) return Grammar_Rule is
+      begin
+         return Self.Value.Value.Grammar_Rule_Value;
+      end As_Grammar_Rule;
+
+      function Create_Grammar_Rule
+        (Value : Grammar_Rule) return Value_Type is
+      begin
+         return Result : constant Value_Type := Allocate
+           (Grammar_Rule_Value)
+         do
+            Result.Value.Value.Grammar_Rule_Value := Value;
+         end return;
+      end Create_Grammar_Rule;
+
+         function As_Text_Type
+           (Self : Value_Type) return Text_Type is
+         begin
+               return Result : Text_Type
+                 (Self.Value.Value.Text_Type_Value'Range)
+               do
+                  for I in Result'Range loop
+                        Result (I) :=
+                           Self.Value.Value.Text_Type_Value.all (I);
+                  end loop;
+               end return;
+
+         end As_Text_Type;
+
+         function Create_Text_Type
+           (Value : Text_Type) return Value_Type is
+         begin
+            return Result : constant Value_Type := Allocate
+              (Text_Type_Value)
+            do
+                  Result.Value.Value.Text_Type_Value :=
+                     new Text_Type (Value'Range);
+                  for I in Value'Range loop
+                        Result.Value.Value.Text_Type_Value.all (I) :=
+                           Value (I);
+                  end loop;
+
+            end return;
+         end Create_Text_Type;
+         function As_LK_Node_Array
+           (Self : Value_Type) return LK_Node_Array is
+         begin
+               return Result : LK_Node_Array
+                 (Self.Value.Value.LK_Node_Array_Value'Range)
+               do
+                  for I in Result'Range loop
+                        Result (I) :=
+                           Self.Value.Value.LK_Node_Array_Value.all (I);
+                  end loop;
+               end return;
+
+         end As_LK_Node_Array;
+
+         function Create_LK_Node_Array
+           (Value : LK_Node_Array) return Value_Type is
+         begin
+            return Result : constant Value_Type := Allocate
+              (LK_Node_Array_Value)
+            do
+                  Result.Value.Value.LK_Node_Array_Value :=
+                     new LK_Node_Array (Value'Range);
+                  for I in Value'Range loop
+                        Result.Value.Value.LK_Node_Array_Value.all (I) :=
+                           Value (I);
+                  end loop;
+
+            end return;
+         end Create_LK_Node_Array;
+         function As_Type_Decl_Array
+           (Self : Value_Type) return Type_Decl_Array is
+         begin
+               return Result : Type_Decl_Array
+                 (Self.Value.Value.Type_Decl_Array_Value'Range)
+               do
+                  for I in Result'Range loop
+                        Result (I) :=
+                           Self.Value.Value.Type_Decl_Array_Value.all (I);
+                  end loop;
+               end return;
+
+         end As_Type_Decl_Array;
+
+         function Create_Type_Decl_Array
+           (Value : Type_Decl_Array) return Value_Type is
+         begin
+            return Result : constant Value_Type := Allocate
+              (Type_Decl_Array_Value)
+            do
+                  Result.Value.Value.Type_Decl_Array_Value :=
+                     new Type_Decl_Array (Value'Range);
+                  for I in Value'Range loop
+                        Result.Value.Value.Type_Decl_Array_Value.all (I) :=
+                           Value (I);
+                  end loop;
+
+            end return;
+         end Create_Type_Decl_Array;
+         function As_Semantic_Result
+           (Self : Value_Type) return Semantic_Result is
+         begin
+               return Self.Value.Value.Semantic_Result_Value;
+         end As_Semantic_Result;
+
+         function Create_Semantic_Result
+           (Value : Semantic_Result) return Value_Type is
+         begin
+            return Result : constant Value_Type := Allocate
+              (Semantic_Result_Value)
+            do
+                  Result.Value.Value.Semantic_Result_Value := Value;
+            end return;
+         end Create_Semantic_Result;
+         function As_Semantic_Result_Array
+           (Self : Value_Type) return Semantic_Result_Array is
+         begin
+               return Result : Semantic_Result_Array
+                 (Self.Value.Value.Semantic_Result_Array_Value'Range)
+               do
+                  for I in Result'Range loop
+                        Result (I) :=
+                           Self.Value.Value.Semantic_Result_Array_Value.all (I);
+                  end loop;
+               end return;
+
+         end As_Semantic_Result_Array;
+
+         function Create_Semantic_Result_Array
+           (Value : Semantic_Result_Array) return Value_Type is
+         begin
+            return Result : constant Value_Type := Allocate
+              (Semantic_Result_Array_Value)
+            do
+                  Result.Value.Value.Semantic_Result_Array_Value :=
+                     new Semantic_Result_Array (Value'Range);
+                  for I in Value'Range loop
+                        Result.Value.Value.Semantic_Result_Array_Value.all (I) :=
+                           Value (I);
+                  end loop;
+
+            end return;
+         end Create_Semantic_Result_Array;
+         function As_Tree_Semantic_Result
+           (Self : Value_Type) return Tree_Semantic_Result is
+         begin
+               return Self.Value.Value.Tree_Semantic_Result_Value;
+         end As_Tree_Semantic_Result;
+
+         function Create_Tree_Semantic_Result
+           (Value : Tree_Semantic_Result) return Value_Type is
+         begin
+            return Result : constant Value_Type := Allocate
+              (Tree_Semantic_Result_Value)
+            do
+                  Result.Value.Value.Tree_Semantic_Result_Value := Value;
+            end return;
+         end Create_Tree_Semantic_Result;
+
+   --------------
+   -- DSL_Name --
+   --------------
+
+   function DSL_Name (Id : Node_Type_Id) return String is
+   begin
+      return Impl.DSL_Name (Id);
+   end DSL_Name;
+
+   ---------------------
+   -- Lookup_DSL_Name --
+   ---------------------
+
+   function Lookup_DSL_Name (Name : String) return Any_Node_Type_Id is
+   begin
+      return Impl.Lookup_DSL_Name (Name);
+   end Lookup_DSL_Name;
+
+   -----------------
+   -- Is_Abstract --
+   -----------------
+
+   function Is_Abstract (Id : Node_Type_Id) return Boolean is
+   begin
+      return Impl.Is_Abstract (Id);
+   end Is_Abstract;
+
+   --------------
+   -- Kind_For --
+   --------------
+
+   function Kind_For (Id : Node_Type_Id) return LK_Node_Kind_Type is
+   begin
+      return Impl.Kind_For (Id);
+   end Kind_For;
+
+   -----------------
+   -- Id_For_Kind --
+   -----------------
+
+   function Id_For_Kind (Kind : LK_Node_Kind_Type) return Node_Type_Id is
+   begin
+      return Impl.Id_For_Kind (Kind);
+   end Id_For_Kind;
+
+   ------------------
+   -- Is_Root_Node --
+   ------------------
+
+   function Is_Root_Node (Id : Node_Type_Id) return Boolean is
+   begin
+      return Impl.Is_Root_Node (Id);
+   end Is_Root_Node;
+
+   ---------------
+   -- Base_Type --
+   ---------------
+
+   function Base_Type (Id : Node_Type_Id) return Node_Type_Id is
+   begin
+      return Impl.Base_Type (Id);
+   end Base_Type;
+
+   -------------------
+   -- Derived_Types --
+   -------------------
+
+   function Derived_Types (Id : Node_Type_Id) return Node_Type_Id_Array is
+   begin
+      return Impl.Derived_Types (Id);
+   end Derived_Types;
+
+   ---------------------
+   -- Is_Derived_From --
+   ---------------------
+
+   function Is_Derived_From (Id, Parent : Node_Type_Id) return Boolean is
+   begin
+      return Impl.Is_Derived_From (Id, Parent);
+   end Is_Derived_From;
+
+   --------------
+   -- DSL_Name --
+   --------------
+
+   function DSL_Name (Constraint : Value_Constraint) return String is
+   begin
+      
+      case Constraint.Kind is
+               when Boolean_Value =>
+                  return "Bool";
+               when Integer_Value =>
+                  return "Int";
+               when Big_Integer_Value =>
+                  return "BigInt";
+               when Character_Value =>
+                  return "Character";
+               when Token_Value =>
+                  return "Token";
+               when Unbounded_Text_Value =>
+                  return "Symbol";
+               when Analysis_Unit_Value =>
+                  return "AnalysisUnit";
+               when Analysis_Unit_Kind_Value =>
+                  return "AnalysisUnitKind";
+               when Lookup_Kind_Value =>
+                  return "LookupKind";
+               when Grammar_Rule_Value =>
+                  return "GrammarRule";
+               when Text_Type_Value =>
+                  return "Character.array";
+               when LK_Node_Array_Value =>
+                  return "LKNode.entity.array";
+               when Type_Decl_Array_Value =>
+                  return "TypeDecl.entity.array";
+               when Semantic_Result_Value =>
+                  return "SemanticResult";
+               when Semantic_Result_Array_Value =>
+                  return "SemanticResult.array";
+               when Tree_Semantic_Result_Value =>
+                  return "TreeSemanticResult";
+
+         when Node_Value =>
+            return DSL_Name (Constraint.Node_Type);
+      end case;
+   end DSL_Name;
+
+   ---------------
+   -- Satisfies --
+   ---------------
+
+   function Satisfies
+     (Value : Value_Type; Constraint : Value_Constraint) return Boolean is
+   begin
+      if Value.Value.Value.Kind /= Constraint.Kind then
+         return False;
+      end if;
+
+      case Constraint.Kind is
+         when Node_Value =>
+            return
+
+              --  A null node always satisfies the type constraint
+              Value.Value.Value.Node_Value.Is_Null
+
+              --  Else, check that the type of the node is derived from the
+              --  type of the constraint.
+              or else Is_Derived_From
+                (Id_For_Kind (Value.Value.Value.Node_Value.Kind),
+                 Constraint.Node_Type);
+
+         when others =>
+            return True;
+      end case;
+   end Satisfies;
+
+   --------------------
+   -- Node_Data_Name --
+   --------------------
+
+   function Node_Data_Name (Node_Data : Node_Data_Reference) return String is
+   begin
+      return Impl.Node_Data_Name (Node_Data);
+   end Node_Data_Name;
+
+   --------------------
+   -- Node_Data_Type --
+   --------------------
+
+   function Node_Data_Type
+     (Node_Data : Node_Data_Reference) return Value_Constraint is
+   begin
+      return Impl.Node_Data_Type (Node_Data);
+   end Node_Data_Type;
+
+   --------------------
+   -- Eval_Node_Data --
+   --------------------
+
+   function Eval_Node_Data
+     (Node      : LK_Node'Class;
+      Node_Data : Node_Data_Reference;
+      Arguments : Value_Array) return Value_Type is
+   begin
+      case Node_Data is
+         when Field_Reference =>
+            if Arguments'Length > 0 then
+               raise Node_Data_Evaluation_Error with "fields take no argument";
+            end if;
+            pragma Warnings (Off, "value not in range of type");
+            return Create_Node (Eval_Field (Node, Node_Data));
+            pragma Warnings (On, "value not in range of type");
+
+         when Property_Reference =>
+            return Eval_Property (Node, Node_Data, Arguments);
+      end case;
+   end Eval_Node_Data;
+
+   ----------------------
+   -- Lookup_Node_Data --
+   ----------------------
+
+   function Lookup_Node_Data
+     (Id   : Node_Type_Id;
+      Name : String) return Any_Node_Data_Reference is
+   begin
+      return Impl.Lookup_Node_Data (Id, Name);
+   end Lookup_Node_Data;
+
+   ----------------
+   -- Field_Name --
+   ----------------
+
+   function Field_Name (Field : Field_Reference) return String is
+   begin
+      pragma Warnings (Off, "value not in range of type");
+      return Impl.Field_Name (Field);
+      pragma Warnings (On, "value not in range of type");
+   end Field_Name;
+
+   ----------------
+   -- Field_Type --
+   ----------------
+
+   function Field_Type (Field : Field_Reference) return Node_Type_Id is
+   begin
+      pragma Warnings (Off, "value not in range of type");
+      return Impl.Field_Type (Field);
+      pragma Warnings (On, "value not in range of type");
+   end Field_Type;
+
+   ----------------
+   -- Eval_Field --
+   ----------------
+
+   function Eval_Field
+     (Node  : LK_Node'Class;
+      Field : Field_Reference) return LK_Node
+   is
+      Ent : constant Internal_Entity := Unwrap_Entity (Node);
+
+      pragma Warnings (Off, "value not in range of type");
+      Result : constant Bare_LK_Node :=
+         Impl.Eval_Field (Ent.Node, Field);
+      pragma Warnings (On, "value not in range of type");
+   begin
+      return Wrap_Node (Result, Ent.Info);
+   end Eval_Field;
+
+   -----------
+   -- Index --
+   -----------
+
+   function Index
+     (Kind : LK_Node_Kind_Type; Field : Field_Reference) return Positive is
+   begin
+      pragma Warnings (Off, "value not in range of type");
+      return Impl.Index (Kind, Field);
+      pragma Warnings (On, "value not in range of type");
+   end Index;
+
+   --------------------------------
+   -- Field_Reference_From_Index --
+   --------------------------------
+
+   function Field_Reference_From_Index
+     (Kind : LK_Node_Kind_Type; Index : Positive) return Field_Reference is
+   begin
+      pragma Warnings (Off, "value not in range of type");
+      return Impl.Field_Reference_From_Index (Kind, Index);
+      pragma Warnings (On, "value not in range of type");
+   end Field_Reference_From_Index;
+
+   ------------
+   -- Fields --
+   ------------
+
+   function Fields (Kind : LK_Node_Kind_Type) return Field_Reference_Array is
+   begin
+      return Impl.Fields (Kind);
+   end Fields;
+
+   ------------
+   -- Fields --
+   ------------
+
+   function Fields (Id : Node_Type_Id) return Field_Reference_Array is
+   begin
+      return Impl.Fields (Id);
+   end Fields;
+
+
+   -------------------
+   -- Property_Name --
+   -------------------
+
+   function Property_Name (Property : Property_Reference) return String is
+   begin
+      return Impl.Property_Name (Property);
+   end Property_Name;
+
+   --------------------------
+   -- Property_Return_Type --
+   --------------------------
+
+   function Property_Return_Type
+     (Property : Property_Reference) return Value_Constraint is
+   begin
+      return Impl.Property_Return_Type (Property);
+   end Property_Return_Type;
+
+   -----------------------------
+   -- Property_Argument_Types --
+   -----------------------------
+
+   function Property_Argument_Types
+     (Property : Property_Reference) return Value_Constraint_Array is
+   begin
+      return Impl.Property_Argument_Types (Property);
+   end Property_Argument_Types;
+
+   ----------------------------
+   -- Property_Argument_Name --
+   ----------------------------
+
+   function Property_Argument_Name
+     (Property : Property_Reference; Argument_Number : Positive) return String
+   is
+   begin
+      return Impl.Property_Argument_Name (Property, Argument_Number);
+   end Property_Argument_Name;
+
+   -------------------------------------
+   -- Property_Argument_Default_Value --
+   -------------------------------------
+
+   function Property_Argument_Default_Value
+     (Property        : Property_Reference;
+      Argument_Number : Positive) return Any_Value_Type
+   is
+      Desc : Impl.Property_Descriptor renames
+         Impl.Property_Descriptors (Property).all;
+   begin
+      Impl.Check_Argument_Number (Desc, Argument_Number);
+      return From_Internal_Value
+        (Desc.Argument_Default_Values (Argument_Number));
+   end Property_Argument_Default_Value;
+
+   -------------------
+   -- Eval_Property --
+   -------------------
+
+   function Eval_Property
+     (Node      : LK_Node'Class;
+      Property  : Property_Reference;
+      Arguments : Value_Array) return Value_Type
+   is
+      Kind   : constant LK_Node_Kind_Type := Node.Kind;
+      Desc   : Impl.Property_Descriptor renames
+         Impl.Property_Descriptors (Property).all;
+      Result : Any_Value_Type := No_Value;
+   begin
+      --  First, check that arguments match the property signature
+
+      if Arguments'Length /= Desc.Arity then
+         raise Node_Data_Evaluation_Error with "invalid number of arguments";
+      end if;
+
+      for I in Desc.Argument_Types'Range loop
+         declare
+            Arg : Value_Type renames Arguments (I - 1 + Arguments'First);
+         begin
+            if not Satisfies (Arg, Desc.Argument_Types (I)) then
+               raise Node_Data_Evaluation_Error with
+                  "invalid type for argument " & Desc.Argument_Names (I).all;
+            end if;
+         end;
+      end loop;
+
+      --  Now, we can proceed with the property evaluation
+
+      
+      case Property is
+when LK_Node_P_Node_Type =>
+Result := Create_Node (Node.P_Node_Type);
+when LK_Node_P_Char_Type =>
+Result := Create_Node (Node.P_Char_Type);
+when LK_Node_P_Int_Type =>
+Result := Create_Node (Node.P_Int_Type);
+when LK_Node_P_Bool_Type =>
+Result := Create_Node (Node.P_Bool_Type);
+when LK_Node_P_Bigint_Type =>
+Result := Create_Node (Node.P_Bigint_Type);
+when LK_Node_P_String_Type =>
+Result := Create_Node (Node.P_String_Type);
+when LK_Node_P_Symbol_Type =>
+Result := Create_Node (Node.P_Symbol_Type);
+when LK_Node_P_Regexp_Type =>
+Result := Create_Node (Node.P_Regexp_Type);
+when LK_Node_P_Array_Gen_Type =>
+Result := Create_Node (Node.P_Array_Gen_Type);
+when LK_Node_P_Astlist_Gen_Type =>
+Result := Create_Node (Node.P_Astlist_Gen_Type);
+when LK_Node_P_Iterator_Gen_Trait =>
+Result := Create_Node (Node.P_Iterator_Gen_Trait);
+when LK_Node_P_Check_Semantic =>
+Result := Create_Tree_Semantic_Result (Node.P_Check_Semantic);
+when LK_Node_Parent =>
+Result := Create_Node (Node.Parent);
+when LK_Node_Parents =>
+Result := Create_LK_Node_Array (Node.Parents);
+when LK_Node_Children =>
+Result := Create_LK_Node_Array (Node.Children);
+when LK_Node_Token_Start =>
+Result := Create_Token (Node.Token_Start);
+when LK_Node_Token_End =>
+Result := Create_Token (Node.Token_End);
+when LK_Node_Child_Index =>
+Result := Create_Integer (Node.Child_Index);
+when LK_Node_Previous_Sibling =>
+Result := Create_Node (Node.Previous_Sibling);
+when LK_Node_Next_Sibling =>
+Result := Create_Node (Node.Next_Sibling);
+when LK_Node_Unit =>
+Result := Create_Analysis_Unit (Node.Unit);
+when LK_Node_Is_Ghost =>
+Result := Create_Boolean (Node.Is_Ghost);
+when LK_Node_Full_Sloc_Image =>
+Result := Create_Text_Type (Node.Full_Sloc_Image);
+when others => null;
+end case;
+case lkt_LK_Node (Kind) is
+when lkt_Langkit_Root_Range =>
+declare
+N_Bare_Langkit_Root : constant Analysis.Langkit_Root := Node.As_Langkit_Root;
+begin
+case Property is
+when Langkit_Root_P_Check_Legality =>
+Result := Create_Semantic_Result_Array (N_Bare_Langkit_Root.P_Check_Legality);
+when others => null;
+end case;
+end;
+when lkt_Import_Range =>
+declare
+N_Bare_Import : constant Analysis.Import := Node.As_Import;
+begin
+case Property is
+when Import_P_Referenced_Unit =>
+Result := Create_Analysis_Unit (N_Bare_Import.P_Referenced_Unit);
+when others => null;
+end case;
+end;
+when lkt_Decl =>
+declare
+N_Bare_Decl : constant Analysis.Decl := Node.As_Decl;
+begin
+case Property is
+when Decl_P_Name =>
+Result := Create_Unbounded_Text (N_Bare_Decl.P_Name);
+when others => null;
+end case;
+case lkt_Decl (Kind) is
+when lkt_Grammar_Decl_Range =>
+declare
+N_Bare_Grammar_Decl : constant Analysis.Grammar_Decl := N_Bare_Decl.As_Grammar_Decl;
+begin
+case Property is
+when Grammar_Decl_P_Lexer =>
+Result := Create_Node (N_Bare_Grammar_Decl.P_Lexer);
+when others => null;
+end case;
+end;
+when lkt_Type_Decl =>
+declare
+N_Bare_Type_Decl : constant Analysis.Type_Decl := N_Bare_Decl.As_Type_Decl;
+begin
+case Property is
+when Type_Decl_P_Implemented_Traits =>
+Result := Create_Type_Decl_Array (N_Bare_Type_Decl.P_Implemented_Traits);
+when Type_Decl_P_Base_Types =>
+Result := Create_Type_Decl_Array (N_Bare_Type_Decl.P_Base_Types);
+when Type_Decl_P_Root_Type =>
+Result := Create_Node (N_Bare_Type_Decl.P_Root_Type);
+when Type_Decl_P_Is_Subtype =>
+declare
+Potential_Base : constant Type_Decl :=
+As_Node (Arguments (Arguments'First + 0)).As_Type_Decl;
+begin
+Result := Create_Boolean (N_Bare_Type_Decl.P_Is_Subtype (Potential_Base));
+end;
+when Type_Decl_P_Is_Generic =>
+Result := Create_Boolean (N_Bare_Type_Decl.P_Is_Generic);
+when others => null;
+end case;
+case lkt_Type_Decl (Kind) is
+when lkt_Instantiated_Generic_Type_Range =>
+declare
+N_Bare_Instantiated_Generic_Type : constant Analysis.Instantiated_Generic_Type := N_Bare_Type_Decl.As_Instantiated_Generic_Type;
+begin
+case Property is
+when Instantiated_Generic_Type_P_Get_Inner_Type =>
+Result := Create_Node (N_Bare_Instantiated_Generic_Type.P_Get_Inner_Type);
+when Instantiated_Generic_Type_P_Get_Actuals =>
+Result := Create_Type_Decl_Array (N_Bare_Instantiated_Generic_Type.P_Get_Actuals);
+when Instantiated_Generic_Type_P_Get_Instantiated_Type =>
+Result := Create_Node (N_Bare_Instantiated_Generic_Type.P_Get_Instantiated_Type);
+when others => null;
+end case;
+end;
+when others => null;
+end case;
+end;
+when lkt_Base_Val_Decl =>
+declare
+N_Bare_Base_Val_Decl : constant Analysis.Base_Val_Decl := N_Bare_Decl.As_Base_Val_Decl;
+begin
+case Property is
+when Base_Val_Decl_P_Get_Type =>
+declare
+No_Inference : constant Boolean :=
+As_Boolean (Arguments (Arguments'First + 0));
+begin
+Result := Create_Node (N_Bare_Base_Val_Decl.P_Get_Type (No_Inference));
+end;
+when others => null;
+end case;
+end;
+when others => null;
+end case;
+end;
+when lkt_Expr =>
+declare
+N_Bare_Expr : constant Analysis.Expr := Node.As_Expr;
+begin
+case Property is
+when Expr_P_In_Type_Ref =>
+Result := Create_Boolean (N_Bare_Expr.P_In_Type_Ref);
+when Expr_P_Is_Regular_Expr =>
+Result := Create_Boolean (N_Bare_Expr.P_Is_Regular_Expr);
+when Expr_P_Expr_Type =>
+Result := Create_Semantic_Result (N_Bare_Expr.P_Expr_Type);
+when Expr_P_Check_Expr_Type =>
+Result := Create_Node (N_Bare_Expr.P_Check_Expr_Type);
+when Expr_P_Expr_Context_Free_Type =>
+Result := Create_Node (N_Bare_Expr.P_Expr_Context_Free_Type);
+when Expr_P_Referenced_Decl =>
+Result := Create_Semantic_Result (N_Bare_Expr.P_Referenced_Decl);
+when Expr_P_Check_Referenced_Decl =>
+Result := Create_Node (N_Bare_Expr.P_Check_Referenced_Decl);
+when others => null;
+end case;
+case lkt_Expr (Kind) is
+when lkt_Call_Expr_Range =>
+declare
+N_Bare_Call_Expr : constant Analysis.Call_Expr := N_Bare_Expr.As_Call_Expr;
+begin
+case Property is
+when Call_Expr_P_Called_Object_Type =>
+Result := Create_Node (N_Bare_Call_Expr.P_Called_Object_Type);
+when Call_Expr_P_Called_Decl =>
+Result := Create_Node (N_Bare_Call_Expr.P_Called_Decl);
+when others => null;
+end case;
+end;
+when lkt_Generic_Instantiation_Range =>
+declare
+N_Bare_Generic_Instantiation : constant Analysis.Generic_Instantiation := N_Bare_Expr.As_Generic_Instantiation;
+begin
+case Property is
+when Generic_Instantiation_P_Instantiated_Decl =>
+Result := Create_Node (N_Bare_Generic_Instantiation.P_Instantiated_Decl);
+when others => null;
+end case;
+end;
+when lkt_String_Lit_Range =>
+declare
+N_Bare_String_Lit : constant Analysis.String_Lit := N_Bare_Expr.As_String_Lit;
+begin
+case Property is
+when String_Lit_P_Is_Prefixed_String =>
+Result := Create_Boolean (N_Bare_String_Lit.P_Is_Prefixed_String);
+when String_Lit_P_Prefix =>
+Result := Create_Character (N_Bare_String_Lit.P_Prefix);
+when String_Lit_P_Denoted_Value =>
+Result := Create_Text_Type (N_Bare_String_Lit.P_Denoted_Value);
+when String_Lit_P_Is_Regexp_Literal =>
+Result := Create_Boolean (N_Bare_String_Lit.P_Is_Regexp_Literal);
+when others => null;
+end case;
+end;
+when others => null;
+end case;
+end;
+when lkt_Type_Ref =>
+declare
+N_Bare_Type_Ref : constant Analysis.Type_Ref := Node.As_Type_Ref;
+begin
+case Property is
+when Type_Ref_P_Designated_Type =>
+Result := Create_Node (N_Bare_Type_Ref.P_Designated_Type);
+when others => null;
+end case;
+end;
+when lkt_Excludes_Null =>
+declare
+N_Bare_Excludes_Null : constant Analysis.Excludes_Null := Node.As_Excludes_Null;
+begin
+case Property is
+when Excludes_Null_P_As_Bool =>
+Result := Create_Boolean (N_Bare_Excludes_Null.P_As_Bool);
+when others => null;
+end case;
+end;
+when others => null;
+end case;
+
+      if Result = No_Value then
+         raise Node_Data_Evaluation_Error with "no such field on this node";
+      end if;
+      return Result;
+   end Eval_Property;
+
+   ----------------
+   -- Properties --
+   ----------------
+
+   function Properties (Kind : LK_Node_Kind_Type) return Property_Reference_Array
+   is
+   begin
+      return Impl.Properties (Kind);
+   end Properties;
+
+   ----------------
+   -- Properties --
+   ----------------
+
+   function Properties (Id : Node_Type_Id) return Property_Reference_Array is
+   begin
+      return Impl.Properties (Id);
+   end Properties;
+
+
+   ---------------------
+   -- Token_Node_Kind --
+   ---------------------
+
+   function Token_Node_Kind (Kind : LK_Node_Kind_Type) return Token_Kind is
+   begin
+      return Impl.Token_Node_Kind (Kind);
+   end Token_Node_Kind;
+
+end Liblktlang.Introspection;
@@ -0,0 +1,2080 @@
+
+
+
+package body Liblktlang.Introspection_Implementation is
+
+   ----------------
+   -- As_Boolean --
+   ----------------
+
+   function As_Boolean (Self : Internal_Value) return Boolean is
+   begin
+      return Self.Boolean_Value;
+   end As_Boolean;
+
+   ----------------
+   -- As_Integer --
+   ----------------
+
+   function As_Integer (Self : Internal_Value) return Integer is
+   begin
+      return Self.Integer_Value;
+   end As_Integer;
+
+   ------------------
+   -- As_Character --
+   ------------------
+
+   function As_Character (Self : Internal_Value) return Character_Type is
+   begin
+      return Self.Character_Value;
+   end As_Character;
+
+   -------------
+   -- As_Node --
+   -------------
+
+   function As_Node (Self : Internal_Value) return Internal_Entity is
+   begin
+      return Self.Node_Value;
+   end As_Node;
+
+      function As_Analysis_Unit_Kind
+        (Self : Internal_Value) return Analysis_Unit_Kind is
+      begin
+         return Self.Analysis_Unit_Kind_Value;
+      end As_Analysis_Unit_Kind;
+
+      function As_Lookup_Kind
+        (Self : Internal_Value) return Lookup_Kind is
+      begin
+         return Self.Lookup_Kind_Value;
+      end As_Lookup_Kind;
+
+      function As_Grammar_Rule
+        (Self : Internal_Value) return Grammar_Rule is
+      begin
+         return Self.Grammar_Rule_Value;
+      end As_Grammar_Rule;
+
+
+   --  Now we can emit descriptor tables
+
+   --------------
+   -- DSL_Name --
+   --------------
+
+   function DSL_Name (Id : Node_Type_Id) return String is
+   begin
+      return To_String (Node_Type_Descriptors (Id).DSL_Name);
+   end DSL_Name;
+
+   ---------------------
+   -- Lookup_DSL_Name --
+   ---------------------
+
+   function Lookup_DSL_Name (Name : String) return Any_Node_Type_Id is
+      use Node_Type_Id_Maps;
+
+      Position : constant Cursor :=
+         DSL_Name_To_Node_Type.Find (To_Unbounded_String (Name));
+   begin
+      if Has_Element (Position) then
+         return Element (Position);
+      else
+         return None;
+      end if;
+   end Lookup_DSL_Name;
+
+   -----------------
+   -- Is_Abstract --
+   -----------------
+
+   function Is_Abstract (Id : Node_Type_Id) return Boolean is
+   begin
+      return Node_Type_Descriptors (Id).Is_Abstract;
+   end Is_Abstract;
+
+   --------------
+   -- Kind_For --
+   --------------
+
+   function Kind_For (Id : Node_Type_Id) return LK_Node_Kind_Type is
+      Desc : Node_Type_Descriptor renames Node_Type_Descriptors (Id).all;
+   begin
+      if Desc.Is_Abstract then
+         raise Constraint_Error with "trying to get kind for abstract node";
+      end if;
+      return Desc.Kind;
+   end Kind_For;
+
+   -----------------
+   -- Id_For_Kind --
+   -----------------
+
+   function Id_For_Kind (Kind : LK_Node_Kind_Type) return Node_Type_Id is
+   begin
+      return Kind_To_Id (Kind);
+   end Id_For_Kind;
+
+   ------------------
+   -- Is_Root_Node --
+   ------------------
+
+   function Is_Root_Node (Id : Node_Type_Id) return Boolean is
+   begin
+      return Id = Common.LK_Node_Type_Id;
+   end Is_Root_Node;
+
+   ---------------
+   -- Base_Type --
+   ---------------
+
+   function Base_Type (Id : Node_Type_Id) return Node_Type_Id is
+   begin
+      if Is_Root_Node (Id) then
+         raise Constraint_Error with "trying to get base type of root node";
+      end if;
+      return Node_Type_Descriptors (Id).Base_Type;
+   end Base_Type;
+
+   -------------------
+   -- Derived_Types --
+   -------------------
+
+   function Derived_Types (Id : Node_Type_Id) return Node_Type_Id_Array is
+   begin
+      return Node_Type_Descriptors (Id).Derivations;
+   end Derived_Types;
+
+   ---------------------
+   -- Is_Derived_From --
+   ---------------------
+
+   function Is_Derived_From (Id, Parent : Node_Type_Id) return Boolean is
+      Cursor : Any_Node_Type_Id := Id;
+   begin
+      while Cursor /= None loop
+         if Cursor = Parent then
+            return True;
+         end if;
+
+         Cursor := Node_Type_Descriptors (Cursor).Base_Type;
+      end loop;
+      return False;
+   end Is_Derived_From;
+
+   --------------------
+   -- Node_Data_Name --
+   --------------------
+
+   function Node_Data_Name (Node_Data : Node_Data_Reference) return String is
+   begin
+      case Node_Data is
+         when Field_Reference =>
+            pragma Warnings (Off, "value not in range of type");
+            return Field_Name (Node_Data);
+            pragma Warnings (On, "value not in range of type");
+
+         when Property_Reference =>
+            return Property_Name (Node_Data);
+      end case;
+   end Node_Data_Name;
+
+   --------------------
+   -- Node_Data_Type --
+   --------------------
+
+   function Node_Data_Type
+     (Node_Data : Node_Data_Reference) return Value_Constraint is
+   begin
+      case Node_Data is
+         when Field_Reference =>
+            pragma Warnings (Off, "value not in range of type");
+            return (Kind => Node_Value, Node_Type => Field_Type (Node_Data));
+            pragma Warnings (On, "value not in range of type");
+
+         when Property_Reference =>
+            return Property_Return_Type (Node_Data);
+      end case;
+   end Node_Data_Type;
+
+   ----------------------
+   -- Lookup_Node_Data --
+   ----------------------
+
+   function Lookup_Node_Data
+     (Id   : Node_Type_Id;
+      Name : String) return Any_Node_Data_Reference
+   is
+      Cursor : Any_Node_Type_Id := Id;
+   begin
+      --  Go through the derivation chain for Id and look for any field or
+      --  property whose name matches Name.
+
+      while Cursor /= None loop
+         declare
+            Node_Desc : Node_Type_Descriptor renames
+               Node_Type_Descriptors (Cursor).all;
+         begin
+            for F of Node_Desc.Fields loop
+               pragma Warnings (Off, "value not in range of type");
+               if Field_Name (F.Field) = Name then
+                  return F.Field;
+               end if;
+               pragma Warnings (On, "value not in range of type");
+            end loop;
+
+            for P of Node_Desc.Properties loop
+               if Property_Name (P) = Name then
+                  return P;
+               end if;
+            end loop;
+
+            Cursor := Node_Desc.Base_Type;
+         end;
+      end loop;
+      return None;
+   end Lookup_Node_Data;
+
+   ----------------
+   -- Field_Name --
+   ----------------
+
+   function Field_Name (Field : Field_Reference) return String is
+   begin
+      pragma Warnings (Off, "value not in range of subtype");
+      return Syntax_Field_Descriptors (Field).Name;
+      pragma Warnings (On, "value not in range of subtype");
+   end Field_Name;
+
+   ----------------
+   -- Field_Type --
+   ----------------
+
+   function Field_Type (Field : Field_Reference) return Node_Type_Id is
+   begin
+      pragma Warnings (Off, "value not in range of subtype");
+      return Syntax_Field_Descriptors (Field).Field_Type;
+      pragma Warnings (On, "value not in range of subtype");
+   end Field_Type;
+
+   ----------------
+   -- Eval_Field --
+   ----------------
+
+   function Eval_Field
+     (Node  : Bare_LK_Node;
+      Field : Field_Reference) return Bare_LK_Node
+   is
+      Kind : constant LK_Node_Kind_Type := Node.Kind;
+   begin
+      
+      case lkt_LK_Node (Kind) is
+when lkt_Langkit_Root_Range =>
+declare
+N_Bare_Langkit_Root : constant Bare_Langkit_Root := Node;
+begin
+case Field is
+when Langkit_Root_F_Imports => return Langkit_Root_F_Imports (N_Bare_Langkit_Root);
+when Langkit_Root_F_Decls => return Langkit_Root_F_Decls (N_Bare_Langkit_Root);
+when others => null;
+end case;
+end;
+when lkt_Import_Range =>
+declare
+N_Bare_Import : constant Bare_Import := Node;
+begin
+case Field is
+when Import_F_Name => return Import_F_Name (N_Bare_Import);
+when others => null;
+end case;
+end;
+when lkt_Full_Decl_Range =>
+declare
+N_Bare_Full_Decl : constant Bare_Full_Decl := Node;
+begin
+case Field is
+when Full_Decl_F_Doc => return Full_Decl_F_Doc (N_Bare_Full_Decl);
+when Full_Decl_F_Decl_Annotations => return Full_Decl_F_Decl_Annotations (N_Bare_Full_Decl);
+when Full_Decl_F_Decl => return Full_Decl_F_Decl (N_Bare_Full_Decl);
+when others => null;
+end case;
+end;
+when lkt_Decl =>
+declare
+N_Bare_Decl : constant Bare_Decl := Node;
+begin
+case Field is
+when Decl_F_Syn_Name => return Decl_F_Syn_Name (N_Bare_Decl);
+when others => null;
+end case;
+case lkt_Decl (Kind) is
+when lkt_Lexer_Decl_Range =>
+declare
+N_Bare_Lexer_Decl : constant Bare_Lexer_Decl := N_Bare_Decl;
+begin
+case Field is
+when Lexer_Decl_F_Rules => return Lexer_Decl_F_Rules (N_Bare_Lexer_Decl);
+when others => null;
+end case;
+end;
+when lkt_Lexer_Family_Decl_Range =>
+declare
+N_Bare_Lexer_Family_Decl : constant Bare_Lexer_Family_Decl := N_Bare_Decl;
+begin
+case Field is
+when Lexer_Family_Decl_F_Rules => return Lexer_Family_Decl_F_Rules (N_Bare_Lexer_Family_Decl);
+when others => null;
+end case;
+end;
+when lkt_Grammar_Decl_Range =>
+declare
+N_Bare_Grammar_Decl : constant Bare_Grammar_Decl := N_Bare_Decl;
+begin
+case Field is
+when Grammar_Decl_F_Rules => return Grammar_Decl_F_Rules (N_Bare_Grammar_Decl);
+when others => null;
+end case;
+end;
+when lkt_Base_Grammar_Rule_Decl =>
+declare
+N_Bare_Base_Grammar_Rule_Decl : constant Bare_Base_Grammar_Rule_Decl := N_Bare_Decl;
+begin
+case Field is
+when Base_Grammar_Rule_Decl_F_Expr => return Base_Grammar_Rule_Decl_F_Expr (N_Bare_Base_Grammar_Rule_Decl);
+when others => null;
+end case;
+end;
+when lkt_Type_Decl =>
+declare
+N_Bare_Type_Decl : constant Bare_Type_Decl := N_Bare_Decl;
+begin
+case Field is
+when Type_Decl_F_Traits => return Type_Decl_F_Traits (N_Bare_Type_Decl);
+when Type_Decl_F_Base_Type => return Type_Decl_F_Base_Type (N_Bare_Type_Decl);
+when others => null;
+end case;
+case lkt_Type_Decl (Kind) is
+when lkt_Named_Type_Decl =>
+declare
+N_Bare_Named_Type_Decl : constant Bare_Named_Type_Decl := N_Bare_Type_Decl;
+begin
+case Field is
+when Named_Type_Decl_F_Decls => return Named_Type_Decl_F_Decls (N_Bare_Named_Type_Decl);
+when others => null;
+end case;
+case lkt_Named_Type_Decl (Kind) is
+when lkt_Enum_Type_Decl_Range =>
+declare
+N_Bare_Enum_Type_Decl : constant Bare_Enum_Type_Decl := N_Bare_Named_Type_Decl;
+begin
+case Field is
+when Enum_Type_Decl_F_Literals => return Enum_Type_Decl_F_Literals (N_Bare_Enum_Type_Decl);
+when others => null;
+end case;
+end;
+when lkt_Enum_Class_Decl_Range =>
+declare
+N_Bare_Enum_Class_Decl : constant Bare_Enum_Class_Decl := N_Bare_Named_Type_Decl;
+begin
+case Field is
+when Enum_Class_Decl_F_Branches => return Enum_Class_Decl_F_Branches (N_Bare_Enum_Class_Decl);
+when others => null;
+end case;
+end;
+when others => null;
+end case;
+end;
+when others => null;
+end case;
+end;
+when lkt_Generic_Decl_Range =>
+declare
+N_Bare_Generic_Decl : constant Bare_Generic_Decl := N_Bare_Decl;
+begin
+case Field is
+when Generic_Decl_F_Generic_Formal_Decls => return Generic_Decl_F_Generic_Formal_Decls (N_Bare_Generic_Decl);
+when Generic_Decl_F_Decl => return Generic_Decl_F_Decl (N_Bare_Generic_Decl);
+when others => null;
+end case;
+end;
+when lkt_Fun_Decl_Range =>
+declare
+N_Bare_Fun_Decl : constant Bare_Fun_Decl := N_Bare_Decl;
+begin
+case Field is
+when Fun_Decl_F_Args => return Fun_Decl_F_Args (N_Bare_Fun_Decl);
+when Fun_Decl_F_Return_Type => return Fun_Decl_F_Return_Type (N_Bare_Fun_Decl);
+when Fun_Decl_F_Body => return Fun_Decl_F_Body (N_Bare_Fun_Decl);
+when others => null;
+end case;
+end;
+when lkt_Explicitly_Typed_Decl =>
+declare
+N_Bare_Explicitly_Typed_Decl : constant Bare_Explicitly_Typed_Decl := N_Bare_Decl;
+begin
+case Field is
+when Explicitly_Typed_Decl_F_Decl_Type => return Explicitly_Typed_Decl_F_Decl_Type (N_Bare_Explicitly_Typed_Decl);
+when others => null;
+end case;
+case lkt_Explicitly_Typed_Decl (Kind) is
+when lkt_Component_Decl =>
+declare
+N_Bare_Component_Decl : constant Bare_Component_Decl := N_Bare_Explicitly_Typed_Decl;
+begin
+case Field is
+when Component_Decl_F_Default_Val => return Component_Decl_F_Default_Val (N_Bare_Component_Decl);
+when others => null;
+end case;
+end;
+when lkt_Val_Decl_Range =>
+declare
+N_Bare_Val_Decl : constant Bare_Val_Decl := N_Bare_Explicitly_Typed_Decl;
+begin
+case Field is
+when Val_Decl_F_Val => return Val_Decl_F_Val (N_Bare_Val_Decl);
+when others => null;
+end case;
+end;
+when others => null;
+end case;
+end;
+when others => null;
+end case;
+end;
+when lkt_Parse_Node_Expr_Range =>
+declare
+N_Bare_Parse_Node_Expr : constant Bare_Parse_Node_Expr := Node;
+begin
+case Field is
+when Parse_Node_Expr_F_Node_Name => return Parse_Node_Expr_F_Node_Name (N_Bare_Parse_Node_Expr);
+when Parse_Node_Expr_F_Sub_Exprs => return Parse_Node_Expr_F_Sub_Exprs (N_Bare_Parse_Node_Expr);
+when others => null;
+end case;
+end;
+when lkt_Grammar_Rule_Ref_Range =>
+declare
+N_Bare_Grammar_Rule_Ref : constant Bare_Grammar_Rule_Ref := Node;
+begin
+case Field is
+when Grammar_Rule_Ref_F_Node_Name => return Grammar_Rule_Ref_F_Node_Name (N_Bare_Grammar_Rule_Ref);
+when others => null;
+end case;
+end;
+when lkt_Grammar_Discard_Range =>
+declare
+N_Bare_Grammar_Discard : constant Bare_Grammar_Discard := Node;
+begin
+case Field is
+when Grammar_Discard_F_Expr => return Grammar_Discard_F_Expr (N_Bare_Grammar_Discard);
+when others => null;
+end case;
+end;
+when lkt_Token_No_Case_Lit_Range =>
+declare
+N_Bare_Token_No_Case_Lit : constant Bare_Token_No_Case_Lit := Node;
+begin
+case Field is
+when Token_No_Case_Lit_F_Lit => return Token_No_Case_Lit_F_Lit (N_Bare_Token_No_Case_Lit);
+when others => null;
+end case;
+end;
+when lkt_Grammar_Pick_Range =>
+declare
+N_Bare_Grammar_Pick : constant Bare_Grammar_Pick := Node;
+begin
+case Field is
+when Grammar_Pick_F_Exprs => return Grammar_Pick_F_Exprs (N_Bare_Grammar_Pick);
+when others => null;
+end case;
+end;
+when lkt_Token_Ref_Range =>
+declare
+N_Bare_Token_Ref : constant Bare_Token_Ref := Node;
+begin
+case Field is
+when Token_Ref_F_Token_Name => return Token_Ref_F_Token_Name (N_Bare_Token_Ref);
+when Token_Ref_F_Expr => return Token_Ref_F_Expr (N_Bare_Token_Ref);
+when others => null;
+end case;
+end;
+when lkt_Grammar_Or_Expr_Range =>
+declare
+N_Bare_Grammar_Or_Expr : constant Bare_Grammar_Or_Expr := Node;
+begin
+case Field is
+when Grammar_Or_Expr_F_Sub_Exprs => return Grammar_Or_Expr_F_Sub_Exprs (N_Bare_Grammar_Or_Expr);
+when others => null;
+end case;
+end;
+when lkt_Grammar_Opt_Range =>
+declare
+N_Bare_Grammar_Opt : constant Bare_Grammar_Opt := Node;
+begin
+case Field is
+when Grammar_Opt_F_Expr => return Grammar_Opt_F_Expr (N_Bare_Grammar_Opt);
+when others => null;
+end case;
+end;
+when lkt_Grammar_Opt_Group_Range =>
+declare
+N_Bare_Grammar_Opt_Group : constant Bare_Grammar_Opt_Group := Node;
+begin
+case Field is
+when Grammar_Opt_Group_F_Expr => return Grammar_Opt_Group_F_Expr (N_Bare_Grammar_Opt_Group);
+when others => null;
+end case;
+end;
+when lkt_Grammar_Null_Range =>
+declare
+N_Bare_Grammar_Null : constant Bare_Grammar_Null := Node;
+begin
+case Field is
+when Grammar_Null_F_Name => return Grammar_Null_F_Name (N_Bare_Grammar_Null);
+when others => null;
+end case;
+end;
+when lkt_Grammar_Skip_Range =>
+declare
+N_Bare_Grammar_Skip : constant Bare_Grammar_Skip := Node;
+begin
+case Field is
+when Grammar_Skip_F_Name => return Grammar_Skip_F_Name (N_Bare_Grammar_Skip);
+when others => null;
+end case;
+end;
+when lkt_Grammar_Predicate_Range =>
+declare
+N_Bare_Grammar_Predicate : constant Bare_Grammar_Predicate := Node;
+begin
+case Field is
+when Grammar_Predicate_F_Expr => return Grammar_Predicate_F_Expr (N_Bare_Grammar_Predicate);
+when Grammar_Predicate_F_Prop_Ref => return Grammar_Predicate_F_Prop_Ref (N_Bare_Grammar_Predicate);
+when others => null;
+end case;
+end;
+when lkt_Grammar_Dont_Skip_Range =>
+declare
+N_Bare_Grammar_Dont_Skip : constant Bare_Grammar_Dont_Skip := Node;
+begin
+case Field is
+when Grammar_Dont_Skip_F_Expr => return Grammar_Dont_Skip_F_Expr (N_Bare_Grammar_Dont_Skip);
+when Grammar_Dont_Skip_F_Dont_Skip => return Grammar_Dont_Skip_F_Dont_Skip (N_Bare_Grammar_Dont_Skip);
+when others => null;
+end case;
+end;
+when lkt_Grammar_List_Range =>
+declare
+N_Bare_Grammar_List : constant Bare_Grammar_List := Node;
+begin
+case Field is
+when Grammar_List_F_List_Type => return Grammar_List_F_List_Type (N_Bare_Grammar_List);
+when Grammar_List_F_Kind => return Grammar_List_F_Kind (N_Bare_Grammar_List);
+when Grammar_List_F_Expr => return Grammar_List_F_Expr (N_Bare_Grammar_List);
+when Grammar_List_F_Sep => return Grammar_List_F_Sep (N_Bare_Grammar_List);
+when others => null;
+end case;
+end;
+when lkt_Dot_Expr_Range =>
+declare
+N_Bare_Dot_Expr : constant Bare_Dot_Expr := Node;
+begin
+case Field is
+when Dot_Expr_F_Prefix => return Dot_Expr_F_Prefix (N_Bare_Dot_Expr);
+when Dot_Expr_F_Suffix => return Dot_Expr_F_Suffix (N_Bare_Dot_Expr);
+when others => null;
+end case;
+end;
+when lkt_Array_Literal_Range =>
+declare
+N_Bare_Array_Literal : constant Bare_Array_Literal := Node;
+begin
+case Field is
+when Array_Literal_F_Exprs => return Array_Literal_F_Exprs (N_Bare_Array_Literal);
+when others => null;
+end case;
+end;
+when lkt_Not_Expr_Range =>
+declare
+N_Bare_Not_Expr : constant Bare_Not_Expr := Node;
+begin
+case Field is
+when Not_Expr_F_Expr => return Not_Expr_F_Expr (N_Bare_Not_Expr);
+when others => null;
+end case;
+end;
+when lkt_Cast_Expr_Range =>
+declare
+N_Bare_Cast_Expr : constant Bare_Cast_Expr := Node;
+begin
+case Field is
+when Cast_Expr_F_Expr => return Cast_Expr_F_Expr (N_Bare_Cast_Expr);
+when Cast_Expr_F_Excludes_Null => return Cast_Expr_F_Excludes_Null (N_Bare_Cast_Expr);
+when Cast_Expr_F_Dest_Type => return Cast_Expr_F_Dest_Type (N_Bare_Cast_Expr);
+when others => null;
+end case;
+end;
+when lkt_Isa_Range =>
+declare
+N_Bare_Isa : constant Bare_Isa := Node;
+begin
+case Field is
+when Isa_F_Expr => return Isa_F_Expr (N_Bare_Isa);
+when Isa_F_Dest_Type => return Isa_F_Dest_Type (N_Bare_Isa);
+when others => null;
+end case;
+end;
+when lkt_Paren_Expr_Range =>
+declare
+N_Bare_Paren_Expr : constant Bare_Paren_Expr := Node;
+begin
+case Field is
+when Paren_Expr_F_Expr => return Paren_Expr_F_Expr (N_Bare_Paren_Expr);
+when others => null;
+end case;
+end;
+when lkt_Call_Expr_Range =>
+declare
+N_Bare_Call_Expr : constant Bare_Call_Expr := Node;
+begin
+case Field is
+when Call_Expr_F_Name => return Call_Expr_F_Name (N_Bare_Call_Expr);
+when Call_Expr_F_Args => return Call_Expr_F_Args (N_Bare_Call_Expr);
+when others => null;
+end case;
+end;
+when lkt_Generic_Instantiation_Range =>
+declare
+N_Bare_Generic_Instantiation : constant Bare_Generic_Instantiation := Node;
+begin
+case Field is
+when Generic_Instantiation_F_Name => return Generic_Instantiation_F_Name (N_Bare_Generic_Instantiation);
+when Generic_Instantiation_F_Args => return Generic_Instantiation_F_Args (N_Bare_Generic_Instantiation);
+when others => null;
+end case;
+end;
+when lkt_Error_On_Null_Range =>
+declare
+N_Bare_Error_On_Null : constant Bare_Error_On_Null := Node;
+begin
+case Field is
+when Error_On_Null_F_Expr => return Error_On_Null_F_Expr (N_Bare_Error_On_Null);
+when others => null;
+end case;
+end;
+when lkt_Lambda_Expr_Range =>
+declare
+N_Bare_Lambda_Expr : constant Bare_Lambda_Expr := Node;
+begin
+case Field is
+when Lambda_Expr_F_Params => return Lambda_Expr_F_Params (N_Bare_Lambda_Expr);
+when Lambda_Expr_F_Return_Type => return Lambda_Expr_F_Return_Type (N_Bare_Lambda_Expr);
+when Lambda_Expr_F_Body => return Lambda_Expr_F_Body (N_Bare_Lambda_Expr);
+when others => null;
+end case;
+end;
+when lkt_Try_Expr_Range =>
+declare
+N_Bare_Try_Expr : constant Bare_Try_Expr := Node;
+begin
+case Field is
+when Try_Expr_F_Try_Expr => return Try_Expr_F_Try_Expr (N_Bare_Try_Expr);
+when Try_Expr_F_Or_Expr => return Try_Expr_F_Or_Expr (N_Bare_Try_Expr);
+when others => null;
+end case;
+end;
+when lkt_Raise_Expr_Range =>
+declare
+N_Bare_Raise_Expr : constant Bare_Raise_Expr := Node;
+begin
+case Field is
+when Raise_Expr_F_Except_Expr => return Raise_Expr_F_Except_Expr (N_Bare_Raise_Expr);
+when others => null;
+end case;
+end;
+when lkt_If_Expr_Range =>
+declare
+N_Bare_If_Expr : constant Bare_If_Expr := Node;
+begin
+case Field is
+when If_Expr_F_Cond_Expr => return If_Expr_F_Cond_Expr (N_Bare_If_Expr);
+when If_Expr_F_Then_Expr => return If_Expr_F_Then_Expr (N_Bare_If_Expr);
+when If_Expr_F_Alternatives => return If_Expr_F_Alternatives (N_Bare_If_Expr);
+when If_Expr_F_Else_Expr => return If_Expr_F_Else_Expr (N_Bare_If_Expr);
+when others => null;
+end case;
+end;
+when lkt_Block_Expr_Range =>
+declare
+N_Bare_Block_Expr : constant Bare_Block_Expr := Node;
+begin
+case Field is
+when Block_Expr_F_Val_Defs => return Block_Expr_F_Val_Defs (N_Bare_Block_Expr);
+when Block_Expr_F_Expr => return Block_Expr_F_Expr (N_Bare_Block_Expr);
+when others => null;
+end case;
+end;
+when lkt_Match_Expr_Range =>
+declare
+N_Bare_Match_Expr : constant Bare_Match_Expr := Node;
+begin
+case Field is
+when Match_Expr_F_Match_Expr => return Match_Expr_F_Match_Expr (N_Bare_Match_Expr);
+when Match_Expr_F_Branches => return Match_Expr_F_Branches (N_Bare_Match_Expr);
+when others => null;
+end case;
+end;
+when lkt_Bin_Op_Range =>
+declare
+N_Bare_Bin_Op : constant Bare_Bin_Op := Node;
+begin
+case Field is
+when Bin_Op_F_Left => return Bin_Op_F_Left (N_Bare_Bin_Op);
+when Bin_Op_F_Op => return Bin_Op_F_Op (N_Bare_Bin_Op);
+when Bin_Op_F_Right => return Bin_Op_F_Right (N_Bare_Bin_Op);
+when others => null;
+end case;
+end;
+when lkt_Logic_Expr_Range =>
+declare
+N_Bare_Logic_Expr : constant Bare_Logic_Expr := Node;
+begin
+case Field is
+when Logic_Expr_F_Expr => return Logic_Expr_F_Expr (N_Bare_Logic_Expr);
+when others => null;
+end case;
+end;
+when lkt_Lexer_Case_Rule_Range =>
+declare
+N_Bare_Lexer_Case_Rule : constant Bare_Lexer_Case_Rule := Node;
+begin
+case Field is
+when Lexer_Case_Rule_F_Expr => return Lexer_Case_Rule_F_Expr (N_Bare_Lexer_Case_Rule);
+when Lexer_Case_Rule_F_Alts => return Lexer_Case_Rule_F_Alts (N_Bare_Lexer_Case_Rule);
+when others => null;
+end case;
+end;
+when lkt_Base_Lexer_Case_Rule_Alt =>
+declare
+N_Bare_Base_Lexer_Case_Rule_Alt : constant Bare_Base_Lexer_Case_Rule_Alt := Node;
+begin
+case Field is
+when Base_Lexer_Case_Rule_Alt_F_Send => return Base_Lexer_Case_Rule_Alt_F_Send (N_Bare_Base_Lexer_Case_Rule_Alt);
+when others => null;
+end case;
+case lkt_Base_Lexer_Case_Rule_Alt (Kind) is
+when lkt_Lexer_Case_Rule_Cond_Alt_Range =>
+declare
+N_Bare_Lexer_Case_Rule_Cond_Alt : constant Bare_Lexer_Case_Rule_Cond_Alt := N_Bare_Base_Lexer_Case_Rule_Alt;
+begin
+case Field is
+when Lexer_Case_Rule_Cond_Alt_F_Cond_Exprs => return Lexer_Case_Rule_Cond_Alt_F_Cond_Exprs (N_Bare_Lexer_Case_Rule_Cond_Alt);
+when others => null;
+end case;
+end;
+when others => null;
+end case;
+end;
+when lkt_Lexer_Case_Rule_Send_Range =>
+declare
+N_Bare_Lexer_Case_Rule_Send : constant Bare_Lexer_Case_Rule_Send := Node;
+begin
+case Field is
+when Lexer_Case_Rule_Send_F_Sent => return Lexer_Case_Rule_Send_F_Sent (N_Bare_Lexer_Case_Rule_Send);
+when Lexer_Case_Rule_Send_F_Match_Size => return Lexer_Case_Rule_Send_F_Match_Size (N_Bare_Lexer_Case_Rule_Send);
+when others => null;
+end case;
+end;
+when lkt_Enum_Class_Case_Range =>
+declare
+N_Bare_Enum_Class_Case : constant Bare_Enum_Class_Case := Node;
+begin
+case Field is
+when Enum_Class_Case_F_Decls => return Enum_Class_Case_F_Decls (N_Bare_Enum_Class_Case);
+when others => null;
+end case;
+end;
+when lkt_Doc_Range =>
+declare
+N_Bare_Doc : constant Bare_Doc := Node;
+begin
+case Field is
+when Doc_F_Lines => return Doc_F_Lines (N_Bare_Doc);
+when others => null;
+end case;
+end;
+when lkt_Simple_Type_Ref_Range =>
+declare
+N_Bare_Simple_Type_Ref : constant Bare_Simple_Type_Ref := Node;
+begin
+case Field is
+when Simple_Type_Ref_F_Type_Name => return Simple_Type_Ref_F_Type_Name (N_Bare_Simple_Type_Ref);
+when others => null;
+end case;
+end;
+when lkt_Generic_Type_Ref_Range =>
+declare
+N_Bare_Generic_Type_Ref : constant Bare_Generic_Type_Ref := Node;
+begin
+case Field is
+when Generic_Type_Ref_F_Type_Name => return Generic_Type_Ref_F_Type_Name (N_Bare_Generic_Type_Ref);
+when Generic_Type_Ref_F_Params => return Generic_Type_Ref_F_Params (N_Bare_Generic_Type_Ref);
+when others => null;
+end case;
+end;
+when lkt_Function_Type_Ref_Range =>
+declare
+N_Bare_Function_Type_Ref : constant Bare_Function_Type_Ref := Node;
+begin
+case Field is
+when Function_Type_Ref_F_Args_Types => return Function_Type_Ref_F_Args_Types (N_Bare_Function_Type_Ref);
+when Function_Type_Ref_F_Return_Type => return Function_Type_Ref_F_Return_Type (N_Bare_Function_Type_Ref);
+when others => null;
+end case;
+end;
+when lkt_Decl_Annotation_Range =>
+declare
+N_Bare_Decl_Annotation : constant Bare_Decl_Annotation := Node;
+begin
+case Field is
+when Decl_Annotation_F_Name => return Decl_Annotation_F_Name (N_Bare_Decl_Annotation);
+when Decl_Annotation_F_Params => return Decl_Annotation_F_Params (N_Bare_Decl_Annotation);
+when others => null;
+end case;
+end;
+when lkt_Decl_Annotation_Params_Range =>
+declare
+N_Bare_Decl_Annotation_Params : constant Bare_Decl_Annotation_Params := Node;
+begin
+case Field is
+when Decl_Annotation_Params_F_Params => return Decl_Annotation_Params_F_Params (N_Bare_Decl_Annotation_Params);
+when others => null;
+end case;
+end;
+when lkt_Param_Range =>
+declare
+N_Bare_Param : constant Bare_Param := Node;
+begin
+case Field is
+when Param_F_Name => return Param_F_Name (N_Bare_Param);
+when Param_F_Value => return Param_F_Value (N_Bare_Param);
+when others => null;
+end case;
+end;
+when lkt_Elsif_Branch_Range =>
+declare
+N_Bare_Elsif_Branch : constant Bare_Elsif_Branch := Node;
+begin
+case Field is
+when Elsif_Branch_F_Cond_Expr => return Elsif_Branch_F_Cond_Expr (N_Bare_Elsif_Branch);
+when Elsif_Branch_F_Then_Expr => return Elsif_Branch_F_Then_Expr (N_Bare_Elsif_Branch);
+when others => null;
+end case;
+end;
+when lkt_Match_Branch_Range =>
+declare
+N_Bare_Match_Branch : constant Bare_Match_Branch := Node;
+begin
+case Field is
+when Match_Branch_F_Decl => return Match_Branch_F_Decl (N_Bare_Match_Branch);
+when Match_Branch_F_Expr => return Match_Branch_F_Expr (N_Bare_Match_Branch);
+when others => null;
+end case;
+end;
+when lkt_Var_Bind_Range =>
+declare
+N_Bare_Var_Bind : constant Bare_Var_Bind := Node;
+begin
+case Field is
+when Var_Bind_F_Name => return Var_Bind_F_Name (N_Bare_Var_Bind);
+when Var_Bind_F_Expr => return Var_Bind_F_Expr (N_Bare_Var_Bind);
+when others => null;
+end case;
+end;
+when others => null;
+end case;
+
+      return (raise Node_Data_Evaluation_Error
+              with "no such field on this node");
+   end Eval_Field;
+
+   -----------
+   -- Index --
+   -----------
+
+   function Index
+     (Kind : LK_Node_Kind_Type; Field : Field_Reference) return Positive is
+   begin
+         
+         case Kind is
+               when lkt_Lexer_Case_Rule_Cond_Alt =>
+               return (case Field is
+                       when Lexer_Case_Rule_Cond_Alt_F_Cond_Exprs => 1,
+                       when Base_Lexer_Case_Rule_Alt_F_Send => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Lexer_Case_Rule_Default_Alt =>
+               return (case Field is
+                       when Base_Lexer_Case_Rule_Alt_F_Send => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when Grammar_Decl_F_Rules => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_Rule_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when Base_Grammar_Rule_Decl_F_Expr => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Synthetic_Lexer_Decl =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Node_Decl =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Self_Decl =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Enum_Lit_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Field_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when Explicitly_Typed_Decl_F_Decl_Type => 2,
+                       when Component_Decl_F_Default_Val => 3,
+                       when others => raise Constraint_Error);
+               when lkt_Fun_Arg_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when Explicitly_Typed_Decl_F_Decl_Type => 2,
+                       when Component_Decl_F_Default_Val => 3,
+                       when others => raise Constraint_Error);
+               when lkt_Lambda_Arg_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when Explicitly_Typed_Decl_F_Decl_Type => 2,
+                       when Component_Decl_F_Default_Val => 3,
+                       when others => raise Constraint_Error);
+               when lkt_Match_Val_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when Explicitly_Typed_Decl_F_Decl_Type => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Val_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when Explicitly_Typed_Decl_F_Decl_Type => 2,
+                       when Val_Decl_F_Val => 3,
+                       when others => raise Constraint_Error);
+               when lkt_Fun_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when Fun_Decl_F_Args => 2,
+                       when Fun_Decl_F_Return_Type => 3,
+                       when Fun_Decl_F_Body => 4,
+                       when others => raise Constraint_Error);
+               when lkt_Generic_Decl =>
+               return (case Field is
+                       when Generic_Decl_F_Generic_Formal_Decls => 1,
+                       when Generic_Decl_F_Decl => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Lexer_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when Lexer_Decl_F_Rules => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Lexer_Family_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when Lexer_Family_Decl_F_Rules => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Enum_Class_Alt_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Function_Type =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Generic_Formal_Type_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Instantiated_Generic_Type =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Class_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when Type_Decl_F_Base_Type => 2,
+                       when Type_Decl_F_Traits => 3,
+                       when Named_Type_Decl_F_Decls => 4,
+                       when others => raise Constraint_Error);
+               when lkt_Enum_Class_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when Type_Decl_F_Base_Type => 2,
+                       when Type_Decl_F_Traits => 3,
+                       when Enum_Class_Decl_F_Branches => 4,
+                       when Named_Type_Decl_F_Decls => 5,
+                       when others => raise Constraint_Error);
+               when lkt_Enum_Type_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when Type_Decl_F_Traits => 2,
+                       when Enum_Type_Decl_F_Literals => 3,
+                       when Named_Type_Decl_F_Decls => 4,
+                       when others => raise Constraint_Error);
+               when lkt_Struct_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when Type_Decl_F_Traits => 2,
+                       when Named_Type_Decl_F_Decls => 3,
+                       when others => raise Constraint_Error);
+               when lkt_Trait_Decl =>
+               return (case Field is
+                       when Decl_F_Syn_Name => 1,
+                       when Named_Type_Decl_F_Decls => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Decl_Annotation =>
+               return (case Field is
+                       when Decl_Annotation_F_Name => 1,
+                       when Decl_Annotation_F_Params => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Decl_Annotation_Params =>
+               return (case Field is
+                       when Decl_Annotation_Params_F_Params => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Doc =>
+               return (case Field is
+                       when Doc_F_Lines => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Doc_Comment =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Elsif_Branch =>
+               return (case Field is
+                       when Elsif_Branch_F_Cond_Expr => 1,
+                       when Elsif_Branch_F_Then_Expr => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Enum_Class_Case =>
+               return (case Field is
+                       when Enum_Class_Case_F_Decls => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Excludes_Null_Absent =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Excludes_Null_Present =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Array_Literal =>
+               return (case Field is
+                       when Array_Literal_F_Exprs => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Bin_Op =>
+               return (case Field is
+                       when Bin_Op_F_Left => 1,
+                       when Bin_Op_F_Op => 2,
+                       when Bin_Op_F_Right => 3,
+                       when others => raise Constraint_Error);
+               when lkt_Block_Expr =>
+               return (case Field is
+                       when Block_Expr_F_Val_Defs => 1,
+                       when Block_Expr_F_Expr => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Call_Expr =>
+               return (case Field is
+                       when Call_Expr_F_Name => 1,
+                       when Call_Expr_F_Args => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Null_Cond_Call_Expr =>
+               return (case Field is
+                       when Call_Expr_F_Name => 1,
+                       when Call_Expr_F_Args => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Cast_Expr =>
+               return (case Field is
+                       when Cast_Expr_F_Expr => 1,
+                       when Cast_Expr_F_Excludes_Null => 2,
+                       when Cast_Expr_F_Dest_Type => 3,
+                       when others => raise Constraint_Error);
+               when lkt_Dot_Expr =>
+               return (case Field is
+                       when Dot_Expr_F_Prefix => 1,
+                       when Dot_Expr_F_Suffix => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Null_Cond_Dotted_Name =>
+               return (case Field is
+                       when Dot_Expr_F_Prefix => 1,
+                       when Dot_Expr_F_Suffix => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Error_On_Null =>
+               return (case Field is
+                       when Error_On_Null_F_Expr => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Generic_Instantiation =>
+               return (case Field is
+                       when Generic_Instantiation_F_Name => 1,
+                       when Generic_Instantiation_F_Args => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_Cut =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_Discard =>
+               return (case Field is
+                       when Grammar_Discard_F_Expr => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_Dont_Skip =>
+               return (case Field is
+                       when Grammar_Dont_Skip_F_Expr => 1,
+                       when Grammar_Dont_Skip_F_Dont_Skip => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_List =>
+               return (case Field is
+                       when Grammar_List_F_List_Type => 1,
+                       when Grammar_List_F_Kind => 2,
+                       when Grammar_List_F_Expr => 3,
+                       when Grammar_List_F_Sep => 4,
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_Null =>
+               return (case Field is
+                       when Grammar_Null_F_Name => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_Opt =>
+               return (case Field is
+                       when Grammar_Opt_F_Expr => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_Opt_Group =>
+               return (case Field is
+                       when Grammar_Opt_Group_F_Expr => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_Or_Expr =>
+               return (case Field is
+                       when Grammar_Or_Expr_F_Sub_Exprs => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_Pick =>
+               return (case Field is
+                       when Grammar_Pick_F_Exprs => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_Implicit_Pick =>
+               return (case Field is
+                       when Grammar_Pick_F_Exprs => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_Predicate =>
+               return (case Field is
+                       when Grammar_Predicate_F_Expr => 1,
+                       when Grammar_Predicate_F_Prop_Ref => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_Rule_Ref =>
+               return (case Field is
+                       when Grammar_Rule_Ref_F_Node_Name => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_Skip =>
+               return (case Field is
+                       when Grammar_Skip_F_Name => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Parse_Node_Expr =>
+               return (case Field is
+                       when Parse_Node_Expr_F_Node_Name => 1,
+                       when Parse_Node_Expr_F_Sub_Exprs => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Token_Lit =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Token_No_Case_Lit =>
+               return (case Field is
+                       when Token_No_Case_Lit_F_Lit => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Token_Pattern_Lit =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Token_Ref =>
+               return (case Field is
+                       when Token_Ref_F_Token_Name => 1,
+                       when Token_Ref_F_Expr => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Id =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Def_Id =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Ref_Id =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Module_Ref_Id =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_If_Expr =>
+               return (case Field is
+                       when If_Expr_F_Cond_Expr => 1,
+                       when If_Expr_F_Then_Expr => 2,
+                       when If_Expr_F_Alternatives => 3,
+                       when If_Expr_F_Else_Expr => 4,
+                       when others => raise Constraint_Error);
+               when lkt_Isa =>
+               return (case Field is
+                       when Isa_F_Expr => 1,
+                       when Isa_F_Dest_Type => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Lambda_Expr =>
+               return (case Field is
+                       when Lambda_Expr_F_Params => 1,
+                       when Lambda_Expr_F_Return_Type => 2,
+                       when Lambda_Expr_F_Body => 3,
+                       when others => raise Constraint_Error);
+               when lkt_Char_Lit =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Null_Lit =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Num_Lit =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_String_Lit =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Logic_Expr =>
+               return (case Field is
+                       when Logic_Expr_F_Expr => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Match_Expr =>
+               return (case Field is
+                       when Match_Expr_F_Match_Expr => 1,
+                       when Match_Expr_F_Branches => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Not_Expr =>
+               return (case Field is
+                       when Not_Expr_F_Expr => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Paren_Expr =>
+               return (case Field is
+                       when Paren_Expr_F_Expr => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Raise_Expr =>
+               return (case Field is
+                       when Raise_Expr_F_Except_Expr => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Try_Expr =>
+               return (case Field is
+                       when Try_Expr_F_Try_Expr => 1,
+                       when Try_Expr_F_Or_Expr => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Full_Decl =>
+               return (case Field is
+                       when Full_Decl_F_Doc => 1,
+                       when Full_Decl_F_Decl_Annotations => 2,
+                       when Full_Decl_F_Decl => 3,
+                       when others => raise Constraint_Error);
+               when lkt_Import =>
+               return (case Field is
+                       when Import_F_Name => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Base_Lexer_Case_Rule_Alt_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Decl_Annotation_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Doc_Comment_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Elsif_Branch_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Enum_Class_Alt_Decl_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Enum_Class_Case_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Enum_Lit_Decl_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Expr_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Full_Decl_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Decl_Block =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Fun_Arg_Decl_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_Expr_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Grammar_Expr_List_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Import_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_LK_Node_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Lambda_Arg_Decl_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Match_Branch_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Param_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Ref_Id_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Type_Ref_List =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Langkit_Root =>
+               return (case Field is
+                       when Langkit_Root_F_Imports => 1,
+                       when Langkit_Root_F_Decls => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Lexer_Case_Rule =>
+               return (case Field is
+                       when Lexer_Case_Rule_F_Expr => 1,
+                       when Lexer_Case_Rule_F_Alts => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Lexer_Case_Rule_Send =>
+               return (case Field is
+                       when Lexer_Case_Rule_Send_F_Sent => 1,
+                       when Lexer_Case_Rule_Send_F_Match_Size => 2,
+                       when others => raise Constraint_Error);
+               when lkt_List_Kind_One =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_List_Kind_Zero =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Match_Branch =>
+               return (case Field is
+                       when Match_Branch_F_Decl => 1,
+                       when Match_Branch_F_Expr => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Op_Amp =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Op_And =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Op_Div =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Op_Eq =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Op_Gt =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Op_Gte =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Op_Lt =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Op_Lte =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Op_Minus =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Op_Mult =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Op_Or =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Op_Plus =>
+               return (case Field is
+                       when others => raise Constraint_Error);
+               when lkt_Param =>
+               return (case Field is
+                       when Param_F_Name => 1,
+                       when Param_F_Value => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Function_Type_Ref =>
+               return (case Field is
+                       when Function_Type_Ref_F_Args_Types => 1,
+                       when Function_Type_Ref_F_Return_Type => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Generic_Type_Ref =>
+               return (case Field is
+                       when Generic_Type_Ref_F_Type_Name => 1,
+                       when Generic_Type_Ref_F_Params => 2,
+                       when others => raise Constraint_Error);
+               when lkt_Simple_Type_Ref =>
+               return (case Field is
+                       when Simple_Type_Ref_F_Type_Name => 1,
+                       when others => raise Constraint_Error);
+               when lkt_Var_Bind =>
+               return (case Field is
+                       when Var_Bind_F_Name => 1,
+                       when Var_Bind_F_Expr => 2,
+                       when others => raise Constraint_Error);
+         end case;
+
+   end Index;
+
+   --------------------------------
+   -- Field_Reference_From_Index --
+   --------------------------------
+
+   function Field_Reference_From_Index
+     (Kind : LK_Node_Kind_Type; Index : Positive) return Field_Reference is
+   begin
+      
+      case lkt_LK_Node (Kind) is
+when lkt_LK_Node_Base_List =>
+raise Invalid_Field with "List AST nodes have no field";
+when lkt_Langkit_Root_Range =>
+case Index is
+when 1 => return Langkit_Root_F_Imports;
+when 2 => return Langkit_Root_F_Decls;
+when others => null;
+end case;
+when lkt_Import_Range =>
+case Index is
+when 1 => return Import_F_Name;
+when others => null;
+end case;
+when lkt_Full_Decl_Range =>
+case Index is
+when 1 => return Full_Decl_F_Doc;
+when 2 => return Full_Decl_F_Decl_Annotations;
+when 3 => return Full_Decl_F_Decl;
+when others => null;
+end case;
+when lkt_Lexer_Decl_Range =>
+case Index is
+when 1 => return Decl_F_Syn_Name;
+when 2 => return Lexer_Decl_F_Rules;
+when others => null;
+end case;
+when lkt_Lexer_Family_Decl_Range =>
+case Index is
+when 1 => return Decl_F_Syn_Name;
+when 2 => return Lexer_Family_Decl_F_Rules;
+when others => null;
+end case;
+when lkt_Grammar_Decl_Range =>
+case Index is
+when 1 => return Decl_F_Syn_Name;
+when 2 => return Grammar_Decl_F_Rules;
+when others => null;
+end case;
+when lkt_Grammar_Rule_Decl_Range =>
+case Index is
+when 1 => return Decl_F_Syn_Name;
+when 2 => return Base_Grammar_Rule_Decl_F_Expr;
+when others => null;
+end case;
+when lkt_Generic_Formal_Type_Decl_Range =>
+case Index is
+when 1 => return Decl_F_Syn_Name;
+when others => null;
+end case;
+when lkt_Trait_Decl_Range =>
+case Index is
+when 1 => return Decl_F_Syn_Name;
+when 2 => return Named_Type_Decl_F_Decls;
+when others => null;
+end case;
+when lkt_Enum_Type_Decl_Range =>
+case Index is
+when 1 => return Decl_F_Syn_Name;
+when 2 => return Type_Decl_F_Traits;
+when 3 => return Enum_Type_Decl_F_Literals;
+when 4 => return Named_Type_Decl_F_Decls;
+when others => null;
+end case;
+when lkt_Struct_Decl_Range =>
+case Index is
+when 1 => return Decl_F_Syn_Name;
+when 2 => return Type_Decl_F_Traits;
+when 3 => return Named_Type_Decl_F_Decls;
+when others => null;
+end case;
+when lkt_Basic_Class_Decl =>
+case Index is
+when 1 => return Decl_F_Syn_Name;
+when 2 => return Type_Decl_F_Base_Type;
+when 3 => return Type_Decl_F_Traits;
+when others => null;
+end case;
+case lkt_Basic_Class_Decl (Kind) is
+when lkt_Class_Decl_Range =>
+case Index is
+when 4 => return Named_Type_Decl_F_Decls;
+when others => null;
+end case;
+when lkt_Enum_Class_Decl_Range =>
+case Index is
+when 4 => return Enum_Class_Decl_F_Branches;
+when 5 => return Named_Type_Decl_F_Decls;
+when others => null;
+end case;
+when others => null;
+end case;
+when lkt_Enum_Class_Alt_Decl_Range =>
+case Index is
+when 1 => return Decl_F_Syn_Name;
+when others => null;
+end case;
+when lkt_Generic_Decl_Range =>
+case Index is
+when 1 => return Generic_Decl_F_Generic_Formal_Decls;
+when 2 => return Generic_Decl_F_Decl;
+when others => null;
+end case;
+when lkt_User_Val_Decl =>
+case Index is
+when 1 => return Decl_F_Syn_Name;
+when others => null;
+end case;
+case lkt_User_Val_Decl (Kind) is
+when lkt_Fun_Decl_Range =>
+case Index is
+when 2 => return Fun_Decl_F_Args;
+when 3 => return Fun_Decl_F_Return_Type;
+when 4 => return Fun_Decl_F_Body;
+when others => null;
+end case;
+when lkt_Fun_Arg_Decl_Range =>
+case Index is
+when 2 => return Explicitly_Typed_Decl_F_Decl_Type;
+when 3 => return Component_Decl_F_Default_Val;
+when others => null;
+end case;
+when lkt_Lambda_Arg_Decl_Range =>
+case Index is
+when 2 => return Explicitly_Typed_Decl_F_Decl_Type;
+when 3 => return Component_Decl_F_Default_Val;
+when others => null;
+end case;
+when lkt_Field_Decl_Range =>
+case Index is
+when 2 => return Explicitly_Typed_Decl_F_Decl_Type;
+when 3 => return Component_Decl_F_Default_Val;
+when others => null;
+end case;
+when lkt_Match_Val_Decl_Range =>
+case Index is
+when 2 => return Explicitly_Typed_Decl_F_Decl_Type;
+when others => null;
+end case;
+when lkt_Val_Decl_Range =>
+case Index is
+when 2 => return Explicitly_Typed_Decl_F_Decl_Type;
+when 3 => return Val_Decl_F_Val;
+when others => null;
+end case;
+when others => null;
+end case;
+when lkt_Parse_Node_Expr_Range =>
+case Index is
+when 1 => return Parse_Node_Expr_F_Node_Name;
+when 2 => return Parse_Node_Expr_F_Sub_Exprs;
+when others => null;
+end case;
+when lkt_Grammar_Rule_Ref_Range =>
+case Index is
+when 1 => return Grammar_Rule_Ref_F_Node_Name;
+when others => null;
+end case;
+when lkt_Grammar_Discard_Range =>
+case Index is
+when 1 => return Grammar_Discard_F_Expr;
+when others => null;
+end case;
+when lkt_Token_No_Case_Lit_Range =>
+case Index is
+when 1 => return Token_No_Case_Lit_F_Lit;
+when others => null;
+end case;
+when lkt_Grammar_Pick_Range =>
+case Index is
+when 1 => return Grammar_Pick_F_Exprs;
+when others => null;
+end case;
+when lkt_Token_Ref_Range =>
+case Index is
+when 1 => return Token_Ref_F_Token_Name;
+when 2 => return Token_Ref_F_Expr;
+when others => null;
+end case;
+when lkt_Grammar_Or_Expr_Range =>
+case Index is
+when 1 => return Grammar_Or_Expr_F_Sub_Exprs;
+when others => null;
+end case;
+when lkt_Grammar_Opt_Range =>
+case Index is
+when 1 => return Grammar_Opt_F_Expr;
+when others => null;
+end case;
+when lkt_Grammar_Opt_Group_Range =>
+case Index is
+when 1 => return Grammar_Opt_Group_F_Expr;
+when others => null;
+end case;
+when lkt_Grammar_Null_Range =>
+case Index is
+when 1 => return Grammar_Null_F_Name;
+when others => null;
+end case;
+when lkt_Grammar_Skip_Range =>
+case Index is
+when 1 => return Grammar_Skip_F_Name;
+when others => null;
+end case;
+when lkt_Grammar_Predicate_Range =>
+case Index is
+when 1 => return Grammar_Predicate_F_Expr;
+when 2 => return Grammar_Predicate_F_Prop_Ref;
+when others => null;
+end case;
+when lkt_Grammar_Dont_Skip_Range =>
+case Index is
+when 1 => return Grammar_Dont_Skip_F_Expr;
+when 2 => return Grammar_Dont_Skip_F_Dont_Skip;
+when others => null;
+end case;
+when lkt_Grammar_List_Range =>
+case Index is
+when 1 => return Grammar_List_F_List_Type;
+when 2 => return Grammar_List_F_Kind;
+when 3 => return Grammar_List_F_Expr;
+when 4 => return Grammar_List_F_Sep;
+when others => null;
+end case;
+when lkt_Dot_Expr_Range =>
+case Index is
+when 1 => return Dot_Expr_F_Prefix;
+when 2 => return Dot_Expr_F_Suffix;
+when others => null;
+end case;
+when lkt_Array_Literal_Range =>
+case Index is
+when 1 => return Array_Literal_F_Exprs;
+when others => null;
+end case;
+when lkt_Not_Expr_Range =>
+case Index is
+when 1 => return Not_Expr_F_Expr;
+when others => null;
+end case;
+when lkt_Cast_Expr_Range =>
+case Index is
+when 1 => return Cast_Expr_F_Expr;
+when 2 => return Cast_Expr_F_Excludes_Null;
+when 3 => return Cast_Expr_F_Dest_Type;
+when others => null;
+end case;
+when lkt_Isa_Range =>
+case Index is
+when 1 => return Isa_F_Expr;
+when 2 => return Isa_F_Dest_Type;
+when others => null;
+end case;
+when lkt_Paren_Expr_Range =>
+case Index is
+when 1 => return Paren_Expr_F_Expr;
+when others => null;
+end case;
+when lkt_Call_Expr_Range =>
+case Index is
+when 1 => return Call_Expr_F_Name;
+when 2 => return Call_Expr_F_Args;
+when others => null;
+end case;
+when lkt_Generic_Instantiation_Range =>
+case Index is
+when 1 => return Generic_Instantiation_F_Name;
+when 2 => return Generic_Instantiation_F_Args;
+when others => null;
+end case;
+when lkt_Error_On_Null_Range =>
+case Index is
+when 1 => return Error_On_Null_F_Expr;
+when others => null;
+end case;
+when lkt_Lambda_Expr_Range =>
+case Index is
+when 1 => return Lambda_Expr_F_Params;
+when 2 => return Lambda_Expr_F_Return_Type;
+when 3 => return Lambda_Expr_F_Body;
+when others => null;
+end case;
+when lkt_Try_Expr_Range =>
+case Index is
+when 1 => return Try_Expr_F_Try_Expr;
+when 2 => return Try_Expr_F_Or_Expr;
+when others => null;
+end case;
+when lkt_Raise_Expr_Range =>
+case Index is
+when 1 => return Raise_Expr_F_Except_Expr;
+when others => null;
+end case;
+when lkt_If_Expr_Range =>
+case Index is
+when 1 => return If_Expr_F_Cond_Expr;
+when 2 => return If_Expr_F_Then_Expr;
+when 3 => return If_Expr_F_Alternatives;
+when 4 => return If_Expr_F_Else_Expr;
+when others => null;
+end case;
+when lkt_Block_Expr_Range =>
+case Index is
+when 1 => return Block_Expr_F_Val_Defs;
+when 2 => return Block_Expr_F_Expr;
+when others => null;
+end case;
+when lkt_Match_Expr_Range =>
+case Index is
+when 1 => return Match_Expr_F_Match_Expr;
+when 2 => return Match_Expr_F_Branches;
+when others => null;
+end case;
+when lkt_Bin_Op_Range =>
+case Index is
+when 1 => return Bin_Op_F_Left;
+when 2 => return Bin_Op_F_Op;
+when 3 => return Bin_Op_F_Right;
+when others => null;
+end case;
+when lkt_Logic_Expr_Range =>
+case Index is
+when 1 => return Logic_Expr_F_Expr;
+when others => null;
+end case;
+when lkt_Lexer_Case_Rule_Range =>
+case Index is
+when 1 => return Lexer_Case_Rule_F_Expr;
+when 2 => return Lexer_Case_Rule_F_Alts;
+when others => null;
+end case;
+when lkt_Lexer_Case_Rule_Cond_Alt_Range =>
+case Index is
+when 1 => return Lexer_Case_Rule_Cond_Alt_F_Cond_Exprs;
+when 2 => return Base_Lexer_Case_Rule_Alt_F_Send;
+when others => null;
+end case;
+when lkt_Lexer_Case_Rule_Default_Alt_Range =>
+case Index is
+when 1 => return Base_Lexer_Case_Rule_Alt_F_Send;
+when others => null;
+end case;
+when lkt_Lexer_Case_Rule_Send_Range =>
+case Index is
+when 1 => return Lexer_Case_Rule_Send_F_Sent;
+when 2 => return Lexer_Case_Rule_Send_F_Match_Size;
+when others => null;
+end case;
+when lkt_Enum_Class_Case_Range =>
+case Index is
+when 1 => return Enum_Class_Case_F_Decls;
+when others => null;
+end case;
+when lkt_Doc_Range =>
+case Index is
+when 1 => return Doc_F_Lines;
+when others => null;
+end case;
+when lkt_Simple_Type_Ref_Range =>
+case Index is
+when 1 => return Simple_Type_Ref_F_Type_Name;
+when others => null;
+end case;
+when lkt_Generic_Type_Ref_Range =>
+case Index is
+when 1 => return Generic_Type_Ref_F_Type_Name;
+when 2 => return Generic_Type_Ref_F_Params;
+when others => null;
+end case;
+when lkt_Function_Type_Ref_Range =>
+case Index is
+when 1 => return Function_Type_Ref_F_Args_Types;
+when 2 => return Function_Type_Ref_F_Return_Type;
+when others => null;
+end case;
+when lkt_Decl_Annotation_Range =>
+case Index is
+when 1 => return Decl_Annotation_F_Name;
+when 2 => return Decl_Annotation_F_Params;
+when others => null;
+end case;
+when lkt_Decl_Annotation_Params_Range =>
+case Index is
+when 1 => return Decl_Annotation_Params_F_Params;
+when others => null;
+end case;
+when lkt_Param_Range =>
+case Index is
+when 1 => return Param_F_Name;
+when 2 => return Param_F_Value;
+when others => null;
+end case;
+when lkt_Elsif_Branch_Range =>
+case Index is
+when 1 => return Elsif_Branch_F_Cond_Expr;
+when 2 => return Elsif_Branch_F_Then_Expr;
+when others => null;
+end case;
+when lkt_Match_Branch_Range =>
+case Index is
+when 1 => return Match_Branch_F_Decl;
+when 2 => return Match_Branch_F_Expr;
+when others => null;
+end case;
+when lkt_Var_Bind_Range =>
+case Index is
+when 1 => return Var_Bind_F_Name;
+when 2 => return Var_Bind_F_Expr;
+when others => null;
+end case;
+when others => null;
+end case;
+
+      pragma Warnings (Off, "value not in range of type");
+      return (raise Invalid_Field with "Index is out of bounds");
+      pragma Warnings (On, "value not in range of type");
+   end Field_Reference_From_Index;
+
+   ------------
+   -- Fields --
+   ------------
+
+   function Fields (Kind : LK_Node_Kind_Type) return Field_Reference_Array is
+   begin
+         return Fields (Id_For_Kind (Kind), Concrete_Only => True);
+   end Fields;
+
+   ------------
+   -- Fields --
+   ------------
+
+   function Fields
+     (Id : Node_Type_Id; Concrete_Only : Boolean) return Field_Reference_Array
+   is
+      Cursor : Any_Node_Type_Id := Id;
+
+      Added_Fields : array (Field_Reference) of Boolean := (others => False);
+      --  Set of field references that were added to Result
+
+      Result : Field_Reference_Array (1 .. Added_Fields'Length);
+      --  Temporary to hold the result. We return Result (1 .. Last).
+
+      Last : Natural := 0;
+      --  Index of the last element in Result to return
+   begin
+
+         --  Go through the derivation chain for Id and collect fields. Do
+         --  it in reverse order as we process base types last.
+         while Cursor /= None loop
+            declare
+               Node_Desc : Node_Type_Descriptor renames
+                  Node_Type_Descriptors (Cursor).all;
+            begin
+               for Field_Index in reverse Node_Desc.Fields'Range loop
+                  declare
+                     Field_Desc : Node_Field_Descriptor renames
+                        Node_Desc.Fields (Field_Index).all;
+                     Field      : Field_Reference renames Field_Desc.Field;
+                  begin
+                     --  Abstract fields share the same Field_Reference value
+                     --  with the corresponding concrete fields, so collect
+                     --  fields only once. We process fields in reverse order,
+                     --  so we know that concrete ones will be processed before
+                     --  the abstract fields they override.
+                     if not (Concrete_Only
+                             and then Field_Desc.Is_Abstract_Or_Null)
+                        and then not Added_Fields (Field)
+                     then
+                        Added_Fields (Field) := True;
+                        Last := Last + 1;
+                        Result (Last) := Field;
+                     end if;
+                  end;
+               end loop;
+               Cursor := Node_Desc.Base_Type;
+            end;
+         end loop;
+
+         --  At this point, Result contains elements in the opposite order as
+         --  expected, so reverse it.
+
+         for I in 1 .. Last / 2 loop
+            declare
+               Other_I : constant Positive := Last - I + 1;
+               Swap    : constant Field_Reference := Result (I);
+            begin
+               Result (I) := Result (Other_I);
+               Result (Other_I) := Swap;
+            end;
+         end loop;
+
+         return Result (1 .. Last);
+
+   end Fields;
+
+   ------------
+   -- Fields --
+   ------------
+
+   function Fields (Id : Node_Type_Id) return Field_Reference_Array is
+   begin
+      return Fields (Id, Concrete_Only => False);
+   end Fields;
+
+
+   -------------------
+   -- Property_Name --
+   -------------------
+
+   function Property_Name (Property : Property_Reference) return String is
+   begin
+      return Property_Descriptors (Property).Name;
+   end Property_Name;
+
+   --------------------------
+   -- Property_Return_Type --
+   --------------------------
+
+   function Property_Return_Type
+     (Property : Property_Reference) return Value_Constraint is
+   begin
+      return Property_Descriptors (Property).Return_Type;
+   end Property_Return_Type;
+
+   ---------------------------
+   -- Check_Argument_Number --
+   ---------------------------
+
+   procedure Check_Argument_Number
+     (Desc : Property_Descriptor; Argument_Number : Positive) is
+   begin
+      if Argument_Number not in Desc.Argument_Names'Range then
+         raise Property_Error with "out-of-bounds argument number";
+      end if;
+   end Check_Argument_Number;
+
+   -----------------------------
+   -- Property_Argument_Types --
+   -----------------------------
+
+   function Property_Argument_Types
+     (Property : Property_Reference) return Value_Constraint_Array is
+   begin
+      return Property_Descriptors (Property).Argument_Types;
+   end Property_Argument_Types;
+
+   ----------------------------
+   -- Property_Argument_Name --
+   ----------------------------
+
+   function Property_Argument_Name
+     (Property : Property_Reference; Argument_Number : Positive) return String
+   is
+      Desc : Property_Descriptor renames Property_Descriptors (Property).all;
+   begin
+      Check_Argument_Number (Desc, Argument_Number);
+      return Property_Descriptors (Property)
+             .Argument_Names (Argument_Number).all;
+   end Property_Argument_Name;
+
+   -------------------------------------
+   -- Property_Argument_Default_Value --
+   -------------------------------------
+
+   function Property_Argument_Default_Value
+     (Property        : Property_Reference;
+      Argument_Number : Positive) return Internal_Value
+   is
+      Desc : Property_Descriptor renames Property_Descriptors (Property).all;
+   begin
+      Check_Argument_Number (Desc, Argument_Number);
+      return Desc.Argument_Default_Values (Argument_Number);
+   end Property_Argument_Default_Value;
+
+   ----------------
+   -- Properties --
+   ----------------
+
+   function Properties (Kind : LK_Node_Kind_Type) return Property_Reference_Array
+   is
+   begin
+      return Properties (Id_For_Kind (Kind));
+   end Properties;
+
+   ----------------
+   -- Properties --
+   ----------------
+
+   function Properties (Id : Node_Type_Id) return Property_Reference_Array is
+      Cursor : Any_Node_Type_Id := Id;
+
+      Result : Property_Reference_Array (1 .. Property_Descriptors'Length);
+      --  Temporary to hold the result. We return Result (1 .. Last).
+
+      Last : Natural := 0;
+      --  Index of the last element in Result to return
+   begin
+      --  Go through the derivation chain for Id and collect properties. Do
+      --  it in reverse order as we process base types last.
+
+      while Cursor /= None loop
+         declare
+            Node_Desc : Node_Type_Descriptor renames
+               Node_Type_Descriptors (Cursor).all;
+         begin
+            for Prop_Desc of reverse Node_Desc.Properties loop
+               Last := Last + 1;
+               Result (Last) := Prop_Desc;
+            end loop;
+            Cursor := Node_Desc.Base_Type;
+         end;
+      end loop;
+
+      --  At this point, Result contains elements in the opposite order as
+      --  expected, so reverse it.
+
+      for I in 1 .. Last / 2 loop
+         declare
+            Other_I : constant Positive := Last - I + 1;
+            Swap    : constant Property_Reference := Result (I);
+         begin
+            Result (I) := Result (Other_I);
+            Result (Other_I) := Swap;
+         end;
+      end loop;
+
+      return Result (1 .. Last);
+   end Properties;
+
+
+   ---------------------
+   -- Token_Node_Kind --
+   ---------------------
+
+   function Token_Node_Kind (Kind : LK_Node_Kind_Type) return Token_Kind is
+      
+   begin
+         pragma Unreferenced (Kind);
+         return (raise Program_Error);
+   end Token_Node_Kind;
+
+begin
+   for D in Node_Type_Descriptors'Range loop
+      DSL_Name_To_Node_Type.Insert
+        (Node_Type_Descriptors (D).DSL_Name, D);
+   end loop;
+end Liblktlang.Introspection_Implementation;
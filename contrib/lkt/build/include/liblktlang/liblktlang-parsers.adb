@@ -0,0 +1,32559 @@
+
+with Ada.Containers.Vectors;
+with Ada.Unchecked_Deallocation;
+
+with GNATCOLL.Traces;
+
+with Langkit_Support.Diagnostics; use Langkit_Support.Diagnostics;
+with Langkit_Support.Packrat;
+with Langkit_Support.Text;        use Langkit_Support.Text;
+
+with Liblktlang.Common;             use Liblktlang.Common;
+use Liblktlang.Common.Symbols;
+with Liblktlang.Implementation;     use Liblktlang.Implementation;
+with Liblktlang.Private_Converters; use Liblktlang.Private_Converters;
+
+
+
+package body Liblktlang.Parsers is
+   use all type Symbols.Symbol_Type;
+
+   Packrat_Trace : constant GNATCOLL.Traces.Trace_Handle :=
+     GNATCOLL.Traces.Create
+       ("LIBLKTLANG.PACKRAT", GNATCOLL.Traces.From_Config);
+   --  Trace to log usage statistics for packrat memoization tables when
+   --  destroying parsers.
+
+   --  Prepare packrat instantiations: one per enum type and onefor each kind
+   --  of node (including lists). Likewise for bump ptr. allocators, except
+   --  we need them only for non-abstract AST nodes.
+   --
+   --  In the Alloc instanciations, there are unchecked conversions to wrap
+   --  System.Address values from a low-level allocator. All read/writes for
+   --  the pointed values are made through values of the same access types
+   --  (i.e. AST node access). Thus, strict aliasing issues should not arise
+   --  for these.
+   --
+   --  See <https://gcc.gnu.org/onlinedocs/gnat_ugn/
+   --       Optimization-and-Strict-Aliasing.html>.
+
+   pragma Warnings (Off, "is not referenced");
+   pragma Warnings (Off, "possible aliasing problem for type");
+      package Bare_LK_Node_Memos is new Langkit_Support.Packrat
+        (Bare_LK_Node, Token_Index);
+
+      package Bare_Base_Lexer_Case_Rule_Alt_Memos is new Langkit_Support.Packrat
+        (Bare_Base_Lexer_Case_Rule_Alt, Token_Index);
+
+      package Bare_Lexer_Case_Rule_Cond_Alt_Memos is new Langkit_Support.Packrat
+        (Bare_Lexer_Case_Rule_Cond_Alt, Token_Index);
+
+         
+         subtype Subtype_For_Lexer_Case_Rule_Cond_Alt is
+            Root_Node_Record (lkt_Lexer_Case_Rule_Cond_Alt);
+         type Access_To_Subtype_For_Lexer_Case_Rule_Cond_Alt is access all Subtype_For_Lexer_Case_Rule_Cond_Alt;
+         package Bare_Lexer_Case_Rule_Cond_Alt_Alloc is new Alloc
+           (Subtype_For_Lexer_Case_Rule_Cond_Alt, Access_To_Subtype_For_Lexer_Case_Rule_Cond_Alt);
+
+         function Allocate_Lexer_Case_Rule_Cond_Alt
+           (Pool : Bump_Ptr_Pool) return Bare_Lexer_Case_Rule_Cond_Alt;
+
+         function Allocate_Lexer_Case_Rule_Cond_Alt
+           (Pool : Bump_Ptr_Pool) return Bare_Lexer_Case_Rule_Cond_Alt
+         is
+            Result      : constant Access_To_Subtype_For_Lexer_Case_Rule_Cond_Alt := Bare_Lexer_Case_Rule_Cond_Alt_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Lexer_Case_Rule_Cond_Alt;
+            return Bare_Lexer_Case_Rule_Cond_Alt (Result);
+         end Allocate_Lexer_Case_Rule_Cond_Alt;
+
+      package Bare_Lexer_Case_Rule_Default_Alt_Memos is new Langkit_Support.Packrat
+        (Bare_Lexer_Case_Rule_Default_Alt, Token_Index);
+
+         
+         subtype Subtype_For_Lexer_Case_Rule_Default_Alt is
+            Root_Node_Record (lkt_Lexer_Case_Rule_Default_Alt);
+         type Access_To_Subtype_For_Lexer_Case_Rule_Default_Alt is access all Subtype_For_Lexer_Case_Rule_Default_Alt;
+         package Bare_Lexer_Case_Rule_Default_Alt_Alloc is new Alloc
+           (Subtype_For_Lexer_Case_Rule_Default_Alt, Access_To_Subtype_For_Lexer_Case_Rule_Default_Alt);
+
+         function Allocate_Lexer_Case_Rule_Default_Alt
+           (Pool : Bump_Ptr_Pool) return Bare_Lexer_Case_Rule_Default_Alt;
+
+         function Allocate_Lexer_Case_Rule_Default_Alt
+           (Pool : Bump_Ptr_Pool) return Bare_Lexer_Case_Rule_Default_Alt
+         is
+            Result      : constant Access_To_Subtype_For_Lexer_Case_Rule_Default_Alt := Bare_Lexer_Case_Rule_Default_Alt_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Lexer_Case_Rule_Default_Alt;
+            return Bare_Lexer_Case_Rule_Default_Alt (Result);
+         end Allocate_Lexer_Case_Rule_Default_Alt;
+
+      package Bare_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Decl, Token_Index);
+
+      package Bare_Base_Grammar_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Base_Grammar_Decl, Token_Index);
+
+      package Bare_Grammar_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_Decl is
+            Root_Node_Record (lkt_Grammar_Decl);
+         type Access_To_Subtype_For_Grammar_Decl is access all Subtype_For_Grammar_Decl;
+         package Bare_Grammar_Decl_Alloc is new Alloc
+           (Subtype_For_Grammar_Decl, Access_To_Subtype_For_Grammar_Decl);
+
+         function Allocate_Grammar_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Decl;
+
+         function Allocate_Grammar_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_Decl := Bare_Grammar_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_Decl;
+            return Bare_Grammar_Decl (Result);
+         end Allocate_Grammar_Decl;
+
+      package Bare_Base_Grammar_Rule_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Base_Grammar_Rule_Decl, Token_Index);
+
+      package Bare_Grammar_Rule_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Rule_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_Rule_Decl is
+            Root_Node_Record (lkt_Grammar_Rule_Decl);
+         type Access_To_Subtype_For_Grammar_Rule_Decl is access all Subtype_For_Grammar_Rule_Decl;
+         package Bare_Grammar_Rule_Decl_Alloc is new Alloc
+           (Subtype_For_Grammar_Rule_Decl, Access_To_Subtype_For_Grammar_Rule_Decl);
+
+         function Allocate_Grammar_Rule_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Rule_Decl;
+
+         function Allocate_Grammar_Rule_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Rule_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_Rule_Decl := Bare_Grammar_Rule_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_Rule_Decl;
+            return Bare_Grammar_Rule_Decl (Result);
+         end Allocate_Grammar_Rule_Decl;
+
+      package Bare_Synthetic_Lexer_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Synthetic_Lexer_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Synthetic_Lexer_Decl is
+            Root_Node_Record (lkt_Synthetic_Lexer_Decl);
+         type Access_To_Subtype_For_Synthetic_Lexer_Decl is access all Subtype_For_Synthetic_Lexer_Decl;
+         package Bare_Synthetic_Lexer_Decl_Alloc is new Alloc
+           (Subtype_For_Synthetic_Lexer_Decl, Access_To_Subtype_For_Synthetic_Lexer_Decl);
+
+         function Allocate_Synthetic_Lexer_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Synthetic_Lexer_Decl;
+
+         function Allocate_Synthetic_Lexer_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Synthetic_Lexer_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Synthetic_Lexer_Decl := Bare_Synthetic_Lexer_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Synthetic_Lexer_Decl;
+            return Bare_Synthetic_Lexer_Decl (Result);
+         end Allocate_Synthetic_Lexer_Decl;
+
+      package Bare_Base_Val_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Base_Val_Decl, Token_Index);
+
+      package Bare_Node_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Node_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Node_Decl is
+            Root_Node_Record (lkt_Node_Decl);
+         type Access_To_Subtype_For_Node_Decl is access all Subtype_For_Node_Decl;
+         package Bare_Node_Decl_Alloc is new Alloc
+           (Subtype_For_Node_Decl, Access_To_Subtype_For_Node_Decl);
+
+         function Allocate_Node_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Node_Decl;
+
+         function Allocate_Node_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Node_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Node_Decl := Bare_Node_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Node_Decl;
+            return Bare_Node_Decl (Result);
+         end Allocate_Node_Decl;
+
+      package Bare_Self_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Self_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Self_Decl is
+            Root_Node_Record (lkt_Self_Decl);
+         type Access_To_Subtype_For_Self_Decl is access all Subtype_For_Self_Decl;
+         package Bare_Self_Decl_Alloc is new Alloc
+           (Subtype_For_Self_Decl, Access_To_Subtype_For_Self_Decl);
+
+         function Allocate_Self_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Self_Decl;
+
+         function Allocate_Self_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Self_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Self_Decl := Bare_Self_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Self_Decl;
+            return Bare_Self_Decl (Result);
+         end Allocate_Self_Decl;
+
+      package Bare_User_Val_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_User_Val_Decl, Token_Index);
+
+      package Bare_Enum_Lit_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Enum_Lit_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Enum_Lit_Decl is
+            Root_Node_Record (lkt_Enum_Lit_Decl);
+         type Access_To_Subtype_For_Enum_Lit_Decl is access all Subtype_For_Enum_Lit_Decl;
+         package Bare_Enum_Lit_Decl_Alloc is new Alloc
+           (Subtype_For_Enum_Lit_Decl, Access_To_Subtype_For_Enum_Lit_Decl);
+
+         function Allocate_Enum_Lit_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Enum_Lit_Decl;
+
+         function Allocate_Enum_Lit_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Enum_Lit_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Enum_Lit_Decl := Bare_Enum_Lit_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Enum_Lit_Decl;
+            return Bare_Enum_Lit_Decl (Result);
+         end Allocate_Enum_Lit_Decl;
+
+      package Bare_Explicitly_Typed_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Explicitly_Typed_Decl, Token_Index);
+
+      package Bare_Component_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Component_Decl, Token_Index);
+
+      package Bare_Field_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Field_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Field_Decl is
+            Root_Node_Record (lkt_Field_Decl);
+         type Access_To_Subtype_For_Field_Decl is access all Subtype_For_Field_Decl;
+         package Bare_Field_Decl_Alloc is new Alloc
+           (Subtype_For_Field_Decl, Access_To_Subtype_For_Field_Decl);
+
+         function Allocate_Field_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Field_Decl;
+
+         function Allocate_Field_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Field_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Field_Decl := Bare_Field_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Field_Decl;
+            return Bare_Field_Decl (Result);
+         end Allocate_Field_Decl;
+
+      package Bare_Fun_Arg_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Fun_Arg_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Fun_Arg_Decl is
+            Root_Node_Record (lkt_Fun_Arg_Decl);
+         type Access_To_Subtype_For_Fun_Arg_Decl is access all Subtype_For_Fun_Arg_Decl;
+         package Bare_Fun_Arg_Decl_Alloc is new Alloc
+           (Subtype_For_Fun_Arg_Decl, Access_To_Subtype_For_Fun_Arg_Decl);
+
+         function Allocate_Fun_Arg_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Fun_Arg_Decl;
+
+         function Allocate_Fun_Arg_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Fun_Arg_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Fun_Arg_Decl := Bare_Fun_Arg_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Fun_Arg_Decl;
+            return Bare_Fun_Arg_Decl (Result);
+         end Allocate_Fun_Arg_Decl;
+
+      package Bare_Lambda_Arg_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Lambda_Arg_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Lambda_Arg_Decl is
+            Root_Node_Record (lkt_Lambda_Arg_Decl);
+         type Access_To_Subtype_For_Lambda_Arg_Decl is access all Subtype_For_Lambda_Arg_Decl;
+         package Bare_Lambda_Arg_Decl_Alloc is new Alloc
+           (Subtype_For_Lambda_Arg_Decl, Access_To_Subtype_For_Lambda_Arg_Decl);
+
+         function Allocate_Lambda_Arg_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Lambda_Arg_Decl;
+
+         function Allocate_Lambda_Arg_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Lambda_Arg_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Lambda_Arg_Decl := Bare_Lambda_Arg_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Lambda_Arg_Decl;
+            return Bare_Lambda_Arg_Decl (Result);
+         end Allocate_Lambda_Arg_Decl;
+
+      package Bare_Match_Val_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Match_Val_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Match_Val_Decl is
+            Root_Node_Record (lkt_Match_Val_Decl);
+         type Access_To_Subtype_For_Match_Val_Decl is access all Subtype_For_Match_Val_Decl;
+         package Bare_Match_Val_Decl_Alloc is new Alloc
+           (Subtype_For_Match_Val_Decl, Access_To_Subtype_For_Match_Val_Decl);
+
+         function Allocate_Match_Val_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Match_Val_Decl;
+
+         function Allocate_Match_Val_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Match_Val_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Match_Val_Decl := Bare_Match_Val_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Match_Val_Decl;
+            return Bare_Match_Val_Decl (Result);
+         end Allocate_Match_Val_Decl;
+
+      package Bare_Val_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Val_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Val_Decl is
+            Root_Node_Record (lkt_Val_Decl);
+         type Access_To_Subtype_For_Val_Decl is access all Subtype_For_Val_Decl;
+         package Bare_Val_Decl_Alloc is new Alloc
+           (Subtype_For_Val_Decl, Access_To_Subtype_For_Val_Decl);
+
+         function Allocate_Val_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Val_Decl;
+
+         function Allocate_Val_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Val_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Val_Decl := Bare_Val_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Val_Decl;
+            return Bare_Val_Decl (Result);
+         end Allocate_Val_Decl;
+
+      package Bare_Fun_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Fun_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Fun_Decl is
+            Root_Node_Record (lkt_Fun_Decl);
+         type Access_To_Subtype_For_Fun_Decl is access all Subtype_For_Fun_Decl;
+         package Bare_Fun_Decl_Alloc is new Alloc
+           (Subtype_For_Fun_Decl, Access_To_Subtype_For_Fun_Decl);
+
+         function Allocate_Fun_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Fun_Decl;
+
+         function Allocate_Fun_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Fun_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Fun_Decl := Bare_Fun_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Fun_Decl;
+            return Bare_Fun_Decl (Result);
+         end Allocate_Fun_Decl;
+
+      package Bare_Generic_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Generic_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Generic_Decl is
+            Root_Node_Record (lkt_Generic_Decl);
+         type Access_To_Subtype_For_Generic_Decl is access all Subtype_For_Generic_Decl;
+         package Bare_Generic_Decl_Alloc is new Alloc
+           (Subtype_For_Generic_Decl, Access_To_Subtype_For_Generic_Decl);
+
+         function Allocate_Generic_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Generic_Decl;
+
+         function Allocate_Generic_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Generic_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Generic_Decl := Bare_Generic_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Generic_Decl;
+            return Bare_Generic_Decl (Result);
+         end Allocate_Generic_Decl;
+
+      package Bare_Lexer_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Lexer_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Lexer_Decl is
+            Root_Node_Record (lkt_Lexer_Decl);
+         type Access_To_Subtype_For_Lexer_Decl is access all Subtype_For_Lexer_Decl;
+         package Bare_Lexer_Decl_Alloc is new Alloc
+           (Subtype_For_Lexer_Decl, Access_To_Subtype_For_Lexer_Decl);
+
+         function Allocate_Lexer_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Lexer_Decl;
+
+         function Allocate_Lexer_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Lexer_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Lexer_Decl := Bare_Lexer_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Lexer_Decl;
+            return Bare_Lexer_Decl (Result);
+         end Allocate_Lexer_Decl;
+
+      package Bare_Lexer_Family_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Lexer_Family_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Lexer_Family_Decl is
+            Root_Node_Record (lkt_Lexer_Family_Decl);
+         type Access_To_Subtype_For_Lexer_Family_Decl is access all Subtype_For_Lexer_Family_Decl;
+         package Bare_Lexer_Family_Decl_Alloc is new Alloc
+           (Subtype_For_Lexer_Family_Decl, Access_To_Subtype_For_Lexer_Family_Decl);
+
+         function Allocate_Lexer_Family_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Lexer_Family_Decl;
+
+         function Allocate_Lexer_Family_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Lexer_Family_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Lexer_Family_Decl := Bare_Lexer_Family_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Lexer_Family_Decl;
+            return Bare_Lexer_Family_Decl (Result);
+         end Allocate_Lexer_Family_Decl;
+
+      package Bare_Type_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Type_Decl, Token_Index);
+
+      package Bare_Enum_Class_Alt_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Enum_Class_Alt_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Enum_Class_Alt_Decl is
+            Root_Node_Record (lkt_Enum_Class_Alt_Decl);
+         type Access_To_Subtype_For_Enum_Class_Alt_Decl is access all Subtype_For_Enum_Class_Alt_Decl;
+         package Bare_Enum_Class_Alt_Decl_Alloc is new Alloc
+           (Subtype_For_Enum_Class_Alt_Decl, Access_To_Subtype_For_Enum_Class_Alt_Decl);
+
+         function Allocate_Enum_Class_Alt_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Enum_Class_Alt_Decl;
+
+         function Allocate_Enum_Class_Alt_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Enum_Class_Alt_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Enum_Class_Alt_Decl := Bare_Enum_Class_Alt_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Enum_Class_Alt_Decl;
+            return Bare_Enum_Class_Alt_Decl (Result);
+         end Allocate_Enum_Class_Alt_Decl;
+
+      package Bare_Function_Type_Memos is new Langkit_Support.Packrat
+        (Bare_Function_Type, Token_Index);
+
+         
+         subtype Subtype_For_Function_Type is
+            Root_Node_Record (lkt_Function_Type);
+         type Access_To_Subtype_For_Function_Type is access all Subtype_For_Function_Type;
+         package Bare_Function_Type_Alloc is new Alloc
+           (Subtype_For_Function_Type, Access_To_Subtype_For_Function_Type);
+
+         function Allocate_Function_Type
+           (Pool : Bump_Ptr_Pool) return Bare_Function_Type;
+
+         function Allocate_Function_Type
+           (Pool : Bump_Ptr_Pool) return Bare_Function_Type
+         is
+            Result      : constant Access_To_Subtype_For_Function_Type := Bare_Function_Type_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Function_Type;
+            return Bare_Function_Type (Result);
+         end Allocate_Function_Type;
+
+      package Bare_Generic_Formal_Type_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Generic_Formal_Type_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Generic_Formal_Type_Decl is
+            Root_Node_Record (lkt_Generic_Formal_Type_Decl);
+         type Access_To_Subtype_For_Generic_Formal_Type_Decl is access all Subtype_For_Generic_Formal_Type_Decl;
+         package Bare_Generic_Formal_Type_Decl_Alloc is new Alloc
+           (Subtype_For_Generic_Formal_Type_Decl, Access_To_Subtype_For_Generic_Formal_Type_Decl);
+
+         function Allocate_Generic_Formal_Type_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Generic_Formal_Type_Decl;
+
+         function Allocate_Generic_Formal_Type_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Generic_Formal_Type_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Generic_Formal_Type_Decl := Bare_Generic_Formal_Type_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Generic_Formal_Type_Decl;
+            return Bare_Generic_Formal_Type_Decl (Result);
+         end Allocate_Generic_Formal_Type_Decl;
+
+      package Bare_Instantiated_Generic_Type_Memos is new Langkit_Support.Packrat
+        (Bare_Instantiated_Generic_Type, Token_Index);
+
+         
+         subtype Subtype_For_Instantiated_Generic_Type is
+            Root_Node_Record (lkt_Instantiated_Generic_Type);
+         type Access_To_Subtype_For_Instantiated_Generic_Type is access all Subtype_For_Instantiated_Generic_Type;
+         package Bare_Instantiated_Generic_Type_Alloc is new Alloc
+           (Subtype_For_Instantiated_Generic_Type, Access_To_Subtype_For_Instantiated_Generic_Type);
+
+         function Allocate_Instantiated_Generic_Type
+           (Pool : Bump_Ptr_Pool) return Bare_Instantiated_Generic_Type;
+
+         function Allocate_Instantiated_Generic_Type
+           (Pool : Bump_Ptr_Pool) return Bare_Instantiated_Generic_Type
+         is
+            Result      : constant Access_To_Subtype_For_Instantiated_Generic_Type := Bare_Instantiated_Generic_Type_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Instantiated_Generic_Type;
+            return Bare_Instantiated_Generic_Type (Result);
+         end Allocate_Instantiated_Generic_Type;
+
+      package Bare_Named_Type_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Named_Type_Decl, Token_Index);
+
+      package Bare_Basic_Class_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Basic_Class_Decl, Token_Index);
+
+      package Bare_Class_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Class_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Class_Decl is
+            Root_Node_Record (lkt_Class_Decl);
+         type Access_To_Subtype_For_Class_Decl is access all Subtype_For_Class_Decl;
+         package Bare_Class_Decl_Alloc is new Alloc
+           (Subtype_For_Class_Decl, Access_To_Subtype_For_Class_Decl);
+
+         function Allocate_Class_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Class_Decl;
+
+         function Allocate_Class_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Class_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Class_Decl := Bare_Class_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Class_Decl;
+            return Bare_Class_Decl (Result);
+         end Allocate_Class_Decl;
+
+      package Bare_Enum_Class_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Enum_Class_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Enum_Class_Decl is
+            Root_Node_Record (lkt_Enum_Class_Decl);
+         type Access_To_Subtype_For_Enum_Class_Decl is access all Subtype_For_Enum_Class_Decl;
+         package Bare_Enum_Class_Decl_Alloc is new Alloc
+           (Subtype_For_Enum_Class_Decl, Access_To_Subtype_For_Enum_Class_Decl);
+
+         function Allocate_Enum_Class_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Enum_Class_Decl;
+
+         function Allocate_Enum_Class_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Enum_Class_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Enum_Class_Decl := Bare_Enum_Class_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Enum_Class_Decl;
+            return Bare_Enum_Class_Decl (Result);
+         end Allocate_Enum_Class_Decl;
+
+      package Bare_Enum_Type_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Enum_Type_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Enum_Type_Decl is
+            Root_Node_Record (lkt_Enum_Type_Decl);
+         type Access_To_Subtype_For_Enum_Type_Decl is access all Subtype_For_Enum_Type_Decl;
+         package Bare_Enum_Type_Decl_Alloc is new Alloc
+           (Subtype_For_Enum_Type_Decl, Access_To_Subtype_For_Enum_Type_Decl);
+
+         function Allocate_Enum_Type_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Enum_Type_Decl;
+
+         function Allocate_Enum_Type_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Enum_Type_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Enum_Type_Decl := Bare_Enum_Type_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Enum_Type_Decl;
+            return Bare_Enum_Type_Decl (Result);
+         end Allocate_Enum_Type_Decl;
+
+      package Bare_Struct_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Struct_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Struct_Decl is
+            Root_Node_Record (lkt_Struct_Decl);
+         type Access_To_Subtype_For_Struct_Decl is access all Subtype_For_Struct_Decl;
+         package Bare_Struct_Decl_Alloc is new Alloc
+           (Subtype_For_Struct_Decl, Access_To_Subtype_For_Struct_Decl);
+
+         function Allocate_Struct_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Struct_Decl;
+
+         function Allocate_Struct_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Struct_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Struct_Decl := Bare_Struct_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Struct_Decl;
+            return Bare_Struct_Decl (Result);
+         end Allocate_Struct_Decl;
+
+      package Bare_Trait_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Trait_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Trait_Decl is
+            Root_Node_Record (lkt_Trait_Decl);
+         type Access_To_Subtype_For_Trait_Decl is access all Subtype_For_Trait_Decl;
+         package Bare_Trait_Decl_Alloc is new Alloc
+           (Subtype_For_Trait_Decl, Access_To_Subtype_For_Trait_Decl);
+
+         function Allocate_Trait_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Trait_Decl;
+
+         function Allocate_Trait_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Trait_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Trait_Decl := Bare_Trait_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Trait_Decl;
+            return Bare_Trait_Decl (Result);
+         end Allocate_Trait_Decl;
+
+      package Bare_Decl_Annotation_Memos is new Langkit_Support.Packrat
+        (Bare_Decl_Annotation, Token_Index);
+
+         
+         subtype Subtype_For_Decl_Annotation is
+            Root_Node_Record (lkt_Decl_Annotation);
+         type Access_To_Subtype_For_Decl_Annotation is access all Subtype_For_Decl_Annotation;
+         package Bare_Decl_Annotation_Alloc is new Alloc
+           (Subtype_For_Decl_Annotation, Access_To_Subtype_For_Decl_Annotation);
+
+         function Allocate_Decl_Annotation
+           (Pool : Bump_Ptr_Pool) return Bare_Decl_Annotation;
+
+         function Allocate_Decl_Annotation
+           (Pool : Bump_Ptr_Pool) return Bare_Decl_Annotation
+         is
+            Result      : constant Access_To_Subtype_For_Decl_Annotation := Bare_Decl_Annotation_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Decl_Annotation;
+            return Bare_Decl_Annotation (Result);
+         end Allocate_Decl_Annotation;
+
+      package Bare_Decl_Annotation_Params_Memos is new Langkit_Support.Packrat
+        (Bare_Decl_Annotation_Params, Token_Index);
+
+         
+         subtype Subtype_For_Decl_Annotation_Params is
+            Root_Node_Record (lkt_Decl_Annotation_Params);
+         type Access_To_Subtype_For_Decl_Annotation_Params is access all Subtype_For_Decl_Annotation_Params;
+         package Bare_Decl_Annotation_Params_Alloc is new Alloc
+           (Subtype_For_Decl_Annotation_Params, Access_To_Subtype_For_Decl_Annotation_Params);
+
+         function Allocate_Decl_Annotation_Params
+           (Pool : Bump_Ptr_Pool) return Bare_Decl_Annotation_Params;
+
+         function Allocate_Decl_Annotation_Params
+           (Pool : Bump_Ptr_Pool) return Bare_Decl_Annotation_Params
+         is
+            Result      : constant Access_To_Subtype_For_Decl_Annotation_Params := Bare_Decl_Annotation_Params_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Decl_Annotation_Params;
+            return Bare_Decl_Annotation_Params (Result);
+         end Allocate_Decl_Annotation_Params;
+
+      package Bare_Doc_Memos is new Langkit_Support.Packrat
+        (Bare_Doc, Token_Index);
+
+         
+         subtype Subtype_For_Doc is
+            Root_Node_Record (lkt_Doc);
+         type Access_To_Subtype_For_Doc is access all Subtype_For_Doc;
+         package Bare_Doc_Alloc is new Alloc
+           (Subtype_For_Doc, Access_To_Subtype_For_Doc);
+
+         function Allocate_Doc
+           (Pool : Bump_Ptr_Pool) return Bare_Doc;
+
+         function Allocate_Doc
+           (Pool : Bump_Ptr_Pool) return Bare_Doc
+         is
+            Result      : constant Access_To_Subtype_For_Doc := Bare_Doc_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Doc;
+            return Bare_Doc (Result);
+         end Allocate_Doc;
+
+      package Bare_Doc_Comment_Memos is new Langkit_Support.Packrat
+        (Bare_Doc_Comment, Token_Index);
+
+         
+         subtype Subtype_For_Doc_Comment is
+            Root_Node_Record (lkt_Doc_Comment);
+         type Access_To_Subtype_For_Doc_Comment is access all Subtype_For_Doc_Comment;
+         package Bare_Doc_Comment_Alloc is new Alloc
+           (Subtype_For_Doc_Comment, Access_To_Subtype_For_Doc_Comment);
+
+         function Allocate_Doc_Comment
+           (Pool : Bump_Ptr_Pool) return Bare_Doc_Comment;
+
+         function Allocate_Doc_Comment
+           (Pool : Bump_Ptr_Pool) return Bare_Doc_Comment
+         is
+            Result      : constant Access_To_Subtype_For_Doc_Comment := Bare_Doc_Comment_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Doc_Comment;
+            return Bare_Doc_Comment (Result);
+         end Allocate_Doc_Comment;
+
+      package Bare_Elsif_Branch_Memos is new Langkit_Support.Packrat
+        (Bare_Elsif_Branch, Token_Index);
+
+         
+         subtype Subtype_For_Elsif_Branch is
+            Root_Node_Record (lkt_Elsif_Branch);
+         type Access_To_Subtype_For_Elsif_Branch is access all Subtype_For_Elsif_Branch;
+         package Bare_Elsif_Branch_Alloc is new Alloc
+           (Subtype_For_Elsif_Branch, Access_To_Subtype_For_Elsif_Branch);
+
+         function Allocate_Elsif_Branch
+           (Pool : Bump_Ptr_Pool) return Bare_Elsif_Branch;
+
+         function Allocate_Elsif_Branch
+           (Pool : Bump_Ptr_Pool) return Bare_Elsif_Branch
+         is
+            Result      : constant Access_To_Subtype_For_Elsif_Branch := Bare_Elsif_Branch_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Elsif_Branch;
+            return Bare_Elsif_Branch (Result);
+         end Allocate_Elsif_Branch;
+
+      package Bare_Enum_Class_Case_Memos is new Langkit_Support.Packrat
+        (Bare_Enum_Class_Case, Token_Index);
+
+         
+         subtype Subtype_For_Enum_Class_Case is
+            Root_Node_Record (lkt_Enum_Class_Case);
+         type Access_To_Subtype_For_Enum_Class_Case is access all Subtype_For_Enum_Class_Case;
+         package Bare_Enum_Class_Case_Alloc is new Alloc
+           (Subtype_For_Enum_Class_Case, Access_To_Subtype_For_Enum_Class_Case);
+
+         function Allocate_Enum_Class_Case
+           (Pool : Bump_Ptr_Pool) return Bare_Enum_Class_Case;
+
+         function Allocate_Enum_Class_Case
+           (Pool : Bump_Ptr_Pool) return Bare_Enum_Class_Case
+         is
+            Result      : constant Access_To_Subtype_For_Enum_Class_Case := Bare_Enum_Class_Case_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Enum_Class_Case;
+            return Bare_Enum_Class_Case (Result);
+         end Allocate_Enum_Class_Case;
+
+      package Bare_Excludes_Null_Memos is new Langkit_Support.Packrat
+        (Bare_Excludes_Null, Token_Index);
+
+      package Bare_Excludes_Null_Absent_Memos is new Langkit_Support.Packrat
+        (Bare_Excludes_Null_Absent, Token_Index);
+
+         
+         subtype Subtype_For_Excludes_Null_Absent is
+            Root_Node_Record (lkt_Excludes_Null_Absent);
+         type Access_To_Subtype_For_Excludes_Null_Absent is access all Subtype_For_Excludes_Null_Absent;
+         package Bare_Excludes_Null_Absent_Alloc is new Alloc
+           (Subtype_For_Excludes_Null_Absent, Access_To_Subtype_For_Excludes_Null_Absent);
+
+         function Allocate_Excludes_Null_Absent
+           (Pool : Bump_Ptr_Pool) return Bare_Excludes_Null_Absent;
+
+         function Allocate_Excludes_Null_Absent
+           (Pool : Bump_Ptr_Pool) return Bare_Excludes_Null_Absent
+         is
+            Result      : constant Access_To_Subtype_For_Excludes_Null_Absent := Bare_Excludes_Null_Absent_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Excludes_Null_Absent;
+            return Bare_Excludes_Null_Absent (Result);
+         end Allocate_Excludes_Null_Absent;
+
+      package Bare_Excludes_Null_Present_Memos is new Langkit_Support.Packrat
+        (Bare_Excludes_Null_Present, Token_Index);
+
+         
+         subtype Subtype_For_Excludes_Null_Present is
+            Root_Node_Record (lkt_Excludes_Null_Present);
+         type Access_To_Subtype_For_Excludes_Null_Present is access all Subtype_For_Excludes_Null_Present;
+         package Bare_Excludes_Null_Present_Alloc is new Alloc
+           (Subtype_For_Excludes_Null_Present, Access_To_Subtype_For_Excludes_Null_Present);
+
+         function Allocate_Excludes_Null_Present
+           (Pool : Bump_Ptr_Pool) return Bare_Excludes_Null_Present;
+
+         function Allocate_Excludes_Null_Present
+           (Pool : Bump_Ptr_Pool) return Bare_Excludes_Null_Present
+         is
+            Result      : constant Access_To_Subtype_For_Excludes_Null_Present := Bare_Excludes_Null_Present_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Excludes_Null_Present;
+            return Bare_Excludes_Null_Present (Result);
+         end Allocate_Excludes_Null_Present;
+
+      package Bare_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_Expr, Token_Index);
+
+      package Bare_Array_Literal_Memos is new Langkit_Support.Packrat
+        (Bare_Array_Literal, Token_Index);
+
+         
+         subtype Subtype_For_Array_Literal is
+            Root_Node_Record (lkt_Array_Literal);
+         type Access_To_Subtype_For_Array_Literal is access all Subtype_For_Array_Literal;
+         package Bare_Array_Literal_Alloc is new Alloc
+           (Subtype_For_Array_Literal, Access_To_Subtype_For_Array_Literal);
+
+         function Allocate_Array_Literal
+           (Pool : Bump_Ptr_Pool) return Bare_Array_Literal;
+
+         function Allocate_Array_Literal
+           (Pool : Bump_Ptr_Pool) return Bare_Array_Literal
+         is
+            Result      : constant Access_To_Subtype_For_Array_Literal := Bare_Array_Literal_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Array_Literal;
+            return Bare_Array_Literal (Result);
+         end Allocate_Array_Literal;
+
+      package Bare_Bin_Op_Memos is new Langkit_Support.Packrat
+        (Bare_Bin_Op, Token_Index);
+
+         
+         subtype Subtype_For_Bin_Op is
+            Root_Node_Record (lkt_Bin_Op);
+         type Access_To_Subtype_For_Bin_Op is access all Subtype_For_Bin_Op;
+         package Bare_Bin_Op_Alloc is new Alloc
+           (Subtype_For_Bin_Op, Access_To_Subtype_For_Bin_Op);
+
+         function Allocate_Bin_Op
+           (Pool : Bump_Ptr_Pool) return Bare_Bin_Op;
+
+         function Allocate_Bin_Op
+           (Pool : Bump_Ptr_Pool) return Bare_Bin_Op
+         is
+            Result      : constant Access_To_Subtype_For_Bin_Op := Bare_Bin_Op_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Bin_Op;
+            return Bare_Bin_Op (Result);
+         end Allocate_Bin_Op;
+
+      package Bare_Block_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_Block_Expr, Token_Index);
+
+         
+         subtype Subtype_For_Block_Expr is
+            Root_Node_Record (lkt_Block_Expr);
+         type Access_To_Subtype_For_Block_Expr is access all Subtype_For_Block_Expr;
+         package Bare_Block_Expr_Alloc is new Alloc
+           (Subtype_For_Block_Expr, Access_To_Subtype_For_Block_Expr);
+
+         function Allocate_Block_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Block_Expr;
+
+         function Allocate_Block_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Block_Expr
+         is
+            Result      : constant Access_To_Subtype_For_Block_Expr := Bare_Block_Expr_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Block_Expr;
+            return Bare_Block_Expr (Result);
+         end Allocate_Block_Expr;
+
+      package Bare_Call_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_Call_Expr, Token_Index);
+
+         
+         subtype Subtype_For_Call_Expr is
+            Root_Node_Record (lkt_Call_Expr);
+         type Access_To_Subtype_For_Call_Expr is access all Subtype_For_Call_Expr;
+         package Bare_Call_Expr_Alloc is new Alloc
+           (Subtype_For_Call_Expr, Access_To_Subtype_For_Call_Expr);
+
+         function Allocate_Call_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Call_Expr;
+
+         function Allocate_Call_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Call_Expr
+         is
+            Result      : constant Access_To_Subtype_For_Call_Expr := Bare_Call_Expr_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Call_Expr;
+            return Bare_Call_Expr (Result);
+         end Allocate_Call_Expr;
+
+      package Bare_Null_Cond_Call_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_Null_Cond_Call_Expr, Token_Index);
+
+         
+         subtype Subtype_For_Null_Cond_Call_Expr is
+            Root_Node_Record (lkt_Null_Cond_Call_Expr);
+         type Access_To_Subtype_For_Null_Cond_Call_Expr is access all Subtype_For_Null_Cond_Call_Expr;
+         package Bare_Null_Cond_Call_Expr_Alloc is new Alloc
+           (Subtype_For_Null_Cond_Call_Expr, Access_To_Subtype_For_Null_Cond_Call_Expr);
+
+         function Allocate_Null_Cond_Call_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Null_Cond_Call_Expr;
+
+         function Allocate_Null_Cond_Call_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Null_Cond_Call_Expr
+         is
+            Result      : constant Access_To_Subtype_For_Null_Cond_Call_Expr := Bare_Null_Cond_Call_Expr_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Null_Cond_Call_Expr;
+            return Bare_Null_Cond_Call_Expr (Result);
+         end Allocate_Null_Cond_Call_Expr;
+
+      package Bare_Cast_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_Cast_Expr, Token_Index);
+
+         
+         subtype Subtype_For_Cast_Expr is
+            Root_Node_Record (lkt_Cast_Expr);
+         type Access_To_Subtype_For_Cast_Expr is access all Subtype_For_Cast_Expr;
+         package Bare_Cast_Expr_Alloc is new Alloc
+           (Subtype_For_Cast_Expr, Access_To_Subtype_For_Cast_Expr);
+
+         function Allocate_Cast_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Cast_Expr;
+
+         function Allocate_Cast_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Cast_Expr
+         is
+            Result      : constant Access_To_Subtype_For_Cast_Expr := Bare_Cast_Expr_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Cast_Expr;
+            return Bare_Cast_Expr (Result);
+         end Allocate_Cast_Expr;
+
+      package Bare_Dot_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_Dot_Expr, Token_Index);
+
+         
+         subtype Subtype_For_Dot_Expr is
+            Root_Node_Record (lkt_Dot_Expr);
+         type Access_To_Subtype_For_Dot_Expr is access all Subtype_For_Dot_Expr;
+         package Bare_Dot_Expr_Alloc is new Alloc
+           (Subtype_For_Dot_Expr, Access_To_Subtype_For_Dot_Expr);
+
+         function Allocate_Dot_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Dot_Expr;
+
+         function Allocate_Dot_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Dot_Expr
+         is
+            Result      : constant Access_To_Subtype_For_Dot_Expr := Bare_Dot_Expr_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Dot_Expr;
+            return Bare_Dot_Expr (Result);
+         end Allocate_Dot_Expr;
+
+      package Bare_Null_Cond_Dotted_Name_Memos is new Langkit_Support.Packrat
+        (Bare_Null_Cond_Dotted_Name, Token_Index);
+
+         
+         subtype Subtype_For_Null_Cond_Dotted_Name is
+            Root_Node_Record (lkt_Null_Cond_Dotted_Name);
+         type Access_To_Subtype_For_Null_Cond_Dotted_Name is access all Subtype_For_Null_Cond_Dotted_Name;
+         package Bare_Null_Cond_Dotted_Name_Alloc is new Alloc
+           (Subtype_For_Null_Cond_Dotted_Name, Access_To_Subtype_For_Null_Cond_Dotted_Name);
+
+         function Allocate_Null_Cond_Dotted_Name
+           (Pool : Bump_Ptr_Pool) return Bare_Null_Cond_Dotted_Name;
+
+         function Allocate_Null_Cond_Dotted_Name
+           (Pool : Bump_Ptr_Pool) return Bare_Null_Cond_Dotted_Name
+         is
+            Result      : constant Access_To_Subtype_For_Null_Cond_Dotted_Name := Bare_Null_Cond_Dotted_Name_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Null_Cond_Dotted_Name;
+            return Bare_Null_Cond_Dotted_Name (Result);
+         end Allocate_Null_Cond_Dotted_Name;
+
+      package Bare_Error_On_Null_Memos is new Langkit_Support.Packrat
+        (Bare_Error_On_Null, Token_Index);
+
+         
+         subtype Subtype_For_Error_On_Null is
+            Root_Node_Record (lkt_Error_On_Null);
+         type Access_To_Subtype_For_Error_On_Null is access all Subtype_For_Error_On_Null;
+         package Bare_Error_On_Null_Alloc is new Alloc
+           (Subtype_For_Error_On_Null, Access_To_Subtype_For_Error_On_Null);
+
+         function Allocate_Error_On_Null
+           (Pool : Bump_Ptr_Pool) return Bare_Error_On_Null;
+
+         function Allocate_Error_On_Null
+           (Pool : Bump_Ptr_Pool) return Bare_Error_On_Null
+         is
+            Result      : constant Access_To_Subtype_For_Error_On_Null := Bare_Error_On_Null_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Error_On_Null;
+            return Bare_Error_On_Null (Result);
+         end Allocate_Error_On_Null;
+
+      package Bare_Generic_Instantiation_Memos is new Langkit_Support.Packrat
+        (Bare_Generic_Instantiation, Token_Index);
+
+         
+         subtype Subtype_For_Generic_Instantiation is
+            Root_Node_Record (lkt_Generic_Instantiation);
+         type Access_To_Subtype_For_Generic_Instantiation is access all Subtype_For_Generic_Instantiation;
+         package Bare_Generic_Instantiation_Alloc is new Alloc
+           (Subtype_For_Generic_Instantiation, Access_To_Subtype_For_Generic_Instantiation);
+
+         function Allocate_Generic_Instantiation
+           (Pool : Bump_Ptr_Pool) return Bare_Generic_Instantiation;
+
+         function Allocate_Generic_Instantiation
+           (Pool : Bump_Ptr_Pool) return Bare_Generic_Instantiation
+         is
+            Result      : constant Access_To_Subtype_For_Generic_Instantiation := Bare_Generic_Instantiation_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Generic_Instantiation;
+            return Bare_Generic_Instantiation (Result);
+         end Allocate_Generic_Instantiation;
+
+      package Bare_Grammar_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Expr, Token_Index);
+
+      package Bare_Grammar_Cut_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Cut, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_Cut is
+            Root_Node_Record (lkt_Grammar_Cut);
+         type Access_To_Subtype_For_Grammar_Cut is access all Subtype_For_Grammar_Cut;
+         package Bare_Grammar_Cut_Alloc is new Alloc
+           (Subtype_For_Grammar_Cut, Access_To_Subtype_For_Grammar_Cut);
+
+         function Allocate_Grammar_Cut
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Cut;
+
+         function Allocate_Grammar_Cut
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Cut
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_Cut := Bare_Grammar_Cut_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_Cut;
+            return Bare_Grammar_Cut (Result);
+         end Allocate_Grammar_Cut;
+
+      package Bare_Grammar_Discard_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Discard, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_Discard is
+            Root_Node_Record (lkt_Grammar_Discard);
+         type Access_To_Subtype_For_Grammar_Discard is access all Subtype_For_Grammar_Discard;
+         package Bare_Grammar_Discard_Alloc is new Alloc
+           (Subtype_For_Grammar_Discard, Access_To_Subtype_For_Grammar_Discard);
+
+         function Allocate_Grammar_Discard
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Discard;
+
+         function Allocate_Grammar_Discard
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Discard
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_Discard := Bare_Grammar_Discard_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_Discard;
+            return Bare_Grammar_Discard (Result);
+         end Allocate_Grammar_Discard;
+
+      package Bare_Grammar_Dont_Skip_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Dont_Skip, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_Dont_Skip is
+            Root_Node_Record (lkt_Grammar_Dont_Skip);
+         type Access_To_Subtype_For_Grammar_Dont_Skip is access all Subtype_For_Grammar_Dont_Skip;
+         package Bare_Grammar_Dont_Skip_Alloc is new Alloc
+           (Subtype_For_Grammar_Dont_Skip, Access_To_Subtype_For_Grammar_Dont_Skip);
+
+         function Allocate_Grammar_Dont_Skip
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Dont_Skip;
+
+         function Allocate_Grammar_Dont_Skip
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Dont_Skip
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_Dont_Skip := Bare_Grammar_Dont_Skip_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_Dont_Skip;
+            return Bare_Grammar_Dont_Skip (Result);
+         end Allocate_Grammar_Dont_Skip;
+
+      package Bare_Grammar_List_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_List, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_List is
+            Root_Node_Record (lkt_Grammar_List);
+         type Access_To_Subtype_For_Grammar_List is access all Subtype_For_Grammar_List;
+         package Bare_Grammar_List_Alloc is new Alloc
+           (Subtype_For_Grammar_List, Access_To_Subtype_For_Grammar_List);
+
+         function Allocate_Grammar_List
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_List;
+
+         function Allocate_Grammar_List
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_List
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_List := Bare_Grammar_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_List;
+            return Bare_Grammar_List (Result);
+         end Allocate_Grammar_List;
+
+      package Bare_Grammar_Null_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Null, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_Null is
+            Root_Node_Record (lkt_Grammar_Null);
+         type Access_To_Subtype_For_Grammar_Null is access all Subtype_For_Grammar_Null;
+         package Bare_Grammar_Null_Alloc is new Alloc
+           (Subtype_For_Grammar_Null, Access_To_Subtype_For_Grammar_Null);
+
+         function Allocate_Grammar_Null
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Null;
+
+         function Allocate_Grammar_Null
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Null
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_Null := Bare_Grammar_Null_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_Null;
+            return Bare_Grammar_Null (Result);
+         end Allocate_Grammar_Null;
+
+      package Bare_Grammar_Opt_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Opt, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_Opt is
+            Root_Node_Record (lkt_Grammar_Opt);
+         type Access_To_Subtype_For_Grammar_Opt is access all Subtype_For_Grammar_Opt;
+         package Bare_Grammar_Opt_Alloc is new Alloc
+           (Subtype_For_Grammar_Opt, Access_To_Subtype_For_Grammar_Opt);
+
+         function Allocate_Grammar_Opt
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Opt;
+
+         function Allocate_Grammar_Opt
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Opt
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_Opt := Bare_Grammar_Opt_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_Opt;
+            return Bare_Grammar_Opt (Result);
+         end Allocate_Grammar_Opt;
+
+      package Bare_Grammar_Opt_Group_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Opt_Group, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_Opt_Group is
+            Root_Node_Record (lkt_Grammar_Opt_Group);
+         type Access_To_Subtype_For_Grammar_Opt_Group is access all Subtype_For_Grammar_Opt_Group;
+         package Bare_Grammar_Opt_Group_Alloc is new Alloc
+           (Subtype_For_Grammar_Opt_Group, Access_To_Subtype_For_Grammar_Opt_Group);
+
+         function Allocate_Grammar_Opt_Group
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Opt_Group;
+
+         function Allocate_Grammar_Opt_Group
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Opt_Group
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_Opt_Group := Bare_Grammar_Opt_Group_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_Opt_Group;
+            return Bare_Grammar_Opt_Group (Result);
+         end Allocate_Grammar_Opt_Group;
+
+      package Bare_Grammar_Or_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Or_Expr, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_Or_Expr is
+            Root_Node_Record (lkt_Grammar_Or_Expr);
+         type Access_To_Subtype_For_Grammar_Or_Expr is access all Subtype_For_Grammar_Or_Expr;
+         package Bare_Grammar_Or_Expr_Alloc is new Alloc
+           (Subtype_For_Grammar_Or_Expr, Access_To_Subtype_For_Grammar_Or_Expr);
+
+         function Allocate_Grammar_Or_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Or_Expr;
+
+         function Allocate_Grammar_Or_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Or_Expr
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_Or_Expr := Bare_Grammar_Or_Expr_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_Or_Expr;
+            return Bare_Grammar_Or_Expr (Result);
+         end Allocate_Grammar_Or_Expr;
+
+      package Bare_Grammar_Pick_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Pick, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_Pick is
+            Root_Node_Record (lkt_Grammar_Pick);
+         type Access_To_Subtype_For_Grammar_Pick is access all Subtype_For_Grammar_Pick;
+         package Bare_Grammar_Pick_Alloc is new Alloc
+           (Subtype_For_Grammar_Pick, Access_To_Subtype_For_Grammar_Pick);
+
+         function Allocate_Grammar_Pick
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Pick;
+
+         function Allocate_Grammar_Pick
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Pick
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_Pick := Bare_Grammar_Pick_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_Pick;
+            return Bare_Grammar_Pick (Result);
+         end Allocate_Grammar_Pick;
+
+      package Bare_Grammar_Implicit_Pick_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Implicit_Pick, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_Implicit_Pick is
+            Root_Node_Record (lkt_Grammar_Implicit_Pick);
+         type Access_To_Subtype_For_Grammar_Implicit_Pick is access all Subtype_For_Grammar_Implicit_Pick;
+         package Bare_Grammar_Implicit_Pick_Alloc is new Alloc
+           (Subtype_For_Grammar_Implicit_Pick, Access_To_Subtype_For_Grammar_Implicit_Pick);
+
+         function Allocate_Grammar_Implicit_Pick
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Implicit_Pick;
+
+         function Allocate_Grammar_Implicit_Pick
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Implicit_Pick
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_Implicit_Pick := Bare_Grammar_Implicit_Pick_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_Implicit_Pick;
+            return Bare_Grammar_Implicit_Pick (Result);
+         end Allocate_Grammar_Implicit_Pick;
+
+      package Bare_Grammar_Predicate_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Predicate, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_Predicate is
+            Root_Node_Record (lkt_Grammar_Predicate);
+         type Access_To_Subtype_For_Grammar_Predicate is access all Subtype_For_Grammar_Predicate;
+         package Bare_Grammar_Predicate_Alloc is new Alloc
+           (Subtype_For_Grammar_Predicate, Access_To_Subtype_For_Grammar_Predicate);
+
+         function Allocate_Grammar_Predicate
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Predicate;
+
+         function Allocate_Grammar_Predicate
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Predicate
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_Predicate := Bare_Grammar_Predicate_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_Predicate;
+            return Bare_Grammar_Predicate (Result);
+         end Allocate_Grammar_Predicate;
+
+      package Bare_Grammar_Rule_Ref_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Rule_Ref, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_Rule_Ref is
+            Root_Node_Record (lkt_Grammar_Rule_Ref);
+         type Access_To_Subtype_For_Grammar_Rule_Ref is access all Subtype_For_Grammar_Rule_Ref;
+         package Bare_Grammar_Rule_Ref_Alloc is new Alloc
+           (Subtype_For_Grammar_Rule_Ref, Access_To_Subtype_For_Grammar_Rule_Ref);
+
+         function Allocate_Grammar_Rule_Ref
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Rule_Ref;
+
+         function Allocate_Grammar_Rule_Ref
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Rule_Ref
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_Rule_Ref := Bare_Grammar_Rule_Ref_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_Rule_Ref;
+            return Bare_Grammar_Rule_Ref (Result);
+         end Allocate_Grammar_Rule_Ref;
+
+      package Bare_Grammar_Skip_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Skip, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_Skip is
+            Root_Node_Record (lkt_Grammar_Skip);
+         type Access_To_Subtype_For_Grammar_Skip is access all Subtype_For_Grammar_Skip;
+         package Bare_Grammar_Skip_Alloc is new Alloc
+           (Subtype_For_Grammar_Skip, Access_To_Subtype_For_Grammar_Skip);
+
+         function Allocate_Grammar_Skip
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Skip;
+
+         function Allocate_Grammar_Skip
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Skip
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_Skip := Bare_Grammar_Skip_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_Skip;
+            return Bare_Grammar_Skip (Result);
+         end Allocate_Grammar_Skip;
+
+      package Bare_Parse_Node_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_Parse_Node_Expr, Token_Index);
+
+         
+         subtype Subtype_For_Parse_Node_Expr is
+            Root_Node_Record (lkt_Parse_Node_Expr);
+         type Access_To_Subtype_For_Parse_Node_Expr is access all Subtype_For_Parse_Node_Expr;
+         package Bare_Parse_Node_Expr_Alloc is new Alloc
+           (Subtype_For_Parse_Node_Expr, Access_To_Subtype_For_Parse_Node_Expr);
+
+         function Allocate_Parse_Node_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Parse_Node_Expr;
+
+         function Allocate_Parse_Node_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Parse_Node_Expr
+         is
+            Result      : constant Access_To_Subtype_For_Parse_Node_Expr := Bare_Parse_Node_Expr_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Parse_Node_Expr;
+            return Bare_Parse_Node_Expr (Result);
+         end Allocate_Parse_Node_Expr;
+
+      package Bare_Token_Lit_Memos is new Langkit_Support.Packrat
+        (Bare_Token_Lit, Token_Index);
+
+         
+         subtype Subtype_For_Token_Lit is
+            Root_Node_Record (lkt_Token_Lit);
+         type Access_To_Subtype_For_Token_Lit is access all Subtype_For_Token_Lit;
+         package Bare_Token_Lit_Alloc is new Alloc
+           (Subtype_For_Token_Lit, Access_To_Subtype_For_Token_Lit);
+
+         function Allocate_Token_Lit
+           (Pool : Bump_Ptr_Pool) return Bare_Token_Lit;
+
+         function Allocate_Token_Lit
+           (Pool : Bump_Ptr_Pool) return Bare_Token_Lit
+         is
+            Result      : constant Access_To_Subtype_For_Token_Lit := Bare_Token_Lit_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Token_Lit;
+            return Bare_Token_Lit (Result);
+         end Allocate_Token_Lit;
+
+      package Bare_Token_No_Case_Lit_Memos is new Langkit_Support.Packrat
+        (Bare_Token_No_Case_Lit, Token_Index);
+
+         
+         subtype Subtype_For_Token_No_Case_Lit is
+            Root_Node_Record (lkt_Token_No_Case_Lit);
+         type Access_To_Subtype_For_Token_No_Case_Lit is access all Subtype_For_Token_No_Case_Lit;
+         package Bare_Token_No_Case_Lit_Alloc is new Alloc
+           (Subtype_For_Token_No_Case_Lit, Access_To_Subtype_For_Token_No_Case_Lit);
+
+         function Allocate_Token_No_Case_Lit
+           (Pool : Bump_Ptr_Pool) return Bare_Token_No_Case_Lit;
+
+         function Allocate_Token_No_Case_Lit
+           (Pool : Bump_Ptr_Pool) return Bare_Token_No_Case_Lit
+         is
+            Result      : constant Access_To_Subtype_For_Token_No_Case_Lit := Bare_Token_No_Case_Lit_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Token_No_Case_Lit;
+            return Bare_Token_No_Case_Lit (Result);
+         end Allocate_Token_No_Case_Lit;
+
+      package Bare_Token_Pattern_Lit_Memos is new Langkit_Support.Packrat
+        (Bare_Token_Pattern_Lit, Token_Index);
+
+         
+         subtype Subtype_For_Token_Pattern_Lit is
+            Root_Node_Record (lkt_Token_Pattern_Lit);
+         type Access_To_Subtype_For_Token_Pattern_Lit is access all Subtype_For_Token_Pattern_Lit;
+         package Bare_Token_Pattern_Lit_Alloc is new Alloc
+           (Subtype_For_Token_Pattern_Lit, Access_To_Subtype_For_Token_Pattern_Lit);
+
+         function Allocate_Token_Pattern_Lit
+           (Pool : Bump_Ptr_Pool) return Bare_Token_Pattern_Lit;
+
+         function Allocate_Token_Pattern_Lit
+           (Pool : Bump_Ptr_Pool) return Bare_Token_Pattern_Lit
+         is
+            Result      : constant Access_To_Subtype_For_Token_Pattern_Lit := Bare_Token_Pattern_Lit_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Token_Pattern_Lit;
+            return Bare_Token_Pattern_Lit (Result);
+         end Allocate_Token_Pattern_Lit;
+
+      package Bare_Token_Ref_Memos is new Langkit_Support.Packrat
+        (Bare_Token_Ref, Token_Index);
+
+         
+         subtype Subtype_For_Token_Ref is
+            Root_Node_Record (lkt_Token_Ref);
+         type Access_To_Subtype_For_Token_Ref is access all Subtype_For_Token_Ref;
+         package Bare_Token_Ref_Alloc is new Alloc
+           (Subtype_For_Token_Ref, Access_To_Subtype_For_Token_Ref);
+
+         function Allocate_Token_Ref
+           (Pool : Bump_Ptr_Pool) return Bare_Token_Ref;
+
+         function Allocate_Token_Ref
+           (Pool : Bump_Ptr_Pool) return Bare_Token_Ref
+         is
+            Result      : constant Access_To_Subtype_For_Token_Ref := Bare_Token_Ref_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Token_Ref;
+            return Bare_Token_Ref (Result);
+         end Allocate_Token_Ref;
+
+      package Bare_Id_Memos is new Langkit_Support.Packrat
+        (Bare_Id, Token_Index);
+
+         
+         subtype Subtype_For_Id is
+            Root_Node_Record (lkt_Id);
+         type Access_To_Subtype_For_Id is access all Subtype_For_Id;
+         package Bare_Id_Alloc is new Alloc
+           (Subtype_For_Id, Access_To_Subtype_For_Id);
+
+         function Allocate_Id
+           (Pool : Bump_Ptr_Pool) return Bare_Id;
+
+         function Allocate_Id
+           (Pool : Bump_Ptr_Pool) return Bare_Id
+         is
+            Result      : constant Access_To_Subtype_For_Id := Bare_Id_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Id;
+            return Bare_Id (Result);
+         end Allocate_Id;
+
+      package Bare_Def_Id_Memos is new Langkit_Support.Packrat
+        (Bare_Def_Id, Token_Index);
+
+         
+         subtype Subtype_For_Def_Id is
+            Root_Node_Record (lkt_Def_Id);
+         type Access_To_Subtype_For_Def_Id is access all Subtype_For_Def_Id;
+         package Bare_Def_Id_Alloc is new Alloc
+           (Subtype_For_Def_Id, Access_To_Subtype_For_Def_Id);
+
+         function Allocate_Def_Id
+           (Pool : Bump_Ptr_Pool) return Bare_Def_Id;
+
+         function Allocate_Def_Id
+           (Pool : Bump_Ptr_Pool) return Bare_Def_Id
+         is
+            Result      : constant Access_To_Subtype_For_Def_Id := Bare_Def_Id_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Def_Id;
+            return Bare_Def_Id (Result);
+         end Allocate_Def_Id;
+
+      package Bare_Ref_Id_Memos is new Langkit_Support.Packrat
+        (Bare_Ref_Id, Token_Index);
+
+         
+         subtype Subtype_For_Ref_Id is
+            Root_Node_Record (lkt_Ref_Id);
+         type Access_To_Subtype_For_Ref_Id is access all Subtype_For_Ref_Id;
+         package Bare_Ref_Id_Alloc is new Alloc
+           (Subtype_For_Ref_Id, Access_To_Subtype_For_Ref_Id);
+
+         function Allocate_Ref_Id
+           (Pool : Bump_Ptr_Pool) return Bare_Ref_Id;
+
+         function Allocate_Ref_Id
+           (Pool : Bump_Ptr_Pool) return Bare_Ref_Id
+         is
+            Result      : constant Access_To_Subtype_For_Ref_Id := Bare_Ref_Id_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Ref_Id;
+            return Bare_Ref_Id (Result);
+         end Allocate_Ref_Id;
+
+      package Bare_Module_Ref_Id_Memos is new Langkit_Support.Packrat
+        (Bare_Module_Ref_Id, Token_Index);
+
+         
+         subtype Subtype_For_Module_Ref_Id is
+            Root_Node_Record (lkt_Module_Ref_Id);
+         type Access_To_Subtype_For_Module_Ref_Id is access all Subtype_For_Module_Ref_Id;
+         package Bare_Module_Ref_Id_Alloc is new Alloc
+           (Subtype_For_Module_Ref_Id, Access_To_Subtype_For_Module_Ref_Id);
+
+         function Allocate_Module_Ref_Id
+           (Pool : Bump_Ptr_Pool) return Bare_Module_Ref_Id;
+
+         function Allocate_Module_Ref_Id
+           (Pool : Bump_Ptr_Pool) return Bare_Module_Ref_Id
+         is
+            Result      : constant Access_To_Subtype_For_Module_Ref_Id := Bare_Module_Ref_Id_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Module_Ref_Id;
+            return Bare_Module_Ref_Id (Result);
+         end Allocate_Module_Ref_Id;
+
+      package Bare_If_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_If_Expr, Token_Index);
+
+         
+         subtype Subtype_For_If_Expr is
+            Root_Node_Record (lkt_If_Expr);
+         type Access_To_Subtype_For_If_Expr is access all Subtype_For_If_Expr;
+         package Bare_If_Expr_Alloc is new Alloc
+           (Subtype_For_If_Expr, Access_To_Subtype_For_If_Expr);
+
+         function Allocate_If_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_If_Expr;
+
+         function Allocate_If_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_If_Expr
+         is
+            Result      : constant Access_To_Subtype_For_If_Expr := Bare_If_Expr_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_If_Expr;
+            return Bare_If_Expr (Result);
+         end Allocate_If_Expr;
+
+      package Bare_Isa_Memos is new Langkit_Support.Packrat
+        (Bare_Isa, Token_Index);
+
+         
+         subtype Subtype_For_Isa is
+            Root_Node_Record (lkt_Isa);
+         type Access_To_Subtype_For_Isa is access all Subtype_For_Isa;
+         package Bare_Isa_Alloc is new Alloc
+           (Subtype_For_Isa, Access_To_Subtype_For_Isa);
+
+         function Allocate_Isa
+           (Pool : Bump_Ptr_Pool) return Bare_Isa;
+
+         function Allocate_Isa
+           (Pool : Bump_Ptr_Pool) return Bare_Isa
+         is
+            Result      : constant Access_To_Subtype_For_Isa := Bare_Isa_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Isa;
+            return Bare_Isa (Result);
+         end Allocate_Isa;
+
+      package Bare_Lambda_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_Lambda_Expr, Token_Index);
+
+         
+         subtype Subtype_For_Lambda_Expr is
+            Root_Node_Record (lkt_Lambda_Expr);
+         type Access_To_Subtype_For_Lambda_Expr is access all Subtype_For_Lambda_Expr;
+         package Bare_Lambda_Expr_Alloc is new Alloc
+           (Subtype_For_Lambda_Expr, Access_To_Subtype_For_Lambda_Expr);
+
+         function Allocate_Lambda_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Lambda_Expr;
+
+         function Allocate_Lambda_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Lambda_Expr
+         is
+            Result      : constant Access_To_Subtype_For_Lambda_Expr := Bare_Lambda_Expr_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Lambda_Expr;
+            return Bare_Lambda_Expr (Result);
+         end Allocate_Lambda_Expr;
+
+      package Bare_Lit_Memos is new Langkit_Support.Packrat
+        (Bare_Lit, Token_Index);
+
+      package Bare_Char_Lit_Memos is new Langkit_Support.Packrat
+        (Bare_Char_Lit, Token_Index);
+
+         
+         subtype Subtype_For_Char_Lit is
+            Root_Node_Record (lkt_Char_Lit);
+         type Access_To_Subtype_For_Char_Lit is access all Subtype_For_Char_Lit;
+         package Bare_Char_Lit_Alloc is new Alloc
+           (Subtype_For_Char_Lit, Access_To_Subtype_For_Char_Lit);
+
+         function Allocate_Char_Lit
+           (Pool : Bump_Ptr_Pool) return Bare_Char_Lit;
+
+         function Allocate_Char_Lit
+           (Pool : Bump_Ptr_Pool) return Bare_Char_Lit
+         is
+            Result      : constant Access_To_Subtype_For_Char_Lit := Bare_Char_Lit_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Char_Lit;
+            return Bare_Char_Lit (Result);
+         end Allocate_Char_Lit;
+
+      package Bare_Null_Lit_Memos is new Langkit_Support.Packrat
+        (Bare_Null_Lit, Token_Index);
+
+         
+         subtype Subtype_For_Null_Lit is
+            Root_Node_Record (lkt_Null_Lit);
+         type Access_To_Subtype_For_Null_Lit is access all Subtype_For_Null_Lit;
+         package Bare_Null_Lit_Alloc is new Alloc
+           (Subtype_For_Null_Lit, Access_To_Subtype_For_Null_Lit);
+
+         function Allocate_Null_Lit
+           (Pool : Bump_Ptr_Pool) return Bare_Null_Lit;
+
+         function Allocate_Null_Lit
+           (Pool : Bump_Ptr_Pool) return Bare_Null_Lit
+         is
+            Result      : constant Access_To_Subtype_For_Null_Lit := Bare_Null_Lit_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Null_Lit;
+            return Bare_Null_Lit (Result);
+         end Allocate_Null_Lit;
+
+      package Bare_Num_Lit_Memos is new Langkit_Support.Packrat
+        (Bare_Num_Lit, Token_Index);
+
+         
+         subtype Subtype_For_Num_Lit is
+            Root_Node_Record (lkt_Num_Lit);
+         type Access_To_Subtype_For_Num_Lit is access all Subtype_For_Num_Lit;
+         package Bare_Num_Lit_Alloc is new Alloc
+           (Subtype_For_Num_Lit, Access_To_Subtype_For_Num_Lit);
+
+         function Allocate_Num_Lit
+           (Pool : Bump_Ptr_Pool) return Bare_Num_Lit;
+
+         function Allocate_Num_Lit
+           (Pool : Bump_Ptr_Pool) return Bare_Num_Lit
+         is
+            Result      : constant Access_To_Subtype_For_Num_Lit := Bare_Num_Lit_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Num_Lit;
+            return Bare_Num_Lit (Result);
+         end Allocate_Num_Lit;
+
+      package Bare_String_Lit_Memos is new Langkit_Support.Packrat
+        (Bare_String_Lit, Token_Index);
+
+         
+         subtype Subtype_For_String_Lit is
+            Root_Node_Record (lkt_String_Lit);
+         type Access_To_Subtype_For_String_Lit is access all Subtype_For_String_Lit;
+         package Bare_String_Lit_Alloc is new Alloc
+           (Subtype_For_String_Lit, Access_To_Subtype_For_String_Lit);
+
+         function Allocate_String_Lit
+           (Pool : Bump_Ptr_Pool) return Bare_String_Lit;
+
+         function Allocate_String_Lit
+           (Pool : Bump_Ptr_Pool) return Bare_String_Lit
+         is
+            Result      : constant Access_To_Subtype_For_String_Lit := Bare_String_Lit_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_String_Lit;
+            return Bare_String_Lit (Result);
+         end Allocate_String_Lit;
+
+      package Bare_Logic_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_Logic_Expr, Token_Index);
+
+         
+         subtype Subtype_For_Logic_Expr is
+            Root_Node_Record (lkt_Logic_Expr);
+         type Access_To_Subtype_For_Logic_Expr is access all Subtype_For_Logic_Expr;
+         package Bare_Logic_Expr_Alloc is new Alloc
+           (Subtype_For_Logic_Expr, Access_To_Subtype_For_Logic_Expr);
+
+         function Allocate_Logic_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Logic_Expr;
+
+         function Allocate_Logic_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Logic_Expr
+         is
+            Result      : constant Access_To_Subtype_For_Logic_Expr := Bare_Logic_Expr_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Logic_Expr;
+            return Bare_Logic_Expr (Result);
+         end Allocate_Logic_Expr;
+
+      package Bare_Match_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_Match_Expr, Token_Index);
+
+         
+         subtype Subtype_For_Match_Expr is
+            Root_Node_Record (lkt_Match_Expr);
+         type Access_To_Subtype_For_Match_Expr is access all Subtype_For_Match_Expr;
+         package Bare_Match_Expr_Alloc is new Alloc
+           (Subtype_For_Match_Expr, Access_To_Subtype_For_Match_Expr);
+
+         function Allocate_Match_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Match_Expr;
+
+         function Allocate_Match_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Match_Expr
+         is
+            Result      : constant Access_To_Subtype_For_Match_Expr := Bare_Match_Expr_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Match_Expr;
+            return Bare_Match_Expr (Result);
+         end Allocate_Match_Expr;
+
+      package Bare_Not_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_Not_Expr, Token_Index);
+
+         
+         subtype Subtype_For_Not_Expr is
+            Root_Node_Record (lkt_Not_Expr);
+         type Access_To_Subtype_For_Not_Expr is access all Subtype_For_Not_Expr;
+         package Bare_Not_Expr_Alloc is new Alloc
+           (Subtype_For_Not_Expr, Access_To_Subtype_For_Not_Expr);
+
+         function Allocate_Not_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Not_Expr;
+
+         function Allocate_Not_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Not_Expr
+         is
+            Result      : constant Access_To_Subtype_For_Not_Expr := Bare_Not_Expr_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Not_Expr;
+            return Bare_Not_Expr (Result);
+         end Allocate_Not_Expr;
+
+      package Bare_Paren_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_Paren_Expr, Token_Index);
+
+         
+         subtype Subtype_For_Paren_Expr is
+            Root_Node_Record (lkt_Paren_Expr);
+         type Access_To_Subtype_For_Paren_Expr is access all Subtype_For_Paren_Expr;
+         package Bare_Paren_Expr_Alloc is new Alloc
+           (Subtype_For_Paren_Expr, Access_To_Subtype_For_Paren_Expr);
+
+         function Allocate_Paren_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Paren_Expr;
+
+         function Allocate_Paren_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Paren_Expr
+         is
+            Result      : constant Access_To_Subtype_For_Paren_Expr := Bare_Paren_Expr_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Paren_Expr;
+            return Bare_Paren_Expr (Result);
+         end Allocate_Paren_Expr;
+
+      package Bare_Raise_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_Raise_Expr, Token_Index);
+
+         
+         subtype Subtype_For_Raise_Expr is
+            Root_Node_Record (lkt_Raise_Expr);
+         type Access_To_Subtype_For_Raise_Expr is access all Subtype_For_Raise_Expr;
+         package Bare_Raise_Expr_Alloc is new Alloc
+           (Subtype_For_Raise_Expr, Access_To_Subtype_For_Raise_Expr);
+
+         function Allocate_Raise_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Raise_Expr;
+
+         function Allocate_Raise_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Raise_Expr
+         is
+            Result      : constant Access_To_Subtype_For_Raise_Expr := Bare_Raise_Expr_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Raise_Expr;
+            return Bare_Raise_Expr (Result);
+         end Allocate_Raise_Expr;
+
+      package Bare_Try_Expr_Memos is new Langkit_Support.Packrat
+        (Bare_Try_Expr, Token_Index);
+
+         
+         subtype Subtype_For_Try_Expr is
+            Root_Node_Record (lkt_Try_Expr);
+         type Access_To_Subtype_For_Try_Expr is access all Subtype_For_Try_Expr;
+         package Bare_Try_Expr_Alloc is new Alloc
+           (Subtype_For_Try_Expr, Access_To_Subtype_For_Try_Expr);
+
+         function Allocate_Try_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Try_Expr;
+
+         function Allocate_Try_Expr
+           (Pool : Bump_Ptr_Pool) return Bare_Try_Expr
+         is
+            Result      : constant Access_To_Subtype_For_Try_Expr := Bare_Try_Expr_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Try_Expr;
+            return Bare_Try_Expr (Result);
+         end Allocate_Try_Expr;
+
+      package Bare_Full_Decl_Memos is new Langkit_Support.Packrat
+        (Bare_Full_Decl, Token_Index);
+
+         
+         subtype Subtype_For_Full_Decl is
+            Root_Node_Record (lkt_Full_Decl);
+         type Access_To_Subtype_For_Full_Decl is access all Subtype_For_Full_Decl;
+         package Bare_Full_Decl_Alloc is new Alloc
+           (Subtype_For_Full_Decl, Access_To_Subtype_For_Full_Decl);
+
+         function Allocate_Full_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Full_Decl;
+
+         function Allocate_Full_Decl
+           (Pool : Bump_Ptr_Pool) return Bare_Full_Decl
+         is
+            Result      : constant Access_To_Subtype_For_Full_Decl := Bare_Full_Decl_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Full_Decl;
+            return Bare_Full_Decl (Result);
+         end Allocate_Full_Decl;
+
+      package Bare_Import_Memos is new Langkit_Support.Packrat
+        (Bare_Import, Token_Index);
+
+         
+         subtype Subtype_For_Import is
+            Root_Node_Record (lkt_Import);
+         type Access_To_Subtype_For_Import is access all Subtype_For_Import;
+         package Bare_Import_Alloc is new Alloc
+           (Subtype_For_Import, Access_To_Subtype_For_Import);
+
+         function Allocate_Import
+           (Pool : Bump_Ptr_Pool) return Bare_Import;
+
+         function Allocate_Import
+           (Pool : Bump_Ptr_Pool) return Bare_Import
+         is
+            Result      : constant Access_To_Subtype_For_Import := Bare_Import_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Import;
+            return Bare_Import (Result);
+         end Allocate_Import;
+
+      package Bare_LK_Node_Base_List_Memos is new Langkit_Support.Packrat
+        (Bare_LK_Node_Base_List, Token_Index);
+
+      package Bare_Base_Lexer_Case_Rule_Alt_List_Memos is new Langkit_Support.Packrat
+        (Bare_Base_Lexer_Case_Rule_Alt_List, Token_Index);
+
+         
+         subtype Subtype_For_Base_Lexer_Case_Rule_Alt_List is
+            Root_Node_Record (lkt_Base_Lexer_Case_Rule_Alt_List);
+         type Access_To_Subtype_For_Base_Lexer_Case_Rule_Alt_List is access all Subtype_For_Base_Lexer_Case_Rule_Alt_List;
+         package Bare_Base_Lexer_Case_Rule_Alt_List_Alloc is new Alloc
+           (Subtype_For_Base_Lexer_Case_Rule_Alt_List, Access_To_Subtype_For_Base_Lexer_Case_Rule_Alt_List);
+
+         function Allocate_Base_Lexer_Case_Rule_Alt_List
+           (Pool : Bump_Ptr_Pool) return Bare_Base_Lexer_Case_Rule_Alt_List;
+
+         function Allocate_Base_Lexer_Case_Rule_Alt_List
+           (Pool : Bump_Ptr_Pool) return Bare_Base_Lexer_Case_Rule_Alt_List
+         is
+            Result      : constant Access_To_Subtype_For_Base_Lexer_Case_Rule_Alt_List := Bare_Base_Lexer_Case_Rule_Alt_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Base_Lexer_Case_Rule_Alt_List;
+            return Bare_Base_Lexer_Case_Rule_Alt_List (Result);
+         end Allocate_Base_Lexer_Case_Rule_Alt_List;
+
+      package Bare_Decl_Annotation_List_Memos is new Langkit_Support.Packrat
+        (Bare_Decl_Annotation_List, Token_Index);
+
+         
+         subtype Subtype_For_Decl_Annotation_List is
+            Root_Node_Record (lkt_Decl_Annotation_List);
+         type Access_To_Subtype_For_Decl_Annotation_List is access all Subtype_For_Decl_Annotation_List;
+         package Bare_Decl_Annotation_List_Alloc is new Alloc
+           (Subtype_For_Decl_Annotation_List, Access_To_Subtype_For_Decl_Annotation_List);
+
+         function Allocate_Decl_Annotation_List
+           (Pool : Bump_Ptr_Pool) return Bare_Decl_Annotation_List;
+
+         function Allocate_Decl_Annotation_List
+           (Pool : Bump_Ptr_Pool) return Bare_Decl_Annotation_List
+         is
+            Result      : constant Access_To_Subtype_For_Decl_Annotation_List := Bare_Decl_Annotation_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Decl_Annotation_List;
+            return Bare_Decl_Annotation_List (Result);
+         end Allocate_Decl_Annotation_List;
+
+      package Bare_Doc_Comment_List_Memos is new Langkit_Support.Packrat
+        (Bare_Doc_Comment_List, Token_Index);
+
+         
+         subtype Subtype_For_Doc_Comment_List is
+            Root_Node_Record (lkt_Doc_Comment_List);
+         type Access_To_Subtype_For_Doc_Comment_List is access all Subtype_For_Doc_Comment_List;
+         package Bare_Doc_Comment_List_Alloc is new Alloc
+           (Subtype_For_Doc_Comment_List, Access_To_Subtype_For_Doc_Comment_List);
+
+         function Allocate_Doc_Comment_List
+           (Pool : Bump_Ptr_Pool) return Bare_Doc_Comment_List;
+
+         function Allocate_Doc_Comment_List
+           (Pool : Bump_Ptr_Pool) return Bare_Doc_Comment_List
+         is
+            Result      : constant Access_To_Subtype_For_Doc_Comment_List := Bare_Doc_Comment_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Doc_Comment_List;
+            return Bare_Doc_Comment_List (Result);
+         end Allocate_Doc_Comment_List;
+
+      package Bare_Elsif_Branch_List_Memos is new Langkit_Support.Packrat
+        (Bare_Elsif_Branch_List, Token_Index);
+
+         
+         subtype Subtype_For_Elsif_Branch_List is
+            Root_Node_Record (lkt_Elsif_Branch_List);
+         type Access_To_Subtype_For_Elsif_Branch_List is access all Subtype_For_Elsif_Branch_List;
+         package Bare_Elsif_Branch_List_Alloc is new Alloc
+           (Subtype_For_Elsif_Branch_List, Access_To_Subtype_For_Elsif_Branch_List);
+
+         function Allocate_Elsif_Branch_List
+           (Pool : Bump_Ptr_Pool) return Bare_Elsif_Branch_List;
+
+         function Allocate_Elsif_Branch_List
+           (Pool : Bump_Ptr_Pool) return Bare_Elsif_Branch_List
+         is
+            Result      : constant Access_To_Subtype_For_Elsif_Branch_List := Bare_Elsif_Branch_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Elsif_Branch_List;
+            return Bare_Elsif_Branch_List (Result);
+         end Allocate_Elsif_Branch_List;
+
+      package Bare_Enum_Class_Alt_Decl_List_Memos is new Langkit_Support.Packrat
+        (Bare_Enum_Class_Alt_Decl_List, Token_Index);
+
+         
+         subtype Subtype_For_Enum_Class_Alt_Decl_List is
+            Root_Node_Record (lkt_Enum_Class_Alt_Decl_List);
+         type Access_To_Subtype_For_Enum_Class_Alt_Decl_List is access all Subtype_For_Enum_Class_Alt_Decl_List;
+         package Bare_Enum_Class_Alt_Decl_List_Alloc is new Alloc
+           (Subtype_For_Enum_Class_Alt_Decl_List, Access_To_Subtype_For_Enum_Class_Alt_Decl_List);
+
+         function Allocate_Enum_Class_Alt_Decl_List
+           (Pool : Bump_Ptr_Pool) return Bare_Enum_Class_Alt_Decl_List;
+
+         function Allocate_Enum_Class_Alt_Decl_List
+           (Pool : Bump_Ptr_Pool) return Bare_Enum_Class_Alt_Decl_List
+         is
+            Result      : constant Access_To_Subtype_For_Enum_Class_Alt_Decl_List := Bare_Enum_Class_Alt_Decl_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Enum_Class_Alt_Decl_List;
+            return Bare_Enum_Class_Alt_Decl_List (Result);
+         end Allocate_Enum_Class_Alt_Decl_List;
+
+      package Bare_Enum_Class_Case_List_Memos is new Langkit_Support.Packrat
+        (Bare_Enum_Class_Case_List, Token_Index);
+
+         
+         subtype Subtype_For_Enum_Class_Case_List is
+            Root_Node_Record (lkt_Enum_Class_Case_List);
+         type Access_To_Subtype_For_Enum_Class_Case_List is access all Subtype_For_Enum_Class_Case_List;
+         package Bare_Enum_Class_Case_List_Alloc is new Alloc
+           (Subtype_For_Enum_Class_Case_List, Access_To_Subtype_For_Enum_Class_Case_List);
+
+         function Allocate_Enum_Class_Case_List
+           (Pool : Bump_Ptr_Pool) return Bare_Enum_Class_Case_List;
+
+         function Allocate_Enum_Class_Case_List
+           (Pool : Bump_Ptr_Pool) return Bare_Enum_Class_Case_List
+         is
+            Result      : constant Access_To_Subtype_For_Enum_Class_Case_List := Bare_Enum_Class_Case_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Enum_Class_Case_List;
+            return Bare_Enum_Class_Case_List (Result);
+         end Allocate_Enum_Class_Case_List;
+
+      package Bare_Enum_Lit_Decl_List_Memos is new Langkit_Support.Packrat
+        (Bare_Enum_Lit_Decl_List, Token_Index);
+
+         
+         subtype Subtype_For_Enum_Lit_Decl_List is
+            Root_Node_Record (lkt_Enum_Lit_Decl_List);
+         type Access_To_Subtype_For_Enum_Lit_Decl_List is access all Subtype_For_Enum_Lit_Decl_List;
+         package Bare_Enum_Lit_Decl_List_Alloc is new Alloc
+           (Subtype_For_Enum_Lit_Decl_List, Access_To_Subtype_For_Enum_Lit_Decl_List);
+
+         function Allocate_Enum_Lit_Decl_List
+           (Pool : Bump_Ptr_Pool) return Bare_Enum_Lit_Decl_List;
+
+         function Allocate_Enum_Lit_Decl_List
+           (Pool : Bump_Ptr_Pool) return Bare_Enum_Lit_Decl_List
+         is
+            Result      : constant Access_To_Subtype_For_Enum_Lit_Decl_List := Bare_Enum_Lit_Decl_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Enum_Lit_Decl_List;
+            return Bare_Enum_Lit_Decl_List (Result);
+         end Allocate_Enum_Lit_Decl_List;
+
+      package Bare_Expr_List_Memos is new Langkit_Support.Packrat
+        (Bare_Expr_List, Token_Index);
+
+         
+         subtype Subtype_For_Expr_List is
+            Root_Node_Record (lkt_Expr_List);
+         type Access_To_Subtype_For_Expr_List is access all Subtype_For_Expr_List;
+         package Bare_Expr_List_Alloc is new Alloc
+           (Subtype_For_Expr_List, Access_To_Subtype_For_Expr_List);
+
+         function Allocate_Expr_List
+           (Pool : Bump_Ptr_Pool) return Bare_Expr_List;
+
+         function Allocate_Expr_List
+           (Pool : Bump_Ptr_Pool) return Bare_Expr_List
+         is
+            Result      : constant Access_To_Subtype_For_Expr_List := Bare_Expr_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Expr_List;
+            return Bare_Expr_List (Result);
+         end Allocate_Expr_List;
+
+      package Bare_Full_Decl_List_Memos is new Langkit_Support.Packrat
+        (Bare_Full_Decl_List, Token_Index);
+
+         
+         subtype Subtype_For_Full_Decl_List is
+            Root_Node_Record (lkt_Full_Decl_List);
+         type Access_To_Subtype_For_Full_Decl_List is access all Subtype_For_Full_Decl_List;
+         package Bare_Full_Decl_List_Alloc is new Alloc
+           (Subtype_For_Full_Decl_List, Access_To_Subtype_For_Full_Decl_List);
+
+         function Allocate_Full_Decl_List
+           (Pool : Bump_Ptr_Pool) return Bare_Full_Decl_List;
+
+         function Allocate_Full_Decl_List
+           (Pool : Bump_Ptr_Pool) return Bare_Full_Decl_List
+         is
+            Result      : constant Access_To_Subtype_For_Full_Decl_List := Bare_Full_Decl_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Full_Decl_List;
+            return Bare_Full_Decl_List (Result);
+         end Allocate_Full_Decl_List;
+
+      package Bare_Decl_Block_Memos is new Langkit_Support.Packrat
+        (Bare_Decl_Block, Token_Index);
+
+         
+         subtype Subtype_For_Decl_Block is
+            Root_Node_Record (lkt_Decl_Block);
+         type Access_To_Subtype_For_Decl_Block is access all Subtype_For_Decl_Block;
+         package Bare_Decl_Block_Alloc is new Alloc
+           (Subtype_For_Decl_Block, Access_To_Subtype_For_Decl_Block);
+
+         function Allocate_Decl_Block
+           (Pool : Bump_Ptr_Pool) return Bare_Decl_Block;
+
+         function Allocate_Decl_Block
+           (Pool : Bump_Ptr_Pool) return Bare_Decl_Block
+         is
+            Result      : constant Access_To_Subtype_For_Decl_Block := Bare_Decl_Block_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Decl_Block;
+            return Bare_Decl_Block (Result);
+         end Allocate_Decl_Block;
+
+      package Bare_Fun_Arg_Decl_List_Memos is new Langkit_Support.Packrat
+        (Bare_Fun_Arg_Decl_List, Token_Index);
+
+         
+         subtype Subtype_For_Fun_Arg_Decl_List is
+            Root_Node_Record (lkt_Fun_Arg_Decl_List);
+         type Access_To_Subtype_For_Fun_Arg_Decl_List is access all Subtype_For_Fun_Arg_Decl_List;
+         package Bare_Fun_Arg_Decl_List_Alloc is new Alloc
+           (Subtype_For_Fun_Arg_Decl_List, Access_To_Subtype_For_Fun_Arg_Decl_List);
+
+         function Allocate_Fun_Arg_Decl_List
+           (Pool : Bump_Ptr_Pool) return Bare_Fun_Arg_Decl_List;
+
+         function Allocate_Fun_Arg_Decl_List
+           (Pool : Bump_Ptr_Pool) return Bare_Fun_Arg_Decl_List
+         is
+            Result      : constant Access_To_Subtype_For_Fun_Arg_Decl_List := Bare_Fun_Arg_Decl_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Fun_Arg_Decl_List;
+            return Bare_Fun_Arg_Decl_List (Result);
+         end Allocate_Fun_Arg_Decl_List;
+
+      package Bare_Grammar_Expr_List_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Expr_List, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_Expr_List is
+            Root_Node_Record (lkt_Grammar_Expr_List);
+         type Access_To_Subtype_For_Grammar_Expr_List is access all Subtype_For_Grammar_Expr_List;
+         package Bare_Grammar_Expr_List_Alloc is new Alloc
+           (Subtype_For_Grammar_Expr_List, Access_To_Subtype_For_Grammar_Expr_List);
+
+         function Allocate_Grammar_Expr_List
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Expr_List;
+
+         function Allocate_Grammar_Expr_List
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Expr_List
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_Expr_List := Bare_Grammar_Expr_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_Expr_List;
+            return Bare_Grammar_Expr_List (Result);
+         end Allocate_Grammar_Expr_List;
+
+      package Bare_Grammar_Expr_List_List_Memos is new Langkit_Support.Packrat
+        (Bare_Grammar_Expr_List_List, Token_Index);
+
+         
+         subtype Subtype_For_Grammar_Expr_List_List is
+            Root_Node_Record (lkt_Grammar_Expr_List_List);
+         type Access_To_Subtype_For_Grammar_Expr_List_List is access all Subtype_For_Grammar_Expr_List_List;
+         package Bare_Grammar_Expr_List_List_Alloc is new Alloc
+           (Subtype_For_Grammar_Expr_List_List, Access_To_Subtype_For_Grammar_Expr_List_List);
+
+         function Allocate_Grammar_Expr_List_List
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Expr_List_List;
+
+         function Allocate_Grammar_Expr_List_List
+           (Pool : Bump_Ptr_Pool) return Bare_Grammar_Expr_List_List
+         is
+            Result      : constant Access_To_Subtype_For_Grammar_Expr_List_List := Bare_Grammar_Expr_List_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Grammar_Expr_List_List;
+            return Bare_Grammar_Expr_List_List (Result);
+         end Allocate_Grammar_Expr_List_List;
+
+      package Bare_Import_List_Memos is new Langkit_Support.Packrat
+        (Bare_Import_List, Token_Index);
+
+         
+         subtype Subtype_For_Import_List is
+            Root_Node_Record (lkt_Import_List);
+         type Access_To_Subtype_For_Import_List is access all Subtype_For_Import_List;
+         package Bare_Import_List_Alloc is new Alloc
+           (Subtype_For_Import_List, Access_To_Subtype_For_Import_List);
+
+         function Allocate_Import_List
+           (Pool : Bump_Ptr_Pool) return Bare_Import_List;
+
+         function Allocate_Import_List
+           (Pool : Bump_Ptr_Pool) return Bare_Import_List
+         is
+            Result      : constant Access_To_Subtype_For_Import_List := Bare_Import_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Import_List;
+            return Bare_Import_List (Result);
+         end Allocate_Import_List;
+
+      package Bare_LK_Node_List_Memos is new Langkit_Support.Packrat
+        (Bare_LK_Node_List, Token_Index);
+
+         
+         subtype Subtype_For_LK_Node_List is
+            Root_Node_Record (lkt_LK_Node_List);
+         type Access_To_Subtype_For_LK_Node_List is access all Subtype_For_LK_Node_List;
+         package Bare_LK_Node_List_Alloc is new Alloc
+           (Subtype_For_LK_Node_List, Access_To_Subtype_For_LK_Node_List);
+
+         function Allocate_LK_Node_List
+           (Pool : Bump_Ptr_Pool) return Bare_LK_Node_List;
+
+         function Allocate_LK_Node_List
+           (Pool : Bump_Ptr_Pool) return Bare_LK_Node_List
+         is
+            Result      : constant Access_To_Subtype_For_LK_Node_List := Bare_LK_Node_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_LK_Node_List;
+            return Bare_LK_Node_List (Result);
+         end Allocate_LK_Node_List;
+
+      package Bare_Lambda_Arg_Decl_List_Memos is new Langkit_Support.Packrat
+        (Bare_Lambda_Arg_Decl_List, Token_Index);
+
+         
+         subtype Subtype_For_Lambda_Arg_Decl_List is
+            Root_Node_Record (lkt_Lambda_Arg_Decl_List);
+         type Access_To_Subtype_For_Lambda_Arg_Decl_List is access all Subtype_For_Lambda_Arg_Decl_List;
+         package Bare_Lambda_Arg_Decl_List_Alloc is new Alloc
+           (Subtype_For_Lambda_Arg_Decl_List, Access_To_Subtype_For_Lambda_Arg_Decl_List);
+
+         function Allocate_Lambda_Arg_Decl_List
+           (Pool : Bump_Ptr_Pool) return Bare_Lambda_Arg_Decl_List;
+
+         function Allocate_Lambda_Arg_Decl_List
+           (Pool : Bump_Ptr_Pool) return Bare_Lambda_Arg_Decl_List
+         is
+            Result      : constant Access_To_Subtype_For_Lambda_Arg_Decl_List := Bare_Lambda_Arg_Decl_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Lambda_Arg_Decl_List;
+            return Bare_Lambda_Arg_Decl_List (Result);
+         end Allocate_Lambda_Arg_Decl_List;
+
+      package Bare_Match_Branch_List_Memos is new Langkit_Support.Packrat
+        (Bare_Match_Branch_List, Token_Index);
+
+         
+         subtype Subtype_For_Match_Branch_List is
+            Root_Node_Record (lkt_Match_Branch_List);
+         type Access_To_Subtype_For_Match_Branch_List is access all Subtype_For_Match_Branch_List;
+         package Bare_Match_Branch_List_Alloc is new Alloc
+           (Subtype_For_Match_Branch_List, Access_To_Subtype_For_Match_Branch_List);
+
+         function Allocate_Match_Branch_List
+           (Pool : Bump_Ptr_Pool) return Bare_Match_Branch_List;
+
+         function Allocate_Match_Branch_List
+           (Pool : Bump_Ptr_Pool) return Bare_Match_Branch_List
+         is
+            Result      : constant Access_To_Subtype_For_Match_Branch_List := Bare_Match_Branch_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Match_Branch_List;
+            return Bare_Match_Branch_List (Result);
+         end Allocate_Match_Branch_List;
+
+      package Bare_Param_List_Memos is new Langkit_Support.Packrat
+        (Bare_Param_List, Token_Index);
+
+         
+         subtype Subtype_For_Param_List is
+            Root_Node_Record (lkt_Param_List);
+         type Access_To_Subtype_For_Param_List is access all Subtype_For_Param_List;
+         package Bare_Param_List_Alloc is new Alloc
+           (Subtype_For_Param_List, Access_To_Subtype_For_Param_List);
+
+         function Allocate_Param_List
+           (Pool : Bump_Ptr_Pool) return Bare_Param_List;
+
+         function Allocate_Param_List
+           (Pool : Bump_Ptr_Pool) return Bare_Param_List
+         is
+            Result      : constant Access_To_Subtype_For_Param_List := Bare_Param_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Param_List;
+            return Bare_Param_List (Result);
+         end Allocate_Param_List;
+
+      package Bare_Ref_Id_List_Memos is new Langkit_Support.Packrat
+        (Bare_Ref_Id_List, Token_Index);
+
+         
+         subtype Subtype_For_Ref_Id_List is
+            Root_Node_Record (lkt_Ref_Id_List);
+         type Access_To_Subtype_For_Ref_Id_List is access all Subtype_For_Ref_Id_List;
+         package Bare_Ref_Id_List_Alloc is new Alloc
+           (Subtype_For_Ref_Id_List, Access_To_Subtype_For_Ref_Id_List);
+
+         function Allocate_Ref_Id_List
+           (Pool : Bump_Ptr_Pool) return Bare_Ref_Id_List;
+
+         function Allocate_Ref_Id_List
+           (Pool : Bump_Ptr_Pool) return Bare_Ref_Id_List
+         is
+            Result      : constant Access_To_Subtype_For_Ref_Id_List := Bare_Ref_Id_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Ref_Id_List;
+            return Bare_Ref_Id_List (Result);
+         end Allocate_Ref_Id_List;
+
+      package Bare_Type_Ref_List_Memos is new Langkit_Support.Packrat
+        (Bare_Type_Ref_List, Token_Index);
+
+         
+         subtype Subtype_For_Type_Ref_List is
+            Root_Node_Record (lkt_Type_Ref_List);
+         type Access_To_Subtype_For_Type_Ref_List is access all Subtype_For_Type_Ref_List;
+         package Bare_Type_Ref_List_Alloc is new Alloc
+           (Subtype_For_Type_Ref_List, Access_To_Subtype_For_Type_Ref_List);
+
+         function Allocate_Type_Ref_List
+           (Pool : Bump_Ptr_Pool) return Bare_Type_Ref_List;
+
+         function Allocate_Type_Ref_List
+           (Pool : Bump_Ptr_Pool) return Bare_Type_Ref_List
+         is
+            Result      : constant Access_To_Subtype_For_Type_Ref_List := Bare_Type_Ref_List_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Type_Ref_List;
+            return Bare_Type_Ref_List (Result);
+         end Allocate_Type_Ref_List;
+
+      package Bare_Langkit_Root_Memos is new Langkit_Support.Packrat
+        (Bare_Langkit_Root, Token_Index);
+
+         
+         subtype Subtype_For_Langkit_Root is
+            Root_Node_Record (lkt_Langkit_Root);
+         type Access_To_Subtype_For_Langkit_Root is access all Subtype_For_Langkit_Root;
+         package Bare_Langkit_Root_Alloc is new Alloc
+           (Subtype_For_Langkit_Root, Access_To_Subtype_For_Langkit_Root);
+
+         function Allocate_Langkit_Root
+           (Pool : Bump_Ptr_Pool) return Bare_Langkit_Root;
+
+         function Allocate_Langkit_Root
+           (Pool : Bump_Ptr_Pool) return Bare_Langkit_Root
+         is
+            Result      : constant Access_To_Subtype_For_Langkit_Root := Bare_Langkit_Root_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Langkit_Root;
+            return Bare_Langkit_Root (Result);
+         end Allocate_Langkit_Root;
+
+      package Bare_Lexer_Case_Rule_Memos is new Langkit_Support.Packrat
+        (Bare_Lexer_Case_Rule, Token_Index);
+
+         
+         subtype Subtype_For_Lexer_Case_Rule is
+            Root_Node_Record (lkt_Lexer_Case_Rule);
+         type Access_To_Subtype_For_Lexer_Case_Rule is access all Subtype_For_Lexer_Case_Rule;
+         package Bare_Lexer_Case_Rule_Alloc is new Alloc
+           (Subtype_For_Lexer_Case_Rule, Access_To_Subtype_For_Lexer_Case_Rule);
+
+         function Allocate_Lexer_Case_Rule
+           (Pool : Bump_Ptr_Pool) return Bare_Lexer_Case_Rule;
+
+         function Allocate_Lexer_Case_Rule
+           (Pool : Bump_Ptr_Pool) return Bare_Lexer_Case_Rule
+         is
+            Result      : constant Access_To_Subtype_For_Lexer_Case_Rule := Bare_Lexer_Case_Rule_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Lexer_Case_Rule;
+            return Bare_Lexer_Case_Rule (Result);
+         end Allocate_Lexer_Case_Rule;
+
+      package Bare_Lexer_Case_Rule_Send_Memos is new Langkit_Support.Packrat
+        (Bare_Lexer_Case_Rule_Send, Token_Index);
+
+         
+         subtype Subtype_For_Lexer_Case_Rule_Send is
+            Root_Node_Record (lkt_Lexer_Case_Rule_Send);
+         type Access_To_Subtype_For_Lexer_Case_Rule_Send is access all Subtype_For_Lexer_Case_Rule_Send;
+         package Bare_Lexer_Case_Rule_Send_Alloc is new Alloc
+           (Subtype_For_Lexer_Case_Rule_Send, Access_To_Subtype_For_Lexer_Case_Rule_Send);
+
+         function Allocate_Lexer_Case_Rule_Send
+           (Pool : Bump_Ptr_Pool) return Bare_Lexer_Case_Rule_Send;
+
+         function Allocate_Lexer_Case_Rule_Send
+           (Pool : Bump_Ptr_Pool) return Bare_Lexer_Case_Rule_Send
+         is
+            Result      : constant Access_To_Subtype_For_Lexer_Case_Rule_Send := Bare_Lexer_Case_Rule_Send_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Lexer_Case_Rule_Send;
+            return Bare_Lexer_Case_Rule_Send (Result);
+         end Allocate_Lexer_Case_Rule_Send;
+
+      package Bare_List_Kind_Memos is new Langkit_Support.Packrat
+        (Bare_List_Kind, Token_Index);
+
+      package Bare_List_Kind_One_Memos is new Langkit_Support.Packrat
+        (Bare_List_Kind_One, Token_Index);
+
+         
+         subtype Subtype_For_List_Kind_One is
+            Root_Node_Record (lkt_List_Kind_One);
+         type Access_To_Subtype_For_List_Kind_One is access all Subtype_For_List_Kind_One;
+         package Bare_List_Kind_One_Alloc is new Alloc
+           (Subtype_For_List_Kind_One, Access_To_Subtype_For_List_Kind_One);
+
+         function Allocate_List_Kind_One
+           (Pool : Bump_Ptr_Pool) return Bare_List_Kind_One;
+
+         function Allocate_List_Kind_One
+           (Pool : Bump_Ptr_Pool) return Bare_List_Kind_One
+         is
+            Result      : constant Access_To_Subtype_For_List_Kind_One := Bare_List_Kind_One_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_List_Kind_One;
+            return Bare_List_Kind_One (Result);
+         end Allocate_List_Kind_One;
+
+      package Bare_List_Kind_Zero_Memos is new Langkit_Support.Packrat
+        (Bare_List_Kind_Zero, Token_Index);
+
+         
+         subtype Subtype_For_List_Kind_Zero is
+            Root_Node_Record (lkt_List_Kind_Zero);
+         type Access_To_Subtype_For_List_Kind_Zero is access all Subtype_For_List_Kind_Zero;
+         package Bare_List_Kind_Zero_Alloc is new Alloc
+           (Subtype_For_List_Kind_Zero, Access_To_Subtype_For_List_Kind_Zero);
+
+         function Allocate_List_Kind_Zero
+           (Pool : Bump_Ptr_Pool) return Bare_List_Kind_Zero;
+
+         function Allocate_List_Kind_Zero
+           (Pool : Bump_Ptr_Pool) return Bare_List_Kind_Zero
+         is
+            Result      : constant Access_To_Subtype_For_List_Kind_Zero := Bare_List_Kind_Zero_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_List_Kind_Zero;
+            return Bare_List_Kind_Zero (Result);
+         end Allocate_List_Kind_Zero;
+
+      package Bare_Match_Branch_Memos is new Langkit_Support.Packrat
+        (Bare_Match_Branch, Token_Index);
+
+         
+         subtype Subtype_For_Match_Branch is
+            Root_Node_Record (lkt_Match_Branch);
+         type Access_To_Subtype_For_Match_Branch is access all Subtype_For_Match_Branch;
+         package Bare_Match_Branch_Alloc is new Alloc
+           (Subtype_For_Match_Branch, Access_To_Subtype_For_Match_Branch);
+
+         function Allocate_Match_Branch
+           (Pool : Bump_Ptr_Pool) return Bare_Match_Branch;
+
+         function Allocate_Match_Branch
+           (Pool : Bump_Ptr_Pool) return Bare_Match_Branch
+         is
+            Result      : constant Access_To_Subtype_For_Match_Branch := Bare_Match_Branch_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Match_Branch;
+            return Bare_Match_Branch (Result);
+         end Allocate_Match_Branch;
+
+      package Bare_Op_Memos is new Langkit_Support.Packrat
+        (Bare_Op, Token_Index);
+
+      package Bare_Op_Amp_Memos is new Langkit_Support.Packrat
+        (Bare_Op_Amp, Token_Index);
+
+         
+         subtype Subtype_For_Op_Amp is
+            Root_Node_Record (lkt_Op_Amp);
+         type Access_To_Subtype_For_Op_Amp is access all Subtype_For_Op_Amp;
+         package Bare_Op_Amp_Alloc is new Alloc
+           (Subtype_For_Op_Amp, Access_To_Subtype_For_Op_Amp);
+
+         function Allocate_Op_Amp
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Amp;
+
+         function Allocate_Op_Amp
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Amp
+         is
+            Result      : constant Access_To_Subtype_For_Op_Amp := Bare_Op_Amp_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Op_Amp;
+            return Bare_Op_Amp (Result);
+         end Allocate_Op_Amp;
+
+      package Bare_Op_And_Memos is new Langkit_Support.Packrat
+        (Bare_Op_And, Token_Index);
+
+         
+         subtype Subtype_For_Op_And is
+            Root_Node_Record (lkt_Op_And);
+         type Access_To_Subtype_For_Op_And is access all Subtype_For_Op_And;
+         package Bare_Op_And_Alloc is new Alloc
+           (Subtype_For_Op_And, Access_To_Subtype_For_Op_And);
+
+         function Allocate_Op_And
+           (Pool : Bump_Ptr_Pool) return Bare_Op_And;
+
+         function Allocate_Op_And
+           (Pool : Bump_Ptr_Pool) return Bare_Op_And
+         is
+            Result      : constant Access_To_Subtype_For_Op_And := Bare_Op_And_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Op_And;
+            return Bare_Op_And (Result);
+         end Allocate_Op_And;
+
+      package Bare_Op_Div_Memos is new Langkit_Support.Packrat
+        (Bare_Op_Div, Token_Index);
+
+         
+         subtype Subtype_For_Op_Div is
+            Root_Node_Record (lkt_Op_Div);
+         type Access_To_Subtype_For_Op_Div is access all Subtype_For_Op_Div;
+         package Bare_Op_Div_Alloc is new Alloc
+           (Subtype_For_Op_Div, Access_To_Subtype_For_Op_Div);
+
+         function Allocate_Op_Div
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Div;
+
+         function Allocate_Op_Div
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Div
+         is
+            Result      : constant Access_To_Subtype_For_Op_Div := Bare_Op_Div_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Op_Div;
+            return Bare_Op_Div (Result);
+         end Allocate_Op_Div;
+
+      package Bare_Op_Eq_Memos is new Langkit_Support.Packrat
+        (Bare_Op_Eq, Token_Index);
+
+         
+         subtype Subtype_For_Op_Eq is
+            Root_Node_Record (lkt_Op_Eq);
+         type Access_To_Subtype_For_Op_Eq is access all Subtype_For_Op_Eq;
+         package Bare_Op_Eq_Alloc is new Alloc
+           (Subtype_For_Op_Eq, Access_To_Subtype_For_Op_Eq);
+
+         function Allocate_Op_Eq
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Eq;
+
+         function Allocate_Op_Eq
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Eq
+         is
+            Result      : constant Access_To_Subtype_For_Op_Eq := Bare_Op_Eq_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Op_Eq;
+            return Bare_Op_Eq (Result);
+         end Allocate_Op_Eq;
+
+      package Bare_Op_Gt_Memos is new Langkit_Support.Packrat
+        (Bare_Op_Gt, Token_Index);
+
+         
+         subtype Subtype_For_Op_Gt is
+            Root_Node_Record (lkt_Op_Gt);
+         type Access_To_Subtype_For_Op_Gt is access all Subtype_For_Op_Gt;
+         package Bare_Op_Gt_Alloc is new Alloc
+           (Subtype_For_Op_Gt, Access_To_Subtype_For_Op_Gt);
+
+         function Allocate_Op_Gt
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Gt;
+
+         function Allocate_Op_Gt
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Gt
+         is
+            Result      : constant Access_To_Subtype_For_Op_Gt := Bare_Op_Gt_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Op_Gt;
+            return Bare_Op_Gt (Result);
+         end Allocate_Op_Gt;
+
+      package Bare_Op_Gte_Memos is new Langkit_Support.Packrat
+        (Bare_Op_Gte, Token_Index);
+
+         
+         subtype Subtype_For_Op_Gte is
+            Root_Node_Record (lkt_Op_Gte);
+         type Access_To_Subtype_For_Op_Gte is access all Subtype_For_Op_Gte;
+         package Bare_Op_Gte_Alloc is new Alloc
+           (Subtype_For_Op_Gte, Access_To_Subtype_For_Op_Gte);
+
+         function Allocate_Op_Gte
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Gte;
+
+         function Allocate_Op_Gte
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Gte
+         is
+            Result      : constant Access_To_Subtype_For_Op_Gte := Bare_Op_Gte_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Op_Gte;
+            return Bare_Op_Gte (Result);
+         end Allocate_Op_Gte;
+
+      package Bare_Op_Lt_Memos is new Langkit_Support.Packrat
+        (Bare_Op_Lt, Token_Index);
+
+         
+         subtype Subtype_For_Op_Lt is
+            Root_Node_Record (lkt_Op_Lt);
+         type Access_To_Subtype_For_Op_Lt is access all Subtype_For_Op_Lt;
+         package Bare_Op_Lt_Alloc is new Alloc
+           (Subtype_For_Op_Lt, Access_To_Subtype_For_Op_Lt);
+
+         function Allocate_Op_Lt
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Lt;
+
+         function Allocate_Op_Lt
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Lt
+         is
+            Result      : constant Access_To_Subtype_For_Op_Lt := Bare_Op_Lt_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Op_Lt;
+            return Bare_Op_Lt (Result);
+         end Allocate_Op_Lt;
+
+      package Bare_Op_Lte_Memos is new Langkit_Support.Packrat
+        (Bare_Op_Lte, Token_Index);
+
+         
+         subtype Subtype_For_Op_Lte is
+            Root_Node_Record (lkt_Op_Lte);
+         type Access_To_Subtype_For_Op_Lte is access all Subtype_For_Op_Lte;
+         package Bare_Op_Lte_Alloc is new Alloc
+           (Subtype_For_Op_Lte, Access_To_Subtype_For_Op_Lte);
+
+         function Allocate_Op_Lte
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Lte;
+
+         function Allocate_Op_Lte
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Lte
+         is
+            Result      : constant Access_To_Subtype_For_Op_Lte := Bare_Op_Lte_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Op_Lte;
+            return Bare_Op_Lte (Result);
+         end Allocate_Op_Lte;
+
+      package Bare_Op_Minus_Memos is new Langkit_Support.Packrat
+        (Bare_Op_Minus, Token_Index);
+
+         
+         subtype Subtype_For_Op_Minus is
+            Root_Node_Record (lkt_Op_Minus);
+         type Access_To_Subtype_For_Op_Minus is access all Subtype_For_Op_Minus;
+         package Bare_Op_Minus_Alloc is new Alloc
+           (Subtype_For_Op_Minus, Access_To_Subtype_For_Op_Minus);
+
+         function Allocate_Op_Minus
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Minus;
+
+         function Allocate_Op_Minus
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Minus
+         is
+            Result      : constant Access_To_Subtype_For_Op_Minus := Bare_Op_Minus_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Op_Minus;
+            return Bare_Op_Minus (Result);
+         end Allocate_Op_Minus;
+
+      package Bare_Op_Mult_Memos is new Langkit_Support.Packrat
+        (Bare_Op_Mult, Token_Index);
+
+         
+         subtype Subtype_For_Op_Mult is
+            Root_Node_Record (lkt_Op_Mult);
+         type Access_To_Subtype_For_Op_Mult is access all Subtype_For_Op_Mult;
+         package Bare_Op_Mult_Alloc is new Alloc
+           (Subtype_For_Op_Mult, Access_To_Subtype_For_Op_Mult);
+
+         function Allocate_Op_Mult
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Mult;
+
+         function Allocate_Op_Mult
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Mult
+         is
+            Result      : constant Access_To_Subtype_For_Op_Mult := Bare_Op_Mult_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Op_Mult;
+            return Bare_Op_Mult (Result);
+         end Allocate_Op_Mult;
+
+      package Bare_Op_Or_Memos is new Langkit_Support.Packrat
+        (Bare_Op_Or, Token_Index);
+
+         
+         subtype Subtype_For_Op_Or is
+            Root_Node_Record (lkt_Op_Or);
+         type Access_To_Subtype_For_Op_Or is access all Subtype_For_Op_Or;
+         package Bare_Op_Or_Alloc is new Alloc
+           (Subtype_For_Op_Or, Access_To_Subtype_For_Op_Or);
+
+         function Allocate_Op_Or
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Or;
+
+         function Allocate_Op_Or
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Or
+         is
+            Result      : constant Access_To_Subtype_For_Op_Or := Bare_Op_Or_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Op_Or;
+            return Bare_Op_Or (Result);
+         end Allocate_Op_Or;
+
+      package Bare_Op_Plus_Memos is new Langkit_Support.Packrat
+        (Bare_Op_Plus, Token_Index);
+
+         
+         subtype Subtype_For_Op_Plus is
+            Root_Node_Record (lkt_Op_Plus);
+         type Access_To_Subtype_For_Op_Plus is access all Subtype_For_Op_Plus;
+         package Bare_Op_Plus_Alloc is new Alloc
+           (Subtype_For_Op_Plus, Access_To_Subtype_For_Op_Plus);
+
+         function Allocate_Op_Plus
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Plus;
+
+         function Allocate_Op_Plus
+           (Pool : Bump_Ptr_Pool) return Bare_Op_Plus
+         is
+            Result      : constant Access_To_Subtype_For_Op_Plus := Bare_Op_Plus_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Op_Plus;
+            return Bare_Op_Plus (Result);
+         end Allocate_Op_Plus;
+
+      package Bare_Param_Memos is new Langkit_Support.Packrat
+        (Bare_Param, Token_Index);
+
+         
+         subtype Subtype_For_Param is
+            Root_Node_Record (lkt_Param);
+         type Access_To_Subtype_For_Param is access all Subtype_For_Param;
+         package Bare_Param_Alloc is new Alloc
+           (Subtype_For_Param, Access_To_Subtype_For_Param);
+
+         function Allocate_Param
+           (Pool : Bump_Ptr_Pool) return Bare_Param;
+
+         function Allocate_Param
+           (Pool : Bump_Ptr_Pool) return Bare_Param
+         is
+            Result      : constant Access_To_Subtype_For_Param := Bare_Param_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Param;
+            return Bare_Param (Result);
+         end Allocate_Param;
+
+      package Bare_Type_Ref_Memos is new Langkit_Support.Packrat
+        (Bare_Type_Ref, Token_Index);
+
+      package Bare_Function_Type_Ref_Memos is new Langkit_Support.Packrat
+        (Bare_Function_Type_Ref, Token_Index);
+
+         
+         subtype Subtype_For_Function_Type_Ref is
+            Root_Node_Record (lkt_Function_Type_Ref);
+         type Access_To_Subtype_For_Function_Type_Ref is access all Subtype_For_Function_Type_Ref;
+         package Bare_Function_Type_Ref_Alloc is new Alloc
+           (Subtype_For_Function_Type_Ref, Access_To_Subtype_For_Function_Type_Ref);
+
+         function Allocate_Function_Type_Ref
+           (Pool : Bump_Ptr_Pool) return Bare_Function_Type_Ref;
+
+         function Allocate_Function_Type_Ref
+           (Pool : Bump_Ptr_Pool) return Bare_Function_Type_Ref
+         is
+            Result      : constant Access_To_Subtype_For_Function_Type_Ref := Bare_Function_Type_Ref_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Function_Type_Ref;
+            return Bare_Function_Type_Ref (Result);
+         end Allocate_Function_Type_Ref;
+
+      package Bare_Generic_Type_Ref_Memos is new Langkit_Support.Packrat
+        (Bare_Generic_Type_Ref, Token_Index);
+
+         
+         subtype Subtype_For_Generic_Type_Ref is
+            Root_Node_Record (lkt_Generic_Type_Ref);
+         type Access_To_Subtype_For_Generic_Type_Ref is access all Subtype_For_Generic_Type_Ref;
+         package Bare_Generic_Type_Ref_Alloc is new Alloc
+           (Subtype_For_Generic_Type_Ref, Access_To_Subtype_For_Generic_Type_Ref);
+
+         function Allocate_Generic_Type_Ref
+           (Pool : Bump_Ptr_Pool) return Bare_Generic_Type_Ref;
+
+         function Allocate_Generic_Type_Ref
+           (Pool : Bump_Ptr_Pool) return Bare_Generic_Type_Ref
+         is
+            Result      : constant Access_To_Subtype_For_Generic_Type_Ref := Bare_Generic_Type_Ref_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Generic_Type_Ref;
+            return Bare_Generic_Type_Ref (Result);
+         end Allocate_Generic_Type_Ref;
+
+      package Bare_Simple_Type_Ref_Memos is new Langkit_Support.Packrat
+        (Bare_Simple_Type_Ref, Token_Index);
+
+         
+         subtype Subtype_For_Simple_Type_Ref is
+            Root_Node_Record (lkt_Simple_Type_Ref);
+         type Access_To_Subtype_For_Simple_Type_Ref is access all Subtype_For_Simple_Type_Ref;
+         package Bare_Simple_Type_Ref_Alloc is new Alloc
+           (Subtype_For_Simple_Type_Ref, Access_To_Subtype_For_Simple_Type_Ref);
+
+         function Allocate_Simple_Type_Ref
+           (Pool : Bump_Ptr_Pool) return Bare_Simple_Type_Ref;
+
+         function Allocate_Simple_Type_Ref
+           (Pool : Bump_Ptr_Pool) return Bare_Simple_Type_Ref
+         is
+            Result      : constant Access_To_Subtype_For_Simple_Type_Ref := Bare_Simple_Type_Ref_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Simple_Type_Ref;
+            return Bare_Simple_Type_Ref (Result);
+         end Allocate_Simple_Type_Ref;
+
+      package Bare_Var_Bind_Memos is new Langkit_Support.Packrat
+        (Bare_Var_Bind, Token_Index);
+
+         
+         subtype Subtype_For_Var_Bind is
+            Root_Node_Record (lkt_Var_Bind);
+         type Access_To_Subtype_For_Var_Bind is access all Subtype_For_Var_Bind;
+         package Bare_Var_Bind_Alloc is new Alloc
+           (Subtype_For_Var_Bind, Access_To_Subtype_For_Var_Bind);
+
+         function Allocate_Var_Bind
+           (Pool : Bump_Ptr_Pool) return Bare_Var_Bind;
+
+         function Allocate_Var_Bind
+           (Pool : Bump_Ptr_Pool) return Bare_Var_Bind
+         is
+            Result      : constant Access_To_Subtype_For_Var_Bind := Bare_Var_Bind_Alloc.Alloc (Pool);
+            Result_Kind : LK_Node_Kind_Type
+               with Import, Address => Result.Kind'Address;
+            --  Result.Kind is a discriminant, so we can't modify it directly.
+            --  We need to initialize it manually, though, as we don't use a
+            --  standard Ada allocator for nodes. Use an overlay to workaround
+            --  Ada's restrictions.
+         begin
+            Result_Kind := lkt_Var_Bind;
+            return Bare_Var_Bind (Result);
+         end Allocate_Var_Bind;
+
+   pragma Warnings (On, "is not referenced");
+   pragma Warnings (On, "possible aliasing problem for type");
+
+   procedure Initialize_List
+     (Self   : Bare_LK_Node_Base_List;
+      Parser : Parser_Type;
+      Count  : Natural);
+   --  Helper for parsers, to initialize the list of children in a freshly
+   --  allocated list node.
+
+   type Dontskip_Parser_Function is access function
+     (Parser : in out Parser_Type;
+      Pos    : Token_Index)
+      return Bare_LK_Node;
+
+   package Dont_Skip_Fn_Vectors
+   is new Ada.Containers.Vectors (Natural, Dontskip_Parser_Function);
+
+   type Free_Parse_List_Record;
+   type Free_Parse_List is access all Free_Parse_List_Record;
+   --  Cache of temporary lists of AST nodes used in List parsers
+
+   type Free_Parse_List_Record is record
+      Nodes : Bare_LK_Node_Vectors.Vector;
+      Next  : Free_Parse_List;
+   end record;
+
+   type Parser_Private_Part_Type is record
+      Parse_Lists : Free_Parse_List;
+
+      
+      Arith_1_Or_Parse_1_Memo : Bare_Expr_Memos.Memo_Type;
+      
+      Arith_2_Or_Parse_1_Memo : Bare_Expr_Memos.Memo_Type;
+      
+      Array_Literal_Transform_Parse_0_Memo : Bare_Array_Literal_Memos.Memo_Type;
+      
+      Bare_Decl_Or_Parse_0_Memo : Bare_Decl_Memos.Memo_Type;
+      
+      Basic_Expr_Or_Parse_0_Memo : Bare_Expr_Memos.Memo_Type;
+      
+      Basic_Name_Or_Parse_0_Memo : Bare_Expr_Memos.Memo_Type;
+      
+      Block_Transform_Parse_0_Memo : Bare_Block_Expr_Memos.Memo_Type;
+      
+      Char_Lit_Transform_Parse_0_Memo : Bare_Char_Lit_Memos.Memo_Type;
+      
+      Decl_Annotation_Params_Opt_Parse_0_Memo : Bare_Decl_Annotation_Params_Memos.Memo_Type;
+      
+      Decl_Annotation_Transform_Parse_0_Memo : Bare_Decl_Annotation_Memos.Memo_Type;
+      
+      Decl_Block_List_Parse_0_Memo : Bare_Decl_Block_Memos.Memo_Type;
+      
+      Decl_Transform_Parse_0_Memo : Bare_Full_Decl_Memos.Memo_Type;
+      
+      Decls_List_Parse_0_Memo : Bare_Full_Decl_List_Memos.Memo_Type;
+      
+      Def_Id_Transform_Parse_0_Memo : Bare_Def_Id_Memos.Memo_Type;
+      
+      Doc_Comment_Transform_Parse_0_Memo : Bare_Doc_Comment_Memos.Memo_Type;
+      
+      Doc_Transform_Parse_0_Memo : Bare_Doc_Memos.Memo_Type;
+      
+      Enum_Lit_Decl_Transform_Parse_0_Memo : Bare_Enum_Lit_Decl_Memos.Memo_Type;
+      
+      Eq_Or_Parse_1_Memo : Bare_Expr_Memos.Memo_Type;
+      
+      Expr_Or_Parse_1_Memo : Bare_Expr_Memos.Memo_Type;
+      
+      Field_Decl_Transform_Parse_0_Memo : Bare_Field_Decl_Memos.Memo_Type;
+      
+      Fun_Arg_Decl_Transform_Parse_0_Memo : Bare_Fun_Arg_Decl_Memos.Memo_Type;
+      
+      Fun_Arg_List_List_Parse_0_Memo : Bare_Fun_Arg_Decl_List_Memos.Memo_Type;
+      
+      Fun_Decl_Transform_Parse_0_Memo : Bare_Fun_Decl_Memos.Memo_Type;
+      
+      Generic_Decl_Transform_Parse_0_Memo : Bare_Generic_Decl_Memos.Memo_Type;
+      
+      Generic_Formal_Type_Transform_Parse_1_Memo : Bare_Full_Decl_Memos.Memo_Type;
+      
+      Grammar_Cut_Transform_Parse_0_Memo : Bare_Grammar_Cut_Memos.Memo_Type;
+      
+      Grammar_Decl_Transform_Parse_0_Memo : Bare_Grammar_Decl_Memos.Memo_Type;
+      
+      Grammar_Discard_Expr_Transform_Parse_0_Memo : Bare_Grammar_Discard_Memos.Memo_Type;
+      
+      Grammar_Expr_Or_Parse_0_Memo : Bare_Grammar_Expr_Memos.Memo_Type;
+      
+      Grammar_Implicit_Pick_Transform_Parse_0_Memo : Bare_Grammar_Implicit_Pick_Memos.Memo_Type;
+      
+      Grammar_List_Expr_Transform_Parse_2_Memo : Bare_Grammar_List_Memos.Memo_Type;
+      
+      Grammar_Null_Transform_Parse_0_Memo : Bare_Grammar_Null_Memos.Memo_Type;
+      
+      Grammar_Opt_Or_Parse_0_Memo : Bare_Grammar_Expr_Memos.Memo_Type;
+      
+      Grammar_Or_Expr_Transform_Parse_0_Memo : Bare_Grammar_Or_Expr_Memos.Memo_Type;
+      
+      Grammar_Pick_Transform_Parse_0_Memo : Bare_Grammar_Pick_Memos.Memo_Type;
+      
+      Grammar_Primary_Or_Parse_0_Memo : Bare_Grammar_Expr_Memos.Memo_Type;
+      
+      Grammar_Rule_Ref_Transform_Parse_0_Memo : Bare_Grammar_Rule_Ref_Memos.Memo_Type;
+      
+      Grammar_Rule_Transform_Parse_0_Memo : Bare_Grammar_Rule_Decl_Memos.Memo_Type;
+      
+      Grammar_Skip_Transform_Parse_0_Memo : Bare_Grammar_Skip_Memos.Memo_Type;
+      
+      Grammar_Token_Transform_Parse_0_Memo : Bare_Token_Ref_Memos.Memo_Type;
+      
+      Id_Transform_Parse_0_Memo : Bare_Id_Memos.Memo_Type;
+      
+      If_Expr_Transform_Parse_1_Memo : Bare_If_Expr_Memos.Memo_Type;
+      
+      Import_Stmt_Transform_Parse_1_Memo : Bare_Import_Memos.Memo_Type;
+      
+      Imports_List_Parse_0_Memo : Bare_Import_List_Memos.Memo_Type;
+      
+      Isa_Or_Primary_Or_Parse_0_Memo : Bare_Expr_Memos.Memo_Type;
+      
+      Lambda_Arg_Decl_Transform_Parse_0_Memo : Bare_Lambda_Arg_Decl_Memos.Memo_Type;
+      
+      Lambda_Arg_List_List_Parse_0_Memo : Bare_Lambda_Arg_Decl_List_Memos.Memo_Type;
+      
+      Lambda_Expr_Transform_Parse_0_Memo : Bare_Lambda_Expr_Memos.Memo_Type;
+      
+      Lexer_Case_Alt_Or_Parse_0_Memo : Bare_Base_Lexer_Case_Rule_Alt_Memos.Memo_Type;
+      
+      Lexer_Case_Rule_Transform_Parse_0_Memo : Bare_Lexer_Case_Rule_Memos.Memo_Type;
+      
+      Lexer_Case_Send_Transform_Parse_0_Memo : Bare_Lexer_Case_Rule_Send_Memos.Memo_Type;
+      
+      Lexer_Decl_Transform_Parse_0_Memo : Bare_Lexer_Decl_Memos.Memo_Type;
+      
+      Lexer_Family_Decl_Transform_Parse_1_Memo : Bare_Full_Decl_Memos.Memo_Type;
+      
+      Lexer_Rule_Or_Parse_0_Memo : Bare_LK_Node_Memos.Memo_Type;
+      
+      Logic_Or_Parse_0_Memo : Bare_Expr_Memos.Memo_Type;
+      
+      Main_Rule_Transform_Parse_0_Memo : Bare_Langkit_Root_Memos.Memo_Type;
+      
+      Match_Expr_Transform_Parse_2_Memo : Bare_Match_Expr_Memos.Memo_Type;
+      
+      Null_Lit_Transform_Parse_0_Memo : Bare_Null_Lit_Memos.Memo_Type;
+      
+      Num_Lit_Transform_Parse_0_Memo : Bare_Num_Lit_Memos.Memo_Type;
+      
+      Param_Transform_Parse_0_Memo : Bare_Param_Memos.Memo_Type;
+      
+      Params_List_Parse_0_Memo : Bare_Param_List_Memos.Memo_Type;
+      
+      Parse_Node_Expr_Transform_Parse_0_Memo : Bare_Parse_Node_Expr_Memos.Memo_Type;
+      
+      Primary_Or_Parse_0_Memo : Bare_Expr_Memos.Memo_Type;
+      
+      Raise_Expr_Transform_Parse_0_Memo : Bare_Raise_Expr_Memos.Memo_Type;
+      
+      Ref_Id_Transform_Parse_0_Memo : Bare_Ref_Id_Memos.Memo_Type;
+      
+      Rel_Or_Parse_0_Memo : Bare_Expr_Memos.Memo_Type;
+      
+      String_Lit_Transform_Parse_0_Memo : Bare_String_Lit_Memos.Memo_Type;
+      
+      Term_Or_Parse_0_Memo : Bare_Expr_Memos.Memo_Type;
+      
+      Token_Literal_Transform_Parse_0_Memo : Bare_Token_Lit_Memos.Memo_Type;
+      
+      Token_No_Case_Literal_Transform_Parse_0_Memo : Bare_Token_No_Case_Lit_Memos.Memo_Type;
+      
+      Token_Pattern_Literal_Transform_Parse_0_Memo : Bare_Token_Pattern_Lit_Memos.Memo_Type;
+      
+      Try_Expr_Transform_Parse_0_Memo : Bare_Try_Expr_Memos.Memo_Type;
+      
+      Type_Decl_Or_Parse_0_Memo : Bare_Named_Type_Decl_Memos.Memo_Type;
+      
+      Type_List_List_Parse_0_Memo : Bare_Type_Ref_List_Memos.Memo_Type;
+      
+      Type_Ref_Or_Parse_0_Memo : Bare_Type_Ref_Memos.Memo_Type;
+      
+      Val_Decl_Transform_Parse_0_Memo : Bare_Val_Decl_Memos.Memo_Type;
+      
+      Var_Bind_Transform_Parse_0_Memo : Bare_Var_Bind_Memos.Memo_Type;
+
+      Dont_Skip : Dont_Skip_Fn_Vectors.Vector;
+   end record;
+
+   
+function Def_Id_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Def_Id;
+
+   
+function Ref_Id_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Ref_Id;
+
+   
+function Basic_Name_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr;
+
+   
+function Type_List_List_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Type_Ref_List;
+
+   
+function Type_Ref_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Type_Ref;
+
+   
+function Eq_Or_Parse_1
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr;
+
+   
+function Rel_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr;
+
+   
+function Expr_Or_Parse_1
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr;
+
+   
+function Lambda_Arg_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Lambda_Arg_Decl;
+
+   
+function Lambda_Arg_List_List_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Lambda_Arg_Decl_List;
+
+   
+function Lambda_Expr_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Lambda_Expr;
+
+   
+function If_Expr_Transform_Parse_1
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_If_Expr;
+
+   
+function Raise_Expr_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Raise_Expr;
+
+   
+function Try_Expr_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Try_Expr;
+
+   
+function Param_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Param;
+
+   
+function Params_List_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Param_List;
+
+   
+function Match_Expr_Transform_Parse_2
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Match_Expr;
+
+   
+function Null_Lit_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Null_Lit;
+
+   
+function Val_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Val_Decl;
+
+   
+function Var_Bind_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Var_Bind;
+
+   
+function Block_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Block_Expr;
+
+   
+function Num_Lit_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Num_Lit;
+
+   
+function String_Lit_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_String_Lit;
+
+   
+function Char_Lit_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Char_Lit;
+
+   
+function Array_Literal_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Array_Literal;
+
+   
+function Term_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr;
+
+   
+function Basic_Expr_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr;
+
+   
+function Logic_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr;
+
+   
+function Primary_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr;
+
+   
+function Isa_Or_Primary_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr;
+
+   
+function Arith_2_Or_Parse_1
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr;
+
+   
+function Arith_1_Or_Parse_1
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr;
+
+   
+function Doc_Comment_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Doc_Comment;
+
+   
+function Doc_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Doc;
+
+   
+function Id_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Id;
+
+   
+function Decl_Annotation_Params_Opt_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Decl_Annotation_Params;
+
+   
+function Decl_Annotation_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Decl_Annotation;
+
+   
+function Generic_Formal_Type_Transform_Parse_1
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Full_Decl;
+
+   
+function Generic_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Generic_Decl;
+
+   
+function Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Full_Decl;
+
+   
+function Decl_Block_List_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Decl_Block;
+
+   
+function Enum_Lit_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Enum_Lit_Decl;
+
+   
+function Type_Decl_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Named_Type_Decl;
+
+   
+function Fun_Arg_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Fun_Arg_Decl;
+
+   
+function Fun_Arg_List_List_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Fun_Arg_Decl_List;
+
+   
+function Fun_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Fun_Decl;
+
+   
+function Lexer_Family_Decl_Transform_Parse_1
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Full_Decl;
+
+   
+function Grammar_Expr_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Expr;
+
+   
+function Grammar_Pick_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Pick;
+
+   
+function Grammar_Implicit_Pick_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Implicit_Pick;
+
+   
+function Grammar_List_Expr_Transform_Parse_2
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_List;
+
+   
+function Token_Literal_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Token_Lit;
+
+   
+function Token_No_Case_Literal_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Token_No_Case_Lit;
+
+   
+function Token_Pattern_Literal_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Token_Pattern_Lit;
+
+   
+function Grammar_Cut_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Cut;
+
+   
+function Grammar_Skip_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Skip;
+
+   
+function Grammar_Null_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Null;
+
+   
+function Grammar_Token_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Token_Ref;
+
+   
+function Parse_Node_Expr_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Parse_Node_Expr;
+
+   
+function Grammar_Opt_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Expr;
+
+   
+function Grammar_Or_Expr_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Or_Expr;
+
+   
+function Grammar_Rule_Ref_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Rule_Ref;
+
+   
+function Grammar_Discard_Expr_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Discard;
+
+   
+function Grammar_Primary_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Expr;
+
+   
+function Lexer_Case_Send_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Lexer_Case_Rule_Send;
+
+   
+function Lexer_Case_Alt_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Base_Lexer_Case_Rule_Alt;
+
+   
+function Lexer_Case_Rule_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Lexer_Case_Rule;
+
+   
+function Lexer_Rule_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_LK_Node;
+
+   
+function Lexer_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Lexer_Decl;
+
+   
+function Grammar_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Decl;
+
+   
+function Field_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Field_Decl;
+
+   
+function Grammar_Rule_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Rule_Decl;
+
+   
+function Bare_Decl_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Decl;
+
+   
+function Decls_List_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Full_Decl_List;
+
+   
+function Import_Stmt_Transform_Parse_1
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Import;
+
+   
+function Imports_List_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Import_List;
+
+   
+function Main_Rule_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Langkit_Root;
+
+
+   procedure Process_Parsing_Error
+     (Parser         : in out Parser_Type;
+      Check_Complete : Boolean := True);
+   --  Helper for the user parsing function, to be called after a low-level
+   --  parsing function. Check_Complete has the same semantics as in Parse. If
+   --  the parsing failed (Parser.Current_Pos = No_Token_Index), append
+   --  corresponding diagnostics to Parser.Diagnostics, do nothing instead.
+
+   procedure Add_Last_Fail_Diagnostic (Parser : in out Parser_Type);
+   --  Add a diagnostic for the last fail position of the parser
+
+   function Get_Parse_List (Parser : Parser_Type) return Free_Parse_List;
+   --  Get a free parse list, or allocate one if there is no free parse list in
+   --  Parser. When done with the result, the caller must invoke
+   --  Release_Parse_List.
+
+   procedure Release_Parse_List
+     (Parser : Parser_Type; List : in out Free_Parse_List);
+   --  Release a parse list, putting it in Parsers' free list. Set List to
+   --  null.
+
+   ---------------------
+   -- Initialize_List --
+   ---------------------
+
+   procedure Initialize_List
+     (Self   : Bare_LK_Node_Base_List;
+      Parser : Parser_Type;
+      Count  : Natural) is
+   begin
+      Self.Count := Count;
+      Self.Nodes := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, 0);
+   end Initialize_List;
+
+   -----------------
+   -- Init_Parser --
+   -----------------
+
+   procedure Init_Parser
+     (Input       : Internal_Lexer_Input;
+      Tab_Stop    : Positive;
+      With_Trivia : Boolean;
+      Unit        : access Implementation.Analysis_Unit_Type;
+      TDH         : Token_Data_Handler_Access;
+      Parser      : in out Parser_Type) is
+   begin
+      Reset (Parser);
+      Extract_Tokens
+        (Input, Tab_Stop, With_Trivia, TDH.all, Parser.Diagnostics);
+      Parser.Unit := Unit;
+      Parser.TDH := TDH;
+   end Init_Parser;
+
+   ------------------------------
+   -- Add_Last_Fail_Diagnostic --
+   ------------------------------
+
+   procedure Add_Last_Fail_Diagnostic (Parser : in out Parser_Type)
+   is
+      Last_Token : Stored_Token_Data renames
+         Get_Token (Parser.TDH.all, Parser.Last_Fail.Pos);
+      D : constant Diagnostic :=
+        (if Parser.Last_Fail.Kind = Token_Fail then
+          Create (Sloc_Range (Parser.TDH.all, Last_Token), To_Text
+            ("Expected "
+             & Token_Error_Image (Parser.Last_Fail.Expected_Token_Id)
+             & ", got "
+             & Token_Error_Image (Parser.Last_Fail.Found_Token_Id)))
+         else
+           Create (Sloc_Range (Parser.TDH.all, Last_Token),
+                   To_Text (Parser.Last_Fail.Custom_Message.all)));
+   begin
+      Parser.Diagnostics.Append (D);
+   end Add_Last_Fail_Diagnostic;
+
+   ---------------------------
+   -- Process_Parsing_Error --
+   ---------------------------
+
+   procedure Process_Parsing_Error
+     (Parser         : in out Parser_Type;
+      Check_Complete : Boolean := True) is
+   begin
+
+      if Parser.Current_Pos = No_Token_Index then
+         Add_Last_Fail_Diagnostic (Parser);
+      elsif Check_Complete
+        and then Parser.Current_Pos /= Last_Token (Parser.TDH.all)
+      then
+         --  If the fail pos is the current position of the parser or after,
+         --  it means that the longest parse is the correct result, and that we
+         --  have some garbage afterwards.
+         if Parser.Current_Pos >= Parser.Last_Fail.Pos then
+            declare
+               First_Garbage_Token : Stored_Token_Data renames
+                  Get_Token (Parser.TDH.all, Parser.Current_Pos);
+            begin
+               Append
+                 (Parser.Diagnostics,
+                  Sloc_Range (Parser.TDH.all, First_Garbage_Token),
+                  To_Text
+                    ("End of input expected, got """
+                     & Token_Kind_Name
+                         (To_Token_Kind (First_Garbage_Token.Kind))
+                     & """"));
+            end;
+
+         --  Else, the last fail pos is further down the line, and we want to
+         --  have the diagnostic of what exactly failed.
+         else
+            Add_Last_Fail_Diagnostic (Parser);
+         end if;
+      end if;
+
+   end Process_Parsing_Error;
+
+   -----------
+   -- Parse --
+   -----------
+
+   function Parse
+     (Parser         : in out Parser_Type;
+      Check_Complete : Boolean := True;
+      Rule           : Grammar_Rule) return Parsed_Node
+   is
+      Result : Bare_LK_Node;
+   begin
+      case Rule is
+         when Main_Rule_Rule =>
+            Result := Main_Rule_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Id_Rule =>
+            Result := Id_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Ref_Id_Rule =>
+            Result := Ref_Id_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Def_Id_Rule =>
+            Result := Def_Id_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Import_Stmt_Rule =>
+            Result := Import_Stmt_Transform_Parse_1
+              (Parser, First_Token_Index);
+         when Imports_Rule =>
+            Result := Imports_List_Parse_0
+              (Parser, First_Token_Index);
+         when Doc_Comment_Rule =>
+            Result := Doc_Comment_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Doc_Rule =>
+            Result := Doc_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Lexer_Decl_Rule =>
+            Result := Lexer_Decl_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Grammar_Decl_Rule =>
+            Result := Grammar_Decl_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Grammar_Rule_Rule =>
+            Result := Grammar_Rule_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Lexer_Rule_Rule =>
+            Result := Lexer_Rule_Or_Parse_0
+              (Parser, First_Token_Index);
+         when Lexer_Family_Decl_Rule =>
+            Result := Lexer_Family_Decl_Transform_Parse_1
+              (Parser, First_Token_Index);
+         when Lexer_Case_Rule_Rule =>
+            Result := Lexer_Case_Rule_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Lexer_Case_Alt_Rule =>
+            Result := Lexer_Case_Alt_Or_Parse_0
+              (Parser, First_Token_Index);
+         when Lexer_Case_Send_Rule =>
+            Result := Lexer_Case_Send_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Grammar_Primary_Rule =>
+            Result := Grammar_Primary_Or_Parse_0
+              (Parser, First_Token_Index);
+         when Grammar_Expr_Rule =>
+            Result := Grammar_Expr_Or_Parse_0
+              (Parser, First_Token_Index);
+         when Grammar_Pick_Rule =>
+            Result := Grammar_Pick_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Grammar_Implicit_Pick_Rule =>
+            Result := Grammar_Implicit_Pick_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Grammar_Opt_Rule =>
+            Result := Grammar_Opt_Or_Parse_0
+              (Parser, First_Token_Index);
+         when Grammar_Cut_Rule =>
+            Result := Grammar_Cut_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Grammar_Or_Expr_Rule =>
+            Result := Grammar_Or_Expr_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Grammar_Discard_Expr_Rule =>
+            Result := Grammar_Discard_Expr_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Token_Literal_Rule =>
+            Result := Token_Literal_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Token_No_Case_Literal_Rule =>
+            Result := Token_No_Case_Literal_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Token_Pattern_Literal_Rule =>
+            Result := Token_Pattern_Literal_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Parse_Node_Expr_Rule =>
+            Result := Parse_Node_Expr_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Grammar_Rule_Ref_Rule =>
+            Result := Grammar_Rule_Ref_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Grammar_List_Expr_Rule =>
+            Result := Grammar_List_Expr_Transform_Parse_2
+              (Parser, First_Token_Index);
+         when Grammar_Skip_Rule =>
+            Result := Grammar_Skip_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Grammar_Null_Rule =>
+            Result := Grammar_Null_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Grammar_Token_Rule =>
+            Result := Grammar_Token_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Type_Decl_Rule =>
+            Result := Type_Decl_Or_Parse_0
+              (Parser, First_Token_Index);
+         when Generic_Decl_Rule =>
+            Result := Generic_Decl_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Generic_Formal_Type_Rule =>
+            Result := Generic_Formal_Type_Transform_Parse_1
+              (Parser, First_Token_Index);
+         when Enum_Lit_Decl_Rule =>
+            Result := Enum_Lit_Decl_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Fun_Decl_Rule =>
+            Result := Fun_Decl_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Lambda_Arg_Decl_Rule =>
+            Result := Lambda_Arg_Decl_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Fun_Arg_Decl_Rule =>
+            Result := Fun_Arg_Decl_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Fun_Arg_List_Rule =>
+            Result := Fun_Arg_List_List_Parse_0
+              (Parser, First_Token_Index);
+         when Lambda_Arg_List_Rule =>
+            Result := Lambda_Arg_List_List_Parse_0
+              (Parser, First_Token_Index);
+         when Field_Decl_Rule =>
+            Result := Field_Decl_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Bare_Decl_Rule =>
+            Result := Bare_Decl_Or_Parse_0
+              (Parser, First_Token_Index);
+         when Decl_Rule =>
+            Result := Decl_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Type_Ref_Rule =>
+            Result := Type_Ref_Or_Parse_0
+              (Parser, First_Token_Index);
+         when Type_List_Rule =>
+            Result := Type_List_List_Parse_0
+              (Parser, First_Token_Index);
+         when Decls_Rule =>
+            Result := Decls_List_Parse_0
+              (Parser, First_Token_Index);
+         when Decl_Block_Rule =>
+            Result := Decl_Block_List_Parse_0
+              (Parser, First_Token_Index);
+         when Val_Decl_Rule =>
+            Result := Val_Decl_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Var_Bind_Rule =>
+            Result := Var_Bind_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Block_Rule =>
+            Result := Block_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Expr_Rule =>
+            Result := Expr_Or_Parse_1
+              (Parser, First_Token_Index);
+         when Rel_Rule =>
+            Result := Rel_Or_Parse_0
+              (Parser, First_Token_Index);
+         when Eq_Rule =>
+            Result := Eq_Or_Parse_1
+              (Parser, First_Token_Index);
+         when Arith_1_Rule =>
+            Result := Arith_1_Or_Parse_1
+              (Parser, First_Token_Index);
+         when Arith_2_Rule =>
+            Result := Arith_2_Or_Parse_1
+              (Parser, First_Token_Index);
+         when Isa_Or_Primary_Rule =>
+            Result := Isa_Or_Primary_Or_Parse_0
+              (Parser, First_Token_Index);
+         when Primary_Rule =>
+            Result := Primary_Or_Parse_0
+              (Parser, First_Token_Index);
+         when Match_Expr_Rule =>
+            Result := Match_Expr_Transform_Parse_2
+              (Parser, First_Token_Index);
+         when Num_Lit_Rule =>
+            Result := Num_Lit_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when String_Lit_Rule =>
+            Result := String_Lit_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Char_Lit_Rule =>
+            Result := Char_Lit_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when If_Expr_Rule =>
+            Result := If_Expr_Transform_Parse_1
+              (Parser, First_Token_Index);
+         when Raise_Expr_Rule =>
+            Result := Raise_Expr_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Try_Expr_Rule =>
+            Result := Try_Expr_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Array_Literal_Rule =>
+            Result := Array_Literal_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Logic_Rule =>
+            Result := Logic_Or_Parse_0
+              (Parser, First_Token_Index);
+         when Basic_Expr_Rule =>
+            Result := Basic_Expr_Or_Parse_0
+              (Parser, First_Token_Index);
+         when Term_Rule =>
+            Result := Term_Or_Parse_0
+              (Parser, First_Token_Index);
+         when Basic_Name_Rule =>
+            Result := Basic_Name_Or_Parse_0
+              (Parser, First_Token_Index);
+         when Lambda_Expr_Rule =>
+            Result := Lambda_Expr_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Null_Lit_Rule =>
+            Result := Null_Lit_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Param_Rule =>
+            Result := Param_Transform_Parse_0
+              (Parser, First_Token_Index);
+         when Params_Rule =>
+            Result := Params_List_Parse_0
+              (Parser, First_Token_Index);
+         when Decl_Annotation_Params_Rule =>
+            Result := Decl_Annotation_Params_Opt_Parse_0
+              (Parser, First_Token_Index);
+         when Decl_Annotation_Rule =>
+            Result := Decl_Annotation_Transform_Parse_0
+              (Parser, First_Token_Index);
+      end case;
+      Process_Parsing_Error (Parser, Check_Complete);
+      Set_Parents (Result, null);
+      return Parsed_Node (Result);
+   end Parse;
+
+   
+
+
+function Def_Id_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Def_Id
+is
+   use Bare_Def_Id_Memos;
+
+      Row_Pos_13 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_14 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_14 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_10 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Def_Id_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_10 := M.Instance;
+      return Transform_Res_10;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_10;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_13 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_14 := Row_Pos_13;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_14));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Identifier)
+   then
+       Token_Pos_14 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_13 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_13,
+             Expected_Token_Id => lkt_Identifier,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_14 := Row_Pos_13 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_14 /= No_Token_Index then
+
+   Row_Pos_13 := Token_Pos_14;
+
+else
+   Row_Pos_13 := No_Token_Index;
+   goto Exit_Row_10_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_10_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_13 /= No_Token_Index then
+
+   Transform_Res_10 := Allocate_Def_Id (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_10,
+      Kind => lkt_Def_Id,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_13 = Pos
+                            then No_Token_Index
+                            else Row_Pos_13 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Def_Id_Transform_Parse_0_Memo,
+      Row_Pos_13 /= No_Token_Index,
+      Transform_Res_10,
+      Pos,
+      Row_Pos_13);
+
+
+   Parser.Current_Pos := Row_Pos_13;
+
+   return Transform_Res_10;
+end Def_Id_Transform_Parse_0;
+
+   
+
+
+function Ref_Id_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Ref_Id
+is
+   use Bare_Ref_Id_Memos;
+
+      Row_Pos_18 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_22 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_22 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_15 :
+            Bare_Ref_Id
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Ref_Id_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_15 := M.Instance;
+      return Transform_Res_15;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_15;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_18 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_22 := Row_Pos_18;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_22));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Identifier)
+   then
+       Token_Pos_22 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_18 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_18,
+             Expected_Token_Id => lkt_Identifier,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_22 := Row_Pos_18 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_22 /= No_Token_Index then
+
+   Row_Pos_18 := Token_Pos_22;
+
+else
+   Row_Pos_18 := No_Token_Index;
+   goto Exit_Row_14_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_14_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_18 /= No_Token_Index then
+
+   Transform_Res_15 := Allocate_Ref_Id (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_15,
+      Kind => lkt_Ref_Id,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_18 = Pos
+                            then No_Token_Index
+                            else Row_Pos_18 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Ref_Id_Transform_Parse_0_Memo,
+      Row_Pos_18 /= No_Token_Index,
+      Transform_Res_15,
+      Pos,
+      Row_Pos_18);
+
+
+   Parser.Current_Pos := Row_Pos_18;
+
+   return Transform_Res_15;
+end Ref_Id_Transform_Parse_0;
+
+   
+
+
+function Basic_Name_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr
+is
+   use Bare_Expr_Memos;
+
+      Row_Pos_17 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_26 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_26 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_21 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_21 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_27 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_27 :
+            Bare_Ref_Id
+               := No_Bare_LK_Node;
+      Transform_Res_14 :
+            Bare_Dot_Expr
+               := No_Bare_LK_Node;
+      Defer_Pos_28 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_28 :
+            Bare_Ref_Id
+               := No_Bare_LK_Node;
+      Or_Pos_7 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_7 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+
+      Mem_Pos : Token_Index := Pos;
+      Mem_Res : Bare_Expr := No_Bare_LK_Node;
+
+   M : Memo_Entry := Get (Parser.Private_Part.Basic_Name_Or_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_7 := M.Instance;
+      return Or_Res_7;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_7;
+   end if;
+
+       Set (Parser.Private_Part.Basic_Name_Or_Parse_0_Memo, False, Or_Res_7, Pos, Mem_Pos);
+
+       <<Try_Again>>
+
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_7 := No_Token_Index;
+Or_Res_7 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_17 := Pos;
+
+
+
+Defer_Res_26 :=
+   Basic_Name_Or_Parse_0 (Parser, Row_Pos_17);
+Defer_Pos_26 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_26 /= No_Token_Index then
+
+   Row_Pos_17 := Defer_Pos_26;
+
+else
+   Row_Pos_17 := No_Token_Index;
+   goto Exit_Row_13_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_21 := Row_Pos_17;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_21));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Dot)
+   then
+       Token_Pos_21 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_17 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_17,
+             Expected_Token_Id => lkt_Dot,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_21 := Row_Pos_17 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_21 /= No_Token_Index then
+
+   Row_Pos_17 := Token_Pos_21;
+
+else
+   Row_Pos_17 := No_Token_Index;
+   goto Exit_Row_13_0;
+
+end if;
+
+
+Defer_Res_27 :=
+   Ref_Id_Transform_Parse_0 (Parser, Row_Pos_17);
+Defer_Pos_27 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_27 /= No_Token_Index then
+
+   Row_Pos_17 := Defer_Pos_27;
+
+else
+   Row_Pos_17 := No_Token_Index;
+   goto Exit_Row_13_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_13_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_17 /= No_Token_Index then
+
+   Transform_Res_14 := Allocate_Dot_Expr (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_14,
+      Kind => lkt_Dot_Expr,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_17 = Pos
+                            then No_Token_Index
+                            else Row_Pos_17 - 1));
+
+      Initialize_Fields_For_Dot_Expr
+        (Self => Transform_Res_14, Dot_Expr_F_Prefix => Defer_Res_26, Dot_Expr_F_Suffix => Defer_Res_27);
+
+         if Defer_Res_26 /= null and then Is_Incomplete (Defer_Res_26) then
+            Transform_Res_14.Last_Attempted_Child := 0;
+         elsif Defer_Res_26 /= null and then not Is_Ghost (Defer_Res_26) then
+            Transform_Res_14.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_27 /= null and then Is_Incomplete (Defer_Res_27) then
+            Transform_Res_14.Last_Attempted_Child := 0;
+         elsif Defer_Res_27 /= null and then not Is_Ghost (Defer_Res_27) then
+            Transform_Res_14.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_17 /= No_Token_Index then
+        Or_Pos_7 := Row_Pos_17;
+        Or_Res_7 := Transform_Res_14;
+        goto Exit_Or_7;
+    end if;
+    
+Defer_Res_28 :=
+   Ref_Id_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_28 := Parser.Current_Pos;
+
+    if Defer_Pos_28 /= No_Token_Index then
+        Or_Pos_7 := Defer_Pos_28;
+        Or_Res_7 := Defer_Res_28;
+        goto Exit_Or_7;
+    end if;
+<<Exit_Or_7>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+      if Or_Pos_7 > Mem_Pos then
+         Mem_Pos := Or_Pos_7;
+         Mem_Res := Or_Res_7;
+         Set
+           (Parser.Private_Part.Basic_Name_Or_Parse_0_Memo,
+            Or_Pos_7 /= No_Token_Index,
+            Or_Res_7,
+            Pos,
+            Or_Pos_7);
+         goto Try_Again;
+
+      elsif Mem_Pos > Pos then
+         Or_Res_7 := Mem_Res;
+         Or_Pos_7 := Mem_Pos;
+         goto No_Memo;
+      end if;
+
+   Set
+     (Parser.Private_Part.Basic_Name_Or_Parse_0_Memo,
+      Or_Pos_7 /= No_Token_Index,
+      Or_Res_7,
+      Pos,
+      Or_Pos_7);
+
+       <<No_Memo>>
+
+   Parser.Current_Pos := Or_Pos_7;
+
+   return Or_Res_7;
+end Basic_Name_Or_Parse_0;
+
+   
+
+
+function Type_List_List_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Type_Ref_List
+is
+   use Bare_Type_Ref_List_Memos;
+
+      Lst_Cpos_3 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_3 :
+            Free_Parse_List;
+      Defer_Pos_29 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_29 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Token_Pos_23 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_23 :
+            Token_Index
+               := No_Token_Index;
+      List_Pos_3 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_3 :
+            Bare_Type_Ref_List
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Type_List_List_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      List_Res_3 := M.Instance;
+      return List_Res_3;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return List_Res_3;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start list_code
+
+    List_Pos_3 := No_Token_Index;
+
+
+
+Lst_Cpos_3 := Pos;
+Tmp_List_3 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_29 :=
+   Type_Ref_Or_Parse_0 (Parser, Lst_Cpos_3);
+Defer_Pos_29 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_29 = No_Token_Index;
+
+   List_Pos_3 := Defer_Pos_29;
+   Lst_Cpos_3 := List_Pos_3;
+
+   Tmp_List_3.Nodes.Append (Defer_Res_29);
+
+      
+--  Start tok_code
+
+Token_Res_23 := Lst_Cpos_3;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_23));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Comma)
+   then
+       Token_Pos_23 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Lst_Cpos_3 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Lst_Cpos_3,
+             Expected_Token_Id => lkt_Comma,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_23 := Lst_Cpos_3 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+      if Token_Pos_23 /= No_Token_Index then
+          Lst_Cpos_3 := Token_Pos_23;
+      else
+         exit;
+      end if;
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_3.Nodes.Length;
+begin
+   List_Res_3 :=
+      Allocate_Type_Ref_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Pos;
+      Token_End := (if Lst_Cpos_3 = Pos
+                    then Pos
+                    else Lst_Cpos_3 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Pos, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_3,
+      Kind              => lkt_Type_Ref_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_3,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_3.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_3.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_3);
+
+--  End list_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Type_List_List_Parse_0_Memo,
+      List_Pos_3 /= No_Token_Index,
+      List_Res_3,
+      Pos,
+      List_Pos_3);
+
+
+   Parser.Current_Pos := List_Pos_3;
+
+   return List_Res_3;
+end Type_List_List_Parse_0;
+
+   
+
+
+function Type_Ref_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Type_Ref
+is
+   use Bare_Type_Ref_Memos;
+
+      Row_Pos_14 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_21 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_21 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_15 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_15 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_22 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_22 :
+            Bare_Type_Ref_List
+               := No_Bare_LK_Node;
+      Token_Pos_16 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_16 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_11 :
+            Bare_Generic_Type_Ref
+               := No_Bare_LK_Node;
+      Row_Pos_15 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_23 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_23 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_12 :
+            Bare_Simple_Type_Ref
+               := No_Bare_LK_Node;
+      Row_Pos_16 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_17 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_17 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_2 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_2 :
+            Free_Parse_List;
+      Defer_Pos_24 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_24 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Token_Pos_18 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_18 :
+            Token_Index
+               := No_Token_Index;
+      List_Pos_2 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_2 :
+            Bare_Type_Ref_List
+               := No_Bare_LK_Node;
+      Token_Pos_19 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_19 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_20 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_20 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_25 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_25 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Transform_Res_13 :
+            Bare_Function_Type_Ref
+               := No_Bare_LK_Node;
+      Or_Pos_6 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_6 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Type_Ref_Or_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_6 := M.Instance;
+      return Or_Res_6;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_6;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_6 := No_Token_Index;
+Or_Res_6 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_14 := Pos;
+
+
+
+Defer_Res_21 :=
+   Basic_Name_Or_Parse_0 (Parser, Row_Pos_14);
+Defer_Pos_21 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_21 /= No_Token_Index then
+
+   Row_Pos_14 := Defer_Pos_21;
+
+else
+   Row_Pos_14 := No_Token_Index;
+   goto Exit_Row_12_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_15 := Row_Pos_14;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_15));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Brack)
+   then
+       Token_Pos_15 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_14 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_14,
+             Expected_Token_Id => lkt_L_Brack,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_15 := Row_Pos_14 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_15 /= No_Token_Index then
+
+   Row_Pos_14 := Token_Pos_15;
+
+else
+   Row_Pos_14 := No_Token_Index;
+   goto Exit_Row_12_0;
+
+end if;
+
+
+Defer_Res_22 :=
+   Type_List_List_Parse_0 (Parser, Row_Pos_14);
+Defer_Pos_22 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_22 /= No_Token_Index then
+
+   Row_Pos_14 := Defer_Pos_22;
+
+else
+   Row_Pos_14 := No_Token_Index;
+   goto Exit_Row_12_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_16 := Row_Pos_14;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_16));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Brack)
+   then
+       Token_Pos_16 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_14 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_14,
+             Expected_Token_Id => lkt_R_Brack,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_16 := Row_Pos_14 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_16 /= No_Token_Index then
+
+   Row_Pos_14 := Token_Pos_16;
+
+else
+   Row_Pos_14 := No_Token_Index;
+   goto Exit_Row_12_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_12_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_14 /= No_Token_Index then
+
+   Transform_Res_11 := Allocate_Generic_Type_Ref (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_11,
+      Kind => lkt_Generic_Type_Ref,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_14 = Pos
+                            then No_Token_Index
+                            else Row_Pos_14 - 1));
+
+      Initialize_Fields_For_Generic_Type_Ref
+        (Self => Transform_Res_11, Generic_Type_Ref_F_Type_Name => Defer_Res_21, Generic_Type_Ref_F_Params => Defer_Res_22);
+
+         if Defer_Res_21 /= null and then Is_Incomplete (Defer_Res_21) then
+            Transform_Res_11.Last_Attempted_Child := 0;
+         elsif Defer_Res_21 /= null and then not Is_Ghost (Defer_Res_21) then
+            Transform_Res_11.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_22 /= null and then Is_Incomplete (Defer_Res_22) then
+            Transform_Res_11.Last_Attempted_Child := 0;
+         elsif Defer_Res_22 /= null and then not Is_Ghost (Defer_Res_22) then
+            Transform_Res_11.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_14 /= No_Token_Index then
+        Or_Pos_6 := Row_Pos_14;
+        Or_Res_6 := Transform_Res_11;
+        goto Exit_Or_6;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_15 := Pos;
+
+
+
+Defer_Res_23 :=
+   Basic_Name_Or_Parse_0 (Parser, Row_Pos_15);
+Defer_Pos_23 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_23 /= No_Token_Index then
+
+   Row_Pos_15 := Defer_Pos_23;
+
+else
+   Row_Pos_15 := No_Token_Index;
+   goto Exit_Row_15_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_15_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_15 /= No_Token_Index then
+
+   Transform_Res_12 := Allocate_Simple_Type_Ref (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_12,
+      Kind => lkt_Simple_Type_Ref,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_15 = Pos
+                            then No_Token_Index
+                            else Row_Pos_15 - 1));
+
+      Initialize_Fields_For_Simple_Type_Ref
+        (Self => Transform_Res_12, Simple_Type_Ref_F_Type_Name => Defer_Res_23);
+
+         if Defer_Res_23 /= null and then Is_Incomplete (Defer_Res_23) then
+            Transform_Res_12.Last_Attempted_Child := 0;
+         elsif Defer_Res_23 /= null and then not Is_Ghost (Defer_Res_23) then
+            Transform_Res_12.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_15 /= No_Token_Index then
+        Or_Pos_6 := Row_Pos_15;
+        Or_Res_6 := Transform_Res_12;
+        goto Exit_Or_6;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_16 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_17 := Row_Pos_16;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_17));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_17 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_16 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_16,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_17 := Row_Pos_16 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_17 /= No_Token_Index then
+
+   Row_Pos_16 := Token_Pos_17;
+
+else
+   Row_Pos_16 := No_Token_Index;
+   goto Exit_Row_16_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_2 := Row_Pos_16;
+
+
+
+Lst_Cpos_2 := Row_Pos_16;
+Tmp_List_2 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_24 :=
+   Type_Ref_Or_Parse_0 (Parser, Lst_Cpos_2);
+Defer_Pos_24 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_24 = No_Token_Index;
+
+   List_Pos_2 := Defer_Pos_24;
+   Lst_Cpos_2 := List_Pos_2;
+
+   Tmp_List_2.Nodes.Append (Defer_Res_24);
+
+      
+--  Start tok_code
+
+Token_Res_18 := Lst_Cpos_2;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_18));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Comma)
+   then
+       Token_Pos_18 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Lst_Cpos_2 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Lst_Cpos_2,
+             Expected_Token_Id => lkt_Comma,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_18 := Lst_Cpos_2 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+      if Token_Pos_18 /= No_Token_Index then
+          Lst_Cpos_2 := Token_Pos_18;
+      else
+         exit;
+      end if;
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_2.Nodes.Length;
+begin
+   List_Res_2 :=
+      Allocate_Type_Ref_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_16;
+      Token_End := (if Lst_Cpos_2 = Row_Pos_16
+                    then Row_Pos_16
+                    else Lst_Cpos_2 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_16, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_2,
+      Kind              => lkt_Type_Ref_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_2,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_2.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_2.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_2);
+
+--  End list_code
+
+
+
+if List_Pos_2 /= No_Token_Index then
+
+   Row_Pos_16 := List_Pos_2;
+
+else
+   Row_Pos_16 := No_Token_Index;
+   goto Exit_Row_16_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_19 := Row_Pos_16;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_19));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_19 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_16 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_16,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_19 := Row_Pos_16 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_19 /= No_Token_Index then
+
+   Row_Pos_16 := Token_Pos_19;
+
+else
+   Row_Pos_16 := No_Token_Index;
+   goto Exit_Row_16_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_20 := Row_Pos_16;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_20));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Right_Arrow)
+   then
+       Token_Pos_20 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_16 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_16,
+             Expected_Token_Id => lkt_Right_Arrow,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_20 := Row_Pos_16 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_20 /= No_Token_Index then
+
+   Row_Pos_16 := Token_Pos_20;
+
+else
+   Row_Pos_16 := No_Token_Index;
+   goto Exit_Row_16_0;
+
+end if;
+
+
+Defer_Res_25 :=
+   Type_Ref_Or_Parse_0 (Parser, Row_Pos_16);
+Defer_Pos_25 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_25 /= No_Token_Index then
+
+   Row_Pos_16 := Defer_Pos_25;
+
+else
+   Row_Pos_16 := No_Token_Index;
+   goto Exit_Row_16_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_16_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_16 /= No_Token_Index then
+
+   Transform_Res_13 := Allocate_Function_Type_Ref (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_13,
+      Kind => lkt_Function_Type_Ref,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_16 = Pos
+                            then No_Token_Index
+                            else Row_Pos_16 - 1));
+
+      Initialize_Fields_For_Function_Type_Ref
+        (Self => Transform_Res_13, Function_Type_Ref_F_Args_Types => List_Res_2, Function_Type_Ref_F_Return_Type => Defer_Res_25);
+
+         if List_Res_2 /= null and then Is_Incomplete (List_Res_2) then
+            Transform_Res_13.Last_Attempted_Child := 0;
+         elsif List_Res_2 /= null and then not Is_Ghost (List_Res_2) then
+            Transform_Res_13.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_25 /= null and then Is_Incomplete (Defer_Res_25) then
+            Transform_Res_13.Last_Attempted_Child := 0;
+         elsif Defer_Res_25 /= null and then not Is_Ghost (Defer_Res_25) then
+            Transform_Res_13.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_16 /= No_Token_Index then
+        Or_Pos_6 := Row_Pos_16;
+        Or_Res_6 := Transform_Res_13;
+        goto Exit_Or_6;
+    end if;
+<<Exit_Or_6>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Type_Ref_Or_Parse_0_Memo,
+      Or_Pos_6 /= No_Token_Index,
+      Or_Res_6,
+      Pos,
+      Or_Pos_6);
+
+
+   Parser.Current_Pos := Or_Pos_6;
+
+   return Or_Res_6;
+end Type_Ref_Or_Parse_0;
+
+   
+
+
+function Eq_Or_Parse_1
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr
+is
+   use Bare_Expr_Memos;
+
+      Row_Pos_23 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_35 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_35 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Row_Pos_24 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_27 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_27 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_20 :
+            Bare_Op_Lte
+               := No_Bare_LK_Node;
+      Row_Pos_25 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_28 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_28 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_21 :
+            Bare_Op_Lt
+               := No_Bare_LK_Node;
+      Row_Pos_26 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_29 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_29 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_22 :
+            Bare_Op_Gte
+               := No_Bare_LK_Node;
+      Row_Pos_27 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_30 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_30 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_23 :
+            Bare_Op_Gt
+               := No_Bare_LK_Node;
+      Row_Pos_28 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_31 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_31 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_24 :
+            Bare_Op_Eq
+               := No_Bare_LK_Node;
+      Or_Pos_11 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_11 :
+            Bare_Op
+               := No_Bare_LK_Node;
+      Defer_Pos_36 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_36 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_25 :
+            Bare_Bin_Op
+               := No_Bare_LK_Node;
+      Defer_Pos_37 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_37 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Or_Pos_12 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_12 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+
+      Mem_Pos : Token_Index := Pos;
+      Mem_Res : Bare_Expr := No_Bare_LK_Node;
+
+   M : Memo_Entry := Get (Parser.Private_Part.Eq_Or_Parse_1_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_12 := M.Instance;
+      return Or_Res_12;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_12;
+   end if;
+
+       Set (Parser.Private_Part.Eq_Or_Parse_1_Memo, False, Or_Res_12, Pos, Mem_Pos);
+
+       <<Try_Again>>
+
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_12 := No_Token_Index;
+Or_Res_12 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_23 := Pos;
+
+
+
+Defer_Res_35 :=
+   Eq_Or_Parse_1 (Parser, Row_Pos_23);
+Defer_Pos_35 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_35 /= No_Token_Index then
+
+   Row_Pos_23 := Defer_Pos_35;
+
+else
+   Row_Pos_23 := No_Token_Index;
+   goto Exit_Row_22_0;
+
+end if;
+
+
+--  Start or_code
+
+Or_Pos_11 := No_Token_Index;
+Or_Res_11 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_24 := Row_Pos_23;
+
+
+
+--  Start tok_code
+
+Token_Res_27 := Row_Pos_24;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_27));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_LTE)
+   then
+       Token_Pos_27 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_24 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_24,
+             Expected_Token_Id => lkt_LTE,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_27 := Row_Pos_24 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_27 /= No_Token_Index then
+
+   Row_Pos_24 := Token_Pos_27;
+
+else
+   Row_Pos_24 := No_Token_Index;
+   goto Exit_Row_23_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_23_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_24 /= No_Token_Index then
+
+   Transform_Res_20 := Allocate_Op_Lte (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_20,
+      Kind => lkt_Op_Lte,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_23,
+      Token_End_Index   => (if Row_Pos_24 = Row_Pos_23
+                            then No_Token_Index
+                            else Row_Pos_24 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_24 /= No_Token_Index then
+        Or_Pos_11 := Row_Pos_24;
+        Or_Res_11 := Transform_Res_20;
+        goto Exit_Or_12;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_25 := Row_Pos_23;
+
+
+
+--  Start tok_code
+
+Token_Res_28 := Row_Pos_25;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_28));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_LT)
+   then
+       Token_Pos_28 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_25 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_25,
+             Expected_Token_Id => lkt_LT,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_28 := Row_Pos_25 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_28 /= No_Token_Index then
+
+   Row_Pos_25 := Token_Pos_28;
+
+else
+   Row_Pos_25 := No_Token_Index;
+   goto Exit_Row_24_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_24_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_25 /= No_Token_Index then
+
+   Transform_Res_21 := Allocate_Op_Lt (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_21,
+      Kind => lkt_Op_Lt,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_23,
+      Token_End_Index   => (if Row_Pos_25 = Row_Pos_23
+                            then No_Token_Index
+                            else Row_Pos_25 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_25 /= No_Token_Index then
+        Or_Pos_11 := Row_Pos_25;
+        Or_Res_11 := Transform_Res_21;
+        goto Exit_Or_12;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_26 := Row_Pos_23;
+
+
+
+--  Start tok_code
+
+Token_Res_29 := Row_Pos_26;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_29));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_GTE)
+   then
+       Token_Pos_29 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_26 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_26,
+             Expected_Token_Id => lkt_GTE,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_29 := Row_Pos_26 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_29 /= No_Token_Index then
+
+   Row_Pos_26 := Token_Pos_29;
+
+else
+   Row_Pos_26 := No_Token_Index;
+   goto Exit_Row_25_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_25_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_26 /= No_Token_Index then
+
+   Transform_Res_22 := Allocate_Op_Gte (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_22,
+      Kind => lkt_Op_Gte,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_23,
+      Token_End_Index   => (if Row_Pos_26 = Row_Pos_23
+                            then No_Token_Index
+                            else Row_Pos_26 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_26 /= No_Token_Index then
+        Or_Pos_11 := Row_Pos_26;
+        Or_Res_11 := Transform_Res_22;
+        goto Exit_Or_12;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_27 := Row_Pos_23;
+
+
+
+--  Start tok_code
+
+Token_Res_30 := Row_Pos_27;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_30));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_GT)
+   then
+       Token_Pos_30 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_27 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_27,
+             Expected_Token_Id => lkt_GT,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_30 := Row_Pos_27 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_30 /= No_Token_Index then
+
+   Row_Pos_27 := Token_Pos_30;
+
+else
+   Row_Pos_27 := No_Token_Index;
+   goto Exit_Row_26_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_26_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_27 /= No_Token_Index then
+
+   Transform_Res_23 := Allocate_Op_Gt (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_23,
+      Kind => lkt_Op_Gt,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_23,
+      Token_End_Index   => (if Row_Pos_27 = Row_Pos_23
+                            then No_Token_Index
+                            else Row_Pos_27 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_27 /= No_Token_Index then
+        Or_Pos_11 := Row_Pos_27;
+        Or_Res_11 := Transform_Res_23;
+        goto Exit_Or_12;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_28 := Row_Pos_23;
+
+
+
+--  Start tok_code
+
+Token_Res_31 := Row_Pos_28;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_31));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Equal)
+   then
+       Token_Pos_31 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_28 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_28,
+             Expected_Token_Id => lkt_Equal,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_31 := Row_Pos_28 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_31 /= No_Token_Index then
+
+   Row_Pos_28 := Token_Pos_31;
+
+else
+   Row_Pos_28 := No_Token_Index;
+   goto Exit_Row_27_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_27_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_28 /= No_Token_Index then
+
+   Transform_Res_24 := Allocate_Op_Eq (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_24,
+      Kind => lkt_Op_Eq,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_23,
+      Token_End_Index   => (if Row_Pos_28 = Row_Pos_23
+                            then No_Token_Index
+                            else Row_Pos_28 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_28 /= No_Token_Index then
+        Or_Pos_11 := Row_Pos_28;
+        Or_Res_11 := Transform_Res_24;
+        goto Exit_Or_12;
+    end if;
+<<Exit_Or_12>>
+
+--  End or_code
+
+
+
+if Or_Pos_11 /= No_Token_Index then
+
+   Row_Pos_23 := Or_Pos_11;
+
+else
+   Row_Pos_23 := No_Token_Index;
+   goto Exit_Row_22_0;
+
+end if;
+
+
+Defer_Res_36 :=
+   Arith_1_Or_Parse_1 (Parser, Row_Pos_23);
+Defer_Pos_36 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_36 /= No_Token_Index then
+
+   Row_Pos_23 := Defer_Pos_36;
+
+else
+   Row_Pos_23 := No_Token_Index;
+   goto Exit_Row_22_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_22_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_23 /= No_Token_Index then
+
+   Transform_Res_25 := Allocate_Bin_Op (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_25,
+      Kind => lkt_Bin_Op,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_23 = Pos
+                            then No_Token_Index
+                            else Row_Pos_23 - 1));
+
+      Initialize_Fields_For_Bin_Op
+        (Self => Transform_Res_25, Bin_Op_F_Left => Defer_Res_35, Bin_Op_F_Op => Or_Res_11, Bin_Op_F_Right => Defer_Res_36);
+
+         if Defer_Res_35 /= null and then Is_Incomplete (Defer_Res_35) then
+            Transform_Res_25.Last_Attempted_Child := 0;
+         elsif Defer_Res_35 /= null and then not Is_Ghost (Defer_Res_35) then
+            Transform_Res_25.Last_Attempted_Child := -1;
+         end if;
+         if Or_Res_11 /= null and then Is_Incomplete (Or_Res_11) then
+            Transform_Res_25.Last_Attempted_Child := 0;
+         elsif Or_Res_11 /= null and then not Is_Ghost (Or_Res_11) then
+            Transform_Res_25.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_36 /= null and then Is_Incomplete (Defer_Res_36) then
+            Transform_Res_25.Last_Attempted_Child := 0;
+         elsif Defer_Res_36 /= null and then not Is_Ghost (Defer_Res_36) then
+            Transform_Res_25.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_23 /= No_Token_Index then
+        Or_Pos_12 := Row_Pos_23;
+        Or_Res_12 := Transform_Res_25;
+        goto Exit_Or_11;
+    end if;
+    
+Defer_Res_37 :=
+   Arith_1_Or_Parse_1 (Parser, Pos);
+Defer_Pos_37 := Parser.Current_Pos;
+
+    if Defer_Pos_37 /= No_Token_Index then
+        Or_Pos_12 := Defer_Pos_37;
+        Or_Res_12 := Defer_Res_37;
+        goto Exit_Or_11;
+    end if;
+<<Exit_Or_11>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+      if Or_Pos_12 > Mem_Pos then
+         Mem_Pos := Or_Pos_12;
+         Mem_Res := Or_Res_12;
+         Set
+           (Parser.Private_Part.Eq_Or_Parse_1_Memo,
+            Or_Pos_12 /= No_Token_Index,
+            Or_Res_12,
+            Pos,
+            Or_Pos_12);
+         goto Try_Again;
+
+      elsif Mem_Pos > Pos then
+         Or_Res_12 := Mem_Res;
+         Or_Pos_12 := Mem_Pos;
+         goto No_Memo;
+      end if;
+
+   Set
+     (Parser.Private_Part.Eq_Or_Parse_1_Memo,
+      Or_Pos_12 /= No_Token_Index,
+      Or_Res_12,
+      Pos,
+      Or_Pos_12);
+
+       <<No_Memo>>
+
+   Parser.Current_Pos := Or_Pos_12;
+
+   return Or_Res_12;
+end Eq_Or_Parse_1;
+
+   
+
+
+function Rel_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr
+is
+   use Bare_Expr_Memos;
+
+      Row_Pos_22 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_26 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_26 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_33 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_33 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_19 :
+            Bare_Not_Expr
+               := No_Bare_LK_Node;
+      Defer_Pos_34 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_34 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Or_Pos_10 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_10 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Rel_Or_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_10 := M.Instance;
+      return Or_Res_10;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_10;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_10 := No_Token_Index;
+Or_Res_10 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_22 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_26 := Row_Pos_22;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_26));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Not_Kw)
+   then
+       Token_Pos_26 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_22 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_22,
+             Expected_Token_Id => lkt_Not_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_26 := Row_Pos_22 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_26 /= No_Token_Index then
+
+   Row_Pos_22 := Token_Pos_26;
+
+else
+   Row_Pos_22 := No_Token_Index;
+   goto Exit_Row_21_0;
+
+end if;
+
+
+Defer_Res_33 :=
+   Eq_Or_Parse_1 (Parser, Row_Pos_22);
+Defer_Pos_33 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_33 /= No_Token_Index then
+
+   Row_Pos_22 := Defer_Pos_33;
+
+else
+   Row_Pos_22 := No_Token_Index;
+   goto Exit_Row_21_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_21_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_22 /= No_Token_Index then
+
+   Transform_Res_19 := Allocate_Not_Expr (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_19,
+      Kind => lkt_Not_Expr,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_22 = Pos
+                            then No_Token_Index
+                            else Row_Pos_22 - 1));
+
+      Initialize_Fields_For_Not_Expr
+        (Self => Transform_Res_19, Not_Expr_F_Expr => Defer_Res_33);
+
+         if Defer_Res_33 /= null and then Is_Incomplete (Defer_Res_33) then
+            Transform_Res_19.Last_Attempted_Child := 0;
+         elsif Defer_Res_33 /= null and then not Is_Ghost (Defer_Res_33) then
+            Transform_Res_19.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_22 /= No_Token_Index then
+        Or_Pos_10 := Row_Pos_22;
+        Or_Res_10 := Transform_Res_19;
+        goto Exit_Or_10;
+    end if;
+    
+Defer_Res_34 :=
+   Eq_Or_Parse_1 (Parser, Pos);
+Defer_Pos_34 := Parser.Current_Pos;
+
+    if Defer_Pos_34 /= No_Token_Index then
+        Or_Pos_10 := Defer_Pos_34;
+        Or_Res_10 := Defer_Res_34;
+        goto Exit_Or_10;
+    end if;
+<<Exit_Or_10>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Rel_Or_Parse_0_Memo,
+      Or_Pos_10 /= No_Token_Index,
+      Or_Res_10,
+      Pos,
+      Or_Pos_10);
+
+
+   Parser.Current_Pos := Or_Pos_10;
+
+   return Or_Res_10;
+end Rel_Or_Parse_0;
+
+   
+
+
+function Expr_Or_Parse_1
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr
+is
+   use Bare_Expr_Memos;
+
+      Row_Pos_19 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_30 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_30 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Row_Pos_20 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_24 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_24 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_16 :
+            Bare_Op_Or
+               := No_Bare_LK_Node;
+      Row_Pos_21 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_25 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_25 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_17 :
+            Bare_Op_And
+               := No_Bare_LK_Node;
+      Or_Pos_8 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_8 :
+            Bare_Op
+               := No_Bare_LK_Node;
+      Defer_Pos_31 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_31 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_18 :
+            Bare_Bin_Op
+               := No_Bare_LK_Node;
+      Defer_Pos_32 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_32 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Or_Pos_9 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_9 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+
+      Mem_Pos : Token_Index := Pos;
+      Mem_Res : Bare_Expr := No_Bare_LK_Node;
+
+   M : Memo_Entry := Get (Parser.Private_Part.Expr_Or_Parse_1_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_9 := M.Instance;
+      return Or_Res_9;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_9;
+   end if;
+
+       Set (Parser.Private_Part.Expr_Or_Parse_1_Memo, False, Or_Res_9, Pos, Mem_Pos);
+
+       <<Try_Again>>
+
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_9 := No_Token_Index;
+Or_Res_9 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_19 := Pos;
+
+
+
+Defer_Res_30 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_19);
+Defer_Pos_30 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_30 /= No_Token_Index then
+
+   Row_Pos_19 := Defer_Pos_30;
+
+else
+   Row_Pos_19 := No_Token_Index;
+   goto Exit_Row_18_0;
+
+end if;
+
+
+--  Start or_code
+
+Or_Pos_8 := No_Token_Index;
+Or_Res_8 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_20 := Row_Pos_19;
+
+
+
+--  Start tok_code
+
+Token_Res_24 := Row_Pos_20;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_24));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Or_Kw)
+   then
+       Token_Pos_24 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_20 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_20,
+             Expected_Token_Id => lkt_Or_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_24 := Row_Pos_20 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_24 /= No_Token_Index then
+
+   Row_Pos_20 := Token_Pos_24;
+
+else
+   Row_Pos_20 := No_Token_Index;
+   goto Exit_Row_19_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_19_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_20 /= No_Token_Index then
+
+   Transform_Res_16 := Allocate_Op_Or (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_16,
+      Kind => lkt_Op_Or,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_19,
+      Token_End_Index   => (if Row_Pos_20 = Row_Pos_19
+                            then No_Token_Index
+                            else Row_Pos_20 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_20 /= No_Token_Index then
+        Or_Pos_8 := Row_Pos_20;
+        Or_Res_8 := Transform_Res_16;
+        goto Exit_Or_9;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_21 := Row_Pos_19;
+
+
+
+--  Start tok_code
+
+Token_Res_25 := Row_Pos_21;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_25));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_And_Kw)
+   then
+       Token_Pos_25 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_21 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_21,
+             Expected_Token_Id => lkt_And_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_25 := Row_Pos_21 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_25 /= No_Token_Index then
+
+   Row_Pos_21 := Token_Pos_25;
+
+else
+   Row_Pos_21 := No_Token_Index;
+   goto Exit_Row_20_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_20_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_21 /= No_Token_Index then
+
+   Transform_Res_17 := Allocate_Op_And (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_17,
+      Kind => lkt_Op_And,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_19,
+      Token_End_Index   => (if Row_Pos_21 = Row_Pos_19
+                            then No_Token_Index
+                            else Row_Pos_21 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_21 /= No_Token_Index then
+        Or_Pos_8 := Row_Pos_21;
+        Or_Res_8 := Transform_Res_17;
+        goto Exit_Or_9;
+    end if;
+<<Exit_Or_9>>
+
+--  End or_code
+
+
+
+if Or_Pos_8 /= No_Token_Index then
+
+   Row_Pos_19 := Or_Pos_8;
+
+else
+   Row_Pos_19 := No_Token_Index;
+   goto Exit_Row_18_0;
+
+end if;
+
+
+Defer_Res_31 :=
+   Rel_Or_Parse_0 (Parser, Row_Pos_19);
+Defer_Pos_31 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_31 /= No_Token_Index then
+
+   Row_Pos_19 := Defer_Pos_31;
+
+else
+   Row_Pos_19 := No_Token_Index;
+   goto Exit_Row_18_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_18_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_19 /= No_Token_Index then
+
+   Transform_Res_18 := Allocate_Bin_Op (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_18,
+      Kind => lkt_Bin_Op,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_19 = Pos
+                            then No_Token_Index
+                            else Row_Pos_19 - 1));
+
+      Initialize_Fields_For_Bin_Op
+        (Self => Transform_Res_18, Bin_Op_F_Left => Defer_Res_30, Bin_Op_F_Op => Or_Res_8, Bin_Op_F_Right => Defer_Res_31);
+
+         if Defer_Res_30 /= null and then Is_Incomplete (Defer_Res_30) then
+            Transform_Res_18.Last_Attempted_Child := 0;
+         elsif Defer_Res_30 /= null and then not Is_Ghost (Defer_Res_30) then
+            Transform_Res_18.Last_Attempted_Child := -1;
+         end if;
+         if Or_Res_8 /= null and then Is_Incomplete (Or_Res_8) then
+            Transform_Res_18.Last_Attempted_Child := 0;
+         elsif Or_Res_8 /= null and then not Is_Ghost (Or_Res_8) then
+            Transform_Res_18.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_31 /= null and then Is_Incomplete (Defer_Res_31) then
+            Transform_Res_18.Last_Attempted_Child := 0;
+         elsif Defer_Res_31 /= null and then not Is_Ghost (Defer_Res_31) then
+            Transform_Res_18.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_19 /= No_Token_Index then
+        Or_Pos_9 := Row_Pos_19;
+        Or_Res_9 := Transform_Res_18;
+        goto Exit_Or_8;
+    end if;
+    
+Defer_Res_32 :=
+   Rel_Or_Parse_0 (Parser, Pos);
+Defer_Pos_32 := Parser.Current_Pos;
+
+    if Defer_Pos_32 /= No_Token_Index then
+        Or_Pos_9 := Defer_Pos_32;
+        Or_Res_9 := Defer_Res_32;
+        goto Exit_Or_8;
+    end if;
+<<Exit_Or_8>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+      if Or_Pos_9 > Mem_Pos then
+         Mem_Pos := Or_Pos_9;
+         Mem_Res := Or_Res_9;
+         Set
+           (Parser.Private_Part.Expr_Or_Parse_1_Memo,
+            Or_Pos_9 /= No_Token_Index,
+            Or_Res_9,
+            Pos,
+            Or_Pos_9);
+         goto Try_Again;
+
+      elsif Mem_Pos > Pos then
+         Or_Res_9 := Mem_Res;
+         Or_Pos_9 := Mem_Pos;
+         goto No_Memo;
+      end if;
+
+   Set
+     (Parser.Private_Part.Expr_Or_Parse_1_Memo,
+      Or_Pos_9 /= No_Token_Index,
+      Or_Res_9,
+      Pos,
+      Or_Pos_9);
+
+       <<No_Memo>>
+
+   Parser.Current_Pos := Or_Pos_9;
+
+   return Or_Res_9;
+end Expr_Or_Parse_1;
+
+   
+
+
+function Lambda_Arg_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Lambda_Arg_Decl
+is
+   use Bare_Lambda_Arg_Decl_Memos;
+
+      Row_Pos_10 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_18 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_18 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Row_Pos_11 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_12 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_12 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_19 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_19 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Row_Pos_12 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_13 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_13 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_20 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_20 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_9 :
+            Bare_Lambda_Arg_Decl
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Lambda_Arg_Decl_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_9 := M.Instance;
+      return Transform_Res_9;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_9;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_10 := Pos;
+
+
+
+Defer_Res_18 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_10);
+Defer_Pos_18 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_18 /= No_Token_Index then
+
+   Row_Pos_10 := Defer_Pos_18;
+
+else
+   Row_Pos_10 := No_Token_Index;
+   goto Exit_Row_9_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_11 := Row_Pos_10;
+
+
+
+--  Start tok_code
+
+Token_Res_12 := Row_Pos_11;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_12));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Colon)
+   then
+       Token_Pos_12 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_11 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_11,
+             Expected_Token_Id => lkt_Colon,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_12 := Row_Pos_11 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_12 /= No_Token_Index then
+
+   Row_Pos_11 := Token_Pos_12;
+
+else
+   Row_Pos_11 := No_Token_Index;
+   goto Exit_Row_11_0;
+
+end if;
+
+
+Defer_Res_19 :=
+   Type_Ref_Or_Parse_0 (Parser, Row_Pos_11);
+Defer_Pos_19 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_19 /= No_Token_Index then
+
+   Row_Pos_11 := Defer_Pos_19;
+
+else
+   Row_Pos_11 := No_Token_Index;
+   goto Exit_Row_11_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_11_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_11 = No_Token_Index then
+
+        Defer_Res_19 := No_Bare_LK_Node;
+
+
+    Row_Pos_11 := Row_Pos_10;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_11 /= No_Token_Index then
+
+   Row_Pos_10 := Row_Pos_11;
+
+else
+   Row_Pos_10 := No_Token_Index;
+   goto Exit_Row_9_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_12 := Row_Pos_10;
+
+
+
+--  Start tok_code
+
+Token_Res_13 := Row_Pos_12;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_13));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Equal)
+   then
+       Token_Pos_13 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_12 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_12,
+             Expected_Token_Id => lkt_Equal,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_13 := Row_Pos_12 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_13 /= No_Token_Index then
+
+   Row_Pos_12 := Token_Pos_13;
+
+else
+   Row_Pos_12 := No_Token_Index;
+   goto Exit_Row_17_0;
+
+end if;
+
+
+Defer_Res_20 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_12);
+Defer_Pos_20 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_20 /= No_Token_Index then
+
+   Row_Pos_12 := Defer_Pos_20;
+
+else
+   Row_Pos_12 := No_Token_Index;
+   goto Exit_Row_17_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_17_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_12 = No_Token_Index then
+
+        Defer_Res_20 := No_Bare_LK_Node;
+
+
+    Row_Pos_12 := Row_Pos_10;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_12 /= No_Token_Index then
+
+   Row_Pos_10 := Row_Pos_12;
+
+else
+   Row_Pos_10 := No_Token_Index;
+   goto Exit_Row_9_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_9_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_10 /= No_Token_Index then
+
+   Transform_Res_9 := Allocate_Lambda_Arg_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_9,
+      Kind => lkt_Lambda_Arg_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_10 = Pos
+                            then No_Token_Index
+                            else Row_Pos_10 - 1));
+
+      Initialize_Fields_For_Lambda_Arg_Decl
+        (Self => Transform_Res_9, User_Val_Decl_F_Syn_Name => Defer_Res_18, Lambda_Arg_Decl_F_Decl_Type => Defer_Res_19, Lambda_Arg_Decl_F_Default_Val => Defer_Res_20);
+
+         if Defer_Res_18 /= null and then Is_Incomplete (Defer_Res_18) then
+            Transform_Res_9.Last_Attempted_Child := 0;
+         elsif Defer_Res_18 /= null and then not Is_Ghost (Defer_Res_18) then
+            Transform_Res_9.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_19 /= null and then Is_Incomplete (Defer_Res_19) then
+            Transform_Res_9.Last_Attempted_Child := 0;
+         elsif Defer_Res_19 /= null and then not Is_Ghost (Defer_Res_19) then
+            Transform_Res_9.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_20 /= null and then Is_Incomplete (Defer_Res_20) then
+            Transform_Res_9.Last_Attempted_Child := 0;
+         elsif Defer_Res_20 /= null and then not Is_Ghost (Defer_Res_20) then
+            Transform_Res_9.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Lambda_Arg_Decl_Transform_Parse_0_Memo,
+      Row_Pos_10 /= No_Token_Index,
+      Transform_Res_9,
+      Pos,
+      Row_Pos_10);
+
+
+   Parser.Current_Pos := Row_Pos_10;
+
+   return Transform_Res_9;
+end Lambda_Arg_Decl_Transform_Parse_0;
+
+   
+
+
+function Lambda_Arg_List_List_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Lambda_Arg_Decl_List
+is
+   use Bare_Lambda_Arg_Decl_List_Memos;
+
+      Lst_Cpos_1 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_1 :
+            Free_Parse_List;
+      Defer_Pos_17 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_17 :
+            Bare_Lambda_Arg_Decl
+               := No_Bare_LK_Node;
+      Token_Pos_11 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_11 :
+            Token_Index
+               := No_Token_Index;
+      List_Pos_1 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_1 :
+            Bare_Lambda_Arg_Decl_List
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Lambda_Arg_List_List_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      List_Res_1 := M.Instance;
+      return List_Res_1;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return List_Res_1;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start list_code
+
+    List_Pos_1 := Pos;
+
+
+
+Lst_Cpos_1 := Pos;
+Tmp_List_1 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_17 :=
+   Lambda_Arg_Decl_Transform_Parse_0 (Parser, Lst_Cpos_1);
+Defer_Pos_17 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_17 = No_Token_Index;
+
+   List_Pos_1 := Defer_Pos_17;
+   Lst_Cpos_1 := List_Pos_1;
+
+   Tmp_List_1.Nodes.Append (Defer_Res_17);
+
+      
+--  Start tok_code
+
+Token_Res_11 := Lst_Cpos_1;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_11));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Comma)
+   then
+       Token_Pos_11 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Lst_Cpos_1 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Lst_Cpos_1,
+             Expected_Token_Id => lkt_Comma,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_11 := Lst_Cpos_1 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+      if Token_Pos_11 /= No_Token_Index then
+          Lst_Cpos_1 := Token_Pos_11;
+      else
+         exit;
+      end if;
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_1.Nodes.Length;
+begin
+   List_Res_1 :=
+      Allocate_Lambda_Arg_Decl_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Pos;
+      Token_End := (if Lst_Cpos_1 = Pos
+                    then Pos
+                    else Lst_Cpos_1 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Pos, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_1,
+      Kind              => lkt_Lambda_Arg_Decl_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_1,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_1.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_1.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_1);
+
+--  End list_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Lambda_Arg_List_List_Parse_0_Memo,
+      List_Pos_1 /= No_Token_Index,
+      List_Res_1,
+      Pos,
+      List_Pos_1);
+
+
+   Parser.Current_Pos := List_Pos_1;
+
+   return List_Res_1;
+end Lambda_Arg_List_List_Parse_0;
+
+   
+
+
+function Lambda_Expr_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Lambda_Expr
+is
+   use Bare_Lambda_Expr_Memos;
+
+      Nobt_0 :
+            Boolean
+               := False;
+      Row_Pos_8 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_7 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_7 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_14 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_14 :
+            Bare_Lambda_Arg_Decl_List
+               := No_Bare_LK_Node;
+      Token_Pos_8 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_8 :
+            Token_Index
+               := No_Token_Index;
+      Row_Pos_9 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_9 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_9 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_15 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_15 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Token_Pos_10 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_10 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_16 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_16 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Row_Progress_0 :
+            Integer
+               := 0;
+      Transform_Res_8 :
+            Bare_Lambda_Expr
+               := No_Bare_LK_Node;
+      Transform_Has_Failed_0 :
+            Boolean
+               := False;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Lambda_Expr_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_8 := M.Instance;
+      return Transform_Res_8;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_8;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_8 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_7 := Row_Pos_8;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_7));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_7 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_8 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_8,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_7 := Row_Pos_8 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+Row_Progress_0 := 1;
+
+if Token_Pos_7 /= No_Token_Index then
+
+   Row_Pos_8 := Token_Pos_7;
+
+else
+   Row_Pos_8 := No_Token_Index;
+   goto Exit_Row_8_0;
+
+end if;
+
+
+Defer_Res_14 :=
+   Lambda_Arg_List_List_Parse_0 (Parser, Row_Pos_8);
+Defer_Pos_14 := Parser.Current_Pos;
+
+
+Row_Progress_0 := 2;
+
+if Defer_Pos_14 /= No_Token_Index then
+
+   Row_Pos_8 := Defer_Pos_14;
+
+else
+   Row_Pos_8 := No_Token_Index;
+   goto Exit_Row_8_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_8 := Row_Pos_8;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_8));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_8 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_8 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_8,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_8 := Row_Pos_8 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+Row_Progress_0 := 3;
+
+if Token_Pos_8 /= No_Token_Index then
+
+   Row_Pos_8 := Token_Pos_8;
+
+else
+   Row_Pos_8 := No_Token_Index;
+   goto Exit_Row_8_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_9 := Row_Pos_8;
+
+
+
+--  Start tok_code
+
+Token_Res_9 := Row_Pos_9;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_9));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Colon)
+   then
+       Token_Pos_9 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_9 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_9,
+             Expected_Token_Id => lkt_Colon,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_9 := Row_Pos_9 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_9 /= No_Token_Index then
+
+   Row_Pos_9 := Token_Pos_9;
+
+else
+   Row_Pos_9 := No_Token_Index;
+   goto Exit_Row_28_0;
+
+end if;
+
+
+Defer_Res_15 :=
+   Type_Ref_Or_Parse_0 (Parser, Row_Pos_9);
+Defer_Pos_15 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_15 /= No_Token_Index then
+
+   Row_Pos_9 := Defer_Pos_15;
+
+else
+   Row_Pos_9 := No_Token_Index;
+   goto Exit_Row_28_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_28_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_9 = No_Token_Index then
+
+        Defer_Res_15 := No_Bare_LK_Node;
+
+
+    Row_Pos_9 := Row_Pos_8;
+
+
+end if;
+
+--  End opt_code
+
+
+Row_Progress_0 := 4;
+
+if Row_Pos_9 /= No_Token_Index then
+
+   Row_Pos_8 := Row_Pos_9;
+
+else
+   Row_Pos_8 := No_Token_Index;
+   goto Exit_Row_8_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_10 := Row_Pos_8;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_10));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Fat_Right_Arrow)
+   then
+       Token_Pos_10 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_8 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_8,
+             Expected_Token_Id => lkt_Fat_Right_Arrow,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_10 := Row_Pos_8 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+Row_Progress_0 := 5;
+
+if Token_Pos_10 /= No_Token_Index then
+
+   Row_Pos_8 := Token_Pos_10;
+
+else
+   Row_Pos_8 := No_Token_Index;
+   goto Exit_Row_8_0;
+
+end if;
+
+Nobt_0 := True;
+
+Row_Progress_0 := 6;
+
+if Row_Pos_8 /= No_Token_Index then
+
+   Row_Pos_8 := Row_Pos_8;
+
+else
+   Row_Pos_8 := No_Token_Index;
+   goto Exit_Row_8_0;
+
+end if;
+
+
+Defer_Res_16 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_8);
+Defer_Pos_16 := Parser.Current_Pos;
+
+
+Row_Progress_0 := 7;
+
+if Defer_Pos_16 /= No_Token_Index then
+
+   Row_Pos_8 := Defer_Pos_16;
+
+else
+   Row_Pos_8 := No_Token_Index;
+   goto Exit_Row_8_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_8_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_8 = No_Token_Index and then Nobt_0 then
+   Row_Pos_8 := Parser.Last_Fail.Pos;
+   Transform_Has_Failed_0 := True;
+end if;
+
+if Row_Pos_8 /= No_Token_Index then
+
+   Transform_Res_8 := Allocate_Lambda_Expr (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_8,
+      Kind => lkt_Lambda_Expr,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_8 = Pos
+                            then No_Token_Index
+                            else Row_Pos_8 - 1));
+
+      Initialize_Fields_For_Lambda_Expr
+        (Self => Transform_Res_8, Lambda_Expr_F_Params => Defer_Res_14, Lambda_Expr_F_Return_Type => Defer_Res_15, Lambda_Expr_F_Body => Defer_Res_16);
+
+         if Defer_Res_14 /= null and then Is_Incomplete (Defer_Res_14) then
+            Transform_Res_8.Last_Attempted_Child := 0;
+         elsif Defer_Res_14 /= null and then not Is_Ghost (Defer_Res_14) then
+            Transform_Res_8.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_15 /= null and then Is_Incomplete (Defer_Res_15) then
+            Transform_Res_8.Last_Attempted_Child := 0;
+         elsif Defer_Res_15 /= null and then not Is_Ghost (Defer_Res_15) then
+            Transform_Res_8.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_16 /= null and then Is_Incomplete (Defer_Res_16) then
+            Transform_Res_8.Last_Attempted_Child := 0;
+         elsif Defer_Res_16 /= null and then not Is_Ghost (Defer_Res_16) then
+            Transform_Res_8.Last_Attempted_Child := -1;
+         end if;
+
+   if Transform_Has_Failed_0 then
+      Transform_Res_8.Last_Attempted_Child :=
+         Row_Progress_0;
+
+      Append (Parser.Diagnostics,
+              Sloc_Range (Parser.TDH.all,
+                          Get_Token (Parser.TDH.all, Pos)),
+              To_Text ("Cannot parse <lambda_expr>"));
+
+      Add_Last_Fail_Diagnostic (Parser);
+   end if;
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Lambda_Expr_Transform_Parse_0_Memo,
+      Row_Pos_8 /= No_Token_Index,
+      Transform_Res_8,
+      Pos,
+      Row_Pos_8);
+
+
+   Parser.Current_Pos := Row_Pos_8;
+
+   return Transform_Res_8;
+end Lambda_Expr_Transform_Parse_0;
+
+   
+
+
+function If_Expr_Transform_Parse_1
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_If_Expr
+is
+   use Bare_If_Expr_Memos;
+
+      Row_Pos_29 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_32 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_32 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_38 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_38 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_33 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_33 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_39 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_39 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Lst_Cpos_4 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_4 :
+            Free_Parse_List;
+      Row_Pos_30 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_34 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_34 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_40 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_40 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_35 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_35 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_41 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_41 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_26 :
+            Bare_Elsif_Branch
+               := No_Bare_LK_Node;
+      List_Pos_4 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_4 :
+            Bare_Elsif_Branch_List
+               := No_Bare_LK_Node;
+      Token_Pos_36 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_36 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_42 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_42 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_27 :
+            Bare_If_Expr
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.If_Expr_Transform_Parse_1_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_27 := M.Instance;
+      return Transform_Res_27;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_27;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_29 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_32 := Row_Pos_29;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_32));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_If_Kw)
+   then
+       Token_Pos_32 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_29 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_29,
+             Expected_Token_Id => lkt_If_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_32 := Row_Pos_29 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_32 /= No_Token_Index then
+
+   Row_Pos_29 := Token_Pos_32;
+
+else
+   Row_Pos_29 := No_Token_Index;
+   goto Exit_Row_29_0;
+
+end if;
+
+
+Defer_Res_38 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_29);
+Defer_Pos_38 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_38 /= No_Token_Index then
+
+   Row_Pos_29 := Defer_Pos_38;
+
+else
+   Row_Pos_29 := No_Token_Index;
+   goto Exit_Row_29_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_33 := Row_Pos_29;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_33));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Then_Kw)
+   then
+       Token_Pos_33 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_29 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_29,
+             Expected_Token_Id => lkt_Then_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_33 := Row_Pos_29 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_33 /= No_Token_Index then
+
+   Row_Pos_29 := Token_Pos_33;
+
+else
+   Row_Pos_29 := No_Token_Index;
+   goto Exit_Row_29_0;
+
+end if;
+
+
+Defer_Res_39 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_29);
+Defer_Pos_39 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_39 /= No_Token_Index then
+
+   Row_Pos_29 := Defer_Pos_39;
+
+else
+   Row_Pos_29 := No_Token_Index;
+   goto Exit_Row_29_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_4 := Row_Pos_29;
+
+
+
+Lst_Cpos_4 := Row_Pos_29;
+Tmp_List_4 := Get_Parse_List (Parser);
+
+loop
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_30 := Lst_Cpos_4;
+
+
+
+--  Start tok_code
+
+Token_Res_34 := Row_Pos_30;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_34));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Elif_Kw)
+   then
+       Token_Pos_34 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_30 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_30,
+             Expected_Token_Id => lkt_Elif_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_34 := Row_Pos_30 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_34 /= No_Token_Index then
+
+   Row_Pos_30 := Token_Pos_34;
+
+else
+   Row_Pos_30 := No_Token_Index;
+   goto Exit_Row_30_0;
+
+end if;
+
+
+Defer_Res_40 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_30);
+Defer_Pos_40 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_40 /= No_Token_Index then
+
+   Row_Pos_30 := Defer_Pos_40;
+
+else
+   Row_Pos_30 := No_Token_Index;
+   goto Exit_Row_30_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_35 := Row_Pos_30;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_35));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Then_Kw)
+   then
+       Token_Pos_35 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_30 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_30,
+             Expected_Token_Id => lkt_Then_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_35 := Row_Pos_30 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_35 /= No_Token_Index then
+
+   Row_Pos_30 := Token_Pos_35;
+
+else
+   Row_Pos_30 := No_Token_Index;
+   goto Exit_Row_30_0;
+
+end if;
+
+
+Defer_Res_41 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_30);
+Defer_Pos_41 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_41 /= No_Token_Index then
+
+   Row_Pos_30 := Defer_Pos_41;
+
+else
+   Row_Pos_30 := No_Token_Index;
+   goto Exit_Row_30_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_30_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_30 /= No_Token_Index then
+
+   Transform_Res_26 := Allocate_Elsif_Branch (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_26,
+      Kind => lkt_Elsif_Branch,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Lst_Cpos_4,
+      Token_End_Index   => (if Row_Pos_30 = Lst_Cpos_4
+                            then No_Token_Index
+                            else Row_Pos_30 - 1));
+
+      Initialize_Fields_For_Elsif_Branch
+        (Self => Transform_Res_26, Elsif_Branch_F_Cond_Expr => Defer_Res_40, Elsif_Branch_F_Then_Expr => Defer_Res_41);
+
+         if Defer_Res_40 /= null and then Is_Incomplete (Defer_Res_40) then
+            Transform_Res_26.Last_Attempted_Child := 0;
+         elsif Defer_Res_40 /= null and then not Is_Ghost (Defer_Res_40) then
+            Transform_Res_26.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_41 /= null and then Is_Incomplete (Defer_Res_41) then
+            Transform_Res_26.Last_Attempted_Child := 0;
+         elsif Defer_Res_41 /= null and then not Is_Ghost (Defer_Res_41) then
+            Transform_Res_26.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   exit when Row_Pos_30 = No_Token_Index;
+
+   List_Pos_4 := Row_Pos_30;
+   Lst_Cpos_4 := List_Pos_4;
+
+   Tmp_List_4.Nodes.Append (Transform_Res_26);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_4.Nodes.Length;
+begin
+   List_Res_4 :=
+      Allocate_Elsif_Branch_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_29;
+      Token_End := (if Lst_Cpos_4 = Row_Pos_29
+                    then Row_Pos_29
+                    else Lst_Cpos_4 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_29, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_4,
+      Kind              => lkt_Elsif_Branch_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_4,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_4.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_4.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_4);
+
+--  End list_code
+
+
+
+if List_Pos_4 /= No_Token_Index then
+
+   Row_Pos_29 := List_Pos_4;
+
+else
+   Row_Pos_29 := No_Token_Index;
+   goto Exit_Row_29_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_36 := Row_Pos_29;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_36));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Else_Kw)
+   then
+       Token_Pos_36 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_29 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_29,
+             Expected_Token_Id => lkt_Else_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_36 := Row_Pos_29 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_36 /= No_Token_Index then
+
+   Row_Pos_29 := Token_Pos_36;
+
+else
+   Row_Pos_29 := No_Token_Index;
+   goto Exit_Row_29_0;
+
+end if;
+
+
+Defer_Res_42 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_29);
+Defer_Pos_42 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_42 /= No_Token_Index then
+
+   Row_Pos_29 := Defer_Pos_42;
+
+else
+   Row_Pos_29 := No_Token_Index;
+   goto Exit_Row_29_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_29_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_29 /= No_Token_Index then
+
+   Transform_Res_27 := Allocate_If_Expr (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_27,
+      Kind => lkt_If_Expr,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_29 = Pos
+                            then No_Token_Index
+                            else Row_Pos_29 - 1));
+
+      Initialize_Fields_For_If_Expr
+        (Self => Transform_Res_27, If_Expr_F_Cond_Expr => Defer_Res_38, If_Expr_F_Then_Expr => Defer_Res_39, If_Expr_F_Alternatives => List_Res_4, If_Expr_F_Else_Expr => Defer_Res_42);
+
+         if Defer_Res_38 /= null and then Is_Incomplete (Defer_Res_38) then
+            Transform_Res_27.Last_Attempted_Child := 0;
+         elsif Defer_Res_38 /= null and then not Is_Ghost (Defer_Res_38) then
+            Transform_Res_27.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_39 /= null and then Is_Incomplete (Defer_Res_39) then
+            Transform_Res_27.Last_Attempted_Child := 0;
+         elsif Defer_Res_39 /= null and then not Is_Ghost (Defer_Res_39) then
+            Transform_Res_27.Last_Attempted_Child := -1;
+         end if;
+         if List_Res_4 /= null and then Is_Incomplete (List_Res_4) then
+            Transform_Res_27.Last_Attempted_Child := 0;
+         elsif List_Res_4 /= null and then not Is_Ghost (List_Res_4) then
+            Transform_Res_27.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_42 /= null and then Is_Incomplete (Defer_Res_42) then
+            Transform_Res_27.Last_Attempted_Child := 0;
+         elsif Defer_Res_42 /= null and then not Is_Ghost (Defer_Res_42) then
+            Transform_Res_27.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.If_Expr_Transform_Parse_1_Memo,
+      Row_Pos_29 /= No_Token_Index,
+      Transform_Res_27,
+      Pos,
+      Row_Pos_29);
+
+
+   Parser.Current_Pos := Row_Pos_29;
+
+   return Transform_Res_27;
+end If_Expr_Transform_Parse_1;
+
+   
+
+
+function Raise_Expr_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Raise_Expr
+is
+   use Bare_Raise_Expr_Memos;
+
+      Row_Pos_31 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_37 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_37 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_43 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_43 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_28 :
+            Bare_Raise_Expr
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Raise_Expr_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_28 := M.Instance;
+      return Transform_Res_28;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_28;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_31 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_37 := Row_Pos_31;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_37));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Raise_Kw)
+   then
+       Token_Pos_37 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_31 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_31,
+             Expected_Token_Id => lkt_Raise_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_37 := Row_Pos_31 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_37 /= No_Token_Index then
+
+   Row_Pos_31 := Token_Pos_37;
+
+else
+   Row_Pos_31 := No_Token_Index;
+   goto Exit_Row_31_0;
+
+end if;
+
+
+Defer_Res_43 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_31);
+Defer_Pos_43 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_43 /= No_Token_Index then
+
+   Row_Pos_31 := Defer_Pos_43;
+
+else
+   Row_Pos_31 := No_Token_Index;
+   goto Exit_Row_31_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_31_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_31 /= No_Token_Index then
+
+   Transform_Res_28 := Allocate_Raise_Expr (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_28,
+      Kind => lkt_Raise_Expr,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_31 = Pos
+                            then No_Token_Index
+                            else Row_Pos_31 - 1));
+
+      Initialize_Fields_For_Raise_Expr
+        (Self => Transform_Res_28, Raise_Expr_F_Except_Expr => Defer_Res_43);
+
+         if Defer_Res_43 /= null and then Is_Incomplete (Defer_Res_43) then
+            Transform_Res_28.Last_Attempted_Child := 0;
+         elsif Defer_Res_43 /= null and then not Is_Ghost (Defer_Res_43) then
+            Transform_Res_28.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Raise_Expr_Transform_Parse_0_Memo,
+      Row_Pos_31 /= No_Token_Index,
+      Transform_Res_28,
+      Pos,
+      Row_Pos_31);
+
+
+   Parser.Current_Pos := Row_Pos_31;
+
+   return Transform_Res_28;
+end Raise_Expr_Transform_Parse_0;
+
+   
+
+
+function Try_Expr_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Try_Expr
+is
+   use Bare_Try_Expr_Memos;
+
+      Row_Pos_32 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_38 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_38 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_44 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_44 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Row_Pos_33 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_39 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_39 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_45 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_45 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_29 :
+            Bare_Try_Expr
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Try_Expr_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_29 := M.Instance;
+      return Transform_Res_29;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_29;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_32 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_38 := Row_Pos_32;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_38));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Try_Kw)
+   then
+       Token_Pos_38 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_32 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_32,
+             Expected_Token_Id => lkt_Try_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_38 := Row_Pos_32 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_38 /= No_Token_Index then
+
+   Row_Pos_32 := Token_Pos_38;
+
+else
+   Row_Pos_32 := No_Token_Index;
+   goto Exit_Row_32_0;
+
+end if;
+
+
+Defer_Res_44 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_32);
+Defer_Pos_44 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_44 /= No_Token_Index then
+
+   Row_Pos_32 := Defer_Pos_44;
+
+else
+   Row_Pos_32 := No_Token_Index;
+   goto Exit_Row_32_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_33 := Row_Pos_32;
+
+
+
+--  Start tok_code
+
+Token_Res_39 := Row_Pos_33;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_39));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Or_Kw)
+   then
+       Token_Pos_39 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_33 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_33,
+             Expected_Token_Id => lkt_Or_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_39 := Row_Pos_33 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_39 /= No_Token_Index then
+
+   Row_Pos_33 := Token_Pos_39;
+
+else
+   Row_Pos_33 := No_Token_Index;
+   goto Exit_Row_33_0;
+
+end if;
+
+
+Defer_Res_45 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_33);
+Defer_Pos_45 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_45 /= No_Token_Index then
+
+   Row_Pos_33 := Defer_Pos_45;
+
+else
+   Row_Pos_33 := No_Token_Index;
+   goto Exit_Row_33_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_33_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_33 = No_Token_Index then
+
+        Defer_Res_45 := No_Bare_LK_Node;
+
+
+    Row_Pos_33 := Row_Pos_32;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_33 /= No_Token_Index then
+
+   Row_Pos_32 := Row_Pos_33;
+
+else
+   Row_Pos_32 := No_Token_Index;
+   goto Exit_Row_32_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_32_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_32 /= No_Token_Index then
+
+   Transform_Res_29 := Allocate_Try_Expr (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_29,
+      Kind => lkt_Try_Expr,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_32 = Pos
+                            then No_Token_Index
+                            else Row_Pos_32 - 1));
+
+      Initialize_Fields_For_Try_Expr
+        (Self => Transform_Res_29, Try_Expr_F_Try_Expr => Defer_Res_44, Try_Expr_F_Or_Expr => Defer_Res_45);
+
+         if Defer_Res_44 /= null and then Is_Incomplete (Defer_Res_44) then
+            Transform_Res_29.Last_Attempted_Child := 0;
+         elsif Defer_Res_44 /= null and then not Is_Ghost (Defer_Res_44) then
+            Transform_Res_29.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_45 /= null and then Is_Incomplete (Defer_Res_45) then
+            Transform_Res_29.Last_Attempted_Child := 0;
+         elsif Defer_Res_45 /= null and then not Is_Ghost (Defer_Res_45) then
+            Transform_Res_29.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Try_Expr_Transform_Parse_0_Memo,
+      Row_Pos_32 /= No_Token_Index,
+      Transform_Res_29,
+      Pos,
+      Row_Pos_32);
+
+
+   Parser.Current_Pos := Row_Pos_32;
+
+   return Transform_Res_29;
+end Try_Expr_Transform_Parse_0;
+
+   
+
+
+function Param_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Param
+is
+   use Bare_Param_Memos;
+
+      Row_Pos_42 :
+            Token_Index
+               := No_Token_Index;
+      Row_Pos_43 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_63 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_63 :
+            Bare_Ref_Id
+               := No_Bare_LK_Node;
+      Token_Pos_58 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_58 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_64 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_64 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_38 :
+            Bare_Param
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Param_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_38 := M.Instance;
+      return Transform_Res_38;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_38;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_42 := Pos;
+
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_43 := Row_Pos_42;
+
+
+
+Defer_Res_63 :=
+   Ref_Id_Transform_Parse_0 (Parser, Row_Pos_43);
+Defer_Pos_63 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_63 /= No_Token_Index then
+
+   Row_Pos_43 := Defer_Pos_63;
+
+else
+   Row_Pos_43 := No_Token_Index;
+   goto Exit_Row_37_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_58 := Row_Pos_43;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_58));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Equal)
+   then
+       Token_Pos_58 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_43 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_43,
+             Expected_Token_Id => lkt_Equal,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_58 := Row_Pos_43 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_58 /= No_Token_Index then
+
+   Row_Pos_43 := Token_Pos_58;
+
+else
+   Row_Pos_43 := No_Token_Index;
+   goto Exit_Row_37_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_37_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_43 = No_Token_Index then
+
+        Defer_Res_63 := No_Bare_LK_Node;
+
+
+    Row_Pos_43 := Row_Pos_42;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_43 /= No_Token_Index then
+
+   Row_Pos_42 := Row_Pos_43;
+
+else
+   Row_Pos_42 := No_Token_Index;
+   goto Exit_Row_36_0;
+
+end if;
+
+
+Defer_Res_64 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_42);
+Defer_Pos_64 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_64 /= No_Token_Index then
+
+   Row_Pos_42 := Defer_Pos_64;
+
+else
+   Row_Pos_42 := No_Token_Index;
+   goto Exit_Row_36_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_36_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_42 /= No_Token_Index then
+
+   Transform_Res_38 := Allocate_Param (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_38,
+      Kind => lkt_Param,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_42 = Pos
+                            then No_Token_Index
+                            else Row_Pos_42 - 1));
+
+      Initialize_Fields_For_Param
+        (Self => Transform_Res_38, Param_F_Name => Defer_Res_63, Param_F_Value => Defer_Res_64);
+
+         if Defer_Res_63 /= null and then Is_Incomplete (Defer_Res_63) then
+            Transform_Res_38.Last_Attempted_Child := 0;
+         elsif Defer_Res_63 /= null and then not Is_Ghost (Defer_Res_63) then
+            Transform_Res_38.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_64 /= null and then Is_Incomplete (Defer_Res_64) then
+            Transform_Res_38.Last_Attempted_Child := 0;
+         elsif Defer_Res_64 /= null and then not Is_Ghost (Defer_Res_64) then
+            Transform_Res_38.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Param_Transform_Parse_0_Memo,
+      Row_Pos_42 /= No_Token_Index,
+      Transform_Res_38,
+      Pos,
+      Row_Pos_42);
+
+
+   Parser.Current_Pos := Row_Pos_42;
+
+   return Transform_Res_38;
+end Param_Transform_Parse_0;
+
+   
+
+
+function Params_List_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Param_List
+is
+   use Bare_Param_List_Memos;
+
+      Lst_Cpos_5 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_5 :
+            Free_Parse_List;
+      Defer_Pos_62 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_62 :
+            Bare_Param
+               := No_Bare_LK_Node;
+      Token_Pos_57 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_57 :
+            Token_Index
+               := No_Token_Index;
+      List_Pos_5 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_5 :
+            Bare_Param_List
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Params_List_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      List_Res_5 := M.Instance;
+      return List_Res_5;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return List_Res_5;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start list_code
+
+    List_Pos_5 := Pos;
+
+
+
+Lst_Cpos_5 := Pos;
+Tmp_List_5 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_62 :=
+   Param_Transform_Parse_0 (Parser, Lst_Cpos_5);
+Defer_Pos_62 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_62 = No_Token_Index;
+
+   List_Pos_5 := Defer_Pos_62;
+   Lst_Cpos_5 := List_Pos_5;
+
+   Tmp_List_5.Nodes.Append (Defer_Res_62);
+
+      
+--  Start tok_code
+
+Token_Res_57 := Lst_Cpos_5;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_57));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Comma)
+   then
+       Token_Pos_57 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Lst_Cpos_5 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Lst_Cpos_5,
+             Expected_Token_Id => lkt_Comma,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_57 := Lst_Cpos_5 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+      if Token_Pos_57 /= No_Token_Index then
+          Lst_Cpos_5 := Token_Pos_57;
+      else
+         exit;
+      end if;
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_5.Nodes.Length;
+begin
+   List_Res_5 :=
+      Allocate_Param_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Pos;
+      Token_End := (if Lst_Cpos_5 = Pos
+                    then Pos
+                    else Lst_Cpos_5 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Pos, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_5,
+      Kind              => lkt_Param_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_5,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_5.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_5.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_5);
+
+--  End list_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Params_List_Parse_0_Memo,
+      List_Pos_5 /= No_Token_Index,
+      List_Res_5,
+      Pos,
+      List_Pos_5);
+
+
+   Parser.Current_Pos := List_Pos_5;
+
+   return List_Res_5;
+end Params_List_Parse_0;
+
+   
+
+
+function Match_Expr_Transform_Parse_2
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Match_Expr
+is
+   use Bare_Match_Expr_Memos;
+
+      Row_Pos_45 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_61 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_61 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_74 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_74 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_62 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_62 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_6 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_6 :
+            Free_Parse_List;
+      Row_Pos_46 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_63 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_63 :
+            Token_Index
+               := No_Token_Index;
+      Row_Pos_47 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_75 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_75 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Row_Pos_48 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_64 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_64 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_76 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_76 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Transform_Res_40 :
+            Bare_Match_Val_Decl
+               := No_Bare_LK_Node;
+      Token_Pos_65 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_65 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_77 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_77 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_41 :
+            Bare_Match_Branch
+               := No_Bare_LK_Node;
+      List_Pos_6 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_6 :
+            Bare_Match_Branch_List
+               := No_Bare_LK_Node;
+      Token_Pos_66 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_66 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_42 :
+            Bare_Match_Expr
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Match_Expr_Transform_Parse_2_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_42 := M.Instance;
+      return Transform_Res_42;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_42;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_45 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_61 := Row_Pos_45;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_61));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Match_Kw)
+   then
+       Token_Pos_61 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_45 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_45,
+             Expected_Token_Id => lkt_Match_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_61 := Row_Pos_45 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_61 /= No_Token_Index then
+
+   Row_Pos_45 := Token_Pos_61;
+
+else
+   Row_Pos_45 := No_Token_Index;
+   goto Exit_Row_45_0;
+
+end if;
+
+
+Defer_Res_74 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_45);
+Defer_Pos_74 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_74 /= No_Token_Index then
+
+   Row_Pos_45 := Defer_Pos_74;
+
+else
+   Row_Pos_45 := No_Token_Index;
+   goto Exit_Row_45_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_62 := Row_Pos_45;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_62));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Brace)
+   then
+       Token_Pos_62 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_45 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_45,
+             Expected_Token_Id => lkt_L_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_62 := Row_Pos_45 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_62 /= No_Token_Index then
+
+   Row_Pos_45 := Token_Pos_62;
+
+else
+   Row_Pos_45 := No_Token_Index;
+   goto Exit_Row_45_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_6 := No_Token_Index;
+
+
+
+Lst_Cpos_6 := Row_Pos_45;
+Tmp_List_6 := Get_Parse_List (Parser);
+
+loop
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_46 := Lst_Cpos_6;
+
+
+
+--  Start tok_code
+
+Token_Res_63 := Row_Pos_46;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_63));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Case_Kw)
+   then
+       Token_Pos_63 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_46 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_46,
+             Expected_Token_Id => lkt_Case_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_63 := Row_Pos_46 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_63 /= No_Token_Index then
+
+   Row_Pos_46 := Token_Pos_63;
+
+else
+   Row_Pos_46 := No_Token_Index;
+   goto Exit_Row_46_0;
+
+end if;
+
+
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_47 := Row_Pos_46;
+
+
+
+Defer_Res_75 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_47);
+Defer_Pos_75 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_75 /= No_Token_Index then
+
+   Row_Pos_47 := Defer_Pos_75;
+
+else
+   Row_Pos_47 := No_Token_Index;
+   goto Exit_Row_47_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_48 := Row_Pos_47;
+
+
+
+--  Start tok_code
+
+Token_Res_64 := Row_Pos_48;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_64));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Colon)
+   then
+       Token_Pos_64 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_48 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_48,
+             Expected_Token_Id => lkt_Colon,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_64 := Row_Pos_48 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_64 /= No_Token_Index then
+
+   Row_Pos_48 := Token_Pos_64;
+
+else
+   Row_Pos_48 := No_Token_Index;
+   goto Exit_Row_48_0;
+
+end if;
+
+
+Defer_Res_76 :=
+   Type_Ref_Or_Parse_0 (Parser, Row_Pos_48);
+Defer_Pos_76 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_76 /= No_Token_Index then
+
+   Row_Pos_48 := Defer_Pos_76;
+
+else
+   Row_Pos_48 := No_Token_Index;
+   goto Exit_Row_48_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_48_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_48 = No_Token_Index then
+
+        Defer_Res_76 := No_Bare_LK_Node;
+
+
+    Row_Pos_48 := Row_Pos_47;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_48 /= No_Token_Index then
+
+   Row_Pos_47 := Row_Pos_48;
+
+else
+   Row_Pos_47 := No_Token_Index;
+   goto Exit_Row_47_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_47_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_47 /= No_Token_Index then
+
+   Transform_Res_40 := Allocate_Match_Val_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_40,
+      Kind => lkt_Match_Val_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_46,
+      Token_End_Index   => (if Row_Pos_47 = Row_Pos_46
+                            then No_Token_Index
+                            else Row_Pos_47 - 1));
+
+      Initialize_Fields_For_Match_Val_Decl
+        (Self => Transform_Res_40, User_Val_Decl_F_Syn_Name => Defer_Res_75, Match_Val_Decl_F_Decl_Type => Defer_Res_76);
+
+         if Defer_Res_75 /= null and then Is_Incomplete (Defer_Res_75) then
+            Transform_Res_40.Last_Attempted_Child := 0;
+         elsif Defer_Res_75 /= null and then not Is_Ghost (Defer_Res_75) then
+            Transform_Res_40.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_76 /= null and then Is_Incomplete (Defer_Res_76) then
+            Transform_Res_40.Last_Attempted_Child := 0;
+         elsif Defer_Res_76 /= null and then not Is_Ghost (Defer_Res_76) then
+            Transform_Res_40.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+
+if Row_Pos_47 /= No_Token_Index then
+
+   Row_Pos_46 := Row_Pos_47;
+
+else
+   Row_Pos_46 := No_Token_Index;
+   goto Exit_Row_46_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_65 := Row_Pos_46;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_65));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Fat_Right_Arrow)
+   then
+       Token_Pos_65 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_46 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_46,
+             Expected_Token_Id => lkt_Fat_Right_Arrow,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_65 := Row_Pos_46 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_65 /= No_Token_Index then
+
+   Row_Pos_46 := Token_Pos_65;
+
+else
+   Row_Pos_46 := No_Token_Index;
+   goto Exit_Row_46_0;
+
+end if;
+
+
+Defer_Res_77 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_46);
+Defer_Pos_77 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_77 /= No_Token_Index then
+
+   Row_Pos_46 := Defer_Pos_77;
+
+else
+   Row_Pos_46 := No_Token_Index;
+   goto Exit_Row_46_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_46_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_46 /= No_Token_Index then
+
+   Transform_Res_41 := Allocate_Match_Branch (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_41,
+      Kind => lkt_Match_Branch,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Lst_Cpos_6,
+      Token_End_Index   => (if Row_Pos_46 = Lst_Cpos_6
+                            then No_Token_Index
+                            else Row_Pos_46 - 1));
+
+      Initialize_Fields_For_Match_Branch
+        (Self => Transform_Res_41, Match_Branch_F_Decl => Transform_Res_40, Match_Branch_F_Expr => Defer_Res_77);
+
+         if Transform_Res_40 /= null and then Is_Incomplete (Transform_Res_40) then
+            Transform_Res_41.Last_Attempted_Child := 0;
+         elsif Transform_Res_40 /= null and then not Is_Ghost (Transform_Res_40) then
+            Transform_Res_41.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_77 /= null and then Is_Incomplete (Defer_Res_77) then
+            Transform_Res_41.Last_Attempted_Child := 0;
+         elsif Defer_Res_77 /= null and then not Is_Ghost (Defer_Res_77) then
+            Transform_Res_41.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   exit when Row_Pos_46 = No_Token_Index;
+
+   List_Pos_6 := Row_Pos_46;
+   Lst_Cpos_6 := List_Pos_6;
+
+   Tmp_List_6.Nodes.Append (Transform_Res_41);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_6.Nodes.Length;
+begin
+   List_Res_6 :=
+      Allocate_Match_Branch_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_45;
+      Token_End := (if Lst_Cpos_6 = Row_Pos_45
+                    then Row_Pos_45
+                    else Lst_Cpos_6 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_45, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_6,
+      Kind              => lkt_Match_Branch_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_6,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_6.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_6.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_6);
+
+--  End list_code
+
+
+
+if List_Pos_6 /= No_Token_Index then
+
+   Row_Pos_45 := List_Pos_6;
+
+else
+   Row_Pos_45 := No_Token_Index;
+   goto Exit_Row_45_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_66 := Row_Pos_45;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_66));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Brace)
+   then
+       Token_Pos_66 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_45 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_45,
+             Expected_Token_Id => lkt_R_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_66 := Row_Pos_45 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_66 /= No_Token_Index then
+
+   Row_Pos_45 := Token_Pos_66;
+
+else
+   Row_Pos_45 := No_Token_Index;
+   goto Exit_Row_45_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_45_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_45 /= No_Token_Index then
+
+   Transform_Res_42 := Allocate_Match_Expr (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_42,
+      Kind => lkt_Match_Expr,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_45 = Pos
+                            then No_Token_Index
+                            else Row_Pos_45 - 1));
+
+      Initialize_Fields_For_Match_Expr
+        (Self => Transform_Res_42, Match_Expr_F_Match_Expr => Defer_Res_74, Match_Expr_F_Branches => List_Res_6);
+
+         if Defer_Res_74 /= null and then Is_Incomplete (Defer_Res_74) then
+            Transform_Res_42.Last_Attempted_Child := 0;
+         elsif Defer_Res_74 /= null and then not Is_Ghost (Defer_Res_74) then
+            Transform_Res_42.Last_Attempted_Child := -1;
+         end if;
+         if List_Res_6 /= null and then Is_Incomplete (List_Res_6) then
+            Transform_Res_42.Last_Attempted_Child := 0;
+         elsif List_Res_6 /= null and then not Is_Ghost (List_Res_6) then
+            Transform_Res_42.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Match_Expr_Transform_Parse_2_Memo,
+      Row_Pos_45 /= No_Token_Index,
+      Transform_Res_42,
+      Pos,
+      Row_Pos_45);
+
+
+   Parser.Current_Pos := Row_Pos_45;
+
+   return Transform_Res_42;
+end Match_Expr_Transform_Parse_2;
+
+   
+
+
+function Null_Lit_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Null_Lit
+is
+   use Bare_Null_Lit_Memos;
+
+      Row_Pos_49 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_67 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_67 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_43 :
+            Bare_Null_Lit
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Null_Lit_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_43 := M.Instance;
+      return Transform_Res_43;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_43;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_49 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_67 := Row_Pos_49;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_67));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Null_Kw)
+   then
+       Token_Pos_67 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_49 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_49,
+             Expected_Token_Id => lkt_Null_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_67 := Row_Pos_49 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_67 /= No_Token_Index then
+
+   Row_Pos_49 := Token_Pos_67;
+
+else
+   Row_Pos_49 := No_Token_Index;
+   goto Exit_Row_49_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_49_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_49 /= No_Token_Index then
+
+   Transform_Res_43 := Allocate_Null_Lit (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_43,
+      Kind => lkt_Null_Lit,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_49 = Pos
+                            then No_Token_Index
+                            else Row_Pos_49 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Null_Lit_Transform_Parse_0_Memo,
+      Row_Pos_49 /= No_Token_Index,
+      Transform_Res_43,
+      Pos,
+      Row_Pos_49);
+
+
+   Parser.Current_Pos := Row_Pos_49;
+
+   return Transform_Res_43;
+end Null_Lit_Transform_Parse_0;
+
+   
+
+
+function Val_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Val_Decl
+is
+   use Bare_Val_Decl_Memos;
+
+      Row_Pos_51 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_72 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_72 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_81 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_81 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Row_Pos_52 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_73 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_73 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_82 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_82 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Token_Pos_74 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_74 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_83 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_83 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_45 :
+            Bare_Val_Decl
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Val_Decl_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_45 := M.Instance;
+      return Transform_Res_45;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_45;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_51 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_72 := Row_Pos_51;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_72));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Val_Kw)
+   then
+       Token_Pos_72 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_51 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_51,
+             Expected_Token_Id => lkt_Val_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_72 := Row_Pos_51 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_72 /= No_Token_Index then
+
+   Row_Pos_51 := Token_Pos_72;
+
+else
+   Row_Pos_51 := No_Token_Index;
+   goto Exit_Row_51_0;
+
+end if;
+
+
+Defer_Res_81 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_51);
+Defer_Pos_81 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_81 /= No_Token_Index then
+
+   Row_Pos_51 := Defer_Pos_81;
+
+else
+   Row_Pos_51 := No_Token_Index;
+   goto Exit_Row_51_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_52 := Row_Pos_51;
+
+
+
+--  Start tok_code
+
+Token_Res_73 := Row_Pos_52;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_73));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Colon)
+   then
+       Token_Pos_73 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_52 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_52,
+             Expected_Token_Id => lkt_Colon,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_73 := Row_Pos_52 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_73 /= No_Token_Index then
+
+   Row_Pos_52 := Token_Pos_73;
+
+else
+   Row_Pos_52 := No_Token_Index;
+   goto Exit_Row_52_0;
+
+end if;
+
+
+Defer_Res_82 :=
+   Type_Ref_Or_Parse_0 (Parser, Row_Pos_52);
+Defer_Pos_82 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_82 /= No_Token_Index then
+
+   Row_Pos_52 := Defer_Pos_82;
+
+else
+   Row_Pos_52 := No_Token_Index;
+   goto Exit_Row_52_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_52_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_52 = No_Token_Index then
+
+        Defer_Res_82 := No_Bare_LK_Node;
+
+
+    Row_Pos_52 := Row_Pos_51;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_52 /= No_Token_Index then
+
+   Row_Pos_51 := Row_Pos_52;
+
+else
+   Row_Pos_51 := No_Token_Index;
+   goto Exit_Row_51_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_74 := Row_Pos_51;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_74));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Equal)
+   then
+       Token_Pos_74 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_51 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_51,
+             Expected_Token_Id => lkt_Equal,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_74 := Row_Pos_51 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_74 /= No_Token_Index then
+
+   Row_Pos_51 := Token_Pos_74;
+
+else
+   Row_Pos_51 := No_Token_Index;
+   goto Exit_Row_51_0;
+
+end if;
+
+
+Defer_Res_83 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_51);
+Defer_Pos_83 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_83 /= No_Token_Index then
+
+   Row_Pos_51 := Defer_Pos_83;
+
+else
+   Row_Pos_51 := No_Token_Index;
+   goto Exit_Row_51_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_51_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_51 /= No_Token_Index then
+
+   Transform_Res_45 := Allocate_Val_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_45,
+      Kind => lkt_Val_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_51 = Pos
+                            then No_Token_Index
+                            else Row_Pos_51 - 1));
+
+      Initialize_Fields_For_Val_Decl
+        (Self => Transform_Res_45, User_Val_Decl_F_Syn_Name => Defer_Res_81, Val_Decl_F_Decl_Type => Defer_Res_82, Val_Decl_F_Val => Defer_Res_83);
+
+         if Defer_Res_81 /= null and then Is_Incomplete (Defer_Res_81) then
+            Transform_Res_45.Last_Attempted_Child := 0;
+         elsif Defer_Res_81 /= null and then not Is_Ghost (Defer_Res_81) then
+            Transform_Res_45.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_82 /= null and then Is_Incomplete (Defer_Res_82) then
+            Transform_Res_45.Last_Attempted_Child := 0;
+         elsif Defer_Res_82 /= null and then not Is_Ghost (Defer_Res_82) then
+            Transform_Res_45.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_83 /= null and then Is_Incomplete (Defer_Res_83) then
+            Transform_Res_45.Last_Attempted_Child := 0;
+         elsif Defer_Res_83 /= null and then not Is_Ghost (Defer_Res_83) then
+            Transform_Res_45.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Val_Decl_Transform_Parse_0_Memo,
+      Row_Pos_51 /= No_Token_Index,
+      Transform_Res_45,
+      Pos,
+      Row_Pos_51);
+
+
+   Parser.Current_Pos := Row_Pos_51;
+
+   return Transform_Res_45;
+end Val_Decl_Transform_Parse_0;
+
+   
+
+
+function Var_Bind_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Var_Bind
+is
+   use Bare_Var_Bind_Memos;
+
+      Row_Pos_53 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_75 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_75 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_84 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_84 :
+            Bare_Ref_Id
+               := No_Bare_LK_Node;
+      Token_Pos_76 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_76 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_85 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_85 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_46 :
+            Bare_Var_Bind
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Var_Bind_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_46 := M.Instance;
+      return Transform_Res_46;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_46;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_53 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_75 := Row_Pos_53;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_75));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Bind_Kw)
+   then
+       Token_Pos_75 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_53 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_53,
+             Expected_Token_Id => lkt_Bind_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_75 := Row_Pos_53 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_75 /= No_Token_Index then
+
+   Row_Pos_53 := Token_Pos_75;
+
+else
+   Row_Pos_53 := No_Token_Index;
+   goto Exit_Row_53_0;
+
+end if;
+
+
+Defer_Res_84 :=
+   Ref_Id_Transform_Parse_0 (Parser, Row_Pos_53);
+Defer_Pos_84 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_84 /= No_Token_Index then
+
+   Row_Pos_53 := Defer_Pos_84;
+
+else
+   Row_Pos_53 := No_Token_Index;
+   goto Exit_Row_53_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_76 := Row_Pos_53;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_76));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Equal)
+   then
+       Token_Pos_76 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_53 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_53,
+             Expected_Token_Id => lkt_Equal,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_76 := Row_Pos_53 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_76 /= No_Token_Index then
+
+   Row_Pos_53 := Token_Pos_76;
+
+else
+   Row_Pos_53 := No_Token_Index;
+   goto Exit_Row_53_0;
+
+end if;
+
+
+Defer_Res_85 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_53);
+Defer_Pos_85 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_85 /= No_Token_Index then
+
+   Row_Pos_53 := Defer_Pos_85;
+
+else
+   Row_Pos_53 := No_Token_Index;
+   goto Exit_Row_53_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_53_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_53 /= No_Token_Index then
+
+   Transform_Res_46 := Allocate_Var_Bind (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_46,
+      Kind => lkt_Var_Bind,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_53 = Pos
+                            then No_Token_Index
+                            else Row_Pos_53 - 1));
+
+      Initialize_Fields_For_Var_Bind
+        (Self => Transform_Res_46, Var_Bind_F_Name => Defer_Res_84, Var_Bind_F_Expr => Defer_Res_85);
+
+         if Defer_Res_84 /= null and then Is_Incomplete (Defer_Res_84) then
+            Transform_Res_46.Last_Attempted_Child := 0;
+         elsif Defer_Res_84 /= null and then not Is_Ghost (Defer_Res_84) then
+            Transform_Res_46.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_85 /= null and then Is_Incomplete (Defer_Res_85) then
+            Transform_Res_46.Last_Attempted_Child := 0;
+         elsif Defer_Res_85 /= null and then not Is_Ghost (Defer_Res_85) then
+            Transform_Res_46.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Var_Bind_Transform_Parse_0_Memo,
+      Row_Pos_53 /= No_Token_Index,
+      Transform_Res_46,
+      Pos,
+      Row_Pos_53);
+
+
+   Parser.Current_Pos := Row_Pos_53;
+
+   return Transform_Res_46;
+end Var_Bind_Transform_Parse_0;
+
+   
+
+
+function Block_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Block_Expr
+is
+   use Bare_Block_Expr_Memos;
+
+      Row_Pos_50 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_68 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_68 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_7 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_7 :
+            Free_Parse_List;
+      Defer_Pos_78 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_78 :
+            Bare_Val_Decl
+               := No_Bare_LK_Node;
+      Defer_Pos_79 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_79 :
+            Bare_Var_Bind
+               := No_Bare_LK_Node;
+      Or_Pos_16 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_16 :
+            Bare_LK_Node
+               := No_Bare_LK_Node;
+      Token_Pos_69 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_69 :
+            Token_Index
+               := No_Token_Index;
+      List_Pos_7 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_7 :
+            Bare_LK_Node_List
+               := No_Bare_LK_Node;
+      Token_Pos_70 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_70 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_80 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_80 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_71 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_71 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_44 :
+            Bare_Block_Expr
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Block_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_44 := M.Instance;
+      return Transform_Res_44;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_44;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_50 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_68 := Row_Pos_50;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_68));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Brace)
+   then
+       Token_Pos_68 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_50 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_50,
+             Expected_Token_Id => lkt_L_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_68 := Row_Pos_50 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_68 /= No_Token_Index then
+
+   Row_Pos_50 := Token_Pos_68;
+
+else
+   Row_Pos_50 := No_Token_Index;
+   goto Exit_Row_50_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_7 := No_Token_Index;
+
+
+
+Lst_Cpos_7 := Row_Pos_50;
+Tmp_List_7 := Get_Parse_List (Parser);
+
+loop
+   
+--  Start or_code
+
+Or_Pos_16 := No_Token_Index;
+Or_Res_16 := No_Bare_LK_Node;
+    
+Defer_Res_78 :=
+   Val_Decl_Transform_Parse_0 (Parser, Lst_Cpos_7);
+Defer_Pos_78 := Parser.Current_Pos;
+
+    if Defer_Pos_78 /= No_Token_Index then
+        Or_Pos_16 := Defer_Pos_78;
+        Or_Res_16 := Defer_Res_78;
+        goto Exit_Or_16;
+    end if;
+    
+Defer_Res_79 :=
+   Var_Bind_Transform_Parse_0 (Parser, Lst_Cpos_7);
+Defer_Pos_79 := Parser.Current_Pos;
+
+    if Defer_Pos_79 /= No_Token_Index then
+        Or_Pos_16 := Defer_Pos_79;
+        Or_Res_16 := Defer_Res_79;
+        goto Exit_Or_16;
+    end if;
+<<Exit_Or_16>>
+
+--  End or_code
+
+
+   exit when Or_Pos_16 = No_Token_Index;
+
+   List_Pos_7 := Or_Pos_16;
+   Lst_Cpos_7 := List_Pos_7;
+
+   Tmp_List_7.Nodes.Append (Or_Res_16);
+
+      
+--  Start tok_code
+
+Token_Res_69 := Lst_Cpos_7;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_69));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Semicolon)
+   then
+       Token_Pos_69 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Lst_Cpos_7 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Lst_Cpos_7,
+             Expected_Token_Id => lkt_Semicolon,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_69 := Lst_Cpos_7 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+      if Token_Pos_69 /= No_Token_Index then
+          Lst_Cpos_7 := Token_Pos_69;
+      else
+         exit;
+      end if;
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_7.Nodes.Length;
+begin
+   List_Res_7 :=
+      Allocate_LK_Node_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_50;
+      Token_End := (if Lst_Cpos_7 = Row_Pos_50
+                    then Row_Pos_50
+                    else Lst_Cpos_7 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_50, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_7,
+      Kind              => lkt_LK_Node_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_7,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_7.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_7.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_7);
+
+--  End list_code
+
+
+
+if List_Pos_7 /= No_Token_Index then
+
+   Row_Pos_50 := List_Pos_7;
+
+else
+   Row_Pos_50 := No_Token_Index;
+   goto Exit_Row_50_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_70 := Row_Pos_50;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_70));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Semicolon)
+   then
+       Token_Pos_70 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_50 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_50,
+             Expected_Token_Id => lkt_Semicolon,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_70 := Row_Pos_50 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_70 /= No_Token_Index then
+
+   Row_Pos_50 := Token_Pos_70;
+
+else
+   Row_Pos_50 := No_Token_Index;
+   goto Exit_Row_50_0;
+
+end if;
+
+
+Defer_Res_80 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_50);
+Defer_Pos_80 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_80 /= No_Token_Index then
+
+   Row_Pos_50 := Defer_Pos_80;
+
+else
+   Row_Pos_50 := No_Token_Index;
+   goto Exit_Row_50_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_71 := Row_Pos_50;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_71));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Brace)
+   then
+       Token_Pos_71 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_50 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_50,
+             Expected_Token_Id => lkt_R_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_71 := Row_Pos_50 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_71 /= No_Token_Index then
+
+   Row_Pos_50 := Token_Pos_71;
+
+else
+   Row_Pos_50 := No_Token_Index;
+   goto Exit_Row_50_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_50_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_50 /= No_Token_Index then
+
+   Transform_Res_44 := Allocate_Block_Expr (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_44,
+      Kind => lkt_Block_Expr,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_50 = Pos
+                            then No_Token_Index
+                            else Row_Pos_50 - 1));
+
+      Initialize_Fields_For_Block_Expr
+        (Self => Transform_Res_44, Block_Expr_F_Val_Defs => List_Res_7, Block_Expr_F_Expr => Defer_Res_80);
+
+         if List_Res_7 /= null and then Is_Incomplete (List_Res_7) then
+            Transform_Res_44.Last_Attempted_Child := 0;
+         elsif List_Res_7 /= null and then not Is_Ghost (List_Res_7) then
+            Transform_Res_44.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_80 /= null and then Is_Incomplete (Defer_Res_80) then
+            Transform_Res_44.Last_Attempted_Child := 0;
+         elsif Defer_Res_80 /= null and then not Is_Ghost (Defer_Res_80) then
+            Transform_Res_44.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Block_Transform_Parse_0_Memo,
+      Row_Pos_50 /= No_Token_Index,
+      Transform_Res_44,
+      Pos,
+      Row_Pos_50);
+
+
+   Parser.Current_Pos := Row_Pos_50;
+
+   return Transform_Res_44;
+end Block_Transform_Parse_0;
+
+   
+
+
+function Num_Lit_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Num_Lit
+is
+   use Bare_Num_Lit_Memos;
+
+      Row_Pos_54 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_77 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_77 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_47 :
+            Bare_Num_Lit
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Num_Lit_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_47 := M.Instance;
+      return Transform_Res_47;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_47;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_54 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_77 := Row_Pos_54;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_77));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Number)
+   then
+       Token_Pos_77 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_54 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_54,
+             Expected_Token_Id => lkt_Number,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_77 := Row_Pos_54 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_77 /= No_Token_Index then
+
+   Row_Pos_54 := Token_Pos_77;
+
+else
+   Row_Pos_54 := No_Token_Index;
+   goto Exit_Row_54_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_54_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_54 /= No_Token_Index then
+
+   Transform_Res_47 := Allocate_Num_Lit (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_47,
+      Kind => lkt_Num_Lit,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_54 = Pos
+                            then No_Token_Index
+                            else Row_Pos_54 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Num_Lit_Transform_Parse_0_Memo,
+      Row_Pos_54 /= No_Token_Index,
+      Transform_Res_47,
+      Pos,
+      Row_Pos_54);
+
+
+   Parser.Current_Pos := Row_Pos_54;
+
+   return Transform_Res_47;
+end Num_Lit_Transform_Parse_0;
+
+   
+
+
+function String_Lit_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_String_Lit
+is
+   use Bare_String_Lit_Memos;
+
+      Row_Pos_55 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_78 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_78 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_79 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_79 :
+            Token_Index
+               := No_Token_Index;
+      Or_Pos_17 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_17 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_48 :
+            Bare_String_Lit
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.String_Lit_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_48 := M.Instance;
+      return Transform_Res_48;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_48;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_55 := Pos;
+
+
+
+--  Start or_code
+
+Or_Pos_17 := No_Token_Index;
+Or_Res_17 := No_Token_Index;
+    
+--  Start tok_code
+
+Token_Res_78 := Row_Pos_55;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_78));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_String)
+   then
+       Token_Pos_78 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_55 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_55,
+             Expected_Token_Id => lkt_String,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_78 := Row_Pos_55 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+    if Token_Pos_78 /= No_Token_Index then
+        Or_Pos_17 := Token_Pos_78;
+        Or_Res_17 := Token_Res_78;
+        goto Exit_Or_17;
+    end if;
+    
+--  Start tok_code
+
+Token_Res_79 := Row_Pos_55;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_79));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_P_String)
+   then
+       Token_Pos_79 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_55 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_55,
+             Expected_Token_Id => lkt_P_String,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_79 := Row_Pos_55 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+    if Token_Pos_79 /= No_Token_Index then
+        Or_Pos_17 := Token_Pos_79;
+        Or_Res_17 := Token_Res_79;
+        goto Exit_Or_17;
+    end if;
+<<Exit_Or_17>>
+
+--  End or_code
+
+
+
+if Or_Pos_17 /= No_Token_Index then
+
+   Row_Pos_55 := Or_Pos_17;
+
+else
+   Row_Pos_55 := No_Token_Index;
+   goto Exit_Row_55_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_55_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_55 /= No_Token_Index then
+
+   Transform_Res_48 := Allocate_String_Lit (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_48,
+      Kind => lkt_String_Lit,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_55 = Pos
+                            then No_Token_Index
+                            else Row_Pos_55 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.String_Lit_Transform_Parse_0_Memo,
+      Row_Pos_55 /= No_Token_Index,
+      Transform_Res_48,
+      Pos,
+      Row_Pos_55);
+
+
+   Parser.Current_Pos := Row_Pos_55;
+
+   return Transform_Res_48;
+end String_Lit_Transform_Parse_0;
+
+   
+
+
+function Char_Lit_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Char_Lit
+is
+   use Bare_Char_Lit_Memos;
+
+      Row_Pos_56 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_80 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_80 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_49 :
+            Bare_Char_Lit
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Char_Lit_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_49 := M.Instance;
+      return Transform_Res_49;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_49;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_56 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_80 := Row_Pos_56;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_80));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Char)
+   then
+       Token_Pos_80 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_56 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_56,
+             Expected_Token_Id => lkt_Char,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_80 := Row_Pos_56 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_80 /= No_Token_Index then
+
+   Row_Pos_56 := Token_Pos_80;
+
+else
+   Row_Pos_56 := No_Token_Index;
+   goto Exit_Row_56_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_56_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_56 /= No_Token_Index then
+
+   Transform_Res_49 := Allocate_Char_Lit (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_49,
+      Kind => lkt_Char_Lit,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_56 = Pos
+                            then No_Token_Index
+                            else Row_Pos_56 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Char_Lit_Transform_Parse_0_Memo,
+      Row_Pos_56 /= No_Token_Index,
+      Transform_Res_49,
+      Pos,
+      Row_Pos_56);
+
+
+   Parser.Current_Pos := Row_Pos_56;
+
+   return Transform_Res_49;
+end Char_Lit_Transform_Parse_0;
+
+   
+
+
+function Array_Literal_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Array_Literal
+is
+   use Bare_Array_Literal_Memos;
+
+      Row_Pos_57 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_81 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_81 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_8 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_8 :
+            Free_Parse_List;
+      Defer_Pos_86 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_86 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_82 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_82 :
+            Token_Index
+               := No_Token_Index;
+      List_Pos_8 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_8 :
+            Bare_Expr_List
+               := No_Bare_LK_Node;
+      Token_Pos_83 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_83 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_50 :
+            Bare_Array_Literal
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Array_Literal_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_50 := M.Instance;
+      return Transform_Res_50;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_50;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_57 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_81 := Row_Pos_57;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_81));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Brack)
+   then
+       Token_Pos_81 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_57 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_57,
+             Expected_Token_Id => lkt_L_Brack,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_81 := Row_Pos_57 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_81 /= No_Token_Index then
+
+   Row_Pos_57 := Token_Pos_81;
+
+else
+   Row_Pos_57 := No_Token_Index;
+   goto Exit_Row_57_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_8 := Row_Pos_57;
+
+
+
+Lst_Cpos_8 := Row_Pos_57;
+Tmp_List_8 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_86 :=
+   Expr_Or_Parse_1 (Parser, Lst_Cpos_8);
+Defer_Pos_86 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_86 = No_Token_Index;
+
+   List_Pos_8 := Defer_Pos_86;
+   Lst_Cpos_8 := List_Pos_8;
+
+   Tmp_List_8.Nodes.Append (Defer_Res_86);
+
+      
+--  Start tok_code
+
+Token_Res_82 := Lst_Cpos_8;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_82));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Comma)
+   then
+       Token_Pos_82 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Lst_Cpos_8 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Lst_Cpos_8,
+             Expected_Token_Id => lkt_Comma,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_82 := Lst_Cpos_8 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+      if Token_Pos_82 /= No_Token_Index then
+          Lst_Cpos_8 := Token_Pos_82;
+      else
+         exit;
+      end if;
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_8.Nodes.Length;
+begin
+   List_Res_8 :=
+      Allocate_Expr_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_57;
+      Token_End := (if Lst_Cpos_8 = Row_Pos_57
+                    then Row_Pos_57
+                    else Lst_Cpos_8 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_57, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_8,
+      Kind              => lkt_Expr_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_8,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_8.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_8.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_8);
+
+--  End list_code
+
+
+
+if List_Pos_8 /= No_Token_Index then
+
+   Row_Pos_57 := List_Pos_8;
+
+else
+   Row_Pos_57 := No_Token_Index;
+   goto Exit_Row_57_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_83 := Row_Pos_57;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_83));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Brack)
+   then
+       Token_Pos_83 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_57 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_57,
+             Expected_Token_Id => lkt_R_Brack,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_83 := Row_Pos_57 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_83 /= No_Token_Index then
+
+   Row_Pos_57 := Token_Pos_83;
+
+else
+   Row_Pos_57 := No_Token_Index;
+   goto Exit_Row_57_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_57_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_57 /= No_Token_Index then
+
+   Transform_Res_50 := Allocate_Array_Literal (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_50,
+      Kind => lkt_Array_Literal,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_57 = Pos
+                            then No_Token_Index
+                            else Row_Pos_57 - 1));
+
+      Initialize_Fields_For_Array_Literal
+        (Self => Transform_Res_50, Array_Literal_F_Exprs => List_Res_8);
+
+         if List_Res_8 /= null and then Is_Incomplete (List_Res_8) then
+            Transform_Res_50.Last_Attempted_Child := 0;
+         elsif List_Res_8 /= null and then not Is_Ghost (List_Res_8) then
+            Transform_Res_50.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Array_Literal_Transform_Parse_0_Memo,
+      Row_Pos_57 /= No_Token_Index,
+      Transform_Res_50,
+      Pos,
+      Row_Pos_57);
+
+
+   Parser.Current_Pos := Row_Pos_57;
+
+   return Transform_Res_50;
+end Array_Literal_Transform_Parse_0;
+
+   
+
+
+function Term_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr
+is
+   use Bare_Expr_Memos;
+
+      Row_Pos_44 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_59 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_59 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_65 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_65 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_60 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_60 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_39 :
+            Bare_Paren_Expr
+               := No_Bare_LK_Node;
+      Defer_Pos_66 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_66 :
+            Bare_Match_Expr
+               := No_Bare_LK_Node;
+      Defer_Pos_67 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_67 :
+            Bare_Null_Lit
+               := No_Bare_LK_Node;
+      Defer_Pos_68 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_68 :
+            Bare_Ref_Id
+               := No_Bare_LK_Node;
+      Defer_Pos_69 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_69 :
+            Bare_Block_Expr
+               := No_Bare_LK_Node;
+      Defer_Pos_70 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_70 :
+            Bare_Num_Lit
+               := No_Bare_LK_Node;
+      Defer_Pos_71 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_71 :
+            Bare_String_Lit
+               := No_Bare_LK_Node;
+      Defer_Pos_72 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_72 :
+            Bare_Char_Lit
+               := No_Bare_LK_Node;
+      Defer_Pos_73 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_73 :
+            Bare_Array_Literal
+               := No_Bare_LK_Node;
+      Or_Pos_15 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_15 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Term_Or_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_15 := M.Instance;
+      return Or_Res_15;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_15;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_15 := No_Token_Index;
+Or_Res_15 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_44 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_59 := Row_Pos_44;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_59));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_59 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_44 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_44,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_59 := Row_Pos_44 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_59 /= No_Token_Index then
+
+   Row_Pos_44 := Token_Pos_59;
+
+else
+   Row_Pos_44 := No_Token_Index;
+   goto Exit_Row_44_0;
+
+end if;
+
+
+Defer_Res_65 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_44);
+Defer_Pos_65 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_65 /= No_Token_Index then
+
+   Row_Pos_44 := Defer_Pos_65;
+
+else
+   Row_Pos_44 := No_Token_Index;
+   goto Exit_Row_44_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_60 := Row_Pos_44;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_60));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_60 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_44 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_44,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_60 := Row_Pos_44 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_60 /= No_Token_Index then
+
+   Row_Pos_44 := Token_Pos_60;
+
+else
+   Row_Pos_44 := No_Token_Index;
+   goto Exit_Row_44_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_44_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_44 /= No_Token_Index then
+
+   Transform_Res_39 := Allocate_Paren_Expr (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_39,
+      Kind => lkt_Paren_Expr,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_44 = Pos
+                            then No_Token_Index
+                            else Row_Pos_44 - 1));
+
+      Initialize_Fields_For_Paren_Expr
+        (Self => Transform_Res_39, Paren_Expr_F_Expr => Defer_Res_65);
+
+         if Defer_Res_65 /= null and then Is_Incomplete (Defer_Res_65) then
+            Transform_Res_39.Last_Attempted_Child := 0;
+         elsif Defer_Res_65 /= null and then not Is_Ghost (Defer_Res_65) then
+            Transform_Res_39.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_44 /= No_Token_Index then
+        Or_Pos_15 := Row_Pos_44;
+        Or_Res_15 := Transform_Res_39;
+        goto Exit_Or_15;
+    end if;
+    
+Defer_Res_66 :=
+   Match_Expr_Transform_Parse_2 (Parser, Pos);
+Defer_Pos_66 := Parser.Current_Pos;
+
+    if Defer_Pos_66 /= No_Token_Index then
+        Or_Pos_15 := Defer_Pos_66;
+        Or_Res_15 := Defer_Res_66;
+        goto Exit_Or_15;
+    end if;
+    
+Defer_Res_67 :=
+   Null_Lit_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_67 := Parser.Current_Pos;
+
+    if Defer_Pos_67 /= No_Token_Index then
+        Or_Pos_15 := Defer_Pos_67;
+        Or_Res_15 := Defer_Res_67;
+        goto Exit_Or_15;
+    end if;
+    
+Defer_Res_68 :=
+   Ref_Id_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_68 := Parser.Current_Pos;
+
+    if Defer_Pos_68 /= No_Token_Index then
+        Or_Pos_15 := Defer_Pos_68;
+        Or_Res_15 := Defer_Res_68;
+        goto Exit_Or_15;
+    end if;
+    
+Defer_Res_69 :=
+   Block_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_69 := Parser.Current_Pos;
+
+    if Defer_Pos_69 /= No_Token_Index then
+        Or_Pos_15 := Defer_Pos_69;
+        Or_Res_15 := Defer_Res_69;
+        goto Exit_Or_15;
+    end if;
+    
+Defer_Res_70 :=
+   Num_Lit_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_70 := Parser.Current_Pos;
+
+    if Defer_Pos_70 /= No_Token_Index then
+        Or_Pos_15 := Defer_Pos_70;
+        Or_Res_15 := Defer_Res_70;
+        goto Exit_Or_15;
+    end if;
+    
+Defer_Res_71 :=
+   String_Lit_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_71 := Parser.Current_Pos;
+
+    if Defer_Pos_71 /= No_Token_Index then
+        Or_Pos_15 := Defer_Pos_71;
+        Or_Res_15 := Defer_Res_71;
+        goto Exit_Or_15;
+    end if;
+    
+Defer_Res_72 :=
+   Char_Lit_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_72 := Parser.Current_Pos;
+
+    if Defer_Pos_72 /= No_Token_Index then
+        Or_Pos_15 := Defer_Pos_72;
+        Or_Res_15 := Defer_Res_72;
+        goto Exit_Or_15;
+    end if;
+    
+Defer_Res_73 :=
+   Array_Literal_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_73 := Parser.Current_Pos;
+
+    if Defer_Pos_73 /= No_Token_Index then
+        Or_Pos_15 := Defer_Pos_73;
+        Or_Res_15 := Defer_Res_73;
+        goto Exit_Or_15;
+    end if;
+<<Exit_Or_15>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Term_Or_Parse_0_Memo,
+      Or_Pos_15 /= No_Token_Index,
+      Or_Res_15,
+      Pos,
+      Or_Pos_15);
+
+
+   Parser.Current_Pos := Or_Pos_15;
+
+   return Or_Res_15;
+end Term_Or_Parse_0;
+
+   
+
+
+function Basic_Expr_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr
+is
+   use Bare_Expr_Memos;
+
+      Row_Pos_35 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_48 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_48 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_41 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_41 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_49 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_49 :
+            Bare_Param_List
+               := No_Bare_LK_Node;
+      Token_Pos_42 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_42 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_31 :
+            Bare_Call_Expr
+               := No_Bare_LK_Node;
+      Row_Pos_36 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_50 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_50 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_43 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_43 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_44 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_44 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_51 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_51 :
+            Bare_Param_List
+               := No_Bare_LK_Node;
+      Token_Pos_45 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_45 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_32 :
+            Bare_Null_Cond_Call_Expr
+               := No_Bare_LK_Node;
+      Row_Pos_37 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_52 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_52 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_46 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_46 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_53 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_53 :
+            Bare_Type_Ref_List
+               := No_Bare_LK_Node;
+      Token_Pos_47 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_47 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_33 :
+            Bare_Generic_Instantiation
+               := No_Bare_LK_Node;
+      Row_Pos_38 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_54 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_54 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_48 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_48 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_34 :
+            Bare_Error_On_Null
+               := No_Bare_LK_Node;
+      Row_Pos_39 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_55 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_55 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_49 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_49 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_50 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_50 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_51 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_51 :
+            Token_Index
+               := No_Token_Index;
+      Opt_Res_0 :
+            Bare_Excludes_Null
+               := No_Bare_LK_Node;
+      Token_Pos_52 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_52 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_56 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_56 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Token_Pos_53 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_53 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_35 :
+            Bare_Cast_Expr
+               := No_Bare_LK_Node;
+      Row_Pos_40 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_57 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_57 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_54 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_54 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_58 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_58 :
+            Bare_Ref_Id
+               := No_Bare_LK_Node;
+      Transform_Res_36 :
+            Bare_Dot_Expr
+               := No_Bare_LK_Node;
+      Row_Pos_41 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_59 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_59 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_55 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_55 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_56 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_56 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_60 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_60 :
+            Bare_Ref_Id
+               := No_Bare_LK_Node;
+      Transform_Res_37 :
+            Bare_Null_Cond_Dotted_Name
+               := No_Bare_LK_Node;
+      Defer_Pos_61 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_61 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Or_Pos_14 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_14 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+
+      Mem_Pos : Token_Index := Pos;
+      Mem_Res : Bare_Expr := No_Bare_LK_Node;
+
+   M : Memo_Entry := Get (Parser.Private_Part.Basic_Expr_Or_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_14 := M.Instance;
+      return Or_Res_14;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_14;
+   end if;
+
+       Set (Parser.Private_Part.Basic_Expr_Or_Parse_0_Memo, False, Or_Res_14, Pos, Mem_Pos);
+
+       <<Try_Again>>
+
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_14 := No_Token_Index;
+Or_Res_14 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_35 := Pos;
+
+
+
+Defer_Res_48 :=
+   Basic_Expr_Or_Parse_0 (Parser, Row_Pos_35);
+Defer_Pos_48 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_48 /= No_Token_Index then
+
+   Row_Pos_35 := Defer_Pos_48;
+
+else
+   Row_Pos_35 := No_Token_Index;
+   goto Exit_Row_35_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_41 := Row_Pos_35;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_41));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_41 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_35 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_35,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_41 := Row_Pos_35 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_41 /= No_Token_Index then
+
+   Row_Pos_35 := Token_Pos_41;
+
+else
+   Row_Pos_35 := No_Token_Index;
+   goto Exit_Row_35_0;
+
+end if;
+
+
+Defer_Res_49 :=
+   Params_List_Parse_0 (Parser, Row_Pos_35);
+Defer_Pos_49 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_49 /= No_Token_Index then
+
+   Row_Pos_35 := Defer_Pos_49;
+
+else
+   Row_Pos_35 := No_Token_Index;
+   goto Exit_Row_35_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_42 := Row_Pos_35;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_42));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_42 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_35 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_35,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_42 := Row_Pos_35 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_42 /= No_Token_Index then
+
+   Row_Pos_35 := Token_Pos_42;
+
+else
+   Row_Pos_35 := No_Token_Index;
+   goto Exit_Row_35_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_35_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_35 /= No_Token_Index then
+
+   Transform_Res_31 := Allocate_Call_Expr (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_31,
+      Kind => lkt_Call_Expr,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_35 = Pos
+                            then No_Token_Index
+                            else Row_Pos_35 - 1));
+
+      Initialize_Fields_For_Call_Expr
+        (Self => Transform_Res_31, Call_Expr_F_Name => Defer_Res_48, Call_Expr_F_Args => Defer_Res_49);
+
+         if Defer_Res_48 /= null and then Is_Incomplete (Defer_Res_48) then
+            Transform_Res_31.Last_Attempted_Child := 0;
+         elsif Defer_Res_48 /= null and then not Is_Ghost (Defer_Res_48) then
+            Transform_Res_31.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_49 /= null and then Is_Incomplete (Defer_Res_49) then
+            Transform_Res_31.Last_Attempted_Child := 0;
+         elsif Defer_Res_49 /= null and then not Is_Ghost (Defer_Res_49) then
+            Transform_Res_31.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_35 /= No_Token_Index then
+        Or_Pos_14 := Row_Pos_35;
+        Or_Res_14 := Transform_Res_31;
+        goto Exit_Or_14;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_36 := Pos;
+
+
+
+Defer_Res_50 :=
+   Basic_Expr_Or_Parse_0 (Parser, Row_Pos_36);
+Defer_Pos_50 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_50 /= No_Token_Index then
+
+   Row_Pos_36 := Defer_Pos_50;
+
+else
+   Row_Pos_36 := No_Token_Index;
+   goto Exit_Row_38_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_43 := Row_Pos_36;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_43));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Int_Mark)
+   then
+       Token_Pos_43 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_36 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_36,
+             Expected_Token_Id => lkt_Int_Mark,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_43 := Row_Pos_36 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_43 /= No_Token_Index then
+
+   Row_Pos_36 := Token_Pos_43;
+
+else
+   Row_Pos_36 := No_Token_Index;
+   goto Exit_Row_38_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_44 := Row_Pos_36;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_44));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_44 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_36 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_36,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_44 := Row_Pos_36 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_44 /= No_Token_Index then
+
+   Row_Pos_36 := Token_Pos_44;
+
+else
+   Row_Pos_36 := No_Token_Index;
+   goto Exit_Row_38_0;
+
+end if;
+
+
+Defer_Res_51 :=
+   Params_List_Parse_0 (Parser, Row_Pos_36);
+Defer_Pos_51 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_51 /= No_Token_Index then
+
+   Row_Pos_36 := Defer_Pos_51;
+
+else
+   Row_Pos_36 := No_Token_Index;
+   goto Exit_Row_38_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_45 := Row_Pos_36;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_45));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_45 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_36 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_36,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_45 := Row_Pos_36 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_45 /= No_Token_Index then
+
+   Row_Pos_36 := Token_Pos_45;
+
+else
+   Row_Pos_36 := No_Token_Index;
+   goto Exit_Row_38_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_38_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_36 /= No_Token_Index then
+
+   Transform_Res_32 := Allocate_Null_Cond_Call_Expr (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_32,
+      Kind => lkt_Null_Cond_Call_Expr,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_36 = Pos
+                            then No_Token_Index
+                            else Row_Pos_36 - 1));
+
+      Initialize_Fields_For_Null_Cond_Call_Expr
+        (Self => Transform_Res_32, Call_Expr_F_Name => Defer_Res_50, Call_Expr_F_Args => Defer_Res_51);
+
+         if Defer_Res_50 /= null and then Is_Incomplete (Defer_Res_50) then
+            Transform_Res_32.Last_Attempted_Child := 0;
+         elsif Defer_Res_50 /= null and then not Is_Ghost (Defer_Res_50) then
+            Transform_Res_32.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_51 /= null and then Is_Incomplete (Defer_Res_51) then
+            Transform_Res_32.Last_Attempted_Child := 0;
+         elsif Defer_Res_51 /= null and then not Is_Ghost (Defer_Res_51) then
+            Transform_Res_32.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_36 /= No_Token_Index then
+        Or_Pos_14 := Row_Pos_36;
+        Or_Res_14 := Transform_Res_32;
+        goto Exit_Or_14;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_37 := Pos;
+
+
+
+Defer_Res_52 :=
+   Basic_Expr_Or_Parse_0 (Parser, Row_Pos_37);
+Defer_Pos_52 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_52 /= No_Token_Index then
+
+   Row_Pos_37 := Defer_Pos_52;
+
+else
+   Row_Pos_37 := No_Token_Index;
+   goto Exit_Row_39_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_46 := Row_Pos_37;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_46));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Brack)
+   then
+       Token_Pos_46 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_37 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_37,
+             Expected_Token_Id => lkt_L_Brack,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_46 := Row_Pos_37 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_46 /= No_Token_Index then
+
+   Row_Pos_37 := Token_Pos_46;
+
+else
+   Row_Pos_37 := No_Token_Index;
+   goto Exit_Row_39_0;
+
+end if;
+
+
+Defer_Res_53 :=
+   Type_List_List_Parse_0 (Parser, Row_Pos_37);
+Defer_Pos_53 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_53 /= No_Token_Index then
+
+   Row_Pos_37 := Defer_Pos_53;
+
+else
+   Row_Pos_37 := No_Token_Index;
+   goto Exit_Row_39_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_47 := Row_Pos_37;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_47));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Brack)
+   then
+       Token_Pos_47 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_37 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_37,
+             Expected_Token_Id => lkt_R_Brack,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_47 := Row_Pos_37 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_47 /= No_Token_Index then
+
+   Row_Pos_37 := Token_Pos_47;
+
+else
+   Row_Pos_37 := No_Token_Index;
+   goto Exit_Row_39_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_39_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_37 /= No_Token_Index then
+
+   Transform_Res_33 := Allocate_Generic_Instantiation (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_33,
+      Kind => lkt_Generic_Instantiation,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_37 = Pos
+                            then No_Token_Index
+                            else Row_Pos_37 - 1));
+
+      Initialize_Fields_For_Generic_Instantiation
+        (Self => Transform_Res_33, Generic_Instantiation_F_Name => Defer_Res_52, Generic_Instantiation_F_Args => Defer_Res_53);
+
+         if Defer_Res_52 /= null and then Is_Incomplete (Defer_Res_52) then
+            Transform_Res_33.Last_Attempted_Child := 0;
+         elsif Defer_Res_52 /= null and then not Is_Ghost (Defer_Res_52) then
+            Transform_Res_33.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_53 /= null and then Is_Incomplete (Defer_Res_53) then
+            Transform_Res_33.Last_Attempted_Child := 0;
+         elsif Defer_Res_53 /= null and then not Is_Ghost (Defer_Res_53) then
+            Transform_Res_33.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_37 /= No_Token_Index then
+        Or_Pos_14 := Row_Pos_37;
+        Or_Res_14 := Transform_Res_33;
+        goto Exit_Or_14;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_38 := Pos;
+
+
+
+Defer_Res_54 :=
+   Basic_Expr_Or_Parse_0 (Parser, Row_Pos_38);
+Defer_Pos_54 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_54 /= No_Token_Index then
+
+   Row_Pos_38 := Defer_Pos_54;
+
+else
+   Row_Pos_38 := No_Token_Index;
+   goto Exit_Row_40_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_48 := Row_Pos_38;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_48));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Excl_Mark)
+   then
+       Token_Pos_48 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_38 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_38,
+             Expected_Token_Id => lkt_Excl_Mark,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_48 := Row_Pos_38 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_48 /= No_Token_Index then
+
+   Row_Pos_38 := Token_Pos_48;
+
+else
+   Row_Pos_38 := No_Token_Index;
+   goto Exit_Row_40_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_40_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_38 /= No_Token_Index then
+
+   Transform_Res_34 := Allocate_Error_On_Null (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_34,
+      Kind => lkt_Error_On_Null,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_38 = Pos
+                            then No_Token_Index
+                            else Row_Pos_38 - 1));
+
+      Initialize_Fields_For_Error_On_Null
+        (Self => Transform_Res_34, Error_On_Null_F_Expr => Defer_Res_54);
+
+         if Defer_Res_54 /= null and then Is_Incomplete (Defer_Res_54) then
+            Transform_Res_34.Last_Attempted_Child := 0;
+         elsif Defer_Res_54 /= null and then not Is_Ghost (Defer_Res_54) then
+            Transform_Res_34.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_38 /= No_Token_Index then
+        Or_Pos_14 := Row_Pos_38;
+        Or_Res_14 := Transform_Res_34;
+        goto Exit_Or_14;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_39 := Pos;
+
+
+
+Defer_Res_55 :=
+   Basic_Expr_Or_Parse_0 (Parser, Row_Pos_39);
+Defer_Pos_55 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_55 /= No_Token_Index then
+
+   Row_Pos_39 := Defer_Pos_55;
+
+else
+   Row_Pos_39 := No_Token_Index;
+   goto Exit_Row_41_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_49 := Row_Pos_39;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_49));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Dot)
+   then
+       Token_Pos_49 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_39 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_39,
+             Expected_Token_Id => lkt_Dot,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_49 := Row_Pos_39 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_49 /= No_Token_Index then
+
+   Row_Pos_39 := Token_Pos_49;
+
+else
+   Row_Pos_39 := No_Token_Index;
+   goto Exit_Row_41_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_50 := Row_Pos_39;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_50));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Identifier)
+      or else T.Symbol /= Precomputed_Symbol
+        (Parser.TDH.Symbols, Precomputed_Symbol_As)
+   then
+       Token_Pos_50 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_39 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_39,
+             Expected_Token_Id => lkt_Identifier,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_50 := Row_Pos_39 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_50 /= No_Token_Index then
+
+   Row_Pos_39 := Token_Pos_50;
+
+else
+   Row_Pos_39 := No_Token_Index;
+   goto Exit_Row_41_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start tok_code
+
+Token_Res_51 := Row_Pos_39;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_51));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Excl_Mark)
+   then
+       Token_Pos_51 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_39 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_39,
+             Expected_Token_Id => lkt_Excl_Mark,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_51 := Row_Pos_39 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+if Token_Pos_51 = No_Token_Index then
+
+         Opt_Res_0 := Allocate_Excludes_Null_Absent (Parser.Mem_Pool);
+         Initialize
+           (Self              => Opt_Res_0,
+            Kind              => lkt_Excludes_Null_Absent,
+            Unit              => Parser.Unit,
+            Token_Start_Index => Row_Pos_39,
+            Token_End_Index   => No_Token_Index);
+
+
+    Token_Pos_51 := Row_Pos_39;
+
+else
+
+      Opt_Res_0 := Allocate_Excludes_Null_Present (Parser.Mem_Pool);
+      Initialize
+        (Self              => Opt_Res_0,
+         Kind              => lkt_Excludes_Null_Present,
+         Unit              => Parser.Unit,
+         Token_Start_Index => Row_Pos_39,
+         Token_End_Index   => Token_Pos_51 - 1);
+
+end if;
+
+--  End opt_code
+
+
+
+if Token_Pos_51 /= No_Token_Index then
+
+   Row_Pos_39 := Token_Pos_51;
+
+else
+   Row_Pos_39 := No_Token_Index;
+   goto Exit_Row_41_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_52 := Row_Pos_39;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_52));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Brack)
+   then
+       Token_Pos_52 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_39 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_39,
+             Expected_Token_Id => lkt_L_Brack,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_52 := Row_Pos_39 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_52 /= No_Token_Index then
+
+   Row_Pos_39 := Token_Pos_52;
+
+else
+   Row_Pos_39 := No_Token_Index;
+   goto Exit_Row_41_0;
+
+end if;
+
+
+Defer_Res_56 :=
+   Type_Ref_Or_Parse_0 (Parser, Row_Pos_39);
+Defer_Pos_56 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_56 /= No_Token_Index then
+
+   Row_Pos_39 := Defer_Pos_56;
+
+else
+   Row_Pos_39 := No_Token_Index;
+   goto Exit_Row_41_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_53 := Row_Pos_39;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_53));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Brack)
+   then
+       Token_Pos_53 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_39 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_39,
+             Expected_Token_Id => lkt_R_Brack,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_53 := Row_Pos_39 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_53 /= No_Token_Index then
+
+   Row_Pos_39 := Token_Pos_53;
+
+else
+   Row_Pos_39 := No_Token_Index;
+   goto Exit_Row_41_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_41_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_39 /= No_Token_Index then
+
+   Transform_Res_35 := Allocate_Cast_Expr (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_35,
+      Kind => lkt_Cast_Expr,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_39 = Pos
+                            then No_Token_Index
+                            else Row_Pos_39 - 1));
+
+      Initialize_Fields_For_Cast_Expr
+        (Self => Transform_Res_35, Cast_Expr_F_Expr => Defer_Res_55, Cast_Expr_F_Excludes_Null => Opt_Res_0, Cast_Expr_F_Dest_Type => Defer_Res_56);
+
+         if Defer_Res_55 /= null and then Is_Incomplete (Defer_Res_55) then
+            Transform_Res_35.Last_Attempted_Child := 0;
+         elsif Defer_Res_55 /= null and then not Is_Ghost (Defer_Res_55) then
+            Transform_Res_35.Last_Attempted_Child := -1;
+         end if;
+         if Opt_Res_0 /= null and then Is_Incomplete (Opt_Res_0) then
+            Transform_Res_35.Last_Attempted_Child := 0;
+         elsif Opt_Res_0 /= null and then not Is_Ghost (Opt_Res_0) then
+            Transform_Res_35.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_56 /= null and then Is_Incomplete (Defer_Res_56) then
+            Transform_Res_35.Last_Attempted_Child := 0;
+         elsif Defer_Res_56 /= null and then not Is_Ghost (Defer_Res_56) then
+            Transform_Res_35.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_39 /= No_Token_Index then
+        Or_Pos_14 := Row_Pos_39;
+        Or_Res_14 := Transform_Res_35;
+        goto Exit_Or_14;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_40 := Pos;
+
+
+
+Defer_Res_57 :=
+   Basic_Expr_Or_Parse_0 (Parser, Row_Pos_40);
+Defer_Pos_57 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_57 /= No_Token_Index then
+
+   Row_Pos_40 := Defer_Pos_57;
+
+else
+   Row_Pos_40 := No_Token_Index;
+   goto Exit_Row_42_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_54 := Row_Pos_40;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_54));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Dot)
+   then
+       Token_Pos_54 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_40 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_40,
+             Expected_Token_Id => lkt_Dot,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_54 := Row_Pos_40 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_54 /= No_Token_Index then
+
+   Row_Pos_40 := Token_Pos_54;
+
+else
+   Row_Pos_40 := No_Token_Index;
+   goto Exit_Row_42_0;
+
+end if;
+
+
+Defer_Res_58 :=
+   Ref_Id_Transform_Parse_0 (Parser, Row_Pos_40);
+Defer_Pos_58 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_58 /= No_Token_Index then
+
+   Row_Pos_40 := Defer_Pos_58;
+
+else
+   Row_Pos_40 := No_Token_Index;
+   goto Exit_Row_42_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_42_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_40 /= No_Token_Index then
+
+   Transform_Res_36 := Allocate_Dot_Expr (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_36,
+      Kind => lkt_Dot_Expr,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_40 = Pos
+                            then No_Token_Index
+                            else Row_Pos_40 - 1));
+
+      Initialize_Fields_For_Dot_Expr
+        (Self => Transform_Res_36, Dot_Expr_F_Prefix => Defer_Res_57, Dot_Expr_F_Suffix => Defer_Res_58);
+
+         if Defer_Res_57 /= null and then Is_Incomplete (Defer_Res_57) then
+            Transform_Res_36.Last_Attempted_Child := 0;
+         elsif Defer_Res_57 /= null and then not Is_Ghost (Defer_Res_57) then
+            Transform_Res_36.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_58 /= null and then Is_Incomplete (Defer_Res_58) then
+            Transform_Res_36.Last_Attempted_Child := 0;
+         elsif Defer_Res_58 /= null and then not Is_Ghost (Defer_Res_58) then
+            Transform_Res_36.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_40 /= No_Token_Index then
+        Or_Pos_14 := Row_Pos_40;
+        Or_Res_14 := Transform_Res_36;
+        goto Exit_Or_14;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_41 := Pos;
+
+
+
+Defer_Res_59 :=
+   Basic_Expr_Or_Parse_0 (Parser, Row_Pos_41);
+Defer_Pos_59 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_59 /= No_Token_Index then
+
+   Row_Pos_41 := Defer_Pos_59;
+
+else
+   Row_Pos_41 := No_Token_Index;
+   goto Exit_Row_43_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_55 := Row_Pos_41;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_55));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Int_Mark)
+   then
+       Token_Pos_55 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_41 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_41,
+             Expected_Token_Id => lkt_Int_Mark,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_55 := Row_Pos_41 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_55 /= No_Token_Index then
+
+   Row_Pos_41 := Token_Pos_55;
+
+else
+   Row_Pos_41 := No_Token_Index;
+   goto Exit_Row_43_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_56 := Row_Pos_41;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_56));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Dot)
+   then
+       Token_Pos_56 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_41 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_41,
+             Expected_Token_Id => lkt_Dot,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_56 := Row_Pos_41 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_56 /= No_Token_Index then
+
+   Row_Pos_41 := Token_Pos_56;
+
+else
+   Row_Pos_41 := No_Token_Index;
+   goto Exit_Row_43_0;
+
+end if;
+
+
+Defer_Res_60 :=
+   Ref_Id_Transform_Parse_0 (Parser, Row_Pos_41);
+Defer_Pos_60 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_60 /= No_Token_Index then
+
+   Row_Pos_41 := Defer_Pos_60;
+
+else
+   Row_Pos_41 := No_Token_Index;
+   goto Exit_Row_43_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_43_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_41 /= No_Token_Index then
+
+   Transform_Res_37 := Allocate_Null_Cond_Dotted_Name (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_37,
+      Kind => lkt_Null_Cond_Dotted_Name,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_41 = Pos
+                            then No_Token_Index
+                            else Row_Pos_41 - 1));
+
+      Initialize_Fields_For_Null_Cond_Dotted_Name
+        (Self => Transform_Res_37, Dot_Expr_F_Prefix => Defer_Res_59, Dot_Expr_F_Suffix => Defer_Res_60);
+
+         if Defer_Res_59 /= null and then Is_Incomplete (Defer_Res_59) then
+            Transform_Res_37.Last_Attempted_Child := 0;
+         elsif Defer_Res_59 /= null and then not Is_Ghost (Defer_Res_59) then
+            Transform_Res_37.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_60 /= null and then Is_Incomplete (Defer_Res_60) then
+            Transform_Res_37.Last_Attempted_Child := 0;
+         elsif Defer_Res_60 /= null and then not Is_Ghost (Defer_Res_60) then
+            Transform_Res_37.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_41 /= No_Token_Index then
+        Or_Pos_14 := Row_Pos_41;
+        Or_Res_14 := Transform_Res_37;
+        goto Exit_Or_14;
+    end if;
+    
+Defer_Res_61 :=
+   Term_Or_Parse_0 (Parser, Pos);
+Defer_Pos_61 := Parser.Current_Pos;
+
+    if Defer_Pos_61 /= No_Token_Index then
+        Or_Pos_14 := Defer_Pos_61;
+        Or_Res_14 := Defer_Res_61;
+        goto Exit_Or_14;
+    end if;
+<<Exit_Or_14>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+      if Or_Pos_14 > Mem_Pos then
+         Mem_Pos := Or_Pos_14;
+         Mem_Res := Or_Res_14;
+         Set
+           (Parser.Private_Part.Basic_Expr_Or_Parse_0_Memo,
+            Or_Pos_14 /= No_Token_Index,
+            Or_Res_14,
+            Pos,
+            Or_Pos_14);
+         goto Try_Again;
+
+      elsif Mem_Pos > Pos then
+         Or_Res_14 := Mem_Res;
+         Or_Pos_14 := Mem_Pos;
+         goto No_Memo;
+      end if;
+
+   Set
+     (Parser.Private_Part.Basic_Expr_Or_Parse_0_Memo,
+      Or_Pos_14 /= No_Token_Index,
+      Or_Res_14,
+      Pos,
+      Or_Pos_14);
+
+       <<No_Memo>>
+
+   Parser.Current_Pos := Or_Pos_14;
+
+   return Or_Res_14;
+end Basic_Expr_Or_Parse_0;
+
+   
+
+
+function Logic_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr
+is
+   use Bare_Expr_Memos;
+
+      Row_Pos_34 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_40 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_40 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_46 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_46 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_30 :
+            Bare_Logic_Expr
+               := No_Bare_LK_Node;
+      Defer_Pos_47 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_47 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Or_Pos_13 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_13 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Logic_Or_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_13 := M.Instance;
+      return Or_Res_13;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_13;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_13 := No_Token_Index;
+Or_Res_13 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_34 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_40 := Row_Pos_34;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_40));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Percent)
+   then
+       Token_Pos_40 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_34 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_34,
+             Expected_Token_Id => lkt_Percent,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_40 := Row_Pos_34 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_40 /= No_Token_Index then
+
+   Row_Pos_34 := Token_Pos_40;
+
+else
+   Row_Pos_34 := No_Token_Index;
+   goto Exit_Row_34_0;
+
+end if;
+
+
+Defer_Res_46 :=
+   Basic_Expr_Or_Parse_0 (Parser, Row_Pos_34);
+Defer_Pos_46 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_46 /= No_Token_Index then
+
+   Row_Pos_34 := Defer_Pos_46;
+
+else
+   Row_Pos_34 := No_Token_Index;
+   goto Exit_Row_34_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_34_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_34 /= No_Token_Index then
+
+   Transform_Res_30 := Allocate_Logic_Expr (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_30,
+      Kind => lkt_Logic_Expr,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_34 = Pos
+                            then No_Token_Index
+                            else Row_Pos_34 - 1));
+
+      Initialize_Fields_For_Logic_Expr
+        (Self => Transform_Res_30, Logic_Expr_F_Expr => Defer_Res_46);
+
+         if Defer_Res_46 /= null and then Is_Incomplete (Defer_Res_46) then
+            Transform_Res_30.Last_Attempted_Child := 0;
+         elsif Defer_Res_46 /= null and then not Is_Ghost (Defer_Res_46) then
+            Transform_Res_30.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_34 /= No_Token_Index then
+        Or_Pos_13 := Row_Pos_34;
+        Or_Res_13 := Transform_Res_30;
+        goto Exit_Or_13;
+    end if;
+    
+Defer_Res_47 :=
+   Basic_Expr_Or_Parse_0 (Parser, Pos);
+Defer_Pos_47 := Parser.Current_Pos;
+
+    if Defer_Pos_47 /= No_Token_Index then
+        Or_Pos_13 := Defer_Pos_47;
+        Or_Res_13 := Defer_Res_47;
+        goto Exit_Or_13;
+    end if;
+<<Exit_Or_13>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Logic_Or_Parse_0_Memo,
+      Or_Pos_13 /= No_Token_Index,
+      Or_Res_13,
+      Pos,
+      Or_Pos_13);
+
+
+   Parser.Current_Pos := Or_Pos_13;
+
+   return Or_Res_13;
+end Logic_Or_Parse_0;
+
+   
+
+
+function Primary_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr
+is
+   use Bare_Expr_Memos;
+
+      Defer_Pos_9 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_9 :
+            Bare_Lambda_Expr
+               := No_Bare_LK_Node;
+      Defer_Pos_10 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_10 :
+            Bare_If_Expr
+               := No_Bare_LK_Node;
+      Defer_Pos_11 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_11 :
+            Bare_Raise_Expr
+               := No_Bare_LK_Node;
+      Defer_Pos_12 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_12 :
+            Bare_Try_Expr
+               := No_Bare_LK_Node;
+      Defer_Pos_13 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_13 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Or_Pos_5 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_5 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Primary_Or_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_5 := M.Instance;
+      return Or_Res_5;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_5;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_5 := No_Token_Index;
+Or_Res_5 := No_Bare_LK_Node;
+    
+Defer_Res_9 :=
+   Lambda_Expr_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_9 := Parser.Current_Pos;
+
+    if Defer_Pos_9 /= No_Token_Index then
+        Or_Pos_5 := Defer_Pos_9;
+        Or_Res_5 := Defer_Res_9;
+        goto Exit_Or_5;
+    end if;
+    
+Defer_Res_10 :=
+   If_Expr_Transform_Parse_1 (Parser, Pos);
+Defer_Pos_10 := Parser.Current_Pos;
+
+    if Defer_Pos_10 /= No_Token_Index then
+        Or_Pos_5 := Defer_Pos_10;
+        Or_Res_5 := Defer_Res_10;
+        goto Exit_Or_5;
+    end if;
+    
+Defer_Res_11 :=
+   Raise_Expr_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_11 := Parser.Current_Pos;
+
+    if Defer_Pos_11 /= No_Token_Index then
+        Or_Pos_5 := Defer_Pos_11;
+        Or_Res_5 := Defer_Res_11;
+        goto Exit_Or_5;
+    end if;
+    
+Defer_Res_12 :=
+   Try_Expr_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_12 := Parser.Current_Pos;
+
+    if Defer_Pos_12 /= No_Token_Index then
+        Or_Pos_5 := Defer_Pos_12;
+        Or_Res_5 := Defer_Res_12;
+        goto Exit_Or_5;
+    end if;
+    
+Defer_Res_13 :=
+   Logic_Or_Parse_0 (Parser, Pos);
+Defer_Pos_13 := Parser.Current_Pos;
+
+    if Defer_Pos_13 /= No_Token_Index then
+        Or_Pos_5 := Defer_Pos_13;
+        Or_Res_5 := Defer_Res_13;
+        goto Exit_Or_5;
+    end if;
+<<Exit_Or_5>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Primary_Or_Parse_0_Memo,
+      Or_Pos_5 /= No_Token_Index,
+      Or_Res_5,
+      Pos,
+      Or_Pos_5);
+
+
+   Parser.Current_Pos := Or_Pos_5;
+
+   return Or_Res_5;
+end Primary_Or_Parse_0;
+
+   
+
+
+function Isa_Or_Primary_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr
+is
+   use Bare_Expr_Memos;
+
+      Row_Pos_7 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_6 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_6 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_5 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_5 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_0 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_0 :
+            Free_Parse_List;
+      Defer_Pos_7 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_7 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Token_Pos_6 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_6 :
+            Token_Index
+               := No_Token_Index;
+      List_Pos_0 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_0 :
+            Bare_Type_Ref_List
+               := No_Bare_LK_Node;
+      Transform_Res_7 :
+            Bare_Isa
+               := No_Bare_LK_Node;
+      Defer_Pos_8 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_8 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Or_Pos_4 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_4 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Isa_Or_Primary_Or_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_4 := M.Instance;
+      return Or_Res_4;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_4;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_4 := No_Token_Index;
+Or_Res_4 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_7 := Pos;
+
+
+
+Defer_Res_6 :=
+   Primary_Or_Parse_0 (Parser, Row_Pos_7);
+Defer_Pos_6 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_6 /= No_Token_Index then
+
+   Row_Pos_7 := Defer_Pos_6;
+
+else
+   Row_Pos_7 := No_Token_Index;
+   goto Exit_Row_7_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_5 := Row_Pos_7;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_5));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Is_Kw)
+   then
+       Token_Pos_5 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_7 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_7,
+             Expected_Token_Id => lkt_Is_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_5 := Row_Pos_7 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_5 /= No_Token_Index then
+
+   Row_Pos_7 := Token_Pos_5;
+
+else
+   Row_Pos_7 := No_Token_Index;
+   goto Exit_Row_7_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_0 := No_Token_Index;
+
+
+
+Lst_Cpos_0 := Row_Pos_7;
+Tmp_List_0 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_7 :=
+   Type_Ref_Or_Parse_0 (Parser, Lst_Cpos_0);
+Defer_Pos_7 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_7 = No_Token_Index;
+
+   List_Pos_0 := Defer_Pos_7;
+   Lst_Cpos_0 := List_Pos_0;
+
+   Tmp_List_0.Nodes.Append (Defer_Res_7);
+
+      
+--  Start tok_code
+
+Token_Res_6 := Lst_Cpos_0;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_6));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Pipe)
+   then
+       Token_Pos_6 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Lst_Cpos_0 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Lst_Cpos_0,
+             Expected_Token_Id => lkt_Pipe,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_6 := Lst_Cpos_0 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+      if Token_Pos_6 /= No_Token_Index then
+          Lst_Cpos_0 := Token_Pos_6;
+      else
+         exit;
+      end if;
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_0.Nodes.Length;
+begin
+   List_Res_0 :=
+      Allocate_Type_Ref_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_7;
+      Token_End := (if Lst_Cpos_0 = Row_Pos_7
+                    then Row_Pos_7
+                    else Lst_Cpos_0 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_7, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_0,
+      Kind              => lkt_Type_Ref_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_0,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_0.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_0.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_0);
+
+--  End list_code
+
+
+
+if List_Pos_0 /= No_Token_Index then
+
+   Row_Pos_7 := List_Pos_0;
+
+else
+   Row_Pos_7 := No_Token_Index;
+   goto Exit_Row_7_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_7_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_7 /= No_Token_Index then
+
+   Transform_Res_7 := Allocate_Isa (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_7,
+      Kind => lkt_Isa,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_7 = Pos
+                            then No_Token_Index
+                            else Row_Pos_7 - 1));
+
+      Initialize_Fields_For_Isa
+        (Self => Transform_Res_7, Isa_F_Expr => Defer_Res_6, Isa_F_Dest_Type => List_Res_0);
+
+         if Defer_Res_6 /= null and then Is_Incomplete (Defer_Res_6) then
+            Transform_Res_7.Last_Attempted_Child := 0;
+         elsif Defer_Res_6 /= null and then not Is_Ghost (Defer_Res_6) then
+            Transform_Res_7.Last_Attempted_Child := -1;
+         end if;
+         if List_Res_0 /= null and then Is_Incomplete (List_Res_0) then
+            Transform_Res_7.Last_Attempted_Child := 0;
+         elsif List_Res_0 /= null and then not Is_Ghost (List_Res_0) then
+            Transform_Res_7.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_7 /= No_Token_Index then
+        Or_Pos_4 := Row_Pos_7;
+        Or_Res_4 := Transform_Res_7;
+        goto Exit_Or_4;
+    end if;
+    
+Defer_Res_8 :=
+   Primary_Or_Parse_0 (Parser, Pos);
+Defer_Pos_8 := Parser.Current_Pos;
+
+    if Defer_Pos_8 /= No_Token_Index then
+        Or_Pos_4 := Defer_Pos_8;
+        Or_Res_4 := Defer_Res_8;
+        goto Exit_Or_4;
+    end if;
+<<Exit_Or_4>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Isa_Or_Primary_Or_Parse_0_Memo,
+      Or_Pos_4 /= No_Token_Index,
+      Or_Res_4,
+      Pos,
+      Or_Pos_4);
+
+
+   Parser.Current_Pos := Or_Pos_4;
+
+   return Or_Res_4;
+end Isa_Or_Primary_Or_Parse_0;
+
+   
+
+
+function Arith_2_Or_Parse_1
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr
+is
+   use Bare_Expr_Memos;
+
+      Row_Pos_4 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_3 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_3 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Row_Pos_5 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_3 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_3 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_4 :
+            Bare_Op_Mult
+               := No_Bare_LK_Node;
+      Row_Pos_6 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_4 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_4 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_5 :
+            Bare_Op_Div
+               := No_Bare_LK_Node;
+      Or_Pos_2 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_2 :
+            Bare_Op
+               := No_Bare_LK_Node;
+      Defer_Pos_4 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_4 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_6 :
+            Bare_Bin_Op
+               := No_Bare_LK_Node;
+      Defer_Pos_5 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_5 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Or_Pos_3 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_3 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+
+      Mem_Pos : Token_Index := Pos;
+      Mem_Res : Bare_Expr := No_Bare_LK_Node;
+
+   M : Memo_Entry := Get (Parser.Private_Part.Arith_2_Or_Parse_1_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_3 := M.Instance;
+      return Or_Res_3;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_3;
+   end if;
+
+       Set (Parser.Private_Part.Arith_2_Or_Parse_1_Memo, False, Or_Res_3, Pos, Mem_Pos);
+
+       <<Try_Again>>
+
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_3 := No_Token_Index;
+Or_Res_3 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_4 := Pos;
+
+
+
+Defer_Res_3 :=
+   Arith_2_Or_Parse_1 (Parser, Row_Pos_4);
+Defer_Pos_3 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_3 /= No_Token_Index then
+
+   Row_Pos_4 := Defer_Pos_3;
+
+else
+   Row_Pos_4 := No_Token_Index;
+   goto Exit_Row_4_0;
+
+end if;
+
+
+--  Start or_code
+
+Or_Pos_2 := No_Token_Index;
+Or_Res_2 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_5 := Row_Pos_4;
+
+
+
+--  Start tok_code
+
+Token_Res_3 := Row_Pos_5;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_3));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Times)
+   then
+       Token_Pos_3 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_5 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_5,
+             Expected_Token_Id => lkt_Times,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_3 := Row_Pos_5 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_3 /= No_Token_Index then
+
+   Row_Pos_5 := Token_Pos_3;
+
+else
+   Row_Pos_5 := No_Token_Index;
+   goto Exit_Row_5_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_5_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_5 /= No_Token_Index then
+
+   Transform_Res_4 := Allocate_Op_Mult (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_4,
+      Kind => lkt_Op_Mult,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_4,
+      Token_End_Index   => (if Row_Pos_5 = Row_Pos_4
+                            then No_Token_Index
+                            else Row_Pos_5 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_5 /= No_Token_Index then
+        Or_Pos_2 := Row_Pos_5;
+        Or_Res_2 := Transform_Res_4;
+        goto Exit_Or_3;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_6 := Row_Pos_4;
+
+
+
+--  Start tok_code
+
+Token_Res_4 := Row_Pos_6;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_4));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Div)
+   then
+       Token_Pos_4 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_6 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_6,
+             Expected_Token_Id => lkt_Div,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_4 := Row_Pos_6 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_4 /= No_Token_Index then
+
+   Row_Pos_6 := Token_Pos_4;
+
+else
+   Row_Pos_6 := No_Token_Index;
+   goto Exit_Row_6_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_6_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_6 /= No_Token_Index then
+
+   Transform_Res_5 := Allocate_Op_Div (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_5,
+      Kind => lkt_Op_Div,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_4,
+      Token_End_Index   => (if Row_Pos_6 = Row_Pos_4
+                            then No_Token_Index
+                            else Row_Pos_6 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_6 /= No_Token_Index then
+        Or_Pos_2 := Row_Pos_6;
+        Or_Res_2 := Transform_Res_5;
+        goto Exit_Or_3;
+    end if;
+<<Exit_Or_3>>
+
+--  End or_code
+
+
+
+if Or_Pos_2 /= No_Token_Index then
+
+   Row_Pos_4 := Or_Pos_2;
+
+else
+   Row_Pos_4 := No_Token_Index;
+   goto Exit_Row_4_0;
+
+end if;
+
+
+Defer_Res_4 :=
+   Isa_Or_Primary_Or_Parse_0 (Parser, Row_Pos_4);
+Defer_Pos_4 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_4 /= No_Token_Index then
+
+   Row_Pos_4 := Defer_Pos_4;
+
+else
+   Row_Pos_4 := No_Token_Index;
+   goto Exit_Row_4_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_4_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_4 /= No_Token_Index then
+
+   Transform_Res_6 := Allocate_Bin_Op (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_6,
+      Kind => lkt_Bin_Op,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_4 = Pos
+                            then No_Token_Index
+                            else Row_Pos_4 - 1));
+
+      Initialize_Fields_For_Bin_Op
+        (Self => Transform_Res_6, Bin_Op_F_Left => Defer_Res_3, Bin_Op_F_Op => Or_Res_2, Bin_Op_F_Right => Defer_Res_4);
+
+         if Defer_Res_3 /= null and then Is_Incomplete (Defer_Res_3) then
+            Transform_Res_6.Last_Attempted_Child := 0;
+         elsif Defer_Res_3 /= null and then not Is_Ghost (Defer_Res_3) then
+            Transform_Res_6.Last_Attempted_Child := -1;
+         end if;
+         if Or_Res_2 /= null and then Is_Incomplete (Or_Res_2) then
+            Transform_Res_6.Last_Attempted_Child := 0;
+         elsif Or_Res_2 /= null and then not Is_Ghost (Or_Res_2) then
+            Transform_Res_6.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_4 /= null and then Is_Incomplete (Defer_Res_4) then
+            Transform_Res_6.Last_Attempted_Child := 0;
+         elsif Defer_Res_4 /= null and then not Is_Ghost (Defer_Res_4) then
+            Transform_Res_6.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_4 /= No_Token_Index then
+        Or_Pos_3 := Row_Pos_4;
+        Or_Res_3 := Transform_Res_6;
+        goto Exit_Or_2;
+    end if;
+    
+Defer_Res_5 :=
+   Isa_Or_Primary_Or_Parse_0 (Parser, Pos);
+Defer_Pos_5 := Parser.Current_Pos;
+
+    if Defer_Pos_5 /= No_Token_Index then
+        Or_Pos_3 := Defer_Pos_5;
+        Or_Res_3 := Defer_Res_5;
+        goto Exit_Or_2;
+    end if;
+<<Exit_Or_2>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+      if Or_Pos_3 > Mem_Pos then
+         Mem_Pos := Or_Pos_3;
+         Mem_Res := Or_Res_3;
+         Set
+           (Parser.Private_Part.Arith_2_Or_Parse_1_Memo,
+            Or_Pos_3 /= No_Token_Index,
+            Or_Res_3,
+            Pos,
+            Or_Pos_3);
+         goto Try_Again;
+
+      elsif Mem_Pos > Pos then
+         Or_Res_3 := Mem_Res;
+         Or_Pos_3 := Mem_Pos;
+         goto No_Memo;
+      end if;
+
+   Set
+     (Parser.Private_Part.Arith_2_Or_Parse_1_Memo,
+      Or_Pos_3 /= No_Token_Index,
+      Or_Res_3,
+      Pos,
+      Or_Pos_3);
+
+       <<No_Memo>>
+
+   Parser.Current_Pos := Or_Pos_3;
+
+   return Or_Res_3;
+end Arith_2_Or_Parse_1;
+
+   
+
+
+function Arith_1_Or_Parse_1
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Expr
+is
+   use Bare_Expr_Memos;
+
+      Row_Pos_0 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_0 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_0 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Row_Pos_1 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_0 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_0 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_0 :
+            Bare_Op_Plus
+               := No_Bare_LK_Node;
+      Row_Pos_2 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_1 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_1 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_1 :
+            Bare_Op_Minus
+               := No_Bare_LK_Node;
+      Row_Pos_3 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_2 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_2 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_2 :
+            Bare_Op_Amp
+               := No_Bare_LK_Node;
+      Or_Pos_0 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_0 :
+            Bare_Op
+               := No_Bare_LK_Node;
+      Defer_Pos_1 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_1 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_3 :
+            Bare_Bin_Op
+               := No_Bare_LK_Node;
+      Defer_Pos_2 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_2 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Or_Pos_1 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_1 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+
+      Mem_Pos : Token_Index := Pos;
+      Mem_Res : Bare_Expr := No_Bare_LK_Node;
+
+   M : Memo_Entry := Get (Parser.Private_Part.Arith_1_Or_Parse_1_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_1 := M.Instance;
+      return Or_Res_1;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_1;
+   end if;
+
+       Set (Parser.Private_Part.Arith_1_Or_Parse_1_Memo, False, Or_Res_1, Pos, Mem_Pos);
+
+       <<Try_Again>>
+
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_1 := No_Token_Index;
+Or_Res_1 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_0 := Pos;
+
+
+
+Defer_Res_0 :=
+   Arith_1_Or_Parse_1 (Parser, Row_Pos_0);
+Defer_Pos_0 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_0 /= No_Token_Index then
+
+   Row_Pos_0 := Defer_Pos_0;
+
+else
+   Row_Pos_0 := No_Token_Index;
+   goto Exit_Row_0_0;
+
+end if;
+
+
+--  Start or_code
+
+Or_Pos_0 := No_Token_Index;
+Or_Res_0 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_1 := Row_Pos_0;
+
+
+
+--  Start tok_code
+
+Token_Res_0 := Row_Pos_1;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_0));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Plus)
+   then
+       Token_Pos_0 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_1 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_1,
+             Expected_Token_Id => lkt_Plus,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_0 := Row_Pos_1 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_0 /= No_Token_Index then
+
+   Row_Pos_1 := Token_Pos_0;
+
+else
+   Row_Pos_1 := No_Token_Index;
+   goto Exit_Row_1_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_1_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_1 /= No_Token_Index then
+
+   Transform_Res_0 := Allocate_Op_Plus (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_0,
+      Kind => lkt_Op_Plus,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_0,
+      Token_End_Index   => (if Row_Pos_1 = Row_Pos_0
+                            then No_Token_Index
+                            else Row_Pos_1 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_1 /= No_Token_Index then
+        Or_Pos_0 := Row_Pos_1;
+        Or_Res_0 := Transform_Res_0;
+        goto Exit_Or_1;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_2 := Row_Pos_0;
+
+
+
+--  Start tok_code
+
+Token_Res_1 := Row_Pos_2;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_1));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Minus)
+   then
+       Token_Pos_1 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_2 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_2,
+             Expected_Token_Id => lkt_Minus,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_1 := Row_Pos_2 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_1 /= No_Token_Index then
+
+   Row_Pos_2 := Token_Pos_1;
+
+else
+   Row_Pos_2 := No_Token_Index;
+   goto Exit_Row_2_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_2_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_2 /= No_Token_Index then
+
+   Transform_Res_1 := Allocate_Op_Minus (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_1,
+      Kind => lkt_Op_Minus,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_0,
+      Token_End_Index   => (if Row_Pos_2 = Row_Pos_0
+                            then No_Token_Index
+                            else Row_Pos_2 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_2 /= No_Token_Index then
+        Or_Pos_0 := Row_Pos_2;
+        Or_Res_0 := Transform_Res_1;
+        goto Exit_Or_1;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_3 := Row_Pos_0;
+
+
+
+--  Start tok_code
+
+Token_Res_2 := Row_Pos_3;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_2));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Amp)
+   then
+       Token_Pos_2 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_3 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_3,
+             Expected_Token_Id => lkt_Amp,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_2 := Row_Pos_3 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_2 /= No_Token_Index then
+
+   Row_Pos_3 := Token_Pos_2;
+
+else
+   Row_Pos_3 := No_Token_Index;
+   goto Exit_Row_3_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_3_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_3 /= No_Token_Index then
+
+   Transform_Res_2 := Allocate_Op_Amp (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_2,
+      Kind => lkt_Op_Amp,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_0,
+      Token_End_Index   => (if Row_Pos_3 = Row_Pos_0
+                            then No_Token_Index
+                            else Row_Pos_3 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_3 /= No_Token_Index then
+        Or_Pos_0 := Row_Pos_3;
+        Or_Res_0 := Transform_Res_2;
+        goto Exit_Or_1;
+    end if;
+<<Exit_Or_1>>
+
+--  End or_code
+
+
+
+if Or_Pos_0 /= No_Token_Index then
+
+   Row_Pos_0 := Or_Pos_0;
+
+else
+   Row_Pos_0 := No_Token_Index;
+   goto Exit_Row_0_0;
+
+end if;
+
+
+Defer_Res_1 :=
+   Arith_2_Or_Parse_1 (Parser, Row_Pos_0);
+Defer_Pos_1 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_1 /= No_Token_Index then
+
+   Row_Pos_0 := Defer_Pos_1;
+
+else
+   Row_Pos_0 := No_Token_Index;
+   goto Exit_Row_0_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_0_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_0 /= No_Token_Index then
+
+   Transform_Res_3 := Allocate_Bin_Op (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_3,
+      Kind => lkt_Bin_Op,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_0 = Pos
+                            then No_Token_Index
+                            else Row_Pos_0 - 1));
+
+      Initialize_Fields_For_Bin_Op
+        (Self => Transform_Res_3, Bin_Op_F_Left => Defer_Res_0, Bin_Op_F_Op => Or_Res_0, Bin_Op_F_Right => Defer_Res_1);
+
+         if Defer_Res_0 /= null and then Is_Incomplete (Defer_Res_0) then
+            Transform_Res_3.Last_Attempted_Child := 0;
+         elsif Defer_Res_0 /= null and then not Is_Ghost (Defer_Res_0) then
+            Transform_Res_3.Last_Attempted_Child := -1;
+         end if;
+         if Or_Res_0 /= null and then Is_Incomplete (Or_Res_0) then
+            Transform_Res_3.Last_Attempted_Child := 0;
+         elsif Or_Res_0 /= null and then not Is_Ghost (Or_Res_0) then
+            Transform_Res_3.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_1 /= null and then Is_Incomplete (Defer_Res_1) then
+            Transform_Res_3.Last_Attempted_Child := 0;
+         elsif Defer_Res_1 /= null and then not Is_Ghost (Defer_Res_1) then
+            Transform_Res_3.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_0 /= No_Token_Index then
+        Or_Pos_1 := Row_Pos_0;
+        Or_Res_1 := Transform_Res_3;
+        goto Exit_Or_0;
+    end if;
+    
+Defer_Res_2 :=
+   Arith_2_Or_Parse_1 (Parser, Pos);
+Defer_Pos_2 := Parser.Current_Pos;
+
+    if Defer_Pos_2 /= No_Token_Index then
+        Or_Pos_1 := Defer_Pos_2;
+        Or_Res_1 := Defer_Res_2;
+        goto Exit_Or_0;
+    end if;
+<<Exit_Or_0>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+      if Or_Pos_1 > Mem_Pos then
+         Mem_Pos := Or_Pos_1;
+         Mem_Res := Or_Res_1;
+         Set
+           (Parser.Private_Part.Arith_1_Or_Parse_1_Memo,
+            Or_Pos_1 /= No_Token_Index,
+            Or_Res_1,
+            Pos,
+            Or_Pos_1);
+         goto Try_Again;
+
+      elsif Mem_Pos > Pos then
+         Or_Res_1 := Mem_Res;
+         Or_Pos_1 := Mem_Pos;
+         goto No_Memo;
+      end if;
+
+   Set
+     (Parser.Private_Part.Arith_1_Or_Parse_1_Memo,
+      Or_Pos_1 /= No_Token_Index,
+      Or_Res_1,
+      Pos,
+      Or_Pos_1);
+
+       <<No_Memo>>
+
+   Parser.Current_Pos := Or_Pos_1;
+
+   return Or_Res_1;
+end Arith_1_Or_Parse_1;
+
+   
+
+
+function Doc_Comment_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Doc_Comment
+is
+   use Bare_Doc_Comment_Memos;
+
+      Row_Pos_62 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_88 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_88 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_55 :
+            Bare_Doc_Comment
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Doc_Comment_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_55 := M.Instance;
+      return Transform_Res_55;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_55;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_62 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_88 := Row_Pos_62;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_88));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Doc_Comment)
+   then
+       Token_Pos_88 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_62 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_62,
+             Expected_Token_Id => lkt_Doc_Comment,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_88 := Row_Pos_62 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_88 /= No_Token_Index then
+
+   Row_Pos_62 := Token_Pos_88;
+
+else
+   Row_Pos_62 := No_Token_Index;
+   goto Exit_Row_61_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_61_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_62 /= No_Token_Index then
+
+   Transform_Res_55 := Allocate_Doc_Comment (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_55,
+      Kind => lkt_Doc_Comment,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_62 = Pos
+                            then No_Token_Index
+                            else Row_Pos_62 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Doc_Comment_Transform_Parse_0_Memo,
+      Row_Pos_62 /= No_Token_Index,
+      Transform_Res_55,
+      Pos,
+      Row_Pos_62);
+
+
+   Parser.Current_Pos := Row_Pos_62;
+
+   return Transform_Res_55;
+end Doc_Comment_Transform_Parse_0;
+
+   
+
+
+function Doc_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Doc
+is
+   use Bare_Doc_Memos;
+
+      Row_Pos_61 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_11 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_11 :
+            Free_Parse_List;
+      Defer_Pos_100 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_100 :
+            Bare_Doc_Comment
+               := No_Bare_LK_Node;
+      List_Pos_11 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_11 :
+            Bare_Doc_Comment_List
+               := No_Bare_LK_Node;
+      Transform_Res_54 :
+            Bare_Doc
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Doc_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_54 := M.Instance;
+      return Transform_Res_54;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_54;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_61 := Pos;
+
+
+
+--  Start list_code
+
+    List_Pos_11 := Row_Pos_61;
+
+
+
+Lst_Cpos_11 := Row_Pos_61;
+Tmp_List_11 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_100 :=
+   Doc_Comment_Transform_Parse_0 (Parser, Lst_Cpos_11);
+Defer_Pos_100 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_100 = No_Token_Index;
+
+   List_Pos_11 := Defer_Pos_100;
+   Lst_Cpos_11 := List_Pos_11;
+
+   Tmp_List_11.Nodes.Append (Defer_Res_100);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_11.Nodes.Length;
+begin
+   List_Res_11 :=
+      Allocate_Doc_Comment_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_61;
+      Token_End := (if Lst_Cpos_11 = Row_Pos_61
+                    then Row_Pos_61
+                    else Lst_Cpos_11 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_61, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_11,
+      Kind              => lkt_Doc_Comment_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_11,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_11.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_11.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_11);
+
+--  End list_code
+
+
+
+if List_Pos_11 /= No_Token_Index then
+
+   Row_Pos_61 := List_Pos_11;
+
+else
+   Row_Pos_61 := No_Token_Index;
+   goto Exit_Row_60_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_60_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_61 /= No_Token_Index then
+
+   Transform_Res_54 := Allocate_Doc (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_54,
+      Kind => lkt_Doc,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_61 = Pos
+                            then No_Token_Index
+                            else Row_Pos_61 - 1));
+
+      Initialize_Fields_For_Doc
+        (Self => Transform_Res_54, Doc_F_Lines => List_Res_11);
+
+         if List_Res_11 /= null and then Is_Incomplete (List_Res_11) then
+            Transform_Res_54.Last_Attempted_Child := 0;
+         elsif List_Res_11 /= null and then not Is_Ghost (List_Res_11) then
+            Transform_Res_54.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Doc_Transform_Parse_0_Memo,
+      Row_Pos_61 /= No_Token_Index,
+      Transform_Res_54,
+      Pos,
+      Row_Pos_61);
+
+
+   Parser.Current_Pos := Row_Pos_61;
+
+   return Transform_Res_54;
+end Doc_Transform_Parse_0;
+
+   
+
+
+function Id_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Id
+is
+   use Bare_Id_Memos;
+
+      Row_Pos_64 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_90 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_90 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_57 :
+            Bare_Id
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Id_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_57 := M.Instance;
+      return Transform_Res_57;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_57;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_64 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_90 := Row_Pos_64;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_90));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Identifier)
+   then
+       Token_Pos_90 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_64 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_64,
+             Expected_Token_Id => lkt_Identifier,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_90 := Row_Pos_64 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_90 /= No_Token_Index then
+
+   Row_Pos_64 := Token_Pos_90;
+
+else
+   Row_Pos_64 := No_Token_Index;
+   goto Exit_Row_63_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_63_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_64 /= No_Token_Index then
+
+   Transform_Res_57 := Allocate_Id (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_57,
+      Kind => lkt_Id,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_64 = Pos
+                            then No_Token_Index
+                            else Row_Pos_64 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Id_Transform_Parse_0_Memo,
+      Row_Pos_64 /= No_Token_Index,
+      Transform_Res_57,
+      Pos,
+      Row_Pos_64);
+
+
+   Parser.Current_Pos := Row_Pos_64;
+
+   return Transform_Res_57;
+end Id_Transform_Parse_0;
+
+   
+
+
+function Decl_Annotation_Params_Opt_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Decl_Annotation_Params
+is
+   use Bare_Decl_Annotation_Params_Memos;
+
+      Row_Pos_65 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_91 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_91 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_103 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_103 :
+            Bare_Param_List
+               := No_Bare_LK_Node;
+      Token_Pos_92 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_92 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_58 :
+            Bare_Decl_Annotation_Params
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Decl_Annotation_Params_Opt_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_58 := M.Instance;
+      return Transform_Res_58;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_58;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start opt_code
+
+
+
+
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_65 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_91 := Row_Pos_65;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_91));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_91 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_65 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_65,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_91 := Row_Pos_65 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_91 /= No_Token_Index then
+
+   Row_Pos_65 := Token_Pos_91;
+
+else
+   Row_Pos_65 := No_Token_Index;
+   goto Exit_Row_64_0;
+
+end if;
+
+
+Defer_Res_103 :=
+   Params_List_Parse_0 (Parser, Row_Pos_65);
+Defer_Pos_103 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_103 /= No_Token_Index then
+
+   Row_Pos_65 := Defer_Pos_103;
+
+else
+   Row_Pos_65 := No_Token_Index;
+   goto Exit_Row_64_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_92 := Row_Pos_65;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_92));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_92 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_65 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_65,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_92 := Row_Pos_65 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_92 /= No_Token_Index then
+
+   Row_Pos_65 := Token_Pos_92;
+
+else
+   Row_Pos_65 := No_Token_Index;
+   goto Exit_Row_64_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_64_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_65 /= No_Token_Index then
+
+   Transform_Res_58 := Allocate_Decl_Annotation_Params (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_58,
+      Kind => lkt_Decl_Annotation_Params,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_65 = Pos
+                            then No_Token_Index
+                            else Row_Pos_65 - 1));
+
+      Initialize_Fields_For_Decl_Annotation_Params
+        (Self => Transform_Res_58, Decl_Annotation_Params_F_Params => Defer_Res_103);
+
+         if Defer_Res_103 /= null and then Is_Incomplete (Defer_Res_103) then
+            Transform_Res_58.Last_Attempted_Child := 0;
+         elsif Defer_Res_103 /= null and then not Is_Ghost (Defer_Res_103) then
+            Transform_Res_58.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+if Row_Pos_65 = No_Token_Index then
+
+        Transform_Res_58 := No_Bare_LK_Node;
+
+
+    Row_Pos_65 := Pos;
+
+
+end if;
+
+--  End opt_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Decl_Annotation_Params_Opt_Parse_0_Memo,
+      Row_Pos_65 /= No_Token_Index,
+      Transform_Res_58,
+      Pos,
+      Row_Pos_65);
+
+
+   Parser.Current_Pos := Row_Pos_65;
+
+   return Transform_Res_58;
+end Decl_Annotation_Params_Opt_Parse_0;
+
+   
+
+
+function Decl_Annotation_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Decl_Annotation
+is
+   use Bare_Decl_Annotation_Memos;
+
+      Row_Pos_63 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_89 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_89 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_101 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_101 :
+            Bare_Id
+               := No_Bare_LK_Node;
+      Defer_Pos_102 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_102 :
+            Bare_Decl_Annotation_Params
+               := No_Bare_LK_Node;
+      Transform_Res_56 :
+            Bare_Decl_Annotation
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Decl_Annotation_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_56 := M.Instance;
+      return Transform_Res_56;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_56;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_63 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_89 := Row_Pos_63;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_89));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_At)
+   then
+       Token_Pos_89 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_63 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_63,
+             Expected_Token_Id => lkt_At,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_89 := Row_Pos_63 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_89 /= No_Token_Index then
+
+   Row_Pos_63 := Token_Pos_89;
+
+else
+   Row_Pos_63 := No_Token_Index;
+   goto Exit_Row_62_0;
+
+end if;
+
+
+Defer_Res_101 :=
+   Id_Transform_Parse_0 (Parser, Row_Pos_63);
+Defer_Pos_101 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_101 /= No_Token_Index then
+
+   Row_Pos_63 := Defer_Pos_101;
+
+else
+   Row_Pos_63 := No_Token_Index;
+   goto Exit_Row_62_0;
+
+end if;
+
+
+Defer_Res_102 :=
+   Decl_Annotation_Params_Opt_Parse_0 (Parser, Row_Pos_63);
+Defer_Pos_102 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_102 /= No_Token_Index then
+
+   Row_Pos_63 := Defer_Pos_102;
+
+else
+   Row_Pos_63 := No_Token_Index;
+   goto Exit_Row_62_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_62_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_63 /= No_Token_Index then
+
+   Transform_Res_56 := Allocate_Decl_Annotation (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_56,
+      Kind => lkt_Decl_Annotation,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_63 = Pos
+                            then No_Token_Index
+                            else Row_Pos_63 - 1));
+
+      Initialize_Fields_For_Decl_Annotation
+        (Self => Transform_Res_56, Decl_Annotation_F_Name => Defer_Res_101, Decl_Annotation_F_Params => Defer_Res_102);
+
+         if Defer_Res_101 /= null and then Is_Incomplete (Defer_Res_101) then
+            Transform_Res_56.Last_Attempted_Child := 0;
+         elsif Defer_Res_101 /= null and then not Is_Ghost (Defer_Res_101) then
+            Transform_Res_56.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_102 /= null and then Is_Incomplete (Defer_Res_102) then
+            Transform_Res_56.Last_Attempted_Child := 0;
+         elsif Defer_Res_102 /= null and then not Is_Ghost (Defer_Res_102) then
+            Transform_Res_56.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Decl_Annotation_Transform_Parse_0_Memo,
+      Row_Pos_63 /= No_Token_Index,
+      Transform_Res_56,
+      Pos,
+      Row_Pos_63);
+
+
+   Parser.Current_Pos := Row_Pos_63;
+
+   return Transform_Res_56;
+end Decl_Annotation_Transform_Parse_0;
+
+   
+
+
+function Generic_Formal_Type_Transform_Parse_1
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Full_Decl
+is
+   use Bare_Full_Decl_Memos;
+
+      Row_Pos_59 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_97 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_97 :
+            Bare_Doc
+               := No_Bare_LK_Node;
+      Lst_Cpos_10 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_10 :
+            Free_Parse_List;
+      Defer_Pos_98 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_98 :
+            Bare_Decl_Annotation
+               := No_Bare_LK_Node;
+      List_Pos_10 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_10 :
+            Bare_Decl_Annotation_List
+               := No_Bare_LK_Node;
+      Row_Pos_60 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_99 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_99 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Transform_Res_52 :
+            Bare_Generic_Formal_Type_Decl
+               := No_Bare_LK_Node;
+      Transform_Res_53 :
+            Bare_Full_Decl
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Generic_Formal_Type_Transform_Parse_1_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_53 := M.Instance;
+      return Transform_Res_53;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_53;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_59 := Pos;
+
+
+
+Defer_Res_97 :=
+   Doc_Transform_Parse_0 (Parser, Row_Pos_59);
+Defer_Pos_97 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_97 /= No_Token_Index then
+
+   Row_Pos_59 := Defer_Pos_97;
+
+else
+   Row_Pos_59 := No_Token_Index;
+   goto Exit_Row_59_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_10 := Row_Pos_59;
+
+
+
+Lst_Cpos_10 := Row_Pos_59;
+Tmp_List_10 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_98 :=
+   Decl_Annotation_Transform_Parse_0 (Parser, Lst_Cpos_10);
+Defer_Pos_98 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_98 = No_Token_Index;
+
+   List_Pos_10 := Defer_Pos_98;
+   Lst_Cpos_10 := List_Pos_10;
+
+   Tmp_List_10.Nodes.Append (Defer_Res_98);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_10.Nodes.Length;
+begin
+   List_Res_10 :=
+      Allocate_Decl_Annotation_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_59;
+      Token_End := (if Lst_Cpos_10 = Row_Pos_59
+                    then Row_Pos_59
+                    else Lst_Cpos_10 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_59, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_10,
+      Kind              => lkt_Decl_Annotation_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_10,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_10.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_10.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_10);
+
+--  End list_code
+
+
+
+if List_Pos_10 /= No_Token_Index then
+
+   Row_Pos_59 := List_Pos_10;
+
+else
+   Row_Pos_59 := No_Token_Index;
+   goto Exit_Row_59_0;
+
+end if;
+
+
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_60 := Row_Pos_59;
+
+
+
+Defer_Res_99 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_60);
+Defer_Pos_99 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_99 /= No_Token_Index then
+
+   Row_Pos_60 := Defer_Pos_99;
+
+else
+   Row_Pos_60 := No_Token_Index;
+   goto Exit_Row_65_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_65_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_60 /= No_Token_Index then
+
+   Transform_Res_52 := Allocate_Generic_Formal_Type_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_52,
+      Kind => lkt_Generic_Formal_Type_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_59,
+      Token_End_Index   => (if Row_Pos_60 = Row_Pos_59
+                            then No_Token_Index
+                            else Row_Pos_60 - 1));
+
+      Initialize_Fields_For_Generic_Formal_Type_Decl
+        (Self => Transform_Res_52, Generic_Formal_Type_Decl_F_Syn_Name => Defer_Res_99);
+
+         if Defer_Res_99 /= null and then Is_Incomplete (Defer_Res_99) then
+            Transform_Res_52.Last_Attempted_Child := 0;
+         elsif Defer_Res_99 /= null and then not Is_Ghost (Defer_Res_99) then
+            Transform_Res_52.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+
+if Row_Pos_60 /= No_Token_Index then
+
+   Row_Pos_59 := Row_Pos_60;
+
+else
+   Row_Pos_59 := No_Token_Index;
+   goto Exit_Row_59_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_59_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_59 /= No_Token_Index then
+
+   Transform_Res_53 := Allocate_Full_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_53,
+      Kind => lkt_Full_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_59 = Pos
+                            then No_Token_Index
+                            else Row_Pos_59 - 1));
+
+      Initialize_Fields_For_Full_Decl
+        (Self => Transform_Res_53, Full_Decl_F_Doc => Defer_Res_97, Full_Decl_F_Decl_Annotations => List_Res_10, Full_Decl_F_Decl => Transform_Res_52);
+
+         if Defer_Res_97 /= null and then Is_Incomplete (Defer_Res_97) then
+            Transform_Res_53.Last_Attempted_Child := 0;
+         elsif Defer_Res_97 /= null and then not Is_Ghost (Defer_Res_97) then
+            Transform_Res_53.Last_Attempted_Child := -1;
+         end if;
+         if List_Res_10 /= null and then Is_Incomplete (List_Res_10) then
+            Transform_Res_53.Last_Attempted_Child := 0;
+         elsif List_Res_10 /= null and then not Is_Ghost (List_Res_10) then
+            Transform_Res_53.Last_Attempted_Child := -1;
+         end if;
+         if Transform_Res_52 /= null and then Is_Incomplete (Transform_Res_52) then
+            Transform_Res_53.Last_Attempted_Child := 0;
+         elsif Transform_Res_52 /= null and then not Is_Ghost (Transform_Res_52) then
+            Transform_Res_53.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Generic_Formal_Type_Transform_Parse_1_Memo,
+      Row_Pos_59 /= No_Token_Index,
+      Transform_Res_53,
+      Pos,
+      Row_Pos_59);
+
+
+   Parser.Current_Pos := Row_Pos_59;
+
+   return Transform_Res_53;
+end Generic_Formal_Type_Transform_Parse_1;
+
+   
+
+
+function Generic_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Generic_Decl
+is
+   use Bare_Generic_Decl_Memos;
+
+      Row_Pos_58 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_84 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_84 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_85 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_85 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_9 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_9 :
+            Free_Parse_List;
+      Defer_Pos_95 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_95 :
+            Bare_Full_Decl
+               := No_Bare_LK_Node;
+      Token_Pos_86 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_86 :
+            Token_Index
+               := No_Token_Index;
+      List_Pos_9 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_9 :
+            Bare_Full_Decl_List
+               := No_Bare_LK_Node;
+      Token_Pos_87 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_87 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_96 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_96 :
+            Bare_Decl
+               := No_Bare_LK_Node;
+      Transform_Res_51 :
+            Bare_Generic_Decl
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Generic_Decl_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_51 := M.Instance;
+      return Transform_Res_51;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_51;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_58 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_84 := Row_Pos_58;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_84));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Generic_Kw)
+   then
+       Token_Pos_84 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_58 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_58,
+             Expected_Token_Id => lkt_Generic_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_84 := Row_Pos_58 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_84 /= No_Token_Index then
+
+   Row_Pos_58 := Token_Pos_84;
+
+else
+   Row_Pos_58 := No_Token_Index;
+   goto Exit_Row_58_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_85 := Row_Pos_58;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_85));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Brack)
+   then
+       Token_Pos_85 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_58 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_58,
+             Expected_Token_Id => lkt_L_Brack,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_85 := Row_Pos_58 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_85 /= No_Token_Index then
+
+   Row_Pos_58 := Token_Pos_85;
+
+else
+   Row_Pos_58 := No_Token_Index;
+   goto Exit_Row_58_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_9 := No_Token_Index;
+
+
+
+Lst_Cpos_9 := Row_Pos_58;
+Tmp_List_9 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_95 :=
+   Generic_Formal_Type_Transform_Parse_1 (Parser, Lst_Cpos_9);
+Defer_Pos_95 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_95 = No_Token_Index;
+
+   List_Pos_9 := Defer_Pos_95;
+   Lst_Cpos_9 := List_Pos_9;
+
+   Tmp_List_9.Nodes.Append (Defer_Res_95);
+
+      
+--  Start tok_code
+
+Token_Res_86 := Lst_Cpos_9;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_86));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Comma)
+   then
+       Token_Pos_86 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Lst_Cpos_9 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Lst_Cpos_9,
+             Expected_Token_Id => lkt_Comma,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_86 := Lst_Cpos_9 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+      if Token_Pos_86 /= No_Token_Index then
+          Lst_Cpos_9 := Token_Pos_86;
+      else
+         exit;
+      end if;
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_9.Nodes.Length;
+begin
+   List_Res_9 :=
+      Allocate_Full_Decl_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_58;
+      Token_End := (if Lst_Cpos_9 = Row_Pos_58
+                    then Row_Pos_58
+                    else Lst_Cpos_9 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_58, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_9,
+      Kind              => lkt_Full_Decl_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_9,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_9.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_9.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_9);
+
+--  End list_code
+
+
+
+if List_Pos_9 /= No_Token_Index then
+
+   Row_Pos_58 := List_Pos_9;
+
+else
+   Row_Pos_58 := No_Token_Index;
+   goto Exit_Row_58_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_87 := Row_Pos_58;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_87));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Brack)
+   then
+       Token_Pos_87 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_58 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_58,
+             Expected_Token_Id => lkt_R_Brack,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_87 := Row_Pos_58 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_87 /= No_Token_Index then
+
+   Row_Pos_58 := Token_Pos_87;
+
+else
+   Row_Pos_58 := No_Token_Index;
+   goto Exit_Row_58_0;
+
+end if;
+
+
+Defer_Res_96 :=
+   Bare_Decl_Or_Parse_0 (Parser, Row_Pos_58);
+Defer_Pos_96 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_96 /= No_Token_Index then
+
+   Row_Pos_58 := Defer_Pos_96;
+
+else
+   Row_Pos_58 := No_Token_Index;
+   goto Exit_Row_58_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_58_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_58 /= No_Token_Index then
+
+   Transform_Res_51 := Allocate_Generic_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_51,
+      Kind => lkt_Generic_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_58 = Pos
+                            then No_Token_Index
+                            else Row_Pos_58 - 1));
+
+      Initialize_Fields_For_Generic_Decl
+        (Self => Transform_Res_51, Generic_Decl_F_Generic_Formal_Decls => List_Res_9, Generic_Decl_F_Decl => Defer_Res_96);
+
+         if List_Res_9 /= null and then Is_Incomplete (List_Res_9) then
+            Transform_Res_51.Last_Attempted_Child := 0;
+         elsif List_Res_9 /= null and then not Is_Ghost (List_Res_9) then
+            Transform_Res_51.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_96 /= null and then Is_Incomplete (Defer_Res_96) then
+            Transform_Res_51.Last_Attempted_Child := 0;
+         elsif Defer_Res_96 /= null and then not Is_Ghost (Defer_Res_96) then
+            Transform_Res_51.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Generic_Decl_Transform_Parse_0_Memo,
+      Row_Pos_58 /= No_Token_Index,
+      Transform_Res_51,
+      Pos,
+      Row_Pos_58);
+
+
+   Parser.Current_Pos := Row_Pos_58;
+
+   return Transform_Res_51;
+end Generic_Decl_Transform_Parse_0;
+
+   
+
+
+function Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Full_Decl
+is
+   use Bare_Full_Decl_Memos;
+
+      Row_Pos_79 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_123 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_123 :
+            Bare_Doc
+               := No_Bare_LK_Node;
+      Lst_Cpos_16 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_16 :
+            Free_Parse_List;
+      Defer_Pos_124 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_124 :
+            Bare_Decl_Annotation
+               := No_Bare_LK_Node;
+      List_Pos_16 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_16 :
+            Bare_Decl_Annotation_List
+               := No_Bare_LK_Node;
+      Defer_Pos_125 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_125 :
+            Bare_Decl
+               := No_Bare_LK_Node;
+      Transform_Res_66 :
+            Bare_Full_Decl
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Decl_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_66 := M.Instance;
+      return Transform_Res_66;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_66;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_79 := Pos;
+
+
+
+Defer_Res_123 :=
+   Doc_Transform_Parse_0 (Parser, Row_Pos_79);
+Defer_Pos_123 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_123 /= No_Token_Index then
+
+   Row_Pos_79 := Defer_Pos_123;
+
+else
+   Row_Pos_79 := No_Token_Index;
+   goto Exit_Row_68_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_16 := Row_Pos_79;
+
+
+
+Lst_Cpos_16 := Row_Pos_79;
+Tmp_List_16 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_124 :=
+   Decl_Annotation_Transform_Parse_0 (Parser, Lst_Cpos_16);
+Defer_Pos_124 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_124 = No_Token_Index;
+
+   List_Pos_16 := Defer_Pos_124;
+   Lst_Cpos_16 := List_Pos_16;
+
+   Tmp_List_16.Nodes.Append (Defer_Res_124);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_16.Nodes.Length;
+begin
+   List_Res_16 :=
+      Allocate_Decl_Annotation_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_79;
+      Token_End := (if Lst_Cpos_16 = Row_Pos_79
+                    then Row_Pos_79
+                    else Lst_Cpos_16 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_79, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_16,
+      Kind              => lkt_Decl_Annotation_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_16,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_16.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_16.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_16);
+
+--  End list_code
+
+
+
+if List_Pos_16 /= No_Token_Index then
+
+   Row_Pos_79 := List_Pos_16;
+
+else
+   Row_Pos_79 := No_Token_Index;
+   goto Exit_Row_68_0;
+
+end if;
+
+
+Defer_Res_125 :=
+   Bare_Decl_Or_Parse_0 (Parser, Row_Pos_79);
+Defer_Pos_125 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_125 /= No_Token_Index then
+
+   Row_Pos_79 := Defer_Pos_125;
+
+else
+   Row_Pos_79 := No_Token_Index;
+   goto Exit_Row_68_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_68_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_79 /= No_Token_Index then
+
+   Transform_Res_66 := Allocate_Full_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_66,
+      Kind => lkt_Full_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_79 = Pos
+                            then No_Token_Index
+                            else Row_Pos_79 - 1));
+
+      Initialize_Fields_For_Full_Decl
+        (Self => Transform_Res_66, Full_Decl_F_Doc => Defer_Res_123, Full_Decl_F_Decl_Annotations => List_Res_16, Full_Decl_F_Decl => Defer_Res_125);
+
+         if Defer_Res_123 /= null and then Is_Incomplete (Defer_Res_123) then
+            Transform_Res_66.Last_Attempted_Child := 0;
+         elsif Defer_Res_123 /= null and then not Is_Ghost (Defer_Res_123) then
+            Transform_Res_66.Last_Attempted_Child := -1;
+         end if;
+         if List_Res_16 /= null and then Is_Incomplete (List_Res_16) then
+            Transform_Res_66.Last_Attempted_Child := 0;
+         elsif List_Res_16 /= null and then not Is_Ghost (List_Res_16) then
+            Transform_Res_66.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_125 /= null and then Is_Incomplete (Defer_Res_125) then
+            Transform_Res_66.Last_Attempted_Child := 0;
+         elsif Defer_Res_125 /= null and then not Is_Ghost (Defer_Res_125) then
+            Transform_Res_66.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Decl_Transform_Parse_0_Memo,
+      Row_Pos_79 /= No_Token_Index,
+      Transform_Res_66,
+      Pos,
+      Row_Pos_79);
+
+
+   Parser.Current_Pos := Row_Pos_79;
+
+   return Transform_Res_66;
+end Decl_Transform_Parse_0;
+
+   
+
+
+function Decl_Block_List_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Decl_Block
+is
+   use Bare_Decl_Block_Memos;
+
+      Lst_Cpos_15 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_15 :
+            Free_Parse_List;
+      Defer_Pos_122 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_122 :
+            Bare_Full_Decl
+               := No_Bare_LK_Node;
+      List_Pos_15 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_15 :
+            Bare_Decl_Block
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Decl_Block_List_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      List_Res_15 := M.Instance;
+      return List_Res_15;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return List_Res_15;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start list_code
+
+    List_Pos_15 := Pos;
+
+
+
+Lst_Cpos_15 := Pos;
+Tmp_List_15 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_122 :=
+   Decl_Transform_Parse_0 (Parser, Lst_Cpos_15);
+Defer_Pos_122 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_122 = No_Token_Index;
+
+   List_Pos_15 := Defer_Pos_122;
+   Lst_Cpos_15 := List_Pos_15;
+
+   Tmp_List_15.Nodes.Append (Defer_Res_122);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_15.Nodes.Length;
+begin
+   List_Res_15 :=
+      Allocate_Decl_Block (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Pos;
+      Token_End := (if Lst_Cpos_15 = Pos
+                    then Pos
+                    else Lst_Cpos_15 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Pos, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_15,
+      Kind              => lkt_Decl_Block,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_15,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_15.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_15.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_15);
+
+--  End list_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Decl_Block_List_Parse_0_Memo,
+      List_Pos_15 /= No_Token_Index,
+      List_Res_15,
+      Pos,
+      List_Pos_15);
+
+
+   Parser.Current_Pos := List_Pos_15;
+
+   return List_Res_15;
+end Decl_Block_List_Parse_0;
+
+   
+
+
+function Enum_Lit_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Enum_Lit_Decl
+is
+   use Bare_Enum_Lit_Decl_Memos;
+
+      Row_Pos_80 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_126 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_126 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Transform_Res_67 :
+            Bare_Enum_Lit_Decl
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Enum_Lit_Decl_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_67 := M.Instance;
+      return Transform_Res_67;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_67;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_80 := Pos;
+
+
+
+Defer_Res_126 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_80);
+Defer_Pos_126 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_126 /= No_Token_Index then
+
+   Row_Pos_80 := Defer_Pos_126;
+
+else
+   Row_Pos_80 := No_Token_Index;
+   goto Exit_Row_79_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_79_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_80 /= No_Token_Index then
+
+   Transform_Res_67 := Allocate_Enum_Lit_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_67,
+      Kind => lkt_Enum_Lit_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_80 = Pos
+                            then No_Token_Index
+                            else Row_Pos_80 - 1));
+
+      Initialize_Fields_For_Enum_Lit_Decl
+        (Self => Transform_Res_67, User_Val_Decl_F_Syn_Name => Defer_Res_126);
+
+         if Defer_Res_126 /= null and then Is_Incomplete (Defer_Res_126) then
+            Transform_Res_67.Last_Attempted_Child := 0;
+         elsif Defer_Res_126 /= null and then not Is_Ghost (Defer_Res_126) then
+            Transform_Res_67.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Enum_Lit_Decl_Transform_Parse_0_Memo,
+      Row_Pos_80 /= No_Token_Index,
+      Transform_Res_67,
+      Pos,
+      Row_Pos_80);
+
+
+   Parser.Current_Pos := Row_Pos_80;
+
+   return Transform_Res_67;
+end Enum_Lit_Decl_Transform_Parse_0;
+
+   
+
+
+function Type_Decl_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Named_Type_Decl
+is
+   use Bare_Named_Type_Decl_Memos;
+
+      Row_Pos_66 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_93 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_93 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_104 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_104 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Row_Pos_67 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_94 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_94 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_105 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_105 :
+            Bare_Type_Ref_List
+               := No_Bare_LK_Node;
+      Token_Pos_95 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_95 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_106 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_106 :
+            Bare_Decl_Block
+               := No_Bare_LK_Node;
+      Token_Pos_96 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_96 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_59 :
+            Bare_Struct_Decl
+               := No_Bare_LK_Node;
+      Row_Pos_68 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_97 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_97 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_98 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_98 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_107 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_107 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Row_Pos_69 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_99 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_99 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_108 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_108 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Row_Pos_70 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_100 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_100 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_109 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_109 :
+            Bare_Type_Ref_List
+               := No_Bare_LK_Node;
+      Token_Pos_101 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_101 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_12 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_12 :
+            Free_Parse_List;
+      Row_Pos_71 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_102 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_102 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_13 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_13 :
+            Free_Parse_List;
+      Row_Pos_72 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_110 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_110 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Transform_Res_60 :
+            Bare_Enum_Class_Alt_Decl
+               := No_Bare_LK_Node;
+      Token_Pos_103 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_103 :
+            Token_Index
+               := No_Token_Index;
+      List_Pos_12 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_12 :
+            Bare_Enum_Class_Alt_Decl_List
+               := No_Bare_LK_Node;
+      Transform_Res_61 :
+            Bare_Enum_Class_Case
+               := No_Bare_LK_Node;
+      List_Pos_13 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_13 :
+            Bare_Enum_Class_Case_List
+               := No_Bare_LK_Node;
+      Defer_Pos_111 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_111 :
+            Bare_Decl_Block
+               := No_Bare_LK_Node;
+      Token_Pos_104 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_104 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_62 :
+            Bare_Enum_Class_Decl
+               := No_Bare_LK_Node;
+      Row_Pos_73 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_105 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_105 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_112 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_112 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Row_Pos_74 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_106 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_106 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_113 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_113 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Row_Pos_75 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_107 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_107 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_114 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_114 :
+            Bare_Type_Ref_List
+               := No_Bare_LK_Node;
+      Token_Pos_108 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_108 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_115 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_115 :
+            Bare_Decl_Block
+               := No_Bare_LK_Node;
+      Token_Pos_109 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_109 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_63 :
+            Bare_Class_Decl
+               := No_Bare_LK_Node;
+      Row_Pos_76 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_110 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_110 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_116 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_116 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Row_Pos_77 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_111 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_111 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_117 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_117 :
+            Bare_Type_Ref_List
+               := No_Bare_LK_Node;
+      Token_Pos_112 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_112 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_113 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_113 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_14 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_14 :
+            Free_Parse_List;
+      Defer_Pos_118 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_118 :
+            Bare_Enum_Lit_Decl
+               := No_Bare_LK_Node;
+      Token_Pos_114 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_114 :
+            Token_Index
+               := No_Token_Index;
+      List_Pos_14 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_14 :
+            Bare_Enum_Lit_Decl_List
+               := No_Bare_LK_Node;
+      Defer_Pos_119 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_119 :
+            Bare_Decl_Block
+               := No_Bare_LK_Node;
+      Token_Pos_115 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_115 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_64 :
+            Bare_Enum_Type_Decl
+               := No_Bare_LK_Node;
+      Row_Pos_78 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_116 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_116 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_120 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_120 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Token_Pos_117 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_117 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_121 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_121 :
+            Bare_Decl_Block
+               := No_Bare_LK_Node;
+      Token_Pos_118 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_118 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_65 :
+            Bare_Trait_Decl
+               := No_Bare_LK_Node;
+      Or_Pos_19 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_19 :
+            Bare_Named_Type_Decl
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Type_Decl_Or_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_19 := M.Instance;
+      return Or_Res_19;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_19;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_19 := No_Token_Index;
+Or_Res_19 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_66 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_93 := Row_Pos_66;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_93));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Struct_Kw)
+   then
+       Token_Pos_93 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_66 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_66,
+             Expected_Token_Id => lkt_Struct_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_93 := Row_Pos_66 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_93 /= No_Token_Index then
+
+   Row_Pos_66 := Token_Pos_93;
+
+else
+   Row_Pos_66 := No_Token_Index;
+   goto Exit_Row_66_0;
+
+end if;
+
+
+Defer_Res_104 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_66);
+Defer_Pos_104 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_104 /= No_Token_Index then
+
+   Row_Pos_66 := Defer_Pos_104;
+
+else
+   Row_Pos_66 := No_Token_Index;
+   goto Exit_Row_66_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_67 := Row_Pos_66;
+
+
+
+--  Start tok_code
+
+Token_Res_94 := Row_Pos_67;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_94));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Implements_Kw)
+   then
+       Token_Pos_94 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_67 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_67,
+             Expected_Token_Id => lkt_Implements_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_94 := Row_Pos_67 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_94 /= No_Token_Index then
+
+   Row_Pos_67 := Token_Pos_94;
+
+else
+   Row_Pos_67 := No_Token_Index;
+   goto Exit_Row_67_0;
+
+end if;
+
+
+Defer_Res_105 :=
+   Type_List_List_Parse_0 (Parser, Row_Pos_67);
+Defer_Pos_105 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_105 /= No_Token_Index then
+
+   Row_Pos_67 := Defer_Pos_105;
+
+else
+   Row_Pos_67 := No_Token_Index;
+   goto Exit_Row_67_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_67_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_67 = No_Token_Index then
+
+        Defer_Res_105 :=
+           Allocate_Type_Ref_List (Parser.Mem_Pool);
+         Initialize
+           (Self              => Defer_Res_105,
+            Kind              => lkt_Type_Ref_List,
+            Unit              => Parser.Unit,
+            Token_Start_Index => Row_Pos_66 - 1,
+            Token_End_Index   => No_Token_Index);
+         Initialize_List
+           (Self   => Defer_Res_105,
+            Parser => Parser,
+            Count  => 0);
+
+
+    Row_Pos_67 := Row_Pos_66;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_67 /= No_Token_Index then
+
+   Row_Pos_66 := Row_Pos_67;
+
+else
+   Row_Pos_66 := No_Token_Index;
+   goto Exit_Row_66_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_95 := Row_Pos_66;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_95));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Brace)
+   then
+       Token_Pos_95 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_66 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_66,
+             Expected_Token_Id => lkt_L_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_95 := Row_Pos_66 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_95 /= No_Token_Index then
+
+   Row_Pos_66 := Token_Pos_95;
+
+else
+   Row_Pos_66 := No_Token_Index;
+   goto Exit_Row_66_0;
+
+end if;
+
+
+Defer_Res_106 :=
+   Decl_Block_List_Parse_0 (Parser, Row_Pos_66);
+Defer_Pos_106 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_106 /= No_Token_Index then
+
+   Row_Pos_66 := Defer_Pos_106;
+
+else
+   Row_Pos_66 := No_Token_Index;
+   goto Exit_Row_66_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_96 := Row_Pos_66;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_96));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Brace)
+   then
+       Token_Pos_96 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_66 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_66,
+             Expected_Token_Id => lkt_R_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_96 := Row_Pos_66 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_96 /= No_Token_Index then
+
+   Row_Pos_66 := Token_Pos_96;
+
+else
+   Row_Pos_66 := No_Token_Index;
+   goto Exit_Row_66_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_66_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_66 /= No_Token_Index then
+
+   Transform_Res_59 := Allocate_Struct_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_59,
+      Kind => lkt_Struct_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_66 = Pos
+                            then No_Token_Index
+                            else Row_Pos_66 - 1));
+
+      Initialize_Fields_For_Struct_Decl
+        (Self => Transform_Res_59, Struct_Decl_F_Syn_Name => Defer_Res_104, Struct_Decl_F_Traits => Defer_Res_105, Struct_Decl_F_Decls => Defer_Res_106);
+
+         if Defer_Res_104 /= null and then Is_Incomplete (Defer_Res_104) then
+            Transform_Res_59.Last_Attempted_Child := 0;
+         elsif Defer_Res_104 /= null and then not Is_Ghost (Defer_Res_104) then
+            Transform_Res_59.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_105 /= null and then Is_Incomplete (Defer_Res_105) then
+            Transform_Res_59.Last_Attempted_Child := 0;
+         elsif Defer_Res_105 /= null and then not Is_Ghost (Defer_Res_105) then
+            Transform_Res_59.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_106 /= null and then Is_Incomplete (Defer_Res_106) then
+            Transform_Res_59.Last_Attempted_Child := 0;
+         elsif Defer_Res_106 /= null and then not Is_Ghost (Defer_Res_106) then
+            Transform_Res_59.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_66 /= No_Token_Index then
+        Or_Pos_19 := Row_Pos_66;
+        Or_Res_19 := Transform_Res_59;
+        goto Exit_Or_19;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_68 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_97 := Row_Pos_68;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_97));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Enum_Kw)
+   then
+       Token_Pos_97 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_68 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_68,
+             Expected_Token_Id => lkt_Enum_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_97 := Row_Pos_68 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_97 /= No_Token_Index then
+
+   Row_Pos_68 := Token_Pos_97;
+
+else
+   Row_Pos_68 := No_Token_Index;
+   goto Exit_Row_69_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_98 := Row_Pos_68;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_98));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Class_Kw)
+   then
+       Token_Pos_98 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_68 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_68,
+             Expected_Token_Id => lkt_Class_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_98 := Row_Pos_68 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_98 /= No_Token_Index then
+
+   Row_Pos_68 := Token_Pos_98;
+
+else
+   Row_Pos_68 := No_Token_Index;
+   goto Exit_Row_69_0;
+
+end if;
+
+
+Defer_Res_107 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_68);
+Defer_Pos_107 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_107 /= No_Token_Index then
+
+   Row_Pos_68 := Defer_Pos_107;
+
+else
+   Row_Pos_68 := No_Token_Index;
+   goto Exit_Row_69_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_69 := Row_Pos_68;
+
+
+
+--  Start tok_code
+
+Token_Res_99 := Row_Pos_69;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_99));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Colon)
+   then
+       Token_Pos_99 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_69 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_69,
+             Expected_Token_Id => lkt_Colon,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_99 := Row_Pos_69 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_99 /= No_Token_Index then
+
+   Row_Pos_69 := Token_Pos_99;
+
+else
+   Row_Pos_69 := No_Token_Index;
+   goto Exit_Row_70_0;
+
+end if;
+
+
+Defer_Res_108 :=
+   Type_Ref_Or_Parse_0 (Parser, Row_Pos_69);
+Defer_Pos_108 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_108 /= No_Token_Index then
+
+   Row_Pos_69 := Defer_Pos_108;
+
+else
+   Row_Pos_69 := No_Token_Index;
+   goto Exit_Row_70_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_70_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_69 = No_Token_Index then
+
+        Defer_Res_108 := No_Bare_LK_Node;
+
+
+    Row_Pos_69 := Row_Pos_68;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_69 /= No_Token_Index then
+
+   Row_Pos_68 := Row_Pos_69;
+
+else
+   Row_Pos_68 := No_Token_Index;
+   goto Exit_Row_69_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_70 := Row_Pos_68;
+
+
+
+--  Start tok_code
+
+Token_Res_100 := Row_Pos_70;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_100));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Implements_Kw)
+   then
+       Token_Pos_100 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_70 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_70,
+             Expected_Token_Id => lkt_Implements_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_100 := Row_Pos_70 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_100 /= No_Token_Index then
+
+   Row_Pos_70 := Token_Pos_100;
+
+else
+   Row_Pos_70 := No_Token_Index;
+   goto Exit_Row_71_0;
+
+end if;
+
+
+Defer_Res_109 :=
+   Type_List_List_Parse_0 (Parser, Row_Pos_70);
+Defer_Pos_109 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_109 /= No_Token_Index then
+
+   Row_Pos_70 := Defer_Pos_109;
+
+else
+   Row_Pos_70 := No_Token_Index;
+   goto Exit_Row_71_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_71_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_70 = No_Token_Index then
+
+        Defer_Res_109 :=
+           Allocate_Type_Ref_List (Parser.Mem_Pool);
+         Initialize
+           (Self              => Defer_Res_109,
+            Kind              => lkt_Type_Ref_List,
+            Unit              => Parser.Unit,
+            Token_Start_Index => Row_Pos_68 - 1,
+            Token_End_Index   => No_Token_Index);
+         Initialize_List
+           (Self   => Defer_Res_109,
+            Parser => Parser,
+            Count  => 0);
+
+
+    Row_Pos_70 := Row_Pos_68;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_70 /= No_Token_Index then
+
+   Row_Pos_68 := Row_Pos_70;
+
+else
+   Row_Pos_68 := No_Token_Index;
+   goto Exit_Row_69_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_101 := Row_Pos_68;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_101));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Brace)
+   then
+       Token_Pos_101 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_68 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_68,
+             Expected_Token_Id => lkt_L_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_101 := Row_Pos_68 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_101 /= No_Token_Index then
+
+   Row_Pos_68 := Token_Pos_101;
+
+else
+   Row_Pos_68 := No_Token_Index;
+   goto Exit_Row_69_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_13 := Row_Pos_68;
+
+
+
+Lst_Cpos_12 := Row_Pos_68;
+Tmp_List_12 := Get_Parse_List (Parser);
+
+loop
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_71 := Lst_Cpos_12;
+
+
+
+--  Start tok_code
+
+Token_Res_102 := Row_Pos_71;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_102));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Case_Kw)
+   then
+       Token_Pos_102 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_71 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_71,
+             Expected_Token_Id => lkt_Case_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_102 := Row_Pos_71 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_102 /= No_Token_Index then
+
+   Row_Pos_71 := Token_Pos_102;
+
+else
+   Row_Pos_71 := No_Token_Index;
+   goto Exit_Row_72_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_12 := No_Token_Index;
+
+
+
+Lst_Cpos_13 := Row_Pos_71;
+Tmp_List_13 := Get_Parse_List (Parser);
+
+loop
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_72 := Lst_Cpos_13;
+
+
+
+Defer_Res_110 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_72);
+Defer_Pos_110 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_110 /= No_Token_Index then
+
+   Row_Pos_72 := Defer_Pos_110;
+
+else
+   Row_Pos_72 := No_Token_Index;
+   goto Exit_Row_73_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_73_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_72 /= No_Token_Index then
+
+   Transform_Res_60 := Allocate_Enum_Class_Alt_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_60,
+      Kind => lkt_Enum_Class_Alt_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Lst_Cpos_13,
+      Token_End_Index   => (if Row_Pos_72 = Lst_Cpos_13
+                            then No_Token_Index
+                            else Row_Pos_72 - 1));
+
+      Initialize_Fields_For_Enum_Class_Alt_Decl
+        (Self => Transform_Res_60, Enum_Class_Alt_Decl_F_Syn_Name => Defer_Res_110);
+
+         if Defer_Res_110 /= null and then Is_Incomplete (Defer_Res_110) then
+            Transform_Res_60.Last_Attempted_Child := 0;
+         elsif Defer_Res_110 /= null and then not Is_Ghost (Defer_Res_110) then
+            Transform_Res_60.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   exit when Row_Pos_72 = No_Token_Index;
+
+   List_Pos_12 := Row_Pos_72;
+   Lst_Cpos_13 := List_Pos_12;
+
+   Tmp_List_13.Nodes.Append (Transform_Res_60);
+
+      
+--  Start tok_code
+
+Token_Res_103 := Lst_Cpos_13;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_103));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Comma)
+   then
+       Token_Pos_103 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Lst_Cpos_13 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Lst_Cpos_13,
+             Expected_Token_Id => lkt_Comma,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_103 := Lst_Cpos_13 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+      if Token_Pos_103 /= No_Token_Index then
+          Lst_Cpos_13 := Token_Pos_103;
+      else
+         exit;
+      end if;
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_13.Nodes.Length;
+begin
+   List_Res_12 :=
+      Allocate_Enum_Class_Alt_Decl_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_71;
+      Token_End := (if Lst_Cpos_13 = Row_Pos_71
+                    then Row_Pos_71
+                    else Lst_Cpos_13 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_71, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_12,
+      Kind              => lkt_Enum_Class_Alt_Decl_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_12,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_13.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_12.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_13);
+
+--  End list_code
+
+
+
+if List_Pos_12 /= No_Token_Index then
+
+   Row_Pos_71 := List_Pos_12;
+
+else
+   Row_Pos_71 := No_Token_Index;
+   goto Exit_Row_72_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_72_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_71 /= No_Token_Index then
+
+   Transform_Res_61 := Allocate_Enum_Class_Case (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_61,
+      Kind => lkt_Enum_Class_Case,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Lst_Cpos_12,
+      Token_End_Index   => (if Row_Pos_71 = Lst_Cpos_12
+                            then No_Token_Index
+                            else Row_Pos_71 - 1));
+
+      Initialize_Fields_For_Enum_Class_Case
+        (Self => Transform_Res_61, Enum_Class_Case_F_Decls => List_Res_12);
+
+         if List_Res_12 /= null and then Is_Incomplete (List_Res_12) then
+            Transform_Res_61.Last_Attempted_Child := 0;
+         elsif List_Res_12 /= null and then not Is_Ghost (List_Res_12) then
+            Transform_Res_61.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   exit when Row_Pos_71 = No_Token_Index;
+
+   List_Pos_13 := Row_Pos_71;
+   Lst_Cpos_12 := List_Pos_13;
+
+   Tmp_List_12.Nodes.Append (Transform_Res_61);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_12.Nodes.Length;
+begin
+   List_Res_13 :=
+      Allocate_Enum_Class_Case_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_68;
+      Token_End := (if Lst_Cpos_12 = Row_Pos_68
+                    then Row_Pos_68
+                    else Lst_Cpos_12 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_68, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_13,
+      Kind              => lkt_Enum_Class_Case_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_13,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_12.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_13.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_12);
+
+--  End list_code
+
+
+
+if List_Pos_13 /= No_Token_Index then
+
+   Row_Pos_68 := List_Pos_13;
+
+else
+   Row_Pos_68 := No_Token_Index;
+   goto Exit_Row_69_0;
+
+end if;
+
+
+Defer_Res_111 :=
+   Decl_Block_List_Parse_0 (Parser, Row_Pos_68);
+Defer_Pos_111 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_111 /= No_Token_Index then
+
+   Row_Pos_68 := Defer_Pos_111;
+
+else
+   Row_Pos_68 := No_Token_Index;
+   goto Exit_Row_69_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_104 := Row_Pos_68;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_104));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Brace)
+   then
+       Token_Pos_104 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_68 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_68,
+             Expected_Token_Id => lkt_R_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_104 := Row_Pos_68 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_104 /= No_Token_Index then
+
+   Row_Pos_68 := Token_Pos_104;
+
+else
+   Row_Pos_68 := No_Token_Index;
+   goto Exit_Row_69_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_69_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_68 /= No_Token_Index then
+
+   Transform_Res_62 := Allocate_Enum_Class_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_62,
+      Kind => lkt_Enum_Class_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_68 = Pos
+                            then No_Token_Index
+                            else Row_Pos_68 - 1));
+
+      Initialize_Fields_For_Enum_Class_Decl
+        (Self => Transform_Res_62, Basic_Class_Decl_F_Syn_Name => Defer_Res_107, Basic_Class_Decl_F_Base_Type => Defer_Res_108, Basic_Class_Decl_F_Traits => Defer_Res_109, Enum_Class_Decl_F_Branches => List_Res_13, Enum_Class_Decl_F_Decls => Defer_Res_111);
+
+         if Defer_Res_107 /= null and then Is_Incomplete (Defer_Res_107) then
+            Transform_Res_62.Last_Attempted_Child := 0;
+         elsif Defer_Res_107 /= null and then not Is_Ghost (Defer_Res_107) then
+            Transform_Res_62.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_108 /= null and then Is_Incomplete (Defer_Res_108) then
+            Transform_Res_62.Last_Attempted_Child := 0;
+         elsif Defer_Res_108 /= null and then not Is_Ghost (Defer_Res_108) then
+            Transform_Res_62.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_109 /= null and then Is_Incomplete (Defer_Res_109) then
+            Transform_Res_62.Last_Attempted_Child := 0;
+         elsif Defer_Res_109 /= null and then not Is_Ghost (Defer_Res_109) then
+            Transform_Res_62.Last_Attempted_Child := -1;
+         end if;
+         if List_Res_13 /= null and then Is_Incomplete (List_Res_13) then
+            Transform_Res_62.Last_Attempted_Child := 0;
+         elsif List_Res_13 /= null and then not Is_Ghost (List_Res_13) then
+            Transform_Res_62.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_111 /= null and then Is_Incomplete (Defer_Res_111) then
+            Transform_Res_62.Last_Attempted_Child := 0;
+         elsif Defer_Res_111 /= null and then not Is_Ghost (Defer_Res_111) then
+            Transform_Res_62.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_68 /= No_Token_Index then
+        Or_Pos_19 := Row_Pos_68;
+        Or_Res_19 := Transform_Res_62;
+        goto Exit_Or_19;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_73 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_105 := Row_Pos_73;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_105));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Class_Kw)
+   then
+       Token_Pos_105 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_73 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_73,
+             Expected_Token_Id => lkt_Class_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_105 := Row_Pos_73 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_105 /= No_Token_Index then
+
+   Row_Pos_73 := Token_Pos_105;
+
+else
+   Row_Pos_73 := No_Token_Index;
+   goto Exit_Row_74_0;
+
+end if;
+
+
+Defer_Res_112 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_73);
+Defer_Pos_112 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_112 /= No_Token_Index then
+
+   Row_Pos_73 := Defer_Pos_112;
+
+else
+   Row_Pos_73 := No_Token_Index;
+   goto Exit_Row_74_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_74 := Row_Pos_73;
+
+
+
+--  Start tok_code
+
+Token_Res_106 := Row_Pos_74;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_106));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Colon)
+   then
+       Token_Pos_106 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_74 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_74,
+             Expected_Token_Id => lkt_Colon,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_106 := Row_Pos_74 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_106 /= No_Token_Index then
+
+   Row_Pos_74 := Token_Pos_106;
+
+else
+   Row_Pos_74 := No_Token_Index;
+   goto Exit_Row_75_0;
+
+end if;
+
+
+Defer_Res_113 :=
+   Type_Ref_Or_Parse_0 (Parser, Row_Pos_74);
+Defer_Pos_113 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_113 /= No_Token_Index then
+
+   Row_Pos_74 := Defer_Pos_113;
+
+else
+   Row_Pos_74 := No_Token_Index;
+   goto Exit_Row_75_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_75_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_74 = No_Token_Index then
+
+        Defer_Res_113 := No_Bare_LK_Node;
+
+
+    Row_Pos_74 := Row_Pos_73;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_74 /= No_Token_Index then
+
+   Row_Pos_73 := Row_Pos_74;
+
+else
+   Row_Pos_73 := No_Token_Index;
+   goto Exit_Row_74_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_75 := Row_Pos_73;
+
+
+
+--  Start tok_code
+
+Token_Res_107 := Row_Pos_75;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_107));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Implements_Kw)
+   then
+       Token_Pos_107 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_75 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_75,
+             Expected_Token_Id => lkt_Implements_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_107 := Row_Pos_75 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_107 /= No_Token_Index then
+
+   Row_Pos_75 := Token_Pos_107;
+
+else
+   Row_Pos_75 := No_Token_Index;
+   goto Exit_Row_76_0;
+
+end if;
+
+
+Defer_Res_114 :=
+   Type_List_List_Parse_0 (Parser, Row_Pos_75);
+Defer_Pos_114 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_114 /= No_Token_Index then
+
+   Row_Pos_75 := Defer_Pos_114;
+
+else
+   Row_Pos_75 := No_Token_Index;
+   goto Exit_Row_76_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_76_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_75 = No_Token_Index then
+
+        Defer_Res_114 :=
+           Allocate_Type_Ref_List (Parser.Mem_Pool);
+         Initialize
+           (Self              => Defer_Res_114,
+            Kind              => lkt_Type_Ref_List,
+            Unit              => Parser.Unit,
+            Token_Start_Index => Row_Pos_73 - 1,
+            Token_End_Index   => No_Token_Index);
+         Initialize_List
+           (Self   => Defer_Res_114,
+            Parser => Parser,
+            Count  => 0);
+
+
+    Row_Pos_75 := Row_Pos_73;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_75 /= No_Token_Index then
+
+   Row_Pos_73 := Row_Pos_75;
+
+else
+   Row_Pos_73 := No_Token_Index;
+   goto Exit_Row_74_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_108 := Row_Pos_73;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_108));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Brace)
+   then
+       Token_Pos_108 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_73 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_73,
+             Expected_Token_Id => lkt_L_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_108 := Row_Pos_73 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_108 /= No_Token_Index then
+
+   Row_Pos_73 := Token_Pos_108;
+
+else
+   Row_Pos_73 := No_Token_Index;
+   goto Exit_Row_74_0;
+
+end if;
+
+
+Defer_Res_115 :=
+   Decl_Block_List_Parse_0 (Parser, Row_Pos_73);
+Defer_Pos_115 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_115 /= No_Token_Index then
+
+   Row_Pos_73 := Defer_Pos_115;
+
+else
+   Row_Pos_73 := No_Token_Index;
+   goto Exit_Row_74_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_109 := Row_Pos_73;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_109));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Brace)
+   then
+       Token_Pos_109 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_73 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_73,
+             Expected_Token_Id => lkt_R_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_109 := Row_Pos_73 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_109 /= No_Token_Index then
+
+   Row_Pos_73 := Token_Pos_109;
+
+else
+   Row_Pos_73 := No_Token_Index;
+   goto Exit_Row_74_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_74_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_73 /= No_Token_Index then
+
+   Transform_Res_63 := Allocate_Class_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_63,
+      Kind => lkt_Class_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_73 = Pos
+                            then No_Token_Index
+                            else Row_Pos_73 - 1));
+
+      Initialize_Fields_For_Class_Decl
+        (Self => Transform_Res_63, Basic_Class_Decl_F_Syn_Name => Defer_Res_112, Basic_Class_Decl_F_Base_Type => Defer_Res_113, Basic_Class_Decl_F_Traits => Defer_Res_114, Class_Decl_F_Decls => Defer_Res_115);
+
+         if Defer_Res_112 /= null and then Is_Incomplete (Defer_Res_112) then
+            Transform_Res_63.Last_Attempted_Child := 0;
+         elsif Defer_Res_112 /= null and then not Is_Ghost (Defer_Res_112) then
+            Transform_Res_63.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_113 /= null and then Is_Incomplete (Defer_Res_113) then
+            Transform_Res_63.Last_Attempted_Child := 0;
+         elsif Defer_Res_113 /= null and then not Is_Ghost (Defer_Res_113) then
+            Transform_Res_63.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_114 /= null and then Is_Incomplete (Defer_Res_114) then
+            Transform_Res_63.Last_Attempted_Child := 0;
+         elsif Defer_Res_114 /= null and then not Is_Ghost (Defer_Res_114) then
+            Transform_Res_63.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_115 /= null and then Is_Incomplete (Defer_Res_115) then
+            Transform_Res_63.Last_Attempted_Child := 0;
+         elsif Defer_Res_115 /= null and then not Is_Ghost (Defer_Res_115) then
+            Transform_Res_63.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_73 /= No_Token_Index then
+        Or_Pos_19 := Row_Pos_73;
+        Or_Res_19 := Transform_Res_63;
+        goto Exit_Or_19;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_76 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_110 := Row_Pos_76;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_110));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Enum_Kw)
+   then
+       Token_Pos_110 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_76 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_76,
+             Expected_Token_Id => lkt_Enum_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_110 := Row_Pos_76 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_110 /= No_Token_Index then
+
+   Row_Pos_76 := Token_Pos_110;
+
+else
+   Row_Pos_76 := No_Token_Index;
+   goto Exit_Row_77_0;
+
+end if;
+
+
+Defer_Res_116 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_76);
+Defer_Pos_116 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_116 /= No_Token_Index then
+
+   Row_Pos_76 := Defer_Pos_116;
+
+else
+   Row_Pos_76 := No_Token_Index;
+   goto Exit_Row_77_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_77 := Row_Pos_76;
+
+
+
+--  Start tok_code
+
+Token_Res_111 := Row_Pos_77;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_111));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Implements_Kw)
+   then
+       Token_Pos_111 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_77 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_77,
+             Expected_Token_Id => lkt_Implements_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_111 := Row_Pos_77 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_111 /= No_Token_Index then
+
+   Row_Pos_77 := Token_Pos_111;
+
+else
+   Row_Pos_77 := No_Token_Index;
+   goto Exit_Row_78_0;
+
+end if;
+
+
+Defer_Res_117 :=
+   Type_List_List_Parse_0 (Parser, Row_Pos_77);
+Defer_Pos_117 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_117 /= No_Token_Index then
+
+   Row_Pos_77 := Defer_Pos_117;
+
+else
+   Row_Pos_77 := No_Token_Index;
+   goto Exit_Row_78_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_78_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_77 = No_Token_Index then
+
+        Defer_Res_117 :=
+           Allocate_Type_Ref_List (Parser.Mem_Pool);
+         Initialize
+           (Self              => Defer_Res_117,
+            Kind              => lkt_Type_Ref_List,
+            Unit              => Parser.Unit,
+            Token_Start_Index => Row_Pos_76 - 1,
+            Token_End_Index   => No_Token_Index);
+         Initialize_List
+           (Self   => Defer_Res_117,
+            Parser => Parser,
+            Count  => 0);
+
+
+    Row_Pos_77 := Row_Pos_76;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_77 /= No_Token_Index then
+
+   Row_Pos_76 := Row_Pos_77;
+
+else
+   Row_Pos_76 := No_Token_Index;
+   goto Exit_Row_77_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_112 := Row_Pos_76;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_112));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Brace)
+   then
+       Token_Pos_112 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_76 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_76,
+             Expected_Token_Id => lkt_L_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_112 := Row_Pos_76 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_112 /= No_Token_Index then
+
+   Row_Pos_76 := Token_Pos_112;
+
+else
+   Row_Pos_76 := No_Token_Index;
+   goto Exit_Row_77_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_113 := Row_Pos_76;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_113));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Case_Kw)
+   then
+       Token_Pos_113 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_76 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_76,
+             Expected_Token_Id => lkt_Case_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_113 := Row_Pos_76 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_113 /= No_Token_Index then
+
+   Row_Pos_76 := Token_Pos_113;
+
+else
+   Row_Pos_76 := No_Token_Index;
+   goto Exit_Row_77_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_14 := No_Token_Index;
+
+
+
+Lst_Cpos_14 := Row_Pos_76;
+Tmp_List_14 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_118 :=
+   Enum_Lit_Decl_Transform_Parse_0 (Parser, Lst_Cpos_14);
+Defer_Pos_118 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_118 = No_Token_Index;
+
+   List_Pos_14 := Defer_Pos_118;
+   Lst_Cpos_14 := List_Pos_14;
+
+   Tmp_List_14.Nodes.Append (Defer_Res_118);
+
+      
+--  Start tok_code
+
+Token_Res_114 := Lst_Cpos_14;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_114));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Comma)
+   then
+       Token_Pos_114 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Lst_Cpos_14 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Lst_Cpos_14,
+             Expected_Token_Id => lkt_Comma,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_114 := Lst_Cpos_14 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+      if Token_Pos_114 /= No_Token_Index then
+          Lst_Cpos_14 := Token_Pos_114;
+      else
+         exit;
+      end if;
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_14.Nodes.Length;
+begin
+   List_Res_14 :=
+      Allocate_Enum_Lit_Decl_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_76;
+      Token_End := (if Lst_Cpos_14 = Row_Pos_76
+                    then Row_Pos_76
+                    else Lst_Cpos_14 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_76, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_14,
+      Kind              => lkt_Enum_Lit_Decl_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_14,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_14.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_14.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_14);
+
+--  End list_code
+
+
+
+if List_Pos_14 /= No_Token_Index then
+
+   Row_Pos_76 := List_Pos_14;
+
+else
+   Row_Pos_76 := No_Token_Index;
+   goto Exit_Row_77_0;
+
+end if;
+
+
+Defer_Res_119 :=
+   Decl_Block_List_Parse_0 (Parser, Row_Pos_76);
+Defer_Pos_119 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_119 /= No_Token_Index then
+
+   Row_Pos_76 := Defer_Pos_119;
+
+else
+   Row_Pos_76 := No_Token_Index;
+   goto Exit_Row_77_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_115 := Row_Pos_76;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_115));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Brace)
+   then
+       Token_Pos_115 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_76 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_76,
+             Expected_Token_Id => lkt_R_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_115 := Row_Pos_76 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_115 /= No_Token_Index then
+
+   Row_Pos_76 := Token_Pos_115;
+
+else
+   Row_Pos_76 := No_Token_Index;
+   goto Exit_Row_77_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_77_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_76 /= No_Token_Index then
+
+   Transform_Res_64 := Allocate_Enum_Type_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_64,
+      Kind => lkt_Enum_Type_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_76 = Pos
+                            then No_Token_Index
+                            else Row_Pos_76 - 1));
+
+      Initialize_Fields_For_Enum_Type_Decl
+        (Self => Transform_Res_64, Enum_Type_Decl_F_Syn_Name => Defer_Res_116, Enum_Type_Decl_F_Traits => Defer_Res_117, Enum_Type_Decl_F_Literals => List_Res_14, Enum_Type_Decl_F_Decls => Defer_Res_119);
+
+         if Defer_Res_116 /= null and then Is_Incomplete (Defer_Res_116) then
+            Transform_Res_64.Last_Attempted_Child := 0;
+         elsif Defer_Res_116 /= null and then not Is_Ghost (Defer_Res_116) then
+            Transform_Res_64.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_117 /= null and then Is_Incomplete (Defer_Res_117) then
+            Transform_Res_64.Last_Attempted_Child := 0;
+         elsif Defer_Res_117 /= null and then not Is_Ghost (Defer_Res_117) then
+            Transform_Res_64.Last_Attempted_Child := -1;
+         end if;
+         if List_Res_14 /= null and then Is_Incomplete (List_Res_14) then
+            Transform_Res_64.Last_Attempted_Child := 0;
+         elsif List_Res_14 /= null and then not Is_Ghost (List_Res_14) then
+            Transform_Res_64.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_119 /= null and then Is_Incomplete (Defer_Res_119) then
+            Transform_Res_64.Last_Attempted_Child := 0;
+         elsif Defer_Res_119 /= null and then not Is_Ghost (Defer_Res_119) then
+            Transform_Res_64.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_76 /= No_Token_Index then
+        Or_Pos_19 := Row_Pos_76;
+        Or_Res_19 := Transform_Res_64;
+        goto Exit_Or_19;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_78 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_116 := Row_Pos_78;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_116));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Trait_Kw)
+   then
+       Token_Pos_116 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_78 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_78,
+             Expected_Token_Id => lkt_Trait_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_116 := Row_Pos_78 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_116 /= No_Token_Index then
+
+   Row_Pos_78 := Token_Pos_116;
+
+else
+   Row_Pos_78 := No_Token_Index;
+   goto Exit_Row_80_0;
+
+end if;
+
+
+Defer_Res_120 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_78);
+Defer_Pos_120 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_120 /= No_Token_Index then
+
+   Row_Pos_78 := Defer_Pos_120;
+
+else
+   Row_Pos_78 := No_Token_Index;
+   goto Exit_Row_80_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_117 := Row_Pos_78;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_117));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Brace)
+   then
+       Token_Pos_117 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_78 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_78,
+             Expected_Token_Id => lkt_L_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_117 := Row_Pos_78 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_117 /= No_Token_Index then
+
+   Row_Pos_78 := Token_Pos_117;
+
+else
+   Row_Pos_78 := No_Token_Index;
+   goto Exit_Row_80_0;
+
+end if;
+
+
+Defer_Res_121 :=
+   Decl_Block_List_Parse_0 (Parser, Row_Pos_78);
+Defer_Pos_121 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_121 /= No_Token_Index then
+
+   Row_Pos_78 := Defer_Pos_121;
+
+else
+   Row_Pos_78 := No_Token_Index;
+   goto Exit_Row_80_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_118 := Row_Pos_78;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_118));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Brace)
+   then
+       Token_Pos_118 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_78 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_78,
+             Expected_Token_Id => lkt_R_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_118 := Row_Pos_78 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_118 /= No_Token_Index then
+
+   Row_Pos_78 := Token_Pos_118;
+
+else
+   Row_Pos_78 := No_Token_Index;
+   goto Exit_Row_80_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_80_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_78 /= No_Token_Index then
+
+   Transform_Res_65 := Allocate_Trait_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_65,
+      Kind => lkt_Trait_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_78 = Pos
+                            then No_Token_Index
+                            else Row_Pos_78 - 1));
+
+      Initialize_Fields_For_Trait_Decl
+        (Self => Transform_Res_65, Trait_Decl_F_Syn_Name => Defer_Res_120, Trait_Decl_F_Decls => Defer_Res_121);
+
+         if Defer_Res_120 /= null and then Is_Incomplete (Defer_Res_120) then
+            Transform_Res_65.Last_Attempted_Child := 0;
+         elsif Defer_Res_120 /= null and then not Is_Ghost (Defer_Res_120) then
+            Transform_Res_65.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_121 /= null and then Is_Incomplete (Defer_Res_121) then
+            Transform_Res_65.Last_Attempted_Child := 0;
+         elsif Defer_Res_121 /= null and then not Is_Ghost (Defer_Res_121) then
+            Transform_Res_65.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_78 /= No_Token_Index then
+        Or_Pos_19 := Row_Pos_78;
+        Or_Res_19 := Transform_Res_65;
+        goto Exit_Or_19;
+    end if;
+<<Exit_Or_19>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Type_Decl_Or_Parse_0_Memo,
+      Or_Pos_19 /= No_Token_Index,
+      Or_Res_19,
+      Pos,
+      Or_Pos_19);
+
+
+   Parser.Current_Pos := Or_Pos_19;
+
+   return Or_Res_19;
+end Type_Decl_Or_Parse_0;
+
+   
+
+
+function Fun_Arg_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Fun_Arg_Decl
+is
+   use Bare_Fun_Arg_Decl_Memos;
+
+      Row_Pos_83 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_132 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_132 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Token_Pos_125 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_125 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_133 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_133 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Row_Pos_84 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_126 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_126 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_134 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_134 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_69 :
+            Bare_Fun_Arg_Decl
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Fun_Arg_Decl_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_69 := M.Instance;
+      return Transform_Res_69;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_69;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_83 := Pos;
+
+
+
+Defer_Res_132 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_83);
+Defer_Pos_132 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_132 /= No_Token_Index then
+
+   Row_Pos_83 := Defer_Pos_132;
+
+else
+   Row_Pos_83 := No_Token_Index;
+   goto Exit_Row_82_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_125 := Row_Pos_83;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_125));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Colon)
+   then
+       Token_Pos_125 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_83 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_83,
+             Expected_Token_Id => lkt_Colon,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_125 := Row_Pos_83 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_125 /= No_Token_Index then
+
+   Row_Pos_83 := Token_Pos_125;
+
+else
+   Row_Pos_83 := No_Token_Index;
+   goto Exit_Row_82_0;
+
+end if;
+
+
+Defer_Res_133 :=
+   Type_Ref_Or_Parse_0 (Parser, Row_Pos_83);
+Defer_Pos_133 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_133 /= No_Token_Index then
+
+   Row_Pos_83 := Defer_Pos_133;
+
+else
+   Row_Pos_83 := No_Token_Index;
+   goto Exit_Row_82_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_84 := Row_Pos_83;
+
+
+
+--  Start tok_code
+
+Token_Res_126 := Row_Pos_84;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_126));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Equal)
+   then
+       Token_Pos_126 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_84 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_84,
+             Expected_Token_Id => lkt_Equal,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_126 := Row_Pos_84 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_126 /= No_Token_Index then
+
+   Row_Pos_84 := Token_Pos_126;
+
+else
+   Row_Pos_84 := No_Token_Index;
+   goto Exit_Row_83_0;
+
+end if;
+
+
+Defer_Res_134 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_84);
+Defer_Pos_134 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_134 /= No_Token_Index then
+
+   Row_Pos_84 := Defer_Pos_134;
+
+else
+   Row_Pos_84 := No_Token_Index;
+   goto Exit_Row_83_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_83_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_84 = No_Token_Index then
+
+        Defer_Res_134 := No_Bare_LK_Node;
+
+
+    Row_Pos_84 := Row_Pos_83;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_84 /= No_Token_Index then
+
+   Row_Pos_83 := Row_Pos_84;
+
+else
+   Row_Pos_83 := No_Token_Index;
+   goto Exit_Row_82_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_82_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_83 /= No_Token_Index then
+
+   Transform_Res_69 := Allocate_Fun_Arg_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_69,
+      Kind => lkt_Fun_Arg_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_83 = Pos
+                            then No_Token_Index
+                            else Row_Pos_83 - 1));
+
+      Initialize_Fields_For_Fun_Arg_Decl
+        (Self => Transform_Res_69, User_Val_Decl_F_Syn_Name => Defer_Res_132, Fun_Arg_Decl_F_Decl_Type => Defer_Res_133, Fun_Arg_Decl_F_Default_Val => Defer_Res_134);
+
+         if Defer_Res_132 /= null and then Is_Incomplete (Defer_Res_132) then
+            Transform_Res_69.Last_Attempted_Child := 0;
+         elsif Defer_Res_132 /= null and then not Is_Ghost (Defer_Res_132) then
+            Transform_Res_69.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_133 /= null and then Is_Incomplete (Defer_Res_133) then
+            Transform_Res_69.Last_Attempted_Child := 0;
+         elsif Defer_Res_133 /= null and then not Is_Ghost (Defer_Res_133) then
+            Transform_Res_69.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_134 /= null and then Is_Incomplete (Defer_Res_134) then
+            Transform_Res_69.Last_Attempted_Child := 0;
+         elsif Defer_Res_134 /= null and then not Is_Ghost (Defer_Res_134) then
+            Transform_Res_69.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Fun_Arg_Decl_Transform_Parse_0_Memo,
+      Row_Pos_83 /= No_Token_Index,
+      Transform_Res_69,
+      Pos,
+      Row_Pos_83);
+
+
+   Parser.Current_Pos := Row_Pos_83;
+
+   return Transform_Res_69;
+end Fun_Arg_Decl_Transform_Parse_0;
+
+   
+
+
+function Fun_Arg_List_List_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Fun_Arg_Decl_List
+is
+   use Bare_Fun_Arg_Decl_List_Memos;
+
+      Lst_Cpos_17 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_17 :
+            Free_Parse_List;
+      Defer_Pos_131 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_131 :
+            Bare_Fun_Arg_Decl
+               := No_Bare_LK_Node;
+      Token_Pos_124 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_124 :
+            Token_Index
+               := No_Token_Index;
+      List_Pos_17 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_17 :
+            Bare_Fun_Arg_Decl_List
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Fun_Arg_List_List_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      List_Res_17 := M.Instance;
+      return List_Res_17;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return List_Res_17;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start list_code
+
+    List_Pos_17 := Pos;
+
+
+
+Lst_Cpos_17 := Pos;
+Tmp_List_17 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_131 :=
+   Fun_Arg_Decl_Transform_Parse_0 (Parser, Lst_Cpos_17);
+Defer_Pos_131 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_131 = No_Token_Index;
+
+   List_Pos_17 := Defer_Pos_131;
+   Lst_Cpos_17 := List_Pos_17;
+
+   Tmp_List_17.Nodes.Append (Defer_Res_131);
+
+      
+--  Start tok_code
+
+Token_Res_124 := Lst_Cpos_17;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_124));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Comma)
+   then
+       Token_Pos_124 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Lst_Cpos_17 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Lst_Cpos_17,
+             Expected_Token_Id => lkt_Comma,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_124 := Lst_Cpos_17 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+      if Token_Pos_124 /= No_Token_Index then
+          Lst_Cpos_17 := Token_Pos_124;
+      else
+         exit;
+      end if;
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_17.Nodes.Length;
+begin
+   List_Res_17 :=
+      Allocate_Fun_Arg_Decl_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Pos;
+      Token_End := (if Lst_Cpos_17 = Pos
+                    then Pos
+                    else Lst_Cpos_17 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Pos, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_17,
+      Kind              => lkt_Fun_Arg_Decl_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_17,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_17.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_17.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_17);
+
+--  End list_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Fun_Arg_List_List_Parse_0_Memo,
+      List_Pos_17 /= No_Token_Index,
+      List_Res_17,
+      Pos,
+      List_Pos_17);
+
+
+   Parser.Current_Pos := List_Pos_17;
+
+   return List_Res_17;
+end Fun_Arg_List_List_Parse_0;
+
+   
+
+
+function Fun_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Fun_Decl
+is
+   use Bare_Fun_Decl_Memos;
+
+      Row_Pos_81 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_119 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_119 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_127 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_127 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Token_Pos_120 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_120 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_128 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_128 :
+            Bare_Fun_Arg_Decl_List
+               := No_Bare_LK_Node;
+      Token_Pos_121 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_121 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_122 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_122 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_129 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_129 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Row_Pos_82 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_123 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_123 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_130 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_130 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_68 :
+            Bare_Fun_Decl
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Fun_Decl_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_68 := M.Instance;
+      return Transform_Res_68;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_68;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_81 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_119 := Row_Pos_81;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_119));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Fun_Kw)
+   then
+       Token_Pos_119 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_81 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_81,
+             Expected_Token_Id => lkt_Fun_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_119 := Row_Pos_81 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_119 /= No_Token_Index then
+
+   Row_Pos_81 := Token_Pos_119;
+
+else
+   Row_Pos_81 := No_Token_Index;
+   goto Exit_Row_81_0;
+
+end if;
+
+
+Defer_Res_127 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_81);
+Defer_Pos_127 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_127 /= No_Token_Index then
+
+   Row_Pos_81 := Defer_Pos_127;
+
+else
+   Row_Pos_81 := No_Token_Index;
+   goto Exit_Row_81_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_120 := Row_Pos_81;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_120));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_120 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_81 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_81,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_120 := Row_Pos_81 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_120 /= No_Token_Index then
+
+   Row_Pos_81 := Token_Pos_120;
+
+else
+   Row_Pos_81 := No_Token_Index;
+   goto Exit_Row_81_0;
+
+end if;
+
+
+Defer_Res_128 :=
+   Fun_Arg_List_List_Parse_0 (Parser, Row_Pos_81);
+Defer_Pos_128 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_128 /= No_Token_Index then
+
+   Row_Pos_81 := Defer_Pos_128;
+
+else
+   Row_Pos_81 := No_Token_Index;
+   goto Exit_Row_81_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_121 := Row_Pos_81;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_121));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_121 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_81 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_81,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_121 := Row_Pos_81 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_121 /= No_Token_Index then
+
+   Row_Pos_81 := Token_Pos_121;
+
+else
+   Row_Pos_81 := No_Token_Index;
+   goto Exit_Row_81_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_122 := Row_Pos_81;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_122));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Colon)
+   then
+       Token_Pos_122 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_81 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_81,
+             Expected_Token_Id => lkt_Colon,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_122 := Row_Pos_81 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_122 /= No_Token_Index then
+
+   Row_Pos_81 := Token_Pos_122;
+
+else
+   Row_Pos_81 := No_Token_Index;
+   goto Exit_Row_81_0;
+
+end if;
+
+
+Defer_Res_129 :=
+   Type_Ref_Or_Parse_0 (Parser, Row_Pos_81);
+Defer_Pos_129 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_129 /= No_Token_Index then
+
+   Row_Pos_81 := Defer_Pos_129;
+
+else
+   Row_Pos_81 := No_Token_Index;
+   goto Exit_Row_81_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_82 := Row_Pos_81;
+
+
+
+--  Start tok_code
+
+Token_Res_123 := Row_Pos_82;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_123));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Equal)
+   then
+       Token_Pos_123 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_82 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_82,
+             Expected_Token_Id => lkt_Equal,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_123 := Row_Pos_82 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_123 /= No_Token_Index then
+
+   Row_Pos_82 := Token_Pos_123;
+
+else
+   Row_Pos_82 := No_Token_Index;
+   goto Exit_Row_84_0;
+
+end if;
+
+
+Defer_Res_130 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_82);
+Defer_Pos_130 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_130 /= No_Token_Index then
+
+   Row_Pos_82 := Defer_Pos_130;
+
+else
+   Row_Pos_82 := No_Token_Index;
+   goto Exit_Row_84_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_84_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_82 = No_Token_Index then
+
+        Defer_Res_130 := No_Bare_LK_Node;
+
+
+    Row_Pos_82 := Row_Pos_81;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_82 /= No_Token_Index then
+
+   Row_Pos_81 := Row_Pos_82;
+
+else
+   Row_Pos_81 := No_Token_Index;
+   goto Exit_Row_81_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_81_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_81 /= No_Token_Index then
+
+   Transform_Res_68 := Allocate_Fun_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_68,
+      Kind => lkt_Fun_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_81 = Pos
+                            then No_Token_Index
+                            else Row_Pos_81 - 1));
+
+      Initialize_Fields_For_Fun_Decl
+        (Self => Transform_Res_68, User_Val_Decl_F_Syn_Name => Defer_Res_127, Fun_Decl_F_Args => Defer_Res_128, Fun_Decl_F_Return_Type => Defer_Res_129, Fun_Decl_F_Body => Defer_Res_130);
+
+         if Defer_Res_127 /= null and then Is_Incomplete (Defer_Res_127) then
+            Transform_Res_68.Last_Attempted_Child := 0;
+         elsif Defer_Res_127 /= null and then not Is_Ghost (Defer_Res_127) then
+            Transform_Res_68.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_128 /= null and then Is_Incomplete (Defer_Res_128) then
+            Transform_Res_68.Last_Attempted_Child := 0;
+         elsif Defer_Res_128 /= null and then not Is_Ghost (Defer_Res_128) then
+            Transform_Res_68.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_129 /= null and then Is_Incomplete (Defer_Res_129) then
+            Transform_Res_68.Last_Attempted_Child := 0;
+         elsif Defer_Res_129 /= null and then not Is_Ghost (Defer_Res_129) then
+            Transform_Res_68.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_130 /= null and then Is_Incomplete (Defer_Res_130) then
+            Transform_Res_68.Last_Attempted_Child := 0;
+         elsif Defer_Res_130 /= null and then not Is_Ghost (Defer_Res_130) then
+            Transform_Res_68.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Fun_Decl_Transform_Parse_0_Memo,
+      Row_Pos_81 /= No_Token_Index,
+      Transform_Res_68,
+      Pos,
+      Row_Pos_81);
+
+
+   Parser.Current_Pos := Row_Pos_81;
+
+   return Transform_Res_68;
+end Fun_Decl_Transform_Parse_0;
+
+   
+
+
+function Lexer_Family_Decl_Transform_Parse_1
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Full_Decl
+is
+   use Bare_Full_Decl_Memos;
+
+      Row_Pos_86 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_138 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_138 :
+            Bare_Doc
+               := No_Bare_LK_Node;
+      Lst_Cpos_19 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_19 :
+            Free_Parse_List;
+      Defer_Pos_139 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_139 :
+            Bare_Decl_Annotation
+               := No_Bare_LK_Node;
+      List_Pos_19 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_19 :
+            Bare_Decl_Annotation_List
+               := No_Bare_LK_Node;
+      Row_Pos_87 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_130 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_130 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_140 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_140 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Token_Pos_131 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_131 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_20 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_20 :
+            Free_Parse_List;
+      Defer_Pos_141 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_141 :
+            Bare_Full_Decl
+               := No_Bare_LK_Node;
+      List_Pos_20 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_20 :
+            Bare_Full_Decl_List
+               := No_Bare_LK_Node;
+      Token_Pos_132 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_132 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_71 :
+            Bare_Lexer_Family_Decl
+               := No_Bare_LK_Node;
+      Transform_Res_72 :
+            Bare_Full_Decl
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Lexer_Family_Decl_Transform_Parse_1_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_72 := M.Instance;
+      return Transform_Res_72;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_72;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_86 := Pos;
+
+
+
+Defer_Res_138 :=
+   Doc_Transform_Parse_0 (Parser, Row_Pos_86);
+Defer_Pos_138 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_138 /= No_Token_Index then
+
+   Row_Pos_86 := Defer_Pos_138;
+
+else
+   Row_Pos_86 := No_Token_Index;
+   goto Exit_Row_86_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_19 := Row_Pos_86;
+
+
+
+Lst_Cpos_19 := Row_Pos_86;
+Tmp_List_19 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_139 :=
+   Decl_Annotation_Transform_Parse_0 (Parser, Lst_Cpos_19);
+Defer_Pos_139 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_139 = No_Token_Index;
+
+   List_Pos_19 := Defer_Pos_139;
+   Lst_Cpos_19 := List_Pos_19;
+
+   Tmp_List_19.Nodes.Append (Defer_Res_139);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_19.Nodes.Length;
+begin
+   List_Res_19 :=
+      Allocate_Decl_Annotation_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_86;
+      Token_End := (if Lst_Cpos_19 = Row_Pos_86
+                    then Row_Pos_86
+                    else Lst_Cpos_19 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_86, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_19,
+      Kind              => lkt_Decl_Annotation_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_19,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_19.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_19.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_19);
+
+--  End list_code
+
+
+
+if List_Pos_19 /= No_Token_Index then
+
+   Row_Pos_86 := List_Pos_19;
+
+else
+   Row_Pos_86 := No_Token_Index;
+   goto Exit_Row_86_0;
+
+end if;
+
+
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_87 := Row_Pos_86;
+
+
+
+--  Start tok_code
+
+Token_Res_130 := Row_Pos_87;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_130));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Identifier)
+      or else T.Symbol /= Precomputed_Symbol
+        (Parser.TDH.Symbols, Precomputed_Symbol_Family)
+   then
+       Token_Pos_130 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_87 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_87,
+             Expected_Token_Id => lkt_Identifier,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_130 := Row_Pos_87 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_130 /= No_Token_Index then
+
+   Row_Pos_87 := Token_Pos_130;
+
+else
+   Row_Pos_87 := No_Token_Index;
+   goto Exit_Row_87_0;
+
+end if;
+
+
+Defer_Res_140 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_87);
+Defer_Pos_140 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_140 /= No_Token_Index then
+
+   Row_Pos_87 := Defer_Pos_140;
+
+else
+   Row_Pos_87 := No_Token_Index;
+   goto Exit_Row_87_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_131 := Row_Pos_87;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_131));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Brace)
+   then
+       Token_Pos_131 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_87 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_87,
+             Expected_Token_Id => lkt_L_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_131 := Row_Pos_87 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_131 /= No_Token_Index then
+
+   Row_Pos_87 := Token_Pos_131;
+
+else
+   Row_Pos_87 := No_Token_Index;
+   goto Exit_Row_87_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_20 := No_Token_Index;
+
+
+
+Lst_Cpos_20 := Row_Pos_87;
+Tmp_List_20 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_141 :=
+   Decl_Transform_Parse_0 (Parser, Lst_Cpos_20);
+Defer_Pos_141 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_141 = No_Token_Index;
+
+   List_Pos_20 := Defer_Pos_141;
+   Lst_Cpos_20 := List_Pos_20;
+
+   Tmp_List_20.Nodes.Append (Defer_Res_141);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_20.Nodes.Length;
+begin
+   List_Res_20 :=
+      Allocate_Full_Decl_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_87;
+      Token_End := (if Lst_Cpos_20 = Row_Pos_87
+                    then Row_Pos_87
+                    else Lst_Cpos_20 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_87, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_20,
+      Kind              => lkt_Full_Decl_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_20,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_20.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_20.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_20);
+
+--  End list_code
+
+
+
+if List_Pos_20 /= No_Token_Index then
+
+   Row_Pos_87 := List_Pos_20;
+
+else
+   Row_Pos_87 := No_Token_Index;
+   goto Exit_Row_87_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_132 := Row_Pos_87;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_132));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Brace)
+   then
+       Token_Pos_132 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_87 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_87,
+             Expected_Token_Id => lkt_R_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_132 := Row_Pos_87 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_132 /= No_Token_Index then
+
+   Row_Pos_87 := Token_Pos_132;
+
+else
+   Row_Pos_87 := No_Token_Index;
+   goto Exit_Row_87_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_87_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_87 /= No_Token_Index then
+
+   Transform_Res_71 := Allocate_Lexer_Family_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_71,
+      Kind => lkt_Lexer_Family_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_86,
+      Token_End_Index   => (if Row_Pos_87 = Row_Pos_86
+                            then No_Token_Index
+                            else Row_Pos_87 - 1));
+
+      Initialize_Fields_For_Lexer_Family_Decl
+        (Self => Transform_Res_71, Lexer_Family_Decl_F_Syn_Name => Defer_Res_140, Lexer_Family_Decl_F_Rules => List_Res_20);
+
+         if Defer_Res_140 /= null and then Is_Incomplete (Defer_Res_140) then
+            Transform_Res_71.Last_Attempted_Child := 0;
+         elsif Defer_Res_140 /= null and then not Is_Ghost (Defer_Res_140) then
+            Transform_Res_71.Last_Attempted_Child := -1;
+         end if;
+         if List_Res_20 /= null and then Is_Incomplete (List_Res_20) then
+            Transform_Res_71.Last_Attempted_Child := 0;
+         elsif List_Res_20 /= null and then not Is_Ghost (List_Res_20) then
+            Transform_Res_71.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+
+if Row_Pos_87 /= No_Token_Index then
+
+   Row_Pos_86 := Row_Pos_87;
+
+else
+   Row_Pos_86 := No_Token_Index;
+   goto Exit_Row_86_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_86_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_86 /= No_Token_Index then
+
+   Transform_Res_72 := Allocate_Full_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_72,
+      Kind => lkt_Full_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_86 = Pos
+                            then No_Token_Index
+                            else Row_Pos_86 - 1));
+
+      Initialize_Fields_For_Full_Decl
+        (Self => Transform_Res_72, Full_Decl_F_Doc => Defer_Res_138, Full_Decl_F_Decl_Annotations => List_Res_19, Full_Decl_F_Decl => Transform_Res_71);
+
+         if Defer_Res_138 /= null and then Is_Incomplete (Defer_Res_138) then
+            Transform_Res_72.Last_Attempted_Child := 0;
+         elsif Defer_Res_138 /= null and then not Is_Ghost (Defer_Res_138) then
+            Transform_Res_72.Last_Attempted_Child := -1;
+         end if;
+         if List_Res_19 /= null and then Is_Incomplete (List_Res_19) then
+            Transform_Res_72.Last_Attempted_Child := 0;
+         elsif List_Res_19 /= null and then not Is_Ghost (List_Res_19) then
+            Transform_Res_72.Last_Attempted_Child := -1;
+         end if;
+         if Transform_Res_71 /= null and then Is_Incomplete (Transform_Res_71) then
+            Transform_Res_72.Last_Attempted_Child := 0;
+         elsif Transform_Res_71 /= null and then not Is_Ghost (Transform_Res_71) then
+            Transform_Res_72.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Lexer_Family_Decl_Transform_Parse_1_Memo,
+      Row_Pos_86 /= No_Token_Index,
+      Transform_Res_72,
+      Pos,
+      Row_Pos_86);
+
+
+   Parser.Current_Pos := Row_Pos_86;
+
+   return Transform_Res_72;
+end Lexer_Family_Decl_Transform_Parse_1;
+
+   
+
+
+function Grammar_Expr_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Expr
+is
+   use Bare_Grammar_Expr_Memos;
+
+      Row_Pos_90 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_162 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_162 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_139 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_139 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_140 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_140 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_141 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_141 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_163 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_163 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_142 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_142 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_75 :
+            Bare_Grammar_Dont_Skip
+               := No_Bare_LK_Node;
+      Row_Pos_91 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_164 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_164 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_143 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_143 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_144 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_144 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_145 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_145 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_165 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_165 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_146 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_146 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_76 :
+            Bare_Grammar_Predicate
+               := No_Bare_LK_Node;
+      Defer_Pos_166 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_166 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      Or_Pos_23 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_23 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+
+      Mem_Pos : Token_Index := Pos;
+      Mem_Res : Bare_Grammar_Expr := No_Bare_LK_Node;
+
+   M : Memo_Entry := Get (Parser.Private_Part.Grammar_Expr_Or_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_23 := M.Instance;
+      return Or_Res_23;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_23;
+   end if;
+
+       Set (Parser.Private_Part.Grammar_Expr_Or_Parse_0_Memo, False, Or_Res_23, Pos, Mem_Pos);
+
+       <<Try_Again>>
+
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_23 := No_Token_Index;
+Or_Res_23 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_90 := Pos;
+
+
+
+Defer_Res_162 :=
+   Grammar_Expr_Or_Parse_0 (Parser, Row_Pos_90);
+Defer_Pos_162 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_162 /= No_Token_Index then
+
+   Row_Pos_90 := Defer_Pos_162;
+
+else
+   Row_Pos_90 := No_Token_Index;
+   goto Exit_Row_90_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_139 := Row_Pos_90;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_139));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Dot)
+   then
+       Token_Pos_139 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_90 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_90,
+             Expected_Token_Id => lkt_Dot,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_139 := Row_Pos_90 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_139 /= No_Token_Index then
+
+   Row_Pos_90 := Token_Pos_139;
+
+else
+   Row_Pos_90 := No_Token_Index;
+   goto Exit_Row_90_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_140 := Row_Pos_90;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_140));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Identifier)
+      or else T.Symbol /= Precomputed_Symbol
+        (Parser.TDH.Symbols, Precomputed_Symbol_Dont_Skip)
+   then
+       Token_Pos_140 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_90 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_90,
+             Expected_Token_Id => lkt_Identifier,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_140 := Row_Pos_90 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_140 /= No_Token_Index then
+
+   Row_Pos_90 := Token_Pos_140;
+
+else
+   Row_Pos_90 := No_Token_Index;
+   goto Exit_Row_90_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_141 := Row_Pos_90;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_141));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_141 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_90 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_90,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_141 := Row_Pos_90 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_141 /= No_Token_Index then
+
+   Row_Pos_90 := Token_Pos_141;
+
+else
+   Row_Pos_90 := No_Token_Index;
+   goto Exit_Row_90_0;
+
+end if;
+
+
+Defer_Res_163 :=
+   Grammar_Expr_Or_Parse_0 (Parser, Row_Pos_90);
+Defer_Pos_163 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_163 /= No_Token_Index then
+
+   Row_Pos_90 := Defer_Pos_163;
+
+else
+   Row_Pos_90 := No_Token_Index;
+   goto Exit_Row_90_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_142 := Row_Pos_90;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_142));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_142 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_90 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_90,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_142 := Row_Pos_90 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_142 /= No_Token_Index then
+
+   Row_Pos_90 := Token_Pos_142;
+
+else
+   Row_Pos_90 := No_Token_Index;
+   goto Exit_Row_90_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_90_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_90 /= No_Token_Index then
+
+   Transform_Res_75 := Allocate_Grammar_Dont_Skip (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_75,
+      Kind => lkt_Grammar_Dont_Skip,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_90 = Pos
+                            then No_Token_Index
+                            else Row_Pos_90 - 1));
+
+      Initialize_Fields_For_Grammar_Dont_Skip
+        (Self => Transform_Res_75, Grammar_Dont_Skip_F_Expr => Defer_Res_162, Grammar_Dont_Skip_F_Dont_Skip => Defer_Res_163);
+
+         if Defer_Res_162 /= null and then Is_Incomplete (Defer_Res_162) then
+            Transform_Res_75.Last_Attempted_Child := 0;
+         elsif Defer_Res_162 /= null and then not Is_Ghost (Defer_Res_162) then
+            Transform_Res_75.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_163 /= null and then Is_Incomplete (Defer_Res_163) then
+            Transform_Res_75.Last_Attempted_Child := 0;
+         elsif Defer_Res_163 /= null and then not Is_Ghost (Defer_Res_163) then
+            Transform_Res_75.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_90 /= No_Token_Index then
+        Or_Pos_23 := Row_Pos_90;
+        Or_Res_23 := Transform_Res_75;
+        goto Exit_Or_23;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_91 := Pos;
+
+
+
+Defer_Res_164 :=
+   Grammar_Expr_Or_Parse_0 (Parser, Row_Pos_91);
+Defer_Pos_164 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_164 /= No_Token_Index then
+
+   Row_Pos_91 := Defer_Pos_164;
+
+else
+   Row_Pos_91 := No_Token_Index;
+   goto Exit_Row_91_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_143 := Row_Pos_91;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_143));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Comb)
+   then
+       Token_Pos_143 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_91 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_91,
+             Expected_Token_Id => lkt_Comb,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_143 := Row_Pos_91 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_143 /= No_Token_Index then
+
+   Row_Pos_91 := Token_Pos_143;
+
+else
+   Row_Pos_91 := No_Token_Index;
+   goto Exit_Row_91_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_144 := Row_Pos_91;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_144));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Identifier)
+      or else T.Symbol /= Precomputed_Symbol
+        (Parser.TDH.Symbols, Precomputed_Symbol_When)
+   then
+       Token_Pos_144 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_91 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_91,
+             Expected_Token_Id => lkt_Identifier,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_144 := Row_Pos_91 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_144 /= No_Token_Index then
+
+   Row_Pos_91 := Token_Pos_144;
+
+else
+   Row_Pos_91 := No_Token_Index;
+   goto Exit_Row_91_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_145 := Row_Pos_91;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_145));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_145 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_91 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_91,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_145 := Row_Pos_91 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_145 /= No_Token_Index then
+
+   Row_Pos_91 := Token_Pos_145;
+
+else
+   Row_Pos_91 := No_Token_Index;
+   goto Exit_Row_91_0;
+
+end if;
+
+
+Defer_Res_165 :=
+   Basic_Name_Or_Parse_0 (Parser, Row_Pos_91);
+Defer_Pos_165 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_165 /= No_Token_Index then
+
+   Row_Pos_91 := Defer_Pos_165;
+
+else
+   Row_Pos_91 := No_Token_Index;
+   goto Exit_Row_91_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_146 := Row_Pos_91;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_146));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_146 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_91 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_91,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_146 := Row_Pos_91 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_146 /= No_Token_Index then
+
+   Row_Pos_91 := Token_Pos_146;
+
+else
+   Row_Pos_91 := No_Token_Index;
+   goto Exit_Row_91_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_91_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_91 /= No_Token_Index then
+
+   Transform_Res_76 := Allocate_Grammar_Predicate (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_76,
+      Kind => lkt_Grammar_Predicate,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_91 = Pos
+                            then No_Token_Index
+                            else Row_Pos_91 - 1));
+
+      Initialize_Fields_For_Grammar_Predicate
+        (Self => Transform_Res_76, Grammar_Predicate_F_Expr => Defer_Res_164, Grammar_Predicate_F_Prop_Ref => Defer_Res_165);
+
+         if Defer_Res_164 /= null and then Is_Incomplete (Defer_Res_164) then
+            Transform_Res_76.Last_Attempted_Child := 0;
+         elsif Defer_Res_164 /= null and then not Is_Ghost (Defer_Res_164) then
+            Transform_Res_76.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_165 /= null and then Is_Incomplete (Defer_Res_165) then
+            Transform_Res_76.Last_Attempted_Child := 0;
+         elsif Defer_Res_165 /= null and then not Is_Ghost (Defer_Res_165) then
+            Transform_Res_76.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_91 /= No_Token_Index then
+        Or_Pos_23 := Row_Pos_91;
+        Or_Res_23 := Transform_Res_76;
+        goto Exit_Or_23;
+    end if;
+    
+Defer_Res_166 :=
+   Grammar_Primary_Or_Parse_0 (Parser, Pos);
+Defer_Pos_166 := Parser.Current_Pos;
+
+    if Defer_Pos_166 /= No_Token_Index then
+        Or_Pos_23 := Defer_Pos_166;
+        Or_Res_23 := Defer_Res_166;
+        goto Exit_Or_23;
+    end if;
+<<Exit_Or_23>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+      if Or_Pos_23 > Mem_Pos then
+         Mem_Pos := Or_Pos_23;
+         Mem_Res := Or_Res_23;
+         Set
+           (Parser.Private_Part.Grammar_Expr_Or_Parse_0_Memo,
+            Or_Pos_23 /= No_Token_Index,
+            Or_Res_23,
+            Pos,
+            Or_Pos_23);
+         goto Try_Again;
+
+      elsif Mem_Pos > Pos then
+         Or_Res_23 := Mem_Res;
+         Or_Pos_23 := Mem_Pos;
+         goto No_Memo;
+      end if;
+
+   Set
+     (Parser.Private_Part.Grammar_Expr_Or_Parse_0_Memo,
+      Or_Pos_23 /= No_Token_Index,
+      Or_Res_23,
+      Pos,
+      Or_Pos_23);
+
+       <<No_Memo>>
+
+   Parser.Current_Pos := Or_Pos_23;
+
+   return Or_Res_23;
+end Grammar_Expr_Or_Parse_0;
+
+   
+
+
+function Grammar_Pick_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Pick
+is
+   use Bare_Grammar_Pick_Memos;
+
+      Row_Pos_89 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_136 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_136 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_137 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_137 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_22 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_22 :
+            Free_Parse_List;
+      Defer_Pos_161 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_161 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      List_Pos_22 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_22 :
+            Bare_Grammar_Expr_List
+               := No_Bare_LK_Node;
+      Token_Pos_138 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_138 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_74 :
+            Bare_Grammar_Pick
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Grammar_Pick_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_74 := M.Instance;
+      return Transform_Res_74;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_74;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_89 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_136 := Row_Pos_89;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_136));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Identifier)
+      or else T.Symbol /= Precomputed_Symbol
+        (Parser.TDH.Symbols, Precomputed_Symbol_Pick)
+   then
+       Token_Pos_136 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_89 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_89,
+             Expected_Token_Id => lkt_Identifier,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_136 := Row_Pos_89 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_136 /= No_Token_Index then
+
+   Row_Pos_89 := Token_Pos_136;
+
+else
+   Row_Pos_89 := No_Token_Index;
+   goto Exit_Row_89_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_137 := Row_Pos_89;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_137));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_137 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_89 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_89,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_137 := Row_Pos_89 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_137 /= No_Token_Index then
+
+   Row_Pos_89 := Token_Pos_137;
+
+else
+   Row_Pos_89 := No_Token_Index;
+   goto Exit_Row_89_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_22 := No_Token_Index;
+
+
+
+Lst_Cpos_22 := Row_Pos_89;
+Tmp_List_22 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_161 :=
+   Grammar_Expr_Or_Parse_0 (Parser, Lst_Cpos_22);
+Defer_Pos_161 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_161 = No_Token_Index;
+
+   List_Pos_22 := Defer_Pos_161;
+   Lst_Cpos_22 := List_Pos_22;
+
+   Tmp_List_22.Nodes.Append (Defer_Res_161);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_22.Nodes.Length;
+begin
+   List_Res_22 :=
+      Allocate_Grammar_Expr_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_89;
+      Token_End := (if Lst_Cpos_22 = Row_Pos_89
+                    then Row_Pos_89
+                    else Lst_Cpos_22 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_89, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_22,
+      Kind              => lkt_Grammar_Expr_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_22,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_22.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_22.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_22);
+
+--  End list_code
+
+
+
+if List_Pos_22 /= No_Token_Index then
+
+   Row_Pos_89 := List_Pos_22;
+
+else
+   Row_Pos_89 := No_Token_Index;
+   goto Exit_Row_89_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_138 := Row_Pos_89;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_138));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_138 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_89 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_89,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_138 := Row_Pos_89 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_138 /= No_Token_Index then
+
+   Row_Pos_89 := Token_Pos_138;
+
+else
+   Row_Pos_89 := No_Token_Index;
+   goto Exit_Row_89_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_89_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_89 /= No_Token_Index then
+
+   Transform_Res_74 := Allocate_Grammar_Pick (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_74,
+      Kind => lkt_Grammar_Pick,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_89 = Pos
+                            then No_Token_Index
+                            else Row_Pos_89 - 1));
+
+      Initialize_Fields_For_Grammar_Pick
+        (Self => Transform_Res_74, Grammar_Pick_F_Exprs => List_Res_22);
+
+         if List_Res_22 /= null and then Is_Incomplete (List_Res_22) then
+            Transform_Res_74.Last_Attempted_Child := 0;
+         elsif List_Res_22 /= null and then not Is_Ghost (List_Res_22) then
+            Transform_Res_74.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Grammar_Pick_Transform_Parse_0_Memo,
+      Row_Pos_89 /= No_Token_Index,
+      Transform_Res_74,
+      Pos,
+      Row_Pos_89);
+
+
+   Parser.Current_Pos := Row_Pos_89;
+
+   return Transform_Res_74;
+end Grammar_Pick_Transform_Parse_0;
+
+   
+
+
+function Grammar_Implicit_Pick_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Implicit_Pick
+is
+   use Bare_Grammar_Implicit_Pick_Memos;
+
+      Row_Pos_97 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_23 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_23 :
+            Free_Parse_List;
+      Defer_Pos_171 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_171 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      List_Pos_23 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_23 :
+            Bare_Grammar_Expr_List
+               := No_Bare_LK_Node;
+      Transform_Res_80 :
+            Bare_Grammar_Implicit_Pick
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Grammar_Implicit_Pick_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_80 := M.Instance;
+      return Transform_Res_80;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_80;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_97 := Pos;
+
+
+
+--  Start list_code
+
+    List_Pos_23 := No_Token_Index;
+
+
+
+Lst_Cpos_23 := Row_Pos_97;
+Tmp_List_23 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_171 :=
+   Grammar_Expr_Or_Parse_0 (Parser, Lst_Cpos_23);
+Defer_Pos_171 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_171 = No_Token_Index;
+
+   List_Pos_23 := Defer_Pos_171;
+   Lst_Cpos_23 := List_Pos_23;
+
+   Tmp_List_23.Nodes.Append (Defer_Res_171);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_23.Nodes.Length;
+begin
+   List_Res_23 :=
+      Allocate_Grammar_Expr_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_97;
+      Token_End := (if Lst_Cpos_23 = Row_Pos_97
+                    then Row_Pos_97
+                    else Lst_Cpos_23 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_97, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_23,
+      Kind              => lkt_Grammar_Expr_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_23,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_23.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_23.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_23);
+
+--  End list_code
+
+
+
+if List_Pos_23 /= No_Token_Index then
+
+   Row_Pos_97 := List_Pos_23;
+
+else
+   Row_Pos_97 := No_Token_Index;
+   goto Exit_Row_96_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_96_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_97 /= No_Token_Index then
+
+   Transform_Res_80 := Allocate_Grammar_Implicit_Pick (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_80,
+      Kind => lkt_Grammar_Implicit_Pick,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_97 = Pos
+                            then No_Token_Index
+                            else Row_Pos_97 - 1));
+
+      Initialize_Fields_For_Grammar_Implicit_Pick
+        (Self => Transform_Res_80, Grammar_Pick_F_Exprs => List_Res_23);
+
+         if List_Res_23 /= null and then Is_Incomplete (List_Res_23) then
+            Transform_Res_80.Last_Attempted_Child := 0;
+         elsif List_Res_23 /= null and then not Is_Ghost (List_Res_23) then
+            Transform_Res_80.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Grammar_Implicit_Pick_Transform_Parse_0_Memo,
+      Row_Pos_97 /= No_Token_Index,
+      Transform_Res_80,
+      Pos,
+      Row_Pos_97);
+
+
+   Parser.Current_Pos := Row_Pos_97;
+
+   return Transform_Res_80;
+end Grammar_Implicit_Pick_Transform_Parse_0;
+
+   
+
+
+function Grammar_List_Expr_Transform_Parse_2
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_List
+is
+   use Bare_Grammar_List_Memos;
+
+      Row_Pos_92 :
+            Token_Index
+               := No_Token_Index;
+      Row_Pos_93 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_147 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_147 :
+            Token_Index
+               := No_Token_Index;
+      Null_Res_0 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Defer_Pos_167 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_167 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Or_Pos_24 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_24 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Row_Pos_94 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_148 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_148 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_77 :
+            Bare_List_Kind_One
+               := No_Bare_LK_Node;
+      Row_Pos_95 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_149 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_149 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_78 :
+            Bare_List_Kind_Zero
+               := No_Bare_LK_Node;
+      Or_Pos_25 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_25 :
+            Bare_List_Kind
+               := No_Bare_LK_Node;
+      Token_Pos_150 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_150 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_168 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_168 :
+            Bare_Grammar_Implicit_Pick
+               := No_Bare_LK_Node;
+      Defer_Pos_169 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_169 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      Or_Pos_26 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_26 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      Row_Pos_96 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_151 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_151 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_170 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_170 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_152 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_152 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_79 :
+            Bare_Grammar_List
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Grammar_List_Expr_Transform_Parse_2_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_79 := M.Instance;
+      return Transform_Res_79;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_79;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_92 := Pos;
+
+
+
+--  Start or_code
+
+Or_Pos_24 := No_Token_Index;
+Or_Res_24 := No_Bare_LK_Node;
+    
+--  Start row_code
+
+Row_Pos_93 := Row_Pos_92;
+
+
+
+--  Start tok_code
+
+Token_Res_147 := Row_Pos_93;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_147));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Identifier)
+      or else T.Symbol /= Precomputed_Symbol
+        (Parser.TDH.Symbols, Precomputed_Symbol_List)
+   then
+       Token_Pos_147 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_93 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_93,
+             Expected_Token_Id => lkt_Identifier,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_147 := Row_Pos_93 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_147 /= No_Token_Index then
+
+   Row_Pos_93 := Token_Pos_147;
+
+else
+   Row_Pos_93 := No_Token_Index;
+   goto Exit_Row_93_0;
+
+end if;
+
+
+   Null_Res_0 := No_Bare_LK_Node;
+
+
+
+if Row_Pos_93 /= No_Token_Index then
+
+   Row_Pos_93 := Row_Pos_93;
+
+else
+   Row_Pos_93 := No_Token_Index;
+   goto Exit_Row_93_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_93_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+    if Row_Pos_93 /= No_Token_Index then
+        Or_Pos_24 := Row_Pos_93;
+        Or_Res_24 := Null_Res_0;
+        goto Exit_Or_24;
+    end if;
+    
+Defer_Res_167 :=
+   Type_Ref_Or_Parse_0 (Parser, Row_Pos_92);
+Defer_Pos_167 := Parser.Current_Pos;
+
+    if Defer_Pos_167 /= No_Token_Index then
+        Or_Pos_24 := Defer_Pos_167;
+        Or_Res_24 := Defer_Res_167;
+        goto Exit_Or_24;
+    end if;
+<<Exit_Or_24>>
+
+--  End or_code
+
+
+
+if Or_Pos_24 /= No_Token_Index then
+
+   Row_Pos_92 := Or_Pos_24;
+
+else
+   Row_Pos_92 := No_Token_Index;
+   goto Exit_Row_92_0;
+
+end if;
+
+
+--  Start or_code
+
+Or_Pos_25 := No_Token_Index;
+Or_Res_25 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_94 := Row_Pos_92;
+
+
+
+--  Start tok_code
+
+Token_Res_148 := Row_Pos_94;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_148));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Plus)
+   then
+       Token_Pos_148 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_94 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_94,
+             Expected_Token_Id => lkt_Plus,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_148 := Row_Pos_94 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_148 /= No_Token_Index then
+
+   Row_Pos_94 := Token_Pos_148;
+
+else
+   Row_Pos_94 := No_Token_Index;
+   goto Exit_Row_94_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_94_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_94 /= No_Token_Index then
+
+   Transform_Res_77 := Allocate_List_Kind_One (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_77,
+      Kind => lkt_List_Kind_One,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_92,
+      Token_End_Index   => (if Row_Pos_94 = Row_Pos_92
+                            then No_Token_Index
+                            else Row_Pos_94 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_94 /= No_Token_Index then
+        Or_Pos_25 := Row_Pos_94;
+        Or_Res_25 := Transform_Res_77;
+        goto Exit_Or_25;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_95 := Row_Pos_92;
+
+
+
+--  Start tok_code
+
+Token_Res_149 := Row_Pos_95;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_149));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Times)
+   then
+       Token_Pos_149 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_95 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_95,
+             Expected_Token_Id => lkt_Times,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_149 := Row_Pos_95 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_149 /= No_Token_Index then
+
+   Row_Pos_95 := Token_Pos_149;
+
+else
+   Row_Pos_95 := No_Token_Index;
+   goto Exit_Row_95_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_95_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_95 /= No_Token_Index then
+
+   Transform_Res_78 := Allocate_List_Kind_Zero (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_78,
+      Kind => lkt_List_Kind_Zero,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_92,
+      Token_End_Index   => (if Row_Pos_95 = Row_Pos_92
+                            then No_Token_Index
+                            else Row_Pos_95 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_95 /= No_Token_Index then
+        Or_Pos_25 := Row_Pos_95;
+        Or_Res_25 := Transform_Res_78;
+        goto Exit_Or_25;
+    end if;
+<<Exit_Or_25>>
+
+--  End or_code
+
+
+
+if Or_Pos_25 /= No_Token_Index then
+
+   Row_Pos_92 := Or_Pos_25;
+
+else
+   Row_Pos_92 := No_Token_Index;
+   goto Exit_Row_92_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_150 := Row_Pos_92;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_150));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_150 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_92 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_92,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_150 := Row_Pos_92 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_150 /= No_Token_Index then
+
+   Row_Pos_92 := Token_Pos_150;
+
+else
+   Row_Pos_92 := No_Token_Index;
+   goto Exit_Row_92_0;
+
+end if;
+
+
+--  Start or_code
+
+Or_Pos_26 := No_Token_Index;
+Or_Res_26 := No_Bare_LK_Node;
+    
+Defer_Res_168 :=
+   Grammar_Implicit_Pick_Transform_Parse_0 (Parser, Row_Pos_92);
+Defer_Pos_168 := Parser.Current_Pos;
+
+    if Defer_Pos_168 /= No_Token_Index then
+        Or_Pos_26 := Defer_Pos_168;
+        Or_Res_26 := Defer_Res_168;
+        goto Exit_Or_26;
+    end if;
+    
+Defer_Res_169 :=
+   Grammar_Expr_Or_Parse_0 (Parser, Row_Pos_92);
+Defer_Pos_169 := Parser.Current_Pos;
+
+    if Defer_Pos_169 /= No_Token_Index then
+        Or_Pos_26 := Defer_Pos_169;
+        Or_Res_26 := Defer_Res_169;
+        goto Exit_Or_26;
+    end if;
+<<Exit_Or_26>>
+
+--  End or_code
+
+
+
+if Or_Pos_26 /= No_Token_Index then
+
+   Row_Pos_92 := Or_Pos_26;
+
+else
+   Row_Pos_92 := No_Token_Index;
+   goto Exit_Row_92_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_96 := Row_Pos_92;
+
+
+
+--  Start tok_code
+
+Token_Res_151 := Row_Pos_96;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_151));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Comma)
+   then
+       Token_Pos_151 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_96 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_96,
+             Expected_Token_Id => lkt_Comma,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_151 := Row_Pos_96 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_151 /= No_Token_Index then
+
+   Row_Pos_96 := Token_Pos_151;
+
+else
+   Row_Pos_96 := No_Token_Index;
+   goto Exit_Row_97_0;
+
+end if;
+
+
+Defer_Res_170 :=
+   Grammar_Expr_Or_Parse_0 (Parser, Row_Pos_96);
+Defer_Pos_170 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_170 /= No_Token_Index then
+
+   Row_Pos_96 := Defer_Pos_170;
+
+else
+   Row_Pos_96 := No_Token_Index;
+   goto Exit_Row_97_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_97_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_96 = No_Token_Index then
+
+        Defer_Res_170 := No_Bare_LK_Node;
+
+
+    Row_Pos_96 := Row_Pos_92;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_96 /= No_Token_Index then
+
+   Row_Pos_92 := Row_Pos_96;
+
+else
+   Row_Pos_92 := No_Token_Index;
+   goto Exit_Row_92_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_152 := Row_Pos_92;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_152));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_152 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_92 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_92,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_152 := Row_Pos_92 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_152 /= No_Token_Index then
+
+   Row_Pos_92 := Token_Pos_152;
+
+else
+   Row_Pos_92 := No_Token_Index;
+   goto Exit_Row_92_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_92_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_92 /= No_Token_Index then
+
+   Transform_Res_79 := Allocate_Grammar_List (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_79,
+      Kind => lkt_Grammar_List,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_92 = Pos
+                            then No_Token_Index
+                            else Row_Pos_92 - 1));
+
+      Initialize_Fields_For_Grammar_List
+        (Self => Transform_Res_79, Grammar_List_F_List_Type => Or_Res_24, Grammar_List_F_Kind => Or_Res_25, Grammar_List_F_Expr => Or_Res_26, Grammar_List_F_Sep => Defer_Res_170);
+
+         if Or_Res_24 /= null and then Is_Incomplete (Or_Res_24) then
+            Transform_Res_79.Last_Attempted_Child := 0;
+         elsif Or_Res_24 /= null and then not Is_Ghost (Or_Res_24) then
+            Transform_Res_79.Last_Attempted_Child := -1;
+         end if;
+         if Or_Res_25 /= null and then Is_Incomplete (Or_Res_25) then
+            Transform_Res_79.Last_Attempted_Child := 0;
+         elsif Or_Res_25 /= null and then not Is_Ghost (Or_Res_25) then
+            Transform_Res_79.Last_Attempted_Child := -1;
+         end if;
+         if Or_Res_26 /= null and then Is_Incomplete (Or_Res_26) then
+            Transform_Res_79.Last_Attempted_Child := 0;
+         elsif Or_Res_26 /= null and then not Is_Ghost (Or_Res_26) then
+            Transform_Res_79.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_170 /= null and then Is_Incomplete (Defer_Res_170) then
+            Transform_Res_79.Last_Attempted_Child := 0;
+         elsif Defer_Res_170 /= null and then not Is_Ghost (Defer_Res_170) then
+            Transform_Res_79.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Grammar_List_Expr_Transform_Parse_2_Memo,
+      Row_Pos_92 /= No_Token_Index,
+      Transform_Res_79,
+      Pos,
+      Row_Pos_92);
+
+
+   Parser.Current_Pos := Row_Pos_92;
+
+   return Transform_Res_79;
+end Grammar_List_Expr_Transform_Parse_2;
+
+   
+
+
+function Token_Literal_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Token_Lit
+is
+   use Bare_Token_Lit_Memos;
+
+      Row_Pos_98 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_153 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_153 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_81 :
+            Bare_Token_Lit
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Token_Literal_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_81 := M.Instance;
+      return Transform_Res_81;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_81;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_98 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_153 := Row_Pos_98;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_153));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_String)
+   then
+       Token_Pos_153 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_98 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_98,
+             Expected_Token_Id => lkt_String,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_153 := Row_Pos_98 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_153 /= No_Token_Index then
+
+   Row_Pos_98 := Token_Pos_153;
+
+else
+   Row_Pos_98 := No_Token_Index;
+   goto Exit_Row_98_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_98_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_98 /= No_Token_Index then
+
+   Transform_Res_81 := Allocate_Token_Lit (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_81,
+      Kind => lkt_Token_Lit,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_98 = Pos
+                            then No_Token_Index
+                            else Row_Pos_98 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Token_Literal_Transform_Parse_0_Memo,
+      Row_Pos_98 /= No_Token_Index,
+      Transform_Res_81,
+      Pos,
+      Row_Pos_98);
+
+
+   Parser.Current_Pos := Row_Pos_98;
+
+   return Transform_Res_81;
+end Token_Literal_Transform_Parse_0;
+
+   
+
+
+function Token_No_Case_Literal_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Token_No_Case_Lit
+is
+   use Bare_Token_No_Case_Lit_Memos;
+
+      Row_Pos_99 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_154 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_154 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_155 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_155 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_172 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_172 :
+            Bare_Token_Lit
+               := No_Bare_LK_Node;
+      Token_Pos_156 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_156 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_82 :
+            Bare_Token_No_Case_Lit
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Token_No_Case_Literal_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_82 := M.Instance;
+      return Transform_Res_82;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_82;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_99 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_154 := Row_Pos_99;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_154));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Identifier)
+      or else T.Symbol /= Precomputed_Symbol
+        (Parser.TDH.Symbols, Precomputed_Symbol_No_Case)
+   then
+       Token_Pos_154 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_99 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_99,
+             Expected_Token_Id => lkt_Identifier,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_154 := Row_Pos_99 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_154 /= No_Token_Index then
+
+   Row_Pos_99 := Token_Pos_154;
+
+else
+   Row_Pos_99 := No_Token_Index;
+   goto Exit_Row_99_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_155 := Row_Pos_99;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_155));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_155 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_99 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_99,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_155 := Row_Pos_99 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_155 /= No_Token_Index then
+
+   Row_Pos_99 := Token_Pos_155;
+
+else
+   Row_Pos_99 := No_Token_Index;
+   goto Exit_Row_99_0;
+
+end if;
+
+
+Defer_Res_172 :=
+   Token_Literal_Transform_Parse_0 (Parser, Row_Pos_99);
+Defer_Pos_172 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_172 /= No_Token_Index then
+
+   Row_Pos_99 := Defer_Pos_172;
+
+else
+   Row_Pos_99 := No_Token_Index;
+   goto Exit_Row_99_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_156 := Row_Pos_99;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_156));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_156 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_99 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_99,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_156 := Row_Pos_99 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_156 /= No_Token_Index then
+
+   Row_Pos_99 := Token_Pos_156;
+
+else
+   Row_Pos_99 := No_Token_Index;
+   goto Exit_Row_99_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_99_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_99 /= No_Token_Index then
+
+   Transform_Res_82 := Allocate_Token_No_Case_Lit (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_82,
+      Kind => lkt_Token_No_Case_Lit,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_99 = Pos
+                            then No_Token_Index
+                            else Row_Pos_99 - 1));
+
+      Initialize_Fields_For_Token_No_Case_Lit
+        (Self => Transform_Res_82, Token_No_Case_Lit_F_Lit => Defer_Res_172);
+
+         if Defer_Res_172 /= null and then Is_Incomplete (Defer_Res_172) then
+            Transform_Res_82.Last_Attempted_Child := 0;
+         elsif Defer_Res_172 /= null and then not Is_Ghost (Defer_Res_172) then
+            Transform_Res_82.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Token_No_Case_Literal_Transform_Parse_0_Memo,
+      Row_Pos_99 /= No_Token_Index,
+      Transform_Res_82,
+      Pos,
+      Row_Pos_99);
+
+
+   Parser.Current_Pos := Row_Pos_99;
+
+   return Transform_Res_82;
+end Token_No_Case_Literal_Transform_Parse_0;
+
+   
+
+
+function Token_Pattern_Literal_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Token_Pattern_Lit
+is
+   use Bare_Token_Pattern_Lit_Memos;
+
+      Row_Pos_100 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_157 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_157 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_83 :
+            Bare_Token_Pattern_Lit
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Token_Pattern_Literal_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_83 := M.Instance;
+      return Transform_Res_83;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_83;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_100 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_157 := Row_Pos_100;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_157));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_P_String)
+   then
+       Token_Pos_157 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_100 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_100,
+             Expected_Token_Id => lkt_P_String,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_157 := Row_Pos_100 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_157 /= No_Token_Index then
+
+   Row_Pos_100 := Token_Pos_157;
+
+else
+   Row_Pos_100 := No_Token_Index;
+   goto Exit_Row_100_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_100_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_100 /= No_Token_Index then
+
+   Transform_Res_83 := Allocate_Token_Pattern_Lit (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_83,
+      Kind => lkt_Token_Pattern_Lit,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_100 = Pos
+                            then No_Token_Index
+                            else Row_Pos_100 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Token_Pattern_Literal_Transform_Parse_0_Memo,
+      Row_Pos_100 /= No_Token_Index,
+      Transform_Res_83,
+      Pos,
+      Row_Pos_100);
+
+
+   Parser.Current_Pos := Row_Pos_100;
+
+   return Transform_Res_83;
+end Token_Pattern_Literal_Transform_Parse_0;
+
+   
+
+
+function Grammar_Cut_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Cut
+is
+   use Bare_Grammar_Cut_Memos;
+
+      Row_Pos_101 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_158 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_158 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_84 :
+            Bare_Grammar_Cut
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Grammar_Cut_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_84 := M.Instance;
+      return Transform_Res_84;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_84;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_101 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_158 := Row_Pos_101;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_158));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Div)
+   then
+       Token_Pos_158 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_101 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_101,
+             Expected_Token_Id => lkt_Div,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_158 := Row_Pos_101 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_158 /= No_Token_Index then
+
+   Row_Pos_101 := Token_Pos_158;
+
+else
+   Row_Pos_101 := No_Token_Index;
+   goto Exit_Row_101_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_101_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_101 /= No_Token_Index then
+
+   Transform_Res_84 := Allocate_Grammar_Cut (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_84,
+      Kind => lkt_Grammar_Cut,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_101 = Pos
+                            then No_Token_Index
+                            else Row_Pos_101 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Grammar_Cut_Transform_Parse_0_Memo,
+      Row_Pos_101 /= No_Token_Index,
+      Transform_Res_84,
+      Pos,
+      Row_Pos_101);
+
+
+   Parser.Current_Pos := Row_Pos_101;
+
+   return Transform_Res_84;
+end Grammar_Cut_Transform_Parse_0;
+
+   
+
+
+function Grammar_Skip_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Skip
+is
+   use Bare_Grammar_Skip_Memos;
+
+      Row_Pos_102 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_159 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_159 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_160 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_160 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_173 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_173 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Token_Pos_161 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_161 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_85 :
+            Bare_Grammar_Skip
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Grammar_Skip_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_85 := M.Instance;
+      return Transform_Res_85;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_85;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_102 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_159 := Row_Pos_102;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_159));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Identifier)
+      or else T.Symbol /= Precomputed_Symbol
+        (Parser.TDH.Symbols, Precomputed_Symbol_Skip)
+   then
+       Token_Pos_159 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_102 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_102,
+             Expected_Token_Id => lkt_Identifier,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_159 := Row_Pos_102 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_159 /= No_Token_Index then
+
+   Row_Pos_102 := Token_Pos_159;
+
+else
+   Row_Pos_102 := No_Token_Index;
+   goto Exit_Row_102_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_160 := Row_Pos_102;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_160));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_160 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_102 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_102,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_160 := Row_Pos_102 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_160 /= No_Token_Index then
+
+   Row_Pos_102 := Token_Pos_160;
+
+else
+   Row_Pos_102 := No_Token_Index;
+   goto Exit_Row_102_0;
+
+end if;
+
+
+Defer_Res_173 :=
+   Type_Ref_Or_Parse_0 (Parser, Row_Pos_102);
+Defer_Pos_173 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_173 /= No_Token_Index then
+
+   Row_Pos_102 := Defer_Pos_173;
+
+else
+   Row_Pos_102 := No_Token_Index;
+   goto Exit_Row_102_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_161 := Row_Pos_102;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_161));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_161 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_102 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_102,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_161 := Row_Pos_102 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_161 /= No_Token_Index then
+
+   Row_Pos_102 := Token_Pos_161;
+
+else
+   Row_Pos_102 := No_Token_Index;
+   goto Exit_Row_102_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_102_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_102 /= No_Token_Index then
+
+   Transform_Res_85 := Allocate_Grammar_Skip (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_85,
+      Kind => lkt_Grammar_Skip,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_102 = Pos
+                            then No_Token_Index
+                            else Row_Pos_102 - 1));
+
+      Initialize_Fields_For_Grammar_Skip
+        (Self => Transform_Res_85, Grammar_Skip_F_Name => Defer_Res_173);
+
+         if Defer_Res_173 /= null and then Is_Incomplete (Defer_Res_173) then
+            Transform_Res_85.Last_Attempted_Child := 0;
+         elsif Defer_Res_173 /= null and then not Is_Ghost (Defer_Res_173) then
+            Transform_Res_85.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Grammar_Skip_Transform_Parse_0_Memo,
+      Row_Pos_102 /= No_Token_Index,
+      Transform_Res_85,
+      Pos,
+      Row_Pos_102);
+
+
+   Parser.Current_Pos := Row_Pos_102;
+
+   return Transform_Res_85;
+end Grammar_Skip_Transform_Parse_0;
+
+   
+
+
+function Grammar_Null_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Null
+is
+   use Bare_Grammar_Null_Memos;
+
+      Row_Pos_103 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_162 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_162 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_163 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_163 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_174 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_174 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Token_Pos_164 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_164 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_86 :
+            Bare_Grammar_Null
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Grammar_Null_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_86 := M.Instance;
+      return Transform_Res_86;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_86;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_103 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_162 := Row_Pos_103;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_162));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Null_Kw)
+   then
+       Token_Pos_162 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_103 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_103,
+             Expected_Token_Id => lkt_Null_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_162 := Row_Pos_103 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_162 /= No_Token_Index then
+
+   Row_Pos_103 := Token_Pos_162;
+
+else
+   Row_Pos_103 := No_Token_Index;
+   goto Exit_Row_103_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_163 := Row_Pos_103;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_163));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_163 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_103 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_103,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_163 := Row_Pos_103 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_163 /= No_Token_Index then
+
+   Row_Pos_103 := Token_Pos_163;
+
+else
+   Row_Pos_103 := No_Token_Index;
+   goto Exit_Row_103_0;
+
+end if;
+
+
+Defer_Res_174 :=
+   Type_Ref_Or_Parse_0 (Parser, Row_Pos_103);
+Defer_Pos_174 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_174 /= No_Token_Index then
+
+   Row_Pos_103 := Defer_Pos_174;
+
+else
+   Row_Pos_103 := No_Token_Index;
+   goto Exit_Row_103_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_164 := Row_Pos_103;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_164));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_164 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_103 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_103,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_164 := Row_Pos_103 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_164 /= No_Token_Index then
+
+   Row_Pos_103 := Token_Pos_164;
+
+else
+   Row_Pos_103 := No_Token_Index;
+   goto Exit_Row_103_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_103_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_103 /= No_Token_Index then
+
+   Transform_Res_86 := Allocate_Grammar_Null (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_86,
+      Kind => lkt_Grammar_Null,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_103 = Pos
+                            then No_Token_Index
+                            else Row_Pos_103 - 1));
+
+      Initialize_Fields_For_Grammar_Null
+        (Self => Transform_Res_86, Grammar_Null_F_Name => Defer_Res_174);
+
+         if Defer_Res_174 /= null and then Is_Incomplete (Defer_Res_174) then
+            Transform_Res_86.Last_Attempted_Child := 0;
+         elsif Defer_Res_174 /= null and then not Is_Ghost (Defer_Res_174) then
+            Transform_Res_86.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Grammar_Null_Transform_Parse_0_Memo,
+      Row_Pos_103 /= No_Token_Index,
+      Transform_Res_86,
+      Pos,
+      Row_Pos_103);
+
+
+   Parser.Current_Pos := Row_Pos_103;
+
+   return Transform_Res_86;
+end Grammar_Null_Transform_Parse_0;
+
+   
+
+
+function Grammar_Token_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Token_Ref
+is
+   use Bare_Token_Ref_Memos;
+
+      Row_Pos_104 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_165 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_165 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_175 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_175 :
+            Bare_Ref_Id
+               := No_Bare_LK_Node;
+      Row_Pos_105 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_166 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_166 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_176 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_176 :
+            Bare_Token_Lit
+               := No_Bare_LK_Node;
+      Token_Pos_167 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_167 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_87 :
+            Bare_Token_Ref
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Grammar_Token_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_87 := M.Instance;
+      return Transform_Res_87;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_87;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_104 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_165 := Row_Pos_104;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_165));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_At)
+   then
+       Token_Pos_165 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_104 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_104,
+             Expected_Token_Id => lkt_At,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_165 := Row_Pos_104 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_165 /= No_Token_Index then
+
+   Row_Pos_104 := Token_Pos_165;
+
+else
+   Row_Pos_104 := No_Token_Index;
+   goto Exit_Row_104_0;
+
+end if;
+
+
+Defer_Res_175 :=
+   Ref_Id_Transform_Parse_0 (Parser, Row_Pos_104);
+Defer_Pos_175 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_175 /= No_Token_Index then
+
+   Row_Pos_104 := Defer_Pos_175;
+
+else
+   Row_Pos_104 := No_Token_Index;
+   goto Exit_Row_104_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_105 := Row_Pos_104;
+
+
+
+--  Start tok_code
+
+Token_Res_166 := Row_Pos_105;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_166));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_166 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_105 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_105,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_166 := Row_Pos_105 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_166 /= No_Token_Index then
+
+   Row_Pos_105 := Token_Pos_166;
+
+else
+   Row_Pos_105 := No_Token_Index;
+   goto Exit_Row_105_0;
+
+end if;
+
+
+Defer_Res_176 :=
+   Token_Literal_Transform_Parse_0 (Parser, Row_Pos_105);
+Defer_Pos_176 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_176 /= No_Token_Index then
+
+   Row_Pos_105 := Defer_Pos_176;
+
+else
+   Row_Pos_105 := No_Token_Index;
+   goto Exit_Row_105_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_167 := Row_Pos_105;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_167));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_167 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_105 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_105,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_167 := Row_Pos_105 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_167 /= No_Token_Index then
+
+   Row_Pos_105 := Token_Pos_167;
+
+else
+   Row_Pos_105 := No_Token_Index;
+   goto Exit_Row_105_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_105_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_105 = No_Token_Index then
+
+        Defer_Res_176 := No_Bare_LK_Node;
+
+
+    Row_Pos_105 := Row_Pos_104;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_105 /= No_Token_Index then
+
+   Row_Pos_104 := Row_Pos_105;
+
+else
+   Row_Pos_104 := No_Token_Index;
+   goto Exit_Row_104_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_104_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_104 /= No_Token_Index then
+
+   Transform_Res_87 := Allocate_Token_Ref (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_87,
+      Kind => lkt_Token_Ref,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_104 = Pos
+                            then No_Token_Index
+                            else Row_Pos_104 - 1));
+
+      Initialize_Fields_For_Token_Ref
+        (Self => Transform_Res_87, Token_Ref_F_Token_Name => Defer_Res_175, Token_Ref_F_Expr => Defer_Res_176);
+
+         if Defer_Res_175 /= null and then Is_Incomplete (Defer_Res_175) then
+            Transform_Res_87.Last_Attempted_Child := 0;
+         elsif Defer_Res_175 /= null and then not Is_Ghost (Defer_Res_175) then
+            Transform_Res_87.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_176 /= null and then Is_Incomplete (Defer_Res_176) then
+            Transform_Res_87.Last_Attempted_Child := 0;
+         elsif Defer_Res_176 /= null and then not Is_Ghost (Defer_Res_176) then
+            Transform_Res_87.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Grammar_Token_Transform_Parse_0_Memo,
+      Row_Pos_104 /= No_Token_Index,
+      Transform_Res_87,
+      Pos,
+      Row_Pos_104);
+
+
+   Parser.Current_Pos := Row_Pos_104;
+
+   return Transform_Res_87;
+end Grammar_Token_Transform_Parse_0;
+
+   
+
+
+function Parse_Node_Expr_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Parse_Node_Expr
+is
+   use Bare_Parse_Node_Expr_Memos;
+
+      Row_Pos_106 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_177 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_177 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Token_Pos_168 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_168 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_24 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_24 :
+            Free_Parse_List;
+      Defer_Pos_178 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_178 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      List_Pos_24 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_24 :
+            Bare_Grammar_Expr_List
+               := No_Bare_LK_Node;
+      Token_Pos_169 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_169 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_88 :
+            Bare_Parse_Node_Expr
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Parse_Node_Expr_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_88 := M.Instance;
+      return Transform_Res_88;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_88;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_106 := Pos;
+
+
+
+Defer_Res_177 :=
+   Type_Ref_Or_Parse_0 (Parser, Row_Pos_106);
+Defer_Pos_177 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_177 /= No_Token_Index then
+
+   Row_Pos_106 := Defer_Pos_177;
+
+else
+   Row_Pos_106 := No_Token_Index;
+   goto Exit_Row_106_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_168 := Row_Pos_106;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_168));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_168 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_106 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_106,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_168 := Row_Pos_106 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_168 /= No_Token_Index then
+
+   Row_Pos_106 := Token_Pos_168;
+
+else
+   Row_Pos_106 := No_Token_Index;
+   goto Exit_Row_106_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_24 := Row_Pos_106;
+
+
+
+Lst_Cpos_24 := Row_Pos_106;
+Tmp_List_24 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_178 :=
+   Grammar_Expr_Or_Parse_0 (Parser, Lst_Cpos_24);
+Defer_Pos_178 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_178 = No_Token_Index;
+
+   List_Pos_24 := Defer_Pos_178;
+   Lst_Cpos_24 := List_Pos_24;
+
+   Tmp_List_24.Nodes.Append (Defer_Res_178);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_24.Nodes.Length;
+begin
+   List_Res_24 :=
+      Allocate_Grammar_Expr_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_106;
+      Token_End := (if Lst_Cpos_24 = Row_Pos_106
+                    then Row_Pos_106
+                    else Lst_Cpos_24 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_106, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_24,
+      Kind              => lkt_Grammar_Expr_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_24,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_24.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_24.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_24);
+
+--  End list_code
+
+
+
+if List_Pos_24 /= No_Token_Index then
+
+   Row_Pos_106 := List_Pos_24;
+
+else
+   Row_Pos_106 := No_Token_Index;
+   goto Exit_Row_106_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_169 := Row_Pos_106;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_169));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_169 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_106 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_106,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_169 := Row_Pos_106 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_169 /= No_Token_Index then
+
+   Row_Pos_106 := Token_Pos_169;
+
+else
+   Row_Pos_106 := No_Token_Index;
+   goto Exit_Row_106_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_106_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_106 /= No_Token_Index then
+
+   Transform_Res_88 := Allocate_Parse_Node_Expr (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_88,
+      Kind => lkt_Parse_Node_Expr,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_106 = Pos
+                            then No_Token_Index
+                            else Row_Pos_106 - 1));
+
+      Initialize_Fields_For_Parse_Node_Expr
+        (Self => Transform_Res_88, Parse_Node_Expr_F_Node_Name => Defer_Res_177, Parse_Node_Expr_F_Sub_Exprs => List_Res_24);
+
+         if Defer_Res_177 /= null and then Is_Incomplete (Defer_Res_177) then
+            Transform_Res_88.Last_Attempted_Child := 0;
+         elsif Defer_Res_177 /= null and then not Is_Ghost (Defer_Res_177) then
+            Transform_Res_88.Last_Attempted_Child := -1;
+         end if;
+         if List_Res_24 /= null and then Is_Incomplete (List_Res_24) then
+            Transform_Res_88.Last_Attempted_Child := 0;
+         elsif List_Res_24 /= null and then not Is_Ghost (List_Res_24) then
+            Transform_Res_88.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Parse_Node_Expr_Transform_Parse_0_Memo,
+      Row_Pos_106 /= No_Token_Index,
+      Transform_Res_88,
+      Pos,
+      Row_Pos_106);
+
+
+   Parser.Current_Pos := Row_Pos_106;
+
+   return Transform_Res_88;
+end Parse_Node_Expr_Transform_Parse_0;
+
+   
+
+
+function Grammar_Opt_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Expr
+is
+   use Bare_Grammar_Expr_Memos;
+
+      Row_Pos_107 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_170 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_170 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_179 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_179 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_89 :
+            Bare_Grammar_Opt
+               := No_Bare_LK_Node;
+      Row_Pos_108 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_171 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_171 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_172 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_172 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_25 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_25 :
+            Free_Parse_List;
+      Defer_Pos_180 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_180 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      List_Pos_25 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_25 :
+            Bare_Grammar_Expr_List
+               := No_Bare_LK_Node;
+      Token_Pos_173 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_173 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_90 :
+            Bare_Grammar_Opt_Group
+               := No_Bare_LK_Node;
+      Or_Pos_27 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_27 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Grammar_Opt_Or_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_27 := M.Instance;
+      return Or_Res_27;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_27;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_27 := No_Token_Index;
+Or_Res_27 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_107 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_170 := Row_Pos_107;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_170));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Int_Mark)
+   then
+       Token_Pos_170 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_107 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_107,
+             Expected_Token_Id => lkt_Int_Mark,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_170 := Row_Pos_107 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_170 /= No_Token_Index then
+
+   Row_Pos_107 := Token_Pos_170;
+
+else
+   Row_Pos_107 := No_Token_Index;
+   goto Exit_Row_107_0;
+
+end if;
+
+
+Defer_Res_179 :=
+   Grammar_Expr_Or_Parse_0 (Parser, Row_Pos_107);
+Defer_Pos_179 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_179 /= No_Token_Index then
+
+   Row_Pos_107 := Defer_Pos_179;
+
+else
+   Row_Pos_107 := No_Token_Index;
+   goto Exit_Row_107_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_107_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_107 /= No_Token_Index then
+
+   Transform_Res_89 := Allocate_Grammar_Opt (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_89,
+      Kind => lkt_Grammar_Opt,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_107 = Pos
+                            then No_Token_Index
+                            else Row_Pos_107 - 1));
+
+      Initialize_Fields_For_Grammar_Opt
+        (Self => Transform_Res_89, Grammar_Opt_F_Expr => Defer_Res_179);
+
+         if Defer_Res_179 /= null and then Is_Incomplete (Defer_Res_179) then
+            Transform_Res_89.Last_Attempted_Child := 0;
+         elsif Defer_Res_179 /= null and then not Is_Ghost (Defer_Res_179) then
+            Transform_Res_89.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_107 /= No_Token_Index then
+        Or_Pos_27 := Row_Pos_107;
+        Or_Res_27 := Transform_Res_89;
+        goto Exit_Or_27;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_108 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_171 := Row_Pos_108;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_171));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Int_Mark)
+   then
+       Token_Pos_171 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_108 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_108,
+             Expected_Token_Id => lkt_Int_Mark,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_171 := Row_Pos_108 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_171 /= No_Token_Index then
+
+   Row_Pos_108 := Token_Pos_171;
+
+else
+   Row_Pos_108 := No_Token_Index;
+   goto Exit_Row_108_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_172 := Row_Pos_108;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_172));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_172 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_108 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_108,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_172 := Row_Pos_108 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_172 /= No_Token_Index then
+
+   Row_Pos_108 := Token_Pos_172;
+
+else
+   Row_Pos_108 := No_Token_Index;
+   goto Exit_Row_108_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_25 := Row_Pos_108;
+
+
+
+Lst_Cpos_25 := Row_Pos_108;
+Tmp_List_25 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_180 :=
+   Grammar_Expr_Or_Parse_0 (Parser, Lst_Cpos_25);
+Defer_Pos_180 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_180 = No_Token_Index;
+
+   List_Pos_25 := Defer_Pos_180;
+   Lst_Cpos_25 := List_Pos_25;
+
+   Tmp_List_25.Nodes.Append (Defer_Res_180);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_25.Nodes.Length;
+begin
+   List_Res_25 :=
+      Allocate_Grammar_Expr_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_108;
+      Token_End := (if Lst_Cpos_25 = Row_Pos_108
+                    then Row_Pos_108
+                    else Lst_Cpos_25 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_108, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_25,
+      Kind              => lkt_Grammar_Expr_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_25,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_25.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_25.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_25);
+
+--  End list_code
+
+
+
+if List_Pos_25 /= No_Token_Index then
+
+   Row_Pos_108 := List_Pos_25;
+
+else
+   Row_Pos_108 := No_Token_Index;
+   goto Exit_Row_108_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_173 := Row_Pos_108;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_173));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_173 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_108 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_108,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_173 := Row_Pos_108 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_173 /= No_Token_Index then
+
+   Row_Pos_108 := Token_Pos_173;
+
+else
+   Row_Pos_108 := No_Token_Index;
+   goto Exit_Row_108_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_108_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_108 /= No_Token_Index then
+
+   Transform_Res_90 := Allocate_Grammar_Opt_Group (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_90,
+      Kind => lkt_Grammar_Opt_Group,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_108 = Pos
+                            then No_Token_Index
+                            else Row_Pos_108 - 1));
+
+      Initialize_Fields_For_Grammar_Opt_Group
+        (Self => Transform_Res_90, Grammar_Opt_Group_F_Expr => List_Res_25);
+
+         if List_Res_25 /= null and then Is_Incomplete (List_Res_25) then
+            Transform_Res_90.Last_Attempted_Child := 0;
+         elsif List_Res_25 /= null and then not Is_Ghost (List_Res_25) then
+            Transform_Res_90.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_108 /= No_Token_Index then
+        Or_Pos_27 := Row_Pos_108;
+        Or_Res_27 := Transform_Res_90;
+        goto Exit_Or_27;
+    end if;
+<<Exit_Or_27>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Grammar_Opt_Or_Parse_0_Memo,
+      Or_Pos_27 /= No_Token_Index,
+      Or_Res_27,
+      Pos,
+      Or_Pos_27);
+
+
+   Parser.Current_Pos := Or_Pos_27;
+
+   return Or_Res_27;
+end Grammar_Opt_Or_Parse_0;
+
+   
+
+
+function Grammar_Or_Expr_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Or_Expr
+is
+   use Bare_Grammar_Or_Expr_Memos;
+
+      Row_Pos_109 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_174 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_174 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_175 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_175 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_176 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_176 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_26 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_26 :
+            Free_Parse_List;
+      Lst_Cpos_27 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_27 :
+            Free_Parse_List;
+      Defer_Pos_181 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_181 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      List_Pos_26 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_26 :
+            Bare_Grammar_Expr_List
+               := No_Bare_LK_Node;
+      Token_Pos_177 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_177 :
+            Token_Index
+               := No_Token_Index;
+      List_Pos_27 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_27 :
+            Bare_Grammar_Expr_List_List
+               := No_Bare_LK_Node;
+      Token_Pos_178 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_178 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_91 :
+            Bare_Grammar_Or_Expr
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Grammar_Or_Expr_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_91 := M.Instance;
+      return Transform_Res_91;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_91;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_109 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_174 := Row_Pos_109;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_174));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Or_Kw)
+   then
+       Token_Pos_174 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_109 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_109,
+             Expected_Token_Id => lkt_Or_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_174 := Row_Pos_109 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_174 /= No_Token_Index then
+
+   Row_Pos_109 := Token_Pos_174;
+
+else
+   Row_Pos_109 := No_Token_Index;
+   goto Exit_Row_109_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_175 := Row_Pos_109;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_175));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_175 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_109 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_109,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_175 := Row_Pos_109 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_175 /= No_Token_Index then
+
+   Row_Pos_109 := Token_Pos_175;
+
+else
+   Row_Pos_109 := No_Token_Index;
+   goto Exit_Row_109_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start tok_code
+
+Token_Res_176 := Row_Pos_109;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_176));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Pipe)
+   then
+       Token_Pos_176 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_109 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_109,
+             Expected_Token_Id => lkt_Pipe,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_176 := Row_Pos_109 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+if Token_Pos_176 = No_Token_Index then
+
+        Token_Res_176 := No_Token_Index;
+
+
+    Token_Pos_176 := Row_Pos_109;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Token_Pos_176 /= No_Token_Index then
+
+   Row_Pos_109 := Token_Pos_176;
+
+else
+   Row_Pos_109 := No_Token_Index;
+   goto Exit_Row_109_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_27 := No_Token_Index;
+
+
+
+Lst_Cpos_26 := Row_Pos_109;
+Tmp_List_26 := Get_Parse_List (Parser);
+
+loop
+   
+--  Start list_code
+
+    List_Pos_26 := No_Token_Index;
+
+
+
+Lst_Cpos_27 := Lst_Cpos_26;
+Tmp_List_27 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_181 :=
+   Grammar_Expr_Or_Parse_0 (Parser, Lst_Cpos_27);
+Defer_Pos_181 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_181 = No_Token_Index;
+
+   List_Pos_26 := Defer_Pos_181;
+   Lst_Cpos_27 := List_Pos_26;
+
+   Tmp_List_27.Nodes.Append (Defer_Res_181);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_27.Nodes.Length;
+begin
+   List_Res_26 :=
+      Allocate_Grammar_Expr_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Lst_Cpos_26;
+      Token_End := (if Lst_Cpos_27 = Lst_Cpos_26
+                    then Lst_Cpos_26
+                    else Lst_Cpos_27 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Lst_Cpos_26, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_26,
+      Kind              => lkt_Grammar_Expr_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_26,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_27.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_26.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_27);
+
+--  End list_code
+
+
+   exit when List_Pos_26 = No_Token_Index;
+
+   List_Pos_27 := List_Pos_26;
+   Lst_Cpos_26 := List_Pos_27;
+
+   Tmp_List_26.Nodes.Append (List_Res_26);
+
+      
+--  Start tok_code
+
+Token_Res_177 := Lst_Cpos_26;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_177));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Pipe)
+   then
+       Token_Pos_177 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Lst_Cpos_26 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Lst_Cpos_26,
+             Expected_Token_Id => lkt_Pipe,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_177 := Lst_Cpos_26 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+      if Token_Pos_177 /= No_Token_Index then
+          Lst_Cpos_26 := Token_Pos_177;
+      else
+         exit;
+      end if;
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_26.Nodes.Length;
+begin
+   List_Res_27 :=
+      Allocate_Grammar_Expr_List_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_109;
+      Token_End := (if Lst_Cpos_26 = Row_Pos_109
+                    then Row_Pos_109
+                    else Lst_Cpos_26 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_109, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_27,
+      Kind              => lkt_Grammar_Expr_List_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_27,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_26.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_27.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_26);
+
+--  End list_code
+
+
+
+if List_Pos_27 /= No_Token_Index then
+
+   Row_Pos_109 := List_Pos_27;
+
+else
+   Row_Pos_109 := No_Token_Index;
+   goto Exit_Row_109_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_178 := Row_Pos_109;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_178));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_178 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_109 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_109,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_178 := Row_Pos_109 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_178 /= No_Token_Index then
+
+   Row_Pos_109 := Token_Pos_178;
+
+else
+   Row_Pos_109 := No_Token_Index;
+   goto Exit_Row_109_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_109_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_109 /= No_Token_Index then
+
+   Transform_Res_91 := Allocate_Grammar_Or_Expr (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_91,
+      Kind => lkt_Grammar_Or_Expr,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_109 = Pos
+                            then No_Token_Index
+                            else Row_Pos_109 - 1));
+
+      Initialize_Fields_For_Grammar_Or_Expr
+        (Self => Transform_Res_91, Grammar_Or_Expr_F_Sub_Exprs => List_Res_27);
+
+         if List_Res_27 /= null and then Is_Incomplete (List_Res_27) then
+            Transform_Res_91.Last_Attempted_Child := 0;
+         elsif List_Res_27 /= null and then not Is_Ghost (List_Res_27) then
+            Transform_Res_91.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Grammar_Or_Expr_Transform_Parse_0_Memo,
+      Row_Pos_109 /= No_Token_Index,
+      Transform_Res_91,
+      Pos,
+      Row_Pos_109);
+
+
+   Parser.Current_Pos := Row_Pos_109;
+
+   return Transform_Res_91;
+end Grammar_Or_Expr_Transform_Parse_0;
+
+   
+
+
+function Grammar_Rule_Ref_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Rule_Ref
+is
+   use Bare_Grammar_Rule_Ref_Memos;
+
+      Row_Pos_110 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_182 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_182 :
+            Bare_Ref_Id
+               := No_Bare_LK_Node;
+      Transform_Res_92 :
+            Bare_Grammar_Rule_Ref
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Grammar_Rule_Ref_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_92 := M.Instance;
+      return Transform_Res_92;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_92;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_110 := Pos;
+
+
+
+Defer_Res_182 :=
+   Ref_Id_Transform_Parse_0 (Parser, Row_Pos_110);
+Defer_Pos_182 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_182 /= No_Token_Index then
+
+   Row_Pos_110 := Defer_Pos_182;
+
+else
+   Row_Pos_110 := No_Token_Index;
+   goto Exit_Row_110_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_110_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_110 /= No_Token_Index then
+
+   Transform_Res_92 := Allocate_Grammar_Rule_Ref (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_92,
+      Kind => lkt_Grammar_Rule_Ref,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_110 = Pos
+                            then No_Token_Index
+                            else Row_Pos_110 - 1));
+
+      Initialize_Fields_For_Grammar_Rule_Ref
+        (Self => Transform_Res_92, Grammar_Rule_Ref_F_Node_Name => Defer_Res_182);
+
+         if Defer_Res_182 /= null and then Is_Incomplete (Defer_Res_182) then
+            Transform_Res_92.Last_Attempted_Child := 0;
+         elsif Defer_Res_182 /= null and then not Is_Ghost (Defer_Res_182) then
+            Transform_Res_92.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Grammar_Rule_Ref_Transform_Parse_0_Memo,
+      Row_Pos_110 /= No_Token_Index,
+      Transform_Res_92,
+      Pos,
+      Row_Pos_110);
+
+
+   Parser.Current_Pos := Row_Pos_110;
+
+   return Transform_Res_92;
+end Grammar_Rule_Ref_Transform_Parse_0;
+
+   
+
+
+function Grammar_Discard_Expr_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Discard
+is
+   use Bare_Grammar_Discard_Memos;
+
+      Row_Pos_111 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_179 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_179 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_180 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_180 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_183 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_183 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_181 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_181 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_93 :
+            Bare_Grammar_Discard
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Grammar_Discard_Expr_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_93 := M.Instance;
+      return Transform_Res_93;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_93;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_111 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_179 := Row_Pos_111;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_179));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Discard_Kw)
+   then
+       Token_Pos_179 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_111 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_111,
+             Expected_Token_Id => lkt_Discard_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_179 := Row_Pos_111 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_179 /= No_Token_Index then
+
+   Row_Pos_111 := Token_Pos_179;
+
+else
+   Row_Pos_111 := No_Token_Index;
+   goto Exit_Row_111_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_180 := Row_Pos_111;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_180));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_180 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_111 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_111,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_180 := Row_Pos_111 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_180 /= No_Token_Index then
+
+   Row_Pos_111 := Token_Pos_180;
+
+else
+   Row_Pos_111 := No_Token_Index;
+   goto Exit_Row_111_0;
+
+end if;
+
+
+Defer_Res_183 :=
+   Grammar_Expr_Or_Parse_0 (Parser, Row_Pos_111);
+Defer_Pos_183 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_183 /= No_Token_Index then
+
+   Row_Pos_111 := Defer_Pos_183;
+
+else
+   Row_Pos_111 := No_Token_Index;
+   goto Exit_Row_111_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_181 := Row_Pos_111;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_181));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_181 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_111 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_111,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_181 := Row_Pos_111 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_181 /= No_Token_Index then
+
+   Row_Pos_111 := Token_Pos_181;
+
+else
+   Row_Pos_111 := No_Token_Index;
+   goto Exit_Row_111_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_111_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_111 /= No_Token_Index then
+
+   Transform_Res_93 := Allocate_Grammar_Discard (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_93,
+      Kind => lkt_Grammar_Discard,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_111 = Pos
+                            then No_Token_Index
+                            else Row_Pos_111 - 1));
+
+      Initialize_Fields_For_Grammar_Discard
+        (Self => Transform_Res_93, Grammar_Discard_F_Expr => Defer_Res_183);
+
+         if Defer_Res_183 /= null and then Is_Incomplete (Defer_Res_183) then
+            Transform_Res_93.Last_Attempted_Child := 0;
+         elsif Defer_Res_183 /= null and then not Is_Ghost (Defer_Res_183) then
+            Transform_Res_93.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Grammar_Discard_Expr_Transform_Parse_0_Memo,
+      Row_Pos_111 /= No_Token_Index,
+      Transform_Res_93,
+      Pos,
+      Row_Pos_111);
+
+
+   Parser.Current_Pos := Row_Pos_111;
+
+   return Transform_Res_93;
+end Grammar_Discard_Expr_Transform_Parse_0;
+
+   
+
+
+function Grammar_Primary_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Expr
+is
+   use Bare_Grammar_Expr_Memos;
+
+      Defer_Pos_147 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_147 :
+            Bare_Grammar_Pick
+               := No_Bare_LK_Node;
+      Defer_Pos_148 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_148 :
+            Bare_Grammar_List
+               := No_Bare_LK_Node;
+      Defer_Pos_149 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_149 :
+            Bare_Token_Lit
+               := No_Bare_LK_Node;
+      Defer_Pos_150 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_150 :
+            Bare_Token_No_Case_Lit
+               := No_Bare_LK_Node;
+      Defer_Pos_151 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_151 :
+            Bare_Token_Pattern_Lit
+               := No_Bare_LK_Node;
+      Defer_Pos_152 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_152 :
+            Bare_Grammar_Cut
+               := No_Bare_LK_Node;
+      Defer_Pos_153 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_153 :
+            Bare_Grammar_Skip
+               := No_Bare_LK_Node;
+      Defer_Pos_154 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_154 :
+            Bare_Grammar_Null
+               := No_Bare_LK_Node;
+      Defer_Pos_155 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_155 :
+            Bare_Token_Ref
+               := No_Bare_LK_Node;
+      Defer_Pos_156 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_156 :
+            Bare_Parse_Node_Expr
+               := No_Bare_LK_Node;
+      Defer_Pos_157 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_157 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      Defer_Pos_158 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_158 :
+            Bare_Grammar_Or_Expr
+               := No_Bare_LK_Node;
+      Defer_Pos_159 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_159 :
+            Bare_Grammar_Rule_Ref
+               := No_Bare_LK_Node;
+      Defer_Pos_160 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_160 :
+            Bare_Grammar_Discard
+               := No_Bare_LK_Node;
+      Or_Pos_22 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_22 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Grammar_Primary_Or_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_22 := M.Instance;
+      return Or_Res_22;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_22;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_22 := No_Token_Index;
+Or_Res_22 := No_Bare_LK_Node;
+    
+Defer_Res_147 :=
+   Grammar_Pick_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_147 := Parser.Current_Pos;
+
+    if Defer_Pos_147 /= No_Token_Index then
+        Or_Pos_22 := Defer_Pos_147;
+        Or_Res_22 := Defer_Res_147;
+        goto Exit_Or_22;
+    end if;
+    
+Defer_Res_148 :=
+   Grammar_List_Expr_Transform_Parse_2 (Parser, Pos);
+Defer_Pos_148 := Parser.Current_Pos;
+
+    if Defer_Pos_148 /= No_Token_Index then
+        Or_Pos_22 := Defer_Pos_148;
+        Or_Res_22 := Defer_Res_148;
+        goto Exit_Or_22;
+    end if;
+    
+Defer_Res_149 :=
+   Token_Literal_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_149 := Parser.Current_Pos;
+
+    if Defer_Pos_149 /= No_Token_Index then
+        Or_Pos_22 := Defer_Pos_149;
+        Or_Res_22 := Defer_Res_149;
+        goto Exit_Or_22;
+    end if;
+    
+Defer_Res_150 :=
+   Token_No_Case_Literal_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_150 := Parser.Current_Pos;
+
+    if Defer_Pos_150 /= No_Token_Index then
+        Or_Pos_22 := Defer_Pos_150;
+        Or_Res_22 := Defer_Res_150;
+        goto Exit_Or_22;
+    end if;
+    
+Defer_Res_151 :=
+   Token_Pattern_Literal_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_151 := Parser.Current_Pos;
+
+    if Defer_Pos_151 /= No_Token_Index then
+        Or_Pos_22 := Defer_Pos_151;
+        Or_Res_22 := Defer_Res_151;
+        goto Exit_Or_22;
+    end if;
+    
+Defer_Res_152 :=
+   Grammar_Cut_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_152 := Parser.Current_Pos;
+
+    if Defer_Pos_152 /= No_Token_Index then
+        Or_Pos_22 := Defer_Pos_152;
+        Or_Res_22 := Defer_Res_152;
+        goto Exit_Or_22;
+    end if;
+    
+Defer_Res_153 :=
+   Grammar_Skip_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_153 := Parser.Current_Pos;
+
+    if Defer_Pos_153 /= No_Token_Index then
+        Or_Pos_22 := Defer_Pos_153;
+        Or_Res_22 := Defer_Res_153;
+        goto Exit_Or_22;
+    end if;
+    
+Defer_Res_154 :=
+   Grammar_Null_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_154 := Parser.Current_Pos;
+
+    if Defer_Pos_154 /= No_Token_Index then
+        Or_Pos_22 := Defer_Pos_154;
+        Or_Res_22 := Defer_Res_154;
+        goto Exit_Or_22;
+    end if;
+    
+Defer_Res_155 :=
+   Grammar_Token_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_155 := Parser.Current_Pos;
+
+    if Defer_Pos_155 /= No_Token_Index then
+        Or_Pos_22 := Defer_Pos_155;
+        Or_Res_22 := Defer_Res_155;
+        goto Exit_Or_22;
+    end if;
+    
+Defer_Res_156 :=
+   Parse_Node_Expr_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_156 := Parser.Current_Pos;
+
+    if Defer_Pos_156 /= No_Token_Index then
+        Or_Pos_22 := Defer_Pos_156;
+        Or_Res_22 := Defer_Res_156;
+        goto Exit_Or_22;
+    end if;
+    
+Defer_Res_157 :=
+   Grammar_Opt_Or_Parse_0 (Parser, Pos);
+Defer_Pos_157 := Parser.Current_Pos;
+
+    if Defer_Pos_157 /= No_Token_Index then
+        Or_Pos_22 := Defer_Pos_157;
+        Or_Res_22 := Defer_Res_157;
+        goto Exit_Or_22;
+    end if;
+    
+Defer_Res_158 :=
+   Grammar_Or_Expr_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_158 := Parser.Current_Pos;
+
+    if Defer_Pos_158 /= No_Token_Index then
+        Or_Pos_22 := Defer_Pos_158;
+        Or_Res_22 := Defer_Res_158;
+        goto Exit_Or_22;
+    end if;
+    
+Defer_Res_159 :=
+   Grammar_Rule_Ref_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_159 := Parser.Current_Pos;
+
+    if Defer_Pos_159 /= No_Token_Index then
+        Or_Pos_22 := Defer_Pos_159;
+        Or_Res_22 := Defer_Res_159;
+        goto Exit_Or_22;
+    end if;
+    
+Defer_Res_160 :=
+   Grammar_Discard_Expr_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_160 := Parser.Current_Pos;
+
+    if Defer_Pos_160 /= No_Token_Index then
+        Or_Pos_22 := Defer_Pos_160;
+        Or_Res_22 := Defer_Res_160;
+        goto Exit_Or_22;
+    end if;
+<<Exit_Or_22>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Grammar_Primary_Or_Parse_0_Memo,
+      Or_Pos_22 /= No_Token_Index,
+      Or_Res_22,
+      Pos,
+      Or_Pos_22);
+
+
+   Parser.Current_Pos := Or_Pos_22;
+
+   return Or_Res_22;
+end Grammar_Primary_Or_Parse_0;
+
+   
+
+
+function Lexer_Case_Send_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Lexer_Case_Rule_Send
+is
+   use Bare_Lexer_Case_Rule_Send_Memos;
+
+      Row_Pos_114 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_188 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_188 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_189 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_189 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_187 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_187 :
+            Bare_Ref_Id
+               := No_Bare_LK_Node;
+      Token_Pos_190 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_190 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_188 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_188 :
+            Bare_Num_Lit
+               := No_Bare_LK_Node;
+      Token_Pos_191 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_191 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_96 :
+            Bare_Lexer_Case_Rule_Send
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Lexer_Case_Send_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_96 := M.Instance;
+      return Transform_Res_96;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_96;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_114 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_188 := Row_Pos_114;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_188));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Identifier)
+      or else T.Symbol /= Precomputed_Symbol
+        (Parser.TDH.Symbols, Precomputed_Symbol_Send)
+   then
+       Token_Pos_188 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_114 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_114,
+             Expected_Token_Id => lkt_Identifier,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_188 := Row_Pos_114 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_188 /= No_Token_Index then
+
+   Row_Pos_114 := Token_Pos_188;
+
+else
+   Row_Pos_114 := No_Token_Index;
+   goto Exit_Row_113_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_189 := Row_Pos_114;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_189));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Par)
+   then
+       Token_Pos_189 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_114 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_114,
+             Expected_Token_Id => lkt_L_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_189 := Row_Pos_114 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_189 /= No_Token_Index then
+
+   Row_Pos_114 := Token_Pos_189;
+
+else
+   Row_Pos_114 := No_Token_Index;
+   goto Exit_Row_113_0;
+
+end if;
+
+
+Defer_Res_187 :=
+   Ref_Id_Transform_Parse_0 (Parser, Row_Pos_114);
+Defer_Pos_187 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_187 /= No_Token_Index then
+
+   Row_Pos_114 := Defer_Pos_187;
+
+else
+   Row_Pos_114 := No_Token_Index;
+   goto Exit_Row_113_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_190 := Row_Pos_114;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_190));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Comma)
+   then
+       Token_Pos_190 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_114 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_114,
+             Expected_Token_Id => lkt_Comma,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_190 := Row_Pos_114 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_190 /= No_Token_Index then
+
+   Row_Pos_114 := Token_Pos_190;
+
+else
+   Row_Pos_114 := No_Token_Index;
+   goto Exit_Row_113_0;
+
+end if;
+
+
+Defer_Res_188 :=
+   Num_Lit_Transform_Parse_0 (Parser, Row_Pos_114);
+Defer_Pos_188 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_188 /= No_Token_Index then
+
+   Row_Pos_114 := Defer_Pos_188;
+
+else
+   Row_Pos_114 := No_Token_Index;
+   goto Exit_Row_113_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_191 := Row_Pos_114;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_191));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Par)
+   then
+       Token_Pos_191 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_114 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_114,
+             Expected_Token_Id => lkt_R_Par,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_191 := Row_Pos_114 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_191 /= No_Token_Index then
+
+   Row_Pos_114 := Token_Pos_191;
+
+else
+   Row_Pos_114 := No_Token_Index;
+   goto Exit_Row_113_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_113_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_114 /= No_Token_Index then
+
+   Transform_Res_96 := Allocate_Lexer_Case_Rule_Send (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_96,
+      Kind => lkt_Lexer_Case_Rule_Send,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_114 = Pos
+                            then No_Token_Index
+                            else Row_Pos_114 - 1));
+
+      Initialize_Fields_For_Lexer_Case_Rule_Send
+        (Self => Transform_Res_96, Lexer_Case_Rule_Send_F_Sent => Defer_Res_187, Lexer_Case_Rule_Send_F_Match_Size => Defer_Res_188);
+
+         if Defer_Res_187 /= null and then Is_Incomplete (Defer_Res_187) then
+            Transform_Res_96.Last_Attempted_Child := 0;
+         elsif Defer_Res_187 /= null and then not Is_Ghost (Defer_Res_187) then
+            Transform_Res_96.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_188 /= null and then Is_Incomplete (Defer_Res_188) then
+            Transform_Res_96.Last_Attempted_Child := 0;
+         elsif Defer_Res_188 /= null and then not Is_Ghost (Defer_Res_188) then
+            Transform_Res_96.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Lexer_Case_Send_Transform_Parse_0_Memo,
+      Row_Pos_114 /= No_Token_Index,
+      Transform_Res_96,
+      Pos,
+      Row_Pos_114);
+
+
+   Parser.Current_Pos := Row_Pos_114;
+
+   return Transform_Res_96;
+end Lexer_Case_Send_Transform_Parse_0;
+
+   
+
+
+function Lexer_Case_Alt_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Base_Lexer_Case_Rule_Alt
+is
+   use Bare_Base_Lexer_Case_Rule_Alt_Memos;
+
+      Row_Pos_112 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_182 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_182 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_183 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_183 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_184 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_184 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_28 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_28 :
+            Free_Parse_List;
+      Defer_Pos_184 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_184 :
+            Bare_Ref_Id
+               := No_Bare_LK_Node;
+      Token_Pos_185 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_185 :
+            Token_Index
+               := No_Token_Index;
+      List_Pos_28 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_28 :
+            Bare_Ref_Id_List
+               := No_Bare_LK_Node;
+      Token_Pos_186 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_186 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_185 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_185 :
+            Bare_Lexer_Case_Rule_Send
+               := No_Bare_LK_Node;
+      Transform_Res_94 :
+            Bare_Lexer_Case_Rule_Cond_Alt
+               := No_Bare_LK_Node;
+      Row_Pos_113 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_187 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_187 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_186 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_186 :
+            Bare_Lexer_Case_Rule_Send
+               := No_Bare_LK_Node;
+      Transform_Res_95 :
+            Bare_Lexer_Case_Rule_Default_Alt
+               := No_Bare_LK_Node;
+      Or_Pos_28 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_28 :
+            Bare_Base_Lexer_Case_Rule_Alt
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Lexer_Case_Alt_Or_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_28 := M.Instance;
+      return Or_Res_28;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_28;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_28 := No_Token_Index;
+Or_Res_28 := No_Bare_LK_Node;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_112 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_182 := Row_Pos_112;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_182));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_If_Kw)
+   then
+       Token_Pos_182 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_112 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_112,
+             Expected_Token_Id => lkt_If_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_182 := Row_Pos_112 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_182 /= No_Token_Index then
+
+   Row_Pos_112 := Token_Pos_182;
+
+else
+   Row_Pos_112 := No_Token_Index;
+   goto Exit_Row_112_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_183 := Row_Pos_112;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_183));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Identifier)
+      or else T.Symbol /= Precomputed_Symbol
+        (Parser.TDH.Symbols, Precomputed_Symbol_Previous_Token)
+   then
+       Token_Pos_183 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_112 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_112,
+             Expected_Token_Id => lkt_Identifier,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_183 := Row_Pos_112 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_183 /= No_Token_Index then
+
+   Row_Pos_112 := Token_Pos_183;
+
+else
+   Row_Pos_112 := No_Token_Index;
+   goto Exit_Row_112_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_184 := Row_Pos_112;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_184));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Is_Kw)
+   then
+       Token_Pos_184 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_112 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_112,
+             Expected_Token_Id => lkt_Is_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_184 := Row_Pos_112 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_184 /= No_Token_Index then
+
+   Row_Pos_112 := Token_Pos_184;
+
+else
+   Row_Pos_112 := No_Token_Index;
+   goto Exit_Row_112_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_28 := No_Token_Index;
+
+
+
+Lst_Cpos_28 := Row_Pos_112;
+Tmp_List_28 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_184 :=
+   Ref_Id_Transform_Parse_0 (Parser, Lst_Cpos_28);
+Defer_Pos_184 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_184 = No_Token_Index;
+
+   List_Pos_28 := Defer_Pos_184;
+   Lst_Cpos_28 := List_Pos_28;
+
+   Tmp_List_28.Nodes.Append (Defer_Res_184);
+
+      
+--  Start tok_code
+
+Token_Res_185 := Lst_Cpos_28;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_185));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Pipe)
+   then
+       Token_Pos_185 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Lst_Cpos_28 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Lst_Cpos_28,
+             Expected_Token_Id => lkt_Pipe,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_185 := Lst_Cpos_28 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+      if Token_Pos_185 /= No_Token_Index then
+          Lst_Cpos_28 := Token_Pos_185;
+      else
+         exit;
+      end if;
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_28.Nodes.Length;
+begin
+   List_Res_28 :=
+      Allocate_Ref_Id_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_112;
+      Token_End := (if Lst_Cpos_28 = Row_Pos_112
+                    then Row_Pos_112
+                    else Lst_Cpos_28 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_112, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_28,
+      Kind              => lkt_Ref_Id_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_28,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_28.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_28.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_28);
+
+--  End list_code
+
+
+
+if List_Pos_28 /= No_Token_Index then
+
+   Row_Pos_112 := List_Pos_28;
+
+else
+   Row_Pos_112 := No_Token_Index;
+   goto Exit_Row_112_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_186 := Row_Pos_112;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_186));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Then_Kw)
+   then
+       Token_Pos_186 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_112 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_112,
+             Expected_Token_Id => lkt_Then_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_186 := Row_Pos_112 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_186 /= No_Token_Index then
+
+   Row_Pos_112 := Token_Pos_186;
+
+else
+   Row_Pos_112 := No_Token_Index;
+   goto Exit_Row_112_0;
+
+end if;
+
+
+Defer_Res_185 :=
+   Lexer_Case_Send_Transform_Parse_0 (Parser, Row_Pos_112);
+Defer_Pos_185 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_185 /= No_Token_Index then
+
+   Row_Pos_112 := Defer_Pos_185;
+
+else
+   Row_Pos_112 := No_Token_Index;
+   goto Exit_Row_112_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_112_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_112 /= No_Token_Index then
+
+   Transform_Res_94 := Allocate_Lexer_Case_Rule_Cond_Alt (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_94,
+      Kind => lkt_Lexer_Case_Rule_Cond_Alt,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_112 = Pos
+                            then No_Token_Index
+                            else Row_Pos_112 - 1));
+
+      Initialize_Fields_For_Lexer_Case_Rule_Cond_Alt
+        (Self => Transform_Res_94, Lexer_Case_Rule_Cond_Alt_F_Cond_Exprs => List_Res_28, Lexer_Case_Rule_Cond_Alt_F_Send => Defer_Res_185);
+
+         if List_Res_28 /= null and then Is_Incomplete (List_Res_28) then
+            Transform_Res_94.Last_Attempted_Child := 0;
+         elsif List_Res_28 /= null and then not Is_Ghost (List_Res_28) then
+            Transform_Res_94.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_185 /= null and then Is_Incomplete (Defer_Res_185) then
+            Transform_Res_94.Last_Attempted_Child := 0;
+         elsif Defer_Res_185 /= null and then not Is_Ghost (Defer_Res_185) then
+            Transform_Res_94.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_112 /= No_Token_Index then
+        Or_Pos_28 := Row_Pos_112;
+        Or_Res_28 := Transform_Res_94;
+        goto Exit_Or_28;
+    end if;
+    
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_113 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_187 := Row_Pos_113;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_187));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Else_Kw)
+   then
+       Token_Pos_187 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_113 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_113,
+             Expected_Token_Id => lkt_Else_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_187 := Row_Pos_113 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_187 /= No_Token_Index then
+
+   Row_Pos_113 := Token_Pos_187;
+
+else
+   Row_Pos_113 := No_Token_Index;
+   goto Exit_Row_114_0;
+
+end if;
+
+
+Defer_Res_186 :=
+   Lexer_Case_Send_Transform_Parse_0 (Parser, Row_Pos_113);
+Defer_Pos_186 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_186 /= No_Token_Index then
+
+   Row_Pos_113 := Defer_Pos_186;
+
+else
+   Row_Pos_113 := No_Token_Index;
+   goto Exit_Row_114_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_114_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_113 /= No_Token_Index then
+
+   Transform_Res_95 := Allocate_Lexer_Case_Rule_Default_Alt (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_95,
+      Kind => lkt_Lexer_Case_Rule_Default_Alt,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_113 = Pos
+                            then No_Token_Index
+                            else Row_Pos_113 - 1));
+
+      Initialize_Fields_For_Lexer_Case_Rule_Default_Alt
+        (Self => Transform_Res_95, Lexer_Case_Rule_Default_Alt_F_Send => Defer_Res_186);
+
+         if Defer_Res_186 /= null and then Is_Incomplete (Defer_Res_186) then
+            Transform_Res_95.Last_Attempted_Child := 0;
+         elsif Defer_Res_186 /= null and then not Is_Ghost (Defer_Res_186) then
+            Transform_Res_95.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+    if Row_Pos_113 /= No_Token_Index then
+        Or_Pos_28 := Row_Pos_113;
+        Or_Res_28 := Transform_Res_95;
+        goto Exit_Or_28;
+    end if;
+<<Exit_Or_28>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Lexer_Case_Alt_Or_Parse_0_Memo,
+      Or_Pos_28 /= No_Token_Index,
+      Or_Res_28,
+      Pos,
+      Or_Pos_28);
+
+
+   Parser.Current_Pos := Or_Pos_28;
+
+   return Or_Res_28;
+end Lexer_Case_Alt_Or_Parse_0;
+
+   
+
+
+function Lexer_Case_Rule_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Lexer_Case_Rule
+is
+   use Bare_Lexer_Case_Rule_Memos;
+
+      Row_Pos_88 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_133 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_133 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_145 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_145 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      Token_Pos_134 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_134 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_21 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_21 :
+            Free_Parse_List;
+      Defer_Pos_146 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_146 :
+            Bare_Base_Lexer_Case_Rule_Alt
+               := No_Bare_LK_Node;
+      List_Pos_21 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_21 :
+            Bare_Base_Lexer_Case_Rule_Alt_List
+               := No_Bare_LK_Node;
+      Token_Pos_135 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_135 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_73 :
+            Bare_Lexer_Case_Rule
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Lexer_Case_Rule_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_73 := M.Instance;
+      return Transform_Res_73;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_73;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_88 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_133 := Row_Pos_88;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_133));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Match_Kw)
+   then
+       Token_Pos_133 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_88 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_88,
+             Expected_Token_Id => lkt_Match_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_133 := Row_Pos_88 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_133 /= No_Token_Index then
+
+   Row_Pos_88 := Token_Pos_133;
+
+else
+   Row_Pos_88 := No_Token_Index;
+   goto Exit_Row_88_0;
+
+end if;
+
+
+Defer_Res_145 :=
+   Grammar_Primary_Or_Parse_0 (Parser, Row_Pos_88);
+Defer_Pos_145 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_145 /= No_Token_Index then
+
+   Row_Pos_88 := Defer_Pos_145;
+
+else
+   Row_Pos_88 := No_Token_Index;
+   goto Exit_Row_88_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_134 := Row_Pos_88;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_134));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Brace)
+   then
+       Token_Pos_134 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_88 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_88,
+             Expected_Token_Id => lkt_L_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_134 := Row_Pos_88 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_134 /= No_Token_Index then
+
+   Row_Pos_88 := Token_Pos_134;
+
+else
+   Row_Pos_88 := No_Token_Index;
+   goto Exit_Row_88_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_21 := No_Token_Index;
+
+
+
+Lst_Cpos_21 := Row_Pos_88;
+Tmp_List_21 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_146 :=
+   Lexer_Case_Alt_Or_Parse_0 (Parser, Lst_Cpos_21);
+Defer_Pos_146 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_146 = No_Token_Index;
+
+   List_Pos_21 := Defer_Pos_146;
+   Lst_Cpos_21 := List_Pos_21;
+
+   Tmp_List_21.Nodes.Append (Defer_Res_146);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_21.Nodes.Length;
+begin
+   List_Res_21 :=
+      Allocate_Base_Lexer_Case_Rule_Alt_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_88;
+      Token_End := (if Lst_Cpos_21 = Row_Pos_88
+                    then Row_Pos_88
+                    else Lst_Cpos_21 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_88, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_21,
+      Kind              => lkt_Base_Lexer_Case_Rule_Alt_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_21,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_21.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_21.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_21);
+
+--  End list_code
+
+
+
+if List_Pos_21 /= No_Token_Index then
+
+   Row_Pos_88 := List_Pos_21;
+
+else
+   Row_Pos_88 := No_Token_Index;
+   goto Exit_Row_88_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_135 := Row_Pos_88;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_135));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Brace)
+   then
+       Token_Pos_135 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_88 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_88,
+             Expected_Token_Id => lkt_R_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_135 := Row_Pos_88 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_135 /= No_Token_Index then
+
+   Row_Pos_88 := Token_Pos_135;
+
+else
+   Row_Pos_88 := No_Token_Index;
+   goto Exit_Row_88_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_88_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_88 /= No_Token_Index then
+
+   Transform_Res_73 := Allocate_Lexer_Case_Rule (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_73,
+      Kind => lkt_Lexer_Case_Rule,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_88 = Pos
+                            then No_Token_Index
+                            else Row_Pos_88 - 1));
+
+      Initialize_Fields_For_Lexer_Case_Rule
+        (Self => Transform_Res_73, Lexer_Case_Rule_F_Expr => Defer_Res_145, Lexer_Case_Rule_F_Alts => List_Res_21);
+
+         if Defer_Res_145 /= null and then Is_Incomplete (Defer_Res_145) then
+            Transform_Res_73.Last_Attempted_Child := 0;
+         elsif Defer_Res_145 /= null and then not Is_Ghost (Defer_Res_145) then
+            Transform_Res_73.Last_Attempted_Child := -1;
+         end if;
+         if List_Res_21 /= null and then Is_Incomplete (List_Res_21) then
+            Transform_Res_73.Last_Attempted_Child := 0;
+         elsif List_Res_21 /= null and then not Is_Ghost (List_Res_21) then
+            Transform_Res_73.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Lexer_Case_Rule_Transform_Parse_0_Memo,
+      Row_Pos_88 /= No_Token_Index,
+      Transform_Res_73,
+      Pos,
+      Row_Pos_88);
+
+
+   Parser.Current_Pos := Row_Pos_88;
+
+   return Transform_Res_73;
+end Lexer_Case_Rule_Transform_Parse_0;
+
+   
+
+
+function Lexer_Rule_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_LK_Node
+is
+   use Bare_LK_Node_Memos;
+
+      Defer_Pos_142 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_142 :
+            Bare_Full_Decl
+               := No_Bare_LK_Node;
+      Defer_Pos_143 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_143 :
+            Bare_Full_Decl
+               := No_Bare_LK_Node;
+      Defer_Pos_144 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_144 :
+            Bare_Lexer_Case_Rule
+               := No_Bare_LK_Node;
+      Or_Pos_21 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_21 :
+            Bare_LK_Node
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Lexer_Rule_Or_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_21 := M.Instance;
+      return Or_Res_21;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_21;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_21 := No_Token_Index;
+Or_Res_21 := No_Bare_LK_Node;
+    
+Defer_Res_142 :=
+   Lexer_Family_Decl_Transform_Parse_1 (Parser, Pos);
+Defer_Pos_142 := Parser.Current_Pos;
+
+    if Defer_Pos_142 /= No_Token_Index then
+        Or_Pos_21 := Defer_Pos_142;
+        Or_Res_21 := Defer_Res_142;
+        goto Exit_Or_21;
+    end if;
+    
+Defer_Res_143 :=
+   Decl_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_143 := Parser.Current_Pos;
+
+    if Defer_Pos_143 /= No_Token_Index then
+        Or_Pos_21 := Defer_Pos_143;
+        Or_Res_21 := Defer_Res_143;
+        goto Exit_Or_21;
+    end if;
+    
+Defer_Res_144 :=
+   Lexer_Case_Rule_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_144 := Parser.Current_Pos;
+
+    if Defer_Pos_144 /= No_Token_Index then
+        Or_Pos_21 := Defer_Pos_144;
+        Or_Res_21 := Defer_Res_144;
+        goto Exit_Or_21;
+    end if;
+<<Exit_Or_21>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Lexer_Rule_Or_Parse_0_Memo,
+      Or_Pos_21 /= No_Token_Index,
+      Or_Res_21,
+      Pos,
+      Or_Pos_21);
+
+
+   Parser.Current_Pos := Or_Pos_21;
+
+   return Or_Res_21;
+end Lexer_Rule_Or_Parse_0;
+
+   
+
+
+function Lexer_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Lexer_Decl
+is
+   use Bare_Lexer_Decl_Memos;
+
+      Row_Pos_85 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_127 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_127 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_135 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_135 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Token_Pos_128 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_128 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_18 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_18 :
+            Free_Parse_List;
+      Defer_Pos_136 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_136 :
+            Bare_Full_Decl
+               := No_Bare_LK_Node;
+      Defer_Pos_137 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_137 :
+            Bare_LK_Node
+               := No_Bare_LK_Node;
+      Or_Pos_20 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_20 :
+            Bare_LK_Node
+               := No_Bare_LK_Node;
+      List_Pos_18 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_18 :
+            Bare_LK_Node_List
+               := No_Bare_LK_Node;
+      Token_Pos_129 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_129 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_70 :
+            Bare_Lexer_Decl
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Lexer_Decl_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_70 := M.Instance;
+      return Transform_Res_70;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_70;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_85 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_127 := Row_Pos_85;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_127));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Lexer_Kw)
+   then
+       Token_Pos_127 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_85 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_85,
+             Expected_Token_Id => lkt_Lexer_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_127 := Row_Pos_85 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_127 /= No_Token_Index then
+
+   Row_Pos_85 := Token_Pos_127;
+
+else
+   Row_Pos_85 := No_Token_Index;
+   goto Exit_Row_85_0;
+
+end if;
+
+
+Defer_Res_135 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_85);
+Defer_Pos_135 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_135 /= No_Token_Index then
+
+   Row_Pos_85 := Defer_Pos_135;
+
+else
+   Row_Pos_85 := No_Token_Index;
+   goto Exit_Row_85_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_128 := Row_Pos_85;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_128));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Brace)
+   then
+       Token_Pos_128 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_85 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_85,
+             Expected_Token_Id => lkt_L_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_128 := Row_Pos_85 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_128 /= No_Token_Index then
+
+   Row_Pos_85 := Token_Pos_128;
+
+else
+   Row_Pos_85 := No_Token_Index;
+   goto Exit_Row_85_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_18 := Row_Pos_85;
+
+
+
+Lst_Cpos_18 := Row_Pos_85;
+Tmp_List_18 := Get_Parse_List (Parser);
+
+loop
+   
+--  Start or_code
+
+Or_Pos_20 := No_Token_Index;
+Or_Res_20 := No_Bare_LK_Node;
+    
+Defer_Res_136 :=
+   Lexer_Family_Decl_Transform_Parse_1 (Parser, Lst_Cpos_18);
+Defer_Pos_136 := Parser.Current_Pos;
+
+    if Defer_Pos_136 /= No_Token_Index then
+        Or_Pos_20 := Defer_Pos_136;
+        Or_Res_20 := Defer_Res_136;
+        goto Exit_Or_20;
+    end if;
+    
+Defer_Res_137 :=
+   Lexer_Rule_Or_Parse_0 (Parser, Lst_Cpos_18);
+Defer_Pos_137 := Parser.Current_Pos;
+
+    if Defer_Pos_137 /= No_Token_Index then
+        Or_Pos_20 := Defer_Pos_137;
+        Or_Res_20 := Defer_Res_137;
+        goto Exit_Or_20;
+    end if;
+<<Exit_Or_20>>
+
+--  End or_code
+
+
+   exit when Or_Pos_20 = No_Token_Index;
+
+   List_Pos_18 := Or_Pos_20;
+   Lst_Cpos_18 := List_Pos_18;
+
+   Tmp_List_18.Nodes.Append (Or_Res_20);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_18.Nodes.Length;
+begin
+   List_Res_18 :=
+      Allocate_LK_Node_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_85;
+      Token_End := (if Lst_Cpos_18 = Row_Pos_85
+                    then Row_Pos_85
+                    else Lst_Cpos_18 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_85, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_18,
+      Kind              => lkt_LK_Node_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_18,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_18.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_18.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_18);
+
+--  End list_code
+
+
+
+if List_Pos_18 /= No_Token_Index then
+
+   Row_Pos_85 := List_Pos_18;
+
+else
+   Row_Pos_85 := No_Token_Index;
+   goto Exit_Row_85_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_129 := Row_Pos_85;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_129));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Brace)
+   then
+       Token_Pos_129 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_85 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_85,
+             Expected_Token_Id => lkt_R_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_129 := Row_Pos_85 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_129 /= No_Token_Index then
+
+   Row_Pos_85 := Token_Pos_129;
+
+else
+   Row_Pos_85 := No_Token_Index;
+   goto Exit_Row_85_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_85_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_85 /= No_Token_Index then
+
+   Transform_Res_70 := Allocate_Lexer_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_70,
+      Kind => lkt_Lexer_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_85 = Pos
+                            then No_Token_Index
+                            else Row_Pos_85 - 1));
+
+      Initialize_Fields_For_Lexer_Decl
+        (Self => Transform_Res_70, Lexer_Decl_F_Syn_Name => Defer_Res_135, Lexer_Decl_F_Rules => List_Res_18);
+
+         if Defer_Res_135 /= null and then Is_Incomplete (Defer_Res_135) then
+            Transform_Res_70.Last_Attempted_Child := 0;
+         elsif Defer_Res_135 /= null and then not Is_Ghost (Defer_Res_135) then
+            Transform_Res_70.Last_Attempted_Child := -1;
+         end if;
+         if List_Res_18 /= null and then Is_Incomplete (List_Res_18) then
+            Transform_Res_70.Last_Attempted_Child := 0;
+         elsif List_Res_18 /= null and then not Is_Ghost (List_Res_18) then
+            Transform_Res_70.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Lexer_Decl_Transform_Parse_0_Memo,
+      Row_Pos_85 /= No_Token_Index,
+      Transform_Res_70,
+      Pos,
+      Row_Pos_85);
+
+
+   Parser.Current_Pos := Row_Pos_85;
+
+   return Transform_Res_70;
+end Lexer_Decl_Transform_Parse_0;
+
+   
+
+
+function Grammar_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Decl
+is
+   use Bare_Grammar_Decl_Memos;
+
+      Row_Pos_115 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_192 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_192 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_189 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_189 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Token_Pos_193 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_193 :
+            Token_Index
+               := No_Token_Index;
+      Lst_Cpos_29 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_29 :
+            Free_Parse_List;
+      Defer_Pos_190 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_190 :
+            Bare_Full_Decl
+               := No_Bare_LK_Node;
+      List_Pos_29 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_29 :
+            Bare_Full_Decl_List
+               := No_Bare_LK_Node;
+      Token_Pos_194 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_194 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_97 :
+            Bare_Grammar_Decl
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Grammar_Decl_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_97 := M.Instance;
+      return Transform_Res_97;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_97;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_115 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_192 := Row_Pos_115;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_192));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Grammar_Kw)
+   then
+       Token_Pos_192 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_115 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_115,
+             Expected_Token_Id => lkt_Grammar_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_192 := Row_Pos_115 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_192 /= No_Token_Index then
+
+   Row_Pos_115 := Token_Pos_192;
+
+else
+   Row_Pos_115 := No_Token_Index;
+   goto Exit_Row_115_0;
+
+end if;
+
+
+Defer_Res_189 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_115);
+Defer_Pos_189 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_189 /= No_Token_Index then
+
+   Row_Pos_115 := Defer_Pos_189;
+
+else
+   Row_Pos_115 := No_Token_Index;
+   goto Exit_Row_115_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_193 := Row_Pos_115;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_193));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_L_Brace)
+   then
+       Token_Pos_193 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_115 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_115,
+             Expected_Token_Id => lkt_L_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_193 := Row_Pos_115 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_193 /= No_Token_Index then
+
+   Row_Pos_115 := Token_Pos_193;
+
+else
+   Row_Pos_115 := No_Token_Index;
+   goto Exit_Row_115_0;
+
+end if;
+
+
+--  Start list_code
+
+    List_Pos_29 := Row_Pos_115;
+
+
+
+Lst_Cpos_29 := Row_Pos_115;
+Tmp_List_29 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_190 :=
+   Decl_Transform_Parse_0 (Parser, Lst_Cpos_29);
+Defer_Pos_190 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_190 = No_Token_Index;
+
+   List_Pos_29 := Defer_Pos_190;
+   Lst_Cpos_29 := List_Pos_29;
+
+   Tmp_List_29.Nodes.Append (Defer_Res_190);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_29.Nodes.Length;
+begin
+   List_Res_29 :=
+      Allocate_Full_Decl_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Row_Pos_115;
+      Token_End := (if Lst_Cpos_29 = Row_Pos_115
+                    then Row_Pos_115
+                    else Lst_Cpos_29 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Row_Pos_115, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_29,
+      Kind              => lkt_Full_Decl_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_29,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_29.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_29.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_29);
+
+--  End list_code
+
+
+
+if List_Pos_29 /= No_Token_Index then
+
+   Row_Pos_115 := List_Pos_29;
+
+else
+   Row_Pos_115 := No_Token_Index;
+   goto Exit_Row_115_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_194 := Row_Pos_115;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_194));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_R_Brace)
+   then
+       Token_Pos_194 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_115 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_115,
+             Expected_Token_Id => lkt_R_Brace,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_194 := Row_Pos_115 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_194 /= No_Token_Index then
+
+   Row_Pos_115 := Token_Pos_194;
+
+else
+   Row_Pos_115 := No_Token_Index;
+   goto Exit_Row_115_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_115_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_115 /= No_Token_Index then
+
+   Transform_Res_97 := Allocate_Grammar_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_97,
+      Kind => lkt_Grammar_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_115 = Pos
+                            then No_Token_Index
+                            else Row_Pos_115 - 1));
+
+      Initialize_Fields_For_Grammar_Decl
+        (Self => Transform_Res_97, Grammar_Decl_F_Syn_Name => Defer_Res_189, Grammar_Decl_F_Rules => List_Res_29);
+
+         if Defer_Res_189 /= null and then Is_Incomplete (Defer_Res_189) then
+            Transform_Res_97.Last_Attempted_Child := 0;
+         elsif Defer_Res_189 /= null and then not Is_Ghost (Defer_Res_189) then
+            Transform_Res_97.Last_Attempted_Child := -1;
+         end if;
+         if List_Res_29 /= null and then Is_Incomplete (List_Res_29) then
+            Transform_Res_97.Last_Attempted_Child := 0;
+         elsif List_Res_29 /= null and then not Is_Ghost (List_Res_29) then
+            Transform_Res_97.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Grammar_Decl_Transform_Parse_0_Memo,
+      Row_Pos_115 /= No_Token_Index,
+      Transform_Res_97,
+      Pos,
+      Row_Pos_115);
+
+
+   Parser.Current_Pos := Row_Pos_115;
+
+   return Transform_Res_97;
+end Grammar_Decl_Transform_Parse_0;
+
+   
+
+
+function Field_Decl_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Field_Decl
+is
+   use Bare_Field_Decl_Memos;
+
+      Row_Pos_116 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_191 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_191 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Token_Pos_195 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_195 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_192 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_192 :
+            Bare_Type_Ref
+               := No_Bare_LK_Node;
+      Row_Pos_117 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_196 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_196 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_193 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_193 :
+            Bare_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_98 :
+            Bare_Field_Decl
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Field_Decl_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_98 := M.Instance;
+      return Transform_Res_98;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_98;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_116 := Pos;
+
+
+
+Defer_Res_191 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_116);
+Defer_Pos_191 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_191 /= No_Token_Index then
+
+   Row_Pos_116 := Defer_Pos_191;
+
+else
+   Row_Pos_116 := No_Token_Index;
+   goto Exit_Row_116_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_195 := Row_Pos_116;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_195));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Colon)
+   then
+       Token_Pos_195 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_116 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_116,
+             Expected_Token_Id => lkt_Colon,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_195 := Row_Pos_116 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_195 /= No_Token_Index then
+
+   Row_Pos_116 := Token_Pos_195;
+
+else
+   Row_Pos_116 := No_Token_Index;
+   goto Exit_Row_116_0;
+
+end if;
+
+
+Defer_Res_192 :=
+   Type_Ref_Or_Parse_0 (Parser, Row_Pos_116);
+Defer_Pos_192 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_192 /= No_Token_Index then
+
+   Row_Pos_116 := Defer_Pos_192;
+
+else
+   Row_Pos_116 := No_Token_Index;
+   goto Exit_Row_116_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_117 := Row_Pos_116;
+
+
+
+--  Start tok_code
+
+Token_Res_196 := Row_Pos_117;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_196));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Equal)
+   then
+       Token_Pos_196 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_117 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_117,
+             Expected_Token_Id => lkt_Equal,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_196 := Row_Pos_117 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_196 /= No_Token_Index then
+
+   Row_Pos_117 := Token_Pos_196;
+
+else
+   Row_Pos_117 := No_Token_Index;
+   goto Exit_Row_117_0;
+
+end if;
+
+
+Defer_Res_193 :=
+   Expr_Or_Parse_1 (Parser, Row_Pos_117);
+Defer_Pos_193 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_193 /= No_Token_Index then
+
+   Row_Pos_117 := Defer_Pos_193;
+
+else
+   Row_Pos_117 := No_Token_Index;
+   goto Exit_Row_117_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_117_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_117 = No_Token_Index then
+
+        Defer_Res_193 := No_Bare_LK_Node;
+
+
+    Row_Pos_117 := Row_Pos_116;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_117 /= No_Token_Index then
+
+   Row_Pos_116 := Row_Pos_117;
+
+else
+   Row_Pos_116 := No_Token_Index;
+   goto Exit_Row_116_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_116_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_116 /= No_Token_Index then
+
+   Transform_Res_98 := Allocate_Field_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_98,
+      Kind => lkt_Field_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_116 = Pos
+                            then No_Token_Index
+                            else Row_Pos_116 - 1));
+
+      Initialize_Fields_For_Field_Decl
+        (Self => Transform_Res_98, User_Val_Decl_F_Syn_Name => Defer_Res_191, Field_Decl_F_Decl_Type => Defer_Res_192, Field_Decl_F_Default_Val => Defer_Res_193);
+
+         if Defer_Res_191 /= null and then Is_Incomplete (Defer_Res_191) then
+            Transform_Res_98.Last_Attempted_Child := 0;
+         elsif Defer_Res_191 /= null and then not Is_Ghost (Defer_Res_191) then
+            Transform_Res_98.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_192 /= null and then Is_Incomplete (Defer_Res_192) then
+            Transform_Res_98.Last_Attempted_Child := 0;
+         elsif Defer_Res_192 /= null and then not Is_Ghost (Defer_Res_192) then
+            Transform_Res_98.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_193 /= null and then Is_Incomplete (Defer_Res_193) then
+            Transform_Res_98.Last_Attempted_Child := 0;
+         elsif Defer_Res_193 /= null and then not Is_Ghost (Defer_Res_193) then
+            Transform_Res_98.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Field_Decl_Transform_Parse_0_Memo,
+      Row_Pos_116 /= No_Token_Index,
+      Transform_Res_98,
+      Pos,
+      Row_Pos_116);
+
+
+   Parser.Current_Pos := Row_Pos_116;
+
+   return Transform_Res_98;
+end Field_Decl_Transform_Parse_0;
+
+   
+
+
+function Grammar_Rule_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Grammar_Rule_Decl
+is
+   use Bare_Grammar_Rule_Decl_Memos;
+
+      Row_Pos_118 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_194 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_194 :
+            Bare_Def_Id
+               := No_Bare_LK_Node;
+      Row_Pos_119 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_197 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_197 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_195 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_195 :
+            Bare_Grammar_Expr
+               := No_Bare_LK_Node;
+      Transform_Res_99 :
+            Bare_Grammar_Rule_Decl
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Grammar_Rule_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_99 := M.Instance;
+      return Transform_Res_99;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_99;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_118 := Pos;
+
+
+
+Defer_Res_194 :=
+   Def_Id_Transform_Parse_0 (Parser, Row_Pos_118);
+Defer_Pos_194 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_194 /= No_Token_Index then
+
+   Row_Pos_118 := Defer_Pos_194;
+
+else
+   Row_Pos_118 := No_Token_Index;
+   goto Exit_Row_118_0;
+
+end if;
+
+
+--  Start opt_code
+
+
+
+
+--  Start row_code
+
+Row_Pos_119 := Row_Pos_118;
+
+
+
+--  Start tok_code
+
+Token_Res_197 := Row_Pos_119;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_197));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Left_Arrow)
+   then
+       Token_Pos_197 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_119 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_119,
+             Expected_Token_Id => lkt_Left_Arrow,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_197 := Row_Pos_119 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_197 /= No_Token_Index then
+
+   Row_Pos_119 := Token_Pos_197;
+
+else
+   Row_Pos_119 := No_Token_Index;
+   goto Exit_Row_119_0;
+
+end if;
+
+
+Defer_Res_195 :=
+   Grammar_Expr_Or_Parse_0 (Parser, Row_Pos_119);
+Defer_Pos_195 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_195 /= No_Token_Index then
+
+   Row_Pos_119 := Defer_Pos_195;
+
+else
+   Row_Pos_119 := No_Token_Index;
+   goto Exit_Row_119_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_119_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+if Row_Pos_119 = No_Token_Index then
+
+        Defer_Res_195 := No_Bare_LK_Node;
+
+
+    Row_Pos_119 := Row_Pos_118;
+
+
+end if;
+
+--  End opt_code
+
+
+
+if Row_Pos_119 /= No_Token_Index then
+
+   Row_Pos_118 := Row_Pos_119;
+
+else
+   Row_Pos_118 := No_Token_Index;
+   goto Exit_Row_118_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_118_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_118 /= No_Token_Index then
+
+   Transform_Res_99 := Allocate_Grammar_Rule_Decl (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_99,
+      Kind => lkt_Grammar_Rule_Decl,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_118 = Pos
+                            then No_Token_Index
+                            else Row_Pos_118 - 1));
+
+      Initialize_Fields_For_Grammar_Rule_Decl
+        (Self => Transform_Res_99, Grammar_Rule_Decl_F_Syn_Name => Defer_Res_194, Grammar_Rule_Decl_F_Expr => Defer_Res_195);
+
+         if Defer_Res_194 /= null and then Is_Incomplete (Defer_Res_194) then
+            Transform_Res_99.Last_Attempted_Child := 0;
+         elsif Defer_Res_194 /= null and then not Is_Ghost (Defer_Res_194) then
+            Transform_Res_99.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_195 /= null and then Is_Incomplete (Defer_Res_195) then
+            Transform_Res_99.Last_Attempted_Child := 0;
+         elsif Defer_Res_195 /= null and then not Is_Ghost (Defer_Res_195) then
+            Transform_Res_99.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Grammar_Rule_Transform_Parse_0_Memo,
+      Row_Pos_118 /= No_Token_Index,
+      Transform_Res_99,
+      Pos,
+      Row_Pos_118);
+
+
+   Parser.Current_Pos := Row_Pos_118;
+
+   return Transform_Res_99;
+end Grammar_Rule_Transform_Parse_0;
+
+   
+
+
+function Bare_Decl_Or_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Decl
+is
+   use Bare_Decl_Memos;
+
+      Defer_Pos_87 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_87 :
+            Bare_Generic_Decl
+               := No_Bare_LK_Node;
+      Defer_Pos_88 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_88 :
+            Bare_Named_Type_Decl
+               := No_Bare_LK_Node;
+      Defer_Pos_89 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_89 :
+            Bare_Fun_Decl
+               := No_Bare_LK_Node;
+      Defer_Pos_90 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_90 :
+            Bare_Lexer_Decl
+               := No_Bare_LK_Node;
+      Defer_Pos_91 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_91 :
+            Bare_Grammar_Decl
+               := No_Bare_LK_Node;
+      Defer_Pos_92 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_92 :
+            Bare_Field_Decl
+               := No_Bare_LK_Node;
+      Defer_Pos_93 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_93 :
+            Bare_Val_Decl
+               := No_Bare_LK_Node;
+      Defer_Pos_94 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_94 :
+            Bare_Grammar_Rule_Decl
+               := No_Bare_LK_Node;
+      Or_Pos_18 :
+            Token_Index
+               := No_Token_Index;
+      Or_Res_18 :
+            Bare_Decl
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Bare_Decl_Or_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Or_Res_18 := M.Instance;
+      return Or_Res_18;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Or_Res_18;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start or_code
+
+Or_Pos_18 := No_Token_Index;
+Or_Res_18 := No_Bare_LK_Node;
+    
+Defer_Res_87 :=
+   Generic_Decl_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_87 := Parser.Current_Pos;
+
+    if Defer_Pos_87 /= No_Token_Index then
+        Or_Pos_18 := Defer_Pos_87;
+        Or_Res_18 := Defer_Res_87;
+        goto Exit_Or_18;
+    end if;
+    
+Defer_Res_88 :=
+   Type_Decl_Or_Parse_0 (Parser, Pos);
+Defer_Pos_88 := Parser.Current_Pos;
+
+    if Defer_Pos_88 /= No_Token_Index then
+        Or_Pos_18 := Defer_Pos_88;
+        Or_Res_18 := Defer_Res_88;
+        goto Exit_Or_18;
+    end if;
+    
+Defer_Res_89 :=
+   Fun_Decl_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_89 := Parser.Current_Pos;
+
+    if Defer_Pos_89 /= No_Token_Index then
+        Or_Pos_18 := Defer_Pos_89;
+        Or_Res_18 := Defer_Res_89;
+        goto Exit_Or_18;
+    end if;
+    
+Defer_Res_90 :=
+   Lexer_Decl_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_90 := Parser.Current_Pos;
+
+    if Defer_Pos_90 /= No_Token_Index then
+        Or_Pos_18 := Defer_Pos_90;
+        Or_Res_18 := Defer_Res_90;
+        goto Exit_Or_18;
+    end if;
+    
+Defer_Res_91 :=
+   Grammar_Decl_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_91 := Parser.Current_Pos;
+
+    if Defer_Pos_91 /= No_Token_Index then
+        Or_Pos_18 := Defer_Pos_91;
+        Or_Res_18 := Defer_Res_91;
+        goto Exit_Or_18;
+    end if;
+    
+Defer_Res_92 :=
+   Field_Decl_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_92 := Parser.Current_Pos;
+
+    if Defer_Pos_92 /= No_Token_Index then
+        Or_Pos_18 := Defer_Pos_92;
+        Or_Res_18 := Defer_Res_92;
+        goto Exit_Or_18;
+    end if;
+    
+Defer_Res_93 :=
+   Val_Decl_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_93 := Parser.Current_Pos;
+
+    if Defer_Pos_93 /= No_Token_Index then
+        Or_Pos_18 := Defer_Pos_93;
+        Or_Res_18 := Defer_Res_93;
+        goto Exit_Or_18;
+    end if;
+    
+Defer_Res_94 :=
+   Grammar_Rule_Transform_Parse_0 (Parser, Pos);
+Defer_Pos_94 := Parser.Current_Pos;
+
+    if Defer_Pos_94 /= No_Token_Index then
+        Or_Pos_18 := Defer_Pos_94;
+        Or_Res_18 := Defer_Res_94;
+        goto Exit_Or_18;
+    end if;
+<<Exit_Or_18>>
+
+--  End or_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Bare_Decl_Or_Parse_0_Memo,
+      Or_Pos_18 /= No_Token_Index,
+      Or_Res_18,
+      Pos,
+      Or_Pos_18);
+
+
+   Parser.Current_Pos := Or_Pos_18;
+
+   return Or_Res_18;
+end Bare_Decl_Or_Parse_0;
+
+   
+
+
+function Decls_List_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Full_Decl_List
+is
+   use Bare_Full_Decl_List_Memos;
+
+      Lst_Cpos_30 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_30 :
+            Free_Parse_List;
+      Defer_Pos_196 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_196 :
+            Bare_Full_Decl
+               := No_Bare_LK_Node;
+      List_Pos_30 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_30 :
+            Bare_Full_Decl_List
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Decls_List_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      List_Res_30 := M.Instance;
+      return List_Res_30;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return List_Res_30;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start list_code
+
+    List_Pos_30 := Pos;
+
+
+
+Lst_Cpos_30 := Pos;
+Tmp_List_30 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_196 :=
+   Decl_Transform_Parse_0 (Parser, Lst_Cpos_30);
+Defer_Pos_196 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_196 = No_Token_Index;
+
+   List_Pos_30 := Defer_Pos_196;
+   Lst_Cpos_30 := List_Pos_30;
+
+   Tmp_List_30.Nodes.Append (Defer_Res_196);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_30.Nodes.Length;
+begin
+   List_Res_30 :=
+      Allocate_Full_Decl_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Pos;
+      Token_End := (if Lst_Cpos_30 = Pos
+                    then Pos
+                    else Lst_Cpos_30 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Pos, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_30,
+      Kind              => lkt_Full_Decl_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_30,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_30.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_30.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_30);
+
+--  End list_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Decls_List_Parse_0_Memo,
+      List_Pos_30 /= No_Token_Index,
+      List_Res_30,
+      Pos,
+      List_Pos_30);
+
+
+   Parser.Current_Pos := List_Pos_30;
+
+   return List_Res_30;
+end Decls_List_Parse_0;
+
+   
+
+
+function Import_Stmt_Transform_Parse_1
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Import
+is
+   use Bare_Import_Memos;
+
+      Row_Pos_120 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_198 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_198 :
+            Token_Index
+               := No_Token_Index;
+      Row_Pos_121 :
+            Token_Index
+               := No_Token_Index;
+      Token_Pos_199 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_199 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_100 :
+            Bare_Module_Ref_Id
+               := No_Bare_LK_Node;
+      Transform_Res_101 :
+            Bare_Import
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Import_Stmt_Transform_Parse_1_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_101 := M.Instance;
+      return Transform_Res_101;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_101;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_120 := Pos;
+
+
+
+--  Start tok_code
+
+Token_Res_198 := Row_Pos_120;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_198));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Import_Kw)
+   then
+       Token_Pos_198 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_120 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_120,
+             Expected_Token_Id => lkt_Import_Kw,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_198 := Row_Pos_120 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_198 /= No_Token_Index then
+
+   Row_Pos_120 := Token_Pos_198;
+
+else
+   Row_Pos_120 := No_Token_Index;
+   goto Exit_Row_120_0;
+
+end if;
+
+
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_121 := Row_Pos_120;
+
+
+
+--  Start tok_code
+
+Token_Res_199 := Row_Pos_121;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_199));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Identifier)
+   then
+       Token_Pos_199 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_121 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_121,
+             Expected_Token_Id => lkt_Identifier,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_199 := Row_Pos_121 + 1;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_199 /= No_Token_Index then
+
+   Row_Pos_121 := Token_Pos_199;
+
+else
+   Row_Pos_121 := No_Token_Index;
+   goto Exit_Row_121_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_121_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_121 /= No_Token_Index then
+
+   Transform_Res_100 := Allocate_Module_Ref_Id (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_100,
+      Kind => lkt_Module_Ref_Id,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Row_Pos_120,
+      Token_End_Index   => (if Row_Pos_121 = Row_Pos_120
+                            then No_Token_Index
+                            else Row_Pos_121 - 1));
+
+
+
+
+end if;
+
+--  End transform_code
+
+
+
+if Row_Pos_121 /= No_Token_Index then
+
+   Row_Pos_120 := Row_Pos_121;
+
+else
+   Row_Pos_120 := No_Token_Index;
+   goto Exit_Row_120_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_120_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_120 /= No_Token_Index then
+
+   Transform_Res_101 := Allocate_Import (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_101,
+      Kind => lkt_Import,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_120 = Pos
+                            then No_Token_Index
+                            else Row_Pos_120 - 1));
+
+      Initialize_Fields_For_Import
+        (Self => Transform_Res_101, Import_F_Name => Transform_Res_100);
+
+         if Transform_Res_100 /= null and then Is_Incomplete (Transform_Res_100) then
+            Transform_Res_101.Last_Attempted_Child := 0;
+         elsif Transform_Res_100 /= null and then not Is_Ghost (Transform_Res_100) then
+            Transform_Res_101.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Import_Stmt_Transform_Parse_1_Memo,
+      Row_Pos_120 /= No_Token_Index,
+      Transform_Res_101,
+      Pos,
+      Row_Pos_120);
+
+
+   Parser.Current_Pos := Row_Pos_120;
+
+   return Transform_Res_101;
+end Import_Stmt_Transform_Parse_1;
+
+   
+
+
+function Imports_List_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Import_List
+is
+   use Bare_Import_List_Memos;
+
+      Lst_Cpos_31 :
+            Token_Index
+               := No_Token_Index;
+      Tmp_List_31 :
+            Free_Parse_List;
+      Defer_Pos_197 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_197 :
+            Bare_Import
+               := No_Bare_LK_Node;
+      List_Pos_31 :
+            Token_Index
+               := No_Token_Index;
+      List_Res_31 :
+            Bare_Import_List
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Imports_List_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      List_Res_31 := M.Instance;
+      return List_Res_31;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return List_Res_31;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start list_code
+
+    List_Pos_31 := Pos;
+
+
+
+Lst_Cpos_31 := Pos;
+Tmp_List_31 := Get_Parse_List (Parser);
+
+loop
+   
+Defer_Res_197 :=
+   Import_Stmt_Transform_Parse_1 (Parser, Lst_Cpos_31);
+Defer_Pos_197 := Parser.Current_Pos;
+
+
+   exit when Defer_Pos_197 = No_Token_Index;
+
+   List_Pos_31 := Defer_Pos_197;
+   Lst_Cpos_31 := List_Pos_31;
+
+   Tmp_List_31.Nodes.Append (Defer_Res_197);
+
+
+end loop;
+
+declare
+   Token_Start, Token_End : Token_Index;
+   Count                  : constant Natural := Tmp_List_31.Nodes.Length;
+begin
+   List_Res_31 :=
+      Allocate_Import_List (Parser.Mem_Pool);
+
+   if Count > 0 then
+      Token_Start := Pos;
+      Token_End := (if Lst_Cpos_31 = Pos
+                    then Pos
+                    else Lst_Cpos_31 - 1);
+
+   else
+      Token_Start := Token_Index'Max (Pos, 1);
+      Token_End := No_Token_Index;
+   end if;
+
+   Initialize
+     (Self              => List_Res_31,
+      Kind              => lkt_Import_List,
+      Unit              => Parser.Unit,
+      Token_Start_Index => Token_Start,
+      Token_End_Index   => Token_End);
+   Initialize_List
+     (Self   => List_Res_31,
+      Parser => Parser,
+      Count  => Count);
+
+   declare
+      Vec : Bare_LK_Node_Vectors.Vector renames
+         Tmp_List_31.Nodes;
+      Arr : Alloc_AST_List_Array.Element_Array_Access renames
+         List_Res_31.Nodes;
+   begin
+      Arr := Alloc_AST_List_Array.Alloc (Parser.Mem_Pool, Vec.Length);
+      for I in Vec.First_Index .. Vec.Last_Index loop
+         Arr (I) := Vec.Get (I);
+      end loop;
+   end;
+end;
+
+Release_Parse_List (Parser, Tmp_List_31);
+
+--  End list_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Imports_List_Parse_0_Memo,
+      List_Pos_31 /= No_Token_Index,
+      List_Res_31,
+      Pos,
+      List_Pos_31);
+
+
+   Parser.Current_Pos := List_Pos_31;
+
+   return List_Res_31;
+end Imports_List_Parse_0;
+
+   
+
+
+function Main_Rule_Transform_Parse_0
+  (Parser : in out Parser_Type;
+   Pos    : Token_Index) return Bare_Langkit_Root
+is
+   use Bare_Langkit_Root_Memos;
+
+      Row_Pos_122 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Pos_198 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_198 :
+            Bare_Import_List
+               := No_Bare_LK_Node;
+      Defer_Pos_199 :
+            Token_Index
+               := No_Token_Index;
+      Defer_Res_199 :
+            Bare_Full_Decl_List
+               := No_Bare_LK_Node;
+      Token_Pos_200 :
+            Token_Index
+               := No_Token_Index;
+      Token_Res_200 :
+            Token_Index
+               := No_Token_Index;
+      Transform_Res_102 :
+            Bare_Langkit_Root
+               := No_Bare_LK_Node;
+
+
+   M : Memo_Entry := Get (Parser.Private_Part.Main_Rule_Transform_Parse_0_Memo, Pos);
+
+begin
+
+   if M.State = Success then
+      Parser.Current_Pos := M.Final_Pos;
+      Transform_Res_102 := M.Instance;
+      return Transform_Res_102;
+   elsif M.State = Failure then
+      Parser.Current_Pos := No_Token_Index;
+      return Transform_Res_102;
+   end if;
+
+
+   ---------------------------
+   -- MAIN COMBINATORS CODE --
+   ---------------------------
+
+   
+--  Start transform_code
+
+
+--  Start row_code
+
+Row_Pos_122 := Pos;
+
+
+
+Defer_Res_198 :=
+   Imports_List_Parse_0 (Parser, Row_Pos_122);
+Defer_Pos_198 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_198 /= No_Token_Index then
+
+   Row_Pos_122 := Defer_Pos_198;
+
+else
+   Row_Pos_122 := No_Token_Index;
+   goto Exit_Row_122_0;
+
+end if;
+
+
+Defer_Res_199 :=
+   Decls_List_Parse_0 (Parser, Row_Pos_122);
+Defer_Pos_199 := Parser.Current_Pos;
+
+
+
+if Defer_Pos_199 /= No_Token_Index then
+
+   Row_Pos_122 := Defer_Pos_199;
+
+else
+   Row_Pos_122 := No_Token_Index;
+   goto Exit_Row_122_0;
+
+end if;
+
+
+--  Start tok_code
+
+Token_Res_200 := Row_Pos_122;
+
+declare
+   T : constant Stored_Token_Data :=
+      Token_Vectors.Get (Parser.TDH.Tokens, Natural (Token_Res_200));
+begin
+   if
+      T.Kind /= From_Token_Kind (lkt_Termination)
+   then
+       Token_Pos_200 := No_Token_Index;
+
+       if Parser.Last_Fail.Pos <= Row_Pos_122 then
+          Parser.Last_Fail :=
+            (Kind              => Token_Fail,
+             Pos               => Row_Pos_122,
+             Expected_Token_Id => lkt_Termination,
+             Found_Token_Id    => To_Token_Kind (T.Kind));
+       end if;
+   else
+          Token_Pos_200 := Row_Pos_122;
+   end if;
+end;
+
+--  End tok_code
+
+
+
+if Token_Pos_200 /= No_Token_Index then
+
+   Row_Pos_122 := Token_Pos_200;
+
+else
+   Row_Pos_122 := No_Token_Index;
+   goto Exit_Row_122_0;
+
+end if;
+
+pragma Warnings (Off, "referenced");
+<<Exit_Row_122_0>>
+pragma Warnings (On, "referenced");
+
+--  End row_code
+
+
+
+if Row_Pos_122 /= No_Token_Index then
+
+   Transform_Res_102 := Allocate_Langkit_Root (Parser.Mem_Pool);
+
+   Initialize
+     (Self => Transform_Res_102,
+      Kind => lkt_Langkit_Root,
+      Unit => Parser.Unit,
+
+      Token_Start_Index => Pos,
+      Token_End_Index   => (if Row_Pos_122 = Pos
+                            then No_Token_Index
+                            else Row_Pos_122 - 1));
+
+      Initialize_Fields_For_Langkit_Root
+        (Self => Transform_Res_102, Langkit_Root_F_Imports => Defer_Res_198, Langkit_Root_F_Decls => Defer_Res_199);
+
+         if Defer_Res_198 /= null and then Is_Incomplete (Defer_Res_198) then
+            Transform_Res_102.Last_Attempted_Child := 0;
+         elsif Defer_Res_198 /= null and then not Is_Ghost (Defer_Res_198) then
+            Transform_Res_102.Last_Attempted_Child := -1;
+         end if;
+         if Defer_Res_199 /= null and then Is_Incomplete (Defer_Res_199) then
+            Transform_Res_102.Last_Attempted_Child := 0;
+         elsif Defer_Res_199 /= null and then not Is_Ghost (Defer_Res_199) then
+            Transform_Res_102.Last_Attempted_Child := -1;
+         end if;
+
+
+end if;
+
+--  End transform_code
+
+
+   -------------------------------
+   -- END MAIN COMBINATORS CODE --
+   -------------------------------
+
+
+   Set
+     (Parser.Private_Part.Main_Rule_Transform_Parse_0_Memo,
+      Row_Pos_122 /= No_Token_Index,
+      Transform_Res_102,
+      Pos,
+      Row_Pos_122);
+
+
+   Parser.Current_Pos := Row_Pos_122;
+
+   return Transform_Res_102;
+end Main_Rule_Transform_Parse_0;
+
+
+   -----------
+   -- Reset --
+   -----------
+
+   procedure Reset (Parser : in out Parser_Type) is
+      New_Parser : Parser_Type;
+      --  We create this new parser instance to leverage creation of default
+      --  values, so as to not repeat them.
+   begin
+      --  We just keep the private part, to not have to reallocate it
+      New_Parser.Private_Part := Parser.Private_Part;
+
+      --  And then reset everything else
+      Parser := New_Parser;
+
+      --  Reset the memo tables in the private part
+         Bare_Expr_Memos.Clear
+           (Parser.Private_Part.Arith_1_Or_Parse_1_Memo);
+         Bare_Expr_Memos.Clear
+           (Parser.Private_Part.Arith_2_Or_Parse_1_Memo);
+         Bare_Array_Literal_Memos.Clear
+           (Parser.Private_Part.Array_Literal_Transform_Parse_0_Memo);
+         Bare_Decl_Memos.Clear
+           (Parser.Private_Part.Bare_Decl_Or_Parse_0_Memo);
+         Bare_Expr_Memos.Clear
+           (Parser.Private_Part.Basic_Expr_Or_Parse_0_Memo);
+         Bare_Expr_Memos.Clear
+           (Parser.Private_Part.Basic_Name_Or_Parse_0_Memo);
+         Bare_Block_Expr_Memos.Clear
+           (Parser.Private_Part.Block_Transform_Parse_0_Memo);
+         Bare_Char_Lit_Memos.Clear
+           (Parser.Private_Part.Char_Lit_Transform_Parse_0_Memo);
+         Bare_Decl_Annotation_Params_Memos.Clear
+           (Parser.Private_Part.Decl_Annotation_Params_Opt_Parse_0_Memo);
+         Bare_Decl_Annotation_Memos.Clear
+           (Parser.Private_Part.Decl_Annotation_Transform_Parse_0_Memo);
+         Bare_Decl_Block_Memos.Clear
+           (Parser.Private_Part.Decl_Block_List_Parse_0_Memo);
+         Bare_Full_Decl_Memos.Clear
+           (Parser.Private_Part.Decl_Transform_Parse_0_Memo);
+         Bare_Full_Decl_List_Memos.Clear
+           (Parser.Private_Part.Decls_List_Parse_0_Memo);
+         Bare_Def_Id_Memos.Clear
+           (Parser.Private_Part.Def_Id_Transform_Parse_0_Memo);
+         Bare_Doc_Comment_Memos.Clear
+           (Parser.Private_Part.Doc_Comment_Transform_Parse_0_Memo);
+         Bare_Doc_Memos.Clear
+           (Parser.Private_Part.Doc_Transform_Parse_0_Memo);
+         Bare_Enum_Lit_Decl_Memos.Clear
+           (Parser.Private_Part.Enum_Lit_Decl_Transform_Parse_0_Memo);
+         Bare_Expr_Memos.Clear
+           (Parser.Private_Part.Eq_Or_Parse_1_Memo);
+         Bare_Expr_Memos.Clear
+           (Parser.Private_Part.Expr_Or_Parse_1_Memo);
+         Bare_Field_Decl_Memos.Clear
+           (Parser.Private_Part.Field_Decl_Transform_Parse_0_Memo);
+         Bare_Fun_Arg_Decl_Memos.Clear
+           (Parser.Private_Part.Fun_Arg_Decl_Transform_Parse_0_Memo);
+         Bare_Fun_Arg_Decl_List_Memos.Clear
+           (Parser.Private_Part.Fun_Arg_List_List_Parse_0_Memo);
+         Bare_Fun_Decl_Memos.Clear
+           (Parser.Private_Part.Fun_Decl_Transform_Parse_0_Memo);
+         Bare_Generic_Decl_Memos.Clear
+           (Parser.Private_Part.Generic_Decl_Transform_Parse_0_Memo);
+         Bare_Full_Decl_Memos.Clear
+           (Parser.Private_Part.Generic_Formal_Type_Transform_Parse_1_Memo);
+         Bare_Grammar_Cut_Memos.Clear
+           (Parser.Private_Part.Grammar_Cut_Transform_Parse_0_Memo);
+         Bare_Grammar_Decl_Memos.Clear
+           (Parser.Private_Part.Grammar_Decl_Transform_Parse_0_Memo);
+         Bare_Grammar_Discard_Memos.Clear
+           (Parser.Private_Part.Grammar_Discard_Expr_Transform_Parse_0_Memo);
+         Bare_Grammar_Expr_Memos.Clear
+           (Parser.Private_Part.Grammar_Expr_Or_Parse_0_Memo);
+         Bare_Grammar_Implicit_Pick_Memos.Clear
+           (Parser.Private_Part.Grammar_Implicit_Pick_Transform_Parse_0_Memo);
+         Bare_Grammar_List_Memos.Clear
+           (Parser.Private_Part.Grammar_List_Expr_Transform_Parse_2_Memo);
+         Bare_Grammar_Null_Memos.Clear
+           (Parser.Private_Part.Grammar_Null_Transform_Parse_0_Memo);
+         Bare_Grammar_Expr_Memos.Clear
+           (Parser.Private_Part.Grammar_Opt_Or_Parse_0_Memo);
+         Bare_Grammar_Or_Expr_Memos.Clear
+           (Parser.Private_Part.Grammar_Or_Expr_Transform_Parse_0_Memo);
+         Bare_Grammar_Pick_Memos.Clear
+           (Parser.Private_Part.Grammar_Pick_Transform_Parse_0_Memo);
+         Bare_Grammar_Expr_Memos.Clear
+           (Parser.Private_Part.Grammar_Primary_Or_Parse_0_Memo);
+         Bare_Grammar_Rule_Ref_Memos.Clear
+           (Parser.Private_Part.Grammar_Rule_Ref_Transform_Parse_0_Memo);
+         Bare_Grammar_Rule_Decl_Memos.Clear
+           (Parser.Private_Part.Grammar_Rule_Transform_Parse_0_Memo);
+         Bare_Grammar_Skip_Memos.Clear
+           (Parser.Private_Part.Grammar_Skip_Transform_Parse_0_Memo);
+         Bare_Token_Ref_Memos.Clear
+           (Parser.Private_Part.Grammar_Token_Transform_Parse_0_Memo);
+         Bare_Id_Memos.Clear
+           (Parser.Private_Part.Id_Transform_Parse_0_Memo);
+         Bare_If_Expr_Memos.Clear
+           (Parser.Private_Part.If_Expr_Transform_Parse_1_Memo);
+         Bare_Import_Memos.Clear
+           (Parser.Private_Part.Import_Stmt_Transform_Parse_1_Memo);
+         Bare_Import_List_Memos.Clear
+           (Parser.Private_Part.Imports_List_Parse_0_Memo);
+         Bare_Expr_Memos.Clear
+           (Parser.Private_Part.Isa_Or_Primary_Or_Parse_0_Memo);
+         Bare_Lambda_Arg_Decl_Memos.Clear
+           (Parser.Private_Part.Lambda_Arg_Decl_Transform_Parse_0_Memo);
+         Bare_Lambda_Arg_Decl_List_Memos.Clear
+           (Parser.Private_Part.Lambda_Arg_List_List_Parse_0_Memo);
+         Bare_Lambda_Expr_Memos.Clear
+           (Parser.Private_Part.Lambda_Expr_Transform_Parse_0_Memo);
+         Bare_Base_Lexer_Case_Rule_Alt_Memos.Clear
+           (Parser.Private_Part.Lexer_Case_Alt_Or_Parse_0_Memo);
+         Bare_Lexer_Case_Rule_Memos.Clear
+           (Parser.Private_Part.Lexer_Case_Rule_Transform_Parse_0_Memo);
+         Bare_Lexer_Case_Rule_Send_Memos.Clear
+           (Parser.Private_Part.Lexer_Case_Send_Transform_Parse_0_Memo);
+         Bare_Lexer_Decl_Memos.Clear
+           (Parser.Private_Part.Lexer_Decl_Transform_Parse_0_Memo);
+         Bare_Full_Decl_Memos.Clear
+           (Parser.Private_Part.Lexer_Family_Decl_Transform_Parse_1_Memo);
+         Bare_LK_Node_Memos.Clear
+           (Parser.Private_Part.Lexer_Rule_Or_Parse_0_Memo);
+         Bare_Expr_Memos.Clear
+           (Parser.Private_Part.Logic_Or_Parse_0_Memo);
+         Bare_Langkit_Root_Memos.Clear
+           (Parser.Private_Part.Main_Rule_Transform_Parse_0_Memo);
+         Bare_Match_Expr_Memos.Clear
+           (Parser.Private_Part.Match_Expr_Transform_Parse_2_Memo);
+         Bare_Null_Lit_Memos.Clear
+           (Parser.Private_Part.Null_Lit_Transform_Parse_0_Memo);
+         Bare_Num_Lit_Memos.Clear
+           (Parser.Private_Part.Num_Lit_Transform_Parse_0_Memo);
+         Bare_Param_Memos.Clear
+           (Parser.Private_Part.Param_Transform_Parse_0_Memo);
+         Bare_Param_List_Memos.Clear
+           (Parser.Private_Part.Params_List_Parse_0_Memo);
+         Bare_Parse_Node_Expr_Memos.Clear
+           (Parser.Private_Part.Parse_Node_Expr_Transform_Parse_0_Memo);
+         Bare_Expr_Memos.Clear
+           (Parser.Private_Part.Primary_Or_Parse_0_Memo);
+         Bare_Raise_Expr_Memos.Clear
+           (Parser.Private_Part.Raise_Expr_Transform_Parse_0_Memo);
+         Bare_Ref_Id_Memos.Clear
+           (Parser.Private_Part.Ref_Id_Transform_Parse_0_Memo);
+         Bare_Expr_Memos.Clear
+           (Parser.Private_Part.Rel_Or_Parse_0_Memo);
+         Bare_String_Lit_Memos.Clear
+           (Parser.Private_Part.String_Lit_Transform_Parse_0_Memo);
+         Bare_Expr_Memos.Clear
+           (Parser.Private_Part.Term_Or_Parse_0_Memo);
+         Bare_Token_Lit_Memos.Clear
+           (Parser.Private_Part.Token_Literal_Transform_Parse_0_Memo);
+         Bare_Token_No_Case_Lit_Memos.Clear
+           (Parser.Private_Part.Token_No_Case_Literal_Transform_Parse_0_Memo);
+         Bare_Token_Pattern_Lit_Memos.Clear
+           (Parser.Private_Part.Token_Pattern_Literal_Transform_Parse_0_Memo);
+         Bare_Try_Expr_Memos.Clear
+           (Parser.Private_Part.Try_Expr_Transform_Parse_0_Memo);
+         Bare_Named_Type_Decl_Memos.Clear
+           (Parser.Private_Part.Type_Decl_Or_Parse_0_Memo);
+         Bare_Type_Ref_List_Memos.Clear
+           (Parser.Private_Part.Type_List_List_Parse_0_Memo);
+         Bare_Type_Ref_Memos.Clear
+           (Parser.Private_Part.Type_Ref_Or_Parse_0_Memo);
+         Bare_Val_Decl_Memos.Clear
+           (Parser.Private_Part.Val_Decl_Transform_Parse_0_Memo);
+         Bare_Var_Bind_Memos.Clear
+           (Parser.Private_Part.Var_Bind_Transform_Parse_0_Memo);
+   end Reset;
+
+   -------------
+   -- Destroy --
+   -------------
+
+   procedure Destroy (Parser : in out Parser_Type) is
+      procedure Free is new Ada.Unchecked_Deallocation
+        (Parser_Private_Part_Type, Parser_Private_Part);
+      procedure Free is new Ada.Unchecked_Deallocation
+        (Free_Parse_List_Record, Free_Parse_List);
+
+      Cur : Free_Parse_List renames Parser.Private_Part.Parse_Lists;
+
+      procedure Trace_Statistics
+        (Rule_Name : String; Stats : Packrat_Statistics);
+      --  Log Stats to Packrat_Trace
+
+      ----------------------
+      -- Trace_Statistics --
+      ----------------------
+
+      procedure Trace_Statistics
+        (Rule_Name : String; Stats : Packrat_Statistics) is
+      begin
+         GNATCOLL.Traces.Trace
+           (Packrat_Trace,
+            Rule_Name & ": size" & Stats.Size'Image
+            & ", hits" & Stats.Hits'Image
+            & ", misses" & Stats.Misses'Image
+            & ", collisions" & Stats.Collisions'Image);
+      end Trace_Statistics;
+
+   begin
+      if Packrat_Trace.Is_Active then
+         Iterate_Memo_Statistics (Parser, Trace_Statistics'Access);
+      end if;
+
+      while Cur /= null loop
+         declare
+            Next : constant Free_Parse_List := Cur.Next;
+         begin
+            Cur.Nodes.Destroy;
+            Free (Cur);
+            Cur := Next;
+         end;
+      end loop;
+
+         Bare_Expr_Memos.Destroy
+           (Parser.Private_Part.Arith_1_Or_Parse_1_Memo);
+         Bare_Expr_Memos.Destroy
+           (Parser.Private_Part.Arith_2_Or_Parse_1_Memo);
+         Bare_Array_Literal_Memos.Destroy
+           (Parser.Private_Part.Array_Literal_Transform_Parse_0_Memo);
+         Bare_Decl_Memos.Destroy
+           (Parser.Private_Part.Bare_Decl_Or_Parse_0_Memo);
+         Bare_Expr_Memos.Destroy
+           (Parser.Private_Part.Basic_Expr_Or_Parse_0_Memo);
+         Bare_Expr_Memos.Destroy
+           (Parser.Private_Part.Basic_Name_Or_Parse_0_Memo);
+         Bare_Block_Expr_Memos.Destroy
+           (Parser.Private_Part.Block_Transform_Parse_0_Memo);
+         Bare_Char_Lit_Memos.Destroy
+           (Parser.Private_Part.Char_Lit_Transform_Parse_0_Memo);
+         Bare_Decl_Annotation_Params_Memos.Destroy
+           (Parser.Private_Part.Decl_Annotation_Params_Opt_Parse_0_Memo);
+         Bare_Decl_Annotation_Memos.Destroy
+           (Parser.Private_Part.Decl_Annotation_Transform_Parse_0_Memo);
+         Bare_Decl_Block_Memos.Destroy
+           (Parser.Private_Part.Decl_Block_List_Parse_0_Memo);
+         Bare_Full_Decl_Memos.Destroy
+           (Parser.Private_Part.Decl_Transform_Parse_0_Memo);
+         Bare_Full_Decl_List_Memos.Destroy
+           (Parser.Private_Part.Decls_List_Parse_0_Memo);
+         Bare_Def_Id_Memos.Destroy
+           (Parser.Private_Part.Def_Id_Transform_Parse_0_Memo);
+         Bare_Doc_Comment_Memos.Destroy
+           (Parser.Private_Part.Doc_Comment_Transform_Parse_0_Memo);
+         Bare_Doc_Memos.Destroy
+           (Parser.Private_Part.Doc_Transform_Parse_0_Memo);
+         Bare_Enum_Lit_Decl_Memos.Destroy
+           (Parser.Private_Part.Enum_Lit_Decl_Transform_Parse_0_Memo);
+         Bare_Expr_Memos.Destroy
+           (Parser.Private_Part.Eq_Or_Parse_1_Memo);
+         Bare_Expr_Memos.Destroy
+           (Parser.Private_Part.Expr_Or_Parse_1_Memo);
+         Bare_Field_Decl_Memos.Destroy
+           (Parser.Private_Part.Field_Decl_Transform_Parse_0_Memo);
+         Bare_Fun_Arg_Decl_Memos.Destroy
+           (Parser.Private_Part.Fun_Arg_Decl_Transform_Parse_0_Memo);
+         Bare_Fun_Arg_Decl_List_Memos.Destroy
+           (Parser.Private_Part.Fun_Arg_List_List_Parse_0_Memo);
+         Bare_Fun_Decl_Memos.Destroy
+           (Parser.Private_Part.Fun_Decl_Transform_Parse_0_Memo);
+         Bare_Generic_Decl_Memos.Destroy
+           (Parser.Private_Part.Generic_Decl_Transform_Parse_0_Memo);
+         Bare_Full_Decl_Memos.Destroy
+           (Parser.Private_Part.Generic_Formal_Type_Transform_Parse_1_Memo);
+         Bare_Grammar_Cut_Memos.Destroy
+           (Parser.Private_Part.Grammar_Cut_Transform_Parse_0_Memo);
+         Bare_Grammar_Decl_Memos.Destroy
+           (Parser.Private_Part.Grammar_Decl_Transform_Parse_0_Memo);
+         Bare_Grammar_Discard_Memos.Destroy
+           (Parser.Private_Part.Grammar_Discard_Expr_Transform_Parse_0_Memo);
+         Bare_Grammar_Expr_Memos.Destroy
+           (Parser.Private_Part.Grammar_Expr_Or_Parse_0_Memo);
+         Bare_Grammar_Implicit_Pick_Memos.Destroy
+           (Parser.Private_Part.Grammar_Implicit_Pick_Transform_Parse_0_Memo);
+         Bare_Grammar_List_Memos.Destroy
+           (Parser.Private_Part.Grammar_List_Expr_Transform_Parse_2_Memo);
+         Bare_Grammar_Null_Memos.Destroy
+           (Parser.Private_Part.Grammar_Null_Transform_Parse_0_Memo);
+         Bare_Grammar_Expr_Memos.Destroy
+           (Parser.Private_Part.Grammar_Opt_Or_Parse_0_Memo);
+         Bare_Grammar_Or_Expr_Memos.Destroy
+           (Parser.Private_Part.Grammar_Or_Expr_Transform_Parse_0_Memo);
+         Bare_Grammar_Pick_Memos.Destroy
+           (Parser.Private_Part.Grammar_Pick_Transform_Parse_0_Memo);
+         Bare_Grammar_Expr_Memos.Destroy
+           (Parser.Private_Part.Grammar_Primary_Or_Parse_0_Memo);
+         Bare_Grammar_Rule_Ref_Memos.Destroy
+           (Parser.Private_Part.Grammar_Rule_Ref_Transform_Parse_0_Memo);
+         Bare_Grammar_Rule_Decl_Memos.Destroy
+           (Parser.Private_Part.Grammar_Rule_Transform_Parse_0_Memo);
+         Bare_Grammar_Skip_Memos.Destroy
+           (Parser.Private_Part.Grammar_Skip_Transform_Parse_0_Memo);
+         Bare_Token_Ref_Memos.Destroy
+           (Parser.Private_Part.Grammar_Token_Transform_Parse_0_Memo);
+         Bare_Id_Memos.Destroy
+           (Parser.Private_Part.Id_Transform_Parse_0_Memo);
+         Bare_If_Expr_Memos.Destroy
+           (Parser.Private_Part.If_Expr_Transform_Parse_1_Memo);
+         Bare_Import_Memos.Destroy
+           (Parser.Private_Part.Import_Stmt_Transform_Parse_1_Memo);
+         Bare_Import_List_Memos.Destroy
+           (Parser.Private_Part.Imports_List_Parse_0_Memo);
+         Bare_Expr_Memos.Destroy
+           (Parser.Private_Part.Isa_Or_Primary_Or_Parse_0_Memo);
+         Bare_Lambda_Arg_Decl_Memos.Destroy
+           (Parser.Private_Part.Lambda_Arg_Decl_Transform_Parse_0_Memo);
+         Bare_Lambda_Arg_Decl_List_Memos.Destroy
+           (Parser.Private_Part.Lambda_Arg_List_List_Parse_0_Memo);
+         Bare_Lambda_Expr_Memos.Destroy
+           (Parser.Private_Part.Lambda_Expr_Transform_Parse_0_Memo);
+         Bare_Base_Lexer_Case_Rule_Alt_Memos.Destroy
+           (Parser.Private_Part.Lexer_Case_Alt_Or_Parse_0_Memo);
+         Bare_Lexer_Case_Rule_Memos.Destroy
+           (Parser.Private_Part.Lexer_Case_Rule_Transform_Parse_0_Memo);
+         Bare_Lexer_Case_Rule_Send_Memos.Destroy
+           (Parser.Private_Part.Lexer_Case_Send_Transform_Parse_0_Memo);
+         Bare_Lexer_Decl_Memos.Destroy
+           (Parser.Private_Part.Lexer_Decl_Transform_Parse_0_Memo);
+         Bare_Full_Decl_Memos.Destroy
+           (Parser.Private_Part.Lexer_Family_Decl_Transform_Parse_1_Memo);
+         Bare_LK_Node_Memos.Destroy
+           (Parser.Private_Part.Lexer_Rule_Or_Parse_0_Memo);
+         Bare_Expr_Memos.Destroy
+           (Parser.Private_Part.Logic_Or_Parse_0_Memo);
+         Bare_Langkit_Root_Memos.Destroy
+           (Parser.Private_Part.Main_Rule_Transform_Parse_0_Memo);
+         Bare_Match_Expr_Memos.Destroy
+           (Parser.Private_Part.Match_Expr_Transform_Parse_2_Memo);
+         Bare_Null_Lit_Memos.Destroy
+           (Parser.Private_Part.Null_Lit_Transform_Parse_0_Memo);
+         Bare_Num_Lit_Memos.Destroy
+           (Parser.Private_Part.Num_Lit_Transform_Parse_0_Memo);
+         Bare_Param_Memos.Destroy
+           (Parser.Private_Part.Param_Transform_Parse_0_Memo);
+         Bare_Param_List_Memos.Destroy
+           (Parser.Private_Part.Params_List_Parse_0_Memo);
+         Bare_Parse_Node_Expr_Memos.Destroy
+           (Parser.Private_Part.Parse_Node_Expr_Transform_Parse_0_Memo);
+         Bare_Expr_Memos.Destroy
+           (Parser.Private_Part.Primary_Or_Parse_0_Memo);
+         Bare_Raise_Expr_Memos.Destroy
+           (Parser.Private_Part.Raise_Expr_Transform_Parse_0_Memo);
+         Bare_Ref_Id_Memos.Destroy
+           (Parser.Private_Part.Ref_Id_Transform_Parse_0_Memo);
+         Bare_Expr_Memos.Destroy
+           (Parser.Private_Part.Rel_Or_Parse_0_Memo);
+         Bare_String_Lit_Memos.Destroy
+           (Parser.Private_Part.String_Lit_Transform_Parse_0_Memo);
+         Bare_Expr_Memos.Destroy
+           (Parser.Private_Part.Term_Or_Parse_0_Memo);
+         Bare_Token_Lit_Memos.Destroy
+           (Parser.Private_Part.Token_Literal_Transform_Parse_0_Memo);
+         Bare_Token_No_Case_Lit_Memos.Destroy
+           (Parser.Private_Part.Token_No_Case_Literal_Transform_Parse_0_Memo);
+         Bare_Token_Pattern_Lit_Memos.Destroy
+           (Parser.Private_Part.Token_Pattern_Literal_Transform_Parse_0_Memo);
+         Bare_Try_Expr_Memos.Destroy
+           (Parser.Private_Part.Try_Expr_Transform_Parse_0_Memo);
+         Bare_Named_Type_Decl_Memos.Destroy
+           (Parser.Private_Part.Type_Decl_Or_Parse_0_Memo);
+         Bare_Type_Ref_List_Memos.Destroy
+           (Parser.Private_Part.Type_List_List_Parse_0_Memo);
+         Bare_Type_Ref_Memos.Destroy
+           (Parser.Private_Part.Type_Ref_Or_Parse_0_Memo);
+         Bare_Val_Decl_Memos.Destroy
+           (Parser.Private_Part.Val_Decl_Transform_Parse_0_Memo);
+         Bare_Var_Bind_Memos.Destroy
+           (Parser.Private_Part.Var_Bind_Transform_Parse_0_Memo);
+
+      Free (Parser.Private_Part);
+   end Destroy;
+
+   ----------------
+   -- Initialize --
+   ----------------
+
+   procedure Initialize (Parser : in out Parser_Type) is
+   begin
+      Parser.Private_Part := new Parser_Private_Part_Type'(others => <>);
+
+      --  Create memo tables according to per-rule settings
+         
+         Bare_Expr_Memos.Initialize
+           (Parser.Private_Part.Arith_1_Or_Parse_1_Memo, Ring, 16);
+         
+         Bare_Expr_Memos.Initialize
+           (Parser.Private_Part.Arith_2_Or_Parse_1_Memo, Ring, 16);
+         
+         Bare_Array_Literal_Memos.Initialize
+           (Parser.Private_Part.Array_Literal_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Decl_Memos.Initialize
+           (Parser.Private_Part.Bare_Decl_Or_Parse_0_Memo, Ring, 16);
+         
+         Bare_Expr_Memos.Initialize
+           (Parser.Private_Part.Basic_Expr_Or_Parse_0_Memo, Ring, 16);
+         
+         Bare_Expr_Memos.Initialize
+           (Parser.Private_Part.Basic_Name_Or_Parse_0_Memo, Ring, 16);
+         
+         Bare_Block_Expr_Memos.Initialize
+           (Parser.Private_Part.Block_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Char_Lit_Memos.Initialize
+           (Parser.Private_Part.Char_Lit_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Decl_Annotation_Params_Memos.Initialize
+           (Parser.Private_Part.Decl_Annotation_Params_Opt_Parse_0_Memo, Ring, 16);
+         
+         Bare_Decl_Annotation_Memos.Initialize
+           (Parser.Private_Part.Decl_Annotation_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Decl_Block_Memos.Initialize
+           (Parser.Private_Part.Decl_Block_List_Parse_0_Memo, Ring, 16);
+         
+         Bare_Full_Decl_Memos.Initialize
+           (Parser.Private_Part.Decl_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Full_Decl_List_Memos.Initialize
+           (Parser.Private_Part.Decls_List_Parse_0_Memo, Ring, 16);
+         
+         Bare_Def_Id_Memos.Initialize
+           (Parser.Private_Part.Def_Id_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Doc_Comment_Memos.Initialize
+           (Parser.Private_Part.Doc_Comment_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Doc_Memos.Initialize
+           (Parser.Private_Part.Doc_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Enum_Lit_Decl_Memos.Initialize
+           (Parser.Private_Part.Enum_Lit_Decl_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Expr_Memos.Initialize
+           (Parser.Private_Part.Eq_Or_Parse_1_Memo, Ring, 16);
+         
+         Bare_Expr_Memos.Initialize
+           (Parser.Private_Part.Expr_Or_Parse_1_Memo, Ring, 16);
+         
+         Bare_Field_Decl_Memos.Initialize
+           (Parser.Private_Part.Field_Decl_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Fun_Arg_Decl_Memos.Initialize
+           (Parser.Private_Part.Fun_Arg_Decl_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Fun_Arg_Decl_List_Memos.Initialize
+           (Parser.Private_Part.Fun_Arg_List_List_Parse_0_Memo, Ring, 16);
+         
+         Bare_Fun_Decl_Memos.Initialize
+           (Parser.Private_Part.Fun_Decl_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Generic_Decl_Memos.Initialize
+           (Parser.Private_Part.Generic_Decl_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Full_Decl_Memos.Initialize
+           (Parser.Private_Part.Generic_Formal_Type_Transform_Parse_1_Memo, Ring, 16);
+         
+         Bare_Grammar_Cut_Memos.Initialize
+           (Parser.Private_Part.Grammar_Cut_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Grammar_Decl_Memos.Initialize
+           (Parser.Private_Part.Grammar_Decl_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Grammar_Discard_Memos.Initialize
+           (Parser.Private_Part.Grammar_Discard_Expr_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Grammar_Expr_Memos.Initialize
+           (Parser.Private_Part.Grammar_Expr_Or_Parse_0_Memo, Ring, 16);
+         
+         Bare_Grammar_Implicit_Pick_Memos.Initialize
+           (Parser.Private_Part.Grammar_Implicit_Pick_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Grammar_List_Memos.Initialize
+           (Parser.Private_Part.Grammar_List_Expr_Transform_Parse_2_Memo, Ring, 16);
+         
+         Bare_Grammar_Null_Memos.Initialize
+           (Parser.Private_Part.Grammar_Null_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Grammar_Expr_Memos.Initialize
+           (Parser.Private_Part.Grammar_Opt_Or_Parse_0_Memo, Ring, 16);
+         
+         Bare_Grammar_Or_Expr_Memos.Initialize
+           (Parser.Private_Part.Grammar_Or_Expr_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Grammar_Pick_Memos.Initialize
+           (Parser.Private_Part.Grammar_Pick_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Grammar_Expr_Memos.Initialize
+           (Parser.Private_Part.Grammar_Primary_Or_Parse_0_Memo, Ring, 16);
+         
+         Bare_Grammar_Rule_Ref_Memos.Initialize
+           (Parser.Private_Part.Grammar_Rule_Ref_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Grammar_Rule_Decl_Memos.Initialize
+           (Parser.Private_Part.Grammar_Rule_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Grammar_Skip_Memos.Initialize
+           (Parser.Private_Part.Grammar_Skip_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Token_Ref_Memos.Initialize
+           (Parser.Private_Part.Grammar_Token_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Id_Memos.Initialize
+           (Parser.Private_Part.Id_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_If_Expr_Memos.Initialize
+           (Parser.Private_Part.If_Expr_Transform_Parse_1_Memo, Ring, 16);
+         
+         Bare_Import_Memos.Initialize
+           (Parser.Private_Part.Import_Stmt_Transform_Parse_1_Memo, Ring, 16);
+         
+         Bare_Import_List_Memos.Initialize
+           (Parser.Private_Part.Imports_List_Parse_0_Memo, Ring, 16);
+         
+         Bare_Expr_Memos.Initialize
+           (Parser.Private_Part.Isa_Or_Primary_Or_Parse_0_Memo, Ring, 16);
+         
+         Bare_Lambda_Arg_Decl_Memos.Initialize
+           (Parser.Private_Part.Lambda_Arg_Decl_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Lambda_Arg_Decl_List_Memos.Initialize
+           (Parser.Private_Part.Lambda_Arg_List_List_Parse_0_Memo, Ring, 16);
+         
+         Bare_Lambda_Expr_Memos.Initialize
+           (Parser.Private_Part.Lambda_Expr_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Base_Lexer_Case_Rule_Alt_Memos.Initialize
+           (Parser.Private_Part.Lexer_Case_Alt_Or_Parse_0_Memo, Ring, 16);
+         
+         Bare_Lexer_Case_Rule_Memos.Initialize
+           (Parser.Private_Part.Lexer_Case_Rule_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Lexer_Case_Rule_Send_Memos.Initialize
+           (Parser.Private_Part.Lexer_Case_Send_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Lexer_Decl_Memos.Initialize
+           (Parser.Private_Part.Lexer_Decl_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Full_Decl_Memos.Initialize
+           (Parser.Private_Part.Lexer_Family_Decl_Transform_Parse_1_Memo, Ring, 16);
+         
+         Bare_LK_Node_Memos.Initialize
+           (Parser.Private_Part.Lexer_Rule_Or_Parse_0_Memo, Ring, 16);
+         
+         Bare_Expr_Memos.Initialize
+           (Parser.Private_Part.Logic_Or_Parse_0_Memo, Ring, 16);
+         
+         Bare_Langkit_Root_Memos.Initialize
+           (Parser.Private_Part.Main_Rule_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Match_Expr_Memos.Initialize
+           (Parser.Private_Part.Match_Expr_Transform_Parse_2_Memo, Ring, 16);
+         
+         Bare_Null_Lit_Memos.Initialize
+           (Parser.Private_Part.Null_Lit_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Num_Lit_Memos.Initialize
+           (Parser.Private_Part.Num_Lit_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Param_Memos.Initialize
+           (Parser.Private_Part.Param_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Param_List_Memos.Initialize
+           (Parser.Private_Part.Params_List_Parse_0_Memo, Ring, 16);
+         
+         Bare_Parse_Node_Expr_Memos.Initialize
+           (Parser.Private_Part.Parse_Node_Expr_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Expr_Memos.Initialize
+           (Parser.Private_Part.Primary_Or_Parse_0_Memo, Ring, 16);
+         
+         Bare_Raise_Expr_Memos.Initialize
+           (Parser.Private_Part.Raise_Expr_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Ref_Id_Memos.Initialize
+           (Parser.Private_Part.Ref_Id_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Expr_Memos.Initialize
+           (Parser.Private_Part.Rel_Or_Parse_0_Memo, Ring, 16);
+         
+         Bare_String_Lit_Memos.Initialize
+           (Parser.Private_Part.String_Lit_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Expr_Memos.Initialize
+           (Parser.Private_Part.Term_Or_Parse_0_Memo, Ring, 16);
+         
+         Bare_Token_Lit_Memos.Initialize
+           (Parser.Private_Part.Token_Literal_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Token_No_Case_Lit_Memos.Initialize
+           (Parser.Private_Part.Token_No_Case_Literal_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Token_Pattern_Lit_Memos.Initialize
+           (Parser.Private_Part.Token_Pattern_Literal_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Try_Expr_Memos.Initialize
+           (Parser.Private_Part.Try_Expr_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Named_Type_Decl_Memos.Initialize
+           (Parser.Private_Part.Type_Decl_Or_Parse_0_Memo, Ring, 16);
+         
+         Bare_Type_Ref_List_Memos.Initialize
+           (Parser.Private_Part.Type_List_List_Parse_0_Memo, Ring, 16);
+         
+         Bare_Type_Ref_Memos.Initialize
+           (Parser.Private_Part.Type_Ref_Or_Parse_0_Memo, Ring, 16);
+         
+         Bare_Val_Decl_Memos.Initialize
+           (Parser.Private_Part.Val_Decl_Transform_Parse_0_Memo, Ring, 16);
+         
+         Bare_Var_Bind_Memos.Initialize
+           (Parser.Private_Part.Var_Bind_Transform_Parse_0_Memo, Ring, 16);
+   end Initialize;
+
+   -----------------------------
+   -- Iterate_Memo_Statistics --
+   -----------------------------
+
+   procedure Iterate_Memo_Statistics
+     (Parser  : Parser_Type;
+      Process : access procedure
+        (Rule_Name : String; Stats : Packrat_Statistics)) is
+   begin
+         Process
+           ("arith_1",
+            Bare_Expr_Memos.Statistics
+              (Parser.Private_Part.Arith_1_Or_Parse_1_Memo));
+         Process
+           ("arith_2",
+            Bare_Expr_Memos.Statistics
+              (Parser.Private_Part.Arith_2_Or_Parse_1_Memo));
+         Process
+           ("array_literal",
+            Bare_Array_Literal_Memos.Statistics
+              (Parser.Private_Part.Array_Literal_Transform_Parse_0_Memo));
+         Process
+           ("bare_decl",
+            Bare_Decl_Memos.Statistics
+              (Parser.Private_Part.Bare_Decl_Or_Parse_0_Memo));
+         Process
+           ("basic_expr",
+            Bare_Expr_Memos.Statistics
+              (Parser.Private_Part.Basic_Expr_Or_Parse_0_Memo));
+         Process
+           ("basic_name",
+            Bare_Expr_Memos.Statistics
+              (Parser.Private_Part.Basic_Name_Or_Parse_0_Memo));
+         Process
+           ("block",
+            Bare_Block_Expr_Memos.Statistics
+              (Parser.Private_Part.Block_Transform_Parse_0_Memo));
+         Process
+           ("char_lit",
+            Bare_Char_Lit_Memos.Statistics
+              (Parser.Private_Part.Char_Lit_Transform_Parse_0_Memo));
+         Process
+           ("decl_annotation_params",
+            Bare_Decl_Annotation_Params_Memos.Statistics
+              (Parser.Private_Part.Decl_Annotation_Params_Opt_Parse_0_Memo));
+         Process
+           ("decl_annotation",
+            Bare_Decl_Annotation_Memos.Statistics
+              (Parser.Private_Part.Decl_Annotation_Transform_Parse_0_Memo));
+         Process
+           ("decl_block",
+            Bare_Decl_Block_Memos.Statistics
+              (Parser.Private_Part.Decl_Block_List_Parse_0_Memo));
+         Process
+           ("decl",
+            Bare_Full_Decl_Memos.Statistics
+              (Parser.Private_Part.Decl_Transform_Parse_0_Memo));
+         Process
+           ("decls",
+            Bare_Full_Decl_List_Memos.Statistics
+              (Parser.Private_Part.Decls_List_Parse_0_Memo));
+         Process
+           ("def_id",
+            Bare_Def_Id_Memos.Statistics
+              (Parser.Private_Part.Def_Id_Transform_Parse_0_Memo));
+         Process
+           ("doc_comment",
+            Bare_Doc_Comment_Memos.Statistics
+              (Parser.Private_Part.Doc_Comment_Transform_Parse_0_Memo));
+         Process
+           ("doc",
+            Bare_Doc_Memos.Statistics
+              (Parser.Private_Part.Doc_Transform_Parse_0_Memo));
+         Process
+           ("enum_lit_decl",
+            Bare_Enum_Lit_Decl_Memos.Statistics
+              (Parser.Private_Part.Enum_Lit_Decl_Transform_Parse_0_Memo));
+         Process
+           ("eq",
+            Bare_Expr_Memos.Statistics
+              (Parser.Private_Part.Eq_Or_Parse_1_Memo));
+         Process
+           ("expr",
+            Bare_Expr_Memos.Statistics
+              (Parser.Private_Part.Expr_Or_Parse_1_Memo));
+         Process
+           ("field_decl",
+            Bare_Field_Decl_Memos.Statistics
+              (Parser.Private_Part.Field_Decl_Transform_Parse_0_Memo));
+         Process
+           ("fun_arg_decl",
+            Bare_Fun_Arg_Decl_Memos.Statistics
+              (Parser.Private_Part.Fun_Arg_Decl_Transform_Parse_0_Memo));
+         Process
+           ("fun_arg_list",
+            Bare_Fun_Arg_Decl_List_Memos.Statistics
+              (Parser.Private_Part.Fun_Arg_List_List_Parse_0_Memo));
+         Process
+           ("fun_decl",
+            Bare_Fun_Decl_Memos.Statistics
+              (Parser.Private_Part.Fun_Decl_Transform_Parse_0_Memo));
+         Process
+           ("generic_decl",
+            Bare_Generic_Decl_Memos.Statistics
+              (Parser.Private_Part.Generic_Decl_Transform_Parse_0_Memo));
+         Process
+           ("generic_formal_type",
+            Bare_Full_Decl_Memos.Statistics
+              (Parser.Private_Part.Generic_Formal_Type_Transform_Parse_1_Memo));
+         Process
+           ("grammar_cut",
+            Bare_Grammar_Cut_Memos.Statistics
+              (Parser.Private_Part.Grammar_Cut_Transform_Parse_0_Memo));
+         Process
+           ("grammar_decl",
+            Bare_Grammar_Decl_Memos.Statistics
+              (Parser.Private_Part.Grammar_Decl_Transform_Parse_0_Memo));
+         Process
+           ("grammar_discard_expr",
+            Bare_Grammar_Discard_Memos.Statistics
+              (Parser.Private_Part.Grammar_Discard_Expr_Transform_Parse_0_Memo));
+         Process
+           ("grammar_expr",
+            Bare_Grammar_Expr_Memos.Statistics
+              (Parser.Private_Part.Grammar_Expr_Or_Parse_0_Memo));
+         Process
+           ("grammar_implicit_pick",
+            Bare_Grammar_Implicit_Pick_Memos.Statistics
+              (Parser.Private_Part.Grammar_Implicit_Pick_Transform_Parse_0_Memo));
+         Process
+           ("grammar_list_expr",
+            Bare_Grammar_List_Memos.Statistics
+              (Parser.Private_Part.Grammar_List_Expr_Transform_Parse_2_Memo));
+         Process
+           ("grammar_null",
+            Bare_Grammar_Null_Memos.Statistics
+              (Parser.Private_Part.Grammar_Null_Transform_Parse_0_Memo));
+         Process
+           ("grammar_opt",
+            Bare_Grammar_Expr_Memos.Statistics
+              (Parser.Private_Part.Grammar_Opt_Or_Parse_0_Memo));
+         Process
+           ("grammar_or_expr",
+            Bare_Grammar_Or_Expr_Memos.Statistics
+              (Parser.Private_Part.Grammar_Or_Expr_Transform_Parse_0_Memo));
+         Process
+           ("grammar_pick",
+            Bare_Grammar_Pick_Memos.Statistics
+              (Parser.Private_Part.Grammar_Pick_Transform_Parse_0_Memo));
+         Process
+           ("grammar_primary",
+            Bare_Grammar_Expr_Memos.Statistics
+              (Parser.Private_Part.Grammar_Primary_Or_Parse_0_Memo));
+         Process
+           ("grammar_rule_ref",
+            Bare_Grammar_Rule_Ref_Memos.Statistics
+              (Parser.Private_Part.Grammar_Rule_Ref_Transform_Parse_0_Memo));
+         Process
+           ("grammar_rule",
+            Bare_Grammar_Rule_Decl_Memos.Statistics
+              (Parser.Private_Part.Grammar_Rule_Transform_Parse_0_Memo));
+         Process
+           ("grammar_skip",
+            Bare_Grammar_Skip_Memos.Statistics
+              (Parser.Private_Part.Grammar_Skip_Transform_Parse_0_Memo));
+         Process
+           ("grammar_token",
+            Bare_Token_Ref_Memos.Statistics
+              (Parser.Private_Part.Grammar_Token_Transform_Parse_0_Memo));
+         Process
+           ("id",
+            Bare_Id_Memos.Statistics
+              (Parser.Private_Part.Id_Transform_Parse_0_Memo));
+         Process
+           ("if_expr",
+            Bare_If_Expr_Memos.Statistics
+              (Parser.Private_Part.If_Expr_Transform_Parse_1_Memo));
+         Process
+           ("import_stmt",
+            Bare_Import_Memos.Statistics
+              (Parser.Private_Part.Import_Stmt_Transform_Parse_1_Memo));
+         Process
+           ("imports",
+            Bare_Import_List_Memos.Statistics
+              (Parser.Private_Part.Imports_List_Parse_0_Memo));
+         Process
+           ("isa_or_primary",
+            Bare_Expr_Memos.Statistics
+              (Parser.Private_Part.Isa_Or_Primary_Or_Parse_0_Memo));
+         Process
+           ("lambda_arg_decl",
+            Bare_Lambda_Arg_Decl_Memos.Statistics
+              (Parser.Private_Part.Lambda_Arg_Decl_Transform_Parse_0_Memo));
+         Process
+           ("lambda_arg_list",
+            Bare_Lambda_Arg_Decl_List_Memos.Statistics
+              (Parser.Private_Part.Lambda_Arg_List_List_Parse_0_Memo));
+         Process
+           ("lambda_expr",
+            Bare_Lambda_Expr_Memos.Statistics
+              (Parser.Private_Part.Lambda_Expr_Transform_Parse_0_Memo));
+         Process
+           ("lexer_case_alt",
+            Bare_Base_Lexer_Case_Rule_Alt_Memos.Statistics
+              (Parser.Private_Part.Lexer_Case_Alt_Or_Parse_0_Memo));
+         Process
+           ("lexer_case_rule",
+            Bare_Lexer_Case_Rule_Memos.Statistics
+              (Parser.Private_Part.Lexer_Case_Rule_Transform_Parse_0_Memo));
+         Process
+           ("lexer_case_send",
+            Bare_Lexer_Case_Rule_Send_Memos.Statistics
+              (Parser.Private_Part.Lexer_Case_Send_Transform_Parse_0_Memo));
+         Process
+           ("lexer_decl",
+            Bare_Lexer_Decl_Memos.Statistics
+              (Parser.Private_Part.Lexer_Decl_Transform_Parse_0_Memo));
+         Process
+           ("lexer_family_decl",
+            Bare_Full_Decl_Memos.Statistics
+              (Parser.Private_Part.Lexer_Family_Decl_Transform_Parse_1_Memo));
+         Process
+           ("lexer_rule",
+            Bare_LK_Node_Memos.Statistics
+              (Parser.Private_Part.Lexer_Rule_Or_Parse_0_Memo));
+         Process
+           ("logic",
+            Bare_Expr_Memos.Statistics
+              (Parser.Private_Part.Logic_Or_Parse_0_Memo));
+         Process
+           ("main_rule",
+            Bare_Langkit_Root_Memos.Statistics
+              (Parser.Private_Part.Main_Rule_Transform_Parse_0_Memo));
+         Process
+           ("match_expr",
+            Bare_Match_Expr_Memos.Statistics
+              (Parser.Private_Part.Match_Expr_Transform_Parse_2_Memo));
+         Process
+           ("null_lit",
+            Bare_Null_Lit_Memos.Statistics
+              (Parser.Private_Part.Null_Lit_Transform_Parse_0_Memo));
+         Process
+           ("num_lit",
+            Bare_Num_Lit_Memos.Statistics
+              (Parser.Private_Part.Num_Lit_Transform_Parse_0_Memo));
+         Process
+           ("param",
+            Bare_Param_Memos.Statistics
+              (Parser.Private_Part.Param_Transform_Parse_0_Memo));
+         Process
+           ("params",
+            Bare_Param_List_Memos.Statistics
+              (Parser.Private_Part.Params_List_Parse_0_Memo));
+         Process
+           ("parse_node_expr",
+            Bare_Parse_Node_Expr_Memos.Statistics
+              (Parser.Private_Part.Parse_Node_Expr_Transform_Parse_0_Memo));
+         Process
+           ("primary",
+            Bare_Expr_Memos.Statistics
+              (Parser.Private_Part.Primary_Or_Parse_0_Memo));
+         Process
+           ("raise_expr",
+            Bare_Raise_Expr_Memos.Statistics
+              (Parser.Private_Part.Raise_Expr_Transform_Parse_0_Memo));
+         Process
+           ("ref_id",
+            Bare_Ref_Id_Memos.Statistics
+              (Parser.Private_Part.Ref_Id_Transform_Parse_0_Memo));
+         Process
+           ("rel",
+            Bare_Expr_Memos.Statistics
+              (Parser.Private_Part.Rel_Or_Parse_0_Memo));
+         Process
+           ("string_lit",
+            Bare_String_Lit_Memos.Statistics
+              (Parser.Private_Part.String_Lit_Transform_Parse_0_Memo));
+         Process
+           ("term",
+            Bare_Expr_Memos.Statistics
+              (Parser.Private_Part.Term_Or_Parse_0_Memo));
+         Process
+           ("token_literal",
+            Bare_Token_Lit_Memos.Statistics
+              (Parser.Private_Part.Token_Literal_Transform_Parse_0_Memo));
+         Process
+           ("token_no_case_literal",
+            Bare_Token_No_Case_Lit_Memos.Statistics
+              (Parser.Private_Part.Token_No_Case_Literal_Transform_Parse_0_Memo));
+         Process
+           ("token_pattern_literal",
+            Bare_Token_Pattern_Lit_Memos.Statistics
+              (Parser.Private_Part.Token_Pattern_Literal_Transform_Parse_0_Memo));
+         Process
+           ("try_expr",
+            Bare_Try_Expr_Memos.Statistics
+              (Parser.Private_Part.Try_Expr_Transform_Parse_0_Memo));
+         Process
+           ("type_decl",
+            Bare_Named_Type_Decl_Memos.Statistics
+              (Parser.Private_Part.Type_Decl_Or_Parse_0_Memo));
+         Process
+           ("type_list",
+            Bare_Type_Ref_List_Memos.Statistics
+              (Parser.Private_Part.Type_List_List_Parse_0_Memo));
+         Process
+           ("type_ref",
+            Bare_Type_Ref_Memos.Statistics
+              (Parser.Private_Part.Type_Ref_Or_Parse_0_Memo));
+         Process
+           ("val_decl",
+            Bare_Val_Decl_Memos.Statistics
+              (Parser.Private_Part.Val_Decl_Transform_Parse_0_Memo));
+         Process
+           ("var_bind",
+            Bare_Var_Bind_Memos.Statistics
+              (Parser.Private_Part.Var_Bind_Transform_Parse_0_Memo));
+   end Iterate_Memo_Statistics;
+
+   --------------------
+   -- Get_Parse_List --
+   --------------------
+
+   function Get_Parse_List (Parser : Parser_Type) return Free_Parse_List is
+      Lists  : Free_Parse_List renames Parser.Private_Part.Parse_Lists;
+      Result : Free_Parse_List;
+   begin
+      if Lists = null then
+         Result := new Free_Parse_List_Record;
+
+      else
+         Result := Lists;
+         Lists := Lists.Next;
+      end if;
+
+      return Result;
+   end Get_Parse_List;
+
+   ------------------------
+   -- Release_Parse_List --
+   ------------------------
+
+   procedure Release_Parse_List
+     (Parser : Parser_Type; List : in out Free_Parse_List)
+   is
+      Lists  : Free_Parse_List renames Parser.Private_Part.Parse_Lists;
+   begin
+      List.Nodes.Clear;
+      List.Next := Lists;
+      Lists := List;
+      List := null;
+   end Release_Parse_List;
+
+end Liblktlang.Parsers;
@@ -0,0 +1,29743 @@
+
+
+
+
+
+
+
+
+open Ctypes
+open Foreign
+
+let so_ext = if Sys.win32 || Sys.cygwin then "dll" else "so"
+let c_lib_name = Format.sprintf "liblktlang.%s" so_ext
+let c_lib = Dl.dlopen ~filename:c_lib_name ~flags:[Dl.RTLD_NOW]
+
+exception InvalidField of string
+
+exception NodeDataEvaluationError of string
+
+exception InvalidInput of string
+
+exception InvalidSymbolError of string
+
+exception InvalidUnitNameError of string
+
+exception NativeException of string
+
+exception PreconditionFailure of string
+
+exception PropertyError of string
+
+exception TemplateArgsError of string
+
+exception TemplateFormatError of string
+
+exception TemplateInstantiationError of string
+
+exception StaleReferenceError of string
+
+exception UnknownCharset of string
+
+
+
+
+
+exception SyntaxError
+
+module Exception = struct
+
+  type t = {
+    kind : int;
+    information : string;
+  }
+
+  let c_struct : t structure typ = structure "exception"
+  let kind = field c_struct "kind" int
+  let information = field c_struct "information" string
+  let () = seal c_struct
+
+  let wrap c_value_ptr =
+    if is_null c_value_ptr then
+      None
+    else
+      let c_value = !@ c_value_ptr in
+      Some {
+        kind = getf c_value kind;
+        information = getf c_value information;
+      }
+
+  let unwrap value =
+    match value with
+    | None ->
+        from_voidp c_struct null
+    | Some value ->
+        let c_value = make c_struct in
+        setf c_value kind value.kind;
+        setf c_value information value.information;
+        allocate c_struct c_value
+
+  let c_type = view (ptr c_struct) ~read:wrap ~write:unwrap
+
+end
+
+let get_last_exception = foreign ~from:c_lib
+  "lkt_get_last_exception"
+  (void @-> returning Exception.c_type)
+
+(* When declaring an imported function with foreign, use raisable instead of
+ returning, to check get_last_exception before returning *)
+let raisable typ =
+  let read value =
+    match get_last_exception () with
+    | None -> value
+    | Some exc ->
+        (match exc.kind with
+         | 0 ->
+             raise (InvalidField exc.information)
+         | 1 ->
+             raise (NodeDataEvaluationError exc.information)
+         | 2 ->
+             raise (InvalidInput exc.information)
+         | 3 ->
+             raise (InvalidSymbolError exc.information)
+         | 4 ->
+             raise (InvalidUnitNameError exc.information)
+         | 5 ->
+             raise (NativeException exc.information)
+         | 6 ->
+             raise (PreconditionFailure exc.information)
+         | 7 ->
+             raise (PropertyError exc.information)
+         | 8 ->
+             raise (TemplateArgsError exc.information)
+         | 9 ->
+             raise (TemplateFormatError exc.information)
+         | 10 ->
+             raise (TemplateInstantiationError exc.information)
+         | 11 ->
+             raise (StaleReferenceError exc.information)
+         | 12 ->
+             raise (UnknownCharset exc.information)
+         | _ -> assert false)
+  in
+  let write value = value in
+  let new_typ = view typ ~read ~write in
+  returning new_typ
+
+(* Module used to encode/decode UTF32 strings *)
+
+(* Camomile needs to know the location of its standard library to work,
+   so we use the following heuristic:
+   - if the directory chosen at build time exists, we assume the installation
+     is ok
+   - otherwise we look for a directory 'share/camomile' next to the binary
+   - otherwise we fail
+*)
+
+module CamomileDefaultConfig = CamomileLibrary.DefaultConfig
+
+module CamomileShareConfig = struct
+  let (^/) = Filename.concat
+  let bin_dir = Filename.dirname Sys.executable_name
+  let share_dir = bin_dir ^/ Filename.parent_dir_name ^/ "share" ^/ "camomile"
+  let datadir    = share_dir ^/ "database"
+  let localedir  = share_dir ^/ "locales"
+  let charmapdir = share_dir ^/ "charmaps"
+  let unimapdir  = share_dir ^/ "mappings"
+end
+
+module type CamomileConfig = module type of CamomileLibrary.DefaultConfig
+
+let camomile_config =
+  if Sys.file_exists CamomileDefaultConfig.datadir then
+    (module CamomileDefaultConfig : CamomileConfig)
+  else if Sys.file_exists CamomileShareConfig.datadir then
+    (module CamomileShareConfig: CamomileConfig)
+  else failwith "no camomile library found"
+
+module CamomileConfig = (val camomile_config)
+
+module Camomile = CamomileLibrary.Make (CamomileConfig)
+
+module Text = struct
+  type t = string
+
+  let c_struct : t structure typ = structure "text"
+
+  let chars = field c_struct "chars" (ptr uint32_t)
+
+  let length = field c_struct "length" size_t
+
+  let is_allocated = field c_struct "is_allocated" bool
+
+  let () = seal c_struct
+
+  let destroy_text = foreign ~from:c_lib "lkt_destroy_text"
+    (ptr c_struct @-> raisable void)
+
+  module UCS4Encoding = Camomile.CharEncoding.Make (Camomile.UCS4)
+
+  let wrap (c_value : t structure) : t =
+    let open Unsigned.Size_t in
+    let open Camomile in
+    let length = to_int (getf c_value length) in
+    let chars = getf c_value chars in
+    let f i =
+      UChar.chr_of_uint (Unsigned.UInt32.to_int !@ (chars +@ i))
+    in
+    let result = UCS4.init length f in
+    (* Now that the value is fully transformed to an ocaml value, we can
+      free it by calling destroy_text *)
+    destroy_text (addr c_value) ;
+    UCS4Encoding.encode CharEncoding.utf8 result
+
+  let unwrap (value : t) : t structure =
+    let open Unsigned in
+    let open Camomile in
+    let text = UCS4Encoding.decode CharEncoding.utf8 value in
+    let struct_length = Size_t.of_int (UCS4.length text) in
+    let struct_chars = allocate_n uint32_t ~count:(UCS4.length text) in
+    let i = ref 0 in
+    let f c =
+      struct_chars +@ !i <-@ (UInt32.of_int (UChar.code c));
+      i := !i + 1
+    in
+    UCS4.iter f text ;
+    let c_value = make c_struct in
+    setf c_value length struct_length ;
+    setf c_value chars struct_chars ;
+    setf c_value is_allocated false ;
+    (* We don't need to care about calling destroy_text here since we
+     manually allocated the pointer, ctypes will take care of freeing the
+     memory *)
+    c_value
+
+  let c_type = view c_struct ~read:wrap ~write:unwrap
+end
+
+module Character = struct
+  (* Characters are encoded as strings because ocaml char are not unicode
+   characters *)
+  type t = string
+
+  module UCharEncoding = Camomile.CharEncoding.Make (Camomile.UText)
+
+  let of_int i =
+    let open Camomile in
+    let uchar = UChar.chr i in
+    UCharEncoding.encode CharEncoding.utf8 (UText.init 1 (fun _ -> uchar))
+
+  let of_int32 i =
+    of_int (Unsigned.UInt32.to_int i)
+
+  let wrap (c_value : Unsigned.UInt32.t) : t =
+    of_int32 c_value
+
+  let unwrap (value : string) : Unsigned.UInt32.t =
+    let open Camomile in
+    let text = UCharEncoding.decode CharEncoding.utf8 value in
+    let uchar = UText.get text 0 in
+    Unsigned.UInt32.of_int (UChar.code uchar)
+
+  let c_type = view uint32_t ~read:wrap ~write:unwrap
+end
+
+module BigInteger = struct
+
+  type t = Z.t
+
+  let c_type = ptr void
+
+  let create = foreign ~from:c_lib "lkt_create_big_integer"
+    (ptr Text.c_type @-> raisable c_type)
+
+  let text = foreign ~from:c_lib "lkt_big_integer_text"
+    (c_type @-> ptr Text.c_type @-> raisable void)
+
+  let decref = foreign ~from:c_lib "lkt_big_integer_decref"
+    (c_type @-> raisable void)
+
+  let wrap (c_value : unit ptr) : t =
+    let c_text_ptr = allocate_n Text.c_type ~count:1 in
+    text c_value c_text_ptr;
+    decref c_value;
+    Z.of_string (!@ c_text_ptr)
+
+  let unwrap (value : t) : unit ptr =
+    create (allocate Text.c_type (Z.to_string value))
+end
+
+module AnalysisUnitKind = struct
+  type t =
+  | UnitSpecification
+  | UnitBody
+
+  let name () = "AnalysisUnitKind"
+
+  let wrap (c_value : int) : t =
+    match c_value with
+    | 0 -> UnitSpecification
+    | 1 -> UnitBody
+    | _ -> assert false
+
+  let unwrap (value : t) : int =
+    match value with
+    | UnitSpecification -> 0
+    | UnitBody -> 1
+
+   let c_type = view int ~read:wrap ~write:unwrap
+end
+
+module LookupKind = struct
+  type t =
+  | Recursive
+  | Flat
+  | Minimal
+
+  let name () = "LookupKind"
+
+  let wrap (c_value : int) : t =
+    match c_value with
+    | 0 -> Recursive
+    | 1 -> Flat
+    | 2 -> Minimal
+    | _ -> assert false
+
+  let unwrap (value : t) : int =
+    match value with
+    | Recursive -> 0
+    | Flat -> 1
+    | Minimal -> 2
+
+   let c_type = view int ~read:wrap ~write:unwrap
+end
+
+module GrammarRule = struct
+  type t =
+  | MainRuleRule
+  | IdRule
+  | RefIdRule
+  | DefIdRule
+  | ImportStmtRule
+  | ImportsRule
+  | DocCommentRule
+  | DocRule
+  | LexerDeclRule
+  | GrammarDeclRule
+  | GrammarRuleRule
+  | LexerRuleRule
+  | LexerFamilyDeclRule
+  | LexerCaseRuleRule
+  | LexerCaseAltRule
+  | LexerCaseSendRule
+  | GrammarPrimaryRule
+  | GrammarExprRule
+  | GrammarPickRule
+  | GrammarImplicitPickRule
+  | GrammarOptRule
+  | GrammarCutRule
+  | GrammarOrExprRule
+  | GrammarDiscardExprRule
+  | TokenLiteralRule
+  | TokenNoCaseLiteralRule
+  | TokenPatternLiteralRule
+  | ParseNodeExprRule
+  | GrammarRuleRefRule
+  | GrammarListExprRule
+  | GrammarSkipRule
+  | GrammarNullRule
+  | GrammarTokenRule
+  | TypeDeclRule
+  | GenericDeclRule
+  | GenericFormalTypeRule
+  | EnumLitDeclRule
+  | FunDeclRule
+  | LambdaArgDeclRule
+  | FunArgDeclRule
+  | FunArgListRule
+  | LambdaArgListRule
+  | FieldDeclRule
+  | BareDeclRule
+  | DeclRule
+  | TypeRefRule
+  | TypeListRule
+  | DeclsRule
+  | DeclBlockRule
+  | ValDeclRule
+  | VarBindRule
+  | BlockRule
+  | ExprRule
+  | RelRule
+  | EqRule
+  | Arith1Rule
+  | Arith2Rule
+  | IsaOrPrimaryRule
+  | PrimaryRule
+  | MatchExprRule
+  | NumLitRule
+  | StringLitRule
+  | CharLitRule
+  | IfExprRule
+  | RaiseExprRule
+  | TryExprRule
+  | ArrayLiteralRule
+  | LogicRule
+  | BasicExprRule
+  | TermRule
+  | BasicNameRule
+  | LambdaExprRule
+  | NullLitRule
+  | ParamRule
+  | ParamsRule
+  | DeclAnnotationParamsRule
+  | DeclAnnotationRule
+
+  let name () = "GrammarRule"
+
+  let wrap (c_value : int) : t =
+    match c_value with
+    | 0 -> MainRuleRule
+    | 1 -> IdRule
+    | 2 -> RefIdRule
+    | 3 -> DefIdRule
+    | 4 -> ImportStmtRule
+    | 5 -> ImportsRule
+    | 6 -> DocCommentRule
+    | 7 -> DocRule
+    | 8 -> LexerDeclRule
+    | 9 -> GrammarDeclRule
+    | 10 -> GrammarRuleRule
+    | 11 -> LexerRuleRule
+    | 12 -> LexerFamilyDeclRule
+    | 13 -> LexerCaseRuleRule
+    | 14 -> LexerCaseAltRule
+    | 15 -> LexerCaseSendRule
+    | 16 -> GrammarPrimaryRule
+    | 17 -> GrammarExprRule
+    | 18 -> GrammarPickRule
+    | 19 -> GrammarImplicitPickRule
+    | 20 -> GrammarOptRule
+    | 21 -> GrammarCutRule
+    | 22 -> GrammarOrExprRule
+    | 23 -> GrammarDiscardExprRule
+    | 24 -> TokenLiteralRule
+    | 25 -> TokenNoCaseLiteralRule
+    | 26 -> TokenPatternLiteralRule
+    | 27 -> ParseNodeExprRule
+    | 28 -> GrammarRuleRefRule
+    | 29 -> GrammarListExprRule
+    | 30 -> GrammarSkipRule
+    | 31 -> GrammarNullRule
+    | 32 -> GrammarTokenRule
+    | 33 -> TypeDeclRule
+    | 34 -> GenericDeclRule
+    | 35 -> GenericFormalTypeRule
+    | 36 -> EnumLitDeclRule
+    | 37 -> FunDeclRule
+    | 38 -> LambdaArgDeclRule
+    | 39 -> FunArgDeclRule
+    | 40 -> FunArgListRule
+    | 41 -> LambdaArgListRule
+    | 42 -> FieldDeclRule
+    | 43 -> BareDeclRule
+    | 44 -> DeclRule
+    | 45 -> TypeRefRule
+    | 46 -> TypeListRule
+    | 47 -> DeclsRule
+    | 48 -> DeclBlockRule
+    | 49 -> ValDeclRule
+    | 50 -> VarBindRule
+    | 51 -> BlockRule
+    | 52 -> ExprRule
+    | 53 -> RelRule
+    | 54 -> EqRule
+    | 55 -> Arith1Rule
+    | 56 -> Arith2Rule
+    | 57 -> IsaOrPrimaryRule
+    | 58 -> PrimaryRule
+    | 59 -> MatchExprRule
+    | 60 -> NumLitRule
+    | 61 -> StringLitRule
+    | 62 -> CharLitRule
+    | 63 -> IfExprRule
+    | 64 -> RaiseExprRule
+    | 65 -> TryExprRule
+    | 66 -> ArrayLiteralRule
+    | 67 -> LogicRule
+    | 68 -> BasicExprRule
+    | 69 -> TermRule
+    | 70 -> BasicNameRule
+    | 71 -> LambdaExprRule
+    | 72 -> NullLitRule
+    | 73 -> ParamRule
+    | 74 -> ParamsRule
+    | 75 -> DeclAnnotationParamsRule
+    | 76 -> DeclAnnotationRule
+    | _ -> assert false
+
+  let unwrap (value : t) : int =
+    match value with
+    | MainRuleRule -> 0
+    | IdRule -> 1
+    | RefIdRule -> 2
+    | DefIdRule -> 3
+    | ImportStmtRule -> 4
+    | ImportsRule -> 5
+    | DocCommentRule -> 6
+    | DocRule -> 7
+    | LexerDeclRule -> 8
+    | GrammarDeclRule -> 9
+    | GrammarRuleRule -> 10
+    | LexerRuleRule -> 11
+    | LexerFamilyDeclRule -> 12
+    | LexerCaseRuleRule -> 13
+    | LexerCaseAltRule -> 14
+    | LexerCaseSendRule -> 15
+    | GrammarPrimaryRule -> 16
+    | GrammarExprRule -> 17
+    | GrammarPickRule -> 18
+    | GrammarImplicitPickRule -> 19
+    | GrammarOptRule -> 20
+    | GrammarCutRule -> 21
+    | GrammarOrExprRule -> 22
+    | GrammarDiscardExprRule -> 23
+    | TokenLiteralRule -> 24
+    | TokenNoCaseLiteralRule -> 25
+    | TokenPatternLiteralRule -> 26
+    | ParseNodeExprRule -> 27
+    | GrammarRuleRefRule -> 28
+    | GrammarListExprRule -> 29
+    | GrammarSkipRule -> 30
+    | GrammarNullRule -> 31
+    | GrammarTokenRule -> 32
+    | TypeDeclRule -> 33
+    | GenericDeclRule -> 34
+    | GenericFormalTypeRule -> 35
+    | EnumLitDeclRule -> 36
+    | FunDeclRule -> 37
+    | LambdaArgDeclRule -> 38
+    | FunArgDeclRule -> 39
+    | FunArgListRule -> 40
+    | LambdaArgListRule -> 41
+    | FieldDeclRule -> 42
+    | BareDeclRule -> 43
+    | DeclRule -> 44
+    | TypeRefRule -> 45
+    | TypeListRule -> 46
+    | DeclsRule -> 47
+    | DeclBlockRule -> 48
+    | ValDeclRule -> 49
+    | VarBindRule -> 50
+    | BlockRule -> 51
+    | ExprRule -> 52
+    | RelRule -> 53
+    | EqRule -> 54
+    | Arith1Rule -> 55
+    | Arith2Rule -> 56
+    | IsaOrPrimaryRule -> 57
+    | PrimaryRule -> 58
+    | MatchExprRule -> 59
+    | NumLitRule -> 60
+    | StringLitRule -> 61
+    | CharLitRule -> 62
+    | IfExprRule -> 63
+    | RaiseExprRule -> 64
+    | TryExprRule -> 65
+    | ArrayLiteralRule -> 66
+    | LogicRule -> 67
+    | BasicExprRule -> 68
+    | TermRule -> 69
+    | BasicNameRule -> 70
+    | LambdaExprRule -> 71
+    | NullLitRule -> 72
+    | ParamRule -> 73
+    | ParamsRule -> 74
+    | DeclAnnotationParamsRule -> 75
+    | DeclAnnotationRule -> 76
+
+   let c_type = view int ~read:wrap ~write:unwrap
+end
+
+
+let free = foreign ~from:c_lib
+  "lkt_free"
+  (ptr void @-> returning void)
+
+(** Assuming char_ptr is a valid char*, convert it to a native Ocaml
+  * string and free the C pointer.
+  *)
+let unwrap_str char_ptr =
+  let str = Ctypes.coerce (ptr char) string char_ptr in
+  free (Ctypes.coerce (ptr char) (ptr void) char_ptr);
+  str
+
+
+let default_grammar_rule = GrammarRule.MainRuleRule
+
+module Sloc = struct
+  type t = {
+    line : int;
+    column : int;
+  }
+
+  let c_struct : t structure typ = structure "sloc"
+  let line = field c_struct "line" uint32_t
+  let column = field c_struct "column" uint16_t
+  let () = seal c_struct
+
+  let wrap (c_value : t structure) : t = {
+    line = Unsigned.UInt32.to_int (getf c_value line);
+    column = Unsigned.UInt16.to_int (getf c_value column);
+  }
+
+  let unwrap (value : t) : t structure =
+    let c_value = make c_struct in
+    setf c_value line (Unsigned.UInt32.of_int (value.line));
+    setf c_value column (Unsigned.UInt16.of_int (value.column));
+    c_value
+
+  let c_type = view c_struct ~read:wrap ~write:unwrap
+end
+
+module SlocRange = struct
+  type t = {
+    loc_start : Sloc.t;
+    loc_end : Sloc.t;
+  }
+
+  let c_struct : t structure typ = structure "sloc_range"
+  let loc_start = field c_struct "loc_start" Sloc.c_type
+  let loc_end = field c_struct "loc_end" Sloc.c_type
+  let () = seal c_struct
+
+  let wrap (c_value : t structure) : t = {
+    loc_start = getf c_value loc_start;
+    loc_end = getf c_value loc_end;
+  }
+
+  let unwrap (value : t) : t structure =
+    let c_value = make c_struct in
+    setf c_value loc_start value.loc_start;
+    setf c_value loc_end value.loc_end;
+    c_value
+
+  let c_type = view c_struct ~read:wrap ~write:unwrap
+
+  let pp fmt sloc_range =
+    Format.fprintf fmt "<SlocRange %d:%d-%d:%d>"
+      sloc_range.loc_start.line
+      sloc_range.loc_start.column
+      sloc_range.loc_end.line
+      sloc_range.loc_end.column
+end
+
+module Diagnostic = struct
+  type t = {
+    sloc_range : SlocRange.t;
+    message : string
+  }
+
+  let c_struct : t structure typ = structure "diagnostic"
+  let sloc_range = field c_struct "sloc_range" SlocRange.c_type
+  let message = field c_struct "message" Text.c_type
+  let () = seal c_struct
+
+  let wrap (c_value : t structure) : t = {
+    sloc_range = getf c_value sloc_range;
+    message = getf c_value message;
+  }
+
+  let unwrap (value : t) : t structure =
+    let c_value = make c_struct in
+    setf c_value sloc_range value.sloc_range;
+    setf c_value message value.message;
+    c_value
+
+  let c_type = view c_struct ~read:wrap ~write:unwrap
+end
+
+module TokenData = struct
+  type t = unit ptr
+end
+
+module Token = struct
+  type t = {
+    token_data : TokenData.t;
+    token_index : int;
+    trivia_index : int;
+    kind : int;
+    text : string;
+    sloc_range : SlocRange.t;
+  }
+
+  let c_struct : t structure typ = structure "token"
+  let token_data = field c_struct "token_data" (ptr void)
+  let token_index = field c_struct "token_index" int
+  let trivia_index = field c_struct "trivia_index" int
+  let kind = field c_struct "kind" int
+  let text = field c_struct "text" Text.c_type
+  let sloc_range = field c_struct "sloc_range" SlocRange.c_type
+  let () = seal c_struct
+
+  let wrap (c_value : t structure) : t = {
+    token_data = getf c_value token_data;
+    token_index = getf c_value token_index;
+    trivia_index = getf c_value trivia_index;
+    kind = getf c_value kind;
+    text = getf c_value text;
+    sloc_range = getf c_value sloc_range;
+  }
+
+  let unwrap (value : t) : t structure =
+    let c_value = make c_struct in
+    setf c_value token_data value.token_data;
+    setf c_value token_index value.token_index;
+    setf c_value trivia_index value.trivia_index;
+    setf c_value kind value.kind;
+    setf c_value text value.text;
+    setf c_value sloc_range value.sloc_range;
+    c_value
+
+  let c_type = view c_struct ~read:wrap ~write:unwrap
+
+  let _token_kind_name = foreign ~from:c_lib
+    "lkt_token_kind_name"
+    (int @-> raisable (ptr char))
+
+  let token_kind_name kind =
+    unwrap_str (_token_kind_name kind)
+
+  let kind_name token = token_kind_name token.kind
+
+  let token_range_text = foreign ~from:c_lib
+    "lkt_token_range_text"
+    (ptr c_type @-> ptr c_type @-> ptr Text.c_type @-> raisable int)
+
+  let token_next = foreign ~from:c_lib
+    "lkt_token_next"
+    (ptr c_type @-> ptr c_type @-> raisable void)
+
+  let token_previous = foreign ~from:c_lib
+    "lkt_token_previous"
+    (ptr c_type @-> ptr c_type @-> raisable void)
+
+  let is_equivalent = foreign ~from:c_lib
+    "lkt_token_is_equivalent"
+    (ptr c_type @-> ptr c_type @-> raisable bool)
+
+  let pp fmt token =
+    let pp_text fmt = function
+      | "" -> Format.pp_print_string fmt ""
+      | _ as text -> Format.fprintf fmt " %S" text
+    in
+    Format.fprintf fmt "<Token %s%a at %a>"
+      (kind_name token)
+      pp_text token.text
+      SlocRange.pp token.sloc_range
+
+  let text_range token_first token_last =
+    let c_result_ptr = allocate_n Text.c_type ~count:1 in
+    let res =
+      token_range_text
+        (allocate c_type token_first)
+        (allocate c_type token_last)
+        c_result_ptr
+    in
+    if res = 0 then
+      raise (Invalid_argument
+        (Format.asprintf "%a and %a come from different units"
+          pp token_first
+          pp token_last));
+    !@ c_result_ptr
+
+  let next token =
+    let c_next_token_ptr = allocate_n c_type ~count:1 in
+    token_next (allocate c_type token) c_next_token_ptr ;
+    !@ c_next_token_ptr
+
+  let previous token =
+    let c_next_token_ptr = allocate_n c_type ~count:1 in
+    token_previous (allocate c_type token) c_next_token_ptr ;
+    !@ c_next_token_ptr
+
+  let is_trivia token =
+    token.trivia_index != 0
+
+  let index token =
+    match token.trivia_index with
+    | 0 ->
+        token.token_index - 1
+    | _ ->
+        token.trivia_index - 1
+
+  let compare one other =
+    let open Pervasives in
+    let compare_token_data = compare one.token_data other.token_data in
+    if compare_token_data = 0 then
+      let compare_token_index = compare one.token_index other.token_index in
+      if compare_token_index = 0 then
+        compare one.trivia_index other.trivia_index
+      else
+        compare_token_index
+    else
+      compare_token_data
+
+  let equal one other =
+    compare one other = 0
+
+  let hash token =
+    Hashtbl.hash
+      (token.token_data
+       , token.token_index
+       , token.trivia_index)
+
+  let is_equivalent one other =
+    is_equivalent (allocate c_type one) (allocate c_type other)
+
+end
+
+module TokenTable = struct
+  type int32_column = (int32, Bigarray.int32_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+  type uint16_column = (int, Bigarray.int16_unsigned_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+  type uint8_column = (int, Bigarray.int8_unsigned_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+
+  type t = {
+    kinds : int32_column;
+    start_offsets : int32_column;
+    end_offsets : int32_column;
+    start_lines : int32_column;
+    end_lines : int32_column;
+    start_columns : uint16_column;
+    end_columns : uint16_column;
+    is_trivia : uint8_column;
+  }
+
+  let c_struct : t structure typ = structure "token_table"
+  let count = field c_struct "count" int
+  let kinds = field c_struct "kinds" (ptr void)
+  let start_offsets = field c_struct "start_offsets" (ptr void)
+  let end_offsets = field c_struct "end_offsets" (ptr void)
+  let start_lines = field c_struct "start_lines" (ptr void)
+  let end_lines = field c_struct "end_lines" (ptr void)
+  let start_columns = field c_struct "start_columns" (ptr void)
+  let end_columns = field c_struct "end_columns" (ptr void)
+  let is_trivia = field c_struct "is_trivia" (ptr void)
+  let () = seal c_struct
+
+  let create length =
+    let column kind = Bigarray.Array1.create kind Bigarray.c_layout length in
+    {
+      kinds = column Bigarray.int32;
+      start_offsets = column Bigarray.int32;
+      end_offsets = column Bigarray.int32;
+      start_lines = column Bigarray.int32;
+      end_lines = column Bigarray.int32;
+      start_columns = column Bigarray.int16_unsigned;
+      end_columns = column Bigarray.int16_unsigned;
+      is_trivia = column Bigarray.int8_unsigned;
+    }
+
+  let length table = Bigarray.Array1.dim table.kinds
+
+  let unwrap (value : t) : t structure =
+    (* Bigarrays are allocated out of the OCaml heap, so the C API can fill
+       them in place: no copy is required. *)
+    let start column = to_voidp (bigarray_start array1 column) in
+    let c_value = make c_struct in
+    setf c_value count (length value);
+    setf c_value kinds (start value.kinds);
+    setf c_value start_offsets (start value.start_offsets);
+    setf c_value end_offsets (start value.end_offsets);
+    setf c_value start_lines (start value.start_lines);
+    setf c_value end_lines (start value.end_lines);
+    setf c_value start_columns (start value.start_columns);
+    setf c_value end_columns (start value.end_columns);
+    setf c_value is_trivia (start value.is_trivia);
+    c_value
+
+  let kind_name table index =
+    let kind = Bigarray.Array1.get table.kinds index in
+    Token.token_kind_name (Int32.to_int kind)
+
+  let is_trivia table index = Bigarray.Array1.get table.is_trivia index <> 0
+end
+
+module UnitProvider = struct
+  (* The real C type of a context is a void*. But we use a pointer to this
+     type, to be able to allocate a value of t and attach a finalizer to it. *)
+  type t = unit ptr ptr
+
+  let c_type = ptr void
+
+  let null = allocate c_type null
+
+  
+
+end
+
+module BareNode = struct
+  type t = unit ptr
+end
+
+module Rebindings = struct
+  type t = unit ptr
+end
+
+
+
+      
+module EntityInfoStruct = struct
+  type t
+
+   
+  let c_type : t structure typ = structure "entity_info"
+  let rebindings =
+    field c_type "rebindings" (ptr void)
+  let from_rebound =
+    field c_type "from_rebound" bool
+  let () = seal c_type
+
+end
+
+         
+module EntityStruct = struct
+  type t
+
+   
+  let c_type : t structure typ = structure "lk_node"
+  let node =
+    field c_type "node" (ptr void)
+  let info =
+    field c_type "info" EntityInfoStruct.c_type
+  let () = seal c_type
+
+end
+
+      
+module AnalysisUnitStruct : sig
+  type t = unit ptr
+
+  val c_type : t typ
+
+  val unit_root : t -> EntityStruct.t structure ptr -> unit
+
+  val unit_diagnostic_count : t -> int
+
+  val unit_diagnostic : t -> int -> Diagnostic.t ptr -> int
+
+  val unit_filename : t -> char ptr
+
+  val unit_reparse_from_file : t -> string -> int
+
+  val unit_reparse_from_buffer :
+    t -> string -> string -> Unsigned.size_t -> int
+
+  val unit_first_token : t -> Token.t ptr -> unit
+
+  val unit_last_token : t -> Token.t ptr -> unit
+
+  val unit_token_count : t -> int
+
+  val unit_trivia_count : t -> int
+
+  val unit_export_tokens : t -> TokenTable.t structure ptr -> int
+end = struct
+  (* Module defining the c structure of an analysis unit *)
+
+  type t = unit ptr
+  let c_type = ptr void
+
+  let unit_root = foreign ~from:c_lib "lkt_unit_root"
+    (c_type @-> ptr EntityStruct.c_type @-> raisable void)
+
+  let unit_diagnostic_count = foreign ~from:c_lib
+    "lkt_unit_diagnostic_count"
+    (c_type @-> raisable int)
+
+  let unit_diagnostic = foreign ~from:c_lib
+    "lkt_unit_diagnostic"
+    (c_type @-> int @-> ptr Diagnostic.c_type @-> raisable int)
+
+  let unit_filename = foreign ~from:c_lib
+    "lkt_unit_filename"
+    (c_type @-> raisable (ptr char))
+
+  let unit_reparse_from_file = foreign ~from:c_lib
+    "lkt_unit_reparse_from_file"
+    (c_type
+     @-> string
+     @-> raisable int)
+
+  let unit_reparse_from_buffer = foreign ~from:c_lib
+    "lkt_unit_reparse_from_buffer"
+    (c_type
+     @-> string
+     @-> string
+     @-> size_t
+     @-> raisable int)
+
+  let unit_first_token = foreign ~from:c_lib
+    "lkt_unit_first_token"
+    (c_type
+     @-> ptr Token.c_type
+     @-> raisable void)
+
+  let unit_last_token = foreign ~from:c_lib
+    "lkt_unit_last_token"
+    (c_type
+     @-> ptr Token.c_type
+     @-> raisable void)
+
+  let unit_token_count = foreign ~from:c_lib
+    "lkt_unit_token_count"
+    (c_type @-> raisable int)
+
+  let unit_trivia_count = foreign ~from:c_lib
+    "lkt_unit_trivia_count"
+    (c_type @-> raisable int)
+
+  let unit_export_tokens = foreign ~from:c_lib
+    "lkt_unit_export_tokens"
+    (c_type @-> ptr TokenTable.c_struct @-> raisable int)
+end
+
+
+      
+module AnalysisContextStruct : sig
+  type t
+
+  val c_type : t typ
+
+  val create_analysis_context : string -> unit ptr -> bool -> int -> t
+
+  val get_analysis_unit_from_file :
+    t -> string -> string -> bool -> GrammarRule.t -> AnalysisUnitStruct.t
+
+  val get_analysis_unit_from_buffer :
+    t
+    -> string (* Filename *)
+    -> string (* Charset *)
+    -> string (* Buffer *)
+    -> Unsigned.size_t (* Buffer size *)
+    -> GrammarRule.t
+    -> AnalysisUnitStruct.t
+end = struct
+  (* Module defining the c structure of an analysis context *)
+
+  (* The real C type of a context is a void*. But we use a pointer to this
+     type, to be able to allocate a value of t and attach a finalizer to it.
+     See wrap function *)
+  type t = unit ptr ptr
+
+  let unwrap (value : t) : unit ptr = !@value
+
+  let context_decref =
+    let f =
+      foreign ~from:c_lib "lkt_context_decref"
+        (ptr void @-> raisable void)
+    in
+    fun ctx -> f (unwrap ctx)
+
+  let wrap (c_value : unit ptr) : t =
+    (* To deallocate cleanly the context, we need to call context_decref.
+       Allocate a value and attach a finalizer to it *)
+    allocate ~finalise:context_decref (ptr void) c_value
+
+  let c_type = view (ptr void) ~read:wrap ~write:unwrap
+
+  let create_analysis_context =
+    foreign ~from:c_lib "lkt_create_analysis_context"
+      (string @-> UnitProvider.c_type @-> bool @-> int @-> raisable c_type)
+
+  let get_analysis_unit_from_file =
+    foreign ~from:c_lib "lkt_get_analysis_unit_from_file"
+      ( c_type @-> string @-> string @-> bool @-> GrammarRule.c_type
+      @-> raisable AnalysisUnitStruct.c_type )
+
+  let get_analysis_unit_from_buffer =
+    foreign ~from:c_lib "lkt_get_analysis_unit_from_buffer"
+      ( c_type @-> string (* Filename *) @-> string (* Charset *)
+      @-> string (* Buffer *) @-> size_t (* Buffer size *)
+      @-> GrammarRule.c_type
+      @-> raisable AnalysisUnitStruct.c_type )
+
+end
+
+      
+module Symbol : sig
+  type t = string
+
+  val c_type : t structure typ
+
+  val wrap : (t structure) -> t
+
+  val unwrap : AnalysisContextStruct.t -> t -> (t structure)
+
+  val symbol_text : t structure ptr -> string ptr -> unit
+
+  val context_symbol :
+    AnalysisContextStruct.t -> string ptr -> t structure ptr -> int
+end = struct
+  type t = string
+
+  let c_type : t structure typ = structure "symbol"
+  let data = field c_type "data" (ptr void)
+  let bounds = field c_type "bounds" (ptr void)
+  let () = seal c_type
+
+  let symbol_text = foreign ~from:c_lib "lkt_symbol_text"
+    (ptr c_type @-> ptr Text.c_type @-> raisable void)
+
+  let wrap (c_value : t structure) : t =
+    let c_result_ptr = allocate_n Text.c_type ~count:1 in
+    symbol_text (addr c_value) c_result_ptr;
+    !@ c_result_ptr
+
+  let context_symbol = foreign ~from:c_lib "lkt_context_symbol"
+    (AnalysisContextStruct.c_type
+     @-> ptr Text.c_type
+     @-> ptr c_type
+     @-> raisable int)
+
+  let unwrap (ctx : AnalysisContextStruct.t) (value : t) : t structure =
+    let result = make c_type in
+    let code =
+      context_symbol ctx (allocate Text.c_type value) (addr result)
+    in
+    if code = 0 then
+      raise (InvalidSymbolError value) ;
+    result
+end
+
+         
+module TextTypeStruct = struct
+  
+
+  type t
+
+  let c_struct : t structure typ = structure "text_type"
+  let n = field c_struct "n" int
+  let _ = field c_struct "ref_count" int
+  let items = field c_struct "items" uint32_t
+  let () = seal c_struct
+
+  let c_type = ptr c_struct
+
+  let create = foreign ~from:c_lib "lkt_text_type_create"
+    (int @-> raisable c_type)
+  let dec_ref = foreign ~from:c_lib "lkt_text_type_dec_ref"
+    (c_type @-> raisable void)
+
+end
+
+      
+module SemanticResultStruct = struct
+  type t
+
+   
+  let c_type : t structure typ = structure "semantic_result"
+  let node =
+    field c_type "node" (ptr void)
+  let result_type =
+    field c_type "result_type" EntityStruct.c_type
+  let result_ref =
+    field c_type "result_ref" EntityStruct.c_type
+  let has_error =
+    field c_type "has_error" bool
+  let error_message =
+    field c_type "error_message" TextTypeStruct.c_type
+  let exempt_analysis =
+    field c_type "exempt_analysis" bool
+  let () = seal c_type
+
+end
+
+         
+module SemanticResultArrayStruct = struct
+  
+
+  type t
+
+  let c_struct : t structure typ = structure "semantic_result_array"
+  let n = field c_struct "n" int
+  let _ = field c_struct "ref_count" int
+  let items = field c_struct "items"
+    SemanticResultStruct.c_type
+  let () = seal c_struct
+
+  let c_type = ptr c_struct
+
+  let create = foreign ~from:c_lib "lkt_semantic_result_array_create"
+    (int @-> raisable c_type)
+  let dec_ref = foreign ~from:c_lib "lkt_semantic_result_array_dec_ref"
+    (c_type @-> raisable void)
+
+end
+
+      
+module TreeSemanticResultStruct = struct
+  type t
+
+   
+  let c_type : t structure typ = structure "tree_semantic_result"
+  let results =
+    field c_type "results" SemanticResultArrayStruct.c_type
+  let has_error =
+    field c_type "has_error" bool
+  let () = seal c_type
+
+end
+
+         
+module LKNodeArrayStruct = struct
+  
+
+  type t
+
+  let c_struct : t structure typ = structure "lk_node_array"
+  let n = field c_struct "n" int
+  let _ = field c_struct "ref_count" int
+  let items = field c_struct "items"
+    EntityStruct.c_type
+  let () = seal c_struct
+
+  let c_type = ptr c_struct
+
+  let create = foreign ~from:c_lib "lkt_lk_node_array_create"
+    (int @-> raisable c_type)
+  let dec_ref = foreign ~from:c_lib "lkt_lk_node_array_dec_ref"
+    (c_type @-> raisable void)
+
+end
+
+
+module CFunctions = struct
+  let node_kind = foreign ~from:c_lib "lkt_node_kind"
+    (ptr EntityStruct.c_type @-> raisable int)
+
+  let image = foreign ~from:c_lib "lkt_node_image"
+    (ptr EntityStruct.c_type
+     @-> ptr Text.c_type
+     @-> raisable void)
+
+  let node_sloc_range = foreign ~from:c_lib
+    "lkt_node_sloc_range"
+    (ptr EntityStruct.c_type
+     @-> ptr SlocRange.c_type
+     @-> raisable void)
+
+  let lookup_in_node = foreign ~from:c_lib
+    "lkt_lookup_in_node"
+    (ptr EntityStruct.c_type
+     @-> ptr Sloc.c_type
+     @-> ptr EntityStruct.c_type
+     @-> raisable void)
+
+  let entity_image = foreign ~from:c_lib
+    "lkt_entity_image"
+    (ptr EntityStruct.c_type
+     @-> ptr Text.c_type
+     @-> raisable void)
+
+  let node_is_token_node = foreign ~from:c_lib
+    "lkt_node_is_token_node"
+    (ptr EntityStruct.c_type
+     @-> raisable bool)
+
+  let lk_node_p_node_type = foreign ~from:c_lib
+    "lkt_lk_node_p_node_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lk_node_p_char_type = foreign ~from:c_lib
+    "lkt_lk_node_p_char_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lk_node_p_int_type = foreign ~from:c_lib
+    "lkt_lk_node_p_int_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lk_node_p_bool_type = foreign ~from:c_lib
+    "lkt_lk_node_p_bool_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lk_node_p_bigint_type = foreign ~from:c_lib
+    "lkt_lk_node_p_bigint_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lk_node_p_string_type = foreign ~from:c_lib
+    "lkt_lk_node_p_string_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lk_node_p_symbol_type = foreign ~from:c_lib
+    "lkt_lk_node_p_symbol_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lk_node_p_regexp_type = foreign ~from:c_lib
+    "lkt_lk_node_p_regexp_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lk_node_p_array_gen_type = foreign ~from:c_lib
+    "lkt_lk_node_p_array_gen_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lk_node_p_astlist_gen_type = foreign ~from:c_lib
+    "lkt_lk_node_p_astlist_gen_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lk_node_p_iterator_gen_trait = foreign ~from:c_lib
+    "lkt_lk_node_p_iterator_gen_trait"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lk_node_p_check_semantic = foreign ~from:c_lib
+    "lkt_lk_node_p_check_semantic"
+    (ptr EntityStruct.c_type
+    @-> ptr TreeSemanticResultStruct.c_type
+    @-> raisable int)
+
+  let lk_node_parent = foreign ~from:c_lib
+    "lkt_lk_node_parent"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lk_node_parents = foreign ~from:c_lib
+    "lkt_lk_node_parents"
+    (ptr EntityStruct.c_type
+    @-> ptr LKNodeArrayStruct.c_type
+    @-> raisable int)
+
+  let lk_node_children = foreign ~from:c_lib
+    "lkt_lk_node_children"
+    (ptr EntityStruct.c_type
+    @-> ptr LKNodeArrayStruct.c_type
+    @-> raisable int)
+
+  let lk_node_token_start = foreign ~from:c_lib
+    "lkt_lk_node_token_start"
+    (ptr EntityStruct.c_type
+    @-> ptr Token.c_type
+    @-> raisable int)
+
+  let lk_node_token_end = foreign ~from:c_lib
+    "lkt_lk_node_token_end"
+    (ptr EntityStruct.c_type
+    @-> ptr Token.c_type
+    @-> raisable int)
+
+  let lk_node_child_index = foreign ~from:c_lib
+    "lkt_lk_node_child_index"
+    (ptr EntityStruct.c_type
+    @-> ptr int
+    @-> raisable int)
+
+  let lk_node_previous_sibling = foreign ~from:c_lib
+    "lkt_lk_node_previous_sibling"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lk_node_next_sibling = foreign ~from:c_lib
+    "lkt_lk_node_next_sibling"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lk_node_unit = foreign ~from:c_lib
+    "lkt_lk_node_unit"
+    (ptr EntityStruct.c_type
+    @-> ptr AnalysisUnitStruct.c_type
+    @-> raisable int)
+
+  let lk_node_is_ghost = foreign ~from:c_lib
+    "lkt_lk_node_is_ghost"
+    (ptr EntityStruct.c_type
+    @-> ptr bool
+    @-> raisable int)
+
+  let lk_node_full_sloc_image = foreign ~from:c_lib
+    "lkt_lk_node_full_sloc_image"
+    (ptr EntityStruct.c_type
+    @-> ptr TextTypeStruct.c_type
+    @-> raisable int)
+
+  let base_lexer_case_rule_alt_f_send = foreign ~from:c_lib
+    "lkt_base_lexer_case_rule_alt_f_send"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lexer_case_rule_cond_alt_f_cond_exprs = foreign ~from:c_lib
+    "lkt_lexer_case_rule_cond_alt_f_cond_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let decl_f_syn_name = foreign ~from:c_lib
+    "lkt_decl_f_syn_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let decl_p_name = foreign ~from:c_lib
+    "lkt_decl_p_name"
+    (ptr EntityStruct.c_type
+    @-> ptr Symbol.c_type
+    @-> raisable int)
+
+  let grammar_decl_f_rules = foreign ~from:c_lib
+    "lkt_grammar_decl_f_rules"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_decl_p_lexer = foreign ~from:c_lib
+    "lkt_grammar_decl_p_lexer"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let base_grammar_rule_decl_f_expr = foreign ~from:c_lib
+    "lkt_base_grammar_rule_decl_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let base_val_decl_p_get_type = foreign ~from:c_lib
+    "lkt_base_val_decl_p_get_type"
+    (ptr EntityStruct.c_type
+        
+    @-> bool
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let explicitly_typed_decl_f_decl_type = foreign ~from:c_lib
+    "lkt_explicitly_typed_decl_f_decl_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let component_decl_f_default_val = foreign ~from:c_lib
+    "lkt_component_decl_f_default_val"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let val_decl_f_val = foreign ~from:c_lib
+    "lkt_val_decl_f_val"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let fun_decl_f_args = foreign ~from:c_lib
+    "lkt_fun_decl_f_args"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let fun_decl_f_return_type = foreign ~from:c_lib
+    "lkt_fun_decl_f_return_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let fun_decl_f_body = foreign ~from:c_lib
+    "lkt_fun_decl_f_body"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let generic_decl_f_generic_formal_decls = foreign ~from:c_lib
+    "lkt_generic_decl_f_generic_formal_decls"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let generic_decl_f_decl = foreign ~from:c_lib
+    "lkt_generic_decl_f_decl"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lexer_decl_f_rules = foreign ~from:c_lib
+    "lkt_lexer_decl_f_rules"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lexer_family_decl_f_rules = foreign ~from:c_lib
+    "lkt_lexer_family_decl_f_rules"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let type_decl_f_traits = foreign ~from:c_lib
+    "lkt_type_decl_f_traits"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let type_decl_p_implemented_traits = foreign ~from:c_lib
+    "lkt_type_decl_p_implemented_traits"
+    (ptr EntityStruct.c_type
+    @-> ptr LKNodeArrayStruct.c_type
+    @-> raisable int)
+
+  let type_decl_f_base_type = foreign ~from:c_lib
+    "lkt_type_decl_f_base_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let type_decl_p_base_types = foreign ~from:c_lib
+    "lkt_type_decl_p_base_types"
+    (ptr EntityStruct.c_type
+    @-> ptr LKNodeArrayStruct.c_type
+    @-> raisable int)
+
+  let type_decl_p_root_type = foreign ~from:c_lib
+    "lkt_type_decl_p_root_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let type_decl_p_is_subtype = foreign ~from:c_lib
+    "lkt_type_decl_p_is_subtype"
+    (ptr EntityStruct.c_type
+        
+    @-> ptr EntityStruct.c_type
+    @-> ptr bool
+    @-> raisable int)
+
+  let type_decl_p_is_generic = foreign ~from:c_lib
+    "lkt_type_decl_p_is_generic"
+    (ptr EntityStruct.c_type
+    @-> ptr bool
+    @-> raisable int)
+
+  let instantiated_generic_type_p_get_inner_type = foreign ~from:c_lib
+    "lkt_instantiated_generic_type_p_get_inner_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let instantiated_generic_type_p_get_actuals = foreign ~from:c_lib
+    "lkt_instantiated_generic_type_p_get_actuals"
+    (ptr EntityStruct.c_type
+    @-> ptr LKNodeArrayStruct.c_type
+    @-> raisable int)
+
+  let instantiated_generic_type_p_get_instantiated_type = foreign ~from:c_lib
+    "lkt_instantiated_generic_type_p_get_instantiated_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let named_type_decl_f_decls = foreign ~from:c_lib
+    "lkt_named_type_decl_f_decls"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let enum_class_decl_f_branches = foreign ~from:c_lib
+    "lkt_enum_class_decl_f_branches"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let enum_type_decl_f_literals = foreign ~from:c_lib
+    "lkt_enum_type_decl_f_literals"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let decl_annotation_f_name = foreign ~from:c_lib
+    "lkt_decl_annotation_f_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let decl_annotation_f_params = foreign ~from:c_lib
+    "lkt_decl_annotation_f_params"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let decl_annotation_params_f_params = foreign ~from:c_lib
+    "lkt_decl_annotation_params_f_params"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let doc_f_lines = foreign ~from:c_lib
+    "lkt_doc_f_lines"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let elsif_branch_f_cond_expr = foreign ~from:c_lib
+    "lkt_elsif_branch_f_cond_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let elsif_branch_f_then_expr = foreign ~from:c_lib
+    "lkt_elsif_branch_f_then_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let enum_class_case_f_decls = foreign ~from:c_lib
+    "lkt_enum_class_case_f_decls"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let excludes_null_p_as_bool = foreign ~from:c_lib
+    "lkt_excludes_null_p_as_bool"
+    (ptr EntityStruct.c_type
+    @-> ptr bool
+    @-> raisable int)
+
+  let expr_p_in_type_ref = foreign ~from:c_lib
+    "lkt_expr_p_in_type_ref"
+    (ptr EntityStruct.c_type
+    @-> ptr bool
+    @-> raisable int)
+
+  let expr_p_is_regular_expr = foreign ~from:c_lib
+    "lkt_expr_p_is_regular_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr bool
+    @-> raisable int)
+
+  let expr_p_expr_type = foreign ~from:c_lib
+    "lkt_expr_p_expr_type"
+    (ptr EntityStruct.c_type
+    @-> ptr SemanticResultStruct.c_type
+    @-> raisable int)
+
+  let expr_p_check_expr_type = foreign ~from:c_lib
+    "lkt_expr_p_check_expr_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let expr_p_expr_context_free_type = foreign ~from:c_lib
+    "lkt_expr_p_expr_context_free_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let expr_p_referenced_decl = foreign ~from:c_lib
+    "lkt_expr_p_referenced_decl"
+    (ptr EntityStruct.c_type
+    @-> ptr SemanticResultStruct.c_type
+    @-> raisable int)
+
+  let expr_p_check_referenced_decl = foreign ~from:c_lib
+    "lkt_expr_p_check_referenced_decl"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let array_literal_f_exprs = foreign ~from:c_lib
+    "lkt_array_literal_f_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let bin_op_f_left = foreign ~from:c_lib
+    "lkt_bin_op_f_left"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let bin_op_f_op = foreign ~from:c_lib
+    "lkt_bin_op_f_op"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let bin_op_f_right = foreign ~from:c_lib
+    "lkt_bin_op_f_right"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let block_expr_f_val_defs = foreign ~from:c_lib
+    "lkt_block_expr_f_val_defs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let block_expr_f_expr = foreign ~from:c_lib
+    "lkt_block_expr_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let call_expr_f_name = foreign ~from:c_lib
+    "lkt_call_expr_f_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let call_expr_f_args = foreign ~from:c_lib
+    "lkt_call_expr_f_args"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let call_expr_p_called_object_type = foreign ~from:c_lib
+    "lkt_call_expr_p_called_object_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let call_expr_p_called_decl = foreign ~from:c_lib
+    "lkt_call_expr_p_called_decl"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let cast_expr_f_expr = foreign ~from:c_lib
+    "lkt_cast_expr_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let cast_expr_f_excludes_null = foreign ~from:c_lib
+    "lkt_cast_expr_f_excludes_null"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let cast_expr_f_dest_type = foreign ~from:c_lib
+    "lkt_cast_expr_f_dest_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let dot_expr_f_prefix = foreign ~from:c_lib
+    "lkt_dot_expr_f_prefix"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let dot_expr_f_suffix = foreign ~from:c_lib
+    "lkt_dot_expr_f_suffix"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let error_on_null_f_expr = foreign ~from:c_lib
+    "lkt_error_on_null_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let generic_instantiation_f_name = foreign ~from:c_lib
+    "lkt_generic_instantiation_f_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let generic_instantiation_f_args = foreign ~from:c_lib
+    "lkt_generic_instantiation_f_args"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let generic_instantiation_p_instantiated_decl = foreign ~from:c_lib
+    "lkt_generic_instantiation_p_instantiated_decl"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_discard_f_expr = foreign ~from:c_lib
+    "lkt_grammar_discard_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_dont_skip_f_expr = foreign ~from:c_lib
+    "lkt_grammar_dont_skip_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_dont_skip_f_dont_skip = foreign ~from:c_lib
+    "lkt_grammar_dont_skip_f_dont_skip"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_list_f_list_type = foreign ~from:c_lib
+    "lkt_grammar_list_f_list_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_list_f_kind = foreign ~from:c_lib
+    "lkt_grammar_list_f_kind"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_list_f_expr = foreign ~from:c_lib
+    "lkt_grammar_list_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_list_f_sep = foreign ~from:c_lib
+    "lkt_grammar_list_f_sep"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_null_f_name = foreign ~from:c_lib
+    "lkt_grammar_null_f_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_opt_f_expr = foreign ~from:c_lib
+    "lkt_grammar_opt_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_opt_group_f_expr = foreign ~from:c_lib
+    "lkt_grammar_opt_group_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_or_expr_f_sub_exprs = foreign ~from:c_lib
+    "lkt_grammar_or_expr_f_sub_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_pick_f_exprs = foreign ~from:c_lib
+    "lkt_grammar_pick_f_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_predicate_f_expr = foreign ~from:c_lib
+    "lkt_grammar_predicate_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_predicate_f_prop_ref = foreign ~from:c_lib
+    "lkt_grammar_predicate_f_prop_ref"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_rule_ref_f_node_name = foreign ~from:c_lib
+    "lkt_grammar_rule_ref_f_node_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let grammar_skip_f_name = foreign ~from:c_lib
+    "lkt_grammar_skip_f_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let parse_node_expr_f_node_name = foreign ~from:c_lib
+    "lkt_parse_node_expr_f_node_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let parse_node_expr_f_sub_exprs = foreign ~from:c_lib
+    "lkt_parse_node_expr_f_sub_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let token_no_case_lit_f_lit = foreign ~from:c_lib
+    "lkt_token_no_case_lit_f_lit"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let token_ref_f_token_name = foreign ~from:c_lib
+    "lkt_token_ref_f_token_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let token_ref_f_expr = foreign ~from:c_lib
+    "lkt_token_ref_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let if_expr_f_cond_expr = foreign ~from:c_lib
+    "lkt_if_expr_f_cond_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let if_expr_f_then_expr = foreign ~from:c_lib
+    "lkt_if_expr_f_then_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let if_expr_f_alternatives = foreign ~from:c_lib
+    "lkt_if_expr_f_alternatives"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let if_expr_f_else_expr = foreign ~from:c_lib
+    "lkt_if_expr_f_else_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let isa_f_expr = foreign ~from:c_lib
+    "lkt_isa_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let isa_f_dest_type = foreign ~from:c_lib
+    "lkt_isa_f_dest_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lambda_expr_f_params = foreign ~from:c_lib
+    "lkt_lambda_expr_f_params"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lambda_expr_f_return_type = foreign ~from:c_lib
+    "lkt_lambda_expr_f_return_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lambda_expr_f_body = foreign ~from:c_lib
+    "lkt_lambda_expr_f_body"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let string_lit_p_is_prefixed_string = foreign ~from:c_lib
+    "lkt_string_lit_p_is_prefixed_string"
+    (ptr EntityStruct.c_type
+    @-> ptr bool
+    @-> raisable int)
+
+  let string_lit_p_prefix = foreign ~from:c_lib
+    "lkt_string_lit_p_prefix"
+    (ptr EntityStruct.c_type
+    @-> ptr Character.c_type
+    @-> raisable int)
+
+  let string_lit_p_denoted_value = foreign ~from:c_lib
+    "lkt_string_lit_p_denoted_value"
+    (ptr EntityStruct.c_type
+    @-> ptr TextTypeStruct.c_type
+    @-> raisable int)
+
+  let string_lit_p_is_regexp_literal = foreign ~from:c_lib
+    "lkt_string_lit_p_is_regexp_literal"
+    (ptr EntityStruct.c_type
+    @-> ptr bool
+    @-> raisable int)
+
+  let logic_expr_f_expr = foreign ~from:c_lib
+    "lkt_logic_expr_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let match_expr_f_match_expr = foreign ~from:c_lib
+    "lkt_match_expr_f_match_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let match_expr_f_branches = foreign ~from:c_lib
+    "lkt_match_expr_f_branches"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let not_expr_f_expr = foreign ~from:c_lib
+    "lkt_not_expr_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let paren_expr_f_expr = foreign ~from:c_lib
+    "lkt_paren_expr_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let raise_expr_f_except_expr = foreign ~from:c_lib
+    "lkt_raise_expr_f_except_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let try_expr_f_try_expr = foreign ~from:c_lib
+    "lkt_try_expr_f_try_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let try_expr_f_or_expr = foreign ~from:c_lib
+    "lkt_try_expr_f_or_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let full_decl_f_doc = foreign ~from:c_lib
+    "lkt_full_decl_f_doc"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let full_decl_f_decl_annotations = foreign ~from:c_lib
+    "lkt_full_decl_f_decl_annotations"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let full_decl_f_decl = foreign ~from:c_lib
+    "lkt_full_decl_f_decl"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let import_f_name = foreign ~from:c_lib
+    "lkt_import_f_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let import_p_referenced_unit = foreign ~from:c_lib
+    "lkt_import_p_referenced_unit"
+    (ptr EntityStruct.c_type
+    @-> ptr AnalysisUnitStruct.c_type
+    @-> raisable int)
+
+  let langkit_root_f_imports = foreign ~from:c_lib
+    "lkt_langkit_root_f_imports"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let langkit_root_f_decls = foreign ~from:c_lib
+    "lkt_langkit_root_f_decls"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let langkit_root_p_check_legality = foreign ~from:c_lib
+    "lkt_langkit_root_p_check_legality"
+    (ptr EntityStruct.c_type
+    @-> ptr SemanticResultArrayStruct.c_type
+    @-> raisable int)
+
+  let lexer_case_rule_f_expr = foreign ~from:c_lib
+    "lkt_lexer_case_rule_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lexer_case_rule_f_alts = foreign ~from:c_lib
+    "lkt_lexer_case_rule_f_alts"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lexer_case_rule_send_f_sent = foreign ~from:c_lib
+    "lkt_lexer_case_rule_send_f_sent"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lexer_case_rule_send_f_match_size = foreign ~from:c_lib
+    "lkt_lexer_case_rule_send_f_match_size"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let match_branch_f_decl = foreign ~from:c_lib
+    "lkt_match_branch_f_decl"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let match_branch_f_expr = foreign ~from:c_lib
+    "lkt_match_branch_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let param_f_name = foreign ~from:c_lib
+    "lkt_param_f_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let param_f_value = foreign ~from:c_lib
+    "lkt_param_f_value"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let type_ref_p_designated_type = foreign ~from:c_lib
+    "lkt_type_ref_p_designated_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let function_type_ref_f_args_types = foreign ~from:c_lib
+    "lkt_function_type_ref_f_args_types"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let function_type_ref_f_return_type = foreign ~from:c_lib
+    "lkt_function_type_ref_f_return_type"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let generic_type_ref_f_type_name = foreign ~from:c_lib
+    "lkt_generic_type_ref_f_type_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let generic_type_ref_f_params = foreign ~from:c_lib
+    "lkt_generic_type_ref_f_params"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let simple_type_ref_f_type_name = foreign ~from:c_lib
+    "lkt_simple_type_ref_f_type_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let var_bind_f_name = foreign ~from:c_lib
+    "lkt_var_bind_f_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let var_bind_f_expr = foreign ~from:c_lib
+    "lkt_var_bind_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+
+end
+
+module rec LKNodeType : sig
+  
+   
+  (**
+    * LKNodeBaseListType.t
+    * LangkitRootType.t
+    * ImportType.t
+    * FullDeclType.t
+    * DeclType.t
+    * ExprType.t
+    * LexerCaseRuleType.t
+    * BaseLexerCaseRuleAltType.t
+    * LexerCaseRuleSendType.t
+    * ListKindType.t
+    * EnumClassCaseType.t
+    * DocCommentType.t
+    * DocType.t
+    * TypeRefType.t
+    * ExcludesNullType.t
+    * DeclAnnotationType.t
+    * DeclAnnotationParamsType.t
+    * ParamType.t
+    * ElsifBranchType.t
+    * MatchBranchType.t
+    * OpType.t
+    * VarBindType.t
+    *)
+  type t = [
+    | `LexerCaseRuleCondAlt
+        of LexerCaseRuleCondAltType.fields
+    | `LexerCaseRuleDefaultAlt
+        of LexerCaseRuleDefaultAltType.fields
+    | `GrammarDecl
+        of GrammarDeclType.fields
+    | `GrammarRuleDecl
+        of GrammarRuleDeclType.fields
+    | `SyntheticLexerDecl
+        of SyntheticLexerDeclType.fields
+    | `NodeDecl
+        of NodeDeclType.fields
+    | `SelfDecl
+        of SelfDeclType.fields
+    | `EnumLitDecl
+        of EnumLitDeclType.fields
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+    | `MatchValDecl
+        of MatchValDeclType.fields
+    | `ValDecl
+        of ValDeclType.fields
+    | `FunDecl
+        of FunDeclType.fields
+    | `GenericDecl
+        of GenericDeclType.fields
+    | `LexerDecl
+        of LexerDeclType.fields
+    | `LexerFamilyDecl
+        of LexerFamilyDeclType.fields
+    | `EnumClassAltDecl
+        of EnumClassAltDeclType.fields
+    | `FunctionType
+        of FunctionTypeType.fields
+    | `GenericFormalTypeDecl
+        of GenericFormalTypeDeclType.fields
+    | `InstantiatedGenericType
+        of InstantiatedGenericTypeType.fields
+    | `ClassDecl
+        of ClassDeclType.fields
+    | `EnumClassDecl
+        of EnumClassDeclType.fields
+    | `EnumTypeDecl
+        of EnumTypeDeclType.fields
+    | `StructDecl
+        of StructDeclType.fields
+    | `TraitDecl
+        of TraitDeclType.fields
+    | `DeclAnnotation
+        of DeclAnnotationType.fields
+    | `DeclAnnotationParams
+        of DeclAnnotationParamsType.fields
+    | `Doc
+        of DocType.fields
+    | `DocComment
+        of DocCommentType.fields
+    | `ElsifBranch
+        of ElsifBranchType.fields
+    | `EnumClassCase
+        of EnumClassCaseType.fields
+    | `ExcludesNullAbsent
+        of ExcludesNullAbsentType.fields
+    | `ExcludesNullPresent
+        of ExcludesNullPresentType.fields
+    | `ArrayLiteral
+        of ArrayLiteralType.fields
+    | `BinOp
+        of BinOpType.fields
+    | `BlockExpr
+        of BlockExprType.fields
+    | `CallExpr
+        of CallExprType.fields
+    | `NullCondCallExpr
+        of NullCondCallExprType.fields
+    | `CastExpr
+        of CastExprType.fields
+    | `DotExpr
+        of DotExprType.fields
+    | `NullCondDottedName
+        of NullCondDottedNameType.fields
+    | `ErrorOnNull
+        of ErrorOnNullType.fields
+    | `GenericInstantiation
+        of GenericInstantiationType.fields
+    | `GrammarCut
+        of GrammarCutType.fields
+    | `GrammarDiscard
+        of GrammarDiscardType.fields
+    | `GrammarDontSkip
+        of GrammarDontSkipType.fields
+    | `GrammarList
+        of GrammarListType.fields
+    | `GrammarNull
+        of GrammarNullType.fields
+    | `GrammarOpt
+        of GrammarOptType.fields
+    | `GrammarOptGroup
+        of GrammarOptGroupType.fields
+    | `GrammarOrExpr
+        of GrammarOrExprType.fields
+    | `GrammarPick
+        of GrammarPickType.fields
+    | `GrammarImplicitPick
+        of GrammarImplicitPickType.fields
+    | `GrammarPredicate
+        of GrammarPredicateType.fields
+    | `GrammarRuleRef
+        of GrammarRuleRefType.fields
+    | `GrammarSkip
+        of GrammarSkipType.fields
+    | `ParseNodeExpr
+        of ParseNodeExprType.fields
+    | `TokenLit
+        of TokenLitType.fields
+    | `TokenNoCaseLit
+        of TokenNoCaseLitType.fields
+    | `TokenPatternLit
+        of TokenPatternLitType.fields
+    | `TokenRef
+        of TokenRefType.fields
+    | `Id
+        of IdType.fields
+    | `DefId
+        of DefIdType.fields
+    | `RefId
+        of RefIdType.fields
+    | `ModuleRefId
+        of ModuleRefIdType.fields
+    | `IfExpr
+        of IfExprType.fields
+    | `Isa
+        of IsaType.fields
+    | `LambdaExpr
+        of LambdaExprType.fields
+    | `CharLit
+        of CharLitType.fields
+    | `NullLit
+        of NullLitType.fields
+    | `NumLit
+        of NumLitType.fields
+    | `StringLit
+        of StringLitType.fields
+    | `LogicExpr
+        of LogicExprType.fields
+    | `MatchExpr
+        of MatchExprType.fields
+    | `NotExpr
+        of NotExprType.fields
+    | `ParenExpr
+        of ParenExprType.fields
+    | `RaiseExpr
+        of RaiseExprType.fields
+    | `TryExpr
+        of TryExprType.fields
+    | `FullDecl
+        of FullDeclType.fields
+    | `Import
+        of ImportType.fields
+    | `BaseLexerCaseRuleAltList
+        of BaseLexerCaseRuleAltListType.fields
+    | `DeclAnnotationList
+        of DeclAnnotationListType.fields
+    | `DocCommentList
+        of DocCommentListType.fields
+    | `ElsifBranchList
+        of ElsifBranchListType.fields
+    | `EnumClassAltDeclList
+        of EnumClassAltDeclListType.fields
+    | `EnumClassCaseList
+        of EnumClassCaseListType.fields
+    | `EnumLitDeclList
+        of EnumLitDeclListType.fields
+    | `ExprList
+        of ExprListType.fields
+    | `FullDeclList
+        of FullDeclListType.fields
+    | `DeclBlock
+        of DeclBlockType.fields
+    | `FunArgDeclList
+        of FunArgDeclListType.fields
+    | `GrammarExprList
+        of GrammarExprListType.fields
+    | `GrammarExprListList
+        of GrammarExprListListType.fields
+    | `ImportList
+        of ImportListType.fields
+    | `LKNodeList
+        of LKNodeListType.fields
+    | `LambdaArgDeclList
+        of LambdaArgDeclListType.fields
+    | `MatchBranchList
+        of MatchBranchListType.fields
+    | `ParamList
+        of ParamListType.fields
+    | `RefIdList
+        of RefIdListType.fields
+    | `TypeRefList
+        of TypeRefListType.fields
+    | `LangkitRoot
+        of LangkitRootType.fields
+    | `LexerCaseRule
+        of LexerCaseRuleType.fields
+    | `LexerCaseRuleSend
+        of LexerCaseRuleSendType.fields
+    | `ListKindOne
+        of ListKindOneType.fields
+    | `ListKindZero
+        of ListKindZeroType.fields
+    | `MatchBranch
+        of MatchBranchType.fields
+    | `OpAmp
+        of OpAmpType.fields
+    | `OpAnd
+        of OpAndType.fields
+    | `OpDiv
+        of OpDivType.fields
+    | `OpEq
+        of OpEqType.fields
+    | `OpGt
+        of OpGtType.fields
+    | `OpGte
+        of OpGteType.fields
+    | `OpLt
+        of OpLtType.fields
+    | `OpLte
+        of OpLteType.fields
+    | `OpMinus
+        of OpMinusType.fields
+    | `OpMult
+        of OpMultType.fields
+    | `OpOr
+        of OpOrType.fields
+    | `OpPlus
+        of OpPlusType.fields
+    | `Param
+        of ParamType.fields
+    | `FunctionTypeRef
+        of FunctionTypeRefType.fields
+    | `GenericTypeRef
+        of GenericTypeRefType.fields
+    | `SimpleTypeRef
+        of SimpleTypeRefType.fields
+    | `VarBind
+        of VarBindType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+  val unwrap : [< t ] -> EntityStruct.t structure
+
+end = struct
+  
+   
+  (**
+    * LKNodeBaseListType.t
+    * LangkitRootType.t
+    * ImportType.t
+    * FullDeclType.t
+    * DeclType.t
+    * ExprType.t
+    * LexerCaseRuleType.t
+    * BaseLexerCaseRuleAltType.t
+    * LexerCaseRuleSendType.t
+    * ListKindType.t
+    * EnumClassCaseType.t
+    * DocCommentType.t
+    * DocType.t
+    * TypeRefType.t
+    * ExcludesNullType.t
+    * DeclAnnotationType.t
+    * DeclAnnotationParamsType.t
+    * ParamType.t
+    * ElsifBranchType.t
+    * MatchBranchType.t
+    * OpType.t
+    * VarBindType.t
+    *)
+  type t = [
+    | `LexerCaseRuleCondAlt
+        of LexerCaseRuleCondAltType.fields
+    | `LexerCaseRuleDefaultAlt
+        of LexerCaseRuleDefaultAltType.fields
+    | `GrammarDecl
+        of GrammarDeclType.fields
+    | `GrammarRuleDecl
+        of GrammarRuleDeclType.fields
+    | `SyntheticLexerDecl
+        of SyntheticLexerDeclType.fields
+    | `NodeDecl
+        of NodeDeclType.fields
+    | `SelfDecl
+        of SelfDeclType.fields
+    | `EnumLitDecl
+        of EnumLitDeclType.fields
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+    | `MatchValDecl
+        of MatchValDeclType.fields
+    | `ValDecl
+        of ValDeclType.fields
+    | `FunDecl
+        of FunDeclType.fields
+    | `GenericDecl
+        of GenericDeclType.fields
+    | `LexerDecl
+        of LexerDeclType.fields
+    | `LexerFamilyDecl
+        of LexerFamilyDeclType.fields
+    | `EnumClassAltDecl
+        of EnumClassAltDeclType.fields
+    | `FunctionType
+        of FunctionTypeType.fields
+    | `GenericFormalTypeDecl
+        of GenericFormalTypeDeclType.fields
+    | `InstantiatedGenericType
+        of InstantiatedGenericTypeType.fields
+    | `ClassDecl
+        of ClassDeclType.fields
+    | `EnumClassDecl
+        of EnumClassDeclType.fields
+    | `EnumTypeDecl
+        of EnumTypeDeclType.fields
+    | `StructDecl
+        of StructDeclType.fields
+    | `TraitDecl
+        of TraitDeclType.fields
+    | `DeclAnnotation
+        of DeclAnnotationType.fields
+    | `DeclAnnotationParams
+        of DeclAnnotationParamsType.fields
+    | `Doc
+        of DocType.fields
+    | `DocComment
+        of DocCommentType.fields
+    | `ElsifBranch
+        of ElsifBranchType.fields
+    | `EnumClassCase
+        of EnumClassCaseType.fields
+    | `ExcludesNullAbsent
+        of ExcludesNullAbsentType.fields
+    | `ExcludesNullPresent
+        of ExcludesNullPresentType.fields
+    | `ArrayLiteral
+        of ArrayLiteralType.fields
+    | `BinOp
+        of BinOpType.fields
+    | `BlockExpr
+        of BlockExprType.fields
+    | `CallExpr
+        of CallExprType.fields
+    | `NullCondCallExpr
+        of NullCondCallExprType.fields
+    | `CastExpr
+        of CastExprType.fields
+    | `DotExpr
+        of DotExprType.fields
+    | `NullCondDottedName
+        of NullCondDottedNameType.fields
+    | `ErrorOnNull
+        of ErrorOnNullType.fields
+    | `GenericInstantiation
+        of GenericInstantiationType.fields
+    | `GrammarCut
+        of GrammarCutType.fields
+    | `GrammarDiscard
+        of GrammarDiscardType.fields
+    | `GrammarDontSkip
+        of GrammarDontSkipType.fields
+    | `GrammarList
+        of GrammarListType.fields
+    | `GrammarNull
+        of GrammarNullType.fields
+    | `GrammarOpt
+        of GrammarOptType.fields
+    | `GrammarOptGroup
+        of GrammarOptGroupType.fields
+    | `GrammarOrExpr
+        of GrammarOrExprType.fields
+    | `GrammarPick
+        of GrammarPickType.fields
+    | `GrammarImplicitPick
+        of GrammarImplicitPickType.fields
+    | `GrammarPredicate
+        of GrammarPredicateType.fields
+    | `GrammarRuleRef
+        of GrammarRuleRefType.fields
+    | `GrammarSkip
+        of GrammarSkipType.fields
+    | `ParseNodeExpr
+        of ParseNodeExprType.fields
+    | `TokenLit
+        of TokenLitType.fields
+    | `TokenNoCaseLit
+        of TokenNoCaseLitType.fields
+    | `TokenPatternLit
+        of TokenPatternLitType.fields
+    | `TokenRef
+        of TokenRefType.fields
+    | `Id
+        of IdType.fields
+    | `DefId
+        of DefIdType.fields
+    | `RefId
+        of RefIdType.fields
+    | `ModuleRefId
+        of ModuleRefIdType.fields
+    | `IfExpr
+        of IfExprType.fields
+    | `Isa
+        of IsaType.fields
+    | `LambdaExpr
+        of LambdaExprType.fields
+    | `CharLit
+        of CharLitType.fields
+    | `NullLit
+        of NullLitType.fields
+    | `NumLit
+        of NumLitType.fields
+    | `StringLit
+        of StringLitType.fields
+    | `LogicExpr
+        of LogicExprType.fields
+    | `MatchExpr
+        of MatchExprType.fields
+    | `NotExpr
+        of NotExprType.fields
+    | `ParenExpr
+        of ParenExprType.fields
+    | `RaiseExpr
+        of RaiseExprType.fields
+    | `TryExpr
+        of TryExprType.fields
+    | `FullDecl
+        of FullDeclType.fields
+    | `Import
+        of ImportType.fields
+    | `BaseLexerCaseRuleAltList
+        of BaseLexerCaseRuleAltListType.fields
+    | `DeclAnnotationList
+        of DeclAnnotationListType.fields
+    | `DocCommentList
+        of DocCommentListType.fields
+    | `ElsifBranchList
+        of ElsifBranchListType.fields
+    | `EnumClassAltDeclList
+        of EnumClassAltDeclListType.fields
+    | `EnumClassCaseList
+        of EnumClassCaseListType.fields
+    | `EnumLitDeclList
+        of EnumLitDeclListType.fields
+    | `ExprList
+        of ExprListType.fields
+    | `FullDeclList
+        of FullDeclListType.fields
+    | `DeclBlock
+        of DeclBlockType.fields
+    | `FunArgDeclList
+        of FunArgDeclListType.fields
+    | `GrammarExprList
+        of GrammarExprListType.fields
+    | `GrammarExprListList
+        of GrammarExprListListType.fields
+    | `ImportList
+        of ImportListType.fields
+    | `LKNodeList
+        of LKNodeListType.fields
+    | `LambdaArgDeclList
+        of LambdaArgDeclListType.fields
+    | `MatchBranchList
+        of MatchBranchListType.fields
+    | `ParamList
+        of ParamListType.fields
+    | `RefIdList
+        of RefIdListType.fields
+    | `TypeRefList
+        of TypeRefListType.fields
+    | `LangkitRoot
+        of LangkitRootType.fields
+    | `LexerCaseRule
+        of LexerCaseRuleType.fields
+    | `LexerCaseRuleSend
+        of LexerCaseRuleSendType.fields
+    | `ListKindOne
+        of ListKindOneType.fields
+    | `ListKindZero
+        of ListKindZeroType.fields
+    | `MatchBranch
+        of MatchBranchType.fields
+    | `OpAmp
+        of OpAmpType.fields
+    | `OpAnd
+        of OpAndType.fields
+    | `OpDiv
+        of OpDivType.fields
+    | `OpEq
+        of OpEqType.fields
+    | `OpGt
+        of OpGtType.fields
+    | `OpGte
+        of OpGteType.fields
+    | `OpLt
+        of OpLtType.fields
+    | `OpLte
+        of OpLteType.fields
+    | `OpMinus
+        of OpMinusType.fields
+    | `OpMult
+        of OpMultType.fields
+    | `OpOr
+        of OpOrType.fields
+    | `OpPlus
+        of OpPlusType.fields
+    | `Param
+        of ParamType.fields
+    | `FunctionTypeRef
+        of FunctionTypeRefType.fields
+    | `GenericTypeRef
+        of GenericTypeRefType.fields
+    | `SimpleTypeRef
+        of SimpleTypeRefType.fields
+    | `VarBind
+        of VarBindType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* Top level wrap function that dispatch to wrap function of concrete types
+      depending on the node kind *)
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      let kind = CFunctions.node_kind (addr c_value) in
+      match kind with
+      | 1 ->
+          (LexerCaseRuleCondAltType.wrap context (c_value)
+           :> t)
+      | 2 ->
+          (LexerCaseRuleDefaultAltType.wrap context (c_value)
+           :> t)
+      | 3 ->
+          (GrammarDeclType.wrap context (c_value)
+           :> t)
+      | 4 ->
+          (GrammarRuleDeclType.wrap context (c_value)
+           :> t)
+      | 5 ->
+          (SyntheticLexerDeclType.wrap context (c_value)
+           :> t)
+      | 6 ->
+          (NodeDeclType.wrap context (c_value)
+           :> t)
+      | 7 ->
+          (SelfDeclType.wrap context (c_value)
+           :> t)
+      | 8 ->
+          (EnumLitDeclType.wrap context (c_value)
+           :> t)
+      | 9 ->
+          (FieldDeclType.wrap context (c_value)
+           :> t)
+      | 10 ->
+          (FunArgDeclType.wrap context (c_value)
+           :> t)
+      | 11 ->
+          (LambdaArgDeclType.wrap context (c_value)
+           :> t)
+      | 12 ->
+          (MatchValDeclType.wrap context (c_value)
+           :> t)
+      | 13 ->
+          (ValDeclType.wrap context (c_value)
+           :> t)
+      | 14 ->
+          (FunDeclType.wrap context (c_value)
+           :> t)
+      | 15 ->
+          (GenericDeclType.wrap context (c_value)
+           :> t)
+      | 16 ->
+          (LexerDeclType.wrap context (c_value)
+           :> t)
+      | 17 ->
+          (LexerFamilyDeclType.wrap context (c_value)
+           :> t)
+      | 18 ->
+          (EnumClassAltDeclType.wrap context (c_value)
+           :> t)
+      | 19 ->
+          (FunctionTypeType.wrap context (c_value)
+           :> t)
+      | 20 ->
+          (GenericFormalTypeDeclType.wrap context (c_value)
+           :> t)
+      | 21 ->
+          (InstantiatedGenericTypeType.wrap context (c_value)
+           :> t)
+      | 22 ->
+          (ClassDeclType.wrap context (c_value)
+           :> t)
+      | 23 ->
+          (EnumClassDeclType.wrap context (c_value)
+           :> t)
+      | 24 ->
+          (EnumTypeDeclType.wrap context (c_value)
+           :> t)
+      | 25 ->
+          (StructDeclType.wrap context (c_value)
+           :> t)
+      | 26 ->
+          (TraitDeclType.wrap context (c_value)
+           :> t)
+      | 27 ->
+          (DeclAnnotationType.wrap context (c_value)
+           :> t)
+      | 28 ->
+          (DeclAnnotationParamsType.wrap context (c_value)
+           :> t)
+      | 29 ->
+          (DocType.wrap context (c_value)
+           :> t)
+      | 30 ->
+          (DocCommentType.wrap context (c_value)
+           :> t)
+      | 31 ->
+          (ElsifBranchType.wrap context (c_value)
+           :> t)
+      | 32 ->
+          (EnumClassCaseType.wrap context (c_value)
+           :> t)
+      | 33 ->
+          (ExcludesNullAbsentType.wrap context (c_value)
+           :> t)
+      | 34 ->
+          (ExcludesNullPresentType.wrap context (c_value)
+           :> t)
+      | 35 ->
+          (ArrayLiteralType.wrap context (c_value)
+           :> t)
+      | 36 ->
+          (BinOpType.wrap context (c_value)
+           :> t)
+      | 37 ->
+          (BlockExprType.wrap context (c_value)
+           :> t)
+      | 38 ->
+          (CallExprType.wrap context (c_value)
+           :> t)
+      | 39 ->
+          (NullCondCallExprType.wrap context (c_value)
+           :> t)
+      | 40 ->
+          (CastExprType.wrap context (c_value)
+           :> t)
+      | 41 ->
+          (DotExprType.wrap context (c_value)
+           :> t)
+      | 42 ->
+          (NullCondDottedNameType.wrap context (c_value)
+           :> t)
+      | 43 ->
+          (ErrorOnNullType.wrap context (c_value)
+           :> t)
+      | 44 ->
+          (GenericInstantiationType.wrap context (c_value)
+           :> t)
+      | 45 ->
+          (GrammarCutType.wrap context (c_value)
+           :> t)
+      | 46 ->
+          (GrammarDiscardType.wrap context (c_value)
+           :> t)
+      | 47 ->
+          (GrammarDontSkipType.wrap context (c_value)
+           :> t)
+      | 48 ->
+          (GrammarListType.wrap context (c_value)
+           :> t)
+      | 49 ->
+          (GrammarNullType.wrap context (c_value)
+           :> t)
+      | 50 ->
+          (GrammarOptType.wrap context (c_value)
+           :> t)
+      | 51 ->
+          (GrammarOptGroupType.wrap context (c_value)
+           :> t)
+      | 52 ->
+          (GrammarOrExprType.wrap context (c_value)
+           :> t)
+      | 53 ->
+          (GrammarPickType.wrap context (c_value)
+           :> t)
+      | 54 ->
+          (GrammarImplicitPickType.wrap context (c_value)
+           :> t)
+      | 55 ->
+          (GrammarPredicateType.wrap context (c_value)
+           :> t)
+      | 56 ->
+          (GrammarRuleRefType.wrap context (c_value)
+           :> t)
+      | 57 ->
+          (GrammarSkipType.wrap context (c_value)
+           :> t)
+      | 58 ->
+          (ParseNodeExprType.wrap context (c_value)
+           :> t)
+      | 59 ->
+          (TokenLitType.wrap context (c_value)
+           :> t)
+      | 60 ->
+          (TokenNoCaseLitType.wrap context (c_value)
+           :> t)
+      | 61 ->
+          (TokenPatternLitType.wrap context (c_value)
+           :> t)
+      | 62 ->
+          (TokenRefType.wrap context (c_value)
+           :> t)
+      | 63 ->
+          (IdType.wrap context (c_value)
+           :> t)
+      | 64 ->
+          (DefIdType.wrap context (c_value)
+           :> t)
+      | 65 ->
+          (RefIdType.wrap context (c_value)
+           :> t)
+      | 66 ->
+          (ModuleRefIdType.wrap context (c_value)
+           :> t)
+      | 67 ->
+          (IfExprType.wrap context (c_value)
+           :> t)
+      | 68 ->
+          (IsaType.wrap context (c_value)
+           :> t)
+      | 69 ->
+          (LambdaExprType.wrap context (c_value)
+           :> t)
+      | 70 ->
+          (CharLitType.wrap context (c_value)
+           :> t)
+      | 71 ->
+          (NullLitType.wrap context (c_value)
+           :> t)
+      | 72 ->
+          (NumLitType.wrap context (c_value)
+           :> t)
+      | 73 ->
+          (StringLitType.wrap context (c_value)
+           :> t)
+      | 74 ->
+          (LogicExprType.wrap context (c_value)
+           :> t)
+      | 75 ->
+          (MatchExprType.wrap context (c_value)
+           :> t)
+      | 76 ->
+          (NotExprType.wrap context (c_value)
+           :> t)
+      | 77 ->
+          (ParenExprType.wrap context (c_value)
+           :> t)
+      | 78 ->
+          (RaiseExprType.wrap context (c_value)
+           :> t)
+      | 79 ->
+          (TryExprType.wrap context (c_value)
+           :> t)
+      | 80 ->
+          (FullDeclType.wrap context (c_value)
+           :> t)
+      | 81 ->
+          (ImportType.wrap context (c_value)
+           :> t)
+      | 82 ->
+          (BaseLexerCaseRuleAltListType.wrap context (c_value)
+           :> t)
+      | 83 ->
+          (DeclAnnotationListType.wrap context (c_value)
+           :> t)
+      | 84 ->
+          (DocCommentListType.wrap context (c_value)
+           :> t)
+      | 85 ->
+          (ElsifBranchListType.wrap context (c_value)
+           :> t)
+      | 86 ->
+          (EnumClassAltDeclListType.wrap context (c_value)
+           :> t)
+      | 87 ->
+          (EnumClassCaseListType.wrap context (c_value)
+           :> t)
+      | 88 ->
+          (EnumLitDeclListType.wrap context (c_value)
+           :> t)
+      | 89 ->
+          (ExprListType.wrap context (c_value)
+           :> t)
+      | 90 ->
+          (FullDeclListType.wrap context (c_value)
+           :> t)
+      | 91 ->
+          (DeclBlockType.wrap context (c_value)
+           :> t)
+      | 92 ->
+          (FunArgDeclListType.wrap context (c_value)
+           :> t)
+      | 93 ->
+          (GrammarExprListType.wrap context (c_value)
+           :> t)
+      | 94 ->
+          (GrammarExprListListType.wrap context (c_value)
+           :> t)
+      | 95 ->
+          (ImportListType.wrap context (c_value)
+           :> t)
+      | 96 ->
+          (LKNodeListType.wrap context (c_value)
+           :> t)
+      | 97 ->
+          (LambdaArgDeclListType.wrap context (c_value)
+           :> t)
+      | 98 ->
+          (MatchBranchListType.wrap context (c_value)
+           :> t)
+      | 99 ->
+          (ParamListType.wrap context (c_value)
+           :> t)
+      | 100 ->
+          (RefIdListType.wrap context (c_value)
+           :> t)
+      | 101 ->
+          (TypeRefListType.wrap context (c_value)
+           :> t)
+      | 102 ->
+          (LangkitRootType.wrap context (c_value)
+           :> t)
+      | 103 ->
+          (LexerCaseRuleType.wrap context (c_value)
+           :> t)
+      | 104 ->
+          (LexerCaseRuleSendType.wrap context (c_value)
+           :> t)
+      | 105 ->
+          (ListKindOneType.wrap context (c_value)
+           :> t)
+      | 106 ->
+          (ListKindZeroType.wrap context (c_value)
+           :> t)
+      | 107 ->
+          (MatchBranchType.wrap context (c_value)
+           :> t)
+      | 108 ->
+          (OpAmpType.wrap context (c_value)
+           :> t)
+      | 109 ->
+          (OpAndType.wrap context (c_value)
+           :> t)
+      | 110 ->
+          (OpDivType.wrap context (c_value)
+           :> t)
+      | 111 ->
+          (OpEqType.wrap context (c_value)
+           :> t)
+      | 112 ->
+          (OpGtType.wrap context (c_value)
+           :> t)
+      | 113 ->
+          (OpGteType.wrap context (c_value)
+           :> t)
+      | 114 ->
+          (OpLtType.wrap context (c_value)
+           :> t)
+      | 115 ->
+          (OpLteType.wrap context (c_value)
+           :> t)
+      | 116 ->
+          (OpMinusType.wrap context (c_value)
+           :> t)
+      | 117 ->
+          (OpMultType.wrap context (c_value)
+           :> t)
+      | 118 ->
+          (OpOrType.wrap context (c_value)
+           :> t)
+      | 119 ->
+          (OpPlusType.wrap context (c_value)
+           :> t)
+      | 120 ->
+          (ParamType.wrap context (c_value)
+           :> t)
+      | 121 ->
+          (FunctionTypeRefType.wrap context (c_value)
+           :> t)
+      | 122 ->
+          (GenericTypeRefType.wrap context (c_value)
+           :> t)
+      | 123 ->
+          (SimpleTypeRefType.wrap context (c_value)
+           :> t)
+      | 124 ->
+          (VarBindType.wrap context (c_value)
+           :> t)
+      | _ -> assert false
+
+  let unwrap value =
+    (* This is the unique unwrap function that can be called for any node. *)
+    match (value :> LKNodeType.t) with
+    | `LexerCaseRuleCondAlt fields -> fields.c_value
+    | `LexerCaseRuleDefaultAlt fields -> fields.c_value
+    | `GrammarDecl fields -> fields.c_value
+    | `GrammarRuleDecl fields -> fields.c_value
+    | `SyntheticLexerDecl fields -> fields.c_value
+    | `NodeDecl fields -> fields.c_value
+    | `SelfDecl fields -> fields.c_value
+    | `EnumLitDecl fields -> fields.c_value
+    | `FieldDecl fields -> fields.c_value
+    | `FunArgDecl fields -> fields.c_value
+    | `LambdaArgDecl fields -> fields.c_value
+    | `MatchValDecl fields -> fields.c_value
+    | `ValDecl fields -> fields.c_value
+    | `FunDecl fields -> fields.c_value
+    | `GenericDecl fields -> fields.c_value
+    | `LexerDecl fields -> fields.c_value
+    | `LexerFamilyDecl fields -> fields.c_value
+    | `EnumClassAltDecl fields -> fields.c_value
+    | `FunctionType fields -> fields.c_value
+    | `GenericFormalTypeDecl fields -> fields.c_value
+    | `InstantiatedGenericType fields -> fields.c_value
+    | `ClassDecl fields -> fields.c_value
+    | `EnumClassDecl fields -> fields.c_value
+    | `EnumTypeDecl fields -> fields.c_value
+    | `StructDecl fields -> fields.c_value
+    | `TraitDecl fields -> fields.c_value
+    | `DeclAnnotation fields -> fields.c_value
+    | `DeclAnnotationParams fields -> fields.c_value
+    | `Doc fields -> fields.c_value
+    | `DocComment fields -> fields.c_value
+    | `ElsifBranch fields -> fields.c_value
+    | `EnumClassCase fields -> fields.c_value
+    | `ExcludesNullAbsent fields -> fields.c_value
+    | `ExcludesNullPresent fields -> fields.c_value
+    | `ArrayLiteral fields -> fields.c_value
+    | `BinOp fields -> fields.c_value
+    | `BlockExpr fields -> fields.c_value
+    | `CallExpr fields -> fields.c_value
+    | `NullCondCallExpr fields -> fields.c_value
+    | `CastExpr fields -> fields.c_value
+    | `DotExpr fields -> fields.c_value
+    | `NullCondDottedName fields -> fields.c_value
+    | `ErrorOnNull fields -> fields.c_value
+    | `GenericInstantiation fields -> fields.c_value
+    | `GrammarCut fields -> fields.c_value
+    | `GrammarDiscard fields -> fields.c_value
+    | `GrammarDontSkip fields -> fields.c_value
+    | `GrammarList fields -> fields.c_value
+    | `GrammarNull fields -> fields.c_value
+    | `GrammarOpt fields -> fields.c_value
+    | `GrammarOptGroup fields -> fields.c_value
+    | `GrammarOrExpr fields -> fields.c_value
+    | `GrammarPick fields -> fields.c_value
+    | `GrammarImplicitPick fields -> fields.c_value
+    | `GrammarPredicate fields -> fields.c_value
+    | `GrammarRuleRef fields -> fields.c_value
+    | `GrammarSkip fields -> fields.c_value
+    | `ParseNodeExpr fields -> fields.c_value
+    | `TokenLit fields -> fields.c_value
+    | `TokenNoCaseLit fields -> fields.c_value
+    | `TokenPatternLit fields -> fields.c_value
+    | `TokenRef fields -> fields.c_value
+    | `Id fields -> fields.c_value
+    | `DefId fields -> fields.c_value
+    | `RefId fields -> fields.c_value
+    | `ModuleRefId fields -> fields.c_value
+    | `IfExpr fields -> fields.c_value
+    | `Isa fields -> fields.c_value
+    | `LambdaExpr fields -> fields.c_value
+    | `CharLit fields -> fields.c_value
+    | `NullLit fields -> fields.c_value
+    | `NumLit fields -> fields.c_value
+    | `StringLit fields -> fields.c_value
+    | `LogicExpr fields -> fields.c_value
+    | `MatchExpr fields -> fields.c_value
+    | `NotExpr fields -> fields.c_value
+    | `ParenExpr fields -> fields.c_value
+    | `RaiseExpr fields -> fields.c_value
+    | `TryExpr fields -> fields.c_value
+    | `FullDecl fields -> fields.c_value
+    | `Import fields -> fields.c_value
+    | `BaseLexerCaseRuleAltList fields -> fields.c_value
+    | `DeclAnnotationList fields -> fields.c_value
+    | `DocCommentList fields -> fields.c_value
+    | `ElsifBranchList fields -> fields.c_value
+    | `EnumClassAltDeclList fields -> fields.c_value
+    | `EnumClassCaseList fields -> fields.c_value
+    | `EnumLitDeclList fields -> fields.c_value
+    | `ExprList fields -> fields.c_value
+    | `FullDeclList fields -> fields.c_value
+    | `DeclBlock fields -> fields.c_value
+    | `FunArgDeclList fields -> fields.c_value
+    | `GrammarExprList fields -> fields.c_value
+    | `GrammarExprListList fields -> fields.c_value
+    | `ImportList fields -> fields.c_value
+    | `LKNodeList fields -> fields.c_value
+    | `LambdaArgDeclList fields -> fields.c_value
+    | `MatchBranchList fields -> fields.c_value
+    | `ParamList fields -> fields.c_value
+    | `RefIdList fields -> fields.c_value
+    | `TypeRefList fields -> fields.c_value
+    | `LangkitRoot fields -> fields.c_value
+    | `LexerCaseRule fields -> fields.c_value
+    | `LexerCaseRuleSend fields -> fields.c_value
+    | `ListKindOne fields -> fields.c_value
+    | `ListKindZero fields -> fields.c_value
+    | `MatchBranch fields -> fields.c_value
+    | `OpAmp fields -> fields.c_value
+    | `OpAnd fields -> fields.c_value
+    | `OpDiv fields -> fields.c_value
+    | `OpEq fields -> fields.c_value
+    | `OpGt fields -> fields.c_value
+    | `OpGte fields -> fields.c_value
+    | `OpLt fields -> fields.c_value
+    | `OpLte fields -> fields.c_value
+    | `OpMinus fields -> fields.c_value
+    | `OpMult fields -> fields.c_value
+    | `OpOr fields -> fields.c_value
+    | `OpPlus fields -> fields.c_value
+    | `Param fields -> fields.c_value
+    | `FunctionTypeRef fields -> fields.c_value
+    | `GenericTypeRef fields -> fields.c_value
+    | `SimpleTypeRef fields -> fields.c_value
+    | `VarBind fields -> fields.c_value
+
+end
+
+      
+and BaseLexerCaseRuleAltType : sig
+   
+  
+   
+  type t = [
+    | `LexerCaseRuleCondAlt
+        of LexerCaseRuleCondAltType.fields
+    | `LexerCaseRuleDefaultAlt
+        of LexerCaseRuleDefaultAltType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `LexerCaseRuleCondAlt
+        of LexerCaseRuleCondAltType.fields
+    | `LexerCaseRuleDefaultAlt
+        of LexerCaseRuleDefaultAltType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `LexerCaseRuleCondAlt _
+      | `LexerCaseRuleDefaultAlt _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and LexerCaseRuleCondAltType : sig
+   
+  
+   
+  type t = [
+    | `LexerCaseRuleCondAlt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_exprs: RefIdListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `LexerCaseRuleCondAlt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_exprs: RefIdListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_cond_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.lexer_case_rule_cond_alt_f_cond_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         RefIdListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `LexerCaseRuleCondAlt {
+        f_cond_exprs
+          = Lazy.from_fun f_cond_exprs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and LexerCaseRuleDefaultAltType : sig
+   
+  
+   
+  type t = [
+    | `LexerCaseRuleDefaultAlt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `LexerCaseRuleDefaultAlt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `LexerCaseRuleDefaultAlt {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DeclType : sig
+   
+  
+   
+  (**
+    * LexerDeclType.t
+    * LexerFamilyDeclType.t
+    * BaseGrammarDeclType.t
+    * BaseGrammarRuleDeclType.t
+    * TypeDeclType.t
+    * GenericDeclType.t
+    * BaseValDeclType.t
+    *)
+  type t = [
+    | `GrammarDecl
+        of GrammarDeclType.fields
+    | `GrammarRuleDecl
+        of GrammarRuleDeclType.fields
+    | `SyntheticLexerDecl
+        of SyntheticLexerDeclType.fields
+    | `NodeDecl
+        of NodeDeclType.fields
+    | `SelfDecl
+        of SelfDeclType.fields
+    | `EnumLitDecl
+        of EnumLitDeclType.fields
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+    | `MatchValDecl
+        of MatchValDeclType.fields
+    | `ValDecl
+        of ValDeclType.fields
+    | `FunDecl
+        of FunDeclType.fields
+    | `GenericDecl
+        of GenericDeclType.fields
+    | `LexerDecl
+        of LexerDeclType.fields
+    | `LexerFamilyDecl
+        of LexerFamilyDeclType.fields
+    | `EnumClassAltDecl
+        of EnumClassAltDeclType.fields
+    | `FunctionType
+        of FunctionTypeType.fields
+    | `GenericFormalTypeDecl
+        of GenericFormalTypeDeclType.fields
+    | `InstantiatedGenericType
+        of InstantiatedGenericTypeType.fields
+    | `ClassDecl
+        of ClassDeclType.fields
+    | `EnumClassDecl
+        of EnumClassDeclType.fields
+    | `EnumTypeDecl
+        of EnumTypeDeclType.fields
+    | `StructDecl
+        of StructDeclType.fields
+    | `TraitDecl
+        of TraitDeclType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  (**
+    * LexerDeclType.t
+    * LexerFamilyDeclType.t
+    * BaseGrammarDeclType.t
+    * BaseGrammarRuleDeclType.t
+    * TypeDeclType.t
+    * GenericDeclType.t
+    * BaseValDeclType.t
+    *)
+  type t = [
+    | `GrammarDecl
+        of GrammarDeclType.fields
+    | `GrammarRuleDecl
+        of GrammarRuleDeclType.fields
+    | `SyntheticLexerDecl
+        of SyntheticLexerDeclType.fields
+    | `NodeDecl
+        of NodeDeclType.fields
+    | `SelfDecl
+        of SelfDeclType.fields
+    | `EnumLitDecl
+        of EnumLitDeclType.fields
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+    | `MatchValDecl
+        of MatchValDeclType.fields
+    | `ValDecl
+        of ValDeclType.fields
+    | `FunDecl
+        of FunDeclType.fields
+    | `GenericDecl
+        of GenericDeclType.fields
+    | `LexerDecl
+        of LexerDeclType.fields
+    | `LexerFamilyDecl
+        of LexerFamilyDeclType.fields
+    | `EnumClassAltDecl
+        of EnumClassAltDeclType.fields
+    | `FunctionType
+        of FunctionTypeType.fields
+    | `GenericFormalTypeDecl
+        of GenericFormalTypeDeclType.fields
+    | `InstantiatedGenericType
+        of InstantiatedGenericTypeType.fields
+    | `ClassDecl
+        of ClassDeclType.fields
+    | `EnumClassDecl
+        of EnumClassDeclType.fields
+    | `EnumTypeDecl
+        of EnumTypeDeclType.fields
+    | `StructDecl
+        of StructDeclType.fields
+    | `TraitDecl
+        of TraitDeclType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `GrammarDecl _
+      | `GrammarRuleDecl _
+      | `SyntheticLexerDecl _
+      | `NodeDecl _
+      | `SelfDecl _
+      | `EnumLitDecl _
+      | `FieldDecl _
+      | `FunArgDecl _
+      | `LambdaArgDecl _
+      | `MatchValDecl _
+      | `ValDecl _
+      | `FunDecl _
+      | `GenericDecl _
+      | `LexerDecl _
+      | `LexerFamilyDecl _
+      | `EnumClassAltDecl _
+      | `FunctionType _
+      | `GenericFormalTypeDecl _
+      | `InstantiatedGenericType _
+      | `ClassDecl _
+      | `EnumClassDecl _
+      | `EnumTypeDecl _
+      | `StructDecl _
+      | `TraitDecl _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and BaseGrammarDeclType : sig
+   
+  
+   
+  type t = [
+    | `GrammarDecl
+        of GrammarDeclType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarDecl
+        of GrammarDeclType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `GrammarDecl _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and GrammarDeclType : sig
+   
+  
+   
+  type t = [
+    | `GrammarDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_rules: FullDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_rules: FullDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_rules () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_decl_f_rules
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         FullDeclListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarDecl {
+        f_rules
+          = Lazy.from_fun f_rules ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and BaseGrammarRuleDeclType : sig
+   
+  
+   
+  type t = [
+    | `GrammarRuleDecl
+        of GrammarRuleDeclType.fields
+    | `SyntheticLexerDecl
+        of SyntheticLexerDeclType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarRuleDecl
+        of GrammarRuleDeclType.fields
+    | `SyntheticLexerDecl
+        of SyntheticLexerDeclType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `GrammarRuleDecl _
+      | `SyntheticLexerDecl _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and GrammarRuleDeclType : sig
+   
+  
+   
+  type t = [
+    | `GrammarRuleDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarRuleDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarRuleDecl {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and SyntheticLexerDeclType : sig
+   
+  
+   
+  type t = [
+    | `SyntheticLexerDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `SyntheticLexerDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `SyntheticLexerDecl {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and BaseValDeclType : sig
+   
+  
+   
+  (**
+    * SelfDeclType.t
+    * NodeDeclType.t
+    * UserValDeclType.t
+    *)
+  type t = [
+    | `NodeDecl
+        of NodeDeclType.fields
+    | `SelfDecl
+        of SelfDeclType.fields
+    | `EnumLitDecl
+        of EnumLitDeclType.fields
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+    | `MatchValDecl
+        of MatchValDeclType.fields
+    | `ValDecl
+        of ValDeclType.fields
+    | `FunDecl
+        of FunDeclType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  (**
+    * SelfDeclType.t
+    * NodeDeclType.t
+    * UserValDeclType.t
+    *)
+  type t = [
+    | `NodeDecl
+        of NodeDeclType.fields
+    | `SelfDecl
+        of SelfDeclType.fields
+    | `EnumLitDecl
+        of EnumLitDeclType.fields
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+    | `MatchValDecl
+        of MatchValDeclType.fields
+    | `ValDecl
+        of ValDeclType.fields
+    | `FunDecl
+        of FunDeclType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `NodeDecl _
+      | `SelfDecl _
+      | `EnumLitDecl _
+      | `FieldDecl _
+      | `FunArgDecl _
+      | `LambdaArgDecl _
+      | `MatchValDecl _
+      | `ValDecl _
+      | `FunDecl _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and NodeDeclType : sig
+   
+  
+   
+  type t = [
+    | `NodeDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `NodeDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `NodeDecl {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and SelfDeclType : sig
+   
+  
+   
+  type t = [
+    | `SelfDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `SelfDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `SelfDecl {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and UserValDeclType : sig
+   
+  
+   
+  (**
+    * FunDeclType.t
+    * EnumLitDeclType.t
+    * ExplicitlyTypedDeclType.t
+    *)
+  type t = [
+    | `EnumLitDecl
+        of EnumLitDeclType.fields
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+    | `MatchValDecl
+        of MatchValDeclType.fields
+    | `ValDecl
+        of ValDeclType.fields
+    | `FunDecl
+        of FunDeclType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  (**
+    * FunDeclType.t
+    * EnumLitDeclType.t
+    * ExplicitlyTypedDeclType.t
+    *)
+  type t = [
+    | `EnumLitDecl
+        of EnumLitDeclType.fields
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+    | `MatchValDecl
+        of MatchValDeclType.fields
+    | `ValDecl
+        of ValDeclType.fields
+    | `FunDecl
+        of FunDeclType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `EnumLitDecl _
+      | `FieldDecl _
+      | `FunArgDecl _
+      | `LambdaArgDecl _
+      | `MatchValDecl _
+      | `ValDecl _
+      | `FunDecl _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and EnumLitDeclType : sig
+   
+  
+   
+  type t = [
+    | `EnumLitDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `EnumLitDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `EnumLitDecl {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ExplicitlyTypedDeclType : sig
+   
+  
+   
+  (**
+    * ComponentDeclType.t
+    * MatchValDeclType.t
+    * ValDeclType.t
+    *)
+  type t = [
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+    | `MatchValDecl
+        of MatchValDeclType.fields
+    | `ValDecl
+        of ValDeclType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  (**
+    * ComponentDeclType.t
+    * MatchValDeclType.t
+    * ValDeclType.t
+    *)
+  type t = [
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+    | `MatchValDecl
+        of MatchValDeclType.fields
+    | `ValDecl
+        of ValDeclType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `FieldDecl _
+      | `FunArgDecl _
+      | `LambdaArgDecl _
+      | `MatchValDecl _
+      | `ValDecl _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and ComponentDeclType : sig
+   
+  
+   
+  type t = [
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `FieldDecl _
+      | `FunArgDecl _
+      | `LambdaArgDecl _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and FieldDeclType : sig
+   
+  
+   
+  type t = [
+    | `FieldDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `FieldDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `FieldDecl {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and FunArgDeclType : sig
+   
+  
+   
+  type t = [
+    | `FunArgDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `FunArgDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `FunArgDecl {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and LambdaArgDeclType : sig
+   
+  
+   
+  type t = [
+    | `LambdaArgDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `LambdaArgDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `LambdaArgDecl {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and MatchValDeclType : sig
+   
+  
+   
+  type t = [
+    | `MatchValDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `MatchValDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `MatchValDecl {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ValDeclType : sig
+   
+  
+   
+  type t = [
+    | `ValDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_val: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ValDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_val: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_val () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.val_decl_f_val
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ValDecl {
+        f_val
+          = Lazy.from_fun f_val ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and FunDeclType : sig
+   
+  
+   
+  type t = [
+    | `FunDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_args: FunArgDeclListType.t
+    Lazy.t;
+         
+    f_return_type: TypeRefType.t
+    Lazy.t;
+         
+    f_body: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `FunDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_args: FunArgDeclListType.t
+    Lazy.t;
+         
+    f_return_type: TypeRefType.t
+    Lazy.t;
+         
+    f_body: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_args () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.fun_decl_f_args
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         FunArgDeclListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_return_type () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.fun_decl_f_return_type
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         TypeRefType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_body () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.fun_decl_f_body
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprType.wrap context (field_c_value))
+      in
+         
+
+      match node with
+            
+      | Some `ArrayLiteral _
+      | Some `BinOp _
+      | Some `BlockExpr _
+      | Some `CallExpr _
+      | Some `CastExpr _
+      | Some `CharLit _
+      | Some `DotExpr _
+      | Some `ErrorOnNull _
+      | Some `GenericInstantiation _
+      | Some `IfExpr _
+      | Some `Isa _
+      | Some `LambdaExpr _
+      | Some `LogicExpr _
+      | Some `MatchExpr _
+      | Some `ModuleRefId _
+      | Some `NotExpr _
+      | Some `NullCondCallExpr _
+      | Some `NullCondDottedName _
+      | Some `NullLit _
+      | Some `NumLit _
+      | Some `ParenExpr _
+      | Some `RaiseExpr _
+      | Some `RefId _
+      | Some `StringLit _
+      | Some `TryExpr _
+      | None as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `FunDecl {
+        f_args
+          = Lazy.from_fun f_args ;
+        f_return_type
+          = Lazy.from_fun f_return_type ;
+        f_body
+          = Lazy.from_fun f_body ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GenericDeclType : sig
+   
+  
+   
+  type t = [
+    | `GenericDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_generic_formal_decls: FullDeclListType.t
+    Lazy.t;
+         
+    f_decl: [
+      | `ClassDecl
+          of ClassDeclType.fields
+      | `EnumClassDecl
+          of EnumClassDeclType.fields
+      | `EnumTypeDecl
+          of EnumTypeDeclType.fields
+      | `FieldDecl
+          of FieldDeclType.fields
+      | `FunDecl
+          of FunDeclType.fields
+      | `GenericDecl
+          of fields
+      | `GrammarDecl
+          of GrammarDeclType.fields
+      | `GrammarRuleDecl
+          of GrammarRuleDeclType.fields
+      | `LexerDecl
+          of LexerDeclType.fields
+      | `StructDecl
+          of StructDeclType.fields
+      | `TraitDecl
+          of TraitDeclType.fields
+      | `ValDecl
+          of ValDeclType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GenericDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_generic_formal_decls: FullDeclListType.t
+    Lazy.t;
+         
+    f_decl: [
+      | `ClassDecl
+          of ClassDeclType.fields
+      | `EnumClassDecl
+          of EnumClassDeclType.fields
+      | `EnumTypeDecl
+          of EnumTypeDeclType.fields
+      | `FieldDecl
+          of FieldDeclType.fields
+      | `FunDecl
+          of FunDeclType.fields
+      | `GenericDecl
+          of fields
+      | `GrammarDecl
+          of GrammarDeclType.fields
+      | `GrammarRuleDecl
+          of GrammarRuleDeclType.fields
+      | `LexerDecl
+          of LexerDeclType.fields
+      | `StructDecl
+          of StructDeclType.fields
+      | `TraitDecl
+          of TraitDeclType.fields
+      | `ValDecl
+          of ValDeclType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_generic_formal_decls () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.generic_decl_f_generic_formal_decls
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         FullDeclListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_decl () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.generic_decl_f_decl
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         DeclType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ClassDecl _
+      | `EnumClassDecl _
+      | `EnumTypeDecl _
+      | `FieldDecl _
+      | `FunDecl _
+      | `GenericDecl _
+      | `GrammarDecl _
+      | `GrammarRuleDecl _
+      | `LexerDecl _
+      | `StructDecl _
+      | `TraitDecl _
+      | `ValDecl _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GenericDecl {
+        f_generic_formal_decls
+          = Lazy.from_fun f_generic_formal_decls ;
+        f_decl
+          = Lazy.from_fun f_decl ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and LexerDeclType : sig
+   
+  
+   
+  type t = [
+    | `LexerDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_rules: LKNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `LexerDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_rules: LKNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_rules () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.lexer_decl_f_rules
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         LKNodeListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `LexerDecl {
+        f_rules
+          = Lazy.from_fun f_rules ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and LexerFamilyDeclType : sig
+   
+  
+   
+  type t = [
+    | `LexerFamilyDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_rules: FullDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `LexerFamilyDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_rules: FullDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_rules () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.lexer_family_decl_f_rules
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         FullDeclListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `LexerFamilyDecl {
+        f_rules
+          = Lazy.from_fun f_rules ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and TypeDeclType : sig
+   
+  
+   
+  (**
+    * FunctionTypeType.t
+    * GenericFormalTypeDeclType.t
+    * NamedTypeDeclType.t
+    * InstantiatedGenericTypeType.t
+    * EnumClassAltDeclType.t
+    *)
+  type t = [
+    | `EnumClassAltDecl
+        of EnumClassAltDeclType.fields
+    | `FunctionType
+        of FunctionTypeType.fields
+    | `GenericFormalTypeDecl
+        of GenericFormalTypeDeclType.fields
+    | `InstantiatedGenericType
+        of InstantiatedGenericTypeType.fields
+    | `ClassDecl
+        of ClassDeclType.fields
+    | `EnumClassDecl
+        of EnumClassDeclType.fields
+    | `EnumTypeDecl
+        of EnumTypeDeclType.fields
+    | `StructDecl
+        of StructDeclType.fields
+    | `TraitDecl
+        of TraitDeclType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  (**
+    * FunctionTypeType.t
+    * GenericFormalTypeDeclType.t
+    * NamedTypeDeclType.t
+    * InstantiatedGenericTypeType.t
+    * EnumClassAltDeclType.t
+    *)
+  type t = [
+    | `EnumClassAltDecl
+        of EnumClassAltDeclType.fields
+    | `FunctionType
+        of FunctionTypeType.fields
+    | `GenericFormalTypeDecl
+        of GenericFormalTypeDeclType.fields
+    | `InstantiatedGenericType
+        of InstantiatedGenericTypeType.fields
+    | `ClassDecl
+        of ClassDeclType.fields
+    | `EnumClassDecl
+        of EnumClassDeclType.fields
+    | `EnumTypeDecl
+        of EnumTypeDeclType.fields
+    | `StructDecl
+        of StructDeclType.fields
+    | `TraitDecl
+        of TraitDeclType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `EnumClassAltDecl _
+      | `FunctionType _
+      | `GenericFormalTypeDecl _
+      | `InstantiatedGenericType _
+      | `ClassDecl _
+      | `EnumClassDecl _
+      | `EnumTypeDecl _
+      | `StructDecl _
+      | `TraitDecl _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and EnumClassAltDeclType : sig
+   
+  
+   
+  type t = [
+    | `EnumClassAltDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `EnumClassAltDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `EnumClassAltDecl {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and FunctionTypeType : sig
+   
+  
+   
+  type t = [
+    | `FunctionType
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `FunctionType
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `FunctionType {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GenericFormalTypeDeclType : sig
+   
+  
+   
+  type t = [
+    | `GenericFormalTypeDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GenericFormalTypeDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GenericFormalTypeDecl {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and InstantiatedGenericTypeType : sig
+   
+  
+   
+  type t = [
+    | `InstantiatedGenericType
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `InstantiatedGenericType
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `InstantiatedGenericType {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and NamedTypeDeclType : sig
+   
+  
+   
+  (**
+    * TraitDeclType.t
+    * EnumTypeDeclType.t
+    * StructDeclType.t
+    * BasicClassDeclType.t
+    *)
+  type t = [
+    | `ClassDecl
+        of ClassDeclType.fields
+    | `EnumClassDecl
+        of EnumClassDeclType.fields
+    | `EnumTypeDecl
+        of EnumTypeDeclType.fields
+    | `StructDecl
+        of StructDeclType.fields
+    | `TraitDecl
+        of TraitDeclType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  (**
+    * TraitDeclType.t
+    * EnumTypeDeclType.t
+    * StructDeclType.t
+    * BasicClassDeclType.t
+    *)
+  type t = [
+    | `ClassDecl
+        of ClassDeclType.fields
+    | `EnumClassDecl
+        of EnumClassDeclType.fields
+    | `EnumTypeDecl
+        of EnumTypeDeclType.fields
+    | `StructDecl
+        of StructDeclType.fields
+    | `TraitDecl
+        of TraitDeclType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `ClassDecl _
+      | `EnumClassDecl _
+      | `EnumTypeDecl _
+      | `StructDecl _
+      | `TraitDecl _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and BasicClassDeclType : sig
+   
+  
+   
+  type t = [
+    | `ClassDecl
+        of ClassDeclType.fields
+    | `EnumClassDecl
+        of EnumClassDeclType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ClassDecl
+        of ClassDeclType.fields
+    | `EnumClassDecl
+        of EnumClassDeclType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `ClassDecl _
+      | `EnumClassDecl _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and ClassDeclType : sig
+   
+  
+   
+  type t = [
+    | `ClassDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ClassDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ClassDecl {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and EnumClassDeclType : sig
+   
+  
+   
+  type t = [
+    | `EnumClassDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_branches: EnumClassCaseListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `EnumClassDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_branches: EnumClassCaseListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_branches () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.enum_class_decl_f_branches
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         EnumClassCaseListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `EnumClassDecl {
+        f_branches
+          = Lazy.from_fun f_branches ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and EnumTypeDeclType : sig
+   
+  
+   
+  type t = [
+    | `EnumTypeDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_literals: EnumLitDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `EnumTypeDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_literals: EnumLitDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_literals () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.enum_type_decl_f_literals
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         EnumLitDeclListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `EnumTypeDecl {
+        f_literals
+          = Lazy.from_fun f_literals ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and StructDeclType : sig
+   
+  
+   
+  type t = [
+    | `StructDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `StructDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `StructDecl {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and TraitDeclType : sig
+   
+  
+   
+  type t = [
+    | `TraitDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `TraitDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `TraitDecl {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DeclAnnotationType : sig
+   
+  
+   
+  type t = [
+    | `DeclAnnotation
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: IdType.t
+    Lazy.t;
+         
+    f_params: DeclAnnotationParamsType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DeclAnnotation
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: IdType.t
+    Lazy.t;
+         
+    f_params: DeclAnnotationParamsType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.decl_annotation_f_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         IdType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_params () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.decl_annotation_f_params
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (DeclAnnotationParamsType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `DeclAnnotation {
+        f_name
+          = Lazy.from_fun f_name ;
+        f_params
+          = Lazy.from_fun f_params ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DeclAnnotationParamsType : sig
+   
+  
+   
+  type t = [
+    | `DeclAnnotationParams
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_params: ParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DeclAnnotationParams
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_params: ParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_params () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.decl_annotation_params_f_params
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ParamListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `DeclAnnotationParams {
+        f_params
+          = Lazy.from_fun f_params ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DocType : sig
+   
+  
+   
+  type t = [
+    | `Doc
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_lines: DocCommentListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `Doc
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_lines: DocCommentListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_lines () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.doc_f_lines
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         DocCommentListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `Doc {
+        f_lines
+          = Lazy.from_fun f_lines ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DocCommentType : sig
+   
+  
+   
+  type t = [
+    | `DocComment
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DocComment
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `DocComment {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ElsifBranchType : sig
+   
+  
+   
+  type t = [
+    | `ElsifBranch
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_then_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ElsifBranch
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_then_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_cond_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.elsif_branch_f_cond_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_then_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.elsif_branch_f_then_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ElsifBranch {
+        f_cond_expr
+          = Lazy.from_fun f_cond_expr ;
+        f_then_expr
+          = Lazy.from_fun f_then_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and EnumClassCaseType : sig
+   
+  
+   
+  type t = [
+    | `EnumClassCase
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_decls: EnumClassAltDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `EnumClassCase
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_decls: EnumClassAltDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_decls () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.enum_class_case_f_decls
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         EnumClassAltDeclListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `EnumClassCase {
+        f_decls
+          = Lazy.from_fun f_decls ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ExcludesNullType : sig
+   
+  
+   
+  type t = [
+    | `ExcludesNullAbsent
+        of ExcludesNullAbsentType.fields
+    | `ExcludesNullPresent
+        of ExcludesNullPresentType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ExcludesNullAbsent
+        of ExcludesNullAbsentType.fields
+    | `ExcludesNullPresent
+        of ExcludesNullPresentType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `ExcludesNullAbsent _
+      | `ExcludesNullPresent _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and ExcludesNullAbsentType : sig
+   
+  
+   
+  type t = [
+    | `ExcludesNullAbsent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ExcludesNullAbsent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ExcludesNullAbsent {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ExcludesNullPresentType : sig
+   
+  
+   
+  type t = [
+    | `ExcludesNullPresent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ExcludesNullPresent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ExcludesNullPresent {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ExprType : sig
+   
+  
+   
+  (**
+    * GrammarExprType.t
+    * DotExprType.t
+    * IdType.t
+    * ArrayLiteralType.t
+    * NotExprType.t
+    * CastExprType.t
+    * IsaType.t
+    * ParenExprType.t
+    * CallExprType.t
+    * GenericInstantiationType.t
+    * ErrorOnNullType.t
+    * LambdaExprType.t
+    * TryExprType.t
+    * RaiseExprType.t
+    * IfExprType.t
+    * BlockExprType.t
+    * MatchExprType.t
+    * BinOpType.t
+    * LitType.t
+    * LogicExprType.t
+    *)
+  type t = [
+    | `ArrayLiteral
+        of ArrayLiteralType.fields
+    | `BinOp
+        of BinOpType.fields
+    | `BlockExpr
+        of BlockExprType.fields
+    | `CallExpr
+        of CallExprType.fields
+    | `NullCondCallExpr
+        of NullCondCallExprType.fields
+    | `CastExpr
+        of CastExprType.fields
+    | `DotExpr
+        of DotExprType.fields
+    | `NullCondDottedName
+        of NullCondDottedNameType.fields
+    | `ErrorOnNull
+        of ErrorOnNullType.fields
+    | `GenericInstantiation
+        of GenericInstantiationType.fields
+    | `GrammarCut
+        of GrammarCutType.fields
+    | `GrammarDiscard
+        of GrammarDiscardType.fields
+    | `GrammarDontSkip
+        of GrammarDontSkipType.fields
+    | `GrammarList
+        of GrammarListType.fields
+    | `GrammarNull
+        of GrammarNullType.fields
+    | `GrammarOpt
+        of GrammarOptType.fields
+    | `GrammarOptGroup
+        of GrammarOptGroupType.fields
+    | `GrammarOrExpr
+        of GrammarOrExprType.fields
+    | `GrammarPick
+        of GrammarPickType.fields
+    | `GrammarImplicitPick
+        of GrammarImplicitPickType.fields
+    | `GrammarPredicate
+        of GrammarPredicateType.fields
+    | `GrammarRuleRef
+        of GrammarRuleRefType.fields
+    | `GrammarSkip
+        of GrammarSkipType.fields
+    | `ParseNodeExpr
+        of ParseNodeExprType.fields
+    | `TokenLit
+        of TokenLitType.fields
+    | `TokenNoCaseLit
+        of TokenNoCaseLitType.fields
+    | `TokenPatternLit
+        of TokenPatternLitType.fields
+    | `TokenRef
+        of TokenRefType.fields
+    | `Id
+        of IdType.fields
+    | `DefId
+        of DefIdType.fields
+    | `RefId
+        of RefIdType.fields
+    | `ModuleRefId
+        of ModuleRefIdType.fields
+    | `IfExpr
+        of IfExprType.fields
+    | `Isa
+        of IsaType.fields
+    | `LambdaExpr
+        of LambdaExprType.fields
+    | `CharLit
+        of CharLitType.fields
+    | `NullLit
+        of NullLitType.fields
+    | `NumLit
+        of NumLitType.fields
+    | `StringLit
+        of StringLitType.fields
+    | `LogicExpr
+        of LogicExprType.fields
+    | `MatchExpr
+        of MatchExprType.fields
+    | `NotExpr
+        of NotExprType.fields
+    | `ParenExpr
+        of ParenExprType.fields
+    | `RaiseExpr
+        of RaiseExprType.fields
+    | `TryExpr
+        of TryExprType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  (**
+    * GrammarExprType.t
+    * DotExprType.t
+    * IdType.t
+    * ArrayLiteralType.t
+    * NotExprType.t
+    * CastExprType.t
+    * IsaType.t
+    * ParenExprType.t
+    * CallExprType.t
+    * GenericInstantiationType.t
+    * ErrorOnNullType.t
+    * LambdaExprType.t
+    * TryExprType.t
+    * RaiseExprType.t
+    * IfExprType.t
+    * BlockExprType.t
+    * MatchExprType.t
+    * BinOpType.t
+    * LitType.t
+    * LogicExprType.t
+    *)
+  type t = [
+    | `ArrayLiteral
+        of ArrayLiteralType.fields
+    | `BinOp
+        of BinOpType.fields
+    | `BlockExpr
+        of BlockExprType.fields
+    | `CallExpr
+        of CallExprType.fields
+    | `NullCondCallExpr
+        of NullCondCallExprType.fields
+    | `CastExpr
+        of CastExprType.fields
+    | `DotExpr
+        of DotExprType.fields
+    | `NullCondDottedName
+        of NullCondDottedNameType.fields
+    | `ErrorOnNull
+        of ErrorOnNullType.fields
+    | `GenericInstantiation
+        of GenericInstantiationType.fields
+    | `GrammarCut
+        of GrammarCutType.fields
+    | `GrammarDiscard
+        of GrammarDiscardType.fields
+    | `GrammarDontSkip
+        of GrammarDontSkipType.fields
+    | `GrammarList
+        of GrammarListType.fields
+    | `GrammarNull
+        of GrammarNullType.fields
+    | `GrammarOpt
+        of GrammarOptType.fields
+    | `GrammarOptGroup
+        of GrammarOptGroupType.fields
+    | `GrammarOrExpr
+        of GrammarOrExprType.fields
+    | `GrammarPick
+        of GrammarPickType.fields
+    | `GrammarImplicitPick
+        of GrammarImplicitPickType.fields
+    | `GrammarPredicate
+        of GrammarPredicateType.fields
+    | `GrammarRuleRef
+        of GrammarRuleRefType.fields
+    | `GrammarSkip
+        of GrammarSkipType.fields
+    | `ParseNodeExpr
+        of ParseNodeExprType.fields
+    | `TokenLit
+        of TokenLitType.fields
+    | `TokenNoCaseLit
+        of TokenNoCaseLitType.fields
+    | `TokenPatternLit
+        of TokenPatternLitType.fields
+    | `TokenRef
+        of TokenRefType.fields
+    | `Id
+        of IdType.fields
+    | `DefId
+        of DefIdType.fields
+    | `RefId
+        of RefIdType.fields
+    | `ModuleRefId
+        of ModuleRefIdType.fields
+    | `IfExpr
+        of IfExprType.fields
+    | `Isa
+        of IsaType.fields
+    | `LambdaExpr
+        of LambdaExprType.fields
+    | `CharLit
+        of CharLitType.fields
+    | `NullLit
+        of NullLitType.fields
+    | `NumLit
+        of NumLitType.fields
+    | `StringLit
+        of StringLitType.fields
+    | `LogicExpr
+        of LogicExprType.fields
+    | `MatchExpr
+        of MatchExprType.fields
+    | `NotExpr
+        of NotExprType.fields
+    | `ParenExpr
+        of ParenExprType.fields
+    | `RaiseExpr
+        of RaiseExprType.fields
+    | `TryExpr
+        of TryExprType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `NullCondCallExpr _
+      | `CastExpr _
+      | `DotExpr _
+      | `NullCondDottedName _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `GrammarCut _
+      | `GrammarDiscard _
+      | `GrammarDontSkip _
+      | `GrammarList _
+      | `GrammarNull _
+      | `GrammarOpt _
+      | `GrammarOptGroup _
+      | `GrammarOrExpr _
+      | `GrammarPick _
+      | `GrammarImplicitPick _
+      | `GrammarPredicate _
+      | `GrammarRuleRef _
+      | `GrammarSkip _
+      | `ParseNodeExpr _
+      | `TokenLit _
+      | `TokenNoCaseLit _
+      | `TokenPatternLit _
+      | `TokenRef _
+      | `Id _
+      | `DefId _
+      | `RefId _
+      | `ModuleRefId _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `CharLit _
+      | `NullLit _
+      | `NumLit _
+      | `StringLit _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `NotExpr _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `TryExpr _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and ArrayLiteralType : sig
+   
+  
+   
+  type t = [
+    | `ArrayLiteral
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ArrayLiteral
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.array_literal_f_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ArrayLiteral {
+        f_exprs
+          = Lazy.from_fun f_exprs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and BinOpType : sig
+   
+  
+   
+  type t = [
+    | `BinOp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `BinOp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_left () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.bin_op_f_left
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_op () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.bin_op_f_op
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         OpType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_right () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.bin_op_f_right
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `BinOp {
+        f_left
+          = Lazy.from_fun f_left ;
+        f_op
+          = Lazy.from_fun f_op ;
+        f_right
+          = Lazy.from_fun f_right ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and BlockExprType : sig
+   
+  
+   
+  type t = [
+    | `BlockExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_val_defs: LKNodeListType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `BlockExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_val_defs: LKNodeListType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_val_defs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.block_expr_f_val_defs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         LKNodeListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.block_expr_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `BlockExpr {
+        f_val_defs
+          = Lazy.from_fun f_val_defs ;
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CallExprType : sig
+   
+  
+   
+  type t = [
+    | `CallExpr
+        of fields
+    | `NullCondCallExpr
+        of NullCondCallExprType.fields
+  ]
+  and fields = 
+  {
+         
+    f_name: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_args: ParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CallExpr
+        of fields
+    | `NullCondCallExpr
+        of NullCondCallExprType.fields
+  ]
+  and fields = 
+  {
+         
+    f_name: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_args: ParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.call_expr_f_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RefId _
+      | `StringLit _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_args () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.call_expr_f_args
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ParamListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CallExpr {
+        f_name
+          = Lazy.from_fun f_name ;
+        f_args
+          = Lazy.from_fun f_args ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and NullCondCallExprType : sig
+   
+  
+   
+  type t = [
+    | `NullCondCallExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_args: ParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `NullCondCallExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_args: ParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.call_expr_f_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RefId _
+      | `StringLit _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_args () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.call_expr_f_args
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ParamListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `NullCondCallExpr {
+        f_name
+          = Lazy.from_fun f_name ;
+        f_args
+          = Lazy.from_fun f_args ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CastExprType : sig
+   
+  
+   
+  type t = [
+    | `CastExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_excludes_null: ExcludesNullType.t
+    Lazy.t;
+         
+    f_dest_type: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CastExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_excludes_null: ExcludesNullType.t
+    Lazy.t;
+         
+    f_dest_type: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.cast_expr_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RefId _
+      | `StringLit _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_excludes_null () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.cast_expr_f_excludes_null
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExcludesNullType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_dest_type () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.cast_expr_f_dest_type
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         TypeRefType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CastExpr {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        f_excludes_null
+          = Lazy.from_fun f_excludes_null ;
+        f_dest_type
+          = Lazy.from_fun f_dest_type ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DotExprType : sig
+   
+  
+   
+  type t = [
+    | `DotExpr
+        of fields
+    | `NullCondDottedName
+        of NullCondDottedNameType.fields
+  ]
+  and fields = 
+  {
+         
+    f_prefix: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: RefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DotExpr
+        of fields
+    | `NullCondDottedName
+        of NullCondDottedNameType.fields
+  ]
+  and fields = 
+  {
+         
+    f_prefix: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: RefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_prefix () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.dot_expr_f_prefix
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RefId _
+      | `StringLit _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_suffix () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.dot_expr_f_suffix
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         RefIdType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `DotExpr {
+        f_prefix
+          = Lazy.from_fun f_prefix ;
+        f_suffix
+          = Lazy.from_fun f_suffix ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and NullCondDottedNameType : sig
+   
+  
+   
+  type t = [
+    | `NullCondDottedName
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_prefix: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: RefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `NullCondDottedName
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_prefix: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: RefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_prefix () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.dot_expr_f_prefix
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RefId _
+      | `StringLit _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_suffix () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.dot_expr_f_suffix
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         RefIdType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `NullCondDottedName {
+        f_prefix
+          = Lazy.from_fun f_prefix ;
+        f_suffix
+          = Lazy.from_fun f_suffix ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ErrorOnNullType : sig
+   
+  
+   
+  type t = [
+    | `ErrorOnNull
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ErrorOnNull
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.error_on_null_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RefId _
+      | `StringLit _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ErrorOnNull {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GenericInstantiationType : sig
+   
+  
+   
+  type t = [
+    | `GenericInstantiation
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_args: TypeRefListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GenericInstantiation
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_args: TypeRefListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.generic_instantiation_f_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RefId _
+      | `StringLit _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_args () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.generic_instantiation_f_args
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         TypeRefListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GenericInstantiation {
+        f_name
+          = Lazy.from_fun f_name ;
+        f_args
+          = Lazy.from_fun f_args ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GrammarExprType : sig
+   
+  
+   
+  (**
+    * ParseNodeExprType.t
+    * GrammarRuleRefType.t
+    * GrammarDiscardType.t
+    * TokenLitType.t
+    * TokenNoCaseLitType.t
+    * TokenPatternLitType.t
+    * GrammarPickType.t
+    * TokenRefType.t
+    * GrammarOrExprType.t
+    * GrammarOptType.t
+    * GrammarOptGroupType.t
+    * GrammarCutType.t
+    * GrammarNullType.t
+    * GrammarSkipType.t
+    * GrammarPredicateType.t
+    * GrammarDontSkipType.t
+    * GrammarListType.t
+    *)
+  type t = [
+    | `GrammarCut
+        of GrammarCutType.fields
+    | `GrammarDiscard
+        of GrammarDiscardType.fields
+    | `GrammarDontSkip
+        of GrammarDontSkipType.fields
+    | `GrammarList
+        of GrammarListType.fields
+    | `GrammarNull
+        of GrammarNullType.fields
+    | `GrammarOpt
+        of GrammarOptType.fields
+    | `GrammarOptGroup
+        of GrammarOptGroupType.fields
+    | `GrammarOrExpr
+        of GrammarOrExprType.fields
+    | `GrammarPick
+        of GrammarPickType.fields
+    | `GrammarImplicitPick
+        of GrammarImplicitPickType.fields
+    | `GrammarPredicate
+        of GrammarPredicateType.fields
+    | `GrammarRuleRef
+        of GrammarRuleRefType.fields
+    | `GrammarSkip
+        of GrammarSkipType.fields
+    | `ParseNodeExpr
+        of ParseNodeExprType.fields
+    | `TokenLit
+        of TokenLitType.fields
+    | `TokenNoCaseLit
+        of TokenNoCaseLitType.fields
+    | `TokenPatternLit
+        of TokenPatternLitType.fields
+    | `TokenRef
+        of TokenRefType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  (**
+    * ParseNodeExprType.t
+    * GrammarRuleRefType.t
+    * GrammarDiscardType.t
+    * TokenLitType.t
+    * TokenNoCaseLitType.t
+    * TokenPatternLitType.t
+    * GrammarPickType.t
+    * TokenRefType.t
+    * GrammarOrExprType.t
+    * GrammarOptType.t
+    * GrammarOptGroupType.t
+    * GrammarCutType.t
+    * GrammarNullType.t
+    * GrammarSkipType.t
+    * GrammarPredicateType.t
+    * GrammarDontSkipType.t
+    * GrammarListType.t
+    *)
+  type t = [
+    | `GrammarCut
+        of GrammarCutType.fields
+    | `GrammarDiscard
+        of GrammarDiscardType.fields
+    | `GrammarDontSkip
+        of GrammarDontSkipType.fields
+    | `GrammarList
+        of GrammarListType.fields
+    | `GrammarNull
+        of GrammarNullType.fields
+    | `GrammarOpt
+        of GrammarOptType.fields
+    | `GrammarOptGroup
+        of GrammarOptGroupType.fields
+    | `GrammarOrExpr
+        of GrammarOrExprType.fields
+    | `GrammarPick
+        of GrammarPickType.fields
+    | `GrammarImplicitPick
+        of GrammarImplicitPickType.fields
+    | `GrammarPredicate
+        of GrammarPredicateType.fields
+    | `GrammarRuleRef
+        of GrammarRuleRefType.fields
+    | `GrammarSkip
+        of GrammarSkipType.fields
+    | `ParseNodeExpr
+        of ParseNodeExprType.fields
+    | `TokenLit
+        of TokenLitType.fields
+    | `TokenNoCaseLit
+        of TokenNoCaseLitType.fields
+    | `TokenPatternLit
+        of TokenPatternLitType.fields
+    | `TokenRef
+        of TokenRefType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `GrammarCut _
+      | `GrammarDiscard _
+      | `GrammarDontSkip _
+      | `GrammarList _
+      | `GrammarNull _
+      | `GrammarOpt _
+      | `GrammarOptGroup _
+      | `GrammarOrExpr _
+      | `GrammarPick _
+      | `GrammarImplicitPick _
+      | `GrammarPredicate _
+      | `GrammarRuleRef _
+      | `GrammarSkip _
+      | `ParseNodeExpr _
+      | `TokenLit _
+      | `TokenNoCaseLit _
+      | `TokenPatternLit _
+      | `TokenRef _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and GrammarCutType : sig
+   
+  
+   
+  type t = [
+    | `GrammarCut
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarCut
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarCut {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GrammarDiscardType : sig
+   
+  
+   
+  type t = [
+    | `GrammarDiscard
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarDiscard
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_discard_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         GrammarExprType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarDiscard {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GrammarDontSkipType : sig
+   
+  
+   
+  type t = [
+    | `GrammarDontSkip
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+         
+    f_dont_skip: GrammarExprType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarDontSkip
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+         
+    f_dont_skip: GrammarExprType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_dont_skip_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         GrammarExprType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_dont_skip () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_dont_skip_f_dont_skip
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         GrammarExprType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarDontSkip {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        f_dont_skip
+          = Lazy.from_fun f_dont_skip ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GrammarListType : sig
+   
+  
+   
+  type t = [
+    | `GrammarList
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_list_type: TypeRefType.t
+    option
+    Lazy.t;
+         
+    f_kind: ListKindType.t
+    Lazy.t;
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+         
+    f_sep: GrammarExprType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarList
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_list_type: TypeRefType.t
+    option
+    Lazy.t;
+         
+    f_kind: ListKindType.t
+    Lazy.t;
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+         
+    f_sep: GrammarExprType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_list_type () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_list_f_list_type
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (TypeRefType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    let f_kind () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_list_f_kind
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ListKindType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_list_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         GrammarExprType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_sep () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_list_f_sep
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (GrammarExprType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarList {
+        f_list_type
+          = Lazy.from_fun f_list_type ;
+        f_kind
+          = Lazy.from_fun f_kind ;
+        f_expr
+          = Lazy.from_fun f_expr ;
+        f_sep
+          = Lazy.from_fun f_sep ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GrammarNullType : sig
+   
+  
+   
+  type t = [
+    | `GrammarNull
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarNull
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_null_f_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         TypeRefType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarNull {
+        f_name
+          = Lazy.from_fun f_name ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GrammarOptType : sig
+   
+  
+   
+  type t = [
+    | `GrammarOpt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarOpt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_opt_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         GrammarExprType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarOpt {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GrammarOptGroupType : sig
+   
+  
+   
+  type t = [
+    | `GrammarOptGroup
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarOptGroup
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_opt_group_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         GrammarExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarOptGroup {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GrammarOrExprType : sig
+   
+  
+   
+  type t = [
+    | `GrammarOrExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_sub_exprs: GrammarExprListListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarOrExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_sub_exprs: GrammarExprListListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_sub_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_or_expr_f_sub_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         GrammarExprListListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarOrExpr {
+        f_sub_exprs
+          = Lazy.from_fun f_sub_exprs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GrammarPickType : sig
+   
+  
+   
+  type t = [
+    | `GrammarPick
+        of fields
+    | `GrammarImplicitPick
+        of GrammarImplicitPickType.fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarPick
+        of fields
+    | `GrammarImplicitPick
+        of GrammarImplicitPickType.fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_pick_f_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         GrammarExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarPick {
+        f_exprs
+          = Lazy.from_fun f_exprs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GrammarImplicitPickType : sig
+   
+  
+   
+  type t = [
+    | `GrammarImplicitPick
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarImplicitPick
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_pick_f_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         GrammarExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarImplicitPick {
+        f_exprs
+          = Lazy.from_fun f_exprs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GrammarPredicateType : sig
+   
+  
+   
+  type t = [
+    | `GrammarPredicate
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+         
+    f_prop_ref: [
+      | `DotExpr
+          of DotExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `RefId
+          of RefIdType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarPredicate
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+         
+    f_prop_ref: [
+      | `DotExpr
+          of DotExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `RefId
+          of RefIdType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_predicate_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         GrammarExprType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_prop_ref () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_predicate_f_prop_ref
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `DotExpr _
+      | `ModuleRefId _
+      | `NullCondDottedName _
+      | `RefId _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarPredicate {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        f_prop_ref
+          = Lazy.from_fun f_prop_ref ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GrammarRuleRefType : sig
+   
+  
+   
+  type t = [
+    | `GrammarRuleRef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_node_name: RefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarRuleRef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_node_name: RefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_node_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_rule_ref_f_node_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         RefIdType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarRuleRef {
+        f_node_name
+          = Lazy.from_fun f_node_name ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GrammarSkipType : sig
+   
+  
+   
+  type t = [
+    | `GrammarSkip
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarSkip
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.grammar_skip_f_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         TypeRefType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarSkip {
+        f_name
+          = Lazy.from_fun f_name ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ParseNodeExprType : sig
+   
+  
+   
+  type t = [
+    | `ParseNodeExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_node_name: TypeRefType.t
+    Lazy.t;
+         
+    f_sub_exprs: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ParseNodeExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_node_name: TypeRefType.t
+    Lazy.t;
+         
+    f_sub_exprs: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_node_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.parse_node_expr_f_node_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         TypeRefType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_sub_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.parse_node_expr_f_sub_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         GrammarExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ParseNodeExpr {
+        f_node_name
+          = Lazy.from_fun f_node_name ;
+        f_sub_exprs
+          = Lazy.from_fun f_sub_exprs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and TokenLitType : sig
+   
+  
+   
+  type t = [
+    | `TokenLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `TokenLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `TokenLit {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and TokenNoCaseLitType : sig
+   
+  
+   
+  type t = [
+    | `TokenNoCaseLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_lit: TokenLitType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `TokenNoCaseLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_lit: TokenLitType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_lit () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.token_no_case_lit_f_lit
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         TokenLitType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `TokenNoCaseLit {
+        f_lit
+          = Lazy.from_fun f_lit ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and TokenPatternLitType : sig
+   
+  
+   
+  type t = [
+    | `TokenPatternLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `TokenPatternLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `TokenPatternLit {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and TokenRefType : sig
+   
+  
+   
+  type t = [
+    | `TokenRef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_token_name: RefIdType.t
+    Lazy.t;
+         
+    f_expr: TokenLitType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `TokenRef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_token_name: RefIdType.t
+    Lazy.t;
+         
+    f_expr: TokenLitType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_token_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.token_ref_f_token_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         RefIdType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.token_ref_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (TokenLitType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `TokenRef {
+        f_token_name
+          = Lazy.from_fun f_token_name ;
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and IdType : sig
+   
+  
+   
+  type t = [
+    | `Id
+        of fields
+    | `DefId
+        of DefIdType.fields
+    | `RefId
+        of RefIdType.fields
+    | `ModuleRefId
+        of ModuleRefIdType.fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `Id
+        of fields
+    | `DefId
+        of DefIdType.fields
+    | `RefId
+        of RefIdType.fields
+    | `ModuleRefId
+        of ModuleRefIdType.fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `Id {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DefIdType : sig
+   
+  
+   
+  type t = [
+    | `DefId
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DefId
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `DefId {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and RefIdType : sig
+   
+  
+   
+  type t = [
+    | `RefId
+        of fields
+    | `ModuleRefId
+        of ModuleRefIdType.fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `RefId
+        of fields
+    | `ModuleRefId
+        of ModuleRefIdType.fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `RefId {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ModuleRefIdType : sig
+   
+  
+   
+  type t = [
+    | `ModuleRefId
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ModuleRefId
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ModuleRefId {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and IfExprType : sig
+   
+  
+   
+  type t = [
+    | `IfExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_then_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_alternatives: ElsifBranchListType.t
+    Lazy.t;
+         
+    f_else_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `IfExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_then_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_alternatives: ElsifBranchListType.t
+    Lazy.t;
+         
+    f_else_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_cond_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.if_expr_f_cond_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_then_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.if_expr_f_then_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_alternatives () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.if_expr_f_alternatives
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ElsifBranchListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_else_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.if_expr_f_else_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `IfExpr {
+        f_cond_expr
+          = Lazy.from_fun f_cond_expr ;
+        f_then_expr
+          = Lazy.from_fun f_then_expr ;
+        f_alternatives
+          = Lazy.from_fun f_alternatives ;
+        f_else_expr
+          = Lazy.from_fun f_else_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and IsaType : sig
+   
+  
+   
+  type t = [
+    | `Isa
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_dest_type: TypeRefListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `Isa
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_dest_type: TypeRefListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.isa_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_dest_type () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.isa_f_dest_type
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         TypeRefListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `Isa {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        f_dest_type
+          = Lazy.from_fun f_dest_type ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and LambdaExprType : sig
+   
+  
+   
+  type t = [
+    | `LambdaExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_params: LambdaArgDeclListType.t
+    Lazy.t;
+         
+    f_return_type: TypeRefType.t
+    option
+    Lazy.t;
+         
+    f_body: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `LambdaExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_params: LambdaArgDeclListType.t
+    Lazy.t;
+         
+    f_return_type: TypeRefType.t
+    option
+    Lazy.t;
+         
+    f_body: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_params () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.lambda_expr_f_params
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         LambdaArgDeclListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_return_type () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.lambda_expr_f_return_type
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (TypeRefType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    let f_body () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.lambda_expr_f_body
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `LambdaExpr {
+        f_params
+          = Lazy.from_fun f_params ;
+        f_return_type
+          = Lazy.from_fun f_return_type ;
+        f_body
+          = Lazy.from_fun f_body ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and LitType : sig
+   
+  
+   
+  type t = [
+    | `CharLit
+        of CharLitType.fields
+    | `NullLit
+        of NullLitType.fields
+    | `NumLit
+        of NumLitType.fields
+    | `StringLit
+        of StringLitType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CharLit
+        of CharLitType.fields
+    | `NullLit
+        of NullLitType.fields
+    | `NumLit
+        of NumLitType.fields
+    | `StringLit
+        of StringLitType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `CharLit _
+      | `NullLit _
+      | `NumLit _
+      | `StringLit _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and CharLitType : sig
+   
+  
+   
+  type t = [
+    | `CharLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CharLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CharLit {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and NullLitType : sig
+   
+  
+   
+  type t = [
+    | `NullLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `NullLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `NullLit {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and NumLitType : sig
+   
+  
+   
+  type t = [
+    | `NumLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `NumLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `NumLit {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and StringLitType : sig
+   
+  
+   
+  type t = [
+    | `StringLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `StringLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `StringLit {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and LogicExprType : sig
+   
+  
+   
+  type t = [
+    | `LogicExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `LogicExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.logic_expr_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RefId _
+      | `StringLit _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `LogicExpr {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and MatchExprType : sig
+   
+  
+   
+  type t = [
+    | `MatchExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_match_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_branches: MatchBranchListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `MatchExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_match_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_branches: MatchBranchListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_match_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.match_expr_f_match_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_branches () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.match_expr_f_branches
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         MatchBranchListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `MatchExpr {
+        f_match_expr
+          = Lazy.from_fun f_match_expr ;
+        f_branches
+          = Lazy.from_fun f_branches ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and NotExprType : sig
+   
+  
+   
+  type t = [
+    | `NotExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `NotExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.not_expr_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `NotExpr {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ParenExprType : sig
+   
+  
+   
+  type t = [
+    | `ParenExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ParenExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.paren_expr_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ParenExpr {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and RaiseExprType : sig
+   
+  
+   
+  type t = [
+    | `RaiseExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_except_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `RaiseExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_except_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_except_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.raise_expr_f_except_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `RaiseExpr {
+        f_except_expr
+          = Lazy.from_fun f_except_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and TryExprType : sig
+   
+  
+   
+  type t = [
+    | `TryExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_try_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of fields
+    ]
+    Lazy.t;
+         
+    f_or_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `TryExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_try_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of fields
+    ]
+    Lazy.t;
+         
+    f_or_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_try_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.try_expr_f_try_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_or_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.try_expr_f_or_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprType.wrap context (field_c_value))
+      in
+         
+
+      match node with
+            
+      | Some `ArrayLiteral _
+      | Some `BinOp _
+      | Some `BlockExpr _
+      | Some `CallExpr _
+      | Some `CastExpr _
+      | Some `CharLit _
+      | Some `DotExpr _
+      | Some `ErrorOnNull _
+      | Some `GenericInstantiation _
+      | Some `IfExpr _
+      | Some `Isa _
+      | Some `LambdaExpr _
+      | Some `LogicExpr _
+      | Some `MatchExpr _
+      | Some `ModuleRefId _
+      | Some `NotExpr _
+      | Some `NullCondCallExpr _
+      | Some `NullCondDottedName _
+      | Some `NullLit _
+      | Some `NumLit _
+      | Some `ParenExpr _
+      | Some `RaiseExpr _
+      | Some `RefId _
+      | Some `StringLit _
+      | Some `TryExpr _
+      | None as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `TryExpr {
+        f_try_expr
+          = Lazy.from_fun f_try_expr ;
+        f_or_expr
+          = Lazy.from_fun f_or_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and FullDeclType : sig
+   
+  
+   
+  type t = [
+    | `FullDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_doc: DocType.t
+    Lazy.t;
+         
+    f_decl_annotations: DeclAnnotationListType.t
+    Lazy.t;
+         
+    f_decl: [
+      | `ClassDecl
+          of ClassDeclType.fields
+      | `EnumClassDecl
+          of EnumClassDeclType.fields
+      | `EnumTypeDecl
+          of EnumTypeDeclType.fields
+      | `FieldDecl
+          of FieldDeclType.fields
+      | `FunDecl
+          of FunDeclType.fields
+      | `GenericDecl
+          of GenericDeclType.fields
+      | `GenericFormalTypeDecl
+          of GenericFormalTypeDeclType.fields
+      | `GrammarDecl
+          of GrammarDeclType.fields
+      | `GrammarRuleDecl
+          of GrammarRuleDeclType.fields
+      | `LexerDecl
+          of LexerDeclType.fields
+      | `LexerFamilyDecl
+          of LexerFamilyDeclType.fields
+      | `StructDecl
+          of StructDeclType.fields
+      | `TraitDecl
+          of TraitDeclType.fields
+      | `ValDecl
+          of ValDeclType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `FullDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_doc: DocType.t
+    Lazy.t;
+         
+    f_decl_annotations: DeclAnnotationListType.t
+    Lazy.t;
+         
+    f_decl: [
+      | `ClassDecl
+          of ClassDeclType.fields
+      | `EnumClassDecl
+          of EnumClassDeclType.fields
+      | `EnumTypeDecl
+          of EnumTypeDeclType.fields
+      | `FieldDecl
+          of FieldDeclType.fields
+      | `FunDecl
+          of FunDeclType.fields
+      | `GenericDecl
+          of GenericDeclType.fields
+      | `GenericFormalTypeDecl
+          of GenericFormalTypeDeclType.fields
+      | `GrammarDecl
+          of GrammarDeclType.fields
+      | `GrammarRuleDecl
+          of GrammarRuleDeclType.fields
+      | `LexerDecl
+          of LexerDeclType.fields
+      | `LexerFamilyDecl
+          of LexerFamilyDeclType.fields
+      | `StructDecl
+          of StructDeclType.fields
+      | `TraitDecl
+          of TraitDeclType.fields
+      | `ValDecl
+          of ValDeclType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_doc () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.full_decl_f_doc
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         DocType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_decl_annotations () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.full_decl_f_decl_annotations
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         DeclAnnotationListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_decl () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.full_decl_f_decl
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         DeclType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ClassDecl _
+      | `EnumClassDecl _
+      | `EnumTypeDecl _
+      | `FieldDecl _
+      | `FunDecl _
+      | `GenericDecl _
+      | `GenericFormalTypeDecl _
+      | `GrammarDecl _
+      | `GrammarRuleDecl _
+      | `LexerDecl _
+      | `LexerFamilyDecl _
+      | `StructDecl _
+      | `TraitDecl _
+      | `ValDecl _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `FullDecl {
+        f_doc
+          = Lazy.from_fun f_doc ;
+        f_decl_annotations
+          = Lazy.from_fun f_decl_annotations ;
+        f_decl
+          = Lazy.from_fun f_decl ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ImportType : sig
+   
+  
+   
+  type t = [
+    | `Import
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: ModuleRefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `Import
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: ModuleRefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.import_f_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ModuleRefIdType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `Import {
+        f_name
+          = Lazy.from_fun f_name ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and LKNodeBaseListType : sig
+   
+  
+   
+  (**
+    * FullDeclListType.t
+    * ExprListType.t
+    * ParamListType.t
+    * TypeRefListType.t
+    * LKNodeListType.t
+    * DeclAnnotationListType.t
+    * DocCommentListType.t
+    * FunArgDeclListType.t
+    * GrammarExprListType.t
+    * GrammarExprListListType.t
+    * ElsifBranchListType.t
+    * ImportListType.t
+    * LambdaArgDeclListType.t
+    * RefIdListType.t
+    * BaseLexerCaseRuleAltListType.t
+    * MatchBranchListType.t
+    * EnumClassCaseListType.t
+    * EnumClassAltDeclListType.t
+    * EnumLitDeclListType.t
+    *)
+  type t = [
+    | `BaseLexerCaseRuleAltList
+        of BaseLexerCaseRuleAltListType.fields
+    | `DeclAnnotationList
+        of DeclAnnotationListType.fields
+    | `DocCommentList
+        of DocCommentListType.fields
+    | `ElsifBranchList
+        of ElsifBranchListType.fields
+    | `EnumClassAltDeclList
+        of EnumClassAltDeclListType.fields
+    | `EnumClassCaseList
+        of EnumClassCaseListType.fields
+    | `EnumLitDeclList
+        of EnumLitDeclListType.fields
+    | `ExprList
+        of ExprListType.fields
+    | `FullDeclList
+        of FullDeclListType.fields
+    | `DeclBlock
+        of DeclBlockType.fields
+    | `FunArgDeclList
+        of FunArgDeclListType.fields
+    | `GrammarExprList
+        of GrammarExprListType.fields
+    | `GrammarExprListList
+        of GrammarExprListListType.fields
+    | `ImportList
+        of ImportListType.fields
+    | `LKNodeList
+        of LKNodeListType.fields
+    | `LambdaArgDeclList
+        of LambdaArgDeclListType.fields
+    | `MatchBranchList
+        of MatchBranchListType.fields
+    | `ParamList
+        of ParamListType.fields
+    | `RefIdList
+        of RefIdListType.fields
+    | `TypeRefList
+        of TypeRefListType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  (**
+    * FullDeclListType.t
+    * ExprListType.t
+    * ParamListType.t
+    * TypeRefListType.t
+    * LKNodeListType.t
+    * DeclAnnotationListType.t
+    * DocCommentListType.t
+    * FunArgDeclListType.t
+    * GrammarExprListType.t
+    * GrammarExprListListType.t
+    * ElsifBranchListType.t
+    * ImportListType.t
+    * LambdaArgDeclListType.t
+    * RefIdListType.t
+    * BaseLexerCaseRuleAltListType.t
+    * MatchBranchListType.t
+    * EnumClassCaseListType.t
+    * EnumClassAltDeclListType.t
+    * EnumLitDeclListType.t
+    *)
+  type t = [
+    | `BaseLexerCaseRuleAltList
+        of BaseLexerCaseRuleAltListType.fields
+    | `DeclAnnotationList
+        of DeclAnnotationListType.fields
+    | `DocCommentList
+        of DocCommentListType.fields
+    | `ElsifBranchList
+        of ElsifBranchListType.fields
+    | `EnumClassAltDeclList
+        of EnumClassAltDeclListType.fields
+    | `EnumClassCaseList
+        of EnumClassCaseListType.fields
+    | `EnumLitDeclList
+        of EnumLitDeclListType.fields
+    | `ExprList
+        of ExprListType.fields
+    | `FullDeclList
+        of FullDeclListType.fields
+    | `DeclBlock
+        of DeclBlockType.fields
+    | `FunArgDeclList
+        of FunArgDeclListType.fields
+    | `GrammarExprList
+        of GrammarExprListType.fields
+    | `GrammarExprListList
+        of GrammarExprListListType.fields
+    | `ImportList
+        of ImportListType.fields
+    | `LKNodeList
+        of LKNodeListType.fields
+    | `LambdaArgDeclList
+        of LambdaArgDeclListType.fields
+    | `MatchBranchList
+        of MatchBranchListType.fields
+    | `ParamList
+        of ParamListType.fields
+    | `RefIdList
+        of RefIdListType.fields
+    | `TypeRefList
+        of TypeRefListType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `BaseLexerCaseRuleAltList _
+      | `DeclAnnotationList _
+      | `DocCommentList _
+      | `ElsifBranchList _
+      | `EnumClassAltDeclList _
+      | `EnumClassCaseList _
+      | `EnumLitDeclList _
+      | `ExprList _
+      | `FullDeclList _
+      | `DeclBlock _
+      | `FunArgDeclList _
+      | `GrammarExprList _
+      | `GrammarExprListList _
+      | `ImportList _
+      | `LKNodeList _
+      | `LambdaArgDeclList _
+      | `MatchBranchList _
+      | `ParamList _
+      | `RefIdList _
+      | `TypeRefList _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and BaseLexerCaseRuleAltListType : sig
+   
+  
+   
+  type t = [
+    | `BaseLexerCaseRuleAltList
+        of fields
+  ]
+  and fields = 
+  {
+    list : BaseLexerCaseRuleAltType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `BaseLexerCaseRuleAltList
+        of fields
+  ]
+  and fields = 
+  {
+    list : BaseLexerCaseRuleAltType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        BaseLexerCaseRuleAltType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `BaseLexerCaseRuleAltList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DeclAnnotationListType : sig
+   
+  
+   
+  type t = [
+    | `DeclAnnotationList
+        of fields
+  ]
+  and fields = 
+  {
+    list : DeclAnnotationType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DeclAnnotationList
+        of fields
+  ]
+  and fields = 
+  {
+    list : DeclAnnotationType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        DeclAnnotationType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `DeclAnnotationList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DocCommentListType : sig
+   
+  
+   
+  type t = [
+    | `DocCommentList
+        of fields
+  ]
+  and fields = 
+  {
+    list : DocCommentType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DocCommentList
+        of fields
+  ]
+  and fields = 
+  {
+    list : DocCommentType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        DocCommentType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `DocCommentList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ElsifBranchListType : sig
+   
+  
+   
+  type t = [
+    | `ElsifBranchList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ElsifBranchType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ElsifBranchList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ElsifBranchType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        ElsifBranchType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ElsifBranchList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and EnumClassAltDeclListType : sig
+   
+  
+   
+  type t = [
+    | `EnumClassAltDeclList
+        of fields
+  ]
+  and fields = 
+  {
+    list : EnumClassAltDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `EnumClassAltDeclList
+        of fields
+  ]
+  and fields = 
+  {
+    list : EnumClassAltDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        EnumClassAltDeclType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `EnumClassAltDeclList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and EnumClassCaseListType : sig
+   
+  
+   
+  type t = [
+    | `EnumClassCaseList
+        of fields
+  ]
+  and fields = 
+  {
+    list : EnumClassCaseType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `EnumClassCaseList
+        of fields
+  ]
+  and fields = 
+  {
+    list : EnumClassCaseType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        EnumClassCaseType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `EnumClassCaseList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and EnumLitDeclListType : sig
+   
+  
+   
+  type t = [
+    | `EnumLitDeclList
+        of fields
+  ]
+  and fields = 
+  {
+    list : EnumLitDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `EnumLitDeclList
+        of fields
+  ]
+  and fields = 
+  {
+    list : EnumLitDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        EnumLitDeclType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `EnumLitDeclList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ExprListType : sig
+   
+  
+   
+  type t = [
+    | `ExprList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ExprType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ExprList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ExprType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        ExprType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ExprList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and FullDeclListType : sig
+   
+  
+   
+  type t = [
+    | `FullDeclList
+        of fields
+    | `DeclBlock
+        of DeclBlockType.fields
+  ]
+  and fields = 
+  {
+    list : FullDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `FullDeclList
+        of fields
+    | `DeclBlock
+        of DeclBlockType.fields
+  ]
+  and fields = 
+  {
+    list : FullDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        FullDeclType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `FullDeclList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DeclBlockType : sig
+   
+  
+   
+  type t = [
+    | `DeclBlock
+        of fields
+  ]
+  and fields = 
+  {
+    list : FullDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DeclBlock
+        of fields
+  ]
+  and fields = 
+  {
+    list : FullDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        FullDeclType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `DeclBlock {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and FunArgDeclListType : sig
+   
+  
+   
+  type t = [
+    | `FunArgDeclList
+        of fields
+  ]
+  and fields = 
+  {
+    list : FunArgDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `FunArgDeclList
+        of fields
+  ]
+  and fields = 
+  {
+    list : FunArgDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        FunArgDeclType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `FunArgDeclList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GrammarExprListType : sig
+   
+  
+   
+  type t = [
+    | `GrammarExprList
+        of fields
+  ]
+  and fields = 
+  {
+    list : GrammarExprType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarExprList
+        of fields
+  ]
+  and fields = 
+  {
+    list : GrammarExprType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        GrammarExprType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarExprList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GrammarExprListListType : sig
+   
+  
+   
+  type t = [
+    | `GrammarExprListList
+        of fields
+  ]
+  and fields = 
+  {
+    list : GrammarExprListType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GrammarExprListList
+        of fields
+  ]
+  and fields = 
+  {
+    list : GrammarExprListType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        GrammarExprListType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GrammarExprListList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ImportListType : sig
+   
+  
+   
+  type t = [
+    | `ImportList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ImportType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ImportList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ImportType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        ImportType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ImportList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and LKNodeListType : sig
+   
+  
+   
+  type t = [
+    | `LKNodeList
+        of fields
+  ]
+  and fields = 
+  {
+    list : LKNodeType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `LKNodeList
+        of fields
+  ]
+  and fields = 
+  {
+    list : LKNodeType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        LKNodeType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `LKNodeList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and LambdaArgDeclListType : sig
+   
+  
+   
+  type t = [
+    | `LambdaArgDeclList
+        of fields
+  ]
+  and fields = 
+  {
+    list : LambdaArgDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `LambdaArgDeclList
+        of fields
+  ]
+  and fields = 
+  {
+    list : LambdaArgDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        LambdaArgDeclType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `LambdaArgDeclList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and MatchBranchListType : sig
+   
+  
+   
+  type t = [
+    | `MatchBranchList
+        of fields
+  ]
+  and fields = 
+  {
+    list : MatchBranchType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `MatchBranchList
+        of fields
+  ]
+  and fields = 
+  {
+    list : MatchBranchType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        MatchBranchType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `MatchBranchList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ParamListType : sig
+   
+  
+   
+  type t = [
+    | `ParamList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ParamType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ParamList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ParamType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        ParamType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ParamList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and RefIdListType : sig
+   
+  
+   
+  type t = [
+    | `RefIdList
+        of fields
+  ]
+  and fields = 
+  {
+    list : RefIdType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `RefIdList
+        of fields
+  ]
+  and fields = 
+  {
+    list : RefIdType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        RefIdType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `RefIdList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and TypeRefListType : sig
+   
+  
+   
+  type t = [
+    | `TypeRefList
+        of fields
+  ]
+  and fields = 
+  {
+    list : TypeRefType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `TypeRefList
+        of fields
+  ]
+  and fields = 
+  {
+    list : TypeRefType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.lkt_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value LKNodeArrayStruct.n in
+      let items = c_value @. LKNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        TypeRefType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `TypeRefList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and LangkitRootType : sig
+   
+  
+   
+  type t = [
+    | `LangkitRoot
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_imports: ImportListType.t
+    Lazy.t;
+         
+    f_decls: FullDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `LangkitRoot
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_imports: ImportListType.t
+    Lazy.t;
+         
+    f_decls: FullDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_imports () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.langkit_root_f_imports
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ImportListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_decls () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.langkit_root_f_decls
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         FullDeclListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `LangkitRoot {
+        f_imports
+          = Lazy.from_fun f_imports ;
+        f_decls
+          = Lazy.from_fun f_decls ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and LexerCaseRuleType : sig
+   
+  
+   
+  type t = [
+    | `LexerCaseRule
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `GrammarCut
+          of GrammarCutType.fields
+      | `GrammarDiscard
+          of GrammarDiscardType.fields
+      | `GrammarImplicitPick
+          of GrammarImplicitPickType.fields
+      | `GrammarList
+          of GrammarListType.fields
+      | `GrammarNull
+          of GrammarNullType.fields
+      | `GrammarOpt
+          of GrammarOptType.fields
+      | `GrammarOptGroup
+          of GrammarOptGroupType.fields
+      | `GrammarOrExpr
+          of GrammarOrExprType.fields
+      | `GrammarPick
+          of GrammarPickType.fields
+      | `GrammarRuleRef
+          of GrammarRuleRefType.fields
+      | `GrammarSkip
+          of GrammarSkipType.fields
+      | `ParseNodeExpr
+          of ParseNodeExprType.fields
+      | `TokenLit
+          of TokenLitType.fields
+      | `TokenNoCaseLit
+          of TokenNoCaseLitType.fields
+      | `TokenPatternLit
+          of TokenPatternLitType.fields
+      | `TokenRef
+          of TokenRefType.fields
+    ]
+    Lazy.t;
+         
+    f_alts: BaseLexerCaseRuleAltListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `LexerCaseRule
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `GrammarCut
+          of GrammarCutType.fields
+      | `GrammarDiscard
+          of GrammarDiscardType.fields
+      | `GrammarImplicitPick
+          of GrammarImplicitPickType.fields
+      | `GrammarList
+          of GrammarListType.fields
+      | `GrammarNull
+          of GrammarNullType.fields
+      | `GrammarOpt
+          of GrammarOptType.fields
+      | `GrammarOptGroup
+          of GrammarOptGroupType.fields
+      | `GrammarOrExpr
+          of GrammarOrExprType.fields
+      | `GrammarPick
+          of GrammarPickType.fields
+      | `GrammarRuleRef
+          of GrammarRuleRefType.fields
+      | `GrammarSkip
+          of GrammarSkipType.fields
+      | `ParseNodeExpr
+          of ParseNodeExprType.fields
+      | `TokenLit
+          of TokenLitType.fields
+      | `TokenNoCaseLit
+          of TokenNoCaseLitType.fields
+      | `TokenPatternLit
+          of TokenPatternLitType.fields
+      | `TokenRef
+          of TokenRefType.fields
+    ]
+    Lazy.t;
+         
+    f_alts: BaseLexerCaseRuleAltListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.lexer_case_rule_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         GrammarExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `GrammarCut _
+      | `GrammarDiscard _
+      | `GrammarImplicitPick _
+      | `GrammarList _
+      | `GrammarNull _
+      | `GrammarOpt _
+      | `GrammarOptGroup _
+      | `GrammarOrExpr _
+      | `GrammarPick _
+      | `GrammarRuleRef _
+      | `GrammarSkip _
+      | `ParseNodeExpr _
+      | `TokenLit _
+      | `TokenNoCaseLit _
+      | `TokenPatternLit _
+      | `TokenRef _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_alts () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.lexer_case_rule_f_alts
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         BaseLexerCaseRuleAltListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `LexerCaseRule {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        f_alts
+          = Lazy.from_fun f_alts ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and LexerCaseRuleSendType : sig
+   
+  
+   
+  type t = [
+    | `LexerCaseRuleSend
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_sent: RefIdType.t
+    Lazy.t;
+         
+    f_match_size: NumLitType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `LexerCaseRuleSend
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_sent: RefIdType.t
+    Lazy.t;
+         
+    f_match_size: NumLitType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_sent () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.lexer_case_rule_send_f_sent
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         RefIdType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_match_size () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.lexer_case_rule_send_f_match_size
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         NumLitType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `LexerCaseRuleSend {
+        f_sent
+          = Lazy.from_fun f_sent ;
+        f_match_size
+          = Lazy.from_fun f_match_size ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ListKindType : sig
+   
+  
+   
+  type t = [
+    | `ListKindOne
+        of ListKindOneType.fields
+    | `ListKindZero
+        of ListKindZeroType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ListKindOne
+        of ListKindOneType.fields
+    | `ListKindZero
+        of ListKindZeroType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `ListKindOne _
+      | `ListKindZero _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and ListKindOneType : sig
+   
+  
+   
+  type t = [
+    | `ListKindOne
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ListKindOne
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ListKindOne {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ListKindZeroType : sig
+   
+  
+   
+  type t = [
+    | `ListKindZero
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ListKindZero
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ListKindZero {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and MatchBranchType : sig
+   
+  
+   
+  type t = [
+    | `MatchBranch
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_decl: MatchValDeclType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `MatchBranch
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_decl: MatchValDeclType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_decl () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.match_branch_f_decl
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         MatchValDeclType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.match_branch_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `MatchBranch {
+        f_decl
+          = Lazy.from_fun f_decl ;
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and OpType : sig
+   
+  
+   
+  type t = [
+    | `OpAmp
+        of OpAmpType.fields
+    | `OpAnd
+        of OpAndType.fields
+    | `OpDiv
+        of OpDivType.fields
+    | `OpEq
+        of OpEqType.fields
+    | `OpGt
+        of OpGtType.fields
+    | `OpGte
+        of OpGteType.fields
+    | `OpLt
+        of OpLtType.fields
+    | `OpLte
+        of OpLteType.fields
+    | `OpMinus
+        of OpMinusType.fields
+    | `OpMult
+        of OpMultType.fields
+    | `OpOr
+        of OpOrType.fields
+    | `OpPlus
+        of OpPlusType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `OpAmp
+        of OpAmpType.fields
+    | `OpAnd
+        of OpAndType.fields
+    | `OpDiv
+        of OpDivType.fields
+    | `OpEq
+        of OpEqType.fields
+    | `OpGt
+        of OpGtType.fields
+    | `OpGte
+        of OpGteType.fields
+    | `OpLt
+        of OpLtType.fields
+    | `OpLte
+        of OpLteType.fields
+    | `OpMinus
+        of OpMinusType.fields
+    | `OpMult
+        of OpMultType.fields
+    | `OpOr
+        of OpOrType.fields
+    | `OpPlus
+        of OpPlusType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `OpAmp _
+      | `OpAnd _
+      | `OpDiv _
+      | `OpEq _
+      | `OpGt _
+      | `OpGte _
+      | `OpLt _
+      | `OpLte _
+      | `OpMinus _
+      | `OpMult _
+      | `OpOr _
+      | `OpPlus _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and OpAmpType : sig
+   
+  
+   
+  type t = [
+    | `OpAmp
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `OpAmp
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `OpAmp {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and OpAndType : sig
+   
+  
+   
+  type t = [
+    | `OpAnd
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `OpAnd
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `OpAnd {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and OpDivType : sig
+   
+  
+   
+  type t = [
+    | `OpDiv
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `OpDiv
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `OpDiv {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and OpEqType : sig
+   
+  
+   
+  type t = [
+    | `OpEq
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `OpEq
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `OpEq {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and OpGtType : sig
+   
+  
+   
+  type t = [
+    | `OpGt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `OpGt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `OpGt {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and OpGteType : sig
+   
+  
+   
+  type t = [
+    | `OpGte
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `OpGte
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `OpGte {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and OpLtType : sig
+   
+  
+   
+  type t = [
+    | `OpLt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `OpLt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `OpLt {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and OpLteType : sig
+   
+  
+   
+  type t = [
+    | `OpLte
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `OpLte
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `OpLte {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and OpMinusType : sig
+   
+  
+   
+  type t = [
+    | `OpMinus
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `OpMinus
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `OpMinus {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and OpMultType : sig
+   
+  
+   
+  type t = [
+    | `OpMult
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `OpMult
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `OpMult {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and OpOrType : sig
+   
+  
+   
+  type t = [
+    | `OpOr
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `OpOr
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `OpOr {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and OpPlusType : sig
+   
+  
+   
+  type t = [
+    | `OpPlus
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `OpPlus
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `OpPlus {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ParamType : sig
+   
+  
+   
+  type t = [
+    | `Param
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: RefIdType.t
+    option
+    Lazy.t;
+         
+    f_value: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `Param
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: RefIdType.t
+    option
+    Lazy.t;
+         
+    f_value: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.param_f_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (RefIdType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    let f_value () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.param_f_value
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `Param {
+        f_name
+          = Lazy.from_fun f_name ;
+        f_value
+          = Lazy.from_fun f_value ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and TypeRefType : sig
+   
+  
+   
+  type t = [
+    | `FunctionTypeRef
+        of FunctionTypeRefType.fields
+    | `GenericTypeRef
+        of GenericTypeRefType.fields
+    | `SimpleTypeRef
+        of SimpleTypeRefType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `FunctionTypeRef
+        of FunctionTypeRefType.fields
+    | `GenericTypeRef
+        of GenericTypeRefType.fields
+    | `SimpleTypeRef
+        of SimpleTypeRefType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match LKNodeType.wrap context (c_value) with
+      | `FunctionTypeRef _
+      | `GenericTypeRef _
+      | `SimpleTypeRef _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and FunctionTypeRefType : sig
+   
+  
+   
+  type t = [
+    | `FunctionTypeRef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_args_types: TypeRefListType.t
+    Lazy.t;
+         
+    f_return_type: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `FunctionTypeRef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_args_types: TypeRefListType.t
+    Lazy.t;
+         
+    f_return_type: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_args_types () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.function_type_ref_f_args_types
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         TypeRefListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_return_type () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.function_type_ref_f_return_type
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         TypeRefType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `FunctionTypeRef {
+        f_args_types
+          = Lazy.from_fun f_args_types ;
+        f_return_type
+          = Lazy.from_fun f_return_type ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GenericTypeRefType : sig
+   
+  
+   
+  type t = [
+    | `GenericTypeRef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_type_name: [
+      | `DotExpr
+          of DotExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `RefId
+          of RefIdType.fields
+    ]
+    Lazy.t;
+         
+    f_params: TypeRefListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GenericTypeRef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_type_name: [
+      | `DotExpr
+          of DotExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `RefId
+          of RefIdType.fields
+    ]
+    Lazy.t;
+         
+    f_params: TypeRefListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_type_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.generic_type_ref_f_type_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `DotExpr _
+      | `ModuleRefId _
+      | `NullCondDottedName _
+      | `RefId _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_params () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.generic_type_ref_f_params
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         TypeRefListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GenericTypeRef {
+        f_type_name
+          = Lazy.from_fun f_type_name ;
+        f_params
+          = Lazy.from_fun f_params ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and SimpleTypeRefType : sig
+   
+  
+   
+  type t = [
+    | `SimpleTypeRef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_type_name: [
+      | `DotExpr
+          of DotExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `RefId
+          of RefIdType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `SimpleTypeRef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_type_name: [
+      | `DotExpr
+          of DotExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `RefId
+          of RefIdType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_type_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.simple_type_ref_f_type_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `DotExpr _
+      | `ModuleRefId _
+      | `NullCondDottedName _
+      | `RefId _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `SimpleTypeRef {
+        f_type_name
+          = Lazy.from_fun f_type_name ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and VarBindType : sig
+   
+  
+   
+  type t = [
+    | `VarBind
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: RefIdType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `VarBind
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: RefIdType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.var_bind_f_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         RefIdType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.var_bind_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArrayLiteral _
+      | `BinOp _
+      | `BlockExpr _
+      | `CallExpr _
+      | `CastExpr _
+      | `CharLit _
+      | `DotExpr _
+      | `ErrorOnNull _
+      | `GenericInstantiation _
+      | `IfExpr _
+      | `Isa _
+      | `LambdaExpr _
+      | `LogicExpr _
+      | `MatchExpr _
+      | `ModuleRefId _
+      | `NotExpr _
+      | `NullCondCallExpr _
+      | `NullCondDottedName _
+      | `NullLit _
+      | `NumLit _
+      | `ParenExpr _
+      | `RaiseExpr _
+      | `RefId _
+      | `StringLit _
+      | `TryExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `VarBind {
+        f_name
+          = Lazy.from_fun f_name ;
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+
+and Entity : sig
+  type t = EntityStruct.t structure
+
+  val info : t -> EntityInfo.t
+
+  val equal : t -> t -> bool
+
+  val compare : t -> t -> int
+
+  val hash : t -> int
+end = struct
+  type t = EntityStruct.t structure
+
+  let info value =
+    EntityInfo.wrap (getf value EntityStruct.info)
+
+  let compare e1 e2 =
+    let open Pervasives in
+    let compare_node =
+      compare (getf e1 EntityStruct.node) (getf e2 EntityStruct.node)
+    in
+    if compare_node = 0 then
+      compare
+        (getf (getf e1 EntityStruct.info) EntityInfoStruct.rebindings)
+        (getf (getf e2 EntityStruct.info) EntityInfoStruct.rebindings)
+    else
+      compare_node
+
+  let equal e1 e2 =
+    compare e1 e2 = 0
+
+  let hash e =
+    Hashtbl.hash
+      ( getf e EntityStruct.node
+      , getf (getf e EntityStruct.info) EntityInfoStruct.rebindings )
+end
+
+and AnalysisUnit : sig
+  type t = {
+    c_value : AnalysisUnitStruct.t;
+    context : AnalysisContext.t
+  }
+
+  val root : t -> LKNodeType.t option
+  val diagnostics : t -> Diagnostic.t list
+  val filename : t -> string
+  val reparse : ?charset:string -> ?buffer:string -> t -> unit
+  val first_token : t -> Token.t
+  val last_token : t -> Token.t
+  val token_count : t -> int
+  val trivia_count : t -> int
+  val token_table : t -> TokenTable.t
+
+  
+  val fold_tokens : ('a -> Token.t -> 'a) -> 'a -> t -> 'a
+  (**
+   * Fold all the token this node contains by calling f on each token.
+   *)
+
+  val iter_tokens : (Token.t -> unit) -> t-> unit
+  (**
+   * Iterate over all token this node contains by calling f on each token.
+   *)
+
+  val map_tokens : (Token.t -> 'a) -> t -> 'a list
+  (**
+   * Map each token calling the given function
+   *)
+
+  val tokens : t -> Token.t list
+  (**
+   * Return a list of tokens for the given node
+   *)
+
+
+  val wrap : AnalysisContext.t -> AnalysisUnitStruct.t -> t
+  val unwrap : t -> AnalysisUnitStruct.t
+end = struct
+  type t = {
+    c_value : AnalysisUnitStruct.t;
+    context : AnalysisContext.t
+  }
+
+  let root analysis_unit =
+    let c_value = make EntityStruct.c_type in
+    AnalysisUnitStruct.unit_root
+      (AnalysisUnit.unwrap (analysis_unit))
+      (addr c_value);
+    if is_null (getf c_value EntityStruct.node) then None else Some (LKNodeType.wrap analysis_unit.context (c_value))
+
+  let diagnostics unit =
+    let c_unit = AnalysisUnit.unwrap (unit) in
+    let length = AnalysisUnitStruct.unit_diagnostic_count c_unit in
+    let f i =
+      let diag = allocate_n Diagnostic.c_type ~count:1 in
+      let _ : int = AnalysisUnitStruct.unit_diagnostic c_unit i diag in
+      !@ diag
+    in
+    List.init length f
+
+  let filename unit =
+    unwrap_str( AnalysisUnitStruct.unit_filename
+      (AnalysisUnit.unwrap (unit)))
+
+  let reparse ?charset:(charset="") ?buffer ctx =
+    match buffer with
+    | None ->
+        ignore
+          (AnalysisUnitStruct.unit_reparse_from_file ctx.c_value charset)
+    | Some buffer ->
+        ignore (AnalysisUnitStruct.unit_reparse_from_buffer ctx.c_value
+          charset buffer (Unsigned.Size_t.of_int (String.length buffer)))
+
+  let first_token unit =
+    let c_unit = AnalysisUnit.unwrap (unit) in
+    let result_ptr = allocate_n Token.c_type ~count:1 in
+    AnalysisUnitStruct.unit_first_token c_unit result_ptr ;
+    !@ result_ptr
+
+  let last_token unit =
+    let c_unit = AnalysisUnit.unwrap (unit) in
+    let result_ptr = allocate_n Token.c_type ~count:1 in
+    AnalysisUnitStruct.unit_last_token c_unit result_ptr ;
+    !@ result_ptr
+
+  let token_count unit =
+    AnalysisUnitStruct.unit_token_count
+      (AnalysisUnit.unwrap (unit))
+
+  let trivia_count unit =
+    AnalysisUnitStruct.unit_trivia_count
+      (AnalysisUnit.unwrap (unit))
+
+  let token_table unit =
+    let c_unit = AnalysisUnit.unwrap (unit) in
+    let table =
+      TokenTable.create
+        (AnalysisUnitStruct.unit_token_count c_unit
+         + AnalysisUnitStruct.unit_trivia_count c_unit)
+    in
+    if TokenTable.length table > 0 then begin
+      let c_table = TokenTable.unwrap table in
+      let _ : int =
+        AnalysisUnitStruct.unit_export_tokens c_unit (addr c_table)
+      in
+      ()
+    end;
+    table
+
+  
+  let fold_tokens f init node =
+    let tok_start = first_token node in
+    let tok_end = last_token node in
+    let rec aux acc tok_curr =
+      let new_acc = f acc tok_curr in
+      if Token.equal tok_curr tok_end then
+        new_acc
+      else
+        aux new_acc (Token.next tok_curr)
+    in
+    aux init tok_start
+
+  let iter_tokens f node =
+    let tok_start = first_token node in
+    let tok_end = last_token node in
+    let rec aux tok_curr =
+      f tok_curr;
+      if not (Token.equal tok_curr tok_end) then
+        aux (Token.next tok_curr)
+    in
+    aux tok_start
+
+  let map_tokens f node =
+    let tok_start = first_token node in
+    let tok_end = last_token node in
+    let rec aux tok_curr =
+      let value = f tok_curr in
+      if Token.equal tok_curr tok_end then
+        [value]
+      else
+        value :: aux (Token.next tok_curr)
+    in
+    aux tok_start
+
+  let tokens node =
+    map_tokens (fun x -> x) node
+
+
+  let wrap context c_value = {
+    c_value=c_value;
+    context=context;
+  }
+
+  let unwrap {c_value} = c_value
+end
+
+and AnalysisContext : sig
+  type t = {
+    c_value : AnalysisContextStruct.t;
+    unit_provider : UnitProvider.t }
+
+  val create :
+    ?charset:string
+    -> ?with_trivia:bool
+    -> ?tab_stop:int
+    -> ?unit_provider:UnitProvider.t
+    -> unit
+    -> t
+
+  val get_from_file :
+    ?charset:string
+    -> ?reparse:bool
+    -> ?grammar_rule:GrammarRule.t
+    -> t
+    -> string
+    -> AnalysisUnit.t
+
+  val get_from_buffer :
+    ?charset:string
+    -> ?grammar_rule:GrammarRule.t
+    -> t
+    -> string
+    -> string
+    -> AnalysisUnit.t
+end = struct
+  type t = {
+    c_value : AnalysisContextStruct.t;
+    unit_provider : UnitProvider.t }
+
+  let create
+    ?charset:(charset="")
+    ?with_trivia:(with_trivia=true)
+    ?tab_stop:(tab_stop=8)
+    ?unit_provider:(unit_provider=UnitProvider.null) () : t =
+    if tab_stop < 1 then
+      raise (Invalid_argument "Invalid tab_stop (positive integer expected)") ;
+    let c_context =
+       AnalysisContextStruct.create_analysis_context
+         charset
+         (!@unit_provider)
+         with_trivia
+         tab_stop
+    in
+    { c_value= c_context
+      ; unit_provider= unit_provider }
+
+  let get_from_file
+    ?charset:(charset="")
+    ?reparse:(reparse=false)
+    ?grammar_rule:(grammar_rule=default_grammar_rule)
+    ctx
+    filename : AnalysisUnit.t =
+
+    AnalysisUnit.wrap ctx (AnalysisContextStruct.get_analysis_unit_from_file ctx.c_value filename charset reparse grammar_rule)
+
+  let get_from_buffer
+    ?charset:(charset="")
+    ?grammar_rule:(grammar_rule=default_grammar_rule)
+    ctx
+    filename
+    buffer : AnalysisUnit.t =
+
+    AnalysisUnit.wrap ctx (AnalysisContextStruct.get_analysis_unit_from_buffer ctx.c_value filename charset buffer (Unsigned.Size_t.of_int (String.length buffer)) grammar_rule)
+end
+
+
+and EntityInfo : sig
+   
+  
+  type t = {
+      rebindings :
+         Rebindings.t;
+      from_rebound :
+         bool;
+  }
+
+
+  val wrap : EntityInfoStruct.t structure -> t
+
+  val unwrap : t -> EntityInfoStruct.t structure
+
+
+end = struct
+   
+  
+  type t = {
+      rebindings :
+         Rebindings.t;
+      from_rebound :
+         bool;
+  }
+
+
+  let wrap c_value = {
+    rebindings = (getf c_value EntityInfoStruct.rebindings);
+    from_rebound = (getf c_value EntityInfoStruct.from_rebound);
+  }
+
+  let unwrap value =
+    let c_value = make EntityInfoStruct.c_type in
+    setf c_value
+      EntityInfoStruct.rebindings
+      (value.rebindings);
+    setf c_value
+      EntityInfoStruct.from_rebound
+      (value.from_rebound);
+    c_value
+
+
+end
+
+
+
+
+
+   
+module TextType : sig
+   
+  type t = string
+
+  val wrap : TextTypeStruct.t structure ptr -> t
+
+  val unwrap : t -> TextTypeStruct.t structure ptr
+
+end = struct
+   
+  type t = string
+
+  let wrap c_value_ptr =
+    let open Text in
+    let open Camomile in
+    let c_value = !@ c_value_ptr in
+    let length = getf c_value TextTypeStruct.n in
+    let items = c_value @. TextTypeStruct.items in
+    (* We use Camomile to encode utf32 strings to an ocaml string *)
+    let f i = UChar.chr_of_uint (Unsigned.UInt32.to_int !@(items +@ i)) in
+    let result =
+      UCS4Encoding.encode CharEncoding.utf8 (UCS4.init length f)
+    in
+    TextTypeStruct.dec_ref c_value_ptr;
+    result
+
+  let unwrap value =
+    let open Text in
+    let open Camomile in
+    let text = UCS4Encoding.decode CharEncoding.utf8 value in
+    let result = TextTypeStruct.create (UCS4.length text) in
+    let items = result |-> TextTypeStruct.items in
+    let i = ref 0 in
+    let f c =
+      items +@ !i <-@ Unsigned.UInt32.of_int (UChar.code c);
+      i := !i + 1
+    in
+    UCS4.iter f text;
+    result
+
+
+end
+
+   
+module SemanticResult : sig
+   
+  
+  type t = {
+      node :
+         BareNode.t;
+      result_type :
+         TypeDeclType.t option;
+      result_ref :
+         DeclType.t option;
+      has_error :
+         bool;
+      error_message :
+         string;
+      exempt_analysis :
+         bool;
+  }
+
+
+  val wrap : AnalysisContext.t -> SemanticResultStruct.t structure -> t
+
+  val unwrap : t -> SemanticResultStruct.t structure
+
+
+end = struct
+   
+  
+  type t = {
+      node :
+         BareNode.t;
+      result_type :
+         TypeDeclType.t option;
+      result_ref :
+         DeclType.t option;
+      has_error :
+         bool;
+      error_message :
+         string;
+      exempt_analysis :
+         bool;
+  }
+
+
+  let wrap context c_value = {
+    node = (getf c_value SemanticResultStruct.node);
+    result_type = if is_null (getf (getf c_value SemanticResultStruct.result_type) EntityStruct.node) then None else Some (TypeDeclType.wrap context ((getf c_value SemanticResultStruct.result_type)));
+    result_ref = if is_null (getf (getf c_value SemanticResultStruct.result_ref) EntityStruct.node) then None else Some (DeclType.wrap context ((getf c_value SemanticResultStruct.result_ref)));
+    has_error = (getf c_value SemanticResultStruct.has_error);
+    error_message = TextType.wrap ((getf c_value SemanticResultStruct.error_message));
+    exempt_analysis = (getf c_value SemanticResultStruct.exempt_analysis);
+  }
+
+  let unwrap value =
+    let c_value = make SemanticResultStruct.c_type in
+    setf c_value
+      SemanticResultStruct.node
+      (value.node);
+    setf c_value
+      SemanticResultStruct.result_type
+      (match value.result_type with Some n -> LKNodeType.unwrap (n) | None -> make EntityStruct.c_type);
+    setf c_value
+      SemanticResultStruct.result_ref
+      (match value.result_ref with Some n -> LKNodeType.unwrap (n) | None -> make EntityStruct.c_type);
+    setf c_value
+      SemanticResultStruct.has_error
+      (value.has_error);
+    setf c_value
+      SemanticResultStruct.error_message
+      (TextType.unwrap (value.error_message));
+    setf c_value
+      SemanticResultStruct.exempt_analysis
+      (value.exempt_analysis);
+    c_value
+
+
+end
+
+   
+module SemanticResultArray : sig
+   
+  type t = SemanticResult.t list
+
+  val wrap : AnalysisContext.t -> SemanticResultArrayStruct.t structure ptr -> t
+
+  val unwrap : t -> SemanticResultArrayStruct.t structure ptr
+
+end = struct
+   
+  type t = SemanticResult.t list
+
+  let wrap context c_value_ptr =
+    let c_value = !@ c_value_ptr in
+    let length = getf c_value SemanticResultArrayStruct.n in
+    let items = c_value @. SemanticResultArrayStruct.items in
+    let f i =
+      (* we want to allocate a fresh value for a record, otherwize, the c value
+       * will still point to the memory at array location *)
+      let fresh =
+        allocate SemanticResultStruct.c_type (!@ (items +@ i))
+      in
+      SemanticResult.wrap context (!@ fresh)
+    in
+    let result = List.init length f in
+    SemanticResultArrayStruct.dec_ref c_value_ptr;
+    result
+
+  let unwrap value =
+    let result = SemanticResultArrayStruct.create (List.length value) in
+    let items = result |-> SemanticResultArrayStruct.items in
+    let f i v =
+      items +@ i <-@
+        SemanticResult.unwrap (v)
+    in
+    List.iteri f value;
+    result
+
+
+end
+
+   
+module TreeSemanticResult : sig
+   
+  
+  type t = {
+      results :
+         SemanticResult.t list;
+      has_error :
+         bool;
+  }
+
+
+  val wrap : AnalysisContext.t -> TreeSemanticResultStruct.t structure -> t
+
+  val unwrap : t -> TreeSemanticResultStruct.t structure
+
+
+end = struct
+   
+  
+  type t = {
+      results :
+         SemanticResult.t list;
+      has_error :
+         bool;
+  }
+
+
+  let wrap context c_value = {
+    results = SemanticResultArray.wrap context ((getf c_value TreeSemanticResultStruct.results));
+    has_error = (getf c_value TreeSemanticResultStruct.has_error);
+  }
+
+  let unwrap value =
+    let c_value = make TreeSemanticResultStruct.c_type in
+    setf c_value
+      TreeSemanticResultStruct.results
+      (SemanticResultArray.unwrap (value.results));
+    setf c_value
+      TreeSemanticResultStruct.has_error
+      (value.has_error);
+    c_value
+
+
+end
+
+   
+module LKNodeArray : sig
+   
+  type t = LKNodeType.t list
+
+  val wrap : AnalysisContext.t -> LKNodeArrayStruct.t structure ptr -> t
+
+  val unwrap : t -> LKNodeArrayStruct.t structure ptr
+
+end = struct
+   
+  type t = LKNodeType.t list
+
+  let wrap context c_value_ptr =
+    let c_value = !@ c_value_ptr in
+    let length = getf c_value LKNodeArrayStruct.n in
+    let items = c_value @. LKNodeArrayStruct.items in
+    let f i =
+      (* we want to allocate a fresh value for a record, otherwize, the c value
+       * will still point to the memory at array location *)
+      let fresh =
+        allocate EntityStruct.c_type (!@ (items +@ i))
+      in
+      LKNodeType.wrap context (!@ fresh)
+    in
+    let result = List.init length f in
+    LKNodeArrayStruct.dec_ref c_value_ptr;
+    result
+
+  let unwrap value =
+    let result = LKNodeArrayStruct.create (List.length value) in
+    let items = result |-> LKNodeArrayStruct.items in
+    let f i v =
+      items +@ i <-@
+        LKNodeType.unwrap (v)
+    in
+    List.iteri f value;
+    result
+
+
+end
+
+   
+module TypeDeclArray : sig
+   
+  type t = TypeDeclType.t list
+
+  val wrap : AnalysisContext.t -> LKNodeArrayStruct.t structure ptr -> t
+
+  val unwrap : t -> LKNodeArrayStruct.t structure ptr
+
+end = struct
+   
+  type t = TypeDeclType.t list
+
+  let wrap context c_value_ptr =
+    let c_value = !@ c_value_ptr in
+    let length = getf c_value LKNodeArrayStruct.n in
+    let items = c_value @. LKNodeArrayStruct.items in
+    let f i =
+      (* we want to allocate a fresh value for a record, otherwize, the c value
+       * will still point to the memory at array location *)
+      let fresh =
+        allocate EntityStruct.c_type (!@ (items +@ i))
+      in
+      TypeDeclType.wrap context (!@ fresh)
+    in
+    let result = List.init length f in
+    LKNodeArrayStruct.dec_ref c_value_ptr;
+    result
+
+  let unwrap value =
+    let result = LKNodeArrayStruct.create (List.length value) in
+    let items = result |-> LKNodeArrayStruct.items in
+    let f i v =
+      items +@ i <-@
+        LKNodeType.unwrap (v)
+    in
+    List.iteri f value;
+    result
+
+
+end
+
+
+let context node =
+  (* Given any node, extract the context field *)
+  match (node :> LKNodeType.t) with
+  | `LexerCaseRuleCondAlt fields -> fields.context
+  | `LexerCaseRuleDefaultAlt fields -> fields.context
+  | `GrammarDecl fields -> fields.context
+  | `GrammarRuleDecl fields -> fields.context
+  | `SyntheticLexerDecl fields -> fields.context
+  | `NodeDecl fields -> fields.context
+  | `SelfDecl fields -> fields.context
+  | `EnumLitDecl fields -> fields.context
+  | `FieldDecl fields -> fields.context
+  | `FunArgDecl fields -> fields.context
+  | `LambdaArgDecl fields -> fields.context
+  | `MatchValDecl fields -> fields.context
+  | `ValDecl fields -> fields.context
+  | `FunDecl fields -> fields.context
+  | `GenericDecl fields -> fields.context
+  | `LexerDecl fields -> fields.context
+  | `LexerFamilyDecl fields -> fields.context
+  | `EnumClassAltDecl fields -> fields.context
+  | `FunctionType fields -> fields.context
+  | `GenericFormalTypeDecl fields -> fields.context
+  | `InstantiatedGenericType fields -> fields.context
+  | `ClassDecl fields -> fields.context
+  | `EnumClassDecl fields -> fields.context
+  | `EnumTypeDecl fields -> fields.context
+  | `StructDecl fields -> fields.context
+  | `TraitDecl fields -> fields.context
+  | `DeclAnnotation fields -> fields.context
+  | `DeclAnnotationParams fields -> fields.context
+  | `Doc fields -> fields.context
+  | `DocComment fields -> fields.context
+  | `ElsifBranch fields -> fields.context
+  | `EnumClassCase fields -> fields.context
+  | `ExcludesNullAbsent fields -> fields.context
+  | `ExcludesNullPresent fields -> fields.context
+  | `ArrayLiteral fields -> fields.context
+  | `BinOp fields -> fields.context
+  | `BlockExpr fields -> fields.context
+  | `CallExpr fields -> fields.context
+  | `NullCondCallExpr fields -> fields.context
+  | `CastExpr fields -> fields.context
+  | `DotExpr fields -> fields.context
+  | `NullCondDottedName fields -> fields.context
+  | `ErrorOnNull fields -> fields.context
+  | `GenericInstantiation fields -> fields.context
+  | `GrammarCut fields -> fields.context
+  | `GrammarDiscard fields -> fields.context
+  | `GrammarDontSkip fields -> fields.context
+  | `GrammarList fields -> fields.context
+  | `GrammarNull fields -> fields.context
+  | `GrammarOpt fields -> fields.context
+  | `GrammarOptGroup fields -> fields.context
+  | `GrammarOrExpr fields -> fields.context
+  | `GrammarPick fields -> fields.context
+  | `GrammarImplicitPick fields -> fields.context
+  | `GrammarPredicate fields -> fields.context
+  | `GrammarRuleRef fields -> fields.context
+  | `GrammarSkip fields -> fields.context
+  | `ParseNodeExpr fields -> fields.context
+  | `TokenLit fields -> fields.context
+  | `TokenNoCaseLit fields -> fields.context
+  | `TokenPatternLit fields -> fields.context
+  | `TokenRef fields -> fields.context
+  | `Id fields -> fields.context
+  | `DefId fields -> fields.context
+  | `RefId fields -> fields.context
+  | `ModuleRefId fields -> fields.context
+  | `IfExpr fields -> fields.context
+  | `Isa fields -> fields.context
+  | `LambdaExpr fields -> fields.context
+  | `CharLit fields -> fields.context
+  | `NullLit fields -> fields.context
+  | `NumLit fields -> fields.context
+  | `StringLit fields -> fields.context
+  | `LogicExpr fields -> fields.context
+  | `MatchExpr fields -> fields.context
+  | `NotExpr fields -> fields.context
+  | `ParenExpr fields -> fields.context
+  | `RaiseExpr fields -> fields.context
+  | `TryExpr fields -> fields.context
+  | `FullDecl fields -> fields.context
+  | `Import fields -> fields.context
+  | `BaseLexerCaseRuleAltList fields -> fields.context
+  | `DeclAnnotationList fields -> fields.context
+  | `DocCommentList fields -> fields.context
+  | `ElsifBranchList fields -> fields.context
+  | `EnumClassAltDeclList fields -> fields.context
+  | `EnumClassCaseList fields -> fields.context
+  | `EnumLitDeclList fields -> fields.context
+  | `ExprList fields -> fields.context
+  | `FullDeclList fields -> fields.context
+  | `DeclBlock fields -> fields.context
+  | `FunArgDeclList fields -> fields.context
+  | `GrammarExprList fields -> fields.context
+  | `GrammarExprListList fields -> fields.context
+  | `ImportList fields -> fields.context
+  | `LKNodeList fields -> fields.context
+  | `LambdaArgDeclList fields -> fields.context
+  | `MatchBranchList fields -> fields.context
+  | `ParamList fields -> fields.context
+  | `RefIdList fields -> fields.context
+  | `TypeRefList fields -> fields.context
+  | `LangkitRoot fields -> fields.context
+  | `LexerCaseRule fields -> fields.context
+  | `LexerCaseRuleSend fields -> fields.context
+  | `ListKindOne fields -> fields.context
+  | `ListKindZero fields -> fields.context
+  | `MatchBranch fields -> fields.context
+  | `OpAmp fields -> fields.context
+  | `OpAnd fields -> fields.context
+  | `OpDiv fields -> fields.context
+  | `OpEq fields -> fields.context
+  | `OpGt fields -> fields.context
+  | `OpGte fields -> fields.context
+  | `OpLt fields -> fields.context
+  | `OpLte fields -> fields.context
+  | `OpMinus fields -> fields.context
+  | `OpMult fields -> fields.context
+  | `OpOr fields -> fields.context
+  | `OpPlus fields -> fields.context
+  | `Param fields -> fields.context
+  | `FunctionTypeRef fields -> fields.context
+  | `GenericTypeRef fields -> fields.context
+  | `SimpleTypeRef fields -> fields.context
+  | `VarBind fields -> fields.context
+
+type _ node =
+  | LKNode :
+      LKNodeType.t node
+  | BaseLexerCaseRuleAlt :
+      BaseLexerCaseRuleAltType.t node
+  | LexerCaseRuleCondAlt :
+      LexerCaseRuleCondAltType.t node
+  | LexerCaseRuleDefaultAlt :
+      LexerCaseRuleDefaultAltType.t node
+  | Decl :
+      DeclType.t node
+  | BaseGrammarDecl :
+      BaseGrammarDeclType.t node
+  | GrammarDecl :
+      GrammarDeclType.t node
+  | BaseGrammarRuleDecl :
+      BaseGrammarRuleDeclType.t node
+  | GrammarRuleDecl :
+      GrammarRuleDeclType.t node
+  | SyntheticLexerDecl :
+      SyntheticLexerDeclType.t node
+  | BaseValDecl :
+      BaseValDeclType.t node
+  | NodeDecl :
+      NodeDeclType.t node
+  | SelfDecl :
+      SelfDeclType.t node
+  | UserValDecl :
+      UserValDeclType.t node
+  | EnumLitDecl :
+      EnumLitDeclType.t node
+  | ExplicitlyTypedDecl :
+      ExplicitlyTypedDeclType.t node
+  | ComponentDecl :
+      ComponentDeclType.t node
+  | FieldDecl :
+      FieldDeclType.t node
+  | FunArgDecl :
+      FunArgDeclType.t node
+  | LambdaArgDecl :
+      LambdaArgDeclType.t node
+  | MatchValDecl :
+      MatchValDeclType.t node
+  | ValDecl :
+      ValDeclType.t node
+  | FunDecl :
+      FunDeclType.t node
+  | GenericDecl :
+      GenericDeclType.t node
+  | LexerDecl :
+      LexerDeclType.t node
+  | LexerFamilyDecl :
+      LexerFamilyDeclType.t node
+  | TypeDecl :
+      TypeDeclType.t node
+  | EnumClassAltDecl :
+      EnumClassAltDeclType.t node
+  | FunctionType :
+      FunctionTypeType.t node
+  | GenericFormalTypeDecl :
+      GenericFormalTypeDeclType.t node
+  | InstantiatedGenericType :
+      InstantiatedGenericTypeType.t node
+  | NamedTypeDecl :
+      NamedTypeDeclType.t node
+  | BasicClassDecl :
+      BasicClassDeclType.t node
+  | ClassDecl :
+      ClassDeclType.t node
+  | EnumClassDecl :
+      EnumClassDeclType.t node
+  | EnumTypeDecl :
+      EnumTypeDeclType.t node
+  | StructDecl :
+      StructDeclType.t node
+  | TraitDecl :
+      TraitDeclType.t node
+  | DeclAnnotation :
+      DeclAnnotationType.t node
+  | DeclAnnotationParams :
+      DeclAnnotationParamsType.t node
+  | Doc :
+      DocType.t node
+  | DocComment :
+      DocCommentType.t node
+  | ElsifBranch :
+      ElsifBranchType.t node
+  | EnumClassCase :
+      EnumClassCaseType.t node
+  | ExcludesNull :
+      ExcludesNullType.t node
+  | ExcludesNullAbsent :
+      ExcludesNullAbsentType.t node
+  | ExcludesNullPresent :
+      ExcludesNullPresentType.t node
+  | Expr :
+      ExprType.t node
+  | ArrayLiteral :
+      ArrayLiteralType.t node
+  | BinOp :
+      BinOpType.t node
+  | BlockExpr :
+      BlockExprType.t node
+  | CallExpr :
+      CallExprType.t node
+  | NullCondCallExpr :
+      NullCondCallExprType.t node
+  | CastExpr :
+      CastExprType.t node
+  | DotExpr :
+      DotExprType.t node
+  | NullCondDottedName :
+      NullCondDottedNameType.t node
+  | ErrorOnNull :
+      ErrorOnNullType.t node
+  | GenericInstantiation :
+      GenericInstantiationType.t node
+  | GrammarExpr :
+      GrammarExprType.t node
+  | GrammarCut :
+      GrammarCutType.t node
+  | GrammarDiscard :
+      GrammarDiscardType.t node
+  | GrammarDontSkip :
+      GrammarDontSkipType.t node
+  | GrammarList :
+      GrammarListType.t node
+  | GrammarNull :
+      GrammarNullType.t node
+  | GrammarOpt :
+      GrammarOptType.t node
+  | GrammarOptGroup :
+      GrammarOptGroupType.t node
+  | GrammarOrExpr :
+      GrammarOrExprType.t node
+  | GrammarPick :
+      GrammarPickType.t node
+  | GrammarImplicitPick :
+      GrammarImplicitPickType.t node
+  | GrammarPredicate :
+      GrammarPredicateType.t node
+  | GrammarRuleRef :
+      GrammarRuleRefType.t node
+  | GrammarSkip :
+      GrammarSkipType.t node
+  | ParseNodeExpr :
+      ParseNodeExprType.t node
+  | TokenLit :
+      TokenLitType.t node
+  | TokenNoCaseLit :
+      TokenNoCaseLitType.t node
+  | TokenPatternLit :
+      TokenPatternLitType.t node
+  | TokenRef :
+      TokenRefType.t node
+  | Id :
+      IdType.t node
+  | DefId :
+      DefIdType.t node
+  | RefId :
+      RefIdType.t node
+  | ModuleRefId :
+      ModuleRefIdType.t node
+  | IfExpr :
+      IfExprType.t node
+  | Isa :
+      IsaType.t node
+  | LambdaExpr :
+      LambdaExprType.t node
+  | Lit :
+      LitType.t node
+  | CharLit :
+      CharLitType.t node
+  | NullLit :
+      NullLitType.t node
+  | NumLit :
+      NumLitType.t node
+  | StringLit :
+      StringLitType.t node
+  | LogicExpr :
+      LogicExprType.t node
+  | MatchExpr :
+      MatchExprType.t node
+  | NotExpr :
+      NotExprType.t node
+  | ParenExpr :
+      ParenExprType.t node
+  | RaiseExpr :
+      RaiseExprType.t node
+  | TryExpr :
+      TryExprType.t node
+  | FullDecl :
+      FullDeclType.t node
+  | Import :
+      ImportType.t node
+  | LKNodeBaseList :
+      LKNodeBaseListType.t node
+  | BaseLexerCaseRuleAltList :
+      BaseLexerCaseRuleAltListType.t node
+  | DeclAnnotationList :
+      DeclAnnotationListType.t node
+  | DocCommentList :
+      DocCommentListType.t node
+  | ElsifBranchList :
+      ElsifBranchListType.t node
+  | EnumClassAltDeclList :
+      EnumClassAltDeclListType.t node
+  | EnumClassCaseList :
+      EnumClassCaseListType.t node
+  | EnumLitDeclList :
+      EnumLitDeclListType.t node
+  | ExprList :
+      ExprListType.t node
+  | FullDeclList :
+      FullDeclListType.t node
+  | DeclBlock :
+      DeclBlockType.t node
+  | FunArgDeclList :
+      FunArgDeclListType.t node
+  | GrammarExprList :
+      GrammarExprListType.t node
+  | GrammarExprListList :
+      GrammarExprListListType.t node
+  | ImportList :
+      ImportListType.t node
+  | LKNodeList :
+      LKNodeListType.t node
+  | LambdaArgDeclList :
+      LambdaArgDeclListType.t node
+  | MatchBranchList :
+      MatchBranchListType.t node
+  | ParamList :
+      ParamListType.t node
+  | RefIdList :
+      RefIdListType.t node
+  | TypeRefList :
+      TypeRefListType.t node
+  | LangkitRoot :
+      LangkitRootType.t node
+  | LexerCaseRule :
+      LexerCaseRuleType.t node
+  | LexerCaseRuleSend :
+      LexerCaseRuleSendType.t node
+  | ListKind :
+      ListKindType.t node
+  | ListKindOne :
+      ListKindOneType.t node
+  | ListKindZero :
+      ListKindZeroType.t node
+  | MatchBranch :
+      MatchBranchType.t node
+  | Op :
+      OpType.t node
+  | OpAmp :
+      OpAmpType.t node
+  | OpAnd :
+      OpAndType.t node
+  | OpDiv :
+      OpDivType.t node
+  | OpEq :
+      OpEqType.t node
+  | OpGt :
+      OpGtType.t node
+  | OpGte :
+      OpGteType.t node
+  | OpLt :
+      OpLtType.t node
+  | OpLte :
+      OpLteType.t node
+  | OpMinus :
+      OpMinusType.t node
+  | OpMult :
+      OpMultType.t node
+  | OpOr :
+      OpOrType.t node
+  | OpPlus :
+      OpPlusType.t node
+  | Param :
+      ParamType.t node
+  | TypeRef :
+      TypeRefType.t node
+  | FunctionTypeRef :
+      FunctionTypeRefType.t node
+  | GenericTypeRef :
+      GenericTypeRefType.t node
+  | SimpleTypeRef :
+      SimpleTypeRefType.t node
+  | VarBind :
+      VarBindType.t node
+
+module VarBind = struct
+  type t =
+    [
+      | `VarBind of
+          VarBindType.fields
+    ]
+
+  type fields = VarBindType.fields =
+    
+  {
+         
+    f_name: RefIdType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_name node =
+    match (node :> VarBindType.t) with
+    | `VarBind fields ->
+        Lazy.force fields.f_name
+  let f_expr node =
+    match (node :> VarBindType.t) with
+    | `VarBind fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module SimpleTypeRef = struct
+  type t =
+    [
+      | `SimpleTypeRef of
+          SimpleTypeRefType.fields
+    ]
+
+  type fields = SimpleTypeRefType.fields =
+    
+  {
+         
+    f_type_name: [
+      | `DotExpr
+          of DotExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `RefId
+          of RefIdType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_type_name node =
+    match (node :> SimpleTypeRefType.t) with
+    | `SimpleTypeRef fields ->
+        Lazy.force fields.f_type_name
+
+
+
+end
+
+module GenericTypeRef = struct
+  type t =
+    [
+      | `GenericTypeRef of
+          GenericTypeRefType.fields
+    ]
+
+  type fields = GenericTypeRefType.fields =
+    
+  {
+         
+    f_type_name: [
+      | `DotExpr
+          of DotExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `RefId
+          of RefIdType.fields
+    ]
+    Lazy.t;
+         
+    f_params: TypeRefListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_type_name node =
+    match (node :> GenericTypeRefType.t) with
+    | `GenericTypeRef fields ->
+        Lazy.force fields.f_type_name
+  let f_params node =
+    match (node :> GenericTypeRefType.t) with
+    | `GenericTypeRef fields ->
+        Lazy.force fields.f_params
+
+
+
+end
+
+module FunctionTypeRef = struct
+  type t =
+    [
+      | `FunctionTypeRef of
+          FunctionTypeRefType.fields
+    ]
+
+  type fields = FunctionTypeRefType.fields =
+    
+  {
+         
+    f_args_types: TypeRefListType.t
+    Lazy.t;
+         
+    f_return_type: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_args_types node =
+    match (node :> FunctionTypeRefType.t) with
+    | `FunctionTypeRef fields ->
+        Lazy.force fields.f_args_types
+  let f_return_type node =
+    match (node :> FunctionTypeRefType.t) with
+    | `FunctionTypeRef fields ->
+        Lazy.force fields.f_return_type
+
+
+
+end
+
+module TypeRef = struct
+  type t =
+    [
+      | SimpleTypeRef.t
+      | GenericTypeRef.t
+      | FunctionTypeRef.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+let p_designated_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.type_ref_p_designated_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+
+
+
+
+end
+
+module Param = struct
+  type t =
+    [
+      | `Param of
+          ParamType.fields
+    ]
+
+  type fields = ParamType.fields =
+    
+  {
+         
+    f_name: RefIdType.t
+    option
+    Lazy.t;
+         
+    f_value: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_name node =
+    match (node :> ParamType.t) with
+    | `Param fields ->
+        Lazy.force fields.f_name
+  let f_value node =
+    match (node :> ParamType.t) with
+    | `Param fields ->
+        Lazy.force fields.f_value
+
+
+
+end
+
+module OpPlus = struct
+  type t =
+    [
+      | `OpPlus of
+          OpPlusType.fields
+    ]
+
+  type fields = OpPlusType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module OpOr = struct
+  type t =
+    [
+      | `OpOr of
+          OpOrType.fields
+    ]
+
+  type fields = OpOrType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module OpMult = struct
+  type t =
+    [
+      | `OpMult of
+          OpMultType.fields
+    ]
+
+  type fields = OpMultType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module OpMinus = struct
+  type t =
+    [
+      | `OpMinus of
+          OpMinusType.fields
+    ]
+
+  type fields = OpMinusType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module OpLte = struct
+  type t =
+    [
+      | `OpLte of
+          OpLteType.fields
+    ]
+
+  type fields = OpLteType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module OpLt = struct
+  type t =
+    [
+      | `OpLt of
+          OpLtType.fields
+    ]
+
+  type fields = OpLtType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module OpGte = struct
+  type t =
+    [
+      | `OpGte of
+          OpGteType.fields
+    ]
+
+  type fields = OpGteType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module OpGt = struct
+  type t =
+    [
+      | `OpGt of
+          OpGtType.fields
+    ]
+
+  type fields = OpGtType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module OpEq = struct
+  type t =
+    [
+      | `OpEq of
+          OpEqType.fields
+    ]
+
+  type fields = OpEqType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module OpDiv = struct
+  type t =
+    [
+      | `OpDiv of
+          OpDivType.fields
+    ]
+
+  type fields = OpDivType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module OpAnd = struct
+  type t =
+    [
+      | `OpAnd of
+          OpAndType.fields
+    ]
+
+  type fields = OpAndType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module OpAmp = struct
+  type t =
+    [
+      | `OpAmp of
+          OpAmpType.fields
+    ]
+
+  type fields = OpAmpType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module Op = struct
+  type t =
+    [
+      | OpAnd.t
+      | OpOr.t
+      | OpPlus.t
+      | OpMinus.t
+      | OpEq.t
+      | OpMult.t
+      | OpDiv.t
+      | OpLt.t
+      | OpGt.t
+      | OpLte.t
+      | OpGte.t
+      | OpAmp.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module MatchBranch = struct
+  type t =
+    [
+      | `MatchBranch of
+          MatchBranchType.fields
+    ]
+
+  type fields = MatchBranchType.fields =
+    
+  {
+         
+    f_decl: MatchValDeclType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_decl node =
+    match (node :> MatchBranchType.t) with
+    | `MatchBranch fields ->
+        Lazy.force fields.f_decl
+  let f_expr node =
+    match (node :> MatchBranchType.t) with
+    | `MatchBranch fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module ListKindZero = struct
+  type t =
+    [
+      | `ListKindZero of
+          ListKindZeroType.fields
+    ]
+
+  type fields = ListKindZeroType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module ListKindOne = struct
+  type t =
+    [
+      | `ListKindOne of
+          ListKindOneType.fields
+    ]
+
+  type fields = ListKindOneType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module ListKind = struct
+  type t =
+    [
+      | ListKindOne.t
+      | ListKindZero.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module LexerCaseRuleSend = struct
+  type t =
+    [
+      | `LexerCaseRuleSend of
+          LexerCaseRuleSendType.fields
+    ]
+
+  type fields = LexerCaseRuleSendType.fields =
+    
+  {
+         
+    f_sent: RefIdType.t
+    Lazy.t;
+         
+    f_match_size: NumLitType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_sent node =
+    match (node :> LexerCaseRuleSendType.t) with
+    | `LexerCaseRuleSend fields ->
+        Lazy.force fields.f_sent
+  let f_match_size node =
+    match (node :> LexerCaseRuleSendType.t) with
+    | `LexerCaseRuleSend fields ->
+        Lazy.force fields.f_match_size
+
+
+
+end
+
+module LexerCaseRule = struct
+  type t =
+    [
+      | `LexerCaseRule of
+          LexerCaseRuleType.fields
+    ]
+
+  type fields = LexerCaseRuleType.fields =
+    
+  {
+         
+    f_expr: [
+      | `GrammarCut
+          of GrammarCutType.fields
+      | `GrammarDiscard
+          of GrammarDiscardType.fields
+      | `GrammarImplicitPick
+          of GrammarImplicitPickType.fields
+      | `GrammarList
+          of GrammarListType.fields
+      | `GrammarNull
+          of GrammarNullType.fields
+      | `GrammarOpt
+          of GrammarOptType.fields
+      | `GrammarOptGroup
+          of GrammarOptGroupType.fields
+      | `GrammarOrExpr
+          of GrammarOrExprType.fields
+      | `GrammarPick
+          of GrammarPickType.fields
+      | `GrammarRuleRef
+          of GrammarRuleRefType.fields
+      | `GrammarSkip
+          of GrammarSkipType.fields
+      | `ParseNodeExpr
+          of ParseNodeExprType.fields
+      | `TokenLit
+          of TokenLitType.fields
+      | `TokenNoCaseLit
+          of TokenNoCaseLitType.fields
+      | `TokenPatternLit
+          of TokenPatternLitType.fields
+      | `TokenRef
+          of TokenRefType.fields
+    ]
+    Lazy.t;
+         
+    f_alts: BaseLexerCaseRuleAltListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> LexerCaseRuleType.t) with
+    | `LexerCaseRule fields ->
+        Lazy.force fields.f_expr
+  let f_alts node =
+    match (node :> LexerCaseRuleType.t) with
+    | `LexerCaseRule fields ->
+        Lazy.force fields.f_alts
+
+
+
+end
+
+module LangkitRoot = struct
+  type t =
+    [
+      | `LangkitRoot of
+          LangkitRootType.fields
+    ]
+
+  type fields = LangkitRootType.fields =
+    
+  {
+         
+    f_imports: ImportListType.t
+    Lazy.t;
+         
+    f_decls: FullDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+let p_check_legality
+    (node)
+    =
+      let result_ptr =
+        allocate_n SemanticResultArrayStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.langkit_root_p_check_legality
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      SemanticResultArray.wrap (context node) (!@ result_ptr)
+
+
+  let f_imports node =
+    match (node :> LangkitRootType.t) with
+    | `LangkitRoot fields ->
+        Lazy.force fields.f_imports
+  let f_decls node =
+    match (node :> LangkitRootType.t) with
+    | `LangkitRoot fields ->
+        Lazy.force fields.f_decls
+
+
+
+end
+
+module TypeRefList = struct
+  type t =
+    [
+      | `TypeRefList of
+          TypeRefListType.fields
+    ]
+
+  type fields = TypeRefListType.fields =
+    
+  {
+    list : TypeRefType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> TypeRefListType.t) with
+    | `TypeRefList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module RefIdList = struct
+  type t =
+    [
+      | `RefIdList of
+          RefIdListType.fields
+    ]
+
+  type fields = RefIdListType.fields =
+    
+  {
+    list : RefIdType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> RefIdListType.t) with
+    | `RefIdList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module ParamList = struct
+  type t =
+    [
+      | `ParamList of
+          ParamListType.fields
+    ]
+
+  type fields = ParamListType.fields =
+    
+  {
+    list : ParamType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> ParamListType.t) with
+    | `ParamList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module MatchBranchList = struct
+  type t =
+    [
+      | `MatchBranchList of
+          MatchBranchListType.fields
+    ]
+
+  type fields = MatchBranchListType.fields =
+    
+  {
+    list : MatchBranchType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> MatchBranchListType.t) with
+    | `MatchBranchList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module LambdaArgDeclList = struct
+  type t =
+    [
+      | `LambdaArgDeclList of
+          LambdaArgDeclListType.fields
+    ]
+
+  type fields = LambdaArgDeclListType.fields =
+    
+  {
+    list : LambdaArgDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> LambdaArgDeclListType.t) with
+    | `LambdaArgDeclList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module LKNodeList = struct
+  type t =
+    [
+      | `LKNodeList of
+          LKNodeListType.fields
+    ]
+
+  type fields = LKNodeListType.fields =
+    
+  {
+    list : LKNodeType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> LKNodeListType.t) with
+    | `LKNodeList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module ImportList = struct
+  type t =
+    [
+      | `ImportList of
+          ImportListType.fields
+    ]
+
+  type fields = ImportListType.fields =
+    
+  {
+    list : ImportType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> ImportListType.t) with
+    | `ImportList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module GrammarExprListList = struct
+  type t =
+    [
+      | `GrammarExprListList of
+          GrammarExprListListType.fields
+    ]
+
+  type fields = GrammarExprListListType.fields =
+    
+  {
+    list : GrammarExprListType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> GrammarExprListListType.t) with
+    | `GrammarExprListList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module GrammarExprList = struct
+  type t =
+    [
+      | `GrammarExprList of
+          GrammarExprListType.fields
+    ]
+
+  type fields = GrammarExprListType.fields =
+    
+  {
+    list : GrammarExprType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> GrammarExprListType.t) with
+    | `GrammarExprList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module FunArgDeclList = struct
+  type t =
+    [
+      | `FunArgDeclList of
+          FunArgDeclListType.fields
+    ]
+
+  type fields = FunArgDeclListType.fields =
+    
+  {
+    list : FunArgDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> FunArgDeclListType.t) with
+    | `FunArgDeclList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module DeclBlock = struct
+  type t =
+    [
+      | `DeclBlock of
+          DeclBlockType.fields
+    ]
+
+  type fields = DeclBlockType.fields =
+    
+  {
+    list : FullDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> DeclBlockType.t) with
+    | `DeclBlock fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module FullDeclList = struct
+  type t =
+    [
+      | `FullDeclList of
+          FullDeclListType.fields
+      | `DeclBlock of
+          DeclBlockType.fields
+    ]
+
+  type fields = FullDeclListType.fields =
+    
+  {
+    list : FullDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> FullDeclListType.t) with
+    | `FullDeclList fields ->
+        Lazy.force fields.list
+    | `DeclBlock fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module ExprList = struct
+  type t =
+    [
+      | `ExprList of
+          ExprListType.fields
+    ]
+
+  type fields = ExprListType.fields =
+    
+  {
+    list : ExprType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> ExprListType.t) with
+    | `ExprList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module EnumLitDeclList = struct
+  type t =
+    [
+      | `EnumLitDeclList of
+          EnumLitDeclListType.fields
+    ]
+
+  type fields = EnumLitDeclListType.fields =
+    
+  {
+    list : EnumLitDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> EnumLitDeclListType.t) with
+    | `EnumLitDeclList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module EnumClassCaseList = struct
+  type t =
+    [
+      | `EnumClassCaseList of
+          EnumClassCaseListType.fields
+    ]
+
+  type fields = EnumClassCaseListType.fields =
+    
+  {
+    list : EnumClassCaseType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> EnumClassCaseListType.t) with
+    | `EnumClassCaseList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module EnumClassAltDeclList = struct
+  type t =
+    [
+      | `EnumClassAltDeclList of
+          EnumClassAltDeclListType.fields
+    ]
+
+  type fields = EnumClassAltDeclListType.fields =
+    
+  {
+    list : EnumClassAltDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> EnumClassAltDeclListType.t) with
+    | `EnumClassAltDeclList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module ElsifBranchList = struct
+  type t =
+    [
+      | `ElsifBranchList of
+          ElsifBranchListType.fields
+    ]
+
+  type fields = ElsifBranchListType.fields =
+    
+  {
+    list : ElsifBranchType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> ElsifBranchListType.t) with
+    | `ElsifBranchList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module DocCommentList = struct
+  type t =
+    [
+      | `DocCommentList of
+          DocCommentListType.fields
+    ]
+
+  type fields = DocCommentListType.fields =
+    
+  {
+    list : DocCommentType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> DocCommentListType.t) with
+    | `DocCommentList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module DeclAnnotationList = struct
+  type t =
+    [
+      | `DeclAnnotationList of
+          DeclAnnotationListType.fields
+    ]
+
+  type fields = DeclAnnotationListType.fields =
+    
+  {
+    list : DeclAnnotationType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> DeclAnnotationListType.t) with
+    | `DeclAnnotationList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module BaseLexerCaseRuleAltList = struct
+  type t =
+    [
+      | `BaseLexerCaseRuleAltList of
+          BaseLexerCaseRuleAltListType.fields
+    ]
+
+  type fields = BaseLexerCaseRuleAltListType.fields =
+    
+  {
+    list : BaseLexerCaseRuleAltType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> BaseLexerCaseRuleAltListType.t) with
+    | `BaseLexerCaseRuleAltList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module LKNodeBaseList = struct
+  type t =
+    [
+      | FullDeclList.t
+      | ExprList.t
+      | ParamList.t
+      | TypeRefList.t
+      | LKNodeList.t
+      | DeclAnnotationList.t
+      | DocCommentList.t
+      | FunArgDeclList.t
+      | GrammarExprList.t
+      | GrammarExprListList.t
+      | ElsifBranchList.t
+      | ImportList.t
+      | LambdaArgDeclList.t
+      | RefIdList.t
+      | BaseLexerCaseRuleAltList.t
+      | MatchBranchList.t
+      | EnumClassCaseList.t
+      | EnumClassAltDeclList.t
+      | EnumLitDeclList.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module Import = struct
+  type t =
+    [
+      | `Import of
+          ImportType.fields
+    ]
+
+  type fields = ImportType.fields =
+    
+  {
+         
+    f_name: ModuleRefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+let p_referenced_unit
+    (node)
+    =
+      let result_ptr =
+        allocate_n AnalysisUnitStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.import_p_referenced_unit
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      AnalysisUnit.wrap (context node) (!@ result_ptr)
+
+
+  let f_name node =
+    match (node :> ImportType.t) with
+    | `Import fields ->
+        Lazy.force fields.f_name
+
+
+
+end
+
+module FullDecl = struct
+  type t =
+    [
+      | `FullDecl of
+          FullDeclType.fields
+    ]
+
+  type fields = FullDeclType.fields =
+    
+  {
+         
+    f_doc: DocType.t
+    Lazy.t;
+         
+    f_decl_annotations: DeclAnnotationListType.t
+    Lazy.t;
+         
+    f_decl: [
+      | `ClassDecl
+          of ClassDeclType.fields
+      | `EnumClassDecl
+          of EnumClassDeclType.fields
+      | `EnumTypeDecl
+          of EnumTypeDeclType.fields
+      | `FieldDecl
+          of FieldDeclType.fields
+      | `FunDecl
+          of FunDeclType.fields
+      | `GenericDecl
+          of GenericDeclType.fields
+      | `GenericFormalTypeDecl
+          of GenericFormalTypeDeclType.fields
+      | `GrammarDecl
+          of GrammarDeclType.fields
+      | `GrammarRuleDecl
+          of GrammarRuleDeclType.fields
+      | `LexerDecl
+          of LexerDeclType.fields
+      | `LexerFamilyDecl
+          of LexerFamilyDeclType.fields
+      | `StructDecl
+          of StructDeclType.fields
+      | `TraitDecl
+          of TraitDeclType.fields
+      | `ValDecl
+          of ValDeclType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_doc node =
+    match (node :> FullDeclType.t) with
+    | `FullDecl fields ->
+        Lazy.force fields.f_doc
+  let f_decl_annotations node =
+    match (node :> FullDeclType.t) with
+    | `FullDecl fields ->
+        Lazy.force fields.f_decl_annotations
+  let f_decl node =
+    match (node :> FullDeclType.t) with
+    | `FullDecl fields ->
+        Lazy.force fields.f_decl
+
+
+
+end
+
+module TryExpr = struct
+  type t =
+    [
+      | `TryExpr of
+          TryExprType.fields
+    ]
+
+  type fields = TryExprType.fields =
+    
+  {
+         
+    f_try_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of fields
+    ]
+    Lazy.t;
+         
+    f_or_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_try_expr node =
+    match (node :> TryExprType.t) with
+    | `TryExpr fields ->
+        Lazy.force fields.f_try_expr
+  let f_or_expr node =
+    match (node :> TryExprType.t) with
+    | `TryExpr fields ->
+        Lazy.force fields.f_or_expr
+
+
+
+end
+
+module RaiseExpr = struct
+  type t =
+    [
+      | `RaiseExpr of
+          RaiseExprType.fields
+    ]
+
+  type fields = RaiseExprType.fields =
+    
+  {
+         
+    f_except_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_except_expr node =
+    match (node :> RaiseExprType.t) with
+    | `RaiseExpr fields ->
+        Lazy.force fields.f_except_expr
+
+
+
+end
+
+module ParenExpr = struct
+  type t =
+    [
+      | `ParenExpr of
+          ParenExprType.fields
+    ]
+
+  type fields = ParenExprType.fields =
+    
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> ParenExprType.t) with
+    | `ParenExpr fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module NotExpr = struct
+  type t =
+    [
+      | `NotExpr of
+          NotExprType.fields
+    ]
+
+  type fields = NotExprType.fields =
+    
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> NotExprType.t) with
+    | `NotExpr fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module MatchExpr = struct
+  type t =
+    [
+      | `MatchExpr of
+          MatchExprType.fields
+    ]
+
+  type fields = MatchExprType.fields =
+    
+  {
+         
+    f_match_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_branches: MatchBranchListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_match_expr node =
+    match (node :> MatchExprType.t) with
+    | `MatchExpr fields ->
+        Lazy.force fields.f_match_expr
+  let f_branches node =
+    match (node :> MatchExprType.t) with
+    | `MatchExpr fields ->
+        Lazy.force fields.f_branches
+
+
+
+end
+
+module LogicExpr = struct
+  type t =
+    [
+      | `LogicExpr of
+          LogicExprType.fields
+    ]
+
+  type fields = LogicExprType.fields =
+    
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> LogicExprType.t) with
+    | `LogicExpr fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module StringLit = struct
+  type t =
+    [
+      | `StringLit of
+          StringLitType.fields
+    ]
+
+  type fields = StringLitType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+let p_is_prefixed_string
+    (node)
+    =
+      let result_ptr =
+        allocate_n bool ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.string_lit_p_is_prefixed_string
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+let p_prefix
+    (node)
+    =
+      let result_ptr =
+        allocate_n Character.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.string_lit_p_prefix
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+let p_denoted_value
+    (node)
+    =
+      let result_ptr =
+        allocate_n TextTypeStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.string_lit_p_denoted_value
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      TextType.wrap (!@ result_ptr)
+
+let p_is_regexp_literal
+    (node)
+    =
+      let result_ptr =
+        allocate_n bool ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.string_lit_p_is_regexp_literal
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+
+
+
+
+end
+
+module NumLit = struct
+  type t =
+    [
+      | `NumLit of
+          NumLitType.fields
+    ]
+
+  type fields = NumLitType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module NullLit = struct
+  type t =
+    [
+      | `NullLit of
+          NullLitType.fields
+    ]
+
+  type fields = NullLitType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module CharLit = struct
+  type t =
+    [
+      | `CharLit of
+          CharLitType.fields
+    ]
+
+  type fields = CharLitType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module Lit = struct
+  type t =
+    [
+      | NullLit.t
+      | StringLit.t
+      | CharLit.t
+      | NumLit.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module LambdaExpr = struct
+  type t =
+    [
+      | `LambdaExpr of
+          LambdaExprType.fields
+    ]
+
+  type fields = LambdaExprType.fields =
+    
+  {
+         
+    f_params: LambdaArgDeclListType.t
+    Lazy.t;
+         
+    f_return_type: TypeRefType.t
+    option
+    Lazy.t;
+         
+    f_body: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_params node =
+    match (node :> LambdaExprType.t) with
+    | `LambdaExpr fields ->
+        Lazy.force fields.f_params
+  let f_return_type node =
+    match (node :> LambdaExprType.t) with
+    | `LambdaExpr fields ->
+        Lazy.force fields.f_return_type
+  let f_body node =
+    match (node :> LambdaExprType.t) with
+    | `LambdaExpr fields ->
+        Lazy.force fields.f_body
+
+
+
+end
+
+module Isa = struct
+  type t =
+    [
+      | `Isa of
+          IsaType.fields
+    ]
+
+  type fields = IsaType.fields =
+    
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_dest_type: TypeRefListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> IsaType.t) with
+    | `Isa fields ->
+        Lazy.force fields.f_expr
+  let f_dest_type node =
+    match (node :> IsaType.t) with
+    | `Isa fields ->
+        Lazy.force fields.f_dest_type
+
+
+
+end
+
+module IfExpr = struct
+  type t =
+    [
+      | `IfExpr of
+          IfExprType.fields
+    ]
+
+  type fields = IfExprType.fields =
+    
+  {
+         
+    f_cond_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_then_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_alternatives: ElsifBranchListType.t
+    Lazy.t;
+         
+    f_else_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_cond_expr node =
+    match (node :> IfExprType.t) with
+    | `IfExpr fields ->
+        Lazy.force fields.f_cond_expr
+  let f_then_expr node =
+    match (node :> IfExprType.t) with
+    | `IfExpr fields ->
+        Lazy.force fields.f_then_expr
+  let f_alternatives node =
+    match (node :> IfExprType.t) with
+    | `IfExpr fields ->
+        Lazy.force fields.f_alternatives
+  let f_else_expr node =
+    match (node :> IfExprType.t) with
+    | `IfExpr fields ->
+        Lazy.force fields.f_else_expr
+
+
+
+end
+
+module ModuleRefId = struct
+  type t =
+    [
+      | `ModuleRefId of
+          ModuleRefIdType.fields
+    ]
+
+  type fields = ModuleRefIdType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module RefId = struct
+  type t =
+    [
+      | `RefId of
+          RefIdType.fields
+      | `ModuleRefId of
+          ModuleRefIdType.fields
+    ]
+
+  type fields = RefIdType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module DefId = struct
+  type t =
+    [
+      | `DefId of
+          DefIdType.fields
+    ]
+
+  type fields = DefIdType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module Id = struct
+  type t =
+    [
+      | `Id of
+          IdType.fields
+      | `DefId of
+          DefIdType.fields
+      | `RefId of
+          RefIdType.fields
+      | `ModuleRefId of
+          ModuleRefIdType.fields
+    ]
+
+  type fields = IdType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module TokenRef = struct
+  type t =
+    [
+      | `TokenRef of
+          TokenRefType.fields
+    ]
+
+  type fields = TokenRefType.fields =
+    
+  {
+         
+    f_token_name: RefIdType.t
+    Lazy.t;
+         
+    f_expr: TokenLitType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_token_name node =
+    match (node :> TokenRefType.t) with
+    | `TokenRef fields ->
+        Lazy.force fields.f_token_name
+  let f_expr node =
+    match (node :> TokenRefType.t) with
+    | `TokenRef fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module TokenPatternLit = struct
+  type t =
+    [
+      | `TokenPatternLit of
+          TokenPatternLitType.fields
+    ]
+
+  type fields = TokenPatternLitType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module TokenNoCaseLit = struct
+  type t =
+    [
+      | `TokenNoCaseLit of
+          TokenNoCaseLitType.fields
+    ]
+
+  type fields = TokenNoCaseLitType.fields =
+    
+  {
+         
+    f_lit: TokenLitType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_lit node =
+    match (node :> TokenNoCaseLitType.t) with
+    | `TokenNoCaseLit fields ->
+        Lazy.force fields.f_lit
+
+
+
+end
+
+module TokenLit = struct
+  type t =
+    [
+      | `TokenLit of
+          TokenLitType.fields
+    ]
+
+  type fields = TokenLitType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module ParseNodeExpr = struct
+  type t =
+    [
+      | `ParseNodeExpr of
+          ParseNodeExprType.fields
+    ]
+
+  type fields = ParseNodeExprType.fields =
+    
+  {
+         
+    f_node_name: TypeRefType.t
+    Lazy.t;
+         
+    f_sub_exprs: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_node_name node =
+    match (node :> ParseNodeExprType.t) with
+    | `ParseNodeExpr fields ->
+        Lazy.force fields.f_node_name
+  let f_sub_exprs node =
+    match (node :> ParseNodeExprType.t) with
+    | `ParseNodeExpr fields ->
+        Lazy.force fields.f_sub_exprs
+
+
+
+end
+
+module GrammarSkip = struct
+  type t =
+    [
+      | `GrammarSkip of
+          GrammarSkipType.fields
+    ]
+
+  type fields = GrammarSkipType.fields =
+    
+  {
+         
+    f_name: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_name node =
+    match (node :> GrammarSkipType.t) with
+    | `GrammarSkip fields ->
+        Lazy.force fields.f_name
+
+
+
+end
+
+module GrammarRuleRef = struct
+  type t =
+    [
+      | `GrammarRuleRef of
+          GrammarRuleRefType.fields
+    ]
+
+  type fields = GrammarRuleRefType.fields =
+    
+  {
+         
+    f_node_name: RefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_node_name node =
+    match (node :> GrammarRuleRefType.t) with
+    | `GrammarRuleRef fields ->
+        Lazy.force fields.f_node_name
+
+
+
+end
+
+module GrammarPredicate = struct
+  type t =
+    [
+      | `GrammarPredicate of
+          GrammarPredicateType.fields
+    ]
+
+  type fields = GrammarPredicateType.fields =
+    
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+         
+    f_prop_ref: [
+      | `DotExpr
+          of DotExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `RefId
+          of RefIdType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> GrammarPredicateType.t) with
+    | `GrammarPredicate fields ->
+        Lazy.force fields.f_expr
+  let f_prop_ref node =
+    match (node :> GrammarPredicateType.t) with
+    | `GrammarPredicate fields ->
+        Lazy.force fields.f_prop_ref
+
+
+
+end
+
+module GrammarImplicitPick = struct
+  type t =
+    [
+      | `GrammarImplicitPick of
+          GrammarImplicitPickType.fields
+    ]
+
+  type fields = GrammarImplicitPickType.fields =
+    
+  {
+         
+    f_exprs: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_exprs node =
+    match (node :> GrammarImplicitPickType.t) with
+    | `GrammarImplicitPick fields ->
+        Lazy.force fields.f_exprs
+
+
+
+end
+
+module GrammarPick = struct
+  type t =
+    [
+      | `GrammarPick of
+          GrammarPickType.fields
+      | `GrammarImplicitPick of
+          GrammarImplicitPickType.fields
+    ]
+
+  type fields = GrammarPickType.fields =
+    
+  {
+         
+    f_exprs: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_exprs node =
+    match (node :> GrammarPickType.t) with
+    | `GrammarPick fields ->
+        Lazy.force fields.f_exprs
+    | `GrammarImplicitPick fields ->
+        Lazy.force fields.f_exprs
+
+
+
+end
+
+module GrammarOrExpr = struct
+  type t =
+    [
+      | `GrammarOrExpr of
+          GrammarOrExprType.fields
+    ]
+
+  type fields = GrammarOrExprType.fields =
+    
+  {
+         
+    f_sub_exprs: GrammarExprListListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_sub_exprs node =
+    match (node :> GrammarOrExprType.t) with
+    | `GrammarOrExpr fields ->
+        Lazy.force fields.f_sub_exprs
+
+
+
+end
+
+module GrammarOptGroup = struct
+  type t =
+    [
+      | `GrammarOptGroup of
+          GrammarOptGroupType.fields
+    ]
+
+  type fields = GrammarOptGroupType.fields =
+    
+  {
+         
+    f_expr: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> GrammarOptGroupType.t) with
+    | `GrammarOptGroup fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module GrammarOpt = struct
+  type t =
+    [
+      | `GrammarOpt of
+          GrammarOptType.fields
+    ]
+
+  type fields = GrammarOptType.fields =
+    
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> GrammarOptType.t) with
+    | `GrammarOpt fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module GrammarNull = struct
+  type t =
+    [
+      | `GrammarNull of
+          GrammarNullType.fields
+    ]
+
+  type fields = GrammarNullType.fields =
+    
+  {
+         
+    f_name: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_name node =
+    match (node :> GrammarNullType.t) with
+    | `GrammarNull fields ->
+        Lazy.force fields.f_name
+
+
+
+end
+
+module GrammarList = struct
+  type t =
+    [
+      | `GrammarList of
+          GrammarListType.fields
+    ]
+
+  type fields = GrammarListType.fields =
+    
+  {
+         
+    f_list_type: TypeRefType.t
+    option
+    Lazy.t;
+         
+    f_kind: ListKindType.t
+    Lazy.t;
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+         
+    f_sep: GrammarExprType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_list_type node =
+    match (node :> GrammarListType.t) with
+    | `GrammarList fields ->
+        Lazy.force fields.f_list_type
+  let f_kind node =
+    match (node :> GrammarListType.t) with
+    | `GrammarList fields ->
+        Lazy.force fields.f_kind
+  let f_expr node =
+    match (node :> GrammarListType.t) with
+    | `GrammarList fields ->
+        Lazy.force fields.f_expr
+  let f_sep node =
+    match (node :> GrammarListType.t) with
+    | `GrammarList fields ->
+        Lazy.force fields.f_sep
+
+
+
+end
+
+module GrammarDontSkip = struct
+  type t =
+    [
+      | `GrammarDontSkip of
+          GrammarDontSkipType.fields
+    ]
+
+  type fields = GrammarDontSkipType.fields =
+    
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+         
+    f_dont_skip: GrammarExprType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> GrammarDontSkipType.t) with
+    | `GrammarDontSkip fields ->
+        Lazy.force fields.f_expr
+  let f_dont_skip node =
+    match (node :> GrammarDontSkipType.t) with
+    | `GrammarDontSkip fields ->
+        Lazy.force fields.f_dont_skip
+
+
+
+end
+
+module GrammarDiscard = struct
+  type t =
+    [
+      | `GrammarDiscard of
+          GrammarDiscardType.fields
+    ]
+
+  type fields = GrammarDiscardType.fields =
+    
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> GrammarDiscardType.t) with
+    | `GrammarDiscard fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module GrammarCut = struct
+  type t =
+    [
+      | `GrammarCut of
+          GrammarCutType.fields
+    ]
+
+  type fields = GrammarCutType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module GrammarExpr = struct
+  type t =
+    [
+      | ParseNodeExpr.t
+      | GrammarRuleRef.t
+      | GrammarDiscard.t
+      | TokenLit.t
+      | TokenNoCaseLit.t
+      | TokenPatternLit.t
+      | GrammarPick.t
+      | TokenRef.t
+      | GrammarOrExpr.t
+      | GrammarOpt.t
+      | GrammarOptGroup.t
+      | GrammarCut.t
+      | GrammarNull.t
+      | GrammarSkip.t
+      | GrammarPredicate.t
+      | GrammarDontSkip.t
+      | GrammarList.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module GenericInstantiation = struct
+  type t =
+    [
+      | `GenericInstantiation of
+          GenericInstantiationType.fields
+    ]
+
+  type fields = GenericInstantiationType.fields =
+    
+  {
+         
+    f_name: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_args: TypeRefListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+let p_instantiated_decl
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.generic_instantiation_p_instantiated_decl
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (DeclType.wrap (context node) (!@ result_ptr))
+
+
+  let f_name node =
+    match (node :> GenericInstantiationType.t) with
+    | `GenericInstantiation fields ->
+        Lazy.force fields.f_name
+  let f_args node =
+    match (node :> GenericInstantiationType.t) with
+    | `GenericInstantiation fields ->
+        Lazy.force fields.f_args
+
+
+
+end
+
+module ErrorOnNull = struct
+  type t =
+    [
+      | `ErrorOnNull of
+          ErrorOnNullType.fields
+    ]
+
+  type fields = ErrorOnNullType.fields =
+    
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> ErrorOnNullType.t) with
+    | `ErrorOnNull fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module NullCondDottedName = struct
+  type t =
+    [
+      | `NullCondDottedName of
+          NullCondDottedNameType.fields
+    ]
+
+  type fields = NullCondDottedNameType.fields =
+    
+  {
+         
+    f_prefix: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: RefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_prefix node =
+    match (node :> NullCondDottedNameType.t) with
+    | `NullCondDottedName fields ->
+        Lazy.force fields.f_prefix
+  let f_suffix node =
+    match (node :> NullCondDottedNameType.t) with
+    | `NullCondDottedName fields ->
+        Lazy.force fields.f_suffix
+
+
+
+end
+
+module DotExpr = struct
+  type t =
+    [
+      | `DotExpr of
+          DotExprType.fields
+      | `NullCondDottedName of
+          NullCondDottedNameType.fields
+    ]
+
+  type fields = DotExprType.fields =
+    
+  {
+         
+    f_prefix: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: RefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_prefix node =
+    match (node :> DotExprType.t) with
+    | `DotExpr fields ->
+        Lazy.force fields.f_prefix
+    | `NullCondDottedName fields ->
+        Lazy.force fields.f_prefix
+  let f_suffix node =
+    match (node :> DotExprType.t) with
+    | `DotExpr fields ->
+        Lazy.force fields.f_suffix
+    | `NullCondDottedName fields ->
+        Lazy.force fields.f_suffix
+
+
+
+end
+
+module CastExpr = struct
+  type t =
+    [
+      | `CastExpr of
+          CastExprType.fields
+    ]
+
+  type fields = CastExprType.fields =
+    
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_excludes_null: ExcludesNullType.t
+    Lazy.t;
+         
+    f_dest_type: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> CastExprType.t) with
+    | `CastExpr fields ->
+        Lazy.force fields.f_expr
+  let f_excludes_null node =
+    match (node :> CastExprType.t) with
+    | `CastExpr fields ->
+        Lazy.force fields.f_excludes_null
+  let f_dest_type node =
+    match (node :> CastExprType.t) with
+    | `CastExpr fields ->
+        Lazy.force fields.f_dest_type
+
+
+
+end
+
+module NullCondCallExpr = struct
+  type t =
+    [
+      | `NullCondCallExpr of
+          NullCondCallExprType.fields
+    ]
+
+  type fields = NullCondCallExprType.fields =
+    
+  {
+         
+    f_name: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_args: ParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_name node =
+    match (node :> NullCondCallExprType.t) with
+    | `NullCondCallExpr fields ->
+        Lazy.force fields.f_name
+  let f_args node =
+    match (node :> NullCondCallExprType.t) with
+    | `NullCondCallExpr fields ->
+        Lazy.force fields.f_args
+
+
+
+end
+
+module CallExpr = struct
+  type t =
+    [
+      | `CallExpr of
+          CallExprType.fields
+      | `NullCondCallExpr of
+          NullCondCallExprType.fields
+    ]
+
+  type fields = CallExprType.fields =
+    
+  {
+         
+    f_name: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_args: ParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+let p_called_object_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.call_expr_p_called_object_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+let p_called_decl
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.call_expr_p_called_decl
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (DeclType.wrap (context node) (!@ result_ptr))
+
+
+  let f_name node =
+    match (node :> CallExprType.t) with
+    | `CallExpr fields ->
+        Lazy.force fields.f_name
+    | `NullCondCallExpr fields ->
+        Lazy.force fields.f_name
+  let f_args node =
+    match (node :> CallExprType.t) with
+    | `CallExpr fields ->
+        Lazy.force fields.f_args
+    | `NullCondCallExpr fields ->
+        Lazy.force fields.f_args
+
+
+
+end
+
+module BlockExpr = struct
+  type t =
+    [
+      | `BlockExpr of
+          BlockExprType.fields
+    ]
+
+  type fields = BlockExprType.fields =
+    
+  {
+         
+    f_val_defs: LKNodeListType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_val_defs node =
+    match (node :> BlockExprType.t) with
+    | `BlockExpr fields ->
+        Lazy.force fields.f_val_defs
+  let f_expr node =
+    match (node :> BlockExprType.t) with
+    | `BlockExpr fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module BinOp = struct
+  type t =
+    [
+      | `BinOp of
+          BinOpType.fields
+    ]
+
+  type fields = BinOpType.fields =
+    
+  {
+         
+    f_left: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_left node =
+    match (node :> BinOpType.t) with
+    | `BinOp fields ->
+        Lazy.force fields.f_left
+  let f_op node =
+    match (node :> BinOpType.t) with
+    | `BinOp fields ->
+        Lazy.force fields.f_op
+  let f_right node =
+    match (node :> BinOpType.t) with
+    | `BinOp fields ->
+        Lazy.force fields.f_right
+
+
+
+end
+
+module ArrayLiteral = struct
+  type t =
+    [
+      | `ArrayLiteral of
+          ArrayLiteralType.fields
+    ]
+
+  type fields = ArrayLiteralType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_exprs node =
+    match (node :> ArrayLiteralType.t) with
+    | `ArrayLiteral fields ->
+        Lazy.force fields.f_exprs
+
+
+
+end
+
+module Expr = struct
+  type t =
+    [
+      | GrammarExpr.t
+      | DotExpr.t
+      | Id.t
+      | ArrayLiteral.t
+      | NotExpr.t
+      | CastExpr.t
+      | Isa.t
+      | ParenExpr.t
+      | CallExpr.t
+      | GenericInstantiation.t
+      | ErrorOnNull.t
+      | LambdaExpr.t
+      | TryExpr.t
+      | RaiseExpr.t
+      | IfExpr.t
+      | BlockExpr.t
+      | MatchExpr.t
+      | BinOp.t
+      | Lit.t
+      | LogicExpr.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+let p_in_type_ref
+    (node)
+    =
+      let result_ptr =
+        allocate_n bool ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.expr_p_in_type_ref
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+let p_is_regular_expr
+    (node)
+    =
+      let result_ptr =
+        allocate_n bool ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.expr_p_is_regular_expr
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+let p_expr_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n SemanticResultStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.expr_p_expr_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      SemanticResult.wrap (context node) (!@ result_ptr)
+
+let p_check_expr_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.expr_p_check_expr_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+let p_expr_context_free_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.expr_p_expr_context_free_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+let p_referenced_decl
+    (node)
+    =
+      let result_ptr =
+        allocate_n SemanticResultStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.expr_p_referenced_decl
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      SemanticResult.wrap (context node) (!@ result_ptr)
+
+let p_check_referenced_decl
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.expr_p_check_referenced_decl
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (DeclType.wrap (context node) (!@ result_ptr))
+
+
+
+
+
+end
+
+module ExcludesNullPresent = struct
+  type t =
+    [
+      | `ExcludesNullPresent of
+          ExcludesNullPresentType.fields
+    ]
+
+  type fields = ExcludesNullPresentType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module ExcludesNullAbsent = struct
+  type t =
+    [
+      | `ExcludesNullAbsent of
+          ExcludesNullAbsentType.fields
+    ]
+
+  type fields = ExcludesNullAbsentType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module ExcludesNull = struct
+  type t =
+    [
+      | ExcludesNullPresent.t
+      | ExcludesNullAbsent.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+let p_as_bool
+    (node)
+    =
+      let result_ptr =
+        allocate_n bool ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.excludes_null_p_as_bool
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+
+
+
+
+end
+
+module EnumClassCase = struct
+  type t =
+    [
+      | `EnumClassCase of
+          EnumClassCaseType.fields
+    ]
+
+  type fields = EnumClassCaseType.fields =
+    
+  {
+         
+    f_decls: EnumClassAltDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_decls node =
+    match (node :> EnumClassCaseType.t) with
+    | `EnumClassCase fields ->
+        Lazy.force fields.f_decls
+
+
+
+end
+
+module ElsifBranch = struct
+  type t =
+    [
+      | `ElsifBranch of
+          ElsifBranchType.fields
+    ]
+
+  type fields = ElsifBranchType.fields =
+    
+  {
+         
+    f_cond_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_then_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_cond_expr node =
+    match (node :> ElsifBranchType.t) with
+    | `ElsifBranch fields ->
+        Lazy.force fields.f_cond_expr
+  let f_then_expr node =
+    match (node :> ElsifBranchType.t) with
+    | `ElsifBranch fields ->
+        Lazy.force fields.f_then_expr
+
+
+
+end
+
+module DocComment = struct
+  type t =
+    [
+      | `DocComment of
+          DocCommentType.fields
+    ]
+
+  type fields = DocCommentType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module Doc = struct
+  type t =
+    [
+      | `Doc of
+          DocType.fields
+    ]
+
+  type fields = DocType.fields =
+    
+  {
+         
+    f_lines: DocCommentListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_lines node =
+    match (node :> DocType.t) with
+    | `Doc fields ->
+        Lazy.force fields.f_lines
+
+
+
+end
+
+module DeclAnnotationParams = struct
+  type t =
+    [
+      | `DeclAnnotationParams of
+          DeclAnnotationParamsType.fields
+    ]
+
+  type fields = DeclAnnotationParamsType.fields =
+    
+  {
+         
+    f_params: ParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_params node =
+    match (node :> DeclAnnotationParamsType.t) with
+    | `DeclAnnotationParams fields ->
+        Lazy.force fields.f_params
+
+
+
+end
+
+module DeclAnnotation = struct
+  type t =
+    [
+      | `DeclAnnotation of
+          DeclAnnotationType.fields
+    ]
+
+  type fields = DeclAnnotationType.fields =
+    
+  {
+         
+    f_name: IdType.t
+    Lazy.t;
+         
+    f_params: DeclAnnotationParamsType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_name node =
+    match (node :> DeclAnnotationType.t) with
+    | `DeclAnnotation fields ->
+        Lazy.force fields.f_name
+  let f_params node =
+    match (node :> DeclAnnotationType.t) with
+    | `DeclAnnotation fields ->
+        Lazy.force fields.f_params
+
+
+
+end
+
+module TraitDecl = struct
+  type t =
+    [
+      | `TraitDecl of
+          TraitDeclType.fields
+    ]
+
+  type fields = TraitDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module StructDecl = struct
+  type t =
+    [
+      | `StructDecl of
+          StructDeclType.fields
+    ]
+
+  type fields = StructDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module EnumTypeDecl = struct
+  type t =
+    [
+      | `EnumTypeDecl of
+          EnumTypeDeclType.fields
+    ]
+
+  type fields = EnumTypeDeclType.fields =
+    
+  {
+         
+    f_literals: EnumLitDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_literals node =
+    match (node :> EnumTypeDeclType.t) with
+    | `EnumTypeDecl fields ->
+        Lazy.force fields.f_literals
+
+
+
+end
+
+module EnumClassDecl = struct
+  type t =
+    [
+      | `EnumClassDecl of
+          EnumClassDeclType.fields
+    ]
+
+  type fields = EnumClassDeclType.fields =
+    
+  {
+         
+    f_branches: EnumClassCaseListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_branches node =
+    match (node :> EnumClassDeclType.t) with
+    | `EnumClassDecl fields ->
+        Lazy.force fields.f_branches
+
+
+
+end
+
+module ClassDecl = struct
+  type t =
+    [
+      | `ClassDecl of
+          ClassDeclType.fields
+    ]
+
+  type fields = ClassDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module BasicClassDecl = struct
+  type t =
+    [
+      | ClassDecl.t
+      | EnumClassDecl.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module NamedTypeDecl = struct
+  type t =
+    [
+      | TraitDecl.t
+      | EnumTypeDecl.t
+      | StructDecl.t
+      | BasicClassDecl.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module InstantiatedGenericType = struct
+  type t =
+    [
+      | `InstantiatedGenericType of
+          InstantiatedGenericTypeType.fields
+    ]
+
+  type fields = InstantiatedGenericTypeType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+let p_get_inner_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.instantiated_generic_type_p_get_inner_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+let p_get_actuals
+    (node)
+    =
+      let result_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.instantiated_generic_type_p_get_actuals
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      TypeDeclArray.wrap (context node) (!@ result_ptr)
+
+let p_get_instantiated_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.instantiated_generic_type_p_get_instantiated_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+
+
+
+
+end
+
+module GenericFormalTypeDecl = struct
+  type t =
+    [
+      | `GenericFormalTypeDecl of
+          GenericFormalTypeDeclType.fields
+    ]
+
+  type fields = GenericFormalTypeDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module FunctionType = struct
+  type t =
+    [
+      | `FunctionType of
+          FunctionTypeType.fields
+    ]
+
+  type fields = FunctionTypeType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module EnumClassAltDecl = struct
+  type t =
+    [
+      | `EnumClassAltDecl of
+          EnumClassAltDeclType.fields
+    ]
+
+  type fields = EnumClassAltDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module TypeDecl = struct
+  type t =
+    [
+      | FunctionType.t
+      | GenericFormalTypeDecl.t
+      | NamedTypeDecl.t
+      | InstantiatedGenericType.t
+      | EnumClassAltDecl.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+let p_implemented_traits
+    (node)
+    =
+      let result_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.type_decl_p_implemented_traits
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      TypeDeclArray.wrap (context node) (!@ result_ptr)
+
+let p_base_types
+    (node)
+    =
+      let result_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.type_decl_p_base_types
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      TypeDeclArray.wrap (context node) (!@ result_ptr)
+
+let p_root_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.type_decl_p_root_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+let p_is_subtype
+    (node)
+    (potential_base)
+    =
+      let result_ptr =
+        allocate_n bool ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let c_potential_base =
+            
+        addr (LKNodeType.unwrap (potential_base))
+      in
+      let _ : int =
+        CFunctions.type_decl_p_is_subtype
+          (addr (LKNodeType.unwrap (node)))
+          c_potential_base
+          (result_ptr)
+      in
+         
+      !@ result_ptr
+
+let p_is_generic
+    (node)
+    =
+      let result_ptr =
+        allocate_n bool ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.type_decl_p_is_generic
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+
+
+
+
+end
+
+module LexerFamilyDecl = struct
+  type t =
+    [
+      | `LexerFamilyDecl of
+          LexerFamilyDeclType.fields
+    ]
+
+  type fields = LexerFamilyDeclType.fields =
+    
+  {
+         
+    f_rules: FullDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_rules node =
+    match (node :> LexerFamilyDeclType.t) with
+    | `LexerFamilyDecl fields ->
+        Lazy.force fields.f_rules
+
+
+
+end
+
+module LexerDecl = struct
+  type t =
+    [
+      | `LexerDecl of
+          LexerDeclType.fields
+    ]
+
+  type fields = LexerDeclType.fields =
+    
+  {
+         
+    f_rules: LKNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_rules node =
+    match (node :> LexerDeclType.t) with
+    | `LexerDecl fields ->
+        Lazy.force fields.f_rules
+
+
+
+end
+
+module GenericDecl = struct
+  type t =
+    [
+      | `GenericDecl of
+          GenericDeclType.fields
+    ]
+
+  type fields = GenericDeclType.fields =
+    
+  {
+         
+    f_generic_formal_decls: FullDeclListType.t
+    Lazy.t;
+         
+    f_decl: [
+      | `ClassDecl
+          of ClassDeclType.fields
+      | `EnumClassDecl
+          of EnumClassDeclType.fields
+      | `EnumTypeDecl
+          of EnumTypeDeclType.fields
+      | `FieldDecl
+          of FieldDeclType.fields
+      | `FunDecl
+          of FunDeclType.fields
+      | `GenericDecl
+          of fields
+      | `GrammarDecl
+          of GrammarDeclType.fields
+      | `GrammarRuleDecl
+          of GrammarRuleDeclType.fields
+      | `LexerDecl
+          of LexerDeclType.fields
+      | `StructDecl
+          of StructDeclType.fields
+      | `TraitDecl
+          of TraitDeclType.fields
+      | `ValDecl
+          of ValDeclType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_generic_formal_decls node =
+    match (node :> GenericDeclType.t) with
+    | `GenericDecl fields ->
+        Lazy.force fields.f_generic_formal_decls
+  let f_decl node =
+    match (node :> GenericDeclType.t) with
+    | `GenericDecl fields ->
+        Lazy.force fields.f_decl
+
+
+
+end
+
+module FunDecl = struct
+  type t =
+    [
+      | `FunDecl of
+          FunDeclType.fields
+    ]
+
+  type fields = FunDeclType.fields =
+    
+  {
+         
+    f_args: FunArgDeclListType.t
+    Lazy.t;
+         
+    f_return_type: TypeRefType.t
+    Lazy.t;
+         
+    f_body: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_args node =
+    match (node :> FunDeclType.t) with
+    | `FunDecl fields ->
+        Lazy.force fields.f_args
+  let f_return_type node =
+    match (node :> FunDeclType.t) with
+    | `FunDecl fields ->
+        Lazy.force fields.f_return_type
+  let f_body node =
+    match (node :> FunDeclType.t) with
+    | `FunDecl fields ->
+        Lazy.force fields.f_body
+
+
+
+end
+
+module ValDecl = struct
+  type t =
+    [
+      | `ValDecl of
+          ValDeclType.fields
+    ]
+
+  type fields = ValDeclType.fields =
+    
+  {
+         
+    f_val: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_val node =
+    match (node :> ValDeclType.t) with
+    | `ValDecl fields ->
+        Lazy.force fields.f_val
+
+
+
+end
+
+module MatchValDecl = struct
+  type t =
+    [
+      | `MatchValDecl of
+          MatchValDeclType.fields
+    ]
+
+  type fields = MatchValDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module LambdaArgDecl = struct
+  type t =
+    [
+      | `LambdaArgDecl of
+          LambdaArgDeclType.fields
+    ]
+
+  type fields = LambdaArgDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module FunArgDecl = struct
+  type t =
+    [
+      | `FunArgDecl of
+          FunArgDeclType.fields
+    ]
+
+  type fields = FunArgDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module FieldDecl = struct
+  type t =
+    [
+      | `FieldDecl of
+          FieldDeclType.fields
+    ]
+
+  type fields = FieldDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module ComponentDecl = struct
+  type t =
+    [
+      | FunArgDecl.t
+      | LambdaArgDecl.t
+      | FieldDecl.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module ExplicitlyTypedDecl = struct
+  type t =
+    [
+      | ComponentDecl.t
+      | MatchValDecl.t
+      | ValDecl.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module EnumLitDecl = struct
+  type t =
+    [
+      | `EnumLitDecl of
+          EnumLitDeclType.fields
+    ]
+
+  type fields = EnumLitDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module UserValDecl = struct
+  type t =
+    [
+      | FunDecl.t
+      | EnumLitDecl.t
+      | ExplicitlyTypedDecl.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module SelfDecl = struct
+  type t =
+    [
+      | `SelfDecl of
+          SelfDeclType.fields
+    ]
+
+  type fields = SelfDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module NodeDecl = struct
+  type t =
+    [
+      | `NodeDecl of
+          NodeDeclType.fields
+    ]
+
+  type fields = NodeDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module BaseValDecl = struct
+  type t =
+    [
+      | SelfDecl.t
+      | NodeDecl.t
+      | UserValDecl.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+let p_get_type
+    ?(no_inference=false)
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let c_no_inference =
+            
+        no_inference
+      in
+      let _ : int =
+        CFunctions.base_val_decl_p_get_type
+          (addr (LKNodeType.unwrap (node)))
+          c_no_inference
+          (result_ptr)
+      in
+         
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+
+
+
+
+end
+
+module SyntheticLexerDecl = struct
+  type t =
+    [
+      | `SyntheticLexerDecl of
+          SyntheticLexerDeclType.fields
+    ]
+
+  type fields = SyntheticLexerDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module GrammarRuleDecl = struct
+  type t =
+    [
+      | `GrammarRuleDecl of
+          GrammarRuleDeclType.fields
+    ]
+
+  type fields = GrammarRuleDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module BaseGrammarRuleDecl = struct
+  type t =
+    [
+      | GrammarRuleDecl.t
+      | SyntheticLexerDecl.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module GrammarDecl = struct
+  type t =
+    [
+      | `GrammarDecl of
+          GrammarDeclType.fields
+    ]
+
+  type fields = GrammarDeclType.fields =
+    
+  {
+         
+    f_rules: FullDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+let p_lexer
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.grammar_decl_p_lexer
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (DeclType.wrap (context node) (!@ result_ptr))
+
+
+  let f_rules node =
+    match (node :> GrammarDeclType.t) with
+    | `GrammarDecl fields ->
+        Lazy.force fields.f_rules
+
+
+
+end
+
+module BaseGrammarDecl = struct
+  type t =
+    [
+      | GrammarDecl.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module Decl = struct
+  type t =
+    [
+      | LexerDecl.t
+      | LexerFamilyDecl.t
+      | BaseGrammarDecl.t
+      | BaseGrammarRuleDecl.t
+      | TypeDecl.t
+      | GenericDecl.t
+      | BaseValDecl.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+let p_name
+    (node)
+    =
+      let result_ptr =
+        allocate_n Symbol.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.decl_p_name
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      Symbol.wrap (!@ result_ptr)
+
+
+
+
+
+end
+
+module LexerCaseRuleDefaultAlt = struct
+  type t =
+    [
+      | `LexerCaseRuleDefaultAlt of
+          LexerCaseRuleDefaultAltType.fields
+    ]
+
+  type fields = LexerCaseRuleDefaultAltType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module LexerCaseRuleCondAlt = struct
+  type t =
+    [
+      | `LexerCaseRuleCondAlt of
+          LexerCaseRuleCondAltType.fields
+    ]
+
+  type fields = LexerCaseRuleCondAltType.fields =
+    
+  {
+         
+    f_cond_exprs: RefIdListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+  let f_cond_exprs node =
+    match (node :> LexerCaseRuleCondAltType.t) with
+    | `LexerCaseRuleCondAlt fields ->
+        Lazy.force fields.f_cond_exprs
+
+
+
+end
+
+module BaseLexerCaseRuleAlt = struct
+  type t =
+    [
+      | LexerCaseRuleCondAlt.t
+      | LexerCaseRuleDefaultAlt.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+
+
+
+
+end
+
+module LKNode = struct
+  type t =
+    [
+      | LKNodeBaseList.t
+      | LangkitRoot.t
+      | Import.t
+      | FullDecl.t
+      | Decl.t
+      | Expr.t
+      | LexerCaseRule.t
+      | BaseLexerCaseRuleAlt.t
+      | LexerCaseRuleSend.t
+      | ListKind.t
+      | EnumClassCase.t
+      | DocComment.t
+      | Doc.t
+      | TypeRef.t
+      | ExcludesNull.t
+      | DeclAnnotation.t
+      | DeclAnnotationParams.t
+      | Param.t
+      | ElsifBranch.t
+      | MatchBranch.t
+      | Op.t
+      | VarBind.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (LKNodeType.unwrap ((node1 :> LKNodeType.t)))
+      (LKNodeType.unwrap ((node2 :> LKNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (LKNodeType.unwrap ((node :> LKNodeType.t)))
+
+let p_node_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_p_node_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+let p_char_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_p_char_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+let p_int_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_p_int_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+let p_bool_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_p_bool_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+let p_bigint_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_p_bigint_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+let p_string_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_p_string_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+let p_symbol_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_p_symbol_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+let p_regexp_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_p_regexp_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+let p_array_gen_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_p_array_gen_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+let p_astlist_gen_type
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_p_astlist_gen_type
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TypeDeclType.wrap (context node) (!@ result_ptr))
+
+let p_iterator_gen_trait
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_p_iterator_gen_trait
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (TraitDeclType.wrap (context node) (!@ result_ptr))
+
+let p_check_semantic
+    (node)
+    =
+      let result_ptr =
+        allocate_n TreeSemanticResultStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_p_check_semantic
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      TreeSemanticResult.wrap (context node) (!@ result_ptr)
+
+let parent
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_parent
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (LKNodeType.wrap (context node) (!@ result_ptr))
+
+let parents
+    (node)
+    =
+      let result_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_parents
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      LKNodeArray.wrap (context node) (!@ result_ptr)
+
+let children
+    (node)
+    =
+      let result_ptr =
+        allocate_n LKNodeArrayStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_children
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      LKNodeArray.wrap (context node) (!@ result_ptr)
+
+let token_start
+    (node)
+    =
+      let result_ptr =
+        allocate_n Token.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_token_start
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+let token_end
+    (node)
+    =
+      let result_ptr =
+        allocate_n Token.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_token_end
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+let child_index
+    (node)
+    =
+      let result_ptr =
+        allocate_n int ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_child_index
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+let previous_sibling
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_previous_sibling
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (LKNodeType.wrap (context node) (!@ result_ptr))
+
+let next_sibling
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_next_sibling
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (LKNodeType.wrap (context node) (!@ result_ptr))
+
+let unit
+    (node)
+    =
+      let result_ptr =
+        allocate_n AnalysisUnitStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_unit
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      AnalysisUnit.wrap (context node) (!@ result_ptr)
+
+let is_ghost
+    (node)
+    =
+      let result_ptr =
+        allocate_n bool ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_is_ghost
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+let full_sloc_image
+    (node)
+    =
+      let result_ptr =
+        allocate_n TextTypeStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.lk_node_full_sloc_image
+          (addr (LKNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      TextType.wrap (!@ result_ptr)
+
+
+
+
+
+  let kind_name = function
+    | #VarBindType.t ->
+        "VarBind"
+    | #SimpleTypeRefType.t ->
+        "SimpleTypeRef"
+    | #GenericTypeRefType.t ->
+        "GenericTypeRef"
+    | #FunctionTypeRefType.t ->
+        "FunctionTypeRef"
+    | #ParamType.t ->
+        "Param"
+    | #OpPlusType.t ->
+        "OpPlus"
+    | #OpOrType.t ->
+        "OpOr"
+    | #OpMultType.t ->
+        "OpMult"
+    | #OpMinusType.t ->
+        "OpMinus"
+    | #OpLteType.t ->
+        "OpLte"
+    | #OpLtType.t ->
+        "OpLt"
+    | #OpGteType.t ->
+        "OpGte"
+    | #OpGtType.t ->
+        "OpGt"
+    | #OpEqType.t ->
+        "OpEq"
+    | #OpDivType.t ->
+        "OpDiv"
+    | #OpAndType.t ->
+        "OpAnd"
+    | #OpAmpType.t ->
+        "OpAmp"
+    | #MatchBranchType.t ->
+        "MatchBranch"
+    | #ListKindZeroType.t ->
+        "ListKindZero"
+    | #ListKindOneType.t ->
+        "ListKindOne"
+    | #LexerCaseRuleSendType.t ->
+        "LexerCaseRuleSend"
+    | #LexerCaseRuleType.t ->
+        "LexerCaseRule"
+    | #LangkitRootType.t ->
+        "LangkitRoot"
+    | #TypeRefListType.t ->
+        "TypeRefList"
+    | #RefIdListType.t ->
+        "RefIdList"
+    | #ParamListType.t ->
+        "ParamList"
+    | #MatchBranchListType.t ->
+        "MatchBranchList"
+    | #LambdaArgDeclListType.t ->
+        "LambdaArgDeclList"
+    | #LKNodeListType.t ->
+        "LKNodeList"
+    | #ImportListType.t ->
+        "ImportList"
+    | #GrammarExprListListType.t ->
+        "GrammarExprListList"
+    | #GrammarExprListType.t ->
+        "GrammarExprList"
+    | #FunArgDeclListType.t ->
+        "FunArgDeclList"
+    | #DeclBlockType.t ->
+        "DeclBlock"
+    | #FullDeclListType.t ->
+        "FullDeclList"
+    | #ExprListType.t ->
+        "ExprList"
+    | #EnumLitDeclListType.t ->
+        "EnumLitDeclList"
+    | #EnumClassCaseListType.t ->
+        "EnumClassCaseList"
+    | #EnumClassAltDeclListType.t ->
+        "EnumClassAltDeclList"
+    | #ElsifBranchListType.t ->
+        "ElsifBranchList"
+    | #DocCommentListType.t ->
+        "DocCommentList"
+    | #DeclAnnotationListType.t ->
+        "DeclAnnotationList"
+    | #BaseLexerCaseRuleAltListType.t ->
+        "BaseLexerCaseRuleAltList"
+    | #ImportType.t ->
+        "Import"
+    | #FullDeclType.t ->
+        "FullDecl"
+    | #TryExprType.t ->
+        "TryExpr"
+    | #RaiseExprType.t ->
+        "RaiseExpr"
+    | #ParenExprType.t ->
+        "ParenExpr"
+    | #NotExprType.t ->
+        "NotExpr"
+    | #MatchExprType.t ->
+        "MatchExpr"
+    | #LogicExprType.t ->
+        "LogicExpr"
+    | #StringLitType.t ->
+        "StringLit"
+    | #NumLitType.t ->
+        "NumLit"
+    | #NullLitType.t ->
+        "NullLit"
+    | #CharLitType.t ->
+        "CharLit"
+    | #LambdaExprType.t ->
+        "LambdaExpr"
+    | #IsaType.t ->
+        "Isa"
+    | #IfExprType.t ->
+        "IfExpr"
+    | #ModuleRefIdType.t ->
+        "ModuleRefId"
+    | #RefIdType.t ->
+        "RefId"
+    | #DefIdType.t ->
+        "DefId"
+    | #IdType.t ->
+        "Id"
+    | #TokenRefType.t ->
+        "TokenRef"
+    | #TokenPatternLitType.t ->
+        "TokenPatternLit"
+    | #TokenNoCaseLitType.t ->
+        "TokenNoCaseLit"
+    | #TokenLitType.t ->
+        "TokenLit"
+    | #ParseNodeExprType.t ->
+        "ParseNodeExpr"
+    | #GrammarSkipType.t ->
+        "GrammarSkip"
+    | #GrammarRuleRefType.t ->
+        "GrammarRuleRef"
+    | #GrammarPredicateType.t ->
+        "GrammarPredicate"
+    | #GrammarImplicitPickType.t ->
+        "GrammarImplicitPick"
+    | #GrammarPickType.t ->
+        "GrammarPick"
+    | #GrammarOrExprType.t ->
+        "GrammarOrExpr"
+    | #GrammarOptGroupType.t ->
+        "GrammarOptGroup"
+    | #GrammarOptType.t ->
+        "GrammarOpt"
+    | #GrammarNullType.t ->
+        "GrammarNull"
+    | #GrammarListType.t ->
+        "GrammarList"
+    | #GrammarDontSkipType.t ->
+        "GrammarDontSkip"
+    | #GrammarDiscardType.t ->
+        "GrammarDiscard"
+    | #GrammarCutType.t ->
+        "GrammarCut"
+    | #GenericInstantiationType.t ->
+        "GenericInstantiation"
+    | #ErrorOnNullType.t ->
+        "ErrorOnNull"
+    | #NullCondDottedNameType.t ->
+        "NullCondDottedName"
+    | #DotExprType.t ->
+        "DotExpr"
+    | #CastExprType.t ->
+        "CastExpr"
+    | #NullCondCallExprType.t ->
+        "NullCondCallExpr"
+    | #CallExprType.t ->
+        "CallExpr"
+    | #BlockExprType.t ->
+        "BlockExpr"
+    | #BinOpType.t ->
+        "BinOp"
+    | #ArrayLiteralType.t ->
+        "ArrayLiteral"
+    | #ExcludesNullPresentType.t ->
+        "ExcludesNullPresent"
+    | #ExcludesNullAbsentType.t ->
+        "ExcludesNullAbsent"
+    | #EnumClassCaseType.t ->
+        "EnumClassCase"
+    | #ElsifBranchType.t ->
+        "ElsifBranch"
+    | #DocCommentType.t ->
+        "DocComment"
+    | #DocType.t ->
+        "Doc"
+    | #DeclAnnotationParamsType.t ->
+        "DeclAnnotationParams"
+    | #DeclAnnotationType.t ->
+        "DeclAnnotation"
+    | #TraitDeclType.t ->
+        "TraitDecl"
+    | #StructDeclType.t ->
+        "StructDecl"
+    | #EnumTypeDeclType.t ->
+        "EnumTypeDecl"
+    | #EnumClassDeclType.t ->
+        "EnumClassDecl"
+    | #ClassDeclType.t ->
+        "ClassDecl"
+    | #InstantiatedGenericTypeType.t ->
+        "InstantiatedGenericType"
+    | #GenericFormalTypeDeclType.t ->
+        "GenericFormalTypeDecl"
+    | #FunctionTypeType.t ->
+        "FunctionType"
+    | #EnumClassAltDeclType.t ->
+        "EnumClassAltDecl"
+    | #LexerFamilyDeclType.t ->
+        "LexerFamilyDecl"
+    | #LexerDeclType.t ->
+        "LexerDecl"
+    | #GenericDeclType.t ->
+        "GenericDecl"
+    | #FunDeclType.t ->
+        "FunDecl"
+    | #ValDeclType.t ->
+        "ValDecl"
+    | #MatchValDeclType.t ->
+        "MatchValDecl"
+    | #LambdaArgDeclType.t ->
+        "LambdaArgDecl"
+    | #FunArgDeclType.t ->
+        "FunArgDecl"
+    | #FieldDeclType.t ->
+        "FieldDecl"
+    | #EnumLitDeclType.t ->
+        "EnumLitDecl"
+    | #SelfDeclType.t ->
+        "SelfDecl"
+    | #NodeDeclType.t ->
+        "NodeDecl"
+    | #SyntheticLexerDeclType.t ->
+        "SyntheticLexerDecl"
+    | #GrammarRuleDeclType.t ->
+        "GrammarRuleDecl"
+    | #GrammarDeclType.t ->
+        "GrammarDecl"
+    | #LexerCaseRuleDefaultAltType.t ->
+        "LexerCaseRuleDefaultAlt"
+    | #LexerCaseRuleCondAltType.t ->
+        "LexerCaseRuleCondAlt"
+
+  let text node =
+    Token.text_range (token_start node) (token_end node)
+
+  let image node =
+    let c_result_ptr = allocate_n Text.c_type ~count:1 in
+    CFunctions.image
+      (addr (LKNodeType.unwrap (node)))
+      c_result_ptr;
+    !@ c_result_ptr
+
+  let entity_image node =
+    let c_result_ptr = allocate_n Text.c_type ~count:1 in
+    let node_c_value = LKNodeType.unwrap (node) in
+    CFunctions.entity_image (addr node_c_value) c_result_ptr;
+    !@ c_result_ptr
+
+  let is_token_node node =
+    let node_c_value = LKNodeType.unwrap (node) in
+    CFunctions.node_is_token_node (addr node_c_value)
+
+  let sloc_range node =
+    let c_result_ptr = allocate_n SlocRange.c_type ~count:1 in
+    CFunctions.node_sloc_range
+      (addr (LKNodeType.unwrap (node)))
+      c_result_ptr;
+    !@ c_result_ptr
+
+  
+  let fold_tokens f init node =
+    let tok_start = token_start node in
+    let tok_end = token_end node in
+    let rec aux acc tok_curr =
+      let new_acc = f acc tok_curr in
+      if Token.equal tok_curr tok_end then
+        new_acc
+      else
+        aux new_acc (Token.next tok_curr)
+    in
+    aux init tok_start
+
+  let iter_tokens f node =
+    let tok_start = token_start node in
+    let tok_end = token_end node in
+    let rec aux tok_curr =
+      f tok_curr;
+      if not (Token.equal tok_curr tok_end) then
+        aux (Token.next tok_curr)
+    in
+    aux tok_start
+
+  let map_tokens f node =
+    let tok_start = token_start node in
+    let tok_end = token_end node in
+    let rec aux tok_curr =
+      let value = f tok_curr in
+      if Token.equal tok_curr tok_end then
+        [value]
+      else
+        value :: aux (Token.next tok_curr)
+    in
+    aux tok_start
+
+  let tokens node =
+    map_tokens (fun x -> x) node
+
+
+  let lookup node sloc =
+    let node_c_value = LKNodeType.unwrap (node) in
+    let sloc_ptr = allocate Sloc.c_type sloc in
+    let result_ptr = allocate_n EntityStruct.c_type ~count:1 in
+    CFunctions.lookup_in_node
+      (addr node_c_value) sloc_ptr result_ptr;
+    if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (LKNodeType.wrap (context node) (!@ result_ptr))
+
+  let children_opt node =
+    let node_c_value = LKNodeType.unwrap (node) in
+    let context = context node in
+    let c_value_ptr = allocate_n LKNodeArrayStruct.c_type ~count:1 in
+    let _ : int =
+      CFunctions.lkt_node_children
+        (addr node_c_value)
+        (c_value_ptr)
+    in
+    let c_value = !@(!@(c_value_ptr)) in
+    let length = getf c_value LKNodeArrayStruct.n in
+    let items = c_value @. LKNodeArrayStruct.items in
+    let f i =
+      let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+      if is_null (getf !@ fresh EntityStruct.node) then None else Some (LKNodeType.wrap context (!@ fresh))
+    in
+    let result = List.init length f in
+    LKNodeArrayStruct.dec_ref (!@ c_value_ptr);
+    result
+
+  let iter_fields f node =
+    children_opt (node :> LKNodeType.t)
+    |> List.iter (function None -> () | Some node -> f node)
+
+  let fold_fields f acc node =
+    children_opt (node :> LKNodeType.t)
+    |> List.fold_left (fun x -> function None -> x | Some node -> f x node) acc
+
+  let exists_fields p node =
+    children_opt (node :> LKNodeType.t)
+    |> List.exists (function | None -> false | Some node -> p node)
+
+  let for_all_fields p node =
+    children_opt (node :> LKNodeType.t)
+    |> List.for_all (function | None -> true | Some node -> p node)
+
+  let fold f acc node =
+    (* Use an auxiliary function here to have a better type for the function *)
+    let rec aux acc node = fold_fields aux (f acc node) node in
+    aux acc (node :> LKNodeType.t)
+
+  let iter f node =
+    (* Use an auxiliary function here to have a better type for the function *)
+    let rec aux node = f node; iter_fields aux node in
+    aux (node :> LKNodeType.t)
+
+  let filter p node =
+    fold (fun acc node -> if p node then node :: acc else acc) [] node
+    |> List.rev
+
+  let exists p node =
+    (* Use an auxiliary function here to have a better type for the function *)
+    let rec aux node =
+      p node || exists_fields aux node in aux (node :> LKNodeType.t)
+
+  let for_all p node =
+    (* Use an auxiliary function here to have a better type for the function *)
+    let rec aux node = p node && for_all_fields aux node in
+    aux (node :> LKNodeType.t)
+
+  let lookup_with_kind :
+    type a. a node -> [< LKNodeType.t] -> Sloc.t -> a option =
+    fun node_type node sloc ->
+      let lookup_res = lookup node sloc in
+      let rec aux : a node -> [< LKNodeType.t] -> a option =
+        fun node_type node ->
+        match node_type, node with
+        | LKNode
+          , (#LKNodeType.t as node) ->
+          Some node
+        | BaseLexerCaseRuleAlt
+          , (#BaseLexerCaseRuleAltType.t as node) ->
+          Some node
+        | LexerCaseRuleCondAlt
+          , (#LexerCaseRuleCondAltType.t as node) ->
+          Some node
+        | LexerCaseRuleDefaultAlt
+          , (#LexerCaseRuleDefaultAltType.t as node) ->
+          Some node
+        | Decl
+          , (#DeclType.t as node) ->
+          Some node
+        | BaseGrammarDecl
+          , (#BaseGrammarDeclType.t as node) ->
+          Some node
+        | GrammarDecl
+          , (#GrammarDeclType.t as node) ->
+          Some node
+        | BaseGrammarRuleDecl
+          , (#BaseGrammarRuleDeclType.t as node) ->
+          Some node
+        | GrammarRuleDecl
+          , (#GrammarRuleDeclType.t as node) ->
+          Some node
+        | SyntheticLexerDecl
+          , (#SyntheticLexerDeclType.t as node) ->
+          Some node
+        | BaseValDecl
+          , (#BaseValDeclType.t as node) ->
+          Some node
+        | NodeDecl
+          , (#NodeDeclType.t as node) ->
+          Some node
+        | SelfDecl
+          , (#SelfDeclType.t as node) ->
+          Some node
+        | UserValDecl
+          , (#UserValDeclType.t as node) ->
+          Some node
+        | EnumLitDecl
+          , (#EnumLitDeclType.t as node) ->
+          Some node
+        | ExplicitlyTypedDecl
+          , (#ExplicitlyTypedDeclType.t as node) ->
+          Some node
+        | ComponentDecl
+          , (#ComponentDeclType.t as node) ->
+          Some node
+        | FieldDecl
+          , (#FieldDeclType.t as node) ->
+          Some node
+        | FunArgDecl
+          , (#FunArgDeclType.t as node) ->
+          Some node
+        | LambdaArgDecl
+          , (#LambdaArgDeclType.t as node) ->
+          Some node
+        | MatchValDecl
+          , (#MatchValDeclType.t as node) ->
+          Some node
+        | ValDecl
+          , (#ValDeclType.t as node) ->
+          Some node
+        | FunDecl
+          , (#FunDeclType.t as node) ->
+          Some node
+        | GenericDecl
+          , (#GenericDeclType.t as node) ->
+          Some node
+        | LexerDecl
+          , (#LexerDeclType.t as node) ->
+          Some node
+        | LexerFamilyDecl
+          , (#LexerFamilyDeclType.t as node) ->
+          Some node
+        | TypeDecl
+          , (#TypeDeclType.t as node) ->
+          Some node
+        | EnumClassAltDecl
+          , (#EnumClassAltDeclType.t as node) ->
+          Some node
+        | FunctionType
+          , (#FunctionTypeType.t as node) ->
+          Some node
+        | GenericFormalTypeDecl
+          , (#GenericFormalTypeDeclType.t as node) ->
+          Some node
+        | InstantiatedGenericType
+          , (#InstantiatedGenericTypeType.t as node) ->
+          Some node
+        | NamedTypeDecl
+          , (#NamedTypeDeclType.t as node) ->
+          Some node
+        | BasicClassDecl
+          , (#BasicClassDeclType.t as node) ->
+          Some node
+        | ClassDecl
+          , (#ClassDeclType.t as node) ->
+          Some node
+        | EnumClassDecl
+          , (#EnumClassDeclType.t as node) ->
+          Some node
+        | EnumTypeDecl
+          , (#EnumTypeDeclType.t as node) ->
+          Some node
+        | StructDecl
+          , (#StructDeclType.t as node) ->
+          Some node
+        | TraitDecl
+          , (#TraitDeclType.t as node) ->
+          Some node
+        | DeclAnnotation
+          , (#DeclAnnotationType.t as node) ->
+          Some node
+        | DeclAnnotationParams
+          , (#DeclAnnotationParamsType.t as node) ->
+          Some node
+        | Doc
+          , (#DocType.t as node) ->
+          Some node
+        | DocComment
+          , (#DocCommentType.t as node) ->
+          Some node
+        | ElsifBranch
+          , (#ElsifBranchType.t as node) ->
+          Some node
+        | EnumClassCase
+          , (#EnumClassCaseType.t as node) ->
+          Some node
+        | ExcludesNull
+          , (#ExcludesNullType.t as node) ->
+          Some node
+        | ExcludesNullAbsent
+          , (#ExcludesNullAbsentType.t as node) ->
+          Some node
+        | ExcludesNullPresent
+          , (#ExcludesNullPresentType.t as node) ->
+          Some node
+        | Expr
+          , (#ExprType.t as node) ->
+          Some node
+        | ArrayLiteral
+          , (#ArrayLiteralType.t as node) ->
+          Some node
+        | BinOp
+          , (#BinOpType.t as node) ->
+          Some node
+        | BlockExpr
+          , (#BlockExprType.t as node) ->
+          Some node
+        | CallExpr
+          , (#CallExprType.t as node) ->
+          Some node
+        | NullCondCallExpr
+          , (#NullCondCallExprType.t as node) ->
+          Some node
+        | CastExpr
+          , (#CastExprType.t as node) ->
+          Some node
+        | DotExpr
+          , (#DotExprType.t as node) ->
+          Some node
+        | NullCondDottedName
+          , (#NullCondDottedNameType.t as node) ->
+          Some node
+        | ErrorOnNull
+          , (#ErrorOnNullType.t as node) ->
+          Some node
+        | GenericInstantiation
+          , (#GenericInstantiationType.t as node) ->
+          Some node
+        | GrammarExpr
+          , (#GrammarExprType.t as node) ->
+          Some node
+        | GrammarCut
+          , (#GrammarCutType.t as node) ->
+          Some node
+        | GrammarDiscard
+          , (#GrammarDiscardType.t as node) ->
+          Some node
+        | GrammarDontSkip
+          , (#GrammarDontSkipType.t as node) ->
+          Some node
+        | GrammarList
+          , (#GrammarListType.t as node) ->
+          Some node
+        | GrammarNull
+          , (#GrammarNullType.t as node) ->
+          Some node
+        | GrammarOpt
+          , (#GrammarOptType.t as node) ->
+          Some node
+        | GrammarOptGroup
+          , (#GrammarOptGroupType.t as node) ->
+          Some node
+        | GrammarOrExpr
+          , (#GrammarOrExprType.t as node) ->
+          Some node
+        | GrammarPick
+          , (#GrammarPickType.t as node) ->
+          Some node
+        | GrammarImplicitPick
+          , (#GrammarImplicitPickType.t as node) ->
+          Some node
+        | GrammarPredicate
+          , (#GrammarPredicateType.t as node) ->
+          Some node
+        | GrammarRuleRef
+          , (#GrammarRuleRefType.t as node) ->
+          Some node
+        | GrammarSkip
+          , (#GrammarSkipType.t as node) ->
+          Some node
+        | ParseNodeExpr
+          , (#ParseNodeExprType.t as node) ->
+          Some node
+        | TokenLit
+          , (#TokenLitType.t as node) ->
+          Some node
+        | TokenNoCaseLit
+          , (#TokenNoCaseLitType.t as node) ->
+          Some node
+        | TokenPatternLit
+          , (#TokenPatternLitType.t as node) ->
+          Some node
+        | TokenRef
+          , (#TokenRefType.t as node) ->
+          Some node
+        | Id
+          , (#IdType.t as node) ->
+          Some node
+        | DefId
+          , (#DefIdType.t as node) ->
+          Some node
+        | RefId
+          , (#RefIdType.t as node) ->
+          Some node
+        | ModuleRefId
+          , (#ModuleRefIdType.t as node) ->
+          Some node
+        | IfExpr
+          , (#IfExprType.t as node) ->
+          Some node
+        | Isa
+          , (#IsaType.t as node) ->
+          Some node
+        | LambdaExpr
+          , (#LambdaExprType.t as node) ->
+          Some node
+        | Lit
+          , (#LitType.t as node) ->
+          Some node
+        | CharLit
+          , (#CharLitType.t as node) ->
+          Some node
+        | NullLit
+          , (#NullLitType.t as node) ->
+          Some node
+        | NumLit
+          , (#NumLitType.t as node) ->
+          Some node
+        | StringLit
+          , (#StringLitType.t as node) ->
+          Some node
+        | LogicExpr
+          , (#LogicExprType.t as node) ->
+          Some node
+        | MatchExpr
+          , (#MatchExprType.t as node) ->
+          Some node
+        | NotExpr
+          , (#NotExprType.t as node) ->
+          Some node
+        | ParenExpr
+          , (#ParenExprType.t as node) ->
+          Some node
+        | RaiseExpr
+          , (#RaiseExprType.t as node) ->
+          Some node
+        | TryExpr
+          , (#TryExprType.t as node) ->
+          Some node
+        | FullDecl
+          , (#FullDeclType.t as node) ->
+          Some node
+        | Import
+          , (#ImportType.t as node) ->
+          Some node
+        | LKNodeBaseList
+          , (#LKNodeBaseListType.t as node) ->
+          Some node
+        | BaseLexerCaseRuleAltList
+          , (#BaseLexerCaseRuleAltListType.t as node) ->
+          Some node
+        | DeclAnnotationList
+          , (#DeclAnnotationListType.t as node) ->
+          Some node
+        | DocCommentList
+          , (#DocCommentListType.t as node) ->
+          Some node
+        | ElsifBranchList
+          , (#ElsifBranchListType.t as node) ->
+          Some node
+        | EnumClassAltDeclList
+          , (#EnumClassAltDeclListType.t as node) ->
+          Some node
+        | EnumClassCaseList
+          , (#EnumClassCaseListType.t as node) ->
+          Some node
+        | EnumLitDeclList
+          , (#EnumLitDeclListType.t as node) ->
+          Some node
+        | ExprList
+          , (#ExprListType.t as node) ->
+          Some node
+        | FullDeclList
+          , (#FullDeclListType.t as node) ->
+          Some node
+        | DeclBlock
+          , (#DeclBlockType.t as node) ->
+          Some node
+        | FunArgDeclList
+          , (#FunArgDeclListType.t as node) ->
+          Some node
+        | GrammarExprList
+          , (#GrammarExprListType.t as node) ->
+          Some node
+        | GrammarExprListList
+          , (#GrammarExprListListType.t as node) ->
+          Some node
+        | ImportList
+          , (#ImportListType.t as node) ->
+          Some node
+        | LKNodeList
+          , (#LKNodeListType.t as node) ->
+          Some node
+        | LambdaArgDeclList
+          , (#LambdaArgDeclListType.t as node) ->
+          Some node
+        | MatchBranchList
+          , (#MatchBranchListType.t as node) ->
+          Some node
+        | ParamList
+          , (#ParamListType.t as node) ->
+          Some node
+        | RefIdList
+          , (#RefIdListType.t as node) ->
+          Some node
+        | TypeRefList
+          , (#TypeRefListType.t as node) ->
+          Some node
+        | LangkitRoot
+          , (#LangkitRootType.t as node) ->
+          Some node
+        | LexerCaseRule
+          , (#LexerCaseRuleType.t as node) ->
+          Some node
+        | LexerCaseRuleSend
+          , (#LexerCaseRuleSendType.t as node) ->
+          Some node
+        | ListKind
+          , (#ListKindType.t as node) ->
+          Some node
+        | ListKindOne
+          , (#ListKindOneType.t as node) ->
+          Some node
+        | ListKindZero
+          , (#ListKindZeroType.t as node) ->
+          Some node
+        | MatchBranch
+          , (#MatchBranchType.t as node) ->
+          Some node
+        | Op
+          , (#OpType.t as node) ->
+          Some node
+        | OpAmp
+          , (#OpAmpType.t as node) ->
+          Some node
+        | OpAnd
+          , (#OpAndType.t as node) ->
+          Some node
+        | OpDiv
+          , (#OpDivType.t as node) ->
+          Some node
+        | OpEq
+          , (#OpEqType.t as node) ->
+          Some node
+        | OpGt
+          , (#OpGtType.t as node) ->
+          Some node
+        | OpGte
+          , (#OpGteType.t as node) ->
+          Some node
+        | OpLt
+          , (#OpLtType.t as node) ->
+          Some node
+        | OpLte
+          , (#OpLteType.t as node) ->
+          Some node
+        | OpMinus
+          , (#OpMinusType.t as node) ->
+          Some node
+        | OpMult
+          , (#OpMultType.t as node) ->
+          Some node
+        | OpOr
+          , (#OpOrType.t as node) ->
+          Some node
+        | OpPlus
+          , (#OpPlusType.t as node) ->
+          Some node
+        | Param
+          , (#ParamType.t as node) ->
+          Some node
+        | TypeRef
+          , (#TypeRefType.t as node) ->
+          Some node
+        | FunctionTypeRef
+          , (#FunctionTypeRefType.t as node) ->
+          Some node
+        | GenericTypeRef
+          , (#GenericTypeRefType.t as node) ->
+          Some node
+        | SimpleTypeRef
+          , (#SimpleTypeRefType.t as node) ->
+          Some node
+        | VarBind
+          , (#VarBindType.t as node) ->
+          Some node
+        | _ -> (match parent node with
+                | Some parent_node -> aux node_type parent_node
+                | _ -> None) in
+    match lookup_res with
+      | Some node -> aux node_type node
+      | _ -> None
+
+  let as_a : type a. a node -> [< LKNodeType.t ] -> a option =
+   fun node_type node ->
+    match node_type, (node :> LKNodeType.t) with
+    | LKNode
+      , (#LKNodeType.t as node) ->
+        Some node
+    | BaseLexerCaseRuleAlt
+      , (#BaseLexerCaseRuleAltType.t as node) ->
+        Some node
+    | LexerCaseRuleCondAlt
+      , (#LexerCaseRuleCondAltType.t as node) ->
+        Some node
+    | LexerCaseRuleDefaultAlt
+      , (#LexerCaseRuleDefaultAltType.t as node) ->
+        Some node
+    | Decl
+      , (#DeclType.t as node) ->
+        Some node
+    | BaseGrammarDecl
+      , (#BaseGrammarDeclType.t as node) ->
+        Some node
+    | GrammarDecl
+      , (#GrammarDeclType.t as node) ->
+        Some node
+    | BaseGrammarRuleDecl
+      , (#BaseGrammarRuleDeclType.t as node) ->
+        Some node
+    | GrammarRuleDecl
+      , (#GrammarRuleDeclType.t as node) ->
+        Some node
+    | SyntheticLexerDecl
+      , (#SyntheticLexerDeclType.t as node) ->
+        Some node
+    | BaseValDecl
+      , (#BaseValDeclType.t as node) ->
+        Some node
+    | NodeDecl
+      , (#NodeDeclType.t as node) ->
+        Some node
+    | SelfDecl
+      , (#SelfDeclType.t as node) ->
+        Some node
+    | UserValDecl
+      , (#UserValDeclType.t as node) ->
+        Some node
+    | EnumLitDecl
+      , (#EnumLitDeclType.t as node) ->
+        Some node
+    | ExplicitlyTypedDecl
+      , (#ExplicitlyTypedDeclType.t as node) ->
+        Some node
+    | ComponentDecl
+      , (#ComponentDeclType.t as node) ->
+        Some node
+    | FieldDecl
+      , (#FieldDeclType.t as node) ->
+        Some node
+    | FunArgDecl
+      , (#FunArgDeclType.t as node) ->
+        Some node
+    | LambdaArgDecl
+      , (#LambdaArgDeclType.t as node) ->
+        Some node
+    | MatchValDecl
+      , (#MatchValDeclType.t as node) ->
+        Some node
+    | ValDecl
+      , (#ValDeclType.t as node) ->
+        Some node
+    | FunDecl
+      , (#FunDeclType.t as node) ->
+        Some node
+    | GenericDecl
+      , (#GenericDeclType.t as node) ->
+        Some node
+    | LexerDecl
+      , (#LexerDeclType.t as node) ->
+        Some node
+    | LexerFamilyDecl
+      , (#LexerFamilyDeclType.t as node) ->
+        Some node
+    | TypeDecl
+      , (#TypeDeclType.t as node) ->
+        Some node
+    | EnumClassAltDecl
+      , (#EnumClassAltDeclType.t as node) ->
+        Some node
+    | FunctionType
+      , (#FunctionTypeType.t as node) ->
+        Some node
+    | GenericFormalTypeDecl
+      , (#GenericFormalTypeDeclType.t as node) ->
+        Some node
+    | InstantiatedGenericType
+      , (#InstantiatedGenericTypeType.t as node) ->
+        Some node
+    | NamedTypeDecl
+      , (#NamedTypeDeclType.t as node) ->
+        Some node
+    | BasicClassDecl
+      , (#BasicClassDeclType.t as node) ->
+        Some node
+    | ClassDecl
+      , (#ClassDeclType.t as node) ->
+        Some node
+    | EnumClassDecl
+      , (#EnumClassDeclType.t as node) ->
+        Some node
+    | EnumTypeDecl
+      , (#EnumTypeDeclType.t as node) ->
+        Some node
+    | StructDecl
+      , (#StructDeclType.t as node) ->
+        Some node
+    | TraitDecl
+      , (#TraitDeclType.t as node) ->
+        Some node
+    | DeclAnnotation
+      , (#DeclAnnotationType.t as node) ->
+        Some node
+    | DeclAnnotationParams
+      , (#DeclAnnotationParamsType.t as node) ->
+        Some node
+    | Doc
+      , (#DocType.t as node) ->
+        Some node
+    | DocComment
+      , (#DocCommentType.t as node) ->
+        Some node
+    | ElsifBranch
+      , (#ElsifBranchType.t as node) ->
+        Some node
+    | EnumClassCase
+      , (#EnumClassCaseType.t as node) ->
+        Some node
+    | ExcludesNull
+      , (#ExcludesNullType.t as node) ->
+        Some node
+    | ExcludesNullAbsent
+      , (#ExcludesNullAbsentType.t as node) ->
+        Some node
+    | ExcludesNullPresent
+      , (#ExcludesNullPresentType.t as node) ->
+        Some node
+    | Expr
+      , (#ExprType.t as node) ->
+        Some node
+    | ArrayLiteral
+      , (#ArrayLiteralType.t as node) ->
+        Some node
+    | BinOp
+      , (#BinOpType.t as node) ->
+        Some node
+    | BlockExpr
+      , (#BlockExprType.t as node) ->
+        Some node
+    | CallExpr
+      , (#CallExprType.t as node) ->
+        Some node
+    | NullCondCallExpr
+      , (#NullCondCallExprType.t as node) ->
+        Some node
+    | CastExpr
+      , (#CastExprType.t as node) ->
+        Some node
+    | DotExpr
+      , (#DotExprType.t as node) ->
+        Some node
+    | NullCondDottedName
+      , (#NullCondDottedNameType.t as node) ->
+        Some node
+    | ErrorOnNull
+      , (#ErrorOnNullType.t as node) ->
+        Some node
+    | GenericInstantiation
+      , (#GenericInstantiationType.t as node) ->
+        Some node
+    | GrammarExpr
+      , (#GrammarExprType.t as node) ->
+        Some node
+    | GrammarCut
+      , (#GrammarCutType.t as node) ->
+        Some node
+    | GrammarDiscard
+      , (#GrammarDiscardType.t as node) ->
+        Some node
+    | GrammarDontSkip
+      , (#GrammarDontSkipType.t as node) ->
+        Some node
+    | GrammarList
+      , (#GrammarListType.t as node) ->
+        Some node
+    | GrammarNull
+      , (#GrammarNullType.t as node) ->
+        Some node
+    | GrammarOpt
+      , (#GrammarOptType.t as node) ->
+        Some node
+    | GrammarOptGroup
+      , (#GrammarOptGroupType.t as node) ->
+        Some node
+    | GrammarOrExpr
+      , (#GrammarOrExprType.t as node) ->
+        Some node
+    | GrammarPick
+      , (#GrammarPickType.t as node) ->
+        Some node
+    | GrammarImplicitPick
+      , (#GrammarImplicitPickType.t as node) ->
+        Some node
+    | GrammarPredicate
+      , (#GrammarPredicateType.t as node) ->
+        Some node
+    | GrammarRuleRef
+      , (#GrammarRuleRefType.t as node) ->
+        Some node
+    | GrammarSkip
+      , (#GrammarSkipType.t as node) ->
+        Some node
+    | ParseNodeExpr
+      , (#ParseNodeExprType.t as node) ->
+        Some node
+    | TokenLit
+      , (#TokenLitType.t as node) ->
+        Some node
+    | TokenNoCaseLit
+      , (#TokenNoCaseLitType.t as node) ->
+        Some node
+    | TokenPatternLit
+      , (#TokenPatternLitType.t as node) ->
+        Some node
+    | TokenRef
+      , (#TokenRefType.t as node) ->
+        Some node
+    | Id
+      , (#IdType.t as node) ->
+        Some node
+    | DefId
+      , (#DefIdType.t as node) ->
+        Some node
+    | RefId
+      , (#RefIdType.t as node) ->
+        Some node
+    | ModuleRefId
+      , (#ModuleRefIdType.t as node) ->
+        Some node
+    | IfExpr
+      , (#IfExprType.t as node) ->
+        Some node
+    | Isa
+      , (#IsaType.t as node) ->
+        Some node
+    | LambdaExpr
+      , (#LambdaExprType.t as node) ->
+        Some node
+    | Lit
+      , (#LitType.t as node) ->
+        Some node
+    | CharLit
+      , (#CharLitType.t as node) ->
+        Some node
+    | NullLit
+      , (#NullLitType.t as node) ->
+        Some node
+    | NumLit
+      , (#NumLitType.t as node) ->
+        Some node
+    | StringLit
+      , (#StringLitType.t as node) ->
+        Some node
+    | LogicExpr
+      , (#LogicExprType.t as node) ->
+        Some node
+    | MatchExpr
+      , (#MatchExprType.t as node) ->
+        Some node
+    | NotExpr
+      , (#NotExprType.t as node) ->
+        Some node
+    | ParenExpr
+      , (#ParenExprType.t as node) ->
+        Some node
+    | RaiseExpr
+      , (#RaiseExprType.t as node) ->
+        Some node
+    | TryExpr
+      , (#TryExprType.t as node) ->
+        Some node
+    | FullDecl
+      , (#FullDeclType.t as node) ->
+        Some node
+    | Import
+      , (#ImportType.t as node) ->
+        Some node
+    | LKNodeBaseList
+      , (#LKNodeBaseListType.t as node) ->
+        Some node
+    | BaseLexerCaseRuleAltList
+      , (#BaseLexerCaseRuleAltListType.t as node) ->
+        Some node
+    | DeclAnnotationList
+      , (#DeclAnnotationListType.t as node) ->
+        Some node
+    | DocCommentList
+      , (#DocCommentListType.t as node) ->
+        Some node
+    | ElsifBranchList
+      , (#ElsifBranchListType.t as node) ->
+        Some node
+    | EnumClassAltDeclList
+      , (#EnumClassAltDeclListType.t as node) ->
+        Some node
+    | EnumClassCaseList
+      , (#EnumClassCaseListType.t as node) ->
+        Some node
+    | EnumLitDeclList
+      , (#EnumLitDeclListType.t as node) ->
+        Some node
+    | ExprList
+      , (#ExprListType.t as node) ->
+        Some node
+    | FullDeclList
+      , (#FullDeclListType.t as node) ->
+        Some node
+    | DeclBlock
+      , (#DeclBlockType.t as node) ->
+        Some node
+    | FunArgDeclList
+      , (#FunArgDeclListType.t as node) ->
+        Some node
+    | GrammarExprList
+      , (#GrammarExprListType.t as node) ->
+        Some node
+    | GrammarExprListList
+      , (#GrammarExprListListType.t as node) ->
+        Some node
+    | ImportList
+      , (#ImportListType.t as node) ->
+        Some node
+    | LKNodeList
+      , (#LKNodeListType.t as node) ->
+        Some node
+    | LambdaArgDeclList
+      , (#LambdaArgDeclListType.t as node) ->
+        Some node
+    | MatchBranchList
+      , (#MatchBranchListType.t as node) ->
+        Some node
+    | ParamList
+      , (#ParamListType.t as node) ->
+        Some node
+    | RefIdList
+      , (#RefIdListType.t as node) ->
+        Some node
+    | TypeRefList
+      , (#TypeRefListType.t as node) ->
+        Some node
+    | LangkitRoot
+      , (#LangkitRootType.t as node) ->
+        Some node
+    | LexerCaseRule
+      , (#LexerCaseRuleType.t as node) ->
+        Some node
+    | LexerCaseRuleSend
+      , (#LexerCaseRuleSendType.t as node) ->
+        Some node
+    | ListKind
+      , (#ListKindType.t as node) ->
+        Some node
+    | ListKindOne
+      , (#ListKindOneType.t as node) ->
+        Some node
+    | ListKindZero
+      , (#ListKindZeroType.t as node) ->
+        Some node
+    | MatchBranch
+      , (#MatchBranchType.t as node) ->
+        Some node
+    | Op
+      , (#OpType.t as node) ->
+        Some node
+    | OpAmp
+      , (#OpAmpType.t as node) ->
+        Some node
+    | OpAnd
+      , (#OpAndType.t as node) ->
+        Some node
+    | OpDiv
+      , (#OpDivType.t as node) ->
+        Some node
+    | OpEq
+      , (#OpEqType.t as node) ->
+        Some node
+    | OpGt
+      , (#OpGtType.t as node) ->
+        Some node
+    | OpGte
+      , (#OpGteType.t as node) ->
+        Some node
+    | OpLt
+      , (#OpLtType.t as node) ->
+        Some node
+    | OpLte
+      , (#OpLteType.t as node) ->
+        Some node
+    | OpMinus
+      , (#OpMinusType.t as node) ->
+        Some node
+    | OpMult
+      , (#OpMultType.t as node) ->
+        Some node
+    | OpOr
+      , (#OpOrType.t as node) ->
+        Some node
+    | OpPlus
+      , (#OpPlusType.t as node) ->
+        Some node
+    | Param
+      , (#ParamType.t as node) ->
+        Some node
+    | TypeRef
+      , (#TypeRefType.t as node) ->
+        Some node
+    | FunctionTypeRef
+      , (#FunctionTypeRefType.t as node) ->
+        Some node
+    | GenericTypeRef
+      , (#GenericTypeRefType.t as node) ->
+        Some node
+    | SimpleTypeRef
+      , (#SimpleTypeRefType.t as node) ->
+        Some node
+    | VarBind
+      , (#VarBindType.t as node) ->
+        Some node
+    | _ ->
+        None
+
+  let find : type a. a node ->  [< LKNodeType.t ] -> a =
+    fun node_type node ->
+      let exception Found of a in
+      let aux node =
+        match node_type, node with
+        | LKNode
+          , (#LKNodeType.t as node) ->
+            raise (Found node)
+        | BaseLexerCaseRuleAlt
+          , (#BaseLexerCaseRuleAltType.t as node) ->
+            raise (Found node)
+        | LexerCaseRuleCondAlt
+          , (#LexerCaseRuleCondAltType.t as node) ->
+            raise (Found node)
+        | LexerCaseRuleDefaultAlt
+          , (#LexerCaseRuleDefaultAltType.t as node) ->
+            raise (Found node)
+        | Decl
+          , (#DeclType.t as node) ->
+            raise (Found node)
+        | BaseGrammarDecl
+          , (#BaseGrammarDeclType.t as node) ->
+            raise (Found node)
+        | GrammarDecl
+          , (#GrammarDeclType.t as node) ->
+            raise (Found node)
+        | BaseGrammarRuleDecl
+          , (#BaseGrammarRuleDeclType.t as node) ->
+            raise (Found node)
+        | GrammarRuleDecl
+          , (#GrammarRuleDeclType.t as node) ->
+            raise (Found node)
+        | SyntheticLexerDecl
+          , (#SyntheticLexerDeclType.t as node) ->
+            raise (Found node)
+        | BaseValDecl
+          , (#BaseValDeclType.t as node) ->
+            raise (Found node)
+        | NodeDecl
+          , (#NodeDeclType.t as node) ->
+            raise (Found node)
+        | SelfDecl
+          , (#SelfDeclType.t as node) ->
+            raise (Found node)
+        | UserValDecl
+          , (#UserValDeclType.t as node) ->
+            raise (Found node)
+        | EnumLitDecl
+          , (#EnumLitDeclType.t as node) ->
+            raise (Found node)
+        | ExplicitlyTypedDecl
+          , (#ExplicitlyTypedDeclType.t as node) ->
+            raise (Found node)
+        | ComponentDecl
+          , (#ComponentDeclType.t as node) ->
+            raise (Found node)
+        | FieldDecl
+          , (#FieldDeclType.t as node) ->
+            raise (Found node)
+        | FunArgDecl
+          , (#FunArgDeclType.t as node) ->
+            raise (Found node)
+        | LambdaArgDecl
+          , (#LambdaArgDeclType.t as node) ->
+            raise (Found node)
+        | MatchValDecl
+          , (#MatchValDeclType.t as node) ->
+            raise (Found node)
+        | ValDecl
+          , (#ValDeclType.t as node) ->
+            raise (Found node)
+        | FunDecl
+          , (#FunDeclType.t as node) ->
+            raise (Found node)
+        | GenericDecl
+          , (#GenericDeclType.t as node) ->
+            raise (Found node)
+        | LexerDecl
+          , (#LexerDeclType.t as node) ->
+            raise (Found node)
+        | LexerFamilyDecl
+          , (#LexerFamilyDeclType.t as node) ->
+            raise (Found node)
+        | TypeDecl
+          , (#TypeDeclType.t as node) ->
+            raise (Found node)
+        | EnumClassAltDecl
+          , (#EnumClassAltDeclType.t as node) ->
+            raise (Found node)
+        | FunctionType
+          , (#FunctionTypeType.t as node) ->
+            raise (Found node)
+        | GenericFormalTypeDecl
+          , (#GenericFormalTypeDeclType.t as node) ->
+            raise (Found node)
+        | InstantiatedGenericType
+          , (#InstantiatedGenericTypeType.t as node) ->
+            raise (Found node)
+        | NamedTypeDecl
+          , (#NamedTypeDeclType.t as node) ->
+            raise (Found node)
+        | BasicClassDecl
+          , (#BasicClassDeclType.t as node) ->
+            raise (Found node)
+        | ClassDecl
+          , (#ClassDeclType.t as node) ->
+            raise (Found node)
+        | EnumClassDecl
+          , (#EnumClassDeclType.t as node) ->
+            raise (Found node)
+        | EnumTypeDecl
+          , (#EnumTypeDeclType.t as node) ->
+            raise (Found node)
+        | StructDecl
+          , (#StructDeclType.t as node) ->
+            raise (Found node)
+        | TraitDecl
+          , (#TraitDeclType.t as node) ->
+            raise (Found node)
+        | DeclAnnotation
+          , (#DeclAnnotationType.t as node) ->
+            raise (Found node)
+        | DeclAnnotationParams
+          , (#DeclAnnotationParamsType.t as node) ->
+            raise (Found node)
+        | Doc
+          , (#DocType.t as node) ->
+            raise (Found node)
+        | DocComment
+          , (#DocCommentType.t as node) ->
+            raise (Found node)
+        | ElsifBranch
+          , (#ElsifBranchType.t as node) ->
+            raise (Found node)
+        | EnumClassCase
+          , (#EnumClassCaseType.t as node) ->
+            raise (Found node)
+        | ExcludesNull
+          , (#ExcludesNullType.t as node) ->
+            raise (Found node)
+        | ExcludesNullAbsent
+          , (#ExcludesNullAbsentType.t as node) ->
+            raise (Found node)
+        | ExcludesNullPresent
+          , (#ExcludesNullPresentType.t as node) ->
+            raise (Found node)
+        | Expr
+          , (#ExprType.t as node) ->
+            raise (Found node)
+        | ArrayLiteral
+          , (#ArrayLiteralType.t as node) ->
+            raise (Found node)
+        | BinOp
+          , (#BinOpType.t as node) ->
+            raise (Found node)
+        | BlockExpr
+          , (#BlockExprType.t as node) ->
+            raise (Found node)
+        | CallExpr
+          , (#CallExprType.t as node) ->
+            raise (Found node)
+        | NullCondCallExpr
+          , (#NullCondCallExprType.t as node) ->
+            raise (Found node)
+        | CastExpr
+          , (#CastExprType.t as node) ->
+            raise (Found node)
+        | DotExpr
+          , (#DotExprType.t as node) ->
+            raise (Found node)
+        | NullCondDottedName
+          , (#NullCondDottedNameType.t as node) ->
+            raise (Found node)
+        | ErrorOnNull
+          , (#ErrorOnNullType.t as node) ->
+            raise (Found node)
+        | GenericInstantiation
+          , (#GenericInstantiationType.t as node) ->
+            raise (Found node)
+        | GrammarExpr
+          , (#GrammarExprType.t as node) ->
+            raise (Found node)
+        | GrammarCut
+          , (#GrammarCutType.t as node) ->
+            raise (Found node)
+        | GrammarDiscard
+          , (#GrammarDiscardType.t as node) ->
+            raise (Found node)
+        | GrammarDontSkip
+          , (#GrammarDontSkipType.t as node) ->
+            raise (Found node)
+        | GrammarList
+          , (#GrammarListType.t as node) ->
+            raise (Found node)
+        | GrammarNull
+          , (#GrammarNullType.t as node) ->
+            raise (Found node)
+        | GrammarOpt
+          , (#GrammarOptType.t as node) ->
+            raise (Found node)
+        | GrammarOptGroup
+          , (#GrammarOptGroupType.t as node) ->
+            raise (Found node)
+        | GrammarOrExpr
+          , (#GrammarOrExprType.t as node) ->
+            raise (Found node)
+        | GrammarPick
+          , (#GrammarPickType.t as node) ->
+            raise (Found node)
+        | GrammarImplicitPick
+          , (#GrammarImplicitPickType.t as node) ->
+            raise (Found node)
+        | GrammarPredicate
+          , (#GrammarPredicateType.t as node) ->
+            raise (Found node)
+        | GrammarRuleRef
+          , (#GrammarRuleRefType.t as node) ->
+            raise (Found node)
+        | GrammarSkip
+          , (#GrammarSkipType.t as node) ->
+            raise (Found node)
+        | ParseNodeExpr
+          , (#ParseNodeExprType.t as node) ->
+            raise (Found node)
+        | TokenLit
+          , (#TokenLitType.t as node) ->
+            raise (Found node)
+        | TokenNoCaseLit
+          , (#TokenNoCaseLitType.t as node) ->
+            raise (Found node)
+        | TokenPatternLit
+          , (#TokenPatternLitType.t as node) ->
+            raise (Found node)
+        | TokenRef
+          , (#TokenRefType.t as node) ->
+            raise (Found node)
+        | Id
+          , (#IdType.t as node) ->
+            raise (Found node)
+        | DefId
+          , (#DefIdType.t as node) ->
+            raise (Found node)
+        | RefId
+          , (#RefIdType.t as node) ->
+            raise (Found node)
+        | ModuleRefId
+          , (#ModuleRefIdType.t as node) ->
+            raise (Found node)
+        | IfExpr
+          , (#IfExprType.t as node) ->
+            raise (Found node)
+        | Isa
+          , (#IsaType.t as node) ->
+            raise (Found node)
+        | LambdaExpr
+          , (#LambdaExprType.t as node) ->
+            raise (Found node)
+        | Lit
+          , (#LitType.t as node) ->
+            raise (Found node)
+        | CharLit
+          , (#CharLitType.t as node) ->
+            raise (Found node)
+        | NullLit
+          , (#NullLitType.t as node) ->
+            raise (Found node)
+        | NumLit
+          , (#NumLitType.t as node) ->
+            raise (Found node)
+        | StringLit
+          , (#StringLitType.t as node) ->
+            raise (Found node)
+        | LogicExpr
+          , (#LogicExprType.t as node) ->
+            raise (Found node)
+        | MatchExpr
+          , (#MatchExprType.t as node) ->
+            raise (Found node)
+        | NotExpr
+          , (#NotExprType.t as node) ->
+            raise (Found node)
+        | ParenExpr
+          , (#ParenExprType.t as node) ->
+            raise (Found node)
+        | RaiseExpr
+          , (#RaiseExprType.t as node) ->
+            raise (Found node)
+        | TryExpr
+          , (#TryExprType.t as node) ->
+            raise (Found node)
+        | FullDecl
+          , (#FullDeclType.t as node) ->
+            raise (Found node)
+        | Import
+          , (#ImportType.t as node) ->
+            raise (Found node)
+        | LKNodeBaseList
+          , (#LKNodeBaseListType.t as node) ->
+            raise (Found node)
+        | BaseLexerCaseRuleAltList
+          , (#BaseLexerCaseRuleAltListType.t as node) ->
+            raise (Found node)
+        | DeclAnnotationList
+          , (#DeclAnnotationListType.t as node) ->
+            raise (Found node)
+        | DocCommentList
+          , (#DocCommentListType.t as node) ->
+            raise (Found node)
+        | ElsifBranchList
+          , (#ElsifBranchListType.t as node) ->
+            raise (Found node)
+        | EnumClassAltDeclList
+          , (#EnumClassAltDeclListType.t as node) ->
+            raise (Found node)
+        | EnumClassCaseList
+          , (#EnumClassCaseListType.t as node) ->
+            raise (Found node)
+        | EnumLitDeclList
+          , (#EnumLitDeclListType.t as node) ->
+            raise (Found node)
+        | ExprList
+          , (#ExprListType.t as node) ->
+            raise (Found node)
+        | FullDeclList
+          , (#FullDeclListType.t as node) ->
+            raise (Found node)
+        | DeclBlock
+          , (#DeclBlockType.t as node) ->
+            raise (Found node)
+        | FunArgDeclList
+          , (#FunArgDeclListType.t as node) ->
+            raise (Found node)
+        | GrammarExprList
+          , (#GrammarExprListType.t as node) ->
+            raise (Found node)
+        | GrammarExprListList
+          , (#GrammarExprListListType.t as node) ->
+            raise (Found node)
+        | ImportList
+          , (#ImportListType.t as node) ->
+            raise (Found node)
+        | LKNodeList
+          , (#LKNodeListType.t as node) ->
+            raise (Found node)
+        | LambdaArgDeclList
+          , (#LambdaArgDeclListType.t as node) ->
+            raise (Found node)
+        | MatchBranchList
+          , (#MatchBranchListType.t as node) ->
+            raise (Found node)
+        | ParamList
+          , (#ParamListType.t as node) ->
+            raise (Found node)
+        | RefIdList
+          , (#RefIdListType.t as node) ->
+            raise (Found node)
+        | TypeRefList
+          , (#TypeRefListType.t as node) ->
+            raise (Found node)
+        | LangkitRoot
+          , (#LangkitRootType.t as node) ->
+            raise (Found node)
+        | LexerCaseRule
+          , (#LexerCaseRuleType.t as node) ->
+            raise (Found node)
+        | LexerCaseRuleSend
+          , (#LexerCaseRuleSendType.t as node) ->
+            raise (Found node)
+        | ListKind
+          , (#ListKindType.t as node) ->
+            raise (Found node)
+        | ListKindOne
+          , (#ListKindOneType.t as node) ->
+            raise (Found node)
+        | ListKindZero
+          , (#ListKindZeroType.t as node) ->
+            raise (Found node)
+        | MatchBranch
+          , (#MatchBranchType.t as node) ->
+            raise (Found node)
+        | Op
+          , (#OpType.t as node) ->
+            raise (Found node)
+        | OpAmp
+          , (#OpAmpType.t as node) ->
+            raise (Found node)
+        | OpAnd
+          , (#OpAndType.t as node) ->
+            raise (Found node)
+        | OpDiv
+          , (#OpDivType.t as node) ->
+            raise (Found node)
+        | OpEq
+          , (#OpEqType.t as node) ->
+            raise (Found node)
+        | OpGt
+          , (#OpGtType.t as node) ->
+            raise (Found node)
+        | OpGte
+          , (#OpGteType.t as node) ->
+            raise (Found node)
+        | OpLt
+          , (#OpLtType.t as node) ->
+            raise (Found node)
+        | OpLte
+          , (#OpLteType.t as node) ->
+            raise (Found node)
+        | OpMinus
+          , (#OpMinusType.t as node) ->
+            raise (Found node)
+        | OpMult
+          , (#OpMultType.t as node) ->
+            raise (Found node)
+        | OpOr
+          , (#OpOrType.t as node) ->
+            raise (Found node)
+        | OpPlus
+          , (#OpPlusType.t as node) ->
+            raise (Found node)
+        | Param
+          , (#ParamType.t as node) ->
+            raise (Found node)
+        | TypeRef
+          , (#TypeRefType.t as node) ->
+            raise (Found node)
+        | FunctionTypeRef
+          , (#FunctionTypeRefType.t as node) ->
+            raise (Found node)
+        | GenericTypeRef
+          , (#GenericTypeRefType.t as node) ->
+            raise (Found node)
+        | SimpleTypeRef
+          , (#SimpleTypeRefType.t as node) ->
+            raise (Found node)
+        | VarBind
+          , (#VarBindType.t as node) ->
+            raise (Found node)
+        | _ ->
+          ()
+      in
+      try
+        iter aux node;
+        raise Not_found
+      with (Found node) -> node
+
+
+
+  let findall : type a. a node ->  [< LKNodeType.t ] -> a list =
+    fun node_type node ->
+      let aux : a list -> [< LKNodeType.t ] -> a list =
+       fun acc node ->
+        match node_type, node with
+        | LKNode
+          , (#LKNodeType.t as node) ->
+            node :: acc
+        | BaseLexerCaseRuleAlt
+          , (#BaseLexerCaseRuleAltType.t as node) ->
+            node :: acc
+        | LexerCaseRuleCondAlt
+          , (#LexerCaseRuleCondAltType.t as node) ->
+            node :: acc
+        | LexerCaseRuleDefaultAlt
+          , (#LexerCaseRuleDefaultAltType.t as node) ->
+            node :: acc
+        | Decl
+          , (#DeclType.t as node) ->
+            node :: acc
+        | BaseGrammarDecl
+          , (#BaseGrammarDeclType.t as node) ->
+            node :: acc
+        | GrammarDecl
+          , (#GrammarDeclType.t as node) ->
+            node :: acc
+        | BaseGrammarRuleDecl
+          , (#BaseGrammarRuleDeclType.t as node) ->
+            node :: acc
+        | GrammarRuleDecl
+          , (#GrammarRuleDeclType.t as node) ->
+            node :: acc
+        | SyntheticLexerDecl
+          , (#SyntheticLexerDeclType.t as node) ->
+            node :: acc
+        | BaseValDecl
+          , (#BaseValDeclType.t as node) ->
+            node :: acc
+        | NodeDecl
+          , (#NodeDeclType.t as node) ->
+            node :: acc
+        | SelfDecl
+          , (#SelfDeclType.t as node) ->
+            node :: acc
+        | UserValDecl
+          , (#UserValDeclType.t as node) ->
+            node :: acc
+        | EnumLitDecl
+          , (#EnumLitDeclType.t as node) ->
+            node :: acc
+        | ExplicitlyTypedDecl
+          , (#ExplicitlyTypedDeclType.t as node) ->
+            node :: acc
+        | ComponentDecl
+          , (#ComponentDeclType.t as node) ->
+            node :: acc
+        | FieldDecl
+          , (#FieldDeclType.t as node) ->
+            node :: acc
+        | FunArgDecl
+          , (#FunArgDeclType.t as node) ->
+            node :: acc
+        | LambdaArgDecl
+          , (#LambdaArgDeclType.t as node) ->
+            node :: acc
+        | MatchValDecl
+          , (#MatchValDeclType.t as node) ->
+            node :: acc
+        | ValDecl
+          , (#ValDeclType.t as node) ->
+            node :: acc
+        | FunDecl
+          , (#FunDeclType.t as node) ->
+            node :: acc
+        | GenericDecl
+          , (#GenericDeclType.t as node) ->
+            node :: acc
+        | LexerDecl
+          , (#LexerDeclType.t as node) ->
+            node :: acc
+        | LexerFamilyDecl
+          , (#LexerFamilyDeclType.t as node) ->
+            node :: acc
+        | TypeDecl
+          , (#TypeDeclType.t as node) ->
+            node :: acc
+        | EnumClassAltDecl
+          , (#EnumClassAltDeclType.t as node) ->
+            node :: acc
+        | FunctionType
+          , (#FunctionTypeType.t as node) ->
+            node :: acc
+        | GenericFormalTypeDecl
+          , (#GenericFormalTypeDeclType.t as node) ->
+            node :: acc
+        | InstantiatedGenericType
+          , (#InstantiatedGenericTypeType.t as node) ->
+            node :: acc
+        | NamedTypeDecl
+          , (#NamedTypeDeclType.t as node) ->
+            node :: acc
+        | BasicClassDecl
+          , (#BasicClassDeclType.t as node) ->
+            node :: acc
+        | ClassDecl
+          , (#ClassDeclType.t as node) ->
+            node :: acc
+        | EnumClassDecl
+          , (#EnumClassDeclType.t as node) ->
+            node :: acc
+        | EnumTypeDecl
+          , (#EnumTypeDeclType.t as node) ->
+            node :: acc
+        | StructDecl
+          , (#StructDeclType.t as node) ->
+            node :: acc
+        | TraitDecl
+          , (#TraitDeclType.t as node) ->
+            node :: acc
+        | DeclAnnotation
+          , (#DeclAnnotationType.t as node) ->
+            node :: acc
+        | DeclAnnotationParams
+          , (#DeclAnnotationParamsType.t as node) ->
+            node :: acc
+        | Doc
+          , (#DocType.t as node) ->
+            node :: acc
+        | DocComment
+          , (#DocCommentType.t as node) ->
+            node :: acc
+        | ElsifBranch
+          , (#ElsifBranchType.t as node) ->
+            node :: acc
+        | EnumClassCase
+          , (#EnumClassCaseType.t as node) ->
+            node :: acc
+        | ExcludesNull
+          , (#ExcludesNullType.t as node) ->
+            node :: acc
+        | ExcludesNullAbsent
+          , (#ExcludesNullAbsentType.t as node) ->
+            node :: acc
+        | ExcludesNullPresent
+          , (#ExcludesNullPresentType.t as node) ->
+            node :: acc
+        | Expr
+          , (#ExprType.t as node) ->
+            node :: acc
+        | ArrayLiteral
+          , (#ArrayLiteralType.t as node) ->
+            node :: acc
+        | BinOp
+          , (#BinOpType.t as node) ->
+            node :: acc
+        | BlockExpr
+          , (#BlockExprType.t as node) ->
+            node :: acc
+        | CallExpr
+          , (#CallExprType.t as node) ->
+            node :: acc
+        | NullCondCallExpr
+          , (#NullCondCallExprType.t as node) ->
+            node :: acc
+        | CastExpr
+          , (#CastExprType.t as node) ->
+            node :: acc
+        | DotExpr
+          , (#DotExprType.t as node) ->
+            node :: acc
+        | NullCondDottedName
+          , (#NullCondDottedNameType.t as node) ->
+            node :: acc
+        | ErrorOnNull
+          , (#ErrorOnNullType.t as node) ->
+            node :: acc
+        | GenericInstantiation
+          , (#GenericInstantiationType.t as node) ->
+            node :: acc
+        | GrammarExpr
+          , (#GrammarExprType.t as node) ->
+            node :: acc
+        | GrammarCut
+          , (#GrammarCutType.t as node) ->
+            node :: acc
+        | GrammarDiscard
+          , (#GrammarDiscardType.t as node) ->
+            node :: acc
+        | GrammarDontSkip
+          , (#GrammarDontSkipType.t as node) ->
+            node :: acc
+        | GrammarList
+          , (#GrammarListType.t as node) ->
+            node :: acc
+        | GrammarNull
+          , (#GrammarNullType.t as node) ->
+            node :: acc
+        | GrammarOpt
+          , (#GrammarOptType.t as node) ->
+            node :: acc
+        | GrammarOptGroup
+          , (#GrammarOptGroupType.t as node) ->
+            node :: acc
+        | GrammarOrExpr
+          , (#GrammarOrExprType.t as node) ->
+            node :: acc
+        | GrammarPick
+          , (#GrammarPickType.t as node) ->
+            node :: acc
+        | GrammarImplicitPick
+          , (#GrammarImplicitPickType.t as node) ->
+            node :: acc
+        | GrammarPredicate
+          , (#GrammarPredicateType.t as node) ->
+            node :: acc
+        | GrammarRuleRef
+          , (#GrammarRuleRefType.t as node) ->
+            node :: acc
+        | GrammarSkip
+          , (#GrammarSkipType.t as node) ->
+            node :: acc
+        | ParseNodeExpr
+          , (#ParseNodeExprType.t as node) ->
+            node :: acc
+        | TokenLit
+          , (#TokenLitType.t as node) ->
+            node :: acc
+        | TokenNoCaseLit
+          , (#TokenNoCaseLitType.t as node) ->
+            node :: acc
+        | TokenPatternLit
+          , (#TokenPatternLitType.t as node) ->
+            node :: acc
+        | TokenRef
+          , (#TokenRefType.t as node) ->
+            node :: acc
+        | Id
+          , (#IdType.t as node) ->
+            node :: acc
+        | DefId
+          , (#DefIdType.t as node) ->
+            node :: acc
+        | RefId
+          , (#RefIdType.t as node) ->
+            node :: acc
+        | ModuleRefId
+          , (#ModuleRefIdType.t as node) ->
+            node :: acc
+        | IfExpr
+          , (#IfExprType.t as node) ->
+            node :: acc
+        | Isa
+          , (#IsaType.t as node) ->
+            node :: acc
+        | LambdaExpr
+          , (#LambdaExprType.t as node) ->
+            node :: acc
+        | Lit
+          , (#LitType.t as node) ->
+            node :: acc
+        | CharLit
+          , (#CharLitType.t as node) ->
+            node :: acc
+        | NullLit
+          , (#NullLitType.t as node) ->
+            node :: acc
+        | NumLit
+          , (#NumLitType.t as node) ->
+            node :: acc
+        | StringLit
+          , (#StringLitType.t as node) ->
+            node :: acc
+        | LogicExpr
+          , (#LogicExprType.t as node) ->
+            node :: acc
+        | MatchExpr
+          , (#MatchExprType.t as node) ->
+            node :: acc
+        | NotExpr
+          , (#NotExprType.t as node) ->
+            node :: acc
+        | ParenExpr
+          , (#ParenExprType.t as node) ->
+            node :: acc
+        | RaiseExpr
+          , (#RaiseExprType.t as node) ->
+            node :: acc
+        | TryExpr
+          , (#TryExprType.t as node) ->
+            node :: acc
+        | FullDecl
+          , (#FullDeclType.t as node) ->
+            node :: acc
+        | Import
+          , (#ImportType.t as node) ->
+            node :: acc
+        | LKNodeBaseList
+          , (#LKNodeBaseListType.t as node) ->
+            node :: acc
+        | BaseLexerCaseRuleAltList
+          , (#BaseLexerCaseRuleAltListType.t as node) ->
+            node :: acc
+        | DeclAnnotationList
+          , (#DeclAnnotationListType.t as node) ->
+            node :: acc
+        | DocCommentList
+          , (#DocCommentListType.t as node) ->
+            node :: acc
+        | ElsifBranchList
+          , (#ElsifBranchListType.t as node) ->
+            node :: acc
+        | EnumClassAltDeclList
+          , (#EnumClassAltDeclListType.t as node) ->
+            node :: acc
+        | EnumClassCaseList
+          , (#EnumClassCaseListType.t as node) ->
+            node :: acc
+        | EnumLitDeclList
+          , (#EnumLitDeclListType.t as node) ->
+            node :: acc
+        | ExprList
+          , (#ExprListType.t as node) ->
+            node :: acc
+        | FullDeclList
+          , (#FullDeclListType.t as node) ->
+            node :: acc
+        | DeclBlock
+          , (#DeclBlockType.t as node) ->
+            node :: acc
+        | FunArgDeclList
+          , (#FunArgDeclListType.t as node) ->
+            node :: acc
+        | GrammarExprList
+          , (#GrammarExprListType.t as node) ->
+            node :: acc
+        | GrammarExprListList
+          , (#GrammarExprListListType.t as node) ->
+            node :: acc
+        | ImportList
+          , (#ImportListType.t as node) ->
+            node :: acc
+        | LKNodeList
+          , (#LKNodeListType.t as node) ->
+            node :: acc
+        | LambdaArgDeclList
+          , (#LambdaArgDeclListType.t as node) ->
+            node :: acc
+        | MatchBranchList
+          , (#MatchBranchListType.t as node) ->
+            node :: acc
+        | ParamList
+          , (#ParamListType.t as node) ->
+            node :: acc
+        | RefIdList
+          , (#RefIdListType.t as node) ->
+            node :: acc
+        | TypeRefList
+          , (#TypeRefListType.t as node) ->
+            node :: acc
+        | LangkitRoot
+          , (#LangkitRootType.t as node) ->
+            node :: acc
+        | LexerCaseRule
+          , (#LexerCaseRuleType.t as node) ->
+            node :: acc
+        | LexerCaseRuleSend
+          , (#LexerCaseRuleSendType.t as node) ->
+            node :: acc
+        | ListKind
+          , (#ListKindType.t as node) ->
+            node :: acc
+        | ListKindOne
+          , (#ListKindOneType.t as node) ->
+            node :: acc
+        | ListKindZero
+          , (#ListKindZeroType.t as node) ->
+            node :: acc
+        | MatchBranch
+          , (#MatchBranchType.t as node) ->
+            node :: acc
+        | Op
+          , (#OpType.t as node) ->
+            node :: acc
+        | OpAmp
+          , (#OpAmpType.t as node) ->
+            node :: acc
+        | OpAnd
+          , (#OpAndType.t as node) ->
+            node :: acc
+        | OpDiv
+          , (#OpDivType.t as node) ->
+            node :: acc
+        | OpEq
+          , (#OpEqType.t as node) ->
+            node :: acc
+        | OpGt
+          , (#OpGtType.t as node) ->
+            node :: acc
+        | OpGte
+          , (#OpGteType.t as node) ->
+            node :: acc
+        | OpLt
+          , (#OpLtType.t as node) ->
+            node :: acc
+        | OpLte
+          , (#OpLteType.t as node) ->
+            node :: acc
+        | OpMinus
+          , (#OpMinusType.t as node) ->
+            node :: acc
+        | OpMult
+          , (#OpMultType.t as node) ->
+            node :: acc
+        | OpOr
+          , (#OpOrType.t as node) ->
+            node :: acc
+        | OpPlus
+          , (#OpPlusType.t as node) ->
+            node :: acc
+        | Param
+          , (#ParamType.t as node) ->
+            node :: acc
+        | TypeRef
+          , (#TypeRefType.t as node) ->
+            node :: acc
+        | FunctionTypeRef
+          , (#FunctionTypeRefType.t as node) ->
+            node :: acc
+        | GenericTypeRef
+          , (#GenericTypeRefType.t as node) ->
+            node :: acc
+        | SimpleTypeRef
+          , (#SimpleTypeRefType.t as node) ->
+            node :: acc
+        | VarBind
+          , (#VarBindType.t as node) ->
+            node :: acc
+        | _ ->
+          acc
+      in
+      List.rev (fold aux [] node)
+
+  let fields_with_names node =
+    let aux i x =
+      (Format.sprintf "item_%d" i), x
+    in
+    match (node :> LKNodeType.t) with
+    | `VarBind value ->
+        [
+        (try
+           ("name"
+           , Some (Lazy.force value.f_name
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("name", None) );
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ]
+    | `SimpleTypeRef value ->
+        [
+        (try
+           ("type_name"
+           , Some (Lazy.force value.f_type_name
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("type_name", None) );
+        ]
+    | `GenericTypeRef value ->
+        [
+        (try
+           ("type_name"
+           , Some (Lazy.force value.f_type_name
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("type_name", None) );
+        (try
+           ("params"
+           , Some (Lazy.force value.f_params
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("params", None) );
+        ]
+    | `FunctionTypeRef value ->
+        [
+        (try
+           ("args_types"
+           , Some (Lazy.force value.f_args_types
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("args_types", None) );
+        (try
+           ("return_type"
+           , Some (Lazy.force value.f_return_type
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("return_type", None) );
+        ]
+    | `Param value ->
+        [
+        ("name"
+        , (Lazy.force value.f_name
+           :> LKNodeType.t option));
+        (try
+           ("value"
+           , Some (Lazy.force value.f_value
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("value", None) );
+        ]
+    | `OpPlus value ->
+        [
+        ]
+    | `OpOr value ->
+        [
+        ]
+    | `OpMult value ->
+        [
+        ]
+    | `OpMinus value ->
+        [
+        ]
+    | `OpLte value ->
+        [
+        ]
+    | `OpLt value ->
+        [
+        ]
+    | `OpGte value ->
+        [
+        ]
+    | `OpGt value ->
+        [
+        ]
+    | `OpEq value ->
+        [
+        ]
+    | `OpDiv value ->
+        [
+        ]
+    | `OpAnd value ->
+        [
+        ]
+    | `OpAmp value ->
+        [
+        ]
+    | `MatchBranch value ->
+        [
+        (try
+           ("decl"
+           , Some (Lazy.force value.f_decl
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("decl", None) );
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ]
+    | `ListKindZero value ->
+        [
+        ]
+    | `ListKindOne value ->
+        [
+        ]
+    | `LexerCaseRuleSend value ->
+        [
+        (try
+           ("sent"
+           , Some (Lazy.force value.f_sent
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("sent", None) );
+        (try
+           ("match_size"
+           , Some (Lazy.force value.f_match_size
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("match_size", None) );
+        ]
+    | `LexerCaseRule value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        (try
+           ("alts"
+           , Some (Lazy.force value.f_alts
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("alts", None) );
+        ]
+    | `LangkitRoot value ->
+        [
+        (try
+           ("imports"
+           , Some (Lazy.force value.f_imports
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("imports", None) );
+        (try
+           ("decls"
+           , Some (Lazy.force value.f_decls
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("decls", None) );
+        ]
+    | `TypeRefList value ->
+        List.mapi aux (children_opt node)
+    | `RefIdList value ->
+        List.mapi aux (children_opt node)
+    | `ParamList value ->
+        List.mapi aux (children_opt node)
+    | `MatchBranchList value ->
+        List.mapi aux (children_opt node)
+    | `LambdaArgDeclList value ->
+        List.mapi aux (children_opt node)
+    | `LKNodeList value ->
+        List.mapi aux (children_opt node)
+    | `ImportList value ->
+        List.mapi aux (children_opt node)
+    | `GrammarExprListList value ->
+        List.mapi aux (children_opt node)
+    | `GrammarExprList value ->
+        List.mapi aux (children_opt node)
+    | `FunArgDeclList value ->
+        List.mapi aux (children_opt node)
+    | `DeclBlock value ->
+        List.mapi aux (children_opt node)
+    | `FullDeclList value ->
+        List.mapi aux (children_opt node)
+    | `ExprList value ->
+        List.mapi aux (children_opt node)
+    | `EnumLitDeclList value ->
+        List.mapi aux (children_opt node)
+    | `EnumClassCaseList value ->
+        List.mapi aux (children_opt node)
+    | `EnumClassAltDeclList value ->
+        List.mapi aux (children_opt node)
+    | `ElsifBranchList value ->
+        List.mapi aux (children_opt node)
+    | `DocCommentList value ->
+        List.mapi aux (children_opt node)
+    | `DeclAnnotationList value ->
+        List.mapi aux (children_opt node)
+    | `BaseLexerCaseRuleAltList value ->
+        List.mapi aux (children_opt node)
+    | `Import value ->
+        [
+        (try
+           ("name"
+           , Some (Lazy.force value.f_name
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("name", None) );
+        ]
+    | `FullDecl value ->
+        [
+        (try
+           ("doc"
+           , Some (Lazy.force value.f_doc
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("doc", None) );
+        (try
+           ("decl_annotations"
+           , Some (Lazy.force value.f_decl_annotations
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("decl_annotations", None) );
+        (try
+           ("decl"
+           , Some (Lazy.force value.f_decl
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("decl", None) );
+        ]
+    | `TryExpr value ->
+        [
+        (try
+           ("try_expr"
+           , Some (Lazy.force value.f_try_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("try_expr", None) );
+        ("or_expr"
+        , (Lazy.force value.f_or_expr
+           :> LKNodeType.t option));
+        ]
+    | `RaiseExpr value ->
+        [
+        (try
+           ("except_expr"
+           , Some (Lazy.force value.f_except_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("except_expr", None) );
+        ]
+    | `ParenExpr value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ]
+    | `NotExpr value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ]
+    | `MatchExpr value ->
+        [
+        (try
+           ("match_expr"
+           , Some (Lazy.force value.f_match_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("match_expr", None) );
+        (try
+           ("branches"
+           , Some (Lazy.force value.f_branches
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("branches", None) );
+        ]
+    | `LogicExpr value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ]
+    | `StringLit value ->
+        [
+        ]
+    | `NumLit value ->
+        [
+        ]
+    | `NullLit value ->
+        [
+        ]
+    | `CharLit value ->
+        [
+        ]
+    | `LambdaExpr value ->
+        [
+        (try
+           ("params"
+           , Some (Lazy.force value.f_params
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("params", None) );
+        ("return_type"
+        , (Lazy.force value.f_return_type
+           :> LKNodeType.t option));
+        (try
+           ("body"
+           , Some (Lazy.force value.f_body
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("body", None) );
+        ]
+    | `Isa value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        (try
+           ("dest_type"
+           , Some (Lazy.force value.f_dest_type
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("dest_type", None) );
+        ]
+    | `IfExpr value ->
+        [
+        (try
+           ("cond_expr"
+           , Some (Lazy.force value.f_cond_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("cond_expr", None) );
+        (try
+           ("then_expr"
+           , Some (Lazy.force value.f_then_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("then_expr", None) );
+        (try
+           ("alternatives"
+           , Some (Lazy.force value.f_alternatives
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("alternatives", None) );
+        (try
+           ("else_expr"
+           , Some (Lazy.force value.f_else_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("else_expr", None) );
+        ]
+    | `ModuleRefId value ->
+        [
+        ]
+    | `RefId value ->
+        [
+        ]
+    | `DefId value ->
+        [
+        ]
+    | `Id value ->
+        [
+        ]
+    | `TokenRef value ->
+        [
+        (try
+           ("token_name"
+           , Some (Lazy.force value.f_token_name
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("token_name", None) );
+        ("expr"
+        , (Lazy.force value.f_expr
+           :> LKNodeType.t option));
+        ]
+    | `TokenPatternLit value ->
+        [
+        ]
+    | `TokenNoCaseLit value ->
+        [
+        (try
+           ("lit"
+           , Some (Lazy.force value.f_lit
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("lit", None) );
+        ]
+    | `TokenLit value ->
+        [
+        ]
+    | `ParseNodeExpr value ->
+        [
+        (try
+           ("node_name"
+           , Some (Lazy.force value.f_node_name
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("node_name", None) );
+        (try
+           ("sub_exprs"
+           , Some (Lazy.force value.f_sub_exprs
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("sub_exprs", None) );
+        ]
+    | `GrammarSkip value ->
+        [
+        (try
+           ("name"
+           , Some (Lazy.force value.f_name
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("name", None) );
+        ]
+    | `GrammarRuleRef value ->
+        [
+        (try
+           ("node_name"
+           , Some (Lazy.force value.f_node_name
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("node_name", None) );
+        ]
+    | `GrammarPredicate value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        (try
+           ("prop_ref"
+           , Some (Lazy.force value.f_prop_ref
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("prop_ref", None) );
+        ]
+    | `GrammarImplicitPick value ->
+        [
+        (try
+           ("exprs"
+           , Some (Lazy.force value.f_exprs
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("exprs", None) );
+        ]
+    | `GrammarPick value ->
+        [
+        (try
+           ("exprs"
+           , Some (Lazy.force value.f_exprs
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("exprs", None) );
+        ]
+    | `GrammarOrExpr value ->
+        [
+        (try
+           ("sub_exprs"
+           , Some (Lazy.force value.f_sub_exprs
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("sub_exprs", None) );
+        ]
+    | `GrammarOptGroup value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ]
+    | `GrammarOpt value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ]
+    | `GrammarNull value ->
+        [
+        (try
+           ("name"
+           , Some (Lazy.force value.f_name
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("name", None) );
+        ]
+    | `GrammarList value ->
+        [
+        ("list_type"
+        , (Lazy.force value.f_list_type
+           :> LKNodeType.t option));
+        (try
+           ("kind"
+           , Some (Lazy.force value.f_kind
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("kind", None) );
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ("sep"
+        , (Lazy.force value.f_sep
+           :> LKNodeType.t option));
+        ]
+    | `GrammarDontSkip value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        (try
+           ("dont_skip"
+           , Some (Lazy.force value.f_dont_skip
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("dont_skip", None) );
+        ]
+    | `GrammarDiscard value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ]
+    | `GrammarCut value ->
+        [
+        ]
+    | `GenericInstantiation value ->
+        [
+        (try
+           ("name"
+           , Some (Lazy.force value.f_name
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("name", None) );
+        (try
+           ("args"
+           , Some (Lazy.force value.f_args
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("args", None) );
+        ]
+    | `ErrorOnNull value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ]
+    | `NullCondDottedName value ->
+        [
+        (try
+           ("prefix"
+           , Some (Lazy.force value.f_prefix
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("prefix", None) );
+        (try
+           ("suffix"
+           , Some (Lazy.force value.f_suffix
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("suffix", None) );
+        ]
+    | `DotExpr value ->
+        [
+        (try
+           ("prefix"
+           , Some (Lazy.force value.f_prefix
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("prefix", None) );
+        (try
+           ("suffix"
+           , Some (Lazy.force value.f_suffix
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("suffix", None) );
+        ]
+    | `CastExpr value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        (try
+           ("excludes_null"
+           , Some (Lazy.force value.f_excludes_null
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("excludes_null", None) );
+        (try
+           ("dest_type"
+           , Some (Lazy.force value.f_dest_type
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("dest_type", None) );
+        ]
+    | `NullCondCallExpr value ->
+        [
+        (try
+           ("name"
+           , Some (Lazy.force value.f_name
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("name", None) );
+        (try
+           ("args"
+           , Some (Lazy.force value.f_args
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("args", None) );
+        ]
+    | `CallExpr value ->
+        [
+        (try
+           ("name"
+           , Some (Lazy.force value.f_name
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("name", None) );
+        (try
+           ("args"
+           , Some (Lazy.force value.f_args
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("args", None) );
+        ]
+    | `BlockExpr value ->
+        [
+        (try
+           ("val_defs"
+           , Some (Lazy.force value.f_val_defs
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("val_defs", None) );
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ]
+    | `BinOp value ->
+        [
+        (try
+           ("left"
+           , Some (Lazy.force value.f_left
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("left", None) );
+        (try
+           ("op"
+           , Some (Lazy.force value.f_op
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("op", None) );
+        (try
+           ("right"
+           , Some (Lazy.force value.f_right
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("right", None) );
+        ]
+    | `ArrayLiteral value ->
+        [
+        (try
+           ("exprs"
+           , Some (Lazy.force value.f_exprs
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("exprs", None) );
+        ]
+    | `ExcludesNullPresent value ->
+        [
+        ]
+    | `ExcludesNullAbsent value ->
+        [
+        ]
+    | `EnumClassCase value ->
+        [
+        (try
+           ("decls"
+           , Some (Lazy.force value.f_decls
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("decls", None) );
+        ]
+    | `ElsifBranch value ->
+        [
+        (try
+           ("cond_expr"
+           , Some (Lazy.force value.f_cond_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("cond_expr", None) );
+        (try
+           ("then_expr"
+           , Some (Lazy.force value.f_then_expr
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("then_expr", None) );
+        ]
+    | `DocComment value ->
+        [
+        ]
+    | `Doc value ->
+        [
+        (try
+           ("lines"
+           , Some (Lazy.force value.f_lines
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("lines", None) );
+        ]
+    | `DeclAnnotationParams value ->
+        [
+        (try
+           ("params"
+           , Some (Lazy.force value.f_params
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("params", None) );
+        ]
+    | `DeclAnnotation value ->
+        [
+        (try
+           ("name"
+           , Some (Lazy.force value.f_name
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("name", None) );
+        ("params"
+        , (Lazy.force value.f_params
+           :> LKNodeType.t option));
+        ]
+    | `TraitDecl value ->
+        [
+        ]
+    | `StructDecl value ->
+        [
+        ]
+    | `EnumTypeDecl value ->
+        [
+        (try
+           ("literals"
+           , Some (Lazy.force value.f_literals
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("literals", None) );
+        ]
+    | `EnumClassDecl value ->
+        [
+        (try
+           ("branches"
+           , Some (Lazy.force value.f_branches
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("branches", None) );
+        ]
+    | `ClassDecl value ->
+        [
+        ]
+    | `InstantiatedGenericType value ->
+        [
+        ]
+    | `GenericFormalTypeDecl value ->
+        [
+        ]
+    | `FunctionType value ->
+        [
+        ]
+    | `EnumClassAltDecl value ->
+        [
+        ]
+    | `LexerFamilyDecl value ->
+        [
+        (try
+           ("rules"
+           , Some (Lazy.force value.f_rules
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("rules", None) );
+        ]
+    | `LexerDecl value ->
+        [
+        (try
+           ("rules"
+           , Some (Lazy.force value.f_rules
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("rules", None) );
+        ]
+    | `GenericDecl value ->
+        [
+        (try
+           ("generic_formal_decls"
+           , Some (Lazy.force value.f_generic_formal_decls
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("generic_formal_decls", None) );
+        (try
+           ("decl"
+           , Some (Lazy.force value.f_decl
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("decl", None) );
+        ]
+    | `FunDecl value ->
+        [
+        (try
+           ("args"
+           , Some (Lazy.force value.f_args
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("args", None) );
+        (try
+           ("return_type"
+           , Some (Lazy.force value.f_return_type
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("return_type", None) );
+        ("body"
+        , (Lazy.force value.f_body
+           :> LKNodeType.t option));
+        ]
+    | `ValDecl value ->
+        [
+        (try
+           ("val"
+           , Some (Lazy.force value.f_val
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("val", None) );
+        ]
+    | `MatchValDecl value ->
+        [
+        ]
+    | `LambdaArgDecl value ->
+        [
+        ]
+    | `FunArgDecl value ->
+        [
+        ]
+    | `FieldDecl value ->
+        [
+        ]
+    | `EnumLitDecl value ->
+        [
+        ]
+    | `SelfDecl value ->
+        [
+        ]
+    | `NodeDecl value ->
+        [
+        ]
+    | `SyntheticLexerDecl value ->
+        [
+        ]
+    | `GrammarRuleDecl value ->
+        [
+        ]
+    | `GrammarDecl value ->
+        [
+        (try
+           ("rules"
+           , Some (Lazy.force value.f_rules
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("rules", None) );
+        ]
+    | `LexerCaseRuleDefaultAlt value ->
+        [
+        ]
+    | `LexerCaseRuleCondAlt value ->
+        [
+        (try
+           ("cond_exprs"
+           , Some (Lazy.force value.f_cond_exprs
+                    :> LKNodeType.t))
+        with SyntaxError ->
+          ("cond_exprs", None) );
+        ]
+
+  let rec pp_tree fmt node =
+    let rec pp_node_field fmt (name, node) =
+      match node with
+      | Some node ->
+          Format.fprintf fmt "@[<v 2>%s:@ %a@]" name pp_node node
+      | None ->
+          Format.fprintf fmt "@[<v 2>%s: None@]" name
+    and pp_node_fields fmt node =
+      let name_field_list = fields_with_names node in
+      match name_field_list with
+      | [] ->
+          ()
+      | l ->
+          Format.fprintf fmt "@ @[<v>%a@]"
+            (Format.pp_print_list pp_node_field) l
+    and pp_node fmt node =
+      let repr = entity_image node in
+      let len = String.length repr in
+      let erepr = String.sub repr 1 (len - 2) in
+      Format.fprintf fmt "@[<v 2>%s%s%a@]"
+        erepr
+        (if is_token_node node then (": " ^ (text node)) else "")
+        pp_node_fields node
+    in
+    let default = Format.pp_get_formatter_out_functions fmt () in
+    let out_indent n =
+      let the_end = n in
+      let rec make n =
+        if n = the_end then ""
+        else (if n mod 4 = 2 then "|" else " ") ^ make (n + 1)
+      in
+      default.out_string (make 0) 0 n
+    in
+    Format.pp_set_formatter_out_functions fmt {default with out_indent} ;
+    Format.fprintf fmt "%a%!" pp_node (node :> LKNodeType.t);
+    Format.pp_set_formatter_out_functions fmt default
+
+
+end
+
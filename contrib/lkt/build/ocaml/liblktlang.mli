@@ -0,0 +1,13083 @@
+
+
+
+
+
+
+(**
+ * OCaml binding of the Liblktlang API.
+ *)
+
+(**
+ * Raised when introspection functions (``Liblktlang.Introspection``) are
+ * requested an invalid field.
+ *)
+exception InvalidField of string
+
+(**
+ * Raised when introspection functions (``Liblktlang.Introspection``) are
+ * improperly used to evaluate a node data (field or property).
+ *)
+exception NodeDataEvaluationError of string
+
+(**
+ * Raised by lexing functions (``Liblktlang.Lexer``) when the input contains an
+ * invalid byte sequence.
+ *)
+exception InvalidInput of string
+
+(**
+ * Exception raise when an invalid symbol is passed to a subprogram.
+ *)
+exception InvalidSymbolError of string
+
+(**
+ * Raised when an invalid unit name is provided.
+ *)
+exception InvalidUnitNameError of string
+
+(**
+ * Exception raised in language bindings when the underlying C API reports an
+ * unexpected error that occurred in the library.
+
+ * This kind of exception is raised for internal errors: they should never
+ * happen in normal situations and if they are raised at some point, it means
+ * the library state is potentially corrupted.
+
+ * Nevertheless, the library does its best not to crash the program,
+ * materializing internal errors using this kind of exception.
+ *)
+exception NativeException of string
+
+(**
+ * Exception raised when an API is called while its preconditions are not
+ * satisfied.
+ *)
+exception PreconditionFailure of string
+
+(**
+ * Exception that is raised when an error occurs while evaluating any AST node
+ * method whose name starts with ``p_``. This is the only exceptions that such
+ * functions can raise.
+ *)
+exception PropertyError of string
+
+(**
+ * Exception raised when the provided arguments for a template don't match what
+ * the template expects.
+ *)
+exception TemplateArgsError of string
+
+(**
+ * Exception raised when a template has an invalid syntax, such as badly
+ * formatted placeholders.
+ *)
+exception TemplateFormatError of string
+
+(**
+ * Exception raised when the instantiation of a template cannot be parsed.
+ *)
+exception TemplateInstantiationError of string
+
+(**
+ * Exception raised while trying to access data that was deallocated. This
+ * happens when one tries to use a node whose unit has been reparsed, for
+ * instance.
+ *)
+exception StaleReferenceError of string
+
+(**
+ * Raised by lexing functions (``Liblktlang.Lexer``) when the input charset is
+ * not supported.
+ *)
+exception UnknownCharset of string
+
+
+
+
+
+(**
+ * Raised if a field of a node is null due to a syntax error
+ *)
+exception SyntaxError
+
+module AnalysisUnitKind : sig
+  (**
+   * Specify a kind of analysis unit. Specification units provide an interface
+   * to the outer world while body units provide an implementation for the
+   * corresponding interface.
+   *)
+
+  type t =
+  | UnitSpecification
+  | UnitBody
+
+  val name : unit -> string
+end
+
+module LookupKind : sig
+  
+
+  type t =
+  | Recursive
+  | Flat
+  | Minimal
+
+  val name : unit -> string
+end
+
+module GrammarRule : sig
+  (**
+   * Gramar rule to use for parsing.
+   *)
+
+  type t =
+  | MainRuleRule
+  | IdRule
+  | RefIdRule
+  | DefIdRule
+  | ImportStmtRule
+  | ImportsRule
+  | DocCommentRule
+  | DocRule
+  | LexerDeclRule
+  | GrammarDeclRule
+  | GrammarRuleRule
+  | LexerRuleRule
+  | LexerFamilyDeclRule
+  | LexerCaseRuleRule
+  | LexerCaseAltRule
+  | LexerCaseSendRule
+  | GrammarPrimaryRule
+  | GrammarExprRule
+  | GrammarPickRule
+  | GrammarImplicitPickRule
+  | GrammarOptRule
+  | GrammarCutRule
+  | GrammarOrExprRule
+  | GrammarDiscardExprRule
+  | TokenLiteralRule
+  | TokenNoCaseLiteralRule
+  | TokenPatternLiteralRule
+  | ParseNodeExprRule
+  | GrammarRuleRefRule
+  | GrammarListExprRule
+  | GrammarSkipRule
+  | GrammarNullRule
+  | GrammarTokenRule
+  | TypeDeclRule
+  | GenericDeclRule
+  | GenericFormalTypeRule
+  | EnumLitDeclRule
+  | FunDeclRule
+  | LambdaArgDeclRule
+  | FunArgDeclRule
+  | FunArgListRule
+  | LambdaArgListRule
+  | FieldDeclRule
+  | BareDeclRule
+  | DeclRule
+  | TypeRefRule
+  | TypeListRule
+  | DeclsRule
+  | DeclBlockRule
+  | ValDeclRule
+  | VarBindRule
+  | BlockRule
+  | ExprRule
+  | RelRule
+  | EqRule
+  | Arith1Rule
+  | Arith2Rule
+  | IsaOrPrimaryRule
+  | PrimaryRule
+  | MatchExprRule
+  | NumLitRule
+  | StringLitRule
+  | CharLitRule
+  | IfExprRule
+  | RaiseExprRule
+  | TryExprRule
+  | ArrayLiteralRule
+  | LogicRule
+  | BasicExprRule
+  | TermRule
+  | BasicNameRule
+  | LambdaExprRule
+  | NullLitRule
+  | ParamRule
+  | ParamsRule
+  | DeclAnnotationParamsRule
+  | DeclAnnotationRule
+
+  val name : unit -> string
+end
+
+val default_grammar_rule : GrammarRule.t
+
+module Sloc : sig
+  (**
+   * Location in a source file. Line and column numbers are one-based.
+   *)
+
+  type t = {
+    line : int;
+    column : int;
+  }
+end
+
+module SlocRange : sig
+  (**
+   * Location of a span of text in a source file.
+   *)
+
+  type t = {
+    loc_start : Sloc.t;
+    loc_end : Sloc.t;
+  }
+
+  val pp : Format.formatter -> t -> unit
+end
+
+module Diagnostic : sig
+  (**
+   * Diagnostic for an analysis unit: cannot open the source file, parsing
+   * error, ...
+   *)
+
+  type t = {
+    sloc_range : SlocRange.t;
+    message : string;
+  }
+end
+
+module TokenData : sig
+  type t
+end
+
+module Token : sig
+  (**
+   * Reference to a token in an analysis unit.
+   *)
+
+  type t = {
+    token_data : TokenData.t;
+    token_index : int;
+    trivia_index : int;
+    kind : int;
+    text : string;
+    sloc_range : SlocRange.t;
+  }
+
+  val kind_name : t -> string
+  (**
+   * Return a human-readable name for a token kind.
+   *)
+
+  val text_range : t -> t -> string
+  (**
+   * Compute the source buffer slice corresponding to the text that spans
+   * between the ``First`` and ``Last`` tokens (both included). This yields an
+   * empty slice if ``Last`` actually appears before ``First``.
+  
+   * if ``First`` and ``Last`` don't belong to the same analysis unit.
+   *)
+
+  val is_trivia : t -> bool
+  (**
+   * Return whether this token is a trivia. If it's not, it's a regular token.
+   *)
+
+  val index : t -> int
+  (**
+   * Zero-based index for this token/trivia. Tokens and trivias get their own
+   * index space.
+   *)
+
+  val next : t -> t
+  (**
+   * Return a reference to the first token scanned in this unit.
+   *)
+
+  val previous : t -> t
+  (**
+   * Return a reference to the last token scanned in this unit.
+   *)
+
+  val compare : t -> t -> int
+
+  val equal : t -> t -> bool
+
+  val hash : t -> int
+
+  val is_equivalent : t -> t -> bool
+  (**
+   * Return whether ``L`` and ``R`` are structurally equivalent tokens. This
+   * means that their position in the stream won't be taken into account, only
+   * the kind and text of the token.
+   *)
+
+  val pp : Format.formatter -> t -> unit
+end
+
+module TokenTable : sig
+  (**
+   * Columnar representation of the stream of tokens and trivia in an analysis
+   * unit, as computed by ``lkt_unit_export_tokens``.
+  
+   * Tokens and trivia are stored in the same order as in the source: the Nth
+   * item in each column (i.e. each field of this structure, except ``count``)
+   * contains the corresponding data for the Nth token or trivia. Offsets are
+   * 0-based indexes in the unit's source buffer: end offsets are exclusive.
+   *)
+
+  type int32_column = (int32, Bigarray.int32_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+  type uint16_column = (int, Bigarray.int16_unsigned_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+  type uint8_column = (int, Bigarray.int8_unsigned_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+
+  type t = {
+    kinds : int32_column;
+    start_offsets : int32_column;
+    end_offsets : int32_column;
+    start_lines : int32_column;
+    end_lines : int32_column;
+    start_columns : uint16_column;
+    end_columns : uint16_column;
+    is_trivia : uint8_column;
+  }
+
+  val length : t -> int
+  (**
+   * Number of tokens and trivia in this table.
+   *)
+
+  val kind_name : t -> int -> string
+  (**
+   * Return the kind name for the token at the given index in this table.
+   *)
+
+  val is_trivia : t -> int -> bool
+  (**
+   * Return whether the token at the given index in this table is a trivia.
+   *)
+end
+
+module BigInteger : sig
+  type t = Z.t
+end
+
+module BareNode : sig
+  type t
+end
+
+module Rebindings : sig
+  type t
+end
+
+module UnitProvider : sig
+  (**
+   * Interface to fetch analysis units from a name and a unit kind.
+  
+   * The unit provider mechanism provides an abstraction which assumes that to
+   * any couple (unit name, unit kind) we can associate at most one source file.
+   * This means that several couples can be associated to the same source file,
+   * but on the other hand, only one one source file can be associated to a
+   * couple.
+  
+   * This is used to make the semantic analysis able to switch from one analysis
+   * units to another.
+   *)
+
+  type t
+
+  
+
+end
+
+module rec Entity : sig
+  type t
+
+  val info : t -> EntityInfo.t
+end
+
+and LKNodeType : sig
+
+  
+   
+  (**
+    * LKNodeBaseListType.t
+    * LangkitRootType.t
+    * ImportType.t
+    * FullDeclType.t
+    * DeclType.t
+    * ExprType.t
+    * LexerCaseRuleType.t
+    * BaseLexerCaseRuleAltType.t
+    * LexerCaseRuleSendType.t
+    * ListKindType.t
+    * EnumClassCaseType.t
+    * DocCommentType.t
+    * DocType.t
+    * TypeRefType.t
+    * ExcludesNullType.t
+    * DeclAnnotationType.t
+    * DeclAnnotationParamsType.t
+    * ParamType.t
+    * ElsifBranchType.t
+    * MatchBranchType.t
+    * OpType.t
+    * VarBindType.t
+    *)
+  type t = [
+    | `LexerCaseRuleCondAlt
+        of LexerCaseRuleCondAltType.fields
+    | `LexerCaseRuleDefaultAlt
+        of LexerCaseRuleDefaultAltType.fields
+    | `GrammarDecl
+        of GrammarDeclType.fields
+    | `GrammarRuleDecl
+        of GrammarRuleDeclType.fields
+    | `SyntheticLexerDecl
+        of SyntheticLexerDeclType.fields
+    | `NodeDecl
+        of NodeDeclType.fields
+    | `SelfDecl
+        of SelfDeclType.fields
+    | `EnumLitDecl
+        of EnumLitDeclType.fields
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+    | `MatchValDecl
+        of MatchValDeclType.fields
+    | `ValDecl
+        of ValDeclType.fields
+    | `FunDecl
+        of FunDeclType.fields
+    | `GenericDecl
+        of GenericDeclType.fields
+    | `LexerDecl
+        of LexerDeclType.fields
+    | `LexerFamilyDecl
+        of LexerFamilyDeclType.fields
+    | `EnumClassAltDecl
+        of EnumClassAltDeclType.fields
+    | `FunctionType
+        of FunctionTypeType.fields
+    | `GenericFormalTypeDecl
+        of GenericFormalTypeDeclType.fields
+    | `InstantiatedGenericType
+        of InstantiatedGenericTypeType.fields
+    | `ClassDecl
+        of ClassDeclType.fields
+    | `EnumClassDecl
+        of EnumClassDeclType.fields
+    | `EnumTypeDecl
+        of EnumTypeDeclType.fields
+    | `StructDecl
+        of StructDeclType.fields
+    | `TraitDecl
+        of TraitDeclType.fields
+    | `DeclAnnotation
+        of DeclAnnotationType.fields
+    | `DeclAnnotationParams
+        of DeclAnnotationParamsType.fields
+    | `Doc
+        of DocType.fields
+    | `DocComment
+        of DocCommentType.fields
+    | `ElsifBranch
+        of ElsifBranchType.fields
+    | `EnumClassCase
+        of EnumClassCaseType.fields
+    | `ExcludesNullAbsent
+        of ExcludesNullAbsentType.fields
+    | `ExcludesNullPresent
+        of ExcludesNullPresentType.fields
+    | `ArrayLiteral
+        of ArrayLiteralType.fields
+    | `BinOp
+        of BinOpType.fields
+    | `BlockExpr
+        of BlockExprType.fields
+    | `CallExpr
+        of CallExprType.fields
+    | `NullCondCallExpr
+        of NullCondCallExprType.fields
+    | `CastExpr
+        of CastExprType.fields
+    | `DotExpr
+        of DotExprType.fields
+    | `NullCondDottedName
+        of NullCondDottedNameType.fields
+    | `ErrorOnNull
+        of ErrorOnNullType.fields
+    | `GenericInstantiation
+        of GenericInstantiationType.fields
+    | `GrammarCut
+        of GrammarCutType.fields
+    | `GrammarDiscard
+        of GrammarDiscardType.fields
+    | `GrammarDontSkip
+        of GrammarDontSkipType.fields
+    | `GrammarList
+        of GrammarListType.fields
+    | `GrammarNull
+        of GrammarNullType.fields
+    | `GrammarOpt
+        of GrammarOptType.fields
+    | `GrammarOptGroup
+        of GrammarOptGroupType.fields
+    | `GrammarOrExpr
+        of GrammarOrExprType.fields
+    | `GrammarPick
+        of GrammarPickType.fields
+    | `GrammarImplicitPick
+        of GrammarImplicitPickType.fields
+    | `GrammarPredicate
+        of GrammarPredicateType.fields
+    | `GrammarRuleRef
+        of GrammarRuleRefType.fields
+    | `GrammarSkip
+        of GrammarSkipType.fields
+    | `ParseNodeExpr
+        of ParseNodeExprType.fields
+    | `TokenLit
+        of TokenLitType.fields
+    | `TokenNoCaseLit
+        of TokenNoCaseLitType.fields
+    | `TokenPatternLit
+        of TokenPatternLitType.fields
+    | `TokenRef
+        of TokenRefType.fields
+    | `Id
+        of IdType.fields
+    | `DefId
+        of DefIdType.fields
+    | `RefId
+        of RefIdType.fields
+    | `ModuleRefId
+        of ModuleRefIdType.fields
+    | `IfExpr
+        of IfExprType.fields
+    | `Isa
+        of IsaType.fields
+    | `LambdaExpr
+        of LambdaExprType.fields
+    | `CharLit
+        of CharLitType.fields
+    | `NullLit
+        of NullLitType.fields
+    | `NumLit
+        of NumLitType.fields
+    | `StringLit
+        of StringLitType.fields
+    | `LogicExpr
+        of LogicExprType.fields
+    | `MatchExpr
+        of MatchExprType.fields
+    | `NotExpr
+        of NotExprType.fields
+    | `ParenExpr
+        of ParenExprType.fields
+    | `RaiseExpr
+        of RaiseExprType.fields
+    | `TryExpr
+        of TryExprType.fields
+    | `FullDecl
+        of FullDeclType.fields
+    | `Import
+        of ImportType.fields
+    | `BaseLexerCaseRuleAltList
+        of BaseLexerCaseRuleAltListType.fields
+    | `DeclAnnotationList
+        of DeclAnnotationListType.fields
+    | `DocCommentList
+        of DocCommentListType.fields
+    | `ElsifBranchList
+        of ElsifBranchListType.fields
+    | `EnumClassAltDeclList
+        of EnumClassAltDeclListType.fields
+    | `EnumClassCaseList
+        of EnumClassCaseListType.fields
+    | `EnumLitDeclList
+        of EnumLitDeclListType.fields
+    | `ExprList
+        of ExprListType.fields
+    | `FullDeclList
+        of FullDeclListType.fields
+    | `DeclBlock
+        of DeclBlockType.fields
+    | `FunArgDeclList
+        of FunArgDeclListType.fields
+    | `GrammarExprList
+        of GrammarExprListType.fields
+    | `GrammarExprListList
+        of GrammarExprListListType.fields
+    | `ImportList
+        of ImportListType.fields
+    | `LKNodeList
+        of LKNodeListType.fields
+    | `LambdaArgDeclList
+        of LambdaArgDeclListType.fields
+    | `MatchBranchList
+        of MatchBranchListType.fields
+    | `ParamList
+        of ParamListType.fields
+    | `RefIdList
+        of RefIdListType.fields
+    | `TypeRefList
+        of TypeRefListType.fields
+    | `LangkitRoot
+        of LangkitRootType.fields
+    | `LexerCaseRule
+        of LexerCaseRuleType.fields
+    | `LexerCaseRuleSend
+        of LexerCaseRuleSendType.fields
+    | `ListKindOne
+        of ListKindOneType.fields
+    | `ListKindZero
+        of ListKindZeroType.fields
+    | `MatchBranch
+        of MatchBranchType.fields
+    | `OpAmp
+        of OpAmpType.fields
+    | `OpAnd
+        of OpAndType.fields
+    | `OpDiv
+        of OpDivType.fields
+    | `OpEq
+        of OpEqType.fields
+    | `OpGt
+        of OpGtType.fields
+    | `OpGte
+        of OpGteType.fields
+    | `OpLt
+        of OpLtType.fields
+    | `OpLte
+        of OpLteType.fields
+    | `OpMinus
+        of OpMinusType.fields
+    | `OpMult
+        of OpMultType.fields
+    | `OpOr
+        of OpOrType.fields
+    | `OpPlus
+        of OpPlusType.fields
+    | `Param
+        of ParamType.fields
+    | `FunctionTypeRef
+        of FunctionTypeRefType.fields
+    | `GenericTypeRef
+        of GenericTypeRefType.fields
+    | `SimpleTypeRef
+        of SimpleTypeRefType.fields
+    | `VarBind
+        of VarBindType.fields
+  ]
+
+
+end
+and BaseLexerCaseRuleAltType : sig
+
+  
+   
+  type t = [
+    | `LexerCaseRuleCondAlt
+        of LexerCaseRuleCondAltType.fields
+    | `LexerCaseRuleDefaultAlt
+        of LexerCaseRuleDefaultAltType.fields
+  ]
+
+
+end
+and LexerCaseRuleCondAltType : sig
+
+  
+   
+  type t = [
+    | `LexerCaseRuleCondAlt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_exprs: RefIdListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and LexerCaseRuleDefaultAltType : sig
+
+  
+   
+  type t = [
+    | `LexerCaseRuleDefaultAlt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DeclType : sig
+
+  
+   
+  (**
+    * LexerDeclType.t
+    * LexerFamilyDeclType.t
+    * BaseGrammarDeclType.t
+    * BaseGrammarRuleDeclType.t
+    * TypeDeclType.t
+    * GenericDeclType.t
+    * BaseValDeclType.t
+    *)
+  type t = [
+    | `GrammarDecl
+        of GrammarDeclType.fields
+    | `GrammarRuleDecl
+        of GrammarRuleDeclType.fields
+    | `SyntheticLexerDecl
+        of SyntheticLexerDeclType.fields
+    | `NodeDecl
+        of NodeDeclType.fields
+    | `SelfDecl
+        of SelfDeclType.fields
+    | `EnumLitDecl
+        of EnumLitDeclType.fields
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+    | `MatchValDecl
+        of MatchValDeclType.fields
+    | `ValDecl
+        of ValDeclType.fields
+    | `FunDecl
+        of FunDeclType.fields
+    | `GenericDecl
+        of GenericDeclType.fields
+    | `LexerDecl
+        of LexerDeclType.fields
+    | `LexerFamilyDecl
+        of LexerFamilyDeclType.fields
+    | `EnumClassAltDecl
+        of EnumClassAltDeclType.fields
+    | `FunctionType
+        of FunctionTypeType.fields
+    | `GenericFormalTypeDecl
+        of GenericFormalTypeDeclType.fields
+    | `InstantiatedGenericType
+        of InstantiatedGenericTypeType.fields
+    | `ClassDecl
+        of ClassDeclType.fields
+    | `EnumClassDecl
+        of EnumClassDeclType.fields
+    | `EnumTypeDecl
+        of EnumTypeDeclType.fields
+    | `StructDecl
+        of StructDeclType.fields
+    | `TraitDecl
+        of TraitDeclType.fields
+  ]
+
+
+end
+and BaseGrammarDeclType : sig
+
+  
+   
+  type t = [
+    | `GrammarDecl
+        of GrammarDeclType.fields
+  ]
+
+
+end
+and GrammarDeclType : sig
+
+  
+   
+  type t = [
+    | `GrammarDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_rules: FullDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and BaseGrammarRuleDeclType : sig
+
+  
+   
+  type t = [
+    | `GrammarRuleDecl
+        of GrammarRuleDeclType.fields
+    | `SyntheticLexerDecl
+        of SyntheticLexerDeclType.fields
+  ]
+
+
+end
+and GrammarRuleDeclType : sig
+
+  
+   
+  type t = [
+    | `GrammarRuleDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and SyntheticLexerDeclType : sig
+
+  
+   
+  type t = [
+    | `SyntheticLexerDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and BaseValDeclType : sig
+
+  
+   
+  (**
+    * SelfDeclType.t
+    * NodeDeclType.t
+    * UserValDeclType.t
+    *)
+  type t = [
+    | `NodeDecl
+        of NodeDeclType.fields
+    | `SelfDecl
+        of SelfDeclType.fields
+    | `EnumLitDecl
+        of EnumLitDeclType.fields
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+    | `MatchValDecl
+        of MatchValDeclType.fields
+    | `ValDecl
+        of ValDeclType.fields
+    | `FunDecl
+        of FunDeclType.fields
+  ]
+
+
+end
+and NodeDeclType : sig
+
+  
+   
+  type t = [
+    | `NodeDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and SelfDeclType : sig
+
+  
+   
+  type t = [
+    | `SelfDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and UserValDeclType : sig
+
+  
+   
+  (**
+    * FunDeclType.t
+    * EnumLitDeclType.t
+    * ExplicitlyTypedDeclType.t
+    *)
+  type t = [
+    | `EnumLitDecl
+        of EnumLitDeclType.fields
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+    | `MatchValDecl
+        of MatchValDeclType.fields
+    | `ValDecl
+        of ValDeclType.fields
+    | `FunDecl
+        of FunDeclType.fields
+  ]
+
+
+end
+and EnumLitDeclType : sig
+
+  
+   
+  type t = [
+    | `EnumLitDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ExplicitlyTypedDeclType : sig
+
+  
+   
+  (**
+    * ComponentDeclType.t
+    * MatchValDeclType.t
+    * ValDeclType.t
+    *)
+  type t = [
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+    | `MatchValDecl
+        of MatchValDeclType.fields
+    | `ValDecl
+        of ValDeclType.fields
+  ]
+
+
+end
+and ComponentDeclType : sig
+
+  
+   
+  type t = [
+    | `FieldDecl
+        of FieldDeclType.fields
+    | `FunArgDecl
+        of FunArgDeclType.fields
+    | `LambdaArgDecl
+        of LambdaArgDeclType.fields
+  ]
+
+
+end
+and FieldDeclType : sig
+
+  
+   
+  type t = [
+    | `FieldDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and FunArgDeclType : sig
+
+  
+   
+  type t = [
+    | `FunArgDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and LambdaArgDeclType : sig
+
+  
+   
+  type t = [
+    | `LambdaArgDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and MatchValDeclType : sig
+
+  
+   
+  type t = [
+    | `MatchValDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ValDeclType : sig
+
+  
+   
+  type t = [
+    | `ValDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_val: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and FunDeclType : sig
+
+  
+   
+  type t = [
+    | `FunDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_args: FunArgDeclListType.t
+    Lazy.t;
+         
+    f_return_type: TypeRefType.t
+    Lazy.t;
+         
+    f_body: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GenericDeclType : sig
+
+  
+   
+  type t = [
+    | `GenericDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_generic_formal_decls: FullDeclListType.t
+    Lazy.t;
+         
+    f_decl: [
+      | `ClassDecl
+          of ClassDeclType.fields
+      | `EnumClassDecl
+          of EnumClassDeclType.fields
+      | `EnumTypeDecl
+          of EnumTypeDeclType.fields
+      | `FieldDecl
+          of FieldDeclType.fields
+      | `FunDecl
+          of FunDeclType.fields
+      | `GenericDecl
+          of fields
+      | `GrammarDecl
+          of GrammarDeclType.fields
+      | `GrammarRuleDecl
+          of GrammarRuleDeclType.fields
+      | `LexerDecl
+          of LexerDeclType.fields
+      | `StructDecl
+          of StructDeclType.fields
+      | `TraitDecl
+          of TraitDeclType.fields
+      | `ValDecl
+          of ValDeclType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and LexerDeclType : sig
+
+  
+   
+  type t = [
+    | `LexerDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_rules: LKNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and LexerFamilyDeclType : sig
+
+  
+   
+  type t = [
+    | `LexerFamilyDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_rules: FullDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and TypeDeclType : sig
+
+  
+   
+  (**
+    * FunctionTypeType.t
+    * GenericFormalTypeDeclType.t
+    * NamedTypeDeclType.t
+    * InstantiatedGenericTypeType.t
+    * EnumClassAltDeclType.t
+    *)
+  type t = [
+    | `EnumClassAltDecl
+        of EnumClassAltDeclType.fields
+    | `FunctionType
+        of FunctionTypeType.fields
+    | `GenericFormalTypeDecl
+        of GenericFormalTypeDeclType.fields
+    | `InstantiatedGenericType
+        of InstantiatedGenericTypeType.fields
+    | `ClassDecl
+        of ClassDeclType.fields
+    | `EnumClassDecl
+        of EnumClassDeclType.fields
+    | `EnumTypeDecl
+        of EnumTypeDeclType.fields
+    | `StructDecl
+        of StructDeclType.fields
+    | `TraitDecl
+        of TraitDeclType.fields
+  ]
+
+
+end
+and EnumClassAltDeclType : sig
+
+  
+   
+  type t = [
+    | `EnumClassAltDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and FunctionTypeType : sig
+
+  
+   
+  type t = [
+    | `FunctionType
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GenericFormalTypeDeclType : sig
+
+  
+   
+  type t = [
+    | `GenericFormalTypeDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and InstantiatedGenericTypeType : sig
+
+  
+   
+  type t = [
+    | `InstantiatedGenericType
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and NamedTypeDeclType : sig
+
+  
+   
+  (**
+    * TraitDeclType.t
+    * EnumTypeDeclType.t
+    * StructDeclType.t
+    * BasicClassDeclType.t
+    *)
+  type t = [
+    | `ClassDecl
+        of ClassDeclType.fields
+    | `EnumClassDecl
+        of EnumClassDeclType.fields
+    | `EnumTypeDecl
+        of EnumTypeDeclType.fields
+    | `StructDecl
+        of StructDeclType.fields
+    | `TraitDecl
+        of TraitDeclType.fields
+  ]
+
+
+end
+and BasicClassDeclType : sig
+
+  
+   
+  type t = [
+    | `ClassDecl
+        of ClassDeclType.fields
+    | `EnumClassDecl
+        of EnumClassDeclType.fields
+  ]
+
+
+end
+and ClassDeclType : sig
+
+  
+   
+  type t = [
+    | `ClassDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and EnumClassDeclType : sig
+
+  
+   
+  type t = [
+    | `EnumClassDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_branches: EnumClassCaseListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and EnumTypeDeclType : sig
+
+  
+   
+  type t = [
+    | `EnumTypeDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_literals: EnumLitDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and StructDeclType : sig
+
+  
+   
+  type t = [
+    | `StructDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and TraitDeclType : sig
+
+  
+   
+  type t = [
+    | `TraitDecl
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DeclAnnotationType : sig
+
+  
+   
+  type t = [
+    | `DeclAnnotation
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: IdType.t
+    Lazy.t;
+         
+    f_params: DeclAnnotationParamsType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DeclAnnotationParamsType : sig
+
+  
+   
+  type t = [
+    | `DeclAnnotationParams
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_params: ParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DocType : sig
+
+  
+   
+  type t = [
+    | `Doc
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_lines: DocCommentListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DocCommentType : sig
+
+  
+   
+  type t = [
+    | `DocComment
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ElsifBranchType : sig
+
+  
+   
+  type t = [
+    | `ElsifBranch
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_then_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and EnumClassCaseType : sig
+
+  
+   
+  type t = [
+    | `EnumClassCase
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_decls: EnumClassAltDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ExcludesNullType : sig
+
+  
+   
+  type t = [
+    | `ExcludesNullAbsent
+        of ExcludesNullAbsentType.fields
+    | `ExcludesNullPresent
+        of ExcludesNullPresentType.fields
+  ]
+
+
+end
+and ExcludesNullAbsentType : sig
+
+  
+   
+  type t = [
+    | `ExcludesNullAbsent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ExcludesNullPresentType : sig
+
+  
+   
+  type t = [
+    | `ExcludesNullPresent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ExprType : sig
+
+  
+   
+  (**
+    * GrammarExprType.t
+    * DotExprType.t
+    * IdType.t
+    * ArrayLiteralType.t
+    * NotExprType.t
+    * CastExprType.t
+    * IsaType.t
+    * ParenExprType.t
+    * CallExprType.t
+    * GenericInstantiationType.t
+    * ErrorOnNullType.t
+    * LambdaExprType.t
+    * TryExprType.t
+    * RaiseExprType.t
+    * IfExprType.t
+    * BlockExprType.t
+    * MatchExprType.t
+    * BinOpType.t
+    * LitType.t
+    * LogicExprType.t
+    *)
+  type t = [
+    | `ArrayLiteral
+        of ArrayLiteralType.fields
+    | `BinOp
+        of BinOpType.fields
+    | `BlockExpr
+        of BlockExprType.fields
+    | `CallExpr
+        of CallExprType.fields
+    | `NullCondCallExpr
+        of NullCondCallExprType.fields
+    | `CastExpr
+        of CastExprType.fields
+    | `DotExpr
+        of DotExprType.fields
+    | `NullCondDottedName
+        of NullCondDottedNameType.fields
+    | `ErrorOnNull
+        of ErrorOnNullType.fields
+    | `GenericInstantiation
+        of GenericInstantiationType.fields
+    | `GrammarCut
+        of GrammarCutType.fields
+    | `GrammarDiscard
+        of GrammarDiscardType.fields
+    | `GrammarDontSkip
+        of GrammarDontSkipType.fields
+    | `GrammarList
+        of GrammarListType.fields
+    | `GrammarNull
+        of GrammarNullType.fields
+    | `GrammarOpt
+        of GrammarOptType.fields
+    | `GrammarOptGroup
+        of GrammarOptGroupType.fields
+    | `GrammarOrExpr
+        of GrammarOrExprType.fields
+    | `GrammarPick
+        of GrammarPickType.fields
+    | `GrammarImplicitPick
+        of GrammarImplicitPickType.fields
+    | `GrammarPredicate
+        of GrammarPredicateType.fields
+    | `GrammarRuleRef
+        of GrammarRuleRefType.fields
+    | `GrammarSkip
+        of GrammarSkipType.fields
+    | `ParseNodeExpr
+        of ParseNodeExprType.fields
+    | `TokenLit
+        of TokenLitType.fields
+    | `TokenNoCaseLit
+        of TokenNoCaseLitType.fields
+    | `TokenPatternLit
+        of TokenPatternLitType.fields
+    | `TokenRef
+        of TokenRefType.fields
+    | `Id
+        of IdType.fields
+    | `DefId
+        of DefIdType.fields
+    | `RefId
+        of RefIdType.fields
+    | `ModuleRefId
+        of ModuleRefIdType.fields
+    | `IfExpr
+        of IfExprType.fields
+    | `Isa
+        of IsaType.fields
+    | `LambdaExpr
+        of LambdaExprType.fields
+    | `CharLit
+        of CharLitType.fields
+    | `NullLit
+        of NullLitType.fields
+    | `NumLit
+        of NumLitType.fields
+    | `StringLit
+        of StringLitType.fields
+    | `LogicExpr
+        of LogicExprType.fields
+    | `MatchExpr
+        of MatchExprType.fields
+    | `NotExpr
+        of NotExprType.fields
+    | `ParenExpr
+        of ParenExprType.fields
+    | `RaiseExpr
+        of RaiseExprType.fields
+    | `TryExpr
+        of TryExprType.fields
+  ]
+
+
+end
+and ArrayLiteralType : sig
+
+  
+   
+  type t = [
+    | `ArrayLiteral
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and BinOpType : sig
+
+  
+   
+  type t = [
+    | `BinOp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and BlockExprType : sig
+
+  
+   
+  type t = [
+    | `BlockExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_val_defs: LKNodeListType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CallExprType : sig
+
+  
+   
+  type t = [
+    | `CallExpr
+        of fields
+    | `NullCondCallExpr
+        of NullCondCallExprType.fields
+  ]
+  and fields = 
+  {
+         
+    f_name: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_args: ParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and NullCondCallExprType : sig
+
+  
+   
+  type t = [
+    | `NullCondCallExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_args: ParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CastExprType : sig
+
+  
+   
+  type t = [
+    | `CastExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_excludes_null: ExcludesNullType.t
+    Lazy.t;
+         
+    f_dest_type: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DotExprType : sig
+
+  
+   
+  type t = [
+    | `DotExpr
+        of fields
+    | `NullCondDottedName
+        of NullCondDottedNameType.fields
+  ]
+  and fields = 
+  {
+         
+    f_prefix: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: RefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and NullCondDottedNameType : sig
+
+  
+   
+  type t = [
+    | `NullCondDottedName
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_prefix: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: RefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ErrorOnNullType : sig
+
+  
+   
+  type t = [
+    | `ErrorOnNull
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GenericInstantiationType : sig
+
+  
+   
+  type t = [
+    | `GenericInstantiation
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_args: TypeRefListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GrammarExprType : sig
+
+  
+   
+  (**
+    * ParseNodeExprType.t
+    * GrammarRuleRefType.t
+    * GrammarDiscardType.t
+    * TokenLitType.t
+    * TokenNoCaseLitType.t
+    * TokenPatternLitType.t
+    * GrammarPickType.t
+    * TokenRefType.t
+    * GrammarOrExprType.t
+    * GrammarOptType.t
+    * GrammarOptGroupType.t
+    * GrammarCutType.t
+    * GrammarNullType.t
+    * GrammarSkipType.t
+    * GrammarPredicateType.t
+    * GrammarDontSkipType.t
+    * GrammarListType.t
+    *)
+  type t = [
+    | `GrammarCut
+        of GrammarCutType.fields
+    | `GrammarDiscard
+        of GrammarDiscardType.fields
+    | `GrammarDontSkip
+        of GrammarDontSkipType.fields
+    | `GrammarList
+        of GrammarListType.fields
+    | `GrammarNull
+        of GrammarNullType.fields
+    | `GrammarOpt
+        of GrammarOptType.fields
+    | `GrammarOptGroup
+        of GrammarOptGroupType.fields
+    | `GrammarOrExpr
+        of GrammarOrExprType.fields
+    | `GrammarPick
+        of GrammarPickType.fields
+    | `GrammarImplicitPick
+        of GrammarImplicitPickType.fields
+    | `GrammarPredicate
+        of GrammarPredicateType.fields
+    | `GrammarRuleRef
+        of GrammarRuleRefType.fields
+    | `GrammarSkip
+        of GrammarSkipType.fields
+    | `ParseNodeExpr
+        of ParseNodeExprType.fields
+    | `TokenLit
+        of TokenLitType.fields
+    | `TokenNoCaseLit
+        of TokenNoCaseLitType.fields
+    | `TokenPatternLit
+        of TokenPatternLitType.fields
+    | `TokenRef
+        of TokenRefType.fields
+  ]
+
+
+end
+and GrammarCutType : sig
+
+  
+   
+  type t = [
+    | `GrammarCut
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GrammarDiscardType : sig
+
+  
+   
+  type t = [
+    | `GrammarDiscard
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GrammarDontSkipType : sig
+
+  
+   
+  type t = [
+    | `GrammarDontSkip
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+         
+    f_dont_skip: GrammarExprType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GrammarListType : sig
+
+  
+   
+  type t = [
+    | `GrammarList
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_list_type: TypeRefType.t
+    option
+    Lazy.t;
+         
+    f_kind: ListKindType.t
+    Lazy.t;
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+         
+    f_sep: GrammarExprType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GrammarNullType : sig
+
+  
+   
+  type t = [
+    | `GrammarNull
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GrammarOptType : sig
+
+  
+   
+  type t = [
+    | `GrammarOpt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GrammarOptGroupType : sig
+
+  
+   
+  type t = [
+    | `GrammarOptGroup
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GrammarOrExprType : sig
+
+  
+   
+  type t = [
+    | `GrammarOrExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_sub_exprs: GrammarExprListListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GrammarPickType : sig
+
+  
+   
+  type t = [
+    | `GrammarPick
+        of fields
+    | `GrammarImplicitPick
+        of GrammarImplicitPickType.fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GrammarImplicitPickType : sig
+
+  
+   
+  type t = [
+    | `GrammarImplicitPick
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GrammarPredicateType : sig
+
+  
+   
+  type t = [
+    | `GrammarPredicate
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+         
+    f_prop_ref: [
+      | `DotExpr
+          of DotExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `RefId
+          of RefIdType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GrammarRuleRefType : sig
+
+  
+   
+  type t = [
+    | `GrammarRuleRef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_node_name: RefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GrammarSkipType : sig
+
+  
+   
+  type t = [
+    | `GrammarSkip
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ParseNodeExprType : sig
+
+  
+   
+  type t = [
+    | `ParseNodeExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_node_name: TypeRefType.t
+    Lazy.t;
+         
+    f_sub_exprs: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and TokenLitType : sig
+
+  
+   
+  type t = [
+    | `TokenLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and TokenNoCaseLitType : sig
+
+  
+   
+  type t = [
+    | `TokenNoCaseLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_lit: TokenLitType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and TokenPatternLitType : sig
+
+  
+   
+  type t = [
+    | `TokenPatternLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and TokenRefType : sig
+
+  
+   
+  type t = [
+    | `TokenRef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_token_name: RefIdType.t
+    Lazy.t;
+         
+    f_expr: TokenLitType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and IdType : sig
+
+  
+   
+  type t = [
+    | `Id
+        of fields
+    | `DefId
+        of DefIdType.fields
+    | `RefId
+        of RefIdType.fields
+    | `ModuleRefId
+        of ModuleRefIdType.fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DefIdType : sig
+
+  
+   
+  type t = [
+    | `DefId
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and RefIdType : sig
+
+  
+   
+  type t = [
+    | `RefId
+        of fields
+    | `ModuleRefId
+        of ModuleRefIdType.fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ModuleRefIdType : sig
+
+  
+   
+  type t = [
+    | `ModuleRefId
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and IfExprType : sig
+
+  
+   
+  type t = [
+    | `IfExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_then_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_alternatives: ElsifBranchListType.t
+    Lazy.t;
+         
+    f_else_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and IsaType : sig
+
+  
+   
+  type t = [
+    | `Isa
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_dest_type: TypeRefListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and LambdaExprType : sig
+
+  
+   
+  type t = [
+    | `LambdaExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_params: LambdaArgDeclListType.t
+    Lazy.t;
+         
+    f_return_type: TypeRefType.t
+    option
+    Lazy.t;
+         
+    f_body: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and LitType : sig
+
+  
+   
+  type t = [
+    | `CharLit
+        of CharLitType.fields
+    | `NullLit
+        of NullLitType.fields
+    | `NumLit
+        of NumLitType.fields
+    | `StringLit
+        of StringLitType.fields
+  ]
+
+
+end
+and CharLitType : sig
+
+  
+   
+  type t = [
+    | `CharLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and NullLitType : sig
+
+  
+   
+  type t = [
+    | `NullLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and NumLitType : sig
+
+  
+   
+  type t = [
+    | `NumLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and StringLitType : sig
+
+  
+   
+  type t = [
+    | `StringLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and LogicExprType : sig
+
+  
+   
+  type t = [
+    | `LogicExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and MatchExprType : sig
+
+  
+   
+  type t = [
+    | `MatchExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_match_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_branches: MatchBranchListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and NotExprType : sig
+
+  
+   
+  type t = [
+    | `NotExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ParenExprType : sig
+
+  
+   
+  type t = [
+    | `ParenExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and RaiseExprType : sig
+
+  
+   
+  type t = [
+    | `RaiseExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_except_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and TryExprType : sig
+
+  
+   
+  type t = [
+    | `TryExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_try_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of fields
+    ]
+    Lazy.t;
+         
+    f_or_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and FullDeclType : sig
+
+  
+   
+  type t = [
+    | `FullDecl
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_doc: DocType.t
+    Lazy.t;
+         
+    f_decl_annotations: DeclAnnotationListType.t
+    Lazy.t;
+         
+    f_decl: [
+      | `ClassDecl
+          of ClassDeclType.fields
+      | `EnumClassDecl
+          of EnumClassDeclType.fields
+      | `EnumTypeDecl
+          of EnumTypeDeclType.fields
+      | `FieldDecl
+          of FieldDeclType.fields
+      | `FunDecl
+          of FunDeclType.fields
+      | `GenericDecl
+          of GenericDeclType.fields
+      | `GenericFormalTypeDecl
+          of GenericFormalTypeDeclType.fields
+      | `GrammarDecl
+          of GrammarDeclType.fields
+      | `GrammarRuleDecl
+          of GrammarRuleDeclType.fields
+      | `LexerDecl
+          of LexerDeclType.fields
+      | `LexerFamilyDecl
+          of LexerFamilyDeclType.fields
+      | `StructDecl
+          of StructDeclType.fields
+      | `TraitDecl
+          of TraitDeclType.fields
+      | `ValDecl
+          of ValDeclType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ImportType : sig
+
+  
+   
+  type t = [
+    | `Import
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: ModuleRefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and LKNodeBaseListType : sig
+
+  
+   
+  (**
+    * FullDeclListType.t
+    * ExprListType.t
+    * ParamListType.t
+    * TypeRefListType.t
+    * LKNodeListType.t
+    * DeclAnnotationListType.t
+    * DocCommentListType.t
+    * FunArgDeclListType.t
+    * GrammarExprListType.t
+    * GrammarExprListListType.t
+    * ElsifBranchListType.t
+    * ImportListType.t
+    * LambdaArgDeclListType.t
+    * RefIdListType.t
+    * BaseLexerCaseRuleAltListType.t
+    * MatchBranchListType.t
+    * EnumClassCaseListType.t
+    * EnumClassAltDeclListType.t
+    * EnumLitDeclListType.t
+    *)
+  type t = [
+    | `BaseLexerCaseRuleAltList
+        of BaseLexerCaseRuleAltListType.fields
+    | `DeclAnnotationList
+        of DeclAnnotationListType.fields
+    | `DocCommentList
+        of DocCommentListType.fields
+    | `ElsifBranchList
+        of ElsifBranchListType.fields
+    | `EnumClassAltDeclList
+        of EnumClassAltDeclListType.fields
+    | `EnumClassCaseList
+        of EnumClassCaseListType.fields
+    | `EnumLitDeclList
+        of EnumLitDeclListType.fields
+    | `ExprList
+        of ExprListType.fields
+    | `FullDeclList
+        of FullDeclListType.fields
+    | `DeclBlock
+        of DeclBlockType.fields
+    | `FunArgDeclList
+        of FunArgDeclListType.fields
+    | `GrammarExprList
+        of GrammarExprListType.fields
+    | `GrammarExprListList
+        of GrammarExprListListType.fields
+    | `ImportList
+        of ImportListType.fields
+    | `LKNodeList
+        of LKNodeListType.fields
+    | `LambdaArgDeclList
+        of LambdaArgDeclListType.fields
+    | `MatchBranchList
+        of MatchBranchListType.fields
+    | `ParamList
+        of ParamListType.fields
+    | `RefIdList
+        of RefIdListType.fields
+    | `TypeRefList
+        of TypeRefListType.fields
+  ]
+
+
+end
+and BaseLexerCaseRuleAltListType : sig
+
+  
+   
+  type t = [
+    | `BaseLexerCaseRuleAltList
+        of fields
+  ]
+  and fields = 
+  {
+    list : BaseLexerCaseRuleAltType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DeclAnnotationListType : sig
+
+  
+   
+  type t = [
+    | `DeclAnnotationList
+        of fields
+  ]
+  and fields = 
+  {
+    list : DeclAnnotationType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DocCommentListType : sig
+
+  
+   
+  type t = [
+    | `DocCommentList
+        of fields
+  ]
+  and fields = 
+  {
+    list : DocCommentType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ElsifBranchListType : sig
+
+  
+   
+  type t = [
+    | `ElsifBranchList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ElsifBranchType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and EnumClassAltDeclListType : sig
+
+  
+   
+  type t = [
+    | `EnumClassAltDeclList
+        of fields
+  ]
+  and fields = 
+  {
+    list : EnumClassAltDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and EnumClassCaseListType : sig
+
+  
+   
+  type t = [
+    | `EnumClassCaseList
+        of fields
+  ]
+  and fields = 
+  {
+    list : EnumClassCaseType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and EnumLitDeclListType : sig
+
+  
+   
+  type t = [
+    | `EnumLitDeclList
+        of fields
+  ]
+  and fields = 
+  {
+    list : EnumLitDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ExprListType : sig
+
+  
+   
+  type t = [
+    | `ExprList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ExprType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and FullDeclListType : sig
+
+  
+   
+  type t = [
+    | `FullDeclList
+        of fields
+    | `DeclBlock
+        of DeclBlockType.fields
+  ]
+  and fields = 
+  {
+    list : FullDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DeclBlockType : sig
+
+  
+   
+  type t = [
+    | `DeclBlock
+        of fields
+  ]
+  and fields = 
+  {
+    list : FullDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and FunArgDeclListType : sig
+
+  
+   
+  type t = [
+    | `FunArgDeclList
+        of fields
+  ]
+  and fields = 
+  {
+    list : FunArgDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GrammarExprListType : sig
+
+  
+   
+  type t = [
+    | `GrammarExprList
+        of fields
+  ]
+  and fields = 
+  {
+    list : GrammarExprType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GrammarExprListListType : sig
+
+  
+   
+  type t = [
+    | `GrammarExprListList
+        of fields
+  ]
+  and fields = 
+  {
+    list : GrammarExprListType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ImportListType : sig
+
+  
+   
+  type t = [
+    | `ImportList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ImportType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and LKNodeListType : sig
+
+  
+   
+  type t = [
+    | `LKNodeList
+        of fields
+  ]
+  and fields = 
+  {
+    list : LKNodeType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and LambdaArgDeclListType : sig
+
+  
+   
+  type t = [
+    | `LambdaArgDeclList
+        of fields
+  ]
+  and fields = 
+  {
+    list : LambdaArgDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and MatchBranchListType : sig
+
+  
+   
+  type t = [
+    | `MatchBranchList
+        of fields
+  ]
+  and fields = 
+  {
+    list : MatchBranchType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ParamListType : sig
+
+  
+   
+  type t = [
+    | `ParamList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ParamType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and RefIdListType : sig
+
+  
+   
+  type t = [
+    | `RefIdList
+        of fields
+  ]
+  and fields = 
+  {
+    list : RefIdType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and TypeRefListType : sig
+
+  
+   
+  type t = [
+    | `TypeRefList
+        of fields
+  ]
+  and fields = 
+  {
+    list : TypeRefType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and LangkitRootType : sig
+
+  
+   
+  type t = [
+    | `LangkitRoot
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_imports: ImportListType.t
+    Lazy.t;
+         
+    f_decls: FullDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and LexerCaseRuleType : sig
+
+  
+   
+  type t = [
+    | `LexerCaseRule
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `GrammarCut
+          of GrammarCutType.fields
+      | `GrammarDiscard
+          of GrammarDiscardType.fields
+      | `GrammarImplicitPick
+          of GrammarImplicitPickType.fields
+      | `GrammarList
+          of GrammarListType.fields
+      | `GrammarNull
+          of GrammarNullType.fields
+      | `GrammarOpt
+          of GrammarOptType.fields
+      | `GrammarOptGroup
+          of GrammarOptGroupType.fields
+      | `GrammarOrExpr
+          of GrammarOrExprType.fields
+      | `GrammarPick
+          of GrammarPickType.fields
+      | `GrammarRuleRef
+          of GrammarRuleRefType.fields
+      | `GrammarSkip
+          of GrammarSkipType.fields
+      | `ParseNodeExpr
+          of ParseNodeExprType.fields
+      | `TokenLit
+          of TokenLitType.fields
+      | `TokenNoCaseLit
+          of TokenNoCaseLitType.fields
+      | `TokenPatternLit
+          of TokenPatternLitType.fields
+      | `TokenRef
+          of TokenRefType.fields
+    ]
+    Lazy.t;
+         
+    f_alts: BaseLexerCaseRuleAltListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and LexerCaseRuleSendType : sig
+
+  
+   
+  type t = [
+    | `LexerCaseRuleSend
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_sent: RefIdType.t
+    Lazy.t;
+         
+    f_match_size: NumLitType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ListKindType : sig
+
+  
+   
+  type t = [
+    | `ListKindOne
+        of ListKindOneType.fields
+    | `ListKindZero
+        of ListKindZeroType.fields
+  ]
+
+
+end
+and ListKindOneType : sig
+
+  
+   
+  type t = [
+    | `ListKindOne
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ListKindZeroType : sig
+
+  
+   
+  type t = [
+    | `ListKindZero
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and MatchBranchType : sig
+
+  
+   
+  type t = [
+    | `MatchBranch
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_decl: MatchValDeclType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and OpType : sig
+
+  
+   
+  type t = [
+    | `OpAmp
+        of OpAmpType.fields
+    | `OpAnd
+        of OpAndType.fields
+    | `OpDiv
+        of OpDivType.fields
+    | `OpEq
+        of OpEqType.fields
+    | `OpGt
+        of OpGtType.fields
+    | `OpGte
+        of OpGteType.fields
+    | `OpLt
+        of OpLtType.fields
+    | `OpLte
+        of OpLteType.fields
+    | `OpMinus
+        of OpMinusType.fields
+    | `OpMult
+        of OpMultType.fields
+    | `OpOr
+        of OpOrType.fields
+    | `OpPlus
+        of OpPlusType.fields
+  ]
+
+
+end
+and OpAmpType : sig
+
+  
+   
+  type t = [
+    | `OpAmp
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and OpAndType : sig
+
+  
+   
+  type t = [
+    | `OpAnd
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and OpDivType : sig
+
+  
+   
+  type t = [
+    | `OpDiv
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and OpEqType : sig
+
+  
+   
+  type t = [
+    | `OpEq
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and OpGtType : sig
+
+  
+   
+  type t = [
+    | `OpGt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and OpGteType : sig
+
+  
+   
+  type t = [
+    | `OpGte
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and OpLtType : sig
+
+  
+   
+  type t = [
+    | `OpLt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and OpLteType : sig
+
+  
+   
+  type t = [
+    | `OpLte
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and OpMinusType : sig
+
+  
+   
+  type t = [
+    | `OpMinus
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and OpMultType : sig
+
+  
+   
+  type t = [
+    | `OpMult
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and OpOrType : sig
+
+  
+   
+  type t = [
+    | `OpOr
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and OpPlusType : sig
+
+  
+   
+  type t = [
+    | `OpPlus
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ParamType : sig
+
+  
+   
+  type t = [
+    | `Param
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: RefIdType.t
+    option
+    Lazy.t;
+         
+    f_value: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and TypeRefType : sig
+
+  
+   
+  type t = [
+    | `FunctionTypeRef
+        of FunctionTypeRefType.fields
+    | `GenericTypeRef
+        of GenericTypeRefType.fields
+    | `SimpleTypeRef
+        of SimpleTypeRefType.fields
+  ]
+
+
+end
+and FunctionTypeRefType : sig
+
+  
+   
+  type t = [
+    | `FunctionTypeRef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_args_types: TypeRefListType.t
+    Lazy.t;
+         
+    f_return_type: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GenericTypeRefType : sig
+
+  
+   
+  type t = [
+    | `GenericTypeRef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_type_name: [
+      | `DotExpr
+          of DotExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `RefId
+          of RefIdType.fields
+    ]
+    Lazy.t;
+         
+    f_params: TypeRefListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and SimpleTypeRefType : sig
+
+  
+   
+  type t = [
+    | `SimpleTypeRef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_type_name: [
+      | `DotExpr
+          of DotExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `RefId
+          of RefIdType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and VarBindType : sig
+
+  
+   
+  type t = [
+    | `VarBind
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: RefIdType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+
+and AnalysisUnit : sig
+  (**
+   * This type represents the analysis of a single file.
+  
+   * This type has strong-reference semantics and is ref-counted. Furthermore, a
+   * reference to a unit contains an implicit reference to the context that owns
+   * it. This means that keeping a reference to a unit will keep the context and
+   * all the unit it contains allocated.
+   *)
+
+  type t
+
+  val root : t -> LKNodeType.t option
+  (**
+   * Return the root node for this unit, or ``None`` if there is none.
+   *)
+
+  val diagnostics : t -> Diagnostic.t list
+  (**
+   * Diagnostics for this unit.
+   *)
+
+  val filename : t -> string
+  (**
+   * Return the filename this unit is associated to.
+   *)
+
+  val reparse : ?charset:string -> ?buffer:string -> t -> unit
+  (**
+   * Reparse an analysis unit from a buffer, if provided, or from the original
+   * file otherwise. If ``Charset`` is empty or ``None``, use the last charset
+   * successfuly used for this unit, otherwise use it to decode the content of
+   * the source file.
+  
+   * If any failure occurs, such as decoding, lexing or parsing failure,
+   * diagnostic are emitted to explain what happened.
+   *)
+
+  val first_token : t -> Token.t
+  (**
+   * Return a reference to the first token scanned in this unit.
+   *)
+
+  val last_token : t -> Token.t
+  (**
+   * Return a reference to the last token scanned in this unit.
+   *)
+
+  val token_count : t -> int
+  (**
+   * Return the number of tokens in this unit.
+   *)
+
+  val trivia_count : t -> int
+  (**
+   * Return the number of trivias in this unit. This is 0 for units that were
+   * parsed with trivia analysis disabled.
+   *)
+
+  val token_table : t -> TokenTable.t
+  (**
+   * Return a columnar representation of all the tokens and trivia in this
+   * unit, computed in a single native call.
+   *)
+
+  
+  val fold_tokens : ('a -> Token.t -> 'a) -> 'a -> t -> 'a
+  (**
+   * Fold all the token this node contains by calling f on each token.
+   *)
+
+  val iter_tokens : (Token.t -> unit) -> t-> unit
+  (**
+   * Iterate over all token this node contains by calling f on each token.
+   *)
+
+  val map_tokens : (Token.t -> 'a) -> t -> 'a list
+  (**
+   * Map each token calling the given function
+   *)
+
+  val tokens : t -> Token.t list
+  (**
+   * Return a list of tokens for the given node
+   *)
+
+end
+
+and AnalysisContext : sig
+  (**
+   * This type represents a context for all source analysis. This is the first
+   * type you need to create to use Liblktlang. It will contain the results of
+   * all analysis, and is the main holder for all the data.
+  
+   * You can create several analysis contexts if you need to, which enables you,
+   * for example to:
+  
+   * * analyze several different projects at the same time;
+  
+   * * analyze different parts of the same projects in parallel.
+  
+   * In the current design, contexts always keep all of their analysis units
+   * allocated. If you need to get this memory released, the only option at your
+   * disposal is to destroy your analysis context instance.
+   *)
+
+  type t
+
+  val create :
+    ?charset:string
+    -> ?with_trivia:bool
+    -> ?tab_stop:int
+    -> ?unit_provider:UnitProvider.t
+    -> unit
+    -> t
+  (**
+   * Create a new analysis context.
+  
+   * ``Charset`` will be used as a default charset to decode input sources in
+   * analysis units. Please see ``GNATCOLL.Iconv`` for several supported
+   * charsets. Be careful: passing an unsupported charset is not guaranteed to
+   * raise an error here. If no charset is provided, ``"utf-8"`` is the default.
+  
+   * .. todo:: Passing an unsupported charset here is not guaranteed to raise an
+   *    error right here, but this would be really helpful for users.
+  
+   * When ``With_Trivia`` is true, the parsed analysis units will contain
+   * trivias.
+  
+   * If provided, ``Unit_Provider`` will be used to query the file name that
+   * corresponds to a unit reference during semantic analysis. If it is
+   * ``None``, the default one is used instead.
+  
+   * ``Tab_Stop`` is a positive number to describe the effect of tabulation
+   * characters on the column number in source files.
+   *)
+
+  val get_from_file :
+    ?charset:string
+    -> ?reparse:bool
+    -> ?grammar_rule:GrammarRule.t
+    -> t
+    -> string
+    -> AnalysisUnit.t
+  (**
+   * Create a new analysis unit for ``Filename`` or return the existing one if
+   * any. If ``Reparse`` is true and the analysis unit already exists, reparse
+   * it from ``Filename``.
+  
+   * ``Rule`` controls which grammar rule is used to parse the unit.
+  
+   * Use ``Charset`` in order to decode the source. If ``Charset`` is empty then
+   * use the context's default charset.
+  
+   * If any failure occurs, such as file opening, decoding, lexing or parsing
+   * failure, return an analysis unit anyway: errors are described as
+   * diagnostics of the returned analysis unit.
+   *)
+
+  val get_from_buffer :
+    ?charset:string
+    -> ?grammar_rule:GrammarRule.t
+    -> t
+    -> string
+    -> string
+    -> AnalysisUnit.t
+  (**
+   * Create a new analysis unit for ``Filename`` or return the existing one if
+   * any. Whether the analysis unit already exists or not, (re)parse it from the
+   * source code in ``Buffer``.
+  
+   * ``Rule`` controls which grammar rule is used to parse the unit.
+  
+   * Use ``Charset`` in order to decode the source. If ``Charset`` is empty then
+   * use the context's default charset.
+  
+   * If any failure occurs, such as file opening, decoding, lexing or parsing
+   * failure, return an analysis unit anyway: errors are described as
+   * diagnostics of the returned analysis unit.
+   *)
+end
+
+   
+
+   
+and EntityInfo : sig
+  
+
+  
+  type t = {
+      rebindings :
+         Rebindings.t;
+      from_rebound :
+         bool;
+  }
+
+end
+
+   
+and SemanticResult : sig
+  (**
+   * Result for a call to a semantic property that can return an error.
+  
+   * In every case, the node field will be populated with the node upon which
+   * the request was made. Then, the result can be either:
+  
+   * * ``result_type`` if the property was a type returning property.
+  
+   * * ``result_ref`` if the property was a reference returning property
+  
+   * * ``error_message`` if an error was found as part of the resolution
+   * process.
+  
+   * Only one of those fields can have a value.
+  
+   * If all fields are null, it means that ``expr_type`` has been called on a
+   * non regular expression.
+  
+   * TODO: Turn this into a real variant record when we have variants.
+   *)
+
+  
+  type t = {
+      node :
+         BareNode.t;
+      result_type :
+         TypeDeclType.t option;
+      result_ref :
+         DeclType.t option;
+      has_error :
+         bool;
+      error_message :
+         string;
+      exempt_analysis :
+         bool;
+  }
+
+end
+
+   
+and TreeSemanticResult : sig
+  (**
+   * Collection of semantic results for a subtree. This will carry both:
+  
+   * * An array of semantic results for all of the subtree's nodes.
+  
+   * * A flag indicating whether the subtree contained errors or not.
+   *)
+
+  
+  type t = {
+      results :
+         SemanticResult.t list;
+      has_error :
+         bool;
+  }
+
+end
+
+
+type _ node =
+  | LKNode :
+      LKNodeType.t node
+  | BaseLexerCaseRuleAlt :
+      BaseLexerCaseRuleAltType.t node
+  | LexerCaseRuleCondAlt :
+      LexerCaseRuleCondAltType.t node
+  | LexerCaseRuleDefaultAlt :
+      LexerCaseRuleDefaultAltType.t node
+  | Decl :
+      DeclType.t node
+  | BaseGrammarDecl :
+      BaseGrammarDeclType.t node
+  | GrammarDecl :
+      GrammarDeclType.t node
+  | BaseGrammarRuleDecl :
+      BaseGrammarRuleDeclType.t node
+  | GrammarRuleDecl :
+      GrammarRuleDeclType.t node
+  | SyntheticLexerDecl :
+      SyntheticLexerDeclType.t node
+  | BaseValDecl :
+      BaseValDeclType.t node
+  | NodeDecl :
+      NodeDeclType.t node
+  | SelfDecl :
+      SelfDeclType.t node
+  | UserValDecl :
+      UserValDeclType.t node
+  | EnumLitDecl :
+      EnumLitDeclType.t node
+  | ExplicitlyTypedDecl :
+      ExplicitlyTypedDeclType.t node
+  | ComponentDecl :
+      ComponentDeclType.t node
+  | FieldDecl :
+      FieldDeclType.t node
+  | FunArgDecl :
+      FunArgDeclType.t node
+  | LambdaArgDecl :
+      LambdaArgDeclType.t node
+  | MatchValDecl :
+      MatchValDeclType.t node
+  | ValDecl :
+      ValDeclType.t node
+  | FunDecl :
+      FunDeclType.t node
+  | GenericDecl :
+      GenericDeclType.t node
+  | LexerDecl :
+      LexerDeclType.t node
+  | LexerFamilyDecl :
+      LexerFamilyDeclType.t node
+  | TypeDecl :
+      TypeDeclType.t node
+  | EnumClassAltDecl :
+      EnumClassAltDeclType.t node
+  | FunctionType :
+      FunctionTypeType.t node
+  | GenericFormalTypeDecl :
+      GenericFormalTypeDeclType.t node
+  | InstantiatedGenericType :
+      InstantiatedGenericTypeType.t node
+  | NamedTypeDecl :
+      NamedTypeDeclType.t node
+  | BasicClassDecl :
+      BasicClassDeclType.t node
+  | ClassDecl :
+      ClassDeclType.t node
+  | EnumClassDecl :
+      EnumClassDeclType.t node
+  | EnumTypeDecl :
+      EnumTypeDeclType.t node
+  | StructDecl :
+      StructDeclType.t node
+  | TraitDecl :
+      TraitDeclType.t node
+  | DeclAnnotation :
+      DeclAnnotationType.t node
+  | DeclAnnotationParams :
+      DeclAnnotationParamsType.t node
+  | Doc :
+      DocType.t node
+  | DocComment :
+      DocCommentType.t node
+  | ElsifBranch :
+      ElsifBranchType.t node
+  | EnumClassCase :
+      EnumClassCaseType.t node
+  | ExcludesNull :
+      ExcludesNullType.t node
+  | ExcludesNullAbsent :
+      ExcludesNullAbsentType.t node
+  | ExcludesNullPresent :
+      ExcludesNullPresentType.t node
+  | Expr :
+      ExprType.t node
+  | ArrayLiteral :
+      ArrayLiteralType.t node
+  | BinOp :
+      BinOpType.t node
+  | BlockExpr :
+      BlockExprType.t node
+  | CallExpr :
+      CallExprType.t node
+  | NullCondCallExpr :
+      NullCondCallExprType.t node
+  | CastExpr :
+      CastExprType.t node
+  | DotExpr :
+      DotExprType.t node
+  | NullCondDottedName :
+      NullCondDottedNameType.t node
+  | ErrorOnNull :
+      ErrorOnNullType.t node
+  | GenericInstantiation :
+      GenericInstantiationType.t node
+  | GrammarExpr :
+      GrammarExprType.t node
+  | GrammarCut :
+      GrammarCutType.t node
+  | GrammarDiscard :
+      GrammarDiscardType.t node
+  | GrammarDontSkip :
+      GrammarDontSkipType.t node
+  | GrammarList :
+      GrammarListType.t node
+  | GrammarNull :
+      GrammarNullType.t node
+  | GrammarOpt :
+      GrammarOptType.t node
+  | GrammarOptGroup :
+      GrammarOptGroupType.t node
+  | GrammarOrExpr :
+      GrammarOrExprType.t node
+  | GrammarPick :
+      GrammarPickType.t node
+  | GrammarImplicitPick :
+      GrammarImplicitPickType.t node
+  | GrammarPredicate :
+      GrammarPredicateType.t node
+  | GrammarRuleRef :
+      GrammarRuleRefType.t node
+  | GrammarSkip :
+      GrammarSkipType.t node
+  | ParseNodeExpr :
+      ParseNodeExprType.t node
+  | TokenLit :
+      TokenLitType.t node
+  | TokenNoCaseLit :
+      TokenNoCaseLitType.t node
+  | TokenPatternLit :
+      TokenPatternLitType.t node
+  | TokenRef :
+      TokenRefType.t node
+  | Id :
+      IdType.t node
+  | DefId :
+      DefIdType.t node
+  | RefId :
+      RefIdType.t node
+  | ModuleRefId :
+      ModuleRefIdType.t node
+  | IfExpr :
+      IfExprType.t node
+  | Isa :
+      IsaType.t node
+  | LambdaExpr :
+      LambdaExprType.t node
+  | Lit :
+      LitType.t node
+  | CharLit :
+      CharLitType.t node
+  | NullLit :
+      NullLitType.t node
+  | NumLit :
+      NumLitType.t node
+  | StringLit :
+      StringLitType.t node
+  | LogicExpr :
+      LogicExprType.t node
+  | MatchExpr :
+      MatchExprType.t node
+  | NotExpr :
+      NotExprType.t node
+  | ParenExpr :
+      ParenExprType.t node
+  | RaiseExpr :
+      RaiseExprType.t node
+  | TryExpr :
+      TryExprType.t node
+  | FullDecl :
+      FullDeclType.t node
+  | Import :
+      ImportType.t node
+  | LKNodeBaseList :
+      LKNodeBaseListType.t node
+  | BaseLexerCaseRuleAltList :
+      BaseLexerCaseRuleAltListType.t node
+  | DeclAnnotationList :
+      DeclAnnotationListType.t node
+  | DocCommentList :
+      DocCommentListType.t node
+  | ElsifBranchList :
+      ElsifBranchListType.t node
+  | EnumClassAltDeclList :
+      EnumClassAltDeclListType.t node
+  | EnumClassCaseList :
+      EnumClassCaseListType.t node
+  | EnumLitDeclList :
+      EnumLitDeclListType.t node
+  | ExprList :
+      ExprListType.t node
+  | FullDeclList :
+      FullDeclListType.t node
+  | DeclBlock :
+      DeclBlockType.t node
+  | FunArgDeclList :
+      FunArgDeclListType.t node
+  | GrammarExprList :
+      GrammarExprListType.t node
+  | GrammarExprListList :
+      GrammarExprListListType.t node
+  | ImportList :
+      ImportListType.t node
+  | LKNodeList :
+      LKNodeListType.t node
+  | LambdaArgDeclList :
+      LambdaArgDeclListType.t node
+  | MatchBranchList :
+      MatchBranchListType.t node
+  | ParamList :
+      ParamListType.t node
+  | RefIdList :
+      RefIdListType.t node
+  | TypeRefList :
+      TypeRefListType.t node
+  | LangkitRoot :
+      LangkitRootType.t node
+  | LexerCaseRule :
+      LexerCaseRuleType.t node
+  | LexerCaseRuleSend :
+      LexerCaseRuleSendType.t node
+  | ListKind :
+      ListKindType.t node
+  | ListKindOne :
+      ListKindOneType.t node
+  | ListKindZero :
+      ListKindZeroType.t node
+  | MatchBranch :
+      MatchBranchType.t node
+  | Op :
+      OpType.t node
+  | OpAmp :
+      OpAmpType.t node
+  | OpAnd :
+      OpAndType.t node
+  | OpDiv :
+      OpDivType.t node
+  | OpEq :
+      OpEqType.t node
+  | OpGt :
+      OpGtType.t node
+  | OpGte :
+      OpGteType.t node
+  | OpLt :
+      OpLtType.t node
+  | OpLte :
+      OpLteType.t node
+  | OpMinus :
+      OpMinusType.t node
+  | OpMult :
+      OpMultType.t node
+  | OpOr :
+      OpOrType.t node
+  | OpPlus :
+      OpPlusType.t node
+  | Param :
+      ParamType.t node
+  | TypeRef :
+      TypeRefType.t node
+  | FunctionTypeRef :
+      FunctionTypeRefType.t node
+  | GenericTypeRef :
+      GenericTypeRefType.t node
+  | SimpleTypeRef :
+      SimpleTypeRefType.t node
+  | VarBind :
+      VarBindType.t node
+
+module VarBind : sig
+  (**
+   * Dynamic var bind expression.
+   *)
+
+  type t =
+    [
+      | `VarBind of
+          VarBindType.fields
+    ]
+
+  type fields = VarBindType.fields =
+    
+  {
+         
+    f_name: RefIdType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_name :
+    [< VarBindType.t]
+    -> RefIdType.t
+
+      
+  val f_expr :
+    [< VarBindType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+
+end
+
+module SimpleTypeRef : sig
+  (**
+   * Simple reference to a type.
+   *)
+
+  type t =
+    [
+      | `SimpleTypeRef of
+          SimpleTypeRefType.fields
+    ]
+
+  type fields = SimpleTypeRefType.fields =
+    
+  {
+         
+    f_type_name: [
+      | `DotExpr
+          of DotExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `RefId
+          of RefIdType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_type_name :
+    [< SimpleTypeRefType.t]
+    -> [DotExprType.t | RefIdType.t]
+
+
+end
+
+module GenericTypeRef : sig
+  (**
+   * Reference to a generic type.
+   *)
+
+  type t =
+    [
+      | `GenericTypeRef of
+          GenericTypeRefType.fields
+    ]
+
+  type fields = GenericTypeRefType.fields =
+    
+  {
+         
+    f_type_name: [
+      | `DotExpr
+          of DotExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `RefId
+          of RefIdType.fields
+    ]
+    Lazy.t;
+         
+    f_params: TypeRefListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_type_name :
+    [< GenericTypeRefType.t]
+    -> [DotExprType.t | RefIdType.t]
+
+      
+  val f_params :
+    [< GenericTypeRefType.t]
+    -> TypeRefListType.t
+
+
+end
+
+module FunctionTypeRef : sig
+  (**
+   * Reference to a function type.
+   *)
+
+  type t =
+    [
+      | `FunctionTypeRef of
+          FunctionTypeRefType.fields
+    ]
+
+  type fields = FunctionTypeRefType.fields =
+    
+  {
+         
+    f_args_types: TypeRefListType.t
+    Lazy.t;
+         
+    f_return_type: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_args_types :
+    [< FunctionTypeRefType.t]
+    -> TypeRefListType.t
+
+      
+  val f_return_type :
+    [< FunctionTypeRefType.t]
+    -> TypeRefType.t
+
+
+end
+
+module TypeRef : sig
+  (**
+   * Base class for a reference to a type.
+   *)
+
+  type t =
+    [
+      | SimpleTypeRef.t
+      | GenericTypeRef.t
+      | FunctionTypeRef.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+      
+  val p_designated_type :
+    [< TypeRefType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Return the type designated by this type ref.
+   *)
+
+
+
+end
+
+module Param : sig
+  (**
+   * Parameter for function calls or for annotations.
+   *)
+
+  type t =
+    [
+      | `Param of
+          ParamType.fields
+    ]
+
+  type fields = ParamType.fields =
+    
+  {
+         
+    f_name: RefIdType.t
+    option
+    Lazy.t;
+         
+    f_value: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_name :
+    [< ParamType.t]
+    -> RefIdType.t option
+
+      
+  val f_value :
+    [< ParamType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+
+end
+
+module OpPlus : sig
+  
+
+  type t =
+    [
+      | `OpPlus of
+          OpPlusType.fields
+    ]
+
+  type fields = OpPlusType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module OpOr : sig
+  
+
+  type t =
+    [
+      | `OpOr of
+          OpOrType.fields
+    ]
+
+  type fields = OpOrType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module OpMult : sig
+  
+
+  type t =
+    [
+      | `OpMult of
+          OpMultType.fields
+    ]
+
+  type fields = OpMultType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module OpMinus : sig
+  
+
+  type t =
+    [
+      | `OpMinus of
+          OpMinusType.fields
+    ]
+
+  type fields = OpMinusType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module OpLte : sig
+  
+
+  type t =
+    [
+      | `OpLte of
+          OpLteType.fields
+    ]
+
+  type fields = OpLteType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module OpLt : sig
+  
+
+  type t =
+    [
+      | `OpLt of
+          OpLtType.fields
+    ]
+
+  type fields = OpLtType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module OpGte : sig
+  
+
+  type t =
+    [
+      | `OpGte of
+          OpGteType.fields
+    ]
+
+  type fields = OpGteType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module OpGt : sig
+  
+
+  type t =
+    [
+      | `OpGt of
+          OpGtType.fields
+    ]
+
+  type fields = OpGtType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module OpEq : sig
+  
+
+  type t =
+    [
+      | `OpEq of
+          OpEqType.fields
+    ]
+
+  type fields = OpEqType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module OpDiv : sig
+  
+
+  type t =
+    [
+      | `OpDiv of
+          OpDivType.fields
+    ]
+
+  type fields = OpDivType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module OpAnd : sig
+  
+
+  type t =
+    [
+      | `OpAnd of
+          OpAndType.fields
+    ]
+
+  type fields = OpAndType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module OpAmp : sig
+  
+
+  type t =
+    [
+      | `OpAmp of
+          OpAmpType.fields
+    ]
+
+  type fields = OpAmpType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module Op : sig
+  (**
+   * Operator in a binary operator expression.
+   *)
+
+  type t =
+    [
+      | OpAnd.t
+      | OpOr.t
+      | OpPlus.t
+      | OpMinus.t
+      | OpEq.t
+      | OpMult.t
+      | OpDiv.t
+      | OpLt.t
+      | OpGt.t
+      | OpLte.t
+      | OpGte.t
+      | OpAmp.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module MatchBranch : sig
+  (**
+   * Branch inside a match expression.
+   *)
+
+  type t =
+    [
+      | `MatchBranch of
+          MatchBranchType.fields
+    ]
+
+  type fields = MatchBranchType.fields =
+    
+  {
+         
+    f_decl: MatchValDeclType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_decl :
+    [< MatchBranchType.t]
+    -> MatchValDeclType.t
+
+      
+  val f_expr :
+    [< MatchBranchType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+
+end
+
+module ListKindZero : sig
+  
+
+  type t =
+    [
+      | `ListKindZero of
+          ListKindZeroType.fields
+    ]
+
+  type fields = ListKindZeroType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module ListKindOne : sig
+  
+
+  type t =
+    [
+      | `ListKindOne of
+          ListKindOneType.fields
+    ]
+
+  type fields = ListKindOneType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module ListKind : sig
+  (**
+   * Kind for list parser expressions.
+   *)
+
+  type t =
+    [
+      | ListKindOne.t
+      | ListKindZero.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module LexerCaseRuleSend : sig
+  (**
+   * Lexer construction used by case alternatives to represent the token to send
+   * if that alternative was chosen.
+   *)
+
+  type t =
+    [
+      | `LexerCaseRuleSend of
+          LexerCaseRuleSendType.fields
+    ]
+
+  type fields = LexerCaseRuleSendType.fields =
+    
+  {
+         
+    f_sent: RefIdType.t
+    Lazy.t;
+         
+    f_match_size: NumLitType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_sent :
+    [< LexerCaseRuleSendType.t]
+    -> RefIdType.t
+
+      
+  val f_match_size :
+    [< LexerCaseRuleSendType.t]
+    -> NumLitType.t
+
+
+end
+
+module LexerCaseRule : sig
+  (**
+   * Lexer construct to introduce a conditional lexing action.
+   *)
+
+  type t =
+    [
+      | `LexerCaseRule of
+          LexerCaseRuleType.fields
+    ]
+
+  type fields = LexerCaseRuleType.fields =
+    
+  {
+         
+    f_expr: [
+      | `GrammarCut
+          of GrammarCutType.fields
+      | `GrammarDiscard
+          of GrammarDiscardType.fields
+      | `GrammarImplicitPick
+          of GrammarImplicitPickType.fields
+      | `GrammarList
+          of GrammarListType.fields
+      | `GrammarNull
+          of GrammarNullType.fields
+      | `GrammarOpt
+          of GrammarOptType.fields
+      | `GrammarOptGroup
+          of GrammarOptGroupType.fields
+      | `GrammarOrExpr
+          of GrammarOrExprType.fields
+      | `GrammarPick
+          of GrammarPickType.fields
+      | `GrammarRuleRef
+          of GrammarRuleRefType.fields
+      | `GrammarSkip
+          of GrammarSkipType.fields
+      | `ParseNodeExpr
+          of ParseNodeExprType.fields
+      | `TokenLit
+          of TokenLitType.fields
+      | `TokenNoCaseLit
+          of TokenNoCaseLitType.fields
+      | `TokenPatternLit
+          of TokenPatternLitType.fields
+      | `TokenRef
+          of TokenRefType.fields
+    ]
+    Lazy.t;
+         
+    f_alts: BaseLexerCaseRuleAltListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< LexerCaseRuleType.t]
+    -> [GrammarCutType.t | GrammarDiscardType.t | GrammarListType.t | GrammarNullType.t | GrammarOptType.t | GrammarOptGroupType.t | GrammarOrExprType.t | GrammarPickType.t | GrammarRuleRefType.t | GrammarSkipType.t | ParseNodeExprType.t | TokenLitType.t | TokenNoCaseLitType.t | TokenPatternLitType.t | TokenRefType.t]
+
+      
+  val f_alts :
+    [< LexerCaseRuleType.t]
+    -> BaseLexerCaseRuleAltListType.t
+
+
+end
+
+module LangkitRoot : sig
+  (**
+   * For the moment, root node of a lkt compilation unit.
+   *)
+
+  type t =
+    [
+      | `LangkitRoot of
+          LangkitRootType.fields
+    ]
+
+  type fields = LangkitRootType.fields =
+    
+  {
+         
+    f_imports: ImportListType.t
+    Lazy.t;
+         
+    f_decls: FullDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+      
+  val p_check_legality :
+    [< LangkitRootType.t ]
+    -> SemanticResult.t list
+  (**
+   * Run all legality checks on this tree. Return a list of diagnostics (For the
+   * moment, pending on real discriminated records, SemanticResults which
+   * necessarily have an error_message).
+   *)
+
+
+      
+  val f_imports :
+    [< LangkitRootType.t]
+    -> ImportListType.t
+
+      
+  val f_decls :
+    [< LangkitRootType.t]
+    -> FullDeclListType.t
+
+
+end
+
+module TypeRefList : sig
+  (**
+   * List of TypeRef.
+   *)
+
+  type t =
+    [
+      | `TypeRefList of
+          TypeRefListType.fields
+    ]
+
+  type fields = TypeRefListType.fields =
+    
+  {
+    list : TypeRefType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< TypeRefListType.t]
+    -> TypeRefType.t list
+
+end
+
+module RefIdList : sig
+  (**
+   * List of RefId.
+   *)
+
+  type t =
+    [
+      | `RefIdList of
+          RefIdListType.fields
+    ]
+
+  type fields = RefIdListType.fields =
+    
+  {
+    list : RefIdType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< RefIdListType.t]
+    -> RefIdType.t list
+
+end
+
+module ParamList : sig
+  (**
+   * List of Param.
+   *)
+
+  type t =
+    [
+      | `ParamList of
+          ParamListType.fields
+    ]
+
+  type fields = ParamListType.fields =
+    
+  {
+    list : ParamType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< ParamListType.t]
+    -> ParamType.t list
+
+end
+
+module MatchBranchList : sig
+  (**
+   * List of MatchBranch.
+   *)
+
+  type t =
+    [
+      | `MatchBranchList of
+          MatchBranchListType.fields
+    ]
+
+  type fields = MatchBranchListType.fields =
+    
+  {
+    list : MatchBranchType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< MatchBranchListType.t]
+    -> MatchBranchType.t list
+
+end
+
+module LambdaArgDeclList : sig
+  (**
+   * List of LambdaArgDecl.
+   *)
+
+  type t =
+    [
+      | `LambdaArgDeclList of
+          LambdaArgDeclListType.fields
+    ]
+
+  type fields = LambdaArgDeclListType.fields =
+    
+  {
+    list : LambdaArgDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< LambdaArgDeclListType.t]
+    -> LambdaArgDeclType.t list
+
+end
+
+module LKNodeList : sig
+  (**
+   * List of LKNode.
+  
+   * This list node can contain one of the following nodes:
+  
+   * * FullDeclType.t
+  
+   * * LexerCaseRuleType.t
+  
+   * * ValDeclType.t
+  
+   * * VarBindType.t
+   *)
+
+  type t =
+    [
+      | `LKNodeList of
+          LKNodeListType.fields
+    ]
+
+  type fields = LKNodeListType.fields =
+    
+  {
+    list : LKNodeType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< LKNodeListType.t]
+    -> LKNodeType.t list
+
+end
+
+module ImportList : sig
+  (**
+   * List of Import.
+   *)
+
+  type t =
+    [
+      | `ImportList of
+          ImportListType.fields
+    ]
+
+  type fields = ImportListType.fields =
+    
+  {
+    list : ImportType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< ImportListType.t]
+    -> ImportType.t list
+
+end
+
+module GrammarExprListList : sig
+  (**
+   * List of GrammarExpr.list.
+   *)
+
+  type t =
+    [
+      | `GrammarExprListList of
+          GrammarExprListListType.fields
+    ]
+
+  type fields = GrammarExprListListType.fields =
+    
+  {
+    list : GrammarExprListType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< GrammarExprListListType.t]
+    -> GrammarExprListType.t list
+
+end
+
+module GrammarExprList : sig
+  (**
+   * List of GrammarExpr.
+   *)
+
+  type t =
+    [
+      | `GrammarExprList of
+          GrammarExprListType.fields
+    ]
+
+  type fields = GrammarExprListType.fields =
+    
+  {
+    list : GrammarExprType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< GrammarExprListType.t]
+    -> GrammarExprType.t list
+
+end
+
+module FunArgDeclList : sig
+  (**
+   * List of FunArgDecl.
+   *)
+
+  type t =
+    [
+      | `FunArgDeclList of
+          FunArgDeclListType.fields
+    ]
+
+  type fields = FunArgDeclListType.fields =
+    
+  {
+    list : FunArgDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< FunArgDeclListType.t]
+    -> FunArgDeclType.t list
+
+end
+
+module DeclBlock : sig
+  (**
+   * List of declarations that also introduces a containing lexical scope.
+   *)
+
+  type t =
+    [
+      | `DeclBlock of
+          DeclBlockType.fields
+    ]
+
+  type fields = DeclBlockType.fields =
+    
+  {
+    list : FullDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< DeclBlockType.t]
+    -> FullDeclType.t list
+
+end
+
+module FullDeclList : sig
+  (**
+   * List of FullDecl.
+   *)
+
+  type t =
+    [
+      | `FullDeclList of
+          FullDeclListType.fields
+      | `DeclBlock of
+          DeclBlockType.fields
+    ]
+
+  type fields = FullDeclListType.fields =
+    
+  {
+    list : FullDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< FullDeclListType.t]
+    -> FullDeclType.t list
+
+end
+
+module ExprList : sig
+  (**
+   * List of Expr.
+  
+   * This list node can contain one of the following nodes:
+  
+   * * ArrayLiteralType.t
+  
+   * * BinOpType.t
+  
+   * * BlockExprType.t
+  
+   * * CallExprType.t
+  
+   * * CastExprType.t
+  
+   * * DotExprType.t
+  
+   * * ErrorOnNullType.t
+  
+   * * GenericInstantiationType.t
+  
+   * * IfExprType.t
+  
+   * * IsaType.t
+  
+   * * LambdaExprType.t
+  
+   * * LitType.t
+  
+   * * LogicExprType.t
+  
+   * * MatchExprType.t
+  
+   * * NotExprType.t
+  
+   * * ParenExprType.t
+  
+   * * RaiseExprType.t
+  
+   * * RefIdType.t
+  
+   * * TryExprType.t
+   *)
+
+  type t =
+    [
+      | `ExprList of
+          ExprListType.fields
+    ]
+
+  type fields = ExprListType.fields =
+    
+  {
+    list : ExprType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< ExprListType.t]
+    -> ExprType.t list
+
+end
+
+module EnumLitDeclList : sig
+  (**
+   * List of EnumLitDecl.
+   *)
+
+  type t =
+    [
+      | `EnumLitDeclList of
+          EnumLitDeclListType.fields
+    ]
+
+  type fields = EnumLitDeclListType.fields =
+    
+  {
+    list : EnumLitDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< EnumLitDeclListType.t]
+    -> EnumLitDeclType.t list
+
+end
+
+module EnumClassCaseList : sig
+  (**
+   * List of EnumClassCase.
+   *)
+
+  type t =
+    [
+      | `EnumClassCaseList of
+          EnumClassCaseListType.fields
+    ]
+
+  type fields = EnumClassCaseListType.fields =
+    
+  {
+    list : EnumClassCaseType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< EnumClassCaseListType.t]
+    -> EnumClassCaseType.t list
+
+end
+
+module EnumClassAltDeclList : sig
+  (**
+   * List of EnumClassAltDecl.
+   *)
+
+  type t =
+    [
+      | `EnumClassAltDeclList of
+          EnumClassAltDeclListType.fields
+    ]
+
+  type fields = EnumClassAltDeclListType.fields =
+    
+  {
+    list : EnumClassAltDeclType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< EnumClassAltDeclListType.t]
+    -> EnumClassAltDeclType.t list
+
+end
+
+module ElsifBranchList : sig
+  (**
+   * List of ElsifBranch.
+   *)
+
+  type t =
+    [
+      | `ElsifBranchList of
+          ElsifBranchListType.fields
+    ]
+
+  type fields = ElsifBranchListType.fields =
+    
+  {
+    list : ElsifBranchType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< ElsifBranchListType.t]
+    -> ElsifBranchType.t list
+
+end
+
+module DocCommentList : sig
+  (**
+   * List of DocComment.
+   *)
+
+  type t =
+    [
+      | `DocCommentList of
+          DocCommentListType.fields
+    ]
+
+  type fields = DocCommentListType.fields =
+    
+  {
+    list : DocCommentType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< DocCommentListType.t]
+    -> DocCommentType.t list
+
+end
+
+module DeclAnnotationList : sig
+  (**
+   * List of DeclAnnotation.
+   *)
+
+  type t =
+    [
+      | `DeclAnnotationList of
+          DeclAnnotationListType.fields
+    ]
+
+  type fields = DeclAnnotationListType.fields =
+    
+  {
+    list : DeclAnnotationType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< DeclAnnotationListType.t]
+    -> DeclAnnotationType.t list
+
+end
+
+module BaseLexerCaseRuleAltList : sig
+  (**
+   * List of BaseLexerCaseRuleAlt.
+   *)
+
+  type t =
+    [
+      | `BaseLexerCaseRuleAltList of
+          BaseLexerCaseRuleAltListType.fields
+    ]
+
+  type fields = BaseLexerCaseRuleAltListType.fields =
+    
+  {
+    list : BaseLexerCaseRuleAltType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< BaseLexerCaseRuleAltListType.t]
+    -> BaseLexerCaseRuleAltType.t list
+
+end
+
+module LKNodeBaseList : sig
+  
+
+  type t =
+    [
+      | FullDeclList.t
+      | ExprList.t
+      | ParamList.t
+      | TypeRefList.t
+      | LKNodeList.t
+      | DeclAnnotationList.t
+      | DocCommentList.t
+      | FunArgDeclList.t
+      | GrammarExprList.t
+      | GrammarExprListList.t
+      | ElsifBranchList.t
+      | ImportList.t
+      | LambdaArgDeclList.t
+      | RefIdList.t
+      | BaseLexerCaseRuleAltList.t
+      | MatchBranchList.t
+      | EnumClassCaseList.t
+      | EnumClassAltDeclList.t
+      | EnumLitDeclList.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module Import : sig
+  (**
+   * Statement to import another source file.
+   *)
+
+  type t =
+    [
+      | `Import of
+          ImportType.fields
+    ]
+
+  type fields = ImportType.fields =
+    
+  {
+         
+    f_name: ModuleRefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+      
+  val p_referenced_unit :
+    [< ImportType.t ]
+    -> AnalysisUnit.t
+  (**
+   * Return the unit that this import statements designates. Load it if needed.
+   *)
+
+
+      
+  val f_name :
+    [< ImportType.t]
+    -> ModuleRefIdType.t
+
+
+end
+
+module FullDecl : sig
+  (**
+   * Container for an lkt declaration. Contains the decl node plus the
+   * documentation and annotations.
+   *)
+
+  type t =
+    [
+      | `FullDecl of
+          FullDeclType.fields
+    ]
+
+  type fields = FullDeclType.fields =
+    
+  {
+         
+    f_doc: DocType.t
+    Lazy.t;
+         
+    f_decl_annotations: DeclAnnotationListType.t
+    Lazy.t;
+         
+    f_decl: [
+      | `ClassDecl
+          of ClassDeclType.fields
+      | `EnumClassDecl
+          of EnumClassDeclType.fields
+      | `EnumTypeDecl
+          of EnumTypeDeclType.fields
+      | `FieldDecl
+          of FieldDeclType.fields
+      | `FunDecl
+          of FunDeclType.fields
+      | `GenericDecl
+          of GenericDeclType.fields
+      | `GenericFormalTypeDecl
+          of GenericFormalTypeDeclType.fields
+      | `GrammarDecl
+          of GrammarDeclType.fields
+      | `GrammarRuleDecl
+          of GrammarRuleDeclType.fields
+      | `LexerDecl
+          of LexerDeclType.fields
+      | `LexerFamilyDecl
+          of LexerFamilyDeclType.fields
+      | `StructDecl
+          of StructDeclType.fields
+      | `TraitDecl
+          of TraitDeclType.fields
+      | `ValDecl
+          of ValDeclType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_doc :
+    [< FullDeclType.t]
+    -> DocType.t
+
+      
+  val f_decl_annotations :
+    [< FullDeclType.t]
+    -> DeclAnnotationListType.t
+
+      
+  val f_decl :
+    [< FullDeclType.t]
+    -> [BaseGrammarDeclType.t | FieldDeclType.t | FunDeclType.t | GenericDeclType.t | GenericFormalTypeDeclType.t | GrammarRuleDeclType.t | LexerDeclType.t | LexerFamilyDeclType.t | NamedTypeDeclType.t | ValDeclType.t]
+
+
+end
+
+module TryExpr : sig
+  (**
+   * Try expression.
+   *)
+
+  type t =
+    [
+      | `TryExpr of
+          TryExprType.fields
+    ]
+
+  type fields = TryExprType.fields =
+    
+  {
+         
+    f_try_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of fields
+    ]
+    Lazy.t;
+         
+    f_or_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_try_expr :
+    [< TryExprType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+      
+  val f_or_expr :
+    [< TryExprType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t] option
+
+
+end
+
+module RaiseExpr : sig
+  (**
+   * Raise expression.
+   *)
+
+  type t =
+    [
+      | `RaiseExpr of
+          RaiseExprType.fields
+    ]
+
+  type fields = RaiseExprType.fields =
+    
+  {
+         
+    f_except_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_except_expr :
+    [< RaiseExprType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+
+end
+
+module ParenExpr : sig
+  (**
+   * Parenthesized expression.
+   *)
+
+  type t =
+    [
+      | `ParenExpr of
+          ParenExprType.fields
+    ]
+
+  type fields = ParenExprType.fields =
+    
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< ParenExprType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+
+end
+
+module NotExpr : sig
+  (**
+   * Boolean negation expression.
+   *)
+
+  type t =
+    [
+      | `NotExpr of
+          NotExprType.fields
+    ]
+
+  type fields = NotExprType.fields =
+    
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< NotExprType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+
+end
+
+module MatchExpr : sig
+  (**
+   * Binary operator expression.
+   *)
+
+  type t =
+    [
+      | `MatchExpr of
+          MatchExprType.fields
+    ]
+
+  type fields = MatchExprType.fields =
+    
+  {
+         
+    f_match_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_branches: MatchBranchListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_match_expr :
+    [< MatchExprType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+      
+  val f_branches :
+    [< MatchExprType.t]
+    -> MatchBranchListType.t
+
+
+end
+
+module LogicExpr : sig
+  (**
+   * Class for logic expressions (any ``basic_expr`` starting with %).
+   *)
+
+  type t =
+    [
+      | `LogicExpr of
+          LogicExprType.fields
+    ]
+
+  type fields = LogicExprType.fields =
+    
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< LogicExprType.t]
+    -> [ArrayLiteralType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | LitType.t | MatchExprType.t | ParenExprType.t | RefIdType.t]
+
+
+end
+
+module StringLit : sig
+  (**
+   * String literal expression.
+  
+   * Note that in order to reduce the size of the node type hierarchy, we define
+   * only one node (StringLit) for all our string literals (only regular strings
+   * and pattern string literals at the moment). This will also make it easy to
+   * add new string prefixes in the future.
+   *)
+
+  type t =
+    [
+      | `StringLit of
+          StringLitType.fields
+    ]
+
+  type fields = StringLitType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+      
+  val p_is_prefixed_string :
+    [< StringLitType.t ]
+    -> bool
+  (**
+   * Return whether this string is prefixed or not.
+   *)
+
+      
+  val p_prefix :
+    [< StringLitType.t ]
+    -> string
+  (**
+   * Return the prefix of this string, or the null character if there is no
+   * prefix.
+   *)
+
+      
+  val p_denoted_value :
+    [< StringLitType.t ]
+    -> string
+  (**
+   * Return the content of the given string literal node.
+   *)
+
+      
+  val p_is_regexp_literal :
+    [< StringLitType.t ]
+    -> bool
+  (**
+   * Return whether this string literal is actually a regexp literal, by
+   * checking that this string is prefixed by 'p'.
+   *)
+
+
+
+end
+
+module NumLit : sig
+  (**
+   * Number literal expression.
+   *)
+
+  type t =
+    [
+      | `NumLit of
+          NumLitType.fields
+    ]
+
+  type fields = NumLitType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module NullLit : sig
+  (**
+   * Null literal expression.
+   *)
+
+  type t =
+    [
+      | `NullLit of
+          NullLitType.fields
+    ]
+
+  type fields = NullLitType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module CharLit : sig
+  (**
+   * Character literal expression.
+   *)
+
+  type t =
+    [
+      | `CharLit of
+          CharLitType.fields
+    ]
+
+  type fields = CharLitType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module Lit : sig
+  (**
+   * Base class for literals.
+   *)
+
+  type t =
+    [
+      | NullLit.t
+      | StringLit.t
+      | CharLit.t
+      | NumLit.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module LambdaExpr : sig
+  (**
+   * Lambda expression.
+   *)
+
+  type t =
+    [
+      | `LambdaExpr of
+          LambdaExprType.fields
+    ]
+
+  type fields = LambdaExprType.fields =
+    
+  {
+         
+    f_params: LambdaArgDeclListType.t
+    Lazy.t;
+         
+    f_return_type: TypeRefType.t
+    option
+    Lazy.t;
+         
+    f_body: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_params :
+    [< LambdaExprType.t]
+    -> LambdaArgDeclListType.t
+
+      
+  val f_return_type :
+    [< LambdaExprType.t]
+    -> TypeRefType.t option
+
+      
+  val f_body :
+    [< LambdaExprType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+
+end
+
+module Isa : sig
+  (**
+   * Isa expression.
+   *)
+
+  type t =
+    [
+      | `Isa of
+          IsaType.fields
+    ]
+
+  type fields = IsaType.fields =
+    
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_dest_type: TypeRefListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< IsaType.t]
+    -> [ArrayLiteralType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+      
+  val f_dest_type :
+    [< IsaType.t]
+    -> TypeRefListType.t
+
+
+end
+
+module IfExpr : sig
+  (**
+   * If expression.
+   *)
+
+  type t =
+    [
+      | `IfExpr of
+          IfExprType.fields
+    ]
+
+  type fields = IfExprType.fields =
+    
+  {
+         
+    f_cond_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_then_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_alternatives: ElsifBranchListType.t
+    Lazy.t;
+         
+    f_else_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_cond_expr :
+    [< IfExprType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+      
+  val f_then_expr :
+    [< IfExprType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+      
+  val f_alternatives :
+    [< IfExprType.t]
+    -> ElsifBranchListType.t
+
+      
+  val f_else_expr :
+    [< IfExprType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+
+end
+
+module ModuleRefId : sig
+  (**
+   * Id referencing a langkit module.
+   *)
+
+  type t =
+    [
+      | `ModuleRefId of
+          ModuleRefIdType.fields
+    ]
+
+  type fields = ModuleRefIdType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module RefId : sig
+  (**
+   * Reference identifier.
+   *)
+
+  type t =
+    [
+      | `RefId of
+          RefIdType.fields
+      | `ModuleRefId of
+          ModuleRefIdType.fields
+    ]
+
+  type fields = RefIdType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module DefId : sig
+  (**
+   * Defining identifier.
+   *)
+
+  type t =
+    [
+      | `DefId of
+          DefIdType.fields
+    ]
+
+  type fields = DefIdType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module Id : sig
+  (**
+   * Identifier.
+   *)
+
+  type t =
+    [
+      | `Id of
+          IdType.fields
+      | `DefId of
+          DefIdType.fields
+      | `RefId of
+          RefIdType.fields
+      | `ModuleRefId of
+          ModuleRefIdType.fields
+    ]
+
+  type fields = IdType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module TokenRef : sig
+  (**
+   * Grammar expression for a token reference.
+   *)
+
+  type t =
+    [
+      | `TokenRef of
+          TokenRefType.fields
+    ]
+
+  type fields = TokenRefType.fields =
+    
+  {
+         
+    f_token_name: RefIdType.t
+    Lazy.t;
+         
+    f_expr: TokenLitType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_token_name :
+    [< TokenRefType.t]
+    -> RefIdType.t
+
+      
+  val f_expr :
+    [< TokenRefType.t]
+    -> TokenLitType.t option
+
+
+end
+
+module TokenPatternLit : sig
+  (**
+   * Grammar expression for a pattern literal.
+   *)
+
+  type t =
+    [
+      | `TokenPatternLit of
+          TokenPatternLitType.fields
+    ]
+
+  type fields = TokenPatternLitType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module TokenNoCaseLit : sig
+  (**
+   * Grammar expression for a case insensitive token literal.
+   *)
+
+  type t =
+    [
+      | `TokenNoCaseLit of
+          TokenNoCaseLitType.fields
+    ]
+
+  type fields = TokenNoCaseLitType.fields =
+    
+  {
+         
+    f_lit: TokenLitType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_lit :
+    [< TokenNoCaseLitType.t]
+    -> TokenLitType.t
+
+
+end
+
+module TokenLit : sig
+  (**
+   * Grammar expression for a token literal.
+   *)
+
+  type t =
+    [
+      | `TokenLit of
+          TokenLitType.fields
+    ]
+
+  type fields = TokenLitType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module ParseNodeExpr : sig
+  (**
+   * Expression for the parsing of a Node.
+   *)
+
+  type t =
+    [
+      | `ParseNodeExpr of
+          ParseNodeExprType.fields
+    ]
+
+  type fields = ParseNodeExprType.fields =
+    
+  {
+         
+    f_node_name: TypeRefType.t
+    Lazy.t;
+         
+    f_sub_exprs: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_node_name :
+    [< ParseNodeExprType.t]
+    -> TypeRefType.t
+
+      
+  val f_sub_exprs :
+    [< ParseNodeExprType.t]
+    -> GrammarExprListType.t
+
+
+end
+
+module GrammarSkip : sig
+  (**
+   * Grammar expression (error recovery) to skip a parsing result.
+   *)
+
+  type t =
+    [
+      | `GrammarSkip of
+          GrammarSkipType.fields
+    ]
+
+  type fields = GrammarSkipType.fields =
+    
+  {
+         
+    f_name: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_name :
+    [< GrammarSkipType.t]
+    -> TypeRefType.t
+
+
+end
+
+module GrammarRuleRef : sig
+  (**
+   * Grammar expression for a reference to another grammar rule.
+   *)
+
+  type t =
+    [
+      | `GrammarRuleRef of
+          GrammarRuleRefType.fields
+    ]
+
+  type fields = GrammarRuleRefType.fields =
+    
+  {
+         
+    f_node_name: RefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_node_name :
+    [< GrammarRuleRefType.t]
+    -> RefIdType.t
+
+
+end
+
+module GrammarPredicate : sig
+  (**
+   * Grammar expression for a predicate: Only parse something if the predicate
+   * (that is a reference to a node property) returns True.
+   *)
+
+  type t =
+    [
+      | `GrammarPredicate of
+          GrammarPredicateType.fields
+    ]
+
+  type fields = GrammarPredicateType.fields =
+    
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+         
+    f_prop_ref: [
+      | `DotExpr
+          of DotExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `RefId
+          of RefIdType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< GrammarPredicateType.t]
+    -> GrammarExprType.t
+
+      
+  val f_prop_ref :
+    [< GrammarPredicateType.t]
+    -> [DotExprType.t | RefIdType.t]
+
+
+end
+
+module GrammarImplicitPick : sig
+  (**
+   * Implicit pick operation.
+   *)
+
+  type t =
+    [
+      | `GrammarImplicitPick of
+          GrammarImplicitPickType.fields
+    ]
+
+  type fields = GrammarImplicitPickType.fields =
+    
+  {
+         
+    f_exprs: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_exprs :
+    [< GrammarImplicitPickType.t]
+    -> GrammarExprListType.t
+
+
+end
+
+module GrammarPick : sig
+  (**
+   * Grammar expression to pick the significant parse out of a list of parses
+   * (will automatically discard token results).
+   *)
+
+  type t =
+    [
+      | `GrammarPick of
+          GrammarPickType.fields
+      | `GrammarImplicitPick of
+          GrammarImplicitPickType.fields
+    ]
+
+  type fields = GrammarPickType.fields =
+    
+  {
+         
+    f_exprs: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_exprs :
+    [< GrammarPickType.t]
+    -> GrammarExprListType.t
+
+
+end
+
+module GrammarOrExpr : sig
+  (**
+   * Grammar `Or` expression (disjunctive choice between several grammar
+   * options).
+   *)
+
+  type t =
+    [
+      | `GrammarOrExpr of
+          GrammarOrExprType.fields
+    ]
+
+  type fields = GrammarOrExprType.fields =
+    
+  {
+         
+    f_sub_exprs: GrammarExprListListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_sub_exprs :
+    [< GrammarOrExprType.t]
+    -> GrammarExprListListType.t
+
+
+end
+
+module GrammarOptGroup : sig
+  (**
+   * Grammar expression for a group of optional parsing results.
+   *)
+
+  type t =
+    [
+      | `GrammarOptGroup of
+          GrammarOptGroupType.fields
+    ]
+
+  type fields = GrammarOptGroupType.fields =
+    
+  {
+         
+    f_expr: GrammarExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< GrammarOptGroupType.t]
+    -> GrammarExprListType.t
+
+
+end
+
+module GrammarOpt : sig
+  (**
+   * Grammar expression for an optional parsing result.
+   *)
+
+  type t =
+    [
+      | `GrammarOpt of
+          GrammarOptType.fields
+    ]
+
+  type fields = GrammarOptType.fields =
+    
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< GrammarOptType.t]
+    -> GrammarExprType.t
+
+
+end
+
+module GrammarNull : sig
+  (**
+   * Grammar expression to parse a null node.
+   *)
+
+  type t =
+    [
+      | `GrammarNull of
+          GrammarNullType.fields
+    ]
+
+  type fields = GrammarNullType.fields =
+    
+  {
+         
+    f_name: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_name :
+    [< GrammarNullType.t]
+    -> TypeRefType.t
+
+
+end
+
+module GrammarList : sig
+  (**
+   * Grammar expression to parse lists of results. Results can be separated by a
+   * separator. List can be empty ('*') or not ('+').
+   *)
+
+  type t =
+    [
+      | `GrammarList of
+          GrammarListType.fields
+    ]
+
+  type fields = GrammarListType.fields =
+    
+  {
+         
+    f_list_type: TypeRefType.t
+    option
+    Lazy.t;
+         
+    f_kind: ListKindType.t
+    Lazy.t;
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+         
+    f_sep: GrammarExprType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_list_type :
+    [< GrammarListType.t]
+    -> TypeRefType.t option
+
+      
+  val f_kind :
+    [< GrammarListType.t]
+    -> ListKindType.t
+
+      
+  val f_expr :
+    [< GrammarListType.t]
+    -> GrammarExprType.t
+
+      
+  val f_sep :
+    [< GrammarListType.t]
+    -> GrammarExprType.t option
+
+
+end
+
+module GrammarDontSkip : sig
+  (**
+   * Grammar expression (error recovery) to ensure that any nested skip parser
+   * calls won't skip certain parse results.
+   *)
+
+  type t =
+    [
+      | `GrammarDontSkip of
+          GrammarDontSkipType.fields
+    ]
+
+  type fields = GrammarDontSkipType.fields =
+    
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+         
+    f_dont_skip: GrammarExprType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< GrammarDontSkipType.t]
+    -> GrammarExprType.t
+
+      
+  val f_dont_skip :
+    [< GrammarDontSkipType.t]
+    -> GrammarExprType.t
+
+
+end
+
+module GrammarDiscard : sig
+  (**
+   * Grammar expression to discard the match.
+   *)
+
+  type t =
+    [
+      | `GrammarDiscard of
+          GrammarDiscardType.fields
+    ]
+
+  type fields = GrammarDiscardType.fields =
+    
+  {
+         
+    f_expr: GrammarExprType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< GrammarDiscardType.t]
+    -> GrammarExprType.t
+
+
+end
+
+module GrammarCut : sig
+  (**
+   * Grammar expression for a cut.
+   *)
+
+  type t =
+    [
+      | `GrammarCut of
+          GrammarCutType.fields
+    ]
+
+  type fields = GrammarCutType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module GrammarExpr : sig
+  (**
+   * Base class for expressions related to grammars.
+   *)
+
+  type t =
+    [
+      | ParseNodeExpr.t
+      | GrammarRuleRef.t
+      | GrammarDiscard.t
+      | TokenLit.t
+      | TokenNoCaseLit.t
+      | TokenPatternLit.t
+      | GrammarPick.t
+      | TokenRef.t
+      | GrammarOrExpr.t
+      | GrammarOpt.t
+      | GrammarOptGroup.t
+      | GrammarCut.t
+      | GrammarNull.t
+      | GrammarSkip.t
+      | GrammarPredicate.t
+      | GrammarDontSkip.t
+      | GrammarList.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module GenericInstantiation : sig
+  (**
+   * Generic instantiation.
+   *)
+
+  type t =
+    [
+      | `GenericInstantiation of
+          GenericInstantiationType.fields
+    ]
+
+  type fields = GenericInstantiationType.fields =
+    
+  {
+         
+    f_name: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_args: TypeRefListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+      
+  val p_instantiated_decl :
+    [< GenericInstantiationType.t ]
+    -> DeclType.t option
+  (**
+   * Get the type designated by this instantiation.
+   *)
+
+
+      
+  val f_name :
+    [< GenericInstantiationType.t]
+    -> [ArrayLiteralType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | LitType.t | MatchExprType.t | ParenExprType.t | RefIdType.t]
+
+      
+  val f_args :
+    [< GenericInstantiationType.t]
+    -> TypeRefListType.t
+
+
+end
+
+module ErrorOnNull : sig
+  (**
+   * Expression that throws an error if LHS is null.
+   *)
+
+  type t =
+    [
+      | `ErrorOnNull of
+          ErrorOnNullType.fields
+    ]
+
+  type fields = ErrorOnNullType.fields =
+    
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< ErrorOnNullType.t]
+    -> [ArrayLiteralType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | LitType.t | MatchExprType.t | ParenExprType.t | RefIdType.t]
+
+
+end
+
+module NullCondDottedName : sig
+  (**
+   * Null conditional dotted expression.
+   *)
+
+  type t =
+    [
+      | `NullCondDottedName of
+          NullCondDottedNameType.fields
+    ]
+
+  type fields = NullCondDottedNameType.fields =
+    
+  {
+         
+    f_prefix: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: RefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_prefix :
+    [< NullCondDottedNameType.t]
+    -> [ArrayLiteralType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | LitType.t | MatchExprType.t | ParenExprType.t | RefIdType.t]
+
+      
+  val f_suffix :
+    [< NullCondDottedNameType.t]
+    -> RefIdType.t
+
+
+end
+
+module DotExpr : sig
+  (**
+   * Dotted expression.
+   *)
+
+  type t =
+    [
+      | `DotExpr of
+          DotExprType.fields
+      | `NullCondDottedName of
+          NullCondDottedNameType.fields
+    ]
+
+  type fields = DotExprType.fields =
+    
+  {
+         
+    f_prefix: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: RefIdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_prefix :
+    [< DotExprType.t]
+    -> [ArrayLiteralType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | LitType.t | MatchExprType.t | ParenExprType.t | RefIdType.t]
+
+      
+  val f_suffix :
+    [< DotExprType.t]
+    -> RefIdType.t
+
+
+end
+
+module CastExpr : sig
+  (**
+   * Cast expression.
+   *)
+
+  type t =
+    [
+      | `CastExpr of
+          CastExprType.fields
+    ]
+
+  type fields = CastExprType.fields =
+    
+  {
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_excludes_null: ExcludesNullType.t
+    Lazy.t;
+         
+    f_dest_type: TypeRefType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< CastExprType.t]
+    -> [ArrayLiteralType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | LitType.t | MatchExprType.t | ParenExprType.t | RefIdType.t]
+
+      
+  val f_excludes_null :
+    [< CastExprType.t]
+    -> ExcludesNullType.t
+
+      
+  val f_dest_type :
+    [< CastExprType.t]
+    -> TypeRefType.t
+
+
+end
+
+module NullCondCallExpr : sig
+  (**
+   * Null conditional call expression.
+   *)
+
+  type t =
+    [
+      | `NullCondCallExpr of
+          NullCondCallExprType.fields
+    ]
+
+  type fields = NullCondCallExprType.fields =
+    
+  {
+         
+    f_name: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_args: ParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_name :
+    [< NullCondCallExprType.t]
+    -> [ArrayLiteralType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | LitType.t | MatchExprType.t | ParenExprType.t | RefIdType.t]
+
+      
+  val f_args :
+    [< NullCondCallExprType.t]
+    -> ParamListType.t
+
+
+end
+
+module CallExpr : sig
+  (**
+   * Call expression.
+   *)
+
+  type t =
+    [
+      | `CallExpr of
+          CallExprType.fields
+      | `NullCondCallExpr of
+          NullCondCallExprType.fields
+    ]
+
+  type fields = CallExprType.fields =
+    
+  {
+         
+    f_name: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+    ]
+    Lazy.t;
+         
+    f_args: ParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+      
+  val p_called_object_type :
+    [< CallExprType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Return the type of the called object.
+   *)
+
+      
+  val p_called_decl :
+    [< CallExprType.t ]
+    -> DeclType.t option
+  (**
+   * Return the declaration that is called by this call expression.
+   *)
+
+
+      
+  val f_name :
+    [< CallExprType.t]
+    -> [ArrayLiteralType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | LitType.t | MatchExprType.t | ParenExprType.t | RefIdType.t]
+
+      
+  val f_args :
+    [< CallExprType.t]
+    -> ParamListType.t
+
+
+end
+
+module BlockExpr : sig
+  (**
+   * Block expression.
+   *)
+
+  type t =
+    [
+      | `BlockExpr of
+          BlockExprType.fields
+    ]
+
+  type fields = BlockExprType.fields =
+    
+  {
+         
+    f_val_defs: LKNodeListType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_val_defs :
+    [< BlockExprType.t]
+    -> LKNodeListType.t
+
+      
+  val f_expr :
+    [< BlockExprType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+
+end
+
+module BinOp : sig
+  (**
+   * Binary operator expression.
+   *)
+
+  type t =
+    [
+      | `BinOp of
+          BinOpType.fields
+    ]
+
+  type fields = BinOpType.fields =
+    
+  {
+         
+    f_left: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_left :
+    [< BinOpType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+      
+  val f_op :
+    [< BinOpType.t]
+    -> OpType.t
+
+      
+  val f_right :
+    [< BinOpType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+
+end
+
+module ArrayLiteral : sig
+  (**
+   * Literal for an array value.
+   *)
+
+  type t =
+    [
+      | `ArrayLiteral of
+          ArrayLiteralType.fields
+    ]
+
+  type fields = ArrayLiteralType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_exprs :
+    [< ArrayLiteralType.t]
+    -> ExprListType.t
+
+
+end
+
+module Expr : sig
+  (**
+   * Base class for expressions. Encompasses regular expressions as well as
+   * special expressions (grammar expressions, etc).
+   *)
+
+  type t =
+    [
+      | GrammarExpr.t
+      | DotExpr.t
+      | Id.t
+      | ArrayLiteral.t
+      | NotExpr.t
+      | CastExpr.t
+      | Isa.t
+      | ParenExpr.t
+      | CallExpr.t
+      | GenericInstantiation.t
+      | ErrorOnNull.t
+      | LambdaExpr.t
+      | TryExpr.t
+      | RaiseExpr.t
+      | IfExpr.t
+      | BlockExpr.t
+      | MatchExpr.t
+      | BinOp.t
+      | Lit.t
+      | LogicExpr.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+      
+  val p_in_type_ref :
+    [< ExprType.t ]
+    -> bool
+  (**
+   * Return whether this expression is part of a type reference.
+   *)
+
+      
+  val p_is_regular_expr :
+    [< ExprType.t ]
+    -> bool
+  (**
+   * Return whether this expression is a regular expression that can be
+   * evaluated at runtime, in particular:
+  
+   * * Not part of a type reference.
+  
+   * * Not part of a declaration annotation.
+  
+   * * Not a defining identifier.
+  
+   * TODO: List  to be expanded probably to take into account grammar
+   * expressions.
+   *)
+
+      
+  val p_expr_type :
+    [< ExprType.t ]
+    -> SemanticResult.t
+  (**
+   * Return the type of this expression, if it is a regular expression (see
+   * ``is_regular_expr``), null otherwise.
+   *)
+
+      
+  val p_check_expr_type :
+    [< ExprType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Return the type of this expression. Assumes that this is a regular and
+   * valid expression. If this is called on a non regular or non valid
+   * expression, it will raise an error.
+   *)
+
+      
+  val p_expr_context_free_type :
+    [< ExprType.t ]
+    -> TypeDeclType.t option
+  (**
+   * If the type of this expression can be determined with no bottom up context,
+   * return it. This will be used by `expr_type_impl`'s default implementation.
+   *)
+
+      
+  val p_referenced_decl :
+    [< ExprType.t ]
+    -> SemanticResult.t
+  (**
+   * Return the declaration referenced by this expression, if applicable, null
+   * otherwise.
+   *)
+
+      
+  val p_check_referenced_decl :
+    [< ExprType.t ]
+    -> DeclType.t option
+  (**
+   * Return the referenced decl of this expr, raise otherwise.
+   *)
+
+
+
+end
+
+module ExcludesNullPresent : sig
+  
+
+  type t =
+    [
+      | `ExcludesNullPresent of
+          ExcludesNullPresentType.fields
+    ]
+
+  type fields = ExcludesNullPresentType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module ExcludesNullAbsent : sig
+  
+
+  type t =
+    [
+      | `ExcludesNullAbsent of
+          ExcludesNullAbsentType.fields
+    ]
+
+  type fields = ExcludesNullAbsentType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module ExcludesNull : sig
+  (**
+   * Whether the containing cast expression will raise on null cast result or
+   * not.
+   *)
+
+  type t =
+    [
+      | ExcludesNullPresent.t
+      | ExcludesNullAbsent.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+      
+  val p_as_bool :
+    [< ExcludesNullType.t ]
+    -> bool
+  (**
+   * Return whether this is an instance of ExcludesNullPresent
+   *)
+
+
+
+end
+
+module EnumClassCase : sig
+  (**
+   * Case branch for an enum class declaration.
+   *)
+
+  type t =
+    [
+      | `EnumClassCase of
+          EnumClassCaseType.fields
+    ]
+
+  type fields = EnumClassCaseType.fields =
+    
+  {
+         
+    f_decls: EnumClassAltDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_decls :
+    [< EnumClassCaseType.t]
+    -> EnumClassAltDeclListType.t
+
+
+end
+
+module ElsifBranch : sig
+  (**
+   * Elsif branch of an if expression.
+   *)
+
+  type t =
+    [
+      | `ElsifBranch of
+          ElsifBranchType.fields
+    ]
+
+  type fields = ElsifBranchType.fields =
+    
+  {
+         
+    f_cond_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+         
+    f_then_expr: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_cond_expr :
+    [< ElsifBranchType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+      
+  val f_then_expr :
+    [< ElsifBranchType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+
+end
+
+module DocComment : sig
+  (**
+   * Node for one line of documentation attached to a node.
+   *)
+
+  type t =
+    [
+      | `DocComment of
+          DocCommentType.fields
+    ]
+
+  type fields = DocCommentType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module Doc : sig
+  (**
+   * Documentation attached to a decl node.
+   *)
+
+  type t =
+    [
+      | `Doc of
+          DocType.fields
+    ]
+
+  type fields = DocType.fields =
+    
+  {
+         
+    f_lines: DocCommentListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_lines :
+    [< DocType.t]
+    -> DocCommentListType.t
+
+
+end
+
+module DeclAnnotationParams : sig
+  (**
+   * List of arguments for an annotation with a call syntax. This intermediate
+   * node is necessary in order to determine after parsing whether there is no
+   * param list, or if the list is empty.
+   *)
+
+  type t =
+    [
+      | `DeclAnnotationParams of
+          DeclAnnotationParamsType.fields
+    ]
+
+  type fields = DeclAnnotationParamsType.fields =
+    
+  {
+         
+    f_params: ParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_params :
+    [< DeclAnnotationParamsType.t]
+    -> ParamListType.t
+
+
+end
+
+module DeclAnnotation : sig
+  (**
+   * Compile time annotation attached to a declaration.
+   *)
+
+  type t =
+    [
+      | `DeclAnnotation of
+          DeclAnnotationType.fields
+    ]
+
+  type fields = DeclAnnotationType.fields =
+    
+  {
+         
+    f_name: IdType.t
+    Lazy.t;
+         
+    f_params: DeclAnnotationParamsType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_name :
+    [< DeclAnnotationType.t]
+    -> IdType.t
+
+      
+  val f_params :
+    [< DeclAnnotationType.t]
+    -> DeclAnnotationParamsType.t option
+
+
+end
+
+module TraitDecl : sig
+  (**
+   * Trait declaration. For the moment, a Trait can just be used to group
+   * behavior for built-in types. It's not usable as a type-bound since we don't
+   * have generics, and you cannot implement one either.
+  
+   * The reason they're added is to lay down the basics of what we want the LKT
+   * type system to be.
+  
+   * TODO: Traits are *not* types. They're treated as such in the grammar for
+   * convenience for now, but it's probably not a good idea. Migrate away from
+   * this.
+   *)
+
+  type t =
+    [
+      | `TraitDecl of
+          TraitDeclType.fields
+    ]
+
+  type fields = TraitDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module StructDecl : sig
+  (**
+   * Declaration for a LK struct.
+   *)
+
+  type t =
+    [
+      | `StructDecl of
+          StructDeclType.fields
+    ]
+
+  type fields = StructDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module EnumTypeDecl : sig
+  (**
+   * Enum type declaration.
+   *)
+
+  type t =
+    [
+      | `EnumTypeDecl of
+          EnumTypeDeclType.fields
+    ]
+
+  type fields = EnumTypeDeclType.fields =
+    
+  {
+         
+    f_literals: EnumLitDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_literals :
+    [< EnumTypeDeclType.t]
+    -> EnumLitDeclListType.t
+
+
+end
+
+module EnumClassDecl : sig
+  (**
+   * Declaration for a LK class. This only cover node classes for the moment,
+   * but might be extended to support regular classes in the future.
+   *)
+
+  type t =
+    [
+      | `EnumClassDecl of
+          EnumClassDeclType.fields
+    ]
+
+  type fields = EnumClassDeclType.fields =
+    
+  {
+         
+    f_branches: EnumClassCaseListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_branches :
+    [< EnumClassDeclType.t]
+    -> EnumClassCaseListType.t
+
+
+end
+
+module ClassDecl : sig
+  (**
+   * Declaration for a LK class. This only cover node classes for the moment,
+   * but might be extended to support regular classes in the future.
+   *)
+
+  type t =
+    [
+      | `ClassDecl of
+          ClassDeclType.fields
+    ]
+
+  type fields = ClassDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module BasicClassDecl : sig
+  (**
+   * Common ancestor for declarations of regular classes and enum classes.
+   *)
+
+  type t =
+    [
+      | ClassDecl.t
+      | EnumClassDecl.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module NamedTypeDecl : sig
+  (**
+   * Explicit named type declaration.
+   *)
+
+  type t =
+    [
+      | TraitDecl.t
+      | EnumTypeDecl.t
+      | StructDecl.t
+      | BasicClassDecl.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module InstantiatedGenericType : sig
+  (**
+   * Instantiated generic type.
+   *)
+
+  type t =
+    [
+      | `InstantiatedGenericType of
+          InstantiatedGenericTypeType.fields
+    ]
+
+  type fields = InstantiatedGenericTypeType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+      
+  val p_get_inner_type :
+    [< InstantiatedGenericTypeType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Return the generic type that ``self`` instantiates.
+   *)
+
+      
+  val p_get_actuals :
+    [< InstantiatedGenericTypeType.t ]
+    -> TypeDeclType.t list
+  (**
+   * Return the declaration of types that were passed as generic actuals to
+   * create ``self``.
+   *)
+
+      
+  val p_get_instantiated_type :
+    [< InstantiatedGenericTypeType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Return the instantiated type decl with proper rebindings, that can be used
+   * for typing and code generation.
+   *)
+
+
+
+end
+
+module GenericFormalTypeDecl : sig
+  (**
+   * Declaration of a generic formal type in a generic declaration.
+   *)
+
+  type t =
+    [
+      | `GenericFormalTypeDecl of
+          GenericFormalTypeDeclType.fields
+    ]
+
+  type fields = GenericFormalTypeDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module FunctionType : sig
+  (**
+   * Function type.
+   *)
+
+  type t =
+    [
+      | `FunctionType of
+          FunctionTypeType.fields
+    ]
+
+  type fields = FunctionTypeType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module EnumClassAltDecl : sig
+  (**
+   * Alternative for an enum class decl.
+   *)
+
+  type t =
+    [
+      | `EnumClassAltDecl of
+          EnumClassAltDeclType.fields
+    ]
+
+  type fields = EnumClassAltDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module TypeDecl : sig
+  (**
+   * Abstract base class for type declarations.
+   *)
+
+  type t =
+    [
+      | FunctionType.t
+      | GenericFormalTypeDecl.t
+      | NamedTypeDecl.t
+      | InstantiatedGenericType.t
+      | EnumClassAltDecl.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+      
+  val p_implemented_traits :
+    [< TypeDeclType.t ]
+    -> TypeDeclType.t list
+  (**
+   * Traits implemented by this type.
+   *)
+
+      
+  val p_base_types :
+    [< TypeDeclType.t ]
+    -> TypeDeclType.t list
+  (**
+   * Return the chain of base types for this type, if applicable, else null.
+   *)
+
+      
+  val p_root_type :
+    [< TypeDeclType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Return the root type of this type, if applicable, else null.
+   *)
+
+      
+  val p_is_subtype :
+    [< TypeDeclType.t ]
+    -> TypeDeclType.t
+    -> bool
+  (**
+   * Return whether ``self`` is a subtype of ``potential_base``.
+   *)
+
+      
+  val p_is_generic :
+    [< TypeDeclType.t ]
+    -> bool
+  (**
+   * Returns whether this type is an instantiated generic type.
+   *)
+
+
+
+end
+
+module LexerFamilyDecl : sig
+  (**
+   * Declaration of a token family.
+   *)
+
+  type t =
+    [
+      | `LexerFamilyDecl of
+          LexerFamilyDeclType.fields
+    ]
+
+  type fields = LexerFamilyDeclType.fields =
+    
+  {
+         
+    f_rules: FullDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_rules :
+    [< LexerFamilyDeclType.t]
+    -> FullDeclListType.t
+
+
+end
+
+module LexerDecl : sig
+  (**
+   * Declaration of a language's lexer.
+   *)
+
+  type t =
+    [
+      | `LexerDecl of
+          LexerDeclType.fields
+    ]
+
+  type fields = LexerDeclType.fields =
+    
+  {
+         
+    f_rules: LKNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_rules :
+    [< LexerDeclType.t]
+    -> LKNodeListType.t
+
+
+end
+
+module GenericDecl : sig
+  (**
+   * Generic entity declaration.
+   *)
+
+  type t =
+    [
+      | `GenericDecl of
+          GenericDeclType.fields
+    ]
+
+  type fields = GenericDeclType.fields =
+    
+  {
+         
+    f_generic_formal_decls: FullDeclListType.t
+    Lazy.t;
+         
+    f_decl: [
+      | `ClassDecl
+          of ClassDeclType.fields
+      | `EnumClassDecl
+          of EnumClassDeclType.fields
+      | `EnumTypeDecl
+          of EnumTypeDeclType.fields
+      | `FieldDecl
+          of FieldDeclType.fields
+      | `FunDecl
+          of FunDeclType.fields
+      | `GenericDecl
+          of fields
+      | `GrammarDecl
+          of GrammarDeclType.fields
+      | `GrammarRuleDecl
+          of GrammarRuleDeclType.fields
+      | `LexerDecl
+          of LexerDeclType.fields
+      | `StructDecl
+          of StructDeclType.fields
+      | `TraitDecl
+          of TraitDeclType.fields
+      | `ValDecl
+          of ValDeclType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_generic_formal_decls :
+    [< GenericDeclType.t]
+    -> FullDeclListType.t
+
+      
+  val f_decl :
+    [< GenericDeclType.t]
+    -> [BaseGrammarDeclType.t | FieldDeclType.t | FunDeclType.t | GenericDeclType.t | GrammarRuleDeclType.t | LexerDeclType.t | NamedTypeDeclType.t | ValDeclType.t]
+
+
+end
+
+module FunDecl : sig
+  (**
+   * Function declaration.
+   *)
+
+  type t =
+    [
+      | `FunDecl of
+          FunDeclType.fields
+    ]
+
+  type fields = FunDeclType.fields =
+    
+  {
+         
+    f_args: FunArgDeclListType.t
+    Lazy.t;
+         
+    f_return_type: TypeRefType.t
+    Lazy.t;
+         
+    f_body: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_args :
+    [< FunDeclType.t]
+    -> FunArgDeclListType.t
+
+      
+  val f_return_type :
+    [< FunDeclType.t]
+    -> TypeRefType.t
+
+      
+  val f_body :
+    [< FunDeclType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t] option
+
+
+end
+
+module ValDecl : sig
+  (**
+   * Value declaration.
+   *)
+
+  type t =
+    [
+      | `ValDecl of
+          ValDeclType.fields
+    ]
+
+  type fields = ValDeclType.fields =
+    
+  {
+         
+    f_val: [
+      | `ArrayLiteral
+          of ArrayLiteralType.fields
+      | `BinOp
+          of BinOpType.fields
+      | `BlockExpr
+          of BlockExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CastExpr
+          of CastExprType.fields
+      | `CharLit
+          of CharLitType.fields
+      | `DotExpr
+          of DotExprType.fields
+      | `ErrorOnNull
+          of ErrorOnNullType.fields
+      | `GenericInstantiation
+          of GenericInstantiationType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `Isa
+          of IsaType.fields
+      | `LambdaExpr
+          of LambdaExprType.fields
+      | `LogicExpr
+          of LogicExprType.fields
+      | `MatchExpr
+          of MatchExprType.fields
+      | `ModuleRefId
+          of ModuleRefIdType.fields
+      | `NotExpr
+          of NotExprType.fields
+      | `NullCondCallExpr
+          of NullCondCallExprType.fields
+      | `NullCondDottedName
+          of NullCondDottedNameType.fields
+      | `NullLit
+          of NullLitType.fields
+      | `NumLit
+          of NumLitType.fields
+      | `ParenExpr
+          of ParenExprType.fields
+      | `RaiseExpr
+          of RaiseExprType.fields
+      | `RefId
+          of RefIdType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `TryExpr
+          of TryExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_val :
+    [< ValDeclType.t]
+    -> [ArrayLiteralType.t | BinOpType.t | BlockExprType.t | CallExprType.t | CastExprType.t | DotExprType.t | ErrorOnNullType.t | GenericInstantiationType.t | IfExprType.t | IsaType.t | LambdaExprType.t | LitType.t | LogicExprType.t | MatchExprType.t | NotExprType.t | ParenExprType.t | RaiseExprType.t | RefIdType.t | TryExprType.t]
+
+
+end
+
+module MatchValDecl : sig
+  (**
+   * Value declaration in a match branch.
+   *)
+
+  type t =
+    [
+      | `MatchValDecl of
+          MatchValDeclType.fields
+    ]
+
+  type fields = MatchValDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module LambdaArgDecl : sig
+  (**
+   * Function argument declaration.
+   *)
+
+  type t =
+    [
+      | `LambdaArgDecl of
+          LambdaArgDeclType.fields
+    ]
+
+  type fields = LambdaArgDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module FunArgDecl : sig
+  (**
+   * Function argument declaration.
+   *)
+
+  type t =
+    [
+      | `FunArgDecl of
+          FunArgDeclType.fields
+    ]
+
+  type fields = FunArgDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module FieldDecl : sig
+  (**
+   * Field declaration.
+   *)
+
+  type t =
+    [
+      | `FieldDecl of
+          FieldDeclType.fields
+    ]
+
+  type fields = FieldDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module ComponentDecl : sig
+  (**
+   * Subset of explicitly typed declarations for value declarations that:
+  
+   * 1. Have an optional default value. 2. Are part of a bigger declaration that
+   * can be referred to via a call expression (either a type or a function).
+   *)
+
+  type t =
+    [
+      | FunArgDecl.t
+      | LambdaArgDecl.t
+      | FieldDecl.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module ExplicitlyTypedDecl : sig
+  (**
+   * Subset of user declared value declarations for values that have a type that
+   * can be syntactically annotated by the user.
+   *)
+
+  type t =
+    [
+      | ComponentDecl.t
+      | MatchValDecl.t
+      | ValDecl.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module EnumLitDecl : sig
+  (**
+   * Enum literal declaration.
+   *)
+
+  type t =
+    [
+      | `EnumLitDecl of
+          EnumLitDeclType.fields
+    ]
+
+  type fields = EnumLitDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module UserValDecl : sig
+  (**
+   * Class for user declared val declarations (not synthetic).
+   *)
+
+  type t =
+    [
+      | FunDecl.t
+      | EnumLitDecl.t
+      | ExplicitlyTypedDecl.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module SelfDecl : sig
+  (**
+   * Synthetic declaration for the implicit "self" variable available in
+   * properties.
+   *)
+
+  type t =
+    [
+      | `SelfDecl of
+          SelfDeclType.fields
+    ]
+
+  type fields = SelfDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module NodeDecl : sig
+  (**
+   * Synthetic declaration for the implicit "node" variable available in
+   * properties.
+   *)
+
+  type t =
+    [
+      | `NodeDecl of
+          NodeDeclType.fields
+    ]
+
+  type fields = NodeDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module BaseValDecl : sig
+  (**
+   * Abstract class for named values declarations, such as arguments, local
+   * value bindings, fields, etc.
+   *)
+
+  type t =
+    [
+      | SelfDecl.t
+      | NodeDecl.t
+      | UserValDecl.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+      
+  val p_get_type :
+    ?no_inference:
+    bool
+    -> [< BaseValDeclType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Get the type of this value declaration.
+   *)
+
+
+
+end
+
+module SyntheticLexerDecl : sig
+  
+
+  type t =
+    [
+      | `SyntheticLexerDecl of
+          SyntheticLexerDeclType.fields
+    ]
+
+  type fields = SyntheticLexerDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module GrammarRuleDecl : sig
+  (**
+   * Declaration of a grammar rule inside of a grammar.
+   *)
+
+  type t =
+    [
+      | `GrammarRuleDecl of
+          GrammarRuleDeclType.fields
+    ]
+
+  type fields = GrammarRuleDeclType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module BaseGrammarRuleDecl : sig
+  (**
+   * Base class for grammar rules inside of grammars/lexers.
+   *)
+
+  type t =
+    [
+      | GrammarRuleDecl.t
+      | SyntheticLexerDecl.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module GrammarDecl : sig
+  (**
+   * Declaration of a language's grammar.
+   *)
+
+  type t =
+    [
+      | `GrammarDecl of
+          GrammarDeclType.fields
+    ]
+
+  type fields = GrammarDeclType.fields =
+    
+  {
+         
+    f_rules: FullDeclListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+      
+  val p_lexer :
+    [< GrammarDeclType.t ]
+    -> DeclType.t option
+  (**
+   * Return the lexer that is associated to this grammar.
+   *)
+
+
+      
+  val f_rules :
+    [< GrammarDeclType.t]
+    -> FullDeclListType.t
+
+
+end
+
+module BaseGrammarDecl : sig
+  (**
+   * Base class for all declarations related to grammars.
+   *)
+
+  type t =
+    [
+      | GrammarDecl.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module Decl : sig
+  (**
+   * Base class for declarations. Encompasses regular declarations as well as
+   * special declarations such as grammars, grammar rules, etc.
+   *)
+
+  type t =
+    [
+      | LexerDecl.t
+      | LexerFamilyDecl.t
+      | BaseGrammarDecl.t
+      | BaseGrammarRuleDecl.t
+      | TypeDecl.t
+      | GenericDecl.t
+      | BaseValDecl.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+      
+  val p_name :
+    [< DeclType.t ]
+    -> string
+  (**
+   * Return the symbol corresponding to the name of this declaration.
+   *)
+
+
+
+end
+
+module LexerCaseRuleDefaultAlt : sig
+  (**
+   * Default alternative of a case rule which sends the token if all the
+   * previous alternatives failed.
+   *)
+
+  type t =
+    [
+      | `LexerCaseRuleDefaultAlt of
+          LexerCaseRuleDefaultAltType.fields
+    ]
+
+  type fields = LexerCaseRuleDefaultAltType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module LexerCaseRuleCondAlt : sig
+  (**
+   * Alternative of a case rule which sends the token only if the kind of the
+   * previous token is among a given set.
+   *)
+
+  type t =
+    [
+      | `LexerCaseRuleCondAlt of
+          LexerCaseRuleCondAltType.fields
+    ]
+
+  type fields = LexerCaseRuleCondAltType.fields =
+    
+  {
+         
+    f_cond_exprs: RefIdListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_cond_exprs :
+    [< LexerCaseRuleCondAltType.t]
+    -> RefIdListType.t
+
+
+end
+
+module BaseLexerCaseRuleAlt : sig
+  (**
+   * Base class for the different kind of alternatives allowed in a case rule.
+   *)
+
+  type t =
+    [
+      | LexerCaseRuleCondAlt.t
+      | LexerCaseRuleDefaultAlt.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module LKNode : sig
+  (**
+   * Root node class for lkt AST nodes.
+   *)
+
+  type t =
+    [
+      | LKNodeBaseList.t
+      | LangkitRoot.t
+      | Import.t
+      | FullDecl.t
+      | Decl.t
+      | Expr.t
+      | LexerCaseRule.t
+      | BaseLexerCaseRuleAlt.t
+      | LexerCaseRuleSend.t
+      | ListKind.t
+      | EnumClassCase.t
+      | DocComment.t
+      | Doc.t
+      | TypeRef.t
+      | ExcludesNull.t
+      | DeclAnnotation.t
+      | DeclAnnotationParams.t
+      | Param.t
+      | ElsifBranch.t
+      | MatchBranch.t
+      | Op.t
+      | VarBind.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+  val kind_name : [< LKNodeType.t] -> string
+  (**
+   * Return the kind of this node.
+   *)
+
+  val text : [< LKNodeType.t ] -> string
+  (**
+   * Return the source buffer slice corresponding to the text that spans
+   * between the first and the last tokens of the given node.
+   *)
+
+  val image : [< LKNodeType.t ] -> string
+  (**
+   * Return a representation of this node as a string.
+   *)
+
+  val sloc_range : [< LKNodeType.t ] -> SlocRange.t
+  (**
+   * Return the spanning source location range for this node.
+  
+   * Note that this returns the sloc of the parent for synthetic nodes.
+   *)
+
+  val lookup : [< LKNodeType.t ] -> Sloc.t -> LKNodeType.t option
+  (**
+   * Return the bottom-most node from in ``Node`` and its children which
+   * contains ``Sloc``, or ``None`` if there is none.
+   *)
+
+  
+  val fold_tokens : ('a -> Token.t -> 'a) -> 'a -> [< LKNodeType.t] -> 'a
+  (**
+   * Fold all the token this node contains by calling f on each token.
+   *)
+
+  val iter_tokens : (Token.t -> unit) -> [< LKNodeType.t]-> unit
+  (**
+   * Iterate over all token this node contains by calling f on each token.
+   *)
+
+  val map_tokens : (Token.t -> 'a) -> [< LKNodeType.t] -> 'a list
+  (**
+   * Map each token calling the given function
+   *)
+
+  val tokens : [< LKNodeType.t] -> Token.t list
+  (**
+   * Return a list of tokens for the given node
+   *)
+
+
+  val entity_image : [< LKNodeType.t ] -> string
+
+  val children_opt : [< LKNodeType.t ] -> LKNodeType.t option list
+  (**
+   * Return an optional list of nodes which are the children of the given node.
+   * Each child is optional because it can either be because of a syntax error,
+   * or an optional field evaluated to null.
+   *)
+
+  val fold_fields :
+    ('a -> LKNodeType.t -> 'a) -> 'a -> [< LKNodeType.t ] -> 'a
+  (**
+   * Fold all fields of the given node. This skips any child that is None
+   * because of a syntax error or because the field is optional
+   *)
+
+  val iter_fields :
+    (LKNodeType.t -> unit) -> [< LKNodeType.t ] -> unit
+  (**
+   * Iter all fields of the given node. This skips any child that is None
+   * because of a syntax error or because the field is optional
+   *)
+
+  val exists_fields :
+    (LKNodeType.t -> bool) -> [< LKNodeType.t ] -> bool
+  (**
+   * Fold all fields of the given node. Return true if the given predicate is
+   * evaluated to true for at least one node.
+   *)
+
+  val for_all_fields :
+    (LKNodeType.t -> bool) -> [< LKNodeType.t ] -> bool
+  (**
+   * Fold all fields of the given node. Return true if the given predicate is
+   * evaluated to true for all nodes.
+   *)
+
+  val fold :
+    ('a -> LKNodeType.t -> 'a) -> 'a -> [< LKNodeType.t ] -> 'a
+  (**
+   * Fold the entire AST, below the given node, and call the given function on
+   * each node in prefix order.
+   *)
+
+  val iter :
+    (LKNodeType.t -> unit) -> [< LKNodeType.t ] -> unit
+  (**
+   * Iterate over the entire AST, below the given node, and call the given
+   * function on each node in prefix order.
+   *)
+
+  val filter :
+    (LKNodeType.t -> bool)
+    -> [< LKNodeType.t ]
+    -> LKNodeType.t list
+  (**
+   * Fold the entire AST, below the given node, and return the list of node
+   * evaluated to true by the given function
+   *)
+
+  val exists :
+    (LKNodeType.t -> bool) -> [< LKNodeType.t ] -> bool
+  (**
+   * Fold the entire AST, below the given node, and return true if the given
+   * predicate is evaluated to true by at least one node.
+   *)
+
+  val for_all :
+    (LKNodeType.t -> bool) -> [< LKNodeType.t ] -> bool
+  (**
+   * Fold the entire AST, below the given node, and return true if the given
+   * predicate is evaluated to true for all nodes.
+   *)
+
+  val lookup_with_kind :
+    'a node -> [< LKNodeType.t] -> Sloc.t -> 'a option
+  (**
+   * Given the kind of a node, a source location and a node, return the deepest
+   * node containing the source location and of the right kind. Returns None if
+   * there is no match.
+   *)
+
+  val as_a : 'a node -> [< LKNodeType.t ] -> 'a option
+  (**
+   * Given the kind of a node, try to cast the given node to this kind. Return
+   * None if the node is not of this type and thus, cannot be cast.
+   *)
+
+  val find : 'a node -> [< LKNodeType.t ] -> 'a
+  (**
+   * Given the kind of node, return the first node found by walking the given
+   * node. The type of the resulting node depends on the desired kind
+   *)
+
+
+  val findall : 'a node -> [< LKNodeType.t ] -> 'a list
+  (**
+   * Given the kind of node, return the all nodes of this kind found by walking
+   * the given node. The type of the resulting nodes depends on the desired
+   * kind
+   *)
+
+  val fields_with_names :
+    [< LKNodeType.t ] -> (string * LKNodeType.t option) list
+  (**
+   * Given a node, return the list of it's fields, together with the name of
+   * the field. This function does not raise SyntaxError, but instead the
+   * returned node is None.
+   *)
+
+  val pp_tree : Format.formatter -> [< LKNodeType.t] -> unit
+  (**
+   * Pretty print the whole tree by completely walking it.
+   *)
+
+
+      
+  val p_node_type :
+    [< LKNodeType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Unit method. Return the Node base class.
+   *)
+
+      
+  val p_char_type :
+    [< LKNodeType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Unit method. Return the character builtin type.
+   *)
+
+      
+  val p_int_type :
+    [< LKNodeType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Unit method. Return the integer builtin type.
+   *)
+
+      
+  val p_bool_type :
+    [< LKNodeType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Unit method. Return the boolean builtin type.
+   *)
+
+      
+  val p_bigint_type :
+    [< LKNodeType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Unit method. Return the big integer builtin type.
+   *)
+
+      
+  val p_string_type :
+    [< LKNodeType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Unit method. Return the string builtin type.
+   *)
+
+      
+  val p_symbol_type :
+    [< LKNodeType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Unit method. Return the string builtin type.
+   *)
+
+      
+  val p_regexp_type :
+    [< LKNodeType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Unit method. Return the regexp builtin type.
+   *)
+
+      
+  val p_array_gen_type :
+    [< LKNodeType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Unit method. Return the array builtin type.
+   *)
+
+      
+  val p_astlist_gen_type :
+    [< LKNodeType.t ]
+    -> TypeDeclType.t option
+  (**
+   * Unit method. Return the ASTList builtin generic type.
+   *)
+
+      
+  val p_iterator_gen_trait :
+    [< LKNodeType.t ]
+    -> TraitDeclType.t option
+  (**
+   * Unit method. Return the Iterator builtin generic trait.
+   *)
+
+      
+  val p_check_semantic :
+    [< LKNodeType.t ]
+    -> TreeSemanticResult.t
+  (**
+   * Run name and type resolution on all relevant entities in this subtree,
+   * aggregating and returning the results.
+  
+   * If you ran this and the result's `has_error` flag is false, then you *know*
+   * that you can call semantic properties such as `referenced_decl` and
+   * `expr_type`, and those will never raise.
+   *)
+
+      
+  val parent :
+    [< LKNodeType.t ]
+    -> LKNodeType.t option
+  (**
+   * Return the lexical parent for this node. Return null for the root AST node
+   * or for AST nodes for which no one has a reference to the parent.
+   *)
+
+      
+  val parents :
+    [< LKNodeType.t ]
+    -> LKNodeType.t list
+  (**
+   * Return an array that contains the lexical parents (this node included).
+   * Nearer parents are first in the list.
+   *)
+
+      
+  val children :
+    [< LKNodeType.t ]
+    -> LKNodeType.t list
+  (**
+   * Return an array that contains the direct lexical children.
+   *)
+
+      
+  val token_start :
+    [< LKNodeType.t ]
+    -> Token.t
+  (**
+   * Return the first token used to parse this node.
+   *)
+
+      
+  val token_end :
+    [< LKNodeType.t ]
+    -> Token.t
+  (**
+   * Return the last token used to parse this node.
+   *)
+
+      
+  val child_index :
+    [< LKNodeType.t ]
+    -> int
+  (**
+   * Return the 0-based index for Node in its parent's children.
+   *)
+
+      
+  val previous_sibling :
+    [< LKNodeType.t ]
+    -> LKNodeType.t option
+  (**
+   * Return the node's previous sibling, if there is one.
+   *)
+
+      
+  val next_sibling :
+    [< LKNodeType.t ]
+    -> LKNodeType.t option
+  (**
+   * Return the node's next sibling, if there is one.
+   *)
+
+      
+  val unit :
+    [< LKNodeType.t ]
+    -> AnalysisUnit.t
+  (**
+   * Return the analysis unit owning this node.
+   *)
+
+      
+  val is_ghost :
+    [< LKNodeType.t ]
+    -> bool
+  (**
+   * Return whether the node is a ghost.
+  
+   * Unlike regular nodes, ghost nodes cover no token in the input source: they
+   * are logically located instead between two tokens. The "token_first" of all
+   * ghost nodes is the token right after this logical position, while they have
+   * no "token_last".
+   *)
+
+      
+  val full_sloc_image :
+    [< LKNodeType.t ]
+    -> string
+  (**
+   * Return a string containing the filename + the sloc in GNU conformant
+   * format. Useful to create diagnostics from a node.
+   *)
+
+
+
+end
+
+
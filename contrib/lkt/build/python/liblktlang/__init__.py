@@ -0,0 +1,11225 @@
+
+"""
+Python binding of the Liblktlang API.
+
+Please consider all exported entities whose names that start with an underscore
+("_") as internal implementation details. They are not meant to be used
+directly.
+"""
+
+
+
+
+
+
+from __future__ import absolute_import, division, print_function
+
+
+
+
+
+import argparse
+import collections
+import ctypes
+import json
+import os
+import sys
+import weakref
+
+import liblktlang._py2to3 as _py2to3
+
+
+#
+# Low-level binding - First part
+#
+
+_so_ext = {
+    'win32':  'dll',
+    'darwin': 'dylib',
+}.get(sys.platform, 'so')
+
+# Loading the shared library here is quite involved as we want to support
+# Python packages that embed all the required shared libraries: if we can
+# find the shared library in the package directory, import it from there
+# directly.
+
+# Directory that contains this __init__.py module
+_self_path = os.path.dirname(os.path.abspath(__file__))
+
+# Base and full names for the shared library to load. Full name assumes the
+# shared lib is in the package directory.
+_c_lib_name = 'liblktlang.{}'.format(_so_ext)
+_c_lib_path = os.path.join(_self_path, _c_lib_name)
+
+# If we can find the shared lirbray in the package directory, load it from
+# here, otherwise let the dynamic loader find it in the environment. On
+# Windows, there is no RPATH trick, so we need to temporarily alter the PATH
+# environment variable in order to import the whole closure of DLLs.
+_old_env_path = None
+if os.path.exists(_c_lib_path):
+    if sys.platform == 'win32':
+        _old_env_path = os.environ['PATH']
+        os.environ['PATH'] = '{}{}{}'.format(_self_path, os.path.pathsep,
+                                             os.environ['PATH'])
+else:
+    _c_lib_path = _c_lib_name
+
+# Finally load the library
+_c_lib = ctypes.cdll.LoadLibrary(_c_lib_path)
+
+# Restore the PATH environment variable if we altered it
+if _old_env_path is not None:
+    os.environ['PATH'] = _old_env_path
+
+
+def _import_func(name, argtypes, restype, exc_wrap=True):
+    """
+    Import "name" from the C library, set its arguments/return types and return
+    the binding.
+
+    :param str name: Name of the symbol for the function to import.
+    :param list[ctypes._CData] argtypes: Types for function argruments.
+    :param None|ctypes._CData restype: Function return type, or None if it
+        does not return anything.
+    :param bool exc_wrap: If True, wrap the returned function to check for
+      exceptions.
+    """
+    func = getattr(_c_lib, name)
+    func.argtypes = argtypes
+    func.restype = restype
+
+    # Wrapper for "func" that raises a NativeException in case of internal
+    # error.
+    #
+    # These wrappers are on the path of all calls to the C API, so make them
+    # as cheap as possible. First, build them with exactly one parameter per C
+    # function argument: this way, the interpreter itself rejects calls with
+    # an incorrect number of arguments, so there is no need to count them at
+    # each call. Second, checking for errors just reads the exported
+    # "last_exception" variable, which does not require a second native call.
+    params = ', '.join('arg_{}'.format(i) for i in range(len(argtypes)))
+    if exc_wrap:
+        body = ('    result = func({params})\n'
+                '    if _last_exception:\n'
+                '        raise _last_exception.contents._wrap()\n'
+                '    return result\n')
+    else:
+        body = '    return func({params})\n'
+    namespace = {'func': func, '_last_exception': _last_exception}
+    exec('def {name}({params}):\n{body}'.format(
+        name=name, params=params, body=body.format(params=params)
+    ), namespace)
+    return namespace[name]
+
+
+class _Exception(ctypes.Structure):
+    _fields_ = [('kind', ctypes.c_int),
+                ('information', ctypes.c_char_p)]
+
+    def _wrap(self):
+        # In Python3, turn information into native strings, i.e. decode bytes.
+        # These strings are only informative, so do not raise an error if
+        # decoding fails: do best effort decoding instead to be as helpful as
+        # possible.
+        info = self.information
+        if not _py2to3.python2:
+            info = info.decode(errors='replace')
+        return _exception_kind_to_type[self.kind](info)
+
+
+_last_exception = ctypes.POINTER(_Exception).in_dll(
+    _c_lib, 'lkt_last_exception'
+)
+"""
+Exception information for the last error that happened in the C API, or a
+null pointer if the last call succeeded. This reflects the value of the C
+variable, so reading it does not involve any native call.
+"""
+
+
+def _type_fullname(t):
+    """
+    Return the fully qualified name for the given `t` type.
+    """
+    name = t.__name__
+    module = t.__module__
+    return (name
+            if module in (None, object.__class__.__module__) else
+            '{}.{}'.format(module, name))
+
+
+def _raise_type_error(expected_type_name, actual_value):
+    raise TypeError('{} instance expected, got {} instead'.format(
+        expected_type_name, _type_fullname(type(actual_value))
+    ))
+
+
+_get_last_exception = _import_func(
+   'lkt_get_last_exception',
+   [], ctypes.POINTER(_Exception),
+   exc_wrap=False
+)
+
+
+def _hashable_c_pointer(pointed_type=None):
+    """
+    Create a "pointer to `pointed_type` type and make it hashable.
+
+    :param pointed_type: ctypes type class. If left to `None`, we return a
+        subclass of `ctypes.c_void_p`.
+    :rtype: ctypes.POINTER
+    """
+
+    if pointed_type is None:
+        class _c_type(ctypes.c_void_p):
+            @property
+            def _pointer_value(self):
+                return self.value or 0
+    else:
+        @property
+        def _pointer_value(self):
+            return ctypes.addressof(self.contents)
+
+        _c_type = ctypes.POINTER(pointed_type)
+        _c_type._pointer_value = _pointer_value
+
+    def __hash__(self):
+        return self._pointer_value
+
+    def __eq__(self, other):
+        return self._pointer_value == other._pointer_value
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    _c_type.__hash__ = __hash__
+    _c_type.__eq__ = __eq__
+    _c_type.__ne__ = __ne__
+    return _c_type
+
+
+class _text(ctypes.Structure):
+    """
+    C value for unicode strings. This object is the owner of the underlying
+    buffer, so the string will be deallocated when ``self`` is destroyed.
+
+    ``_unwrap`` takes a string/unicode object and returns a ``_text`` instance,
+    while ``_wrap`` retuns an unicode instance.
+    """
+    # The chars field really is a uint32_t* but considering it as a char* here
+    # is more convenient for conversion in this binding layer. On the other
+    # side, we have to be careful about converting the length when retrieving
+    # the chars.
+    _fields_ = [("chars", ctypes.POINTER(ctypes.c_char)),
+                ("length", ctypes.c_size_t),
+                ("is_allocated", ctypes.c_int),]
+
+    encoding = 'utf-32le' if sys.byteorder == 'little' else 'utf-32be'
+
+    compact_threshold = 1024
+    """
+    Minimum number of characters for texts to be transferred in a compact
+    encoding (see ``_text_to_bytes``) rather than in UTF-32. For smaller
+    texts, the additional native calls cost more than the bigger copy.
+    """
+
+    # Instances can hold buffers that they own. In this case, the buffer must
+    # be deallocated when the instance is destroyed. Thus instances will hold
+    # a "text_buffer" attribute that will be automatically destroyed.
+    text_buffer = None
+
+    @classmethod
+    def _unwrap(cls, value):
+        value = cls.cast(value)
+
+        # The C API never modifies text arguments, so there is no need to copy
+        # the encoded string: just reference the bytes object's own buffer,
+        # and keep the bytes object alive as long as this text.
+        text = value.encode(cls.encoding)
+        text_buffer_ptr = ctypes.cast(
+            ctypes.c_char_p(text), ctypes.POINTER(ctypes.c_char)
+        )
+        result = _text(text_buffer_ptr, len(value))
+        result.text_buffer = text
+        return result
+
+    def _wrap(self):
+        length = self.length
+        if length == 0:
+            return u''
+
+        elif length < self.compact_threshold:
+            # self.length tells how much UTF-32 chars there are in self.chars
+            # but self.chars is a char* so we have to fetch 4 times more bytes
+            # than characters. Use ctypes.string_at to copy them in one go:
+            # slicing self.chars would copy them one at a time.
+            return ctypes.string_at(self.chars, 4 * length).decode(
+                self.encoding
+            )
+
+        else:
+            # Big texts are usually mostly ASCII: let the library encode them
+            # to Latin-1 (or UTF-8 if needed), which divides the amount of
+            # data to copy by up to four.
+            buffer = ctypes.c_void_p()
+            size = ctypes.c_size_t()
+            is_latin_1 = _text_to_bytes(
+                ctypes.byref(self), ctypes.byref(buffer), ctypes.byref(size)
+            )
+            try:
+                data = ctypes.string_at(buffer.value, size.value)
+            finally:
+                _free(buffer)
+            return data.decode('latin-1' if is_latin_1 else 'utf-8')
+
+    @classmethod
+    def cast(cls, value):
+        """
+        Try to cast ``value`` into an unicode object. Raise a TypeError, or
+        raise a string decoding error when this is not possible.
+        """
+        if isinstance(value, _py2to3.bytes_type):
+            return value.decode('ascii')
+        elif not isinstance(value, _py2to3.text_type):
+            _raise_type_error('text string', value)
+        else:
+            return value
+
+    def __del__(self):
+        # Only texts that own their buffer need to go through the C API
+        if self.is_allocated:
+            _destroy_text(ctypes.byref(self))
+
+
+class _symbol_type(ctypes.Structure):
+    _fields_ = [('data', ctypes.c_void_p),
+                ('bounds', ctypes.c_void_p)]
+
+    @classmethod
+    def wrap(cls, c_value):
+        # First extract the text associated to this symbol in "text"
+        text = _text()
+        _symbol_text(ctypes.byref(c_value), ctypes.byref(text))
+
+        # Then wrap this text
+        return text._wrap()
+
+    @classmethod
+    def unwrap(cls, py_value, context):
+        # Symbols are interned in their analysis context, so the C value for a
+        # given string is the same for the whole context lifetime: look for it
+        # in the context wrapper's cache first.
+        py_value = _text.cast(py_value)
+        context_wrapper = AnalysisContext._context_cache.get(context)
+        cache = (context_wrapper._symbol_cache
+                 if context_wrapper is not None else {})
+        try:
+            return cache[py_value]
+        except KeyError:
+            pass
+
+        # First turn the given symbol into a low-level text object
+        text = _text._unwrap(py_value)
+
+        # Then convert it to a symbol
+        result = cls()
+        if not _context_symbol(context, ctypes.byref(text),
+                               ctypes.byref(result)):
+            raise InvalidSymbolError(py_value)
+        cache[py_value] = result
+        return result
+
+
+class _big_integer(object):
+
+    class c_type(ctypes.c_void_p):
+        pass
+
+    def __init__(self, c_value):
+        self.c_value = c_value
+
+    @classmethod
+    def unwrap(cls, value):
+        if not _py2to3.is_int(value):
+            _raise_type_error('int or long', value)
+
+        text = _text._unwrap(str(value))
+        c_value = cls.create(ctypes.byref(text))
+        return cls(c_value)
+
+    @classmethod
+    def wrap(cls, c_value):
+        helper = cls(c_value)
+        text = _text()
+        cls.text(helper.c_value, ctypes.byref(text))
+        return int(text._wrap())
+
+    def clear(self):
+        self.c_value = None
+
+    def __del__(self):
+        self.decref(self.c_value)
+        self.clear()
+
+    create = staticmethod(_import_func(
+        'lkt_create_big_integer',
+        [ctypes.POINTER(_text)], c_type
+    ))
+    text = staticmethod(_import_func(
+        'lkt_big_integer_text',
+        [c_type, ctypes.POINTER(_text)], None
+    ))
+    decref = staticmethod(_import_func(
+        'lkt_big_integer_decref',
+        [c_type], None
+    ))
+
+
+class _Enum(object):
+
+    _name = None
+    """
+    Name for this enumeration type.
+    :type: str
+    """
+
+    _c_to_py = None
+    """
+    Mapping from C values to user-level Python values.
+    :type: list[str]
+    """
+
+    _py_to_c = None
+    """
+    Mapping from user-level Python values to C values.
+    :type: dict[str, int]
+    """
+
+    @classmethod
+    def _unwrap(cls, py_value):
+        if not isinstance(py_value, str):
+            _raise_type_error('str', py_value)
+        try:
+            return _py2to3.text_to_bytes(cls._py_to_c[py_value])
+        except KeyError:
+            raise ValueError('Invalid {}: {}'.format(cls._name, py_value))
+
+    @classmethod
+    def _wrap(cls, c_value):
+        if isinstance(c_value, ctypes.c_int):
+            c_value = c_value.value
+        return cls._c_to_py[c_value]
+
+
+class AnalysisUnitKind(_Enum):
+    """
+    Specify a kind of analysis unit. Specification units provide an interface
+    to the outer world while body units provide an implementation for the
+    corresponding interface.
+    """
+
+    unit_specification = 'unit_specification'
+    unit_body = 'unit_body'
+
+    _name = 'AnalysisUnitKind'
+    _c_to_py = [
+        unit_specification, unit_body]
+    _py_to_c = {name: index for index, name in enumerate(_c_to_py)}
+class LookupKind(_Enum):
+    """
+    """
+
+    recursive = 'recursive'
+    flat = 'flat'
+    minimal = 'minimal'
+
+    _name = 'LookupKind'
+    _c_to_py = [
+        recursive, flat, minimal]
+    _py_to_c = {name: index for index, name in enumerate(_c_to_py)}
+class GrammarRule(_Enum):
+    """
+    Gramar rule to use for parsing.
+    """
+
+    main_rule_rule = 'main_rule_rule'
+    id_rule = 'id_rule'
+    ref_id_rule = 'ref_id_rule'
+    def_id_rule = 'def_id_rule'
+    import_stmt_rule = 'import_stmt_rule'
+    imports_rule = 'imports_rule'
+    doc_comment_rule = 'doc_comment_rule'
+    doc_rule = 'doc_rule'
+    lexer_decl_rule = 'lexer_decl_rule'
+    grammar_decl_rule = 'grammar_decl_rule'
+    grammar_rule_rule = 'grammar_rule_rule'
+    lexer_rule_rule = 'lexer_rule_rule'
+    lexer_family_decl_rule = 'lexer_family_decl_rule'
+    lexer_case_rule_rule = 'lexer_case_rule_rule'
+    lexer_case_alt_rule = 'lexer_case_alt_rule'
+    lexer_case_send_rule = 'lexer_case_send_rule'
+    grammar_primary_rule = 'grammar_primary_rule'
+    grammar_expr_rule = 'grammar_expr_rule'
+    grammar_pick_rule = 'grammar_pick_rule'
+    grammar_implicit_pick_rule = 'grammar_implicit_pick_rule'
+    grammar_opt_rule = 'grammar_opt_rule'
+    grammar_cut_rule = 'grammar_cut_rule'
+    grammar_or_expr_rule = 'grammar_or_expr_rule'
+    grammar_discard_expr_rule = 'grammar_discard_expr_rule'
+    token_literal_rule = 'token_literal_rule'
+    token_no_case_literal_rule = 'token_no_case_literal_rule'
+    token_pattern_literal_rule = 'token_pattern_literal_rule'
+    parse_node_expr_rule = 'parse_node_expr_rule'
+    grammar_rule_ref_rule = 'grammar_rule_ref_rule'
+    grammar_list_expr_rule = 'grammar_list_expr_rule'
+    grammar_skip_rule = 'grammar_skip_rule'
+    grammar_null_rule = 'grammar_null_rule'
+    grammar_token_rule = 'grammar_token_rule'
+    type_decl_rule = 'type_decl_rule'
+    generic_decl_rule = 'generic_decl_rule'
+    generic_formal_type_rule = 'generic_formal_type_rule'
+    enum_lit_decl_rule = 'enum_lit_decl_rule'
+    fun_decl_rule = 'fun_decl_rule'
+    lambda_arg_decl_rule = 'lambda_arg_decl_rule'
+    fun_arg_decl_rule = 'fun_arg_decl_rule'
+    fun_arg_list_rule = 'fun_arg_list_rule'
+    lambda_arg_list_rule = 'lambda_arg_list_rule'
+    field_decl_rule = 'field_decl_rule'
+    bare_decl_rule = 'bare_decl_rule'
+    decl_rule = 'decl_rule'
+    type_ref_rule = 'type_ref_rule'
+    type_list_rule = 'type_list_rule'
+    decls_rule = 'decls_rule'
+    decl_block_rule = 'decl_block_rule'
+    val_decl_rule = 'val_decl_rule'
+    var_bind_rule = 'var_bind_rule'
+    block_rule = 'block_rule'
+    expr_rule = 'expr_rule'
+    rel_rule = 'rel_rule'
+    eq_rule = 'eq_rule'
+    arith_1_rule = 'arith_1_rule'
+    arith_2_rule = 'arith_2_rule'
+    isa_or_primary_rule = 'isa_or_primary_rule'
+    primary_rule = 'primary_rule'
+    match_expr_rule = 'match_expr_rule'
+    num_lit_rule = 'num_lit_rule'
+    string_lit_rule = 'string_lit_rule'
+    char_lit_rule = 'char_lit_rule'
+    if_expr_rule = 'if_expr_rule'
+    raise_expr_rule = 'raise_expr_rule'
+    try_expr_rule = 'try_expr_rule'
+    array_literal_rule = 'array_literal_rule'
+    logic_rule = 'logic_rule'
+    basic_expr_rule = 'basic_expr_rule'
+    term_rule = 'term_rule'
+    basic_name_rule = 'basic_name_rule'
+    lambda_expr_rule = 'lambda_expr_rule'
+    null_lit_rule = 'null_lit_rule'
+    param_rule = 'param_rule'
+    params_rule = 'params_rule'
+    decl_annotation_params_rule = 'decl_annotation_params_rule'
+    decl_annotation_rule = 'decl_annotation_rule'
+
+    _name = 'GrammarRule'
+    _c_to_py = [
+        main_rule_rule, id_rule, ref_id_rule, def_id_rule, import_stmt_rule, imports_rule, doc_comment_rule, doc_rule, lexer_decl_rule, grammar_decl_rule, grammar_rule_rule, lexer_rule_rule, lexer_family_decl_rule, lexer_case_rule_rule, lexer_case_alt_rule, lexer_case_send_rule, grammar_primary_rule, grammar_expr_rule, grammar_pick_rule, grammar_implicit_pick_rule, grammar_opt_rule, grammar_cut_rule, grammar_or_expr_rule, grammar_discard_expr_rule, token_literal_rule, token_no_case_literal_rule, token_pattern_literal_rule, parse_node_expr_rule, grammar_rule_ref_rule, grammar_list_expr_rule, grammar_skip_rule, grammar_null_rule, grammar_token_rule, type_decl_rule, generic_decl_rule, generic_formal_type_rule, enum_lit_decl_rule, fun_decl_rule, lambda_arg_decl_rule, fun_arg_decl_rule, fun_arg_list_rule, lambda_arg_list_rule, field_decl_rule, bare_decl_rule, decl_rule, type_ref_rule, type_list_rule, decls_rule, decl_block_rule, val_decl_rule, var_bind_rule, block_rule, expr_rule, rel_rule, eq_rule, arith_1_rule, arith_2_rule, isa_or_primary_rule, primary_rule, match_expr_rule, num_lit_rule, string_lit_rule, char_lit_rule, if_expr_rule, raise_expr_rule, try_expr_rule, array_literal_rule, logic_rule, basic_expr_rule, term_rule, basic_name_rule, lambda_expr_rule, null_lit_rule, param_rule, params_rule, decl_annotation_params_rule, decl_annotation_rule]
+    _py_to_c = {name: index for index, name in enumerate(_c_to_py)}
+
+
+default_grammar_rule = GrammarRule.main_rule_rule
+
+
+_unit_provider = _hashable_c_pointer()
+
+
+def _canonicalize_buffer(buffer, charset):
+    """Canonicalize source buffers to be bytes buffers."""
+    if isinstance(buffer, _py2to3.text_type):
+        if charset:
+            raise TypeError('`charset` must be null when the buffer is'
+                            ' Unicode')
+        buffer = buffer.encode('utf-8')
+        charset = b'utf-8'
+    elif not isinstance(buffer, _py2to3.bytes_type):
+        raise TypeError('`buffer` must be a string')
+    return (buffer, charset)
+
+
+#
+# High-level binding
+#
+
+
+class InvalidField(Exception):
+    """
+    Raised when introspection functions (``Liblktlang.Introspection``) are
+    requested an invalid field.
+    """
+    pass
+class NodeDataEvaluationError(Exception):
+    """
+    Raised when introspection functions (``Liblktlang.Introspection``) are
+    improperly used to evaluate a node data (field or property).
+    """
+    pass
+class InvalidInput(Exception):
+    """
+    Raised by lexing functions (``Liblktlang.Lexer``) when the input contains
+    an invalid byte sequence.
+    """
+    pass
+class InvalidSymbolError(Exception):
+    """
+    Exception raise when an invalid symbol is passed to a subprogram.
+    """
+    pass
+class InvalidUnitNameError(Exception):
+    """
+    Raised when an invalid unit name is provided.
+    """
+    pass
+class NativeException(Exception):
+    """
+    Exception raised in language bindings when the underlying C API reports an
+    unexpected error that occurred in the library.
+
+    This kind of exception is raised for internal errors: they should never
+    happen in normal situations and if they are raised at some point, it means
+    the library state is potentially corrupted.
+
+    Nevertheless, the library does its best not to crash the program,
+    materializing internal errors using this kind of exception.
+    """
+    pass
+class PreconditionFailure(Exception):
+    """
+    Exception raised when an API is called while its preconditions are not
+    satisfied.
+    """
+    pass
+class PropertyError(Exception):
+    """
+    Exception that is raised when an error occurs while evaluating any AST node
+    method whose name starts with ``p_``. This is the only exceptions that such
+    functions can raise.
+    """
+    pass
+class TemplateArgsError(Exception):
+    """
+    Exception raised when the provided arguments for a template don't match
+    what the template expects.
+    """
+    pass
+class TemplateFormatError(Exception):
+    """
+    Exception raised when a template has an invalid syntax, such as badly
+    formatted placeholders.
+    """
+    pass
+class TemplateInstantiationError(Exception):
+    """
+    Exception raised when the instantiation of a template cannot be parsed.
+    """
+    pass
+class StaleReferenceError(Exception):
+    """
+    Exception raised while trying to access data that was deallocated. This
+    happens when one tries to use a node whose unit has been reparsed, for
+    instance.
+    """
+    pass
+class UnknownCharset(Exception):
+    """
+    Raised by lexing functions (``Liblktlang.Lexer``) when the input charset is
+    not supported.
+    """
+    pass
+
+_exception_kind_to_type = [
+    InvalidField,
+    NodeDataEvaluationError,
+    InvalidInput,
+    InvalidSymbolError,
+    InvalidUnitNameError,
+    NativeException,
+    PreconditionFailure,
+    PropertyError,
+    TemplateArgsError,
+    TemplateFormatError,
+    TemplateInstantiationError,
+    StaleReferenceError,
+    UnknownCharset,
+]
+
+
+
+
+
+class AnalysisContext(object):
+    """
+    This type represents a context for all source analysis. This is the first
+    type you need to create to use Liblktlang. It will contain the results of
+    all analysis, and is the main holder for all the data.
+
+    You can create several analysis contexts if you need to, which enables you,
+    for example to:
+
+    * analyze several different projects at the same time;
+
+    * analyze different parts of the same projects in parallel.
+
+    In the current design, contexts always keep all of their analysis units
+    allocated. If you need to get this memory released, the only option at your
+    disposal is to destroy your analysis context instance.
+    """
+
+    __slots__ = ('_c_value', '_unit_provider', '_serial_number', '_unit_cache',
+                 '_symbol_cache', '__weakref__')
+
+    _context_cache = weakref.WeakValueDictionary()
+    """
+    Cache for analysis context wrappers. Indexed by analysis context addresses,
+    which are known to stay valid forever (and re-used).
+
+    Unlike unit and node caches, this one should contain weak references so
+    that analysis contexts (and their units/nodes) can be free'd when user code
+    does not reference them anymore.
+
+    :type: dict[AnalysisContext._c_type, AnalysisContext]
+    """
+
+    def __init__(self,
+                 charset=None,
+                 unit_provider=None,
+                 with_trivia=True,
+                 tab_stop=8,
+                 _c_value=None):
+        """
+        Create a new analysis context.
+
+        ``Charset`` will be used as a default charset to decode input sources
+        in analysis units. Please see ``GNATCOLL.Iconv`` for several supported
+        charsets. Be careful: passing an unsupported charset is not guaranteed
+        to raise an error here. If no charset is provided, ``"utf-8"`` is the
+        default.
+
+        .. todo:: Passing an unsupported charset here is not guaranteed to
+        raise an error right here, but this would be really helpful for users.
+
+        When ``With_Trivia`` is true, the parsed analysis units will contain
+        trivias.
+
+        If provided, ``Unit_Provider`` will be used to query the file name that
+        corresponds to a unit reference during semantic analysis. If it is
+        ``None``, the default one is used instead.
+
+        ``Tab_Stop`` is a positive number to describe the effect of tabulation
+        characters on the column number in source files.
+        """
+
+        # Initialize this field in case we raise an exception during
+        # construction, so that the destructor can run later on.
+        self._c_value = None
+
+        if _c_value is None:
+            charset = _py2to3.text_to_bytes(charset)
+            if not isinstance(tab_stop, int) or tab_stop < 1:
+                raise ValueError(
+                    'Invalid tab_stop (positive integer expected)')
+            c_unit_provider = unit_provider._c_value if unit_provider else None
+            self._c_value = _create_analysis_context(charset, c_unit_provider,
+                                                     with_trivia, tab_stop)
+        else:
+            self._c_value = _context_incref(_c_value)
+        assert self._c_value not in self._context_cache
+        self._context_cache[self._c_value] = self
+
+        # Keep a reference to the unit provider so that it is live at least as
+        # long as the analysis context is live.
+        self._unit_provider = unit_provider
+
+        self._serial_number = None
+        self._unit_cache = {}
+        """
+        Cache for AnalysisUnit wrappers, indexed by analysis unit addresses,
+        which are known to stay valid as long as the context is alive.
+
+        :type: dict[str, AnalysisUnit]
+        """
+
+        self._symbol_cache = {}
+        """
+        Cache for symbol C values, indexed by symbol text. Symbols stay valid
+        as long as the context is alive.
+
+        :type: dict[str, _symbol_type]
+        """
+
+        self._check_unit_cache()
+
+    def __del__(self):
+        if self._c_value:
+            _context_decref(self._c_value)
+
+    def __eq__(self, other):
+        return self._c_value == other._c_value
+
+    def __hash__(self):
+        return hash(self._c_value)
+
+    def get_from_file(self, filename, charset=None, reparse=False,
+                      rule=default_grammar_rule):
+        """
+        Create a new analysis unit for ``Filename`` or return the existing one
+        if any. If ``Reparse`` is true and the analysis unit already exists,
+        reparse it from ``Filename``.
+
+        ``Rule`` controls which grammar rule is used to parse the unit.
+
+        Use ``Charset`` in order to decode the source. If ``Charset`` is empty
+        then use the context's default charset.
+
+        If any failure occurs, such as file opening, decoding, lexing or
+        parsing failure, return an analysis unit anyway: errors are described
+        as diagnostics of the returned analysis unit.
+        """
+        filename = _py2to3.text_to_bytes(filename)
+        charset = _py2to3.text_to_bytes(charset or '')
+        c_value = _get_analysis_unit_from_file(self._c_value, filename,
+                                               charset, reparse,
+                                               GrammarRule._unwrap(rule))
+        return AnalysisUnit._wrap(c_value)
+
+    def get_from_files(self, filenames, charset=None, reparse=False,
+                       rule=default_grammar_rule, jobs=0):
+        """
+        Create new analysis units for all ``Filenames``, or return the existing
+        ones, as ``Get_From_File`` would do for each of them. Units that need
+        to be (re)parsed are lexed and parsed concurrently on ``Jobs`` worker
+        tasks, or on one task per processor if ``Jobs`` is zero. Only lexing
+        and parsing run concurrently: the rest of the processing (for instance
+        lexical environments updates) is sequential.
+
+        Return the analysis units in the same order as ``Filenames``.
+        """
+        filenames = [_py2to3.text_to_bytes(f) for f in filenames]
+        charset = _py2to3.text_to_bytes(charset or '')
+        count = len(filenames)
+        c_filenames = (ctypes.c_char_p * count)(*filenames)
+        c_units = (AnalysisUnit._c_type * count)()
+        _get_analysis_units_from_files(self._c_value, c_filenames, count,
+                                       charset, reparse,
+                                       GrammarRule._unwrap(rule), jobs,
+                                       c_units)
+        return [AnalysisUnit._wrap(u) for u in c_units]
+
+    def get_from_buffer(self, filename, buffer, charset=None, reparse=False,
+                        rule=default_grammar_rule):
+        """
+        Create a new analysis unit for ``Filename`` or return the existing one
+        if any. Whether the analysis unit already exists or not, (re)parse it
+        from the source code in ``Buffer``.
+
+        ``Rule`` controls which grammar rule is used to parse the unit.
+
+        Use ``Charset`` in order to decode the source. If ``Charset`` is empty
+        then use the context's default charset.
+
+        If any failure occurs, such as file opening, decoding, lexing or
+        parsing failure, return an analysis unit anyway: errors are described
+        as diagnostics of the returned analysis unit.
+        """
+        filename = _py2to3.text_to_bytes(filename)
+        charset = _py2to3.text_to_bytes(charset or '')
+        buffer, charset = _canonicalize_buffer(buffer, charset)
+        c_value = _get_analysis_unit_from_buffer(self._c_value, filename,
+                                                 charset,
+                                                 buffer, len(buffer),
+                                                 GrammarRule._unwrap(rule))
+        return AnalysisUnit._wrap(c_value)
+
+    def get_from_provider(self, name, kind, charset=None, reparse=False):
+        """
+        Create a new analysis unit for ``Name``/``Kind`` or return the existing
+        one if any. If ``Reparse`` is true and the analysis unit already
+        exists, reparse it from ``Filename``.
+
+        Use ``Charset`` in order to decode the source. If ``Charset`` is empty
+        then use the context's default charset.
+
+        If the unit name cannot be tuned into a file name, raise an
+        ``InvalidUnitNameError`` exception. If any other failure occurs, such
+        as file opening, decoding, lexing or parsing failure, return an
+        analysis unit anyway: errors are described as diagnostics of the
+        returned analysis unit.
+        """
+        name = _py2to3.bytes_to_text(name)
+        charset = _py2to3.text_to_bytes(charset or '')
+
+        _name = _text._unwrap(name)
+        _kind = AnalysisUnitKind._unwrap(kind)
+        c_value = _get_analysis_unit_from_provider(
+            self._c_value, ctypes.byref(_name), _kind, charset, reparse
+        )
+        if c_value:
+            return AnalysisUnit._wrap(c_value)
+        else:
+            raise InvalidUnitNameError('Invalid unit name: {} ({})'.format(
+                repr(name), kind
+            ))
+
+    def discard_errors_in_populate_lexical_env(self, discard):
+        """
+        Debug helper. Set whether ``Property_Error`` exceptions raised in
+        ``Populate_Lexical_Env`` should be discarded. They are by default.
+        """
+        _discard_errors_in_populate_lexical_env(self._c_value, bool(discard))
+
+    def use_memory_mapped_files(self, enabled=True):
+        """
+        Set whether analysis units created from files in this context should be
+        lexed directly from a compact copy of the memory-mapped file. This
+        avoids decoding the file into a wide-character buffer, and thus speeds
+        up parsing and reduces memory usage. It is disabled by default.
+
+        This only applies to files that use a single-byte charset (ASCII or
+        Latin-1) and that do not start with a UTF byte order mark: other files
+        are decoded as usual.
+        """
+        _use_memory_mapped_files(self._c_value, bool(enabled))
+
+    class _c_struct(ctypes.Structure):
+        _fields_ = [('serial_number', ctypes.c_uint64)]
+    _c_type = _hashable_c_pointer(_c_struct)
+
+    @classmethod
+    def _wrap(cls, c_value):
+        try:
+            return cls._context_cache[c_value]
+        except KeyError:
+            return cls(_c_value=c_value)
+
+    def _check_unit_cache(self):
+        """
+        If this context has been re-used, invalidate its unit cache.
+        """
+        serial_number = self._c_value.contents.serial_number
+        if self._serial_number != serial_number:
+            self._unit_cache = {}
+            self._symbol_cache = {}
+            self._serial_number = serial_number
+
+
+class AnalysisUnit(object):
+    """
+    This type represents the analysis of a single file.
+    """
+
+    __slots__ = ('_c_value', '_context_link', '_cache_version_number',
+                 '_node_cache')
+
+    class TokenIterator(object):
+        """
+        Iterator over the tokens in an analysis unit.
+        """
+
+        def __init__(self, first):
+            self.first = first
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            if not self.first:
+                raise StopIteration()
+            result = self.first
+            self.first = self.first.next
+            return result
+        next = __next__
+
+    def __init__(self, context, c_value):
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly. Please use AnalysisContext.get_from_* methods to create
+        analysis unit instances instead.
+        """
+        self._c_value = c_value
+
+        # Keep a reference on the owning context so that we keep it alive at
+        # least as long as this unit is alive.
+        self._context_link = context
+
+        # Store this wrapper in caches for later re-use
+        assert c_value not in context._unit_cache
+        context._unit_cache[c_value] = self
+
+        self._cache_version_number = None
+        """
+        Last version number we saw for this analysis unit wrapper. If it's
+        different from `self._unit_version`, it means that the unit was
+        reparsed: in this case we need to clear the node cache below (see the
+        `_check_node_cache` method).
+
+        :type: int
+        """
+
+        self._node_cache = {}
+        """
+        Cache for all node wrappers in this unit. Indexed by couples:
+        (c_value, metadata, rebindings).
+
+        :type: dict[T, LKNode]
+        """
+
+        self._check_node_cache()
+
+    def __eq__(self, other):
+        return self._c_value == other._c_value
+
+    def __hash__(self):
+        return hash(self._c_value)
+
+    @property
+    def context(self):
+        """
+        Return the context that owns this unit.
+        """
+        return self._context_link
+
+    def reparse(self, buffer=None, charset=None):
+        """
+        Reparse an analysis unit from a buffer, if provided, or from the
+        original file otherwise. If ``Charset`` is empty or ``None``, use the
+        last charset successfuly used for this unit, otherwise use it to decode
+        the content of the source file.
+
+        If any failure occurs, such as decoding, lexing or parsing failure,
+        diagnostic are emitted to explain what happened.
+        """
+        charset = _py2to3.text_to_bytes(charset or '')
+        if buffer is None:
+            _unit_reparse_from_file(self._c_value, charset)
+        else:
+            buffer, charset = _canonicalize_buffer(buffer, charset)
+            _unit_reparse_from_buffer(self._c_value, charset, buffer,
+                                      len(buffer))
+
+    def reparse_edit(self, edit_range, text):
+        """
+        Replace the source text in ``Edit_Range`` with ``Text`` and reparse the
+        analysis unit accordingly. The end of ``Edit_Range`` is exclusive, so
+        an empty range inserts ``Text``.
+
+        When the edit changes only trivia (whitespaces, comments, ...), the
+        unit keeps its current tree, so its nodes remain valid. Otherwise, this
+        is equivalent to reparsing the whole edited source buffer.
+
+        Raise a ``PreconditionFailure`` exception if the unit has no source
+        buffer or if ``Edit_Range`` is not a valid source location range for
+        it.
+        """
+        c_edit_range = SlocRange._c_type._unwrap(edit_range)
+        c_text = _text._unwrap(text)
+        _unit_reparse_edit(self._c_value, ctypes.byref(c_edit_range),
+                           ctypes.byref(c_text))
+
+    def populate_lexical_env(self):
+        """
+        Create lexical environments for this analysis unit, according to the
+        specifications given in the language spec.
+
+        If not done before, it will be automatically called during semantic
+        analysis. Calling it before enables one to control where the latency
+        occurs.
+
+        Depending on whether errors are discarded (see
+        ``Discard_Errors_In_Populate_Lexical_Env``), raise a ``Property_Error``
+        on failure.
+        """
+        if not _unit_populate_lexical_env(self._c_value):
+            raise PropertyError()
+
+    @property
+    def root(self):
+        """
+        Return the root node for this unit, or ``None`` if there is none.
+
+        :rtype: LKNode
+        """
+        result = _Entity_c_type()
+        _unit_root(self._c_value, ctypes.byref(result))
+        return LKNode._wrap(result)
+
+    @property
+    def first_token(self):
+        """
+        Return a reference to the first token scanned in this unit.
+        """
+        result = Token()
+        _unit_first_token(self._c_value, ctypes.byref(result))
+        return result._wrap()
+
+    @property
+    def last_token(self):
+        """
+        Return a reference to the last token scanned in this unit.
+        """
+        result = Token()
+        _unit_last_token(self._c_value, ctypes.byref(result))
+        return result._wrap()
+
+    @property
+    def text(self):
+        """
+        Return the source buffer associated to this unit.
+        """
+        return Token.text_range(self.first_token, self.last_token)
+
+    @property
+    def token_count(self):
+        """
+        Return the number of tokens in this unit.
+        """
+        return _unit_token_count(self._c_value)
+
+    @property
+    def trivia_count(self):
+        """
+        Return the number of trivias in this unit. This is 0 for units that
+        were parsed with trivia analysis disabled.
+        """
+        return _unit_trivia_count(self._c_value)
+
+    def token_table(self):
+        """
+        Return a columnar representation of all the tokens and trivia in this
+        unit.
+
+        Iterating on tokens one at a time is slow: this computes the data for
+        all tokens in a single native call, which is a lot faster.
+
+        :rtype: TokenTable
+        """
+        c_table = _token_table()
+        _unit_export_tokens(self._c_value, ctypes.byref(c_table))
+        return TokenTable(self, c_table)
+
+    def lookup_token(self, sloc):
+        """
+        Look for a token in this unit that contains the given source location.
+        If this falls before the first token, return the first token. If this
+        falls between two tokens, return the token that appears before. If this
+        falls after the last token, return the last token. If there is no token
+        in this unit, return no token.
+        """
+        unit = AnalysisUnit._unwrap(self)
+        _sloc = Sloc._c_type._unwrap(sloc)
+        tok = Token()
+        _unit_lookup_token(unit, ctypes.byref(_sloc), ctypes.byref(tok))
+        return tok._wrap()
+
+    def _dump_lexical_env(self):
+        """
+        Debug helper: output the lexical envs for the given analysis unit.
+        """
+        unit = AnalysisUnit._unwrap(self)
+        _unit_dump_lexical_env(unit)
+
+    def iter_tokens(self):
+        """
+        Iterator over the tokens in an analysis unit.
+        """
+        return self.TokenIterator(self.first_token)
+
+    @property
+    def filename(self):
+        """
+        Return the filename this unit is associated to.
+        """
+        filename = _unit_filename(self._c_value)
+        return _unwrap_str(filename)
+
+    @property
+    def diagnostics(self):
+        """
+        Diagnostics for this unit.
+        """
+        count = _unit_diagnostic_count(self._c_value)
+        result = []
+        diag = Diagnostic._c_type()
+        for i in range(count):
+            assert _unit_diagnostic(self._c_value, i, ctypes.byref(diag))
+            result.append(diag._wrap())
+        return result
+
+    def __repr__(self):
+        return '<AnalysisUnit {}>'.format(repr(
+            os.path.basename(self.filename)
+        ))
+
+    class _c_struct(ctypes.Structure):
+        _fields_ = [('unit_version', ctypes.c_uint64)]
+    _c_type = _hashable_c_pointer(_c_struct)
+
+    @classmethod
+    def _wrap(cls, c_value):
+        if not c_value:
+            return None
+
+        # Invalidate the unit cache if needed, then look for an existing
+        # wrapper for this unit.
+        context = cls._context(c_value)
+        context._check_unit_cache()
+
+        try:
+            return context._unit_cache[c_value]
+        except KeyError:
+            return cls(context, c_value)
+
+    @classmethod
+    def _unwrap(cls, value):
+        if value is None:
+            return value
+        elif not isinstance(value, cls):
+            _raise_type_error(cls.__name__, value)
+        else:
+            return value._c_value
+
+    @classmethod
+    def _context(cls, c_value):
+        ctx = _unit_context(c_value)
+        return AnalysisContext._wrap(ctx)
+
+    @property
+    def _unit_version(self):
+        return self._c_value.contents.unit_version
+
+    def _check_node_cache(self):
+        """
+        If this unit has been reparsed, invalidate its node cache.
+        """
+        if self._cache_version_number != self._unit_version:
+            self._node_cache = {}
+            self._cache_version_number = self._unit_version
+
+
+class Sloc(object):
+    """
+    Location in a source file. Line and column numbers are one-based.
+    """
+
+    def __init__(self, line, column):
+        assert line >= 0 and column >= 0
+        self.line = line
+        self.column = column
+
+    def __bool__(self):
+        return bool(self.line or self.column)
+    __nonzero__ = __bool__
+
+    def __lt__(self, other):
+        # First compare line numbers...
+        if self.line < other.line:
+            return True
+        elif self.line > other.line:
+            return False
+
+        # Past this point, we know that both are on the same line, so now
+        # compare column numbers.
+        else:
+            return self.column < other.column
+
+    def __eq__(self, other):
+        return self.line == other.line and self.column == other.column
+
+    def __hash__(self):
+        return hash((self.line, self.column))
+
+    def __str__(self):
+        return '{}:{}'.format(self.line, self.column)
+
+    def __repr__(self):
+        return '<Sloc {} at {:#x}>'.format(self, id(self))
+
+    class _c_type(ctypes.Structure):
+        _fields_ = [("line", ctypes.c_uint32),
+                    ("column", ctypes.c_uint16)]
+
+        def _wrap(self):
+            return Sloc(self.line, self.column)
+
+        @classmethod
+        def _unwrap(cls, sloc):
+            return cls(sloc.line, sloc.column)
+
+
+class SlocRange(object):
+    """
+    Location of a span of text in a source file.
+    """
+
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+
+    def __bool__(self):
+        return bool(self.start or self.end)
+    __nonzero__ = __bool__
+
+    def __lt__(self, other):
+        raise NotImplementedError('SlocRange comparison not supported')
+
+    def __eq__(self, other):
+        return self.start == other.start and self.end == other.end
+
+    def __hash__(self):
+        return hash((self.start, self.end))
+
+    def __str__(self):
+        return '{}-{}'.format(self.start, self.end)
+
+    def __repr__(self):
+        return "<SlocRange {}:{}-{}:{}>".format(
+            self.start.line, self.start.column,
+            self.end.line, self.end.column
+        )
+
+
+    class _c_type(ctypes.Structure):
+        _fields_ = [("start", Sloc._c_type),
+                    ("end", Sloc._c_type)]
+
+        def _wrap(self):
+            return SlocRange(self.start._wrap(), self.end._wrap())
+
+        @classmethod
+        def _unwrap(cls, sloc_range):
+            return cls(Sloc._c_type._unwrap(sloc_range.start),
+                       Sloc._c_type._unwrap(sloc_range.end))
+
+
+class Diagnostic(object):
+    """
+    Diagnostic for an analysis unit: cannot open the source file, parsing
+    error, ...
+    """
+
+    def __init__(self, sloc_range, message):
+        self.sloc_range = sloc_range
+        self.message = message
+
+    @property
+    def as_text(self):
+        return (u'{}: {}'.format(self.sloc_range, self.message)
+                if self.sloc_range else
+                self.message)
+
+    def __str__(self):
+        result = self.as_text
+        if _py2to3.python2:
+            result = result.encode('ascii', errors='replace')
+        return result
+
+    def __repr__(self):
+        return '<Diagnostic {}>'.format(self)
+
+
+    class _c_type(ctypes.Structure):
+        _fields_ = [('sloc_range', SlocRange._c_type),
+                    ('message', _text)]
+
+        def _wrap(self):
+            return Diagnostic(self.sloc_range._wrap(), self.message._wrap())
+
+
+class Token(ctypes.Structure):
+    """
+    Reference to a token in an analysis unit.
+    """
+
+    _tdh_c_type = _hashable_c_pointer()
+
+    _fields_ = [('_token_data',   _tdh_c_type),
+                ('_token_index',  ctypes.c_int),
+                ('_trivia_index', ctypes.c_int),
+                ('_kind',         ctypes.c_int),
+                ('_text',         _text),
+                ('_sloc_range',   SlocRange._c_type)]
+
+    def _wrap(self):
+        return self if self._token_data else None
+
+    @staticmethod
+    def _check_token(value):
+        if not isinstance(value, Token):
+            raise TypeError('invalid token: {}'.format(value))
+
+    def _check_same_unit(self, other):
+        if self._token_data != other._token_data:
+            raise ValueError('{} and {} come from different analysis units'
+                             .format(self, other))
+
+    @property
+    def next(self):
+        """
+        Return a reference to the next token in the corresponding analysis
+        unit.
+        """
+        t = Token()
+        _token_next(ctypes.byref(self), ctypes.byref(t))
+        return t._wrap()
+
+    @property
+    def previous(self):
+        """
+        Return a reference to the previous token in the corresponding analysis
+        unit.
+        """
+        t = Token()
+        _token_previous(ctypes.byref(self), ctypes.byref(t))
+        return t._wrap()
+
+    def range_until(self, other):
+        """
+        Return an iterator on the list of tokens that spans between `self` and
+        `other` (included). This returns an empty list if the first token
+        appears after the other one in the source code. Raise a ``ValueError``
+        if both tokens come from different analysis units.
+        """
+        self._check_token(other)
+        self._check_same_unit(other)
+
+        # Keep the generator as a nested function so that the above checks are
+        # executed when the generator is created, instead of only when its
+        # first item is requested.
+        def generator():
+            if other < self:
+                return
+
+            yield self
+            current = self
+            while current < other:
+                current = current.next
+                yield current
+        return generator()
+
+    def is_equivalent(self, other):
+        """
+        Return whether ``L`` and ``R`` are structurally equivalent tokens. This
+        means that their position in the stream won't be taken into account,
+        only the kind and text of the token.
+        """
+        self._check_token(other)
+        return bool(_token_is_equivalent(
+            ctypes.byref(self), ctypes.byref(other))
+        )
+
+    @property
+    def kind(self):
+        """
+        Kind for this token.
+        """
+        name = _token_kind_name(self._kind)
+        # The _token_kind_name wrapper is already supposed to handle exceptions
+        # so this should always return a non-null value.
+        assert name
+        return _unwrap_str(name)
+
+    @property
+    def is_trivia(self):
+        """
+        Return whether this token is a trivia. If it's not, it's a regular
+        token.
+        """
+        return self._trivia_index != 0
+
+    @property
+    def index(self):
+        """
+        Zero-based index for this token/trivia. Tokens and trivias get their
+        own index space.
+        """
+        return (self._token_index - 1
+                if self._trivia_index == 0 else
+                self._trivia_index - 1)
+
+    @property
+    def text(self):
+        """
+        Return the text of the given token.
+        """
+        return self._text._wrap()
+
+    @classmethod
+    def text_range(cls, first, last):
+        """
+        Compute the source buffer slice corresponding to the text that spans
+        between the ``First`` and ``Last`` tokens (both included). This yields
+        an empty slice if ``Last`` actually appears before ``First``.
+
+        This raises a ``ValueError`` if ``First`` and ``Last`` don't belong to
+        the same analysis unit.
+        """
+        cls._check_token(first)
+        cls._check_token(last)
+        first._check_same_unit(last)
+        result = _text()
+        assert _token_range_text(ctypes.byref(first), ctypes.byref(last),
+                                 ctypes.byref(result))
+        return result._wrap() or u''
+
+    @property
+    def sloc_range(self):
+        """
+        Return the source location range of the given token.
+        """
+        return self._sloc_range._wrap()
+
+    def __eq__(self, other):
+        """
+        Return whether the two tokens refer to the same token in the same unit.
+
+        Note that this does not actually compares the token data.
+        """
+        return (isinstance(other, Token)
+                and self._identity_tuple == other._identity_tuple)
+
+    def __hash__(self):
+        return hash(self._identity_tuple)
+
+    def __repr__(self):
+        return '<Token {}{} at {}>'.format(
+            self.kind,
+            ' {}'.format(_py2to3.text_repr(self.text)) if self.text else '',
+            self.sloc_range
+        )
+
+    def __lt__(self, other):
+        """
+        Consider that None comes before all tokens. Then, sort by unit, token
+        index, and trivia index.
+        """
+
+        # None always comes first
+        if other is None:
+            return False
+
+        self._check_token(other)
+        self._check_same_unit(other)
+        return self._identity_tuple < other._identity_tuple
+
+    def __le__(self, other):
+        return self == other or self < other
+
+    def __gt__(self, other):
+        return not (self <= other)
+
+    def __ge__(self, other):
+        return not (self < other)
+
+    def to_data(self):
+        """
+        Return a dict representation of this Token.
+        """
+        return {"kind": "Token", "token_kind": self.kind, "text": self.text}
+
+    @property
+    def _identity_tuple(self):
+        """
+        Return a tuple that return a tuple that contains "identity" information
+        for this token. Think of it as a database primary key.
+
+        This property is for internal use only.
+        """
+        return (self._token_data, self._token_index, self._trivia_index)
+
+
+class UnitProvider(object):
+    """
+    Interface to fetch analysis units from a name and a unit kind.
+
+    The unit provider mechanism provides an abstraction which assumes that to
+    any couple (unit name, unit kind) we can associate at most one source file.
+    This means that several couples can be associated to the same source file,
+    but on the other hand, only one one source file can be associated to a
+    couple.
+
+    This is used to make the semantic analysis able to switch from one analysis
+    units to another.
+    """
+
+    def __init__(self, c_value):
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly.
+        """
+        self._c_value = c_value
+
+    def __del__(self):
+        _dec_ref_unit_provider(self._c_value)
+
+
+
+
+
+class LKNode(object):
+    """
+    Root node class for lkt AST nodes.
+    """
+
+    is_list_type = False
+    __slots__ = ('_unprotected_c_value', '_node_c_value', '_metadata',
+                 '_rebindings', '_unprotected_getitem_cache', '_unit',
+                 '_unit_version')
+
+    
+    
+
+    
+    @property
+    def p_node_type(self):
+        """
+        Unit method. Return the Node base class.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _lk_node_p_node_type)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def p_char_type(self):
+        """
+        Unit method. Return the character builtin type.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _lk_node_p_char_type)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def p_int_type(self):
+        """
+        Unit method. Return the integer builtin type.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _lk_node_p_int_type)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def p_bool_type(self):
+        """
+        Unit method. Return the boolean builtin type.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _lk_node_p_bool_type)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def p_bigint_type(self):
+        """
+        Unit method. Return the big integer builtin type.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _lk_node_p_bigint_type)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def p_string_type(self):
+        """
+        Unit method. Return the string builtin type.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _lk_node_p_string_type)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def p_symbol_type(self):
+        """
+        Unit method. Return the string builtin type.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _lk_node_p_symbol_type)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def p_regexp_type(self):
+        """
+        Unit method. Return the regexp builtin type.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _lk_node_p_regexp_type)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def p_array_gen_type(self):
+        """
+        Unit method. Return the array builtin type.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _lk_node_p_array_gen_type)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def p_astlist_gen_type(self):
+        """
+        Unit method. Return the ASTList builtin generic type.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _lk_node_p_astlist_gen_type)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def p_iterator_gen_trait(self):
+        """
+        Unit method. Return the Iterator builtin generic trait.
+
+        :rtype: TraitDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _lk_node_p_iterator_gen_trait)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def p_check_semantic(self):
+        """
+        Run name and type resolution on all relevant entities in this subtree,
+        aggregating and returning the results.
+
+        If you ran this and the result's `has_error` flag is false, then you
+        *know* that you can call semantic properties such as `referenced_decl`
+        and `expr_type`, and those will never raise.
+
+        :rtype: TreeSemanticResult
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(TreeSemanticResult._c_type(), _lk_node_p_check_semantic)
+        result = TreeSemanticResult._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def parent(self):
+        """
+        Return the lexical parent for this node. Return null for the root AST
+        node or for AST nodes for which no one has a reference to the parent.
+
+        :rtype: LKNode
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _lk_node_parent)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def parents(self):
+        """
+        Return an array that contains the lexical parents (this node included).
+        Nearer parents are first in the list.
+
+        :rtype: List[LKNode]
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_LKNodeArrayConverter.c_type(), _lk_node_parents)
+        result = _LKNodeArrayConverter.wrap(c_result, False)
+
+
+        return result
+    
+    @property
+    def children(self):
+        """
+        Return an array that contains the direct lexical children.
+
+        :rtype: List[LKNode]
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_LKNodeArrayConverter.c_type(), _lk_node_children)
+        result = _LKNodeArrayConverter.wrap(c_result, False)
+
+
+        return result
+    
+    @property
+    def token_start(self):
+        """
+        Return the first token used to parse this node.
+
+        :rtype: Token
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(Token(), _lk_node_token_start)
+        result = c_result
+
+
+        return result
+    
+    @property
+    def token_end(self):
+        """
+        Return the last token used to parse this node.
+
+        :rtype: Token
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(Token(), _lk_node_token_end)
+        result = c_result
+
+
+        return result
+    
+    @property
+    def child_index(self):
+        """
+        Return the 0-based index for Node in its parent's children.
+
+        :rtype: int
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(ctypes.c_int(), _lk_node_child_index)
+        result = c_result.value
+
+
+        return result
+    
+    @property
+    def previous_sibling(self):
+        """
+        Return the node's previous sibling, if there is one.
+
+        :rtype: LKNode
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _lk_node_previous_sibling)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def next_sibling(self):
+        """
+        Return the node's next sibling, if there is one.
+
+        :rtype: LKNode
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _lk_node_next_sibling)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def unit(self):
+        """
+        Return the analysis unit owning this node.
+
+        :rtype: AnalysisUnit
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(AnalysisUnit._c_type(), _lk_node_unit)
+        result = AnalysisUnit._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def is_ghost(self):
+        """
+        Return whether the node is a ghost.
+
+        Unlike regular nodes, ghost nodes cover no token in the input source:
+        they are logically located instead between two tokens. The
+        "token_first" of all ghost nodes is the token right after this logical
+        position, while they have no "token_last".
+
+        :rtype: bool
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(ctypes.c_uint8(), _lk_node_is_ghost)
+        result = bool(c_result.value)
+
+
+        return result
+    
+    @property
+    def full_sloc_image(self):
+        """
+        Return a string containing the filename + the sloc in GNU conformant
+        format. Useful to create diagnostics from a node.
+
+        :rtype: str
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_TextTypeConverter.c_type(), _lk_node_full_sloc_image)
+        result = _TextTypeConverter.wrap(c_result, False)
+
+
+        return result
+
+    _field_names = () + (
+    )
+
+
+
+
+    def __init__(self, c_value, node_c_value, metadata, rebindings,
+                 unit=None):
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly. For now, the creation of AST nodes can happen only as
+        part of the parsing of an analysis unit.
+        """
+
+        self._unprotected_c_value = c_value
+
+        # Access to these fields is unprotected from stale references, but it
+        # is supposed to be used only in _id_tuple, which itself should not be
+        # used outside of hashing/equality use cases.
+        self._node_c_value = node_c_value
+        self._rebindings = rebindings
+        self._metadata = metadata
+
+        self._unprotected_getitem_cache = {}
+        """
+        Cache for the __getitem__ override.
+
+        :type: dict[int, LKNode]
+        """
+
+        # Information to check before accessing node data that it is still
+        # valid.
+        self._unit = (unit if unit is not None
+                      else self._fetch_unit(c_value))
+        self._unit_version = self._unit._unit_version
+
+    def _check_stale_reference(self):
+        # We have a reference to the owning unit, so there is no need to
+        # check that the unit and the context are still valid. Just check that
+        # the unit has not been reparsed.
+        if self._unit._unit_version != self._unit_version:
+            raise StaleReferenceError()
+
+    @property
+    def _c_value(self):
+        self._check_stale_reference()
+        return self._unprotected_c_value
+
+    @property
+    def _getitem_cache(self):
+        self._check_stale_reference()
+        return self._unprotected_getitem_cache
+
+    @property
+    def _id_tuple(self):
+        return (self._node_c_value, self._rebindings)
+
+    def __eq__(self, other):
+        return (isinstance(other, LKNode) and
+                self._id_tuple == other._id_tuple)
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self._id_tuple)
+
+    @property
+    def kind_name(self):
+        """
+        Return the kind of this node.
+        """
+        return self._kind_name
+
+    @property
+    def is_token_node(self):
+        """
+        Return whether this node is a node that contains only a single token.
+        """
+        node = self._unwrap(self)
+        return bool(_node_is_token_node(ctypes.byref(node)))
+
+    @property
+    def is_synthetic(self):
+        """
+        Return whether this node is synthetic.
+        """
+        node = self._unwrap(self)
+        return bool(_node_is_synthetic(ctypes.byref(node)))
+
+    @property
+    def sloc_range(self):
+        """
+        Return the spanning source location range for this node.
+
+        Note that this returns the sloc of the parent for synthetic nodes.
+        """
+        node = self._unwrap(self)
+        result = SlocRange._c_type()
+        _node_sloc_range(ctypes.byref(node), ctypes.byref(result))
+        return result._wrap()
+
+    @property
+    def text(self):
+        """
+        Return the source buffer slice corresponding to the text that spans
+        between the first and the last tokens of this node.
+
+        Note that this returns the empty string for synthetic nodes.
+        """
+        node = self._unwrap(self)
+        result = _text()
+        _node_text(ctypes.byref(node), ctypes.byref(result))
+        return result._wrap()
+
+    @property
+    def image(self):
+        """
+        Return a representation of this node as a string.
+        """
+        c_node = self._unwrap(self)
+        c_result = _text()
+        _node_image(ctypes.byref(c_node), ctypes.byref(c_result))
+        return c_result._wrap()
+
+    def lookup(self, sloc):
+        """
+        Return the bottom-most node from in ``Node`` and its children which
+        contains ``Sloc``, or ``None`` if there is none.
+        """
+        node = self._unwrap(self)
+        c_sloc = Sloc._c_type._unwrap(sloc)
+        result = _Entity_c_type()
+        _lookup_in_node(ctypes.byref(node), ctypes.byref(c_sloc),
+                        ctypes.byref(result))
+        return LKNode._wrap(result)
+
+    def __bool__(self):
+        """
+        Return always True so that checking a node against None can be done as
+        simply as::
+
+        if node: ...
+        """
+        return True
+    __nonzero__ = __bool__
+
+    def __iter__(self):
+        """
+        Return an iterator on the children of this node.
+        """
+        for i in range(len(self)):
+            yield self[i]
+
+    def __len__(self):
+        """
+        Return the number of LKNode children this node has.
+        """
+        node = self._unwrap(self)
+        return _node_children_count(ctypes.byref(node))
+
+    def __getitem__(self, key):
+        """
+        Return the Nth LKNode child this node has.
+
+        This handles negative indexes the same way Python lists do. Raise an
+        IndexError if "key" is out of range.
+        """
+        if not isinstance(key, int):
+            msg = ('LKNode children are integer-indexed'
+                   ' (got {})').format(type(key))
+            raise TypeError(msg)
+
+        if key < 0:
+            key += len(self)
+
+        if key in self._getitem_cache:
+            return self._getitem_cache[key]
+
+        node = self._unwrap(self)
+        result = _Entity_c_type()
+        success = _node_child(ctypes.byref(node), key, ctypes.byref(result))
+        if not success:
+            raise IndexError('child index out of range')
+        else:
+            result = LKNode._wrap(result)
+            self._getitem_cache[key] = result
+            return result
+
+    def iter_fields(self):
+        """
+        Iterate through all the fields this node contains.
+
+        Return an iterator that yields (name, value) couples for all abstract
+        fields in this node. If "self" is a list, field names will be
+        "item_{n}" with "n" being the index.
+        """
+        if self.is_list_type:
+            for i, value in enumerate(self):
+                yield ('item_{}'.format(i), value)
+        else:
+            for field_name in self._field_names:
+                yield (field_name, getattr(self, '{}'.format(field_name)))
+
+    def export_tree(self):
+        """
+        Return a flat representation of the sub-tree rooted at this node.
+
+        Traversing a big tree one node at a time is slow: this computes the
+        data for all nodes in a single native call, which is a lot faster.
+
+        :rtype: NodeTree
+        """
+        node = self._unwrap(self)
+        c_tree = _node_tree()
+        _node_export_tree(ctypes.byref(node), ctypes.byref(c_tree))
+        return NodeTree(self, c_tree)
+
+    def dump_str(self):
+        """
+        Dump the sub-tree to a string in a human-readable format.
+        """
+        output = _py2to3.StringIO()
+        self.dump(file=output)
+        ret = output.getvalue()
+        output.close()
+        return ret
+
+    def dump(self, indent='', file=sys.stdout):
+        """
+        Dump the sub-tree in a human-readable format on the given file.
+
+        :param str indent: Prefix printed on each line during the dump. :param
+        file file: File in which the dump must occur.
+        """
+
+        def print_node(name, value):
+            if isinstance(value, LKNode):
+                print('{}{}:'.format(indent, name), file=file)
+                value.dump(indent + '  ', file)
+            else:
+                print('{}{}: {}'.format(indent, name, value), file=file)
+
+        erepr = self.entity_repr[1:-1]
+        print('{}{}{}'.format(
+            indent, erepr,
+            ': {}'.format(self.text) if self.is_token_node else ''
+        ), file=file)
+        indent = indent + '|'
+        if self.is_list_type:
+            for i, value in enumerate(self):
+                print_node("item_{}".format(i), value)
+        else:
+            for name, value in self.iter_fields():
+                # Remove the f_ prefix to have the same behavior as the Ada
+                # dumper.
+                print_node(name[2:], value)
+
+    def findall(self, ast_type_or_pred, **kwargs):
+        """
+        Helper for finditer that will return all results as a list. See
+        finditer's documentation for more details.
+        """
+        return list(self.finditer(ast_type_or_pred, **kwargs))
+
+    def find(self, ast_type_or_pred, **kwargs):
+        """
+        Helper for finditer that will return only the first result. See
+        finditer's documentation for more details.
+        """
+        try:
+            return next(self.finditer(ast_type_or_pred, **kwargs))
+        except StopIteration:
+            return None
+
+    def finditer(self, ast_type_or_pred, **kwargs):
+        """
+        Find every node corresponding to the passed predicates.
+
+        :param ast_type_or_pred: If supplied with a subclass of LKNode, will
+        constrain the resulting collection to only the instances of this type
+        or any subclass. If supplied with a predicate, it will apply the
+        predicate on every node and keep only the ones for which it returns
+        True. If supplied with a list of subclasses of LKNode, it will match
+        all instances of any of them. :type ast_type_or_pred: type|((LKNode) ->
+        bool)|list[type]
+
+        :param kwargs: Allows the user to filter on attributes of the node. For
+        every key value association, if the node has an attribute of name key
+        that has the specified value, then the child is kept. :type kwargs:
+        dict[str, Any]
+        """
+        # Create a "pred" function to use as the node filter during the
+        # traversal.
+        if isinstance(ast_type_or_pred, type):
+            sought_type = ast_type_or_pred
+            pred = lambda node: isinstance(node, sought_type)
+        elif isinstance(ast_type_or_pred, collections.Sequence):
+            sought_types = ast_type_or_pred
+            pred = lambda node: isinstance(node, tuple(sought_types))
+        else:
+            pred = ast_type_or_pred
+
+        def match(left, right):
+            """
+            :param left: Node child to match.
+            :param right: Matcher, coming from ``kwargs``.
+            """
+            if left is None:
+                return
+            if hasattr(left, "match"):
+                return left.match(right)
+            else:
+                return left == right
+
+        def helper(node):
+            for child in node:
+                if child is not None:
+                    if pred(child):
+                        if not kwargs:
+                            yield child
+                        elif all([match(getattr(child, key, None), val)
+                                  for key, val in kwargs.items()]):
+                            yield child
+                    for c in helper(child):
+                        if c is not None:
+                            yield c
+
+        return helper(self)
+
+    @property
+    def parent_chain(self):
+        """
+        Return the parent chain of self. Self will be the first element,
+        followed by the first parent, then this parent's parent, etc.
+        """
+        def _parent_chain(node):
+            yield node
+            if node.parent is not None:
+                for p in _parent_chain(node.parent):
+                    yield p
+
+        return list(_parent_chain(self))
+
+    def __repr__(self):
+        return self.image
+
+    @property
+    def entity_repr(self):
+        c_value = self._unwrap(self)
+        c_result = _text()
+        _entity_image(ctypes.byref(c_value), ctypes.byref(c_result))
+        return c_result._wrap()
+
+    @property
+    def tokens(self):
+        """
+        Return an iterator on the range of tokens that self encompasses.
+        """
+        start = self.token_start
+        end = self.token_end
+        while not start == end:
+            yield start
+            start = start.next
+        yield end
+
+    def to_data(self):
+        """
+        Return a nested python data-structure, constituted only of standard
+        data types (dicts, lists, strings, ints, etc), and representing the
+        portion of the AST corresponding to this node.
+        """
+        if self.is_list_type:
+            return [i.to_data() for i in self if i is not None]
+        else:
+            return {n: v.to_data()
+                    for n, v in self.iter_fields()
+                    if v is not None}
+
+    def to_json(self):
+        """
+        Return a JSON representation of this node.
+        """
+        return json.dumps(self.to_data())
+
+    def is_a(self, *types):
+        """
+        Shortcut for isinstance(self, types).
+        :rtype: bool
+        """
+        return isinstance(self, tuple(types))
+
+    def cast(self, typ):
+        """
+        Fluent interface style method. Return ``self``, raise an error if self
+        is not of type ``typ``.
+
+        :type typ: () -> T
+        :rtype: T
+        """
+        assert isinstance(self, typ)
+        return self
+
+    _node_c_type = _hashable_c_pointer()
+
+    @classmethod
+    def _wrap(cls, c_value):
+        """
+        Internal helper to wrap a low-level entity value into an instance of
+        the the appropriate high-level Python wrapper subclass.
+        """
+        node_c_value = c_value.node
+        if not node_c_value:
+            return None
+
+        rebindings = c_value.info.rebindings
+        metadata = c_value.info.md
+
+        # Look for an already existing wrapper for this node
+        cache_key = (node_c_value, metadata, rebindings)
+        unit = cls._fetch_unit(c_value)
+        unit._check_node_cache()
+        try:
+            return unit._node_cache[cache_key]
+        except KeyError:
+            pass
+
+        # Pick the right subclass to materialize this node in Python
+        kind = _node_kind(ctypes.byref(c_value))
+        result = _kind_to_astnode_cls[kind](c_value, node_c_value, metadata,
+                                            rebindings, unit)
+        unit._node_cache[cache_key] = result
+        return result
+
+    @classmethod
+    def _wrap_bare_node(cls, c_value):
+        return cls._wrap(_Entity_c_type.from_bare_node(c_value))
+
+    @classmethod
+    def _unwrap(cls, py_value):
+        """
+        Internal helper to unwrap a high-level ASTNode instance into a
+        low-level value. Raise a TypeError if the input value has unexpected
+        type.
+        """
+        if py_value is None:
+            return _Entity_c_type._null_value
+        elif not isinstance(py_value, LKNode):
+            _raise_type_error('LKNode', py_value)
+        else:
+            return py_value._c_value
+
+    @property
+    def _unwrap_einfo(self):
+        return self._c_value.info
+
+    @classmethod
+    def _fetch_unit(cls, c_value):
+        return AnalysisUnit._wrap(_node_unit(ctypes.byref(c_value)))
+
+    def _eval_field(self, c_result, c_accessor, *c_args):
+        """
+        Internal helper to evaluate low-level field accessors/properties.
+
+        This calls "c_accessor" on this node with the input arguments and puts
+        the result in "c_result". This raises a PropertyError if the evaluation
+        failed. Return "c_result" for convenience.
+        """
+        args = (self._unwrap(self), ) + c_args + (ctypes.byref(c_result), )
+        if not c_accessor(*args):
+            raise PropertyError()
+        return c_result
+
+    def _eval_astnode_field(self, c_accessor):
+        """
+        Internal helper. Wrapper around _eval_field for fields that return an
+        AST node and that accept no explicit argument. This is useful as it's
+        the most common case of field, so using this wrapper reduces generated
+        code length.
+        """
+        c_result = self._eval_field(_Entity_c_type(), c_accessor)
+        node_c_value = c_result.node
+        if not node_c_value:
+            return None
+
+        # Fast path: such fields most often return nodes that belong to the
+        # same unit as this node. Look for an existing wrapper in this unit's
+        # node cache first, which saves the native calls that _wrap needs to
+        # fetch the unit of the result. Node addresses are unique among live
+        # nodes, so a cache hit is necessarily the right node.
+        unit = self._unit
+        unit._check_node_cache()
+        cache_key = (node_c_value, c_result.info.md, c_result.info.rebindings)
+        try:
+            return unit._node_cache[cache_key]
+        except KeyError:
+            return LKNode._wrap(c_result)
+
+
+class _node_tree(ctypes.Structure):
+    """
+    C value for flat trees of nodes. See ``NodeTree``.
+    """
+    _fields_ = [('count', ctypes.c_int),
+                ('nodes', ctypes.c_void_p),
+                ('kinds', ctypes.c_void_p),
+                ('parents', ctypes.c_void_p),
+                ('children_counts', ctypes.c_void_p),
+                ('token_starts', ctypes.c_void_p),
+                ('token_ends', ctypes.c_void_p),
+                ('start_lines', ctypes.c_void_p),
+                ('start_columns', ctypes.c_void_p),
+                ('end_lines', ctypes.c_void_p),
+                ('end_columns', ctypes.c_void_p)]
+
+
+class _ColumnarData(object):
+    """
+    Base class for wrappers of columnar data that the C API allocates in a
+    single memory block: ``NodeTree`` and ``TokenTable``.
+    """
+
+    _columns = []
+    """
+    Name, ctypes element type and memoryview format for each column, in memory
+    order: the last column ends the memory block.
+    """
+
+    def _init_columns(self, c_value, first_field, destroy):
+        """
+        Expose all columns in ``c_value`` as memoryview attributes.
+
+        :param c_value: C value that the C API filled.
+        :param str first_field: Name of the ``c_value`` field for the data
+            that starts the memory block.
+        :param destroy: C API function to free the memory block.
+        """
+        self._count = count = c_value.count
+
+        # Wrap the memory block in a single ctypes array, and free the block
+        # only when this array is garbage collected, i.e. when this wrapper
+        # and all its columns are.
+        base = getattr(c_value, first_field) or 0
+        last_name, last_type, _ = self._columns[-1]
+        size = (
+            (getattr(c_value, last_name) + ctypes.sizeof(last_type) * count
+             - base)
+            if count else 0
+        )
+        self._block = (ctypes.c_char * size).from_address(base)
+        weakref.finalize(self._block, destroy, ctypes.byref(c_value))
+
+        memory = memoryview(self._block).cast('B')
+        for name, c_type, fmt in self._columns:
+            offset = (getattr(c_value, name) or base) - base
+            column = memory[offset:offset + ctypes.sizeof(c_type) * count]
+            setattr(self, name, column.cast(fmt))
+
+    def __len__(self):
+        return self._count
+
+
+class NodeTree(_ColumnarData):
+    """
+    Flat representation of a tree of nodes, as computed by the
+    ``LKNode.export_tree`` method.
+
+    Nodes are stored in prefix depth-first order, so the root node comes first,
+    and the children of each node come right after it. Null children are
+    skipped. Node data is available as columns: for each column attribute, the
+    Nth item contains the corresponding data for the Nth node. Columns are
+    memoryview objects that reference native memory without copying it, so they
+    can be used in vectorized processing (for instance with
+    ``numpy.frombuffer``). Columns are:
+
+    * ``kinds``: integer kind for each node (see ``LKNode.kind_name``).
+
+    * ``parents``: index of the parent node (-1 for the root node).
+
+    * ``children_counts``: number of non-null children.
+
+    * ``token_starts``/``token_ends``: indexes of the first and last tokens for
+    each node. Token end is 0 for ghost nodes.
+
+    * ``start_lines``/``start_columns``/``end_lines``/``end_columns``: source
+    location ranges for each node.
+    """
+
+    _columns = [('kinds', ctypes.c_int, 'i'),
+                ('parents', ctypes.c_int, 'i'),
+                ('children_counts', ctypes.c_int, 'i'),
+                ('token_starts', ctypes.c_int, 'i'),
+                ('token_ends', ctypes.c_int, 'i'),
+                ('start_lines', ctypes.c_uint32, 'I'),
+                ('start_columns', ctypes.c_uint16, 'H'),
+                ('end_lines', ctypes.c_uint32, 'I'),
+                ('end_columns', ctypes.c_uint16, 'H')]
+    """
+    Name, ctypes element type and memoryview format for each column.
+    """
+
+    def __init__(self, root, c_value):
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly. Use ``LKNode.export_tree`` instead.
+        """
+        self._root = root
+
+        # The memory block starts with nodes, followed by all columns
+        self._init_columns(c_value, 'nodes', _destroy_node_tree)
+        self._nodes = (
+            (LKNode._node_c_type * self._count)
+            .from_address(ctypes.addressof(self._block))
+        )
+
+    def node(self, index):
+        """
+        Return the node at the given index in this tree.
+
+        :param int index: Index of the node to return. :rtype: LKNode
+        """
+        return LKNode._wrap(_Entity_c_type(
+            self._nodes[index], self._root._unwrap_einfo
+        ))
+
+    def kind_name(self, index):
+        """
+        Return the kind name for the node at the given index in this tree.
+
+        :param int index: Index of the node. :rtype: str
+        """
+        return _kind_to_astnode_cls[self.kinds[index]]._kind_name
+
+
+class _token_table(ctypes.Structure):
+    """
+    C value for columnar token streams. See ``TokenTable``.
+    """
+    _fields_ = [('count', ctypes.c_int),
+                ('kinds', ctypes.c_void_p),
+                ('start_offsets', ctypes.c_void_p),
+                ('end_offsets', ctypes.c_void_p),
+                ('start_lines', ctypes.c_void_p),
+                ('end_lines', ctypes.c_void_p),
+                ('start_columns', ctypes.c_void_p),
+                ('end_columns', ctypes.c_void_p),
+                ('is_trivia', ctypes.c_void_p)]
+
+
+class TokenTable(_ColumnarData):
+    """
+    Columnar representation of the stream of tokens and trivia in an analysis
+    unit, as computed by the ``AnalysisUnit.token_table`` method.
+
+    Tokens and trivia are stored in the same order as in the source. Token data
+    is available as columns: for each column attribute, the Nth item contains
+    the corresponding data for the Nth token or trivia. Columns are memoryview
+    objects that reference native memory without copying it, so they can be
+    used in vectorized processing (for instance with ``numpy.frombuffer``).
+    Columns are:
+
+    * ``kinds``: integer kind for each token (see ``kind_name``).
+
+    * ``start_offsets``/``end_offsets``: 0-based indexes in the unit text of
+    the first character of each token and of the character that follows the
+    last one.
+
+    * ``start_lines``/``start_columns``/``end_lines``/``end_columns``: source
+    location ranges for each token.
+
+    * ``is_trivia``: 1 for trivia, 0 for regular tokens.
+    """
+
+    _columns = [('kinds', ctypes.c_int, 'i'),
+                ('start_offsets', ctypes.c_int, 'i'),
+                ('end_offsets', ctypes.c_int, 'i'),
+                ('start_lines', ctypes.c_uint32, 'I'),
+                ('end_lines', ctypes.c_uint32, 'I'),
+                ('start_columns', ctypes.c_uint16, 'H'),
+                ('end_columns', ctypes.c_uint16, 'H'),
+                ('is_trivia', ctypes.c_uint8, 'B')]
+    """
+    Name, ctypes element type and memoryview format for each column.
+    """
+
+    def __init__(self, unit, c_value):
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly. Use ``AnalysisUnit.token_table`` instead.
+        """
+        self._unit = unit
+        self._init_columns(c_value, 'kinds', _destroy_token_table)
+
+    def kind_name(self, index):
+        """
+        Return the kind name for the token at the given index in this table.
+
+        :param int index: Index of the token. :rtype: str
+        """
+        return _unwrap_str(_token_kind_name(self.kinds[index]))
+
+
+
+
+class BaseLexerCaseRuleAlt(LKNode):
+    """
+    Base class for the different kind of alternatives allowed in a case rule.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_send(self):
+        """
+        :rtype: LexerCaseRuleSend
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_base_lexer_case_rule_alt_f_send)
+
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+    )
+
+
+
+
+
+
+
+class LexerCaseRuleCondAlt(BaseLexerCaseRuleAlt):
+    """
+    Alternative of a case rule which sends the token only if the kind of the
+    previous token is among a given set.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_cond_exprs(self):
+        """
+        :rtype: RefIdList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_lexer_case_rule_cond_alt_f_cond_exprs)
+
+
+
+        return result
+
+    _field_names = BaseLexerCaseRuleAlt._field_names + (
+        "f_cond_exprs",
+        "f_send",
+    )
+
+    _kind_name = 'LexerCaseRuleCondAlt'
+
+
+
+
+
+
+class LexerCaseRuleDefaultAlt(BaseLexerCaseRuleAlt):
+    """
+    Default alternative of a case rule which sends the token if all the
+    previous alternatives failed.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = BaseLexerCaseRuleAlt._field_names + (
+        "f_send",
+    )
+
+    _kind_name = 'LexerCaseRuleDefaultAlt'
+
+
+
+
+
+
+class Decl(LKNode):
+    """
+    Base class for declarations. Encompasses regular declarations as well as
+    special declarations such as grammars, grammar rules, etc.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_syn_name(self):
+        """
+        :rtype: DefId
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_decl_f_syn_name)
+
+
+
+        return result
+    
+    @property
+    def p_name(self):
+        """
+        Return the symbol corresponding to the name of this declaration.
+
+        :rtype: str
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_symbol_type(), _decl_p_name)
+        result = _symbol_type.wrap(c_result)
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+    )
+
+
+
+
+
+
+
+class BaseGrammarDecl(Decl):
+    """
+    Base class for all declarations related to grammars.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Decl._field_names + (
+    )
+
+
+
+
+
+
+
+class GrammarDecl(BaseGrammarDecl):
+    """
+    Declaration of a language's grammar.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_rules(self):
+        """
+        :rtype: FullDeclList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_decl_f_rules)
+
+
+
+        return result
+    
+    @property
+    def p_lexer(self):
+        """
+        Return the lexer that is associated to this grammar.
+
+        :rtype: Decl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _grammar_decl_p_lexer)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+
+    _field_names = BaseGrammarDecl._field_names + (
+        "f_syn_name",
+        "f_rules",
+    )
+
+    _kind_name = 'GrammarDecl'
+
+
+
+
+
+
+class BaseGrammarRuleDecl(Decl):
+    """
+    Base class for grammar rules inside of grammars/lexers.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        :rtype: GrammarExpr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_base_grammar_rule_decl_f_expr)
+
+
+
+        return result
+
+    _field_names = Decl._field_names + (
+    )
+
+
+
+
+
+
+
+class GrammarRuleDecl(BaseGrammarRuleDecl):
+    """
+    Declaration of a grammar rule inside of a grammar.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = BaseGrammarRuleDecl._field_names + (
+        "f_syn_name",
+        "f_expr",
+    )
+
+    _kind_name = 'GrammarRuleDecl'
+
+
+
+
+
+
+class SyntheticLexerDecl(BaseGrammarRuleDecl):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = BaseGrammarRuleDecl._field_names + (
+    )
+
+    _kind_name = 'SyntheticLexerDecl'
+
+
+
+
+
+
+class BaseValDecl(Decl):
+    """
+    Abstract class for named values declarations, such as arguments, local
+    value bindings, fields, etc.
+    """
+    __slots__ = []
+
+    
+
+    
+    def p_get_type(self, no_inference=False):
+        """
+        Get the type of this value declaration.
+
+        :param no_inference:
+        :type no_inference: bool
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+        unwrapped_no_inference = bool(no_inference)
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _base_val_decl_p_get_type, unwrapped_no_inference)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+
+    _field_names = Decl._field_names + (
+    )
+
+
+
+
+
+
+
+class NodeDecl(BaseValDecl):
+    """
+    Synthetic declaration for the implicit "node" variable available in
+    properties.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = BaseValDecl._field_names + (
+    )
+
+    _kind_name = 'NodeDecl'
+
+
+
+
+
+
+class SelfDecl(BaseValDecl):
+    """
+    Synthetic declaration for the implicit "self" variable available in
+    properties.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = BaseValDecl._field_names + (
+    )
+
+    _kind_name = 'SelfDecl'
+
+
+
+
+
+
+class UserValDecl(BaseValDecl):
+    """
+    Class for user declared val declarations (not synthetic).
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = BaseValDecl._field_names + (
+        "f_syn_name",
+    )
+
+
+
+
+
+
+
+class EnumLitDecl(UserValDecl):
+    """
+    Enum literal declaration.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = UserValDecl._field_names + (
+    )
+
+    _kind_name = 'EnumLitDecl'
+
+
+
+
+
+
+class ExplicitlyTypedDecl(UserValDecl):
+    """
+    Subset of user declared value declarations for values that have a type that
+    can be syntactically annotated by the user.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_decl_type(self):
+        """
+        :rtype: TypeRef
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_explicitly_typed_decl_f_decl_type)
+
+
+
+        return result
+
+    _field_names = UserValDecl._field_names + (
+    )
+
+
+
+
+
+
+
+class ComponentDecl(ExplicitlyTypedDecl):
+    """
+    Subset of explicitly typed declarations for value declarations that:
+
+    1. Have an optional default value. 2. Are part of a bigger declaration that
+    can be referred to via a call expression (either a type or a function).
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_default_val(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_component_decl_f_default_val)
+
+
+
+        return result
+
+    _field_names = ExplicitlyTypedDecl._field_names + (
+    )
+
+
+
+
+
+
+
+class FieldDecl(ComponentDecl):
+    """
+    Field declaration.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = ComponentDecl._field_names + (
+        "f_decl_type",
+        "f_default_val",
+    )
+
+    _kind_name = 'FieldDecl'
+
+
+
+
+
+
+class FunArgDecl(ComponentDecl):
+    """
+    Function argument declaration.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = ComponentDecl._field_names + (
+        "f_decl_type",
+        "f_default_val",
+    )
+
+    _kind_name = 'FunArgDecl'
+
+
+
+
+
+
+class LambdaArgDecl(ComponentDecl):
+    """
+    Function argument declaration.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = ComponentDecl._field_names + (
+        "f_decl_type",
+        "f_default_val",
+    )
+
+    _kind_name = 'LambdaArgDecl'
+
+
+
+
+
+
+class MatchValDecl(ExplicitlyTypedDecl):
+    """
+    Value declaration in a match branch.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = ExplicitlyTypedDecl._field_names + (
+        "f_decl_type",
+    )
+
+    _kind_name = 'MatchValDecl'
+
+
+
+
+
+
+class ValDecl(ExplicitlyTypedDecl):
+    """
+    Value declaration.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_val(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_val_decl_f_val)
+
+
+
+        return result
+
+    _field_names = ExplicitlyTypedDecl._field_names + (
+        "f_decl_type",
+        "f_val",
+    )
+
+    _kind_name = 'ValDecl'
+
+
+
+
+
+
+class FunDecl(UserValDecl):
+    """
+    Function declaration.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_args(self):
+        """
+        :rtype: FunArgDeclList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_fun_decl_f_args)
+
+
+
+        return result
+    
+    @property
+    def f_return_type(self):
+        """
+        :rtype: TypeRef
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_fun_decl_f_return_type)
+
+
+
+        return result
+    
+    @property
+    def f_body(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_fun_decl_f_body)
+
+
+
+        return result
+
+    _field_names = UserValDecl._field_names + (
+        "f_args",
+        "f_return_type",
+        "f_body",
+    )
+
+    _kind_name = 'FunDecl'
+
+
+
+
+
+
+class GenericDecl(Decl):
+    """
+    Generic entity declaration.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_generic_formal_decls(self):
+        """
+        :rtype: FullDeclList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_generic_decl_f_generic_formal_decls)
+
+
+
+        return result
+    
+    @property
+    def f_decl(self):
+        """
+        This field can contain one of the following nodes:
+
+        * BaseGrammarDecl
+
+        * FieldDecl
+
+        * FunDecl
+
+        * GenericDecl
+
+        * GrammarRuleDecl
+
+        * LexerDecl
+
+        * NamedTypeDecl
+
+        * ValDecl
+
+        :rtype: Decl
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_generic_decl_f_decl)
+
+
+
+        return result
+
+    _field_names = Decl._field_names + (
+        "f_generic_formal_decls",
+        "f_decl",
+    )
+
+    _kind_name = 'GenericDecl'
+
+
+
+
+
+
+class LexerDecl(Decl):
+    """
+    Declaration of a language's lexer.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_rules(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * FullDecl
+
+        * LexerCaseRule
+
+        :rtype: LKNodeList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_lexer_decl_f_rules)
+
+
+
+        return result
+
+    _field_names = Decl._field_names + (
+        "f_syn_name",
+        "f_rules",
+    )
+
+    _kind_name = 'LexerDecl'
+
+
+
+
+
+
+class LexerFamilyDecl(Decl):
+    """
+    Declaration of a token family.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_rules(self):
+        """
+        :rtype: FullDeclList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_lexer_family_decl_f_rules)
+
+
+
+        return result
+
+    _field_names = Decl._field_names + (
+        "f_syn_name",
+        "f_rules",
+    )
+
+    _kind_name = 'LexerFamilyDecl'
+
+
+
+
+
+
+class TypeDecl(Decl):
+    """
+    Abstract base class for type declarations.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_traits(self):
+        """
+        Traits for this type
+
+        :rtype: TypeRefList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_type_decl_f_traits)
+
+
+
+        return result
+    
+    @property
+    def p_implemented_traits(self):
+        """
+        Traits implemented by this type.
+
+        :rtype: List[TypeDecl]
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_LKNodeArrayConverter.c_type(), _type_decl_p_implemented_traits)
+        result = _LKNodeArrayConverter.wrap(c_result, False)
+
+
+        return result
+    
+    @property
+    def f_base_type(self):
+        """
+        :rtype: TypeRef
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_type_decl_f_base_type)
+
+
+
+        return result
+    
+    @property
+    def p_base_types(self):
+        """
+        Return the chain of base types for this type, if applicable, else null.
+
+        :rtype: List[TypeDecl]
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_LKNodeArrayConverter.c_type(), _type_decl_p_base_types)
+        result = _LKNodeArrayConverter.wrap(c_result, False)
+
+
+        return result
+    
+    @property
+    def p_root_type(self):
+        """
+        Return the root type of this type, if applicable, else null.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _type_decl_p_root_type)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    def p_is_subtype(self, potential_base):
+        """
+        Return whether ``self`` is a subtype of ``potential_base``.
+
+        :param potential_base:
+        :type potential_base: TypeDecl
+        :rtype: bool
+        """
+        
+
+        
+
+        unwrapped_potential_base = LKNode._unwrap(potential_base)
+
+        
+        c_result = self._eval_field(ctypes.c_uint8(), _type_decl_p_is_subtype, unwrapped_potential_base)
+        result = bool(c_result.value)
+
+
+        return result
+    
+    @property
+    def p_is_generic(self):
+        """
+        Returns whether this type is an instantiated generic type.
+
+        :rtype: bool
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(ctypes.c_uint8(), _type_decl_p_is_generic)
+        result = bool(c_result.value)
+
+
+        return result
+
+    _field_names = Decl._field_names + (
+    )
+
+
+
+
+
+
+
+class EnumClassAltDecl(TypeDecl):
+    """
+    Alternative for an enum class decl.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = TypeDecl._field_names + (
+        "f_syn_name",
+    )
+
+    _kind_name = 'EnumClassAltDecl'
+
+
+
+
+
+
+class FunctionType(TypeDecl):
+    """
+    Function type.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = TypeDecl._field_names + (
+    )
+
+    _kind_name = 'FunctionType'
+
+
+
+
+
+
+class GenericFormalTypeDecl(TypeDecl):
+    """
+    Declaration of a generic formal type in a generic declaration.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = TypeDecl._field_names + (
+        "f_syn_name",
+    )
+
+    _kind_name = 'GenericFormalTypeDecl'
+
+
+
+
+
+
+class InstantiatedGenericType(TypeDecl):
+    """
+    Instantiated generic type.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def p_get_inner_type(self):
+        """
+        Return the generic type that ``self`` instantiates.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_instantiated_generic_type_p_get_inner_type)
+
+
+
+        return result
+    
+    @property
+    def p_get_actuals(self):
+        """
+        Return the declaration of types that were passed as generic actuals to
+        create ``self``.
+
+        :rtype: List[TypeDecl]
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_LKNodeArrayConverter.c_type(), _instantiated_generic_type_p_get_actuals)
+        result = _LKNodeArrayConverter.wrap(c_result, False)
+
+
+        return result
+    
+    @property
+    def p_get_instantiated_type(self):
+        """
+        Return the instantiated type decl with proper rebindings, that can be
+        used for typing and code generation.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _instantiated_generic_type_p_get_instantiated_type)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+
+    _field_names = TypeDecl._field_names + (
+    )
+
+    _kind_name = 'InstantiatedGenericType'
+
+
+
+
+
+
+class NamedTypeDecl(TypeDecl):
+    """
+    Explicit named type declaration.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_decls(self):
+        """
+        :rtype: DeclBlock
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_named_type_decl_f_decls)
+
+
+
+        return result
+
+    _field_names = TypeDecl._field_names + (
+    )
+
+
+
+
+
+
+
+class BasicClassDecl(NamedTypeDecl):
+    """
+    Common ancestor for declarations of regular classes and enum classes.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = NamedTypeDecl._field_names + (
+        "f_syn_name",
+        "f_base_type",
+        "f_traits",
+    )
+
+
+
+
+
+
+
+class ClassDecl(BasicClassDecl):
+    """
+    Declaration for a LK class. This only cover node classes for the moment,
+    but might be extended to support regular classes in the future.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = BasicClassDecl._field_names + (
+        "f_decls",
+    )
+
+    _kind_name = 'ClassDecl'
+
+
+
+
+
+
+class EnumClassDecl(BasicClassDecl):
+    """
+    Declaration for a LK class. This only cover node classes for the moment,
+    but might be extended to support regular classes in the future.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_branches(self):
+        """
+        :rtype: EnumClassCaseList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_enum_class_decl_f_branches)
+
+
+
+        return result
+
+    _field_names = BasicClassDecl._field_names + (
+        "f_branches",
+        "f_decls",
+    )
+
+    _kind_name = 'EnumClassDecl'
+
+
+
+
+
+
+class EnumTypeDecl(NamedTypeDecl):
+    """
+    Enum type declaration.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_literals(self):
+        """
+        :rtype: EnumLitDeclList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_enum_type_decl_f_literals)
+
+
+
+        return result
+
+    _field_names = NamedTypeDecl._field_names + (
+        "f_syn_name",
+        "f_traits",
+        "f_literals",
+        "f_decls",
+    )
+
+    _kind_name = 'EnumTypeDecl'
+
+
+
+
+
+
+class StructDecl(NamedTypeDecl):
+    """
+    Declaration for a LK struct.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = NamedTypeDecl._field_names + (
+        "f_syn_name",
+        "f_traits",
+        "f_decls",
+    )
+
+    _kind_name = 'StructDecl'
+
+
+
+
+
+
+class TraitDecl(NamedTypeDecl):
+    """
+    Trait declaration. For the moment, a Trait can just be used to group
+    behavior for built-in types. It's not usable as a type-bound since we don't
+    have generics, and you cannot implement one either.
+
+    The reason they're added is to lay down the basics of what we want the LKT
+    type system to be.
+
+    TODO: Traits are *not* types. They're treated as such in the grammar for
+    convenience for now, but it's probably not a good idea. Migrate away from
+    this.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = NamedTypeDecl._field_names + (
+        "f_syn_name",
+        "f_decls",
+    )
+
+    _kind_name = 'TraitDecl'
+
+
+
+
+
+
+class DeclAnnotation(LKNode):
+    """
+    Compile time annotation attached to a declaration.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_name(self):
+        """
+        :rtype: Id
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_decl_annotation_f_name)
+
+
+
+        return result
+    
+    @property
+    def f_params(self):
+        """
+        :rtype: DeclAnnotationParams
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_decl_annotation_f_params)
+
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+        "f_name",
+        "f_params",
+    )
+
+    _kind_name = 'DeclAnnotation'
+
+
+
+
+
+
+class DeclAnnotationParams(LKNode):
+    """
+    List of arguments for an annotation with a call syntax. This intermediate
+    node is necessary in order to determine after parsing whether there is no
+    param list, or if the list is empty.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_params(self):
+        """
+        :rtype: ParamList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_decl_annotation_params_f_params)
+
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+        "f_params",
+    )
+
+    _kind_name = 'DeclAnnotationParams'
+
+
+
+
+
+
+class Doc(LKNode):
+    """
+    Documentation attached to a decl node.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_lines(self):
+        """
+        :rtype: DocCommentList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_doc_f_lines)
+
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+        "f_lines",
+    )
+
+    _kind_name = 'Doc'
+
+
+
+
+
+
+class DocComment(LKNode):
+    """
+    Node for one line of documentation attached to a node.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNode._field_names + (
+    )
+
+    _kind_name = 'DocComment'
+
+
+
+
+
+
+class ElsifBranch(LKNode):
+    """
+    Elsif branch of an if expression.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_cond_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_elsif_branch_f_cond_expr)
+
+
+
+        return result
+    
+    @property
+    def f_then_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_elsif_branch_f_then_expr)
+
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+        "f_cond_expr",
+        "f_then_expr",
+    )
+
+    _kind_name = 'ElsifBranch'
+
+
+
+
+
+
+class EnumClassCase(LKNode):
+    """
+    Case branch for an enum class declaration.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_decls(self):
+        """
+        :rtype: EnumClassAltDeclList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_enum_class_case_f_decls)
+
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+        "f_decls",
+    )
+
+    _kind_name = 'EnumClassCase'
+
+
+
+
+
+
+class ExcludesNull(LKNode):
+    """
+    Whether the containing cast expression will raise on null cast result or
+    not.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def p_as_bool(self):
+        """
+        Return whether this is an instance of ExcludesNullPresent
+
+        :rtype: bool
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(ctypes.c_uint8(), _excludes_null_p_as_bool)
+        result = bool(c_result.value)
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+    )
+
+
+
+
+
+
+
+class ExcludesNullAbsent(ExcludesNull):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = ExcludesNull._field_names + (
+    )
+
+    _kind_name = 'ExcludesNullAbsent'
+
+
+
+
+
+
+class ExcludesNullPresent(ExcludesNull):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = ExcludesNull._field_names + (
+    )
+
+    _kind_name = 'ExcludesNullPresent'
+
+
+
+
+
+
+class Expr(LKNode):
+    """
+    Base class for expressions. Encompasses regular expressions as well as
+    special expressions (grammar expressions, etc).
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def p_in_type_ref(self):
+        """
+        Return whether this expression is part of a type reference.
+
+        :rtype: bool
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(ctypes.c_uint8(), _expr_p_in_type_ref)
+        result = bool(c_result.value)
+
+
+        return result
+    
+    @property
+    def p_is_regular_expr(self):
+        """
+        Return whether this expression is a regular expression that can be
+        evaluated at runtime, in particular:
+
+        * Not part of a type reference.
+
+        * Not part of a declaration annotation.
+
+        * Not a defining identifier.
+
+        TODO: List  to be expanded probably to take into account grammar
+        expressions.
+
+        :rtype: bool
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(ctypes.c_uint8(), _expr_p_is_regular_expr)
+        result = bool(c_result.value)
+
+
+        return result
+    
+    @property
+    def p_expr_type(self):
+        """
+        Return the type of this expression, if it is a regular expression (see
+        ``is_regular_expr``), null otherwise.
+
+        :rtype: SemanticResult
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(SemanticResult._c_type(), _expr_p_expr_type)
+        result = SemanticResult._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def p_check_expr_type(self):
+        """
+        Return the type of this expression. Assumes that this is a regular and
+        valid expression. If this is called on a non regular or non valid
+        expression, it will raise an error.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _expr_p_check_expr_type)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def p_expr_context_free_type(self):
+        """
+        If the type of this expression can be determined with no bottom up
+        context, return it. This will be used by `expr_type_impl`'s default
+        implementation.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _expr_p_expr_context_free_type)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def p_referenced_decl(self):
+        """
+        Return the declaration referenced by this expression, if applicable,
+        null otherwise.
+
+        :rtype: SemanticResult
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(SemanticResult._c_type(), _expr_p_referenced_decl)
+        result = SemanticResult._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def p_check_referenced_decl(self):
+        """
+        Return the referenced decl of this expr, raise otherwise.
+
+        :rtype: Decl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _expr_p_check_referenced_decl)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+    )
+
+
+
+
+
+
+
+class ArrayLiteral(Expr):
+    """
+    Literal for an array value.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_exprs(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_array_literal_f_exprs)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_exprs",
+    )
+
+    _kind_name = 'ArrayLiteral'
+
+
+
+
+
+
+class BinOp(Expr):
+    """
+    Binary operator expression.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_left(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_bin_op_f_left)
+
+
+
+        return result
+    
+    @property
+    def f_op(self):
+        """
+        :rtype: Op
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_bin_op_f_op)
+
+
+
+        return result
+    
+    @property
+    def f_right(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_bin_op_f_right)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_left",
+        "f_op",
+        "f_right",
+    )
+
+    _kind_name = 'BinOp'
+
+
+
+
+
+
+class BlockExpr(Expr):
+    """
+    Block expression.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_val_defs(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * ValDecl
+
+        * VarBind
+
+        :rtype: LKNodeList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_block_expr_f_val_defs)
+
+
+
+        return result
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_block_expr_f_expr)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_val_defs",
+        "f_expr",
+    )
+
+    _kind_name = 'BlockExpr'
+
+
+
+
+
+
+class CallExpr(Expr):
+    """
+    Call expression.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_name(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * Lit
+
+        * MatchExpr
+
+        * ParenExpr
+
+        * RefId
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_call_expr_f_name)
+
+
+
+        return result
+    
+    @property
+    def f_args(self):
+        """
+        :rtype: ParamList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_call_expr_f_args)
+
+
+
+        return result
+    
+    @property
+    def p_called_object_type(self):
+        """
+        Return the type of the called object.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _call_expr_p_called_object_type)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def p_called_decl(self):
+        """
+        Return the declaration that is called by this call expression.
+
+        :rtype: Decl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _call_expr_p_called_decl)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_name",
+        "f_args",
+    )
+
+    _kind_name = 'CallExpr'
+
+
+
+
+
+
+class NullCondCallExpr(CallExpr):
+    """
+    Null conditional call expression.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = CallExpr._field_names + (
+    )
+
+    _kind_name = 'NullCondCallExpr'
+
+
+
+
+
+
+class CastExpr(Expr):
+    """
+    Cast expression.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * Lit
+
+        * MatchExpr
+
+        * ParenExpr
+
+        * RefId
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_cast_expr_f_expr)
+
+
+
+        return result
+    
+    @property
+    def f_excludes_null(self):
+        """
+        :rtype: ExcludesNull
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_cast_expr_f_excludes_null)
+
+
+
+        return result
+    
+    @property
+    def f_dest_type(self):
+        """
+        :rtype: TypeRef
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_cast_expr_f_dest_type)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_expr",
+        "f_excludes_null",
+        "f_dest_type",
+    )
+
+    _kind_name = 'CastExpr'
+
+
+
+
+
+
+class DotExpr(Expr):
+    """
+    Dotted expression.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_prefix(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * Lit
+
+        * MatchExpr
+
+        * ParenExpr
+
+        * RefId
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_dot_expr_f_prefix)
+
+
+
+        return result
+    
+    @property
+    def f_suffix(self):
+        """
+        :rtype: RefId
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_dot_expr_f_suffix)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_prefix",
+        "f_suffix",
+    )
+
+    _kind_name = 'DotExpr'
+
+
+
+
+
+
+class NullCondDottedName(DotExpr):
+    """
+    Null conditional dotted expression.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = DotExpr._field_names + (
+    )
+
+    _kind_name = 'NullCondDottedName'
+
+
+
+
+
+
+class ErrorOnNull(Expr):
+    """
+    Expression that throws an error if LHS is null.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * Lit
+
+        * MatchExpr
+
+        * ParenExpr
+
+        * RefId
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_error_on_null_f_expr)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_expr",
+    )
+
+    _kind_name = 'ErrorOnNull'
+
+
+
+
+
+
+class GenericInstantiation(Expr):
+    """
+    Generic instantiation.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_name(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * Lit
+
+        * MatchExpr
+
+        * ParenExpr
+
+        * RefId
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_generic_instantiation_f_name)
+
+
+
+        return result
+    
+    @property
+    def f_args(self):
+        """
+        :rtype: TypeRefList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_generic_instantiation_f_args)
+
+
+
+        return result
+    
+    @property
+    def p_instantiated_decl(self):
+        """
+        Get the type designated by this instantiation.
+
+        :rtype: Decl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _generic_instantiation_p_instantiated_decl)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_name",
+        "f_args",
+    )
+
+    _kind_name = 'GenericInstantiation'
+
+
+
+
+
+
+class GrammarExpr(Expr):
+    """
+    Base class for expressions related to grammars.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Expr._field_names + (
+    )
+
+
+
+
+
+
+
+class GrammarCut(GrammarExpr):
+    """
+    Grammar expression for a cut.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = GrammarExpr._field_names + (
+    )
+
+    _kind_name = 'GrammarCut'
+
+
+
+
+
+
+class GrammarDiscard(GrammarExpr):
+    """
+    Grammar expression to discard the match.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        :rtype: GrammarExpr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_discard_f_expr)
+
+
+
+        return result
+
+    _field_names = GrammarExpr._field_names + (
+        "f_expr",
+    )
+
+    _kind_name = 'GrammarDiscard'
+
+
+
+
+
+
+class GrammarDontSkip(GrammarExpr):
+    """
+    Grammar expression (error recovery) to ensure that any nested skip parser
+    calls won't skip certain parse results.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        :rtype: GrammarExpr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_dont_skip_f_expr)
+
+
+
+        return result
+    
+    @property
+    def f_dont_skip(self):
+        """
+        :rtype: GrammarExpr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_dont_skip_f_dont_skip)
+
+
+
+        return result
+
+    _field_names = GrammarExpr._field_names + (
+        "f_expr",
+        "f_dont_skip",
+    )
+
+    _kind_name = 'GrammarDontSkip'
+
+
+
+
+
+
+class GrammarList(GrammarExpr):
+    """
+    Grammar expression to parse lists of results. Results can be separated by a
+    separator. List can be empty ('*') or not ('+').
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_list_type(self):
+        """
+        :rtype: TypeRef
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_list_f_list_type)
+
+
+
+        return result
+    
+    @property
+    def f_kind(self):
+        """
+        :rtype: ListKind
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_list_f_kind)
+
+
+
+        return result
+    
+    @property
+    def f_expr(self):
+        """
+        :rtype: GrammarExpr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_list_f_expr)
+
+
+
+        return result
+    
+    @property
+    def f_sep(self):
+        """
+        :rtype: GrammarExpr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_list_f_sep)
+
+
+
+        return result
+
+    _field_names = GrammarExpr._field_names + (
+        "f_list_type",
+        "f_kind",
+        "f_expr",
+        "f_sep",
+    )
+
+    _kind_name = 'GrammarList'
+
+
+
+
+
+
+class GrammarNull(GrammarExpr):
+    """
+    Grammar expression to parse a null node.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_name(self):
+        """
+        :rtype: TypeRef
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_null_f_name)
+
+
+
+        return result
+
+    _field_names = GrammarExpr._field_names + (
+        "f_name",
+    )
+
+    _kind_name = 'GrammarNull'
+
+
+
+
+
+
+class GrammarOpt(GrammarExpr):
+    """
+    Grammar expression for an optional parsing result.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        :rtype: GrammarExpr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_opt_f_expr)
+
+
+
+        return result
+
+    _field_names = GrammarExpr._field_names + (
+        "f_expr",
+    )
+
+    _kind_name = 'GrammarOpt'
+
+
+
+
+
+
+class GrammarOptGroup(GrammarExpr):
+    """
+    Grammar expression for a group of optional parsing results.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        :rtype: GrammarExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_opt_group_f_expr)
+
+
+
+        return result
+
+    _field_names = GrammarExpr._field_names + (
+        "f_expr",
+    )
+
+    _kind_name = 'GrammarOptGroup'
+
+
+
+
+
+
+class GrammarOrExpr(GrammarExpr):
+    """
+    Grammar `Or` expression (disjunctive choice between several grammar
+    options).
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_sub_exprs(self):
+        """
+        :rtype: GrammarExprListList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_or_expr_f_sub_exprs)
+
+
+
+        return result
+
+    _field_names = GrammarExpr._field_names + (
+        "f_sub_exprs",
+    )
+
+    _kind_name = 'GrammarOrExpr'
+
+
+
+
+
+
+class GrammarPick(GrammarExpr):
+    """
+    Grammar expression to pick the significant parse out of a list of parses
+    (will automatically discard token results).
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_exprs(self):
+        """
+        :rtype: GrammarExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_pick_f_exprs)
+
+
+
+        return result
+
+    _field_names = GrammarExpr._field_names + (
+        "f_exprs",
+    )
+
+    _kind_name = 'GrammarPick'
+
+
+
+
+
+
+class GrammarImplicitPick(GrammarPick):
+    """
+    Implicit pick operation.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = GrammarPick._field_names + (
+    )
+
+    _kind_name = 'GrammarImplicitPick'
+
+
+
+
+
+
+class GrammarPredicate(GrammarExpr):
+    """
+    Grammar expression for a predicate: Only parse something if the predicate
+    (that is a reference to a node property) returns True.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        :rtype: GrammarExpr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_predicate_f_expr)
+
+
+
+        return result
+    
+    @property
+    def f_prop_ref(self):
+        """
+        This field can contain one of the following nodes:
+
+        * DotExpr
+
+        * RefId
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_predicate_f_prop_ref)
+
+
+
+        return result
+
+    _field_names = GrammarExpr._field_names + (
+        "f_expr",
+        "f_prop_ref",
+    )
+
+    _kind_name = 'GrammarPredicate'
+
+
+
+
+
+
+class GrammarRuleRef(GrammarExpr):
+    """
+    Grammar expression for a reference to another grammar rule.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_node_name(self):
+        """
+        :rtype: RefId
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_rule_ref_f_node_name)
+
+
+
+        return result
+
+    _field_names = GrammarExpr._field_names + (
+        "f_node_name",
+    )
+
+    _kind_name = 'GrammarRuleRef'
+
+
+
+
+
+
+class GrammarSkip(GrammarExpr):
+    """
+    Grammar expression (error recovery) to skip a parsing result.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_name(self):
+        """
+        :rtype: TypeRef
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_grammar_skip_f_name)
+
+
+
+        return result
+
+    _field_names = GrammarExpr._field_names + (
+        "f_name",
+    )
+
+    _kind_name = 'GrammarSkip'
+
+
+
+
+
+
+class ParseNodeExpr(GrammarExpr):
+    """
+    Expression for the parsing of a Node.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_node_name(self):
+        """
+        :rtype: TypeRef
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_parse_node_expr_f_node_name)
+
+
+
+        return result
+    
+    @property
+    def f_sub_exprs(self):
+        """
+        :rtype: GrammarExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_parse_node_expr_f_sub_exprs)
+
+
+
+        return result
+
+    _field_names = GrammarExpr._field_names + (
+        "f_node_name",
+        "f_sub_exprs",
+    )
+
+    _kind_name = 'ParseNodeExpr'
+
+
+
+
+
+
+class TokenLit(GrammarExpr):
+    """
+    Grammar expression for a token literal.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = GrammarExpr._field_names + (
+    )
+
+    _kind_name = 'TokenLit'
+
+
+
+
+
+
+class TokenNoCaseLit(GrammarExpr):
+    """
+    Grammar expression for a case insensitive token literal.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_lit(self):
+        """
+        :rtype: TokenLit
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_token_no_case_lit_f_lit)
+
+
+
+        return result
+
+    _field_names = GrammarExpr._field_names + (
+        "f_lit",
+    )
+
+    _kind_name = 'TokenNoCaseLit'
+
+
+
+
+
+
+class TokenPatternLit(GrammarExpr):
+    """
+    Grammar expression for a pattern literal.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = GrammarExpr._field_names + (
+    )
+
+    _kind_name = 'TokenPatternLit'
+
+
+
+
+
+
+class TokenRef(GrammarExpr):
+    """
+    Grammar expression for a token reference.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_token_name(self):
+        """
+        :rtype: RefId
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_token_ref_f_token_name)
+
+
+
+        return result
+    
+    @property
+    def f_expr(self):
+        """
+        :rtype: TokenLit
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_token_ref_f_expr)
+
+
+
+        return result
+
+    _field_names = GrammarExpr._field_names + (
+        "f_token_name",
+        "f_expr",
+    )
+
+    _kind_name = 'TokenRef'
+
+
+
+
+
+
+class Id(Expr):
+    """
+    Identifier.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Expr._field_names + (
+    )
+
+    _kind_name = 'Id'
+
+
+
+
+
+
+class DefId(Id):
+    """
+    Defining identifier.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Id._field_names + (
+    )
+
+    _kind_name = 'DefId'
+
+
+
+
+
+
+class RefId(Id):
+    """
+    Reference identifier.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Id._field_names + (
+    )
+
+    _kind_name = 'RefId'
+
+
+
+
+
+
+class ModuleRefId(RefId):
+    """
+    Id referencing a langkit module.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = RefId._field_names + (
+    )
+
+    _kind_name = 'ModuleRefId'
+
+
+
+
+
+
+class IfExpr(Expr):
+    """
+    If expression.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_cond_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_if_expr_f_cond_expr)
+
+
+
+        return result
+    
+    @property
+    def f_then_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_if_expr_f_then_expr)
+
+
+
+        return result
+    
+    @property
+    def f_alternatives(self):
+        """
+        :rtype: ElsifBranchList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_if_expr_f_alternatives)
+
+
+
+        return result
+    
+    @property
+    def f_else_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_if_expr_f_else_expr)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_cond_expr",
+        "f_then_expr",
+        "f_alternatives",
+        "f_else_expr",
+    )
+
+    _kind_name = 'IfExpr'
+
+
+
+
+
+
+class Isa(Expr):
+    """
+    Isa expression.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_isa_f_expr)
+
+
+
+        return result
+    
+    @property
+    def f_dest_type(self):
+        """
+        :rtype: TypeRefList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_isa_f_dest_type)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_expr",
+        "f_dest_type",
+    )
+
+    _kind_name = 'Isa'
+
+
+
+
+
+
+class LambdaExpr(Expr):
+    """
+    Lambda expression.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_params(self):
+        """
+        :rtype: LambdaArgDeclList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_lambda_expr_f_params)
+
+
+
+        return result
+    
+    @property
+    def f_return_type(self):
+        """
+        :rtype: TypeRef
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_lambda_expr_f_return_type)
+
+
+
+        return result
+    
+    @property
+    def f_body(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_lambda_expr_f_body)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_params",
+        "f_return_type",
+        "f_body",
+    )
+
+    _kind_name = 'LambdaExpr'
+
+
+
+
+
+
+class Lit(Expr):
+    """
+    Base class for literals.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Expr._field_names + (
+    )
+
+
+
+
+
+
+
+class CharLit(Lit):
+    """
+    Character literal expression.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Lit._field_names + (
+    )
+
+    _kind_name = 'CharLit'
+
+
+
+
+
+
+class NullLit(Lit):
+    """
+    Null literal expression.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Lit._field_names + (
+    )
+
+    _kind_name = 'NullLit'
+
+
+
+
+
+
+class NumLit(Lit):
+    """
+    Number literal expression.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Lit._field_names + (
+    )
+
+    _kind_name = 'NumLit'
+
+
+
+
+
+
+class StringLit(Lit):
+    """
+    String literal expression.
+
+    Note that in order to reduce the size of the node type hierarchy, we define
+    only one node (StringLit) for all our string literals (only regular strings
+    and pattern string literals at the moment). This will also make it easy to
+    add new string prefixes in the future.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def p_is_prefixed_string(self):
+        """
+        Return whether this string is prefixed or not.
+
+        :rtype: bool
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(ctypes.c_uint8(), _string_lit_p_is_prefixed_string)
+        result = bool(c_result.value)
+
+
+        return result
+    
+    @property
+    def p_prefix(self):
+        """
+        Return the prefix of this string, or the null character if there is no
+        prefix.
+
+        :rtype: str
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(ctypes.c_uint32(), _string_lit_p_prefix)
+        result = _py2to3.unicode_character(c_result.value)
+
+
+        return result
+    
+    @property
+    def p_denoted_value(self):
+        """
+        Return the content of the given string literal node.
+
+        :rtype: str
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_TextTypeConverter.c_type(), _string_lit_p_denoted_value)
+        result = _TextTypeConverter.wrap(c_result, False)
+
+
+        return result
+    
+    @property
+    def p_is_regexp_literal(self):
+        """
+        Return whether this string literal is actually a regexp literal, by
+        checking that this string is prefixed by 'p'.
+
+        :rtype: bool
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(ctypes.c_uint8(), _string_lit_p_is_regexp_literal)
+        result = bool(c_result.value)
+
+
+        return result
+
+    _field_names = Lit._field_names + (
+    )
+
+    _kind_name = 'StringLit'
+
+
+
+
+
+
+class LogicExpr(Expr):
+    """
+    Class for logic expressions (any ``basic_expr`` starting with %).
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * Lit
+
+        * MatchExpr
+
+        * ParenExpr
+
+        * RefId
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_logic_expr_f_expr)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_expr",
+    )
+
+    _kind_name = 'LogicExpr'
+
+
+
+
+
+
+class MatchExpr(Expr):
+    """
+    Binary operator expression.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_match_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_match_expr_f_match_expr)
+
+
+
+        return result
+    
+    @property
+    def f_branches(self):
+        """
+        :rtype: MatchBranchList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_match_expr_f_branches)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_match_expr",
+        "f_branches",
+    )
+
+    _kind_name = 'MatchExpr'
+
+
+
+
+
+
+class NotExpr(Expr):
+    """
+    Boolean negation expression.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_not_expr_f_expr)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_expr",
+    )
+
+    _kind_name = 'NotExpr'
+
+
+
+
+
+
+class ParenExpr(Expr):
+    """
+    Parenthesized expression.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_paren_expr_f_expr)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_expr",
+    )
+
+    _kind_name = 'ParenExpr'
+
+
+
+
+
+
+class RaiseExpr(Expr):
+    """
+    Raise expression.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_except_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_raise_expr_f_except_expr)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_except_expr",
+    )
+
+    _kind_name = 'RaiseExpr'
+
+
+
+
+
+
+class TryExpr(Expr):
+    """
+    Try expression.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_try_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_try_expr_f_try_expr)
+
+
+
+        return result
+    
+    @property
+    def f_or_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_try_expr_f_or_expr)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_try_expr",
+        "f_or_expr",
+    )
+
+    _kind_name = 'TryExpr'
+
+
+
+
+
+
+class FullDecl(LKNode):
+    """
+    Container for an lkt declaration. Contains the decl node plus the
+    documentation and annotations.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_doc(self):
+        """
+        :rtype: Doc
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_full_decl_f_doc)
+
+
+
+        return result
+    
+    @property
+    def f_decl_annotations(self):
+        """
+        :rtype: DeclAnnotationList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_full_decl_f_decl_annotations)
+
+
+
+        return result
+    
+    @property
+    def f_decl(self):
+        """
+        This field can contain one of the following nodes:
+
+        * BaseGrammarDecl
+
+        * FieldDecl
+
+        * FunDecl
+
+        * GenericDecl
+
+        * GenericFormalTypeDecl
+
+        * GrammarRuleDecl
+
+        * LexerDecl
+
+        * LexerFamilyDecl
+
+        * NamedTypeDecl
+
+        * ValDecl
+
+        :rtype: Decl
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_full_decl_f_decl)
+
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+        "f_doc",
+        "f_decl_annotations",
+        "f_decl",
+    )
+
+    _kind_name = 'FullDecl'
+
+
+
+
+
+
+class Import(LKNode):
+    """
+    Statement to import another source file.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_name(self):
+        """
+        :rtype: ModuleRefId
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_import_f_name)
+
+
+
+        return result
+    
+    @property
+    def p_referenced_unit(self):
+        """
+        Return the unit that this import statements designates. Load it if
+        needed.
+
+        :rtype: AnalysisUnit
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(AnalysisUnit._c_type(), _import_p_referenced_unit)
+        result = AnalysisUnit._wrap(c_result)
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+        "f_name",
+    )
+
+    _kind_name = 'Import'
+
+
+
+
+
+
+class LKNodeBaseList(LKNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNode._field_names + (
+    )
+
+
+
+
+
+
+
+class BaseLexerCaseRuleAltList(LKNodeBaseList):
+    """
+    List of BaseLexerCaseRuleAlt.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'BaseLexerCaseRuleAltList'
+
+    is_list_type = True
+
+
+
+
+
+class DeclAnnotationList(LKNodeBaseList):
+    """
+    List of DeclAnnotation.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'DeclAnnotationList'
+
+    is_list_type = True
+
+
+
+
+
+class DocCommentList(LKNodeBaseList):
+    """
+    List of DocComment.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'DocCommentList'
+
+    is_list_type = True
+
+
+
+
+
+class ElsifBranchList(LKNodeBaseList):
+    """
+    List of ElsifBranch.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'ElsifBranchList'
+
+    is_list_type = True
+
+
+
+
+
+class EnumClassAltDeclList(LKNodeBaseList):
+    """
+    List of EnumClassAltDecl.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'EnumClassAltDeclList'
+
+    is_list_type = True
+
+
+
+
+
+class EnumClassCaseList(LKNodeBaseList):
+    """
+    List of EnumClassCase.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'EnumClassCaseList'
+
+    is_list_type = True
+
+
+
+
+
+class EnumLitDeclList(LKNodeBaseList):
+    """
+    List of EnumLitDecl.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'EnumLitDeclList'
+
+    is_list_type = True
+
+
+
+
+
+class ExprList(LKNodeBaseList):
+    """
+    List of Expr.
+
+    This list node can contain one of the following nodes:
+
+    * ArrayLiteral
+
+    * BinOp
+
+    * BlockExpr
+
+    * CallExpr
+
+    * CastExpr
+
+    * DotExpr
+
+    * ErrorOnNull
+
+    * GenericInstantiation
+
+    * IfExpr
+
+    * Isa
+
+    * LambdaExpr
+
+    * Lit
+
+    * LogicExpr
+
+    * MatchExpr
+
+    * NotExpr
+
+    * ParenExpr
+
+    * RaiseExpr
+
+    * RefId
+
+    * TryExpr
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'ExprList'
+
+    is_list_type = True
+
+
+
+
+
+class FullDeclList(LKNodeBaseList):
+    """
+    List of FullDecl.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'FullDeclList'
+
+    is_list_type = True
+
+
+
+
+
+class DeclBlock(FullDeclList):
+    """
+    List of declarations that also introduces a containing lexical scope.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = FullDeclList._field_names + (
+    )
+
+    _kind_name = 'DeclBlock'
+
+    is_list_type = True
+
+
+
+
+
+class FunArgDeclList(LKNodeBaseList):
+    """
+    List of FunArgDecl.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'FunArgDeclList'
+
+    is_list_type = True
+
+
+
+
+
+class GrammarExprList(LKNodeBaseList):
+    """
+    List of GrammarExpr.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'GrammarExprList'
+
+    is_list_type = True
+
+
+
+
+
+class GrammarExprListList(LKNodeBaseList):
+    """
+    List of GrammarExpr.list.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'GrammarExprListList'
+
+    is_list_type = True
+
+
+
+
+
+class ImportList(LKNodeBaseList):
+    """
+    List of Import.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'ImportList'
+
+    is_list_type = True
+
+
+
+
+
+class LKNodeList(LKNodeBaseList):
+    """
+    List of LKNode.
+
+    This list node can contain one of the following nodes:
+
+    * FullDecl
+
+    * LexerCaseRule
+
+    * ValDecl
+
+    * VarBind
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'LKNodeList'
+
+    is_list_type = True
+
+
+
+
+
+class LambdaArgDeclList(LKNodeBaseList):
+    """
+    List of LambdaArgDecl.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'LambdaArgDeclList'
+
+    is_list_type = True
+
+
+
+
+
+class MatchBranchList(LKNodeBaseList):
+    """
+    List of MatchBranch.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'MatchBranchList'
+
+    is_list_type = True
+
+
+
+
+
+class ParamList(LKNodeBaseList):
+    """
+    List of Param.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'ParamList'
+
+    is_list_type = True
+
+
+
+
+
+class RefIdList(LKNodeBaseList):
+    """
+    List of RefId.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'RefIdList'
+
+    is_list_type = True
+
+
+
+
+
+class TypeRefList(LKNodeBaseList):
+    """
+    List of TypeRef.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'TypeRefList'
+
+    is_list_type = True
+
+
+
+
+
+class LangkitRoot(LKNode):
+    """
+    For the moment, root node of a lkt compilation unit.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_imports(self):
+        """
+        :rtype: ImportList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_langkit_root_f_imports)
+
+
+
+        return result
+    
+    @property
+    def f_decls(self):
+        """
+        :rtype: FullDeclList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_langkit_root_f_decls)
+
+
+
+        return result
+    
+    @property
+    def p_check_legality(self):
+        """
+        Run all legality checks on this tree. Return a list of diagnostics (For
+        the moment, pending on real discriminated records, SemanticResults
+        which necessarily have an error_message).
+
+        :rtype: List[SemanticResult]
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_SemanticResultArrayConverter.c_type(), _langkit_root_p_check_legality)
+        result = _SemanticResultArrayConverter.wrap(c_result, False)
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+        "f_imports",
+        "f_decls",
+    )
+
+    _kind_name = 'LangkitRoot'
+
+
+
+
+
+
+class LexerCaseRule(LKNode):
+    """
+    Lexer construct to introduce a conditional lexing action.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * GrammarCut
+
+        * GrammarDiscard
+
+        * GrammarList
+
+        * GrammarNull
+
+        * GrammarOpt
+
+        * GrammarOptGroup
+
+        * GrammarOrExpr
+
+        * GrammarPick
+
+        * GrammarRuleRef
+
+        * GrammarSkip
+
+        * ParseNodeExpr
+
+        * TokenLit
+
+        * TokenNoCaseLit
+
+        * TokenPatternLit
+
+        * TokenRef
+
+        :rtype: GrammarExpr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_lexer_case_rule_f_expr)
+
+
+
+        return result
+    
+    @property
+    def f_alts(self):
+        """
+        :rtype: BaseLexerCaseRuleAltList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_lexer_case_rule_f_alts)
+
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+        "f_expr",
+        "f_alts",
+    )
+
+    _kind_name = 'LexerCaseRule'
+
+
+
+
+
+
+class LexerCaseRuleSend(LKNode):
+    """
+    Lexer construction used by case alternatives to represent the token to send
+    if that alternative was chosen.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_sent(self):
+        """
+        :rtype: RefId
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_lexer_case_rule_send_f_sent)
+
+
+
+        return result
+    
+    @property
+    def f_match_size(self):
+        """
+        :rtype: NumLit
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_lexer_case_rule_send_f_match_size)
+
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+        "f_sent",
+        "f_match_size",
+    )
+
+    _kind_name = 'LexerCaseRuleSend'
+
+
+
+
+
+
+class ListKind(LKNode):
+    """
+    Kind for list parser expressions.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNode._field_names + (
+    )
+
+
+
+
+
+
+
+class ListKindOne(ListKind):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = ListKind._field_names + (
+    )
+
+    _kind_name = 'ListKindOne'
+
+
+
+
+
+
+class ListKindZero(ListKind):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = ListKind._field_names + (
+    )
+
+    _kind_name = 'ListKindZero'
+
+
+
+
+
+
+class MatchBranch(LKNode):
+    """
+    Branch inside a match expression.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_decl(self):
+        """
+        :rtype: MatchValDecl
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_match_branch_f_decl)
+
+
+
+        return result
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_match_branch_f_expr)
+
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+        "f_decl",
+        "f_expr",
+    )
+
+    _kind_name = 'MatchBranch'
+
+
+
+
+
+
+class Op(LKNode):
+    """
+    Operator in a binary operator expression.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = LKNode._field_names + (
+    )
+
+
+
+
+
+
+
+class OpAmp(Op):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Op._field_names + (
+    )
+
+    _kind_name = 'OpAmp'
+
+
+
+
+
+
+class OpAnd(Op):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Op._field_names + (
+    )
+
+    _kind_name = 'OpAnd'
+
+
+
+
+
+
+class OpDiv(Op):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Op._field_names + (
+    )
+
+    _kind_name = 'OpDiv'
+
+
+
+
+
+
+class OpEq(Op):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Op._field_names + (
+    )
+
+    _kind_name = 'OpEq'
+
+
+
+
+
+
+class OpGt(Op):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Op._field_names + (
+    )
+
+    _kind_name = 'OpGt'
+
+
+
+
+
+
+class OpGte(Op):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Op._field_names + (
+    )
+
+    _kind_name = 'OpGte'
+
+
+
+
+
+
+class OpLt(Op):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Op._field_names + (
+    )
+
+    _kind_name = 'OpLt'
+
+
+
+
+
+
+class OpLte(Op):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Op._field_names + (
+    )
+
+    _kind_name = 'OpLte'
+
+
+
+
+
+
+class OpMinus(Op):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Op._field_names + (
+    )
+
+    _kind_name = 'OpMinus'
+
+
+
+
+
+
+class OpMult(Op):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Op._field_names + (
+    )
+
+    _kind_name = 'OpMult'
+
+
+
+
+
+
+class OpOr(Op):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Op._field_names + (
+    )
+
+    _kind_name = 'OpOr'
+
+
+
+
+
+
+class OpPlus(Op):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Op._field_names + (
+    )
+
+    _kind_name = 'OpPlus'
+
+
+
+
+
+
+class Param(LKNode):
+    """
+    Parameter for function calls or for annotations.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_name(self):
+        """
+        :rtype: RefId
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_param_f_name)
+
+
+
+        return result
+    
+    @property
+    def f_value(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_param_f_value)
+
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+        "f_name",
+        "f_value",
+    )
+
+    _kind_name = 'Param'
+
+
+
+
+
+
+class TypeRef(LKNode):
+    """
+    Base class for a reference to a type.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def p_designated_type(self):
+        """
+        Return the type designated by this type ref.
+
+        :rtype: TypeDecl
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _type_ref_p_designated_type)
+        result = LKNode._wrap(c_result)
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+    )
+
+
+
+
+
+
+
+class FunctionTypeRef(TypeRef):
+    """
+    Reference to a function type.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_args_types(self):
+        """
+        :rtype: TypeRefList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_function_type_ref_f_args_types)
+
+
+
+        return result
+    
+    @property
+    def f_return_type(self):
+        """
+        :rtype: TypeRef
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_function_type_ref_f_return_type)
+
+
+
+        return result
+
+    _field_names = TypeRef._field_names + (
+        "f_args_types",
+        "f_return_type",
+    )
+
+    _kind_name = 'FunctionTypeRef'
+
+
+
+
+
+
+class GenericTypeRef(TypeRef):
+    """
+    Reference to a generic type.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_type_name(self):
+        """
+        This field can contain one of the following nodes:
+
+        * DotExpr
+
+        * RefId
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_generic_type_ref_f_type_name)
+
+
+
+        return result
+    
+    @property
+    def f_params(self):
+        """
+        :rtype: TypeRefList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_generic_type_ref_f_params)
+
+
+
+        return result
+
+    _field_names = TypeRef._field_names + (
+        "f_type_name",
+        "f_params",
+    )
+
+    _kind_name = 'GenericTypeRef'
+
+
+
+
+
+
+class SimpleTypeRef(TypeRef):
+    """
+    Simple reference to a type.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_type_name(self):
+        """
+        This field can contain one of the following nodes:
+
+        * DotExpr
+
+        * RefId
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_simple_type_ref_f_type_name)
+
+
+
+        return result
+
+    _field_names = TypeRef._field_names + (
+        "f_type_name",
+    )
+
+    _kind_name = 'SimpleTypeRef'
+
+
+
+
+
+
+class VarBind(LKNode):
+    """
+    Dynamic var bind expression.
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_name(self):
+        """
+        :rtype: RefId
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_var_bind_f_name)
+
+
+
+        return result
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_var_bind_f_expr)
+
+
+
+        return result
+
+    _field_names = LKNode._field_names + (
+        "f_name",
+        "f_expr",
+    )
+
+    _kind_name = 'VarBind'
+
+
+
+
+
+
+_EnvRebindings_c_type = _hashable_c_pointer()
+
+
+
+
+class _BaseStruct(object):
+    """
+    Mixin for Ada struct wrappers.
+    """
+
+    # Subclasses will override this to a subclass of ctypes.Structure
+    _c_type = None
+
+    def __getitem__(self, key):
+      if not isinstance(key, int):
+         raise TypeError('Tuples items are indexed by integers, not {}'.format(
+            type(key)
+         ))
+
+      fields = self._c_type._fields_
+      if 0 <= key < len(fields):
+         field_name, _ = fields[key]
+         return getattr(self, field_name)
+      else:
+         raise IndexError('There is no {}th field'.format(key))
+
+    def __repr__(self):
+        field_names = [name for name, _ in self._c_type._fields_]
+        return '<{} {}>'.format(
+            type(self).__name__,
+            ' '.join('{}={}'.format(name, getattr(self, name))
+                      for name in field_names)
+        )
+
+    @property
+    def as_tuple(self):
+        return tuple(getattr(self, f) for f, _ in self._c_type._fields_)
+
+    def __eq__(self, other):
+        return (isinstance(other, type(self)) and
+                self.as_tuple == other.as_tuple)
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self.as_tuple)
+
+
+
+
+class _Metadata_c_type(ctypes.Structure):
+    _fields_ =  [
+] 
+
+    @property
+    def as_tuple(self):
+        return tuple(getattr(self, f) for f, _ in self._fields_)
+
+    def __eq__(self, other):
+        return (isinstance(other, type(self)) and
+                self.as_tuple == other.as_tuple)
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self.as_tuple)
+class _EntityInfo_c_type(ctypes.Structure):
+    _fields_ =  [
+        ('md',
+            _Metadata_c_type
+         ),
+        ('rebindings',
+            _EnvRebindings_c_type
+         ),
+        ('from_rebound',
+            ctypes.c_uint8
+         ),
+] 
+class _Entity_c_type(ctypes.Structure):
+    _fields_ =  [
+        ('node',
+            LKNode._node_c_type
+         ),
+        ('info',
+            _EntityInfo_c_type
+         ),
+] 
+
+    @classmethod
+    def from_bare_node(cls, node_c_value):
+        return cls(node_c_value, _EntityInfo_c_type._null_value)
+
+
+
+
+class SemanticResult(_BaseStruct):
+    """
+    Result for a call to a semantic property that can return an error.
+
+    In every case, the node field will be populated with the node upon which
+    the request was made. Then, the result can be either:
+
+    * ``result_type`` if the property was a type returning property.
+
+    * ``result_ref`` if the property was a reference returning property
+
+    * ``error_message`` if an error was found as part of the resolution
+    process.
+
+    Only one of those fields can have a value.
+
+    If all fields are null, it means that ``expr_type`` has been called on a
+    non regular expression.
+
+    TODO: Turn this into a real variant record when we have variants.
+    """
+
+    
+
+    __slots__ = ('_node', '_result_type', '_result_ref', '_has_error', '_error_message', '_exempt_analysis')
+
+    def __init__(self, node, result_type, result_ref, has_error, error_message, exempt_analysis):
+        self._node = node
+        self._result_type = result_type
+        self._result_ref = result_ref
+        self._has_error = has_error
+        self._error_message = error_message
+        self._exempt_analysis = exempt_analysis
+
+
+    @property
+    def node(self):
+        """
+        """
+        return self._node
+
+    @property
+    def result_type(self):
+        """
+        """
+        return self._result_type
+
+    @property
+    def result_ref(self):
+        """
+        """
+        return self._result_ref
+
+    @property
+    def has_error(self):
+        """
+        """
+        return self._has_error
+
+    @property
+    def error_message(self):
+        """
+        """
+        return self._error_message
+
+    @property
+    def exempt_analysis(self):
+        """
+        Internal value. Used to skip analysis of some nodes
+        """
+        return self._exempt_analysis
+
+    class _c_type(ctypes.Structure):
+        _fields_ =  [
+        ('node',
+            LKNode._node_c_type
+         ),
+        ('result_type',
+            _Entity_c_type
+         ),
+        ('result_ref',
+            _Entity_c_type
+         ),
+        ('has_error',
+            ctypes.c_uint8
+         ),
+        ('error_message',
+             ctypes.c_void_p
+         ),
+        ('exempt_analysis',
+            ctypes.c_uint8
+         ),
+] 
+
+    class _Holder(object):
+        def __init__(self, c_value):
+            self.c_value = c_value
+
+        def clear(self):
+            self.c_value = None
+
+        def __del__(self):
+            SemanticResult._dec_ref(self.c_value)
+            self.clear()
+
+    @classmethod
+    def _wrap(cls, c_value):
+        return cls(
+            LKNode._wrap_bare_node(c_value.node),
+            LKNode._wrap(c_value.result_type),
+            LKNode._wrap(c_value.result_ref),
+            bool(c_value.has_error),
+            _TextTypeConverter.wrap(ctypes.cast(c_value.error_message, _TextTypeConverter.c_type), True),
+            bool(c_value.exempt_analysis),
+        )
+
+    @classmethod
+    def _unwrap(cls, value, context=None):
+        if not isinstance(value, cls):
+            _raise_type_error(cls.__name__, value)
+
+        
+        node = value.node._node_c_value
+        
+        result_type = LKNode._unwrap(value.result_type)
+        
+        result_ref = LKNode._unwrap(value.result_ref)
+        
+        has_error = bool(value.has_error)
+        
+        error_message = _TextTypeConverter.unwrap(value.error_message)
+        
+        exempt_analysis = bool(value.exempt_analysis)
+
+        result = cls._Holder(cls._c_type(
+            
+            node=node,
+            
+            result_type=result_type,
+            
+            result_ref=result_ref,
+            
+            has_error=has_error,
+            
+            error_message=ctypes.cast(error_message.c_value, ctypes.c_void_p),
+            
+            exempt_analysis=exempt_analysis,
+        ))
+
+        cls._inc_ref(result.c_value)
+
+        return result
+
+    _c_ptr_type = ctypes.POINTER(_c_type)
+    _inc_ref = staticmethod(_import_func('lkt_internal_semantic_result_inc_ref',
+                            [_c_ptr_type], None))
+    _dec_ref = staticmethod(_import_func('lkt_internal_semantic_result_dec_ref',
+                            [_c_ptr_type], None))
+
+
+
+
+
+
+class TreeSemanticResult(_BaseStruct):
+    """
+    Collection of semantic results for a subtree. This will carry both:
+
+    * An array of semantic results for all of the subtree's nodes.
+
+    * A flag indicating whether the subtree contained errors or not.
+    """
+
+    
+
+    __slots__ = ('_results', '_has_error')
+
+    def __init__(self, results, has_error):
+        self._results = results
+        self._has_error = has_error
+
+
+    @property
+    def results(self):
+        """
+        """
+        return self._results
+
+    @property
+    def has_error(self):
+        """
+        """
+        return self._has_error
+
+    class _c_type(ctypes.Structure):
+        _fields_ =  [
+        ('results',
+             ctypes.c_void_p
+         ),
+        ('has_error',
+            ctypes.c_uint8
+         ),
+] 
+
+    class _Holder(object):
+        def __init__(self, c_value):
+            self.c_value = c_value
+
+        def clear(self):
+            self.c_value = None
+
+        def __del__(self):
+            TreeSemanticResult._dec_ref(self.c_value)
+            self.clear()
+
+    @classmethod
+    def _wrap(cls, c_value):
+        return cls(
+            _SemanticResultArrayConverter.wrap(ctypes.cast(c_value.results, _SemanticResultArrayConverter.c_type), True),
+            bool(c_value.has_error),
+        )
+
+    @classmethod
+    def _unwrap(cls, value, context=None):
+        if not isinstance(value, cls):
+            _raise_type_error(cls.__name__, value)
+
+        
+        results = _SemanticResultArrayConverter.unwrap(value.results)
+        
+        has_error = bool(value.has_error)
+
+        result = cls._Holder(cls._c_type(
+            
+            results=ctypes.cast(results.c_value, ctypes.c_void_p),
+            
+            has_error=has_error,
+        ))
+
+        cls._inc_ref(result.c_value)
+
+        return result
+
+    _c_ptr_type = ctypes.POINTER(_c_type)
+    _inc_ref = staticmethod(_import_func('lkt_internal_tree_semantic_result_inc_ref',
+                            [_c_ptr_type], None))
+    _dec_ref = staticmethod(_import_func('lkt_internal_tree_semantic_result_dec_ref',
+                            [_c_ptr_type], None))
+
+
+
+
+_Metadata_c_type._null_value = _Metadata_c_type()
+_EntityInfo_c_type._null_value = _EntityInfo_c_type(_Metadata_c_type._null_value,
+                                                None)
+
+
+#
+# Low-level binding - Second part
+#
+
+# For performance, allocate a single C API entity for all uses of null
+# entities.
+_Entity_c_type._null_value = _Entity_c_type()
+_Entity_c_type._null_value.node = None
+
+
+
+_lazy_arrays = False
+
+
+def use_lazy_arrays(enabled=True):
+    """
+    Enable or disable lazy arrays.
+
+    By default, arrays that properties return are converted to lists, which
+    requires to convert all their items upfront. When lazy arrays are enabled,
+    they are converted to sequences instead: these keep a reference to the
+    native array and convert items only when they are accessed. They support
+    ``len``, indexing, slicing (which returns a list) and iteration. Arrays of
+    integers, booleans and enumerations can also be viewed as memoryview
+    objects without copying them (see ``as_memoryview``).
+
+    Like nodes, lazy arrays of nodes become stale when one of the units that
+    own their nodes is reparsed: accessing their items then raises a
+    ``StaleReferenceError``. Arrays of other values that contain nodes
+    (structures, for instance) are always converted upfront.
+
+    :param bool enabled: Whether to enable lazy arrays.
+    """
+    global _lazy_arrays
+    _lazy_arrays = bool(enabled)
+
+
+class _BaseArray(object):
+    """
+    Base class for Ada arrays bindings.
+    """
+
+    c_element_type = None
+    """
+    Ctype class for array elements.
+    """
+
+    items_refcounted = False
+    """
+    Whether items for this arrays are ref-counted.
+    """
+
+    primitive_items = False
+    """
+    Whether items for this arrays are integers, booleans or enumerations, i.e.
+    whether they can be exposed through the buffer protocol.
+    """
+
+    entity_items = False
+    """
+    Whether items for this arrays are entities.
+    """
+
+    eager_items = False
+    """
+    Whether items for this arrays must be wrapped eagerly, even when lazy
+    arrays are enabled. This is the case for items that reference nodes
+    (other than entities): wrapping them after the corresponding units are
+    reparsed would access deallocated nodes.
+    """
+
+    __slots__ = ('c_value', 'length', 'items', 'units')
+
+    def __init__(self, c_value):
+        self.c_value = c_value
+
+        self.length = c_value.contents.n
+
+        items_addr = _field_address(c_value.contents, 'items')
+        items = self.c_element_type.from_address(items_addr)
+        self.items = ctypes.pointer(items)
+
+        self.units = None
+        """
+        For lazy arrays of entities, list of units that own the nodes in this
+        array, and their version at the time this array was created.
+
+        :type: None|list[(AnalysisUnit, int)]
+        """
+
+    def __repr__(self):
+        return '<{} {}>'.format(type(self).__name__, list(self))
+
+    def clear(self):
+        self.c_value = None
+        self.length = None
+        self.items = None
+        self.units = None
+
+    def __del__(self):
+        self.dec_ref(self.c_value)
+        self.clear()
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._get_item(i)
+                    for i in range(*key.indices(self.length))]
+
+        if not isinstance(key, int):
+            _raise_type_error('int', key)
+        index = key + self.length if key < 0 else key
+        if not 0 <= index < self.length:
+            raise IndexError('array index out of range')
+        return self._get_item(index)
+
+    def __iter__(self):
+        for i in range(self.length):
+            yield self._get_item(i)
+
+    def __buffer__(self, flags):
+        return self.as_memoryview()
+
+    def _record_units(self):
+        """
+        Record the units that own the nodes in this array, so that accessing
+        items after one of these units is reparsed raises a
+        StaleReferenceError instead of wrapping deallocated nodes. The unit
+        wrappers also keep the owning context alive.
+        """
+        units = {}
+        for i in range(self.length):
+            item = self.items[i]
+            if item.node:
+                c_unit = _node_unit(ctypes.byref(item))
+                if c_unit not in units:
+                    unit = AnalysisUnit._wrap(c_unit)
+                    units[c_unit] = (unit, unit._unit_version)
+        self.units = list(units.values())
+
+    def _check_stale_reference(self):
+        if self.units:
+            for unit, version in self.units:
+                if unit._unit_version != version:
+                    raise StaleReferenceError()
+
+    def _get_item(self, index):
+        self._check_stale_reference()
+
+        # In ctypes, accessing an array element does not copy it, which means
+        # the the array must live at least as long as the accessed element. We
+        # cannot guarantee that, so we must copy the element so that it is
+        # independent of the array it comes from.
+        #
+        # The try/except block tries to do a copy if "item" is indeed a buffer
+        # to be copied, and will fail if it's a mere integer, which does not
+        # need the buffer copy anyway, hence the "pass".
+        item = self.items[index]
+        try:
+            item = self.c_element_type.from_buffer_copy(item)
+        except TypeError:
+            pass
+        return self.wrap_item(item)
+
+    def as_memoryview(self):
+        """
+        Return a read-only memoryview for the items of this array, without
+        copying them.
+
+        Raise a TypeError if items are not integers, booleans or enumerations.
+        Enumeration values appear as their integer representation.
+
+        :rtype: memoryview
+        """
+        if not self.primitive_items:
+            raise TypeError('{} items cannot be exposed as a buffer'.format(
+                type(self).__name__
+            ))
+
+        items = (self.c_element_type * self.length).from_address(
+            _field_address(self.c_value.contents, 'items')
+        )
+
+        # The memoryview keeps a reference to "items", which must in turn keep
+        # this array alive, as it owns the memory it references.
+        items._array = self
+
+        return (memoryview(items).cast('B')
+                .cast(self.c_element_type._type_)
+                .toreadonly())
+
+    @classmethod
+    def wrap(cls, c_value, from_field_access):
+        helper = cls(c_value)
+
+        # In lazy mode, the array wrapper is the result: it converts items
+        # only on demand. It needs to own a reference to the array, so create
+        # one if this array value comes from a structure field (the structure
+        # owns the current reference).
+        if _lazy_arrays and not cls.eager_items:
+            if from_field_access:
+                cls.inc_ref(c_value)
+            if cls.entity_items:
+                helper._record_units()
+            return helper
+
+        result = list(helper)
+
+        # If this array value comes from a structure field, we must not call
+        # its dec_ref primitive, as it is up to the structure's dec_ref
+        # primitive to take care of it.
+        if from_field_access:
+            helper.clear()
+
+        return result
+
+    @classmethod
+    def unwrap(cls, value, context=None):
+        # Accept lazy arrays wherever lists are accepted
+        if isinstance(value, _BaseArray):
+            value = list(value)
+
+        if not isinstance(value, list):
+            _raise_type_error('list', value)
+
+        # Create a holder for the result
+        result = cls(cls.create(len(value)))
+
+        # Unwrap all items at once, preserving their holder so that resources
+        # are deallocated if there is an error at some point.
+        items = [result.unwrap_item(item, context) for item in value]
+
+        # Initialize the resulting array
+        for i, (_, item) in enumerate(items):
+            result.items[i] = item
+
+        # At this point, we know that this is successful. We don't want
+        # holders to dec-ref the content so that the return array takes over
+        # the corresponding refcounting shares.
+        if cls.items_refcounted:
+            for holder, _ in items:
+                holder.clear()
+
+        return result
+
+
+
+
+
+
+class _BareLKNodeArrayConverter(_BaseArray):
+    """
+    Wrapper class for arrays of BareLKNode.
+
+    This class is not meant to be directly instantiated: it is only used to
+    convert values that various methods take/return.
+    """
+
+    __slots__ = _BaseArray.__slots__
+    items_refcounted = False
+    primitive_items = False
+    entity_items = False
+    eager_items = True
+
+    @staticmethod
+    def wrap_item(item):
+        return LKNode._wrap_bare_node(item)
+
+    @staticmethod
+    def unwrap_item(item, context=None):
+        c_holder = item._node_c_value
+        c_value = c_holder
+        return (c_holder, c_value)
+
+
+    c_element_type = LKNode._node_c_type
+
+    class c_struct(ctypes.Structure):
+        _fields_ = [('n', ctypes.c_int),
+                    ('ref_count', ctypes.c_int),
+                    ('items', LKNode._node_c_type * 1)]
+
+    c_type = ctypes.POINTER(c_struct)
+
+    create = staticmethod(_import_func(
+        'lkt_bare_lk_node_array_create', [ctypes.c_int], c_type))
+    inc_ref = staticmethod(_import_func(
+        'lkt_bare_lk_node_array_inc_ref', [c_type], None))
+    dec_ref = staticmethod(_import_func(
+        'lkt_bare_lk_node_array_dec_ref', [c_type], None))
+
+
+
+
+
+
+class _LKNodeArrayConverter(_BaseArray):
+    """
+    Wrapper class for arrays of InternalEntity.
+
+    This class is not meant to be directly instantiated: it is only used to
+    convert values that various methods take/return.
+    """
+
+    __slots__ = _BaseArray.__slots__
+    items_refcounted = False
+    primitive_items = False
+    entity_items = True
+    eager_items = False
+
+    @staticmethod
+    def wrap_item(item):
+        return LKNode._wrap(item)
+
+    @staticmethod
+    def unwrap_item(item, context=None):
+        c_holder = LKNode._unwrap(item)
+        c_value = c_holder
+        return (c_holder, c_value)
+
+
+    c_element_type = _Entity_c_type
+
+    class c_struct(ctypes.Structure):
+        _fields_ = [('n', ctypes.c_int),
+                    ('ref_count', ctypes.c_int),
+                    ('items', _Entity_c_type * 1)]
+
+    c_type = ctypes.POINTER(c_struct)
+
+    create = staticmethod(_import_func(
+        'lkt_lk_node_array_create', [ctypes.c_int], c_type))
+    inc_ref = staticmethod(_import_func(
+        'lkt_lk_node_array_inc_ref', [c_type], None))
+    dec_ref = staticmethod(_import_func(
+        'lkt_lk_node_array_dec_ref', [c_type], None))
+
+
+
+
+
+
+class _TextTypeConverter(_BaseArray):
+    """
+    Wrapper class for arrays of CharacterType.
+
+    This class is not meant to be directly instantiated: it is only used to
+    convert values that various methods take/return.
+    """
+
+    __slots__ = _BaseArray.__slots__
+    items_refcounted = False
+    primitive_items = False
+    entity_items = False
+    eager_items = False
+
+    @staticmethod
+    def wrap_item(item):
+        return _py2to3.unicode_character(item)
+
+    @staticmethod
+    def unwrap_item(item, context=None):
+        c_holder = ord(item)
+        c_value = c_holder
+        return (c_holder, c_value)
+
+    @classmethod
+    def wrap(cls, c_value, from_field_access):
+        # Reinterpret this array of uint32_t values as the equivalent array of
+        # characters, then decode it using the appropriate UTF-32 encoding.
+        chars = ctypes.cast(ctypes.pointer(c_value.contents.items),
+                            ctypes.POINTER(ctypes.c_char))
+        return chars[:4 * c_value.contents.n].decode(_text.encoding)
+
+    @classmethod
+    def unwrap(cls, value, context=None):
+        # If `value` is not a list, assume it's a string, and convert it to the
+        # expected list.
+        if not isinstance(value, list):
+            value = list(_text.cast(value))
+
+        return super(_TextTypeConverter, cls).unwrap(value, context)
+
+    c_element_type = ctypes.c_uint32
+
+    class c_struct(ctypes.Structure):
+        _fields_ = [('n', ctypes.c_int),
+                    ('ref_count', ctypes.c_int),
+                    ('items', ctypes.c_uint32 * 1)]
+
+    c_type = ctypes.POINTER(c_struct)
+
+    create = staticmethod(_import_func(
+        'lkt_text_type_create', [ctypes.c_int], c_type))
+    inc_ref = staticmethod(_import_func(
+        'lkt_text_type_inc_ref', [c_type], None))
+    dec_ref = staticmethod(_import_func(
+        'lkt_text_type_dec_ref', [c_type], None))
+
+
+
+
+
+
+class _LKNodeArrayConverter(_BaseArray):
+    """
+    Wrapper class for arrays of InternalEntity.
+
+    This class is not meant to be directly instantiated: it is only used to
+    convert values that various methods take/return.
+    """
+
+    __slots__ = _BaseArray.__slots__
+    items_refcounted = False
+    primitive_items = False
+    entity_items = True
+    eager_items = False
+
+    @staticmethod
+    def wrap_item(item):
+        return LKNode._wrap(item)
+
+    @staticmethod
+    def unwrap_item(item, context=None):
+        c_holder = LKNode._unwrap(item)
+        c_value = c_holder
+        return (c_holder, c_value)
+
+
+    c_element_type = _Entity_c_type
+
+    class c_struct(ctypes.Structure):
+        _fields_ = [('n', ctypes.c_int),
+                    ('ref_count', ctypes.c_int),
+                    ('items', _Entity_c_type * 1)]
+
+    c_type = ctypes.POINTER(c_struct)
+
+    create = staticmethod(_import_func(
+        'lkt_lk_node_array_create', [ctypes.c_int], c_type))
+    inc_ref = staticmethod(_import_func(
+        'lkt_lk_node_array_inc_ref', [c_type], None))
+    dec_ref = staticmethod(_import_func(
+        'lkt_lk_node_array_dec_ref', [c_type], None))
+
+
+
+
+
+
+class _SemanticResultArrayConverter(_BaseArray):
+    """
+    Wrapper class for arrays of InternalSemanticResult.
+
+    This class is not meant to be directly instantiated: it is only used to
+    convert values that various methods take/return.
+    """
+
+    __slots__ = _BaseArray.__slots__
+    items_refcounted = True
+    primitive_items = False
+    entity_items = False
+    eager_items = True
+
+    @staticmethod
+    def wrap_item(item):
+        return SemanticResult._wrap(item)
+
+    @staticmethod
+    def unwrap_item(item, context=None):
+        c_holder = SemanticResult._unwrap(item)
+        c_value = c_holder.c_value
+        return (c_holder, c_value)
+
+
+    c_element_type = SemanticResult._c_type
+
+    class c_struct(ctypes.Structure):
+        _fields_ = [('n', ctypes.c_int),
+                    ('ref_count', ctypes.c_int),
+                    ('items', SemanticResult._c_type * 1)]
+
+    c_type = ctypes.POINTER(c_struct)
+
+    create = staticmethod(_import_func(
+        'lkt_semantic_result_array_create', [ctypes.c_int], c_type))
+    inc_ref = staticmethod(_import_func(
+        'lkt_semantic_result_array_inc_ref', [c_type], None))
+    dec_ref = staticmethod(_import_func(
+        'lkt_semantic_result_array_dec_ref', [c_type], None))
+
+
+
+
+_free = _import_func(
+    'lkt_free',
+    [ctypes.c_void_p], None
+)
+
+_text_to_bytes = _import_func(
+    'lkt_text_to_bytes',
+    [ctypes.POINTER(_text),
+     ctypes.POINTER(ctypes.c_void_p),
+     ctypes.POINTER(ctypes.c_size_t)],
+    ctypes.c_int
+)
+
+_destroy_text = _import_func(
+    'lkt_destroy_text', [ctypes.POINTER(_text)], None
+)
+
+_symbol_text = _import_func(
+    'lkt_symbol_text',
+    [ctypes.POINTER(_symbol_type), ctypes.POINTER(_text)], None
+)
+
+# Analysis primitives
+_create_analysis_context = _import_func(
+    'lkt_create_analysis_context',
+    [ctypes.c_char_p, # charset
+     _unit_provider,  # unit_provider
+     ctypes.c_int,    # with_trivia
+     ctypes.c_int],   # tab_stop
+    AnalysisContext._c_type
+)
+_context_incref = _import_func(
+    'lkt_context_incref',
+    [AnalysisContext._c_type], AnalysisContext._c_type
+)
+_context_decref = _import_func(
+    'lkt_context_decref',
+    [AnalysisContext._c_type], None
+)
+_context_symbol = _import_func(
+    'lkt_context_symbol',
+    [AnalysisContext._c_type,
+     ctypes.POINTER(_text),
+     ctypes.POINTER(_symbol_type)], ctypes.c_int
+)
+_discard_errors_in_populate_lexical_env = _import_func(
+   'lkt_context_discard_errors_in_populate_lexical_env',
+   [AnalysisContext._c_type, ctypes.c_int], None
+)
+_use_memory_mapped_files = _import_func(
+   'lkt_context_use_memory_mapped_files',
+   [AnalysisContext._c_type, ctypes.c_int], None
+)
+_get_analysis_unit_from_file = _import_func(
+    'lkt_get_analysis_unit_from_file',
+    [AnalysisContext._c_type,  # context
+     ctypes.c_char_p,          # filename
+     ctypes.c_char_p,          # charset
+     ctypes.c_int,             # reparse
+     ctypes.c_int],            # grammar rule
+    AnalysisUnit._c_type
+)
+_get_analysis_units_from_files = _import_func(
+    'lkt_get_analysis_units_from_files',
+    [AnalysisContext._c_type,         # context
+     ctypes.POINTER(ctypes.c_char_p),  # filenames
+     ctypes.c_int,                    # count
+     ctypes.c_char_p,                 # charset
+     ctypes.c_int,                    # reparse
+     ctypes.c_int,                    # grammar rule
+     ctypes.c_int,                    # jobs
+     ctypes.POINTER(AnalysisUnit._c_type)],  # units
+    None
+)
+_get_analysis_unit_from_buffer = _import_func(
+    'lkt_get_analysis_unit_from_buffer',
+    [AnalysisContext._c_type,  # context
+     ctypes.c_char_p,          # filename
+     ctypes.c_char_p,          # charset
+     ctypes.c_char_p,          # buffer
+     ctypes.c_size_t,          # buffer_size
+     ctypes.c_int],            # grammar rule
+    AnalysisUnit._c_type
+)
+_get_analysis_unit_from_provider = _import_func(
+    'lkt_get_analysis_unit_from_provider',
+    [AnalysisContext._c_type,  # context
+     ctypes.POINTER(_text),    # name
+     ctypes.c_int,             # kind
+     ctypes.c_char_p,          # charset
+     ctypes.c_int],            # reparse
+    AnalysisUnit._c_type
+)
+_unit_root = _import_func(
+    'lkt_unit_root',
+    [AnalysisUnit._c_type, ctypes.POINTER(_Entity_c_type)], None
+)
+_unit_first_token = _import_func(
+    "lkt_unit_first_token",
+    [AnalysisUnit._c_type, ctypes.POINTER(Token)], None
+)
+_unit_last_token = _import_func(
+    "lkt_unit_last_token",
+    [AnalysisUnit._c_type, ctypes.POINTER(Token)], None
+)
+_unit_token_count = _import_func(
+    "lkt_unit_token_count",
+    [AnalysisUnit._c_type], ctypes.c_int
+)
+_unit_trivia_count = _import_func(
+    "lkt_unit_trivia_count",
+    [AnalysisUnit._c_type], ctypes.c_int
+)
+_unit_export_tokens = _import_func(
+    "lkt_unit_export_tokens",
+    [AnalysisUnit._c_type, ctypes.POINTER(_token_table)], ctypes.c_int
+)
+_destroy_token_table = _import_func(
+    "lkt_destroy_token_table",
+    [ctypes.POINTER(_token_table)], None
+)
+_unit_lookup_token = _import_func(
+    "lkt_unit_lookup_token",
+    [AnalysisUnit._c_type,
+     ctypes.POINTER(Sloc._c_type),
+     ctypes.POINTER(Token)],
+    None
+)
+_unit_dump_lexical_env = _import_func(
+    "lkt_unit_dump_lexical_env",
+    [AnalysisUnit._c_type], None
+)
+_unit_filename = _import_func(
+    "lkt_unit_filename",
+    [AnalysisUnit._c_type], ctypes.POINTER(ctypes.c_char)
+)
+_unit_diagnostic_count = _import_func(
+    'lkt_unit_diagnostic_count',
+    [AnalysisUnit._c_type], ctypes.c_uint
+)
+_unit_diagnostic = _import_func(
+    'lkt_unit_diagnostic',
+    [AnalysisUnit._c_type, ctypes.c_uint, ctypes.POINTER(Diagnostic._c_type)],
+    ctypes.c_int
+)
+_unit_context = _import_func(
+    'lkt_unit_context',
+    [AnalysisUnit._c_type], AnalysisContext._c_type
+)
+_unit_reparse_from_file = _import_func(
+    'lkt_unit_reparse_from_file',
+    [AnalysisUnit._c_type,    # unit
+     ctypes.c_char_p],        # charset
+    ctypes.c_int
+)
+_unit_reparse_from_buffer = _import_func(
+    'lkt_unit_reparse_from_buffer',
+    [AnalysisUnit._c_type, # unit
+     ctypes.c_char_p,      # charset
+     ctypes.c_char_p,      # buffer
+     ctypes.c_size_t],     # buffer_size
+    None
+)
+_unit_reparse_edit = _import_func(
+    'lkt_unit_reparse_edit',
+    [AnalysisUnit._c_type,
+     ctypes.POINTER(SlocRange._c_type),
+     ctypes.POINTER(_text)],
+    None
+)
+_unit_populate_lexical_env = _import_func(
+    'lkt_unit_populate_lexical_env',
+    [AnalysisUnit._c_type], ctypes.c_int
+)
+
+# General AST node primitives
+_node_kind = _import_func(
+    'lkt_node_kind',
+    [ctypes.POINTER(_Entity_c_type)], ctypes.c_int
+)
+_node_unit = _import_func(
+    'lkt_node_unit',
+    [ctypes.POINTER(_Entity_c_type)], AnalysisUnit._c_type
+)
+_node_is_token_node = _import_func(
+    'lkt_node_is_token_node',
+    [ctypes.POINTER(_Entity_c_type)], ctypes.c_int
+)
+_node_is_synthetic = _import_func(
+    'lkt_node_is_synthetic',
+    [ctypes.POINTER(_Entity_c_type)], ctypes.c_int
+)
+_node_image = _import_func(
+    'lkt_node_image',
+    [ctypes.POINTER(_Entity_c_type), ctypes.POINTER(_text)], None
+)
+_node_text = _import_func(
+    'lkt_node_text',
+    [ctypes.POINTER(_Entity_c_type), ctypes.POINTER(_text)], None
+)
+_node_sloc_range = _import_func(
+    'lkt_node_sloc_range',
+    [ctypes.POINTER(_Entity_c_type), ctypes.POINTER(SlocRange._c_type)], None
+)
+_lookup_in_node = _import_func(
+    'lkt_lookup_in_node',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(Sloc._c_type),
+     ctypes.POINTER(_Entity_c_type)], None
+)
+_node_children_count = _import_func(
+    'lkt_node_children_count',
+    [ctypes.POINTER(_Entity_c_type)], ctypes.c_uint
+)
+_node_child = _import_func(
+    'lkt_node_child',
+    [ctypes.POINTER(_Entity_c_type), ctypes.c_uint, ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_node_export_tree = _import_func(
+    'lkt_node_export_tree',
+    [ctypes.POINTER(_Entity_c_type), ctypes.POINTER(_node_tree)], ctypes.c_int
+)
+_destroy_node_tree = _import_func(
+    'lkt_destroy_node_tree',
+    [ctypes.POINTER(_node_tree)], None
+)
+
+_lk_node_p_node_type = _import_func(
+    'lkt_lk_node_p_node_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lk_node_p_char_type = _import_func(
+    'lkt_lk_node_p_char_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lk_node_p_int_type = _import_func(
+    'lkt_lk_node_p_int_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lk_node_p_bool_type = _import_func(
+    'lkt_lk_node_p_bool_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lk_node_p_bigint_type = _import_func(
+    'lkt_lk_node_p_bigint_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lk_node_p_string_type = _import_func(
+    'lkt_lk_node_p_string_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lk_node_p_symbol_type = _import_func(
+    'lkt_lk_node_p_symbol_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lk_node_p_regexp_type = _import_func(
+    'lkt_lk_node_p_regexp_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lk_node_p_array_gen_type = _import_func(
+    'lkt_lk_node_p_array_gen_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lk_node_p_astlist_gen_type = _import_func(
+    'lkt_lk_node_p_astlist_gen_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lk_node_p_iterator_gen_trait = _import_func(
+    'lkt_lk_node_p_iterator_gen_trait',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lk_node_p_check_semantic = _import_func(
+    'lkt_lk_node_p_check_semantic',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(TreeSemanticResult._c_type)],
+    ctypes.c_int
+)
+_lk_node_parent = _import_func(
+    'lkt_lk_node_parent',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lk_node_parents = _import_func(
+    'lkt_lk_node_parents',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_LKNodeArrayConverter.c_type)],
+    ctypes.c_int
+)
+_lk_node_children = _import_func(
+    'lkt_lk_node_children',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_LKNodeArrayConverter.c_type)],
+    ctypes.c_int
+)
+_lk_node_token_start = _import_func(
+    'lkt_lk_node_token_start',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(Token)],
+    ctypes.c_int
+)
+_lk_node_token_end = _import_func(
+    'lkt_lk_node_token_end',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(Token)],
+    ctypes.c_int
+)
+_lk_node_child_index = _import_func(
+    'lkt_lk_node_child_index',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(ctypes.c_int)],
+    ctypes.c_int
+)
+_lk_node_previous_sibling = _import_func(
+    'lkt_lk_node_previous_sibling',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lk_node_next_sibling = _import_func(
+    'lkt_lk_node_next_sibling',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lk_node_unit = _import_func(
+    'lkt_lk_node_unit',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(AnalysisUnit._c_type)],
+    ctypes.c_int
+)
+_lk_node_is_ghost = _import_func(
+    'lkt_lk_node_is_ghost',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(ctypes.c_uint8)],
+    ctypes.c_int
+)
+_lk_node_full_sloc_image = _import_func(
+    'lkt_lk_node_full_sloc_image',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_TextTypeConverter.c_type)],
+    ctypes.c_int
+)
+_base_lexer_case_rule_alt_f_send = _import_func(
+    'lkt_base_lexer_case_rule_alt_f_send',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lexer_case_rule_cond_alt_f_cond_exprs = _import_func(
+    'lkt_lexer_case_rule_cond_alt_f_cond_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_decl_f_syn_name = _import_func(
+    'lkt_decl_f_syn_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_decl_p_name = _import_func(
+    'lkt_decl_p_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_symbol_type)],
+    ctypes.c_int
+)
+_grammar_decl_f_rules = _import_func(
+    'lkt_grammar_decl_f_rules',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_decl_p_lexer = _import_func(
+    'lkt_grammar_decl_p_lexer',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_base_grammar_rule_decl_f_expr = _import_func(
+    'lkt_base_grammar_rule_decl_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_base_val_decl_p_get_type = _import_func(
+    'lkt_base_val_decl_p_get_type',
+    [ctypes.POINTER(_Entity_c_type),
+        
+        ctypes.c_uint8,
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_explicitly_typed_decl_f_decl_type = _import_func(
+    'lkt_explicitly_typed_decl_f_decl_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_component_decl_f_default_val = _import_func(
+    'lkt_component_decl_f_default_val',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_val_decl_f_val = _import_func(
+    'lkt_val_decl_f_val',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_fun_decl_f_args = _import_func(
+    'lkt_fun_decl_f_args',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_fun_decl_f_return_type = _import_func(
+    'lkt_fun_decl_f_return_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_fun_decl_f_body = _import_func(
+    'lkt_fun_decl_f_body',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_generic_decl_f_generic_formal_decls = _import_func(
+    'lkt_generic_decl_f_generic_formal_decls',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_generic_decl_f_decl = _import_func(
+    'lkt_generic_decl_f_decl',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lexer_decl_f_rules = _import_func(
+    'lkt_lexer_decl_f_rules',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lexer_family_decl_f_rules = _import_func(
+    'lkt_lexer_family_decl_f_rules',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_type_decl_f_traits = _import_func(
+    'lkt_type_decl_f_traits',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_type_decl_p_implemented_traits = _import_func(
+    'lkt_type_decl_p_implemented_traits',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_LKNodeArrayConverter.c_type)],
+    ctypes.c_int
+)
+_type_decl_f_base_type = _import_func(
+    'lkt_type_decl_f_base_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_type_decl_p_base_types = _import_func(
+    'lkt_type_decl_p_base_types',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_LKNodeArrayConverter.c_type)],
+    ctypes.c_int
+)
+_type_decl_p_root_type = _import_func(
+    'lkt_type_decl_p_root_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_type_decl_p_is_subtype = _import_func(
+    'lkt_type_decl_p_is_subtype',
+    [ctypes.POINTER(_Entity_c_type),
+        
+        ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(ctypes.c_uint8)],
+    ctypes.c_int
+)
+_type_decl_p_is_generic = _import_func(
+    'lkt_type_decl_p_is_generic',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(ctypes.c_uint8)],
+    ctypes.c_int
+)
+_instantiated_generic_type_p_get_inner_type = _import_func(
+    'lkt_instantiated_generic_type_p_get_inner_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_instantiated_generic_type_p_get_actuals = _import_func(
+    'lkt_instantiated_generic_type_p_get_actuals',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_LKNodeArrayConverter.c_type)],
+    ctypes.c_int
+)
+_instantiated_generic_type_p_get_instantiated_type = _import_func(
+    'lkt_instantiated_generic_type_p_get_instantiated_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_named_type_decl_f_decls = _import_func(
+    'lkt_named_type_decl_f_decls',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_enum_class_decl_f_branches = _import_func(
+    'lkt_enum_class_decl_f_branches',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_enum_type_decl_f_literals = _import_func(
+    'lkt_enum_type_decl_f_literals',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_decl_annotation_f_name = _import_func(
+    'lkt_decl_annotation_f_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_decl_annotation_f_params = _import_func(
+    'lkt_decl_annotation_f_params',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_decl_annotation_params_f_params = _import_func(
+    'lkt_decl_annotation_params_f_params',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_doc_f_lines = _import_func(
+    'lkt_doc_f_lines',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_elsif_branch_f_cond_expr = _import_func(
+    'lkt_elsif_branch_f_cond_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_elsif_branch_f_then_expr = _import_func(
+    'lkt_elsif_branch_f_then_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_enum_class_case_f_decls = _import_func(
+    'lkt_enum_class_case_f_decls',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_excludes_null_p_as_bool = _import_func(
+    'lkt_excludes_null_p_as_bool',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(ctypes.c_uint8)],
+    ctypes.c_int
+)
+_expr_p_in_type_ref = _import_func(
+    'lkt_expr_p_in_type_ref',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(ctypes.c_uint8)],
+    ctypes.c_int
+)
+_expr_p_is_regular_expr = _import_func(
+    'lkt_expr_p_is_regular_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(ctypes.c_uint8)],
+    ctypes.c_int
+)
+_expr_p_expr_type = _import_func(
+    'lkt_expr_p_expr_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(SemanticResult._c_type)],
+    ctypes.c_int
+)
+_expr_p_check_expr_type = _import_func(
+    'lkt_expr_p_check_expr_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_expr_p_expr_context_free_type = _import_func(
+    'lkt_expr_p_expr_context_free_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_expr_p_referenced_decl = _import_func(
+    'lkt_expr_p_referenced_decl',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(SemanticResult._c_type)],
+    ctypes.c_int
+)
+_expr_p_check_referenced_decl = _import_func(
+    'lkt_expr_p_check_referenced_decl',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_array_literal_f_exprs = _import_func(
+    'lkt_array_literal_f_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_bin_op_f_left = _import_func(
+    'lkt_bin_op_f_left',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_bin_op_f_op = _import_func(
+    'lkt_bin_op_f_op',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_bin_op_f_right = _import_func(
+    'lkt_bin_op_f_right',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_block_expr_f_val_defs = _import_func(
+    'lkt_block_expr_f_val_defs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_block_expr_f_expr = _import_func(
+    'lkt_block_expr_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_call_expr_f_name = _import_func(
+    'lkt_call_expr_f_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_call_expr_f_args = _import_func(
+    'lkt_call_expr_f_args',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_call_expr_p_called_object_type = _import_func(
+    'lkt_call_expr_p_called_object_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_call_expr_p_called_decl = _import_func(
+    'lkt_call_expr_p_called_decl',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_cast_expr_f_expr = _import_func(
+    'lkt_cast_expr_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_cast_expr_f_excludes_null = _import_func(
+    'lkt_cast_expr_f_excludes_null',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_cast_expr_f_dest_type = _import_func(
+    'lkt_cast_expr_f_dest_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_dot_expr_f_prefix = _import_func(
+    'lkt_dot_expr_f_prefix',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_dot_expr_f_suffix = _import_func(
+    'lkt_dot_expr_f_suffix',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_error_on_null_f_expr = _import_func(
+    'lkt_error_on_null_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_generic_instantiation_f_name = _import_func(
+    'lkt_generic_instantiation_f_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_generic_instantiation_f_args = _import_func(
+    'lkt_generic_instantiation_f_args',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_generic_instantiation_p_instantiated_decl = _import_func(
+    'lkt_generic_instantiation_p_instantiated_decl',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_discard_f_expr = _import_func(
+    'lkt_grammar_discard_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_dont_skip_f_expr = _import_func(
+    'lkt_grammar_dont_skip_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_dont_skip_f_dont_skip = _import_func(
+    'lkt_grammar_dont_skip_f_dont_skip',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_list_f_list_type = _import_func(
+    'lkt_grammar_list_f_list_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_list_f_kind = _import_func(
+    'lkt_grammar_list_f_kind',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_list_f_expr = _import_func(
+    'lkt_grammar_list_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_list_f_sep = _import_func(
+    'lkt_grammar_list_f_sep',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_null_f_name = _import_func(
+    'lkt_grammar_null_f_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_opt_f_expr = _import_func(
+    'lkt_grammar_opt_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_opt_group_f_expr = _import_func(
+    'lkt_grammar_opt_group_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_or_expr_f_sub_exprs = _import_func(
+    'lkt_grammar_or_expr_f_sub_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_pick_f_exprs = _import_func(
+    'lkt_grammar_pick_f_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_predicate_f_expr = _import_func(
+    'lkt_grammar_predicate_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_predicate_f_prop_ref = _import_func(
+    'lkt_grammar_predicate_f_prop_ref',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_rule_ref_f_node_name = _import_func(
+    'lkt_grammar_rule_ref_f_node_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_grammar_skip_f_name = _import_func(
+    'lkt_grammar_skip_f_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_parse_node_expr_f_node_name = _import_func(
+    'lkt_parse_node_expr_f_node_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_parse_node_expr_f_sub_exprs = _import_func(
+    'lkt_parse_node_expr_f_sub_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_token_no_case_lit_f_lit = _import_func(
+    'lkt_token_no_case_lit_f_lit',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_token_ref_f_token_name = _import_func(
+    'lkt_token_ref_f_token_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_token_ref_f_expr = _import_func(
+    'lkt_token_ref_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_if_expr_f_cond_expr = _import_func(
+    'lkt_if_expr_f_cond_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_if_expr_f_then_expr = _import_func(
+    'lkt_if_expr_f_then_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_if_expr_f_alternatives = _import_func(
+    'lkt_if_expr_f_alternatives',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_if_expr_f_else_expr = _import_func(
+    'lkt_if_expr_f_else_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_isa_f_expr = _import_func(
+    'lkt_isa_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_isa_f_dest_type = _import_func(
+    'lkt_isa_f_dest_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lambda_expr_f_params = _import_func(
+    'lkt_lambda_expr_f_params',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lambda_expr_f_return_type = _import_func(
+    'lkt_lambda_expr_f_return_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lambda_expr_f_body = _import_func(
+    'lkt_lambda_expr_f_body',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_string_lit_p_is_prefixed_string = _import_func(
+    'lkt_string_lit_p_is_prefixed_string',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(ctypes.c_uint8)],
+    ctypes.c_int
+)
+_string_lit_p_prefix = _import_func(
+    'lkt_string_lit_p_prefix',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(ctypes.c_uint32)],
+    ctypes.c_int
+)
+_string_lit_p_denoted_value = _import_func(
+    'lkt_string_lit_p_denoted_value',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_TextTypeConverter.c_type)],
+    ctypes.c_int
+)
+_string_lit_p_is_regexp_literal = _import_func(
+    'lkt_string_lit_p_is_regexp_literal',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(ctypes.c_uint8)],
+    ctypes.c_int
+)
+_logic_expr_f_expr = _import_func(
+    'lkt_logic_expr_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_match_expr_f_match_expr = _import_func(
+    'lkt_match_expr_f_match_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_match_expr_f_branches = _import_func(
+    'lkt_match_expr_f_branches',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_not_expr_f_expr = _import_func(
+    'lkt_not_expr_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_paren_expr_f_expr = _import_func(
+    'lkt_paren_expr_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_raise_expr_f_except_expr = _import_func(
+    'lkt_raise_expr_f_except_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_try_expr_f_try_expr = _import_func(
+    'lkt_try_expr_f_try_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_try_expr_f_or_expr = _import_func(
+    'lkt_try_expr_f_or_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_full_decl_f_doc = _import_func(
+    'lkt_full_decl_f_doc',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_full_decl_f_decl_annotations = _import_func(
+    'lkt_full_decl_f_decl_annotations',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_full_decl_f_decl = _import_func(
+    'lkt_full_decl_f_decl',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_import_f_name = _import_func(
+    'lkt_import_f_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_import_p_referenced_unit = _import_func(
+    'lkt_import_p_referenced_unit',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(AnalysisUnit._c_type)],
+    ctypes.c_int
+)
+_langkit_root_f_imports = _import_func(
+    'lkt_langkit_root_f_imports',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_langkit_root_f_decls = _import_func(
+    'lkt_langkit_root_f_decls',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_langkit_root_p_check_legality = _import_func(
+    'lkt_langkit_root_p_check_legality',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_SemanticResultArrayConverter.c_type)],
+    ctypes.c_int
+)
+_lexer_case_rule_f_expr = _import_func(
+    'lkt_lexer_case_rule_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lexer_case_rule_f_alts = _import_func(
+    'lkt_lexer_case_rule_f_alts',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lexer_case_rule_send_f_sent = _import_func(
+    'lkt_lexer_case_rule_send_f_sent',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lexer_case_rule_send_f_match_size = _import_func(
+    'lkt_lexer_case_rule_send_f_match_size',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_match_branch_f_decl = _import_func(
+    'lkt_match_branch_f_decl',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_match_branch_f_expr = _import_func(
+    'lkt_match_branch_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_param_f_name = _import_func(
+    'lkt_param_f_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_param_f_value = _import_func(
+    'lkt_param_f_value',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_type_ref_p_designated_type = _import_func(
+    'lkt_type_ref_p_designated_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_function_type_ref_f_args_types = _import_func(
+    'lkt_function_type_ref_f_args_types',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_function_type_ref_f_return_type = _import_func(
+    'lkt_function_type_ref_f_return_type',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_generic_type_ref_f_type_name = _import_func(
+    'lkt_generic_type_ref_f_type_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_generic_type_ref_f_params = _import_func(
+    'lkt_generic_type_ref_f_params',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_simple_type_ref_f_type_name = _import_func(
+    'lkt_simple_type_ref_f_type_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_var_bind_f_name = _import_func(
+    'lkt_var_bind_f_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_var_bind_f_expr = _import_func(
+    'lkt_var_bind_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+
+# Unit providers
+_dec_ref_unit_provider = _import_func(
+    'lkt_dec_ref_unit_provider',
+    [_unit_provider], None
+)
+
+
+
+# Misc
+_token_kind_name = _import_func(
+   "lkt_token_kind_name",
+   [ctypes.c_int], ctypes.POINTER(ctypes.c_char)
+)
+_token_next = _import_func(
+    "lkt_token_next",
+    [ctypes.POINTER(Token), ctypes.POINTER(Token)], None
+)
+_token_is_equivalent = _import_func(
+    "lkt_token_is_equivalent",
+    [ctypes.POINTER(Token), ctypes.POINTER(Token)], ctypes.c_int
+)
+_token_previous = _import_func(
+    "lkt_token_previous",
+    [ctypes.POINTER(Token), ctypes.POINTER(Token)], None
+)
+_token_range_text = _import_func(
+    "lkt_token_range_text",
+    [ctypes.POINTER(Token), ctypes.POINTER(Token), ctypes.POINTER(_text)],
+    ctypes.c_int
+)
+_entity_image = _import_func(
+    "lkt_entity_image",
+    [ctypes.POINTER(_Entity_c_type), ctypes.POINTER(_text)], None
+)
+
+
+#
+# Layering helpers
+#
+
+def _unwrap_str(c_char_p_value):
+    """
+    Assuming c_char_p_value is a valid char*, convert it to a native Python
+    string and free the C pointer.
+    """
+    result = ctypes.c_char_p(ctypes.addressof(c_char_p_value.contents)).value
+    _free(c_char_p_value)
+    return _py2to3.bytes_to_text(result)
+
+
+_kind_to_astnode_cls = {
+    1: LexerCaseRuleCondAlt,
+    2: LexerCaseRuleDefaultAlt,
+    3: GrammarDecl,
+    4: GrammarRuleDecl,
+    5: SyntheticLexerDecl,
+    6: NodeDecl,
+    7: SelfDecl,
+    8: EnumLitDecl,
+    9: FieldDecl,
+    10: FunArgDecl,
+    11: LambdaArgDecl,
+    12: MatchValDecl,
+    13: ValDecl,
+    14: FunDecl,
+    15: GenericDecl,
+    16: LexerDecl,
+    17: LexerFamilyDecl,
+    18: EnumClassAltDecl,
+    19: FunctionType,
+    20: GenericFormalTypeDecl,
+    21: InstantiatedGenericType,
+    22: ClassDecl,
+    23: EnumClassDecl,
+    24: EnumTypeDecl,
+    25: StructDecl,
+    26: TraitDecl,
+    27: DeclAnnotation,
+    28: DeclAnnotationParams,
+    29: Doc,
+    30: DocComment,
+    31: ElsifBranch,
+    32: EnumClassCase,
+    33: ExcludesNullAbsent,
+    34: ExcludesNullPresent,
+    35: ArrayLiteral,
+    36: BinOp,
+    37: BlockExpr,
+    38: CallExpr,
+    39: NullCondCallExpr,
+    40: CastExpr,
+    41: DotExpr,
+    42: NullCondDottedName,
+    43: ErrorOnNull,
+    44: GenericInstantiation,
+    45: GrammarCut,
+    46: GrammarDiscard,
+    47: GrammarDontSkip,
+    48: GrammarList,
+    49: GrammarNull,
+    50: GrammarOpt,
+    51: GrammarOptGroup,
+    52: GrammarOrExpr,
+    53: GrammarPick,
+    54: GrammarImplicitPick,
+    55: GrammarPredicate,
+    56: GrammarRuleRef,
+    57: GrammarSkip,
+    58: ParseNodeExpr,
+    59: TokenLit,
+    60: TokenNoCaseLit,
+    61: TokenPatternLit,
+    62: TokenRef,
+    63: Id,
+    64: DefId,
+    65: RefId,
+    66: ModuleRefId,
+    67: IfExpr,
+    68: Isa,
+    69: LambdaExpr,
+    70: CharLit,
+    71: NullLit,
+    72: NumLit,
+    73: StringLit,
+    74: LogicExpr,
+    75: MatchExpr,
+    76: NotExpr,
+    77: ParenExpr,
+    78: RaiseExpr,
+    79: TryExpr,
+    80: FullDecl,
+    81: Import,
+    82: BaseLexerCaseRuleAltList,
+    83: DeclAnnotationList,
+    84: DocCommentList,
+    85: ElsifBranchList,
+    86: EnumClassAltDeclList,
+    87: EnumClassCaseList,
+    88: EnumLitDeclList,
+    89: ExprList,
+    90: FullDeclList,
+    91: DeclBlock,
+    92: FunArgDeclList,
+    93: GrammarExprList,
+    94: GrammarExprListList,
+    95: ImportList,
+    96: LKNodeList,
+    97: LambdaArgDeclList,
+    98: MatchBranchList,
+    99: ParamList,
+    100: RefIdList,
+    101: TypeRefList,
+    102: LangkitRoot,
+    103: LexerCaseRule,
+    104: LexerCaseRuleSend,
+    105: ListKindOne,
+    106: ListKindZero,
+    107: MatchBranch,
+    108: OpAmp,
+    109: OpAnd,
+    110: OpDiv,
+    111: OpEq,
+    112: OpGt,
+    113: OpGte,
+    114: OpLt,
+    115: OpLte,
+    116: OpMinus,
+    117: OpMult,
+    118: OpOr,
+    119: OpPlus,
+    120: Param,
+    121: FunctionTypeRef,
+    122: GenericTypeRef,
+    123: SimpleTypeRef,
+    124: VarBind,
+}
+
+
+def _field_address(struct, field_name):
+    """
+    Get the address of a structure field from a structure value.
+
+    For instance::
+
+        class Foo(ctypes.Structure):
+            _fields_ = [('i', ctypes.c_int)]
+
+        f = Foo()
+        i_addr =_field_address(f, 'i')
+    """
+    struct_type = type(struct)
+    struct_addr = ctypes.addressof(struct)
+    field = getattr(struct_type, field_name)
+    field_type = None
+    for f_name, f_type in struct_type._fields_:
+        if f_name == field_name:
+            field_type = f_type
+            break
+    assert field_type is not None
+    return struct_addr + field.offset
+
+
+#
+# Language specific extensions #
+#
+
+
+
+
+#
+# App base class
+#
+
+class App(object):
+    """
+    Base class to regroup logic for an app. We use a class so that
+    specific languages implementations can add specific arguments and
+    processing by overriding specific methods:
+
+    - `main`, which will be the main method of the app.
+
+    - `add_arguments` to add arguments to the argparse.Parser instance
+
+    - `create_unit_provider` to return a custom unit provider to be used by the
+      AnalysisContext.
+
+    - `description` to change the description of the app.
+
+    Inside of `main`, the user can access app specific state:
+
+    - `self.units` is a map of filenames to analysis units.
+    - `self.ctx` is the analysis context.
+    - `self.u` is the last parsed unit.
+
+    The user can then run the app by calling `App.run()`.
+
+    Here is a small example of an app subclassing `App`, that will simply print
+    the tree of every unit passed as argument:
+
+    .. code-block:: python
+
+        from liblktlang import App
+
+
+        class ExampleApp(App):
+            def main(self):
+                for u in self.units.values():
+                    print u.filename
+                    print u.root.dump()
+
+        ExampleApp.run()
+    """
+
+    @property
+    def description(self):
+        """
+        Description for this app. Empty by default.
+        """
+        return ""
+
+    def __init__(self):
+        self.parser = argparse.ArgumentParser(description=self.description)
+        self.parser.add_argument('files', nargs='+', help='Files')
+        self.add_arguments()
+        self.args = self.parser.parse_args()
+        self.ctx = AnalysisContext(
+            'utf-8', with_trivia=True,
+            unit_provider=self.create_unit_provider()
+        )
+
+    def add_arguments(self):
+        """
+        Hook for subclasses to add arguments to self.parser. Default
+        implementation does nothing.
+        """
+        pass
+
+    def create_unit_provider(self):
+        """
+        Hook for subclasses to return a custom unit provider.
+        Default implementation returns None.
+        """
+        return None
+
+    def process_files(self):
+        """
+        Load units for all source files on the command-line in `self.units`.
+        Put the last one in `self.u`.
+        """
+        self.units = {}
+        for file_name in self.args.files:
+            self.u = self.ctx.get_from_file(file_name)
+            self.units[file_name] = self.u
+
+    @classmethod
+    def run(cls):
+        """
+        Instantiate and run this application.
+        """
+        instance = cls()
+        instance.process_files()
+        instance.main()
+
+    
+
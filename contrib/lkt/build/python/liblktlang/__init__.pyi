@@ -0,0 +1,5487 @@
+
+
+
+
+
+
+import argparse
+import sys
+from typing import (
+    Any, AnyStr, Callable, ClassVar, Dict, IO, Iterator, List, Optional as Opt,
+    Tuple, Type, TypeVar, Union
+)
+
+
+
+
+
+class AnalysisUnitKind(object):
+    """
+    Specify a kind of analysis unit. Specification units provide an interface
+    to the outer world while body units provide an implementation for the
+    corresponding interface.
+    """
+    unit_specification: str
+    unit_body: str
+class LookupKind(object):
+    """
+    """
+    recursive: str
+    flat: str
+    minimal: str
+class GrammarRule(object):
+    """
+    Gramar rule to use for parsing.
+    """
+    main_rule_rule: str
+    id_rule: str
+    ref_id_rule: str
+    def_id_rule: str
+    import_stmt_rule: str
+    imports_rule: str
+    doc_comment_rule: str
+    doc_rule: str
+    lexer_decl_rule: str
+    grammar_decl_rule: str
+    grammar_rule_rule: str
+    lexer_rule_rule: str
+    lexer_family_decl_rule: str
+    lexer_case_rule_rule: str
+    lexer_case_alt_rule: str
+    lexer_case_send_rule: str
+    grammar_primary_rule: str
+    grammar_expr_rule: str
+    grammar_pick_rule: str
+    grammar_implicit_pick_rule: str
+    grammar_opt_rule: str
+    grammar_cut_rule: str
+    grammar_or_expr_rule: str
+    grammar_discard_expr_rule: str
+    token_literal_rule: str
+    token_no_case_literal_rule: str
+    token_pattern_literal_rule: str
+    parse_node_expr_rule: str
+    grammar_rule_ref_rule: str
+    grammar_list_expr_rule: str
+    grammar_skip_rule: str
+    grammar_null_rule: str
+    grammar_token_rule: str
+    type_decl_rule: str
+    generic_decl_rule: str
+    generic_formal_type_rule: str
+    enum_lit_decl_rule: str
+    fun_decl_rule: str
+    lambda_arg_decl_rule: str
+    fun_arg_decl_rule: str
+    fun_arg_list_rule: str
+    lambda_arg_list_rule: str
+    field_decl_rule: str
+    bare_decl_rule: str
+    decl_rule: str
+    type_ref_rule: str
+    type_list_rule: str
+    decls_rule: str
+    decl_block_rule: str
+    val_decl_rule: str
+    var_bind_rule: str
+    block_rule: str
+    expr_rule: str
+    rel_rule: str
+    eq_rule: str
+    arith_1_rule: str
+    arith_2_rule: str
+    isa_or_primary_rule: str
+    primary_rule: str
+    match_expr_rule: str
+    num_lit_rule: str
+    string_lit_rule: str
+    char_lit_rule: str
+    if_expr_rule: str
+    raise_expr_rule: str
+    try_expr_rule: str
+    array_literal_rule: str
+    logic_rule: str
+    basic_expr_rule: str
+    term_rule: str
+    basic_name_rule: str
+    lambda_expr_rule: str
+    null_lit_rule: str
+    param_rule: str
+    params_rule: str
+    decl_annotation_params_rule: str
+    decl_annotation_rule: str
+
+
+default_grammar_rule: str
+
+
+class InvalidField(Exception):
+    pass
+class NodeDataEvaluationError(Exception):
+    pass
+class InvalidInput(Exception):
+    pass
+class InvalidSymbolError(Exception):
+    pass
+class InvalidUnitNameError(Exception):
+    pass
+class NativeException(Exception):
+    pass
+class PreconditionFailure(Exception):
+    pass
+class PropertyError(Exception):
+    pass
+class TemplateArgsError(Exception):
+    pass
+class TemplateFormatError(Exception):
+    pass
+class TemplateInstantiationError(Exception):
+    pass
+class StaleReferenceError(Exception):
+    pass
+class UnknownCharset(Exception):
+    pass
+
+
+
+
+
+
+class AnalysisContext(object):
+    """
+    This type represents a context for all source analysis. This is the first
+    type you need to create to use Liblktlang. It will contain the results of
+    all analysis, and is the main holder for all the data.
+
+    You can create several analysis contexts if you need to, which enables you,
+    for example to:
+
+    * analyze several different projects at the same time;
+
+    * analyze different parts of the same projects in parallel.
+
+    In the current design, contexts always keep all of their analysis units
+    allocated. If you need to get this memory released, the only option at your
+    disposal is to destroy your analysis context instance.
+    """
+
+    def __init__(self,
+                 charset: Opt[str] = None,
+                 unit_provider: Opt[UnitProvider] = None,
+                 with_trivia: bool = True,
+                 tab_stop: int = 8,
+                 *,
+                 _c_value: Any = None) -> None:
+        """
+        Create a new analysis context.
+
+        ``Charset`` will be used as a default charset to decode input sources
+        in analysis units. Please see ``GNATCOLL.Iconv`` for several supported
+        charsets. Be careful: passing an unsupported charset is not guaranteed
+        to raise an error here. If no charset is provided, ``"utf-8"`` is the
+        default.
+
+        .. todo:: Passing an unsupported charset here is not guaranteed to
+        raise an error right here, but this would be really helpful for users.
+
+        When ``With_Trivia`` is true, the parsed analysis units will contain
+        trivias.
+
+        If provided, ``Unit_Provider`` will be used to query the file name that
+        corresponds to a unit reference during semantic analysis. If it is
+        ``None``, the default one is used instead.
+
+        ``Tab_Stop`` is a positive number to describe the effect of tabulation
+        characters on the column number in source files.
+        """
+
+    def __eq__(self, other: Any) -> bool: ...
+    def __hash__(self) -> int: ...
+
+    def get_from_file(self,
+                      filename: AnyStr,
+                      charset: Opt[str] = None,
+                      reparse: bool = False,
+                      rule: str = default_grammar_rule) -> AnalysisUnit:
+        """
+        Create a new analysis unit for ``Filename`` or return the existing one
+        if any. If ``Reparse`` is true and the analysis unit already exists,
+        reparse it from ``Filename``.
+
+        ``Rule`` controls which grammar rule is used to parse the unit.
+
+        Use ``Charset`` in order to decode the source. If ``Charset`` is empty
+        then use the context's default charset.
+
+        If any failure occurs, such as file opening, decoding, lexing or
+        parsing failure, return an analysis unit anyway: errors are described
+        as diagnostics of the returned analysis unit.
+        """
+
+    def get_from_files(self,
+                       filenames: List[AnyStr],
+                       charset: Opt[str] = None,
+                       reparse: bool = False,
+                       rule: str = default_grammar_rule,
+                       jobs: int = 0) -> List[AnalysisUnit]:
+        """
+        Create new analysis units for all ``Filenames``, or return the existing
+        ones, as ``Get_From_File`` would do for each of them. Units that need
+        to be (re)parsed are lexed and parsed concurrently on ``Jobs`` worker
+        tasks, or on one task per processor if ``Jobs`` is zero. Only lexing
+        and parsing run concurrently: the rest of the processing (for instance
+        lexical environments updates) is sequential.
+
+        Return the analysis units in the same order as ``Filenames``.
+        """
+
+    def get_from_buffer(self,
+                        filename: AnyStr,
+                        buffer: AnyStr,
+                        charset: Opt[str] = None,
+                        reparse: bool = False,
+                        rule: str = default_grammar_rule) -> AnalysisUnit:
+        """
+        Create a new analysis unit for ``Filename`` or return the existing one
+        if any. Whether the analysis unit already exists or not, (re)parse it
+        from the source code in ``Buffer``.
+
+        ``Rule`` controls which grammar rule is used to parse the unit.
+
+        Use ``Charset`` in order to decode the source. If ``Charset`` is empty
+        then use the context's default charset.
+
+        If any failure occurs, such as file opening, decoding, lexing or
+        parsing failure, return an analysis unit anyway: errors are described
+        as diagnostics of the returned analysis unit.
+        """
+
+    def get_from_provider(
+        self,
+        name: AnyStr,
+        kind: str,
+        charset: Opt[str] = None,
+        reparse: bool = False
+    ) -> AnalysisUnit:
+        """
+        Create a new analysis unit for ``Name``/``Kind`` or return the existing
+        one if any. If ``Reparse`` is true and the analysis unit already
+        exists, reparse it from ``Filename``.
+
+        Use ``Charset`` in order to decode the source. If ``Charset`` is empty
+        then use the context's default charset.
+
+        If the unit name cannot be tuned into a file name, raise an
+        ``InvalidUnitNameError`` exception. If any other failure occurs, such
+        as file opening, decoding, lexing or parsing failure, return an
+        analysis unit anyway: errors are described as diagnostics of the
+        returned analysis unit.
+        """
+
+    def discard_errors_in_populate_lexical_env(self,
+                                               discard: bool) -> None:
+        """
+        Debug helper. Set whether ``Property_Error`` exceptions raised in
+        ``Populate_Lexical_Env`` should be discarded. They are by default.
+        """
+
+    def use_memory_mapped_files(self, enabled: bool = True) -> None:
+        """
+        Set whether analysis units created from files in this context should be
+        lexed directly from a compact copy of the memory-mapped file. This
+        avoids decoding the file into a wide-character buffer, and thus speeds
+        up parsing and reduces memory usage. It is disabled by default.
+
+        This only applies to files that use a single-byte charset (ASCII or
+        Latin-1) and that do not start with a UTF byte order mark: other files
+        are decoded as usual.
+        """
+
+class AnalysisUnit(object):
+    """
+    This type represents the analysis of a single file.
+    """
+
+    class TokenIterator(object):
+        """
+        Iterator over the tokens in an analysis unit.
+        """
+
+        def __init__(self, first: Token) -> None: ...
+        def __iter__(self) -> AnalysisUnit.TokenIterator: ...
+        def __next__(self) -> Token: ...
+        def next(self) -> Token: ...
+
+    def __init__(self, context: AnalysisContext, c_value: Any) -> None: ...
+
+    def __eq__(self, other: Any) -> bool: ...
+    def __hash__(self) -> int: ...
+
+    @property
+    def context(self) -> AnalysisContext:
+        """
+        Return the context that owns this unit.
+        """
+
+    def reparse(self,
+                buffer: Opt[AnyStr] = None,
+                charset: Opt[str] = None) -> None:
+        """
+        Reparse an analysis unit from a buffer, if provided, or from the
+        original file otherwise. If ``Charset`` is empty or ``None``, use the
+        last charset successfuly used for this unit, otherwise use it to decode
+        the content of the source file.
+
+        If any failure occurs, such as decoding, lexing or parsing failure,
+        diagnostic are emitted to explain what happened.
+        """
+
+    def reparse_edit(self, edit_range: SlocRange, text: str) -> None:
+        """
+        Replace the source text in ``Edit_Range`` with ``Text`` and reparse the
+        analysis unit accordingly. The end of ``Edit_Range`` is exclusive, so
+        an empty range inserts ``Text``.
+
+        When the edit changes only trivia (whitespaces, comments, ...), the
+        unit keeps its current tree, so its nodes remain valid. Otherwise, this
+        is equivalent to reparsing the whole edited source buffer.
+
+        Raise a ``PreconditionFailure`` exception if the unit has no source
+        buffer or if ``Edit_Range`` is not a valid source location range for
+        it.
+        """
+
+    def populate_lexical_env(self) -> None:
+        """
+        Create lexical environments for this analysis unit, according to the
+        specifications given in the language spec.
+
+        If not done before, it will be automatically called during semantic
+        analysis. Calling it before enables one to control where the latency
+        occurs.
+
+        Depending on whether errors are discarded (see
+        ``Discard_Errors_In_Populate_Lexical_Env``), raise a ``Property_Error``
+        on failure.
+        """
+
+    @property
+    def root(self) -> LKNode:
+        """
+        Return the root node for this unit, or ``None`` if there is none.
+
+        :rtype: LKNode
+        """
+
+    @property
+    def first_token(self) -> Token:
+        """
+        Return a reference to the first token scanned in this unit.
+        """
+
+    @property
+    def last_token(self) -> Token:
+        """
+        Return a reference to the last token scanned in this unit.
+        """
+
+    @property
+    def text(self) -> str:
+        """
+        Return the source buffer associated to this unit.
+        """
+
+    @property
+    def token_count(self) -> int:
+        """
+        Return the number of tokens in this unit.
+        """
+
+    @property
+    def trivia_count(self) -> int:
+        """
+        Return the number of trivias in this unit. This is 0 for units that
+        were parsed with trivia analysis disabled.
+        """
+
+    def token_table(self) -> TokenTable:
+        """
+        Return a columnar representation of all the tokens and trivia in this
+        unit.
+
+        Iterating on tokens one at a time is slow: this computes the data for
+        all tokens in a single native call, which is a lot faster.
+
+        :rtype: TokenTable
+        """
+
+    def lookup_token(self, sloc: Sloc) -> Token:
+        """
+        Look for a token in this unit that contains the given source location.
+        If this falls before the first token, return the first token. If this
+        falls between two tokens, return the token that appears before. If this
+        falls after the last token, return the last token. If there is no token
+        in this unit, return no token.
+        """
+
+    def iter_tokens(self) -> AnalysisUnit.TokenIterator:
+        """
+        Iterator over the tokens in an analysis unit.
+        """
+
+    @property
+    def filename(self) -> str:
+        """
+        Return the filename this unit is associated to.
+        """
+
+    @property
+    def diagnostics(self) -> List[Diagnostic]:
+        """
+        Diagnostics for this unit.
+        """
+
+    def __repr__(self) -> str: ...
+
+
+class Sloc(object):
+    """
+    Location in a source file. Line and column numbers are one-based.
+    """
+
+    line: int
+    column: int
+
+    def __init__(self, line: int, column: int) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __nonzero__(self) -> bool: ...
+    def __lt__(self, other: Sloc) -> bool: ...
+    def __eq__(self, other: Any) -> bool: ...
+    def __hash__(self) -> int: ...
+    def __str__(self) -> str: ...
+    def __repr__(self) -> str: ...
+
+
+class SlocRange(object):
+    """
+    Location of a span of text in a source file.
+    """
+
+    start: Sloc
+    end: Sloc
+
+    def __init__(self, start: Sloc, end: Sloc) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __nonzero__(self) -> bool: ...
+    def __lt__(self, other: SlocRange) -> bool: ...
+    def __eq__(self, other: Any) -> bool: ...
+    def __hash__(self) -> int: ...
+    def __str__(self) -> str: ...
+    def __repr__(self) -> str: ...
+
+
+class Diagnostic(object):
+    """
+    Diagnostic for an analysis unit: cannot open the source file, parsing
+    error, ...
+    """
+
+    sloc_range: SlocRange
+    message: str
+
+    def __init__(self, sloc_range: SlocRange, message: str) -> None: ...
+
+    @property
+    def as_text(self) -> str: ...
+
+    def __str__(self) -> str: ...
+    def __repr__(self) -> str: ...
+
+
+class Token(object):
+    """
+    Reference to a token in an analysis unit.
+    """
+
+    @property
+    def next(self) -> Opt[Token]:
+        """
+        Return a reference to the next token in the corresponding analysis
+        unit.
+        """
+
+    @property
+    def previous(self) -> Opt[Token]:
+        """
+        Return a reference to the previous token in the corresponding analysis
+        unit.
+        """
+
+    def range_until(self, other: Token) -> Iterator[Token]:
+        """
+        Return an iterator on the list of tokens that spans between `self` and
+        `other` (included). This returns an empty list if the first token
+        appears after the other one in the source code. Raise a ``ValueError``
+        if both tokens come from different analysis units.
+        """
+
+    def is_equivalent(self, other: Token) -> bool:
+        """
+        Return whether ``L`` and ``R`` are structurally equivalent tokens. This
+        means that their position in the stream won't be taken into account,
+        only the kind and text of the token.
+        """
+
+    @property
+    def kind(self) -> str:
+        """
+        Kind for this token.
+        """
+
+    @property
+    def is_trivia(self) -> bool:
+        """
+        Return whether this token is a trivia. If it's not, it's a regular
+        token.
+        """
+
+    @property
+    def index(self) -> int:
+        """
+        Zero-based index for this token/trivia. Tokens and trivias get their
+        own index space.
+        """
+
+    @property
+    def text(self) -> str:
+        """
+        Return the text of the given token.
+        """
+
+    @classmethod
+    def text_range(cls, first: Token, last: Token) -> str:
+        """
+        Compute the source buffer slice corresponding to the text that spans
+        between the ``First`` and ``Last`` tokens (both included). This yields
+        an empty slice if ``Last`` actually appears before ``First``.
+
+        This raises a ``ValueError`` if ``First`` and ``Last`` don't belong to
+        the same analysis unit.
+        """
+
+    @property
+    def sloc_range(self) -> SlocRange:
+        """
+        Return the source location range of the given token.
+        """
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Return whether the two tokens refer to the same token in the same unit.
+
+        Note that this does not actually compares the token data.
+        """
+
+    def __hash__(self) -> int: ...
+    def __repr__(self) -> str: ...
+
+    def __lt__(self, other: Opt[Token]) -> bool:
+        """
+        Consider that None comes before all tokens. Then, sort by unit, token
+        index, and trivia index.
+        """
+
+    def __le__(self, other: Opt[Token]) -> bool: ...
+    def __gt__(self, other: Opt[Token]) -> bool: ...
+    def __ge__(self, other: Opt[Token]) -> bool: ...
+
+    def to_data(self) -> dict:
+        """
+        Return a dict representation of this Token.
+        """
+
+
+class UnitProvider(object):
+    """
+    Interface to fetch analysis units from a name and a unit kind.
+
+    The unit provider mechanism provides an abstraction which assumes that to
+    any couple (unit name, unit kind) we can associate at most one source file.
+    This means that several couples can be associated to the same source file,
+    but on the other hand, only one one source file can be associated to a
+    couple.
+
+    This is used to make the semantic analysis able to switch from one analysis
+    units to another.
+    """
+
+    def __init__(self, c_value: Any) -> None:
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly.
+        """
+
+
+
+
+
+class LKNode(object):
+    """
+    Root node class for lkt AST nodes.
+    """
+
+    is_list_type: ClassVar[bool]
+
+    
+    
+
+    
+    @property
+    def p_node_type(
+        self
+    ) -> TypeDecl:
+        """
+        Unit method. Return the Node base class.
+        """
+    
+    @property
+    def p_char_type(
+        self
+    ) -> TypeDecl:
+        """
+        Unit method. Return the character builtin type.
+        """
+    
+    @property
+    def p_int_type(
+        self
+    ) -> TypeDecl:
+        """
+        Unit method. Return the integer builtin type.
+        """
+    
+    @property
+    def p_bool_type(
+        self
+    ) -> TypeDecl:
+        """
+        Unit method. Return the boolean builtin type.
+        """
+    
+    @property
+    def p_bigint_type(
+        self
+    ) -> TypeDecl:
+        """
+        Unit method. Return the big integer builtin type.
+        """
+    
+    @property
+    def p_string_type(
+        self
+    ) -> TypeDecl:
+        """
+        Unit method. Return the string builtin type.
+        """
+    
+    @property
+    def p_symbol_type(
+        self
+    ) -> TypeDecl:
+        """
+        Unit method. Return the string builtin type.
+        """
+    
+    @property
+    def p_regexp_type(
+        self
+    ) -> TypeDecl:
+        """
+        Unit method. Return the regexp builtin type.
+        """
+    
+    @property
+    def p_array_gen_type(
+        self
+    ) -> TypeDecl:
+        """
+        Unit method. Return the array builtin type.
+        """
+    
+    @property
+    def p_astlist_gen_type(
+        self
+    ) -> TypeDecl:
+        """
+        Unit method. Return the ASTList builtin generic type.
+        """
+    
+    @property
+    def p_iterator_gen_trait(
+        self
+    ) -> TraitDecl:
+        """
+        Unit method. Return the Iterator builtin generic trait.
+        """
+    
+    @property
+    def p_check_semantic(
+        self
+    ) -> TreeSemanticResult:
+        """
+        Run name and type resolution on all relevant entities in this subtree,
+        aggregating and returning the results.
+
+        If you ran this and the result's `has_error` flag is false, then you
+        *know* that you can call semantic properties such as `referenced_decl`
+        and `expr_type`, and those will never raise.
+        """
+    
+    @property
+    def parent(
+        self
+    ) -> LKNode:
+        """
+        Return the lexical parent for this node. Return null for the root AST
+        node or for AST nodes for which no one has a reference to the parent.
+        """
+    
+    @property
+    def parents(
+        self
+    ) -> List[LKNode]:
+        """
+        Return an array that contains the lexical parents (this node included).
+        Nearer parents are first in the list.
+        """
+    
+    @property
+    def children(
+        self
+    ) -> List[LKNode]:
+        """
+        Return an array that contains the direct lexical children.
+        """
+    
+    @property
+    def token_start(
+        self
+    ) -> Token:
+        """
+        Return the first token used to parse this node.
+        """
+    
+    @property
+    def token_end(
+        self
+    ) -> Token:
+        """
+        Return the last token used to parse this node.
+        """
+    
+    @property
+    def child_index(
+        self
+    ) -> int:
+        """
+        Return the 0-based index for Node in its parent's children.
+        """
+    
+    @property
+    def previous_sibling(
+        self
+    ) -> LKNode:
+        """
+        Return the node's previous sibling, if there is one.
+        """
+    
+    @property
+    def next_sibling(
+        self
+    ) -> LKNode:
+        """
+        Return the node's next sibling, if there is one.
+        """
+    
+    @property
+    def unit(
+        self
+    ) -> AnalysisUnit:
+        """
+        Return the analysis unit owning this node.
+        """
+    
+    @property
+    def is_ghost(
+        self
+    ) -> bool:
+        """
+        Return whether the node is a ghost.
+
+        Unlike regular nodes, ghost nodes cover no token in the input source:
+        they are logically located instead between two tokens. The
+        "token_first" of all ghost nodes is the token right after this logical
+        position, while they have no "token_last".
+        """
+    
+    @property
+    def full_sloc_image(
+        self
+    ) -> str:
+        """
+        Return a string containing the filename + the sloc in GNU conformant
+        format. Useful to create diagnostics from a node.
+        """
+
+
+
+
+
+    def __init__(self,
+                 c_value: Any,
+                 node_c_value: Any,
+                 metadata: Any,
+                 rebindings: Any) -> None: ...
+    def __eq__(self, other: Any) -> bool: ...
+    def __ne__(self, other: Any) -> bool: ...
+    def __hash__(self) -> int: ...
+
+    @property
+    def kind_name(self) -> str:
+        """
+        Return the kind of this node.
+        """
+
+    @property
+    def is_token_node(self) -> bool:
+        """
+        Return whether this node is a node that contains only a single token.
+        """
+
+    @property
+    def is_synthetic(self) -> bool:
+        """
+        Return whether this node is synthetic.
+        """
+
+    @property
+    def sloc_range(self) -> SlocRange:
+        """
+        Return the spanning source location range for this node.
+
+        Note that this returns the sloc of the parent for synthetic nodes.
+        """
+
+    @property
+    def text(self) -> str:
+        """
+        Return the source buffer slice corresponding to the text that spans
+        between the first and the last tokens of this node.
+
+        Note that this returns the empty string for synthetic nodes.
+        """
+
+    @property
+    def image(self) -> str:
+        """
+        Return a representation of this node as a string.
+        """
+
+    def lookup(self, sloc: Sloc) -> Opt[LKNode]:
+        """
+        Return the bottom-most node from in ``Node`` and its children which
+        contains ``Sloc``, or ``None`` if there is none.
+        """
+
+    def __bool__(self) -> bool:
+        """
+        Return always True so that checking a node against None can be done as
+        simply as::
+
+        if node: ...
+        """
+
+    def __nonzero__(self) -> bool: ...
+
+    def __iter__(self) -> Iterator[LKNode]:
+        """
+        Return an iterator on the children of this node.
+        """
+
+    def __len__(self) -> int:
+        """
+        Return the number of LKNode children this node has.
+        """
+
+    def __getitem__(self, key: int) -> Opt[LKNode]:
+        """
+        Return the Nth LKNode child this node has.
+
+        This handles negative indexes the same way Python lists do. Raise an
+        IndexError if "key" is out of range.
+        """
+
+    def iter_fields(self) -> Iterator[Tuple[str, LKNode]]:
+        """
+        Iterate through all the fields this node contains.
+
+        Return an iterator that yields (name, value) couples for all abstract
+        fields in this node. If "self" is a list, field names will be
+        "item_{n}" with "n" being the index.
+        """
+
+    def export_tree(self) -> NodeTree:
+        """
+        Return a flat representation of the sub-tree rooted at this node.
+
+        Traversing a big tree one node at a time is slow: this computes the
+        data for all nodes in a single native call, which is a lot faster.
+
+        :rtype: NodeTree
+        """
+
+    def dump_str(self) -> str:
+        """
+        Dump the sub-tree to a string in a human-readable format.
+        """
+
+    def dump(self, indent: str = '', file: IO[str] = sys.stdout) -> None:
+        """
+        Dump the sub-tree in a human-readable format on the given file.
+
+        :param str indent: Prefix printed on each line during the dump. :param
+        file file: File in which the dump must occur.
+        """
+
+    def findall(
+        self,
+        ast_type_or_pred: Union[Type[LKNode],
+                                Callable[[LKNode], bool]],
+        **kwargs: Any
+    ) -> List[LKNode]:
+        """
+        Helper for finditer that will return all results as a list. See
+        finditer's documentation for more details.
+        """
+
+    def find(
+        self,
+        ast_type_or_pred: Union[Type[LKNode],
+                                Callable[[LKNode], bool]],
+        **kwargs: Any
+    ) -> Opt[LKNode]:
+        """
+        Helper for finditer that will return only the first result. See
+        finditer's documentation for more details.
+        """
+
+    def finditer(
+        self,
+        ast_type_or_pred: Union[Type[LKNode],
+                                Callable[[LKNode], bool]],
+        **kwargs: Any
+    ) -> Iterator[LKNode]:
+        """
+        Find every node corresponding to the passed predicates.
+
+        :param ast_type_or_pred: If supplied with a subclass of LKNode, will
+        constrain the resulting collection to only the instances of this type
+        or any subclass. If supplied with a predicate, it will apply the
+        predicate on every node and keep only the ones for which it returns
+        True. If supplied with a list of subclasses of LKNode, it will match
+        all instances of any of them. :type ast_type_or_pred: type|((LKNode) ->
+        bool)|list[type]
+
+        :param kwargs: Allows the user to filter on attributes of the node. For
+        every key value association, if the node has an attribute of name key
+        that has the specified value, then the child is kept. :type kwargs:
+        dict[str, Any]
+        """
+
+    @property
+    def parent_chain(self) -> List[LKNode]:
+        """
+        Return the parent chain of self. Self will be the first element,
+        followed by the first parent, then this parent's parent, etc.
+        """
+
+    def __repr__(self) -> str: ...
+
+    @property
+    def entity_repr(self) -> str: ...
+
+    @property
+    def tokens(self) -> Iterator[Token]:
+        """
+        Return an iterator on the range of tokens that self encompasses.
+        """
+
+    def to_data(self) -> Union[list, dict]:
+        """
+        Return a nested python data-structure, constituted only of standard
+        data types (dicts, lists, strings, ints, etc), and representing the
+        portion of the AST corresponding to this node.
+        """
+
+    def to_json(self) -> str:
+        """
+        Return a JSON representation of this node.
+        """
+
+    def is_a(self, *types: Type[LKNode]) -> bool:
+        """
+        Shortcut for isinstance(self, types). :rtype: bool
+        """
+
+    T = TypeVar('T', bound=LKNode)
+
+    def cast(self, typ: Type[T]) -> T:
+        """
+        Fluent interface style method. Return ``self``, raise an error if self
+        is not of type ``typ``.
+
+        :type typ: () -> T :rtype: T
+        """
+
+
+
+class BaseLexerCaseRuleAlt(LKNode):
+    """
+    Base class for the different kind of alternatives allowed in a case rule.
+    """
+
+    
+
+    
+    @property
+    def f_send(
+        self
+    ) -> LexerCaseRuleSend:
+        pass
+
+
+
+
+
+
+
+class LexerCaseRuleCondAlt(BaseLexerCaseRuleAlt):
+    """
+    Alternative of a case rule which sends the token only if the kind of the
+    previous token is among a given set.
+    """
+
+    
+
+    
+    @property
+    def f_cond_exprs(
+        self
+    ) -> RefIdList:
+        pass
+
+
+
+
+
+
+
+class LexerCaseRuleDefaultAlt(BaseLexerCaseRuleAlt):
+    """
+    Default alternative of a case rule which sends the token if all the
+    previous alternatives failed.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class Decl(LKNode):
+    """
+    Base class for declarations. Encompasses regular declarations as well as
+    special declarations such as grammars, grammar rules, etc.
+    """
+
+    
+
+    
+    @property
+    def f_syn_name(
+        self
+    ) -> DefId:
+        pass
+    
+    @property
+    def p_name(
+        self
+    ) -> str:
+        """
+        Return the symbol corresponding to the name of this declaration.
+        """
+
+
+
+
+
+
+
+class BaseGrammarDecl(Decl):
+    """
+    Base class for all declarations related to grammars.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class GrammarDecl(BaseGrammarDecl):
+    """
+    Declaration of a language's grammar.
+    """
+
+    
+
+    
+    @property
+    def f_rules(
+        self
+    ) -> FullDeclList:
+        pass
+    
+    @property
+    def p_lexer(
+        self
+    ) -> Decl:
+        """
+        Return the lexer that is associated to this grammar.
+        """
+
+
+
+
+
+
+
+class BaseGrammarRuleDecl(Decl):
+    """
+    Base class for grammar rules inside of grammars/lexers.
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> GrammarExpr:
+        pass
+
+
+
+
+
+
+
+class GrammarRuleDecl(BaseGrammarRuleDecl):
+    """
+    Declaration of a grammar rule inside of a grammar.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class SyntheticLexerDecl(BaseGrammarRuleDecl):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class BaseValDecl(Decl):
+    """
+    Abstract class for named values declarations, such as arguments, local
+    value bindings, fields, etc.
+    """
+
+    
+
+    
+    def p_get_type(
+        self, no_inference: bool = False
+    ) -> TypeDecl:
+        """
+        Get the type of this value declaration.
+        """
+
+
+
+
+
+
+
+class NodeDecl(BaseValDecl):
+    """
+    Synthetic declaration for the implicit "node" variable available in
+    properties.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class SelfDecl(BaseValDecl):
+    """
+    Synthetic declaration for the implicit "self" variable available in
+    properties.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class UserValDecl(BaseValDecl):
+    """
+    Class for user declared val declarations (not synthetic).
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class EnumLitDecl(UserValDecl):
+    """
+    Enum literal declaration.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class ExplicitlyTypedDecl(UserValDecl):
+    """
+    Subset of user declared value declarations for values that have a type that
+    can be syntactically annotated by the user.
+    """
+
+    
+
+    
+    @property
+    def f_decl_type(
+        self
+    ) -> TypeRef:
+        pass
+
+
+
+
+
+
+
+class ComponentDecl(ExplicitlyTypedDecl):
+    """
+    Subset of explicitly typed declarations for value declarations that:
+
+    1. Have an optional default value. 2. Are part of a bigger declaration that
+    can be referred to via a call expression (either a type or a function).
+    """
+
+    
+
+    
+    @property
+    def f_default_val(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+
+
+
+
+
+
+
+class FieldDecl(ComponentDecl):
+    """
+    Field declaration.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class FunArgDecl(ComponentDecl):
+    """
+    Function argument declaration.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class LambdaArgDecl(ComponentDecl):
+    """
+    Function argument declaration.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class MatchValDecl(ExplicitlyTypedDecl):
+    """
+    Value declaration in a match branch.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class ValDecl(ExplicitlyTypedDecl):
+    """
+    Value declaration.
+    """
+
+    
+
+    
+    @property
+    def f_val(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+
+
+
+
+
+
+
+class FunDecl(UserValDecl):
+    """
+    Function declaration.
+    """
+
+    
+
+    
+    @property
+    def f_args(
+        self
+    ) -> FunArgDeclList:
+        pass
+    
+    @property
+    def f_return_type(
+        self
+    ) -> TypeRef:
+        pass
+    
+    @property
+    def f_body(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+
+
+
+
+
+
+
+class GenericDecl(Decl):
+    """
+    Generic entity declaration.
+    """
+
+    
+
+    
+    @property
+    def f_generic_formal_decls(
+        self
+    ) -> FullDeclList:
+        pass
+    
+    @property
+    def f_decl(
+        self
+    ) -> Decl:
+        """
+        This field can contain one of the following nodes:
+
+        * BaseGrammarDecl
+
+        * FieldDecl
+
+        * FunDecl
+
+        * GenericDecl
+
+        * GrammarRuleDecl
+
+        * LexerDecl
+
+        * NamedTypeDecl
+
+        * ValDecl
+        """
+
+
+
+
+
+
+
+class LexerDecl(Decl):
+    """
+    Declaration of a language's lexer.
+    """
+
+    
+
+    
+    @property
+    def f_rules(
+        self
+    ) -> LKNodeList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * FullDecl
+
+        * LexerCaseRule
+        """
+
+
+
+
+
+
+
+class LexerFamilyDecl(Decl):
+    """
+    Declaration of a token family.
+    """
+
+    
+
+    
+    @property
+    def f_rules(
+        self
+    ) -> FullDeclList:
+        pass
+
+
+
+
+
+
+
+class TypeDecl(Decl):
+    """
+    Abstract base class for type declarations.
+    """
+
+    
+
+    
+    @property
+    def f_traits(
+        self
+    ) -> TypeRefList:
+        """
+        Traits for this type
+        """
+    
+    @property
+    def p_implemented_traits(
+        self
+    ) -> List[TypeDecl]:
+        """
+        Traits implemented by this type.
+        """
+    
+    @property
+    def f_base_type(
+        self
+    ) -> TypeRef:
+        pass
+    
+    @property
+    def p_base_types(
+        self
+    ) -> List[TypeDecl]:
+        """
+        Return the chain of base types for this type, if applicable, else null.
+        """
+    
+    @property
+    def p_root_type(
+        self
+    ) -> TypeDecl:
+        """
+        Return the root type of this type, if applicable, else null.
+        """
+    
+    def p_is_subtype(
+        self, potential_base: TypeDecl
+    ) -> bool:
+        """
+        Return whether ``self`` is a subtype of ``potential_base``.
+        """
+    
+    @property
+    def p_is_generic(
+        self
+    ) -> bool:
+        """
+        Returns whether this type is an instantiated generic type.
+        """
+
+
+
+
+
+
+
+class EnumClassAltDecl(TypeDecl):
+    """
+    Alternative for an enum class decl.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class FunctionType(TypeDecl):
+    """
+    Function type.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class GenericFormalTypeDecl(TypeDecl):
+    """
+    Declaration of a generic formal type in a generic declaration.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class InstantiatedGenericType(TypeDecl):
+    """
+    Instantiated generic type.
+    """
+
+    
+
+    
+    @property
+    def p_get_inner_type(
+        self
+    ) -> TypeDecl:
+        """
+        Return the generic type that ``self`` instantiates.
+        """
+    
+    @property
+    def p_get_actuals(
+        self
+    ) -> List[TypeDecl]:
+        """
+        Return the declaration of types that were passed as generic actuals to
+        create ``self``.
+        """
+    
+    @property
+    def p_get_instantiated_type(
+        self
+    ) -> TypeDecl:
+        """
+        Return the instantiated type decl with proper rebindings, that can be
+        used for typing and code generation.
+        """
+
+
+
+
+
+
+
+class NamedTypeDecl(TypeDecl):
+    """
+    Explicit named type declaration.
+    """
+
+    
+
+    
+    @property
+    def f_decls(
+        self
+    ) -> DeclBlock:
+        pass
+
+
+
+
+
+
+
+class BasicClassDecl(NamedTypeDecl):
+    """
+    Common ancestor for declarations of regular classes and enum classes.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class ClassDecl(BasicClassDecl):
+    """
+    Declaration for a LK class. This only cover node classes for the moment,
+    but might be extended to support regular classes in the future.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class EnumClassDecl(BasicClassDecl):
+    """
+    Declaration for a LK class. This only cover node classes for the moment,
+    but might be extended to support regular classes in the future.
+    """
+
+    
+
+    
+    @property
+    def f_branches(
+        self
+    ) -> EnumClassCaseList:
+        pass
+
+
+
+
+
+
+
+class EnumTypeDecl(NamedTypeDecl):
+    """
+    Enum type declaration.
+    """
+
+    
+
+    
+    @property
+    def f_literals(
+        self
+    ) -> EnumLitDeclList:
+        pass
+
+
+
+
+
+
+
+class StructDecl(NamedTypeDecl):
+    """
+    Declaration for a LK struct.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class TraitDecl(NamedTypeDecl):
+    """
+    Trait declaration. For the moment, a Trait can just be used to group
+    behavior for built-in types. It's not usable as a type-bound since we don't
+    have generics, and you cannot implement one either.
+
+    The reason they're added is to lay down the basics of what we want the LKT
+    type system to be.
+
+    TODO: Traits are *not* types. They're treated as such in the grammar for
+    convenience for now, but it's probably not a good idea. Migrate away from
+    this.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class DeclAnnotation(LKNode):
+    """
+    Compile time annotation attached to a declaration.
+    """
+
+    
+
+    
+    @property
+    def f_name(
+        self
+    ) -> Id:
+        pass
+    
+    @property
+    def f_params(
+        self
+    ) -> DeclAnnotationParams:
+        pass
+
+
+
+
+
+
+
+class DeclAnnotationParams(LKNode):
+    """
+    List of arguments for an annotation with a call syntax. This intermediate
+    node is necessary in order to determine after parsing whether there is no
+    param list, or if the list is empty.
+    """
+
+    
+
+    
+    @property
+    def f_params(
+        self
+    ) -> ParamList:
+        pass
+
+
+
+
+
+
+
+class Doc(LKNode):
+    """
+    Documentation attached to a decl node.
+    """
+
+    
+
+    
+    @property
+    def f_lines(
+        self
+    ) -> DocCommentList:
+        pass
+
+
+
+
+
+
+
+class DocComment(LKNode):
+    """
+    Node for one line of documentation attached to a node.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class ElsifBranch(LKNode):
+    """
+    Elsif branch of an if expression.
+    """
+
+    
+
+    
+    @property
+    def f_cond_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+    
+    @property
+    def f_then_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+
+
+
+
+
+
+
+class EnumClassCase(LKNode):
+    """
+    Case branch for an enum class declaration.
+    """
+
+    
+
+    
+    @property
+    def f_decls(
+        self
+    ) -> EnumClassAltDeclList:
+        pass
+
+
+
+
+
+
+
+class ExcludesNull(LKNode):
+    """
+    Whether the containing cast expression will raise on null cast result or
+    not.
+    """
+
+    
+
+    
+    @property
+    def p_as_bool(
+        self
+    ) -> bool:
+        """
+        Return whether this is an instance of ExcludesNullPresent
+        """
+
+
+
+
+
+
+
+class ExcludesNullAbsent(ExcludesNull):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class ExcludesNullPresent(ExcludesNull):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class Expr(LKNode):
+    """
+    Base class for expressions. Encompasses regular expressions as well as
+    special expressions (grammar expressions, etc).
+    """
+
+    
+
+    
+    @property
+    def p_in_type_ref(
+        self
+    ) -> bool:
+        """
+        Return whether this expression is part of a type reference.
+        """
+    
+    @property
+    def p_is_regular_expr(
+        self
+    ) -> bool:
+        """
+        Return whether this expression is a regular expression that can be
+        evaluated at runtime, in particular:
+
+        * Not part of a type reference.
+
+        * Not part of a declaration annotation.
+
+        * Not a defining identifier.
+
+        TODO: List  to be expanded probably to take into account grammar
+        expressions.
+        """
+    
+    @property
+    def p_expr_type(
+        self
+    ) -> SemanticResult:
+        """
+        Return the type of this expression, if it is a regular expression (see
+        ``is_regular_expr``), null otherwise.
+        """
+    
+    @property
+    def p_check_expr_type(
+        self
+    ) -> TypeDecl:
+        """
+        Return the type of this expression. Assumes that this is a regular and
+        valid expression. If this is called on a non regular or non valid
+        expression, it will raise an error.
+        """
+    
+    @property
+    def p_expr_context_free_type(
+        self
+    ) -> TypeDecl:
+        """
+        If the type of this expression can be determined with no bottom up
+        context, return it. This will be used by `expr_type_impl`'s default
+        implementation.
+        """
+    
+    @property
+    def p_referenced_decl(
+        self
+    ) -> SemanticResult:
+        """
+        Return the declaration referenced by this expression, if applicable,
+        null otherwise.
+        """
+    
+    @property
+    def p_check_referenced_decl(
+        self
+    ) -> Decl:
+        """
+        Return the referenced decl of this expr, raise otherwise.
+        """
+
+
+
+
+
+
+
+class ArrayLiteral(Expr):
+    """
+    Literal for an array value.
+    """
+
+    
+
+    
+    @property
+    def f_exprs(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+
+
+
+
+
+
+
+class BinOp(Expr):
+    """
+    Binary operator expression.
+    """
+
+    
+
+    
+    @property
+    def f_left(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+    
+    @property
+    def f_op(
+        self
+    ) -> Op:
+        pass
+    
+    @property
+    def f_right(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+
+
+
+
+
+
+
+class BlockExpr(Expr):
+    """
+    Block expression.
+    """
+
+    
+
+    
+    @property
+    def f_val_defs(
+        self
+    ) -> LKNodeList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * ValDecl
+
+        * VarBind
+        """
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+
+
+
+
+
+
+
+class CallExpr(Expr):
+    """
+    Call expression.
+    """
+
+    
+
+    
+    @property
+    def f_name(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * Lit
+
+        * MatchExpr
+
+        * ParenExpr
+
+        * RefId
+        """
+    
+    @property
+    def f_args(
+        self
+    ) -> ParamList:
+        pass
+    
+    @property
+    def p_called_object_type(
+        self
+    ) -> TypeDecl:
+        """
+        Return the type of the called object.
+        """
+    
+    @property
+    def p_called_decl(
+        self
+    ) -> Decl:
+        """
+        Return the declaration that is called by this call expression.
+        """
+
+
+
+
+
+
+
+class NullCondCallExpr(CallExpr):
+    """
+    Null conditional call expression.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class CastExpr(Expr):
+    """
+    Cast expression.
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * Lit
+
+        * MatchExpr
+
+        * ParenExpr
+
+        * RefId
+        """
+    
+    @property
+    def f_excludes_null(
+        self
+    ) -> ExcludesNull:
+        pass
+    
+    @property
+    def f_dest_type(
+        self
+    ) -> TypeRef:
+        pass
+
+
+
+
+
+
+
+class DotExpr(Expr):
+    """
+    Dotted expression.
+    """
+
+    
+
+    
+    @property
+    def f_prefix(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * Lit
+
+        * MatchExpr
+
+        * ParenExpr
+
+        * RefId
+        """
+    
+    @property
+    def f_suffix(
+        self
+    ) -> RefId:
+        pass
+
+
+
+
+
+
+
+class NullCondDottedName(DotExpr):
+    """
+    Null conditional dotted expression.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class ErrorOnNull(Expr):
+    """
+    Expression that throws an error if LHS is null.
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * Lit
+
+        * MatchExpr
+
+        * ParenExpr
+
+        * RefId
+        """
+
+
+
+
+
+
+
+class GenericInstantiation(Expr):
+    """
+    Generic instantiation.
+    """
+
+    
+
+    
+    @property
+    def f_name(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * Lit
+
+        * MatchExpr
+
+        * ParenExpr
+
+        * RefId
+        """
+    
+    @property
+    def f_args(
+        self
+    ) -> TypeRefList:
+        pass
+    
+    @property
+    def p_instantiated_decl(
+        self
+    ) -> Decl:
+        """
+        Get the type designated by this instantiation.
+        """
+
+
+
+
+
+
+
+class GrammarExpr(Expr):
+    """
+    Base class for expressions related to grammars.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class GrammarCut(GrammarExpr):
+    """
+    Grammar expression for a cut.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class GrammarDiscard(GrammarExpr):
+    """
+    Grammar expression to discard the match.
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> GrammarExpr:
+        pass
+
+
+
+
+
+
+
+class GrammarDontSkip(GrammarExpr):
+    """
+    Grammar expression (error recovery) to ensure that any nested skip parser
+    calls won't skip certain parse results.
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> GrammarExpr:
+        pass
+    
+    @property
+    def f_dont_skip(
+        self
+    ) -> GrammarExpr:
+        pass
+
+
+
+
+
+
+
+class GrammarList(GrammarExpr):
+    """
+    Grammar expression to parse lists of results. Results can be separated by a
+    separator. List can be empty ('*') or not ('+').
+    """
+
+    
+
+    
+    @property
+    def f_list_type(
+        self
+    ) -> TypeRef:
+        pass
+    
+    @property
+    def f_kind(
+        self
+    ) -> ListKind:
+        pass
+    
+    @property
+    def f_expr(
+        self
+    ) -> GrammarExpr:
+        pass
+    
+    @property
+    def f_sep(
+        self
+    ) -> GrammarExpr:
+        pass
+
+
+
+
+
+
+
+class GrammarNull(GrammarExpr):
+    """
+    Grammar expression to parse a null node.
+    """
+
+    
+
+    
+    @property
+    def f_name(
+        self
+    ) -> TypeRef:
+        pass
+
+
+
+
+
+
+
+class GrammarOpt(GrammarExpr):
+    """
+    Grammar expression for an optional parsing result.
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> GrammarExpr:
+        pass
+
+
+
+
+
+
+
+class GrammarOptGroup(GrammarExpr):
+    """
+    Grammar expression for a group of optional parsing results.
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> GrammarExprList:
+        pass
+
+
+
+
+
+
+
+class GrammarOrExpr(GrammarExpr):
+    """
+    Grammar `Or` expression (disjunctive choice between several grammar
+    options).
+    """
+
+    
+
+    
+    @property
+    def f_sub_exprs(
+        self
+    ) -> GrammarExprListList:
+        pass
+
+
+
+
+
+
+
+class GrammarPick(GrammarExpr):
+    """
+    Grammar expression to pick the significant parse out of a list of parses
+    (will automatically discard token results).
+    """
+
+    
+
+    
+    @property
+    def f_exprs(
+        self
+    ) -> GrammarExprList:
+        pass
+
+
+
+
+
+
+
+class GrammarImplicitPick(GrammarPick):
+    """
+    Implicit pick operation.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class GrammarPredicate(GrammarExpr):
+    """
+    Grammar expression for a predicate: Only parse something if the predicate
+    (that is a reference to a node property) returns True.
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> GrammarExpr:
+        pass
+    
+    @property
+    def f_prop_ref(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * DotExpr
+
+        * RefId
+        """
+
+
+
+
+
+
+
+class GrammarRuleRef(GrammarExpr):
+    """
+    Grammar expression for a reference to another grammar rule.
+    """
+
+    
+
+    
+    @property
+    def f_node_name(
+        self
+    ) -> RefId:
+        pass
+
+
+
+
+
+
+
+class GrammarSkip(GrammarExpr):
+    """
+    Grammar expression (error recovery) to skip a parsing result.
+    """
+
+    
+
+    
+    @property
+    def f_name(
+        self
+    ) -> TypeRef:
+        pass
+
+
+
+
+
+
+
+class ParseNodeExpr(GrammarExpr):
+    """
+    Expression for the parsing of a Node.
+    """
+
+    
+
+    
+    @property
+    def f_node_name(
+        self
+    ) -> TypeRef:
+        pass
+    
+    @property
+    def f_sub_exprs(
+        self
+    ) -> GrammarExprList:
+        pass
+
+
+
+
+
+
+
+class TokenLit(GrammarExpr):
+    """
+    Grammar expression for a token literal.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class TokenNoCaseLit(GrammarExpr):
+    """
+    Grammar expression for a case insensitive token literal.
+    """
+
+    
+
+    
+    @property
+    def f_lit(
+        self
+    ) -> TokenLit:
+        pass
+
+
+
+
+
+
+
+class TokenPatternLit(GrammarExpr):
+    """
+    Grammar expression for a pattern literal.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class TokenRef(GrammarExpr):
+    """
+    Grammar expression for a token reference.
+    """
+
+    
+
+    
+    @property
+    def f_token_name(
+        self
+    ) -> RefId:
+        pass
+    
+    @property
+    def f_expr(
+        self
+    ) -> TokenLit:
+        pass
+
+
+
+
+
+
+
+class Id(Expr):
+    """
+    Identifier.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class DefId(Id):
+    """
+    Defining identifier.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class RefId(Id):
+    """
+    Reference identifier.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class ModuleRefId(RefId):
+    """
+    Id referencing a langkit module.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class IfExpr(Expr):
+    """
+    If expression.
+    """
+
+    
+
+    
+    @property
+    def f_cond_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+    
+    @property
+    def f_then_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+    
+    @property
+    def f_alternatives(
+        self
+    ) -> ElsifBranchList:
+        pass
+    
+    @property
+    def f_else_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+
+
+
+
+
+
+
+class Isa(Expr):
+    """
+    Isa expression.
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+    
+    @property
+    def f_dest_type(
+        self
+    ) -> TypeRefList:
+        pass
+
+
+
+
+
+
+
+class LambdaExpr(Expr):
+    """
+    Lambda expression.
+    """
+
+    
+
+    
+    @property
+    def f_params(
+        self
+    ) -> LambdaArgDeclList:
+        pass
+    
+    @property
+    def f_return_type(
+        self
+    ) -> TypeRef:
+        pass
+    
+    @property
+    def f_body(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+
+
+
+
+
+
+
+class Lit(Expr):
+    """
+    Base class for literals.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class CharLit(Lit):
+    """
+    Character literal expression.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class NullLit(Lit):
+    """
+    Null literal expression.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class NumLit(Lit):
+    """
+    Number literal expression.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class StringLit(Lit):
+    """
+    String literal expression.
+
+    Note that in order to reduce the size of the node type hierarchy, we define
+    only one node (StringLit) for all our string literals (only regular strings
+    and pattern string literals at the moment). This will also make it easy to
+    add new string prefixes in the future.
+    """
+
+    
+
+    
+    @property
+    def p_is_prefixed_string(
+        self
+    ) -> bool:
+        """
+        Return whether this string is prefixed or not.
+        """
+    
+    @property
+    def p_prefix(
+        self
+    ) -> str:
+        """
+        Return the prefix of this string, or the null character if there is no
+        prefix.
+        """
+    
+    @property
+    def p_denoted_value(
+        self
+    ) -> str:
+        """
+        Return the content of the given string literal node.
+        """
+    
+    @property
+    def p_is_regexp_literal(
+        self
+    ) -> bool:
+        """
+        Return whether this string literal is actually a regexp literal, by
+        checking that this string is prefixed by 'p'.
+        """
+
+
+
+
+
+
+
+class LogicExpr(Expr):
+    """
+    Class for logic expressions (any ``basic_expr`` starting with %).
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * Lit
+
+        * MatchExpr
+
+        * ParenExpr
+
+        * RefId
+        """
+
+
+
+
+
+
+
+class MatchExpr(Expr):
+    """
+    Binary operator expression.
+    """
+
+    
+
+    
+    @property
+    def f_match_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+    
+    @property
+    def f_branches(
+        self
+    ) -> MatchBranchList:
+        pass
+
+
+
+
+
+
+
+class NotExpr(Expr):
+    """
+    Boolean negation expression.
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+
+
+
+
+
+
+
+class ParenExpr(Expr):
+    """
+    Parenthesized expression.
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+
+
+
+
+
+
+
+class RaiseExpr(Expr):
+    """
+    Raise expression.
+    """
+
+    
+
+    
+    @property
+    def f_except_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+
+
+
+
+
+
+
+class TryExpr(Expr):
+    """
+    Try expression.
+    """
+
+    
+
+    
+    @property
+    def f_try_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+    
+    @property
+    def f_or_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+
+
+
+
+
+
+
+class FullDecl(LKNode):
+    """
+    Container for an lkt declaration. Contains the decl node plus the
+    documentation and annotations.
+    """
+
+    
+
+    
+    @property
+    def f_doc(
+        self
+    ) -> Doc:
+        pass
+    
+    @property
+    def f_decl_annotations(
+        self
+    ) -> DeclAnnotationList:
+        pass
+    
+    @property
+    def f_decl(
+        self
+    ) -> Decl:
+        """
+        This field can contain one of the following nodes:
+
+        * BaseGrammarDecl
+
+        * FieldDecl
+
+        * FunDecl
+
+        * GenericDecl
+
+        * GenericFormalTypeDecl
+
+        * GrammarRuleDecl
+
+        * LexerDecl
+
+        * LexerFamilyDecl
+
+        * NamedTypeDecl
+
+        * ValDecl
+        """
+
+
+
+
+
+
+
+class Import(LKNode):
+    """
+    Statement to import another source file.
+    """
+
+    
+
+    
+    @property
+    def f_name(
+        self
+    ) -> ModuleRefId:
+        pass
+    
+    @property
+    def p_referenced_unit(
+        self
+    ) -> AnalysisUnit:
+        """
+        Return the unit that this import statements designates. Load it if
+        needed.
+        """
+
+
+
+
+
+
+
+class LKNodeBaseList(LKNode):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class BaseLexerCaseRuleAltList(LKNodeBaseList):
+    """
+    List of BaseLexerCaseRuleAlt.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[BaseLexerCaseRuleAlt]: ...
+    def __getitem__(self,
+                    index: int) -> BaseLexerCaseRuleAlt: ...
+
+
+
+
+
+
+class DeclAnnotationList(LKNodeBaseList):
+    """
+    List of DeclAnnotation.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[DeclAnnotation]: ...
+    def __getitem__(self,
+                    index: int) -> DeclAnnotation: ...
+
+
+
+
+
+
+class DocCommentList(LKNodeBaseList):
+    """
+    List of DocComment.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[DocComment]: ...
+    def __getitem__(self,
+                    index: int) -> DocComment: ...
+
+
+
+
+
+
+class ElsifBranchList(LKNodeBaseList):
+    """
+    List of ElsifBranch.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[ElsifBranch]: ...
+    def __getitem__(self,
+                    index: int) -> ElsifBranch: ...
+
+
+
+
+
+
+class EnumClassAltDeclList(LKNodeBaseList):
+    """
+    List of EnumClassAltDecl.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[EnumClassAltDecl]: ...
+    def __getitem__(self,
+                    index: int) -> EnumClassAltDecl: ...
+
+
+
+
+
+
+class EnumClassCaseList(LKNodeBaseList):
+    """
+    List of EnumClassCase.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[EnumClassCase]: ...
+    def __getitem__(self,
+                    index: int) -> EnumClassCase: ...
+
+
+
+
+
+
+class EnumLitDeclList(LKNodeBaseList):
+    """
+    List of EnumLitDecl.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[EnumLitDecl]: ...
+    def __getitem__(self,
+                    index: int) -> EnumLitDecl: ...
+
+
+
+
+
+
+class ExprList(LKNodeBaseList):
+    """
+    List of Expr.
+
+    This list node can contain one of the following nodes:
+
+    * ArrayLiteral
+
+    * BinOp
+
+    * BlockExpr
+
+    * CallExpr
+
+    * CastExpr
+
+    * DotExpr
+
+    * ErrorOnNull
+
+    * GenericInstantiation
+
+    * IfExpr
+
+    * Isa
+
+    * LambdaExpr
+
+    * Lit
+
+    * LogicExpr
+
+    * MatchExpr
+
+    * NotExpr
+
+    * ParenExpr
+
+    * RaiseExpr
+
+    * RefId
+
+    * TryExpr
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[Expr]: ...
+    def __getitem__(self,
+                    index: int) -> Expr: ...
+
+
+
+
+
+
+class FullDeclList(LKNodeBaseList):
+    """
+    List of FullDecl.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[FullDecl]: ...
+    def __getitem__(self,
+                    index: int) -> FullDecl: ...
+
+
+
+
+
+
+class DeclBlock(FullDeclList):
+    """
+    List of declarations that also introduces a containing lexical scope.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[FullDecl]: ...
+    def __getitem__(self,
+                    index: int) -> FullDecl: ...
+
+
+
+
+
+
+class FunArgDeclList(LKNodeBaseList):
+    """
+    List of FunArgDecl.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[FunArgDecl]: ...
+    def __getitem__(self,
+                    index: int) -> FunArgDecl: ...
+
+
+
+
+
+
+class GrammarExprList(LKNodeBaseList):
+    """
+    List of GrammarExpr.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[GrammarExpr]: ...
+    def __getitem__(self,
+                    index: int) -> GrammarExpr: ...
+
+
+
+
+
+
+class GrammarExprListList(LKNodeBaseList):
+    """
+    List of GrammarExpr.list.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[GrammarExprList]: ...
+    def __getitem__(self,
+                    index: int) -> GrammarExprList: ...
+
+
+
+
+
+
+class ImportList(LKNodeBaseList):
+    """
+    List of Import.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[Import]: ...
+    def __getitem__(self,
+                    index: int) -> Import: ...
+
+
+
+
+
+
+class LKNodeList(LKNodeBaseList):
+    """
+    List of LKNode.
+
+    This list node can contain one of the following nodes:
+
+    * FullDecl
+
+    * LexerCaseRule
+
+    * ValDecl
+
+    * VarBind
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[LKNode]: ...
+    def __getitem__(self,
+                    index: int) -> LKNode: ...
+
+
+
+
+
+
+class LambdaArgDeclList(LKNodeBaseList):
+    """
+    List of LambdaArgDecl.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[LambdaArgDecl]: ...
+    def __getitem__(self,
+                    index: int) -> LambdaArgDecl: ...
+
+
+
+
+
+
+class MatchBranchList(LKNodeBaseList):
+    """
+    List of MatchBranch.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[MatchBranch]: ...
+    def __getitem__(self,
+                    index: int) -> MatchBranch: ...
+
+
+
+
+
+
+class ParamList(LKNodeBaseList):
+    """
+    List of Param.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[Param]: ...
+    def __getitem__(self,
+                    index: int) -> Param: ...
+
+
+
+
+
+
+class RefIdList(LKNodeBaseList):
+    """
+    List of RefId.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[RefId]: ...
+    def __getitem__(self,
+                    index: int) -> RefId: ...
+
+
+
+
+
+
+class TypeRefList(LKNodeBaseList):
+    """
+    List of TypeRef.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[TypeRef]: ...
+    def __getitem__(self,
+                    index: int) -> TypeRef: ...
+
+
+
+
+
+
+class LangkitRoot(LKNode):
+    """
+    For the moment, root node of a lkt compilation unit.
+    """
+
+    
+
+    
+    @property
+    def f_imports(
+        self
+    ) -> ImportList:
+        pass
+    
+    @property
+    def f_decls(
+        self
+    ) -> FullDeclList:
+        pass
+    
+    @property
+    def p_check_legality(
+        self
+    ) -> List[SemanticResult]:
+        """
+        Run all legality checks on this tree. Return a list of diagnostics (For
+        the moment, pending on real discriminated records, SemanticResults
+        which necessarily have an error_message).
+        """
+
+
+
+
+
+
+
+class LexerCaseRule(LKNode):
+    """
+    Lexer construct to introduce a conditional lexing action.
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> GrammarExpr:
+        """
+        This field can contain one of the following nodes:
+
+        * GrammarCut
+
+        * GrammarDiscard
+
+        * GrammarList
+
+        * GrammarNull
+
+        * GrammarOpt
+
+        * GrammarOptGroup
+
+        * GrammarOrExpr
+
+        * GrammarPick
+
+        * GrammarRuleRef
+
+        * GrammarSkip
+
+        * ParseNodeExpr
+
+        * TokenLit
+
+        * TokenNoCaseLit
+
+        * TokenPatternLit
+
+        * TokenRef
+        """
+    
+    @property
+    def f_alts(
+        self
+    ) -> BaseLexerCaseRuleAltList:
+        pass
+
+
+
+
+
+
+
+class LexerCaseRuleSend(LKNode):
+    """
+    Lexer construction used by case alternatives to represent the token to send
+    if that alternative was chosen.
+    """
+
+    
+
+    
+    @property
+    def f_sent(
+        self
+    ) -> RefId:
+        pass
+    
+    @property
+    def f_match_size(
+        self
+    ) -> NumLit:
+        pass
+
+
+
+
+
+
+
+class ListKind(LKNode):
+    """
+    Kind for list parser expressions.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class ListKindOne(ListKind):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class ListKindZero(ListKind):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class MatchBranch(LKNode):
+    """
+    Branch inside a match expression.
+    """
+
+    
+
+    
+    @property
+    def f_decl(
+        self
+    ) -> MatchValDecl:
+        pass
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+
+
+
+
+
+
+
+class Op(LKNode):
+    """
+    Operator in a binary operator expression.
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class OpAmp(Op):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class OpAnd(Op):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class OpDiv(Op):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class OpEq(Op):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class OpGt(Op):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class OpGte(Op):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class OpLt(Op):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class OpLte(Op):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class OpMinus(Op):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class OpMult(Op):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class OpOr(Op):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class OpPlus(Op):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class Param(LKNode):
+    """
+    Parameter for function calls or for annotations.
+    """
+
+    
+
+    
+    @property
+    def f_name(
+        self
+    ) -> RefId:
+        pass
+    
+    @property
+    def f_value(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+
+
+
+
+
+
+
+class TypeRef(LKNode):
+    """
+    Base class for a reference to a type.
+    """
+
+    
+
+    
+    @property
+    def p_designated_type(
+        self
+    ) -> TypeDecl:
+        """
+        Return the type designated by this type ref.
+        """
+
+
+
+
+
+
+
+class FunctionTypeRef(TypeRef):
+    """
+    Reference to a function type.
+    """
+
+    
+
+    
+    @property
+    def f_args_types(
+        self
+    ) -> TypeRefList:
+        pass
+    
+    @property
+    def f_return_type(
+        self
+    ) -> TypeRef:
+        pass
+
+
+
+
+
+
+
+class GenericTypeRef(TypeRef):
+    """
+    Reference to a generic type.
+    """
+
+    
+
+    
+    @property
+    def f_type_name(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * DotExpr
+
+        * RefId
+        """
+    
+    @property
+    def f_params(
+        self
+    ) -> TypeRefList:
+        pass
+
+
+
+
+
+
+
+class SimpleTypeRef(TypeRef):
+    """
+    Simple reference to a type.
+    """
+
+    
+
+    
+    @property
+    def f_type_name(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * DotExpr
+
+        * RefId
+        """
+
+
+
+
+
+
+
+class VarBind(LKNode):
+    """
+    Dynamic var bind expression.
+    """
+
+    
+
+    
+    @property
+    def f_name(
+        self
+    ) -> RefId:
+        pass
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArrayLiteral
+
+        * BinOp
+
+        * BlockExpr
+
+        * CallExpr
+
+        * CastExpr
+
+        * DotExpr
+
+        * ErrorOnNull
+
+        * GenericInstantiation
+
+        * IfExpr
+
+        * Isa
+
+        * LambdaExpr
+
+        * Lit
+
+        * LogicExpr
+
+        * MatchExpr
+
+        * NotExpr
+
+        * ParenExpr
+
+        * RaiseExpr
+
+        * RefId
+
+        * TryExpr
+        """
+
+
+
+
+
+
+
+
+
+
+class SemanticResult(object):
+    """
+    Result for a call to a semantic property that can return an error.
+
+    In every case, the node field will be populated with the node upon which
+    the request was made. Then, the result can be either:
+
+    * ``result_type`` if the property was a type returning property.
+
+    * ``result_ref`` if the property was a reference returning property
+
+    * ``error_message`` if an error was found as part of the resolution
+    process.
+
+    Only one of those fields can have a value.
+
+    If all fields are null, it means that ``expr_type`` has been called on a
+    non regular expression.
+
+    TODO: Turn this into a real variant record when we have variants.
+    """
+
+    def __init__(
+        self,
+        node: LKNode,
+        result_type: TypeDecl,
+        result_ref: Decl,
+        has_error: bool,
+        error_message: str,
+        exempt_analysis: bool,
+    ) -> None: ...
+
+    @property
+    def node(self) -> LKNode:
+        pass
+    @property
+    def result_type(self) -> TypeDecl:
+        pass
+    @property
+    def result_ref(self) -> Decl:
+        pass
+    @property
+    def has_error(self) -> bool:
+        pass
+    @property
+    def error_message(self) -> str:
+        pass
+    @property
+    def exempt_analysis(self) -> bool:
+        """
+        Internal value. Used to skip analysis of some nodes
+        """
+
+
+
+
+class TreeSemanticResult(object):
+    """
+    Collection of semantic results for a subtree. This will carry both:
+
+    * An array of semantic results for all of the subtree's nodes.
+
+    * A flag indicating whether the subtree contained errors or not.
+    """
+
+    def __init__(
+        self,
+        results: List[SemanticResult],
+        has_error: bool,
+    ) -> None: ...
+
+    @property
+    def results(self) -> List[SemanticResult]:
+        pass
+    @property
+    def has_error(self) -> bool:
+        pass
+
+
+
+
+
+
+
+
+class NodeTree(object):
+    """
+    Flat representation of a tree of nodes, as computed by the
+    ``LKNode.export_tree`` method.
+
+    Nodes are stored in prefix depth-first order, so the root node comes first,
+    and the children of each node come right after it. Null children are
+    skipped. Node data is available as columns: for each column attribute, the
+    Nth item contains the corresponding data for the Nth node. Columns are
+    memoryview objects that reference native memory without copying it, so they
+    can be used in vectorized processing (for instance with
+    ``numpy.frombuffer``). Columns are:
+
+    * ``kinds``: integer kind for each node (see ``LKNode.kind_name``).
+
+    * ``parents``: index of the parent node (-1 for the root node).
+
+    * ``children_counts``: number of non-null children.
+
+    * ``token_starts``/``token_ends``: indexes of the first and last tokens for
+    each node. Token end is 0 for ghost nodes.
+
+    * ``start_lines``/``start_columns``/``end_lines``/``end_columns``: source
+    location ranges for each node.
+    """
+
+    kinds: memoryview
+    parents: memoryview
+    children_counts: memoryview
+    token_starts: memoryview
+    token_ends: memoryview
+    start_lines: memoryview
+    start_columns: memoryview
+    end_lines: memoryview
+    end_columns: memoryview
+
+    def __init__(self, root: LKNode, c_value: Any) -> None: ...
+    def __len__(self) -> int: ...
+
+    def node(self, index: int) -> LKNode:
+        """
+        Return the node at the given index in this tree.
+
+        :param int index: Index of the node to return. :rtype: LKNode
+        """
+
+    def kind_name(self, index: int) -> str:
+        """
+        Return the kind name for the node at the given index in this tree.
+
+        :param int index: Index of the node. :rtype: str
+        """
+
+
+class TokenTable(object):
+    """
+    Columnar representation of the stream of tokens and trivia in an analysis
+    unit, as computed by the ``AnalysisUnit.token_table`` method.
+
+    Tokens and trivia are stored in the same order as in the source. Token data
+    is available as columns: for each column attribute, the Nth item contains
+    the corresponding data for the Nth token or trivia. Columns are memoryview
+    objects that reference native memory without copying it, so they can be
+    used in vectorized processing (for instance with ``numpy.frombuffer``).
+    Columns are:
+
+    * ``kinds``: integer kind for each token (see ``kind_name``).
+
+    * ``start_offsets``/``end_offsets``: 0-based indexes in the unit text of
+    the first character of each token and of the character that follows the
+    last one.
+
+    * ``start_lines``/``start_columns``/``end_lines``/``end_columns``: source
+    location ranges for each token.
+
+    * ``is_trivia``: 1 for trivia, 0 for regular tokens.
+    """
+
+    kinds: memoryview
+    start_offsets: memoryview
+    end_offsets: memoryview
+    start_lines: memoryview
+    end_lines: memoryview
+    start_columns: memoryview
+    end_columns: memoryview
+    is_trivia: memoryview
+
+    def __init__(self, unit: AnalysisUnit, c_value: Any) -> None: ...
+    def __len__(self) -> int: ...
+
+    def kind_name(self, index: int) -> str:
+        """
+        Return the kind name for the token at the given index in this table.
+
+        :param int index: Index of the token. :rtype: str
+        """
+
+
+def use_lazy_arrays(enabled: bool = True) -> None:
+    """
+    Enable or disable lazy arrays.
+
+    By default, arrays that properties return are converted to lists, which
+    requires to convert all their items upfront. When lazy arrays are enabled,
+    they are converted to sequences instead: these keep a reference to the
+    native array and convert items only when they are accessed. They support
+    ``len``, indexing, slicing (which returns a list) and iteration. Arrays of
+    integers, booleans and enumerations can also be viewed as memoryview
+    objects without copying them (see ``as_memoryview``).
+
+    Like nodes, lazy arrays of nodes become stale when one of the units that
+    own their nodes is reparsed: accessing their items then raises a
+    ``StaleReferenceError``. Arrays of other values that contain nodes
+    (structures, for instance) are always converted upfront.
+
+    :param bool enabled: Whether to enable lazy arrays.
+    """
+
+
+class App(object):
+    parser: argparse.ArgumentParser
+    args: argparse.Namespace
+    u: AnalysisUnit
+    units: Dict[str, AnalysisUnit]
+    ctx: AnalysisContext
+
+    @property
+    def description(self) -> str: ...
+
+    def __init__(self) -> None: ...
+    def add_arguments(self) -> None: ...
+    def create_unit_provider(self) -> Opt[UnitProvider]: ...
+    def process_files(self) -> None: ...
+
+    @classmethod
+    def run(cls) -> None: ...
+
+    
+
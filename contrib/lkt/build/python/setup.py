@@ -0,0 +1,16 @@
+
+from setuptools import setup, find_packages
+
+
+
+
+setup(
+    name='Liblktlang',
+    version='0.1',
+    packages=['liblktlang'],
+    package_data={
+        'liblktlang':
+            ['*.{}'.format(ext) for ext in ('dll', 'so', 'so.*', 'dylib')],
+    },
+    zip_safe=False,
+)
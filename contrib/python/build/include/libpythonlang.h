@@ -0,0 +1,7561 @@
+
+
+
+
+
+
+
+
+#ifndef LIBPYTHONLANG
+#define LIBPYTHONLANG
+
+#include <stdint.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* This type represents a context for all source analysis. This is the first
+   type you need to create to use libpythonlang. It will contain the results of
+   all analysis, and is the main holder for all the data.
+
+   You can create several analysis contexts if you need to, which enables you,
+   for example to:
+
+   * analyze several different projects at the same time;
+
+   * analyze different parts of the same projects in parallel.
+
+   In the current design, contexts always keep all of their analysis units
+   allocated. If you need to get this memory released, the only option at your
+   disposal is to destroy your analysis context instance.
+
+   This structure is partially opaque: some fields are exposed to allow direct
+   access, for performance concerns.  */
+typedef struct
+{
+   uint64_t serial_number;
+} *python_analysis_context;
+
+/* This type represents the analysis of a single file.
+
+   This type has strong-reference semantics and is ref-counted. Furthermore, a
+   reference to a unit contains an implicit reference to the context that owns
+   it. This means that keeping a reference to a unit will keep the context and
+   all the unit it contains allocated.
+
+   This structure is partially opaque: some fields are exposed to allow direct
+   access, for performance concerns.  */
+typedef struct
+{
+   uint64_t version_number;
+} *python_analysis_unit;
+
+/* Data type for all nodes. Nodes are assembled to make up a tree.  See the
+   node primitives below to inspect such trees.
+
+   Unlike for contexts and units, this type has weak-reference semantics:
+   keeping a reference to a node has no effect on the decision to keep the unit
+   that it owns allocated. This means that once all references to the context
+   and units related to a node are dropped, the context and its units are
+   deallocated and the node becomes a stale reference: most operations on it
+   will raise a ``Stale_Reference_Error``.
+
+   Note that since reparsing an analysis unit deallocates all the nodes it
+   contains, this operation makes all reference to these nodes stale as
+   well.   */
+typedef void* python_base_node;
+
+/* Kind of AST nodes in parse trees.  */
+typedef enum {
+    
+
+        /* python_node (abstract)  */
+        
+    
+
+        /* arg (abstract)  */
+        
+    
+
+        
+        python_arg_assoc = 1,
+    
+
+        
+        python_arg_gen = 2,
+    
+
+        
+        python_kw_args = 3,
+    
+
+        
+        python_var_args = 4,
+    
+
+        
+        python_as_name_node = 5,
+    
+
+        
+        python_comp_if = 6,
+    
+
+        /* comp_op_kind (abstract)  */
+        
+    
+
+        
+        python_comp_op_kind_diamond = 7,
+    
+
+        
+        python_comp_op_kind_eq = 8,
+    
+
+        
+        python_comp_op_kind_gt = 9,
+    
+
+        
+        python_comp_op_kind_gte = 10,
+    
+
+        
+        python_comp_op_kind_in = 11,
+    
+
+        
+        python_comp_op_kind_is = 12,
+    
+
+        
+        python_comp_op_kind_isnot = 13,
+    
+
+        
+        python_comp_op_kind_lt = 14,
+    
+
+        
+        python_comp_op_kind_lte = 15,
+    
+
+        
+        python_comp_op_kind_noteq = 16,
+    
+
+        
+        python_comp_op_kind_notin = 17,
+    
+
+        /* comprehension (abstract)  */
+        
+    
+
+        
+        python_comp_for = 18,
+    
+
+        
+        python_comp_forl = 19,
+    
+
+        
+        python_decorator = 20,
+    
+
+        
+        python_dict_assoc = 21,
+    
+
+        
+        python_else_part = 22,
+    
+
+        
+        python_except_part = 23,
+    
+
+        /* expr (abstract)  */
+        
+    
+
+        
+        python_and_expr = 24,
+    
+
+        
+        python_and_op = 25,
+    
+
+        /* bin_op (abstract)  */
+        
+    
+
+        
+        python_arith_expr = 26,
+    
+
+        
+        python_shift_expr = 27,
+    
+
+        
+        python_term = 28,
+    
+
+        
+        python_call_expr = 29,
+    
+
+        
+        python_comp_op = 30,
+    
+
+        
+        python_concat_string_lit = 31,
+    
+
+        
+        python_dict_comp = 32,
+    
+
+        
+        python_dict_lit = 33,
+    
+
+        
+        python_dot = 34,
+    
+
+        
+        python_ellipsis_expr = 35,
+    
+
+        
+        python_factor = 36,
+    
+
+        
+        python_if_expr = 37,
+    
+
+        
+        python_inline_eval = 38,
+    
+
+        
+        python_lambda_def = 39,
+    
+
+        
+        python_list_comp = 40,
+    
+
+        
+        python_list_gen = 41,
+    
+
+        
+        python_list_lit = 42,
+    
+
+        /* name (abstract)  */
+        
+    
+
+        
+        python_dotted_name = 43,
+    
+
+        
+        python_id = 44,
+    
+
+        
+        python_not_op = 45,
+    
+
+        
+        python_number_lit = 46,
+    
+
+        
+        python_or_expr = 47,
+    
+
+        
+        python_or_op = 48,
+    
+
+        
+        python_power = 49,
+    
+
+        
+        python_set_comp = 50,
+    
+
+        
+        python_set_lit = 51,
+    
+
+        
+        python_slice_expr = 52,
+    
+
+        
+        python_ext_slice_expr = 53,
+    
+
+        
+        python_string_lit = 54,
+    
+
+        
+        python_subscript_expr = 55,
+    
+
+        
+        python_tuple_lit = 56,
+    
+
+        
+        python_xor_expr = 57,
+    
+
+        
+        python_yield_expr = 58,
+    
+
+        
+        python_file_node = 59,
+    
+
+        
+        python_import_star = 60,
+    
+
+        /* kw_args_flag (abstract)  */
+        
+    
+
+        
+        python_kw_args_flag_absent = 61,
+    
+
+        
+        python_kw_args_flag_present = 62,
+    
+
+        
+        python_nl = 63,
+    
+
+        
+        python_op = 64,
+    
+
+        
+        python_params = 65,
+    
+
+        /* python_node_base_list (abstract)  */
+        
+    
+
+        /* List of Arg.  */
+        python_arg_list = 66,
+    
+
+        /* List of AsNameNode.  */
+        python_as_name_node_list = 67,
+    
+
+        /* List of Decorator.  */
+        python_decorator_list = 68,
+    
+
+        /* List of DictAssoc.  */
+        python_dict_assoc_list = 69,
+    
+
+        /* List of Dot.  */
+        python_dot_list = 70,
+    
+
+        /* List of ElifBranch.  */
+        python_elif_branch_list = 71,
+    
+
+        /* List of ExceptPart.  */
+        python_except_part_list = 72,
+    
+
+        /* List of Expr.
+        
+           This list node can contain one of the following nodes:
+        
+           * python_and_expr
+        
+           * python_and_op
+        
+           * python_bin_op
+        
+           * python_call_expr
+        
+           * python_comp_op
+        
+           * python_concat_string_lit
+        
+           * python_dict_comp
+        
+           * python_dict_lit
+        
+           * python_ellipsis_expr
+        
+           * python_factor
+        
+           * python_if_expr
+        
+           * python_inline_eval
+        
+           * python_lambda_def
+        
+           * python_list_comp
+        
+           * python_list_gen
+        
+           * python_list_lit
+        
+           * python_name
+        
+           * python_not_op
+        
+           * python_number_lit
+        
+           * python_or_expr
+        
+           * python_or_op
+        
+           * python_power
+        
+           * python_set_comp
+        
+           * python_set_lit
+        
+           * python_slice_expr
+        
+           * python_string_lit
+        
+           * python_subscript_expr
+        
+           * python_tuple_lit
+        
+           * python_xor_expr
+        
+           * python_yield_expr  */
+        python_expr_list = 73,
+    
+
+        /* List of Id.  */
+        python_id_list = 74,
+    
+
+        /* List of NL.  */
+        python_nl_list = 75,
+    
+
+        /* List of PythonNode.
+        
+           This list node can contain one of the following nodes:
+        
+           * python_as_name_node
+        
+           * python_assert_stmt
+        
+           * python_assign_stmt
+        
+           * python_aug_assign_stmt
+        
+           * python_break_stmt
+        
+           * python_continue_stmt
+        
+           * python_decorated
+        
+           * python_def_stmt
+        
+           * python_del_stmt
+        
+           * python_exec_stmt
+        
+           * python_expr_list
+        
+           * python_for_stmt
+        
+           * python_global_stmt
+        
+           * python_if_stmt
+        
+           * python_import_from
+        
+           * python_import_name
+        
+           * python_name
+        
+           * python_pass_stmt
+        
+           * python_print_stmt
+        
+           * python_python_node_list
+        
+           * python_raise_stmt
+        
+           * python_return_stmt
+        
+           * python_stream_print_stmt
+        
+           * python_try_stmt
+        
+           * python_while_stmt
+        
+           * python_with_stmt
+        
+           * python_yield_expr  */
+        python_python_node_list = 76,
+    
+
+        /* List of SingleParam.  */
+        python_single_param_list = 77,
+    
+
+        /* List of StringLit.  */
+        python_string_lit_list = 78,
+    
+
+        
+        python_rel_name = 79,
+    
+
+        
+        python_single_param = 80,
+    
+
+        /* stmt (abstract)  */
+        
+    
+
+        
+        python_assert_stmt = 81,
+    
+
+        
+        python_assign_stmt = 82,
+    
+
+        
+        python_aug_assign_stmt = 83,
+    
+
+        
+        python_break_stmt = 84,
+    
+
+        
+        python_continue_stmt = 85,
+    
+
+        
+        python_decorated = 86,
+    
+
+        /* def_stmt (abstract)  */
+        
+    
+
+        
+        python_class_def = 87,
+    
+
+        
+        python_func_def = 88,
+    
+
+        
+        python_del_stmt = 89,
+    
+
+        
+        python_elif_branch = 90,
+    
+
+        
+        python_exec_stmt = 91,
+    
+
+        
+        python_for_stmt = 92,
+    
+
+        
+        python_global_stmt = 93,
+    
+
+        
+        python_if_stmt = 94,
+    
+
+        
+        python_import_from = 95,
+    
+
+        
+        python_import_name = 96,
+    
+
+        
+        python_pass_stmt = 97,
+    
+
+        
+        python_print_stmt = 98,
+    
+
+        
+        python_raise_stmt = 99,
+    
+
+        
+        python_return_stmt = 100,
+    
+
+        
+        python_stream_print_stmt = 101,
+    
+
+        
+        python_try_stmt = 102,
+    
+
+        
+        python_while_stmt = 103,
+    
+
+        
+        python_with_stmt = 104,
+    
+
+        /* var_args_flag (abstract)  */
+        
+    
+
+        
+        python_var_args_flag_absent = 105,
+    
+
+        
+        python_var_args_flag_present = 106,
+} python_node_kind_enum;
+
+/* Reference to a symbol. Symbols are owned by analysis contexts, so they must
+   not outlive them. This type exists only in the C API, and roughly wraps the
+   corresponding Ada type (an array fat pointer).  */
+typedef struct {
+   void *data;
+   void *bounds;
+} python_symbol_type;
+
+/* Data type for env rebindings. For internal use only.  */
+typedef void *python_env_rebindings_type;
+
+typedef uint8_t python_bool;
+
+/* Helper data structures for source location handling.  */
+
+/* Location in a source file. Line and column numbers are one-based.  */
+typedef struct {
+    uint32_t line;
+    uint16_t column;
+} python_source_location;
+
+/* Location of a span of text in a source file.  */
+typedef struct {
+    python_source_location start;
+    python_source_location end;
+} python_source_location_range;
+
+
+/* String encoded in UTF-32 (native endianness).  */
+typedef struct {
+   /* Address for the content of the string.  */
+    uint32_t *chars;
+   /* Size of the string (in characters).  */
+    size_t length;
+
+    int is_allocated;
+} python_text;
+
+/* Arbitrarily large integer.  */
+typedef void *python_big_integer;
+
+/* Kind for this token.  */
+typedef enum {
+   
+      
+      PYTHON_TERMINATION = 0
+      ,
+      PYTHON_LEXING_FAILURE = 1
+      ,
+      PYTHON_RSH_ASSIGN = 2
+      ,
+      PYTHON_IS = 3
+      ,
+      PYTHON_EQUALS = 4
+      ,
+      PYTHON_DEF = 5
+      ,
+      PYTHON_LTE = 6
+      ,
+      PYTHON_RAISE = 7
+      ,
+      PYTHON_MOD = 8
+      ,
+      PYTHON_YIELD = 9
+      ,
+      PYTHON_XOR_ASSIGN = 10
+      ,
+      PYTHON_AS = 11
+      ,
+      PYTHON_LAMBDA = 12
+      ,
+      PYTHON_BACKTICK = 13
+      ,
+      PYTHON_TRY = 14
+      ,
+      PYTHON_DIVIDE = 15
+      ,
+      PYTHON_INVERT = 16
+      ,
+      PYTHON_RETURN = 17
+      ,
+      PYTHON_ASSERT = 18
+      ,
+      PYTHON_XOR = 19
+      ,
+      PYTHON_BREAK = 20
+      ,
+      PYTHON_RBRACK = 21
+      ,
+      PYTHON_POWER_ASSIGN = 22
+      ,
+      PYTHON_IMPORT = 23
+      ,
+      PYTHON_EXEC = 24
+      ,
+      PYTHON_COMMA = 25
+      ,
+      PYTHON_L_PAR = 26
+      ,
+      PYTHON_DOT = 27
+      ,
+      PYTHON_GTE = 28
+      ,
+      PYTHON_FLOORDIV_ASSIGN = 29
+      ,
+      PYTHON_MULTIPLY = 30
+      ,
+      PYTHON_DIV_ASSIGN = 31
+      ,
+      PYTHON_AT = 32
+      ,
+      PYTHON_ASSIGN = 33
+      ,
+      PYTHON_FLOORDIV = 34
+      ,
+      PYTHON_NOTEQUAL = 35
+      ,
+      PYTHON_MULT_ASSIGN = 36
+      ,
+      PYTHON_MOD_ASSIGN = 37
+      ,
+      PYTHON_GT = 38
+      ,
+      PYTHON_POWER = 39
+      ,
+      PYTHON_AMP = 40
+      ,
+      PYTHON_NOT = 41
+      ,
+      PYTHON_COLON = 42
+      ,
+      PYTHON_DIAMOND = 43
+      ,
+      PYTHON_IN = 44
+      ,
+      PYTHON_L_CURL = 45
+      ,
+      PYTHON_CLASS = 46
+      ,
+      PYTHON_OR_ASSIGN = 47
+      ,
+      PYTHON_ELIF = 48
+      ,
+      PYTHON_AND = 49
+      ,
+      PYTHON_SEMICOLON = 50
+      ,
+      PYTHON_ADD_ASIGN = 51
+      ,
+      PYTHON_PRINT = 52
+      ,
+      PYTHON_LSH = 53
+      ,
+      PYTHON_CONTINUE = 54
+      ,
+      PYTHON_WHILE = 55
+      ,
+      PYTHON_EXCEPT = 56
+      ,
+      PYTHON_IF = 57
+      ,
+      PYTHON_ELSE = 58
+      ,
+      PYTHON_DEL = 59
+      ,
+      PYTHON_MINUS_ASSIGN = 60
+      ,
+      PYTHON_OR = 61
+      ,
+      PYTHON_MINUS = 62
+      ,
+      PYTHON_LBRACK = 63
+      ,
+      PYTHON_AND_ASSIGN = 64
+      ,
+      PYTHON_R_PAR = 65
+      ,
+      PYTHON_GLOBAL = 66
+      ,
+      PYTHON_FOR = 67
+      ,
+      PYTHON_FROM = 68
+      ,
+      PYTHON_RSH = 69
+      ,
+      PYTHON_FINALLY = 70
+      ,
+      PYTHON_PASS = 71
+      ,
+      PYTHON_LSH_ASSIGN = 72
+      ,
+      PYTHON_BIN_OR = 73
+      ,
+      PYTHON_RCURL = 74
+      ,
+      PYTHON_WITH = 75
+      ,
+      PYTHON_PLUS = 76
+      ,
+      PYTHON_LT = 77
+      ,
+      PYTHON_NUMBER = 78
+      ,
+      PYTHON_STRING = 79
+      ,
+      PYTHON_COMMENT = 80
+      ,
+      PYTHON_IDENTIFIER = 81
+      ,
+      PYTHON_INDENT = 82
+      ,
+      PYTHON_DEDENT = 83
+      ,
+      PYTHON_NEWLINE = 84
+} python_token_kind;
+
+/* Reference to a token in an analysis unit.  */
+typedef struct {
+    /* Private data associated to this token or NULL if this designates no
+       token.  */
+    void *token_data;
+
+    /* Internal identifiers for this token.  */
+    int token_index, trivia_index;
+
+    python_token_kind kind;
+    python_text text;
+    python_source_location_range sloc_range;
+} python_token;
+
+
+/* Flat representation of a tree of nodes, as computed by
+   ``python_node_export_tree``.
+
+   Nodes are stored in prefix depth-first order, so the root node comes first,
+   and the children of each node come right after it. Null children are
+   skipped. Node data is stored in columns: for each field of this structure
+   (except ``count``), the Nth item in the pointed array contains the
+   corresponding data for the Nth node.
+
+   All columns are allocated as a single memory block that starts at ``nodes``
+   and ends at the end of ``end_columns``. Use ``python_destroy_node_tree`` to
+   free it.  */
+typedef struct {
+    /* Number of nodes in the tree.  */
+    int count;
+
+    /* Nodes themselves.  */
+    python_base_node *nodes;
+
+    /* Kind for each node.  */
+    int *kinds;
+
+    /* Index of the parent for each node (-1 for the root).  */
+    int *parents;
+
+    /* Number of non-null children for each node.  */
+    int *children_counts;
+
+    /* Indexes of the first/last token for each node (the last token index is
+       0 for ghost nodes).  */
+    int *token_starts, *token_ends;
+
+    /* Source location range for each node.  */
+    uint32_t *start_lines;
+    uint16_t *start_columns;
+    uint32_t *end_lines;
+    uint16_t *end_columns;
+} python_node_tree;
+
+/* Columnar representation of the stream of tokens and trivia in an analysis
+   unit, as computed by ``python_unit_export_tokens``.
+
+   Tokens and trivia are stored in the same order as in the source: the Nth
+   item in each column (i.e. each field of this structure, except ``count``)
+   contains the corresponding data for the Nth token or trivia. Offsets are
+   0-based indexes in the unit's source buffer: end offsets are exclusive.  */
+typedef struct {
+    /* Number of tokens and trivia in the table.  */
+    int count;
+
+    /* Kind for each token.  */
+    int *kinds;
+
+    /* Offsets for the first character of each token and for the character
+       that follows the last one.  */
+    int *start_offsets, *end_offsets;
+
+    /* Source location range for each token.  */
+    uint32_t *start_lines;
+    uint32_t *end_lines;
+    uint16_t *start_columns;
+    uint16_t *end_columns;
+
+    /* Whether each token is a trivia (1) or a regular token (0).  */
+    uint8_t *is_trivia;
+} python_token_table;
+
+/* Diagnostic for an analysis unit: cannot open the source file, parsing error,
+   ...  */
+typedef struct {
+    python_source_location_range sloc_range;
+    python_text message;
+} python_diagnostic;
+
+   typedef enum {
+      PYTHON_ANALYSIS_UNIT_KIND_UNIT_SPECIFICATION, PYTHON_ANALYSIS_UNIT_KIND_UNIT_BODY
+   } python_analysis_unit_kind;
+   /* Specify a kind of analysis unit. Specification units provide an interface
+      to the outer world while body units provide an implementation for the
+      corresponding interface.  */
+   typedef enum {
+      PYTHON_LOOKUP_KIND_RECURSIVE, PYTHON_LOOKUP_KIND_FLAT, PYTHON_LOOKUP_KIND_MINIMAL
+   } python_lookup_kind;
+   
+   typedef enum {
+      PYTHON_GRAMMAR_RULE_NAME_RULE, PYTHON_GRAMMAR_RULE_NUMBER_RULE, PYTHON_GRAMMAR_RULE_STRING_RULE, PYTHON_GRAMMAR_RULE_CAT_STRING_RULE, PYTHON_GRAMMAR_RULE_NL_RULE, PYTHON_GRAMMAR_RULE_MAIN_RULE_RULE, PYTHON_GRAMMAR_RULE_DECORATOR_RULE, PYTHON_GRAMMAR_RULE_DECORATORS_RULE, PYTHON_GRAMMAR_RULE_DECORATED_RULE, PYTHON_GRAMMAR_RULE_FUNC_DEF_RULE, PYTHON_GRAMMAR_RULE_PARAMETERS_RULE, PYTHON_GRAMMAR_RULE_VARARGSLIST_RULE, PYTHON_GRAMMAR_RULE_FPDEF_RULE, PYTHON_GRAMMAR_RULE_NAME_LIST_RULE, PYTHON_GRAMMAR_RULE_STMT_RULE, PYTHON_GRAMMAR_RULE_SIMPLE_STMT_RULE, PYTHON_GRAMMAR_RULE_SMALL_STMT_RULE, PYTHON_GRAMMAR_RULE_EXPR_STMT_RULE, PYTHON_GRAMMAR_RULE_PRINT_STMT_RULE, PYTHON_GRAMMAR_RULE_DEL_STMT_RULE, PYTHON_GRAMMAR_RULE_PASS_STMT_RULE, PYTHON_GRAMMAR_RULE_FLOW_STMT_RULE, PYTHON_GRAMMAR_RULE_BREAK_STMT_RULE, PYTHON_GRAMMAR_RULE_CONTINUE_STMT_RULE, PYTHON_GRAMMAR_RULE_RETURN_STMT_RULE, PYTHON_GRAMMAR_RULE_YIELD_STMT_RULE, PYTHON_GRAMMAR_RULE_RAISE_STMT_RULE, PYTHON_GRAMMAR_RULE_IMPORT_STMT_RULE, PYTHON_GRAMMAR_RULE_IMPORT_NAME_RULE, PYTHON_GRAMMAR_RULE_DOT_RULE, PYTHON_GRAMMAR_RULE_IMPORT_FROM_RULE, PYTHON_GRAMMAR_RULE_AS_NAME_RULE, PYTHON_GRAMMAR_RULE_DOTTED_AS_NAME_RULE, PYTHON_GRAMMAR_RULE_IMPORT_AS_NAMES_RULE, PYTHON_GRAMMAR_RULE_DOTTED_AS_NAMES_RULE, PYTHON_GRAMMAR_RULE_DOTTED_NAME_RULE, PYTHON_GRAMMAR_RULE_GLOBAL_STMT_RULE, PYTHON_GRAMMAR_RULE_EXEC_STMT_RULE, PYTHON_GRAMMAR_RULE_ASSERT_STMT_RULE, PYTHON_GRAMMAR_RULE_COMPOUND_STMT_RULE, PYTHON_GRAMMAR_RULE_ELSE_PART_RULE, PYTHON_GRAMMAR_RULE_IF_STMT_RULE, PYTHON_GRAMMAR_RULE_WHILE_STMT_RULE, PYTHON_GRAMMAR_RULE_FOR_STMT_RULE, PYTHON_GRAMMAR_RULE_TRY_STMT_RULE, PYTHON_GRAMMAR_RULE_WITH_STMT_RULE, PYTHON_GRAMMAR_RULE_WITH_ITEM_RULE, PYTHON_GRAMMAR_RULE_SUITE_RULE, PYTHON_GRAMMAR_RULE_TEST_RULE, PYTHON_GRAMMAR_RULE_OR_TEST_RULE, PYTHON_GRAMMAR_RULE_AND_TEST_RULE, PYTHON_GRAMMAR_RULE_NOT_TEST_RULE, PYTHON_GRAMMAR_RULE_COMPARISON_RULE, PYTHON_GRAMMAR_RULE_EXPR_RULE, PYTHON_GRAMMAR_RULE_XOR_EXPR_RULE, PYTHON_GRAMMAR_RULE_AND_EXPR_RULE, PYTHON_GRAMMAR_RULE_SHIFT_EXPR_RULE, PYTHON_GRAMMAR_RULE_ARITH_EXPR_RULE, PYTHON_GRAMMAR_RULE_TERM_RULE, PYTHON_GRAMMAR_RULE_FACTOR_RULE, PYTHON_GRAMMAR_RULE_POWER_RULE, PYTHON_GRAMMAR_RULE_ATOM_EXPR_RULE, PYTHON_GRAMMAR_RULE_DICT_ASSOC_RULE, PYTHON_GRAMMAR_RULE_YIELD_EXPR_RULE, PYTHON_GRAMMAR_RULE_ATOM_RULE, PYTHON_GRAMMAR_RULE_SET_LIT_RULE, PYTHON_GRAMMAR_RULE_LAMBDEF_RULE, PYTHON_GRAMMAR_RULE_SUBSCRIPT_LIST_RULE, PYTHON_GRAMMAR_RULE_SUBSCRIPT_RULE, PYTHON_GRAMMAR_RULE_EXPR_LIST_RULE, PYTHON_GRAMMAR_RULE_TEST_LIST_RULE, PYTHON_GRAMMAR_RULE_EMPTY_TEST_LIST_RULE, PYTHON_GRAMMAR_RULE_CLASS_DEF_RULE, PYTHON_GRAMMAR_RULE_ARG_LIST_RULE, PYTHON_GRAMMAR_RULE_LIST_ITER_RULE, PYTHON_GRAMMAR_RULE_LIST_FOR_RULE, PYTHON_GRAMMAR_RULE_LIST_IF_RULE, PYTHON_GRAMMAR_RULE_COMP_ITER_RULE, PYTHON_GRAMMAR_RULE_COMP_FOR_RULE, PYTHON_GRAMMAR_RULE_COMP_IF_RULE
+   } python_grammar_rule;
+   /* Gramar rule to use for parsing.  */
+
+const python_grammar_rule python_default_grammar_rule = PYTHON_GRAMMAR_RULE_MAIN_RULE_RULE;
+
+/* Enumerated type describing all possible exceptions that need to be handled
+   in the C bindings.  */
+typedef enum {
+      EXCEPTION_INVALID_FIELD,
+      EXCEPTION_NODE_DATA_EVALUATION_ERROR,
+      EXCEPTION_INVALID_INPUT,
+      EXCEPTION_INVALID_SYMBOL_ERROR,
+      EXCEPTION_INVALID_UNIT_NAME_ERROR,
+      EXCEPTION_NATIVE_EXCEPTION,
+      EXCEPTION_PRECONDITION_FAILURE,
+      EXCEPTION_PROPERTY_ERROR,
+      EXCEPTION_TEMPLATE_ARGS_ERROR,
+      EXCEPTION_TEMPLATE_FORMAT_ERROR,
+      EXCEPTION_TEMPLATE_INSTANTIATION_ERROR,
+      EXCEPTION_STALE_REFERENCE_ERROR,
+      EXCEPTION_UNKNOWN_CHARSET,
+} python_exception_kind;
+
+/* Holder for native exceptions-related information.  Memory management for
+   this and all the fields is handled by the library: one just has to make sure
+   not to keep references to it.
+
+   .. todo:: For the moment, this structure contains already formatted
+      information, but depending on possible future Ada runtime improvements,
+      this might change.  */
+typedef struct {
+   /* The kind of this exception.  */
+   python_exception_kind kind;
+
+   /* Message and context information associated with this exception.  */
+   const char *information;
+} python_exception;
+
+/*
+ * Array types incomplete declarations
+ */
+
+
+
+typedef struct python_bare_python_node_array_record *python_bare_python_node_array;
+
+
+
+typedef struct python_python_node_array_record *python_python_node_array;
+
+
+        
+
+typedef struct python_text_type_record *python_text_type;
+
+
+/*
+ * Struct types declarations
+ */
+
+        
+
+
+
+typedef struct {
+} python_internal_metadata;
+
+
+
+        
+
+
+
+typedef struct {
+        python_internal_metadata md;
+        python_env_rebindings_type rebindings;
+        python_bool from_rebound;
+} python_internal_entity_info;
+
+
+
+        
+
+
+
+typedef struct {
+        python_base_node node;
+        python_internal_entity_info info;
+} python_base_entity;
+
+
+
+
+/*
+ * Types for unit providers
+ */
+
+/* Interface to fetch analysis units from a name and a unit kind.
+
+   The unit provider mechanism provides an abstraction which assumes that to
+   any couple (unit name, unit kind) we can associate at most one source file.
+   This means that several couples can be associated to the same source file,
+   but on the other hand, only one one source file can be associated to a
+   couple.
+
+   This is used to make the semantic analysis able to switch from one analysis
+   units to another.  */
+typedef void *python_unit_provider;
+
+/* Callback type for functions that are called when destroying a unit file
+   provider type.  */
+typedef void (*python_unit_provider_destroy_callback)(void *data);
+
+/* Callback type for functions that are called to turn a unit reference encoded
+   as a unit name into an analysis unit.  */
+typedef char *(*python_unit_provider_get_unit_filename_callback)(
+   void *data,
+   python_text *name,
+   python_analysis_unit_kind kind
+);
+
+/* Callback type for functions that are called to turn a unit reference encoded
+   as a unit name into an analysis unit.  */
+typedef python_analysis_unit (*python_unit_provider_get_unit_from_name_callback)(
+   void *data,
+   python_analysis_context context,
+   python_text *name,
+   python_analysis_unit_kind kind,
+   const char *charset,
+   int reparse
+);
+
+/* All the functions below can potentially raise an exception, so
+   python_get_last_exception must be checked after them even
+   before trying to use the returned value.  */
+
+
+/*
+ * Array types declarations
+ */
+
+
+
+
+
+
+struct python_bare_python_node_array_record {
+   int n;
+   int ref_count;
+   python_base_node items[1];
+};
+
+/* Create a length-sized array.  */
+extern python_bare_python_node_array
+python_bare_python_node_array_create(int length);
+
+/* Increment the ref-count for "a".  */
+extern void
+python_bare_python_node_array_inc_ref(python_bare_python_node_array a);
+
+/* Decrement the ref-count for "a". This deallocates it if the ref-count drops
+   to 0.  */
+extern void
+python_bare_python_node_array_dec_ref(python_bare_python_node_array a);
+
+
+
+
+
+
+
+struct python_python_node_array_record {
+   int n;
+   int ref_count;
+   python_base_entity items[1];
+};
+
+/* Create a length-sized array.  */
+extern python_python_node_array
+python_python_node_array_create(int length);
+
+/* Increment the ref-count for "a".  */
+extern void
+python_python_node_array_inc_ref(python_python_node_array a);
+
+/* Decrement the ref-count for "a". This deallocates it if the ref-count drops
+   to 0.  */
+extern void
+python_python_node_array_dec_ref(python_python_node_array a);
+
+
+
+        
+
+
+
+
+struct python_text_type_record {
+   int n;
+   int ref_count;
+   uint32_t items[1];
+};
+
+/* Create a length-sized array.  */
+extern python_text_type
+python_text_type_create(int length);
+
+/* Increment the ref-count for "a".  */
+extern void
+python_text_type_inc_ref(python_text_type a);
+
+/* Decrement the ref-count for "a". This deallocates it if the ref-count drops
+   to 0.  */
+extern void
+python_text_type_dec_ref(python_text_type a);
+
+
+
+/*
+ * Analysis primitives
+ */
+
+/* Create a new analysis context.
+
+   ``Charset`` will be used as a default charset to decode input sources in
+   analysis units. Please see ``GNATCOLL.Iconv`` for several supported
+   charsets. Be careful: passing an unsupported charset is not guaranteed to
+   raise an error here. If no charset is provided, ``"utf-8"`` is the default.
+
+   .. todo:: Passing an unsupported charset here is not guaranteed to raise an
+      error right here, but this would be really helpful for users.
+
+   When ``With_Trivia`` is true, the parsed analysis units will contain
+   trivias.
+
+   If provided, ``Unit_Provider`` will be used to query the file name that
+   corresponds to a unit reference during semantic analysis. If it is ``NULL``,
+   the default one is used instead.
+
+   ``Tab_Stop`` is a positive number to describe the effect of tabulation
+   characters on the column number in source files.  */
+extern python_analysis_context
+python_create_analysis_context(
+   const char *charset,
+   python_unit_provider unit_provider,
+   int with_trivia,
+   int tab_stop
+);
+
+/* Increase the reference count to an analysis context. Return the reference
+   for convenience.  */
+extern python_analysis_context
+python_context_incref(python_analysis_context context);
+
+/* Decrease the reference count to an analysis context. Destruction happens
+   when the ref-count reaches 0.  */
+extern void
+python_context_decref(python_analysis_context context);
+
+/* If the given string is a valid symbol, yield it as a symbol and return true.
+   Otherwise, return false.  */
+extern int
+python_context_symbol(python_analysis_context context,
+                                   python_text *text,
+                                   python_symbol_type *symbol);
+
+/* Debug helper. Set whether ``Property_Error`` exceptions raised in
+   ``Populate_Lexical_Env`` should be discarded. They are by default.  */
+extern void
+python_context_discard_errors_in_populate_lexical_env(
+        python_analysis_context context,
+        int discard);
+
+/* Set whether analysis units created from files in this context should be
+   lexed directly from a compact copy of the memory-mapped file. This avoids
+   decoding the file into a wide-character buffer, and thus speeds up parsing
+   and reduces memory usage. It is disabled by default.
+
+   This only applies to files that use a single-byte charset (ASCII or Latin-1)
+   and that do not start with a UTF byte order mark: other files are decoded as
+   usual.  */
+extern void
+python_context_use_memory_mapped_files(
+        python_analysis_context context,
+        int enabled);
+
+/* Create a new analysis unit for ``Filename`` or return the existing one if
+   any. If ``Reparse`` is true and the analysis unit already exists, reparse it
+   from ``Filename``.
+
+   ``Rule`` controls which grammar rule is used to parse the unit.
+
+   Use ``Charset`` in order to decode the source. If ``Charset`` is empty then
+   use the context's default charset.
+
+   If any failure occurs, such as file opening, decoding, lexing or parsing
+   failure, return an analysis unit anyway: errors are described as diagnostics
+   of the returned analysis unit.  */
+extern python_analysis_unit
+python_get_analysis_unit_from_file(
+        python_analysis_context context,
+        const char *filename,
+        const char *charset,
+        int reparse,
+        python_grammar_rule rule);
+
+/* Create new analysis units for all ``Filenames``, or return the existing
+   ones, as ``Get_From_File`` would do for each of them. Units that need to be
+   (re)parsed are lexed and parsed concurrently on ``Jobs`` worker tasks, or on
+   one task per processor if ``Jobs`` is zero. Only lexing and parsing run
+   concurrently: the rest of the processing (for instance lexical environments
+   updates) is sequential.
+
+   ``Filenames`` and ``Units`` must both have ``Count`` elements: store the
+   analysis unit for each filename at the same index in ``Units``.
+
+   Note that grammar predicates are evaluated concurrently, so properties they
+   use must not depend on other analysis units.  */
+extern void
+python_get_analysis_units_from_files(
+        python_analysis_context context,
+        const char **filenames,
+        int count,
+        const char *charset,
+        int reparse,
+        python_grammar_rule rule,
+        int jobs,
+        python_analysis_unit *units);
+
+/* Create a new analysis unit for ``Filename`` or return the existing one if
+   any. Whether the analysis unit already exists or not, (re)parse it from the
+   source code in ``Buffer``.
+
+   ``Rule`` controls which grammar rule is used to parse the unit.
+
+   Use ``Charset`` in order to decode the source. If ``Charset`` is empty then
+   use the context's default charset.
+
+   If any failure occurs, such as file opening, decoding, lexing or parsing
+   failure, return an analysis unit anyway: errors are described as diagnostics
+   of the returned analysis unit.  */
+extern python_analysis_unit
+python_get_analysis_unit_from_buffer(
+        python_analysis_context context,
+        const char *filename,
+        const char *charset,
+        const char *buffer,
+        size_t buffer_size,
+        python_grammar_rule rule);
+
+
+/* Return the root node for this unit, or ``NULL`` if there is none.  */
+extern void
+python_unit_root(python_analysis_unit unit,
+                              python_base_entity *result_p);
+
+/* Return a reference to the first token scanned in this unit.  */
+extern void
+python_unit_first_token(python_analysis_unit unit,
+                                     python_token *token);
+
+/* Return a reference to the last token scanned in this unit.  */
+extern void
+python_unit_last_token(python_analysis_unit unit,
+                                    python_token *token);
+
+/* Return the number of tokens in this unit.  */
+extern int
+python_unit_token_count(python_analysis_unit unit);
+
+/* Return the number of trivias in this unit. This is 0 for units that were
+   parsed with trivia analysis disabled.  */
+extern int
+python_unit_trivia_count(python_analysis_unit unit);
+
+/* Store data for all the tokens and trivia in UNIT into *TABLE_P. Return zero
+   on failure.
+
+   If the columns in *TABLE_P are null, allocate them as a single memory block,
+   which starts at ``kinds``: it is up to the caller to free it with
+   ``python_destroy_token_table``. Otherwise, all columns must be provided by
+   the caller, with room for at least TABLE_P->count items (see
+   ``python_unit_token_count`` and ``python_unit_trivia_count``). In both
+   cases, TABLE_P->count is then set to the number of exported tokens and
+   trivia.
+
+   This is meant to process big token streams efficiently: it is a lot faster
+   than iterating on tokens with ``python_token_next``.  */
+extern int
+python_unit_export_tokens(python_analysis_unit unit,
+                                       python_token_table *table_p);
+
+/* Free the memory allocated for TABLE by ``python_unit_export_tokens``.  */
+extern void
+python_destroy_token_table(python_token_table *table);
+
+/* Debug helper: output the lexical envs for the given analysis unit.  */
+extern void
+python_unit_dump_lexical_env(python_analysis_unit unit);
+
+/* Return the filename this unit is associated to.
+
+   The returned string is dynamically allocated and the caller must free it
+   when done with it.  */
+extern char *
+python_unit_filename(python_analysis_unit unit);
+
+/* Return the number of diagnostics associated to this unit.  */
+extern unsigned
+python_unit_diagnostic_count(python_analysis_unit unit);
+
+/* Get the Nth diagnostic in this unit and store it into *DIAGNOSTIC_P. Return
+   zero on failure (when N is too big).  */
+extern int
+python_unit_diagnostic(python_analysis_unit unit,
+                                    unsigned n,
+                                    python_diagnostic *diagnostic_p);
+
+/* Return the context that owns this unit.  */
+extern python_analysis_context
+python_unit_context(python_analysis_unit context);
+
+/* Reparse an analysis unit from the associated file.
+
+   Use ``Charset`` in order to decode the source. If ``Charset`` is empty then
+   use the context's default charset.
+
+   If any failure occurs, such as decoding, lexing or parsing failure,
+   diagnostic are emitted to explain what happened.  */
+extern void
+python_unit_reparse_from_file(python_analysis_unit unit,
+                                           const char *charset);
+
+/* Reparse an analysis unit from a buffer.
+
+   Use ``Charset`` in order to decode the source. If ``Charset`` is empty then
+   use the context's default charset.
+
+   If any failure occurs, such as decoding, lexing or parsing failure,
+   diagnostic are emitted to explain what happened.  */
+extern void
+python_unit_reparse_from_buffer (python_analysis_unit unit,
+                                              const char *charset,
+                                              const char *buffer,
+                                              size_t buffer_size);
+
+/* Replace the source text in ``Edit_Range`` with ``Text`` and reparse the
+   analysis unit accordingly. The end of ``Edit_Range`` is exclusive, so an
+   empty range inserts ``Text``.
+
+   When the edit changes only trivia (whitespaces, comments, ...), the unit
+   keeps its current tree, so its nodes remain valid. Otherwise, this is
+   equivalent to reparsing the whole edited source buffer.
+
+   Raise a ``Precondition_Failure`` error if the unit has no source buffer or
+   if ``Edit_Range`` is not a valid source location range for it.  */
+extern void
+python_unit_reparse_edit(python_analysis_unit unit,
+                                      python_source_location_range *edit_range,
+                                      python_text *text);
+
+/* Create lexical environments for this analysis unit, according to the
+   specifications given in the language spec.
+
+   If not done before, it will be automatically called during semantic
+   analysis. Calling it before enables one to control where the latency occurs.
+
+   Depending on whether errors are discarded (see
+   ``Discard_Errors_In_Populate_Lexical_Env``), return 0 on failure and 1 on
+   success.  */
+extern int
+python_unit_populate_lexical_env(python_analysis_unit unit);
+
+/*
+ * General AST node primitives
+ */
+
+/* Return whether this node is a null node reference.  */
+static inline int
+python_node_is_null(python_base_entity *node) {
+    return node->node == NULL;
+}
+
+/* Return the kind of this node.  */
+extern python_node_kind_enum
+python_node_kind(python_base_entity *node);
+
+/* Helper for textual dump: return the kind name for this node. The returned
+   string is a copy and thus must be free'd by the caller.  */
+extern void
+python_kind_name(python_node_kind_enum kind, python_text *result);
+
+/* Return the analysis unit that owns this node.  */
+extern int
+python_node_unit(python_base_entity *node,
+                              python_analysis_unit *unit_p);
+
+/* Return whether this node is a node that contains only a single token.  */
+extern int
+python_node_is_token_node(python_base_entity *node);
+
+/* Return whether this node is synthetic.  */
+extern int
+python_node_is_synthetic(python_base_entity *node);
+
+/* Return a representation of this node as a string.  */
+extern void
+python_node_image(python_base_entity *node,
+                               python_text *result);
+
+/* Return the source buffer slice corresponding to the text that spans between
+   the first and the last tokens of this node.
+
+   Note that this returns the empty string for synthetic nodes.  */
+extern void
+python_node_text(python_base_entity *node,
+                              python_text *text);
+
+/* Return the spanning source location range for this node.
+
+   Note that this returns the sloc of the parent for synthetic nodes.  */
+extern void
+python_node_sloc_range(python_base_entity *node,
+                                    python_source_location_range *sloc_range);
+
+/* Return the bottom-most node from in ``Node`` and its children which contains
+   ``Sloc``, or ``NULL`` if there is none.  */
+extern void
+python_lookup_in_node(python_base_entity *node,
+                                   const python_source_location *sloc,
+                                   python_base_entity *result_p);
+
+/* Return the number of children in this node.  */
+extern unsigned
+python_node_children_count(python_base_entity *node);
+
+/* Return the Nth child for in this node's fields and store it into *CHILD_P.
+   Return zero on failure (when N is too big).  */
+extern int
+python_node_child(python_base_entity *node,
+                               unsigned n,
+                               python_base_entity* child_p);
+
+/* Compute a flat representation of the tree of nodes rooted at NODE and store
+   it into *TREE_P. Return zero on failure. Otherwise, it is up to the caller
+   to free the result with ``python_destroy_node_tree``.
+
+   This is meant to process big trees efficiently: it is a lot faster than
+   traversing the tree with ``python_node_child``.  */
+extern int
+python_node_export_tree(python_base_entity *node,
+                                     python_node_tree *tree_p);
+
+/* Free the memory allocated for TREE.  */
+extern void
+python_destroy_node_tree(python_node_tree *tree);
+
+/* Encode some text using the current locale. The result is dynamically
+   allocated: it is up to the caller to free it when done with it.
+
+   This is a development helper to make it quick and easy to print token and
+   diagnostic text: it ignores errors (when the locale does not support some
+   characters). Production code should use real conversion routines such as
+   libiconv's in order to deal with UTF-32 texts.  */
+extern char *
+python_text_to_locale_string(python_text *text);
+
+/* Encode TEXT into a dynamically allocated buffer, store its address in *BYTES
+   and its size (in bytes) in *LENGTH. It is up to the caller to free it with
+   ``python_free`` when done with it.
+
+   If all characters in TEXT are in the Latin-1 range, encode it in Latin-1 and
+   return 1. Otherwise, encode it in UTF-8 and return 0. Compared to UTF-32,
+   these encodings make the buffer up to four times smaller, which makes
+   transferring big texts to languages such as Python cheaper.  */
+extern int
+python_text_to_bytes(python_text *text,
+                                  char **bytes,
+                                  size_t *length);
+
+/* Free dynamically allocated memory.
+
+   This is a helper to free objects from dynamic languages.  */
+extern void
+python_free(void *address);
+
+/* If this text object owns the buffer it references, free this buffer.
+
+   Note that even though this accepts a pointer to a text object, it does not
+   deallocates the text object itself but rather the buffer it references.  */
+extern void
+python_destroy_text(python_text *text);
+
+/* Return the text associated to this symbol.  */
+extern void
+python_symbol_text(python_symbol_type *symbol,
+                                python_text *text);
+
+/* Create a big integer from its string representation (in base 10).  */
+extern python_big_integer
+python_create_big_integer(python_text *text);
+
+/* Return the string representation (in base 10) of this big integer.  */
+extern void
+python_big_integer_text(python_big_integer bigint,
+                                     python_text *text);
+
+/* Decrease the reference count for this big integer.  */
+extern void
+python_big_integer_decref(python_big_integer bigint);
+
+/*
+ * Kind-specific AST node primitives
+ */
+
+/* All these primitives return their result through an OUT parameter.  They
+   return a boolean telling whether the operation was successful (it can fail
+   if the node does not have the proper type, for instance).  When an AST node
+   is returned, its ref-count is left as-is.  */
+
+        
+
+
+
+/* Return the lexical parent for this node. Return null for the root AST node
+   or for AST nodes for which no one has a reference to the parent.  */
+extern int python_python_node_parent(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return an array that contains the lexical parents (this node included).
+   Nearer parents are first in the list.  */
+extern int python_python_node_parents(
+    python_base_entity *node,
+
+
+    python_python_node_array *value_p
+);
+
+
+        
+
+
+
+/* Return an array that contains the direct lexical children.  */
+extern int python_python_node_children(
+    python_base_entity *node,
+
+
+    python_python_node_array *value_p
+);
+
+
+        
+
+
+
+/* Return the first token used to parse this node.  */
+extern int python_python_node_token_start(
+    python_base_entity *node,
+
+
+    python_token *value_p
+);
+
+
+        
+
+
+
+/* Return the last token used to parse this node.  */
+extern int python_python_node_token_end(
+    python_base_entity *node,
+
+
+    python_token *value_p
+);
+
+
+        
+
+
+
+/* Return the 0-based index for Node in its parent's children.  */
+extern int python_python_node_child_index(
+    python_base_entity *node,
+
+
+    int *value_p
+);
+
+
+        
+
+
+
+/* Return the node's previous sibling, if there is one.  */
+extern int python_python_node_previous_sibling(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return the node's next sibling, if there is one.  */
+extern int python_python_node_next_sibling(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return the analysis unit owning this node.  */
+extern int python_python_node_unit(
+    python_base_entity *node,
+
+
+    python_analysis_unit *value_p
+);
+
+
+        
+
+
+
+/* Return whether the node is a ghost.
+
+   Unlike regular nodes, ghost nodes cover no token in the input source: they
+   are logically located instead between two tokens. The "token_first" of all
+   ghost nodes is the token right after this logical position, while they have
+   no "token_last".  */
+extern int python_python_node_is_ghost(
+    python_base_entity *node,
+
+
+    python_bool *value_p
+);
+
+
+        
+
+
+
+/* Return a string containing the filename + the sloc in GNU conformant format.
+   Useful to create diagnostics from a node.  */
+extern int python_python_node_full_sloc_image(
+    python_base_entity *node,
+
+
+    python_text_type *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_arg_assoc_f_name(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_arg_assoc_f_expr(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_arg_gen_f_expr(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_arg_gen_f_comprehension(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_kw_args_f_expr(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_var_args_f_expr(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_as_name_node_f_imported(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_as_name_node_f_as_name(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_comp_if_f_test(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_comp_if
+
+   * python_comprehension  */
+extern int python_comp_if_f_comp(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_comp_for_f_exprs(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_comp_for_f_target(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_comp_for
+
+   * python_comp_if  */
+extern int python_comp_for_f_comp(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_comp_forl_f_exprs(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_comp_forl_f_target(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_comp_forl
+
+   * python_comp_if  */
+extern int python_comp_forl_f_comp(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_decorator_f_dec_name(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_decorator_f_arg_list(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_dict_assoc_f_key(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_dict_assoc_f_value(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_assert_stmt
+
+   * python_assign_stmt
+
+   * python_aug_assign_stmt
+
+   * python_break_stmt
+
+   * python_continue_stmt
+
+   * python_del_stmt
+
+   * python_exec_stmt
+
+   * python_expr_list
+
+   * python_global_stmt
+
+   * python_import_from
+
+   * python_import_name
+
+   * python_pass_stmt
+
+   * python_print_stmt
+
+   * python_python_node_list
+
+   * python_raise_stmt
+
+   * python_return_stmt
+
+   * python_stream_print_stmt
+
+   * python_yield_expr  */
+extern int python_else_part_f_statements(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_except_part_f_as_name(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_assert_stmt
+
+   * python_assign_stmt
+
+   * python_aug_assign_stmt
+
+   * python_break_stmt
+
+   * python_continue_stmt
+
+   * python_del_stmt
+
+   * python_exec_stmt
+
+   * python_expr_list
+
+   * python_global_stmt
+
+   * python_import_from
+
+   * python_import_name
+
+   * python_pass_stmt
+
+   * python_print_stmt
+
+   * python_python_node_list
+
+   * python_raise_stmt
+
+   * python_return_stmt
+
+   * python_stream_print_stmt
+
+   * python_yield_expr  */
+extern int python_except_part_f_statements(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_yield_expr  */
+extern int python_and_expr_f_left(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_yield_expr  */
+extern int python_and_expr_f_right(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_and_op_f_left(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_and_op_f_right(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_yield_expr  */
+extern int python_bin_op_f_left(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_bin_op_f_op(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_arith_expr
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_term
+
+   * python_tuple_lit
+
+   * python_yield_expr  */
+extern int python_bin_op_f_right(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_yield_expr  */
+extern int python_call_expr_f_prefix(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_call_expr_f_suffix(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_comp_op_f_left(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_comp_op_f_op(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_comp_op_f_right(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_concat_string_lit_f_first_str(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_concat_string_lit_f_subsequent_str(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_dict_comp_f_assoc(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_dict_comp_f_comprehension(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_dict_lit_f_assocs(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_factor_f_op(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_yield_expr  */
+extern int python_factor_f_expr(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_if_expr_f_expr(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_if_expr_f_cond(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_if_expr_f_else_expr(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_inline_eval_f_exprs(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_lambda_def_f_args(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_lambda_def_f_expr(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_list_comp_f_expr(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_list_comp_f_comprehension(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_list_gen_f_expr(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_list_gen_f_comprehension(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_list_lit_f_exprs(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_yield_expr  */
+extern int python_dotted_name_f_prefix(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_dotted_name_f_suffix(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_not_op_f_expr(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_or_expr_f_left(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_or_expr_f_right(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_or_op_f_left(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_or_op_f_right(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_yield_expr  */
+extern int python_power_f_left(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_yield_expr  */
+extern int python_power_f_right(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_set_comp_f_expr(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_set_comp_f_comprehension(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_set_lit_f_exprs(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_slice_expr_f_first(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_slice_expr_f_last(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_ext_slice_expr_f_stride(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_yield_expr  */
+extern int python_subscript_expr_f_prefix(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_ellipsis_expr
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_slice_expr
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_subscript_expr_f_suffix(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_tuple_lit_f_exprs(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_xor_expr_f_left(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_yield_expr  */
+extern int python_xor_expr_f_right(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_yield_expr_f_exprs(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_assert_stmt
+
+   * python_assign_stmt
+
+   * python_aug_assign_stmt
+
+   * python_break_stmt
+
+   * python_continue_stmt
+
+   * python_decorated
+
+   * python_def_stmt
+
+   * python_del_stmt
+
+   * python_exec_stmt
+
+   * python_expr_list
+
+   * python_for_stmt
+
+   * python_global_stmt
+
+   * python_if_stmt
+
+   * python_import_from
+
+   * python_import_name
+
+   * python_pass_stmt
+
+   * python_print_stmt
+
+   * python_python_node_list
+
+   * python_raise_stmt
+
+   * python_return_stmt
+
+   * python_stream_print_stmt
+
+   * python_try_stmt
+
+   * python_while_stmt
+
+   * python_with_stmt
+
+   * python_yield_expr  */
+extern int python_file_node_f_statements(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return whether this is an instance of KwArgsFlagPresent  */
+extern int python_kw_args_flag_p_as_bool(
+    python_base_entity *node,
+
+
+    python_bool *value_p
+);
+
+
+        
+
+
+
+
+extern int python_params_f_single_params(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_rel_name_f_dots(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_rel_name_f_name(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_single_param_f_is_varargs(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_single_param_f_is_kwargs(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_id
+
+   * python_id_list  */
+extern int python_single_param_f_name(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_single_param_f_default_value(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_assert_stmt_f_test_expr(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_assert_stmt_f_msg(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_assign_stmt_f_l_value(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_expr_list
+
+   * python_yield_expr  */
+extern int python_assign_stmt_f_r_values(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_aug_assign_stmt_f_l_value(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_aug_assign_stmt_f_op(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_expr_list
+
+   * python_yield_expr  */
+extern int python_aug_assign_stmt_f_r_value(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_decorated_f_decorators(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_decorated_f_defn(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_class_def_f_name(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_class_def_f_bases(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_assert_stmt
+
+   * python_assign_stmt
+
+   * python_aug_assign_stmt
+
+   * python_break_stmt
+
+   * python_continue_stmt
+
+   * python_del_stmt
+
+   * python_exec_stmt
+
+   * python_expr_list
+
+   * python_global_stmt
+
+   * python_import_from
+
+   * python_import_name
+
+   * python_pass_stmt
+
+   * python_print_stmt
+
+   * python_python_node_list
+
+   * python_raise_stmt
+
+   * python_return_stmt
+
+   * python_stream_print_stmt
+
+   * python_yield_expr  */
+extern int python_class_def_f_statements(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_func_def_f_name(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_func_def_f_parameters(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_assert_stmt
+
+   * python_assign_stmt
+
+   * python_aug_assign_stmt
+
+   * python_break_stmt
+
+   * python_continue_stmt
+
+   * python_del_stmt
+
+   * python_exec_stmt
+
+   * python_expr_list
+
+   * python_global_stmt
+
+   * python_import_from
+
+   * python_import_name
+
+   * python_pass_stmt
+
+   * python_print_stmt
+
+   * python_python_node_list
+
+   * python_raise_stmt
+
+   * python_return_stmt
+
+   * python_stream_print_stmt
+
+   * python_yield_expr  */
+extern int python_func_def_f_body(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_del_stmt_f_exprs(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_elif_branch_f_cond_test(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_assert_stmt
+
+   * python_assign_stmt
+
+   * python_aug_assign_stmt
+
+   * python_break_stmt
+
+   * python_continue_stmt
+
+   * python_del_stmt
+
+   * python_exec_stmt
+
+   * python_expr_list
+
+   * python_global_stmt
+
+   * python_import_from
+
+   * python_import_name
+
+   * python_pass_stmt
+
+   * python_print_stmt
+
+   * python_python_node_list
+
+   * python_raise_stmt
+
+   * python_return_stmt
+
+   * python_stream_print_stmt
+
+   * python_yield_expr  */
+extern int python_elif_branch_f_statements(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_exec_stmt_f_expr(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_exec_stmt_f_in_list(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_inline_eval
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_for_stmt_f_bindings(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_for_stmt_f_expr(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_assert_stmt
+
+   * python_assign_stmt
+
+   * python_aug_assign_stmt
+
+   * python_break_stmt
+
+   * python_continue_stmt
+
+   * python_del_stmt
+
+   * python_exec_stmt
+
+   * python_expr_list
+
+   * python_global_stmt
+
+   * python_import_from
+
+   * python_import_name
+
+   * python_pass_stmt
+
+   * python_print_stmt
+
+   * python_python_node_list
+
+   * python_raise_stmt
+
+   * python_return_stmt
+
+   * python_stream_print_stmt
+
+   * python_yield_expr  */
+extern int python_for_stmt_f_statements(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_for_stmt_f_else_part(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_global_stmt_f_names(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_if_stmt_f_cond_test(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_assert_stmt
+
+   * python_assign_stmt
+
+   * python_aug_assign_stmt
+
+   * python_break_stmt
+
+   * python_continue_stmt
+
+   * python_del_stmt
+
+   * python_exec_stmt
+
+   * python_expr_list
+
+   * python_global_stmt
+
+   * python_import_from
+
+   * python_import_name
+
+   * python_pass_stmt
+
+   * python_print_stmt
+
+   * python_python_node_list
+
+   * python_raise_stmt
+
+   * python_return_stmt
+
+   * python_stream_print_stmt
+
+   * python_yield_expr  */
+extern int python_if_stmt_f_statements(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_if_stmt_f_elif_branchs(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_if_stmt_f_else_part(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_name
+
+   * python_rel_name  */
+extern int python_import_from_f_rel_name(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_import_star
+
+   * python_python_node_list  */
+extern int python_import_from_f_imported(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_as_name_node
+
+   * python_name  */
+extern int python_import_name_f_imported_names(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_print_stmt_f_exprs(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_raise_stmt_f_exprs(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_return_stmt_f_exprs(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_stream_print_stmt_f_stream_expr(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field contains a list that itself contains one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_stream_print_stmt_f_exprs(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_assert_stmt
+
+   * python_assign_stmt
+
+   * python_aug_assign_stmt
+
+   * python_break_stmt
+
+   * python_continue_stmt
+
+   * python_del_stmt
+
+   * python_exec_stmt
+
+   * python_expr_list
+
+   * python_global_stmt
+
+   * python_import_from
+
+   * python_import_name
+
+   * python_pass_stmt
+
+   * python_print_stmt
+
+   * python_python_node_list
+
+   * python_raise_stmt
+
+   * python_return_stmt
+
+   * python_stream_print_stmt
+
+   * python_yield_expr  */
+extern int python_try_stmt_f_statements(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_try_stmt_f_except_parts(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_try_stmt_f_else_part(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_assert_stmt
+
+   * python_assign_stmt
+
+   * python_aug_assign_stmt
+
+   * python_break_stmt
+
+   * python_continue_stmt
+
+   * python_del_stmt
+
+   * python_exec_stmt
+
+   * python_expr_list
+
+   * python_global_stmt
+
+   * python_import_from
+
+   * python_import_name
+
+   * python_pass_stmt
+
+   * python_print_stmt
+
+   * python_python_node_list
+
+   * python_raise_stmt
+
+   * python_return_stmt
+
+   * python_stream_print_stmt
+
+   * python_yield_expr  */
+extern int python_try_stmt_f_finally_part(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_and_expr
+
+   * python_and_op
+
+   * python_bin_op
+
+   * python_call_expr
+
+   * python_comp_op
+
+   * python_concat_string_lit
+
+   * python_dict_comp
+
+   * python_dict_lit
+
+   * python_factor
+
+   * python_if_expr
+
+   * python_inline_eval
+
+   * python_lambda_def
+
+   * python_list_comp
+
+   * python_list_gen
+
+   * python_list_lit
+
+   * python_name
+
+   * python_not_op
+
+   * python_number_lit
+
+   * python_or_expr
+
+   * python_or_op
+
+   * python_power
+
+   * python_set_comp
+
+   * python_set_lit
+
+   * python_string_lit
+
+   * python_subscript_expr
+
+   * python_tuple_lit
+
+   * python_xor_expr
+
+   * python_yield_expr  */
+extern int python_while_stmt_f_cond_test(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_assert_stmt
+
+   * python_assign_stmt
+
+   * python_aug_assign_stmt
+
+   * python_break_stmt
+
+   * python_continue_stmt
+
+   * python_del_stmt
+
+   * python_exec_stmt
+
+   * python_expr_list
+
+   * python_global_stmt
+
+   * python_import_from
+
+   * python_import_name
+
+   * python_pass_stmt
+
+   * python_print_stmt
+
+   * python_python_node_list
+
+   * python_raise_stmt
+
+   * python_return_stmt
+
+   * python_stream_print_stmt
+
+   * python_yield_expr  */
+extern int python_while_stmt_f_statements(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_while_stmt_f_else_part(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+
+extern int python_with_stmt_f_bindings(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* This field can contain one of the following nodes:
+
+   * python_assert_stmt
+
+   * python_assign_stmt
+
+   * python_aug_assign_stmt
+
+   * python_break_stmt
+
+   * python_continue_stmt
+
+   * python_del_stmt
+
+   * python_exec_stmt
+
+   * python_expr_list
+
+   * python_global_stmt
+
+   * python_import_from
+
+   * python_import_name
+
+   * python_pass_stmt
+
+   * python_print_stmt
+
+   * python_python_node_list
+
+   * python_raise_stmt
+
+   * python_return_stmt
+
+   * python_stream_print_stmt
+
+   * python_yield_expr  */
+extern int python_with_stmt_f_statements(
+    python_base_entity *node,
+
+
+    python_base_entity *value_p
+);
+
+
+        
+
+
+
+/* Return whether this is an instance of VarArgsFlagPresent  */
+extern int python_var_args_flag_p_as_bool(
+    python_base_entity *node,
+
+
+    python_bool *value_p
+);
+
+
+
+/*
+ * Unit providers
+ */
+
+/* Create a unit provider. When done with it, the result must be passed to
+   ``python_destroy_unit_provider``.
+
+   Pass as ``data`` a pointer to hold your private data: it will be passed to
+   all callbacks below.
+
+   ``destroy`` is a callback that is called by ``python_destroy_unit_provider``
+   to leave a chance to free resources that ``data`` may hold.
+
+   ``get_unit_from_node`` is a callback. It turns an analysis unit reference
+   represented as a node into an analysis unit. It should return ``NULL`` if
+   the node is not a valid unit name representation.
+
+   ``get_unit_from_name`` is a callback similar to ``get_unit_from_node``
+   except it takes an analysis unit reference represented as a string.  */
+extern python_unit_provider
+python_create_unit_provider(
+   void *data,
+   python_unit_provider_destroy_callback destroy_func,
+   python_unit_provider_get_unit_filename_callback get_unit_filename_func,
+   python_unit_provider_get_unit_from_name_callback get_unit_from_name_func
+);
+
+/* Release an ownership share for this unit provider. This destroys the unit
+   provider if there are no shares left.  */
+extern void
+python_dec_ref_unit_provider(void *data);
+
+
+
+
+/*
+ * Misc
+ */
+
+/* Return exception information for the last error that happened in the current
+   thread. Will be automatically allocated on error and free'd on the next
+   error.  */
+extern const python_exception *
+python_get_last_exception(void);
+
+/* Exception information for the last error that happened, or null if the last
+   call to the library succeeded. This holds the same value as what
+   ``python_get_last_exception`` returns: bindings can read it directly to
+   check for errors without an additional function call.  */
+extern const python_exception *python_last_exception;
+
+/* Return a human-readable name for a token kind.
+
+   The returned string is dynamically allocated and the caller must free it
+   when done with it.
+
+   If the given kind is invalid, return ``NULL`` and set the last exception
+   accordingly.  */
+extern char *
+python_token_kind_name(python_token_kind kind);
+
+/* Return a reference to the next token in the corresponding analysis unit.  */
+extern void
+python_token_next(python_token *token,
+                               python_token *next_token);
+
+/* Return a reference to the previous token in the corresponding analysis
+   unit.   */
+extern void
+python_token_previous(python_token *token,
+                                   python_token *previous_token);
+
+/* Compute the source buffer slice corresponding to the text that spans between
+   the ``First`` and ``Last`` tokens (both included). This yields an empty
+   slice if ``Last`` actually appears before ``First``. Put the result in
+   ``RESULT``.
+
+   This returns 0 if ``First`` and ``Last`` don't belong to the same analysis
+   unit. Return 1 if successful.  */
+extern int
+python_token_range_text(python_token *first,
+                                     python_token *last,
+                                     python_text *result);
+
+/* Return whether ``L`` and ``R`` are structurally equivalent tokens. This
+   means that their position in the stream won't be taken into account, only
+   the kind and text of the token.  */
+extern void
+python_token_is_equivalent(python_token *left,
+                                        python_token *right);
+
+/* Return a representation of this entity as a string.  */
+extern void
+python_entity_image(python_base_entity ent, python_text *result);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,7728 @@
+
+
+
+
+
+
+
+with Ada.Containers;            use Ada.Containers;
+with Ada.Strings.Unbounded;     use Ada.Strings.Unbounded;
+pragma Warnings (Off, "is an internal GNAT unit");
+with Ada.Strings.Unbounded.Aux; use Ada.Strings.Unbounded.Aux;
+pragma Warnings (On, "is an internal GNAT unit");
+with Ada.Unchecked_Conversion;
+
+with GNATCOLL.Traces;
+with GNATCOLL.VFS; use GNATCOLL.VFS;
+
+pragma Warnings (Off, "referenced");
+with Langkit_Support.Adalog.Abstract_Relation;
+use Langkit_Support.Adalog.Abstract_Relation;
+with Langkit_Support.Adalog.Debug;
+use Langkit_Support.Adalog.Debug;
+with Langkit_Support.Adalog.Operations;
+use Langkit_Support.Adalog.Operations;
+with Langkit_Support.Adalog.Predicates;
+use Langkit_Support.Adalog.Predicates;
+with Langkit_Support.Adalog.Pure_Relations;
+use Langkit_Support.Adalog.Pure_Relations;
+pragma Warnings (On, "referenced");
+
+with Libpythonlang.Common;
+use Libpythonlang.Common.Symbols;
+with Libpythonlang.Private_Converters;
+use Libpythonlang.Private_Converters;
+with Libpythonlang.Public_Converters; use Libpythonlang.Public_Converters;
+
+
+
+
+package body Libpythonlang.Analysis is
+
+   use Libpythonlang.Implementation;
+   use AST_Envs;
+
+      
+
+
+      
+      function To_Public_Text_Type
+         (Value : Character_Type_Array_Access) return Text_Type;
+
+
+      
+      function To_Public_Python_Node_Array
+         (Value : Internal_Entity_Array_Access) return Python_Node_Array;
+
+
+      
+
+
+      
+
+
+
+
+   ----------------
+   -- Do_Release --
+   ----------------
+
+   procedure Do_Release (Provider : in out Unit_Provider_Interface'Class) is
+   begin
+      Provider.Release;
+   end Do_Release;
+
+   ------------------------------------
+   -- Create_Unit_Provider_Reference --
+   ------------------------------------
+
+   function Create_Unit_Provider_Reference
+     (Provider : Unit_Provider_Interface'Class) return Unit_Provider_Reference
+   is
+   begin
+      return Result : Unit_Provider_Reference do
+         Result.Set (Provider);
+      end return;
+   end Create_Unit_Provider_Reference;
+
+   --------------------
+   -- Create_Context --
+   --------------------
+
+   function Create_Context
+     (Charset       : String := Default_Charset;
+      Unit_Provider : Unit_Provider_Reference := No_Unit_Provider_Reference;
+      With_Trivia   : Boolean := True;
+      Tab_Stop      : Positive := 8)
+      return Analysis_Context
+   is
+      use Unit_Provider_References;
+
+      UP     : Internal_Unit_Provider_Access :=
+         Wrap_Public_Provider (Unit_Provider);
+      Result : Internal_Context := Create_Context
+        (Charset, UP, With_Trivia, Tab_Stop);
+   begin
+      --  Create_Context created an owneship for itself, so don't forget to
+      --  remove the share on UP.
+      Dec_Ref (UP);
+
+      return Context : constant Analysis_Context := Wrap_Context (Result)
+      do
+         --  Result has one ownership share and the call to Wrap_Context
+         --  creates a new one, so don't forget to dec-ref before returning.
+         Dec_Ref (Result);
+      end return;
+   end Create_Context;
+
+   --------------
+   -- Has_Unit --
+   --------------
+
+   function Has_Unit
+     (Context       : Analysis_Context'Class;
+      Unit_Filename : String) return Boolean is
+   begin
+      return Has_Unit (Unwrap_Context (Context), Unit_Filename);
+   end Has_Unit;
+
+   -------------------
+   -- Get_From_File --
+   -------------------
+
+   function Get_From_File
+     (Context  : Analysis_Context'Class;
+      Filename : String;
+      Charset  : String := "";
+      Reparse  : Boolean := False;
+      Rule     : Grammar_Rule := Default_Grammar_Rule) return Analysis_Unit is
+   begin
+      return Wrap_Unit
+        (Get_From_File (Unwrap_Context (Context), Filename, Charset,
+                        Reparse, Rule));
+   end Get_From_File;
+
+   --------------------
+   -- Get_From_Files --
+   --------------------
+
+   procedure Get_From_Files
+     (Context   : Analysis_Context'Class;
+      Filenames : GNAT.Strings.String_List;
+      Charset   : String := "";
+      Reparse   : Boolean := False;
+      Rule      : Grammar_Rule := Default_Grammar_Rule;
+      Jobs      : Natural := 0)
+   is
+      Dummy : constant Internal_Unit_Array := Get_From_Files
+        (Unwrap_Context (Context), Filenames, Charset, Reparse, Rule, Jobs);
+   begin
+      null;
+   end Get_From_Files;
+
+   ---------------------
+   -- Get_From_Buffer --
+   ---------------------
+
+   function Get_From_Buffer
+     (Context  : Analysis_Context'Class;
+      Filename : String;
+      Charset  : String := "";
+      Buffer   : String;
+      Rule     : Grammar_Rule := Default_Grammar_Rule) return Analysis_Unit is
+   begin
+      return Wrap_Unit
+        (Get_From_Buffer (Unwrap_Context (Context), Filename, Charset,
+                          Buffer, Rule));
+   end Get_From_Buffer;
+
+   ---------------------
+   -- Get_From_Buffer --
+   ---------------------
+
+   function Get_From_Buffer
+     (Context  : Analysis_Context'Class;
+      Filename : String;
+      Charset  : String := "";
+      Buffer   : Ada.Strings.Unbounded.Unbounded_String;
+      Rule     : Grammar_Rule := Default_Grammar_Rule) return Analysis_Unit
+   is
+      Bytes       : Big_String_Access;
+      Bytes_Count : Natural;
+   begin
+      Get_String (Buffer, Bytes, Bytes_Count);
+      return Wrap_Unit
+        (Get_From_Buffer (Unwrap_Context (Context), Filename, Charset,
+                          Bytes (1 .. Bytes_Count), Rule));
+   end Get_From_Buffer;
+
+   --------------------
+   -- Get_With_Error --
+   --------------------
+
+   function Get_With_Error
+     (Context  : Analysis_Context'Class;
+      Filename : String;
+      Error    : Text_Type;
+      Charset  : String := "";
+      Rule     : Grammar_Rule := Default_Grammar_Rule) return Analysis_Unit
+   is
+      Result : constant Internal_Unit :=
+         Implementation.Get_With_Error (Unwrap_Context (Context), Filename,
+                                        Error, Charset, Rule);
+   begin
+      return Wrap_Unit (Result);
+   end Get_With_Error;
+
+
+   -------------------
+   -- Unit_Provider --
+   -------------------
+
+   function Unit_Provider
+     (Context : Analysis_Context'Class) return Unit_Provider_Reference
+   is
+      Provider : constant Internal_Unit_Provider_Access :=
+         Unit_Provider (Unwrap_Context (Context));
+   begin
+      --  By design, Unit_Provider_Wrapper is supposed to be the only
+      --  implementation of the Internal_Unit_Provider interface.
+      if Provider.all not in Unit_Provider_Wrapper'Class then
+         raise Program_Error;
+      end if;
+
+      return Unit_Provider_Wrapper (Provider.all).Internal;
+   end Unit_Provider;
+
+   ----------
+   -- Hash --
+   ----------
+
+   function Hash (Context : Analysis_Context) return Ada.Containers.Hash_Type
+   is
+   begin
+      return Hash (Unwrap_Context (Context));
+   end Hash;
+
+   ---------------------
+   -- Has_With_Trivia --
+   ---------------------
+
+   function Has_With_Trivia (Context : Analysis_Context'Class) return Boolean
+   is
+   begin
+      return Has_With_Trivia (Unwrap_Context (Context));
+   end Has_With_Trivia;
+
+   --------------------------------------------
+   -- Discard_Errors_In_Populate_Lexical_Env --
+   --------------------------------------------
+
+   procedure Discard_Errors_In_Populate_Lexical_Env
+     (Context : Analysis_Context'Class; Discard : Boolean) is
+   begin
+      Discard_Errors_In_Populate_Lexical_Env
+        (Unwrap_Context (Context), Discard);
+   end Discard_Errors_In_Populate_Lexical_Env;
+
+   -----------------------------
+   -- Use_Memory_Mapped_Files --
+   -----------------------------
+
+   procedure Use_Memory_Mapped_Files
+     (Context : Analysis_Context'Class; Enabled : Boolean := True) is
+   begin
+      Use_Memory_Mapped_Files (Unwrap_Context (Context), Enabled);
+   end Use_Memory_Mapped_Files;
+
+   ----------------------------------
+   -- Set_Logic_Resolution_Timeout --
+   ----------------------------------
+
+   procedure Set_Logic_Resolution_Timeout
+     (Context : Analysis_Context'Class; Timeout : Natural) is
+   begin
+      Set_Logic_Resolution_Timeout (Unwrap_Context (Context), Timeout);
+   end Set_Logic_Resolution_Timeout;
+
+   --------------------------
+   -- Disable_Lookup_Cache --
+   --------------------------
+
+   procedure Disable_Lookup_Cache (Disable : Boolean := True) is
+   begin
+      Implementation.AST_Envs.Activate_Lookup_Cache := not Disable;
+   end Disable_Lookup_Cache;
+
+   --------------------------
+   -- Has_Rewriting_Handle --
+   --------------------------
+
+   function Has_Rewriting_Handle
+     (Context : Analysis_Context'Class) return Boolean is
+   begin
+      return Has_Rewriting_Handle (Unwrap_Context (Context));
+   end Has_Rewriting_Handle;
+
+   -------------
+   -- Context --
+   -------------
+
+   function Context (Unit : Analysis_Unit'Class) return Analysis_Context is
+   begin
+      return Wrap_Context (Context (Unwrap_Unit (Unit)));
+   end Context;
+
+   ----------
+   -- Hash --
+   ----------
+
+   function Hash (Unit : Analysis_Unit) return Ada.Containers.Hash_Type
+   is
+   begin
+      return Hash (Unwrap_Unit (Unit));
+   end Hash;
+
+   -------------
+   -- Reparse --
+   -------------
+
+   procedure Reparse (Unit : Analysis_Unit'Class; Charset : String := "") is
+   begin
+      Reparse (Unwrap_Unit (Unit), Charset);
+   end Reparse;
+
+   -------------
+   -- Reparse --
+   -------------
+
+   procedure Reparse
+     (Unit : Analysis_Unit'Class; Charset : String := ""; Buffer  : String) is
+   begin
+      Reparse (Unwrap_Unit (Unit), Charset, Buffer);
+   end Reparse;
+
+   -------------
+   -- Reparse --
+   -------------
+
+   procedure Reparse
+     (Unit       : Analysis_Unit'Class;
+      Edit_Range : Source_Location_Range;
+      Text       : Text_Type) is
+   begin
+      Reparse (Unwrap_Unit (Unit), Edit_Range, Text);
+   end Reparse;
+
+   --------------------------
+   -- Populate_Lexical_Env --
+   --------------------------
+
+   procedure Populate_Lexical_Env (Unit : Analysis_Unit'Class) is
+   begin
+      Populate_Lexical_Env (Unwrap_Unit (Unit));
+   end Populate_Lexical_Env;
+
+   ------------------
+   -- Get_Filename --
+   ------------------
+
+   function Get_Filename (Unit : Analysis_Unit'Class) return String is
+   begin
+      return Get_Filename (Unwrap_Unit (Unit));
+   end Get_Filename;
+
+   -----------------
+   -- Get_Charset --
+   -----------------
+
+   function Get_Charset (Unit : Analysis_Unit'Class) return String is
+   begin
+      return Get_Charset (Unwrap_Unit (Unit));
+   end Get_Charset;
+
+   ---------------------
+   -- Has_Diagnostics --
+   ---------------------
+
+   function Has_Diagnostics (Unit : Analysis_Unit'Class) return Boolean is
+   begin
+      return Has_Diagnostics (Unwrap_Unit (Unit));
+   end Has_Diagnostics;
+
+   -----------------
+   -- Diagnostics --
+   -----------------
+
+   function Diagnostics (Unit : Analysis_Unit'Class) return Diagnostics_Array
+   is
+   begin
+      return Implementation.Diagnostics (Unwrap_Unit (Unit));
+   end Diagnostics;
+
+   ---------------------------
+   -- Format_GNU_Diagnostic --
+   ---------------------------
+
+   function Format_GNU_Diagnostic
+     (Unit : Analysis_Unit'Class; D : Diagnostic) return String is
+   begin
+      return Format_GNU_Diagnostic (Unwrap_Unit (Unit), D);
+   end Format_GNU_Diagnostic;
+
+   ----------
+   -- Root --
+   ----------
+
+   function Root (Unit : Analysis_Unit'Class) return Python_Node is
+   begin
+      return Wrap_Node (Root (Unwrap_Unit (Unit)));
+   end Root;
+
+   -----------------
+   -- First_Token --
+   -----------------
+
+   function First_Token (Unit : Analysis_Unit'Class) return Token_Reference is
+   begin
+      return First_Token (Unwrap_Unit (Unit));
+   end First_Token;
+
+   ----------------
+   -- Last_Token --
+   ----------------
+
+   function Last_Token (Unit : Analysis_Unit'Class) return Token_Reference is
+   begin
+      return Last_Token (Unwrap_Unit (Unit));
+   end Last_Token;
+
+   -----------------
+   -- Token_Count --
+   -----------------
+
+   function Token_Count (Unit : Analysis_Unit'Class) return Natural is
+   begin
+      return Token_Count (Unwrap_Unit (Unit));
+   end Token_Count;
+
+   ------------------
+   -- Trivia_Count --
+   ------------------
+
+   function Trivia_Count (Unit : Analysis_Unit'Class) return Natural is
+   begin
+      return Trivia_Count (Unwrap_Unit (Unit));
+   end Trivia_Count;
+
+   ----------
+   -- Text --
+   ----------
+
+   function Text (Unit : Analysis_Unit'Class) return Text_Type is
+   begin
+      return Implementation.Text (Unwrap_Unit (Unit));
+   end Text;
+
+   ----------
+   -- Text --
+   ----------
+
+   function Text (Unit : Analysis_Unit'Class) return Text_Cst_Access is
+   begin
+      return Implementation.Text (Unwrap_Unit (Unit));
+   end Text;
+
+   ------------------
+   -- Lookup_Token --
+   ------------------
+
+   function Lookup_Token
+     (Unit : Analysis_Unit'Class; Sloc : Source_Location)
+      return Token_Reference is
+   begin
+      return Lookup_Token (Unwrap_Unit (Unit), Sloc);
+   end Lookup_Token;
+
+   ----------------------
+   -- Dump_Lexical_Env --
+   ----------------------
+
+   procedure Dump_Lexical_Env (Unit : Analysis_Unit'Class) is
+   begin
+      Dump_Lexical_Env (Unwrap_Unit (Unit));
+   end Dump_Lexical_Env;
+
+   ------------------------
+   -- Trigger_Envs_Debug --
+   ------------------------
+
+   procedure Trigger_Envs_Debug (Is_Active : Boolean) is
+   begin
+      GNATCOLL.Traces.Set_Active (AST_Envs.Me, Is_Active);
+   end Trigger_Envs_Debug;
+
+   -----------
+   -- Print --
+   -----------
+
+   procedure Print (Unit : Analysis_Unit'Class; Show_Slocs : Boolean := True)
+   is
+   begin
+      Print (Unwrap_Unit (Unit), Show_Slocs);
+   end Print;
+
+   ---------------
+   -- PP_Trivia --
+   ---------------
+
+   procedure PP_Trivia (Unit : Analysis_Unit'Class) is
+   begin
+      PP_Trivia (Unwrap_Unit (Unit));
+   end PP_Trivia;
+
+   -------------
+   -- Is_Null --
+   -------------
+
+   function Is_Null (Node : Python_Node'Class) return Boolean is
+     (Node.Internal.Node = null);
+
+   -------------------
+   -- Is_Token_Node --
+   -------------------
+
+   function Is_Token_Node (Node : Python_Node'Class) return Boolean
+   is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Is_Token_Node (Node.Internal.Node);
+   end Is_Token_Node;
+
+   ------------------
+   -- Is_Synthetic --
+   ------------------
+
+   function Is_Synthetic (Node : Python_Node'Class) return Boolean
+   is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Is_Synthetic (Node.Internal.Node);
+   end Is_Synthetic;
+
+   ---------
+   -- "=" --
+   ---------
+
+   function "=" (L, R : Python_Node'Class) return Boolean is
+   begin
+      Check_Safety_Net (L.Safety_Net);
+      Check_Safety_Net (R.Safety_Net);
+      return Compare_Entity (L.Internal, R.Internal);
+   end "=";
+
+   -----------
+   -- Image --
+   -----------
+
+   function Image (Node : Python_Node'Class) return String is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Image (Node.Internal);
+   end Image;
+
+   -----------------------
+   -- Entity converters --
+   -----------------------
+
+      function As_Python_Node
+        (Node : Python_Node'Class) return Python_Node
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Python_Node;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+
+      end;
+      function As_Expr
+        (Node : Python_Node'Class) return Expr
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Expr;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Expr then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Expr";
+         
+            end if;
+      end;
+      function As_And_Expr
+        (Node : Python_Node'Class) return And_Expr
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_And_Expr;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_And_Expr_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to AndExpr";
+         
+            end if;
+      end;
+      function As_And_Op
+        (Node : Python_Node'Class) return And_Op
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_And_Op;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_And_Op_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to AndOp";
+         
+            end if;
+      end;
+      function As_Arg
+        (Node : Python_Node'Class) return Arg
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Arg;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Arg then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Arg";
+         
+            end if;
+      end;
+      function As_Arg_Assoc
+        (Node : Python_Node'Class) return Arg_Assoc
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Arg_Assoc;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Arg_Assoc_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ArgAssoc";
+         
+            end if;
+      end;
+      function As_Arg_Gen
+        (Node : Python_Node'Class) return Arg_Gen
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Arg_Gen;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Arg_Gen_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ArgGen";
+         
+            end if;
+      end;
+      function As_Python_Node_Base_List
+        (Node : Python_Node'Class) return Python_Node_Base_List
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Python_Node_Base_List;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Python_Node_Base_List then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to PythonNodeBaseList";
+         
+            end if;
+      end;
+      function As_Arg_List
+        (Node : Python_Node'Class) return Arg_List
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Arg_List;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Arg_List_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Arg.list";
+         
+            end if;
+      end;
+      function As_Bin_Op
+        (Node : Python_Node'Class) return Bin_Op
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Bin_Op;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Bin_Op then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to BinOp";
+         
+            end if;
+      end;
+      function As_Arith_Expr
+        (Node : Python_Node'Class) return Arith_Expr
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Arith_Expr;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Arith_Expr_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ArithExpr";
+         
+            end if;
+      end;
+      function As_As_Name_Node
+        (Node : Python_Node'Class) return As_Name_Node
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_As_Name_Node;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_As_Name_Node_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to AsNameNode";
+         
+            end if;
+      end;
+      function As_As_Name_Node_List
+        (Node : Python_Node'Class) return As_Name_Node_List
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_As_Name_Node_List;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_As_Name_Node_List_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to AsNameNode.list";
+         
+            end if;
+      end;
+      function As_Stmt
+        (Node : Python_Node'Class) return Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Stmt then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Stmt";
+         
+            end if;
+      end;
+      function As_Assert_Stmt
+        (Node : Python_Node'Class) return Assert_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Assert_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Assert_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to AssertStmt";
+         
+            end if;
+      end;
+      function As_Assign_Stmt
+        (Node : Python_Node'Class) return Assign_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Assign_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Assign_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to AssignStmt";
+         
+            end if;
+      end;
+      function As_Aug_Assign_Stmt
+        (Node : Python_Node'Class) return Aug_Assign_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Aug_Assign_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Aug_Assign_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to AugAssignStmt";
+         
+            end if;
+      end;
+      function As_Break_Stmt
+        (Node : Python_Node'Class) return Break_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Break_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Break_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to BreakStmt";
+         
+            end if;
+      end;
+      function As_Call_Expr
+        (Node : Python_Node'Class) return Call_Expr
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Call_Expr;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Call_Expr_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CallExpr";
+         
+            end if;
+      end;
+      function As_Def_Stmt
+        (Node : Python_Node'Class) return Def_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Def_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Def_Stmt then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to DefStmt";
+         
+            end if;
+      end;
+      function As_Class_Def
+        (Node : Python_Node'Class) return Class_Def
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Class_Def;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Class_Def_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ClassDef";
+         
+            end if;
+      end;
+      function As_Comprehension
+        (Node : Python_Node'Class) return Comprehension
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comprehension;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comprehension then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Comprehension";
+         
+            end if;
+      end;
+      function As_Comp_For
+        (Node : Python_Node'Class) return Comp_For
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comp_For;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comp_For_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CompFor";
+         
+            end if;
+      end;
+      function As_Comp_ForL
+        (Node : Python_Node'Class) return Comp_ForL
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comp_ForL;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comp_ForL_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CompForL";
+         
+            end if;
+      end;
+      function As_Comp_If
+        (Node : Python_Node'Class) return Comp_If
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comp_If;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comp_If_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CompIf";
+         
+            end if;
+      end;
+      function As_Comp_Op
+        (Node : Python_Node'Class) return Comp_Op
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comp_Op;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comp_Op_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CompOp";
+         
+            end if;
+      end;
+      function As_Comp_Op_Kind
+        (Node : Python_Node'Class) return Comp_Op_Kind
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comp_Op_Kind;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comp_Op_Kind then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CompOpKind";
+         
+            end if;
+      end;
+      function As_Comp_Op_Kind_Diamond
+        (Node : Python_Node'Class) return Comp_Op_Kind_Diamond
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comp_Op_Kind_Diamond;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comp_Op_Kind_Diamond_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CompOpKind.Diamond";
+         
+            end if;
+      end;
+      function As_Comp_Op_Kind_Eq
+        (Node : Python_Node'Class) return Comp_Op_Kind_Eq
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comp_Op_Kind_Eq;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comp_Op_Kind_Eq_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CompOpKind.Eq";
+         
+            end if;
+      end;
+      function As_Comp_Op_Kind_Gt
+        (Node : Python_Node'Class) return Comp_Op_Kind_Gt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comp_Op_Kind_Gt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comp_Op_Kind_Gt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CompOpKind.Gt";
+         
+            end if;
+      end;
+      function As_Comp_Op_Kind_Gte
+        (Node : Python_Node'Class) return Comp_Op_Kind_Gte
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comp_Op_Kind_Gte;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comp_Op_Kind_Gte_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CompOpKind.Gte";
+         
+            end if;
+      end;
+      function As_Comp_Op_Kind_In
+        (Node : Python_Node'Class) return Comp_Op_Kind_In
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comp_Op_Kind_In;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comp_Op_Kind_In_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CompOpKind.In";
+         
+            end if;
+      end;
+      function As_Comp_Op_Kind_Is
+        (Node : Python_Node'Class) return Comp_Op_Kind_Is
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comp_Op_Kind_Is;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comp_Op_Kind_Is_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CompOpKind.Is";
+         
+            end if;
+      end;
+      function As_Comp_Op_Kind_Isnot
+        (Node : Python_Node'Class) return Comp_Op_Kind_Isnot
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comp_Op_Kind_Isnot;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comp_Op_Kind_Isnot_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CompOpKind.Isnot";
+         
+            end if;
+      end;
+      function As_Comp_Op_Kind_Lt
+        (Node : Python_Node'Class) return Comp_Op_Kind_Lt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comp_Op_Kind_Lt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comp_Op_Kind_Lt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CompOpKind.Lt";
+         
+            end if;
+      end;
+      function As_Comp_Op_Kind_Lte
+        (Node : Python_Node'Class) return Comp_Op_Kind_Lte
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comp_Op_Kind_Lte;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comp_Op_Kind_Lte_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CompOpKind.Lte";
+         
+            end if;
+      end;
+      function As_Comp_Op_Kind_Noteq
+        (Node : Python_Node'Class) return Comp_Op_Kind_Noteq
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comp_Op_Kind_Noteq;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comp_Op_Kind_Noteq_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CompOpKind.Noteq";
+         
+            end if;
+      end;
+      function As_Comp_Op_Kind_Notin
+        (Node : Python_Node'Class) return Comp_Op_Kind_Notin
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Comp_Op_Kind_Notin;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Comp_Op_Kind_Notin_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to CompOpKind.Notin";
+         
+            end if;
+      end;
+      function As_Concat_String_Lit
+        (Node : Python_Node'Class) return Concat_String_Lit
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Concat_String_Lit;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Concat_String_Lit_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ConcatStringLit";
+         
+            end if;
+      end;
+      function As_Continue_Stmt
+        (Node : Python_Node'Class) return Continue_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Continue_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Continue_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ContinueStmt";
+         
+            end if;
+      end;
+      function As_Decorated
+        (Node : Python_Node'Class) return Decorated
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Decorated;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Decorated_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Decorated";
+         
+            end if;
+      end;
+      function As_Decorator
+        (Node : Python_Node'Class) return Decorator
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Decorator;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Decorator_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Decorator";
+         
+            end if;
+      end;
+      function As_Decorator_List
+        (Node : Python_Node'Class) return Decorator_List
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Decorator_List;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Decorator_List_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Decorator.list";
+         
+            end if;
+      end;
+      function As_Del_Stmt
+        (Node : Python_Node'Class) return Del_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Del_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Del_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to DelStmt";
+         
+            end if;
+      end;
+      function As_Dict_Assoc
+        (Node : Python_Node'Class) return Dict_Assoc
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Dict_Assoc;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Dict_Assoc_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to DictAssoc";
+         
+            end if;
+      end;
+      function As_Dict_Assoc_List
+        (Node : Python_Node'Class) return Dict_Assoc_List
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Dict_Assoc_List;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Dict_Assoc_List_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to DictAssoc.list";
+         
+            end if;
+      end;
+      function As_Dict_Comp
+        (Node : Python_Node'Class) return Dict_Comp
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Dict_Comp;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Dict_Comp_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to DictComp";
+         
+            end if;
+      end;
+      function As_Dict_Lit
+        (Node : Python_Node'Class) return Dict_Lit
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Dict_Lit;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Dict_Lit_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to DictLit";
+         
+            end if;
+      end;
+      function As_Dot
+        (Node : Python_Node'Class) return Dot
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Dot;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Dot_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Dot";
+         
+            end if;
+      end;
+      function As_Dot_List
+        (Node : Python_Node'Class) return Dot_List
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Dot_List;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Dot_List_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Dot.list";
+         
+            end if;
+      end;
+      function As_Name
+        (Node : Python_Node'Class) return Name
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Name;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Name then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Name";
+         
+            end if;
+      end;
+      function As_Dotted_Name
+        (Node : Python_Node'Class) return Dotted_Name
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Dotted_Name;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Dotted_Name_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to DottedName";
+         
+            end if;
+      end;
+      function As_Elif_Branch
+        (Node : Python_Node'Class) return Elif_Branch
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Elif_Branch;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Elif_Branch_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ElifBranch";
+         
+            end if;
+      end;
+      function As_Elif_Branch_List
+        (Node : Python_Node'Class) return Elif_Branch_List
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Elif_Branch_List;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Elif_Branch_List_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ElifBranch.list";
+         
+            end if;
+      end;
+      function As_Ellipsis_Expr
+        (Node : Python_Node'Class) return Ellipsis_Expr
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Ellipsis_Expr;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Ellipsis_Expr_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to EllipsisExpr";
+         
+            end if;
+      end;
+      function As_Else_Part
+        (Node : Python_Node'Class) return Else_Part
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Else_Part;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Else_Part_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ElsePart";
+         
+            end if;
+      end;
+      function As_Except_Part
+        (Node : Python_Node'Class) return Except_Part
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Except_Part;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Except_Part_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ExceptPart";
+         
+            end if;
+      end;
+      function As_Except_Part_List
+        (Node : Python_Node'Class) return Except_Part_List
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Except_Part_List;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Except_Part_List_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ExceptPart.list";
+         
+            end if;
+      end;
+      function As_Exec_Stmt
+        (Node : Python_Node'Class) return Exec_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Exec_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Exec_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ExecStmt";
+         
+            end if;
+      end;
+      function As_Expr_List
+        (Node : Python_Node'Class) return Expr_List
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Expr_List;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Expr_List_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Expr.list";
+         
+            end if;
+      end;
+      function As_Slice_Expr
+        (Node : Python_Node'Class) return Slice_Expr
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Slice_Expr;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Slice_Expr_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to SliceExpr";
+         
+            end if;
+      end;
+      function As_Ext_Slice_Expr
+        (Node : Python_Node'Class) return Ext_Slice_Expr
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Ext_Slice_Expr;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Ext_Slice_Expr_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ExtSliceExpr";
+         
+            end if;
+      end;
+      function As_Factor
+        (Node : Python_Node'Class) return Factor
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Factor;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Factor_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Factor";
+         
+            end if;
+      end;
+      function As_File_Node
+        (Node : Python_Node'Class) return File_Node
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_File_Node;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_File_Node_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to FileNode";
+         
+            end if;
+      end;
+      function As_For_Stmt
+        (Node : Python_Node'Class) return For_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_For_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_For_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ForStmt";
+         
+            end if;
+      end;
+      function As_Func_Def
+        (Node : Python_Node'Class) return Func_Def
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Func_Def;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Func_Def_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to FuncDef";
+         
+            end if;
+      end;
+      function As_Global_Stmt
+        (Node : Python_Node'Class) return Global_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Global_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Global_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to GlobalStmt";
+         
+            end if;
+      end;
+      function As_Id
+        (Node : Python_Node'Class) return Id
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Id;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Id_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Id";
+         
+            end if;
+      end;
+      function As_Id_List
+        (Node : Python_Node'Class) return Id_List
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Id_List;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Id_List_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Id.list";
+         
+            end if;
+      end;
+      function As_If_Expr
+        (Node : Python_Node'Class) return If_Expr
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_If_Expr;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_If_Expr_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to IfExpr";
+         
+            end if;
+      end;
+      function As_If_Stmt
+        (Node : Python_Node'Class) return If_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_If_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_If_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to IfStmt";
+         
+            end if;
+      end;
+      function As_Import_From
+        (Node : Python_Node'Class) return Import_From
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Import_From;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Import_From_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ImportFrom";
+         
+            end if;
+      end;
+      function As_Import_Name
+        (Node : Python_Node'Class) return Import_Name
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Import_Name;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Import_Name_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ImportName";
+         
+            end if;
+      end;
+      function As_Import_Star
+        (Node : Python_Node'Class) return Import_Star
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Import_Star;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Import_Star_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ImportStar";
+         
+            end if;
+      end;
+      function As_Inline_Eval
+        (Node : Python_Node'Class) return Inline_Eval
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Inline_Eval;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Inline_Eval_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to InlineEval";
+         
+            end if;
+      end;
+      function As_Kw_Args
+        (Node : Python_Node'Class) return Kw_Args
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Kw_Args;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Kw_Args_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to KwArgs";
+         
+            end if;
+      end;
+      function As_Kw_Args_Flag
+        (Node : Python_Node'Class) return Kw_Args_Flag
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Kw_Args_Flag;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Kw_Args_Flag then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to KwArgsFlag";
+         
+            end if;
+      end;
+      function As_Kw_Args_Flag_Absent
+        (Node : Python_Node'Class) return Kw_Args_Flag_Absent
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Kw_Args_Flag_Absent;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Kw_Args_Flag_Absent_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to KwArgsFlag.Absent";
+         
+            end if;
+      end;
+      function As_Kw_Args_Flag_Present
+        (Node : Python_Node'Class) return Kw_Args_Flag_Present
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Kw_Args_Flag_Present;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Kw_Args_Flag_Present_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to KwArgsFlag.Present";
+         
+            end if;
+      end;
+      function As_Lambda_Def
+        (Node : Python_Node'Class) return Lambda_Def
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Lambda_Def;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Lambda_Def_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to LambdaDef";
+         
+            end if;
+      end;
+      function As_List_Comp
+        (Node : Python_Node'Class) return List_Comp
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_List_Comp;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_List_Comp_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ListComp";
+         
+            end if;
+      end;
+      function As_List_Gen
+        (Node : Python_Node'Class) return List_Gen
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_List_Gen;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_List_Gen_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ListGen";
+         
+            end if;
+      end;
+      function As_List_Lit
+        (Node : Python_Node'Class) return List_Lit
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_List_Lit;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_List_Lit_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ListLit";
+         
+            end if;
+      end;
+      function As_NL
+        (Node : Python_Node'Class) return NL
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_NL;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_NL_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to NL";
+         
+            end if;
+      end;
+      function As_NL_List
+        (Node : Python_Node'Class) return NL_List
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_NL_List;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_NL_List_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to NL.list";
+         
+            end if;
+      end;
+      function As_Not_Op
+        (Node : Python_Node'Class) return Not_Op
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Not_Op;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Not_Op_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to NotOp";
+         
+            end if;
+      end;
+      function As_Number_Lit
+        (Node : Python_Node'Class) return Number_Lit
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Number_Lit;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Number_Lit_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to NumberLit";
+         
+            end if;
+      end;
+      function As_Op
+        (Node : Python_Node'Class) return Op
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Op;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Op_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Op";
+         
+            end if;
+      end;
+      function As_Or_Expr
+        (Node : Python_Node'Class) return Or_Expr
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Or_Expr;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Or_Expr_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to OrExpr";
+         
+            end if;
+      end;
+      function As_Or_Op
+        (Node : Python_Node'Class) return Or_Op
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Or_Op;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Or_Op_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to OrOp";
+         
+            end if;
+      end;
+      function As_Params
+        (Node : Python_Node'Class) return Params
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Params;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Params_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Params";
+         
+            end if;
+      end;
+      function As_Pass_Stmt
+        (Node : Python_Node'Class) return Pass_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Pass_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Pass_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to PassStmt";
+         
+            end if;
+      end;
+      function As_Power
+        (Node : Python_Node'Class) return Power
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Power;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Power_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Power";
+         
+            end if;
+      end;
+      function As_Print_Stmt
+        (Node : Python_Node'Class) return Print_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Print_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Print_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to PrintStmt";
+         
+            end if;
+      end;
+      function As_Python_Node_List
+        (Node : Python_Node'Class) return Python_Node_List
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Python_Node_List;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Python_Node_List_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to PythonNode.list";
+         
+            end if;
+      end;
+      function As_Raise_Stmt
+        (Node : Python_Node'Class) return Raise_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Raise_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Raise_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to RaiseStmt";
+         
+            end if;
+      end;
+      function As_Rel_Name
+        (Node : Python_Node'Class) return Rel_Name
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Rel_Name;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Rel_Name_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to RelName";
+         
+            end if;
+      end;
+      function As_Return_Stmt
+        (Node : Python_Node'Class) return Return_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Return_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Return_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ReturnStmt";
+         
+            end if;
+      end;
+      function As_Set_Comp
+        (Node : Python_Node'Class) return Set_Comp
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Set_Comp;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Set_Comp_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to SetComp";
+         
+            end if;
+      end;
+      function As_Set_Lit
+        (Node : Python_Node'Class) return Set_Lit
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Set_Lit;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Set_Lit_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to SetLit";
+         
+            end if;
+      end;
+      function As_Shift_Expr
+        (Node : Python_Node'Class) return Shift_Expr
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Shift_Expr;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Shift_Expr_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to ShiftExpr";
+         
+            end if;
+      end;
+      function As_Single_Param
+        (Node : Python_Node'Class) return Single_Param
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Single_Param;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Single_Param_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to SingleParam";
+         
+            end if;
+      end;
+      function As_Single_Param_List
+        (Node : Python_Node'Class) return Single_Param_List
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Single_Param_List;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Single_Param_List_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to SingleParam.list";
+         
+            end if;
+      end;
+      function As_Stream_Print_Stmt
+        (Node : Python_Node'Class) return Stream_Print_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Stream_Print_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Stream_Print_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to StreamPrintStmt";
+         
+            end if;
+      end;
+      function As_String_Lit
+        (Node : Python_Node'Class) return String_Lit
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_String_Lit;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_String_Lit_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to StringLit";
+         
+            end if;
+      end;
+      function As_String_Lit_List
+        (Node : Python_Node'Class) return String_Lit_List
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_String_Lit_List;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_String_Lit_List_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to StringLit.list";
+         
+            end if;
+      end;
+      function As_Subscript_Expr
+        (Node : Python_Node'Class) return Subscript_Expr
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Subscript_Expr;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Subscript_Expr_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to SubscriptExpr";
+         
+            end if;
+      end;
+      function As_Term
+        (Node : Python_Node'Class) return Term
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Term;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Term_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to Term";
+         
+            end if;
+      end;
+      function As_Try_Stmt
+        (Node : Python_Node'Class) return Try_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Try_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Try_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to TryStmt";
+         
+            end if;
+      end;
+      function As_Tuple_Lit
+        (Node : Python_Node'Class) return Tuple_Lit
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Tuple_Lit;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Tuple_Lit_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to TupleLit";
+         
+            end if;
+      end;
+      function As_Var_Args
+        (Node : Python_Node'Class) return Var_Args
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Var_Args;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Var_Args_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to VarArgs";
+         
+            end if;
+      end;
+      function As_Var_Args_Flag
+        (Node : Python_Node'Class) return Var_Args_Flag
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Var_Args_Flag;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Var_Args_Flag then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to VarArgsFlag";
+         
+            end if;
+      end;
+      function As_Var_Args_Flag_Absent
+        (Node : Python_Node'Class) return Var_Args_Flag_Absent
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Var_Args_Flag_Absent;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Var_Args_Flag_Absent_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to VarArgsFlag.Absent";
+         
+            end if;
+      end;
+      function As_Var_Args_Flag_Present
+        (Node : Python_Node'Class) return Var_Args_Flag_Present
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Var_Args_Flag_Present;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Var_Args_Flag_Present_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to VarArgsFlag.Present";
+         
+            end if;
+      end;
+      function As_While_Stmt
+        (Node : Python_Node'Class) return While_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_While_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_While_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to WhileStmt";
+         
+            end if;
+      end;
+      function As_With_Stmt
+        (Node : Python_Node'Class) return With_Stmt
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_With_Stmt;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_With_Stmt_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to WithStmt";
+         
+            end if;
+      end;
+      function As_Xor_Expr
+        (Node : Python_Node'Class) return Xor_Expr
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Xor_Expr;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Xor_Expr_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to XorExpr";
+         
+            end if;
+      end;
+      function As_Yield_Expr
+        (Node : Python_Node'Class) return Yield_Expr
+      is
+         N : constant Bare_Python_Node := Node.Internal.Node;
+      begin
+         if N = null then
+            return No_Yield_Expr;
+         end if;
+
+         Check_Safety_Net (Node.Safety_Net);
+
+         
+         
+
+            if N.Kind in python_Yield_Expr_Range then
+               
+            return (Internal   => (Node => N, Info => Node.Internal.Info),
+                    Safety_Net => Node.Safety_Net);
+         
+            else
+               
+            raise Constraint_Error with
+              "Libpythonlang: invalid type conversion from "
+              & Node.Kind_Name
+              & " to YieldExpr";
+         
+            end if;
+      end;
+
+   -----------------------
+   -- Entity primitives --
+   -----------------------
+
+   ----------
+   -- Hash --
+   ----------
+
+   function Hash
+     (Node : Python_Node) return Ada.Containers.Hash_Type is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Hash_Entity (Node.Internal);
+   end Hash;
+
+   ----------
+   -- Kind --
+   ----------
+
+   function Kind (Node : Python_Node'Class) return Python_Node_Kind_Type
+   is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Node.Internal.Node.Kind;
+   end Kind;
+
+   ---------------
+   -- Kind_Name --
+   ---------------
+
+   function Kind_Name (Node : Python_Node'Class) return String is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Kind_Name (Node.Internal.Node);
+   end Kind_Name;
+
+      
+
+
+      
+      function To_Public_Text_Type
+         (Value : Character_Type_Array_Access) return Text_Type is
+      begin
+         return Result : Text_Type (1 .. Value.N) do
+            for I in Result'Range loop
+               
+               Result (I - Value.Items'First + Result'First)
+                     := Value.Items (I)
+               ;
+            end loop;
+         end return;
+      end;
+
+
+      
+      function To_Public_Python_Node_Array
+         (Value : Internal_Entity_Array_Access) return Python_Node_Array is
+      begin
+         return Result : Python_Node_Array (1 .. Value.N) do
+            for I in Result'Range loop
+               
+               Result (I - Value.Items'First + Result'First)
+                     := Wrap_Node (Value.Items (I).Node, Value.Items (I).Info)
+               ;
+            end loop;
+         end return;
+      end;
+
+
+      
+
+
+      
+
+
+
+
+
+
+
+
+         
+   function Parent
+     (Node : Python_Node'Class) return Python_Node is
+      
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+
+      declare
+
+         
+         Property_Result
+            : constant
+              Internal_Entity
+            := Libpythonlang.Implementation.Parent
+               (Bare_Python_Node (Node.Internal.Node), E_Info => Node.Internal.Info);
+      begin
+         
+
+            return Wrap_Node (Property_Result.Node, Property_Result.Info);
+      end;
+   end;
+
+         
+   function Parents
+     (Node : Python_Node'Class) return Python_Node_Array is
+      
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+
+      declare
+
+         
+         Property_Result
+            : 
+              Internal_Entity_Array_Access
+            := Libpythonlang.Implementation.Parents
+               (Bare_Python_Node (Node.Internal.Node), E_Info => Node.Internal.Info);
+      begin
+         
+
+            return Result : constant Python_Node_Array :=
+               To_Public_Python_Node_Array (Property_Result)
+            do
+                  Dec_Ref (Property_Result);
+            end return;
+      end;
+   end;
+
+         
+   function Children
+     (Node : Python_Node'Class) return Python_Node_Array is
+      
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+
+      declare
+
+         
+         Property_Result
+            : 
+              Internal_Entity_Array_Access
+            := Libpythonlang.Implementation.Children
+               (Bare_Python_Node (Node.Internal.Node), E_Info => Node.Internal.Info);
+      begin
+         
+
+            return Result : constant Python_Node_Array :=
+               To_Public_Python_Node_Array (Property_Result)
+            do
+                  Dec_Ref (Property_Result);
+            end return;
+      end;
+   end;
+
+         
+   function Token_Start
+     (Node : Python_Node'Class) return Token_Reference is
+      
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+
+      declare
+
+         
+         Property_Result
+            : constant
+              Token_Reference
+            := Libpythonlang.Implementation.Token_Start
+               (Bare_Python_Node (Node.Internal.Node));
+      begin
+         
+
+            return Property_Result;
+      end;
+   end;
+
+         
+   function Token_End
+     (Node : Python_Node'Class) return Token_Reference is
+      
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+
+      declare
+
+         
+         Property_Result
+            : constant
+              Token_Reference
+            := Libpythonlang.Implementation.Token_End
+               (Bare_Python_Node (Node.Internal.Node));
+      begin
+         
+
+            return Property_Result;
+      end;
+   end;
+
+         
+   function Child_Index
+     (Node : Python_Node'Class) return Integer is
+      
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+
+      declare
+
+         
+         Property_Result
+            : constant
+              Integer
+            := Libpythonlang.Implementation.Child_Index
+               (Bare_Python_Node (Node.Internal.Node));
+      begin
+         
+
+            return Property_Result;
+      end;
+   end;
+
+         
+   function Previous_Sibling
+     (Node : Python_Node'Class) return Python_Node is
+      
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+
+      declare
+
+         
+         Property_Result
+            : constant
+              Internal_Entity
+            := Libpythonlang.Implementation.Previous_Sibling
+               (Bare_Python_Node (Node.Internal.Node), E_Info => Node.Internal.Info);
+      begin
+         
+
+            return Wrap_Node (Property_Result.Node, Property_Result.Info);
+      end;
+   end;
+
+         
+   function Next_Sibling
+     (Node : Python_Node'Class) return Python_Node is
+      
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+
+      declare
+
+         
+         Property_Result
+            : constant
+              Internal_Entity
+            := Libpythonlang.Implementation.Next_Sibling
+               (Bare_Python_Node (Node.Internal.Node), E_Info => Node.Internal.Info);
+      begin
+         
+
+            return Wrap_Node (Property_Result.Node, Property_Result.Info);
+      end;
+   end;
+
+         
+   function Unit
+     (Node : Python_Node'Class) return Analysis_Unit is
+      
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+
+      declare
+
+         
+         Property_Result
+            : constant
+              Internal_Unit
+            := Libpythonlang.Implementation.Unit
+               (Bare_Python_Node (Node.Internal.Node));
+      begin
+         
+
+            return Wrap_Unit (Property_Result);
+      end;
+   end;
+
+         
+   function Is_Ghost
+     (Node : Python_Node'Class) return Boolean is
+      
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+
+      declare
+
+         
+         Property_Result
+            : constant
+              Boolean
+            := Libpythonlang.Implementation.Is_Ghost
+               (Bare_Python_Node (Node.Internal.Node));
+      begin
+         
+
+            return Property_Result;
+      end;
+   end;
+
+         
+   function Full_Sloc_Image
+     (Node : Python_Node'Class) return Text_Type is
+      
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+
+      declare
+
+         
+         Property_Result
+            : 
+              Character_Type_Array_Access
+            := Libpythonlang.Implementation.Full_Sloc_Image
+               (Bare_Python_Node (Node.Internal.Node));
+      begin
+         
+
+            return Result : constant Text_Type :=
+               To_Public_Text_Type (Property_Result)
+            do
+                  Dec_Ref (Property_Result);
+            end return;
+      end;
+   end;
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Left
+     (Node : And_Expr'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.And_Expr_F_Left (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Left;
+
+
+         
+   
+
+   function F_Right
+     (Node : And_Expr'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.And_Expr_F_Right (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Right;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Left
+     (Node : And_Op'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.And_Op_F_Left (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Left;
+
+
+         
+   
+
+   function F_Right
+     (Node : And_Op'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.And_Op_F_Right (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Right;
+
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Name
+     (Node : Arg_Assoc'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Arg_Assoc_F_Name (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Name;
+
+
+         
+   
+
+   function F_Expr
+     (Node : Arg_Assoc'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Arg_Assoc_F_Expr (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Expr;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Expr
+     (Node : Arg_Gen'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Arg_Gen_F_Expr (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Expr;
+
+
+         
+   
+
+   function F_Comprehension
+     (Node : Arg_Gen'Class) return Comp_For
+   is
+      Result : Bare_Comp_For;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Arg_Gen_F_Comprehension (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Comprehension;
+
+
+
+
+
+
+
+
+
+
+         
+         ----------------
+         -- List_Child --
+         ----------------
+
+         function List_Child
+           (Node : Arg_List'Class; Index : Positive) return Arg
+         is
+            Result : constant Python_Node := Node.Child (Index);
+         begin
+            return Result.As_Arg;
+         end List_Child;
+
+         
+
+         function Arg_List_First (Node : Arg_List) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return 1;
+         end;
+
+         function Arg_List_Next
+           (Node : Arg_List; Cursor : Positive) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return Cursor + 1;
+         end;
+
+         function Arg_List_Has_Element
+           (Node : Arg_List; Cursor : Positive) return Boolean
+         is
+         begin
+            return Cursor in 1 .. Node.Children_Count;
+         end;
+
+         function Arg_List_Element
+           (Node : Arg_List; Cursor : Positive) return Arg'Class
+         is
+            Child : constant Python_Node := Node.Child (Cursor);
+         begin
+            return Arg'(Child.As_Arg);
+         end;
+
+
+
+
+
+
+         
+   
+
+   function F_Left
+     (Node : Bin_Op'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Bin_Op_F_Left (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Left;
+
+
+         
+   
+
+   function F_Op
+     (Node : Bin_Op'Class) return Op
+   is
+      Result : Bare_Op;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Bin_Op_F_Op (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Op;
+
+
+         
+   
+
+   function F_Right
+     (Node : Bin_Op'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Bin_Op_F_Right (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Right;
+
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Imported
+     (Node : As_Name_Node'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.As_Name_Node_F_Imported (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Imported;
+
+
+         
+   
+
+   function F_As_Name
+     (Node : As_Name_Node'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.As_Name_Node_F_As_Name (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_As_Name;
+
+
+
+
+
+         
+         ----------------
+         -- List_Child --
+         ----------------
+
+         function List_Child
+           (Node : As_Name_Node_List'Class; Index : Positive) return As_Name_Node
+         is
+            Result : constant Python_Node := Node.Child (Index);
+         begin
+            return Result.As_As_Name_Node;
+         end List_Child;
+
+         
+
+         function As_Name_Node_List_First (Node : As_Name_Node_List) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return 1;
+         end;
+
+         function As_Name_Node_List_Next
+           (Node : As_Name_Node_List; Cursor : Positive) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return Cursor + 1;
+         end;
+
+         function As_Name_Node_List_Has_Element
+           (Node : As_Name_Node_List; Cursor : Positive) return Boolean
+         is
+         begin
+            return Cursor in 1 .. Node.Children_Count;
+         end;
+
+         function As_Name_Node_List_Element
+           (Node : As_Name_Node_List; Cursor : Positive) return As_Name_Node'Class
+         is
+            Child : constant Python_Node := Node.Child (Cursor);
+         begin
+            return As_Name_Node'(Child.As_As_Name_Node);
+         end;
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Test_Expr
+     (Node : Assert_Stmt'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Assert_Stmt_F_Test_Expr (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Test_Expr;
+
+
+         
+   
+
+   function F_Msg
+     (Node : Assert_Stmt'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Assert_Stmt_F_Msg (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Msg;
+
+
+
+
+
+
+
+         
+   
+
+   function F_L_Value
+     (Node : Assign_Stmt'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Assign_Stmt_F_L_Value (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_L_Value;
+
+
+         
+   
+
+   function F_R_Values
+     (Node : Assign_Stmt'Class) return Python_Node_List
+   is
+      Result : Bare_Python_Node_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Assign_Stmt_F_R_Values (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_R_Values;
+
+
+
+
+
+
+
+         
+   
+
+   function F_L_Value
+     (Node : Aug_Assign_Stmt'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Aug_Assign_Stmt_F_L_Value (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_L_Value;
+
+
+         
+   
+
+   function F_Op
+     (Node : Aug_Assign_Stmt'Class) return Op
+   is
+      Result : Bare_Op;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Aug_Assign_Stmt_F_Op (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Op;
+
+
+         
+   
+
+   function F_R_Value
+     (Node : Aug_Assign_Stmt'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Aug_Assign_Stmt_F_R_Value (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_R_Value;
+
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Prefix
+     (Node : Call_Expr'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Call_Expr_F_Prefix (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Prefix;
+
+
+         
+   
+
+   function F_Suffix
+     (Node : Call_Expr'Class) return Arg_List
+   is
+      Result : Bare_Arg_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Call_Expr_F_Suffix (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Suffix;
+
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Name
+     (Node : Class_Def'Class) return Id
+   is
+      Result : Bare_Id;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Class_Def_F_Name (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Name;
+
+
+         
+   
+
+   function F_Bases
+     (Node : Class_Def'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Class_Def_F_Bases (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Bases;
+
+
+         
+   
+
+   function F_Statements
+     (Node : Class_Def'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Class_Def_F_Statements (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Statements;
+
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Exprs
+     (Node : Comp_For'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Comp_For_F_Exprs (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Exprs;
+
+
+         
+   
+
+   function F_Target
+     (Node : Comp_For'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Comp_For_F_Target (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Target;
+
+
+         
+   
+
+   function F_Comp
+     (Node : Comp_For'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Comp_For_F_Comp (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Comp;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Exprs
+     (Node : Comp_ForL'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Comp_ForL_F_Exprs (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Exprs;
+
+
+         
+   
+
+   function F_Target
+     (Node : Comp_ForL'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Comp_ForL_F_Target (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Target;
+
+
+         
+   
+
+   function F_Comp
+     (Node : Comp_ForL'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Comp_ForL_F_Comp (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Comp;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Test
+     (Node : Comp_If'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Comp_If_F_Test (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Test;
+
+
+         
+   
+
+   function F_Comp
+     (Node : Comp_If'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Comp_If_F_Comp (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Comp;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Left
+     (Node : Comp_Op'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Comp_Op_F_Left (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Left;
+
+
+         
+   
+
+   function F_Op
+     (Node : Comp_Op'Class) return Comp_Op_Kind
+   is
+      Result : Bare_Comp_Op_Kind;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Comp_Op_F_Op (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Op;
+
+         function F_Op
+           (Node : Comp_Op'Class) return python_Comp_Op_Kind
+         is (Comp_Op_Kind'(Node.F_Op).Kind);
+
+         
+   
+
+   function F_Right
+     (Node : Comp_Op'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Comp_Op_F_Right (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Right;
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_First_Str
+     (Node : Concat_String_Lit'Class) return String_Lit
+   is
+      Result : Bare_String_Lit;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Concat_String_Lit_F_First_Str (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_First_Str;
+
+
+         
+   
+
+   function F_Subsequent_Str
+     (Node : Concat_String_Lit'Class) return String_Lit_List
+   is
+      Result : Bare_String_Lit_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Concat_String_Lit_F_Subsequent_Str (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Subsequent_Str;
+
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Decorators
+     (Node : Decorated'Class) return Decorator_List
+   is
+      Result : Bare_Decorator_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Decorated_F_Decorators (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Decorators;
+
+
+         
+   
+
+   function F_Defn
+     (Node : Decorated'Class) return Def_Stmt
+   is
+      Result : Bare_Def_Stmt;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Decorated_F_Defn (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Defn;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Dec_Name
+     (Node : Decorator'Class) return Name
+   is
+      Result : Bare_Name;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Decorator_F_Dec_Name (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Dec_Name;
+
+
+         
+   
+
+   function F_Arg_List
+     (Node : Decorator'Class) return Arg_List
+   is
+      Result : Bare_Arg_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Decorator_F_Arg_List (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Arg_List;
+
+
+
+
+
+         
+         ----------------
+         -- List_Child --
+         ----------------
+
+         function List_Child
+           (Node : Decorator_List'Class; Index : Positive) return Decorator
+         is
+            Result : constant Python_Node := Node.Child (Index);
+         begin
+            return Result.As_Decorator;
+         end List_Child;
+
+         
+
+         function Decorator_List_First (Node : Decorator_List) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return 1;
+         end;
+
+         function Decorator_List_Next
+           (Node : Decorator_List; Cursor : Positive) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return Cursor + 1;
+         end;
+
+         function Decorator_List_Has_Element
+           (Node : Decorator_List; Cursor : Positive) return Boolean
+         is
+         begin
+            return Cursor in 1 .. Node.Children_Count;
+         end;
+
+         function Decorator_List_Element
+           (Node : Decorator_List; Cursor : Positive) return Decorator'Class
+         is
+            Child : constant Python_Node := Node.Child (Cursor);
+         begin
+            return Decorator'(Child.As_Decorator);
+         end;
+
+
+
+
+
+
+         
+   
+
+   function F_Exprs
+     (Node : Del_Stmt'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Del_Stmt_F_Exprs (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Exprs;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Key
+     (Node : Dict_Assoc'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Dict_Assoc_F_Key (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Key;
+
+
+         
+   
+
+   function F_Value
+     (Node : Dict_Assoc'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Dict_Assoc_F_Value (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Value;
+
+
+
+
+
+         
+         ----------------
+         -- List_Child --
+         ----------------
+
+         function List_Child
+           (Node : Dict_Assoc_List'Class; Index : Positive) return Dict_Assoc
+         is
+            Result : constant Python_Node := Node.Child (Index);
+         begin
+            return Result.As_Dict_Assoc;
+         end List_Child;
+
+         
+
+         function Dict_Assoc_List_First (Node : Dict_Assoc_List) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return 1;
+         end;
+
+         function Dict_Assoc_List_Next
+           (Node : Dict_Assoc_List; Cursor : Positive) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return Cursor + 1;
+         end;
+
+         function Dict_Assoc_List_Has_Element
+           (Node : Dict_Assoc_List; Cursor : Positive) return Boolean
+         is
+         begin
+            return Cursor in 1 .. Node.Children_Count;
+         end;
+
+         function Dict_Assoc_List_Element
+           (Node : Dict_Assoc_List; Cursor : Positive) return Dict_Assoc'Class
+         is
+            Child : constant Python_Node := Node.Child (Cursor);
+         begin
+            return Dict_Assoc'(Child.As_Dict_Assoc);
+         end;
+
+
+
+
+
+
+         
+   
+
+   function F_Assoc
+     (Node : Dict_Comp'Class) return Dict_Assoc
+   is
+      Result : Bare_Dict_Assoc;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Dict_Comp_F_Assoc (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Assoc;
+
+
+         
+   
+
+   function F_Comprehension
+     (Node : Dict_Comp'Class) return Comp_For
+   is
+      Result : Bare_Comp_For;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Dict_Comp_F_Comprehension (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Comprehension;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Assocs
+     (Node : Dict_Lit'Class) return Dict_Assoc_List
+   is
+      Result : Bare_Dict_Assoc_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Dict_Lit_F_Assocs (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Assocs;
+
+
+
+
+
+
+
+
+
+
+         
+         ----------------
+         -- List_Child --
+         ----------------
+
+         function List_Child
+           (Node : Dot_List'Class; Index : Positive) return Dot
+         is
+            Result : constant Python_Node := Node.Child (Index);
+         begin
+            return Result.As_Dot;
+         end List_Child;
+
+         
+
+         function Dot_List_First (Node : Dot_List) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return 1;
+         end;
+
+         function Dot_List_Next
+           (Node : Dot_List; Cursor : Positive) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return Cursor + 1;
+         end;
+
+         function Dot_List_Has_Element
+           (Node : Dot_List; Cursor : Positive) return Boolean
+         is
+         begin
+            return Cursor in 1 .. Node.Children_Count;
+         end;
+
+         function Dot_List_Element
+           (Node : Dot_List; Cursor : Positive) return Dot'Class
+         is
+            Child : constant Python_Node := Node.Child (Cursor);
+         begin
+            return Dot'(Child.As_Dot);
+         end;
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Prefix
+     (Node : Dotted_Name'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Dotted_Name_F_Prefix (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Prefix;
+
+
+         
+   
+
+   function F_Suffix
+     (Node : Dotted_Name'Class) return Id
+   is
+      Result : Bare_Id;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Dotted_Name_F_Suffix (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Suffix;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Cond_Test
+     (Node : Elif_Branch'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Elif_Branch_F_Cond_Test (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Cond_Test;
+
+
+         
+   
+
+   function F_Statements
+     (Node : Elif_Branch'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Elif_Branch_F_Statements (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Statements;
+
+
+
+
+
+         
+         ----------------
+         -- List_Child --
+         ----------------
+
+         function List_Child
+           (Node : Elif_Branch_List'Class; Index : Positive) return Elif_Branch
+         is
+            Result : constant Python_Node := Node.Child (Index);
+         begin
+            return Result.As_Elif_Branch;
+         end List_Child;
+
+         
+
+         function Elif_Branch_List_First (Node : Elif_Branch_List) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return 1;
+         end;
+
+         function Elif_Branch_List_Next
+           (Node : Elif_Branch_List; Cursor : Positive) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return Cursor + 1;
+         end;
+
+         function Elif_Branch_List_Has_Element
+           (Node : Elif_Branch_List; Cursor : Positive) return Boolean
+         is
+         begin
+            return Cursor in 1 .. Node.Children_Count;
+         end;
+
+         function Elif_Branch_List_Element
+           (Node : Elif_Branch_List; Cursor : Positive) return Elif_Branch'Class
+         is
+            Child : constant Python_Node := Node.Child (Cursor);
+         begin
+            return Elif_Branch'(Child.As_Elif_Branch);
+         end;
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Statements
+     (Node : Else_Part'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Else_Part_F_Statements (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Statements;
+
+
+
+
+
+
+
+         
+   
+
+   function F_As_Name
+     (Node : Except_Part'Class) return As_Name_Node
+   is
+      Result : Bare_As_Name_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Except_Part_F_As_Name (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_As_Name;
+
+
+         
+   
+
+   function F_Statements
+     (Node : Except_Part'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Except_Part_F_Statements (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Statements;
+
+
+
+
+
+         
+         ----------------
+         -- List_Child --
+         ----------------
+
+         function List_Child
+           (Node : Except_Part_List'Class; Index : Positive) return Except_Part
+         is
+            Result : constant Python_Node := Node.Child (Index);
+         begin
+            return Result.As_Except_Part;
+         end List_Child;
+
+         
+
+         function Except_Part_List_First (Node : Except_Part_List) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return 1;
+         end;
+
+         function Except_Part_List_Next
+           (Node : Except_Part_List; Cursor : Positive) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return Cursor + 1;
+         end;
+
+         function Except_Part_List_Has_Element
+           (Node : Except_Part_List; Cursor : Positive) return Boolean
+         is
+         begin
+            return Cursor in 1 .. Node.Children_Count;
+         end;
+
+         function Except_Part_List_Element
+           (Node : Except_Part_List; Cursor : Positive) return Except_Part'Class
+         is
+            Child : constant Python_Node := Node.Child (Cursor);
+         begin
+            return Except_Part'(Child.As_Except_Part);
+         end;
+
+
+
+
+
+
+         
+   
+
+   function F_Expr
+     (Node : Exec_Stmt'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Exec_Stmt_F_Expr (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Expr;
+
+
+         
+   
+
+   function F_In_List
+     (Node : Exec_Stmt'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Exec_Stmt_F_In_List (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_In_List;
+
+
+
+
+
+         
+         ----------------
+         -- List_Child --
+         ----------------
+
+         function List_Child
+           (Node : Expr_List'Class; Index : Positive) return Expr
+         is
+            Result : constant Python_Node := Node.Child (Index);
+         begin
+            return Result.As_Expr;
+         end List_Child;
+
+         
+
+         function Expr_List_First (Node : Expr_List) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return 1;
+         end;
+
+         function Expr_List_Next
+           (Node : Expr_List; Cursor : Positive) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return Cursor + 1;
+         end;
+
+         function Expr_List_Has_Element
+           (Node : Expr_List; Cursor : Positive) return Boolean
+         is
+         begin
+            return Cursor in 1 .. Node.Children_Count;
+         end;
+
+         function Expr_List_Element
+           (Node : Expr_List; Cursor : Positive) return Expr'Class
+         is
+            Child : constant Python_Node := Node.Child (Cursor);
+         begin
+            return Expr'(Child.As_Expr);
+         end;
+
+
+
+
+
+
+         
+   
+
+   function F_First
+     (Node : Slice_Expr'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Slice_Expr_F_First (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_First;
+
+
+         
+   
+
+   function F_Last
+     (Node : Slice_Expr'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Slice_Expr_F_Last (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Last;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Stride
+     (Node : Ext_Slice_Expr'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Ext_Slice_Expr_F_Stride (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Stride;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Op
+     (Node : Factor'Class) return Op
+   is
+      Result : Bare_Op;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Factor_F_Op (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Op;
+
+
+         
+   
+
+   function F_Expr
+     (Node : Factor'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Factor_F_Expr (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Expr;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Statements
+     (Node : File_Node'Class) return Python_Node_List
+   is
+      Result : Bare_Python_Node_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.File_Node_F_Statements (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Statements;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Bindings
+     (Node : For_Stmt'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.For_Stmt_F_Bindings (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Bindings;
+
+
+         
+   
+
+   function F_Expr
+     (Node : For_Stmt'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.For_Stmt_F_Expr (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Expr;
+
+
+         
+   
+
+   function F_Statements
+     (Node : For_Stmt'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.For_Stmt_F_Statements (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Statements;
+
+
+         
+   
+
+   function F_Else_Part
+     (Node : For_Stmt'Class) return Else_Part
+   is
+      Result : Bare_Else_Part;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.For_Stmt_F_Else_Part (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Else_Part;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Name
+     (Node : Func_Def'Class) return Id
+   is
+      Result : Bare_Id;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Func_Def_F_Name (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Name;
+
+
+         
+   
+
+   function F_Parameters
+     (Node : Func_Def'Class) return Params
+   is
+      Result : Bare_Params;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Func_Def_F_Parameters (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Parameters;
+
+
+         
+   
+
+   function F_Body
+     (Node : Func_Def'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Func_Def_F_Body (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Body;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Names
+     (Node : Global_Stmt'Class) return Id_List
+   is
+      Result : Bare_Id_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Global_Stmt_F_Names (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Names;
+
+
+
+
+
+
+
+
+
+
+         
+         ----------------
+         -- List_Child --
+         ----------------
+
+         function List_Child
+           (Node : Id_List'Class; Index : Positive) return Id
+         is
+            Result : constant Python_Node := Node.Child (Index);
+         begin
+            return Result.As_Id;
+         end List_Child;
+
+         
+
+         function Id_List_First (Node : Id_List) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return 1;
+         end;
+
+         function Id_List_Next
+           (Node : Id_List; Cursor : Positive) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return Cursor + 1;
+         end;
+
+         function Id_List_Has_Element
+           (Node : Id_List; Cursor : Positive) return Boolean
+         is
+         begin
+            return Cursor in 1 .. Node.Children_Count;
+         end;
+
+         function Id_List_Element
+           (Node : Id_List; Cursor : Positive) return Id'Class
+         is
+            Child : constant Python_Node := Node.Child (Cursor);
+         begin
+            return Id'(Child.As_Id);
+         end;
+
+
+
+
+
+
+         
+   
+
+   function F_Expr
+     (Node : If_Expr'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.If_Expr_F_Expr (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Expr;
+
+
+         
+   
+
+   function F_Cond
+     (Node : If_Expr'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.If_Expr_F_Cond (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Cond;
+
+
+         
+   
+
+   function F_Else_Expr
+     (Node : If_Expr'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.If_Expr_F_Else_Expr (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Else_Expr;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Cond_Test
+     (Node : If_Stmt'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.If_Stmt_F_Cond_Test (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Cond_Test;
+
+
+         
+   
+
+   function F_Statements
+     (Node : If_Stmt'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.If_Stmt_F_Statements (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Statements;
+
+
+         
+   
+
+   function F_Elif_Branchs
+     (Node : If_Stmt'Class) return Elif_Branch_List
+   is
+      Result : Bare_Elif_Branch_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.If_Stmt_F_Elif_Branchs (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Elif_Branchs;
+
+
+         
+   
+
+   function F_Else_Part
+     (Node : If_Stmt'Class) return Else_Part
+   is
+      Result : Bare_Else_Part;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.If_Stmt_F_Else_Part (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Else_Part;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Rel_Name
+     (Node : Import_From'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Import_From_F_Rel_Name (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Rel_Name;
+
+
+         
+   
+
+   function F_Imported
+     (Node : Import_From'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Import_From_F_Imported (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Imported;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Imported_Names
+     (Node : Import_Name'Class) return Python_Node_List
+   is
+      Result : Bare_Python_Node_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Import_Name_F_Imported_Names (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Imported_Names;
+
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Exprs
+     (Node : Inline_Eval'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Inline_Eval_F_Exprs (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Exprs;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Expr
+     (Node : Kw_Args'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Kw_Args_F_Expr (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Expr;
+
+
+
+
+
+
+
+
+         
+   function P_As_Bool
+     (Node : Kw_Args_Flag'Class) return Boolean is
+      
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+
+      declare
+
+         
+         Property_Result
+            : constant
+              Boolean
+            := Libpythonlang.Implementation.Dispatcher_Kw_Args_Flag_P_As_Bool
+               (Bare_Python_Node (Node.Internal.Node));
+      begin
+         
+
+            return Property_Result;
+      end;
+   end;
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Args
+     (Node : Lambda_Def'Class) return Params
+   is
+      Result : Bare_Params;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Lambda_Def_F_Args (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Args;
+
+
+         
+   
+
+   function F_Expr
+     (Node : Lambda_Def'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Lambda_Def_F_Expr (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Expr;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Expr
+     (Node : List_Comp'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.List_Comp_F_Expr (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Expr;
+
+
+         
+   
+
+   function F_Comprehension
+     (Node : List_Comp'Class) return Comp_ForL
+   is
+      Result : Bare_Comp_ForL;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.List_Comp_F_Comprehension (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Comprehension;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Expr
+     (Node : List_Gen'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.List_Gen_F_Expr (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Expr;
+
+
+         
+   
+
+   function F_Comprehension
+     (Node : List_Gen'Class) return Comp_ForL
+   is
+      Result : Bare_Comp_ForL;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.List_Gen_F_Comprehension (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Comprehension;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Exprs
+     (Node : List_Lit'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.List_Lit_F_Exprs (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Exprs;
+
+
+
+
+
+
+
+
+
+
+         
+         ----------------
+         -- List_Child --
+         ----------------
+
+         function List_Child
+           (Node : NL_List'Class; Index : Positive) return NL
+         is
+            Result : constant Python_Node := Node.Child (Index);
+         begin
+            return Result.As_NL;
+         end List_Child;
+
+         
+
+         function NL_List_First (Node : NL_List) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return 1;
+         end;
+
+         function NL_List_Next
+           (Node : NL_List; Cursor : Positive) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return Cursor + 1;
+         end;
+
+         function NL_List_Has_Element
+           (Node : NL_List; Cursor : Positive) return Boolean
+         is
+         begin
+            return Cursor in 1 .. Node.Children_Count;
+         end;
+
+         function NL_List_Element
+           (Node : NL_List; Cursor : Positive) return NL'Class
+         is
+            Child : constant Python_Node := Node.Child (Cursor);
+         begin
+            return NL'(Child.As_NL);
+         end;
+
+
+
+
+
+
+         
+   
+
+   function F_Expr
+     (Node : Not_Op'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Not_Op_F_Expr (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Expr;
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Left
+     (Node : Or_Expr'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Or_Expr_F_Left (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Left;
+
+
+         
+   
+
+   function F_Right
+     (Node : Or_Expr'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Or_Expr_F_Right (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Right;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Left
+     (Node : Or_Op'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Or_Op_F_Left (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Left;
+
+
+         
+   
+
+   function F_Right
+     (Node : Or_Op'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Or_Op_F_Right (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Right;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Single_Params
+     (Node : Params'Class) return Single_Param_List
+   is
+      Result : Bare_Single_Param_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Params_F_Single_Params (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Single_Params;
+
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Left
+     (Node : Power'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Power_F_Left (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Left;
+
+
+         
+   
+
+   function F_Right
+     (Node : Power'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Power_F_Right (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Right;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Exprs
+     (Node : Print_Stmt'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Print_Stmt_F_Exprs (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Exprs;
+
+
+
+
+
+
+         
+
+         function Python_Node_List_First (Node : Python_Node_List) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return 1;
+         end;
+
+         function Python_Node_List_Next
+           (Node : Python_Node_List; Cursor : Positive) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return Cursor + 1;
+         end;
+
+         function Python_Node_List_Has_Element
+           (Node : Python_Node_List; Cursor : Positive) return Boolean
+         is
+         begin
+            return Cursor in 1 .. Node.Children_Count;
+         end;
+
+         function Python_Node_List_Element
+           (Node : Python_Node_List; Cursor : Positive) return Python_Node'Class
+         is
+            Child : constant Python_Node := Node.Child (Cursor);
+         begin
+            return Python_Node'(Child.As_Python_Node);
+         end;
+
+
+
+
+
+
+         
+   
+
+   function F_Exprs
+     (Node : Raise_Stmt'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Raise_Stmt_F_Exprs (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Exprs;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Dots
+     (Node : Rel_Name'Class) return Dot_List
+   is
+      Result : Bare_Dot_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Rel_Name_F_Dots (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Dots;
+
+
+         
+   
+
+   function F_Name
+     (Node : Rel_Name'Class) return Name
+   is
+      Result : Bare_Name;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Rel_Name_F_Name (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Name;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Exprs
+     (Node : Return_Stmt'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Return_Stmt_F_Exprs (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Exprs;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Expr
+     (Node : Set_Comp'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Set_Comp_F_Expr (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Expr;
+
+
+         
+   
+
+   function F_Comprehension
+     (Node : Set_Comp'Class) return Comp_For
+   is
+      Result : Bare_Comp_For;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Set_Comp_F_Comprehension (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Comprehension;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Exprs
+     (Node : Set_Lit'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Set_Lit_F_Exprs (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Exprs;
+
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Is_Varargs
+     (Node : Single_Param'Class) return Var_Args_Flag
+   is
+      Result : Bare_Var_Args_Flag;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Single_Param_F_Is_Varargs (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Is_Varargs;
+
+         function F_Is_Varargs (Node : Single_Param'Class) return Boolean
+         is (Var_Args_Flag'(Node.F_Is_Varargs).Kind
+             = python_Var_Args_Flag_Present);
+
+
+         
+   
+
+   function F_Is_Kwargs
+     (Node : Single_Param'Class) return Kw_Args_Flag
+   is
+      Result : Bare_Kw_Args_Flag;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Single_Param_F_Is_Kwargs (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Is_Kwargs;
+
+         function F_Is_Kwargs (Node : Single_Param'Class) return Boolean
+         is (Kw_Args_Flag'(Node.F_Is_Kwargs).Kind
+             = python_Kw_Args_Flag_Present);
+
+
+         
+   
+
+   function F_Name
+     (Node : Single_Param'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Single_Param_F_Name (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Name;
+
+
+         
+   
+
+   function F_Default_Value
+     (Node : Single_Param'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Single_Param_F_Default_Value (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Default_Value;
+
+
+
+
+
+         
+         ----------------
+         -- List_Child --
+         ----------------
+
+         function List_Child
+           (Node : Single_Param_List'Class; Index : Positive) return Single_Param
+         is
+            Result : constant Python_Node := Node.Child (Index);
+         begin
+            return Result.As_Single_Param;
+         end List_Child;
+
+         
+
+         function Single_Param_List_First (Node : Single_Param_List) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return 1;
+         end;
+
+         function Single_Param_List_Next
+           (Node : Single_Param_List; Cursor : Positive) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return Cursor + 1;
+         end;
+
+         function Single_Param_List_Has_Element
+           (Node : Single_Param_List; Cursor : Positive) return Boolean
+         is
+         begin
+            return Cursor in 1 .. Node.Children_Count;
+         end;
+
+         function Single_Param_List_Element
+           (Node : Single_Param_List; Cursor : Positive) return Single_Param'Class
+         is
+            Child : constant Python_Node := Node.Child (Cursor);
+         begin
+            return Single_Param'(Child.As_Single_Param);
+         end;
+
+
+
+
+
+
+         
+   
+
+   function F_Stream_Expr
+     (Node : Stream_Print_Stmt'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Stream_Print_Stmt_F_Stream_Expr (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Stream_Expr;
+
+
+         
+   
+
+   function F_Exprs
+     (Node : Stream_Print_Stmt'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Stream_Print_Stmt_F_Exprs (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Exprs;
+
+
+
+
+
+
+
+
+
+
+         
+         ----------------
+         -- List_Child --
+         ----------------
+
+         function List_Child
+           (Node : String_Lit_List'Class; Index : Positive) return String_Lit
+         is
+            Result : constant Python_Node := Node.Child (Index);
+         begin
+            return Result.As_String_Lit;
+         end List_Child;
+
+         
+
+         function String_Lit_List_First (Node : String_Lit_List) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return 1;
+         end;
+
+         function String_Lit_List_Next
+           (Node : String_Lit_List; Cursor : Positive) return Positive
+         is
+           pragma Unreferenced (Node);
+         begin
+            return Cursor + 1;
+         end;
+
+         function String_Lit_List_Has_Element
+           (Node : String_Lit_List; Cursor : Positive) return Boolean
+         is
+         begin
+            return Cursor in 1 .. Node.Children_Count;
+         end;
+
+         function String_Lit_List_Element
+           (Node : String_Lit_List; Cursor : Positive) return String_Lit'Class
+         is
+            Child : constant Python_Node := Node.Child (Cursor);
+         begin
+            return String_Lit'(Child.As_String_Lit);
+         end;
+
+
+
+
+
+
+         
+   
+
+   function F_Prefix
+     (Node : Subscript_Expr'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Subscript_Expr_F_Prefix (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Prefix;
+
+
+         
+   
+
+   function F_Suffix
+     (Node : Subscript_Expr'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Subscript_Expr_F_Suffix (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Suffix;
+
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Statements
+     (Node : Try_Stmt'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Try_Stmt_F_Statements (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Statements;
+
+
+         
+   
+
+   function F_Except_Parts
+     (Node : Try_Stmt'Class) return Except_Part_List
+   is
+      Result : Bare_Except_Part_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Try_Stmt_F_Except_Parts (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Except_Parts;
+
+
+         
+   
+
+   function F_Else_Part
+     (Node : Try_Stmt'Class) return Else_Part
+   is
+      Result : Bare_Else_Part;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Try_Stmt_F_Else_Part (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Else_Part;
+
+
+         
+   
+
+   function F_Finally_Part
+     (Node : Try_Stmt'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Try_Stmt_F_Finally_Part (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Finally_Part;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Exprs
+     (Node : Tuple_Lit'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Tuple_Lit_F_Exprs (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Exprs;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Expr
+     (Node : Var_Args'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Var_Args_F_Expr (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Expr;
+
+
+
+
+
+
+
+
+         
+   function P_As_Bool
+     (Node : Var_Args_Flag'Class) return Boolean is
+      
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+
+      declare
+
+         
+         Property_Result
+            : constant
+              Boolean
+            := Libpythonlang.Implementation.Dispatcher_Var_Args_Flag_P_As_Bool
+               (Bare_Python_Node (Node.Internal.Node));
+      begin
+         
+
+            return Property_Result;
+      end;
+   end;
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+         
+   
+
+   function F_Cond_Test
+     (Node : While_Stmt'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.While_Stmt_F_Cond_Test (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Cond_Test;
+
+
+         
+   
+
+   function F_Statements
+     (Node : While_Stmt'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.While_Stmt_F_Statements (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Statements;
+
+
+         
+   
+
+   function F_Else_Part
+     (Node : While_Stmt'Class) return Else_Part
+   is
+      Result : Bare_Else_Part;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.While_Stmt_F_Else_Part (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Else_Part;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Bindings
+     (Node : With_Stmt'Class) return As_Name_Node_List
+   is
+      Result : Bare_As_Name_Node_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.With_Stmt_F_Bindings (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Bindings;
+
+
+         
+   
+
+   function F_Statements
+     (Node : With_Stmt'Class) return Python_Node
+   is
+      Result : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.With_Stmt_F_Statements (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Statements;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Left
+     (Node : Xor_Expr'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Xor_Expr_F_Left (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Left;
+
+
+         
+   
+
+   function F_Right
+     (Node : Xor_Expr'Class) return Expr
+   is
+      Result : Bare_Expr;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Xor_Expr_F_Right (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Right;
+
+
+
+
+
+
+
+         
+   
+
+   function F_Exprs
+     (Node : Yield_Expr'Class) return Expr_List
+   is
+      Result : Bare_Expr_List;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Result := Implementation.Yield_Expr_F_Exprs (Node.Internal.Node);
+         return (Internal   => (Result, Node.Internal.Info),
+                 Safety_Net => Node.Safety_Net);
+   end F_Exprs;
+
+
+
+
+
+   --------------------
+   -- Children_Count --
+   --------------------
+
+   function Children_Count
+     (Node : Python_Node'Class) return Natural is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Children_Count (Node.Internal.Node);
+   end Children_Count;
+
+   -----------------------
+   -- First_Child_Index --
+   -----------------------
+
+   function First_Child_Index
+     (Node : Python_Node'Class) return Natural is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return First_Child_Index (Node.Internal.Node);
+   end First_Child_Index;
+
+   ----------------------
+   -- Last_Child_Index --
+   ----------------------
+
+   function Last_Child_Index
+     (Node : Python_Node'Class) return Natural is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Last_Child_Index (Node.Internal.Node);
+   end Last_Child_Index;
+
+   ---------------
+   -- Get_Child --
+   ---------------
+
+   procedure Get_Child
+     (Node            : Python_Node'Class;
+      Index           : Positive;
+      Index_In_Bounds : out Boolean;
+      Result          : out Python_Node)
+   is
+      N : Bare_Python_Node;
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Get_Child (Node.Internal.Node, Index, Index_In_Bounds, N);
+      Result := Wrap_Node (N, Node.Internal.Info);
+   end Get_Child;
+
+   -----------
+   -- Child --
+   -----------
+
+   function Child
+     (Node  : Python_Node'Class;
+      Index : Positive) return Python_Node
+   is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Wrap_Node (Child (Node.Internal.Node, Index), Node.Internal.Info);
+   end Child;
+
+   ----------------
+   -- Sloc_Range --
+   ----------------
+
+   function Sloc_Range
+     (Node : Python_Node'Class) return Source_Location_Range is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Sloc_Range (Node.Internal.Node);
+   end Sloc_Range;
+
+   -------------
+   -- Compare --
+   -------------
+
+   function Compare
+     (Node : Python_Node'Class;
+      Sloc : Source_Location) return Relative_Position is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Compare (Node.Internal.Node, Sloc);
+   end Compare;
+
+   ------------
+   -- Lookup --
+   ------------
+
+   function Lookup
+     (Node : Python_Node'Class;
+      Sloc : Source_Location) return Python_Node is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Wrap_Node (Lookup (Node.Internal.Node, Sloc));
+   end Lookup;
+
+   ----------
+   -- Text --
+   ----------
+
+   function Text (Node : Python_Node'Class) return Text_Type is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Implementation.Text (Node.Internal.Node);
+   end Text;
+
+   -----------------
+   -- Token_Range --
+   -----------------
+
+   function Token_Range
+     (Node : Python_Node'Class) return Token_Iterator is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Token_Iterator'(Node.As_Python_Node,
+                             Node.Internal.Node.Token_End_Index);
+   end Token_Range;
+
+   -----------
+   -- Print --
+   -----------
+
+   procedure Print
+     (Node        : Python_Node'Class;
+      Show_Slocs  : Boolean := True;
+      Line_Prefix : String := "") is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Print (Node.Internal.Node, Show_Slocs, Line_Prefix);
+   end Print;
+
+   ---------------
+   -- PP_Trivia --
+   ---------------
+
+   procedure PP_Trivia
+     (Node : Python_Node'Class; Line_Prefix : String := "") is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      PP_Trivia (Node.Internal.Node, Line_Prefix);
+   end PP_Trivia;
+
+   --------------
+   -- Traverse --
+   --------------
+
+   function Traverse
+     (Node  : Python_Node'Class;
+      Visit : access function (Node : Python_Node'Class)
+              return Visit_Status)
+      return Visit_Status
+   is
+      Info : constant Internal_Entity_Info := Node.Internal.Info;
+
+      -------------
+      -- Wrapper --
+      -------------
+
+      function Wrapper (Node : Bare_Python_Node) return Visit_Status
+      is
+         Public_Node : constant Python_Node :=
+           Wrap_Node (Bare_Python_Node (Node), Info);
+      begin
+         return Visit (Public_Node);
+      end Wrapper;
+
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      return Traverse (Node.Internal.Node, Wrapper'Access);
+   end Traverse;
+
+   --------------
+   -- Traverse --
+   --------------
+
+   procedure Traverse
+     (Node  : Python_Node'Class;
+      Visit : access function (Node : Python_Node'Class)
+                               return Visit_Status)
+   is
+      Result_Status : Visit_Status;
+      pragma Unreferenced (Result_Status);
+   begin
+      Result_Status := Traverse (Node, Visit);
+   end Traverse;
+
+   --------------------------------
+   -- Assign_Names_To_Logic_Vars --
+   --------------------------------
+
+   procedure Assign_Names_To_Logic_Vars (Node : Python_Node'Class)
+   is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Assign_Names_To_Logic_Vars (Node.Internal.Node);
+   end Assign_Names_To_Logic_Vars;
+
+   -------------------------
+   -- Children_And_Trivia --
+   -------------------------
+
+   function Children_And_Trivia
+     (Node : Python_Node'Class) return Children_Array
+   is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      declare
+         Bare_Result : constant Bare_Children_Array :=
+            Children_And_Trivia (Unwrap_Node (Node));
+         Result      : Children_Array (Bare_Result'Range);
+      begin
+         for I in Bare_Result'Range loop
+            declare
+               BR : Bare_Child_Record renames Bare_Result (I);
+               R  : Child_Record renames Result (I);
+            begin
+               case BR.Kind is
+                  when Child =>
+                     R := (Child, Wrap_Node (BR.Node));
+                  when Trivia =>
+                     R := (Trivia, BR.Trivia);
+               end case;
+            end;
+         end loop;
+         return Result;
+      end;
+   end Children_And_Trivia;
+
+   -----------------
+   -- First_Token --
+   -----------------
+
+   function First_Token (Self : Token_Iterator) return Token_Reference is
+   begin
+      Check_Safety_Net (Self.Node.Safety_Net);
+      return Token_Start (Self.Node);
+   end First_Token;
+
+   ----------------
+   -- Next_Token --
+   ----------------
+
+   function Next_Token
+     (Self : Token_Iterator; Tok : Token_Reference) return Token_Reference is
+   begin
+      Check_Safety_Net (Self.Node.Safety_Net);
+      return Next (Tok);
+   end Next_Token;
+
+   -----------------
+   -- Has_Element --
+   -----------------
+
+   function Has_Element
+     (Self : Token_Iterator; Tok : Token_Reference) return Boolean is
+   begin
+      Check_Safety_Net (Self.Node.Safety_Net);
+      return Get_Token_Index (Tok).Token <= Self.Last;
+   end Has_Element;
+
+   -------------
+   -- Element --
+   -------------
+
+   function Element
+     (Self : Token_Iterator; Tok : Token_Reference) return Token_Reference is
+   begin
+      Check_Safety_Net (Self.Node.Safety_Net);
+      return Tok;
+   end Element;
+
+   ----------------
+   -- Initialize --
+   ----------------
+
+   overriding procedure Initialize (Context : in out Analysis_Context) is
+   begin
+      Context.Internal := null;
+   end Initialize;
+
+   ------------
+   -- Adjust --
+   ------------
+
+   overriding procedure Adjust (Context : in out Analysis_Context) is
+   begin
+      Inc_Ref (Unwrap_Context (Context));
+   end Adjust;
+
+   --------------
+   -- Finalize --
+   --------------
+
+   overriding procedure Finalize (Context : in out Analysis_Context) is
+      Ctx : Internal_Context := Unwrap_Context (Context);
+   begin
+      Dec_Ref (Ctx);
+      Context.Internal := null;
+   end Finalize;
+
+   ----------------------------------------------------
+   -- Soft links for public/internal type converters --
+   ----------------------------------------------------
+
+   function Wrap_Context (Context : Internal_Context) return Analysis_Context;
+   function Unwrap_Context
+     (Context : Analysis_Context'Class) return Internal_Context;
+
+   function Wrap_Unit (Unit : Internal_Unit) return Analysis_Unit;
+   function Unwrap_Unit (Unit : Analysis_Unit'Class) return Internal_Unit;
+
+   function Wrap_Node
+     (Node : Bare_Python_Node;
+      Info : Internal_Entity_Info := No_Entity_Info)
+      return Python_Node;
+   function Unwrap_Node
+     (Node : Python_Node'Class) return Bare_Python_Node;
+   function Unwrap_Entity
+     (Entity : Python_Node'Class) return Internal_Entity;
+
+   ------------------
+   -- Wrap_Context --
+   ------------------
+
+   function Wrap_Context (Context : Internal_Context) return Analysis_Context
+   is
+   begin
+      Inc_Ref (Context);
+      return (Ada.Finalization.Controlled with
+              Internal => Internal_Context_Access (Context));
+   end Wrap_Context;
+
+   --------------------
+   -- Unwrap_Context --
+   --------------------
+
+   function Unwrap_Context
+     (Context : Analysis_Context'Class) return Internal_Context
+   is (Internal_Context (Context.Internal));
+
+   ---------------
+   -- Wrap_Unit --
+   ---------------
+
+   function Wrap_Unit (Unit : Internal_Unit) return Analysis_Unit
+   is ((Internal => Internal_Unit_Access (Unit),
+        Context  => Wrap_Context (Context (Unit))));
+
+   -----------------
+   -- Unwrap_Unit --
+   -----------------
+
+   function Unwrap_Unit (Unit : Analysis_Unit'Class) return Internal_Unit
+   is (Internal_Unit (Unit.Internal));
+
+   ---------------
+   -- Wrap_Node --
+   ---------------
+
+   function Wrap_Node
+     (Node : Bare_Python_Node;
+      Info : Internal_Entity_Info := No_Entity_Info)
+      return Python_Node is
+   begin
+      if Node = null then
+         return No_Python_Node;
+      end if;
+
+      declare
+         Unit    : constant Internal_Unit := Node.Unit;
+         Context : constant Internal_Context := Unit.Context;
+      begin
+         return ((Internal   => (Node, Info),
+                  Safety_Net => (Context        => Context,
+                                 Context_Serial => Context.Serial_Number,
+                                 Unit           => Unit,
+                                 Unit_Version   => Unit.Unit_Version)));
+      end;
+   end;
+
+   -----------------
+   -- Unwrap_Node --
+   -----------------
+
+   function Unwrap_Node
+     (Node : Python_Node'Class) return Bare_Python_Node
+   is (Node.Internal.Node);
+
+   -------------------
+   -- Unwrap_Entity --
+   -------------------
+
+   function Unwrap_Entity
+     (Entity : Python_Node'Class) return Internal_Entity
+   is ((Entity.Internal));
+
+   
+
+
+begin
+   Public_Converters.Wrap_Context := Wrap_Context'Access;
+   Public_Converters.Unwrap_Context := Unwrap_Context'Access;
+   Public_Converters.Wrap_Unit := Wrap_Unit'Access;
+   Public_Converters.Unwrap_Unit := Unwrap_Unit'Access;
+   Public_Converters.Wrap_Node := Wrap_Node'Access;
+   Public_Converters.Unwrap_Node := Unwrap_Node'Access;
+   Public_Converters.Unwrap_Entity := Unwrap_Entity'Access;
+end Libpythonlang.Analysis;
@@ -0,0 +1,792 @@
+
+with Ada.Strings.Unbounded; use Ada.Strings.Unbounded;
+
+with GNATCOLL.Iconv;
+with GNATCOLL.VFS; use GNATCOLL.VFS;
+
+with Libpythonlang.Lexer_Implementation;
+use Libpythonlang.Lexer_Implementation;
+with Libpythonlang.Private_Converters;
+
+
+
+package body Libpythonlang.Common is
+
+   Is_Token_Node_Kind : constant array (Python_Node_Kind_Type) of Boolean :=
+     (python_Arg_Assoc => False, python_Arg_Gen => False, python_Kw_Args => False, python_Var_Args => False, python_As_Name_Node => False, python_Comp_If => False, python_Comp_Op_Kind_Diamond => False, python_Comp_Op_Kind_Eq => False, python_Comp_Op_Kind_Gt => False, python_Comp_Op_Kind_Gte => False, python_Comp_Op_Kind_In => False, python_Comp_Op_Kind_Is => False, python_Comp_Op_Kind_Isnot => False, python_Comp_Op_Kind_Lt => False, python_Comp_Op_Kind_Lte => False, python_Comp_Op_Kind_Noteq => False, python_Comp_Op_Kind_Notin => False, python_Comp_For => False, python_Comp_ForL => False, python_Decorator => False, python_Dict_Assoc => False, python_Else_Part => False, python_Except_Part => False, python_And_Expr => False, python_And_Op => False, python_Arith_Expr => False, python_Shift_Expr => False, python_Term => False, python_Call_Expr => False, python_Comp_Op => False, python_Concat_String_Lit => False, python_Dict_Comp => False, python_Dict_Lit => False, python_Dot => False, python_Ellipsis_Expr => False, python_Factor => False, python_If_Expr => False, python_Inline_Eval => False, python_Lambda_Def => False, python_List_Comp => False, python_List_Gen => False, python_List_Lit => False, python_Dotted_Name => False, python_Id => True, python_Not_Op => False, python_Number_Lit => True, python_Or_Expr => False, python_Or_Op => False, python_Power => False, python_Set_Comp => False, python_Set_Lit => False, python_Slice_Expr => False, python_Ext_Slice_Expr => False, python_String_Lit => True, python_Subscript_Expr => False, python_Tuple_Lit => False, python_Xor_Expr => False, python_Yield_Expr => False, python_File_Node => False, python_Import_Star => False, python_Kw_Args_Flag_Absent => False, python_Kw_Args_Flag_Present => False, python_NL => False, python_Op => True, python_Params => False, python_Arg_List => False, python_As_Name_Node_List => False, python_Decorator_List => False, python_Dict_Assoc_List => False, python_Dot_List => False, python_Elif_Branch_List => False, python_Except_Part_List => False, python_Expr_List => False, python_Id_List => False, python_NL_List => False, python_Python_Node_List => False, python_Single_Param_List => False, python_String_Lit_List => False, python_Rel_Name => False, python_Single_Param => False, python_Assert_Stmt => False, python_Assign_Stmt => False, python_Aug_Assign_Stmt => False, python_Break_Stmt => False, python_Continue_Stmt => False, python_Decorated => False, python_Class_Def => False, python_Func_Def => False, python_Del_Stmt => False, python_Elif_Branch => False, python_Exec_Stmt => False, python_For_Stmt => False, python_Global_Stmt => False, python_If_Stmt => False, python_Import_From => False, python_Import_Name => False, python_Pass_Stmt => False, python_Print_Stmt => False, python_Raise_Stmt => False, python_Return_Stmt => False, python_Stream_Print_Stmt => False, python_Try_Stmt => False, python_While_Stmt => False, python_With_Stmt => False, python_Var_Args_Flag_Absent => False, python_Var_Args_Flag_Present => False);
+   --  For each node kind, return whether it is a node that contains only a
+   --  single token.
+
+   function Wrap_Token_Reference
+     (TDH   : Token_Data_Handler_Access;
+      Index : Token_Or_Trivia_Index) return Token_Reference;
+   function Get_Token_TDH
+     (Token : Token_Reference) return Token_Data_Handler_Access;
+   function Get_Token_Index
+     (Token : Token_Reference) return Token_Or_Trivia_Index;
+   procedure Extract_Token_Text
+     (Token         : Token_Data_Type;
+      Source_Buffer : out Text_Cst_Access;
+      First         : out Positive;
+      Last          : out Natural);
+   --  Implementations for converters soft-links
+
+   Token_Kind_To_Literals : constant array (Token_Kind) of Text_Access := (
+   
+
+         python_Rsh_Assign => new Text_Type'(">>="),
+         
+         python_Is => new Text_Type'("is"),
+         
+         python_Equals => new Text_Type'("=="),
+         
+         python_Def => new Text_Type'("def"),
+         
+         python_Lte => new Text_Type'("<="),
+         
+         python_Raise => new Text_Type'("raise"),
+         
+         python_Mod => new Text_Type'("%"),
+         
+         python_Yield => new Text_Type'("yield"),
+         
+         python_Xor_Assign => new Text_Type'("^="),
+         
+         python_As => new Text_Type'("as"),
+         
+         python_Lambda => new Text_Type'("lambda"),
+         
+         python_Backtick => new Text_Type'("`"),
+         
+         python_Try => new Text_Type'("try"),
+         
+         python_Divide => new Text_Type'("/"),
+         
+         python_Invert => new Text_Type'("~"),
+         
+         python_Return => new Text_Type'("return"),
+         
+         python_Assert => new Text_Type'("assert"),
+         
+         python_Xor => new Text_Type'("^"),
+         
+         python_Break => new Text_Type'("break"),
+         
+         python_Rbrack => new Text_Type'("]"),
+         
+         python_Power_Assign => new Text_Type'("**="),
+         
+         python_Import => new Text_Type'("import"),
+         
+         python_Exec => new Text_Type'("exec"),
+         
+         python_Comma => new Text_Type'(","),
+         
+         python_L_Par => new Text_Type'("("),
+         
+         python_Dot => new Text_Type'("."),
+         
+         python_Gte => new Text_Type'(">="),
+         
+         python_Floordiv_Assign => new Text_Type'("//="),
+         
+         python_Multiply => new Text_Type'("*"),
+         
+         python_Div_Assign => new Text_Type'("/="),
+         
+         python_At => new Text_Type'("@"),
+         
+         python_Assign => new Text_Type'("="),
+         
+         python_Floordiv => new Text_Type'("//"),
+         
+         python_Notequal => new Text_Type'("!="),
+         
+         python_Mult_Assign => new Text_Type'("*="),
+         
+         python_Mod_Assign => new Text_Type'("%="),
+         
+         python_Gt => new Text_Type'(">"),
+         
+         python_Power => new Text_Type'("**"),
+         
+         python_Amp => new Text_Type'("&"),
+         
+         python_Not => new Text_Type'("not"),
+         
+         python_Colon => new Text_Type'(":"),
+         
+         python_Diamond => new Text_Type'("<>"),
+         
+         python_In => new Text_Type'("in"),
+         
+         python_L_Curl => new Text_Type'("{"),
+         
+         python_Class => new Text_Type'("class"),
+         
+         python_Or_Assign => new Text_Type'("|="),
+         
+         python_Elif => new Text_Type'("elif"),
+         
+         python_And => new Text_Type'("and"),
+         
+         python_Semicolon => new Text_Type'(";"),
+         
+         python_Add_Asign => new Text_Type'("+="),
+         
+         python_Print => new Text_Type'("print"),
+         
+         python_Lsh => new Text_Type'("<<"),
+         
+         python_Continue => new Text_Type'("continue"),
+         
+         python_While => new Text_Type'("while"),
+         
+         python_Except => new Text_Type'("except"),
+         
+         python_If => new Text_Type'("if"),
+         
+         python_Else => new Text_Type'("else"),
+         
+         python_Del => new Text_Type'("del"),
+         
+         python_Minus_Assign => new Text_Type'("-="),
+         
+         python_Or => new Text_Type'("or"),
+         
+         python_Minus => new Text_Type'("-"),
+         
+         python_Lbrack => new Text_Type'("["),
+         
+         python_And_Assign => new Text_Type'("&="),
+         
+         python_R_Par => new Text_Type'(")"),
+         
+         python_Global => new Text_Type'("global"),
+         
+         python_For => new Text_Type'("for"),
+         
+         python_From => new Text_Type'("from"),
+         
+         python_Rsh => new Text_Type'(">>"),
+         
+         python_Finally => new Text_Type'("finally"),
+         
+         python_Pass => new Text_Type'("pass"),
+         
+         python_Lsh_Assign => new Text_Type'("<<="),
+         
+         python_Bin_Or => new Text_Type'("|"),
+         
+         python_Rcurl => new Text_Type'("}"),
+         
+         python_With => new Text_Type'("with"),
+         
+         python_Plus => new Text_Type'("+"),
+         
+         python_Lt => new Text_Type'("<"),
+         
+      others => new Text_Type'("")
+   );
+
+   Token_Kind_Names : constant array (Token_Kind) of String_Access := (
+          python_Rsh_Assign =>
+             new String'("Rsh_Assign")
+              ,
+          python_Is =>
+             new String'("Is")
+              ,
+          python_Equals =>
+             new String'("Equals")
+              ,
+          python_Def =>
+             new String'("Def")
+              ,
+          python_Lte =>
+             new String'("Lte")
+              ,
+          python_Raise =>
+             new String'("Raise")
+              ,
+          python_Mod =>
+             new String'("Mod")
+              ,
+          python_Yield =>
+             new String'("Yield")
+              ,
+          python_Xor_Assign =>
+             new String'("Xor_Assign")
+              ,
+          python_As =>
+             new String'("As")
+              ,
+          python_Lambda =>
+             new String'("Lambda")
+              ,
+          python_Backtick =>
+             new String'("Backtick")
+              ,
+          python_Try =>
+             new String'("Try")
+              ,
+          python_Divide =>
+             new String'("Divide")
+              ,
+          python_Invert =>
+             new String'("Invert")
+              ,
+          python_Return =>
+             new String'("Return")
+              ,
+          python_Assert =>
+             new String'("Assert")
+              ,
+          python_Xor =>
+             new String'("Xor")
+              ,
+          python_Break =>
+             new String'("Break")
+              ,
+          python_Rbrack =>
+             new String'("Rbrack")
+              ,
+          python_Power_Assign =>
+             new String'("Power_Assign")
+              ,
+          python_Import =>
+             new String'("Import")
+              ,
+          python_Exec =>
+             new String'("Exec")
+              ,
+          python_Comma =>
+             new String'("Comma")
+              ,
+          python_L_Par =>
+             new String'("L_Par")
+              ,
+          python_Dot =>
+             new String'("Dot")
+              ,
+          python_Gte =>
+             new String'("Gte")
+              ,
+          python_Floordiv_Assign =>
+             new String'("Floordiv_Assign")
+              ,
+          python_Multiply =>
+             new String'("Multiply")
+              ,
+          python_Div_Assign =>
+             new String'("Div_Assign")
+              ,
+          python_At =>
+             new String'("At")
+              ,
+          python_Assign =>
+             new String'("Assign")
+              ,
+          python_Floordiv =>
+             new String'("Floordiv")
+              ,
+          python_Notequal =>
+             new String'("Notequal")
+              ,
+          python_Mult_Assign =>
+             new String'("Mult_Assign")
+              ,
+          python_Mod_Assign =>
+             new String'("Mod_Assign")
+              ,
+          python_Gt =>
+             new String'("Gt")
+              ,
+          python_Power =>
+             new String'("Power")
+              ,
+          python_Amp =>
+             new String'("Amp")
+              ,
+          python_Not =>
+             new String'("Not")
+              ,
+          python_Colon =>
+             new String'("Colon")
+              ,
+          python_Diamond =>
+             new String'("Diamond")
+              ,
+          python_In =>
+             new String'("In")
+              ,
+          python_L_Curl =>
+             new String'("L_Curl")
+              ,
+          python_Class =>
+             new String'("Class")
+              ,
+          python_Or_Assign =>
+             new String'("Or_Assign")
+              ,
+          python_Elif =>
+             new String'("Elif")
+              ,
+          python_And =>
+             new String'("And")
+              ,
+          python_Semicolon =>
+             new String'("Semicolon")
+              ,
+          python_Add_Asign =>
+             new String'("Add_Asign")
+              ,
+          python_Print =>
+             new String'("Print")
+              ,
+          python_Lsh =>
+             new String'("Lsh")
+              ,
+          python_Continue =>
+             new String'("Continue")
+              ,
+          python_While =>
+             new String'("While")
+              ,
+          python_Except =>
+             new String'("Except")
+              ,
+          python_If =>
+             new String'("If")
+              ,
+          python_Else =>
+             new String'("Else")
+              ,
+          python_Del =>
+             new String'("Del")
+              ,
+          python_Minus_Assign =>
+             new String'("Minus_Assign")
+              ,
+          python_Or =>
+             new String'("Or")
+              ,
+          python_Minus =>
+             new String'("Minus")
+              ,
+          python_Lbrack =>
+             new String'("Lbrack")
+              ,
+          python_And_Assign =>
+             new String'("And_Assign")
+              ,
+          python_R_Par =>
+             new String'("R_Par")
+              ,
+          python_Global =>
+             new String'("Global")
+              ,
+          python_For =>
+             new String'("For")
+              ,
+          python_From =>
+             new String'("From")
+              ,
+          python_Rsh =>
+             new String'("Rsh")
+              ,
+          python_Finally =>
+             new String'("Finally")
+              ,
+          python_Pass =>
+             new String'("Pass")
+              ,
+          python_Lsh_Assign =>
+             new String'("Lsh_Assign")
+              ,
+          python_Bin_Or =>
+             new String'("Bin_Or")
+              ,
+          python_Rcurl =>
+             new String'("Rcurl")
+              ,
+          python_With =>
+             new String'("With")
+              ,
+          python_Plus =>
+             new String'("Plus")
+              ,
+          python_Lt =>
+             new String'("Lt")
+              ,
+          python_Number =>
+             new String'("Number")
+              ,
+          python_String =>
+             new String'("String")
+              ,
+          python_Comment =>
+             new String'("Comment")
+              ,
+          python_Identifier =>
+             new String'("Identifier")
+              ,
+          python_Indent =>
+             new String'("Indent")
+              ,
+          python_Dedent =>
+             new String'("Dedent")
+              ,
+          python_Newline =>
+             new String'("Newline")
+              ,
+          python_Termination =>
+             new String'("Termination")
+              ,
+          python_Lexing_Failure =>
+             new String'("Lexing_Failure")
+   );
+
+   ------------------------
+   -- Precomputed_Symbol --
+   ------------------------
+
+   function Precomputed_Symbol
+     (Index : Precomputed_Symbol_Index) return Text_Type is
+   begin
+         return (raise Program_Error);
+   end Precomputed_Symbol;
+
+   ---------------------
+   -- Token_Kind_Name --
+   ---------------------
+
+   function Token_Kind_Name (Token_Id : Token_Kind) return String is
+     (Token_Kind_Names (Token_Id).all);
+
+   ------------------------
+   -- Token_Kind_Literal --
+   ------------------------
+
+   function Token_Kind_Literal (Token_Id : Token_Kind) return Text_Type is
+     (Token_Kind_To_Literals (Token_Id).all);
+
+   -----------------------
+   -- Token_Error_Image --
+   -----------------------
+
+   function Token_Error_Image (Token_Id : Token_Kind) return String is
+      Literal : constant Text_Type := Token_Kind_Literal (Token_Id);
+   begin
+      return (if Literal /= ""
+              then "'" & Image (Literal) & "'"
+              else Token_Kind_Name (Token_Id));
+   end Token_Error_Image;
+
+   function To_Token_Kind (Raw : Raw_Token_Kind) return Token_Kind
+   is (Token_Kind'Val (Raw));
+
+   function From_Token_Kind (Kind : Token_Kind) return Raw_Token_Kind
+   is (Token_Kind'Pos (Kind));
+
+   -------------------
+   -- Is_Token_Node --
+   -------------------
+
+   function Is_Token_Node (Kind : Python_Node_Kind_Type) return Boolean is
+   begin
+      return Is_Token_Node_Kind (Kind);
+   end Is_Token_Node;
+
+   ------------------
+   -- Is_List_Node --
+   ------------------
+
+   function Is_List_Node (Kind : Python_Node_Kind_Type) return Boolean is
+   begin
+      return Kind in python_Python_Node_Base_List;
+   end Is_List_Node;
+
+   ---------
+   -- "<" --
+   ---------
+
+   function "<" (Left, Right : Token_Reference) return Boolean is
+      pragma Assert (Left.TDH = Right.TDH);
+   begin
+      if Left.Index.Token < Right.Index.Token then
+         return True;
+
+      elsif Left.Index.Token = Right.Index.Token then
+         return Left.Index.Trivia < Right.Index.Trivia;
+
+      else
+         return False;
+      end if;
+   end "<";
+
+   ----------
+   -- Next --
+   ----------
+
+   function Next
+     (Token          : Token_Reference;
+      Exclude_Trivia : Boolean := False) return Token_Reference is
+   begin
+      return (if Token.TDH = null
+              then No_Token
+              else Wrap_Token_Reference (Token.TDH,
+                                         Next (Token.Index, Token.TDH.all,
+                                               Exclude_Trivia)));
+   end Next;
+
+   --------------
+   -- Previous --
+   --------------
+
+   function Previous
+     (Token          : Token_Reference;
+      Exclude_Trivia : Boolean := False) return Token_Reference is
+   begin
+      return
+        (if Token.TDH = null
+         then No_Token
+         else Wrap_Token_Reference (Token.TDH,
+                                    Previous (Token.Index, Token.TDH.all,
+                                              Exclude_Trivia)));
+   end Previous;
+
+   ----------------
+   -- Get_Symbol --
+   ----------------
+
+   function Get_Symbol (Token : Token_Reference) return Symbol_Type is
+   begin
+      return Get_Symbol (Token.Index, Token.TDH.all);
+   end Get_Symbol;
+
+   ----------
+   -- Data --
+   ----------
+
+   function Data (Token : Token_Reference) return Token_Data_Type is
+   begin
+      return Convert (Token.TDH.all, Token, Raw_Data (Token));
+   end Data;
+
+   ----------
+   -- Text --
+   ----------
+
+   function Text (Token : Token_Reference) return Text_Type is
+      RD : constant Stored_Token_Data := Raw_Data (Token);
+   begin
+      return Text (Token.TDH.all, RD);
+   end Text;
+
+   ----------
+   -- Text --
+   ----------
+
+   function Text (First, Last : Token_Reference) return Text_Type is
+      FD : constant Token_Data_Type := Data (First);
+      LD : constant Token_Data_Type := Data (Last);
+   begin
+      if First.TDH /= Last.TDH then
+         raise Constraint_Error;
+      end if;
+      return FD.Source_Buffer.all (FD.Source_First .. LD.Source_Last);
+   end Text;
+
+   ----------
+   -- Kind --
+   ----------
+
+   function Kind (Token_Data : Token_Data_Type) return Token_Kind is
+   begin
+      return Token_Data.Kind;
+   end Kind;
+
+   ---------------
+   -- Is_Trivia --
+   ---------------
+
+   function Is_Trivia (Token : Token_Reference) return Boolean is
+   begin
+      return Token.Index.Trivia /= No_Token_Index;
+   end Is_Trivia;
+
+   ---------------
+   -- Is_Trivia --
+   ---------------
+
+   function Is_Trivia (Token_Data : Token_Data_Type) return Boolean is
+   begin
+      return Token_Data.Is_Trivia;
+   end Is_Trivia;
+
+   -----------
+   -- Index --
+   -----------
+
+   function Index (Token : Token_Reference) return Token_Index is
+   begin
+      return (if Token.Index.Trivia = No_Token_Index
+              then Token.Index.Token
+              else Token.Index.Trivia);
+   end Index;
+
+   -----------
+   -- Index --
+   -----------
+
+   function Index (Token_Data : Token_Data_Type) return Token_Index is
+   begin
+      return Token_Data.Index;
+   end Index;
+
+   ----------------
+   -- Sloc_Range --
+   ----------------
+
+   function Sloc_Range
+     (Token_Data : Token_Data_Type) return Source_Location_Range
+   is
+   begin
+      return Token_Data.Sloc_Range;
+   end Sloc_Range;
+
+   ---------------------
+   -- Origin_Filename --
+   ---------------------
+
+   function Origin_Filename (Token : Token_Reference) return String is
+   begin
+      return +Token.TDH.Filename.Full_Name;
+   end Origin_Filename;
+
+   --------------------
+   -- Origin_Charset --
+   --------------------
+
+   function Origin_Charset (Token : Token_Reference) return String is
+   begin
+      return To_String (Token.TDH.Charset);
+   end Origin_Charset;
+
+   -------------------
+   -- Is_Equivalent --
+   -------------------
+
+   function Is_Equivalent (L, R : Token_Reference) return Boolean is
+      DL : constant Token_Data_Type := Data (L);
+      DR : constant Token_Data_Type := Data (R);
+      TL : constant Text_Type := Text (L);
+      TR : constant Text_Type := Text (R);
+   begin
+      return DL.Kind = DR.Kind and then TL = TR;
+   end Is_Equivalent;
+
+   -----------
+   -- Image --
+   -----------
+
+   function Image (Token : Token_Reference) return String is
+      D : constant Token_Data_Type := Data (Token);
+   begin
+      return ("<Token Kind=" & Token_Kind_Name (D.Kind) &
+              " Text=" & Image (Text (Token), With_Quotes => True) & ">");
+   end Image;
+
+   --------------
+   -- Raw_Data --
+   --------------
+
+   function Raw_Data (T : Token_Reference) return Stored_Token_Data is
+     (if T.Index.Trivia = No_Token_Index
+      then Token_Vectors.Get (T.TDH.Tokens, Natural (T.Index.Token))
+      else Trivia_Vectors.Get (T.TDH.Trivias, Natural (T.Index.Trivia)).T);
+
+   -------------
+   -- Convert --
+   -------------
+
+   function Convert
+     (TDH      : Token_Data_Handler;
+      Token    : Token_Reference;
+      Raw_Data : Stored_Token_Data) return Token_Data_Type is
+   begin
+      return (Kind          => To_Token_Kind (Raw_Data.Kind),
+              Is_Trivia     => Token.Index.Trivia /= No_Token_Index,
+              Index         => (if Token.Index.Trivia = No_Token_Index
+                                then Token.Index.Token
+                                else Token.Index.Trivia),
+              Source_Buffer => Text_Cst_Access (Wide_Source_Buffer (TDH)),
+              Source_First  => Raw_Data.Source_First,
+              Source_Last   => Raw_Data.Source_Last,
+              Sloc_Range    => Sloc_Range (TDH, Raw_Data));
+   end Convert;
+
+   --------------------------
+   -- Wrap_Token_Reference --
+   --------------------------
+
+   function Wrap_Token_Reference
+     (TDH   : Token_Data_Handler_Access;
+      Index : Token_Or_Trivia_Index) return Token_Reference is
+   begin
+      return (if Index = No_Token_Or_Trivia_Index
+              then No_Token
+              else (TDH, Index));
+   end Wrap_Token_Reference;
+
+   -------------------
+   -- Get_Token_TDH --
+   -------------------
+
+   function Get_Token_TDH
+     (Token : Token_Reference) return Token_Data_Handler_Access is
+   begin
+      return Token.TDH;
+   end Get_Token_TDH;
+
+   ---------------------
+   -- Get_Token_Index --
+   ---------------------
+
+   function Get_Token_Index
+     (Token : Token_Reference) return Token_Or_Trivia_Index is
+   begin
+      return Token.Index;
+   end Get_Token_Index;
+
+   ------------------------
+   -- Extract_Token_Text --
+   ------------------------
+
+   procedure Extract_Token_Text
+     (Token         : Token_Data_Type;
+      Source_Buffer : out Text_Cst_Access;
+      First         : out Positive;
+      Last          : out Natural) is
+   begin
+      Source_Buffer := Token.Source_Buffer;
+      First := Token.Source_First;
+      Last := Token.Source_Last;
+   end Extract_Token_Text;
+
+
+begin
+   --  Check that we actually have full Libiconv support: as nothing works
+   --  without it, we explicitly check support here instead of letting
+   --  user-unfriendly errors happen during lexing.
+
+   if not GNATCOLL.Iconv.Has_Iconv then
+      raise Program_Error with "Libiconv is not available";
+   end if;
+
+
+   Private_Converters.Wrap_Token_Reference := Wrap_Token_Reference'Access;
+   Private_Converters.Get_Token_TDH := Get_Token_TDH'Access;
+   Private_Converters.Get_Token_Index := Get_Token_Index'Access;
+   Private_Converters.Extract_Token_Text := Extract_Token_Text'Access;
+end Libpythonlang.Common;
@@ -0,0 +1,8726 @@
+
+
+
+
+
+
+
+
+with Ada.Finalization;
+pragma Warnings (Off, "is an internal GNAT unit");
+with Ada.Strings.Wide_Wide_Unbounded.Aux;
+use Ada.Strings.Wide_Wide_Unbounded.Aux;
+pragma Warnings (On, "is an internal GNAT unit");
+
+with System.Memory;
+use type System.Address;
+with System.Storage_Elements; use System.Storage_Elements;
+
+with GNAT.Strings;
+
+with GNATCOLL.Iconv;
+
+with Langkit_Support.Diagnostics; use Langkit_Support.Diagnostics;
+with Langkit_Support.Text;        use Langkit_Support.Text;
+
+with Libpythonlang.Private_Converters;
+use Libpythonlang.Private_Converters;
+
+
+
+
+package body Libpythonlang.Implementation.C is
+
+   --  Avoid hiding from $.Lexer
+   subtype Token_Data_Type is Common.Token_Data_Type;
+
+   type C_Unit_Provider is limited new
+      Ada.Finalization.Limited_Controlled
+      and Internal_Unit_Provider
+   with record
+      Ref_Count               : Natural;
+      Data                    : System.Address;
+      Destroy_Func            : python_unit_provider_destroy_callback;
+      Get_Unit_Filename_Func  : python_unit_provider_get_unit_filename_callback;
+      Get_Unit_From_Name_Func : python_unit_provider_get_unit_from_name_callback;
+   end record;
+
+   type C_Unit_Provider_Access is access all C_Unit_Provider;
+
+   overriding procedure Finalize (Provider : in out C_Unit_Provider);
+   overriding procedure Inc_Ref (Provider : in out C_Unit_Provider);
+   overriding function Dec_Ref
+     (Provider : in out C_Unit_Provider) return Boolean;
+
+   overriding function Get_Unit_Filename
+     (Provider : C_Unit_Provider;
+      Name     : Text_Type;
+      Kind     : Analysis_Unit_Kind) return String;
+
+   overriding function Get_Unit
+     (Provider : C_Unit_Provider;
+      Context  : Internal_Context;
+      Name     : Text_Type;
+      Kind     : Analysis_Unit_Kind;
+      Charset  : String := "";
+      Reparse  : Boolean := False) return Internal_Unit;
+
+   function Value_Or_Empty (S : chars_ptr) return String
+   --  If S is null, return an empty string. Return Value (S) otherwise.
+   is (if S = Null_Ptr
+       then ""
+       else Value (S));
+
+   Last_Exception : python_exception_Ptr := null;
+
+   ----------
+   -- Free --
+   ----------
+
+   procedure Free (Address : System.Address) is
+      procedure C_Free (Address : System.Address)
+        with Import        => True,
+             Convention    => C,
+             External_Name => "free";
+   begin
+      C_Free (Address);
+   end Free;
+
+   -------------------------
+   -- Analysis primitives --
+   -------------------------
+
+   function python_create_analysis_context
+     (Charset       : chars_ptr;
+      Unit_Provider : python_unit_provider;
+      With_Trivia   : int;
+      Tab_Stop      : int) return python_analysis_context is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         C : constant String :=
+           (if Charset = Null_Ptr
+            then "utf-8"
+            else Value (Charset));
+      begin
+         return Create_Context
+            (Charset       => C,
+             Unit_Provider => Unwrap_Private_Provider (Unit_Provider),
+             With_Trivia   => With_Trivia /= 0,
+             Tab_Stop      => Natural (Tab_Stop));
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return null;
+   end;
+
+   function python_context_incref
+     (Context : python_analysis_context) return python_analysis_context is
+   begin
+      Clear_Last_Exception;
+      Inc_Ref (Context);
+      return Context;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return null;
+   end;
+
+   procedure python_context_decref
+     (Context : python_analysis_context)
+   is
+      Context_Var : Internal_Context := Context;
+   begin
+      Clear_Last_Exception;
+      Dec_Ref (Context_Var);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function python_context_symbol
+     (Context : python_analysis_context;
+      Text    : access python_text;
+      Symbol  : access python_symbol_type) return int
+   is
+      Raw_Text : Text_Type (1 .. Natural (Text.Length))
+         with Import, Address => Text.Chars;
+   begin
+      Clear_Last_Exception;
+      Symbol.all := Wrap_Symbol (Lookup_Symbol (Context, Raw_Text));
+      return 1;
+   exception
+      when Invalid_Symbol_Error =>
+         return 0;
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   procedure python_context_discard_errors_in_populate_lexical_env
+     (Context : python_analysis_context;
+      Discard : int) is
+   begin
+      Clear_Last_Exception;
+      Discard_Errors_In_Populate_Lexical_Env (Context, Discard /= 0);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure python_context_use_memory_mapped_files
+     (Context : python_analysis_context;
+      Enabled : int) is
+   begin
+      Clear_Last_Exception;
+      Use_Memory_Mapped_Files (Context, Enabled /= 0);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function python_get_analysis_unit_from_file
+     (Context           : python_analysis_context;
+      Filename, Charset : chars_ptr;
+      Reparse           : int;
+      Rule              : python_grammar_rule) return python_analysis_unit is
+   begin
+      Clear_Last_Exception;
+
+      return Get_From_File
+        (Context,
+         Value (Filename),
+         Value_Or_Empty (Charset),
+         Reparse /= 0,
+         Rule);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return null;
+   end;
+
+   procedure python_get_analysis_units_from_files
+     (Context   : python_analysis_context;
+      Filenames : System.Address;
+      Count     : int;
+      Charset   : chars_ptr;
+      Reparse   : int;
+      Rule      : python_grammar_rule;
+      Jobs      : int;
+      Units     : System.Address) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         C_Filenames : array (1 .. Natural (Count)) of chars_ptr
+            with Import, Address => Filenames;
+         C_Units     : Internal_Unit_Array (1 .. Natural (Count))
+            with Import, Address => Units;
+
+         Ada_Filenames : GNAT.Strings.String_List (1 .. Natural (Count));
+      begin
+         for I in Ada_Filenames'Range loop
+            Ada_Filenames (I) := new String'(Value (C_Filenames (I)));
+         end loop;
+
+         begin
+            C_Units := Get_From_Files
+              (Context,
+               Ada_Filenames,
+               Value_Or_Empty (Charset),
+               Reparse /= 0,
+               Rule,
+               Natural (Jobs));
+         exception
+            when others =>
+               GNAT.Strings.Free (Ada_Filenames);
+               raise;
+         end;
+         GNAT.Strings.Free (Ada_Filenames);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function python_get_analysis_unit_from_buffer
+     (Context           : python_analysis_context;
+      Filename, Charset : chars_ptr;
+      Buffer            : chars_ptr;
+      Buffer_Size       : size_t;
+      Rule              : python_grammar_rule) return python_analysis_unit is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Buffer_Str : String (1 .. Natural (Buffer_Size))
+            with Import, Address => Convert (Buffer);
+      begin
+         return Get_From_Buffer
+           (Context,
+            Value (Filename),
+            Value_Or_Empty (Charset),
+            Buffer_Str,
+            Rule);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return null;
+   end;
+
+
+   procedure python_unit_root
+     (Unit     : python_analysis_unit;
+      Result_P : python_base_entity_Ptr) is
+   begin
+      Clear_Last_Exception;
+
+      Result_P.all := (Unit.AST_Root, No_Entity_Info);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure python_unit_first_token
+     (Unit  : python_analysis_unit;
+      Token : access python_token) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         T : constant Token_Reference := First_Token (Unit);
+      begin
+         Token.all := Wrap (T);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure python_unit_last_token
+     (Unit  : python_analysis_unit;
+      Token : access python_token) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         T : constant Token_Reference := Last_Token (Unit);
+      begin
+         Token.all := Wrap (T);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function python_unit_token_count
+     (Unit : python_analysis_unit) return int is
+   begin
+      Clear_Last_Exception;
+
+      return int (Token_Count (Unit));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return -1;
+   end;
+
+   function python_unit_trivia_count
+     (Unit : python_analysis_unit) return int is
+   begin
+      Clear_Last_Exception;
+
+      return int (Trivia_Count (Unit));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return -1;
+   end;
+
+   function python_unit_export_tokens
+     (Unit    : python_analysis_unit;
+      Table_P : access python_token_table) return int is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         TDH    : Token_Data_Handler renames Unit.TDH;
+         Count  : constant Natural :=
+           Token_Count (Unit) + Trivia_Count (Unit);
+         Length : constant Storage_Offset := Storage_Offset (Count);
+
+         Table : python_token_table := Table_P.all;
+
+         procedure Fill;
+         --  Store data for all tokens and trivia in the columns of Table
+
+         ----------
+         -- Fill --
+         ----------
+
+         procedure Fill is
+            subtype Index_Range is Integer range 0 .. Count - 1;
+            type Int_Column is array (Index_Range) of int
+              with Convention => C;
+            type Line_Column is array (Index_Range) of Unsigned_32
+              with Convention => C;
+            type Column_Column is array (Index_Range) of Unsigned_16
+              with Convention => C;
+            type Flag_Column is array (Index_Range) of Unsigned_8
+              with Convention => C;
+
+            Kinds         : Int_Column with Import, Address => Table.Kinds;
+            Start_Offsets : Int_Column
+              with Import, Address => Table.Start_Offsets;
+            End_Offsets   : Int_Column
+              with Import, Address => Table.End_Offsets;
+            Start_Lines   : Line_Column
+              with Import, Address => Table.Start_Lines;
+            End_Lines     : Line_Column
+              with Import, Address => Table.End_Lines;
+            Start_Columns : Column_Column
+              with Import, Address => Table.Start_Columns;
+            End_Columns   : Column_Column
+              with Import, Address => Table.End_Columns;
+            Is_Trivia     : Flag_Column
+              with Import, Address => Table.Is_Trivia;
+
+            Current : Token_Or_Trivia_Index := First_Token_Or_Trivia (TDH);
+         begin
+            for I in Index_Range loop
+               declare
+                  D    : constant Stored_Token_Data := Data (Current, TDH);
+                  Sloc : constant Source_Location_Range :=
+                    Sloc_Range (TDH, D);
+               begin
+                  Kinds (I) := int (To_Token_Kind (D.Kind)'Enum_Rep);
+                  Start_Offsets (I) := int (D.Source_First - TDH.Source_First);
+                  End_Offsets (I) :=
+                    int (D.Source_Last - TDH.Source_First + 1);
+                  Start_Lines (I) := Unsigned_32 (Sloc.Start_Line);
+                  Start_Columns (I) := Unsigned_16 (Sloc.Start_Column);
+                  End_Lines (I) := Unsigned_32 (Sloc.End_Line);
+                  End_Columns (I) := Unsigned_16 (Sloc.End_Column);
+                  Is_Trivia (I) :=
+                    (if Current.Trivia = No_Token_Index then 0 else 1);
+               end;
+               Current := Next (Current, TDH);
+            end loop;
+         end Fill;
+
+      begin
+         if Table.Kinds = System.Null_Address then
+
+            --  Allocate all columns in a single memory block: first 32-bit
+            --  columns, then 16-bit columns and finally 8-bit columns, so
+            --  that all columns are properly aligned.
+
+            Table.Kinds := System.Memory.Alloc
+              (System.Memory.size_t (Length * (5 * 4 + 2 * 2 + 1)));
+            Table.Start_Offsets := Table.Kinds + Length * 4;
+            Table.End_Offsets := Table.Start_Offsets + Length * 4;
+            Table.Start_Lines := Table.End_Offsets + Length * 4;
+            Table.End_Lines := Table.Start_Lines + Length * 4;
+            Table.Start_Columns := Table.End_Lines + Length * 4;
+            Table.End_Columns := Table.Start_Columns + Length * 2;
+            Table.Is_Trivia := Table.End_Columns + Length * 2;
+
+         elsif Natural (Table.Count) < Count then
+            raise Precondition_Failure with "token table is too small";
+         end if;
+
+         Table.Count := int (Count);
+         if Count > 0 then
+            Fill;
+         end if;
+
+         Table_P.all := Table;
+         return 1;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   procedure python_destroy_token_table
+     (Table : access python_token_table) is
+   begin
+      Clear_Last_Exception;
+
+      System.Memory.Free (Table.Kinds);
+      Table.all := (Count => 0, others => System.Null_Address);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure python_unit_lookup_token
+     (Unit   : python_analysis_unit;
+      Sloc   : access python_source_location;
+      Result : access python_token) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         S   : constant Source_Location := Unwrap (Sloc.all);
+         Tok : constant Token_Reference := Lookup_Token (Unit, S);
+      begin
+         Result.all := Wrap (Tok);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure python_unit_dump_lexical_env
+     (Unit : python_analysis_unit) is
+   begin
+      Clear_Last_Exception;
+      Dump_Lexical_Env (Unit);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function python_unit_filename
+     (Unit : python_analysis_unit) return chars_ptr is
+   begin
+      Clear_Last_Exception;
+
+      return New_String (Get_Filename (Unit));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return Null_Ptr;
+   end;
+
+   function python_unit_diagnostic_count
+     (Unit : python_analysis_unit) return unsigned is
+   begin
+      Clear_Last_Exception;
+
+      return unsigned (Unit.Diagnostics.Length);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   function python_unit_diagnostic
+     (Unit         : python_analysis_unit;
+      N            : unsigned;
+      Diagnostic_P : access python_diagnostic) return int
+   is
+   begin
+      Clear_Last_Exception;
+
+      if N < unsigned (Unit.Diagnostics.Length) then
+         declare
+            D_In  : Diagnostic renames Unit.Diagnostics (Natural (N) + 1);
+            D_Out : python_diagnostic renames Diagnostic_P.all;
+         begin
+            D_Out.Sloc_Range := Wrap (D_In.Sloc_Range);
+            D_Out.Message := Wrap (D_In.Message);
+            return 1;
+         end;
+      else
+         return 0;
+      end if;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   function python_unit_context
+     (Unit : python_analysis_unit) return python_analysis_context is
+   begin
+      Clear_Last_Exception;
+      return Unit.Context;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return null;
+   end;
+
+   procedure python_unit_reparse_from_file
+     (Unit : python_analysis_unit; Charset : chars_ptr) is
+   begin
+      Clear_Last_Exception;
+
+      Reparse (Unit, Value_Or_Empty (Charset));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure python_unit_reparse_from_buffer
+     (Unit        : python_analysis_unit;
+      Charset     : chars_ptr;
+      Buffer      : chars_ptr;
+      Buffer_Size : size_t) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Buffer_Str : String (1 .. Natural (Buffer_Size))
+            with Import, Address => Convert (Buffer);
+      begin
+         Reparse (Unit, Value_Or_Empty (Charset), Buffer_Str);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure python_unit_reparse_edit
+     (Unit       : python_analysis_unit;
+      Edit_Range : access python_source_location_range;
+      Text       : access python_text) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Raw_Text : Text_Type (1 .. Natural (Text.Length))
+            with Import, Address => Text.Chars;
+      begin
+         Reparse (Unit, Unwrap (Edit_Range.all), Raw_Text);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function python_unit_populate_lexical_env
+     (Unit : python_analysis_unit) return int is
+   begin
+      Clear_Last_Exception;
+      Populate_Lexical_Env (Unit);
+      return 1;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   ---------------------------------
+   -- General AST node primitives --
+   ---------------------------------
+
+   Node_Kind_Names : constant array (Python_Node_Kind_Type) of Text_Access :=
+     (python_Arg_Assoc => new Text_Type'(To_Text ("ArgAssoc")), python_Arg_Gen => new Text_Type'(To_Text ("ArgGen")), python_Kw_Args => new Text_Type'(To_Text ("KwArgs")), python_Var_Args => new Text_Type'(To_Text ("VarArgs")), python_As_Name_Node => new Text_Type'(To_Text ("AsNameNode")), python_Comp_If => new Text_Type'(To_Text ("CompIf")), python_Comp_Op_Kind_Diamond => new Text_Type'(To_Text ("CompOpKindDiamond")), python_Comp_Op_Kind_Eq => new Text_Type'(To_Text ("CompOpKindEq")), python_Comp_Op_Kind_Gt => new Text_Type'(To_Text ("CompOpKindGt")), python_Comp_Op_Kind_Gte => new Text_Type'(To_Text ("CompOpKindGte")), python_Comp_Op_Kind_In => new Text_Type'(To_Text ("CompOpKindIn")), python_Comp_Op_Kind_Is => new Text_Type'(To_Text ("CompOpKindIs")), python_Comp_Op_Kind_Isnot => new Text_Type'(To_Text ("CompOpKindIsnot")), python_Comp_Op_Kind_Lt => new Text_Type'(To_Text ("CompOpKindLt")), python_Comp_Op_Kind_Lte => new Text_Type'(To_Text ("CompOpKindLte")), python_Comp_Op_Kind_Noteq => new Text_Type'(To_Text ("CompOpKindNoteq")), python_Comp_Op_Kind_Notin => new Text_Type'(To_Text ("CompOpKindNotin")), python_Comp_For => new Text_Type'(To_Text ("CompFor")), python_Comp_ForL => new Text_Type'(To_Text ("CompForL")), python_Decorator => new Text_Type'(To_Text ("Decorator")), python_Dict_Assoc => new Text_Type'(To_Text ("DictAssoc")), python_Else_Part => new Text_Type'(To_Text ("ElsePart")), python_Except_Part => new Text_Type'(To_Text ("ExceptPart")), python_And_Expr => new Text_Type'(To_Text ("AndExpr")), python_And_Op => new Text_Type'(To_Text ("AndOp")), python_Arith_Expr => new Text_Type'(To_Text ("ArithExpr")), python_Shift_Expr => new Text_Type'(To_Text ("ShiftExpr")), python_Term => new Text_Type'(To_Text ("Term")), python_Call_Expr => new Text_Type'(To_Text ("CallExpr")), python_Comp_Op => new Text_Type'(To_Text ("CompOp")), python_Concat_String_Lit => new Text_Type'(To_Text ("ConcatStringLit")), python_Dict_Comp => new Text_Type'(To_Text ("DictComp")), python_Dict_Lit => new Text_Type'(To_Text ("DictLit")), python_Dot => new Text_Type'(To_Text ("Dot")), python_Ellipsis_Expr => new Text_Type'(To_Text ("EllipsisExpr")), python_Factor => new Text_Type'(To_Text ("Factor")), python_If_Expr => new Text_Type'(To_Text ("IfExpr")), python_Inline_Eval => new Text_Type'(To_Text ("InlineEval")), python_Lambda_Def => new Text_Type'(To_Text ("LambdaDef")), python_List_Comp => new Text_Type'(To_Text ("ListComp")), python_List_Gen => new Text_Type'(To_Text ("ListGen")), python_List_Lit => new Text_Type'(To_Text ("ListLit")), python_Dotted_Name => new Text_Type'(To_Text ("DottedName")), python_Id => new Text_Type'(To_Text ("Id")), python_Not_Op => new Text_Type'(To_Text ("NotOp")), python_Number_Lit => new Text_Type'(To_Text ("NumberLit")), python_Or_Expr => new Text_Type'(To_Text ("OrExpr")), python_Or_Op => new Text_Type'(To_Text ("OrOp")), python_Power => new Text_Type'(To_Text ("Power")), python_Set_Comp => new Text_Type'(To_Text ("SetComp")), python_Set_Lit => new Text_Type'(To_Text ("SetLit")), python_Slice_Expr => new Text_Type'(To_Text ("SliceExpr")), python_Ext_Slice_Expr => new Text_Type'(To_Text ("ExtSliceExpr")), python_String_Lit => new Text_Type'(To_Text ("StringLit")), python_Subscript_Expr => new Text_Type'(To_Text ("SubscriptExpr")), python_Tuple_Lit => new Text_Type'(To_Text ("TupleLit")), python_Xor_Expr => new Text_Type'(To_Text ("XorExpr")), python_Yield_Expr => new Text_Type'(To_Text ("YieldExpr")), python_File_Node => new Text_Type'(To_Text ("FileNode")), python_Import_Star => new Text_Type'(To_Text ("ImportStar")), python_Kw_Args_Flag_Absent => new Text_Type'(To_Text ("KwArgsFlagAbsent")), python_Kw_Args_Flag_Present => new Text_Type'(To_Text ("KwArgsFlagPresent")), python_NL => new Text_Type'(To_Text ("NL")), python_Op => new Text_Type'(To_Text ("Op")), python_Params => new Text_Type'(To_Text ("Params")), python_Arg_List => new Text_Type'(To_Text ("ArgList")), python_As_Name_Node_List => new Text_Type'(To_Text ("AsNameNodeList")), python_Decorator_List => new Text_Type'(To_Text ("DecoratorList")), python_Dict_Assoc_List => new Text_Type'(To_Text ("DictAssocList")), python_Dot_List => new Text_Type'(To_Text ("DotList")), python_Elif_Branch_List => new Text_Type'(To_Text ("ElifBranchList")), python_Except_Part_List => new Text_Type'(To_Text ("ExceptPartList")), python_Expr_List => new Text_Type'(To_Text ("ExprList")), python_Id_List => new Text_Type'(To_Text ("IdList")), python_NL_List => new Text_Type'(To_Text ("NLList")), python_Python_Node_List => new Text_Type'(To_Text ("PythonNodeList")), python_Single_Param_List => new Text_Type'(To_Text ("SingleParamList")), python_String_Lit_List => new Text_Type'(To_Text ("StringLitList")), python_Rel_Name => new Text_Type'(To_Text ("RelName")), python_Single_Param => new Text_Type'(To_Text ("SingleParam")), python_Assert_Stmt => new Text_Type'(To_Text ("AssertStmt")), python_Assign_Stmt => new Text_Type'(To_Text ("AssignStmt")), python_Aug_Assign_Stmt => new Text_Type'(To_Text ("AugAssignStmt")), python_Break_Stmt => new Text_Type'(To_Text ("BreakStmt")), python_Continue_Stmt => new Text_Type'(To_Text ("ContinueStmt")), python_Decorated => new Text_Type'(To_Text ("Decorated")), python_Class_Def => new Text_Type'(To_Text ("ClassDef")), python_Func_Def => new Text_Type'(To_Text ("FuncDef")), python_Del_Stmt => new Text_Type'(To_Text ("DelStmt")), python_Elif_Branch => new Text_Type'(To_Text ("ElifBranch")), python_Exec_Stmt => new Text_Type'(To_Text ("ExecStmt")), python_For_Stmt => new Text_Type'(To_Text ("ForStmt")), python_Global_Stmt => new Text_Type'(To_Text ("GlobalStmt")), python_If_Stmt => new Text_Type'(To_Text ("IfStmt")), python_Import_From => new Text_Type'(To_Text ("ImportFrom")), python_Import_Name => new Text_Type'(To_Text ("ImportName")), python_Pass_Stmt => new Text_Type'(To_Text ("PassStmt")), python_Print_Stmt => new Text_Type'(To_Text ("PrintStmt")), python_Raise_Stmt => new Text_Type'(To_Text ("RaiseStmt")), python_Return_Stmt => new Text_Type'(To_Text ("ReturnStmt")), python_Stream_Print_Stmt => new Text_Type'(To_Text ("StreamPrintStmt")), python_Try_Stmt => new Text_Type'(To_Text ("TryStmt")), python_While_Stmt => new Text_Type'(To_Text ("WhileStmt")), python_With_Stmt => new Text_Type'(To_Text ("WithStmt")), python_Var_Args_Flag_Absent => new Text_Type'(To_Text ("VarArgsFlagAbsent")), python_Var_Args_Flag_Present => new Text_Type'(To_Text ("VarArgsFlagPresent")));
+
+   function python_node_kind
+     (Node : python_base_entity_Ptr) return python_node_kind_enum is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         K : constant Python_Node_Kind_Type := Node.Node.Kind;
+      begin
+         return python_node_kind_enum (K'Enum_Rep);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return python_node_kind_enum'First;
+   end;
+
+   procedure python_kind_name
+     (Kind : python_node_kind_enum; Result : access python_text) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         K    : constant Python_Node_Kind_Type := Python_Node_Kind_Type'Enum_Val (Kind);
+         Name : Text_Access renames Node_Kind_Names (K);
+      begin
+         Result.all := (Chars        => Name.all'Address,
+                        Length       => Name'Length,
+                        Is_Allocated => 0);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function python_node_unit
+     (Node : python_base_entity_Ptr) return python_analysis_unit is
+   begin
+      Clear_Last_Exception;
+      return Node.Node.Unit;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return null;
+   end;
+
+   function python_is_token_node
+     (Node : python_base_entity_Ptr) return int is
+   begin
+      Clear_Last_Exception;
+      return Boolean'Pos (Is_Token_Node (Node.Node));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   function python_is_synthetic
+     (Node : python_base_entity_Ptr) return int is
+   begin
+      Clear_Last_Exception;
+      return Boolean'Pos (Is_Synthetic (Node.Node));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   procedure python_node_image
+     (Node : python_base_entity_Ptr; Result : access python_text) is
+   begin
+      Clear_Last_Exception;
+      declare
+         Img : constant Text_Type := Short_Text_Image (Node.Node);
+      begin
+         Result.all := Wrap_Alloc (Img);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure python_node_text
+     (Node : python_base_entity_Ptr;
+      Text : access python_text) is
+   begin
+      Clear_Last_Exception;
+      Text.all := Wrap_Alloc (Implementation.Text (Node.Node));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure python_node_sloc_range
+     (Node         : python_base_entity_Ptr;
+      Sloc_Range_P : access python_source_location_range) is
+   begin
+      Clear_Last_Exception;
+
+      Sloc_Range_P.all := Wrap (Sloc_Range (Node.Node));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure python_lookup_in_node
+     (Node   : python_base_entity_Ptr;
+      Sloc   : python_source_location;
+      Result : python_base_entity_Ptr) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         S : constant Source_Location := Unwrap (Sloc);
+      begin
+         Result.all := (Lookup (Node.Node, S), Node.Info);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function python_node_children_count
+     (Node : python_base_entity_Ptr) return unsigned is
+   begin
+      Clear_Last_Exception;
+      return unsigned (Children_Count (Node.Node));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   function python_node_child
+     (Node    : python_base_entity_Ptr;
+      N       : unsigned;
+      Child_P : python_base_entity_Ptr) return int is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Result : Bare_Python_Node;
+         Exists : Boolean;
+      begin
+         if N > unsigned (Natural'Last) then
+            return 0;
+         end if;
+         Get_Child (Node.Node, Natural (N) + 1, Exists, Result);
+         if Exists then
+            Child_P.all := (Result, Node.Info);
+            return 1;
+         else
+            return 0;
+         end if;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   function python_node_export_tree
+     (Node   : python_base_entity_Ptr;
+      Tree_P : access python_node_tree) return int is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         function Count_Nodes (N : Bare_Python_Node) return Natural;
+         --  Return the number of nodes in the tree rooted at N
+
+         -----------------
+         -- Count_Nodes --
+         -----------------
+
+         function Count_Nodes (N : Bare_Python_Node) return Natural is
+            Result : Natural := 1;
+            C      : Bare_Python_Node;
+         begin
+            for I in 1 .. Children_Count (N) loop
+               C := Child (N, I);
+               if C /= null then
+                  Result := Result + Count_Nodes (C);
+               end if;
+            end loop;
+            return Result;
+         end Count_Nodes;
+
+         Count  : constant Natural :=
+           (if Node.Node = null then 0 else Count_Nodes (Node.Node));
+         Length : constant Storage_Offset := Storage_Offset (Count);
+
+         Node_Size : constant Storage_Offset :=
+           Bare_Python_Node'Size / System.Storage_Unit;
+
+         --  Allocate all columns in a single memory block: first the nodes,
+         --  then 32-bit columns and finally 16-bit columns, so that all
+         --  columns are properly aligned.
+
+         Nodes_Addr : constant System.Address := System.Memory.Alloc
+           (System.Memory.size_t (Length * (Node_Size + 7 * 4 + 2 * 2)));
+         Kinds_Addr           : constant System.Address :=
+           Nodes_Addr + Length * Node_Size;
+         Parents_Addr         : constant System.Address :=
+           Kinds_Addr + Length * 4;
+         Children_Counts_Addr : constant System.Address :=
+           Parents_Addr + Length * 4;
+         Token_Starts_Addr    : constant System.Address :=
+           Children_Counts_Addr + Length * 4;
+         Token_Ends_Addr      : constant System.Address :=
+           Token_Starts_Addr + Length * 4;
+         Start_Lines_Addr     : constant System.Address :=
+           Token_Ends_Addr + Length * 4;
+         End_Lines_Addr       : constant System.Address :=
+           Start_Lines_Addr + Length * 4;
+         Start_Columns_Addr   : constant System.Address :=
+           End_Lines_Addr + Length * 4;
+         End_Columns_Addr     : constant System.Address :=
+           Start_Columns_Addr + Length * 2;
+
+         subtype Index_Range is Integer range 0 .. Count - 1;
+         type Node_Column is array (Index_Range) of Bare_Python_Node
+           with Convention => C;
+         type Int_Column is array (Index_Range) of int
+           with Convention => C;
+         type Line_Column is array (Index_Range) of Unsigned_32
+           with Convention => C;
+         type Column_Column is array (Index_Range) of Unsigned_16
+           with Convention => C;
+
+         Nodes           : Node_Column with Import, Address => Nodes_Addr;
+         Kinds           : Int_Column with Import, Address => Kinds_Addr;
+         Parents         : Int_Column with Import, Address => Parents_Addr;
+         Children_Counts : Int_Column
+           with Import, Address => Children_Counts_Addr;
+         Token_Starts    : Int_Column
+           with Import, Address => Token_Starts_Addr;
+         Token_Ends      : Int_Column with Import, Address => Token_Ends_Addr;
+         Start_Lines     : Line_Column
+           with Import, Address => Start_Lines_Addr;
+         End_Lines       : Line_Column with Import, Address => End_Lines_Addr;
+         Start_Columns   : Column_Column
+           with Import, Address => Start_Columns_Addr;
+         End_Columns     : Column_Column
+           with Import, Address => End_Columns_Addr;
+
+         Next : Natural := 0;
+         --  Index of the next node to export
+
+         procedure Export (N : Bare_Python_Node; Parent : int);
+         --  Store data for all nodes in the tree rooted at N in columns, using
+         --  Parent as the index of N's parent.
+
+         ------------
+         -- Export --
+         ------------
+
+         procedure Export (N : Bare_Python_Node; Parent : int) is
+            Index    : constant Natural := Next;
+            Sloc     : constant Source_Location_Range := Sloc_Range (N);
+            Children : Natural := 0;
+            C        : Bare_Python_Node;
+         begin
+            Next := Next + 1;
+
+            Nodes (Index) := N;
+            Kinds (Index) := int (N.Kind'Enum_Rep);
+            Parents (Index) := Parent;
+            Token_Starts (Index) := int (N.Token_Start_Index);
+            Token_Ends (Index) := int (N.Token_End_Index);
+            Start_Lines (Index) := Unsigned_32 (Sloc.Start_Line);
+            Start_Columns (Index) := Unsigned_16 (Sloc.Start_Column);
+            End_Lines (Index) := Unsigned_32 (Sloc.End_Line);
+            End_Columns (Index) := Unsigned_16 (Sloc.End_Column);
+
+            for I in 1 .. Children_Count (N) loop
+               C := Child (N, I);
+               if C /= null then
+                  Children := Children + 1;
+                  Export (C, int (Index));
+               end if;
+            end loop;
+            Children_Counts (Index) := int (Children);
+         end Export;
+
+      begin
+         if Count > 0 then
+            Export (Node.Node, -1);
+         end if;
+
+         Tree_P.all := (Count           => int (Count),
+                        Nodes           => Nodes_Addr,
+                        Kinds           => Kinds_Addr,
+                        Parents         => Parents_Addr,
+                        Children_Counts => Children_Counts_Addr,
+                        Token_Starts    => Token_Starts_Addr,
+                        Token_Ends      => Token_Ends_Addr,
+                        Start_Lines     => Start_Lines_Addr,
+                        Start_Columns   => Start_Columns_Addr,
+                        End_Lines       => End_Lines_Addr,
+                        End_Columns     => End_Columns_Addr);
+         return 1;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   procedure python_destroy_node_tree
+     (Tree : access python_node_tree) is
+   begin
+      Clear_Last_Exception;
+
+      System.Memory.Free (Tree.Nodes);
+      Tree.all := (Count => 0, others => System.Null_Address);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function python_text_to_locale_string
+     (Text : python_text) return System.Address is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         use GNATCOLL.Iconv;
+
+         Input_Byte_Size : constant size_t := 4 * Text.Length;
+
+         Output_Byte_Size : constant size_t := Input_Byte_Size + 1;
+         --  Assuming no encoding will take more than 4 bytes per character, 4
+         --  times the size of the input text plus one null byte should be
+         --  enough to hold the result. This is a development helper anyway, so
+         --  we don't have performance concerns.
+
+         Result : constant System.Address := System.Memory.Alloc
+           (System.Memory.size_t (Output_Byte_Size));
+         --  Buffer we are going to return to the caller. We use
+         --  System.Memory.Alloc so that users can call C's "free" function in
+         --  order to free it.
+
+         Input : String (1 .. Natural (Input_Byte_Size));
+         for Input'Address use Text.Chars;
+
+         Output : String (1 .. Natural (Output_Byte_Size));
+         for Output'Address use Result;
+
+         State                     : Iconv_T;
+         Input_Index, Output_Index : Positive := 1;
+         Status                    : Iconv_Result;
+
+         From_Code : constant String :=
+           (if System."=" (System.Default_Bit_Order, System.Low_Order_First)
+            then UTF32LE
+            else UTF32BE);
+
+      begin
+         --  GNATCOLL.Iconv raises Constraint_Error exceptions for empty
+         --  strings, so handle them ourselves.
+
+         if Input_Byte_Size = 0 then
+            Output (1) := ASCII.NUL;
+         end if;
+
+         --  Encode to the locale. Don't bother with error checking...
+
+         Set_Locale;
+         State := Iconv_Open
+           (To_Code         => Locale,
+            From_Code       => From_Code,
+            Transliteration => True,
+            Ignore          => True);
+         Iconv (State, Input, Input_Index, Output, Output_Index, Status);
+         Iconv_Close (State);
+
+         --  Don't forget the trailing NULL character to keep C programs happy
+         Output (Output_Index) := ASCII.NUL;
+
+         return Result;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return System.Null_Address;
+   end;
+
+   function python_text_to_bytes
+     (Text   : access python_text;
+      Bytes  : access System.Address;
+      Length : access size_t) return int is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Chars : Text_Type (1 .. Natural (Text.Length))
+           with Import, Address => Text.Chars;
+
+         Is_Latin_1 : constant Boolean :=
+           (for all C of Chars => Wide_Wide_Character'Pos (C) < 256);
+      begin
+         if Is_Latin_1 then
+
+            --  Fast path: one byte per character, no need for a transcoder
+
+            Bytes.all := System.Memory.Alloc
+              (System.Memory.size_t (Natural'Max (1, Chars'Length)));
+            Length.all := size_t (Chars'Length);
+            declare
+               Result : String (Chars'Range)
+                 with Import, Address => Bytes.all;
+            begin
+               for I in Chars'Range loop
+                  Result (I) :=
+                    Character'Val (Wide_Wide_Character'Pos (Chars (I)));
+               end loop;
+            end;
+            return 1;
+
+         else
+            declare
+               Encoded : constant String := To_UTF8 (Chars);
+               Buffer  : constant System.Address := System.Memory.Alloc
+                 (System.Memory.size_t (Encoded'Length));
+               Result  : String (Encoded'Range)
+                 with Import, Address => Buffer;
+            begin
+               Result := Encoded;
+               Bytes.all := Buffer;
+               Length.all := size_t (Encoded'Length);
+            end;
+            return 0;
+         end if;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   ----------
+   -- Wrap --
+   ----------
+
+   function Wrap (S : Unbounded_Wide_Wide_String) return python_text is
+      Chars  : Big_Wide_Wide_String_Access;
+      Length : Natural;
+   begin
+      Get_Wide_Wide_String (S, Chars, Length);
+      return (Chars.all'Address, size_t (Length), 0);
+   end Wrap;
+
+   ------------------------
+   -- Set_Last_Exception --
+   ------------------------
+
+   procedure Set_Last_Exception (Exc : Exception_Occurrence) is
+   begin
+      --  If it's the first time, allocate room for the exception information
+
+      if Last_Exception = null then
+         Last_Exception := new python_exception;
+
+      --  If it is not the first time, free memory allocated for the last
+      --  exception.
+
+      elsif Last_Exception.Information /= Null_Ptr then
+         Free (Last_Exception.Information);
+      end if;
+
+      --  Get the kind corresponding to Exc
+
+      declare
+         Id : constant Exception_Id := Exception_Identity (Exc);
+      begin
+         if Id = Invalid_Field'Identity then
+            Last_Exception.Kind := Exception_Invalid_Field;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Node_Data_Evaluation_Error'Identity then
+            Last_Exception.Kind := Exception_Node_Data_Evaluation_Error;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Invalid_Input'Identity then
+            Last_Exception.Kind := Exception_Invalid_Input;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Invalid_Symbol_Error'Identity then
+            Last_Exception.Kind := Exception_Invalid_Symbol_Error;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Invalid_Unit_Name_Error'Identity then
+            Last_Exception.Kind := Exception_Invalid_Unit_Name_Error;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Native_Exception'Identity then
+            Last_Exception.Kind := Exception_Native_Exception;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Precondition_Failure'Identity then
+            Last_Exception.Kind := Exception_Precondition_Failure;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Property_Error'Identity then
+            Last_Exception.Kind := Exception_Property_Error;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Template_Args_Error'Identity then
+            Last_Exception.Kind := Exception_Template_Args_Error;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Template_Format_Error'Identity then
+            Last_Exception.Kind := Exception_Template_Format_Error;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Template_Instantiation_Error'Identity then
+            Last_Exception.Kind := Exception_Template_Instantiation_Error;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Stale_Reference_Error'Identity then
+            Last_Exception.Kind := Exception_Stale_Reference_Error;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         elsif Id = Unknown_Charset'Identity then
+            Last_Exception.Kind := Exception_Unknown_Charset;
+            Last_Exception.Information :=
+               New_String (Exception_Message (Exc));
+         else
+            Last_Exception.Kind := Exception_Native_Exception;
+            Last_Exception.Information :=
+               New_String (Exception_Information (Exc));
+         end if;
+      end;
+
+      Current_Exception := Last_Exception;
+   end Set_Last_Exception;
+
+   --------------------------
+   -- Clear_Last_Exception --
+   --------------------------
+
+   procedure Clear_Last_Exception is
+   begin
+      if Current_Exception /= null then
+         Free (Last_Exception.Information);
+         Current_Exception := null;
+      end if;
+   end Clear_Last_Exception;
+
+   function python_get_last_exception return python_exception_Ptr
+   is
+   begin
+      return Current_Exception;
+   end;
+
+   function python_token_kind_name (Kind : int) return chars_ptr
+   is
+      K : Token_Kind;
+   begin
+      begin
+         K := Token_Kind'Enum_Val (Kind);
+      exception
+         when Exc : Constraint_Error =>
+            Set_Last_Exception (Exc);
+            return Null_Ptr;
+      end;
+
+      return New_String (Token_Kind_Name (K));
+   end;
+
+   procedure python_token_next
+     (Token      : python_token;
+      Next_Token : access python_token)
+   is
+   begin
+      Clear_Last_Exception;
+      declare
+         T  : constant Token_Reference := Unwrap (Token);
+         NT : constant Token_Reference := Next (T);
+      begin
+         Next_Token.all := Wrap (NT);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure python_token_previous
+     (Token          : python_token;
+      Previous_Token : access python_token)
+   is
+   begin
+      Clear_Last_Exception;
+      declare
+         T  : constant Token_Reference := Unwrap (Token);
+         PT : constant Token_Reference := Previous (T);
+      begin
+         Previous_Token.all := Wrap (PT);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function python_token_range_text
+     (First, Last : python_token;
+      Text        : access python_text) return int
+   is
+   begin
+      Clear_Last_Exception;
+      declare
+         FD : constant Token_Data_Type := Data (Unwrap (First));
+         LD : constant Token_Data_Type := Data (Unwrap (Last));
+
+         First_Source_Buffer, Last_Source_Buffer : Text_Cst_Access;
+         First_Index, Ignored_First              : Positive;
+         Last_Index, Ignored_Last                : Natural;
+      begin
+         Extract_Token_Text
+           (FD, First_Source_Buffer, First_Index, Ignored_Last);
+         Extract_Token_Text
+           (LD, Last_Source_Buffer, Ignored_First, Last_Index);
+         if First_Source_Buffer /= Last_Source_Buffer then
+            return 0;
+         end if;
+         Text.all := Wrap (First_Source_Buffer, First_Index, Last_Index);
+         return 1;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   function python_token_is_equivalent
+     (Left  : python_token;
+      Right : python_token) return python_bool
+   is
+   begin
+      Clear_Last_Exception;
+         declare
+         L  : constant Token_Reference := Unwrap (Left);
+         R  : constant Token_Reference := Unwrap (Right);
+      begin
+         return python_bool (Boolean'Pos (Is_Equivalent (L, R)));
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   procedure python_entity_image
+     (Ent : python_base_entity_Ptr; Result : access python_text) is
+   begin
+      Clear_Last_Exception;
+      declare
+         Img : constant Text_Type := Text_Image (Ent.all);
+      begin
+         Result.all := Wrap_Alloc (Img);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   ----------------
+   -- Wrap_Alloc --
+   ----------------
+
+   function Wrap_Alloc (S : Text_Type) return python_text is
+      T : Text_Access := new Text_Type'(S);
+   begin
+      return python_text'(T.all'Address, T.all'Length, Is_Allocated => 1);
+   end Wrap_Alloc;
+
+   ----------
+   -- Wrap --
+   ----------
+
+   function Wrap
+     (S     : Text_Cst_Access;
+      First : Positive;
+      Last  : Natural) return python_text
+   is
+      Substring : Text_Type renames S (First .. Last);
+   begin
+      return (if First > Last
+              then (Chars        => System.Null_Address,
+                    Length       => 0,
+                    Is_Allocated => 0)
+              else (Chars        => S (First)'Address,
+                    Length       => Substring'Length,
+                    Is_Allocated => 0));
+   end Wrap;
+
+   procedure python_destroy_text (T : access python_text) is
+   begin
+      Clear_Last_Exception;
+      declare
+         use System;
+      begin
+         if T.Is_Allocated /= 0 and then T.Chars /= System.Null_Address then
+            declare
+               TT : Text_Type (1 .. Natural (T.Length));
+               for TT'Address use T.Chars;
+               TA : Text_Access := TT'Unrestricted_Access;
+            begin
+               Free (TA);
+            end;
+            T.Chars := System.Null_Address;
+         end if;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure python_symbol_text
+     (Symbol : access python_symbol_type; Text : access python_text) is
+   begin
+      Clear_Last_Exception;
+      declare
+         Sym    : constant Symbol_Type := Unwrap_Symbol (Symbol.all);
+         Result : constant Text_Type :=
+           (if Sym = null then "" else Image (Sym));
+      begin
+         Text.all := Wrap_Alloc (Result);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function python_create_big_integer
+     (Text : access python_text) return python_big_integer is
+   begin
+      Clear_Last_Exception;
+      declare
+         T      : Text_Type (1 .. Natural (Text.Length))
+            with Import, Address => Text.Chars;
+         Image  : constant String := Langkit_Support.Text.Image (T);
+         Result : constant Big_Integer_Type := Create_Big_Integer (Image);
+      begin
+         return Wrap_Big_Integer (Result);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return python_big_integer (System.Null_Address);
+   end python_create_big_integer;
+
+   procedure python_big_integer_text
+     (Bigint : python_big_integer; Text : access python_text) is
+   begin
+      Clear_Last_Exception;
+      declare
+         BI    : constant Big_Integer_Type := Unwrap_Big_Integer (Bigint);
+         Image : constant String := BI.Value.Image;
+      begin
+         Text.all := Wrap_Alloc (To_Text (Image));
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure python_big_integer_decref
+     (Bigint : python_big_integer) is
+   begin
+      Clear_Last_Exception;
+      declare
+         BI : Big_Integer_Type := Unwrap_Big_Integer (Bigint);
+      begin
+         Dec_Ref (BI);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   function python_create_unit_provider
+     (Data                    : System.Address;
+      Destroy_Func            : python_unit_provider_destroy_callback;
+      Get_Unit_Filename_Func  : python_unit_provider_get_unit_filename_callback;
+      Get_Unit_From_Name_Func : python_unit_provider_get_unit_from_name_callback)
+      return python_unit_provider is
+   begin
+      Clear_Last_Exception;
+      declare
+         Result : constant C_Unit_Provider_Access := new C_Unit_Provider'
+           (Ada.Finalization.Limited_Controlled with
+            Ref_Count               => 1,
+            Data                    => Data,
+            Destroy_Func            => Destroy_Func,
+            Get_Unit_Filename_Func  => Get_Unit_Filename_Func,
+            Get_Unit_From_Name_Func => Get_Unit_From_Name_Func);
+      begin
+         return Wrap_Private_Provider (Internal_Unit_Provider_Access (Result));
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return python_unit_provider (System.Null_Address);
+   end;
+
+   procedure python_dec_ref_unit_provider
+     (Provider : python_unit_provider) is
+   begin
+      Clear_Last_Exception;
+      declare
+         P : Internal_Unit_Provider_Access :=
+            Unwrap_Private_Provider (Provider);
+      begin
+         Dec_Ref (P);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   --------------
+   -- Finalize --
+   --------------
+
+   overriding procedure Finalize (Provider : in out C_Unit_Provider) is
+   begin
+      Provider.Destroy_Func (Provider.Data);
+   end Finalize;
+
+   -------------
+   -- Inc_Ref --
+   -------------
+
+   overriding procedure Inc_Ref (Provider : in out C_Unit_Provider) is
+   begin
+      Provider.Ref_Count := Provider.Ref_Count + 1;
+   end Inc_Ref;
+
+   -------------
+   -- Dec_Ref --
+   -------------
+
+   overriding function Dec_Ref
+     (Provider : in out C_Unit_Provider) return Boolean is
+   begin
+      Provider.Ref_Count := Provider.Ref_Count - 1;
+      if Provider.Ref_Count = 0 then
+         return True;
+      else
+         return False;
+      end if;
+   end Dec_Ref;
+
+   -----------------------
+   -- Get_Unit_Filename --
+   -----------------------
+
+   overriding function Get_Unit_Filename
+     (Provider : C_Unit_Provider;
+      Name     : Text_Type;
+      Kind     : Analysis_Unit_Kind) return String
+   is
+      Name_Access : constant Text_Cst_Access := Name'Unrestricted_Access;
+
+      C_Result : chars_ptr := Provider.Get_Unit_Filename_Func
+        (Provider.Data, Wrap (Name_Access), Kind);
+   begin
+      if C_Result = Null_Ptr then
+         raise Property_Error with "invalid AST node for unit name";
+      else
+         declare
+            Result : constant String := Value (C_Result);
+         begin
+            Free (C_Result);
+            return Result;
+         end;
+      end if;
+   end Get_Unit_Filename;
+
+   --------------
+   -- Get_Unit --
+   --------------
+
+   overriding function Get_Unit
+     (Provider : C_Unit_Provider;
+      Context  : Internal_Context;
+      Name     : Text_Type;
+      Kind     : Analysis_Unit_Kind;
+      Charset  : String := "";
+      Reparse  : Boolean := False) return Internal_Unit
+   is
+      Name_Access : constant Text_Cst_Access := Name'Unrestricted_Access;
+      C_Charset   : chars_ptr := (if Charset'Length = 0
+                                  then Null_Ptr
+                                  else New_String (Charset));
+   begin
+      return C_Result : constant python_analysis_unit :=
+         Provider.Get_Unit_From_Name_Func
+           (Provider.Data, Context, Wrap (Name_Access), Kind,
+            C_Charset, Boolean'Pos (Reparse))
+      do
+         Free (C_Charset);
+         if C_Result = null then
+            raise Property_Error with "invalid AST node for unit name";
+         end if;
+      end return;
+   end Get_Unit;
+
+   
+
+
+   ----------
+   -- Wrap --
+   ----------
+
+   function Wrap (Token : Token_Reference) return python_token is
+      function Convert is new Ada.Unchecked_Conversion
+        (Token_Data_Handler_Access, System.Address);
+   begin
+      if Token = No_Token then
+         return (Token_Data   => System.Null_Address,
+                 Token_Index  => -1,
+                 Trivia_Index => -1,
+                 others       => <>);
+      end if;
+
+      declare
+         D : constant Token_Data_Type := Data (Token);
+         K : constant Token_Kind := Kind (D);
+
+         Index : constant Token_Or_Trivia_Index := Get_Token_Index (Token);
+
+         Source_Buffer : Text_Cst_Access;
+         First         : Positive;
+         Last          : Natural;
+      begin
+         Extract_Token_Text (D, Source_Buffer, First, Last);
+         return (Token_Data   => Convert (Get_Token_TDH (Token)),
+                 Token_Index  => int (Index.Token),
+                 Trivia_Index => int (Index.Trivia),
+                 Kind         => K'Enum_Rep,
+                 Text         => Wrap (Source_Buffer, First, Last),
+                 Sloc_Range   => Wrap (Sloc_Range (D)));
+      end;
+   end Wrap;
+
+   ------------
+   -- Unwrap --
+   ------------
+
+   function Unwrap (Token : python_token) return Token_Reference is
+      use System;
+
+      --  The following unchecked conversion makes it possible to restore the
+      --  Ada type of token data handler accesses from the C API. All
+      --  read/writes for the pointed values are made in Ada through values of
+      --  the same access type. Thus, strict aliasing issues should not arise
+      --  for these.
+      --
+      --  See <https://gcc.gnu.org/onlinedocs/gnat_ugn/
+      --       Optimization-and-Strict-Aliasing.html>.
+
+      pragma Warnings (Off, "possible aliasing problem for type");
+      function Convert is new Ada.Unchecked_Conversion
+        (System.Address, Token_Data_Handler_Access);
+      pragma Warnings (On, "possible aliasing problem for type");
+
+   begin
+      return (if Token.Token_Data = Null_Address
+              then No_Token
+              else Wrap_Token_Reference
+                     (Convert (Token.Token_Data),
+                      (Token  => Token_Index (Token.Token_Index),
+                       Trivia => Token_Index (Token.Trivia_Index))));
+   end Unwrap;
+
+   
+
+
+
+function python_bare_python_node_array_create (Length : int) return Bare_Python_Node_Array_Access is
+begin
+   Clear_Last_Exception;
+   return Create_Bare_Python_Node_Array (Natural (Length));
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+      return null;
+end python_bare_python_node_array_create;
+
+procedure python_bare_python_node_array_inc_ref (A : Bare_Python_Node_Array_Access) is
+begin
+   Clear_Last_Exception;
+   Inc_Ref (A);
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end;
+
+procedure python_bare_python_node_array_dec_ref (A : Bare_Python_Node_Array_Access) is
+begin
+   Clear_Last_Exception;
+   declare
+      A_Var : Bare_Python_Node_Array_Access := A;
+   begin
+      Dec_Ref (A_Var);
+   end;
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end;
+
+
+
+   
+
+
+
+function python_python_node_array_create (Length : int) return Internal_Entity_Array_Access is
+begin
+   Clear_Last_Exception;
+   return Create_Internal_Entity_Array (Natural (Length));
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+      return null;
+end python_python_node_array_create;
+
+procedure python_python_node_array_inc_ref (A : Internal_Entity_Array_Access) is
+begin
+   Clear_Last_Exception;
+   Inc_Ref (A);
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end;
+
+procedure python_python_node_array_dec_ref (A : Internal_Entity_Array_Access) is
+begin
+   Clear_Last_Exception;
+   declare
+      A_Var : Internal_Entity_Array_Access := A;
+   begin
+      Dec_Ref (A_Var);
+   end;
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end;
+
+
+
+   ---------------------------------------
+   -- Kind-specific AST node primitives --
+   ---------------------------------------
+
+           
+
+   
+
+   
+   
+
+   function python_python_node_parent
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity;
+         begin
+            Result := Libpythonlang.Implementation.Parent (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_python_node_parent;
+
+
+           
+
+   
+
+   
+   
+
+   function python_python_node_parents
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_python_node_array) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity_Array_Access;
+         begin
+            Result := Libpythonlang.Implementation.Parents (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                   Result
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_python_node_parents;
+
+
+           
+
+   
+
+   
+   
+
+   function python_python_node_children
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_python_node_array) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity_Array_Access;
+         begin
+            Result := Libpythonlang.Implementation.Children (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                   Result
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_python_node_children;
+
+
+           
+
+   
+
+   
+   
+
+   function python_python_node_token_start
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_token) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Token_Reference;
+         begin
+            Result := Libpythonlang.Implementation.Token_Start (Unwrapped_Node);
+
+            Value_P.all :=
+                   Wrap (Result)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_python_node_token_start;
+
+
+           
+
+   
+
+   
+   
+
+   function python_python_node_token_end
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_token) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Token_Reference;
+         begin
+            Result := Libpythonlang.Implementation.Token_End (Unwrapped_Node);
+
+            Value_P.all :=
+                   Wrap (Result)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_python_node_token_end;
+
+
+           
+
+   
+
+   
+   
+
+   function python_python_node_child_index
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access int) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Integer;
+         begin
+            Result := Libpythonlang.Implementation.Child_Index (Unwrapped_Node);
+
+            Value_P.all :=
+                   int (Result)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_python_node_child_index;
+
+
+           
+
+   
+
+   
+   
+
+   function python_python_node_previous_sibling
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity;
+         begin
+            Result := Libpythonlang.Implementation.Previous_Sibling (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_python_node_previous_sibling;
+
+
+           
+
+   
+
+   
+   
+
+   function python_python_node_next_sibling
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Entity;
+         begin
+            Result := Libpythonlang.Implementation.Next_Sibling (Unwrapped_Node, E_Info => Node.Info);
+
+            Value_P.all :=
+                  (Result.Node, Result.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_python_node_next_sibling;
+
+
+           
+
+   
+
+   
+   
+
+   function python_python_node_unit
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_analysis_unit) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Internal_Unit;
+         begin
+            Result := Libpythonlang.Implementation.Unit (Unwrapped_Node);
+
+            Value_P.all :=
+                   Result
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_python_node_unit;
+
+
+           
+
+   
+
+   
+   
+
+   function python_python_node_is_ghost
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_bool) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Boolean;
+         begin
+            Result := Libpythonlang.Implementation.Is_Ghost (Unwrapped_Node);
+
+            Value_P.all :=
+                   python_bool (Boolean'Pos (Result))
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_python_node_is_ghost;
+
+
+           
+
+   
+
+   
+   
+
+   function python_python_node_full_sloc_image
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_text_type) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+
+         declare
+            
+
+            Result : Character_Type_Array_Access;
+         begin
+            Result := Libpythonlang.Implementation.Full_Sloc_Image (Unwrapped_Node);
+
+            Value_P.all :=
+                   Result
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_python_node_full_sloc_image;
+
+
+           
+
+   
+
+   
+   
+
+   function python_arg_assoc_f_name
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Arg_Assoc_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Arg_Assoc_F_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_arg_assoc_f_name;
+
+
+           
+
+   
+
+   
+   
+
+   function python_arg_assoc_f_expr
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Arg_Assoc_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Arg_Assoc_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_arg_assoc_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function python_arg_gen_f_expr
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Arg_Gen_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Arg_Gen_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_arg_gen_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function python_arg_gen_f_comprehension
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Arg_Gen_Range then
+
+         declare
+            
+
+            Result : Bare_Comp_For;
+         begin
+            Result := Arg_Gen_F_Comprehension (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_arg_gen_f_comprehension;
+
+
+           
+
+   
+
+   
+   
+
+   function python_kw_args_f_expr
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Kw_Args_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Kw_Args_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_kw_args_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function python_var_args_f_expr
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Var_Args_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Var_Args_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_var_args_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function python_as_name_node_f_imported
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_As_Name_Node_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := As_Name_Node_F_Imported (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_as_name_node_f_imported;
+
+
+           
+
+   
+
+   
+   
+
+   function python_as_name_node_f_as_name
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_As_Name_Node_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := As_Name_Node_F_As_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_as_name_node_f_as_name;
+
+
+           
+
+   
+
+   
+   
+
+   function python_comp_if_f_test
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Comp_If_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Comp_If_F_Test (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_comp_if_f_test;
+
+
+           
+
+   
+
+   
+   
+
+   function python_comp_if_f_comp
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Comp_If_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := Comp_If_F_Comp (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_comp_if_f_comp;
+
+
+           
+
+   
+
+   
+   
+
+   function python_comp_for_f_exprs
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Comp_For_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Comp_For_F_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_comp_for_f_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function python_comp_for_f_target
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Comp_For_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Comp_For_F_Target (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_comp_for_f_target;
+
+
+           
+
+   
+
+   
+   
+
+   function python_comp_for_f_comp
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Comp_For_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := Comp_For_F_Comp (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_comp_for_f_comp;
+
+
+           
+
+   
+
+   
+   
+
+   function python_comp_forl_f_exprs
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Comp_ForL_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Comp_ForL_F_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_comp_forl_f_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function python_comp_forl_f_target
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Comp_ForL_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Comp_ForL_F_Target (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_comp_forl_f_target;
+
+
+           
+
+   
+
+   
+   
+
+   function python_comp_forl_f_comp
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Comp_ForL_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := Comp_ForL_F_Comp (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_comp_forl_f_comp;
+
+
+           
+
+   
+
+   
+   
+
+   function python_decorator_f_dec_name
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Decorator_Range then
+
+         declare
+            
+
+            Result : Bare_Name;
+         begin
+            Result := Decorator_F_Dec_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_decorator_f_dec_name;
+
+
+           
+
+   
+
+   
+   
+
+   function python_decorator_f_arg_list
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Decorator_Range then
+
+         declare
+            
+
+            Result : Bare_Arg_List;
+         begin
+            Result := Decorator_F_Arg_List (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_decorator_f_arg_list;
+
+
+           
+
+   
+
+   
+   
+
+   function python_dict_assoc_f_key
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Dict_Assoc_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Dict_Assoc_F_Key (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_dict_assoc_f_key;
+
+
+           
+
+   
+
+   
+   
+
+   function python_dict_assoc_f_value
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Dict_Assoc_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Dict_Assoc_F_Value (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_dict_assoc_f_value;
+
+
+           
+
+   
+
+   
+   
+
+   function python_else_part_f_statements
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Else_Part_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := Else_Part_F_Statements (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_else_part_f_statements;
+
+
+           
+
+   
+
+   
+   
+
+   function python_except_part_f_as_name
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Except_Part_Range then
+
+         declare
+            
+
+            Result : Bare_As_Name_Node;
+         begin
+            Result := Except_Part_F_As_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_except_part_f_as_name;
+
+
+           
+
+   
+
+   
+   
+
+   function python_except_part_f_statements
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Except_Part_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := Except_Part_F_Statements (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_except_part_f_statements;
+
+
+           
+
+   
+
+   
+   
+
+   function python_and_expr_f_left
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_And_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := And_Expr_F_Left (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_and_expr_f_left;
+
+
+           
+
+   
+
+   
+   
+
+   function python_and_expr_f_right
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_And_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := And_Expr_F_Right (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_and_expr_f_right;
+
+
+           
+
+   
+
+   
+   
+
+   function python_and_op_f_left
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_And_Op_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := And_Op_F_Left (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_and_op_f_left;
+
+
+           
+
+   
+
+   
+   
+
+   function python_and_op_f_right
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_And_Op_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := And_Op_F_Right (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_and_op_f_right;
+
+
+           
+
+   
+
+   
+   
+
+   function python_bin_op_f_left
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Bin_Op then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Bin_Op_F_Left (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_bin_op_f_left;
+
+
+           
+
+   
+
+   
+   
+
+   function python_bin_op_f_op
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Bin_Op then
+
+         declare
+            
+
+            Result : Bare_Op;
+         begin
+            Result := Bin_Op_F_Op (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_bin_op_f_op;
+
+
+           
+
+   
+
+   
+   
+
+   function python_bin_op_f_right
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Bin_Op then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Bin_Op_F_Right (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_bin_op_f_right;
+
+
+           
+
+   
+
+   
+   
+
+   function python_call_expr_f_prefix
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Call_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Call_Expr_F_Prefix (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_call_expr_f_prefix;
+
+
+           
+
+   
+
+   
+   
+
+   function python_call_expr_f_suffix
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Call_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Arg_List;
+         begin
+            Result := Call_Expr_F_Suffix (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_call_expr_f_suffix;
+
+
+           
+
+   
+
+   
+   
+
+   function python_comp_op_f_left
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Comp_Op_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Comp_Op_F_Left (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_comp_op_f_left;
+
+
+           
+
+   
+
+   
+   
+
+   function python_comp_op_f_op
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Comp_Op_Range then
+
+         declare
+            
+
+            Result : Bare_Comp_Op_Kind;
+         begin
+            Result := Comp_Op_F_Op (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_comp_op_f_op;
+
+
+           
+
+   
+
+   
+   
+
+   function python_comp_op_f_right
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Comp_Op_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Comp_Op_F_Right (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_comp_op_f_right;
+
+
+           
+
+   
+
+   
+   
+
+   function python_concat_string_lit_f_first_str
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Concat_String_Lit_Range then
+
+         declare
+            
+
+            Result : Bare_String_Lit;
+         begin
+            Result := Concat_String_Lit_F_First_Str (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_concat_string_lit_f_first_str;
+
+
+           
+
+   
+
+   
+   
+
+   function python_concat_string_lit_f_subsequent_str
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Concat_String_Lit_Range then
+
+         declare
+            
+
+            Result : Bare_String_Lit_List;
+         begin
+            Result := Concat_String_Lit_F_Subsequent_Str (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_concat_string_lit_f_subsequent_str;
+
+
+           
+
+   
+
+   
+   
+
+   function python_dict_comp_f_assoc
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Dict_Comp_Range then
+
+         declare
+            
+
+            Result : Bare_Dict_Assoc;
+         begin
+            Result := Dict_Comp_F_Assoc (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_dict_comp_f_assoc;
+
+
+           
+
+   
+
+   
+   
+
+   function python_dict_comp_f_comprehension
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Dict_Comp_Range then
+
+         declare
+            
+
+            Result : Bare_Comp_For;
+         begin
+            Result := Dict_Comp_F_Comprehension (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_dict_comp_f_comprehension;
+
+
+           
+
+   
+
+   
+   
+
+   function python_dict_lit_f_assocs
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Dict_Lit_Range then
+
+         declare
+            
+
+            Result : Bare_Dict_Assoc_List;
+         begin
+            Result := Dict_Lit_F_Assocs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_dict_lit_f_assocs;
+
+
+           
+
+   
+
+   
+   
+
+   function python_factor_f_op
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Factor_Range then
+
+         declare
+            
+
+            Result : Bare_Op;
+         begin
+            Result := Factor_F_Op (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_factor_f_op;
+
+
+           
+
+   
+
+   
+   
+
+   function python_factor_f_expr
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Factor_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Factor_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_factor_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function python_if_expr_f_expr
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_If_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := If_Expr_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_if_expr_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function python_if_expr_f_cond
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_If_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := If_Expr_F_Cond (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_if_expr_f_cond;
+
+
+           
+
+   
+
+   
+   
+
+   function python_if_expr_f_else_expr
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_If_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := If_Expr_F_Else_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_if_expr_f_else_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function python_inline_eval_f_exprs
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Inline_Eval_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Inline_Eval_F_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_inline_eval_f_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function python_lambda_def_f_args
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Lambda_Def_Range then
+
+         declare
+            
+
+            Result : Bare_Params;
+         begin
+            Result := Lambda_Def_F_Args (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_lambda_def_f_args;
+
+
+           
+
+   
+
+   
+   
+
+   function python_lambda_def_f_expr
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Lambda_Def_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Lambda_Def_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_lambda_def_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function python_list_comp_f_expr
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_List_Comp_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := List_Comp_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_list_comp_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function python_list_comp_f_comprehension
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_List_Comp_Range then
+
+         declare
+            
+
+            Result : Bare_Comp_ForL;
+         begin
+            Result := List_Comp_F_Comprehension (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_list_comp_f_comprehension;
+
+
+           
+
+   
+
+   
+   
+
+   function python_list_gen_f_expr
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_List_Gen_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := List_Gen_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_list_gen_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function python_list_gen_f_comprehension
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_List_Gen_Range then
+
+         declare
+            
+
+            Result : Bare_Comp_ForL;
+         begin
+            Result := List_Gen_F_Comprehension (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_list_gen_f_comprehension;
+
+
+           
+
+   
+
+   
+   
+
+   function python_list_lit_f_exprs
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_List_Lit_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := List_Lit_F_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_list_lit_f_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function python_dotted_name_f_prefix
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Dotted_Name_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Dotted_Name_F_Prefix (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_dotted_name_f_prefix;
+
+
+           
+
+   
+
+   
+   
+
+   function python_dotted_name_f_suffix
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Dotted_Name_Range then
+
+         declare
+            
+
+            Result : Bare_Id;
+         begin
+            Result := Dotted_Name_F_Suffix (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_dotted_name_f_suffix;
+
+
+           
+
+   
+
+   
+   
+
+   function python_not_op_f_expr
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Not_Op_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Not_Op_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_not_op_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function python_or_expr_f_left
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Or_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Or_Expr_F_Left (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_or_expr_f_left;
+
+
+           
+
+   
+
+   
+   
+
+   function python_or_expr_f_right
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Or_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Or_Expr_F_Right (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_or_expr_f_right;
+
+
+           
+
+   
+
+   
+   
+
+   function python_or_op_f_left
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Or_Op_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Or_Op_F_Left (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_or_op_f_left;
+
+
+           
+
+   
+
+   
+   
+
+   function python_or_op_f_right
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Or_Op_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Or_Op_F_Right (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_or_op_f_right;
+
+
+           
+
+   
+
+   
+   
+
+   function python_power_f_left
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Power_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Power_F_Left (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_power_f_left;
+
+
+           
+
+   
+
+   
+   
+
+   function python_power_f_right
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Power_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Power_F_Right (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_power_f_right;
+
+
+           
+
+   
+
+   
+   
+
+   function python_set_comp_f_expr
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Set_Comp_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Set_Comp_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_set_comp_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function python_set_comp_f_comprehension
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Set_Comp_Range then
+
+         declare
+            
+
+            Result : Bare_Comp_For;
+         begin
+            Result := Set_Comp_F_Comprehension (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_set_comp_f_comprehension;
+
+
+           
+
+   
+
+   
+   
+
+   function python_set_lit_f_exprs
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Set_Lit_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Set_Lit_F_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_set_lit_f_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function python_slice_expr_f_first
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Slice_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Slice_Expr_F_First (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_slice_expr_f_first;
+
+
+           
+
+   
+
+   
+   
+
+   function python_slice_expr_f_last
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Slice_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Slice_Expr_F_Last (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_slice_expr_f_last;
+
+
+           
+
+   
+
+   
+   
+
+   function python_ext_slice_expr_f_stride
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Ext_Slice_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Ext_Slice_Expr_F_Stride (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_ext_slice_expr_f_stride;
+
+
+           
+
+   
+
+   
+   
+
+   function python_subscript_expr_f_prefix
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Subscript_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Subscript_Expr_F_Prefix (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_subscript_expr_f_prefix;
+
+
+           
+
+   
+
+   
+   
+
+   function python_subscript_expr_f_suffix
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Subscript_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Subscript_Expr_F_Suffix (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_subscript_expr_f_suffix;
+
+
+           
+
+   
+
+   
+   
+
+   function python_tuple_lit_f_exprs
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Tuple_Lit_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Tuple_Lit_F_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_tuple_lit_f_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function python_xor_expr_f_left
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Xor_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Xor_Expr_F_Left (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_xor_expr_f_left;
+
+
+           
+
+   
+
+   
+   
+
+   function python_xor_expr_f_right
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Xor_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Xor_Expr_F_Right (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_xor_expr_f_right;
+
+
+           
+
+   
+
+   
+   
+
+   function python_yield_expr_f_exprs
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Yield_Expr_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Yield_Expr_F_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_yield_expr_f_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function python_file_node_f_statements
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_File_Node_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node_List;
+         begin
+            Result := File_Node_F_Statements (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_file_node_f_statements;
+
+
+           
+
+   
+
+   
+   
+
+   function python_kw_args_flag_p_as_bool
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_bool) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Kw_Args_Flag then
+
+         declare
+            
+
+            Result : Boolean;
+         begin
+            Result := Libpythonlang.Implementation.Dispatcher_Kw_Args_Flag_P_As_Bool (Unwrapped_Node);
+
+            Value_P.all :=
+                   python_bool (Boolean'Pos (Result))
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_kw_args_flag_p_as_bool;
+
+
+           
+
+   
+
+   
+   
+
+   function python_params_f_single_params
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Params_Range then
+
+         declare
+            
+
+            Result : Bare_Single_Param_List;
+         begin
+            Result := Params_F_Single_Params (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_params_f_single_params;
+
+
+           
+
+   
+
+   
+   
+
+   function python_rel_name_f_dots
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Rel_Name_Range then
+
+         declare
+            
+
+            Result : Bare_Dot_List;
+         begin
+            Result := Rel_Name_F_Dots (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_rel_name_f_dots;
+
+
+           
+
+   
+
+   
+   
+
+   function python_rel_name_f_name
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Rel_Name_Range then
+
+         declare
+            
+
+            Result : Bare_Name;
+         begin
+            Result := Rel_Name_F_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_rel_name_f_name;
+
+
+           
+
+   
+
+   
+   
+
+   function python_single_param_f_is_varargs
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Single_Param_Range then
+
+         declare
+            
+
+            Result : Bare_Var_Args_Flag;
+         begin
+            Result := Single_Param_F_Is_Varargs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_single_param_f_is_varargs;
+
+
+           
+
+   
+
+   
+   
+
+   function python_single_param_f_is_kwargs
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Single_Param_Range then
+
+         declare
+            
+
+            Result : Bare_Kw_Args_Flag;
+         begin
+            Result := Single_Param_F_Is_Kwargs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_single_param_f_is_kwargs;
+
+
+           
+
+   
+
+   
+   
+
+   function python_single_param_f_name
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Single_Param_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := Single_Param_F_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_single_param_f_name;
+
+
+           
+
+   
+
+   
+   
+
+   function python_single_param_f_default_value
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Single_Param_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Single_Param_F_Default_Value (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_single_param_f_default_value;
+
+
+           
+
+   
+
+   
+   
+
+   function python_assert_stmt_f_test_expr
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Assert_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Assert_Stmt_F_Test_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_assert_stmt_f_test_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function python_assert_stmt_f_msg
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Assert_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Assert_Stmt_F_Msg (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_assert_stmt_f_msg;
+
+
+           
+
+   
+
+   
+   
+
+   function python_assign_stmt_f_l_value
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Assign_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Assign_Stmt_F_L_Value (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_assign_stmt_f_l_value;
+
+
+           
+
+   
+
+   
+   
+
+   function python_assign_stmt_f_r_values
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Assign_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node_List;
+         begin
+            Result := Assign_Stmt_F_R_Values (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_assign_stmt_f_r_values;
+
+
+           
+
+   
+
+   
+   
+
+   function python_aug_assign_stmt_f_l_value
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Aug_Assign_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Aug_Assign_Stmt_F_L_Value (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_aug_assign_stmt_f_l_value;
+
+
+           
+
+   
+
+   
+   
+
+   function python_aug_assign_stmt_f_op
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Aug_Assign_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Op;
+         begin
+            Result := Aug_Assign_Stmt_F_Op (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_aug_assign_stmt_f_op;
+
+
+           
+
+   
+
+   
+   
+
+   function python_aug_assign_stmt_f_r_value
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Aug_Assign_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := Aug_Assign_Stmt_F_R_Value (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_aug_assign_stmt_f_r_value;
+
+
+           
+
+   
+
+   
+   
+
+   function python_decorated_f_decorators
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Decorated_Range then
+
+         declare
+            
+
+            Result : Bare_Decorator_List;
+         begin
+            Result := Decorated_F_Decorators (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_decorated_f_decorators;
+
+
+           
+
+   
+
+   
+   
+
+   function python_decorated_f_defn
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Decorated_Range then
+
+         declare
+            
+
+            Result : Bare_Def_Stmt;
+         begin
+            Result := Decorated_F_Defn (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_decorated_f_defn;
+
+
+           
+
+   
+
+   
+   
+
+   function python_class_def_f_name
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Class_Def_Range then
+
+         declare
+            
+
+            Result : Bare_Id;
+         begin
+            Result := Class_Def_F_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_class_def_f_name;
+
+
+           
+
+   
+
+   
+   
+
+   function python_class_def_f_bases
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Class_Def_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Class_Def_F_Bases (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_class_def_f_bases;
+
+
+           
+
+   
+
+   
+   
+
+   function python_class_def_f_statements
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Class_Def_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := Class_Def_F_Statements (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_class_def_f_statements;
+
+
+           
+
+   
+
+   
+   
+
+   function python_func_def_f_name
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Func_Def_Range then
+
+         declare
+            
+
+            Result : Bare_Id;
+         begin
+            Result := Func_Def_F_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_func_def_f_name;
+
+
+           
+
+   
+
+   
+   
+
+   function python_func_def_f_parameters
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Func_Def_Range then
+
+         declare
+            
+
+            Result : Bare_Params;
+         begin
+            Result := Func_Def_F_Parameters (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_func_def_f_parameters;
+
+
+           
+
+   
+
+   
+   
+
+   function python_func_def_f_body
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Func_Def_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := Func_Def_F_Body (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_func_def_f_body;
+
+
+           
+
+   
+
+   
+   
+
+   function python_del_stmt_f_exprs
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Del_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Del_Stmt_F_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_del_stmt_f_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function python_elif_branch_f_cond_test
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Elif_Branch_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Elif_Branch_F_Cond_Test (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_elif_branch_f_cond_test;
+
+
+           
+
+   
+
+   
+   
+
+   function python_elif_branch_f_statements
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Elif_Branch_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := Elif_Branch_F_Statements (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_elif_branch_f_statements;
+
+
+           
+
+   
+
+   
+   
+
+   function python_exec_stmt_f_expr
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Exec_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Exec_Stmt_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_exec_stmt_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function python_exec_stmt_f_in_list
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Exec_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Exec_Stmt_F_In_List (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_exec_stmt_f_in_list;
+
+
+           
+
+   
+
+   
+   
+
+   function python_for_stmt_f_bindings
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_For_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := For_Stmt_F_Bindings (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_for_stmt_f_bindings;
+
+
+           
+
+   
+
+   
+   
+
+   function python_for_stmt_f_expr
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_For_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := For_Stmt_F_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_for_stmt_f_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function python_for_stmt_f_statements
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_For_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := For_Stmt_F_Statements (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_for_stmt_f_statements;
+
+
+           
+
+   
+
+   
+   
+
+   function python_for_stmt_f_else_part
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_For_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Else_Part;
+         begin
+            Result := For_Stmt_F_Else_Part (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_for_stmt_f_else_part;
+
+
+           
+
+   
+
+   
+   
+
+   function python_global_stmt_f_names
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Global_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Id_List;
+         begin
+            Result := Global_Stmt_F_Names (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_global_stmt_f_names;
+
+
+           
+
+   
+
+   
+   
+
+   function python_if_stmt_f_cond_test
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_If_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := If_Stmt_F_Cond_Test (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_if_stmt_f_cond_test;
+
+
+           
+
+   
+
+   
+   
+
+   function python_if_stmt_f_statements
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_If_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := If_Stmt_F_Statements (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_if_stmt_f_statements;
+
+
+           
+
+   
+
+   
+   
+
+   function python_if_stmt_f_elif_branchs
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_If_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Elif_Branch_List;
+         begin
+            Result := If_Stmt_F_Elif_Branchs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_if_stmt_f_elif_branchs;
+
+
+           
+
+   
+
+   
+   
+
+   function python_if_stmt_f_else_part
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_If_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Else_Part;
+         begin
+            Result := If_Stmt_F_Else_Part (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_if_stmt_f_else_part;
+
+
+           
+
+   
+
+   
+   
+
+   function python_import_from_f_rel_name
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Import_From_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := Import_From_F_Rel_Name (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_import_from_f_rel_name;
+
+
+           
+
+   
+
+   
+   
+
+   function python_import_from_f_imported
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Import_From_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := Import_From_F_Imported (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_import_from_f_imported;
+
+
+           
+
+   
+
+   
+   
+
+   function python_import_name_f_imported_names
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Import_Name_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node_List;
+         begin
+            Result := Import_Name_F_Imported_Names (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_import_name_f_imported_names;
+
+
+           
+
+   
+
+   
+   
+
+   function python_print_stmt_f_exprs
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Print_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Print_Stmt_F_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_print_stmt_f_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function python_raise_stmt_f_exprs
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Raise_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Raise_Stmt_F_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_raise_stmt_f_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function python_return_stmt_f_exprs
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Return_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Return_Stmt_F_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_return_stmt_f_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function python_stream_print_stmt_f_stream_expr
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Stream_Print_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := Stream_Print_Stmt_F_Stream_Expr (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_stream_print_stmt_f_stream_expr;
+
+
+           
+
+   
+
+   
+   
+
+   function python_stream_print_stmt_f_exprs
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Stream_Print_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Expr_List;
+         begin
+            Result := Stream_Print_Stmt_F_Exprs (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_stream_print_stmt_f_exprs;
+
+
+           
+
+   
+
+   
+   
+
+   function python_try_stmt_f_statements
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Try_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := Try_Stmt_F_Statements (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_try_stmt_f_statements;
+
+
+           
+
+   
+
+   
+   
+
+   function python_try_stmt_f_except_parts
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Try_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Except_Part_List;
+         begin
+            Result := Try_Stmt_F_Except_Parts (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_try_stmt_f_except_parts;
+
+
+           
+
+   
+
+   
+   
+
+   function python_try_stmt_f_else_part
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Try_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Else_Part;
+         begin
+            Result := Try_Stmt_F_Else_Part (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_try_stmt_f_else_part;
+
+
+           
+
+   
+
+   
+   
+
+   function python_try_stmt_f_finally_part
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Try_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := Try_Stmt_F_Finally_Part (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_try_stmt_f_finally_part;
+
+
+           
+
+   
+
+   
+   
+
+   function python_while_stmt_f_cond_test
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_While_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Expr;
+         begin
+            Result := While_Stmt_F_Cond_Test (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_while_stmt_f_cond_test;
+
+
+           
+
+   
+
+   
+   
+
+   function python_while_stmt_f_statements
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_While_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := While_Stmt_F_Statements (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_while_stmt_f_statements;
+
+
+           
+
+   
+
+   
+   
+
+   function python_while_stmt_f_else_part
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_While_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Else_Part;
+         begin
+            Result := While_Stmt_F_Else_Part (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_while_stmt_f_else_part;
+
+
+           
+
+   
+
+   
+   
+
+   function python_with_stmt_f_bindings
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_With_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_As_Name_Node_List;
+         begin
+            Result := With_Stmt_F_Bindings (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_with_stmt_f_bindings;
+
+
+           
+
+   
+
+   
+   
+
+   function python_with_stmt_f_statements
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_base_entity) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_With_Stmt_Range then
+
+         declare
+            
+
+            Result : Bare_Python_Node;
+         begin
+            Result := With_Stmt_F_Statements (Unwrapped_Node);
+
+            Value_P.all :=
+                   (Result, Node.Info)
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_with_stmt_f_statements;
+
+
+           
+
+   
+
+   
+   
+
+   function python_var_args_flag_p_as_bool
+     (Node : python_base_entity_Ptr;
+
+
+      Value_P : access python_bool) return int
+
+   is
+      Unwrapped_Node : constant Bare_Python_Node := Node.Node;
+   begin
+      Clear_Last_Exception;
+
+
+      if Unwrapped_Node.Kind in python_Var_Args_Flag then
+
+         declare
+            
+
+            Result : Boolean;
+         begin
+            Result := Libpythonlang.Implementation.Dispatcher_Var_Args_Flag_P_As_Bool (Unwrapped_Node);
+
+            Value_P.all :=
+                   python_bool (Boolean'Pos (Result))
+            ;
+
+            return 1;
+         exception
+            when Exc : Property_Error =>
+               Set_Last_Exception (Exc);
+               return 0;
+         end;
+
+      else
+         return 0;
+      end if;
+
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end python_var_args_flag_p_as_bool;
+
+
+
+         
+
+
+
+
+
+
+         
+
+
+
+function python_text_type_create (Length : int) return Character_Type_Array_Access is
+begin
+   Clear_Last_Exception;
+   return Create_Character_Type_Array (Natural (Length));
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+      return null;
+end python_text_type_create;
+
+procedure python_text_type_inc_ref (A : Character_Type_Array_Access) is
+begin
+   Clear_Last_Exception;
+   Inc_Ref (A);
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end;
+
+procedure python_text_type_dec_ref (A : Character_Type_Array_Access) is
+begin
+   Clear_Last_Exception;
+   declare
+      A_Var : Character_Type_Array_Access := A;
+   begin
+      Dec_Ref (A_Var);
+   end;
+exception
+   when Exc : others =>
+      Set_Last_Exception (Exc);
+end;
+
+
+
+end Libpythonlang.Implementation.C;
@@ -0,0 +1,897 @@
+
+with Libpythonlang.Implementation;    use Libpythonlang.Implementation;
+with Libpythonlang.Introspection_Implementation;
+with Libpythonlang.Public_Converters; use Libpythonlang.Public_Converters;
+
+package body Libpythonlang.Introspection is
+
+   package Impl renames Introspection_Implementation;
+
+   --  TODO: move implementation of functions dealing with values (Satisfies,
+   --  Eval_Property, ...) to Impl. This is not not done yet as substantial
+   --  work is required in order to convert back and forth public values
+   --  (structures, symbols) to their internal representations.
+
+   function Allocate (Kind : Value_Kind) return Value_Type;
+   --  Allocate a polymorphic value of the given kind
+
+   pragma Warnings (Off, "is not referenced");
+   function To_Internal_Value
+     (Value : Any_Value_Type) return Impl.Internal_Value;
+   function From_Internal_Value
+     (Value : Impl.Internal_Value) return Any_Value_Type;
+   pragma Warnings (On, "is not referenced");
+
+   ------------
+   -- Adjust --
+   ------------
+
+   overriding procedure Adjust (Self : in out Value_Access_Wrapper) is
+   begin
+      if Self.Value = null then
+         return;
+      end if;
+
+      declare
+         Rec : Value_Record renames Self.Value.all;
+      begin
+         Rec.Ref_Count := Rec.Ref_Count + 1;
+      end;
+   end Adjust;
+
+   --------------
+   -- Finalize --
+   --------------
+
+   overriding procedure Finalize (Self : in out Value_Access_Wrapper) is
+   begin
+      if Self.Value = null then
+         return;
+      end if;
+
+      --  If Self is non-null, decrement the reference count of the referenced
+      --  value.
+
+      declare
+         Rec : Value_Record renames Self.Value.all;
+      begin
+         Rec.Ref_Count := Rec.Ref_Count - 1;
+
+         if Rec.Ref_Count = 0 then
+            --  Reference count dropped to 0: time to free the value and what
+            --  is inside.
+
+            case Rec.Kind is
+                     when Text_Type_Value =>
+                        Free (Rec.Text_Type_Value);
+                     when Python_Node_Array_Value =>
+                        Free (Rec.Python_Node_Array_Value);
+               when others => null;
+            end case;
+
+            Free (Self.Value);
+         end if;
+      end;
+   end Finalize;
+
+   ----------
+   -- Kind --
+   ----------
+
+   function Kind (Self : Value_Type) return Value_Kind is
+   begin
+      return Self.Value.Value.Kind;
+   end Kind;
+
+   --------------
+   -- Allocate --
+   --------------
+
+   function Allocate (Kind : Value_Kind) return Value_Type is
+      Result : Any_Value_Type;
+   begin
+      Result.Value.Value := new Value_Record (Kind);
+      Result.Value.Value.Ref_Count := 1;
+      return Result;
+   end Allocate;
+
+   -----------------------
+   -- To_Internal_Value --
+   -----------------------
+
+   function To_Internal_Value
+     (Value : Any_Value_Type) return Impl.Internal_Value is
+   begin
+      if Value = No_Value then
+         return Impl.No_Internal_Value;
+      end if;
+
+      case Kind (Value) is
+         when Boolean_Value =>
+            return Impl.Create_Boolean (As_Boolean (Value));
+
+         when Integer_Value =>
+            return Impl.Create_Integer (As_Integer (Value));
+
+         when Character_Value =>
+            return Impl.Create_Character (As_Character (Value));
+
+         when Node_Value =>
+            return Impl.Create_Node (Unwrap_Entity (As_Node (Value)));
+
+         when others =>
+            --  For now we use this only to handle default values, so this
+            --  should be unreachable.
+            raise Program_Error;
+      end case;
+   end To_Internal_Value;
+
+   -------------------------
+   -- From_Internal_Value --
+   -------------------------
+
+   function From_Internal_Value
+     (Value : Impl.Internal_Value) return Any_Value_Type is
+   begin
+      case Value.Kind is
+         when None =>
+            return No_Value;
+
+         when Boolean_Value =>
+            return Create_Boolean (Impl.As_Boolean (Value));
+
+         when Integer_Value =>
+            return Create_Integer (Impl.As_Integer (Value));
+
+         when Character_Value =>
+            return Create_Character (Impl.As_Character (Value));
+
+            when Analysis_Unit_Kind_Value =>
+               return Create_Analysis_Unit_Kind
+                 (Impl.As_Analysis_Unit_Kind (Value));
+            when Lookup_Kind_Value =>
+               return Create_Lookup_Kind
+                 (Impl.As_Lookup_Kind (Value));
+            when Grammar_Rule_Value =>
+               return Create_Grammar_Rule
+                 (Impl.As_Grammar_Rule (Value));
+
+         when Node_Value =>
+            declare
+               N : constant Internal_Entity := Impl.As_Node (Value);
+            begin
+               return Create_Node (Wrap_Node (N.Node, N.Info));
+            end;
+      end case;
+   end From_Internal_Value;
+
+   ----------------
+   -- As_Boolean --
+   ----------------
+
+   function As_Boolean (Self : Value_Type) return Boolean is
+   begin
+      return Self.Value.Value.Boolean_Value;
+   end As_Boolean;
+
+   --------------------
+   -- Create_Boolean --
+   --------------------
+
+   function Create_Boolean (Value : Boolean) return Value_Type is
+   begin
+      return Result : constant Value_Type := Allocate (Boolean_Value) do
+         Result.Value.Value.Boolean_Value := Value;
+      end return;
+   end Create_Boolean;
+
+   ----------------
+   -- As_Integer --
+   ----------------
+
+   function As_Integer (Self : Value_Type) return Integer is
+   begin
+      return Self.Value.Value.Integer_Value;
+   end As_Integer;
+
+   --------------------
+   -- Create_Integer --
+   --------------------
+
+   function Create_Integer (Value : Integer) return Value_Type is
+   begin
+      return Result : constant Value_Type := Allocate (Integer_Value) do
+         Result.Value.Value.Integer_Value := Value;
+      end return;
+   end Create_Integer;
+
+   --------------------
+   -- As_Big_Integer --
+   --------------------
+
+   function As_Big_Integer (Self : Value_Type) return Big_Integer is
+   begin
+      return Result : Big_Integer do
+         Result.Set (Self.Value.Value.Big_Integer_Value);
+      end return;
+   end As_Big_Integer;
+
+   ------------------------
+   -- Create_Big_Integer --
+   ------------------------
+
+   function Create_Big_Integer (Value : Big_Integer) return Value_Type is
+   begin
+      return Result : constant Value_Type := Allocate (Big_Integer_Value) do
+         Result.Value.Value.Big_Integer_Value.Set (Value);
+      end return;
+   end Create_Big_Integer;
+
+   ------------------
+   -- As_Character --
+   ------------------
+
+   function As_Character (Self : Value_Type) return Character_Type is
+   begin
+      return Self.Value.Value.Character_Value;
+   end As_Character;
+
+   ----------------------
+   -- Create_Character --
+   ----------------------
+
+   function Create_Character (Value : Character_Type) return Value_Type is
+   begin
+      return Result : constant Value_Type := Allocate (Character_Value) do
+         Result.Value.Value.Character_Value := Value;
+      end return;
+   end Create_Character;
+
+   --------------
+   -- As_Token --
+   --------------
+
+   function As_Token (Self : Value_Type) return Token_Reference is
+   begin
+      return Self.Value.Value.Token_Value;
+   end As_Token;
+
+   ------------------
+   -- Create_Token --
+   ------------------
+
+   function Create_Token (Value : Token_Reference) return Value_Type is
+   begin
+      return Result : constant Value_Type := Allocate (Token_Value)
+      do
+         Result.Value.Value.Token_Value := Value;
+      end return;
+   end Create_Token;
+
+   -----------------------
+   -- As_Unbounded_Text --
+   -----------------------
+
+   function As_Unbounded_Text (Self : Value_Type) return Unbounded_Text_Type is
+   begin
+      return Self.Value.Value.Unbounded_Text_Value;
+   end As_Unbounded_Text;
+
+   ---------------------------
+   -- Create_Unbounded_Text --
+   ---------------------------
+
+   function Create_Unbounded_Text
+     (Value : Unbounded_Text_Type) return Value_Type is
+   begin
+      return Result : constant Value_Type := Allocate (Unbounded_Text_Value)
+      do
+         Result.Value.Value.Unbounded_Text_Value := Value;
+      end return;
+   end Create_Unbounded_Text;
+
+   ----------------------
+   -- As_Analysis_Unit --
+   ----------------------
+
+   function As_Analysis_Unit (Self : Value_Type) return Analysis_Unit is
+   begin
+      return Self.Value.Value.Analysis_Unit_Value;
+   end As_Analysis_Unit;
+
+   --------------------------
+   -- Create_Analysis_Unit --
+   --------------------------
+
+   function Create_Analysis_Unit (Value : Analysis_Unit) return Value_Type is
+   begin
+      return Result : constant Value_Type := Allocate (Analysis_Unit_Value) do
+         Result.Value.Value.Analysis_Unit_Value := Value;
+      end return;
+   end Create_Analysis_Unit;
+
+   -------------
+   -- As_Node --
+   -------------
+
+   function As_Node (Self : Value_Type) return Python_Node is
+   begin
+      return Self.Value.Value.Node_Value;
+   end As_Node;
+
+   -----------------
+   -- Create_Node --
+   -----------------
+
+   function Create_Node
+     (Value : Python_Node'Class) return Value_Type is
+   begin
+      return Result : constant Value_Type := Allocate (Node_Value) do
+         Result.Value.Value.Node_Value := Value.As_Python_Node;
+      end return;
+   end Create_Node;
+
+      function As_Analysis_Unit_Kind
+        (Self : Value_Type) return Analysis_Unit_Kind is
+      begin
+         return Self.Value.Value.Analysis_Unit_Kind_Value;
+      end As_Analysis_Unit_Kind;
+
+      function Create_Analysis_Unit_Kind
+        (Value : Analysis_Unit_Kind) return Value_Type is
+      begin
+         return Result : constant Value_Type := Allocate
+           (Analysis_Unit_Kind_Value)
+         do
+            Result.Value.Value.Analysis_Unit_Kind_Value := Value;
+         end return;
+      end Create_Analysis_Unit_Kind;
+      function As_Lookup_Kind
+        (Self : Value_Type) return Lookup_Kind is
+      begin
+         return Self.Value.Value.Lookup_Kind_Value;
+      end As_Lookup_Kind;
+
+      function Create_Lookup_Kind
+        (Value : Lookup_Kind) return Value_Type is
+      begin
+         return Result : constant Value_Type := Allocate
+           (Lookup_Kind_Value)
+         do
+            Result.Value.Value.Lookup_Kind_Value := Value;
+         end return;
+      end Create_Lookup_Kind;
+      function As_Grammar_Rule
+        (Self : Value_Type) return Grammar_Rule is
+      begin
+         return Self.Value.Value.Grammar_Rule_Value;
+      end As_Grammar_Rule;
+
+      function Create_Grammar_Rule
+        (Value : Grammar_Rule) return Value_Type is
+      begin
+         return Result : constant Value_Type := Allocate
+           (Grammar_Rule_Value)
+         do
+            Result.Value.Value.Grammar_Rule_Value := Value;
+         end return;
+      end Create_Grammar_Rule;
+
+         function As_Text_Type
+           (Self : Value_Type) return Text_Type is
+         begin
+               return Result : Text_Type
+                 (Self.Value.Value.Text_Type_Value'Range)
+               do
+                  for I in Result'Range loop
+                        Result (I) :=
+                           Self.Value.Value.Text_Type_Value.all (I);
+                  end loop;
+               end return;
+
+         end As_Text_Type;
+
+         function Create_Text_Type
+           (Value : Text_Type) return Value_Type is
+         begin
+            return Result : constant Value_Type := Allocate
+              (Text_Type_Value)
+            do
+                  Result.Value.Value.Text_Type_Value :=
+                     new Text_Type (Value'Range);
+                  for I in Value'Range loop
+                        Result.Value.Value.Text_Type_Value.all (I) :=
+                           Value (I);
+                  end loop;
+
+            end return;
+         end Create_Text_Type;
+         function As_Python_Node_Array
+           (Self : Value_Type) return Python_Node_Array is
+         begin
+               return Result : Python_Node_Array
+                 (Self.Value.Value.Python_Node_Array_Value'Range)
+               do
+                  for I in Result'Range loop
+                        Result (I) :=
+                           Self.Value.Value.Python_Node_Array_Value.all (I);
+                  end loop;
+               end return;
+
+         end As_Python_Node_Array;
+
+         function Create_Python_Node_Array
+           (Value : Python_Node_Array) return Value_Type is
+         begin
+            return Result : constant Value_Type := Allocate
+              (Python_Node_Array_Value)
+            do
+                  Result.Value.Value.Python_Node_Array_Value :=
+                     new Python_Node_Array (Value'Range);
+                  for I in Value'Range loop
+                        Result.Value.Value.Python_Node_Array_Value.all (I) :=
+                           Value (I);
+                  end loop;
+
+            end return;
+         end Create_Python_Node_Array;
+
+   --------------
+   -- DSL_Name --
+   --------------
+
+   function DSL_Name (Id : Node_Type_Id) return String is
+   begin
+      return Impl.DSL_Name (Id);
+   end DSL_Name;
+
+   ---------------------
+   -- Lookup_DSL_Name --
+   ---------------------
+
+   function Lookup_DSL_Name (Name : String) return Any_Node_Type_Id is
+   begin
+      return Impl.Lookup_DSL_Name (Name);
+   end Lookup_DSL_Name;
+
+   -----------------
+   -- Is_Abstract --
+   -----------------
+
+   function Is_Abstract (Id : Node_Type_Id) return Boolean is
+   begin
+      return Impl.Is_Abstract (Id);
+   end Is_Abstract;
+
+   --------------
+   -- Kind_For --
+   --------------
+
+   function Kind_For (Id : Node_Type_Id) return Python_Node_Kind_Type is
+   begin
+      return Impl.Kind_For (Id);
+   end Kind_For;
+
+   -----------------
+   -- Id_For_Kind --
+   -----------------
+
+   function Id_For_Kind (Kind : Python_Node_Kind_Type) return Node_Type_Id is
+   begin
+      return Impl.Id_For_Kind (Kind);
+   end Id_For_Kind;
+
+   ------------------
+   -- Is_Root_Node --
+   ------------------
+
+   function Is_Root_Node (Id : Node_Type_Id) return Boolean is
+   begin
+      return Impl.Is_Root_Node (Id);
+   end Is_Root_Node;
+
+   ---------------
+   -- Base_Type --
+   ---------------
+
+   function Base_Type (Id : Node_Type_Id) return Node_Type_Id is
+   begin
+      return Impl.Base_Type (Id);
+   end Base_Type;
+
+   -------------------
+   -- Derived_Types --
+   -------------------
+
+   function Derived_Types (Id : Node_Type_Id) return Node_Type_Id_Array is
+   begin
+      return Impl.Derived_Types (Id);
+   end Derived_Types;
+
+   ---------------------
+   -- Is_Derived_From --
+   ---------------------
+
+   function Is_Derived_From (Id, Parent : Node_Type_Id) return Boolean is
+   begin
+      return Impl.Is_Derived_From (Id, Parent);
+   end Is_Derived_From;
+
+   --------------
+   -- DSL_Name --
+   --------------
+
+   function DSL_Name (Constraint : Value_Constraint) return String is
+   begin
+      
+      case Constraint.Kind is
+               when Boolean_Value =>
+                  return "Bool";
+               when Integer_Value =>
+                  return "Int";
+               when Big_Integer_Value =>
+                  return "BigInt";
+               when Character_Value =>
+                  return "Character";
+               when Token_Value =>
+                  return "Token";
+               when Unbounded_Text_Value =>
+                  return "Symbol";
+               when Analysis_Unit_Value =>
+                  return "AnalysisUnit";
+               when Analysis_Unit_Kind_Value =>
+                  return "AnalysisUnitKind";
+               when Lookup_Kind_Value =>
+                  return "LookupKind";
+               when Grammar_Rule_Value =>
+                  return "GrammarRule";
+               when Text_Type_Value =>
+                  return "Character.array";
+               when Python_Node_Array_Value =>
+                  return "PythonNode.entity.array";
+
+         when Node_Value =>
+            return DSL_Name (Constraint.Node_Type);
+      end case;
+   end DSL_Name;
+
+   ---------------
+   -- Satisfies --
+   ---------------
+
+   function Satisfies
+     (Value : Value_Type; Constraint : Value_Constraint) return Boolean is
+   begin
+      if Value.Value.Value.Kind /= Constraint.Kind then
+         return False;
+      end if;
+
+      case Constraint.Kind is
+         when Node_Value =>
+            return
+
+              --  A null node always satisfies the type constraint
+              Value.Value.Value.Node_Value.Is_Null
+
+              --  Else, check that the type of the node is derived from the
+              --  type of the constraint.
+              or else Is_Derived_From
+                (Id_For_Kind (Value.Value.Value.Node_Value.Kind),
+                 Constraint.Node_Type);
+
+         when others =>
+            return True;
+      end case;
+   end Satisfies;
+
+   --------------------
+   -- Node_Data_Name --
+   --------------------
+
+   function Node_Data_Name (Node_Data : Node_Data_Reference) return String is
+   begin
+      return Impl.Node_Data_Name (Node_Data);
+   end Node_Data_Name;
+
+   --------------------
+   -- Node_Data_Type --
+   --------------------
+
+   function Node_Data_Type
+     (Node_Data : Node_Data_Reference) return Value_Constraint is
+   begin
+      return Impl.Node_Data_Type (Node_Data);
+   end Node_Data_Type;
+
+   --------------------
+   -- Eval_Node_Data --
+   --------------------
+
+   function Eval_Node_Data
+     (Node      : Python_Node'Class;
+      Node_Data : Node_Data_Reference;
+      Arguments : Value_Array) return Value_Type is
+   begin
+      case Node_Data is
+         when Field_Reference =>
+            if Arguments'Length > 0 then
+               raise Node_Data_Evaluation_Error with "fields take no argument";
+            end if;
+            pragma Warnings (Off, "value not in range of type");
+            return Create_Node (Eval_Field (Node, Node_Data));
+            pragma Warnings (On, "value not in range of type");
+
+         when Property_Reference =>
+            return Eval_Property (Node, Node_Data, Arguments);
+      end case;
+   end Eval_Node_Data;
+
+   ----------------------
+   -- Lookup_Node_Data --
+   ----------------------
+
+   function Lookup_Node_Data
+     (Id   : Node_Type_Id;
+      Name : String) return Any_Node_Data_Reference is
+   begin
+      return Impl.Lookup_Node_Data (Id, Name);
+   end Lookup_Node_Data;
+
+   ----------------
+   -- Field_Name --
+   ----------------
+
+   function Field_Name (Field : Field_Reference) return String is
+   begin
+      pragma Warnings (Off, "value not in range of type");
+      return Impl.Field_Name (Field);
+      pragma Warnings (On, "value not in range of type");
+   end Field_Name;
+
+   ----------------
+   -- Field_Type --
+   ----------------
+
+   function Field_Type (Field : Field_Reference) return Node_Type_Id is
+   begin
+      pragma Warnings (Off, "value not in range of type");
+      return Impl.Field_Type (Field);
+      pragma Warnings (On, "value not in range of type");
+   end Field_Type;
+
+   ----------------
+   -- Eval_Field --
+   ----------------
+
+   function Eval_Field
+     (Node  : Python_Node'Class;
+      Field : Field_Reference) return Python_Node
+   is
+      Ent : constant Internal_Entity := Unwrap_Entity (Node);
+
+      pragma Warnings (Off, "value not in range of type");
+      Result : constant Bare_Python_Node :=
+         Impl.Eval_Field (Ent.Node, Field);
+      pragma Warnings (On, "value not in range of type");
+   begin
+      return Wrap_Node (Result, Ent.Info);
+   end Eval_Field;
+
+   -----------
+   -- Index --
+   -----------
+
+   function Index
+     (Kind : Python_Node_Kind_Type; Field : Field_Reference) return Positive is
+   begin
+      pragma Warnings (Off, "value not in range of type");
+      return Impl.Index (Kind, Field);
+      pragma Warnings (On, "value not in range of type");
+   end Index;
+
+   --------------------------------
+   -- Field_Reference_From_Index --
+   --------------------------------
+
+   function Field_Reference_From_Index
+     (Kind : Python_Node_Kind_Type; Index : Positive) return Field_Reference is
+   begin
+      pragma Warnings (Off, "value not in range of type");
+      return Impl.Field_Reference_From_Index (Kind, Index);
+      pragma Warnings (On, "value not in range of type");
+   end Field_Reference_From_Index;
+
+   ------------
+   -- Fields --
+   ------------
+
+   function Fields (Kind : Python_Node_Kind_Type) return Field_Reference_Array is
+   begin
+      return Impl.Fields (Kind);
+   end Fields;
+
+   ------------
+   -- Fields --
+   ------------
+
+   function Fields (Id : Node_Type_Id) return Field_Reference_Array is
+   begin
+      return Impl.Fields (Id);
+   end Fields;
+
+
+   -------------------
+   -- Property_Name --
+   -------------------
+
+   function Property_Name (Property : Property_Reference) return String is
+   begin
+      return Impl.Property_Name (Property);
+   end Property_Name;
+
+   --------------------------
+   -- Property_Return_Type --
+   --------------------------
+
+   function Property_Return_Type
+     (Property : Property_Reference) return Value_Constraint is
+   begin
+      return Impl.Property_Return_Type (Property);
+   end Property_Return_Type;
+
+   -----------------------------
+   -- Property_Argument_Types --
+   -----------------------------
+
+   function Property_Argument_Types
+     (Property : Property_Reference) return Value_Constraint_Array is
+   begin
+      return Impl.Property_Argument_Types (Property);
+   end Property_Argument_Types;
+
+   ----------------------------
+   -- Property_Argument_Name --
+   ----------------------------
+
+   function Property_Argument_Name
+     (Property : Property_Reference; Argument_Number : Positive) return String
+   is
+   begin
+      return Impl.Property_Argument_Name (Property, Argument_Number);
+   end Property_Argument_Name;
+
+   -------------------------------------
+   -- Property_Argument_Default_Value --
+   -------------------------------------
+
+   function Property_Argument_Default_Value
+     (Property        : Property_Reference;
+      Argument_Number : Positive) return Any_Value_Type
+   is
+      Desc : Impl.Property_Descriptor renames
+         Impl.Property_Descriptors (Property).all;
+   begin
+      Impl.Check_Argument_Number (Desc, Argument_Number);
+      return From_Internal_Value
+        (Desc.Argument_Default_Values (Argument_Number));
+   end Property_Argument_Default_Value;
+
+   -------------------
+   -- Eval_Property --
+   -------------------
+
+   function Eval_Property
+     (Node      : Python_Node'Class;
+      Property  : Property_Reference;
+      Arguments : Value_Array) return Value_Type
+   is
+      Kind   : constant Python_Node_Kind_Type := Node.Kind;
+      Desc   : Impl.Property_Descriptor renames
+         Impl.Property_Descriptors (Property).all;
+      Result : Any_Value_Type := No_Value;
+   begin
+      --  First, check that arguments match the property signature
+
+      if Arguments'Length /= Desc.Arity then
+         raise Node_Data_Evaluation_Error with "invalid number of arguments";
+      end if;
+
+      for I in Desc.Argument_Types'Range loop
+         declare
+            Arg : Value_Type renames Arguments (I - 1 + Arguments'First);
+         begin
+            if not Satisfies (Arg, Desc.Argument_Types (I)) then
+               raise Node_Data_Evaluation_Error with
+                  "invalid type for argument " & Desc.Argument_Names (I).all;
+            end if;
+         end;
+      end loop;
+
+      --  Now, we can proceed with the property evaluation
+
+      
+      case Property is
+when Python_Node_Parent =>
+Result := Create_Node (Node.Parent);
+when Python_Node_Parents =>
+Result := Create_Python_Node_Array (Node.Parents);
+when Python_Node_Children =>
+Result := Create_Python_Node_Array (Node.Children);
+when Python_Node_Token_Start =>
+Result := Create_Token (Node.Token_Start);
+when Python_Node_Token_End =>
+Result := Create_Token (Node.Token_End);
+when Python_Node_Child_Index =>
+Result := Create_Integer (Node.Child_Index);
+when Python_Node_Previous_Sibling =>
+Result := Create_Node (Node.Previous_Sibling);
+when Python_Node_Next_Sibling =>
+Result := Create_Node (Node.Next_Sibling);
+when Python_Node_Unit =>
+Result := Create_Analysis_Unit (Node.Unit);
+when Python_Node_Is_Ghost =>
+Result := Create_Boolean (Node.Is_Ghost);
+when Python_Node_Full_Sloc_Image =>
+Result := Create_Text_Type (Node.Full_Sloc_Image);
+when others => null;
+end case;
+case python_Python_Node (Kind) is
+when python_Var_Args_Flag =>
+declare
+N_Bare_Var_Args_Flag : constant Analysis.Var_Args_Flag := Node.As_Var_Args_Flag;
+begin
+case Property is
+when Var_Args_Flag_P_As_Bool =>
+Result := Create_Boolean (N_Bare_Var_Args_Flag.P_As_Bool);
+when others => null;
+end case;
+end;
+when python_Kw_Args_Flag =>
+declare
+N_Bare_Kw_Args_Flag : constant Analysis.Kw_Args_Flag := Node.As_Kw_Args_Flag;
+begin
+case Property is
+when Kw_Args_Flag_P_As_Bool =>
+Result := Create_Boolean (N_Bare_Kw_Args_Flag.P_As_Bool);
+when others => null;
+end case;
+end;
+when others => null;
+end case;
+
+      if Result = No_Value then
+         raise Node_Data_Evaluation_Error with "no such field on this node";
+      end if;
+      return Result;
+   end Eval_Property;
+
+   ----------------
+   -- Properties --
+   ----------------
+
+   function Properties (Kind : Python_Node_Kind_Type) return Property_Reference_Array
+   is
+   begin
+      return Impl.Properties (Kind);
+   end Properties;
+
+   ----------------
+   -- Properties --
+   ----------------
+
+   function Properties (Id : Node_Type_Id) return Property_Reference_Array is
+   begin
+      return Impl.Properties (Id);
+   end Properties;
+
+
+   ---------------------
+   -- Token_Node_Kind --
+   ---------------------
+
+   function Token_Node_Kind (Kind : Python_Node_Kind_Type) return Token_Kind is
+   begin
+      return Impl.Token_Node_Kind (Kind);
+   end Token_Node_Kind;
+
+end Libpythonlang.Introspection;
@@ -0,0 +1,4301 @@
+
+
+
+package body Libpythonlang.Lexer_State_Machine is
+
+   Is_Trivia : constant array (Token_Kind) of Boolean := (
+      python_Termination => False, python_Lexing_Failure => True, python_Rsh_Assign => False, python_Is => False, python_Equals => False, python_Def => False, python_Lte => False, python_Raise => False, python_Mod => False, python_Yield => False, python_Xor_Assign => False, python_As => False, python_Lambda => False, python_Backtick => False, python_Try => False, python_Divide => False, python_Invert => False, python_Return => False, python_Assert => False, python_Xor => False, python_Break => False, python_Rbrack => False, python_Power_Assign => False, python_Import => False, python_Exec => False, python_Comma => False, python_L_Par => False, python_Dot => False, python_Gte => False, python_Floordiv_Assign => False, python_Multiply => False, python_Div_Assign => False, python_At => False, python_Assign => False, python_Floordiv => False, python_Notequal => False, python_Mult_Assign => False, python_Mod_Assign => False, python_Gt => False, python_Power => False, python_Amp => False, python_Not => False, python_Colon => False, python_Diamond => False, python_In => False, python_L_Curl => False, python_Class => False, python_Or_Assign => False, python_Elif => False, python_And => False, python_Semicolon => False, python_Add_Asign => False, python_Print => False, python_Lsh => False, python_Continue => False, python_While => False, python_Except => False, python_If => False, python_Else => False, python_Del => False, python_Minus_Assign => False, python_Or => False, python_Minus => False, python_Lbrack => False, python_And_Assign => False, python_R_Par => False, python_Global => False, python_For => False, python_From => False, python_Rsh => False, python_Finally => False, python_Pass => False, python_Lsh_Assign => False, python_Bin_Or => False, python_Rcurl => False, python_With => False, python_Plus => False, python_Lt => False, python_Number => False, python_String => False, python_Comment => True, python_Identifier => False, python_Indent => False, python_Dedent => False, python_Newline => False
+   );
+
+   type Character_Range is record
+      First, Last : Character_Type;
+   end record;
+
+   type Character_Range_Array is array (Positive range <>) of Character_Range;
+   --  Sorted list of dijoint character ranges
+
+   function Contains
+     (Char : Character_Type; Ranges : Character_Range_Array) return Boolean;
+   --  Return whether Char is included in the given ranges
+
+   ----------------
+   -- Initialize --
+   ----------------
+
+   procedure Initialize
+     (Self        : out Lexer_State;
+      Input       : Text_Access;
+      Input_First : Positive;
+      Input_Last  : Natural) is
+   begin
+      Self.Input := Input;
+      Self.Compact_Input := null;
+      Self.Input_First := Input_First;
+      Self.Input_Last := Input_Last;
+      Self.Has_Next := True;
+      Self.Last_Token := (Kind       => python_Termination,
+                          Text_First => Input_First,
+                          Text_Last  => Input_First - 1);
+      Self.Last_Token_Kind := python_Termination;
+   end Initialize;
+
+   procedure Initialize
+     (Self        : out Lexer_State;
+      Input       : GNAT.Strings.String_Access;
+      Input_First : Positive;
+      Input_Last  : Natural) is
+   begin
+      Initialize (Self, Text_Access'(null), Input_First, Input_Last);
+      Self.Compact_Input := Input;
+   end Initialize;
+
+   ----------------
+   -- Last_Token --
+   ----------------
+
+   function Last_Token (Self : Lexer_State) return Lexed_Token is
+   begin
+      return Self.Last_Token;
+   end Last_Token;
+
+   --------------
+   -- Has_Next --
+   --------------
+
+   function Has_Next (Self : Lexer_State) return Boolean is
+   begin
+      return Self.Has_Next;
+   end Has_Next;
+
+   --------------
+   -- Contains --
+   --------------
+
+   function Contains
+     (Char : Character_Type; Ranges : Character_Range_Array) return Boolean
+   is
+      Low  : Natural := Ranges'First;
+      High : Natural := Ranges'Last;
+   begin
+      while Low <= High loop
+         declare
+            Middle : constant Natural := (Low + High) / 2;
+            R      : Character_Range renames Ranges (Middle);
+         begin
+            if Char < R.First then
+               High := Middle - 1;
+            elsif Char > R.Last then
+               Low := Middle + 1;
+            else
+               return True;
+            end if;
+         end;
+      end loop;
+      return False;
+   end Contains;
+
+
+
+   function Get_Wide_Char
+     (Self : Lexer_State; Index : Positive) return Character_Type
+   is (Self.Input (Index))
+      with Inline;
+   function Get_Compact_Char
+     (Self : Lexer_State; Index : Positive) return Character_Type
+   is (Character_Type'Val (Character'Pos (Self.Compact_Input (Index))))
+      with Inline;
+   --  Return the input character at Index in Self
+
+   generic
+      with function Get_Char
+        (Self : Lexer_State; Index : Positive) return Character_Type;
+   procedure Generic_Next_Token
+     (Self : in out Lexer_State; Token : out Lexed_Token);
+   --  Implementation for Next_Token. Get_Char is used to read Self's input,
+   --  so that the state machine can work on both input representations
+   --  without extra overhead.
+
+   ------------------------
+   -- Generic_Next_Token --
+   ------------------------
+
+   procedure Generic_Next_Token
+     (Self : in out Lexer_State; Token : out Lexed_Token)
+   is
+      First_Index : Positive;
+      --  Index of the first input character for the token to return
+
+      Index : Positive;
+      --  Index for the next input character to be analyzed
+
+      Match_Index : Natural;
+      --  If we found a match, index for its last character. Otherwise, zero.
+
+      Match_Ignore : Boolean;
+      --  If we found a match, whether we must ignore it and restart the
+      --  automaton after its character range.
+
+      Match_Kind : Token_Kind;
+      --  If we found a match and it is not ignored, kind for the token to
+      --  emit. Meaningless otherwise.
+   begin
+      First_Index := Self.Last_Token.Text_Last + 1;
+
+      <<Start>>
+      Index := First_Index;
+      Match_Index := 0;
+      Match_Ignore := False;
+
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#9#) | Character_Type'Val (16#d#) | ' ' => goto State_1;
+               when Character_Type'Val (16#a#) => goto State_2;
+               when '!' => goto State_3;
+               when '"' => goto State_4;
+               when '#' => goto State_5;
+               when '%' => goto State_6;
+               when '&' => goto State_7;
+               when ''' => goto State_8;
+               when '(' => goto State_9;
+               when ')' => goto State_10;
+               when '*' => goto State_11;
+               when '+' => goto State_12;
+               when ',' => goto State_13;
+               when '-' => goto State_14;
+               when '.' => goto State_15;
+               when '/' => goto State_16;
+               when '0' .. '9' => goto State_17;
+               when ':' => goto State_18;
+               when ';' => goto State_19;
+               when '<' => goto State_20;
+               when '=' => goto State_21;
+               when '>' => goto State_22;
+               when '@' => goto State_23;
+               when 'A' .. 'Q' | 'S' .. 'T' | 'V' .. 'Z' | '_' | 'h' | 'j' .. 'k' | 'm' | 'q' | 's' | 'v' | 'x' | 'z' => goto State_24;
+               when 'R' => goto State_25;
+               when 'U' | 'u' => goto State_26;
+               when '[' => goto State_27;
+               when '\' => goto State_28;
+               when ']' => goto State_29;
+               when '^' => goto State_30;
+               when '`' => goto State_31;
+               when 'a' => goto State_32;
+               when 'b' => goto State_33;
+               when 'c' => goto State_34;
+               when 'd' => goto State_35;
+               when 'e' => goto State_36;
+               when 'f' => goto State_37;
+               when 'g' => goto State_38;
+               when 'i' => goto State_39;
+               when 'l' => goto State_40;
+               when 'n' => goto State_41;
+               when 'o' => goto State_42;
+               when 'p' => goto State_43;
+               when 'r' => goto State_44;
+               when 't' => goto State_45;
+               when 'w' => goto State_46;
+               when 'y' => goto State_47;
+               when '{' => goto State_48;
+               when '|' => goto State_49;
+               when '}' => goto State_50;
+               when '~' => goto State_51;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_1>>
+
+               Match_Index := Index - 1;
+               Match_Ignore := True;
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#9#) | Character_Type'Val (16#d#) | ' ' => goto State_1;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_2>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Newline;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_3>>
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '=' => goto State_52;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_4>>
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#0#) .. Character_Type'Val (16#9#) | Character_Type'Val (16#b#) .. '!' | '#' .. '[' | ']' .. Character_Type'Val (16#10ffff#) => goto State_53;
+               when '"' => goto State_54;
+               when '\' => goto State_55;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_5>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Comment;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#0#) .. Character_Type'Val (16#9#) | Character_Type'Val (16#b#) .. Character_Type'Val (16#10ffff#) => goto State_5;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_6>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Mod;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '=' => goto State_56;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_7>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Amp;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '=' => goto State_57;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_8>>
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#0#) .. Character_Type'Val (16#9#) | Character_Type'Val (16#b#) .. '&' | '(' .. '[' | ']' .. Character_Type'Val (16#10ffff#) => goto State_58;
+               when ''' => goto State_59;
+               when '\' => goto State_60;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_9>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_L_Par;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_10>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_R_Par;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_11>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Multiply;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '*' => goto State_61;
+               when '=' => goto State_62;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_12>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Plus;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '=' => goto State_63;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_13>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Comma;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_14>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Minus;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '=' => goto State_64;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_15>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Dot;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_16>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Divide;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '/' => goto State_65;
+               when '=' => goto State_66;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_17>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Number;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' => goto State_17;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_18>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Colon;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_19>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Semicolon;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_20>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Lt;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '<' => goto State_67;
+               when '=' => goto State_68;
+               when '>' => goto State_69;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_21>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Assign;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '=' => goto State_70;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_22>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Gt;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '=' => goto State_71;
+               when '>' => goto State_72;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_23>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_At;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_24>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_25>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '"' => goto State_4;
+               when ''' => goto State_8;
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_26>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '"' => goto State_4;
+               when ''' => goto State_8;
+               when '0' .. '9' | 'A' .. 'Q' | 'S' .. 'Z' | '_' | 'a' .. 'q' | 's' .. 'z' => goto State_24;
+               when 'R' | 'r' => goto State_25;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_27>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Lbrack;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_28>>
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#a#) => goto State_73;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_29>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Rbrack;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_30>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Xor;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '=' => goto State_74;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_31>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Backtick;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_32>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'm' | 'o' .. 'r' | 't' .. 'z' => goto State_24;
+               when 'n' => goto State_75;
+               when 's' => goto State_76;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_33>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'q' | 's' .. 'z' => goto State_24;
+               when 'r' => goto State_77;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_34>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'k' | 'm' .. 'n' | 'p' .. 'z' => goto State_24;
+               when 'l' => goto State_78;
+               when 'o' => goto State_79;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_35>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'd' | 'f' .. 'z' => goto State_24;
+               when 'e' => goto State_80;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_36>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'k' | 'm' .. 'w' | 'y' .. 'z' => goto State_24;
+               when 'l' => goto State_81;
+               when 'x' => goto State_82;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_37>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'h' | 'j' .. 'n' | 'p' .. 'q' | 's' .. 'z' => goto State_24;
+               when 'i' => goto State_83;
+               when 'o' => goto State_84;
+               when 'r' => goto State_85;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_38>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'k' | 'm' .. 'z' => goto State_24;
+               when 'l' => goto State_86;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_39>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'e' | 'g' .. 'l' | 'o' .. 'r' | 't' .. 'z' => goto State_24;
+               when 'f' => goto State_87;
+               when 'm' => goto State_88;
+               when 'n' => goto State_89;
+               when 's' => goto State_90;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_40>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'b' .. 'z' => goto State_24;
+               when 'a' => goto State_91;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_41>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'n' | 'p' .. 'z' => goto State_24;
+               when 'o' => goto State_92;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_42>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'q' | 's' .. 'z' => goto State_24;
+               when 'r' => goto State_93;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_43>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'b' .. 'q' | 's' .. 'z' => goto State_24;
+               when 'a' => goto State_94;
+               when 'r' => goto State_95;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_44>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '"' => goto State_4;
+               when ''' => goto State_8;
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'b' .. 'd' | 'f' .. 'z' => goto State_24;
+               when 'a' => goto State_96;
+               when 'e' => goto State_97;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_45>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'q' | 's' .. 'z' => goto State_24;
+               when 'r' => goto State_98;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_46>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'g' | 'j' .. 'z' => goto State_24;
+               when 'h' => goto State_99;
+               when 'i' => goto State_100;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_47>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'h' | 'j' .. 'z' => goto State_24;
+               when 'i' => goto State_101;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_48>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_L_Curl;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_49>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Bin_Or;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '=' => goto State_102;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_50>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Rcurl;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_51>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Invert;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_52>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Notequal;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_53>>
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#0#) .. Character_Type'Val (16#9#) | Character_Type'Val (16#b#) .. '!' | '#' .. '[' | ']' .. Character_Type'Val (16#10ffff#) => goto State_53;
+               when '"' => goto State_103;
+               when '\' => goto State_55;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_54>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_String;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '"' => goto State_104;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_55>>
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#0#) .. Character_Type'Val (16#9#) | Character_Type'Val (16#b#) .. '!' | '#' .. '[' | ']' .. Character_Type'Val (16#10ffff#) => goto State_53;
+               when '"' => goto State_105;
+               when '\' => goto State_55;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_56>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Mod_Assign;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_57>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_And_Assign;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_58>>
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#0#) .. Character_Type'Val (16#9#) | Character_Type'Val (16#b#) .. '&' | '(' .. '[' | ']' .. Character_Type'Val (16#10ffff#) => goto State_58;
+               when ''' => goto State_103;
+               when '\' => goto State_60;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_59>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_String;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when ''' => goto State_106;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_60>>
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#0#) .. Character_Type'Val (16#9#) | Character_Type'Val (16#b#) .. '&' | '(' .. '[' | ']' .. Character_Type'Val (16#10ffff#) => goto State_58;
+               when ''' => goto State_107;
+               when '\' => goto State_60;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_61>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Power;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '=' => goto State_108;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_62>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Mult_Assign;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_63>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Add_Asign;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_64>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Minus_Assign;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_65>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Floordiv;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '=' => goto State_109;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_66>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Div_Assign;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_67>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Lsh;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '=' => goto State_110;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_68>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Lte;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_69>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Diamond;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_70>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Equals;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_71>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Gte;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_72>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Rsh;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '=' => goto State_111;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_73>>
+
+               Match_Index := Index - 1;
+               Match_Ignore := True;
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#9#) | Character_Type'Val (16#d#) | ' ' => goto State_73;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_74>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Xor_Assign;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_75>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'c' | 'e' .. 'z' => goto State_24;
+               when 'd' => goto State_112;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_76>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_As;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'r' | 't' .. 'z' => goto State_24;
+               when 's' => goto State_113;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_77>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'd' | 'f' .. 'z' => goto State_24;
+               when 'e' => goto State_114;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_78>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'b' .. 'z' => goto State_24;
+               when 'a' => goto State_115;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_79>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'm' | 'o' .. 'z' => goto State_24;
+               when 'n' => goto State_116;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_80>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'e' | 'g' .. 'k' | 'm' .. 'z' => goto State_24;
+               when 'f' => goto State_117;
+               when 'l' => goto State_118;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_81>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'h' | 'j' .. 'r' | 't' .. 'z' => goto State_24;
+               when 'i' => goto State_119;
+               when 's' => goto State_120;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_82>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'b' | 'd' | 'f' .. 'z' => goto State_24;
+               when 'c' => goto State_121;
+               when 'e' => goto State_122;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_83>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'm' | 'o' .. 'z' => goto State_24;
+               when 'n' => goto State_123;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_84>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'q' | 's' .. 'z' => goto State_24;
+               when 'r' => goto State_124;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_85>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'n' | 'p' .. 'z' => goto State_24;
+               when 'o' => goto State_125;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_86>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'n' | 'p' .. 'z' => goto State_24;
+               when 'o' => goto State_126;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_87>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_If;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_88>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'o' | 'q' .. 'z' => goto State_24;
+               when 'p' => goto State_127;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_89>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_In;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_90>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Is;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_91>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'l' | 'n' .. 'z' => goto State_24;
+               when 'm' => goto State_128;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_92>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 's' | 'u' .. 'z' => goto State_24;
+               when 't' => goto State_129;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_93>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Or;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_94>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'r' | 't' .. 'z' => goto State_24;
+               when 's' => goto State_130;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_95>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'h' | 'j' .. 'z' => goto State_24;
+               when 'i' => goto State_131;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_96>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'h' | 'j' .. 'z' => goto State_24;
+               when 'i' => goto State_132;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_97>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 's' | 'u' .. 'z' => goto State_24;
+               when 't' => goto State_133;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_98>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'x' | 'z' => goto State_24;
+               when 'y' => goto State_134;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_99>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'h' | 'j' .. 'z' => goto State_24;
+               when 'i' => goto State_135;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_100>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 's' | 'u' .. 'z' => goto State_24;
+               when 't' => goto State_136;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_101>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'd' | 'f' .. 'z' => goto State_24;
+               when 'e' => goto State_137;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_102>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Or_Assign;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_103>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_String;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_104>>
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#0#) .. '!' | '#' .. Character_Type'Val (16#10ffff#) => goto State_104;
+               when '"' => goto State_138;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_105>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_String;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#0#) .. Character_Type'Val (16#9#) | Character_Type'Val (16#b#) .. '!' | '#' .. '[' | ']' .. Character_Type'Val (16#10ffff#) => goto State_53;
+               when '"' => goto State_103;
+               when '\' => goto State_55;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_106>>
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#0#) .. '&' | '(' .. Character_Type'Val (16#10ffff#) => goto State_106;
+               when ''' => goto State_139;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_107>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_String;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#0#) .. Character_Type'Val (16#9#) | Character_Type'Val (16#b#) .. '&' | '(' .. '[' | ']' .. Character_Type'Val (16#10ffff#) => goto State_58;
+               when ''' => goto State_103;
+               when '\' => goto State_60;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_108>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Power_Assign;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_109>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Floordiv_Assign;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_110>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Lsh_Assign;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_111>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Rsh_Assign;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         Index := Index + 1;
+         goto Stop;
+
+            <<State_112>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_And;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_113>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'd' | 'f' .. 'z' => goto State_24;
+               when 'e' => goto State_140;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_114>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'b' .. 'z' => goto State_24;
+               when 'a' => goto State_141;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_115>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'r' | 't' .. 'z' => goto State_24;
+               when 's' => goto State_142;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_116>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 's' | 'u' .. 'z' => goto State_24;
+               when 't' => goto State_143;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_117>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Def;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_118>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Del;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_119>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'e' | 'g' .. 'z' => goto State_24;
+               when 'f' => goto State_144;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_120>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'd' | 'f' .. 'z' => goto State_24;
+               when 'e' => goto State_145;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_121>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'd' | 'f' .. 'z' => goto State_24;
+               when 'e' => goto State_146;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_122>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'b' | 'd' .. 'z' => goto State_24;
+               when 'c' => goto State_147;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_123>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'b' .. 'z' => goto State_24;
+               when 'a' => goto State_148;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_124>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_For;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_125>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'l' | 'n' .. 'z' => goto State_24;
+               when 'm' => goto State_149;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_126>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' | 'c' .. 'z' => goto State_24;
+               when 'b' => goto State_150;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_127>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'n' | 'p' .. 'z' => goto State_24;
+               when 'o' => goto State_151;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_128>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' | 'c' .. 'z' => goto State_24;
+               when 'b' => goto State_152;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_129>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Not;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_130>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'r' | 't' .. 'z' => goto State_24;
+               when 's' => goto State_153;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_131>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'm' | 'o' .. 'z' => goto State_24;
+               when 'n' => goto State_154;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_132>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'r' | 't' .. 'z' => goto State_24;
+               when 's' => goto State_155;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_133>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 't' | 'v' .. 'z' => goto State_24;
+               when 'u' => goto State_156;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_134>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Try;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_135>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'k' | 'm' .. 'z' => goto State_24;
+               when 'l' => goto State_157;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_136>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'g' | 'i' .. 'z' => goto State_24;
+               when 'h' => goto State_158;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_137>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'k' | 'm' .. 'z' => goto State_24;
+               when 'l' => goto State_159;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_138>>
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#0#) .. '!' | '#' .. Character_Type'Val (16#10ffff#) => goto State_104;
+               when '"' => goto State_160;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_139>>
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#0#) .. '&' | '(' .. Character_Type'Val (16#10ffff#) => goto State_106;
+               when ''' => goto State_161;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_140>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'q' | 's' .. 'z' => goto State_24;
+               when 'r' => goto State_162;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_141>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'j' | 'l' .. 'z' => goto State_24;
+               when 'k' => goto State_163;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_142>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'r' | 't' .. 'z' => goto State_24;
+               when 's' => goto State_164;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_143>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'h' | 'j' .. 'z' => goto State_24;
+               when 'i' => goto State_165;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_144>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Elif;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_145>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Else;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_146>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'o' | 'q' .. 'z' => goto State_24;
+               when 'p' => goto State_166;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_147>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Exec;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_148>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'k' | 'm' .. 'z' => goto State_24;
+               when 'l' => goto State_167;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_149>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_From;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_150>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'b' .. 'z' => goto State_24;
+               when 'a' => goto State_168;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_151>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'q' | 's' .. 'z' => goto State_24;
+               when 'r' => goto State_169;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_152>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'c' | 'e' .. 'z' => goto State_24;
+               when 'd' => goto State_170;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_153>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Pass;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_154>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 's' | 'u' .. 'z' => goto State_24;
+               when 't' => goto State_171;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_155>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'd' | 'f' .. 'z' => goto State_24;
+               when 'e' => goto State_172;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_156>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'q' | 's' .. 'z' => goto State_24;
+               when 'r' => goto State_173;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_157>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'd' | 'f' .. 'z' => goto State_24;
+               when 'e' => goto State_174;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_158>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_With;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_159>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'c' | 'e' .. 'z' => goto State_24;
+               when 'd' => goto State_175;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_160>>
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#0#) .. '!' | '#' .. Character_Type'Val (16#10ffff#) => goto State_104;
+               when '"' => goto State_103;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_161>>
+
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when Character_Type'Val (16#0#) .. '&' | '(' .. Character_Type'Val (16#10ffff#) => goto State_106;
+               when ''' => goto State_103;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_162>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 's' | 'u' .. 'z' => goto State_24;
+               when 't' => goto State_176;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_163>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Break;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_164>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Class;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_165>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'm' | 'o' .. 'z' => goto State_24;
+               when 'n' => goto State_177;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_166>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 's' | 'u' .. 'z' => goto State_24;
+               when 't' => goto State_178;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_167>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'k' | 'm' .. 'z' => goto State_24;
+               when 'l' => goto State_179;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_168>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'k' | 'm' .. 'z' => goto State_24;
+               when 'l' => goto State_180;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_169>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 's' | 'u' .. 'z' => goto State_24;
+               when 't' => goto State_181;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_170>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'b' .. 'z' => goto State_24;
+               when 'a' => goto State_182;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_171>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Print;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_172>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Raise;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_173>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'm' | 'o' .. 'z' => goto State_24;
+               when 'n' => goto State_183;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_174>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_While;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_175>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Yield;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_176>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Assert;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_177>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 't' | 'v' .. 'z' => goto State_24;
+               when 'u' => goto State_184;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_178>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Except;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_179>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'x' | 'z' => goto State_24;
+               when 'y' => goto State_185;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_180>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Global;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_181>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Import;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_182>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Lambda;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_183>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Return;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_184>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Identifier;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'd' | 'f' .. 'z' => goto State_24;
+               when 'e' => goto State_186;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_185>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Finally;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+            <<State_186>>
+
+               Match_Index := Index - 1;
+               Match_Kind := python_Continue;
+
+         if Index > Self.Input_Last then
+            goto Stop;
+         end if;
+
+         declare
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
+         begin
+            Index := Index + 1;
+
+            case Input_Char is
+               when '0' .. '9' | 'A' .. 'Z' | '_' | 'a' .. 'z' => goto State_24;
+
+            when others =>
+
+               goto Stop;
+            end case;
+         end;
+
+
+      <<Stop>>
+      --  We end up here as soon as the currently analyzed character was not
+      --  accepted by any transitions from the current state. Two cases from
+      --  there:
+
+      if Match_Index = 0 then
+         --  We haven't found a match. Just create an error token and plan to
+         --  start a new token at the next character.
+         if Index > Self.Input_Last then
+            Token := (python_Termination, Index, Index - 1);
+            Self.Has_Next := False;
+         else
+            Token := (python_Lexing_Failure, First_Index, First_Index);
+         end if;
+
+      elsif Match_Ignore then
+         --  We found a match. It must be ignored: resume lexing to start right
+         --  after the matched text.
+         First_Index := Match_Index + 1;
+         goto Start;
+
+      else
+         --  We found a match for which we must emit a token
+         Token := (Match_Kind, First_Index, Match_Index);
+      end if;
+
+      Self.Last_Token := Token;
+      if not Is_Trivia (Token.Kind) then
+         Self.Last_Token_Kind := Token.Kind;
+      end if;
+   end Generic_Next_Token;
+
+   procedure Wide_Next_Token is new Generic_Next_Token (Get_Wide_Char);
+   procedure Compact_Next_Token is new Generic_Next_Token (Get_Compact_Char);
+
+   ----------------
+   -- Next_Token --
+   ----------------
+
+   procedure Next_Token
+     (Self : in out Lexer_State; Token : out Lexed_Token) is
+   begin
+      if Self.Input = null then
+         Compact_Next_Token (Self, Token);
+      else
+         Wide_Next_Token (Self, Token);
+      end if;
+   end Next_Token;
+
+end Libpythonlang.Lexer_State_Machine;
@@ -0,0 +1,34097 @@
+
+
+
+
+
+
+
+
+open Ctypes
+open Foreign
+
+let so_ext = if Sys.win32 || Sys.cygwin then "dll" else "so"
+let c_lib_name = Format.sprintf "libpythonlang.%s" so_ext
+let c_lib = Dl.dlopen ~filename:c_lib_name ~flags:[Dl.RTLD_NOW]
+
+exception InvalidField of string
+
+exception NodeDataEvaluationError of string
+
+exception InvalidInput of string
+
+exception InvalidSymbolError of string
+
+exception InvalidUnitNameError of string
+
+exception NativeException of string
+
+exception PreconditionFailure of string
+
+exception PropertyError of string
+
+exception TemplateArgsError of string
+
+exception TemplateFormatError of string
+
+exception TemplateInstantiationError of string
+
+exception StaleReferenceError of string
+
+exception UnknownCharset of string
+
+
+
+
+
+exception SyntaxError
+
+module Exception = struct
+
+  type t = {
+    kind : int;
+    information : string;
+  }
+
+  let c_struct : t structure typ = structure "exception"
+  let kind = field c_struct "kind" int
+  let information = field c_struct "information" string
+  let () = seal c_struct
+
+  let wrap c_value_ptr =
+    if is_null c_value_ptr then
+      None
+    else
+      let c_value = !@ c_value_ptr in
+      Some {
+        kind = getf c_value kind;
+        information = getf c_value information;
+      }
+
+  let unwrap value =
+    match value with
+    | None ->
+        from_voidp c_struct null
+    | Some value ->
+        let c_value = make c_struct in
+        setf c_value kind value.kind;
+        setf c_value information value.information;
+        allocate c_struct c_value
+
+  let c_type = view (ptr c_struct) ~read:wrap ~write:unwrap
+
+end
+
+let get_last_exception = foreign ~from:c_lib
+  "python_get_last_exception"
+  (void @-> returning Exception.c_type)
+
+(* When declaring an imported function with foreign, use raisable instead of
+ returning, to check get_last_exception before returning *)
+let raisable typ =
+  let read value =
+    match get_last_exception () with
+    | None -> value
+    | Some exc ->
+        (match exc.kind with
+         | 0 ->
+             raise (InvalidField exc.information)
+         | 1 ->
+             raise (NodeDataEvaluationError exc.information)
+         | 2 ->
+             raise (InvalidInput exc.information)
+         | 3 ->
+             raise (InvalidSymbolError exc.information)
+         | 4 ->
+             raise (InvalidUnitNameError exc.information)
+         | 5 ->
+             raise (NativeException exc.information)
+         | 6 ->
+             raise (PreconditionFailure exc.information)
+         | 7 ->
+             raise (PropertyError exc.information)
+         | 8 ->
+             raise (TemplateArgsError exc.information)
+         | 9 ->
+             raise (TemplateFormatError exc.information)
+         | 10 ->
+             raise (TemplateInstantiationError exc.information)
+         | 11 ->
+             raise (StaleReferenceError exc.information)
+         | 12 ->
+             raise (UnknownCharset exc.information)
+         | _ -> assert false)
+  in
+  let write value = value in
+  let new_typ = view typ ~read ~write in
+  returning new_typ
+
+(* Module used to encode/decode UTF32 strings *)
+
+(* Camomile needs to know the location of its standard library to work,
+   so we use the following heuristic:
+   - if the directory chosen at build time exists, we assume the installation
+     is ok
+   - otherwise we look for a directory 'share/camomile' next to the binary
+   - otherwise we fail
+*)
+
+module CamomileDefaultConfig = CamomileLibrary.DefaultConfig
+
+module CamomileShareConfig = struct
+  let (^/) = Filename.concat
+  let bin_dir = Filename.dirname Sys.executable_name
+  let share_dir = bin_dir ^/ Filename.parent_dir_name ^/ "share" ^/ "camomile"
+  let datadir    = share_dir ^/ "database"
+  let localedir  = share_dir ^/ "locales"
+  let charmapdir = share_dir ^/ "charmaps"
+  let unimapdir  = share_dir ^/ "mappings"
+end
+
+module type CamomileConfig = module type of CamomileLibrary.DefaultConfig
+
+let camomile_config =
+  if Sys.file_exists CamomileDefaultConfig.datadir then
+    (module CamomileDefaultConfig : CamomileConfig)
+  else if Sys.file_exists CamomileShareConfig.datadir then
+    (module CamomileShareConfig: CamomileConfig)
+  else failwith "no camomile library found"
+
+module CamomileConfig = (val camomile_config)
+
+module Camomile = CamomileLibrary.Make (CamomileConfig)
+
+module Text = struct
+  type t = string
+
+  let c_struct : t structure typ = structure "text"
+
+  let chars = field c_struct "chars" (ptr uint32_t)
+
+  let length = field c_struct "length" size_t
+
+  let is_allocated = field c_struct "is_allocated" bool
+
+  let () = seal c_struct
+
+  let destroy_text = foreign ~from:c_lib "python_destroy_text"
+    (ptr c_struct @-> raisable void)
+
+  module UCS4Encoding = Camomile.CharEncoding.Make (Camomile.UCS4)
+
+  let wrap (c_value : t structure) : t =
+    let open Unsigned.Size_t in
+    let open Camomile in
+    let length = to_int (getf c_value length) in
+    let chars = getf c_value chars in
+    let f i =
+      UChar.chr_of_uint (Unsigned.UInt32.to_int !@ (chars +@ i))
+    in
+    let result = UCS4.init length f in
+    (* Now that the value is fully transformed to an ocaml value, we can
+      free it by calling destroy_text *)
+    destroy_text (addr c_value) ;
+    UCS4Encoding.encode CharEncoding.utf8 result
+
+  let unwrap (value : t) : t structure =
+    let open Unsigned in
+    let open Camomile in
+    let text = UCS4Encoding.decode CharEncoding.utf8 value in
+    let struct_length = Size_t.of_int (UCS4.length text) in
+    let struct_chars = allocate_n uint32_t ~count:(UCS4.length text) in
+    let i = ref 0 in
+    let f c =
+      struct_chars +@ !i <-@ (UInt32.of_int (UChar.code c));
+      i := !i + 1
+    in
+    UCS4.iter f text ;
+    let c_value = make c_struct in
+    setf c_value length struct_length ;
+    setf c_value chars struct_chars ;
+    setf c_value is_allocated false ;
+    (* We don't need to care about calling destroy_text here since we
+     manually allocated the pointer, ctypes will take care of freeing the
+     memory *)
+    c_value
+
+  let c_type = view c_struct ~read:wrap ~write:unwrap
+end
+
+module Character = struct
+  (* Characters are encoded as strings because ocaml char are not unicode
+   characters *)
+  type t = string
+
+  module UCharEncoding = Camomile.CharEncoding.Make (Camomile.UText)
+
+  let of_int i =
+    let open Camomile in
+    let uchar = UChar.chr i in
+    UCharEncoding.encode CharEncoding.utf8 (UText.init 1 (fun _ -> uchar))
+
+  let of_int32 i =
+    of_int (Unsigned.UInt32.to_int i)
+
+  let wrap (c_value : Unsigned.UInt32.t) : t =
+    of_int32 c_value
+
+  let unwrap (value : string) : Unsigned.UInt32.t =
+    let open Camomile in
+    let text = UCharEncoding.decode CharEncoding.utf8 value in
+    let uchar = UText.get text 0 in
+    Unsigned.UInt32.of_int (UChar.code uchar)
+
+  let c_type = view uint32_t ~read:wrap ~write:unwrap
+end
+
+module BigInteger = struct
+
+  type t = Z.t
+
+  let c_type = ptr void
+
+  let create = foreign ~from:c_lib "python_create_big_integer"
+    (ptr Text.c_type @-> raisable c_type)
+
+  let text = foreign ~from:c_lib "python_big_integer_text"
+    (c_type @-> ptr Text.c_type @-> raisable void)
+
+  let decref = foreign ~from:c_lib "python_big_integer_decref"
+    (c_type @-> raisable void)
+
+  let wrap (c_value : unit ptr) : t =
+    let c_text_ptr = allocate_n Text.c_type ~count:1 in
+    text c_value c_text_ptr;
+    decref c_value;
+    Z.of_string (!@ c_text_ptr)
+
+  let unwrap (value : t) : unit ptr =
+    create (allocate Text.c_type (Z.to_string value))
+end
+
+module AnalysisUnitKind = struct
+  type t =
+  | UnitSpecification
+  | UnitBody
+
+  let name () = "AnalysisUnitKind"
+
+  let wrap (c_value : int) : t =
+    match c_value with
+    | 0 -> UnitSpecification
+    | 1 -> UnitBody
+    | _ -> assert false
+
+  let unwrap (value : t) : int =
+    match value with
+    | UnitSpecification -> 0
+    | UnitBody -> 1
+
+   let c_type = view int ~read:wrap ~write:unwrap
+end
+
+module LookupKind = struct
+  type t =
+  | Recursive
+  | Flat
+  | Minimal
+
+  let name () = "LookupKind"
+
+  let wrap (c_value : int) : t =
+    match c_value with
+    | 0 -> Recursive
+    | 1 -> Flat
+    | 2 -> Minimal
+    | _ -> assert false
+
+  let unwrap (value : t) : int =
+    match value with
+    | Recursive -> 0
+    | Flat -> 1
+    | Minimal -> 2
+
+   let c_type = view int ~read:wrap ~write:unwrap
+end
+
+module GrammarRule = struct
+  type t =
+  | NameRule
+  | NumberRule
+  | StringRule
+  | CatStringRule
+  | NlRule
+  | MainRuleRule
+  | DecoratorRule
+  | DecoratorsRule
+  | DecoratedRule
+  | FuncDefRule
+  | ParametersRule
+  | VarargslistRule
+  | FpdefRule
+  | NameListRule
+  | StmtRule
+  | SimpleStmtRule
+  | SmallStmtRule
+  | ExprStmtRule
+  | PrintStmtRule
+  | DelStmtRule
+  | PassStmtRule
+  | FlowStmtRule
+  | BreakStmtRule
+  | ContinueStmtRule
+  | ReturnStmtRule
+  | YieldStmtRule
+  | RaiseStmtRule
+  | ImportStmtRule
+  | ImportNameRule
+  | DotRule
+  | ImportFromRule
+  | AsNameRule
+  | DottedAsNameRule
+  | ImportAsNamesRule
+  | DottedAsNamesRule
+  | DottedNameRule
+  | GlobalStmtRule
+  | ExecStmtRule
+  | AssertStmtRule
+  | CompoundStmtRule
+  | ElsePartRule
+  | IfStmtRule
+  | WhileStmtRule
+  | ForStmtRule
+  | TryStmtRule
+  | WithStmtRule
+  | WithItemRule
+  | SuiteRule
+  | TestRule
+  | OrTestRule
+  | AndTestRule
+  | NotTestRule
+  | ComparisonRule
+  | ExprRule
+  | XorExprRule
+  | AndExprRule
+  | ShiftExprRule
+  | ArithExprRule
+  | TermRule
+  | FactorRule
+  | PowerRule
+  | AtomExprRule
+  | DictAssocRule
+  | YieldExprRule
+  | AtomRule
+  | SetLitRule
+  | LambdefRule
+  | SubscriptListRule
+  | SubscriptRule
+  | ExprListRule
+  | TestListRule
+  | EmptyTestListRule
+  | ClassDefRule
+  | ArgListRule
+  | ListIterRule
+  | ListForRule
+  | ListIfRule
+  | CompIterRule
+  | CompForRule
+  | CompIfRule
+
+  let name () = "GrammarRule"
+
+  let wrap (c_value : int) : t =
+    match c_value with
+    | 0 -> NameRule
+    | 1 -> NumberRule
+    | 2 -> StringRule
+    | 3 -> CatStringRule
+    | 4 -> NlRule
+    | 5 -> MainRuleRule
+    | 6 -> DecoratorRule
+    | 7 -> DecoratorsRule
+    | 8 -> DecoratedRule
+    | 9 -> FuncDefRule
+    | 10 -> ParametersRule
+    | 11 -> VarargslistRule
+    | 12 -> FpdefRule
+    | 13 -> NameListRule
+    | 14 -> StmtRule
+    | 15 -> SimpleStmtRule
+    | 16 -> SmallStmtRule
+    | 17 -> ExprStmtRule
+    | 18 -> PrintStmtRule
+    | 19 -> DelStmtRule
+    | 20 -> PassStmtRule
+    | 21 -> FlowStmtRule
+    | 22 -> BreakStmtRule
+    | 23 -> ContinueStmtRule
+    | 24 -> ReturnStmtRule
+    | 25 -> YieldStmtRule
+    | 26 -> RaiseStmtRule
+    | 27 -> ImportStmtRule
+    | 28 -> ImportNameRule
+    | 29 -> DotRule
+    | 30 -> ImportFromRule
+    | 31 -> AsNameRule
+    | 32 -> DottedAsNameRule
+    | 33 -> ImportAsNamesRule
+    | 34 -> DottedAsNamesRule
+    | 35 -> DottedNameRule
+    | 36 -> GlobalStmtRule
+    | 37 -> ExecStmtRule
+    | 38 -> AssertStmtRule
+    | 39 -> CompoundStmtRule
+    | 40 -> ElsePartRule
+    | 41 -> IfStmtRule
+    | 42 -> WhileStmtRule
+    | 43 -> ForStmtRule
+    | 44 -> TryStmtRule
+    | 45 -> WithStmtRule
+    | 46 -> WithItemRule
+    | 47 -> SuiteRule
+    | 48 -> TestRule
+    | 49 -> OrTestRule
+    | 50 -> AndTestRule
+    | 51 -> NotTestRule
+    | 52 -> ComparisonRule
+    | 53 -> ExprRule
+    | 54 -> XorExprRule
+    | 55 -> AndExprRule
+    | 56 -> ShiftExprRule
+    | 57 -> ArithExprRule
+    | 58 -> TermRule
+    | 59 -> FactorRule
+    | 60 -> PowerRule
+    | 61 -> AtomExprRule
+    | 62 -> DictAssocRule
+    | 63 -> YieldExprRule
+    | 64 -> AtomRule
+    | 65 -> SetLitRule
+    | 66 -> LambdefRule
+    | 67 -> SubscriptListRule
+    | 68 -> SubscriptRule
+    | 69 -> ExprListRule
+    | 70 -> TestListRule
+    | 71 -> EmptyTestListRule
+    | 72 -> ClassDefRule
+    | 73 -> ArgListRule
+    | 74 -> ListIterRule
+    | 75 -> ListForRule
+    | 76 -> ListIfRule
+    | 77 -> CompIterRule
+    | 78 -> CompForRule
+    | 79 -> CompIfRule
+    | _ -> assert false
+
+  let unwrap (value : t) : int =
+    match value with
+    | NameRule -> 0
+    | NumberRule -> 1
+    | StringRule -> 2
+    | CatStringRule -> 3
+    | NlRule -> 4
+    | MainRuleRule -> 5
+    | DecoratorRule -> 6
+    | DecoratorsRule -> 7
+    | DecoratedRule -> 8
+    | FuncDefRule -> 9
+    | ParametersRule -> 10
+    | VarargslistRule -> 11
+    | FpdefRule -> 12
+    | NameListRule -> 13
+    | StmtRule -> 14
+    | SimpleStmtRule -> 15
+    | SmallStmtRule -> 16
+    | ExprStmtRule -> 17
+    | PrintStmtRule -> 18
+    | DelStmtRule -> 19
+    | PassStmtRule -> 20
+    | FlowStmtRule -> 21
+    | BreakStmtRule -> 22
+    | ContinueStmtRule -> 23
+    | ReturnStmtRule -> 24
+    | YieldStmtRule -> 25
+    | RaiseStmtRule -> 26
+    | ImportStmtRule -> 27
+    | ImportNameRule -> 28
+    | DotRule -> 29
+    | ImportFromRule -> 30
+    | AsNameRule -> 31
+    | DottedAsNameRule -> 32
+    | ImportAsNamesRule -> 33
+    | DottedAsNamesRule -> 34
+    | DottedNameRule -> 35
+    | GlobalStmtRule -> 36
+    | ExecStmtRule -> 37
+    | AssertStmtRule -> 38
+    | CompoundStmtRule -> 39
+    | ElsePartRule -> 40
+    | IfStmtRule -> 41
+    | WhileStmtRule -> 42
+    | ForStmtRule -> 43
+    | TryStmtRule -> 44
+    | WithStmtRule -> 45
+    | WithItemRule -> 46
+    | SuiteRule -> 47
+    | TestRule -> 48
+    | OrTestRule -> 49
+    | AndTestRule -> 50
+    | NotTestRule -> 51
+    | ComparisonRule -> 52
+    | ExprRule -> 53
+    | XorExprRule -> 54
+    | AndExprRule -> 55
+    | ShiftExprRule -> 56
+    | ArithExprRule -> 57
+    | TermRule -> 58
+    | FactorRule -> 59
+    | PowerRule -> 60
+    | AtomExprRule -> 61
+    | DictAssocRule -> 62
+    | YieldExprRule -> 63
+    | AtomRule -> 64
+    | SetLitRule -> 65
+    | LambdefRule -> 66
+    | SubscriptListRule -> 67
+    | SubscriptRule -> 68
+    | ExprListRule -> 69
+    | TestListRule -> 70
+    | EmptyTestListRule -> 71
+    | ClassDefRule -> 72
+    | ArgListRule -> 73
+    | ListIterRule -> 74
+    | ListForRule -> 75
+    | ListIfRule -> 76
+    | CompIterRule -> 77
+    | CompForRule -> 78
+    | CompIfRule -> 79
+
+   let c_type = view int ~read:wrap ~write:unwrap
+end
+
+
+let free = foreign ~from:c_lib
+  "python_free"
+  (ptr void @-> returning void)
+
+(** Assuming char_ptr is a valid char*, convert it to a native Ocaml
+  * string and free the C pointer.
+  *)
+let unwrap_str char_ptr =
+  let str = Ctypes.coerce (ptr char) string char_ptr in
+  free (Ctypes.coerce (ptr char) (ptr void) char_ptr);
+  str
+
+
+let default_grammar_rule = GrammarRule.MainRuleRule
+
+module Sloc = struct
+  type t = {
+    line : int;
+    column : int;
+  }
+
+  let c_struct : t structure typ = structure "sloc"
+  let line = field c_struct "line" uint32_t
+  let column = field c_struct "column" uint16_t
+  let () = seal c_struct
+
+  let wrap (c_value : t structure) : t = {
+    line = Unsigned.UInt32.to_int (getf c_value line);
+    column = Unsigned.UInt16.to_int (getf c_value column);
+  }
+
+  let unwrap (value : t) : t structure =
+    let c_value = make c_struct in
+    setf c_value line (Unsigned.UInt32.of_int (value.line));
+    setf c_value column (Unsigned.UInt16.of_int (value.column));
+    c_value
+
+  let c_type = view c_struct ~read:wrap ~write:unwrap
+end
+
+module SlocRange = struct
+  type t = {
+    loc_start : Sloc.t;
+    loc_end : Sloc.t;
+  }
+
+  let c_struct : t structure typ = structure "sloc_range"
+  let loc_start = field c_struct "loc_start" Sloc.c_type
+  let loc_end = field c_struct "loc_end" Sloc.c_type
+  let () = seal c_struct
+
+  let wrap (c_value : t structure) : t = {
+    loc_start = getf c_value loc_start;
+    loc_end = getf c_value loc_end;
+  }
+
+  let unwrap (value : t) : t structure =
+    let c_value = make c_struct in
+    setf c_value loc_start value.loc_start;
+    setf c_value loc_end value.loc_end;
+    c_value
+
+  let c_type = view c_struct ~read:wrap ~write:unwrap
+
+  let pp fmt sloc_range =
+    Format.fprintf fmt "<SlocRange %d:%d-%d:%d>"
+      sloc_range.loc_start.line
+      sloc_range.loc_start.column
+      sloc_range.loc_end.line
+      sloc_range.loc_end.column
+end
+
+module Diagnostic = struct
+  type t = {
+    sloc_range : SlocRange.t;
+    message : string
+  }
+
+  let c_struct : t structure typ = structure "diagnostic"
+  let sloc_range = field c_struct "sloc_range" SlocRange.c_type
+  let message = field c_struct "message" Text.c_type
+  let () = seal c_struct
+
+  let wrap (c_value : t structure) : t = {
+    sloc_range = getf c_value sloc_range;
+    message = getf c_value message;
+  }
+
+  let unwrap (value : t) : t structure =
+    let c_value = make c_struct in
+    setf c_value sloc_range value.sloc_range;
+    setf c_value message value.message;
+    c_value
+
+  let c_type = view c_struct ~read:wrap ~write:unwrap
+end
+
+module TokenData = struct
+  type t = unit ptr
+end
+
+module Token = struct
+  type t = {
+    token_data : TokenData.t;
+    token_index : int;
+    trivia_index : int;
+    kind : int;
+    text : string;
+    sloc_range : SlocRange.t;
+  }
+
+  let c_struct : t structure typ = structure "token"
+  let token_data = field c_struct "token_data" (ptr void)
+  let token_index = field c_struct "token_index" int
+  let trivia_index = field c_struct "trivia_index" int
+  let kind = field c_struct "kind" int
+  let text = field c_struct "text" Text.c_type
+  let sloc_range = field c_struct "sloc_range" SlocRange.c_type
+  let () = seal c_struct
+
+  let wrap (c_value : t structure) : t = {
+    token_data = getf c_value token_data;
+    token_index = getf c_value token_index;
+    trivia_index = getf c_value trivia_index;
+    kind = getf c_value kind;
+    text = getf c_value text;
+    sloc_range = getf c_value sloc_range;
+  }
+
+  let unwrap (value : t) : t structure =
+    let c_value = make c_struct in
+    setf c_value token_data value.token_data;
+    setf c_value token_index value.token_index;
+    setf c_value trivia_index value.trivia_index;
+    setf c_value kind value.kind;
+    setf c_value text value.text;
+    setf c_value sloc_range value.sloc_range;
+    c_value
+
+  let c_type = view c_struct ~read:wrap ~write:unwrap
+
+  let _token_kind_name = foreign ~from:c_lib
+    "python_token_kind_name"
+    (int @-> raisable (ptr char))
+
+  let token_kind_name kind =
+    unwrap_str (_token_kind_name kind)
+
+  let kind_name token = token_kind_name token.kind
+
+  let token_range_text = foreign ~from:c_lib
+    "python_token_range_text"
+    (ptr c_type @-> ptr c_type @-> ptr Text.c_type @-> raisable int)
+
+  let token_next = foreign ~from:c_lib
+    "python_token_next"
+    (ptr c_type @-> ptr c_type @-> raisable void)
+
+  let token_previous = foreign ~from:c_lib
+    "python_token_previous"
+    (ptr c_type @-> ptr c_type @-> raisable void)
+
+  let is_equivalent = foreign ~from:c_lib
+    "python_token_is_equivalent"
+    (ptr c_type @-> ptr c_type @-> raisable bool)
+
+  let pp fmt token =
+    let pp_text fmt = function
+      | "" -> Format.pp_print_string fmt ""
+      | _ as text -> Format.fprintf fmt " %S" text
+    in
+    Format.fprintf fmt "<Token %s%a at %a>"
+      (kind_name token)
+      pp_text token.text
+      SlocRange.pp token.sloc_range
+
+  let text_range token_first token_last =
+    let c_result_ptr = allocate_n Text.c_type ~count:1 in
+    let res =
+      token_range_text
+        (allocate c_type token_first)
+        (allocate c_type token_last)
+        c_result_ptr
+    in
+    if res = 0 then
+      raise (Invalid_argument
+        (Format.asprintf "%a and %a come from different units"
+          pp token_first
+          pp token_last));
+    !@ c_result_ptr
+
+  let next token =
+    let c_next_token_ptr = allocate_n c_type ~count:1 in
+    token_next (allocate c_type token) c_next_token_ptr ;
+    !@ c_next_token_ptr
+
+  let previous token =
+    let c_next_token_ptr = allocate_n c_type ~count:1 in
+    token_previous (allocate c_type token) c_next_token_ptr ;
+    !@ c_next_token_ptr
+
+  let is_trivia token =
+    token.trivia_index != 0
+
+  let index token =
+    match token.trivia_index with
+    | 0 ->
+        token.token_index - 1
+    | _ ->
+        token.trivia_index - 1
+
+  let compare one other =
+    let open Pervasives in
+    let compare_token_data = compare one.token_data other.token_data in
+    if compare_token_data = 0 then
+      let compare_token_index = compare one.token_index other.token_index in
+      if compare_token_index = 0 then
+        compare one.trivia_index other.trivia_index
+      else
+        compare_token_index
+    else
+      compare_token_data
+
+  let equal one other =
+    compare one other = 0
+
+  let hash token =
+    Hashtbl.hash
+      (token.token_data
+       , token.token_index
+       , token.trivia_index)
+
+  let is_equivalent one other =
+    is_equivalent (allocate c_type one) (allocate c_type other)
+
+end
+
+module TokenTable = struct
+  type int32_column = (int32, Bigarray.int32_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+  type uint16_column = (int, Bigarray.int16_unsigned_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+  type uint8_column = (int, Bigarray.int8_unsigned_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+
+  type t = {
+    kinds : int32_column;
+    start_offsets : int32_column;
+    end_offsets : int32_column;
+    start_lines : int32_column;
+    end_lines : int32_column;
+    start_columns : uint16_column;
+    end_columns : uint16_column;
+    is_trivia : uint8_column;
+  }
+
+  let c_struct : t structure typ = structure "token_table"
+  let count = field c_struct "count" int
+  let kinds = field c_struct "kinds" (ptr void)
+  let start_offsets = field c_struct "start_offsets" (ptr void)
+  let end_offsets = field c_struct "end_offsets" (ptr void)
+  let start_lines = field c_struct "start_lines" (ptr void)
+  let end_lines = field c_struct "end_lines" (ptr void)
+  let start_columns = field c_struct "start_columns" (ptr void)
+  let end_columns = field c_struct "end_columns" (ptr void)
+  let is_trivia = field c_struct "is_trivia" (ptr void)
+  let () = seal c_struct
+
+  let create length =
+    let column kind = Bigarray.Array1.create kind Bigarray.c_layout length in
+    {
+      kinds = column Bigarray.int32;
+      start_offsets = column Bigarray.int32;
+      end_offsets = column Bigarray.int32;
+      start_lines = column Bigarray.int32;
+      end_lines = column Bigarray.int32;
+      start_columns = column Bigarray.int16_unsigned;
+      end_columns = column Bigarray.int16_unsigned;
+      is_trivia = column Bigarray.int8_unsigned;
+    }
+
+  let length table = Bigarray.Array1.dim table.kinds
+
+  let unwrap (value : t) : t structure =
+    (* Bigarrays are allocated out of the OCaml heap, so the C API can fill
+       them in place: no copy is required. *)
+    let start column = to_voidp (bigarray_start array1 column) in
+    let c_value = make c_struct in
+    setf c_value count (length value);
+    setf c_value kinds (start value.kinds);
+    setf c_value start_offsets (start value.start_offsets);
+    setf c_value end_offsets (start value.end_offsets);
+    setf c_value start_lines (start value.start_lines);
+    setf c_value end_lines (start value.end_lines);
+    setf c_value start_columns (start value.start_columns);
+    setf c_value end_columns (start value.end_columns);
+    setf c_value is_trivia (start value.is_trivia);
+    c_value
+
+  let kind_name table index =
+    let kind = Bigarray.Array1.get table.kinds index in
+    Token.token_kind_name (Int32.to_int kind)
+
+  let is_trivia table index = Bigarray.Array1.get table.is_trivia index <> 0
+end
+
+module UnitProvider = struct
+  (* The real C type of a context is a void*. But we use a pointer to this
+     type, to be able to allocate a value of t and attach a finalizer to it. *)
+  type t = unit ptr ptr
+
+  let c_type = ptr void
+
+  let null = allocate c_type null
+
+  
+
+end
+
+module BareNode = struct
+  type t = unit ptr
+end
+
+module Rebindings = struct
+  type t = unit ptr
+end
+
+
+
+      
+module EntityInfoStruct = struct
+  type t
+
+   
+  let c_type : t structure typ = structure "entity_info"
+  let rebindings =
+    field c_type "rebindings" (ptr void)
+  let from_rebound =
+    field c_type "from_rebound" bool
+  let () = seal c_type
+
+end
+
+         
+module EntityStruct = struct
+  type t
+
+   
+  let c_type : t structure typ = structure "python_node"
+  let node =
+    field c_type "node" (ptr void)
+  let info =
+    field c_type "info" EntityInfoStruct.c_type
+  let () = seal c_type
+
+end
+
+      
+module AnalysisUnitStruct : sig
+  type t = unit ptr
+
+  val c_type : t typ
+
+  val unit_root : t -> EntityStruct.t structure ptr -> unit
+
+  val unit_diagnostic_count : t -> int
+
+  val unit_diagnostic : t -> int -> Diagnostic.t ptr -> int
+
+  val unit_filename : t -> char ptr
+
+  val unit_reparse_from_file : t -> string -> int
+
+  val unit_reparse_from_buffer :
+    t -> string -> string -> Unsigned.size_t -> int
+
+  val unit_first_token : t -> Token.t ptr -> unit
+
+  val unit_last_token : t -> Token.t ptr -> unit
+
+  val unit_token_count : t -> int
+
+  val unit_trivia_count : t -> int
+
+  val unit_export_tokens : t -> TokenTable.t structure ptr -> int
+end = struct
+  (* Module defining the c structure of an analysis unit *)
+
+  type t = unit ptr
+  let c_type = ptr void
+
+  let unit_root = foreign ~from:c_lib "python_unit_root"
+    (c_type @-> ptr EntityStruct.c_type @-> raisable void)
+
+  let unit_diagnostic_count = foreign ~from:c_lib
+    "python_unit_diagnostic_count"
+    (c_type @-> raisable int)
+
+  let unit_diagnostic = foreign ~from:c_lib
+    "python_unit_diagnostic"
+    (c_type @-> int @-> ptr Diagnostic.c_type @-> raisable int)
+
+  let unit_filename = foreign ~from:c_lib
+    "python_unit_filename"
+    (c_type @-> raisable (ptr char))
+
+  let unit_reparse_from_file = foreign ~from:c_lib
+    "python_unit_reparse_from_file"
+    (c_type
+     @-> string
+     @-> raisable int)
+
+  let unit_reparse_from_buffer = foreign ~from:c_lib
+    "python_unit_reparse_from_buffer"
+    (c_type
+     @-> string
+     @-> string
+     @-> size_t
+     @-> raisable int)
+
+  let unit_first_token = foreign ~from:c_lib
+    "python_unit_first_token"
+    (c_type
+     @-> ptr Token.c_type
+     @-> raisable void)
+
+  let unit_last_token = foreign ~from:c_lib
+    "python_unit_last_token"
+    (c_type
+     @-> ptr Token.c_type
+     @-> raisable void)
+
+  let unit_token_count = foreign ~from:c_lib
+    "python_unit_token_count"
+    (c_type @-> raisable int)
+
+  let unit_trivia_count = foreign ~from:c_lib
+    "python_unit_trivia_count"
+    (c_type @-> raisable int)
+
+  let unit_export_tokens = foreign ~from:c_lib
+    "python_unit_export_tokens"
+    (c_type @-> ptr TokenTable.c_struct @-> raisable int)
+end
+
+
+      
+module AnalysisContextStruct : sig
+  type t
+
+  val c_type : t typ
+
+  val create_analysis_context : string -> unit ptr -> bool -> int -> t
+
+  val get_analysis_unit_from_file :
+    t -> string -> string -> bool -> GrammarRule.t -> AnalysisUnitStruct.t
+
+  val get_analysis_unit_from_buffer :
+    t
+    -> string (* Filename *)
+    -> string (* Charset *)
+    -> string (* Buffer *)
+    -> Unsigned.size_t (* Buffer size *)
+    -> GrammarRule.t
+    -> AnalysisUnitStruct.t
+end = struct
+  (* Module defining the c structure of an analysis context *)
+
+  (* The real C type of a context is a void*. But we use a pointer to this
+     type, to be able to allocate a value of t and attach a finalizer to it.
+     See wrap function *)
+  type t = unit ptr ptr
+
+  let unwrap (value : t) : unit ptr = !@value
+
+  let context_decref =
+    let f =
+      foreign ~from:c_lib "python_context_decref"
+        (ptr void @-> raisable void)
+    in
+    fun ctx -> f (unwrap ctx)
+
+  let wrap (c_value : unit ptr) : t =
+    (* To deallocate cleanly the context, we need to call context_decref.
+       Allocate a value and attach a finalizer to it *)
+    allocate ~finalise:context_decref (ptr void) c_value
+
+  let c_type = view (ptr void) ~read:wrap ~write:unwrap
+
+  let create_analysis_context =
+    foreign ~from:c_lib "python_create_analysis_context"
+      (string @-> UnitProvider.c_type @-> bool @-> int @-> raisable c_type)
+
+  let get_analysis_unit_from_file =
+    foreign ~from:c_lib "python_get_analysis_unit_from_file"
+      ( c_type @-> string @-> string @-> bool @-> GrammarRule.c_type
+      @-> raisable AnalysisUnitStruct.c_type )
+
+  let get_analysis_unit_from_buffer =
+    foreign ~from:c_lib "python_get_analysis_unit_from_buffer"
+      ( c_type @-> string (* Filename *) @-> string (* Charset *)
+      @-> string (* Buffer *) @-> size_t (* Buffer size *)
+      @-> GrammarRule.c_type
+      @-> raisable AnalysisUnitStruct.c_type )
+
+end
+
+      
+module Symbol : sig
+  type t = string
+
+  val c_type : t structure typ
+
+  val wrap : (t structure) -> t
+
+  val unwrap : AnalysisContextStruct.t -> t -> (t structure)
+
+  val symbol_text : t structure ptr -> string ptr -> unit
+
+  val context_symbol :
+    AnalysisContextStruct.t -> string ptr -> t structure ptr -> int
+end = struct
+  type t = string
+
+  let c_type : t structure typ = structure "symbol"
+  let data = field c_type "data" (ptr void)
+  let bounds = field c_type "bounds" (ptr void)
+  let () = seal c_type
+
+  let symbol_text = foreign ~from:c_lib "python_symbol_text"
+    (ptr c_type @-> ptr Text.c_type @-> raisable void)
+
+  let wrap (c_value : t structure) : t =
+    let c_result_ptr = allocate_n Text.c_type ~count:1 in
+    symbol_text (addr c_value) c_result_ptr;
+    !@ c_result_ptr
+
+  let context_symbol = foreign ~from:c_lib "python_context_symbol"
+    (AnalysisContextStruct.c_type
+     @-> ptr Text.c_type
+     @-> ptr c_type
+     @-> raisable int)
+
+  let unwrap (ctx : AnalysisContextStruct.t) (value : t) : t structure =
+    let result = make c_type in
+    let code =
+      context_symbol ctx (allocate Text.c_type value) (addr result)
+    in
+    if code = 0 then
+      raise (InvalidSymbolError value) ;
+    result
+end
+
+         
+module TextTypeStruct = struct
+  
+
+  type t
+
+  let c_struct : t structure typ = structure "text_type"
+  let n = field c_struct "n" int
+  let _ = field c_struct "ref_count" int
+  let items = field c_struct "items" uint32_t
+  let () = seal c_struct
+
+  let c_type = ptr c_struct
+
+  let create = foreign ~from:c_lib "python_text_type_create"
+    (int @-> raisable c_type)
+  let dec_ref = foreign ~from:c_lib "python_text_type_dec_ref"
+    (c_type @-> raisable void)
+
+end
+
+         
+module PythonNodeArrayStruct = struct
+  
+
+  type t
+
+  let c_struct : t structure typ = structure "python_node_array"
+  let n = field c_struct "n" int
+  let _ = field c_struct "ref_count" int
+  let items = field c_struct "items"
+    EntityStruct.c_type
+  let () = seal c_struct
+
+  let c_type = ptr c_struct
+
+  let create = foreign ~from:c_lib "python_python_node_array_create"
+    (int @-> raisable c_type)
+  let dec_ref = foreign ~from:c_lib "python_python_node_array_dec_ref"
+    (c_type @-> raisable void)
+
+end
+
+
+module CFunctions = struct
+  let node_kind = foreign ~from:c_lib "python_node_kind"
+    (ptr EntityStruct.c_type @-> raisable int)
+
+  let image = foreign ~from:c_lib "python_node_image"
+    (ptr EntityStruct.c_type
+     @-> ptr Text.c_type
+     @-> raisable void)
+
+  let node_sloc_range = foreign ~from:c_lib
+    "python_node_sloc_range"
+    (ptr EntityStruct.c_type
+     @-> ptr SlocRange.c_type
+     @-> raisable void)
+
+  let lookup_in_node = foreign ~from:c_lib
+    "python_lookup_in_node"
+    (ptr EntityStruct.c_type
+     @-> ptr Sloc.c_type
+     @-> ptr EntityStruct.c_type
+     @-> raisable void)
+
+  let entity_image = foreign ~from:c_lib
+    "python_entity_image"
+    (ptr EntityStruct.c_type
+     @-> ptr Text.c_type
+     @-> raisable void)
+
+  let node_is_token_node = foreign ~from:c_lib
+    "python_node_is_token_node"
+    (ptr EntityStruct.c_type
+     @-> raisable bool)
+
+  let python_node_parent = foreign ~from:c_lib
+    "python_python_node_parent"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let python_node_parents = foreign ~from:c_lib
+    "python_python_node_parents"
+    (ptr EntityStruct.c_type
+    @-> ptr PythonNodeArrayStruct.c_type
+    @-> raisable int)
+
+  let python_node_children = foreign ~from:c_lib
+    "python_python_node_children"
+    (ptr EntityStruct.c_type
+    @-> ptr PythonNodeArrayStruct.c_type
+    @-> raisable int)
+
+  let python_node_token_start = foreign ~from:c_lib
+    "python_python_node_token_start"
+    (ptr EntityStruct.c_type
+    @-> ptr Token.c_type
+    @-> raisable int)
+
+  let python_node_token_end = foreign ~from:c_lib
+    "python_python_node_token_end"
+    (ptr EntityStruct.c_type
+    @-> ptr Token.c_type
+    @-> raisable int)
+
+  let python_node_child_index = foreign ~from:c_lib
+    "python_python_node_child_index"
+    (ptr EntityStruct.c_type
+    @-> ptr int
+    @-> raisable int)
+
+  let python_node_previous_sibling = foreign ~from:c_lib
+    "python_python_node_previous_sibling"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let python_node_next_sibling = foreign ~from:c_lib
+    "python_python_node_next_sibling"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let python_node_unit = foreign ~from:c_lib
+    "python_python_node_unit"
+    (ptr EntityStruct.c_type
+    @-> ptr AnalysisUnitStruct.c_type
+    @-> raisable int)
+
+  let python_node_is_ghost = foreign ~from:c_lib
+    "python_python_node_is_ghost"
+    (ptr EntityStruct.c_type
+    @-> ptr bool
+    @-> raisable int)
+
+  let python_node_full_sloc_image = foreign ~from:c_lib
+    "python_python_node_full_sloc_image"
+    (ptr EntityStruct.c_type
+    @-> ptr TextTypeStruct.c_type
+    @-> raisable int)
+
+  let arg_assoc_f_name = foreign ~from:c_lib
+    "python_arg_assoc_f_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let arg_assoc_f_expr = foreign ~from:c_lib
+    "python_arg_assoc_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let arg_gen_f_expr = foreign ~from:c_lib
+    "python_arg_gen_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let arg_gen_f_comprehension = foreign ~from:c_lib
+    "python_arg_gen_f_comprehension"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let kw_args_f_expr = foreign ~from:c_lib
+    "python_kw_args_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let var_args_f_expr = foreign ~from:c_lib
+    "python_var_args_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let as_name_node_f_imported = foreign ~from:c_lib
+    "python_as_name_node_f_imported"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let as_name_node_f_as_name = foreign ~from:c_lib
+    "python_as_name_node_f_as_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let comp_if_f_test = foreign ~from:c_lib
+    "python_comp_if_f_test"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let comp_if_f_comp = foreign ~from:c_lib
+    "python_comp_if_f_comp"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let comp_for_f_exprs = foreign ~from:c_lib
+    "python_comp_for_f_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let comp_for_f_target = foreign ~from:c_lib
+    "python_comp_for_f_target"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let comp_for_f_comp = foreign ~from:c_lib
+    "python_comp_for_f_comp"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let comp_forl_f_exprs = foreign ~from:c_lib
+    "python_comp_forl_f_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let comp_forl_f_target = foreign ~from:c_lib
+    "python_comp_forl_f_target"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let comp_forl_f_comp = foreign ~from:c_lib
+    "python_comp_forl_f_comp"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let decorator_f_dec_name = foreign ~from:c_lib
+    "python_decorator_f_dec_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let decorator_f_arg_list = foreign ~from:c_lib
+    "python_decorator_f_arg_list"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let dict_assoc_f_key = foreign ~from:c_lib
+    "python_dict_assoc_f_key"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let dict_assoc_f_value = foreign ~from:c_lib
+    "python_dict_assoc_f_value"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let else_part_f_statements = foreign ~from:c_lib
+    "python_else_part_f_statements"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let except_part_f_as_name = foreign ~from:c_lib
+    "python_except_part_f_as_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let except_part_f_statements = foreign ~from:c_lib
+    "python_except_part_f_statements"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let and_expr_f_left = foreign ~from:c_lib
+    "python_and_expr_f_left"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let and_expr_f_right = foreign ~from:c_lib
+    "python_and_expr_f_right"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let and_op_f_left = foreign ~from:c_lib
+    "python_and_op_f_left"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let and_op_f_right = foreign ~from:c_lib
+    "python_and_op_f_right"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let bin_op_f_left = foreign ~from:c_lib
+    "python_bin_op_f_left"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let bin_op_f_op = foreign ~from:c_lib
+    "python_bin_op_f_op"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let bin_op_f_right = foreign ~from:c_lib
+    "python_bin_op_f_right"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let call_expr_f_prefix = foreign ~from:c_lib
+    "python_call_expr_f_prefix"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let call_expr_f_suffix = foreign ~from:c_lib
+    "python_call_expr_f_suffix"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let comp_op_f_left = foreign ~from:c_lib
+    "python_comp_op_f_left"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let comp_op_f_op = foreign ~from:c_lib
+    "python_comp_op_f_op"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let comp_op_f_right = foreign ~from:c_lib
+    "python_comp_op_f_right"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let concat_string_lit_f_first_str = foreign ~from:c_lib
+    "python_concat_string_lit_f_first_str"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let concat_string_lit_f_subsequent_str = foreign ~from:c_lib
+    "python_concat_string_lit_f_subsequent_str"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let dict_comp_f_assoc = foreign ~from:c_lib
+    "python_dict_comp_f_assoc"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let dict_comp_f_comprehension = foreign ~from:c_lib
+    "python_dict_comp_f_comprehension"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let dict_lit_f_assocs = foreign ~from:c_lib
+    "python_dict_lit_f_assocs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let factor_f_op = foreign ~from:c_lib
+    "python_factor_f_op"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let factor_f_expr = foreign ~from:c_lib
+    "python_factor_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let if_expr_f_expr = foreign ~from:c_lib
+    "python_if_expr_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let if_expr_f_cond = foreign ~from:c_lib
+    "python_if_expr_f_cond"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let if_expr_f_else_expr = foreign ~from:c_lib
+    "python_if_expr_f_else_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let inline_eval_f_exprs = foreign ~from:c_lib
+    "python_inline_eval_f_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lambda_def_f_args = foreign ~from:c_lib
+    "python_lambda_def_f_args"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let lambda_def_f_expr = foreign ~from:c_lib
+    "python_lambda_def_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let list_comp_f_expr = foreign ~from:c_lib
+    "python_list_comp_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let list_comp_f_comprehension = foreign ~from:c_lib
+    "python_list_comp_f_comprehension"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let list_gen_f_expr = foreign ~from:c_lib
+    "python_list_gen_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let list_gen_f_comprehension = foreign ~from:c_lib
+    "python_list_gen_f_comprehension"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let list_lit_f_exprs = foreign ~from:c_lib
+    "python_list_lit_f_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let dotted_name_f_prefix = foreign ~from:c_lib
+    "python_dotted_name_f_prefix"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let dotted_name_f_suffix = foreign ~from:c_lib
+    "python_dotted_name_f_suffix"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let not_op_f_expr = foreign ~from:c_lib
+    "python_not_op_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let or_expr_f_left = foreign ~from:c_lib
+    "python_or_expr_f_left"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let or_expr_f_right = foreign ~from:c_lib
+    "python_or_expr_f_right"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let or_op_f_left = foreign ~from:c_lib
+    "python_or_op_f_left"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let or_op_f_right = foreign ~from:c_lib
+    "python_or_op_f_right"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let power_f_left = foreign ~from:c_lib
+    "python_power_f_left"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let power_f_right = foreign ~from:c_lib
+    "python_power_f_right"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let set_comp_f_expr = foreign ~from:c_lib
+    "python_set_comp_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let set_comp_f_comprehension = foreign ~from:c_lib
+    "python_set_comp_f_comprehension"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let set_lit_f_exprs = foreign ~from:c_lib
+    "python_set_lit_f_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let slice_expr_f_first = foreign ~from:c_lib
+    "python_slice_expr_f_first"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let slice_expr_f_last = foreign ~from:c_lib
+    "python_slice_expr_f_last"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let ext_slice_expr_f_stride = foreign ~from:c_lib
+    "python_ext_slice_expr_f_stride"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let subscript_expr_f_prefix = foreign ~from:c_lib
+    "python_subscript_expr_f_prefix"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let subscript_expr_f_suffix = foreign ~from:c_lib
+    "python_subscript_expr_f_suffix"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let tuple_lit_f_exprs = foreign ~from:c_lib
+    "python_tuple_lit_f_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let xor_expr_f_left = foreign ~from:c_lib
+    "python_xor_expr_f_left"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let xor_expr_f_right = foreign ~from:c_lib
+    "python_xor_expr_f_right"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let yield_expr_f_exprs = foreign ~from:c_lib
+    "python_yield_expr_f_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let file_node_f_statements = foreign ~from:c_lib
+    "python_file_node_f_statements"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let kw_args_flag_p_as_bool = foreign ~from:c_lib
+    "python_kw_args_flag_p_as_bool"
+    (ptr EntityStruct.c_type
+    @-> ptr bool
+    @-> raisable int)
+
+  let params_f_single_params = foreign ~from:c_lib
+    "python_params_f_single_params"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let rel_name_f_dots = foreign ~from:c_lib
+    "python_rel_name_f_dots"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let rel_name_f_name = foreign ~from:c_lib
+    "python_rel_name_f_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let single_param_f_is_varargs = foreign ~from:c_lib
+    "python_single_param_f_is_varargs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let single_param_f_is_kwargs = foreign ~from:c_lib
+    "python_single_param_f_is_kwargs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let single_param_f_name = foreign ~from:c_lib
+    "python_single_param_f_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let single_param_f_default_value = foreign ~from:c_lib
+    "python_single_param_f_default_value"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let assert_stmt_f_test_expr = foreign ~from:c_lib
+    "python_assert_stmt_f_test_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let assert_stmt_f_msg = foreign ~from:c_lib
+    "python_assert_stmt_f_msg"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let assign_stmt_f_l_value = foreign ~from:c_lib
+    "python_assign_stmt_f_l_value"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let assign_stmt_f_r_values = foreign ~from:c_lib
+    "python_assign_stmt_f_r_values"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let aug_assign_stmt_f_l_value = foreign ~from:c_lib
+    "python_aug_assign_stmt_f_l_value"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let aug_assign_stmt_f_op = foreign ~from:c_lib
+    "python_aug_assign_stmt_f_op"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let aug_assign_stmt_f_r_value = foreign ~from:c_lib
+    "python_aug_assign_stmt_f_r_value"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let decorated_f_decorators = foreign ~from:c_lib
+    "python_decorated_f_decorators"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let decorated_f_defn = foreign ~from:c_lib
+    "python_decorated_f_defn"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let class_def_f_name = foreign ~from:c_lib
+    "python_class_def_f_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let class_def_f_bases = foreign ~from:c_lib
+    "python_class_def_f_bases"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let class_def_f_statements = foreign ~from:c_lib
+    "python_class_def_f_statements"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let func_def_f_name = foreign ~from:c_lib
+    "python_func_def_f_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let func_def_f_parameters = foreign ~from:c_lib
+    "python_func_def_f_parameters"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let func_def_f_body = foreign ~from:c_lib
+    "python_func_def_f_body"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let del_stmt_f_exprs = foreign ~from:c_lib
+    "python_del_stmt_f_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let elif_branch_f_cond_test = foreign ~from:c_lib
+    "python_elif_branch_f_cond_test"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let elif_branch_f_statements = foreign ~from:c_lib
+    "python_elif_branch_f_statements"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let exec_stmt_f_expr = foreign ~from:c_lib
+    "python_exec_stmt_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let exec_stmt_f_in_list = foreign ~from:c_lib
+    "python_exec_stmt_f_in_list"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let for_stmt_f_bindings = foreign ~from:c_lib
+    "python_for_stmt_f_bindings"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let for_stmt_f_expr = foreign ~from:c_lib
+    "python_for_stmt_f_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let for_stmt_f_statements = foreign ~from:c_lib
+    "python_for_stmt_f_statements"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let for_stmt_f_else_part = foreign ~from:c_lib
+    "python_for_stmt_f_else_part"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let global_stmt_f_names = foreign ~from:c_lib
+    "python_global_stmt_f_names"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let if_stmt_f_cond_test = foreign ~from:c_lib
+    "python_if_stmt_f_cond_test"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let if_stmt_f_statements = foreign ~from:c_lib
+    "python_if_stmt_f_statements"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let if_stmt_f_elif_branchs = foreign ~from:c_lib
+    "python_if_stmt_f_elif_branchs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let if_stmt_f_else_part = foreign ~from:c_lib
+    "python_if_stmt_f_else_part"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let import_from_f_rel_name = foreign ~from:c_lib
+    "python_import_from_f_rel_name"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let import_from_f_imported = foreign ~from:c_lib
+    "python_import_from_f_imported"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let import_name_f_imported_names = foreign ~from:c_lib
+    "python_import_name_f_imported_names"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let print_stmt_f_exprs = foreign ~from:c_lib
+    "python_print_stmt_f_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let raise_stmt_f_exprs = foreign ~from:c_lib
+    "python_raise_stmt_f_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let return_stmt_f_exprs = foreign ~from:c_lib
+    "python_return_stmt_f_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let stream_print_stmt_f_stream_expr = foreign ~from:c_lib
+    "python_stream_print_stmt_f_stream_expr"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let stream_print_stmt_f_exprs = foreign ~from:c_lib
+    "python_stream_print_stmt_f_exprs"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let try_stmt_f_statements = foreign ~from:c_lib
+    "python_try_stmt_f_statements"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let try_stmt_f_except_parts = foreign ~from:c_lib
+    "python_try_stmt_f_except_parts"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let try_stmt_f_else_part = foreign ~from:c_lib
+    "python_try_stmt_f_else_part"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let try_stmt_f_finally_part = foreign ~from:c_lib
+    "python_try_stmt_f_finally_part"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let while_stmt_f_cond_test = foreign ~from:c_lib
+    "python_while_stmt_f_cond_test"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let while_stmt_f_statements = foreign ~from:c_lib
+    "python_while_stmt_f_statements"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let while_stmt_f_else_part = foreign ~from:c_lib
+    "python_while_stmt_f_else_part"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let with_stmt_f_bindings = foreign ~from:c_lib
+    "python_with_stmt_f_bindings"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let with_stmt_f_statements = foreign ~from:c_lib
+    "python_with_stmt_f_statements"
+    (ptr EntityStruct.c_type
+    @-> ptr EntityStruct.c_type
+    @-> raisable int)
+
+  let var_args_flag_p_as_bool = foreign ~from:c_lib
+    "python_var_args_flag_p_as_bool"
+    (ptr EntityStruct.c_type
+    @-> ptr bool
+    @-> raisable int)
+
+
+end
+
+module rec PythonNodeType : sig
+  
+   
+  (**
+    * PythonNodeBaseListType.t
+    * VarArgsFlagType.t
+    * KwArgsFlagType.t
+    * StmtType.t
+    * DecoratorType.t
+    * FileNodeType.t
+    * ParamsType.t
+    * SingleParamType.t
+    * RelNameType.t
+    * ImportStarType.t
+    * AsNameNodeType.t
+    * ExprType.t
+    * ElsePartType.t
+    * ExceptPartType.t
+    * CompOpKindType.t
+    * OpType.t
+    * DictAssocType.t
+    * ArgType.t
+    * ComprehensionType.t
+    * CompIfType.t
+    * NLType.t
+    *)
+  type t = [
+    | `ArgAssoc
+        of ArgAssocType.fields
+    | `ArgGen
+        of ArgGenType.fields
+    | `KwArgs
+        of KwArgsType.fields
+    | `VarArgs
+        of VarArgsType.fields
+    | `AsNameNode
+        of AsNameNodeType.fields
+    | `CompIf
+        of CompIfType.fields
+    | `CompOpKindDiamond
+        of CompOpKindDiamondType.fields
+    | `CompOpKindEq
+        of CompOpKindEqType.fields
+    | `CompOpKindGt
+        of CompOpKindGtType.fields
+    | `CompOpKindGte
+        of CompOpKindGteType.fields
+    | `CompOpKindIn
+        of CompOpKindInType.fields
+    | `CompOpKindIs
+        of CompOpKindIsType.fields
+    | `CompOpKindIsnot
+        of CompOpKindIsnotType.fields
+    | `CompOpKindLt
+        of CompOpKindLtType.fields
+    | `CompOpKindLte
+        of CompOpKindLteType.fields
+    | `CompOpKindNoteq
+        of CompOpKindNoteqType.fields
+    | `CompOpKindNotin
+        of CompOpKindNotinType.fields
+    | `CompFor
+        of CompForType.fields
+    | `CompForL
+        of CompForLType.fields
+    | `Decorator
+        of DecoratorType.fields
+    | `DictAssoc
+        of DictAssocType.fields
+    | `ElsePart
+        of ElsePartType.fields
+    | `ExceptPart
+        of ExceptPartType.fields
+    | `AndExpr
+        of AndExprType.fields
+    | `AndOp
+        of AndOpType.fields
+    | `ArithExpr
+        of ArithExprType.fields
+    | `ShiftExpr
+        of ShiftExprType.fields
+    | `Term
+        of TermType.fields
+    | `CallExpr
+        of CallExprType.fields
+    | `CompOp
+        of CompOpType.fields
+    | `ConcatStringLit
+        of ConcatStringLitType.fields
+    | `DictComp
+        of DictCompType.fields
+    | `DictLit
+        of DictLitType.fields
+    | `Dot
+        of DotType.fields
+    | `EllipsisExpr
+        of EllipsisExprType.fields
+    | `Factor
+        of FactorType.fields
+    | `IfExpr
+        of IfExprType.fields
+    | `InlineEval
+        of InlineEvalType.fields
+    | `LambdaDef
+        of LambdaDefType.fields
+    | `ListComp
+        of ListCompType.fields
+    | `ListGen
+        of ListGenType.fields
+    | `ListLit
+        of ListLitType.fields
+    | `DottedName
+        of DottedNameType.fields
+    | `Id
+        of IdType.fields
+    | `NotOp
+        of NotOpType.fields
+    | `NumberLit
+        of NumberLitType.fields
+    | `OrExpr
+        of OrExprType.fields
+    | `OrOp
+        of OrOpType.fields
+    | `Power
+        of PowerType.fields
+    | `SetComp
+        of SetCompType.fields
+    | `SetLit
+        of SetLitType.fields
+    | `SliceExpr
+        of SliceExprType.fields
+    | `ExtSliceExpr
+        of ExtSliceExprType.fields
+    | `StringLit
+        of StringLitType.fields
+    | `SubscriptExpr
+        of SubscriptExprType.fields
+    | `TupleLit
+        of TupleLitType.fields
+    | `XorExpr
+        of XorExprType.fields
+    | `YieldExpr
+        of YieldExprType.fields
+    | `FileNode
+        of FileNodeType.fields
+    | `ImportStar
+        of ImportStarType.fields
+    | `KwArgsFlagAbsent
+        of KwArgsFlagAbsentType.fields
+    | `KwArgsFlagPresent
+        of KwArgsFlagPresentType.fields
+    | `NL
+        of NLType.fields
+    | `Op
+        of OpType.fields
+    | `Params
+        of ParamsType.fields
+    | `ArgList
+        of ArgListType.fields
+    | `AsNameNodeList
+        of AsNameNodeListType.fields
+    | `DecoratorList
+        of DecoratorListType.fields
+    | `DictAssocList
+        of DictAssocListType.fields
+    | `DotList
+        of DotListType.fields
+    | `ElifBranchList
+        of ElifBranchListType.fields
+    | `ExceptPartList
+        of ExceptPartListType.fields
+    | `ExprList
+        of ExprListType.fields
+    | `IdList
+        of IdListType.fields
+    | `NLList
+        of NLListType.fields
+    | `PythonNodeList
+        of PythonNodeListType.fields
+    | `SingleParamList
+        of SingleParamListType.fields
+    | `StringLitList
+        of StringLitListType.fields
+    | `RelName
+        of RelNameType.fields
+    | `SingleParam
+        of SingleParamType.fields
+    | `AssertStmt
+        of AssertStmtType.fields
+    | `AssignStmt
+        of AssignStmtType.fields
+    | `AugAssignStmt
+        of AugAssignStmtType.fields
+    | `BreakStmt
+        of BreakStmtType.fields
+    | `ContinueStmt
+        of ContinueStmtType.fields
+    | `Decorated
+        of DecoratedType.fields
+    | `ClassDef
+        of ClassDefType.fields
+    | `FuncDef
+        of FuncDefType.fields
+    | `DelStmt
+        of DelStmtType.fields
+    | `ElifBranch
+        of ElifBranchType.fields
+    | `ExecStmt
+        of ExecStmtType.fields
+    | `ForStmt
+        of ForStmtType.fields
+    | `GlobalStmt
+        of GlobalStmtType.fields
+    | `IfStmt
+        of IfStmtType.fields
+    | `ImportFrom
+        of ImportFromType.fields
+    | `ImportName
+        of ImportNameType.fields
+    | `PassStmt
+        of PassStmtType.fields
+    | `PrintStmt
+        of PrintStmtType.fields
+    | `RaiseStmt
+        of RaiseStmtType.fields
+    | `ReturnStmt
+        of ReturnStmtType.fields
+    | `StreamPrintStmt
+        of StreamPrintStmtType.fields
+    | `TryStmt
+        of TryStmtType.fields
+    | `WhileStmt
+        of WhileStmtType.fields
+    | `WithStmt
+        of WithStmtType.fields
+    | `VarArgsFlagAbsent
+        of VarArgsFlagAbsentType.fields
+    | `VarArgsFlagPresent
+        of VarArgsFlagPresentType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+  val unwrap : [< t ] -> EntityStruct.t structure
+
+end = struct
+  
+   
+  (**
+    * PythonNodeBaseListType.t
+    * VarArgsFlagType.t
+    * KwArgsFlagType.t
+    * StmtType.t
+    * DecoratorType.t
+    * FileNodeType.t
+    * ParamsType.t
+    * SingleParamType.t
+    * RelNameType.t
+    * ImportStarType.t
+    * AsNameNodeType.t
+    * ExprType.t
+    * ElsePartType.t
+    * ExceptPartType.t
+    * CompOpKindType.t
+    * OpType.t
+    * DictAssocType.t
+    * ArgType.t
+    * ComprehensionType.t
+    * CompIfType.t
+    * NLType.t
+    *)
+  type t = [
+    | `ArgAssoc
+        of ArgAssocType.fields
+    | `ArgGen
+        of ArgGenType.fields
+    | `KwArgs
+        of KwArgsType.fields
+    | `VarArgs
+        of VarArgsType.fields
+    | `AsNameNode
+        of AsNameNodeType.fields
+    | `CompIf
+        of CompIfType.fields
+    | `CompOpKindDiamond
+        of CompOpKindDiamondType.fields
+    | `CompOpKindEq
+        of CompOpKindEqType.fields
+    | `CompOpKindGt
+        of CompOpKindGtType.fields
+    | `CompOpKindGte
+        of CompOpKindGteType.fields
+    | `CompOpKindIn
+        of CompOpKindInType.fields
+    | `CompOpKindIs
+        of CompOpKindIsType.fields
+    | `CompOpKindIsnot
+        of CompOpKindIsnotType.fields
+    | `CompOpKindLt
+        of CompOpKindLtType.fields
+    | `CompOpKindLte
+        of CompOpKindLteType.fields
+    | `CompOpKindNoteq
+        of CompOpKindNoteqType.fields
+    | `CompOpKindNotin
+        of CompOpKindNotinType.fields
+    | `CompFor
+        of CompForType.fields
+    | `CompForL
+        of CompForLType.fields
+    | `Decorator
+        of DecoratorType.fields
+    | `DictAssoc
+        of DictAssocType.fields
+    | `ElsePart
+        of ElsePartType.fields
+    | `ExceptPart
+        of ExceptPartType.fields
+    | `AndExpr
+        of AndExprType.fields
+    | `AndOp
+        of AndOpType.fields
+    | `ArithExpr
+        of ArithExprType.fields
+    | `ShiftExpr
+        of ShiftExprType.fields
+    | `Term
+        of TermType.fields
+    | `CallExpr
+        of CallExprType.fields
+    | `CompOp
+        of CompOpType.fields
+    | `ConcatStringLit
+        of ConcatStringLitType.fields
+    | `DictComp
+        of DictCompType.fields
+    | `DictLit
+        of DictLitType.fields
+    | `Dot
+        of DotType.fields
+    | `EllipsisExpr
+        of EllipsisExprType.fields
+    | `Factor
+        of FactorType.fields
+    | `IfExpr
+        of IfExprType.fields
+    | `InlineEval
+        of InlineEvalType.fields
+    | `LambdaDef
+        of LambdaDefType.fields
+    | `ListComp
+        of ListCompType.fields
+    | `ListGen
+        of ListGenType.fields
+    | `ListLit
+        of ListLitType.fields
+    | `DottedName
+        of DottedNameType.fields
+    | `Id
+        of IdType.fields
+    | `NotOp
+        of NotOpType.fields
+    | `NumberLit
+        of NumberLitType.fields
+    | `OrExpr
+        of OrExprType.fields
+    | `OrOp
+        of OrOpType.fields
+    | `Power
+        of PowerType.fields
+    | `SetComp
+        of SetCompType.fields
+    | `SetLit
+        of SetLitType.fields
+    | `SliceExpr
+        of SliceExprType.fields
+    | `ExtSliceExpr
+        of ExtSliceExprType.fields
+    | `StringLit
+        of StringLitType.fields
+    | `SubscriptExpr
+        of SubscriptExprType.fields
+    | `TupleLit
+        of TupleLitType.fields
+    | `XorExpr
+        of XorExprType.fields
+    | `YieldExpr
+        of YieldExprType.fields
+    | `FileNode
+        of FileNodeType.fields
+    | `ImportStar
+        of ImportStarType.fields
+    | `KwArgsFlagAbsent
+        of KwArgsFlagAbsentType.fields
+    | `KwArgsFlagPresent
+        of KwArgsFlagPresentType.fields
+    | `NL
+        of NLType.fields
+    | `Op
+        of OpType.fields
+    | `Params
+        of ParamsType.fields
+    | `ArgList
+        of ArgListType.fields
+    | `AsNameNodeList
+        of AsNameNodeListType.fields
+    | `DecoratorList
+        of DecoratorListType.fields
+    | `DictAssocList
+        of DictAssocListType.fields
+    | `DotList
+        of DotListType.fields
+    | `ElifBranchList
+        of ElifBranchListType.fields
+    | `ExceptPartList
+        of ExceptPartListType.fields
+    | `ExprList
+        of ExprListType.fields
+    | `IdList
+        of IdListType.fields
+    | `NLList
+        of NLListType.fields
+    | `PythonNodeList
+        of PythonNodeListType.fields
+    | `SingleParamList
+        of SingleParamListType.fields
+    | `StringLitList
+        of StringLitListType.fields
+    | `RelName
+        of RelNameType.fields
+    | `SingleParam
+        of SingleParamType.fields
+    | `AssertStmt
+        of AssertStmtType.fields
+    | `AssignStmt
+        of AssignStmtType.fields
+    | `AugAssignStmt
+        of AugAssignStmtType.fields
+    | `BreakStmt
+        of BreakStmtType.fields
+    | `ContinueStmt
+        of ContinueStmtType.fields
+    | `Decorated
+        of DecoratedType.fields
+    | `ClassDef
+        of ClassDefType.fields
+    | `FuncDef
+        of FuncDefType.fields
+    | `DelStmt
+        of DelStmtType.fields
+    | `ElifBranch
+        of ElifBranchType.fields
+    | `ExecStmt
+        of ExecStmtType.fields
+    | `ForStmt
+        of ForStmtType.fields
+    | `GlobalStmt
+        of GlobalStmtType.fields
+    | `IfStmt
+        of IfStmtType.fields
+    | `ImportFrom
+        of ImportFromType.fields
+    | `ImportName
+        of ImportNameType.fields
+    | `PassStmt
+        of PassStmtType.fields
+    | `PrintStmt
+        of PrintStmtType.fields
+    | `RaiseStmt
+        of RaiseStmtType.fields
+    | `ReturnStmt
+        of ReturnStmtType.fields
+    | `StreamPrintStmt
+        of StreamPrintStmtType.fields
+    | `TryStmt
+        of TryStmtType.fields
+    | `WhileStmt
+        of WhileStmtType.fields
+    | `WithStmt
+        of WithStmtType.fields
+    | `VarArgsFlagAbsent
+        of VarArgsFlagAbsentType.fields
+    | `VarArgsFlagPresent
+        of VarArgsFlagPresentType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* Top level wrap function that dispatch to wrap function of concrete types
+      depending on the node kind *)
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      let kind = CFunctions.node_kind (addr c_value) in
+      match kind with
+      | 1 ->
+          (ArgAssocType.wrap context (c_value)
+           :> t)
+      | 2 ->
+          (ArgGenType.wrap context (c_value)
+           :> t)
+      | 3 ->
+          (KwArgsType.wrap context (c_value)
+           :> t)
+      | 4 ->
+          (VarArgsType.wrap context (c_value)
+           :> t)
+      | 5 ->
+          (AsNameNodeType.wrap context (c_value)
+           :> t)
+      | 6 ->
+          (CompIfType.wrap context (c_value)
+           :> t)
+      | 7 ->
+          (CompOpKindDiamondType.wrap context (c_value)
+           :> t)
+      | 8 ->
+          (CompOpKindEqType.wrap context (c_value)
+           :> t)
+      | 9 ->
+          (CompOpKindGtType.wrap context (c_value)
+           :> t)
+      | 10 ->
+          (CompOpKindGteType.wrap context (c_value)
+           :> t)
+      | 11 ->
+          (CompOpKindInType.wrap context (c_value)
+           :> t)
+      | 12 ->
+          (CompOpKindIsType.wrap context (c_value)
+           :> t)
+      | 13 ->
+          (CompOpKindIsnotType.wrap context (c_value)
+           :> t)
+      | 14 ->
+          (CompOpKindLtType.wrap context (c_value)
+           :> t)
+      | 15 ->
+          (CompOpKindLteType.wrap context (c_value)
+           :> t)
+      | 16 ->
+          (CompOpKindNoteqType.wrap context (c_value)
+           :> t)
+      | 17 ->
+          (CompOpKindNotinType.wrap context (c_value)
+           :> t)
+      | 18 ->
+          (CompForType.wrap context (c_value)
+           :> t)
+      | 19 ->
+          (CompForLType.wrap context (c_value)
+           :> t)
+      | 20 ->
+          (DecoratorType.wrap context (c_value)
+           :> t)
+      | 21 ->
+          (DictAssocType.wrap context (c_value)
+           :> t)
+      | 22 ->
+          (ElsePartType.wrap context (c_value)
+           :> t)
+      | 23 ->
+          (ExceptPartType.wrap context (c_value)
+           :> t)
+      | 24 ->
+          (AndExprType.wrap context (c_value)
+           :> t)
+      | 25 ->
+          (AndOpType.wrap context (c_value)
+           :> t)
+      | 26 ->
+          (ArithExprType.wrap context (c_value)
+           :> t)
+      | 27 ->
+          (ShiftExprType.wrap context (c_value)
+           :> t)
+      | 28 ->
+          (TermType.wrap context (c_value)
+           :> t)
+      | 29 ->
+          (CallExprType.wrap context (c_value)
+           :> t)
+      | 30 ->
+          (CompOpType.wrap context (c_value)
+           :> t)
+      | 31 ->
+          (ConcatStringLitType.wrap context (c_value)
+           :> t)
+      | 32 ->
+          (DictCompType.wrap context (c_value)
+           :> t)
+      | 33 ->
+          (DictLitType.wrap context (c_value)
+           :> t)
+      | 34 ->
+          (DotType.wrap context (c_value)
+           :> t)
+      | 35 ->
+          (EllipsisExprType.wrap context (c_value)
+           :> t)
+      | 36 ->
+          (FactorType.wrap context (c_value)
+           :> t)
+      | 37 ->
+          (IfExprType.wrap context (c_value)
+           :> t)
+      | 38 ->
+          (InlineEvalType.wrap context (c_value)
+           :> t)
+      | 39 ->
+          (LambdaDefType.wrap context (c_value)
+           :> t)
+      | 40 ->
+          (ListCompType.wrap context (c_value)
+           :> t)
+      | 41 ->
+          (ListGenType.wrap context (c_value)
+           :> t)
+      | 42 ->
+          (ListLitType.wrap context (c_value)
+           :> t)
+      | 43 ->
+          (DottedNameType.wrap context (c_value)
+           :> t)
+      | 44 ->
+          (IdType.wrap context (c_value)
+           :> t)
+      | 45 ->
+          (NotOpType.wrap context (c_value)
+           :> t)
+      | 46 ->
+          (NumberLitType.wrap context (c_value)
+           :> t)
+      | 47 ->
+          (OrExprType.wrap context (c_value)
+           :> t)
+      | 48 ->
+          (OrOpType.wrap context (c_value)
+           :> t)
+      | 49 ->
+          (PowerType.wrap context (c_value)
+           :> t)
+      | 50 ->
+          (SetCompType.wrap context (c_value)
+           :> t)
+      | 51 ->
+          (SetLitType.wrap context (c_value)
+           :> t)
+      | 52 ->
+          (SliceExprType.wrap context (c_value)
+           :> t)
+      | 53 ->
+          (ExtSliceExprType.wrap context (c_value)
+           :> t)
+      | 54 ->
+          (StringLitType.wrap context (c_value)
+           :> t)
+      | 55 ->
+          (SubscriptExprType.wrap context (c_value)
+           :> t)
+      | 56 ->
+          (TupleLitType.wrap context (c_value)
+           :> t)
+      | 57 ->
+          (XorExprType.wrap context (c_value)
+           :> t)
+      | 58 ->
+          (YieldExprType.wrap context (c_value)
+           :> t)
+      | 59 ->
+          (FileNodeType.wrap context (c_value)
+           :> t)
+      | 60 ->
+          (ImportStarType.wrap context (c_value)
+           :> t)
+      | 61 ->
+          (KwArgsFlagAbsentType.wrap context (c_value)
+           :> t)
+      | 62 ->
+          (KwArgsFlagPresentType.wrap context (c_value)
+           :> t)
+      | 63 ->
+          (NLType.wrap context (c_value)
+           :> t)
+      | 64 ->
+          (OpType.wrap context (c_value)
+           :> t)
+      | 65 ->
+          (ParamsType.wrap context (c_value)
+           :> t)
+      | 66 ->
+          (ArgListType.wrap context (c_value)
+           :> t)
+      | 67 ->
+          (AsNameNodeListType.wrap context (c_value)
+           :> t)
+      | 68 ->
+          (DecoratorListType.wrap context (c_value)
+           :> t)
+      | 69 ->
+          (DictAssocListType.wrap context (c_value)
+           :> t)
+      | 70 ->
+          (DotListType.wrap context (c_value)
+           :> t)
+      | 71 ->
+          (ElifBranchListType.wrap context (c_value)
+           :> t)
+      | 72 ->
+          (ExceptPartListType.wrap context (c_value)
+           :> t)
+      | 73 ->
+          (ExprListType.wrap context (c_value)
+           :> t)
+      | 74 ->
+          (IdListType.wrap context (c_value)
+           :> t)
+      | 75 ->
+          (NLListType.wrap context (c_value)
+           :> t)
+      | 76 ->
+          (PythonNodeListType.wrap context (c_value)
+           :> t)
+      | 77 ->
+          (SingleParamListType.wrap context (c_value)
+           :> t)
+      | 78 ->
+          (StringLitListType.wrap context (c_value)
+           :> t)
+      | 79 ->
+          (RelNameType.wrap context (c_value)
+           :> t)
+      | 80 ->
+          (SingleParamType.wrap context (c_value)
+           :> t)
+      | 81 ->
+          (AssertStmtType.wrap context (c_value)
+           :> t)
+      | 82 ->
+          (AssignStmtType.wrap context (c_value)
+           :> t)
+      | 83 ->
+          (AugAssignStmtType.wrap context (c_value)
+           :> t)
+      | 84 ->
+          (BreakStmtType.wrap context (c_value)
+           :> t)
+      | 85 ->
+          (ContinueStmtType.wrap context (c_value)
+           :> t)
+      | 86 ->
+          (DecoratedType.wrap context (c_value)
+           :> t)
+      | 87 ->
+          (ClassDefType.wrap context (c_value)
+           :> t)
+      | 88 ->
+          (FuncDefType.wrap context (c_value)
+           :> t)
+      | 89 ->
+          (DelStmtType.wrap context (c_value)
+           :> t)
+      | 90 ->
+          (ElifBranchType.wrap context (c_value)
+           :> t)
+      | 91 ->
+          (ExecStmtType.wrap context (c_value)
+           :> t)
+      | 92 ->
+          (ForStmtType.wrap context (c_value)
+           :> t)
+      | 93 ->
+          (GlobalStmtType.wrap context (c_value)
+           :> t)
+      | 94 ->
+          (IfStmtType.wrap context (c_value)
+           :> t)
+      | 95 ->
+          (ImportFromType.wrap context (c_value)
+           :> t)
+      | 96 ->
+          (ImportNameType.wrap context (c_value)
+           :> t)
+      | 97 ->
+          (PassStmtType.wrap context (c_value)
+           :> t)
+      | 98 ->
+          (PrintStmtType.wrap context (c_value)
+           :> t)
+      | 99 ->
+          (RaiseStmtType.wrap context (c_value)
+           :> t)
+      | 100 ->
+          (ReturnStmtType.wrap context (c_value)
+           :> t)
+      | 101 ->
+          (StreamPrintStmtType.wrap context (c_value)
+           :> t)
+      | 102 ->
+          (TryStmtType.wrap context (c_value)
+           :> t)
+      | 103 ->
+          (WhileStmtType.wrap context (c_value)
+           :> t)
+      | 104 ->
+          (WithStmtType.wrap context (c_value)
+           :> t)
+      | 105 ->
+          (VarArgsFlagAbsentType.wrap context (c_value)
+           :> t)
+      | 106 ->
+          (VarArgsFlagPresentType.wrap context (c_value)
+           :> t)
+      | _ -> assert false
+
+  let unwrap value =
+    (* This is the unique unwrap function that can be called for any node. *)
+    match (value :> PythonNodeType.t) with
+    | `ArgAssoc fields -> fields.c_value
+    | `ArgGen fields -> fields.c_value
+    | `KwArgs fields -> fields.c_value
+    | `VarArgs fields -> fields.c_value
+    | `AsNameNode fields -> fields.c_value
+    | `CompIf fields -> fields.c_value
+    | `CompOpKindDiamond fields -> fields.c_value
+    | `CompOpKindEq fields -> fields.c_value
+    | `CompOpKindGt fields -> fields.c_value
+    | `CompOpKindGte fields -> fields.c_value
+    | `CompOpKindIn fields -> fields.c_value
+    | `CompOpKindIs fields -> fields.c_value
+    | `CompOpKindIsnot fields -> fields.c_value
+    | `CompOpKindLt fields -> fields.c_value
+    | `CompOpKindLte fields -> fields.c_value
+    | `CompOpKindNoteq fields -> fields.c_value
+    | `CompOpKindNotin fields -> fields.c_value
+    | `CompFor fields -> fields.c_value
+    | `CompForL fields -> fields.c_value
+    | `Decorator fields -> fields.c_value
+    | `DictAssoc fields -> fields.c_value
+    | `ElsePart fields -> fields.c_value
+    | `ExceptPart fields -> fields.c_value
+    | `AndExpr fields -> fields.c_value
+    | `AndOp fields -> fields.c_value
+    | `ArithExpr fields -> fields.c_value
+    | `ShiftExpr fields -> fields.c_value
+    | `Term fields -> fields.c_value
+    | `CallExpr fields -> fields.c_value
+    | `CompOp fields -> fields.c_value
+    | `ConcatStringLit fields -> fields.c_value
+    | `DictComp fields -> fields.c_value
+    | `DictLit fields -> fields.c_value
+    | `Dot fields -> fields.c_value
+    | `EllipsisExpr fields -> fields.c_value
+    | `Factor fields -> fields.c_value
+    | `IfExpr fields -> fields.c_value
+    | `InlineEval fields -> fields.c_value
+    | `LambdaDef fields -> fields.c_value
+    | `ListComp fields -> fields.c_value
+    | `ListGen fields -> fields.c_value
+    | `ListLit fields -> fields.c_value
+    | `DottedName fields -> fields.c_value
+    | `Id fields -> fields.c_value
+    | `NotOp fields -> fields.c_value
+    | `NumberLit fields -> fields.c_value
+    | `OrExpr fields -> fields.c_value
+    | `OrOp fields -> fields.c_value
+    | `Power fields -> fields.c_value
+    | `SetComp fields -> fields.c_value
+    | `SetLit fields -> fields.c_value
+    | `SliceExpr fields -> fields.c_value
+    | `ExtSliceExpr fields -> fields.c_value
+    | `StringLit fields -> fields.c_value
+    | `SubscriptExpr fields -> fields.c_value
+    | `TupleLit fields -> fields.c_value
+    | `XorExpr fields -> fields.c_value
+    | `YieldExpr fields -> fields.c_value
+    | `FileNode fields -> fields.c_value
+    | `ImportStar fields -> fields.c_value
+    | `KwArgsFlagAbsent fields -> fields.c_value
+    | `KwArgsFlagPresent fields -> fields.c_value
+    | `NL fields -> fields.c_value
+    | `Op fields -> fields.c_value
+    | `Params fields -> fields.c_value
+    | `ArgList fields -> fields.c_value
+    | `AsNameNodeList fields -> fields.c_value
+    | `DecoratorList fields -> fields.c_value
+    | `DictAssocList fields -> fields.c_value
+    | `DotList fields -> fields.c_value
+    | `ElifBranchList fields -> fields.c_value
+    | `ExceptPartList fields -> fields.c_value
+    | `ExprList fields -> fields.c_value
+    | `IdList fields -> fields.c_value
+    | `NLList fields -> fields.c_value
+    | `PythonNodeList fields -> fields.c_value
+    | `SingleParamList fields -> fields.c_value
+    | `StringLitList fields -> fields.c_value
+    | `RelName fields -> fields.c_value
+    | `SingleParam fields -> fields.c_value
+    | `AssertStmt fields -> fields.c_value
+    | `AssignStmt fields -> fields.c_value
+    | `AugAssignStmt fields -> fields.c_value
+    | `BreakStmt fields -> fields.c_value
+    | `ContinueStmt fields -> fields.c_value
+    | `Decorated fields -> fields.c_value
+    | `ClassDef fields -> fields.c_value
+    | `FuncDef fields -> fields.c_value
+    | `DelStmt fields -> fields.c_value
+    | `ElifBranch fields -> fields.c_value
+    | `ExecStmt fields -> fields.c_value
+    | `ForStmt fields -> fields.c_value
+    | `GlobalStmt fields -> fields.c_value
+    | `IfStmt fields -> fields.c_value
+    | `ImportFrom fields -> fields.c_value
+    | `ImportName fields -> fields.c_value
+    | `PassStmt fields -> fields.c_value
+    | `PrintStmt fields -> fields.c_value
+    | `RaiseStmt fields -> fields.c_value
+    | `ReturnStmt fields -> fields.c_value
+    | `StreamPrintStmt fields -> fields.c_value
+    | `TryStmt fields -> fields.c_value
+    | `WhileStmt fields -> fields.c_value
+    | `WithStmt fields -> fields.c_value
+    | `VarArgsFlagAbsent fields -> fields.c_value
+    | `VarArgsFlagPresent fields -> fields.c_value
+
+end
+
+      
+and ArgType : sig
+   
+  
+   
+  type t = [
+    | `ArgAssoc
+        of ArgAssocType.fields
+    | `ArgGen
+        of ArgGenType.fields
+    | `KwArgs
+        of KwArgsType.fields
+    | `VarArgs
+        of VarArgsType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ArgAssoc
+        of ArgAssocType.fields
+    | `ArgGen
+        of ArgGenType.fields
+    | `KwArgs
+        of KwArgsType.fields
+    | `VarArgs
+        of VarArgsType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match PythonNodeType.wrap context (c_value) with
+      | `ArgAssoc _
+      | `ArgGen _
+      | `KwArgs _
+      | `VarArgs _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and ArgAssocType : sig
+   
+  
+   
+  type t = [
+    | `ArgAssoc
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ArgAssoc
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.arg_assoc_f_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprType.wrap context (field_c_value))
+      in
+         
+
+      match node with
+            
+      | Some `AndExpr _
+      | Some `AndOp _
+      | Some `ArithExpr _
+      | Some `CallExpr _
+      | Some `CompOp _
+      | Some `ConcatStringLit _
+      | Some `DictComp _
+      | Some `DictLit _
+      | Some `DottedName _
+      | Some `Factor _
+      | Some `Id _
+      | Some `IfExpr _
+      | Some `InlineEval _
+      | Some `LambdaDef _
+      | Some `ListComp _
+      | Some `ListGen _
+      | Some `ListLit _
+      | Some `NotOp _
+      | Some `NumberLit _
+      | Some `OrExpr _
+      | Some `OrOp _
+      | Some `Power _
+      | Some `SetComp _
+      | Some `SetLit _
+      | Some `ShiftExpr _
+      | Some `StringLit _
+      | Some `SubscriptExpr _
+      | Some `Term _
+      | Some `TupleLit _
+      | Some `XorExpr _
+      | Some `YieldExpr _
+      | None as e -> e
+      | _ -> assert false
+    in
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.arg_assoc_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ArgAssoc {
+        f_name
+          = Lazy.from_fun f_name ;
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ArgGenType : sig
+   
+  
+   
+  type t = [
+    | `ArgGen
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ArgGen
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.arg_gen_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_comprehension () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.arg_gen_f_comprehension
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         CompForType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ArgGen {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        f_comprehension
+          = Lazy.from_fun f_comprehension ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and KwArgsType : sig
+   
+  
+   
+  type t = [
+    | `KwArgs
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `KwArgs
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.kw_args_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `KwArgs {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and VarArgsType : sig
+   
+  
+   
+  type t = [
+    | `VarArgs
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `VarArgs
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.var_args_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `VarArgs {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and AsNameNodeType : sig
+   
+  
+   
+  type t = [
+    | `AsNameNode
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_imported: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_as_name: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `AsNameNode
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_imported: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_as_name: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_imported () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.as_name_node_f_imported
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_as_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.as_name_node_f_as_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprType.wrap context (field_c_value))
+      in
+         
+
+      match node with
+            
+      | Some `AndExpr _
+      | Some `AndOp _
+      | Some `ArithExpr _
+      | Some `CallExpr _
+      | Some `CompOp _
+      | Some `ConcatStringLit _
+      | Some `DictComp _
+      | Some `DictLit _
+      | Some `DottedName _
+      | Some `Factor _
+      | Some `Id _
+      | Some `IfExpr _
+      | Some `InlineEval _
+      | Some `LambdaDef _
+      | Some `ListComp _
+      | Some `ListGen _
+      | Some `ListLit _
+      | Some `NotOp _
+      | Some `NumberLit _
+      | Some `OrExpr _
+      | Some `OrOp _
+      | Some `Power _
+      | Some `SetComp _
+      | Some `SetLit _
+      | Some `ShiftExpr _
+      | Some `StringLit _
+      | Some `SubscriptExpr _
+      | Some `Term _
+      | Some `TupleLit _
+      | Some `XorExpr _
+      | Some `YieldExpr _
+      | None as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `AsNameNode {
+        f_imported
+          = Lazy.from_fun f_imported ;
+        f_as_name
+          = Lazy.from_fun f_as_name ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CompIfType : sig
+   
+  
+   
+  type t = [
+    | `CompIf
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comp: [
+      | `CompFor
+          of CompForType.fields
+      | `CompForL
+          of CompForLType.fields
+      | `CompIf
+          of fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompIf
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comp: [
+      | `CompFor
+          of CompForType.fields
+      | `CompForL
+          of CompForLType.fields
+      | `CompIf
+          of fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_test () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.comp_if_f_test
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_comp () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.comp_if_f_comp
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (PythonNodeType.wrap context (field_c_value))
+      in
+         
+
+      match node with
+            
+      | Some `CompFor _
+      | Some `CompForL _
+      | Some `CompIf _
+      | None as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CompIf {
+        f_test
+          = Lazy.from_fun f_test ;
+        f_comp
+          = Lazy.from_fun f_comp ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CompOpKindType : sig
+   
+  
+   
+  type t = [
+    | `CompOpKindDiamond
+        of CompOpKindDiamondType.fields
+    | `CompOpKindEq
+        of CompOpKindEqType.fields
+    | `CompOpKindGt
+        of CompOpKindGtType.fields
+    | `CompOpKindGte
+        of CompOpKindGteType.fields
+    | `CompOpKindIn
+        of CompOpKindInType.fields
+    | `CompOpKindIs
+        of CompOpKindIsType.fields
+    | `CompOpKindIsnot
+        of CompOpKindIsnotType.fields
+    | `CompOpKindLt
+        of CompOpKindLtType.fields
+    | `CompOpKindLte
+        of CompOpKindLteType.fields
+    | `CompOpKindNoteq
+        of CompOpKindNoteqType.fields
+    | `CompOpKindNotin
+        of CompOpKindNotinType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompOpKindDiamond
+        of CompOpKindDiamondType.fields
+    | `CompOpKindEq
+        of CompOpKindEqType.fields
+    | `CompOpKindGt
+        of CompOpKindGtType.fields
+    | `CompOpKindGte
+        of CompOpKindGteType.fields
+    | `CompOpKindIn
+        of CompOpKindInType.fields
+    | `CompOpKindIs
+        of CompOpKindIsType.fields
+    | `CompOpKindIsnot
+        of CompOpKindIsnotType.fields
+    | `CompOpKindLt
+        of CompOpKindLtType.fields
+    | `CompOpKindLte
+        of CompOpKindLteType.fields
+    | `CompOpKindNoteq
+        of CompOpKindNoteqType.fields
+    | `CompOpKindNotin
+        of CompOpKindNotinType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match PythonNodeType.wrap context (c_value) with
+      | `CompOpKindDiamond _
+      | `CompOpKindEq _
+      | `CompOpKindGt _
+      | `CompOpKindGte _
+      | `CompOpKindIn _
+      | `CompOpKindIs _
+      | `CompOpKindIsnot _
+      | `CompOpKindLt _
+      | `CompOpKindLte _
+      | `CompOpKindNoteq _
+      | `CompOpKindNotin _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and CompOpKindDiamondType : sig
+   
+  
+   
+  type t = [
+    | `CompOpKindDiamond
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompOpKindDiamond
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CompOpKindDiamond {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CompOpKindEqType : sig
+   
+  
+   
+  type t = [
+    | `CompOpKindEq
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompOpKindEq
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CompOpKindEq {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CompOpKindGtType : sig
+   
+  
+   
+  type t = [
+    | `CompOpKindGt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompOpKindGt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CompOpKindGt {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CompOpKindGteType : sig
+   
+  
+   
+  type t = [
+    | `CompOpKindGte
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompOpKindGte
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CompOpKindGte {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CompOpKindInType : sig
+   
+  
+   
+  type t = [
+    | `CompOpKindIn
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompOpKindIn
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CompOpKindIn {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CompOpKindIsType : sig
+   
+  
+   
+  type t = [
+    | `CompOpKindIs
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompOpKindIs
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CompOpKindIs {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CompOpKindIsnotType : sig
+   
+  
+   
+  type t = [
+    | `CompOpKindIsnot
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompOpKindIsnot
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CompOpKindIsnot {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CompOpKindLtType : sig
+   
+  
+   
+  type t = [
+    | `CompOpKindLt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompOpKindLt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CompOpKindLt {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CompOpKindLteType : sig
+   
+  
+   
+  type t = [
+    | `CompOpKindLte
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompOpKindLte
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CompOpKindLte {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CompOpKindNoteqType : sig
+   
+  
+   
+  type t = [
+    | `CompOpKindNoteq
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompOpKindNoteq
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CompOpKindNoteq {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CompOpKindNotinType : sig
+   
+  
+   
+  type t = [
+    | `CompOpKindNotin
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompOpKindNotin
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CompOpKindNotin {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ComprehensionType : sig
+   
+  
+   
+  type t = [
+    | `CompFor
+        of CompForType.fields
+    | `CompForL
+        of CompForLType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompFor
+        of CompForType.fields
+    | `CompForL
+        of CompForLType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match PythonNodeType.wrap context (c_value) with
+      | `CompFor _
+      | `CompForL _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and CompForType : sig
+   
+  
+   
+  type t = [
+    | `CompFor
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+         
+    f_target: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comp: [
+      | `CompFor
+          of fields
+      | `CompIf
+          of CompIfType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompFor
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+         
+    f_target: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comp: [
+      | `CompFor
+          of fields
+      | `CompIf
+          of CompIfType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.comp_for_f_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_target () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.comp_for_f_target
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_comp () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.comp_for_f_comp
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (PythonNodeType.wrap context (field_c_value))
+      in
+         
+
+      match node with
+            
+      | Some `CompFor _
+      | Some `CompIf _
+      | None as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CompFor {
+        f_exprs
+          = Lazy.from_fun f_exprs ;
+        f_target
+          = Lazy.from_fun f_target ;
+        f_comp
+          = Lazy.from_fun f_comp ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CompForLType : sig
+   
+  
+   
+  type t = [
+    | `CompForL
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+         
+    f_target: ExprListType.t
+    Lazy.t;
+         
+    f_comp: [
+      | `CompForL
+          of fields
+      | `CompIf
+          of CompIfType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompForL
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+         
+    f_target: ExprListType.t
+    Lazy.t;
+         
+    f_comp: [
+      | `CompForL
+          of fields
+      | `CompIf
+          of CompIfType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.comp_forl_f_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_target () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.comp_forl_f_target
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_comp () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.comp_forl_f_comp
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (PythonNodeType.wrap context (field_c_value))
+      in
+         
+
+      match node with
+            
+      | Some `CompForL _
+      | Some `CompIf _
+      | None as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CompForL {
+        f_exprs
+          = Lazy.from_fun f_exprs ;
+        f_target
+          = Lazy.from_fun f_target ;
+        f_comp
+          = Lazy.from_fun f_comp ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DecoratorType : sig
+   
+  
+   
+  type t = [
+    | `Decorator
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_dec_name: NameType.t
+    Lazy.t;
+         
+    f_arg_list: ArgListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `Decorator
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_dec_name: NameType.t
+    Lazy.t;
+         
+    f_arg_list: ArgListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_dec_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.decorator_f_dec_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         NameType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_arg_list () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.decorator_f_arg_list
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ArgListType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `Decorator {
+        f_dec_name
+          = Lazy.from_fun f_dec_name ;
+        f_arg_list
+          = Lazy.from_fun f_arg_list ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DictAssocType : sig
+   
+  
+   
+  type t = [
+    | `DictAssoc
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_key: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_value: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DictAssoc
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_key: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_value: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_key () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.dict_assoc_f_key
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_value () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.dict_assoc_f_value
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `DictAssoc {
+        f_key
+          = Lazy.from_fun f_key ;
+        f_value
+          = Lazy.from_fun f_value ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ElsePartType : sig
+   
+  
+   
+  type t = [
+    | `ElsePart
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ElsePart
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_statements () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.else_part_f_statements
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AssertStmt _
+      | `AssignStmt _
+      | `AugAssignStmt _
+      | `BreakStmt _
+      | `ContinueStmt _
+      | `DelStmt _
+      | `ExecStmt _
+      | `ExprList _
+      | `GlobalStmt _
+      | `ImportFrom _
+      | `ImportName _
+      | `PassStmt _
+      | `PrintStmt _
+      | `PythonNodeList _
+      | `RaiseStmt _
+      | `ReturnStmt _
+      | `StreamPrintStmt _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ElsePart {
+        f_statements
+          = Lazy.from_fun f_statements ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ExceptPartType : sig
+   
+  
+   
+  type t = [
+    | `ExceptPart
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_as_name: AsNameNodeType.t
+    option
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ExceptPart
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_as_name: AsNameNodeType.t
+    option
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_as_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.except_part_f_as_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (AsNameNodeType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    let f_statements () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.except_part_f_statements
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AssertStmt _
+      | `AssignStmt _
+      | `AugAssignStmt _
+      | `BreakStmt _
+      | `ContinueStmt _
+      | `DelStmt _
+      | `ExecStmt _
+      | `ExprList _
+      | `GlobalStmt _
+      | `ImportFrom _
+      | `ImportName _
+      | `PassStmt _
+      | `PrintStmt _
+      | `PythonNodeList _
+      | `RaiseStmt _
+      | `ReturnStmt _
+      | `StreamPrintStmt _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ExceptPart {
+        f_as_name
+          = Lazy.from_fun f_as_name ;
+        f_statements
+          = Lazy.from_fun f_statements ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ExprType : sig
+   
+  
+   
+  (**
+    * NameType.t
+    * CallExprType.t
+    * SubscriptExprType.t
+    * IfExprType.t
+    * OrOpType.t
+    * AndOpType.t
+    * NotOpType.t
+    * CompOpType.t
+    * OrExprType.t
+    * XorExprType.t
+    * AndExprType.t
+    * BinOpType.t
+    * FactorType.t
+    * PowerType.t
+    * YieldExprType.t
+    * ListGenType.t
+    * TupleLitType.t
+    * ListCompType.t
+    * ListLitType.t
+    * SetCompType.t
+    * SetLitType.t
+    * DictCompType.t
+    * DictLitType.t
+    * InlineEvalType.t
+    * LambdaDefType.t
+    * EllipsisExprType.t
+    * SliceExprType.t
+    * NumberLitType.t
+    * StringLitType.t
+    * ConcatStringLitType.t
+    * DotType.t
+    *)
+  type t = [
+    | `AndExpr
+        of AndExprType.fields
+    | `AndOp
+        of AndOpType.fields
+    | `ArithExpr
+        of ArithExprType.fields
+    | `ShiftExpr
+        of ShiftExprType.fields
+    | `Term
+        of TermType.fields
+    | `CallExpr
+        of CallExprType.fields
+    | `CompOp
+        of CompOpType.fields
+    | `ConcatStringLit
+        of ConcatStringLitType.fields
+    | `DictComp
+        of DictCompType.fields
+    | `DictLit
+        of DictLitType.fields
+    | `Dot
+        of DotType.fields
+    | `EllipsisExpr
+        of EllipsisExprType.fields
+    | `Factor
+        of FactorType.fields
+    | `IfExpr
+        of IfExprType.fields
+    | `InlineEval
+        of InlineEvalType.fields
+    | `LambdaDef
+        of LambdaDefType.fields
+    | `ListComp
+        of ListCompType.fields
+    | `ListGen
+        of ListGenType.fields
+    | `ListLit
+        of ListLitType.fields
+    | `DottedName
+        of DottedNameType.fields
+    | `Id
+        of IdType.fields
+    | `NotOp
+        of NotOpType.fields
+    | `NumberLit
+        of NumberLitType.fields
+    | `OrExpr
+        of OrExprType.fields
+    | `OrOp
+        of OrOpType.fields
+    | `Power
+        of PowerType.fields
+    | `SetComp
+        of SetCompType.fields
+    | `SetLit
+        of SetLitType.fields
+    | `SliceExpr
+        of SliceExprType.fields
+    | `ExtSliceExpr
+        of ExtSliceExprType.fields
+    | `StringLit
+        of StringLitType.fields
+    | `SubscriptExpr
+        of SubscriptExprType.fields
+    | `TupleLit
+        of TupleLitType.fields
+    | `XorExpr
+        of XorExprType.fields
+    | `YieldExpr
+        of YieldExprType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  (**
+    * NameType.t
+    * CallExprType.t
+    * SubscriptExprType.t
+    * IfExprType.t
+    * OrOpType.t
+    * AndOpType.t
+    * NotOpType.t
+    * CompOpType.t
+    * OrExprType.t
+    * XorExprType.t
+    * AndExprType.t
+    * BinOpType.t
+    * FactorType.t
+    * PowerType.t
+    * YieldExprType.t
+    * ListGenType.t
+    * TupleLitType.t
+    * ListCompType.t
+    * ListLitType.t
+    * SetCompType.t
+    * SetLitType.t
+    * DictCompType.t
+    * DictLitType.t
+    * InlineEvalType.t
+    * LambdaDefType.t
+    * EllipsisExprType.t
+    * SliceExprType.t
+    * NumberLitType.t
+    * StringLitType.t
+    * ConcatStringLitType.t
+    * DotType.t
+    *)
+  type t = [
+    | `AndExpr
+        of AndExprType.fields
+    | `AndOp
+        of AndOpType.fields
+    | `ArithExpr
+        of ArithExprType.fields
+    | `ShiftExpr
+        of ShiftExprType.fields
+    | `Term
+        of TermType.fields
+    | `CallExpr
+        of CallExprType.fields
+    | `CompOp
+        of CompOpType.fields
+    | `ConcatStringLit
+        of ConcatStringLitType.fields
+    | `DictComp
+        of DictCompType.fields
+    | `DictLit
+        of DictLitType.fields
+    | `Dot
+        of DotType.fields
+    | `EllipsisExpr
+        of EllipsisExprType.fields
+    | `Factor
+        of FactorType.fields
+    | `IfExpr
+        of IfExprType.fields
+    | `InlineEval
+        of InlineEvalType.fields
+    | `LambdaDef
+        of LambdaDefType.fields
+    | `ListComp
+        of ListCompType.fields
+    | `ListGen
+        of ListGenType.fields
+    | `ListLit
+        of ListLitType.fields
+    | `DottedName
+        of DottedNameType.fields
+    | `Id
+        of IdType.fields
+    | `NotOp
+        of NotOpType.fields
+    | `NumberLit
+        of NumberLitType.fields
+    | `OrExpr
+        of OrExprType.fields
+    | `OrOp
+        of OrOpType.fields
+    | `Power
+        of PowerType.fields
+    | `SetComp
+        of SetCompType.fields
+    | `SetLit
+        of SetLitType.fields
+    | `SliceExpr
+        of SliceExprType.fields
+    | `ExtSliceExpr
+        of ExtSliceExprType.fields
+    | `StringLit
+        of StringLitType.fields
+    | `SubscriptExpr
+        of SubscriptExprType.fields
+    | `TupleLit
+        of TupleLitType.fields
+    | `XorExpr
+        of XorExprType.fields
+    | `YieldExpr
+        of YieldExprType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match PythonNodeType.wrap context (c_value) with
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `ShiftExpr _
+      | `Term _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `Dot _
+      | `EllipsisExpr _
+      | `Factor _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `DottedName _
+      | `Id _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `SliceExpr _
+      | `ExtSliceExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and AndExprType : sig
+   
+  
+   
+  type t = [
+    | `AndExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `AndExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_left () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.and_expr_f_left
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `ArithExpr _
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_right () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.and_expr_f_right
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArithExpr _
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `AndExpr {
+        f_left
+          = Lazy.from_fun f_left ;
+        f_right
+          = Lazy.from_fun f_right ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and AndOpType : sig
+   
+  
+   
+  type t = [
+    | `AndOp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `AndOp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_left () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.and_op_f_left
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_right () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.and_op_f_right
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `AndOp {
+        f_left
+          = Lazy.from_fun f_left ;
+        f_right
+          = Lazy.from_fun f_right ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and BinOpType : sig
+   
+  
+   
+  type t = [
+    | `ArithExpr
+        of ArithExprType.fields
+    | `ShiftExpr
+        of ShiftExprType.fields
+    | `Term
+        of TermType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ArithExpr
+        of ArithExprType.fields
+    | `ShiftExpr
+        of ShiftExprType.fields
+    | `Term
+        of TermType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match PythonNodeType.wrap context (c_value) with
+      | `ArithExpr _
+      | `ShiftExpr _
+      | `Term _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and ArithExprType : sig
+   
+  
+   
+  type t = [
+    | `ArithExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `ArithExpr
+          of fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ArithExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `ArithExpr
+          of fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_left () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.bin_op_f_left
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArithExpr _
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_op () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.bin_op_f_op
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         OpType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_right () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.bin_op_f_right
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArithExpr _
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ArithExpr {
+        f_left
+          = Lazy.from_fun f_left ;
+        f_op
+          = Lazy.from_fun f_op ;
+        f_right
+          = Lazy.from_fun f_right ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ShiftExprType : sig
+   
+  
+   
+  type t = [
+    | `ShiftExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ShiftExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_left () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.bin_op_f_left
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArithExpr _
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_op () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.bin_op_f_op
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         OpType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_right () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.bin_op_f_right
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArithExpr _
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ShiftExpr {
+        f_left
+          = Lazy.from_fun f_left ;
+        f_op
+          = Lazy.from_fun f_op ;
+        f_right
+          = Lazy.from_fun f_right ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and TermType : sig
+   
+  
+   
+  type t = [
+    | `Term
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `Term
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_left () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.bin_op_f_left
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArithExpr _
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_op () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.bin_op_f_op
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         OpType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_right () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.bin_op_f_right
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ArithExpr _
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `Term {
+        f_left
+          = Lazy.from_fun f_left ;
+        f_op
+          = Lazy.from_fun f_op ;
+        f_right
+          = Lazy.from_fun f_right ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CallExprType : sig
+   
+  
+   
+  type t = [
+    | `CallExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_prefix: [
+      | `CallExpr
+          of fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: ArgListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CallExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_prefix: [
+      | `CallExpr
+          of fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: ArgListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_prefix () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.call_expr_f_prefix
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `SetComp _
+      | `SetLit _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `TupleLit _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_suffix () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.call_expr_f_suffix
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ArgListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CallExpr {
+        f_prefix
+          = Lazy.from_fun f_prefix ;
+        f_suffix
+          = Lazy.from_fun f_suffix ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and CompOpType : sig
+   
+  
+   
+  type t = [
+    | `CompOp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: CompOpKindType.t
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `CompOp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: CompOpKindType.t
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_left () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.comp_op_f_left
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `OrExpr _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_op () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.comp_op_f_op
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         CompOpKindType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_right () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.comp_op_f_right
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `ArithExpr _
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `OrExpr _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `CompOp {
+        f_left
+          = Lazy.from_fun f_left ;
+        f_op
+          = Lazy.from_fun f_op ;
+        f_right
+          = Lazy.from_fun f_right ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ConcatStringLitType : sig
+   
+  
+   
+  type t = [
+    | `ConcatStringLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_first_str: StringLitType.t
+    Lazy.t;
+         
+    f_subsequent_str: StringLitListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ConcatStringLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_first_str: StringLitType.t
+    Lazy.t;
+         
+    f_subsequent_str: StringLitListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_first_str () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.concat_string_lit_f_first_str
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         StringLitType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_subsequent_str () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.concat_string_lit_f_subsequent_str
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         StringLitListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ConcatStringLit {
+        f_first_str
+          = Lazy.from_fun f_first_str ;
+        f_subsequent_str
+          = Lazy.from_fun f_subsequent_str ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DictCompType : sig
+   
+  
+   
+  type t = [
+    | `DictComp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_assoc: DictAssocType.t
+    Lazy.t;
+         
+    f_comprehension: CompForType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DictComp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_assoc: DictAssocType.t
+    Lazy.t;
+         
+    f_comprehension: CompForType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_assoc () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.dict_comp_f_assoc
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         DictAssocType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_comprehension () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.dict_comp_f_comprehension
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         CompForType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `DictComp {
+        f_assoc
+          = Lazy.from_fun f_assoc ;
+        f_comprehension
+          = Lazy.from_fun f_comprehension ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DictLitType : sig
+   
+  
+   
+  type t = [
+    | `DictLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_assocs: DictAssocListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DictLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_assocs: DictAssocListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_assocs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.dict_lit_f_assocs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         DictAssocListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `DictLit {
+        f_assocs
+          = Lazy.from_fun f_assocs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DotType : sig
+   
+  
+   
+  type t = [
+    | `Dot
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `Dot
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `Dot {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and EllipsisExprType : sig
+   
+  
+   
+  type t = [
+    | `EllipsisExpr
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `EllipsisExpr
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `EllipsisExpr {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and FactorType : sig
+   
+  
+   
+  type t = [
+    | `Factor
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `Factor
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_op () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.factor_f_op
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         OpType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.factor_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `TupleLit _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `Factor {
+        f_op
+          = Lazy.from_fun f_op ;
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and IfExprType : sig
+   
+  
+   
+  type t = [
+    | `IfExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_cond: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_else_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `IfExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_cond: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_else_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.if_expr_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_cond () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.if_expr_f_cond
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_else_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.if_expr_f_else_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `IfExpr {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        f_cond
+          = Lazy.from_fun f_cond ;
+        f_else_expr
+          = Lazy.from_fun f_else_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and InlineEvalType : sig
+   
+  
+   
+  type t = [
+    | `InlineEval
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `InlineEval
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.inline_eval_f_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `InlineEval {
+        f_exprs
+          = Lazy.from_fun f_exprs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and LambdaDefType : sig
+   
+  
+   
+  type t = [
+    | `LambdaDef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_args: ParamsType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `LambdaDef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_args: ParamsType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_args () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.lambda_def_f_args
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ParamsType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.lambda_def_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `LambdaDef {
+        f_args
+          = Lazy.from_fun f_args ;
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ListCompType : sig
+   
+  
+   
+  type t = [
+    | `ListComp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForLType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ListComp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForLType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.list_comp_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_comprehension () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.list_comp_f_comprehension
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         CompForLType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ListComp {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        f_comprehension
+          = Lazy.from_fun f_comprehension ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ListGenType : sig
+   
+  
+   
+  type t = [
+    | `ListGen
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForLType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ListGen
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForLType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.list_gen_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_comprehension () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.list_gen_f_comprehension
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         CompForLType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ListGen {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        f_comprehension
+          = Lazy.from_fun f_comprehension ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ListLitType : sig
+   
+  
+   
+  type t = [
+    | `ListLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ListLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.list_lit_f_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ListLit {
+        f_exprs
+          = Lazy.from_fun f_exprs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and NameType : sig
+   
+  
+   
+  type t = [
+    | `DottedName
+        of DottedNameType.fields
+    | `Id
+        of IdType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DottedName
+        of DottedNameType.fields
+    | `Id
+        of IdType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match PythonNodeType.wrap context (c_value) with
+      | `DottedName _
+      | `Id _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and DottedNameType : sig
+   
+  
+   
+  type t = [
+    | `DottedName
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_prefix: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: IdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DottedName
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_prefix: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: IdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_prefix () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.dotted_name_f_prefix
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `SetComp _
+      | `SetLit _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `TupleLit _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_suffix () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.dotted_name_f_suffix
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         IdType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `DottedName {
+        f_prefix
+          = Lazy.from_fun f_prefix ;
+        f_suffix
+          = Lazy.from_fun f_suffix ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and IdType : sig
+   
+  
+   
+  type t = [
+    | `Id
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `Id
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `Id {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and NotOpType : sig
+   
+  
+   
+  type t = [
+    | `NotOp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `NotOp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.not_op_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `NotOp {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and NumberLitType : sig
+   
+  
+   
+  type t = [
+    | `NumberLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `NumberLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `NumberLit {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and OrExprType : sig
+   
+  
+   
+  type t = [
+    | `OrExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `OrExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_left () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.or_expr_f_left
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `ArithExpr _
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `OrExpr _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_right () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.or_expr_f_right
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `ArithExpr _
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `OrExpr {
+        f_left
+          = Lazy.from_fun f_left ;
+        f_right
+          = Lazy.from_fun f_right ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and OrOpType : sig
+   
+  
+   
+  type t = [
+    | `OrOp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `OrOp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_left () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.or_op_f_left
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_right () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.or_op_f_right
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `OrOp {
+        f_left
+          = Lazy.from_fun f_left ;
+        f_right
+          = Lazy.from_fun f_right ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and PowerType : sig
+   
+  
+   
+  type t = [
+    | `Power
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `Power
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_left () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.power_f_left
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `SetComp _
+      | `SetLit _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `TupleLit _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_right () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.power_f_right
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `TupleLit _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `Power {
+        f_left
+          = Lazy.from_fun f_left ;
+        f_right
+          = Lazy.from_fun f_right ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and SetCompType : sig
+   
+  
+   
+  type t = [
+    | `SetComp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `SetComp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.set_comp_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_comprehension () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.set_comp_f_comprehension
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         CompForType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `SetComp {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        f_comprehension
+          = Lazy.from_fun f_comprehension ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and SetLitType : sig
+   
+  
+   
+  type t = [
+    | `SetLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `SetLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.set_lit_f_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `SetLit {
+        f_exprs
+          = Lazy.from_fun f_exprs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and SliceExprType : sig
+   
+  
+   
+  type t = [
+    | `SliceExpr
+        of fields
+    | `ExtSliceExpr
+        of ExtSliceExprType.fields
+  ]
+  and fields = 
+  {
+         
+    f_first: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_last: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `SliceExpr
+        of fields
+    | `ExtSliceExpr
+        of ExtSliceExprType.fields
+  ]
+  and fields = 
+  {
+         
+    f_first: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_last: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_first () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.slice_expr_f_first
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprType.wrap context (field_c_value))
+      in
+         
+
+      match node with
+            
+      | Some `AndExpr _
+      | Some `AndOp _
+      | Some `ArithExpr _
+      | Some `CallExpr _
+      | Some `CompOp _
+      | Some `ConcatStringLit _
+      | Some `DictComp _
+      | Some `DictLit _
+      | Some `DottedName _
+      | Some `Factor _
+      | Some `Id _
+      | Some `IfExpr _
+      | Some `InlineEval _
+      | Some `LambdaDef _
+      | Some `ListComp _
+      | Some `ListGen _
+      | Some `ListLit _
+      | Some `NotOp _
+      | Some `NumberLit _
+      | Some `OrExpr _
+      | Some `OrOp _
+      | Some `Power _
+      | Some `SetComp _
+      | Some `SetLit _
+      | Some `ShiftExpr _
+      | Some `StringLit _
+      | Some `SubscriptExpr _
+      | Some `Term _
+      | Some `TupleLit _
+      | Some `XorExpr _
+      | Some `YieldExpr _
+      | None as e -> e
+      | _ -> assert false
+    in
+    let f_last () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.slice_expr_f_last
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprType.wrap context (field_c_value))
+      in
+         
+
+      match node with
+            
+      | Some `AndExpr _
+      | Some `AndOp _
+      | Some `ArithExpr _
+      | Some `CallExpr _
+      | Some `CompOp _
+      | Some `ConcatStringLit _
+      | Some `DictComp _
+      | Some `DictLit _
+      | Some `DottedName _
+      | Some `Factor _
+      | Some `Id _
+      | Some `IfExpr _
+      | Some `InlineEval _
+      | Some `LambdaDef _
+      | Some `ListComp _
+      | Some `ListGen _
+      | Some `ListLit _
+      | Some `NotOp _
+      | Some `NumberLit _
+      | Some `OrExpr _
+      | Some `OrOp _
+      | Some `Power _
+      | Some `SetComp _
+      | Some `SetLit _
+      | Some `ShiftExpr _
+      | Some `StringLit _
+      | Some `SubscriptExpr _
+      | Some `Term _
+      | Some `TupleLit _
+      | Some `XorExpr _
+      | Some `YieldExpr _
+      | None as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `SliceExpr {
+        f_first
+          = Lazy.from_fun f_first ;
+        f_last
+          = Lazy.from_fun f_last ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ExtSliceExprType : sig
+   
+  
+   
+  type t = [
+    | `ExtSliceExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_first: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_last: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_stride: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ExtSliceExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_first: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_last: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_stride: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_first () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.slice_expr_f_first
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprType.wrap context (field_c_value))
+      in
+         
+
+      match node with
+            
+      | Some `AndExpr _
+      | Some `AndOp _
+      | Some `ArithExpr _
+      | Some `CallExpr _
+      | Some `CompOp _
+      | Some `ConcatStringLit _
+      | Some `DictComp _
+      | Some `DictLit _
+      | Some `DottedName _
+      | Some `Factor _
+      | Some `Id _
+      | Some `IfExpr _
+      | Some `InlineEval _
+      | Some `LambdaDef _
+      | Some `ListComp _
+      | Some `ListGen _
+      | Some `ListLit _
+      | Some `NotOp _
+      | Some `NumberLit _
+      | Some `OrExpr _
+      | Some `OrOp _
+      | Some `Power _
+      | Some `SetComp _
+      | Some `SetLit _
+      | Some `ShiftExpr _
+      | Some `StringLit _
+      | Some `SubscriptExpr _
+      | Some `Term _
+      | Some `TupleLit _
+      | Some `XorExpr _
+      | Some `YieldExpr _
+      | None as e -> e
+      | _ -> assert false
+    in
+    let f_last () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.slice_expr_f_last
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprType.wrap context (field_c_value))
+      in
+         
+
+      match node with
+            
+      | Some `AndExpr _
+      | Some `AndOp _
+      | Some `ArithExpr _
+      | Some `CallExpr _
+      | Some `CompOp _
+      | Some `ConcatStringLit _
+      | Some `DictComp _
+      | Some `DictLit _
+      | Some `DottedName _
+      | Some `Factor _
+      | Some `Id _
+      | Some `IfExpr _
+      | Some `InlineEval _
+      | Some `LambdaDef _
+      | Some `ListComp _
+      | Some `ListGen _
+      | Some `ListLit _
+      | Some `NotOp _
+      | Some `NumberLit _
+      | Some `OrExpr _
+      | Some `OrOp _
+      | Some `Power _
+      | Some `SetComp _
+      | Some `SetLit _
+      | Some `ShiftExpr _
+      | Some `StringLit _
+      | Some `SubscriptExpr _
+      | Some `Term _
+      | Some `TupleLit _
+      | Some `XorExpr _
+      | Some `YieldExpr _
+      | None as e -> e
+      | _ -> assert false
+    in
+    let f_stride () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.ext_slice_expr_f_stride
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprType.wrap context (field_c_value))
+      in
+         
+
+      match node with
+            
+      | Some `AndExpr _
+      | Some `AndOp _
+      | Some `ArithExpr _
+      | Some `CallExpr _
+      | Some `CompOp _
+      | Some `ConcatStringLit _
+      | Some `DictComp _
+      | Some `DictLit _
+      | Some `DottedName _
+      | Some `Factor _
+      | Some `Id _
+      | Some `IfExpr _
+      | Some `InlineEval _
+      | Some `LambdaDef _
+      | Some `ListComp _
+      | Some `ListGen _
+      | Some `ListLit _
+      | Some `NotOp _
+      | Some `NumberLit _
+      | Some `OrExpr _
+      | Some `OrOp _
+      | Some `Power _
+      | Some `SetComp _
+      | Some `SetLit _
+      | Some `ShiftExpr _
+      | Some `StringLit _
+      | Some `SubscriptExpr _
+      | Some `Term _
+      | Some `TupleLit _
+      | Some `XorExpr _
+      | Some `YieldExpr _
+      | None as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ExtSliceExpr {
+        f_first
+          = Lazy.from_fun f_first ;
+        f_last
+          = Lazy.from_fun f_last ;
+        f_stride
+          = Lazy.from_fun f_stride ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and StringLitType : sig
+   
+  
+   
+  type t = [
+    | `StringLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `StringLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `StringLit {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and SubscriptExprType : sig
+   
+  
+   
+  type t = [
+    | `SubscriptExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_prefix: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `SubscriptExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_prefix: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_prefix () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.subscript_expr_f_prefix
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `SetComp _
+      | `SetLit _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `TupleLit _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_suffix () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.subscript_expr_f_suffix
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `SubscriptExpr {
+        f_prefix
+          = Lazy.from_fun f_prefix ;
+        f_suffix
+          = Lazy.from_fun f_suffix ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and TupleLitType : sig
+   
+  
+   
+  type t = [
+    | `TupleLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `TupleLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.tuple_lit_f_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprListType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `TupleLit {
+        f_exprs
+          = Lazy.from_fun f_exprs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and XorExprType : sig
+   
+  
+   
+  type t = [
+    | `XorExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `XorExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_left () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.xor_expr_f_left
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `ArithExpr _
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_right () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.xor_expr_f_right
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `ArithExpr _
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `XorExpr {
+        f_left
+          = Lazy.from_fun f_left ;
+        f_right
+          = Lazy.from_fun f_right ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and YieldExprType : sig
+   
+  
+   
+  type t = [
+    | `YieldExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `YieldExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.yield_expr_f_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprListType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `YieldExpr {
+        f_exprs
+          = Lazy.from_fun f_exprs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and FileNodeType : sig
+   
+  
+   
+  type t = [
+    | `FileNode
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_statements: PythonNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `FileNode
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_statements: PythonNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_statements () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.file_node_f_statements
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `FileNode {
+        f_statements
+          = Lazy.from_fun f_statements ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ImportStarType : sig
+   
+  
+   
+  type t = [
+    | `ImportStar
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ImportStar
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ImportStar {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and KwArgsFlagType : sig
+   
+  
+   
+  type t = [
+    | `KwArgsFlagAbsent
+        of KwArgsFlagAbsentType.fields
+    | `KwArgsFlagPresent
+        of KwArgsFlagPresentType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `KwArgsFlagAbsent
+        of KwArgsFlagAbsentType.fields
+    | `KwArgsFlagPresent
+        of KwArgsFlagPresentType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match PythonNodeType.wrap context (c_value) with
+      | `KwArgsFlagAbsent _
+      | `KwArgsFlagPresent _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and KwArgsFlagAbsentType : sig
+   
+  
+   
+  type t = [
+    | `KwArgsFlagAbsent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `KwArgsFlagAbsent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `KwArgsFlagAbsent {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and KwArgsFlagPresentType : sig
+   
+  
+   
+  type t = [
+    | `KwArgsFlagPresent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `KwArgsFlagPresent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `KwArgsFlagPresent {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and NLType : sig
+   
+  
+   
+  type t = [
+    | `NL
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `NL
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `NL {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and OpType : sig
+   
+  
+   
+  type t = [
+    | `Op
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `Op
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `Op {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ParamsType : sig
+   
+  
+   
+  type t = [
+    | `Params
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_single_params: SingleParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `Params
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_single_params: SingleParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_single_params () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.params_f_single_params
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         SingleParamListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `Params {
+        f_single_params
+          = Lazy.from_fun f_single_params ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and PythonNodeBaseListType : sig
+   
+  
+   
+  type t = [
+    | `ArgList
+        of ArgListType.fields
+    | `AsNameNodeList
+        of AsNameNodeListType.fields
+    | `DecoratorList
+        of DecoratorListType.fields
+    | `DictAssocList
+        of DictAssocListType.fields
+    | `DotList
+        of DotListType.fields
+    | `ElifBranchList
+        of ElifBranchListType.fields
+    | `ExceptPartList
+        of ExceptPartListType.fields
+    | `ExprList
+        of ExprListType.fields
+    | `IdList
+        of IdListType.fields
+    | `NLList
+        of NLListType.fields
+    | `PythonNodeList
+        of PythonNodeListType.fields
+    | `SingleParamList
+        of SingleParamListType.fields
+    | `StringLitList
+        of StringLitListType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ArgList
+        of ArgListType.fields
+    | `AsNameNodeList
+        of AsNameNodeListType.fields
+    | `DecoratorList
+        of DecoratorListType.fields
+    | `DictAssocList
+        of DictAssocListType.fields
+    | `DotList
+        of DotListType.fields
+    | `ElifBranchList
+        of ElifBranchListType.fields
+    | `ExceptPartList
+        of ExceptPartListType.fields
+    | `ExprList
+        of ExprListType.fields
+    | `IdList
+        of IdListType.fields
+    | `NLList
+        of NLListType.fields
+    | `PythonNodeList
+        of PythonNodeListType.fields
+    | `SingleParamList
+        of SingleParamListType.fields
+    | `StringLitList
+        of StringLitListType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match PythonNodeType.wrap context (c_value) with
+      | `ArgList _
+      | `AsNameNodeList _
+      | `DecoratorList _
+      | `DictAssocList _
+      | `DotList _
+      | `ElifBranchList _
+      | `ExceptPartList _
+      | `ExprList _
+      | `IdList _
+      | `NLList _
+      | `PythonNodeList _
+      | `SingleParamList _
+      | `StringLitList _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and ArgListType : sig
+   
+  
+   
+  type t = [
+    | `ArgList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ArgType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ArgList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ArgType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n PythonNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.python_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value PythonNodeArrayStruct.n in
+      let items = c_value @. PythonNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        ArgType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      PythonNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ArgList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and AsNameNodeListType : sig
+   
+  
+   
+  type t = [
+    | `AsNameNodeList
+        of fields
+  ]
+  and fields = 
+  {
+    list : AsNameNodeType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `AsNameNodeList
+        of fields
+  ]
+  and fields = 
+  {
+    list : AsNameNodeType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n PythonNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.python_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value PythonNodeArrayStruct.n in
+      let items = c_value @. PythonNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        AsNameNodeType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      PythonNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `AsNameNodeList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DecoratorListType : sig
+   
+  
+   
+  type t = [
+    | `DecoratorList
+        of fields
+  ]
+  and fields = 
+  {
+    list : DecoratorType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DecoratorList
+        of fields
+  ]
+  and fields = 
+  {
+    list : DecoratorType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n PythonNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.python_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value PythonNodeArrayStruct.n in
+      let items = c_value @. PythonNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        DecoratorType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      PythonNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `DecoratorList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DictAssocListType : sig
+   
+  
+   
+  type t = [
+    | `DictAssocList
+        of fields
+  ]
+  and fields = 
+  {
+    list : DictAssocType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DictAssocList
+        of fields
+  ]
+  and fields = 
+  {
+    list : DictAssocType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n PythonNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.python_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value PythonNodeArrayStruct.n in
+      let items = c_value @. PythonNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        DictAssocType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      PythonNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `DictAssocList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DotListType : sig
+   
+  
+   
+  type t = [
+    | `DotList
+        of fields
+  ]
+  and fields = 
+  {
+    list : DotType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DotList
+        of fields
+  ]
+  and fields = 
+  {
+    list : DotType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n PythonNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.python_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value PythonNodeArrayStruct.n in
+      let items = c_value @. PythonNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        DotType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      PythonNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `DotList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ElifBranchListType : sig
+   
+  
+   
+  type t = [
+    | `ElifBranchList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ElifBranchType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ElifBranchList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ElifBranchType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n PythonNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.python_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value PythonNodeArrayStruct.n in
+      let items = c_value @. PythonNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        ElifBranchType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      PythonNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ElifBranchList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ExceptPartListType : sig
+   
+  
+   
+  type t = [
+    | `ExceptPartList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ExceptPartType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ExceptPartList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ExceptPartType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n PythonNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.python_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value PythonNodeArrayStruct.n in
+      let items = c_value @. PythonNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        ExceptPartType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      PythonNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ExceptPartList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ExprListType : sig
+   
+  
+   
+  type t = [
+    | `ExprList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ExprType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ExprList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ExprType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n PythonNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.python_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value PythonNodeArrayStruct.n in
+      let items = c_value @. PythonNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        ExprType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      PythonNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ExprList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and IdListType : sig
+   
+  
+   
+  type t = [
+    | `IdList
+        of fields
+  ]
+  and fields = 
+  {
+    list : IdType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `IdList
+        of fields
+  ]
+  and fields = 
+  {
+    list : IdType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n PythonNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.python_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value PythonNodeArrayStruct.n in
+      let items = c_value @. PythonNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        IdType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      PythonNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `IdList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and NLListType : sig
+   
+  
+   
+  type t = [
+    | `NLList
+        of fields
+  ]
+  and fields = 
+  {
+    list : NLType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `NLList
+        of fields
+  ]
+  and fields = 
+  {
+    list : NLType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n PythonNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.python_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value PythonNodeArrayStruct.n in
+      let items = c_value @. PythonNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        NLType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      PythonNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `NLList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and PythonNodeListType : sig
+   
+  
+   
+  type t = [
+    | `PythonNodeList
+        of fields
+  ]
+  and fields = 
+  {
+    list : PythonNodeType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `PythonNodeList
+        of fields
+  ]
+  and fields = 
+  {
+    list : PythonNodeType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n PythonNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.python_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value PythonNodeArrayStruct.n in
+      let items = c_value @. PythonNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        PythonNodeType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      PythonNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `PythonNodeList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and SingleParamListType : sig
+   
+  
+   
+  type t = [
+    | `SingleParamList
+        of fields
+  ]
+  and fields = 
+  {
+    list : SingleParamType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `SingleParamList
+        of fields
+  ]
+  and fields = 
+  {
+    list : SingleParamType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n PythonNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.python_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value PythonNodeArrayStruct.n in
+      let items = c_value @. PythonNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        SingleParamType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      PythonNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `SingleParamList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and StringLitListType : sig
+   
+  
+   
+  type t = [
+    | `StringLitList
+        of fields
+  ]
+  and fields = 
+  {
+    list : StringLitType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `StringLitList
+        of fields
+  ]
+  and fields = 
+  {
+    list : StringLitType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let list () =
+      let c_value_ptr =
+        allocate_n PythonNodeArrayStruct.c_type ~count:1
+      in
+      let _ : int =
+        CFunctions.python_node_children
+          (addr c_value)
+          (c_value_ptr)
+      in
+      let c_value = !@(!@(c_value_ptr)) in
+      let length = getf c_value PythonNodeArrayStruct.n in
+      let items = c_value @. PythonNodeArrayStruct.items in
+      let f i =
+        let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+        (* This can raise a SyntaxError, which is expected *)
+        StringLitType.wrap context ((!@ fresh))
+      in
+      let result = List.init length f in
+      PythonNodeArrayStruct.dec_ref (!@ c_value_ptr);
+      result
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `StringLitList {
+        list = Lazy.from_fun list;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and RelNameType : sig
+   
+  
+   
+  type t = [
+    | `RelName
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_dots: DotListType.t
+    Lazy.t;
+         
+    f_name: NameType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `RelName
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_dots: DotListType.t
+    Lazy.t;
+         
+    f_name: NameType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_dots () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.rel_name_f_dots
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         DotListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.rel_name_f_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (NameType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `RelName {
+        f_dots
+          = Lazy.from_fun f_dots ;
+        f_name
+          = Lazy.from_fun f_name ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and SingleParamType : sig
+   
+  
+   
+  type t = [
+    | `SingleParam
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_is_varargs: VarArgsFlagType.t
+    Lazy.t;
+         
+    f_is_kwargs: KwArgsFlagType.t
+    Lazy.t;
+         
+    f_name: [
+      | `Id
+          of IdType.fields
+      | `IdList
+          of IdListType.fields
+    ]
+    Lazy.t;
+         
+    f_default_value: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `SingleParam
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_is_varargs: VarArgsFlagType.t
+    Lazy.t;
+         
+    f_is_kwargs: KwArgsFlagType.t
+    Lazy.t;
+         
+    f_name: [
+      | `Id
+          of IdType.fields
+      | `IdList
+          of IdListType.fields
+    ]
+    Lazy.t;
+         
+    f_default_value: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_is_varargs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.single_param_f_is_varargs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         VarArgsFlagType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_is_kwargs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.single_param_f_is_kwargs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         KwArgsFlagType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.single_param_f_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `Id _
+      | `IdList _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_default_value () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.single_param_f_default_value
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprType.wrap context (field_c_value))
+      in
+         
+
+      match node with
+            
+      | Some `AndExpr _
+      | Some `AndOp _
+      | Some `ArithExpr _
+      | Some `CallExpr _
+      | Some `CompOp _
+      | Some `ConcatStringLit _
+      | Some `DictComp _
+      | Some `DictLit _
+      | Some `DottedName _
+      | Some `Factor _
+      | Some `Id _
+      | Some `IfExpr _
+      | Some `InlineEval _
+      | Some `LambdaDef _
+      | Some `ListComp _
+      | Some `ListGen _
+      | Some `ListLit _
+      | Some `NotOp _
+      | Some `NumberLit _
+      | Some `OrExpr _
+      | Some `OrOp _
+      | Some `Power _
+      | Some `SetComp _
+      | Some `SetLit _
+      | Some `ShiftExpr _
+      | Some `StringLit _
+      | Some `SubscriptExpr _
+      | Some `Term _
+      | Some `TupleLit _
+      | Some `XorExpr _
+      | Some `YieldExpr _
+      | None as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `SingleParam {
+        f_is_varargs
+          = Lazy.from_fun f_is_varargs ;
+        f_is_kwargs
+          = Lazy.from_fun f_is_kwargs ;
+        f_name
+          = Lazy.from_fun f_name ;
+        f_default_value
+          = Lazy.from_fun f_default_value ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and StmtType : sig
+   
+  
+   
+  (**
+    * DecoratedType.t
+    * DefStmtType.t
+    * AugAssignStmtType.t
+    * AssignStmtType.t
+    * PrintStmtType.t
+    * StreamPrintStmtType.t
+    * DelStmtType.t
+    * PassStmtType.t
+    * BreakStmtType.t
+    * ContinueStmtType.t
+    * ReturnStmtType.t
+    * RaiseStmtType.t
+    * ImportNameType.t
+    * ImportFromType.t
+    * GlobalStmtType.t
+    * ExecStmtType.t
+    * AssertStmtType.t
+    * IfStmtType.t
+    * ElifBranchType.t
+    * WhileStmtType.t
+    * ForStmtType.t
+    * TryStmtType.t
+    * WithStmtType.t
+    *)
+  type t = [
+    | `AssertStmt
+        of AssertStmtType.fields
+    | `AssignStmt
+        of AssignStmtType.fields
+    | `AugAssignStmt
+        of AugAssignStmtType.fields
+    | `BreakStmt
+        of BreakStmtType.fields
+    | `ContinueStmt
+        of ContinueStmtType.fields
+    | `Decorated
+        of DecoratedType.fields
+    | `ClassDef
+        of ClassDefType.fields
+    | `FuncDef
+        of FuncDefType.fields
+    | `DelStmt
+        of DelStmtType.fields
+    | `ElifBranch
+        of ElifBranchType.fields
+    | `ExecStmt
+        of ExecStmtType.fields
+    | `ForStmt
+        of ForStmtType.fields
+    | `GlobalStmt
+        of GlobalStmtType.fields
+    | `IfStmt
+        of IfStmtType.fields
+    | `ImportFrom
+        of ImportFromType.fields
+    | `ImportName
+        of ImportNameType.fields
+    | `PassStmt
+        of PassStmtType.fields
+    | `PrintStmt
+        of PrintStmtType.fields
+    | `RaiseStmt
+        of RaiseStmtType.fields
+    | `ReturnStmt
+        of ReturnStmtType.fields
+    | `StreamPrintStmt
+        of StreamPrintStmtType.fields
+    | `TryStmt
+        of TryStmtType.fields
+    | `WhileStmt
+        of WhileStmtType.fields
+    | `WithStmt
+        of WithStmtType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  (**
+    * DecoratedType.t
+    * DefStmtType.t
+    * AugAssignStmtType.t
+    * AssignStmtType.t
+    * PrintStmtType.t
+    * StreamPrintStmtType.t
+    * DelStmtType.t
+    * PassStmtType.t
+    * BreakStmtType.t
+    * ContinueStmtType.t
+    * ReturnStmtType.t
+    * RaiseStmtType.t
+    * ImportNameType.t
+    * ImportFromType.t
+    * GlobalStmtType.t
+    * ExecStmtType.t
+    * AssertStmtType.t
+    * IfStmtType.t
+    * ElifBranchType.t
+    * WhileStmtType.t
+    * ForStmtType.t
+    * TryStmtType.t
+    * WithStmtType.t
+    *)
+  type t = [
+    | `AssertStmt
+        of AssertStmtType.fields
+    | `AssignStmt
+        of AssignStmtType.fields
+    | `AugAssignStmt
+        of AugAssignStmtType.fields
+    | `BreakStmt
+        of BreakStmtType.fields
+    | `ContinueStmt
+        of ContinueStmtType.fields
+    | `Decorated
+        of DecoratedType.fields
+    | `ClassDef
+        of ClassDefType.fields
+    | `FuncDef
+        of FuncDefType.fields
+    | `DelStmt
+        of DelStmtType.fields
+    | `ElifBranch
+        of ElifBranchType.fields
+    | `ExecStmt
+        of ExecStmtType.fields
+    | `ForStmt
+        of ForStmtType.fields
+    | `GlobalStmt
+        of GlobalStmtType.fields
+    | `IfStmt
+        of IfStmtType.fields
+    | `ImportFrom
+        of ImportFromType.fields
+    | `ImportName
+        of ImportNameType.fields
+    | `PassStmt
+        of PassStmtType.fields
+    | `PrintStmt
+        of PrintStmtType.fields
+    | `RaiseStmt
+        of RaiseStmtType.fields
+    | `ReturnStmt
+        of ReturnStmtType.fields
+    | `StreamPrintStmt
+        of StreamPrintStmtType.fields
+    | `TryStmt
+        of TryStmtType.fields
+    | `WhileStmt
+        of WhileStmtType.fields
+    | `WithStmt
+        of WithStmtType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match PythonNodeType.wrap context (c_value) with
+      | `AssertStmt _
+      | `AssignStmt _
+      | `AugAssignStmt _
+      | `BreakStmt _
+      | `ContinueStmt _
+      | `Decorated _
+      | `ClassDef _
+      | `FuncDef _
+      | `DelStmt _
+      | `ElifBranch _
+      | `ExecStmt _
+      | `ForStmt _
+      | `GlobalStmt _
+      | `IfStmt _
+      | `ImportFrom _
+      | `ImportName _
+      | `PassStmt _
+      | `PrintStmt _
+      | `RaiseStmt _
+      | `ReturnStmt _
+      | `StreamPrintStmt _
+      | `TryStmt _
+      | `WhileStmt _
+      | `WithStmt _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and AssertStmtType : sig
+   
+  
+   
+  type t = [
+    | `AssertStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_test_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_msg: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `AssertStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_test_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_msg: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_test_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.assert_stmt_f_test_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_msg () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.assert_stmt_f_msg
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprType.wrap context (field_c_value))
+      in
+         
+
+      match node with
+            
+      | Some `AndExpr _
+      | Some `AndOp _
+      | Some `ArithExpr _
+      | Some `CallExpr _
+      | Some `CompOp _
+      | Some `ConcatStringLit _
+      | Some `DictComp _
+      | Some `DictLit _
+      | Some `DottedName _
+      | Some `Factor _
+      | Some `Id _
+      | Some `IfExpr _
+      | Some `InlineEval _
+      | Some `LambdaDef _
+      | Some `ListComp _
+      | Some `ListGen _
+      | Some `ListLit _
+      | Some `NotOp _
+      | Some `NumberLit _
+      | Some `OrExpr _
+      | Some `OrOp _
+      | Some `Power _
+      | Some `SetComp _
+      | Some `SetLit _
+      | Some `ShiftExpr _
+      | Some `StringLit _
+      | Some `SubscriptExpr _
+      | Some `Term _
+      | Some `TupleLit _
+      | Some `XorExpr _
+      | Some `YieldExpr _
+      | None as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `AssertStmt {
+        f_test_expr
+          = Lazy.from_fun f_test_expr ;
+        f_msg
+          = Lazy.from_fun f_msg ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and AssignStmtType : sig
+   
+  
+   
+  type t = [
+    | `AssignStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_l_value: ExprListType.t
+    Lazy.t;
+         
+    f_r_values: PythonNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `AssignStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_l_value: ExprListType.t
+    Lazy.t;
+         
+    f_r_values: PythonNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_l_value () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.assign_stmt_f_l_value
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_r_values () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.assign_stmt_f_r_values
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `AssignStmt {
+        f_l_value
+          = Lazy.from_fun f_l_value ;
+        f_r_values
+          = Lazy.from_fun f_r_values ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and AugAssignStmtType : sig
+   
+  
+   
+  type t = [
+    | `AugAssignStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_l_value: ExprListType.t
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_r_value: [
+      | `ExprList
+          of ExprListType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `AugAssignStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_l_value: ExprListType.t
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_r_value: [
+      | `ExprList
+          of ExprListType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_l_value () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.aug_assign_stmt_f_l_value
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_op () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.aug_assign_stmt_f_op
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         OpType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_r_value () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.aug_assign_stmt_f_r_value
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ExprList _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `AugAssignStmt {
+        f_l_value
+          = Lazy.from_fun f_l_value ;
+        f_op
+          = Lazy.from_fun f_op ;
+        f_r_value
+          = Lazy.from_fun f_r_value ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and BreakStmtType : sig
+   
+  
+   
+  type t = [
+    | `BreakStmt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `BreakStmt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `BreakStmt {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ContinueStmtType : sig
+   
+  
+   
+  type t = [
+    | `ContinueStmt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ContinueStmt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ContinueStmt {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DecoratedType : sig
+   
+  
+   
+  type t = [
+    | `Decorated
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_decorators: DecoratorListType.t
+    Lazy.t;
+         
+    f_defn: DefStmtType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `Decorated
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_decorators: DecoratorListType.t
+    Lazy.t;
+         
+    f_defn: DefStmtType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_decorators () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.decorated_f_decorators
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         DecoratorListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_defn () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.decorated_f_defn
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         DefStmtType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `Decorated {
+        f_decorators
+          = Lazy.from_fun f_decorators ;
+        f_defn
+          = Lazy.from_fun f_defn ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DefStmtType : sig
+   
+  
+   
+  type t = [
+    | `ClassDef
+        of ClassDefType.fields
+    | `FuncDef
+        of FuncDefType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ClassDef
+        of ClassDefType.fields
+    | `FuncDef
+        of FuncDefType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match PythonNodeType.wrap context (c_value) with
+      | `ClassDef _
+      | `FuncDef _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and ClassDefType : sig
+   
+  
+   
+  type t = [
+    | `ClassDef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: IdType.t
+    Lazy.t;
+         
+    f_bases: ExprListType.t
+    option
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ClassDef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: IdType.t
+    Lazy.t;
+         
+    f_bases: ExprListType.t
+    option
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.class_def_f_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         IdType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_bases () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.class_def_f_bases
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprListType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    let f_statements () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.class_def_f_statements
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AssertStmt _
+      | `AssignStmt _
+      | `AugAssignStmt _
+      | `BreakStmt _
+      | `ContinueStmt _
+      | `DelStmt _
+      | `ExecStmt _
+      | `ExprList _
+      | `GlobalStmt _
+      | `ImportFrom _
+      | `ImportName _
+      | `PassStmt _
+      | `PrintStmt _
+      | `PythonNodeList _
+      | `RaiseStmt _
+      | `ReturnStmt _
+      | `StreamPrintStmt _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ClassDef {
+        f_name
+          = Lazy.from_fun f_name ;
+        f_bases
+          = Lazy.from_fun f_bases ;
+        f_statements
+          = Lazy.from_fun f_statements ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and FuncDefType : sig
+   
+  
+   
+  type t = [
+    | `FuncDef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: IdType.t
+    Lazy.t;
+         
+    f_parameters: ParamsType.t
+    option
+    Lazy.t;
+         
+    f_body: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `FuncDef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: IdType.t
+    Lazy.t;
+         
+    f_parameters: ParamsType.t
+    option
+    Lazy.t;
+         
+    f_body: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.func_def_f_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         IdType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_parameters () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.func_def_f_parameters
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ParamsType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    let f_body () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.func_def_f_body
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AssertStmt _
+      | `AssignStmt _
+      | `AugAssignStmt _
+      | `BreakStmt _
+      | `ContinueStmt _
+      | `DelStmt _
+      | `ExecStmt _
+      | `ExprList _
+      | `GlobalStmt _
+      | `ImportFrom _
+      | `ImportName _
+      | `PassStmt _
+      | `PrintStmt _
+      | `PythonNodeList _
+      | `RaiseStmt _
+      | `ReturnStmt _
+      | `StreamPrintStmt _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `FuncDef {
+        f_name
+          = Lazy.from_fun f_name ;
+        f_parameters
+          = Lazy.from_fun f_parameters ;
+        f_body
+          = Lazy.from_fun f_body ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and DelStmtType : sig
+   
+  
+   
+  type t = [
+    | `DelStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `DelStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.del_stmt_f_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `DelStmt {
+        f_exprs
+          = Lazy.from_fun f_exprs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ElifBranchType : sig
+   
+  
+   
+  type t = [
+    | `ElifBranch
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ElifBranch
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_cond_test () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.elif_branch_f_cond_test
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_statements () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.elif_branch_f_statements
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AssertStmt _
+      | `AssignStmt _
+      | `AugAssignStmt _
+      | `BreakStmt _
+      | `ContinueStmt _
+      | `DelStmt _
+      | `ExecStmt _
+      | `ExprList _
+      | `GlobalStmt _
+      | `ImportFrom _
+      | `ImportName _
+      | `PassStmt _
+      | `PrintStmt _
+      | `PythonNodeList _
+      | `RaiseStmt _
+      | `ReturnStmt _
+      | `StreamPrintStmt _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ElifBranch {
+        f_cond_test
+          = Lazy.from_fun f_cond_test ;
+        f_statements
+          = Lazy.from_fun f_statements ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ExecStmtType : sig
+   
+  
+   
+  type t = [
+    | `ExecStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_in_list: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ExecStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_in_list: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.exec_stmt_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `ArithExpr _
+      | `CallExpr _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `InlineEval _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NumberLit _
+      | `OrExpr _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_in_list () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.exec_stmt_f_in_list
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprListType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ExecStmt {
+        f_expr
+          = Lazy.from_fun f_expr ;
+        f_in_list
+          = Lazy.from_fun f_in_list ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ForStmtType : sig
+   
+  
+   
+  type t = [
+    | `ForStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_bindings: ExprListType.t
+    Lazy.t;
+         
+    f_expr: ExprListType.t
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ForStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_bindings: ExprListType.t
+    Lazy.t;
+         
+    f_expr: ExprListType.t
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_bindings () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.for_stmt_f_bindings
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.for_stmt_f_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_statements () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.for_stmt_f_statements
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AssertStmt _
+      | `AssignStmt _
+      | `AugAssignStmt _
+      | `BreakStmt _
+      | `ContinueStmt _
+      | `DelStmt _
+      | `ExecStmt _
+      | `ExprList _
+      | `GlobalStmt _
+      | `ImportFrom _
+      | `ImportName _
+      | `PassStmt _
+      | `PrintStmt _
+      | `PythonNodeList _
+      | `RaiseStmt _
+      | `ReturnStmt _
+      | `StreamPrintStmt _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_else_part () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.for_stmt_f_else_part
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ElsePartType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ForStmt {
+        f_bindings
+          = Lazy.from_fun f_bindings ;
+        f_expr
+          = Lazy.from_fun f_expr ;
+        f_statements
+          = Lazy.from_fun f_statements ;
+        f_else_part
+          = Lazy.from_fun f_else_part ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and GlobalStmtType : sig
+   
+  
+   
+  type t = [
+    | `GlobalStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_names: IdListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `GlobalStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_names: IdListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_names () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.global_stmt_f_names
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         IdListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `GlobalStmt {
+        f_names
+          = Lazy.from_fun f_names ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and IfStmtType : sig
+   
+  
+   
+  type t = [
+    | `IfStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_elif_branchs: ElifBranchListType.t
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `IfStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_elif_branchs: ElifBranchListType.t
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_cond_test () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.if_stmt_f_cond_test
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_statements () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.if_stmt_f_statements
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AssertStmt _
+      | `AssignStmt _
+      | `AugAssignStmt _
+      | `BreakStmt _
+      | `ContinueStmt _
+      | `DelStmt _
+      | `ExecStmt _
+      | `ExprList _
+      | `GlobalStmt _
+      | `ImportFrom _
+      | `ImportName _
+      | `PassStmt _
+      | `PrintStmt _
+      | `PythonNodeList _
+      | `RaiseStmt _
+      | `ReturnStmt _
+      | `StreamPrintStmt _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_elif_branchs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.if_stmt_f_elif_branchs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ElifBranchListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_else_part () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.if_stmt_f_else_part
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ElsePartType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `IfStmt {
+        f_cond_test
+          = Lazy.from_fun f_cond_test ;
+        f_statements
+          = Lazy.from_fun f_statements ;
+        f_elif_branchs
+          = Lazy.from_fun f_elif_branchs ;
+        f_else_part
+          = Lazy.from_fun f_else_part ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ImportFromType : sig
+   
+  
+   
+  type t = [
+    | `ImportFrom
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_rel_name: [
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `RelName
+          of RelNameType.fields
+    ]
+    Lazy.t;
+         
+    f_imported: [
+      | `ImportStar
+          of ImportStarType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ImportFrom
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_rel_name: [
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `RelName
+          of RelNameType.fields
+    ]
+    Lazy.t;
+         
+    f_imported: [
+      | `ImportStar
+          of ImportStarType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_rel_name () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.import_from_f_rel_name
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `DottedName _
+      | `Id _
+      | `RelName _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_imported () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.import_from_f_imported
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `ImportStar _
+      | `PythonNodeList _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ImportFrom {
+        f_rel_name
+          = Lazy.from_fun f_rel_name ;
+        f_imported
+          = Lazy.from_fun f_imported ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ImportNameType : sig
+   
+  
+   
+  type t = [
+    | `ImportName
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_imported_names: PythonNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ImportName
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_imported_names: PythonNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_imported_names () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.import_name_f_imported_names
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ImportName {
+        f_imported_names
+          = Lazy.from_fun f_imported_names ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and PassStmtType : sig
+   
+  
+   
+  type t = [
+    | `PassStmt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `PassStmt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `PassStmt {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and PrintStmtType : sig
+   
+  
+   
+  type t = [
+    | `PrintStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `PrintStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.print_stmt_f_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `PrintStmt {
+        f_exprs
+          = Lazy.from_fun f_exprs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and RaiseStmtType : sig
+   
+  
+   
+  type t = [
+    | `RaiseStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `RaiseStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.raise_stmt_f_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprListType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `RaiseStmt {
+        f_exprs
+          = Lazy.from_fun f_exprs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and ReturnStmtType : sig
+   
+  
+   
+  type t = [
+    | `ReturnStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `ReturnStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.return_stmt_f_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ExprListType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `ReturnStmt {
+        f_exprs
+          = Lazy.from_fun f_exprs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and StreamPrintStmtType : sig
+   
+  
+   
+  type t = [
+    | `StreamPrintStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_stream_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `StreamPrintStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_stream_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_stream_expr () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.stream_print_stmt_f_stream_expr
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_exprs () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.stream_print_stmt_f_exprs
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `StreamPrintStmt {
+        f_stream_expr
+          = Lazy.from_fun f_stream_expr ;
+        f_exprs
+          = Lazy.from_fun f_exprs ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and TryStmtType : sig
+   
+  
+   
+  type t = [
+    | `TryStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_except_parts: ExceptPartListType.t
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+         
+    f_finally_part: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `TryStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_except_parts: ExceptPartListType.t
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+         
+    f_finally_part: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_statements () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.try_stmt_f_statements
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AssertStmt _
+      | `AssignStmt _
+      | `AugAssignStmt _
+      | `BreakStmt _
+      | `ContinueStmt _
+      | `DelStmt _
+      | `ExecStmt _
+      | `ExprList _
+      | `GlobalStmt _
+      | `ImportFrom _
+      | `ImportName _
+      | `PassStmt _
+      | `PrintStmt _
+      | `PythonNodeList _
+      | `RaiseStmt _
+      | `ReturnStmt _
+      | `StreamPrintStmt _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_except_parts () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.try_stmt_f_except_parts
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExceptPartListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_else_part () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.try_stmt_f_else_part
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ElsePartType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    let f_finally_part () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.try_stmt_f_finally_part
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (PythonNodeType.wrap context (field_c_value))
+      in
+         
+
+      match node with
+            
+      | Some `AssertStmt _
+      | Some `AssignStmt _
+      | Some `AugAssignStmt _
+      | Some `BreakStmt _
+      | Some `ContinueStmt _
+      | Some `DelStmt _
+      | Some `ExecStmt _
+      | Some `ExprList _
+      | Some `GlobalStmt _
+      | Some `ImportFrom _
+      | Some `ImportName _
+      | Some `PassStmt _
+      | Some `PrintStmt _
+      | Some `PythonNodeList _
+      | Some `RaiseStmt _
+      | Some `ReturnStmt _
+      | Some `StreamPrintStmt _
+      | Some `YieldExpr _
+      | None as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `TryStmt {
+        f_statements
+          = Lazy.from_fun f_statements ;
+        f_except_parts
+          = Lazy.from_fun f_except_parts ;
+        f_else_part
+          = Lazy.from_fun f_else_part ;
+        f_finally_part
+          = Lazy.from_fun f_finally_part ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and WhileStmtType : sig
+   
+  
+   
+  type t = [
+    | `WhileStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `WhileStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_cond_test () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.while_stmt_f_cond_test
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         ExprType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AndExpr _
+      | `AndOp _
+      | `ArithExpr _
+      | `CallExpr _
+      | `CompOp _
+      | `ConcatStringLit _
+      | `DictComp _
+      | `DictLit _
+      | `DottedName _
+      | `Factor _
+      | `Id _
+      | `IfExpr _
+      | `InlineEval _
+      | `LambdaDef _
+      | `ListComp _
+      | `ListGen _
+      | `ListLit _
+      | `NotOp _
+      | `NumberLit _
+      | `OrExpr _
+      | `OrOp _
+      | `Power _
+      | `SetComp _
+      | `SetLit _
+      | `ShiftExpr _
+      | `StringLit _
+      | `SubscriptExpr _
+      | `Term _
+      | `TupleLit _
+      | `XorExpr _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_statements () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.while_stmt_f_statements
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AssertStmt _
+      | `AssignStmt _
+      | `AugAssignStmt _
+      | `BreakStmt _
+      | `ContinueStmt _
+      | `DelStmt _
+      | `ExecStmt _
+      | `ExprList _
+      | `GlobalStmt _
+      | `ImportFrom _
+      | `ImportName _
+      | `PassStmt _
+      | `PrintStmt _
+      | `PythonNodeList _
+      | `RaiseStmt _
+      | `ReturnStmt _
+      | `StreamPrintStmt _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    let f_else_part () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.while_stmt_f_else_part
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         if is_null (getf field_c_value EntityStruct.node) then None else Some (ElsePartType.wrap context (field_c_value))
+      in
+         
+
+      node
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `WhileStmt {
+        f_cond_test
+          = Lazy.from_fun f_cond_test ;
+        f_statements
+          = Lazy.from_fun f_statements ;
+        f_else_part
+          = Lazy.from_fun f_else_part ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and WithStmtType : sig
+   
+  
+   
+  type t = [
+    | `WithStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_bindings: AsNameNodeListType.t
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `WithStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_bindings: AsNameNodeListType.t
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    let f_bindings () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.with_stmt_f_bindings
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         AsNameNodeListType.wrap context (field_c_value)
+      in
+         
+
+      node
+    in
+    let f_statements () =
+      let field_c_value = make EntityStruct.c_type in
+      let _ : int = CFunctions.with_stmt_f_statements
+        (addr c_value)
+        (addr field_c_value)
+      in
+      let node =
+         PythonNodeType.wrap context (field_c_value)
+      in
+         
+
+      match node with
+            
+      | `AssertStmt _
+      | `AssignStmt _
+      | `AugAssignStmt _
+      | `BreakStmt _
+      | `ContinueStmt _
+      | `DelStmt _
+      | `ExecStmt _
+      | `ExprList _
+      | `GlobalStmt _
+      | `ImportFrom _
+      | `ImportName _
+      | `PassStmt _
+      | `PrintStmt _
+      | `PythonNodeList _
+      | `RaiseStmt _
+      | `ReturnStmt _
+      | `StreamPrintStmt _
+      | `YieldExpr _
+      as e -> e
+      | _ -> assert false
+    in
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `WithStmt {
+        f_bindings
+          = Lazy.from_fun f_bindings ;
+        f_statements
+          = Lazy.from_fun f_statements ;
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and VarArgsFlagType : sig
+   
+  
+   
+  type t = [
+    | `VarArgsFlagAbsent
+        of VarArgsFlagAbsentType.fields
+    | `VarArgsFlagPresent
+        of VarArgsFlagPresentType.fields
+  ]
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `VarArgsFlagAbsent
+        of VarArgsFlagAbsentType.fields
+    | `VarArgsFlagPresent
+        of VarArgsFlagPresentType.fields
+  ]
+
+
+  let wrap context c_value =
+    (* This is an abstract node, call the root wrap function and filter to get
+     the desired type *)
+    match PythonNodeType.wrap context (c_value) with
+      | `VarArgsFlagAbsent _
+      | `VarArgsFlagPresent _
+      as e -> e
+      | _ ->
+          (* This should not happen if the types are correct *)
+          assert false
+
+end
+
+      
+and VarArgsFlagAbsentType : sig
+   
+  
+   
+  type t = [
+    | `VarArgsFlagAbsent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `VarArgsFlagAbsent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `VarArgsFlagAbsent {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+      
+and VarArgsFlagPresentType : sig
+   
+  
+   
+  type t = [
+    | `VarArgsFlagPresent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+  val wrap :
+    AnalysisContext.t
+    -> EntityStruct.t structure
+    -> t
+
+end = struct
+   
+  
+   
+  type t = [
+    | `VarArgsFlagPresent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+
+  let wrap context c_value =
+    if is_null (getf c_value EntityStruct.node) then
+      raise SyntaxError
+    else
+      `VarArgsFlagPresent {
+        c_value = c_value;
+        context = context
+      }
+
+end
+
+
+and Entity : sig
+  type t = EntityStruct.t structure
+
+  val info : t -> EntityInfo.t
+
+  val equal : t -> t -> bool
+
+  val compare : t -> t -> int
+
+  val hash : t -> int
+end = struct
+  type t = EntityStruct.t structure
+
+  let info value =
+    EntityInfo.wrap (getf value EntityStruct.info)
+
+  let compare e1 e2 =
+    let open Pervasives in
+    let compare_node =
+      compare (getf e1 EntityStruct.node) (getf e2 EntityStruct.node)
+    in
+    if compare_node = 0 then
+      compare
+        (getf (getf e1 EntityStruct.info) EntityInfoStruct.rebindings)
+        (getf (getf e2 EntityStruct.info) EntityInfoStruct.rebindings)
+    else
+      compare_node
+
+  let equal e1 e2 =
+    compare e1 e2 = 0
+
+  let hash e =
+    Hashtbl.hash
+      ( getf e EntityStruct.node
+      , getf (getf e EntityStruct.info) EntityInfoStruct.rebindings )
+end
+
+and AnalysisUnit : sig
+  type t = {
+    c_value : AnalysisUnitStruct.t;
+    context : AnalysisContext.t
+  }
+
+  val root : t -> PythonNodeType.t option
+  val diagnostics : t -> Diagnostic.t list
+  val filename : t -> string
+  val reparse : ?charset:string -> ?buffer:string -> t -> unit
+  val first_token : t -> Token.t
+  val last_token : t -> Token.t
+  val token_count : t -> int
+  val trivia_count : t -> int
+  val token_table : t -> TokenTable.t
+
+  
+  val fold_tokens : ('a -> Token.t -> 'a) -> 'a -> t -> 'a
+  (**
+   * Fold all the token this node contains by calling f on each token.
+   *)
+
+  val iter_tokens : (Token.t -> unit) -> t-> unit
+  (**
+   * Iterate over all token this node contains by calling f on each token.
+   *)
+
+  val map_tokens : (Token.t -> 'a) -> t -> 'a list
+  (**
+   * Map each token calling the given function
+   *)
+
+  val tokens : t -> Token.t list
+  (**
+   * Return a list of tokens for the given node
+   *)
+
+
+  val wrap : AnalysisContext.t -> AnalysisUnitStruct.t -> t
+  val unwrap : t -> AnalysisUnitStruct.t
+end = struct
+  type t = {
+    c_value : AnalysisUnitStruct.t;
+    context : AnalysisContext.t
+  }
+
+  let root analysis_unit =
+    let c_value = make EntityStruct.c_type in
+    AnalysisUnitStruct.unit_root
+      (AnalysisUnit.unwrap (analysis_unit))
+      (addr c_value);
+    if is_null (getf c_value EntityStruct.node) then None else Some (PythonNodeType.wrap analysis_unit.context (c_value))
+
+  let diagnostics unit =
+    let c_unit = AnalysisUnit.unwrap (unit) in
+    let length = AnalysisUnitStruct.unit_diagnostic_count c_unit in
+    let f i =
+      let diag = allocate_n Diagnostic.c_type ~count:1 in
+      let _ : int = AnalysisUnitStruct.unit_diagnostic c_unit i diag in
+      !@ diag
+    in
+    List.init length f
+
+  let filename unit =
+    unwrap_str( AnalysisUnitStruct.unit_filename
+      (AnalysisUnit.unwrap (unit)))
+
+  let reparse ?charset:(charset="") ?buffer ctx =
+    match buffer with
+    | None ->
+        ignore
+          (AnalysisUnitStruct.unit_reparse_from_file ctx.c_value charset)
+    | Some buffer ->
+        ignore (AnalysisUnitStruct.unit_reparse_from_buffer ctx.c_value
+          charset buffer (Unsigned.Size_t.of_int (String.length buffer)))
+
+  let first_token unit =
+    let c_unit = AnalysisUnit.unwrap (unit) in
+    let result_ptr = allocate_n Token.c_type ~count:1 in
+    AnalysisUnitStruct.unit_first_token c_unit result_ptr ;
+    !@ result_ptr
+
+  let last_token unit =
+    let c_unit = AnalysisUnit.unwrap (unit) in
+    let result_ptr = allocate_n Token.c_type ~count:1 in
+    AnalysisUnitStruct.unit_last_token c_unit result_ptr ;
+    !@ result_ptr
+
+  let token_count unit =
+    AnalysisUnitStruct.unit_token_count
+      (AnalysisUnit.unwrap (unit))
+
+  let trivia_count unit =
+    AnalysisUnitStruct.unit_trivia_count
+      (AnalysisUnit.unwrap (unit))
+
+  let token_table unit =
+    let c_unit = AnalysisUnit.unwrap (unit) in
+    let table =
+      TokenTable.create
+        (AnalysisUnitStruct.unit_token_count c_unit
+         + AnalysisUnitStruct.unit_trivia_count c_unit)
+    in
+    if TokenTable.length table > 0 then begin
+      let c_table = TokenTable.unwrap table in
+      let _ : int =
+        AnalysisUnitStruct.unit_export_tokens c_unit (addr c_table)
+      in
+      ()
+    end;
+    table
+
+  
+  let fold_tokens f init node =
+    let tok_start = first_token node in
+    let tok_end = last_token node in
+    let rec aux acc tok_curr =
+      let new_acc = f acc tok_curr in
+      if Token.equal tok_curr tok_end then
+        new_acc
+      else
+        aux new_acc (Token.next tok_curr)
+    in
+    aux init tok_start
+
+  let iter_tokens f node =
+    let tok_start = first_token node in
+    let tok_end = last_token node in
+    let rec aux tok_curr =
+      f tok_curr;
+      if not (Token.equal tok_curr tok_end) then
+        aux (Token.next tok_curr)
+    in
+    aux tok_start
+
+  let map_tokens f node =
+    let tok_start = first_token node in
+    let tok_end = last_token node in
+    let rec aux tok_curr =
+      let value = f tok_curr in
+      if Token.equal tok_curr tok_end then
+        [value]
+      else
+        value :: aux (Token.next tok_curr)
+    in
+    aux tok_start
+
+  let tokens node =
+    map_tokens (fun x -> x) node
+
+
+  let wrap context c_value = {
+    c_value=c_value;
+    context=context;
+  }
+
+  let unwrap {c_value} = c_value
+end
+
+and AnalysisContext : sig
+  type t = {
+    c_value : AnalysisContextStruct.t;
+    unit_provider : UnitProvider.t }
+
+  val create :
+    ?charset:string
+    -> ?with_trivia:bool
+    -> ?tab_stop:int
+    -> ?unit_provider:UnitProvider.t
+    -> unit
+    -> t
+
+  val get_from_file :
+    ?charset:string
+    -> ?reparse:bool
+    -> ?grammar_rule:GrammarRule.t
+    -> t
+    -> string
+    -> AnalysisUnit.t
+
+  val get_from_buffer :
+    ?charset:string
+    -> ?grammar_rule:GrammarRule.t
+    -> t
+    -> string
+    -> string
+    -> AnalysisUnit.t
+end = struct
+  type t = {
+    c_value : AnalysisContextStruct.t;
+    unit_provider : UnitProvider.t }
+
+  let create
+    ?charset:(charset="")
+    ?with_trivia:(with_trivia=true)
+    ?tab_stop:(tab_stop=8)
+    ?unit_provider:(unit_provider=UnitProvider.null) () : t =
+    if tab_stop < 1 then
+      raise (Invalid_argument "Invalid tab_stop (positive integer expected)") ;
+    let c_context =
+       AnalysisContextStruct.create_analysis_context
+         charset
+         (!@unit_provider)
+         with_trivia
+         tab_stop
+    in
+    { c_value= c_context
+      ; unit_provider= unit_provider }
+
+  let get_from_file
+    ?charset:(charset="")
+    ?reparse:(reparse=false)
+    ?grammar_rule:(grammar_rule=default_grammar_rule)
+    ctx
+    filename : AnalysisUnit.t =
+
+    AnalysisUnit.wrap ctx (AnalysisContextStruct.get_analysis_unit_from_file ctx.c_value filename charset reparse grammar_rule)
+
+  let get_from_buffer
+    ?charset:(charset="")
+    ?grammar_rule:(grammar_rule=default_grammar_rule)
+    ctx
+    filename
+    buffer : AnalysisUnit.t =
+
+    AnalysisUnit.wrap ctx (AnalysisContextStruct.get_analysis_unit_from_buffer ctx.c_value filename charset buffer (Unsigned.Size_t.of_int (String.length buffer)) grammar_rule)
+end
+
+
+and EntityInfo : sig
+   
+  
+  type t = {
+      rebindings :
+         Rebindings.t;
+      from_rebound :
+         bool;
+  }
+
+
+  val wrap : EntityInfoStruct.t structure -> t
+
+  val unwrap : t -> EntityInfoStruct.t structure
+
+
+end = struct
+   
+  
+  type t = {
+      rebindings :
+         Rebindings.t;
+      from_rebound :
+         bool;
+  }
+
+
+  let wrap c_value = {
+    rebindings = (getf c_value EntityInfoStruct.rebindings);
+    from_rebound = (getf c_value EntityInfoStruct.from_rebound);
+  }
+
+  let unwrap value =
+    let c_value = make EntityInfoStruct.c_type in
+    setf c_value
+      EntityInfoStruct.rebindings
+      (value.rebindings);
+    setf c_value
+      EntityInfoStruct.from_rebound
+      (value.from_rebound);
+    c_value
+
+
+end
+
+
+
+
+
+   
+module TextType : sig
+   
+  type t = string
+
+  val wrap : TextTypeStruct.t structure ptr -> t
+
+  val unwrap : t -> TextTypeStruct.t structure ptr
+
+end = struct
+   
+  type t = string
+
+  let wrap c_value_ptr =
+    let open Text in
+    let open Camomile in
+    let c_value = !@ c_value_ptr in
+    let length = getf c_value TextTypeStruct.n in
+    let items = c_value @. TextTypeStruct.items in
+    (* We use Camomile to encode utf32 strings to an ocaml string *)
+    let f i = UChar.chr_of_uint (Unsigned.UInt32.to_int !@(items +@ i)) in
+    let result =
+      UCS4Encoding.encode CharEncoding.utf8 (UCS4.init length f)
+    in
+    TextTypeStruct.dec_ref c_value_ptr;
+    result
+
+  let unwrap value =
+    let open Text in
+    let open Camomile in
+    let text = UCS4Encoding.decode CharEncoding.utf8 value in
+    let result = TextTypeStruct.create (UCS4.length text) in
+    let items = result |-> TextTypeStruct.items in
+    let i = ref 0 in
+    let f c =
+      items +@ !i <-@ Unsigned.UInt32.of_int (UChar.code c);
+      i := !i + 1
+    in
+    UCS4.iter f text;
+    result
+
+
+end
+
+   
+module PythonNodeArray : sig
+   
+  type t = PythonNodeType.t list
+
+  val wrap : AnalysisContext.t -> PythonNodeArrayStruct.t structure ptr -> t
+
+  val unwrap : t -> PythonNodeArrayStruct.t structure ptr
+
+end = struct
+   
+  type t = PythonNodeType.t list
+
+  let wrap context c_value_ptr =
+    let c_value = !@ c_value_ptr in
+    let length = getf c_value PythonNodeArrayStruct.n in
+    let items = c_value @. PythonNodeArrayStruct.items in
+    let f i =
+      (* we want to allocate a fresh value for a record, otherwize, the c value
+       * will still point to the memory at array location *)
+      let fresh =
+        allocate EntityStruct.c_type (!@ (items +@ i))
+      in
+      PythonNodeType.wrap context (!@ fresh)
+    in
+    let result = List.init length f in
+    PythonNodeArrayStruct.dec_ref c_value_ptr;
+    result
+
+  let unwrap value =
+    let result = PythonNodeArrayStruct.create (List.length value) in
+    let items = result |-> PythonNodeArrayStruct.items in
+    let f i v =
+      items +@ i <-@
+        PythonNodeType.unwrap (v)
+    in
+    List.iteri f value;
+    result
+
+
+end
+
+
+let context node =
+  (* Given any node, extract the context field *)
+  match (node :> PythonNodeType.t) with
+  | `ArgAssoc fields -> fields.context
+  | `ArgGen fields -> fields.context
+  | `KwArgs fields -> fields.context
+  | `VarArgs fields -> fields.context
+  | `AsNameNode fields -> fields.context
+  | `CompIf fields -> fields.context
+  | `CompOpKindDiamond fields -> fields.context
+  | `CompOpKindEq fields -> fields.context
+  | `CompOpKindGt fields -> fields.context
+  | `CompOpKindGte fields -> fields.context
+  | `CompOpKindIn fields -> fields.context
+  | `CompOpKindIs fields -> fields.context
+  | `CompOpKindIsnot fields -> fields.context
+  | `CompOpKindLt fields -> fields.context
+  | `CompOpKindLte fields -> fields.context
+  | `CompOpKindNoteq fields -> fields.context
+  | `CompOpKindNotin fields -> fields.context
+  | `CompFor fields -> fields.context
+  | `CompForL fields -> fields.context
+  | `Decorator fields -> fields.context
+  | `DictAssoc fields -> fields.context
+  | `ElsePart fields -> fields.context
+  | `ExceptPart fields -> fields.context
+  | `AndExpr fields -> fields.context
+  | `AndOp fields -> fields.context
+  | `ArithExpr fields -> fields.context
+  | `ShiftExpr fields -> fields.context
+  | `Term fields -> fields.context
+  | `CallExpr fields -> fields.context
+  | `CompOp fields -> fields.context
+  | `ConcatStringLit fields -> fields.context
+  | `DictComp fields -> fields.context
+  | `DictLit fields -> fields.context
+  | `Dot fields -> fields.context
+  | `EllipsisExpr fields -> fields.context
+  | `Factor fields -> fields.context
+  | `IfExpr fields -> fields.context
+  | `InlineEval fields -> fields.context
+  | `LambdaDef fields -> fields.context
+  | `ListComp fields -> fields.context
+  | `ListGen fields -> fields.context
+  | `ListLit fields -> fields.context
+  | `DottedName fields -> fields.context
+  | `Id fields -> fields.context
+  | `NotOp fields -> fields.context
+  | `NumberLit fields -> fields.context
+  | `OrExpr fields -> fields.context
+  | `OrOp fields -> fields.context
+  | `Power fields -> fields.context
+  | `SetComp fields -> fields.context
+  | `SetLit fields -> fields.context
+  | `SliceExpr fields -> fields.context
+  | `ExtSliceExpr fields -> fields.context
+  | `StringLit fields -> fields.context
+  | `SubscriptExpr fields -> fields.context
+  | `TupleLit fields -> fields.context
+  | `XorExpr fields -> fields.context
+  | `YieldExpr fields -> fields.context
+  | `FileNode fields -> fields.context
+  | `ImportStar fields -> fields.context
+  | `KwArgsFlagAbsent fields -> fields.context
+  | `KwArgsFlagPresent fields -> fields.context
+  | `NL fields -> fields.context
+  | `Op fields -> fields.context
+  | `Params fields -> fields.context
+  | `ArgList fields -> fields.context
+  | `AsNameNodeList fields -> fields.context
+  | `DecoratorList fields -> fields.context
+  | `DictAssocList fields -> fields.context
+  | `DotList fields -> fields.context
+  | `ElifBranchList fields -> fields.context
+  | `ExceptPartList fields -> fields.context
+  | `ExprList fields -> fields.context
+  | `IdList fields -> fields.context
+  | `NLList fields -> fields.context
+  | `PythonNodeList fields -> fields.context
+  | `SingleParamList fields -> fields.context
+  | `StringLitList fields -> fields.context
+  | `RelName fields -> fields.context
+  | `SingleParam fields -> fields.context
+  | `AssertStmt fields -> fields.context
+  | `AssignStmt fields -> fields.context
+  | `AugAssignStmt fields -> fields.context
+  | `BreakStmt fields -> fields.context
+  | `ContinueStmt fields -> fields.context
+  | `Decorated fields -> fields.context
+  | `ClassDef fields -> fields.context
+  | `FuncDef fields -> fields.context
+  | `DelStmt fields -> fields.context
+  | `ElifBranch fields -> fields.context
+  | `ExecStmt fields -> fields.context
+  | `ForStmt fields -> fields.context
+  | `GlobalStmt fields -> fields.context
+  | `IfStmt fields -> fields.context
+  | `ImportFrom fields -> fields.context
+  | `ImportName fields -> fields.context
+  | `PassStmt fields -> fields.context
+  | `PrintStmt fields -> fields.context
+  | `RaiseStmt fields -> fields.context
+  | `ReturnStmt fields -> fields.context
+  | `StreamPrintStmt fields -> fields.context
+  | `TryStmt fields -> fields.context
+  | `WhileStmt fields -> fields.context
+  | `WithStmt fields -> fields.context
+  | `VarArgsFlagAbsent fields -> fields.context
+  | `VarArgsFlagPresent fields -> fields.context
+
+type _ node =
+  | PythonNode :
+      PythonNodeType.t node
+  | Arg :
+      ArgType.t node
+  | ArgAssoc :
+      ArgAssocType.t node
+  | ArgGen :
+      ArgGenType.t node
+  | KwArgs :
+      KwArgsType.t node
+  | VarArgs :
+      VarArgsType.t node
+  | AsNameNode :
+      AsNameNodeType.t node
+  | CompIf :
+      CompIfType.t node
+  | CompOpKind :
+      CompOpKindType.t node
+  | CompOpKindDiamond :
+      CompOpKindDiamondType.t node
+  | CompOpKindEq :
+      CompOpKindEqType.t node
+  | CompOpKindGt :
+      CompOpKindGtType.t node
+  | CompOpKindGte :
+      CompOpKindGteType.t node
+  | CompOpKindIn :
+      CompOpKindInType.t node
+  | CompOpKindIs :
+      CompOpKindIsType.t node
+  | CompOpKindIsnot :
+      CompOpKindIsnotType.t node
+  | CompOpKindLt :
+      CompOpKindLtType.t node
+  | CompOpKindLte :
+      CompOpKindLteType.t node
+  | CompOpKindNoteq :
+      CompOpKindNoteqType.t node
+  | CompOpKindNotin :
+      CompOpKindNotinType.t node
+  | Comprehension :
+      ComprehensionType.t node
+  | CompFor :
+      CompForType.t node
+  | CompForL :
+      CompForLType.t node
+  | Decorator :
+      DecoratorType.t node
+  | DictAssoc :
+      DictAssocType.t node
+  | ElsePart :
+      ElsePartType.t node
+  | ExceptPart :
+      ExceptPartType.t node
+  | Expr :
+      ExprType.t node
+  | AndExpr :
+      AndExprType.t node
+  | AndOp :
+      AndOpType.t node
+  | BinOp :
+      BinOpType.t node
+  | ArithExpr :
+      ArithExprType.t node
+  | ShiftExpr :
+      ShiftExprType.t node
+  | Term :
+      TermType.t node
+  | CallExpr :
+      CallExprType.t node
+  | CompOp :
+      CompOpType.t node
+  | ConcatStringLit :
+      ConcatStringLitType.t node
+  | DictComp :
+      DictCompType.t node
+  | DictLit :
+      DictLitType.t node
+  | Dot :
+      DotType.t node
+  | EllipsisExpr :
+      EllipsisExprType.t node
+  | Factor :
+      FactorType.t node
+  | IfExpr :
+      IfExprType.t node
+  | InlineEval :
+      InlineEvalType.t node
+  | LambdaDef :
+      LambdaDefType.t node
+  | ListComp :
+      ListCompType.t node
+  | ListGen :
+      ListGenType.t node
+  | ListLit :
+      ListLitType.t node
+  | Name :
+      NameType.t node
+  | DottedName :
+      DottedNameType.t node
+  | Id :
+      IdType.t node
+  | NotOp :
+      NotOpType.t node
+  | NumberLit :
+      NumberLitType.t node
+  | OrExpr :
+      OrExprType.t node
+  | OrOp :
+      OrOpType.t node
+  | Power :
+      PowerType.t node
+  | SetComp :
+      SetCompType.t node
+  | SetLit :
+      SetLitType.t node
+  | SliceExpr :
+      SliceExprType.t node
+  | ExtSliceExpr :
+      ExtSliceExprType.t node
+  | StringLit :
+      StringLitType.t node
+  | SubscriptExpr :
+      SubscriptExprType.t node
+  | TupleLit :
+      TupleLitType.t node
+  | XorExpr :
+      XorExprType.t node
+  | YieldExpr :
+      YieldExprType.t node
+  | FileNode :
+      FileNodeType.t node
+  | ImportStar :
+      ImportStarType.t node
+  | KwArgsFlag :
+      KwArgsFlagType.t node
+  | KwArgsFlagAbsent :
+      KwArgsFlagAbsentType.t node
+  | KwArgsFlagPresent :
+      KwArgsFlagPresentType.t node
+  | NL :
+      NLType.t node
+  | Op :
+      OpType.t node
+  | Params :
+      ParamsType.t node
+  | PythonNodeBaseList :
+      PythonNodeBaseListType.t node
+  | ArgList :
+      ArgListType.t node
+  | AsNameNodeList :
+      AsNameNodeListType.t node
+  | DecoratorList :
+      DecoratorListType.t node
+  | DictAssocList :
+      DictAssocListType.t node
+  | DotList :
+      DotListType.t node
+  | ElifBranchList :
+      ElifBranchListType.t node
+  | ExceptPartList :
+      ExceptPartListType.t node
+  | ExprList :
+      ExprListType.t node
+  | IdList :
+      IdListType.t node
+  | NLList :
+      NLListType.t node
+  | PythonNodeList :
+      PythonNodeListType.t node
+  | SingleParamList :
+      SingleParamListType.t node
+  | StringLitList :
+      StringLitListType.t node
+  | RelName :
+      RelNameType.t node
+  | SingleParam :
+      SingleParamType.t node
+  | Stmt :
+      StmtType.t node
+  | AssertStmt :
+      AssertStmtType.t node
+  | AssignStmt :
+      AssignStmtType.t node
+  | AugAssignStmt :
+      AugAssignStmtType.t node
+  | BreakStmt :
+      BreakStmtType.t node
+  | ContinueStmt :
+      ContinueStmtType.t node
+  | Decorated :
+      DecoratedType.t node
+  | DefStmt :
+      DefStmtType.t node
+  | ClassDef :
+      ClassDefType.t node
+  | FuncDef :
+      FuncDefType.t node
+  | DelStmt :
+      DelStmtType.t node
+  | ElifBranch :
+      ElifBranchType.t node
+  | ExecStmt :
+      ExecStmtType.t node
+  | ForStmt :
+      ForStmtType.t node
+  | GlobalStmt :
+      GlobalStmtType.t node
+  | IfStmt :
+      IfStmtType.t node
+  | ImportFrom :
+      ImportFromType.t node
+  | ImportName :
+      ImportNameType.t node
+  | PassStmt :
+      PassStmtType.t node
+  | PrintStmt :
+      PrintStmtType.t node
+  | RaiseStmt :
+      RaiseStmtType.t node
+  | ReturnStmt :
+      ReturnStmtType.t node
+  | StreamPrintStmt :
+      StreamPrintStmtType.t node
+  | TryStmt :
+      TryStmtType.t node
+  | WhileStmt :
+      WhileStmtType.t node
+  | WithStmt :
+      WithStmtType.t node
+  | VarArgsFlag :
+      VarArgsFlagType.t node
+  | VarArgsFlagAbsent :
+      VarArgsFlagAbsentType.t node
+  | VarArgsFlagPresent :
+      VarArgsFlagPresentType.t node
+
+module VarArgsFlagPresent = struct
+  type t =
+    [
+      | `VarArgsFlagPresent of
+          VarArgsFlagPresentType.fields
+    ]
+
+  type fields = VarArgsFlagPresentType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module VarArgsFlagAbsent = struct
+  type t =
+    [
+      | `VarArgsFlagAbsent of
+          VarArgsFlagAbsentType.fields
+    ]
+
+  type fields = VarArgsFlagAbsentType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module VarArgsFlag = struct
+  type t =
+    [
+      | VarArgsFlagPresent.t
+      | VarArgsFlagAbsent.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+let p_as_bool
+    (node)
+    =
+      let result_ptr =
+        allocate_n bool ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.var_args_flag_p_as_bool
+          (addr (PythonNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+
+
+
+
+end
+
+module WithStmt = struct
+  type t =
+    [
+      | `WithStmt of
+          WithStmtType.fields
+    ]
+
+  type fields = WithStmtType.fields =
+    
+  {
+         
+    f_bindings: AsNameNodeListType.t
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_bindings node =
+    match (node :> WithStmtType.t) with
+    | `WithStmt fields ->
+        Lazy.force fields.f_bindings
+  let f_statements node =
+    match (node :> WithStmtType.t) with
+    | `WithStmt fields ->
+        Lazy.force fields.f_statements
+
+
+
+end
+
+module WhileStmt = struct
+  type t =
+    [
+      | `WhileStmt of
+          WhileStmtType.fields
+    ]
+
+  type fields = WhileStmtType.fields =
+    
+  {
+         
+    f_cond_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_cond_test node =
+    match (node :> WhileStmtType.t) with
+    | `WhileStmt fields ->
+        Lazy.force fields.f_cond_test
+  let f_statements node =
+    match (node :> WhileStmtType.t) with
+    | `WhileStmt fields ->
+        Lazy.force fields.f_statements
+  let f_else_part node =
+    match (node :> WhileStmtType.t) with
+    | `WhileStmt fields ->
+        Lazy.force fields.f_else_part
+
+
+
+end
+
+module TryStmt = struct
+  type t =
+    [
+      | `TryStmt of
+          TryStmtType.fields
+    ]
+
+  type fields = TryStmtType.fields =
+    
+  {
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_except_parts: ExceptPartListType.t
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+         
+    f_finally_part: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_statements node =
+    match (node :> TryStmtType.t) with
+    | `TryStmt fields ->
+        Lazy.force fields.f_statements
+  let f_except_parts node =
+    match (node :> TryStmtType.t) with
+    | `TryStmt fields ->
+        Lazy.force fields.f_except_parts
+  let f_else_part node =
+    match (node :> TryStmtType.t) with
+    | `TryStmt fields ->
+        Lazy.force fields.f_else_part
+  let f_finally_part node =
+    match (node :> TryStmtType.t) with
+    | `TryStmt fields ->
+        Lazy.force fields.f_finally_part
+
+
+
+end
+
+module StreamPrintStmt = struct
+  type t =
+    [
+      | `StreamPrintStmt of
+          StreamPrintStmtType.fields
+    ]
+
+  type fields = StreamPrintStmtType.fields =
+    
+  {
+         
+    f_stream_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_stream_expr node =
+    match (node :> StreamPrintStmtType.t) with
+    | `StreamPrintStmt fields ->
+        Lazy.force fields.f_stream_expr
+  let f_exprs node =
+    match (node :> StreamPrintStmtType.t) with
+    | `StreamPrintStmt fields ->
+        Lazy.force fields.f_exprs
+
+
+
+end
+
+module ReturnStmt = struct
+  type t =
+    [
+      | `ReturnStmt of
+          ReturnStmtType.fields
+    ]
+
+  type fields = ReturnStmtType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_exprs node =
+    match (node :> ReturnStmtType.t) with
+    | `ReturnStmt fields ->
+        Lazy.force fields.f_exprs
+
+
+
+end
+
+module RaiseStmt = struct
+  type t =
+    [
+      | `RaiseStmt of
+          RaiseStmtType.fields
+    ]
+
+  type fields = RaiseStmtType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_exprs node =
+    match (node :> RaiseStmtType.t) with
+    | `RaiseStmt fields ->
+        Lazy.force fields.f_exprs
+
+
+
+end
+
+module PrintStmt = struct
+  type t =
+    [
+      | `PrintStmt of
+          PrintStmtType.fields
+    ]
+
+  type fields = PrintStmtType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_exprs node =
+    match (node :> PrintStmtType.t) with
+    | `PrintStmt fields ->
+        Lazy.force fields.f_exprs
+
+
+
+end
+
+module PassStmt = struct
+  type t =
+    [
+      | `PassStmt of
+          PassStmtType.fields
+    ]
+
+  type fields = PassStmtType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module ImportName = struct
+  type t =
+    [
+      | `ImportName of
+          ImportNameType.fields
+    ]
+
+  type fields = ImportNameType.fields =
+    
+  {
+         
+    f_imported_names: PythonNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_imported_names node =
+    match (node :> ImportNameType.t) with
+    | `ImportName fields ->
+        Lazy.force fields.f_imported_names
+
+
+
+end
+
+module ImportFrom = struct
+  type t =
+    [
+      | `ImportFrom of
+          ImportFromType.fields
+    ]
+
+  type fields = ImportFromType.fields =
+    
+  {
+         
+    f_rel_name: [
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `RelName
+          of RelNameType.fields
+    ]
+    Lazy.t;
+         
+    f_imported: [
+      | `ImportStar
+          of ImportStarType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_rel_name node =
+    match (node :> ImportFromType.t) with
+    | `ImportFrom fields ->
+        Lazy.force fields.f_rel_name
+  let f_imported node =
+    match (node :> ImportFromType.t) with
+    | `ImportFrom fields ->
+        Lazy.force fields.f_imported
+
+
+
+end
+
+module IfStmt = struct
+  type t =
+    [
+      | `IfStmt of
+          IfStmtType.fields
+    ]
+
+  type fields = IfStmtType.fields =
+    
+  {
+         
+    f_cond_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_elif_branchs: ElifBranchListType.t
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_cond_test node =
+    match (node :> IfStmtType.t) with
+    | `IfStmt fields ->
+        Lazy.force fields.f_cond_test
+  let f_statements node =
+    match (node :> IfStmtType.t) with
+    | `IfStmt fields ->
+        Lazy.force fields.f_statements
+  let f_elif_branchs node =
+    match (node :> IfStmtType.t) with
+    | `IfStmt fields ->
+        Lazy.force fields.f_elif_branchs
+  let f_else_part node =
+    match (node :> IfStmtType.t) with
+    | `IfStmt fields ->
+        Lazy.force fields.f_else_part
+
+
+
+end
+
+module GlobalStmt = struct
+  type t =
+    [
+      | `GlobalStmt of
+          GlobalStmtType.fields
+    ]
+
+  type fields = GlobalStmtType.fields =
+    
+  {
+         
+    f_names: IdListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_names node =
+    match (node :> GlobalStmtType.t) with
+    | `GlobalStmt fields ->
+        Lazy.force fields.f_names
+
+
+
+end
+
+module ForStmt = struct
+  type t =
+    [
+      | `ForStmt of
+          ForStmtType.fields
+    ]
+
+  type fields = ForStmtType.fields =
+    
+  {
+         
+    f_bindings: ExprListType.t
+    Lazy.t;
+         
+    f_expr: ExprListType.t
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_bindings node =
+    match (node :> ForStmtType.t) with
+    | `ForStmt fields ->
+        Lazy.force fields.f_bindings
+  let f_expr node =
+    match (node :> ForStmtType.t) with
+    | `ForStmt fields ->
+        Lazy.force fields.f_expr
+  let f_statements node =
+    match (node :> ForStmtType.t) with
+    | `ForStmt fields ->
+        Lazy.force fields.f_statements
+  let f_else_part node =
+    match (node :> ForStmtType.t) with
+    | `ForStmt fields ->
+        Lazy.force fields.f_else_part
+
+
+
+end
+
+module ExecStmt = struct
+  type t =
+    [
+      | `ExecStmt of
+          ExecStmtType.fields
+    ]
+
+  type fields = ExecStmtType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_in_list: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> ExecStmtType.t) with
+    | `ExecStmt fields ->
+        Lazy.force fields.f_expr
+  let f_in_list node =
+    match (node :> ExecStmtType.t) with
+    | `ExecStmt fields ->
+        Lazy.force fields.f_in_list
+
+
+
+end
+
+module ElifBranch = struct
+  type t =
+    [
+      | `ElifBranch of
+          ElifBranchType.fields
+    ]
+
+  type fields = ElifBranchType.fields =
+    
+  {
+         
+    f_cond_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_cond_test node =
+    match (node :> ElifBranchType.t) with
+    | `ElifBranch fields ->
+        Lazy.force fields.f_cond_test
+  let f_statements node =
+    match (node :> ElifBranchType.t) with
+    | `ElifBranch fields ->
+        Lazy.force fields.f_statements
+
+
+
+end
+
+module DelStmt = struct
+  type t =
+    [
+      | `DelStmt of
+          DelStmtType.fields
+    ]
+
+  type fields = DelStmtType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_exprs node =
+    match (node :> DelStmtType.t) with
+    | `DelStmt fields ->
+        Lazy.force fields.f_exprs
+
+
+
+end
+
+module FuncDef = struct
+  type t =
+    [
+      | `FuncDef of
+          FuncDefType.fields
+    ]
+
+  type fields = FuncDefType.fields =
+    
+  {
+         
+    f_name: IdType.t
+    Lazy.t;
+         
+    f_parameters: ParamsType.t
+    option
+    Lazy.t;
+         
+    f_body: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_name node =
+    match (node :> FuncDefType.t) with
+    | `FuncDef fields ->
+        Lazy.force fields.f_name
+  let f_parameters node =
+    match (node :> FuncDefType.t) with
+    | `FuncDef fields ->
+        Lazy.force fields.f_parameters
+  let f_body node =
+    match (node :> FuncDefType.t) with
+    | `FuncDef fields ->
+        Lazy.force fields.f_body
+
+
+
+end
+
+module ClassDef = struct
+  type t =
+    [
+      | `ClassDef of
+          ClassDefType.fields
+    ]
+
+  type fields = ClassDefType.fields =
+    
+  {
+         
+    f_name: IdType.t
+    Lazy.t;
+         
+    f_bases: ExprListType.t
+    option
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_name node =
+    match (node :> ClassDefType.t) with
+    | `ClassDef fields ->
+        Lazy.force fields.f_name
+  let f_bases node =
+    match (node :> ClassDefType.t) with
+    | `ClassDef fields ->
+        Lazy.force fields.f_bases
+  let f_statements node =
+    match (node :> ClassDefType.t) with
+    | `ClassDef fields ->
+        Lazy.force fields.f_statements
+
+
+
+end
+
+module DefStmt = struct
+  type t =
+    [
+      | FuncDef.t
+      | ClassDef.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module Decorated = struct
+  type t =
+    [
+      | `Decorated of
+          DecoratedType.fields
+    ]
+
+  type fields = DecoratedType.fields =
+    
+  {
+         
+    f_decorators: DecoratorListType.t
+    Lazy.t;
+         
+    f_defn: DefStmtType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_decorators node =
+    match (node :> DecoratedType.t) with
+    | `Decorated fields ->
+        Lazy.force fields.f_decorators
+  let f_defn node =
+    match (node :> DecoratedType.t) with
+    | `Decorated fields ->
+        Lazy.force fields.f_defn
+
+
+
+end
+
+module ContinueStmt = struct
+  type t =
+    [
+      | `ContinueStmt of
+          ContinueStmtType.fields
+    ]
+
+  type fields = ContinueStmtType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module BreakStmt = struct
+  type t =
+    [
+      | `BreakStmt of
+          BreakStmtType.fields
+    ]
+
+  type fields = BreakStmtType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module AugAssignStmt = struct
+  type t =
+    [
+      | `AugAssignStmt of
+          AugAssignStmtType.fields
+    ]
+
+  type fields = AugAssignStmtType.fields =
+    
+  {
+         
+    f_l_value: ExprListType.t
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_r_value: [
+      | `ExprList
+          of ExprListType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_l_value node =
+    match (node :> AugAssignStmtType.t) with
+    | `AugAssignStmt fields ->
+        Lazy.force fields.f_l_value
+  let f_op node =
+    match (node :> AugAssignStmtType.t) with
+    | `AugAssignStmt fields ->
+        Lazy.force fields.f_op
+  let f_r_value node =
+    match (node :> AugAssignStmtType.t) with
+    | `AugAssignStmt fields ->
+        Lazy.force fields.f_r_value
+
+
+
+end
+
+module AssignStmt = struct
+  type t =
+    [
+      | `AssignStmt of
+          AssignStmtType.fields
+    ]
+
+  type fields = AssignStmtType.fields =
+    
+  {
+         
+    f_l_value: ExprListType.t
+    Lazy.t;
+         
+    f_r_values: PythonNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_l_value node =
+    match (node :> AssignStmtType.t) with
+    | `AssignStmt fields ->
+        Lazy.force fields.f_l_value
+  let f_r_values node =
+    match (node :> AssignStmtType.t) with
+    | `AssignStmt fields ->
+        Lazy.force fields.f_r_values
+
+
+
+end
+
+module AssertStmt = struct
+  type t =
+    [
+      | `AssertStmt of
+          AssertStmtType.fields
+    ]
+
+  type fields = AssertStmtType.fields =
+    
+  {
+         
+    f_test_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_msg: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_test_expr node =
+    match (node :> AssertStmtType.t) with
+    | `AssertStmt fields ->
+        Lazy.force fields.f_test_expr
+  let f_msg node =
+    match (node :> AssertStmtType.t) with
+    | `AssertStmt fields ->
+        Lazy.force fields.f_msg
+
+
+
+end
+
+module Stmt = struct
+  type t =
+    [
+      | Decorated.t
+      | DefStmt.t
+      | AugAssignStmt.t
+      | AssignStmt.t
+      | PrintStmt.t
+      | StreamPrintStmt.t
+      | DelStmt.t
+      | PassStmt.t
+      | BreakStmt.t
+      | ContinueStmt.t
+      | ReturnStmt.t
+      | RaiseStmt.t
+      | ImportName.t
+      | ImportFrom.t
+      | GlobalStmt.t
+      | ExecStmt.t
+      | AssertStmt.t
+      | IfStmt.t
+      | ElifBranch.t
+      | WhileStmt.t
+      | ForStmt.t
+      | TryStmt.t
+      | WithStmt.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module SingleParam = struct
+  type t =
+    [
+      | `SingleParam of
+          SingleParamType.fields
+    ]
+
+  type fields = SingleParamType.fields =
+    
+  {
+         
+    f_is_varargs: VarArgsFlagType.t
+    Lazy.t;
+         
+    f_is_kwargs: KwArgsFlagType.t
+    Lazy.t;
+         
+    f_name: [
+      | `Id
+          of IdType.fields
+      | `IdList
+          of IdListType.fields
+    ]
+    Lazy.t;
+         
+    f_default_value: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_is_varargs node =
+    match (node :> SingleParamType.t) with
+    | `SingleParam fields ->
+        Lazy.force fields.f_is_varargs
+  let f_is_kwargs node =
+    match (node :> SingleParamType.t) with
+    | `SingleParam fields ->
+        Lazy.force fields.f_is_kwargs
+  let f_name node =
+    match (node :> SingleParamType.t) with
+    | `SingleParam fields ->
+        Lazy.force fields.f_name
+  let f_default_value node =
+    match (node :> SingleParamType.t) with
+    | `SingleParam fields ->
+        Lazy.force fields.f_default_value
+
+
+
+end
+
+module RelName = struct
+  type t =
+    [
+      | `RelName of
+          RelNameType.fields
+    ]
+
+  type fields = RelNameType.fields =
+    
+  {
+         
+    f_dots: DotListType.t
+    Lazy.t;
+         
+    f_name: NameType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_dots node =
+    match (node :> RelNameType.t) with
+    | `RelName fields ->
+        Lazy.force fields.f_dots
+  let f_name node =
+    match (node :> RelNameType.t) with
+    | `RelName fields ->
+        Lazy.force fields.f_name
+
+
+
+end
+
+module StringLitList = struct
+  type t =
+    [
+      | `StringLitList of
+          StringLitListType.fields
+    ]
+
+  type fields = StringLitListType.fields =
+    
+  {
+    list : StringLitType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> StringLitListType.t) with
+    | `StringLitList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module SingleParamList = struct
+  type t =
+    [
+      | `SingleParamList of
+          SingleParamListType.fields
+    ]
+
+  type fields = SingleParamListType.fields =
+    
+  {
+    list : SingleParamType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> SingleParamListType.t) with
+    | `SingleParamList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module PythonNodeList = struct
+  type t =
+    [
+      | `PythonNodeList of
+          PythonNodeListType.fields
+    ]
+
+  type fields = PythonNodeListType.fields =
+    
+  {
+    list : PythonNodeType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> PythonNodeListType.t) with
+    | `PythonNodeList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module NLList = struct
+  type t =
+    [
+      | `NLList of
+          NLListType.fields
+    ]
+
+  type fields = NLListType.fields =
+    
+  {
+    list : NLType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> NLListType.t) with
+    | `NLList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module IdList = struct
+  type t =
+    [
+      | `IdList of
+          IdListType.fields
+    ]
+
+  type fields = IdListType.fields =
+    
+  {
+    list : IdType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> IdListType.t) with
+    | `IdList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module ExprList = struct
+  type t =
+    [
+      | `ExprList of
+          ExprListType.fields
+    ]
+
+  type fields = ExprListType.fields =
+    
+  {
+    list : ExprType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> ExprListType.t) with
+    | `ExprList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module ExceptPartList = struct
+  type t =
+    [
+      | `ExceptPartList of
+          ExceptPartListType.fields
+    ]
+
+  type fields = ExceptPartListType.fields =
+    
+  {
+    list : ExceptPartType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> ExceptPartListType.t) with
+    | `ExceptPartList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module ElifBranchList = struct
+  type t =
+    [
+      | `ElifBranchList of
+          ElifBranchListType.fields
+    ]
+
+  type fields = ElifBranchListType.fields =
+    
+  {
+    list : ElifBranchType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> ElifBranchListType.t) with
+    | `ElifBranchList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module DotList = struct
+  type t =
+    [
+      | `DotList of
+          DotListType.fields
+    ]
+
+  type fields = DotListType.fields =
+    
+  {
+    list : DotType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> DotListType.t) with
+    | `DotList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module DictAssocList = struct
+  type t =
+    [
+      | `DictAssocList of
+          DictAssocListType.fields
+    ]
+
+  type fields = DictAssocListType.fields =
+    
+  {
+    list : DictAssocType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> DictAssocListType.t) with
+    | `DictAssocList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module DecoratorList = struct
+  type t =
+    [
+      | `DecoratorList of
+          DecoratorListType.fields
+    ]
+
+  type fields = DecoratorListType.fields =
+    
+  {
+    list : DecoratorType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> DecoratorListType.t) with
+    | `DecoratorList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module AsNameNodeList = struct
+  type t =
+    [
+      | `AsNameNodeList of
+          AsNameNodeListType.fields
+    ]
+
+  type fields = AsNameNodeListType.fields =
+    
+  {
+    list : AsNameNodeType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> AsNameNodeListType.t) with
+    | `AsNameNodeList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module ArgList = struct
+  type t =
+    [
+      | `ArgList of
+          ArgListType.fields
+    ]
+
+  type fields = ArgListType.fields =
+    
+  {
+    list : ArgType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+  let f_list node =
+    match (node :> ArgListType.t) with
+    | `ArgList fields ->
+        Lazy.force fields.list
+
+
+
+end
+
+module PythonNodeBaseList = struct
+  type t =
+    [
+      | ArgList.t
+      | ExprList.t
+      | DictAssocList.t
+      | StringLitList.t
+      | PythonNodeList.t
+      | DecoratorList.t
+      | IdList.t
+      | ElifBranchList.t
+      | DotList.t
+      | NLList.t
+      | ExceptPartList.t
+      | SingleParamList.t
+      | AsNameNodeList.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module Params = struct
+  type t =
+    [
+      | `Params of
+          ParamsType.fields
+    ]
+
+  type fields = ParamsType.fields =
+    
+  {
+         
+    f_single_params: SingleParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_single_params node =
+    match (node :> ParamsType.t) with
+    | `Params fields ->
+        Lazy.force fields.f_single_params
+
+
+
+end
+
+module Op = struct
+  type t =
+    [
+      | `Op of
+          OpType.fields
+    ]
+
+  type fields = OpType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module NL = struct
+  type t =
+    [
+      | `NL of
+          NLType.fields
+    ]
+
+  type fields = NLType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module KwArgsFlagPresent = struct
+  type t =
+    [
+      | `KwArgsFlagPresent of
+          KwArgsFlagPresentType.fields
+    ]
+
+  type fields = KwArgsFlagPresentType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module KwArgsFlagAbsent = struct
+  type t =
+    [
+      | `KwArgsFlagAbsent of
+          KwArgsFlagAbsentType.fields
+    ]
+
+  type fields = KwArgsFlagAbsentType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module KwArgsFlag = struct
+  type t =
+    [
+      | KwArgsFlagPresent.t
+      | KwArgsFlagAbsent.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+let p_as_bool
+    (node)
+    =
+      let result_ptr =
+        allocate_n bool ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.kw_args_flag_p_as_bool
+          (addr (PythonNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+
+
+
+
+end
+
+module ImportStar = struct
+  type t =
+    [
+      | `ImportStar of
+          ImportStarType.fields
+    ]
+
+  type fields = ImportStarType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module FileNode = struct
+  type t =
+    [
+      | `FileNode of
+          FileNodeType.fields
+    ]
+
+  type fields = FileNodeType.fields =
+    
+  {
+         
+    f_statements: PythonNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_statements node =
+    match (node :> FileNodeType.t) with
+    | `FileNode fields ->
+        Lazy.force fields.f_statements
+
+
+
+end
+
+module YieldExpr = struct
+  type t =
+    [
+      | `YieldExpr of
+          YieldExprType.fields
+    ]
+
+  type fields = YieldExprType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_exprs node =
+    match (node :> YieldExprType.t) with
+    | `YieldExpr fields ->
+        Lazy.force fields.f_exprs
+
+
+
+end
+
+module XorExpr = struct
+  type t =
+    [
+      | `XorExpr of
+          XorExprType.fields
+    ]
+
+  type fields = XorExprType.fields =
+    
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_left node =
+    match (node :> XorExprType.t) with
+    | `XorExpr fields ->
+        Lazy.force fields.f_left
+  let f_right node =
+    match (node :> XorExprType.t) with
+    | `XorExpr fields ->
+        Lazy.force fields.f_right
+
+
+
+end
+
+module TupleLit = struct
+  type t =
+    [
+      | `TupleLit of
+          TupleLitType.fields
+    ]
+
+  type fields = TupleLitType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_exprs node =
+    match (node :> TupleLitType.t) with
+    | `TupleLit fields ->
+        Lazy.force fields.f_exprs
+
+
+
+end
+
+module SubscriptExpr = struct
+  type t =
+    [
+      | `SubscriptExpr of
+          SubscriptExprType.fields
+    ]
+
+  type fields = SubscriptExprType.fields =
+    
+  {
+         
+    f_prefix: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_prefix node =
+    match (node :> SubscriptExprType.t) with
+    | `SubscriptExpr fields ->
+        Lazy.force fields.f_prefix
+  let f_suffix node =
+    match (node :> SubscriptExprType.t) with
+    | `SubscriptExpr fields ->
+        Lazy.force fields.f_suffix
+
+
+
+end
+
+module StringLit = struct
+  type t =
+    [
+      | `StringLit of
+          StringLitType.fields
+    ]
+
+  type fields = StringLitType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module ExtSliceExpr = struct
+  type t =
+    [
+      | `ExtSliceExpr of
+          ExtSliceExprType.fields
+    ]
+
+  type fields = ExtSliceExprType.fields =
+    
+  {
+         
+    f_first: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_last: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_stride: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_first node =
+    match (node :> ExtSliceExprType.t) with
+    | `ExtSliceExpr fields ->
+        Lazy.force fields.f_first
+  let f_last node =
+    match (node :> ExtSliceExprType.t) with
+    | `ExtSliceExpr fields ->
+        Lazy.force fields.f_last
+  let f_stride node =
+    match (node :> ExtSliceExprType.t) with
+    | `ExtSliceExpr fields ->
+        Lazy.force fields.f_stride
+
+
+
+end
+
+module SliceExpr = struct
+  type t =
+    [
+      | `SliceExpr of
+          SliceExprType.fields
+      | `ExtSliceExpr of
+          ExtSliceExprType.fields
+    ]
+
+  type fields = SliceExprType.fields =
+    
+  {
+         
+    f_first: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_last: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_first node =
+    match (node :> SliceExprType.t) with
+    | `SliceExpr fields ->
+        Lazy.force fields.f_first
+    | `ExtSliceExpr fields ->
+        Lazy.force fields.f_first
+  let f_last node =
+    match (node :> SliceExprType.t) with
+    | `SliceExpr fields ->
+        Lazy.force fields.f_last
+    | `ExtSliceExpr fields ->
+        Lazy.force fields.f_last
+
+
+
+end
+
+module SetLit = struct
+  type t =
+    [
+      | `SetLit of
+          SetLitType.fields
+    ]
+
+  type fields = SetLitType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_exprs node =
+    match (node :> SetLitType.t) with
+    | `SetLit fields ->
+        Lazy.force fields.f_exprs
+
+
+
+end
+
+module SetComp = struct
+  type t =
+    [
+      | `SetComp of
+          SetCompType.fields
+    ]
+
+  type fields = SetCompType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> SetCompType.t) with
+    | `SetComp fields ->
+        Lazy.force fields.f_expr
+  let f_comprehension node =
+    match (node :> SetCompType.t) with
+    | `SetComp fields ->
+        Lazy.force fields.f_comprehension
+
+
+
+end
+
+module Power = struct
+  type t =
+    [
+      | `Power of
+          PowerType.fields
+    ]
+
+  type fields = PowerType.fields =
+    
+  {
+         
+    f_left: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_left node =
+    match (node :> PowerType.t) with
+    | `Power fields ->
+        Lazy.force fields.f_left
+  let f_right node =
+    match (node :> PowerType.t) with
+    | `Power fields ->
+        Lazy.force fields.f_right
+
+
+
+end
+
+module OrOp = struct
+  type t =
+    [
+      | `OrOp of
+          OrOpType.fields
+    ]
+
+  type fields = OrOpType.fields =
+    
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_left node =
+    match (node :> OrOpType.t) with
+    | `OrOp fields ->
+        Lazy.force fields.f_left
+  let f_right node =
+    match (node :> OrOpType.t) with
+    | `OrOp fields ->
+        Lazy.force fields.f_right
+
+
+
+end
+
+module OrExpr = struct
+  type t =
+    [
+      | `OrExpr of
+          OrExprType.fields
+    ]
+
+  type fields = OrExprType.fields =
+    
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_left node =
+    match (node :> OrExprType.t) with
+    | `OrExpr fields ->
+        Lazy.force fields.f_left
+  let f_right node =
+    match (node :> OrExprType.t) with
+    | `OrExpr fields ->
+        Lazy.force fields.f_right
+
+
+
+end
+
+module NumberLit = struct
+  type t =
+    [
+      | `NumberLit of
+          NumberLitType.fields
+    ]
+
+  type fields = NumberLitType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module NotOp = struct
+  type t =
+    [
+      | `NotOp of
+          NotOpType.fields
+    ]
+
+  type fields = NotOpType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> NotOpType.t) with
+    | `NotOp fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module Id = struct
+  type t =
+    [
+      | `Id of
+          IdType.fields
+    ]
+
+  type fields = IdType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module DottedName = struct
+  type t =
+    [
+      | `DottedName of
+          DottedNameType.fields
+    ]
+
+  type fields = DottedNameType.fields =
+    
+  {
+         
+    f_prefix: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: IdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_prefix node =
+    match (node :> DottedNameType.t) with
+    | `DottedName fields ->
+        Lazy.force fields.f_prefix
+  let f_suffix node =
+    match (node :> DottedNameType.t) with
+    | `DottedName fields ->
+        Lazy.force fields.f_suffix
+
+
+
+end
+
+module Name = struct
+  type t =
+    [
+      | DottedName.t
+      | Id.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module ListLit = struct
+  type t =
+    [
+      | `ListLit of
+          ListLitType.fields
+    ]
+
+  type fields = ListLitType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_exprs node =
+    match (node :> ListLitType.t) with
+    | `ListLit fields ->
+        Lazy.force fields.f_exprs
+
+
+
+end
+
+module ListGen = struct
+  type t =
+    [
+      | `ListGen of
+          ListGenType.fields
+    ]
+
+  type fields = ListGenType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForLType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> ListGenType.t) with
+    | `ListGen fields ->
+        Lazy.force fields.f_expr
+  let f_comprehension node =
+    match (node :> ListGenType.t) with
+    | `ListGen fields ->
+        Lazy.force fields.f_comprehension
+
+
+
+end
+
+module ListComp = struct
+  type t =
+    [
+      | `ListComp of
+          ListCompType.fields
+    ]
+
+  type fields = ListCompType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForLType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> ListCompType.t) with
+    | `ListComp fields ->
+        Lazy.force fields.f_expr
+  let f_comprehension node =
+    match (node :> ListCompType.t) with
+    | `ListComp fields ->
+        Lazy.force fields.f_comprehension
+
+
+
+end
+
+module LambdaDef = struct
+  type t =
+    [
+      | `LambdaDef of
+          LambdaDefType.fields
+    ]
+
+  type fields = LambdaDefType.fields =
+    
+  {
+         
+    f_args: ParamsType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_args node =
+    match (node :> LambdaDefType.t) with
+    | `LambdaDef fields ->
+        Lazy.force fields.f_args
+  let f_expr node =
+    match (node :> LambdaDefType.t) with
+    | `LambdaDef fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module InlineEval = struct
+  type t =
+    [
+      | `InlineEval of
+          InlineEvalType.fields
+    ]
+
+  type fields = InlineEvalType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_exprs node =
+    match (node :> InlineEvalType.t) with
+    | `InlineEval fields ->
+        Lazy.force fields.f_exprs
+
+
+
+end
+
+module IfExpr = struct
+  type t =
+    [
+      | `IfExpr of
+          IfExprType.fields
+    ]
+
+  type fields = IfExprType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_cond: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_else_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> IfExprType.t) with
+    | `IfExpr fields ->
+        Lazy.force fields.f_expr
+  let f_cond node =
+    match (node :> IfExprType.t) with
+    | `IfExpr fields ->
+        Lazy.force fields.f_cond
+  let f_else_expr node =
+    match (node :> IfExprType.t) with
+    | `IfExpr fields ->
+        Lazy.force fields.f_else_expr
+
+
+
+end
+
+module Factor = struct
+  type t =
+    [
+      | `Factor of
+          FactorType.fields
+    ]
+
+  type fields = FactorType.fields =
+    
+  {
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_op node =
+    match (node :> FactorType.t) with
+    | `Factor fields ->
+        Lazy.force fields.f_op
+  let f_expr node =
+    match (node :> FactorType.t) with
+    | `Factor fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module EllipsisExpr = struct
+  type t =
+    [
+      | `EllipsisExpr of
+          EllipsisExprType.fields
+    ]
+
+  type fields = EllipsisExprType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module Dot = struct
+  type t =
+    [
+      | `Dot of
+          DotType.fields
+    ]
+
+  type fields = DotType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module DictLit = struct
+  type t =
+    [
+      | `DictLit of
+          DictLitType.fields
+    ]
+
+  type fields = DictLitType.fields =
+    
+  {
+         
+    f_assocs: DictAssocListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_assocs node =
+    match (node :> DictLitType.t) with
+    | `DictLit fields ->
+        Lazy.force fields.f_assocs
+
+
+
+end
+
+module DictComp = struct
+  type t =
+    [
+      | `DictComp of
+          DictCompType.fields
+    ]
+
+  type fields = DictCompType.fields =
+    
+  {
+         
+    f_assoc: DictAssocType.t
+    Lazy.t;
+         
+    f_comprehension: CompForType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_assoc node =
+    match (node :> DictCompType.t) with
+    | `DictComp fields ->
+        Lazy.force fields.f_assoc
+  let f_comprehension node =
+    match (node :> DictCompType.t) with
+    | `DictComp fields ->
+        Lazy.force fields.f_comprehension
+
+
+
+end
+
+module ConcatStringLit = struct
+  type t =
+    [
+      | `ConcatStringLit of
+          ConcatStringLitType.fields
+    ]
+
+  type fields = ConcatStringLitType.fields =
+    
+  {
+         
+    f_first_str: StringLitType.t
+    Lazy.t;
+         
+    f_subsequent_str: StringLitListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_first_str node =
+    match (node :> ConcatStringLitType.t) with
+    | `ConcatStringLit fields ->
+        Lazy.force fields.f_first_str
+  let f_subsequent_str node =
+    match (node :> ConcatStringLitType.t) with
+    | `ConcatStringLit fields ->
+        Lazy.force fields.f_subsequent_str
+
+
+
+end
+
+module CompOp = struct
+  type t =
+    [
+      | `CompOp of
+          CompOpType.fields
+    ]
+
+  type fields = CompOpType.fields =
+    
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: CompOpKindType.t
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_left node =
+    match (node :> CompOpType.t) with
+    | `CompOp fields ->
+        Lazy.force fields.f_left
+  let f_op node =
+    match (node :> CompOpType.t) with
+    | `CompOp fields ->
+        Lazy.force fields.f_op
+  let f_right node =
+    match (node :> CompOpType.t) with
+    | `CompOp fields ->
+        Lazy.force fields.f_right
+
+
+
+end
+
+module CallExpr = struct
+  type t =
+    [
+      | `CallExpr of
+          CallExprType.fields
+    ]
+
+  type fields = CallExprType.fields =
+    
+  {
+         
+    f_prefix: [
+      | `CallExpr
+          of fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: ArgListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_prefix node =
+    match (node :> CallExprType.t) with
+    | `CallExpr fields ->
+        Lazy.force fields.f_prefix
+  let f_suffix node =
+    match (node :> CallExprType.t) with
+    | `CallExpr fields ->
+        Lazy.force fields.f_suffix
+
+
+
+end
+
+module Term = struct
+  type t =
+    [
+      | `Term of
+          TermType.fields
+    ]
+
+  type fields = TermType.fields =
+    
+  {
+         
+    f_left: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_left node =
+    match (node :> TermType.t) with
+    | `Term fields ->
+        Lazy.force fields.f_left
+  let f_op node =
+    match (node :> TermType.t) with
+    | `Term fields ->
+        Lazy.force fields.f_op
+  let f_right node =
+    match (node :> TermType.t) with
+    | `Term fields ->
+        Lazy.force fields.f_right
+
+
+
+end
+
+module ShiftExpr = struct
+  type t =
+    [
+      | `ShiftExpr of
+          ShiftExprType.fields
+    ]
+
+  type fields = ShiftExprType.fields =
+    
+  {
+         
+    f_left: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_left node =
+    match (node :> ShiftExprType.t) with
+    | `ShiftExpr fields ->
+        Lazy.force fields.f_left
+  let f_op node =
+    match (node :> ShiftExprType.t) with
+    | `ShiftExpr fields ->
+        Lazy.force fields.f_op
+  let f_right node =
+    match (node :> ShiftExprType.t) with
+    | `ShiftExpr fields ->
+        Lazy.force fields.f_right
+
+
+
+end
+
+module ArithExpr = struct
+  type t =
+    [
+      | `ArithExpr of
+          ArithExprType.fields
+    ]
+
+  type fields = ArithExprType.fields =
+    
+  {
+         
+    f_left: [
+      | `ArithExpr
+          of fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_left node =
+    match (node :> ArithExprType.t) with
+    | `ArithExpr fields ->
+        Lazy.force fields.f_left
+  let f_op node =
+    match (node :> ArithExprType.t) with
+    | `ArithExpr fields ->
+        Lazy.force fields.f_op
+  let f_right node =
+    match (node :> ArithExprType.t) with
+    | `ArithExpr fields ->
+        Lazy.force fields.f_right
+
+
+
+end
+
+module BinOp = struct
+  type t =
+    [
+      | ArithExpr.t
+      | Term.t
+      | ShiftExpr.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_left node =
+    match (node :> BinOpType.t) with
+    | `ArithExpr fields ->
+        Lazy.force fields.f_left
+    | `ShiftExpr fields ->
+        Lazy.force fields.f_left
+    | `Term fields ->
+        Lazy.force fields.f_left
+  let f_op node =
+    match (node :> BinOpType.t) with
+    | `ArithExpr fields ->
+        Lazy.force fields.f_op
+    | `ShiftExpr fields ->
+        Lazy.force fields.f_op
+    | `Term fields ->
+        Lazy.force fields.f_op
+  let f_right node =
+    match (node :> BinOpType.t) with
+    | `ArithExpr fields ->
+        Lazy.force fields.f_right
+    | `ShiftExpr fields ->
+        Lazy.force fields.f_right
+    | `Term fields ->
+        Lazy.force fields.f_right
+
+
+
+end
+
+module AndOp = struct
+  type t =
+    [
+      | `AndOp of
+          AndOpType.fields
+    ]
+
+  type fields = AndOpType.fields =
+    
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_left node =
+    match (node :> AndOpType.t) with
+    | `AndOp fields ->
+        Lazy.force fields.f_left
+  let f_right node =
+    match (node :> AndOpType.t) with
+    | `AndOp fields ->
+        Lazy.force fields.f_right
+
+
+
+end
+
+module AndExpr = struct
+  type t =
+    [
+      | `AndExpr of
+          AndExprType.fields
+    ]
+
+  type fields = AndExprType.fields =
+    
+  {
+         
+    f_left: [
+      | `AndExpr
+          of fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_left node =
+    match (node :> AndExprType.t) with
+    | `AndExpr fields ->
+        Lazy.force fields.f_left
+  let f_right node =
+    match (node :> AndExprType.t) with
+    | `AndExpr fields ->
+        Lazy.force fields.f_right
+
+
+
+end
+
+module Expr = struct
+  type t =
+    [
+      | Name.t
+      | CallExpr.t
+      | SubscriptExpr.t
+      | IfExpr.t
+      | OrOp.t
+      | AndOp.t
+      | NotOp.t
+      | CompOp.t
+      | OrExpr.t
+      | XorExpr.t
+      | AndExpr.t
+      | BinOp.t
+      | Factor.t
+      | Power.t
+      | YieldExpr.t
+      | ListGen.t
+      | TupleLit.t
+      | ListComp.t
+      | ListLit.t
+      | SetComp.t
+      | SetLit.t
+      | DictComp.t
+      | DictLit.t
+      | InlineEval.t
+      | LambdaDef.t
+      | EllipsisExpr.t
+      | SliceExpr.t
+      | NumberLit.t
+      | StringLit.t
+      | ConcatStringLit.t
+      | Dot.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module ExceptPart = struct
+  type t =
+    [
+      | `ExceptPart of
+          ExceptPartType.fields
+    ]
+
+  type fields = ExceptPartType.fields =
+    
+  {
+         
+    f_as_name: AsNameNodeType.t
+    option
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_as_name node =
+    match (node :> ExceptPartType.t) with
+    | `ExceptPart fields ->
+        Lazy.force fields.f_as_name
+  let f_statements node =
+    match (node :> ExceptPartType.t) with
+    | `ExceptPart fields ->
+        Lazy.force fields.f_statements
+
+
+
+end
+
+module ElsePart = struct
+  type t =
+    [
+      | `ElsePart of
+          ElsePartType.fields
+    ]
+
+  type fields = ElsePartType.fields =
+    
+  {
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_statements node =
+    match (node :> ElsePartType.t) with
+    | `ElsePart fields ->
+        Lazy.force fields.f_statements
+
+
+
+end
+
+module DictAssoc = struct
+  type t =
+    [
+      | `DictAssoc of
+          DictAssocType.fields
+    ]
+
+  type fields = DictAssocType.fields =
+    
+  {
+         
+    f_key: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_value: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_key node =
+    match (node :> DictAssocType.t) with
+    | `DictAssoc fields ->
+        Lazy.force fields.f_key
+  let f_value node =
+    match (node :> DictAssocType.t) with
+    | `DictAssoc fields ->
+        Lazy.force fields.f_value
+
+
+
+end
+
+module Decorator = struct
+  type t =
+    [
+      | `Decorator of
+          DecoratorType.fields
+    ]
+
+  type fields = DecoratorType.fields =
+    
+  {
+         
+    f_dec_name: NameType.t
+    Lazy.t;
+         
+    f_arg_list: ArgListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_dec_name node =
+    match (node :> DecoratorType.t) with
+    | `Decorator fields ->
+        Lazy.force fields.f_dec_name
+  let f_arg_list node =
+    match (node :> DecoratorType.t) with
+    | `Decorator fields ->
+        Lazy.force fields.f_arg_list
+
+
+
+end
+
+module CompForL = struct
+  type t =
+    [
+      | `CompForL of
+          CompForLType.fields
+    ]
+
+  type fields = CompForLType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+         
+    f_target: ExprListType.t
+    Lazy.t;
+         
+    f_comp: [
+      | `CompForL
+          of fields
+      | `CompIf
+          of CompIfType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_exprs node =
+    match (node :> CompForLType.t) with
+    | `CompForL fields ->
+        Lazy.force fields.f_exprs
+  let f_target node =
+    match (node :> CompForLType.t) with
+    | `CompForL fields ->
+        Lazy.force fields.f_target
+  let f_comp node =
+    match (node :> CompForLType.t) with
+    | `CompForL fields ->
+        Lazy.force fields.f_comp
+
+
+
+end
+
+module CompFor = struct
+  type t =
+    [
+      | `CompFor of
+          CompForType.fields
+    ]
+
+  type fields = CompForType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+         
+    f_target: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comp: [
+      | `CompFor
+          of fields
+      | `CompIf
+          of CompIfType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_exprs node =
+    match (node :> CompForType.t) with
+    | `CompFor fields ->
+        Lazy.force fields.f_exprs
+  let f_target node =
+    match (node :> CompForType.t) with
+    | `CompFor fields ->
+        Lazy.force fields.f_target
+  let f_comp node =
+    match (node :> CompForType.t) with
+    | `CompFor fields ->
+        Lazy.force fields.f_comp
+
+
+
+end
+
+module Comprehension = struct
+  type t =
+    [
+      | CompFor.t
+      | CompForL.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module CompOpKindNotin = struct
+  type t =
+    [
+      | `CompOpKindNotin of
+          CompOpKindNotinType.fields
+    ]
+
+  type fields = CompOpKindNotinType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module CompOpKindNoteq = struct
+  type t =
+    [
+      | `CompOpKindNoteq of
+          CompOpKindNoteqType.fields
+    ]
+
+  type fields = CompOpKindNoteqType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module CompOpKindLte = struct
+  type t =
+    [
+      | `CompOpKindLte of
+          CompOpKindLteType.fields
+    ]
+
+  type fields = CompOpKindLteType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module CompOpKindLt = struct
+  type t =
+    [
+      | `CompOpKindLt of
+          CompOpKindLtType.fields
+    ]
+
+  type fields = CompOpKindLtType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module CompOpKindIsnot = struct
+  type t =
+    [
+      | `CompOpKindIsnot of
+          CompOpKindIsnotType.fields
+    ]
+
+  type fields = CompOpKindIsnotType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module CompOpKindIs = struct
+  type t =
+    [
+      | `CompOpKindIs of
+          CompOpKindIsType.fields
+    ]
+
+  type fields = CompOpKindIsType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module CompOpKindIn = struct
+  type t =
+    [
+      | `CompOpKindIn of
+          CompOpKindInType.fields
+    ]
+
+  type fields = CompOpKindInType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module CompOpKindGte = struct
+  type t =
+    [
+      | `CompOpKindGte of
+          CompOpKindGteType.fields
+    ]
+
+  type fields = CompOpKindGteType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module CompOpKindGt = struct
+  type t =
+    [
+      | `CompOpKindGt of
+          CompOpKindGtType.fields
+    ]
+
+  type fields = CompOpKindGtType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module CompOpKindEq = struct
+  type t =
+    [
+      | `CompOpKindEq of
+          CompOpKindEqType.fields
+    ]
+
+  type fields = CompOpKindEqType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module CompOpKindDiamond = struct
+  type t =
+    [
+      | `CompOpKindDiamond of
+          CompOpKindDiamondType.fields
+    ]
+
+  type fields = CompOpKindDiamondType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module CompOpKind = struct
+  type t =
+    [
+      | CompOpKindLt.t
+      | CompOpKindGt.t
+      | CompOpKindEq.t
+      | CompOpKindGte.t
+      | CompOpKindLte.t
+      | CompOpKindDiamond.t
+      | CompOpKindNoteq.t
+      | CompOpKindIn.t
+      | CompOpKindNotin.t
+      | CompOpKindIs.t
+      | CompOpKindIsnot.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module CompIf = struct
+  type t =
+    [
+      | `CompIf of
+          CompIfType.fields
+    ]
+
+  type fields = CompIfType.fields =
+    
+  {
+         
+    f_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comp: [
+      | `CompFor
+          of CompForType.fields
+      | `CompForL
+          of CompForLType.fields
+      | `CompIf
+          of fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_test node =
+    match (node :> CompIfType.t) with
+    | `CompIf fields ->
+        Lazy.force fields.f_test
+  let f_comp node =
+    match (node :> CompIfType.t) with
+    | `CompIf fields ->
+        Lazy.force fields.f_comp
+
+
+
+end
+
+module AsNameNode = struct
+  type t =
+    [
+      | `AsNameNode of
+          AsNameNodeType.fields
+    ]
+
+  type fields = AsNameNodeType.fields =
+    
+  {
+         
+    f_imported: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_as_name: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_imported node =
+    match (node :> AsNameNodeType.t) with
+    | `AsNameNode fields ->
+        Lazy.force fields.f_imported
+  let f_as_name node =
+    match (node :> AsNameNodeType.t) with
+    | `AsNameNode fields ->
+        Lazy.force fields.f_as_name
+
+
+
+end
+
+module VarArgs = struct
+  type t =
+    [
+      | `VarArgs of
+          VarArgsType.fields
+    ]
+
+  type fields = VarArgsType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> VarArgsType.t) with
+    | `VarArgs fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module KwArgs = struct
+  type t =
+    [
+      | `KwArgs of
+          KwArgsType.fields
+    ]
+
+  type fields = KwArgsType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> KwArgsType.t) with
+    | `KwArgs fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module ArgGen = struct
+  type t =
+    [
+      | `ArgGen of
+          ArgGenType.fields
+    ]
+
+  type fields = ArgGenType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_expr node =
+    match (node :> ArgGenType.t) with
+    | `ArgGen fields ->
+        Lazy.force fields.f_expr
+  let f_comprehension node =
+    match (node :> ArgGenType.t) with
+    | `ArgGen fields ->
+        Lazy.force fields.f_comprehension
+
+
+
+end
+
+module ArgAssoc = struct
+  type t =
+    [
+      | `ArgAssoc of
+          ArgAssocType.fields
+    ]
+
+  type fields = ArgAssocType.fields =
+    
+  {
+         
+    f_name: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+  let f_name node =
+    match (node :> ArgAssocType.t) with
+    | `ArgAssoc fields ->
+        Lazy.force fields.f_name
+  let f_expr node =
+    match (node :> ArgAssocType.t) with
+    | `ArgAssoc fields ->
+        Lazy.force fields.f_expr
+
+
+
+end
+
+module Arg = struct
+  type t =
+    [
+      | ArgAssoc.t
+      | ArgGen.t
+      | VarArgs.t
+      | KwArgs.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+
+
+
+
+end
+
+module PythonNode = struct
+  type t =
+    [
+      | PythonNodeBaseList.t
+      | VarArgsFlag.t
+      | KwArgsFlag.t
+      | Stmt.t
+      | Decorator.t
+      | FileNode.t
+      | Params.t
+      | SingleParam.t
+      | RelName.t
+      | ImportStar.t
+      | AsNameNode.t
+      | Expr.t
+      | ElsePart.t
+      | ExceptPart.t
+      | CompOpKind.t
+      | Op.t
+      | DictAssoc.t
+      | Arg.t
+      | Comprehension.t
+      | CompIf.t
+      | NL.t
+    ]
+
+
+  let equal node1 node2 =
+    Entity.equal
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let compare node1 node2 =
+    Entity.compare
+      (PythonNodeType.unwrap ((node1 :> PythonNodeType.t)))
+      (PythonNodeType.unwrap ((node2 :> PythonNodeType.t)))
+
+  let hash node =
+    Entity.hash
+      (PythonNodeType.unwrap ((node :> PythonNodeType.t)))
+
+let parent
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.python_node_parent
+          (addr (PythonNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (PythonNodeType.wrap (context node) (!@ result_ptr))
+
+let parents
+    (node)
+    =
+      let result_ptr =
+        allocate_n PythonNodeArrayStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.python_node_parents
+          (addr (PythonNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      PythonNodeArray.wrap (context node) (!@ result_ptr)
+
+let children
+    (node)
+    =
+      let result_ptr =
+        allocate_n PythonNodeArrayStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.python_node_children
+          (addr (PythonNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      PythonNodeArray.wrap (context node) (!@ result_ptr)
+
+let token_start
+    (node)
+    =
+      let result_ptr =
+        allocate_n Token.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.python_node_token_start
+          (addr (PythonNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+let token_end
+    (node)
+    =
+      let result_ptr =
+        allocate_n Token.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.python_node_token_end
+          (addr (PythonNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+let child_index
+    (node)
+    =
+      let result_ptr =
+        allocate_n int ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.python_node_child_index
+          (addr (PythonNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+let previous_sibling
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.python_node_previous_sibling
+          (addr (PythonNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (PythonNodeType.wrap (context node) (!@ result_ptr))
+
+let next_sibling
+    (node)
+    =
+      let result_ptr =
+        allocate_n EntityStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.python_node_next_sibling
+          (addr (PythonNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (PythonNodeType.wrap (context node) (!@ result_ptr))
+
+let unit
+    (node)
+    =
+      let result_ptr =
+        allocate_n AnalysisUnitStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.python_node_unit
+          (addr (PythonNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      AnalysisUnit.wrap (context node) (!@ result_ptr)
+
+let is_ghost
+    (node)
+    =
+      let result_ptr =
+        allocate_n bool ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.python_node_is_ghost
+          (addr (PythonNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      !@ result_ptr
+
+let full_sloc_image
+    (node)
+    =
+      let result_ptr =
+        allocate_n TextTypeStruct.c_type ~count:1
+      in
+      (* The result of this call should already be checked by the raisable
+         mechanism *)
+      let _ : int =
+        CFunctions.python_node_full_sloc_image
+          (addr (PythonNodeType.unwrap (node)))
+          (result_ptr)
+      in
+      TextType.wrap (!@ result_ptr)
+
+
+
+
+
+  let kind_name = function
+    | #VarArgsFlagPresentType.t ->
+        "VarArgsFlagPresent"
+    | #VarArgsFlagAbsentType.t ->
+        "VarArgsFlagAbsent"
+    | #WithStmtType.t ->
+        "WithStmt"
+    | #WhileStmtType.t ->
+        "WhileStmt"
+    | #TryStmtType.t ->
+        "TryStmt"
+    | #StreamPrintStmtType.t ->
+        "StreamPrintStmt"
+    | #ReturnStmtType.t ->
+        "ReturnStmt"
+    | #RaiseStmtType.t ->
+        "RaiseStmt"
+    | #PrintStmtType.t ->
+        "PrintStmt"
+    | #PassStmtType.t ->
+        "PassStmt"
+    | #ImportNameType.t ->
+        "ImportName"
+    | #ImportFromType.t ->
+        "ImportFrom"
+    | #IfStmtType.t ->
+        "IfStmt"
+    | #GlobalStmtType.t ->
+        "GlobalStmt"
+    | #ForStmtType.t ->
+        "ForStmt"
+    | #ExecStmtType.t ->
+        "ExecStmt"
+    | #ElifBranchType.t ->
+        "ElifBranch"
+    | #DelStmtType.t ->
+        "DelStmt"
+    | #FuncDefType.t ->
+        "FuncDef"
+    | #ClassDefType.t ->
+        "ClassDef"
+    | #DecoratedType.t ->
+        "Decorated"
+    | #ContinueStmtType.t ->
+        "ContinueStmt"
+    | #BreakStmtType.t ->
+        "BreakStmt"
+    | #AugAssignStmtType.t ->
+        "AugAssignStmt"
+    | #AssignStmtType.t ->
+        "AssignStmt"
+    | #AssertStmtType.t ->
+        "AssertStmt"
+    | #SingleParamType.t ->
+        "SingleParam"
+    | #RelNameType.t ->
+        "RelName"
+    | #StringLitListType.t ->
+        "StringLitList"
+    | #SingleParamListType.t ->
+        "SingleParamList"
+    | #PythonNodeListType.t ->
+        "PythonNodeList"
+    | #NLListType.t ->
+        "NLList"
+    | #IdListType.t ->
+        "IdList"
+    | #ExprListType.t ->
+        "ExprList"
+    | #ExceptPartListType.t ->
+        "ExceptPartList"
+    | #ElifBranchListType.t ->
+        "ElifBranchList"
+    | #DotListType.t ->
+        "DotList"
+    | #DictAssocListType.t ->
+        "DictAssocList"
+    | #DecoratorListType.t ->
+        "DecoratorList"
+    | #AsNameNodeListType.t ->
+        "AsNameNodeList"
+    | #ArgListType.t ->
+        "ArgList"
+    | #ParamsType.t ->
+        "Params"
+    | #OpType.t ->
+        "Op"
+    | #NLType.t ->
+        "NL"
+    | #KwArgsFlagPresentType.t ->
+        "KwArgsFlagPresent"
+    | #KwArgsFlagAbsentType.t ->
+        "KwArgsFlagAbsent"
+    | #ImportStarType.t ->
+        "ImportStar"
+    | #FileNodeType.t ->
+        "FileNode"
+    | #YieldExprType.t ->
+        "YieldExpr"
+    | #XorExprType.t ->
+        "XorExpr"
+    | #TupleLitType.t ->
+        "TupleLit"
+    | #SubscriptExprType.t ->
+        "SubscriptExpr"
+    | #StringLitType.t ->
+        "StringLit"
+    | #ExtSliceExprType.t ->
+        "ExtSliceExpr"
+    | #SliceExprType.t ->
+        "SliceExpr"
+    | #SetLitType.t ->
+        "SetLit"
+    | #SetCompType.t ->
+        "SetComp"
+    | #PowerType.t ->
+        "Power"
+    | #OrOpType.t ->
+        "OrOp"
+    | #OrExprType.t ->
+        "OrExpr"
+    | #NumberLitType.t ->
+        "NumberLit"
+    | #NotOpType.t ->
+        "NotOp"
+    | #IdType.t ->
+        "Id"
+    | #DottedNameType.t ->
+        "DottedName"
+    | #ListLitType.t ->
+        "ListLit"
+    | #ListGenType.t ->
+        "ListGen"
+    | #ListCompType.t ->
+        "ListComp"
+    | #LambdaDefType.t ->
+        "LambdaDef"
+    | #InlineEvalType.t ->
+        "InlineEval"
+    | #IfExprType.t ->
+        "IfExpr"
+    | #FactorType.t ->
+        "Factor"
+    | #EllipsisExprType.t ->
+        "EllipsisExpr"
+    | #DotType.t ->
+        "Dot"
+    | #DictLitType.t ->
+        "DictLit"
+    | #DictCompType.t ->
+        "DictComp"
+    | #ConcatStringLitType.t ->
+        "ConcatStringLit"
+    | #CompOpType.t ->
+        "CompOp"
+    | #CallExprType.t ->
+        "CallExpr"
+    | #TermType.t ->
+        "Term"
+    | #ShiftExprType.t ->
+        "ShiftExpr"
+    | #ArithExprType.t ->
+        "ArithExpr"
+    | #AndOpType.t ->
+        "AndOp"
+    | #AndExprType.t ->
+        "AndExpr"
+    | #ExceptPartType.t ->
+        "ExceptPart"
+    | #ElsePartType.t ->
+        "ElsePart"
+    | #DictAssocType.t ->
+        "DictAssoc"
+    | #DecoratorType.t ->
+        "Decorator"
+    | #CompForLType.t ->
+        "CompForL"
+    | #CompForType.t ->
+        "CompFor"
+    | #CompOpKindNotinType.t ->
+        "CompOpKindNotin"
+    | #CompOpKindNoteqType.t ->
+        "CompOpKindNoteq"
+    | #CompOpKindLteType.t ->
+        "CompOpKindLte"
+    | #CompOpKindLtType.t ->
+        "CompOpKindLt"
+    | #CompOpKindIsnotType.t ->
+        "CompOpKindIsnot"
+    | #CompOpKindIsType.t ->
+        "CompOpKindIs"
+    | #CompOpKindInType.t ->
+        "CompOpKindIn"
+    | #CompOpKindGteType.t ->
+        "CompOpKindGte"
+    | #CompOpKindGtType.t ->
+        "CompOpKindGt"
+    | #CompOpKindEqType.t ->
+        "CompOpKindEq"
+    | #CompOpKindDiamondType.t ->
+        "CompOpKindDiamond"
+    | #CompIfType.t ->
+        "CompIf"
+    | #AsNameNodeType.t ->
+        "AsNameNode"
+    | #VarArgsType.t ->
+        "VarArgs"
+    | #KwArgsType.t ->
+        "KwArgs"
+    | #ArgGenType.t ->
+        "ArgGen"
+    | #ArgAssocType.t ->
+        "ArgAssoc"
+
+  let text node =
+    Token.text_range (token_start node) (token_end node)
+
+  let image node =
+    let c_result_ptr = allocate_n Text.c_type ~count:1 in
+    CFunctions.image
+      (addr (PythonNodeType.unwrap (node)))
+      c_result_ptr;
+    !@ c_result_ptr
+
+  let entity_image node =
+    let c_result_ptr = allocate_n Text.c_type ~count:1 in
+    let node_c_value = PythonNodeType.unwrap (node) in
+    CFunctions.entity_image (addr node_c_value) c_result_ptr;
+    !@ c_result_ptr
+
+  let is_token_node node =
+    let node_c_value = PythonNodeType.unwrap (node) in
+    CFunctions.node_is_token_node (addr node_c_value)
+
+  let sloc_range node =
+    let c_result_ptr = allocate_n SlocRange.c_type ~count:1 in
+    CFunctions.node_sloc_range
+      (addr (PythonNodeType.unwrap (node)))
+      c_result_ptr;
+    !@ c_result_ptr
+
+  
+  let fold_tokens f init node =
+    let tok_start = token_start node in
+    let tok_end = token_end node in
+    let rec aux acc tok_curr =
+      let new_acc = f acc tok_curr in
+      if Token.equal tok_curr tok_end then
+        new_acc
+      else
+        aux new_acc (Token.next tok_curr)
+    in
+    aux init tok_start
+
+  let iter_tokens f node =
+    let tok_start = token_start node in
+    let tok_end = token_end node in
+    let rec aux tok_curr =
+      f tok_curr;
+      if not (Token.equal tok_curr tok_end) then
+        aux (Token.next tok_curr)
+    in
+    aux tok_start
+
+  let map_tokens f node =
+    let tok_start = token_start node in
+    let tok_end = token_end node in
+    let rec aux tok_curr =
+      let value = f tok_curr in
+      if Token.equal tok_curr tok_end then
+        [value]
+      else
+        value :: aux (Token.next tok_curr)
+    in
+    aux tok_start
+
+  let tokens node =
+    map_tokens (fun x -> x) node
+
+
+  let lookup node sloc =
+    let node_c_value = PythonNodeType.unwrap (node) in
+    let sloc_ptr = allocate Sloc.c_type sloc in
+    let result_ptr = allocate_n EntityStruct.c_type ~count:1 in
+    CFunctions.lookup_in_node
+      (addr node_c_value) sloc_ptr result_ptr;
+    if is_null (getf !@ result_ptr EntityStruct.node) then None else Some (PythonNodeType.wrap (context node) (!@ result_ptr))
+
+  let children_opt node =
+    let node_c_value = PythonNodeType.unwrap (node) in
+    let context = context node in
+    let c_value_ptr = allocate_n PythonNodeArrayStruct.c_type ~count:1 in
+    let _ : int =
+      CFunctions.python_node_children
+        (addr node_c_value)
+        (c_value_ptr)
+    in
+    let c_value = !@(!@(c_value_ptr)) in
+    let length = getf c_value PythonNodeArrayStruct.n in
+    let items = c_value @. PythonNodeArrayStruct.items in
+    let f i =
+      let fresh = allocate EntityStruct.c_type !@(items +@ i) in
+      if is_null (getf !@ fresh EntityStruct.node) then None else Some (PythonNodeType.wrap context (!@ fresh))
+    in
+    let result = List.init length f in
+    PythonNodeArrayStruct.dec_ref (!@ c_value_ptr);
+    result
+
+  let iter_fields f node =
+    children_opt (node :> PythonNodeType.t)
+    |> List.iter (function None -> () | Some node -> f node)
+
+  let fold_fields f acc node =
+    children_opt (node :> PythonNodeType.t)
+    |> List.fold_left (fun x -> function None -> x | Some node -> f x node) acc
+
+  let exists_fields p node =
+    children_opt (node :> PythonNodeType.t)
+    |> List.exists (function | None -> false | Some node -> p node)
+
+  let for_all_fields p node =
+    children_opt (node :> PythonNodeType.t)
+    |> List.for_all (function | None -> true | Some node -> p node)
+
+  let fold f acc node =
+    (* Use an auxiliary function here to have a better type for the function *)
+    let rec aux acc node = fold_fields aux (f acc node) node in
+    aux acc (node :> PythonNodeType.t)
+
+  let iter f node =
+    (* Use an auxiliary function here to have a better type for the function *)
+    let rec aux node = f node; iter_fields aux node in
+    aux (node :> PythonNodeType.t)
+
+  let filter p node =
+    fold (fun acc node -> if p node then node :: acc else acc) [] node
+    |> List.rev
+
+  let exists p node =
+    (* Use an auxiliary function here to have a better type for the function *)
+    let rec aux node =
+      p node || exists_fields aux node in aux (node :> PythonNodeType.t)
+
+  let for_all p node =
+    (* Use an auxiliary function here to have a better type for the function *)
+    let rec aux node = p node && for_all_fields aux node in
+    aux (node :> PythonNodeType.t)
+
+  let lookup_with_kind :
+    type a. a node -> [< PythonNodeType.t] -> Sloc.t -> a option =
+    fun node_type node sloc ->
+      let lookup_res = lookup node sloc in
+      let rec aux : a node -> [< PythonNodeType.t] -> a option =
+        fun node_type node ->
+        match node_type, node with
+        | PythonNode
+          , (#PythonNodeType.t as node) ->
+          Some node
+        | Arg
+          , (#ArgType.t as node) ->
+          Some node
+        | ArgAssoc
+          , (#ArgAssocType.t as node) ->
+          Some node
+        | ArgGen
+          , (#ArgGenType.t as node) ->
+          Some node
+        | KwArgs
+          , (#KwArgsType.t as node) ->
+          Some node
+        | VarArgs
+          , (#VarArgsType.t as node) ->
+          Some node
+        | AsNameNode
+          , (#AsNameNodeType.t as node) ->
+          Some node
+        | CompIf
+          , (#CompIfType.t as node) ->
+          Some node
+        | CompOpKind
+          , (#CompOpKindType.t as node) ->
+          Some node
+        | CompOpKindDiamond
+          , (#CompOpKindDiamondType.t as node) ->
+          Some node
+        | CompOpKindEq
+          , (#CompOpKindEqType.t as node) ->
+          Some node
+        | CompOpKindGt
+          , (#CompOpKindGtType.t as node) ->
+          Some node
+        | CompOpKindGte
+          , (#CompOpKindGteType.t as node) ->
+          Some node
+        | CompOpKindIn
+          , (#CompOpKindInType.t as node) ->
+          Some node
+        | CompOpKindIs
+          , (#CompOpKindIsType.t as node) ->
+          Some node
+        | CompOpKindIsnot
+          , (#CompOpKindIsnotType.t as node) ->
+          Some node
+        | CompOpKindLt
+          , (#CompOpKindLtType.t as node) ->
+          Some node
+        | CompOpKindLte
+          , (#CompOpKindLteType.t as node) ->
+          Some node
+        | CompOpKindNoteq
+          , (#CompOpKindNoteqType.t as node) ->
+          Some node
+        | CompOpKindNotin
+          , (#CompOpKindNotinType.t as node) ->
+          Some node
+        | Comprehension
+          , (#ComprehensionType.t as node) ->
+          Some node
+        | CompFor
+          , (#CompForType.t as node) ->
+          Some node
+        | CompForL
+          , (#CompForLType.t as node) ->
+          Some node
+        | Decorator
+          , (#DecoratorType.t as node) ->
+          Some node
+        | DictAssoc
+          , (#DictAssocType.t as node) ->
+          Some node
+        | ElsePart
+          , (#ElsePartType.t as node) ->
+          Some node
+        | ExceptPart
+          , (#ExceptPartType.t as node) ->
+          Some node
+        | Expr
+          , (#ExprType.t as node) ->
+          Some node
+        | AndExpr
+          , (#AndExprType.t as node) ->
+          Some node
+        | AndOp
+          , (#AndOpType.t as node) ->
+          Some node
+        | BinOp
+          , (#BinOpType.t as node) ->
+          Some node
+        | ArithExpr
+          , (#ArithExprType.t as node) ->
+          Some node
+        | ShiftExpr
+          , (#ShiftExprType.t as node) ->
+          Some node
+        | Term
+          , (#TermType.t as node) ->
+          Some node
+        | CallExpr
+          , (#CallExprType.t as node) ->
+          Some node
+        | CompOp
+          , (#CompOpType.t as node) ->
+          Some node
+        | ConcatStringLit
+          , (#ConcatStringLitType.t as node) ->
+          Some node
+        | DictComp
+          , (#DictCompType.t as node) ->
+          Some node
+        | DictLit
+          , (#DictLitType.t as node) ->
+          Some node
+        | Dot
+          , (#DotType.t as node) ->
+          Some node
+        | EllipsisExpr
+          , (#EllipsisExprType.t as node) ->
+          Some node
+        | Factor
+          , (#FactorType.t as node) ->
+          Some node
+        | IfExpr
+          , (#IfExprType.t as node) ->
+          Some node
+        | InlineEval
+          , (#InlineEvalType.t as node) ->
+          Some node
+        | LambdaDef
+          , (#LambdaDefType.t as node) ->
+          Some node
+        | ListComp
+          , (#ListCompType.t as node) ->
+          Some node
+        | ListGen
+          , (#ListGenType.t as node) ->
+          Some node
+        | ListLit
+          , (#ListLitType.t as node) ->
+          Some node
+        | Name
+          , (#NameType.t as node) ->
+          Some node
+        | DottedName
+          , (#DottedNameType.t as node) ->
+          Some node
+        | Id
+          , (#IdType.t as node) ->
+          Some node
+        | NotOp
+          , (#NotOpType.t as node) ->
+          Some node
+        | NumberLit
+          , (#NumberLitType.t as node) ->
+          Some node
+        | OrExpr
+          , (#OrExprType.t as node) ->
+          Some node
+        | OrOp
+          , (#OrOpType.t as node) ->
+          Some node
+        | Power
+          , (#PowerType.t as node) ->
+          Some node
+        | SetComp
+          , (#SetCompType.t as node) ->
+          Some node
+        | SetLit
+          , (#SetLitType.t as node) ->
+          Some node
+        | SliceExpr
+          , (#SliceExprType.t as node) ->
+          Some node
+        | ExtSliceExpr
+          , (#ExtSliceExprType.t as node) ->
+          Some node
+        | StringLit
+          , (#StringLitType.t as node) ->
+          Some node
+        | SubscriptExpr
+          , (#SubscriptExprType.t as node) ->
+          Some node
+        | TupleLit
+          , (#TupleLitType.t as node) ->
+          Some node
+        | XorExpr
+          , (#XorExprType.t as node) ->
+          Some node
+        | YieldExpr
+          , (#YieldExprType.t as node) ->
+          Some node
+        | FileNode
+          , (#FileNodeType.t as node) ->
+          Some node
+        | ImportStar
+          , (#ImportStarType.t as node) ->
+          Some node
+        | KwArgsFlag
+          , (#KwArgsFlagType.t as node) ->
+          Some node
+        | KwArgsFlagAbsent
+          , (#KwArgsFlagAbsentType.t as node) ->
+          Some node
+        | KwArgsFlagPresent
+          , (#KwArgsFlagPresentType.t as node) ->
+          Some node
+        | NL
+          , (#NLType.t as node) ->
+          Some node
+        | Op
+          , (#OpType.t as node) ->
+          Some node
+        | Params
+          , (#ParamsType.t as node) ->
+          Some node
+        | PythonNodeBaseList
+          , (#PythonNodeBaseListType.t as node) ->
+          Some node
+        | ArgList
+          , (#ArgListType.t as node) ->
+          Some node
+        | AsNameNodeList
+          , (#AsNameNodeListType.t as node) ->
+          Some node
+        | DecoratorList
+          , (#DecoratorListType.t as node) ->
+          Some node
+        | DictAssocList
+          , (#DictAssocListType.t as node) ->
+          Some node
+        | DotList
+          , (#DotListType.t as node) ->
+          Some node
+        | ElifBranchList
+          , (#ElifBranchListType.t as node) ->
+          Some node
+        | ExceptPartList
+          , (#ExceptPartListType.t as node) ->
+          Some node
+        | ExprList
+          , (#ExprListType.t as node) ->
+          Some node
+        | IdList
+          , (#IdListType.t as node) ->
+          Some node
+        | NLList
+          , (#NLListType.t as node) ->
+          Some node
+        | PythonNodeList
+          , (#PythonNodeListType.t as node) ->
+          Some node
+        | SingleParamList
+          , (#SingleParamListType.t as node) ->
+          Some node
+        | StringLitList
+          , (#StringLitListType.t as node) ->
+          Some node
+        | RelName
+          , (#RelNameType.t as node) ->
+          Some node
+        | SingleParam
+          , (#SingleParamType.t as node) ->
+          Some node
+        | Stmt
+          , (#StmtType.t as node) ->
+          Some node
+        | AssertStmt
+          , (#AssertStmtType.t as node) ->
+          Some node
+        | AssignStmt
+          , (#AssignStmtType.t as node) ->
+          Some node
+        | AugAssignStmt
+          , (#AugAssignStmtType.t as node) ->
+          Some node
+        | BreakStmt
+          , (#BreakStmtType.t as node) ->
+          Some node
+        | ContinueStmt
+          , (#ContinueStmtType.t as node) ->
+          Some node
+        | Decorated
+          , (#DecoratedType.t as node) ->
+          Some node
+        | DefStmt
+          , (#DefStmtType.t as node) ->
+          Some node
+        | ClassDef
+          , (#ClassDefType.t as node) ->
+          Some node
+        | FuncDef
+          , (#FuncDefType.t as node) ->
+          Some node
+        | DelStmt
+          , (#DelStmtType.t as node) ->
+          Some node
+        | ElifBranch
+          , (#ElifBranchType.t as node) ->
+          Some node
+        | ExecStmt
+          , (#ExecStmtType.t as node) ->
+          Some node
+        | ForStmt
+          , (#ForStmtType.t as node) ->
+          Some node
+        | GlobalStmt
+          , (#GlobalStmtType.t as node) ->
+          Some node
+        | IfStmt
+          , (#IfStmtType.t as node) ->
+          Some node
+        | ImportFrom
+          , (#ImportFromType.t as node) ->
+          Some node
+        | ImportName
+          , (#ImportNameType.t as node) ->
+          Some node
+        | PassStmt
+          , (#PassStmtType.t as node) ->
+          Some node
+        | PrintStmt
+          , (#PrintStmtType.t as node) ->
+          Some node
+        | RaiseStmt
+          , (#RaiseStmtType.t as node) ->
+          Some node
+        | ReturnStmt
+          , (#ReturnStmtType.t as node) ->
+          Some node
+        | StreamPrintStmt
+          , (#StreamPrintStmtType.t as node) ->
+          Some node
+        | TryStmt
+          , (#TryStmtType.t as node) ->
+          Some node
+        | WhileStmt
+          , (#WhileStmtType.t as node) ->
+          Some node
+        | WithStmt
+          , (#WithStmtType.t as node) ->
+          Some node
+        | VarArgsFlag
+          , (#VarArgsFlagType.t as node) ->
+          Some node
+        | VarArgsFlagAbsent
+          , (#VarArgsFlagAbsentType.t as node) ->
+          Some node
+        | VarArgsFlagPresent
+          , (#VarArgsFlagPresentType.t as node) ->
+          Some node
+        | _ -> (match parent node with
+                | Some parent_node -> aux node_type parent_node
+                | _ -> None) in
+    match lookup_res with
+      | Some node -> aux node_type node
+      | _ -> None
+
+  let as_a : type a. a node -> [< PythonNodeType.t ] -> a option =
+   fun node_type node ->
+    match node_type, (node :> PythonNodeType.t) with
+    | PythonNode
+      , (#PythonNodeType.t as node) ->
+        Some node
+    | Arg
+      , (#ArgType.t as node) ->
+        Some node
+    | ArgAssoc
+      , (#ArgAssocType.t as node) ->
+        Some node
+    | ArgGen
+      , (#ArgGenType.t as node) ->
+        Some node
+    | KwArgs
+      , (#KwArgsType.t as node) ->
+        Some node
+    | VarArgs
+      , (#VarArgsType.t as node) ->
+        Some node
+    | AsNameNode
+      , (#AsNameNodeType.t as node) ->
+        Some node
+    | CompIf
+      , (#CompIfType.t as node) ->
+        Some node
+    | CompOpKind
+      , (#CompOpKindType.t as node) ->
+        Some node
+    | CompOpKindDiamond
+      , (#CompOpKindDiamondType.t as node) ->
+        Some node
+    | CompOpKindEq
+      , (#CompOpKindEqType.t as node) ->
+        Some node
+    | CompOpKindGt
+      , (#CompOpKindGtType.t as node) ->
+        Some node
+    | CompOpKindGte
+      , (#CompOpKindGteType.t as node) ->
+        Some node
+    | CompOpKindIn
+      , (#CompOpKindInType.t as node) ->
+        Some node
+    | CompOpKindIs
+      , (#CompOpKindIsType.t as node) ->
+        Some node
+    | CompOpKindIsnot
+      , (#CompOpKindIsnotType.t as node) ->
+        Some node
+    | CompOpKindLt
+      , (#CompOpKindLtType.t as node) ->
+        Some node
+    | CompOpKindLte
+      , (#CompOpKindLteType.t as node) ->
+        Some node
+    | CompOpKindNoteq
+      , (#CompOpKindNoteqType.t as node) ->
+        Some node
+    | CompOpKindNotin
+      , (#CompOpKindNotinType.t as node) ->
+        Some node
+    | Comprehension
+      , (#ComprehensionType.t as node) ->
+        Some node
+    | CompFor
+      , (#CompForType.t as node) ->
+        Some node
+    | CompForL
+      , (#CompForLType.t as node) ->
+        Some node
+    | Decorator
+      , (#DecoratorType.t as node) ->
+        Some node
+    | DictAssoc
+      , (#DictAssocType.t as node) ->
+        Some node
+    | ElsePart
+      , (#ElsePartType.t as node) ->
+        Some node
+    | ExceptPart
+      , (#ExceptPartType.t as node) ->
+        Some node
+    | Expr
+      , (#ExprType.t as node) ->
+        Some node
+    | AndExpr
+      , (#AndExprType.t as node) ->
+        Some node
+    | AndOp
+      , (#AndOpType.t as node) ->
+        Some node
+    | BinOp
+      , (#BinOpType.t as node) ->
+        Some node
+    | ArithExpr
+      , (#ArithExprType.t as node) ->
+        Some node
+    | ShiftExpr
+      , (#ShiftExprType.t as node) ->
+        Some node
+    | Term
+      , (#TermType.t as node) ->
+        Some node
+    | CallExpr
+      , (#CallExprType.t as node) ->
+        Some node
+    | CompOp
+      , (#CompOpType.t as node) ->
+        Some node
+    | ConcatStringLit
+      , (#ConcatStringLitType.t as node) ->
+        Some node
+    | DictComp
+      , (#DictCompType.t as node) ->
+        Some node
+    | DictLit
+      , (#DictLitType.t as node) ->
+        Some node
+    | Dot
+      , (#DotType.t as node) ->
+        Some node
+    | EllipsisExpr
+      , (#EllipsisExprType.t as node) ->
+        Some node
+    | Factor
+      , (#FactorType.t as node) ->
+        Some node
+    | IfExpr
+      , (#IfExprType.t as node) ->
+        Some node
+    | InlineEval
+      , (#InlineEvalType.t as node) ->
+        Some node
+    | LambdaDef
+      , (#LambdaDefType.t as node) ->
+        Some node
+    | ListComp
+      , (#ListCompType.t as node) ->
+        Some node
+    | ListGen
+      , (#ListGenType.t as node) ->
+        Some node
+    | ListLit
+      , (#ListLitType.t as node) ->
+        Some node
+    | Name
+      , (#NameType.t as node) ->
+        Some node
+    | DottedName
+      , (#DottedNameType.t as node) ->
+        Some node
+    | Id
+      , (#IdType.t as node) ->
+        Some node
+    | NotOp
+      , (#NotOpType.t as node) ->
+        Some node
+    | NumberLit
+      , (#NumberLitType.t as node) ->
+        Some node
+    | OrExpr
+      , (#OrExprType.t as node) ->
+        Some node
+    | OrOp
+      , (#OrOpType.t as node) ->
+        Some node
+    | Power
+      , (#PowerType.t as node) ->
+        Some node
+    | SetComp
+      , (#SetCompType.t as node) ->
+        Some node
+    | SetLit
+      , (#SetLitType.t as node) ->
+        Some node
+    | SliceExpr
+      , (#SliceExprType.t as node) ->
+        Some node
+    | ExtSliceExpr
+      , (#ExtSliceExprType.t as node) ->
+        Some node
+    | StringLit
+      , (#StringLitType.t as node) ->
+        Some node
+    | SubscriptExpr
+      , (#SubscriptExprType.t as node) ->
+        Some node
+    | TupleLit
+      , (#TupleLitType.t as node) ->
+        Some node
+    | XorExpr
+      , (#XorExprType.t as node) ->
+        Some node
+    | YieldExpr
+      , (#YieldExprType.t as node) ->
+        Some node
+    | FileNode
+      , (#FileNodeType.t as node) ->
+        Some node
+    | ImportStar
+      , (#ImportStarType.t as node) ->
+        Some node
+    | KwArgsFlag
+      , (#KwArgsFlagType.t as node) ->
+        Some node
+    | KwArgsFlagAbsent
+      , (#KwArgsFlagAbsentType.t as node) ->
+        Some node
+    | KwArgsFlagPresent
+      , (#KwArgsFlagPresentType.t as node) ->
+        Some node
+    | NL
+      , (#NLType.t as node) ->
+        Some node
+    | Op
+      , (#OpType.t as node) ->
+        Some node
+    | Params
+      , (#ParamsType.t as node) ->
+        Some node
+    | PythonNodeBaseList
+      , (#PythonNodeBaseListType.t as node) ->
+        Some node
+    | ArgList
+      , (#ArgListType.t as node) ->
+        Some node
+    | AsNameNodeList
+      , (#AsNameNodeListType.t as node) ->
+        Some node
+    | DecoratorList
+      , (#DecoratorListType.t as node) ->
+        Some node
+    | DictAssocList
+      , (#DictAssocListType.t as node) ->
+        Some node
+    | DotList
+      , (#DotListType.t as node) ->
+        Some node
+    | ElifBranchList
+      , (#ElifBranchListType.t as node) ->
+        Some node
+    | ExceptPartList
+      , (#ExceptPartListType.t as node) ->
+        Some node
+    | ExprList
+      , (#ExprListType.t as node) ->
+        Some node
+    | IdList
+      , (#IdListType.t as node) ->
+        Some node
+    | NLList
+      , (#NLListType.t as node) ->
+        Some node
+    | PythonNodeList
+      , (#PythonNodeListType.t as node) ->
+        Some node
+    | SingleParamList
+      , (#SingleParamListType.t as node) ->
+        Some node
+    | StringLitList
+      , (#StringLitListType.t as node) ->
+        Some node
+    | RelName
+      , (#RelNameType.t as node) ->
+        Some node
+    | SingleParam
+      , (#SingleParamType.t as node) ->
+        Some node
+    | Stmt
+      , (#StmtType.t as node) ->
+        Some node
+    | AssertStmt
+      , (#AssertStmtType.t as node) ->
+        Some node
+    | AssignStmt
+      , (#AssignStmtType.t as node) ->
+        Some node
+    | AugAssignStmt
+      , (#AugAssignStmtType.t as node) ->
+        Some node
+    | BreakStmt
+      , (#BreakStmtType.t as node) ->
+        Some node
+    | ContinueStmt
+      , (#ContinueStmtType.t as node) ->
+        Some node
+    | Decorated
+      , (#DecoratedType.t as node) ->
+        Some node
+    | DefStmt
+      , (#DefStmtType.t as node) ->
+        Some node
+    | ClassDef
+      , (#ClassDefType.t as node) ->
+        Some node
+    | FuncDef
+      , (#FuncDefType.t as node) ->
+        Some node
+    | DelStmt
+      , (#DelStmtType.t as node) ->
+        Some node
+    | ElifBranch
+      , (#ElifBranchType.t as node) ->
+        Some node
+    | ExecStmt
+      , (#ExecStmtType.t as node) ->
+        Some node
+    | ForStmt
+      , (#ForStmtType.t as node) ->
+        Some node
+    | GlobalStmt
+      , (#GlobalStmtType.t as node) ->
+        Some node
+    | IfStmt
+      , (#IfStmtType.t as node) ->
+        Some node
+    | ImportFrom
+      , (#ImportFromType.t as node) ->
+        Some node
+    | ImportName
+      , (#ImportNameType.t as node) ->
+        Some node
+    | PassStmt
+      , (#PassStmtType.t as node) ->
+        Some node
+    | PrintStmt
+      , (#PrintStmtType.t as node) ->
+        Some node
+    | RaiseStmt
+      , (#RaiseStmtType.t as node) ->
+        Some node
+    | ReturnStmt
+      , (#ReturnStmtType.t as node) ->
+        Some node
+    | StreamPrintStmt
+      , (#StreamPrintStmtType.t as node) ->
+        Some node
+    | TryStmt
+      , (#TryStmtType.t as node) ->
+        Some node
+    | WhileStmt
+      , (#WhileStmtType.t as node) ->
+        Some node
+    | WithStmt
+      , (#WithStmtType.t as node) ->
+        Some node
+    | VarArgsFlag
+      , (#VarArgsFlagType.t as node) ->
+        Some node
+    | VarArgsFlagAbsent
+      , (#VarArgsFlagAbsentType.t as node) ->
+        Some node
+    | VarArgsFlagPresent
+      , (#VarArgsFlagPresentType.t as node) ->
+        Some node
+    | _ ->
+        None
+
+  let find : type a. a node ->  [< PythonNodeType.t ] -> a =
+    fun node_type node ->
+      let exception Found of a in
+      let aux node =
+        match node_type, node with
+        | PythonNode
+          , (#PythonNodeType.t as node) ->
+            raise (Found node)
+        | Arg
+          , (#ArgType.t as node) ->
+            raise (Found node)
+        | ArgAssoc
+          , (#ArgAssocType.t as node) ->
+            raise (Found node)
+        | ArgGen
+          , (#ArgGenType.t as node) ->
+            raise (Found node)
+        | KwArgs
+          , (#KwArgsType.t as node) ->
+            raise (Found node)
+        | VarArgs
+          , (#VarArgsType.t as node) ->
+            raise (Found node)
+        | AsNameNode
+          , (#AsNameNodeType.t as node) ->
+            raise (Found node)
+        | CompIf
+          , (#CompIfType.t as node) ->
+            raise (Found node)
+        | CompOpKind
+          , (#CompOpKindType.t as node) ->
+            raise (Found node)
+        | CompOpKindDiamond
+          , (#CompOpKindDiamondType.t as node) ->
+            raise (Found node)
+        | CompOpKindEq
+          , (#CompOpKindEqType.t as node) ->
+            raise (Found node)
+        | CompOpKindGt
+          , (#CompOpKindGtType.t as node) ->
+            raise (Found node)
+        | CompOpKindGte
+          , (#CompOpKindGteType.t as node) ->
+            raise (Found node)
+        | CompOpKindIn
+          , (#CompOpKindInType.t as node) ->
+            raise (Found node)
+        | CompOpKindIs
+          , (#CompOpKindIsType.t as node) ->
+            raise (Found node)
+        | CompOpKindIsnot
+          , (#CompOpKindIsnotType.t as node) ->
+            raise (Found node)
+        | CompOpKindLt
+          , (#CompOpKindLtType.t as node) ->
+            raise (Found node)
+        | CompOpKindLte
+          , (#CompOpKindLteType.t as node) ->
+            raise (Found node)
+        | CompOpKindNoteq
+          , (#CompOpKindNoteqType.t as node) ->
+            raise (Found node)
+        | CompOpKindNotin
+          , (#CompOpKindNotinType.t as node) ->
+            raise (Found node)
+        | Comprehension
+          , (#ComprehensionType.t as node) ->
+            raise (Found node)
+        | CompFor
+          , (#CompForType.t as node) ->
+            raise (Found node)
+        | CompForL
+          , (#CompForLType.t as node) ->
+            raise (Found node)
+        | Decorator
+          , (#DecoratorType.t as node) ->
+            raise (Found node)
+        | DictAssoc
+          , (#DictAssocType.t as node) ->
+            raise (Found node)
+        | ElsePart
+          , (#ElsePartType.t as node) ->
+            raise (Found node)
+        | ExceptPart
+          , (#ExceptPartType.t as node) ->
+            raise (Found node)
+        | Expr
+          , (#ExprType.t as node) ->
+            raise (Found node)
+        | AndExpr
+          , (#AndExprType.t as node) ->
+            raise (Found node)
+        | AndOp
+          , (#AndOpType.t as node) ->
+            raise (Found node)
+        | BinOp
+          , (#BinOpType.t as node) ->
+            raise (Found node)
+        | ArithExpr
+          , (#ArithExprType.t as node) ->
+            raise (Found node)
+        | ShiftExpr
+          , (#ShiftExprType.t as node) ->
+            raise (Found node)
+        | Term
+          , (#TermType.t as node) ->
+            raise (Found node)
+        | CallExpr
+          , (#CallExprType.t as node) ->
+            raise (Found node)
+        | CompOp
+          , (#CompOpType.t as node) ->
+            raise (Found node)
+        | ConcatStringLit
+          , (#ConcatStringLitType.t as node) ->
+            raise (Found node)
+        | DictComp
+          , (#DictCompType.t as node) ->
+            raise (Found node)
+        | DictLit
+          , (#DictLitType.t as node) ->
+            raise (Found node)
+        | Dot
+          , (#DotType.t as node) ->
+            raise (Found node)
+        | EllipsisExpr
+          , (#EllipsisExprType.t as node) ->
+            raise (Found node)
+        | Factor
+          , (#FactorType.t as node) ->
+            raise (Found node)
+        | IfExpr
+          , (#IfExprType.t as node) ->
+            raise (Found node)
+        | InlineEval
+          , (#InlineEvalType.t as node) ->
+            raise (Found node)
+        | LambdaDef
+          , (#LambdaDefType.t as node) ->
+            raise (Found node)
+        | ListComp
+          , (#ListCompType.t as node) ->
+            raise (Found node)
+        | ListGen
+          , (#ListGenType.t as node) ->
+            raise (Found node)
+        | ListLit
+          , (#ListLitType.t as node) ->
+            raise (Found node)
+        | Name
+          , (#NameType.t as node) ->
+            raise (Found node)
+        | DottedName
+          , (#DottedNameType.t as node) ->
+            raise (Found node)
+        | Id
+          , (#IdType.t as node) ->
+            raise (Found node)
+        | NotOp
+          , (#NotOpType.t as node) ->
+            raise (Found node)
+        | NumberLit
+          , (#NumberLitType.t as node) ->
+            raise (Found node)
+        | OrExpr
+          , (#OrExprType.t as node) ->
+            raise (Found node)
+        | OrOp
+          , (#OrOpType.t as node) ->
+            raise (Found node)
+        | Power
+          , (#PowerType.t as node) ->
+            raise (Found node)
+        | SetComp
+          , (#SetCompType.t as node) ->
+            raise (Found node)
+        | SetLit
+          , (#SetLitType.t as node) ->
+            raise (Found node)
+        | SliceExpr
+          , (#SliceExprType.t as node) ->
+            raise (Found node)
+        | ExtSliceExpr
+          , (#ExtSliceExprType.t as node) ->
+            raise (Found node)
+        | StringLit
+          , (#StringLitType.t as node) ->
+            raise (Found node)
+        | SubscriptExpr
+          , (#SubscriptExprType.t as node) ->
+            raise (Found node)
+        | TupleLit
+          , (#TupleLitType.t as node) ->
+            raise (Found node)
+        | XorExpr
+          , (#XorExprType.t as node) ->
+            raise (Found node)
+        | YieldExpr
+          , (#YieldExprType.t as node) ->
+            raise (Found node)
+        | FileNode
+          , (#FileNodeType.t as node) ->
+            raise (Found node)
+        | ImportStar
+          , (#ImportStarType.t as node) ->
+            raise (Found node)
+        | KwArgsFlag
+          , (#KwArgsFlagType.t as node) ->
+            raise (Found node)
+        | KwArgsFlagAbsent
+          , (#KwArgsFlagAbsentType.t as node) ->
+            raise (Found node)
+        | KwArgsFlagPresent
+          , (#KwArgsFlagPresentType.t as node) ->
+            raise (Found node)
+        | NL
+          , (#NLType.t as node) ->
+            raise (Found node)
+        | Op
+          , (#OpType.t as node) ->
+            raise (Found node)
+        | Params
+          , (#ParamsType.t as node) ->
+            raise (Found node)
+        | PythonNodeBaseList
+          , (#PythonNodeBaseListType.t as node) ->
+            raise (Found node)
+        | ArgList
+          , (#ArgListType.t as node) ->
+            raise (Found node)
+        | AsNameNodeList
+          , (#AsNameNodeListType.t as node) ->
+            raise (Found node)
+        | DecoratorList
+          , (#DecoratorListType.t as node) ->
+            raise (Found node)
+        | DictAssocList
+          , (#DictAssocListType.t as node) ->
+            raise (Found node)
+        | DotList
+          , (#DotListType.t as node) ->
+            raise (Found node)
+        | ElifBranchList
+          , (#ElifBranchListType.t as node) ->
+            raise (Found node)
+        | ExceptPartList
+          , (#ExceptPartListType.t as node) ->
+            raise (Found node)
+        | ExprList
+          , (#ExprListType.t as node) ->
+            raise (Found node)
+        | IdList
+          , (#IdListType.t as node) ->
+            raise (Found node)
+        | NLList
+          , (#NLListType.t as node) ->
+            raise (Found node)
+        | PythonNodeList
+          , (#PythonNodeListType.t as node) ->
+            raise (Found node)
+        | SingleParamList
+          , (#SingleParamListType.t as node) ->
+            raise (Found node)
+        | StringLitList
+          , (#StringLitListType.t as node) ->
+            raise (Found node)
+        | RelName
+          , (#RelNameType.t as node) ->
+            raise (Found node)
+        | SingleParam
+          , (#SingleParamType.t as node) ->
+            raise (Found node)
+        | Stmt
+          , (#StmtType.t as node) ->
+            raise (Found node)
+        | AssertStmt
+          , (#AssertStmtType.t as node) ->
+            raise (Found node)
+        | AssignStmt
+          , (#AssignStmtType.t as node) ->
+            raise (Found node)
+        | AugAssignStmt
+          , (#AugAssignStmtType.t as node) ->
+            raise (Found node)
+        | BreakStmt
+          , (#BreakStmtType.t as node) ->
+            raise (Found node)
+        | ContinueStmt
+          , (#ContinueStmtType.t as node) ->
+            raise (Found node)
+        | Decorated
+          , (#DecoratedType.t as node) ->
+            raise (Found node)
+        | DefStmt
+          , (#DefStmtType.t as node) ->
+            raise (Found node)
+        | ClassDef
+          , (#ClassDefType.t as node) ->
+            raise (Found node)
+        | FuncDef
+          , (#FuncDefType.t as node) ->
+            raise (Found node)
+        | DelStmt
+          , (#DelStmtType.t as node) ->
+            raise (Found node)
+        | ElifBranch
+          , (#ElifBranchType.t as node) ->
+            raise (Found node)
+        | ExecStmt
+          , (#ExecStmtType.t as node) ->
+            raise (Found node)
+        | ForStmt
+          , (#ForStmtType.t as node) ->
+            raise (Found node)
+        | GlobalStmt
+          , (#GlobalStmtType.t as node) ->
+            raise (Found node)
+        | IfStmt
+          , (#IfStmtType.t as node) ->
+            raise (Found node)
+        | ImportFrom
+          , (#ImportFromType.t as node) ->
+            raise (Found node)
+        | ImportName
+          , (#ImportNameType.t as node) ->
+            raise (Found node)
+        | PassStmt
+          , (#PassStmtType.t as node) ->
+            raise (Found node)
+        | PrintStmt
+          , (#PrintStmtType.t as node) ->
+            raise (Found node)
+        | RaiseStmt
+          , (#RaiseStmtType.t as node) ->
+            raise (Found node)
+        | ReturnStmt
+          , (#ReturnStmtType.t as node) ->
+            raise (Found node)
+        | StreamPrintStmt
+          , (#StreamPrintStmtType.t as node) ->
+            raise (Found node)
+        | TryStmt
+          , (#TryStmtType.t as node) ->
+            raise (Found node)
+        | WhileStmt
+          , (#WhileStmtType.t as node) ->
+            raise (Found node)
+        | WithStmt
+          , (#WithStmtType.t as node) ->
+            raise (Found node)
+        | VarArgsFlag
+          , (#VarArgsFlagType.t as node) ->
+            raise (Found node)
+        | VarArgsFlagAbsent
+          , (#VarArgsFlagAbsentType.t as node) ->
+            raise (Found node)
+        | VarArgsFlagPresent
+          , (#VarArgsFlagPresentType.t as node) ->
+            raise (Found node)
+        | _ ->
+          ()
+      in
+      try
+        iter aux node;
+        raise Not_found
+      with (Found node) -> node
+
+
+
+  let findall : type a. a node ->  [< PythonNodeType.t ] -> a list =
+    fun node_type node ->
+      let aux : a list -> [< PythonNodeType.t ] -> a list =
+       fun acc node ->
+        match node_type, node with
+        | PythonNode
+          , (#PythonNodeType.t as node) ->
+            node :: acc
+        | Arg
+          , (#ArgType.t as node) ->
+            node :: acc
+        | ArgAssoc
+          , (#ArgAssocType.t as node) ->
+            node :: acc
+        | ArgGen
+          , (#ArgGenType.t as node) ->
+            node :: acc
+        | KwArgs
+          , (#KwArgsType.t as node) ->
+            node :: acc
+        | VarArgs
+          , (#VarArgsType.t as node) ->
+            node :: acc
+        | AsNameNode
+          , (#AsNameNodeType.t as node) ->
+            node :: acc
+        | CompIf
+          , (#CompIfType.t as node) ->
+            node :: acc
+        | CompOpKind
+          , (#CompOpKindType.t as node) ->
+            node :: acc
+        | CompOpKindDiamond
+          , (#CompOpKindDiamondType.t as node) ->
+            node :: acc
+        | CompOpKindEq
+          , (#CompOpKindEqType.t as node) ->
+            node :: acc
+        | CompOpKindGt
+          , (#CompOpKindGtType.t as node) ->
+            node :: acc
+        | CompOpKindGte
+          , (#CompOpKindGteType.t as node) ->
+            node :: acc
+        | CompOpKindIn
+          , (#CompOpKindInType.t as node) ->
+            node :: acc
+        | CompOpKindIs
+          , (#CompOpKindIsType.t as node) ->
+            node :: acc
+        | CompOpKindIsnot
+          , (#CompOpKindIsnotType.t as node) ->
+            node :: acc
+        | CompOpKindLt
+          , (#CompOpKindLtType.t as node) ->
+            node :: acc
+        | CompOpKindLte
+          , (#CompOpKindLteType.t as node) ->
+            node :: acc
+        | CompOpKindNoteq
+          , (#CompOpKindNoteqType.t as node) ->
+            node :: acc
+        | CompOpKindNotin
+          , (#CompOpKindNotinType.t as node) ->
+            node :: acc
+        | Comprehension
+          , (#ComprehensionType.t as node) ->
+            node :: acc
+        | CompFor
+          , (#CompForType.t as node) ->
+            node :: acc
+        | CompForL
+          , (#CompForLType.t as node) ->
+            node :: acc
+        | Decorator
+          , (#DecoratorType.t as node) ->
+            node :: acc
+        | DictAssoc
+          , (#DictAssocType.t as node) ->
+            node :: acc
+        | ElsePart
+          , (#ElsePartType.t as node) ->
+            node :: acc
+        | ExceptPart
+          , (#ExceptPartType.t as node) ->
+            node :: acc
+        | Expr
+          , (#ExprType.t as node) ->
+            node :: acc
+        | AndExpr
+          , (#AndExprType.t as node) ->
+            node :: acc
+        | AndOp
+          , (#AndOpType.t as node) ->
+            node :: acc
+        | BinOp
+          , (#BinOpType.t as node) ->
+            node :: acc
+        | ArithExpr
+          , (#ArithExprType.t as node) ->
+            node :: acc
+        | ShiftExpr
+          , (#ShiftExprType.t as node) ->
+            node :: acc
+        | Term
+          , (#TermType.t as node) ->
+            node :: acc
+        | CallExpr
+          , (#CallExprType.t as node) ->
+            node :: acc
+        | CompOp
+          , (#CompOpType.t as node) ->
+            node :: acc
+        | ConcatStringLit
+          , (#ConcatStringLitType.t as node) ->
+            node :: acc
+        | DictComp
+          , (#DictCompType.t as node) ->
+            node :: acc
+        | DictLit
+          , (#DictLitType.t as node) ->
+            node :: acc
+        | Dot
+          , (#DotType.t as node) ->
+            node :: acc
+        | EllipsisExpr
+          , (#EllipsisExprType.t as node) ->
+            node :: acc
+        | Factor
+          , (#FactorType.t as node) ->
+            node :: acc
+        | IfExpr
+          , (#IfExprType.t as node) ->
+            node :: acc
+        | InlineEval
+          , (#InlineEvalType.t as node) ->
+            node :: acc
+        | LambdaDef
+          , (#LambdaDefType.t as node) ->
+            node :: acc
+        | ListComp
+          , (#ListCompType.t as node) ->
+            node :: acc
+        | ListGen
+          , (#ListGenType.t as node) ->
+            node :: acc
+        | ListLit
+          , (#ListLitType.t as node) ->
+            node :: acc
+        | Name
+          , (#NameType.t as node) ->
+            node :: acc
+        | DottedName
+          , (#DottedNameType.t as node) ->
+            node :: acc
+        | Id
+          , (#IdType.t as node) ->
+            node :: acc
+        | NotOp
+          , (#NotOpType.t as node) ->
+            node :: acc
+        | NumberLit
+          , (#NumberLitType.t as node) ->
+            node :: acc
+        | OrExpr
+          , (#OrExprType.t as node) ->
+            node :: acc
+        | OrOp
+          , (#OrOpType.t as node) ->
+            node :: acc
+        | Power
+          , (#PowerType.t as node) ->
+            node :: acc
+        | SetComp
+          , (#SetCompType.t as node) ->
+            node :: acc
+        | SetLit
+          , (#SetLitType.t as node) ->
+            node :: acc
+        | SliceExpr
+          , (#SliceExprType.t as node) ->
+            node :: acc
+        | ExtSliceExpr
+          , (#ExtSliceExprType.t as node) ->
+            node :: acc
+        | StringLit
+          , (#StringLitType.t as node) ->
+            node :: acc
+        | SubscriptExpr
+          , (#SubscriptExprType.t as node) ->
+            node :: acc
+        | TupleLit
+          , (#TupleLitType.t as node) ->
+            node :: acc
+        | XorExpr
+          , (#XorExprType.t as node) ->
+            node :: acc
+        | YieldExpr
+          , (#YieldExprType.t as node) ->
+            node :: acc
+        | FileNode
+          , (#FileNodeType.t as node) ->
+            node :: acc
+        | ImportStar
+          , (#ImportStarType.t as node) ->
+            node :: acc
+        | KwArgsFlag
+          , (#KwArgsFlagType.t as node) ->
+            node :: acc
+        | KwArgsFlagAbsent
+          , (#KwArgsFlagAbsentType.t as node) ->
+            node :: acc
+        | KwArgsFlagPresent
+          , (#KwArgsFlagPresentType.t as node) ->
+            node :: acc
+        | NL
+          , (#NLType.t as node) ->
+            node :: acc
+        | Op
+          , (#OpType.t as node) ->
+            node :: acc
+        | Params
+          , (#ParamsType.t as node) ->
+            node :: acc
+        | PythonNodeBaseList
+          , (#PythonNodeBaseListType.t as node) ->
+            node :: acc
+        | ArgList
+          , (#ArgListType.t as node) ->
+            node :: acc
+        | AsNameNodeList
+          , (#AsNameNodeListType.t as node) ->
+            node :: acc
+        | DecoratorList
+          , (#DecoratorListType.t as node) ->
+            node :: acc
+        | DictAssocList
+          , (#DictAssocListType.t as node) ->
+            node :: acc
+        | DotList
+          , (#DotListType.t as node) ->
+            node :: acc
+        | ElifBranchList
+          , (#ElifBranchListType.t as node) ->
+            node :: acc
+        | ExceptPartList
+          , (#ExceptPartListType.t as node) ->
+            node :: acc
+        | ExprList
+          , (#ExprListType.t as node) ->
+            node :: acc
+        | IdList
+          , (#IdListType.t as node) ->
+            node :: acc
+        | NLList
+          , (#NLListType.t as node) ->
+            node :: acc
+        | PythonNodeList
+          , (#PythonNodeListType.t as node) ->
+            node :: acc
+        | SingleParamList
+          , (#SingleParamListType.t as node) ->
+            node :: acc
+        | StringLitList
+          , (#StringLitListType.t as node) ->
+            node :: acc
+        | RelName
+          , (#RelNameType.t as node) ->
+            node :: acc
+        | SingleParam
+          , (#SingleParamType.t as node) ->
+            node :: acc
+        | Stmt
+          , (#StmtType.t as node) ->
+            node :: acc
+        | AssertStmt
+          , (#AssertStmtType.t as node) ->
+            node :: acc
+        | AssignStmt
+          , (#AssignStmtType.t as node) ->
+            node :: acc
+        | AugAssignStmt
+          , (#AugAssignStmtType.t as node) ->
+            node :: acc
+        | BreakStmt
+          , (#BreakStmtType.t as node) ->
+            node :: acc
+        | ContinueStmt
+          , (#ContinueStmtType.t as node) ->
+            node :: acc
+        | Decorated
+          , (#DecoratedType.t as node) ->
+            node :: acc
+        | DefStmt
+          , (#DefStmtType.t as node) ->
+            node :: acc
+        | ClassDef
+          , (#ClassDefType.t as node) ->
+            node :: acc
+        | FuncDef
+          , (#FuncDefType.t as node) ->
+            node :: acc
+        | DelStmt
+          , (#DelStmtType.t as node) ->
+            node :: acc
+        | ElifBranch
+          , (#ElifBranchType.t as node) ->
+            node :: acc
+        | ExecStmt
+          , (#ExecStmtType.t as node) ->
+            node :: acc
+        | ForStmt
+          , (#ForStmtType.t as node) ->
+            node :: acc
+        | GlobalStmt
+          , (#GlobalStmtType.t as node) ->
+            node :: acc
+        | IfStmt
+          , (#IfStmtType.t as node) ->
+            node :: acc
+        | ImportFrom
+          , (#ImportFromType.t as node) ->
+            node :: acc
+        | ImportName
+          , (#ImportNameType.t as node) ->
+            node :: acc
+        | PassStmt
+          , (#PassStmtType.t as node) ->
+            node :: acc
+        | PrintStmt
+          , (#PrintStmtType.t as node) ->
+            node :: acc
+        | RaiseStmt
+          , (#RaiseStmtType.t as node) ->
+            node :: acc
+        | ReturnStmt
+          , (#ReturnStmtType.t as node) ->
+            node :: acc
+        | StreamPrintStmt
+          , (#StreamPrintStmtType.t as node) ->
+            node :: acc
+        | TryStmt
+          , (#TryStmtType.t as node) ->
+            node :: acc
+        | WhileStmt
+          , (#WhileStmtType.t as node) ->
+            node :: acc
+        | WithStmt
+          , (#WithStmtType.t as node) ->
+            node :: acc
+        | VarArgsFlag
+          , (#VarArgsFlagType.t as node) ->
+            node :: acc
+        | VarArgsFlagAbsent
+          , (#VarArgsFlagAbsentType.t as node) ->
+            node :: acc
+        | VarArgsFlagPresent
+          , (#VarArgsFlagPresentType.t as node) ->
+            node :: acc
+        | _ ->
+          acc
+      in
+      List.rev (fold aux [] node)
+
+  let fields_with_names node =
+    let aux i x =
+      (Format.sprintf "item_%d" i), x
+    in
+    match (node :> PythonNodeType.t) with
+    | `VarArgsFlagPresent value ->
+        [
+        ]
+    | `VarArgsFlagAbsent value ->
+        [
+        ]
+    | `WithStmt value ->
+        [
+        (try
+           ("bindings"
+           , Some (Lazy.force value.f_bindings
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("bindings", None) );
+        (try
+           ("statements"
+           , Some (Lazy.force value.f_statements
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("statements", None) );
+        ]
+    | `WhileStmt value ->
+        [
+        (try
+           ("cond_test"
+           , Some (Lazy.force value.f_cond_test
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("cond_test", None) );
+        (try
+           ("statements"
+           , Some (Lazy.force value.f_statements
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("statements", None) );
+        ("else_part"
+        , (Lazy.force value.f_else_part
+           :> PythonNodeType.t option));
+        ]
+    | `TryStmt value ->
+        [
+        (try
+           ("statements"
+           , Some (Lazy.force value.f_statements
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("statements", None) );
+        (try
+           ("except_parts"
+           , Some (Lazy.force value.f_except_parts
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("except_parts", None) );
+        ("else_part"
+        , (Lazy.force value.f_else_part
+           :> PythonNodeType.t option));
+        ("finally_part"
+        , (Lazy.force value.f_finally_part
+           :> PythonNodeType.t option));
+        ]
+    | `StreamPrintStmt value ->
+        [
+        (try
+           ("stream_expr"
+           , Some (Lazy.force value.f_stream_expr
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("stream_expr", None) );
+        (try
+           ("exprs"
+           , Some (Lazy.force value.f_exprs
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("exprs", None) );
+        ]
+    | `ReturnStmt value ->
+        [
+        ("exprs"
+        , (Lazy.force value.f_exprs
+           :> PythonNodeType.t option));
+        ]
+    | `RaiseStmt value ->
+        [
+        ("exprs"
+        , (Lazy.force value.f_exprs
+           :> PythonNodeType.t option));
+        ]
+    | `PrintStmt value ->
+        [
+        (try
+           ("exprs"
+           , Some (Lazy.force value.f_exprs
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("exprs", None) );
+        ]
+    | `PassStmt value ->
+        [
+        ]
+    | `ImportName value ->
+        [
+        (try
+           ("imported_names"
+           , Some (Lazy.force value.f_imported_names
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("imported_names", None) );
+        ]
+    | `ImportFrom value ->
+        [
+        (try
+           ("rel_name"
+           , Some (Lazy.force value.f_rel_name
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("rel_name", None) );
+        (try
+           ("imported"
+           , Some (Lazy.force value.f_imported
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("imported", None) );
+        ]
+    | `IfStmt value ->
+        [
+        (try
+           ("cond_test"
+           , Some (Lazy.force value.f_cond_test
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("cond_test", None) );
+        (try
+           ("statements"
+           , Some (Lazy.force value.f_statements
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("statements", None) );
+        (try
+           ("elif_branchs"
+           , Some (Lazy.force value.f_elif_branchs
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("elif_branchs", None) );
+        ("else_part"
+        , (Lazy.force value.f_else_part
+           :> PythonNodeType.t option));
+        ]
+    | `GlobalStmt value ->
+        [
+        (try
+           ("names"
+           , Some (Lazy.force value.f_names
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("names", None) );
+        ]
+    | `ForStmt value ->
+        [
+        (try
+           ("bindings"
+           , Some (Lazy.force value.f_bindings
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("bindings", None) );
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        (try
+           ("statements"
+           , Some (Lazy.force value.f_statements
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("statements", None) );
+        ("else_part"
+        , (Lazy.force value.f_else_part
+           :> PythonNodeType.t option));
+        ]
+    | `ExecStmt value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ("in_list"
+        , (Lazy.force value.f_in_list
+           :> PythonNodeType.t option));
+        ]
+    | `ElifBranch value ->
+        [
+        (try
+           ("cond_test"
+           , Some (Lazy.force value.f_cond_test
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("cond_test", None) );
+        (try
+           ("statements"
+           , Some (Lazy.force value.f_statements
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("statements", None) );
+        ]
+    | `DelStmt value ->
+        [
+        (try
+           ("exprs"
+           , Some (Lazy.force value.f_exprs
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("exprs", None) );
+        ]
+    | `FuncDef value ->
+        [
+        (try
+           ("name"
+           , Some (Lazy.force value.f_name
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("name", None) );
+        ("parameters"
+        , (Lazy.force value.f_parameters
+           :> PythonNodeType.t option));
+        (try
+           ("body"
+           , Some (Lazy.force value.f_body
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("body", None) );
+        ]
+    | `ClassDef value ->
+        [
+        (try
+           ("name"
+           , Some (Lazy.force value.f_name
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("name", None) );
+        ("bases"
+        , (Lazy.force value.f_bases
+           :> PythonNodeType.t option));
+        (try
+           ("statements"
+           , Some (Lazy.force value.f_statements
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("statements", None) );
+        ]
+    | `Decorated value ->
+        [
+        (try
+           ("decorators"
+           , Some (Lazy.force value.f_decorators
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("decorators", None) );
+        (try
+           ("defn"
+           , Some (Lazy.force value.f_defn
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("defn", None) );
+        ]
+    | `ContinueStmt value ->
+        [
+        ]
+    | `BreakStmt value ->
+        [
+        ]
+    | `AugAssignStmt value ->
+        [
+        (try
+           ("l_value"
+           , Some (Lazy.force value.f_l_value
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("l_value", None) );
+        (try
+           ("op"
+           , Some (Lazy.force value.f_op
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("op", None) );
+        (try
+           ("r_value"
+           , Some (Lazy.force value.f_r_value
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("r_value", None) );
+        ]
+    | `AssignStmt value ->
+        [
+        (try
+           ("l_value"
+           , Some (Lazy.force value.f_l_value
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("l_value", None) );
+        (try
+           ("r_values"
+           , Some (Lazy.force value.f_r_values
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("r_values", None) );
+        ]
+    | `AssertStmt value ->
+        [
+        (try
+           ("test_expr"
+           , Some (Lazy.force value.f_test_expr
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("test_expr", None) );
+        ("msg"
+        , (Lazy.force value.f_msg
+           :> PythonNodeType.t option));
+        ]
+    | `SingleParam value ->
+        [
+        (try
+           ("is_varargs"
+           , Some (Lazy.force value.f_is_varargs
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("is_varargs", None) );
+        (try
+           ("is_kwargs"
+           , Some (Lazy.force value.f_is_kwargs
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("is_kwargs", None) );
+        (try
+           ("name"
+           , Some (Lazy.force value.f_name
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("name", None) );
+        ("default_value"
+        , (Lazy.force value.f_default_value
+           :> PythonNodeType.t option));
+        ]
+    | `RelName value ->
+        [
+        (try
+           ("dots"
+           , Some (Lazy.force value.f_dots
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("dots", None) );
+        ("name"
+        , (Lazy.force value.f_name
+           :> PythonNodeType.t option));
+        ]
+    | `StringLitList value ->
+        List.mapi aux (children_opt node)
+    | `SingleParamList value ->
+        List.mapi aux (children_opt node)
+    | `PythonNodeList value ->
+        List.mapi aux (children_opt node)
+    | `NLList value ->
+        List.mapi aux (children_opt node)
+    | `IdList value ->
+        List.mapi aux (children_opt node)
+    | `ExprList value ->
+        List.mapi aux (children_opt node)
+    | `ExceptPartList value ->
+        List.mapi aux (children_opt node)
+    | `ElifBranchList value ->
+        List.mapi aux (children_opt node)
+    | `DotList value ->
+        List.mapi aux (children_opt node)
+    | `DictAssocList value ->
+        List.mapi aux (children_opt node)
+    | `DecoratorList value ->
+        List.mapi aux (children_opt node)
+    | `AsNameNodeList value ->
+        List.mapi aux (children_opt node)
+    | `ArgList value ->
+        List.mapi aux (children_opt node)
+    | `Params value ->
+        [
+        (try
+           ("single_params"
+           , Some (Lazy.force value.f_single_params
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("single_params", None) );
+        ]
+    | `Op value ->
+        [
+        ]
+    | `NL value ->
+        [
+        ]
+    | `KwArgsFlagPresent value ->
+        [
+        ]
+    | `KwArgsFlagAbsent value ->
+        [
+        ]
+    | `ImportStar value ->
+        [
+        ]
+    | `FileNode value ->
+        [
+        (try
+           ("statements"
+           , Some (Lazy.force value.f_statements
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("statements", None) );
+        ]
+    | `YieldExpr value ->
+        [
+        ("exprs"
+        , (Lazy.force value.f_exprs
+           :> PythonNodeType.t option));
+        ]
+    | `XorExpr value ->
+        [
+        (try
+           ("left"
+           , Some (Lazy.force value.f_left
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("left", None) );
+        (try
+           ("right"
+           , Some (Lazy.force value.f_right
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("right", None) );
+        ]
+    | `TupleLit value ->
+        [
+        ("exprs"
+        , (Lazy.force value.f_exprs
+           :> PythonNodeType.t option));
+        ]
+    | `SubscriptExpr value ->
+        [
+        (try
+           ("prefix"
+           , Some (Lazy.force value.f_prefix
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("prefix", None) );
+        (try
+           ("suffix"
+           , Some (Lazy.force value.f_suffix
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("suffix", None) );
+        ]
+    | `StringLit value ->
+        [
+        ]
+    | `ExtSliceExpr value ->
+        [
+        ("first"
+        , (Lazy.force value.f_first
+           :> PythonNodeType.t option));
+        ("last"
+        , (Lazy.force value.f_last
+           :> PythonNodeType.t option));
+        ("stride"
+        , (Lazy.force value.f_stride
+           :> PythonNodeType.t option));
+        ]
+    | `SliceExpr value ->
+        [
+        ("first"
+        , (Lazy.force value.f_first
+           :> PythonNodeType.t option));
+        ("last"
+        , (Lazy.force value.f_last
+           :> PythonNodeType.t option));
+        ]
+    | `SetLit value ->
+        [
+        (try
+           ("exprs"
+           , Some (Lazy.force value.f_exprs
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("exprs", None) );
+        ]
+    | `SetComp value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        (try
+           ("comprehension"
+           , Some (Lazy.force value.f_comprehension
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("comprehension", None) );
+        ]
+    | `Power value ->
+        [
+        (try
+           ("left"
+           , Some (Lazy.force value.f_left
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("left", None) );
+        (try
+           ("right"
+           , Some (Lazy.force value.f_right
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("right", None) );
+        ]
+    | `OrOp value ->
+        [
+        (try
+           ("left"
+           , Some (Lazy.force value.f_left
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("left", None) );
+        (try
+           ("right"
+           , Some (Lazy.force value.f_right
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("right", None) );
+        ]
+    | `OrExpr value ->
+        [
+        (try
+           ("left"
+           , Some (Lazy.force value.f_left
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("left", None) );
+        (try
+           ("right"
+           , Some (Lazy.force value.f_right
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("right", None) );
+        ]
+    | `NumberLit value ->
+        [
+        ]
+    | `NotOp value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ]
+    | `Id value ->
+        [
+        ]
+    | `DottedName value ->
+        [
+        (try
+           ("prefix"
+           , Some (Lazy.force value.f_prefix
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("prefix", None) );
+        (try
+           ("suffix"
+           , Some (Lazy.force value.f_suffix
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("suffix", None) );
+        ]
+    | `ListLit value ->
+        [
+        (try
+           ("exprs"
+           , Some (Lazy.force value.f_exprs
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("exprs", None) );
+        ]
+    | `ListGen value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        (try
+           ("comprehension"
+           , Some (Lazy.force value.f_comprehension
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("comprehension", None) );
+        ]
+    | `ListComp value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        (try
+           ("comprehension"
+           , Some (Lazy.force value.f_comprehension
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("comprehension", None) );
+        ]
+    | `LambdaDef value ->
+        [
+        (try
+           ("args"
+           , Some (Lazy.force value.f_args
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("args", None) );
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ]
+    | `InlineEval value ->
+        [
+        (try
+           ("exprs"
+           , Some (Lazy.force value.f_exprs
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("exprs", None) );
+        ]
+    | `IfExpr value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        (try
+           ("cond"
+           , Some (Lazy.force value.f_cond
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("cond", None) );
+        (try
+           ("else_expr"
+           , Some (Lazy.force value.f_else_expr
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("else_expr", None) );
+        ]
+    | `Factor value ->
+        [
+        (try
+           ("op"
+           , Some (Lazy.force value.f_op
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("op", None) );
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ]
+    | `EllipsisExpr value ->
+        [
+        ]
+    | `Dot value ->
+        [
+        ]
+    | `DictLit value ->
+        [
+        (try
+           ("assocs"
+           , Some (Lazy.force value.f_assocs
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("assocs", None) );
+        ]
+    | `DictComp value ->
+        [
+        (try
+           ("assoc"
+           , Some (Lazy.force value.f_assoc
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("assoc", None) );
+        (try
+           ("comprehension"
+           , Some (Lazy.force value.f_comprehension
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("comprehension", None) );
+        ]
+    | `ConcatStringLit value ->
+        [
+        (try
+           ("first_str"
+           , Some (Lazy.force value.f_first_str
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("first_str", None) );
+        (try
+           ("subsequent_str"
+           , Some (Lazy.force value.f_subsequent_str
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("subsequent_str", None) );
+        ]
+    | `CompOp value ->
+        [
+        (try
+           ("left"
+           , Some (Lazy.force value.f_left
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("left", None) );
+        (try
+           ("op"
+           , Some (Lazy.force value.f_op
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("op", None) );
+        (try
+           ("right"
+           , Some (Lazy.force value.f_right
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("right", None) );
+        ]
+    | `CallExpr value ->
+        [
+        (try
+           ("prefix"
+           , Some (Lazy.force value.f_prefix
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("prefix", None) );
+        (try
+           ("suffix"
+           , Some (Lazy.force value.f_suffix
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("suffix", None) );
+        ]
+    | `Term value ->
+        [
+        (try
+           ("left"
+           , Some (Lazy.force value.f_left
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("left", None) );
+        (try
+           ("op"
+           , Some (Lazy.force value.f_op
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("op", None) );
+        (try
+           ("right"
+           , Some (Lazy.force value.f_right
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("right", None) );
+        ]
+    | `ShiftExpr value ->
+        [
+        (try
+           ("left"
+           , Some (Lazy.force value.f_left
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("left", None) );
+        (try
+           ("op"
+           , Some (Lazy.force value.f_op
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("op", None) );
+        (try
+           ("right"
+           , Some (Lazy.force value.f_right
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("right", None) );
+        ]
+    | `ArithExpr value ->
+        [
+        (try
+           ("left"
+           , Some (Lazy.force value.f_left
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("left", None) );
+        (try
+           ("op"
+           , Some (Lazy.force value.f_op
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("op", None) );
+        (try
+           ("right"
+           , Some (Lazy.force value.f_right
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("right", None) );
+        ]
+    | `AndOp value ->
+        [
+        (try
+           ("left"
+           , Some (Lazy.force value.f_left
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("left", None) );
+        (try
+           ("right"
+           , Some (Lazy.force value.f_right
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("right", None) );
+        ]
+    | `AndExpr value ->
+        [
+        (try
+           ("left"
+           , Some (Lazy.force value.f_left
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("left", None) );
+        (try
+           ("right"
+           , Some (Lazy.force value.f_right
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("right", None) );
+        ]
+    | `ExceptPart value ->
+        [
+        ("as_name"
+        , (Lazy.force value.f_as_name
+           :> PythonNodeType.t option));
+        (try
+           ("statements"
+           , Some (Lazy.force value.f_statements
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("statements", None) );
+        ]
+    | `ElsePart value ->
+        [
+        (try
+           ("statements"
+           , Some (Lazy.force value.f_statements
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("statements", None) );
+        ]
+    | `DictAssoc value ->
+        [
+        (try
+           ("key"
+           , Some (Lazy.force value.f_key
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("key", None) );
+        (try
+           ("value"
+           , Some (Lazy.force value.f_value
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("value", None) );
+        ]
+    | `Decorator value ->
+        [
+        (try
+           ("dec_name"
+           , Some (Lazy.force value.f_dec_name
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("dec_name", None) );
+        ("arg_list"
+        , (Lazy.force value.f_arg_list
+           :> PythonNodeType.t option));
+        ]
+    | `CompForL value ->
+        [
+        (try
+           ("exprs"
+           , Some (Lazy.force value.f_exprs
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("exprs", None) );
+        (try
+           ("target"
+           , Some (Lazy.force value.f_target
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("target", None) );
+        ("comp"
+        , (Lazy.force value.f_comp
+           :> PythonNodeType.t option));
+        ]
+    | `CompFor value ->
+        [
+        (try
+           ("exprs"
+           , Some (Lazy.force value.f_exprs
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("exprs", None) );
+        (try
+           ("target"
+           , Some (Lazy.force value.f_target
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("target", None) );
+        ("comp"
+        , (Lazy.force value.f_comp
+           :> PythonNodeType.t option));
+        ]
+    | `CompOpKindNotin value ->
+        [
+        ]
+    | `CompOpKindNoteq value ->
+        [
+        ]
+    | `CompOpKindLte value ->
+        [
+        ]
+    | `CompOpKindLt value ->
+        [
+        ]
+    | `CompOpKindIsnot value ->
+        [
+        ]
+    | `CompOpKindIs value ->
+        [
+        ]
+    | `CompOpKindIn value ->
+        [
+        ]
+    | `CompOpKindGte value ->
+        [
+        ]
+    | `CompOpKindGt value ->
+        [
+        ]
+    | `CompOpKindEq value ->
+        [
+        ]
+    | `CompOpKindDiamond value ->
+        [
+        ]
+    | `CompIf value ->
+        [
+        (try
+           ("test"
+           , Some (Lazy.force value.f_test
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("test", None) );
+        ("comp"
+        , (Lazy.force value.f_comp
+           :> PythonNodeType.t option));
+        ]
+    | `AsNameNode value ->
+        [
+        (try
+           ("imported"
+           , Some (Lazy.force value.f_imported
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("imported", None) );
+        ("as_name"
+        , (Lazy.force value.f_as_name
+           :> PythonNodeType.t option));
+        ]
+    | `VarArgs value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ]
+    | `KwArgs value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ]
+    | `ArgGen value ->
+        [
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        (try
+           ("comprehension"
+           , Some (Lazy.force value.f_comprehension
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("comprehension", None) );
+        ]
+    | `ArgAssoc value ->
+        [
+        ("name"
+        , (Lazy.force value.f_name
+           :> PythonNodeType.t option));
+        (try
+           ("expr"
+           , Some (Lazy.force value.f_expr
+                    :> PythonNodeType.t))
+        with SyntaxError ->
+          ("expr", None) );
+        ]
+
+  let rec pp_tree fmt node =
+    let rec pp_node_field fmt (name, node) =
+      match node with
+      | Some node ->
+          Format.fprintf fmt "@[<v 2>%s:@ %a@]" name pp_node node
+      | None ->
+          Format.fprintf fmt "@[<v 2>%s: None@]" name
+    and pp_node_fields fmt node =
+      let name_field_list = fields_with_names node in
+      match name_field_list with
+      | [] ->
+          ()
+      | l ->
+          Format.fprintf fmt "@ @[<v>%a@]"
+            (Format.pp_print_list pp_node_field) l
+    and pp_node fmt node =
+      let repr = entity_image node in
+      let len = String.length repr in
+      let erepr = String.sub repr 1 (len - 2) in
+      Format.fprintf fmt "@[<v 2>%s%s%a@]"
+        erepr
+        (if is_token_node node then (": " ^ (text node)) else "")
+        pp_node_fields node
+    in
+    let default = Format.pp_get_formatter_out_functions fmt () in
+    let out_indent n =
+      let the_end = n in
+      let rec make n =
+        if n = the_end then ""
+        else (if n mod 4 = 2 then "|" else " ") ^ make (n + 1)
+      in
+      default.out_string (make 0) 0 n
+    in
+    Format.pp_set_formatter_out_functions fmt {default with out_indent} ;
+    Format.fprintf fmt "%a%!" pp_node (node :> PythonNodeType.t);
+    Format.pp_set_formatter_out_functions fmt default
+
+
+end
+
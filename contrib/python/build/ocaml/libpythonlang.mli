@@ -0,0 +1,15695 @@
+
+
+
+
+
+
+(**
+ * OCaml binding of the Libpythonlang API.
+ *)
+
+(**
+ * Raised when introspection functions (``Libpythonlang.Introspection``) are
+ * requested an invalid field.
+ *)
+exception InvalidField of string
+
+(**
+ * Raised when introspection functions (``Libpythonlang.Introspection``) are
+ * improperly used to evaluate a node data (field or property).
+ *)
+exception NodeDataEvaluationError of string
+
+(**
+ * Raised by lexing functions (``Libpythonlang.Lexer``) when the input contains
+ * an invalid byte sequence.
+ *)
+exception InvalidInput of string
+
+(**
+ * Exception raise when an invalid symbol is passed to a subprogram.
+ *)
+exception InvalidSymbolError of string
+
+(**
+ * Raised when an invalid unit name is provided.
+ *)
+exception InvalidUnitNameError of string
+
+(**
+ * Exception raised in language bindings when the underlying C API reports an
+ * unexpected error that occurred in the library.
+
+ * This kind of exception is raised for internal errors: they should never
+ * happen in normal situations and if they are raised at some point, it means
+ * the library state is potentially corrupted.
+
+ * Nevertheless, the library does its best not to crash the program,
+ * materializing internal errors using this kind of exception.
+ *)
+exception NativeException of string
+
+(**
+ * Exception raised when an API is called while its preconditions are not
+ * satisfied.
+ *)
+exception PreconditionFailure of string
+
+(**
+ * Exception that is raised when an error occurs while evaluating any AST node
+ * method whose name starts with ``p_``. This is the only exceptions that such
+ * functions can raise.
+ *)
+exception PropertyError of string
+
+(**
+ * Exception raised when the provided arguments for a template don't match what
+ * the template expects.
+ *)
+exception TemplateArgsError of string
+
+(**
+ * Exception raised when a template has an invalid syntax, such as badly
+ * formatted placeholders.
+ *)
+exception TemplateFormatError of string
+
+(**
+ * Exception raised when the instantiation of a template cannot be parsed.
+ *)
+exception TemplateInstantiationError of string
+
+(**
+ * Exception raised while trying to access data that was deallocated. This
+ * happens when one tries to use a node whose unit has been reparsed, for
+ * instance.
+ *)
+exception StaleReferenceError of string
+
+(**
+ * Raised by lexing functions (``Libpythonlang.Lexer``) when the input charset
+ * is not supported.
+ *)
+exception UnknownCharset of string
+
+
+
+
+
+(**
+ * Raised if a field of a node is null due to a syntax error
+ *)
+exception SyntaxError
+
+module AnalysisUnitKind : sig
+  (**
+   * Specify a kind of analysis unit. Specification units provide an interface
+   * to the outer world while body units provide an implementation for the
+   * corresponding interface.
+   *)
+
+  type t =
+  | UnitSpecification
+  | UnitBody
+
+  val name : unit -> string
+end
+
+module LookupKind : sig
+  
+
+  type t =
+  | Recursive
+  | Flat
+  | Minimal
+
+  val name : unit -> string
+end
+
+module GrammarRule : sig
+  (**
+   * Gramar rule to use for parsing.
+   *)
+
+  type t =
+  | NameRule
+  | NumberRule
+  | StringRule
+  | CatStringRule
+  | NlRule
+  | MainRuleRule
+  | DecoratorRule
+  | DecoratorsRule
+  | DecoratedRule
+  | FuncDefRule
+  | ParametersRule
+  | VarargslistRule
+  | FpdefRule
+  | NameListRule
+  | StmtRule
+  | SimpleStmtRule
+  | SmallStmtRule
+  | ExprStmtRule
+  | PrintStmtRule
+  | DelStmtRule
+  | PassStmtRule
+  | FlowStmtRule
+  | BreakStmtRule
+  | ContinueStmtRule
+  | ReturnStmtRule
+  | YieldStmtRule
+  | RaiseStmtRule
+  | ImportStmtRule
+  | ImportNameRule
+  | DotRule
+  | ImportFromRule
+  | AsNameRule
+  | DottedAsNameRule
+  | ImportAsNamesRule
+  | DottedAsNamesRule
+  | DottedNameRule
+  | GlobalStmtRule
+  | ExecStmtRule
+  | AssertStmtRule
+  | CompoundStmtRule
+  | ElsePartRule
+  | IfStmtRule
+  | WhileStmtRule
+  | ForStmtRule
+  | TryStmtRule
+  | WithStmtRule
+  | WithItemRule
+  | SuiteRule
+  | TestRule
+  | OrTestRule
+  | AndTestRule
+  | NotTestRule
+  | ComparisonRule
+  | ExprRule
+  | XorExprRule
+  | AndExprRule
+  | ShiftExprRule
+  | ArithExprRule
+  | TermRule
+  | FactorRule
+  | PowerRule
+  | AtomExprRule
+  | DictAssocRule
+  | YieldExprRule
+  | AtomRule
+  | SetLitRule
+  | LambdefRule
+  | SubscriptListRule
+  | SubscriptRule
+  | ExprListRule
+  | TestListRule
+  | EmptyTestListRule
+  | ClassDefRule
+  | ArgListRule
+  | ListIterRule
+  | ListForRule
+  | ListIfRule
+  | CompIterRule
+  | CompForRule
+  | CompIfRule
+
+  val name : unit -> string
+end
+
+val default_grammar_rule : GrammarRule.t
+
+module Sloc : sig
+  (**
+   * Location in a source file. Line and column numbers are one-based.
+   *)
+
+  type t = {
+    line : int;
+    column : int;
+  }
+end
+
+module SlocRange : sig
+  (**
+   * Location of a span of text in a source file.
+   *)
+
+  type t = {
+    loc_start : Sloc.t;
+    loc_end : Sloc.t;
+  }
+
+  val pp : Format.formatter -> t -> unit
+end
+
+module Diagnostic : sig
+  (**
+   * Diagnostic for an analysis unit: cannot open the source file, parsing
+   * error, ...
+   *)
+
+  type t = {
+    sloc_range : SlocRange.t;
+    message : string;
+  }
+end
+
+module TokenData : sig
+  type t
+end
+
+module Token : sig
+  (**
+   * Reference to a token in an analysis unit.
+   *)
+
+  type t = {
+    token_data : TokenData.t;
+    token_index : int;
+    trivia_index : int;
+    kind : int;
+    text : string;
+    sloc_range : SlocRange.t;
+  }
+
+  val kind_name : t -> string
+  (**
+   * Return a human-readable name for a token kind.
+   *)
+
+  val text_range : t -> t -> string
+  (**
+   * Compute the source buffer slice corresponding to the text that spans
+   * between the ``First`` and ``Last`` tokens (both included). This yields an
+   * empty slice if ``Last`` actually appears before ``First``.
+  
+   * if ``First`` and ``Last`` don't belong to the same analysis unit.
+   *)
+
+  val is_trivia : t -> bool
+  (**
+   * Return whether this token is a trivia. If it's not, it's a regular token.
+   *)
+
+  val index : t -> int
+  (**
+   * Zero-based index for this token/trivia. Tokens and trivias get their own
+   * index space.
+   *)
+
+  val next : t -> t
+  (**
+   * Return a reference to the first token scanned in this unit.
+   *)
+
+  val previous : t -> t
+  (**
+   * Return a reference to the last token scanned in this unit.
+   *)
+
+  val compare : t -> t -> int
+
+  val equal : t -> t -> bool
+
+  val hash : t -> int
+
+  val is_equivalent : t -> t -> bool
+  (**
+   * Return whether ``L`` and ``R`` are structurally equivalent tokens. This
+   * means that their position in the stream won't be taken into account, only
+   * the kind and text of the token.
+   *)
+
+  val pp : Format.formatter -> t -> unit
+end
+
+module TokenTable : sig
+  (**
+   * Columnar representation of the stream of tokens and trivia in an analysis
+   * unit, as computed by ``python_unit_export_tokens``.
+  
+   * Tokens and trivia are stored in the same order as in the source: the Nth
+   * item in each column (i.e. each field of this structure, except ``count``)
+   * contains the corresponding data for the Nth token or trivia. Offsets are
+   * 0-based indexes in the unit's source buffer: end offsets are exclusive.
+   *)
+
+  type int32_column = (int32, Bigarray.int32_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+  type uint16_column = (int, Bigarray.int16_unsigned_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+  type uint8_column = (int, Bigarray.int8_unsigned_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+
+  type t = {
+    kinds : int32_column;
+    start_offsets : int32_column;
+    end_offsets : int32_column;
+    start_lines : int32_column;
+    end_lines : int32_column;
+    start_columns : uint16_column;
+    end_columns : uint16_column;
+    is_trivia : uint8_column;
+  }
+
+  val length : t -> int
+  (**
+   * Number of tokens and trivia in this table.
+   *)
+
+  val kind_name : t -> int -> string
+  (**
+   * Return the kind name for the token at the given index in this table.
+   *)
+
+  val is_trivia : t -> int -> bool
+  (**
+   * Return whether the token at the given index in this table is a trivia.
+   *)
+end
+
+module BigInteger : sig
+  type t = Z.t
+end
+
+module BareNode : sig
+  type t
+end
+
+module Rebindings : sig
+  type t
+end
+
+module UnitProvider : sig
+  (**
+   * Interface to fetch analysis units from a name and a unit kind.
+  
+   * The unit provider mechanism provides an abstraction which assumes that to
+   * any couple (unit name, unit kind) we can associate at most one source file.
+   * This means that several couples can be associated to the same source file,
+   * but on the other hand, only one one source file can be associated to a
+   * couple.
+  
+   * This is used to make the semantic analysis able to switch from one analysis
+   * units to another.
+   *)
+
+  type t
+
+  
+
+end
+
+module rec Entity : sig
+  type t
+
+  val info : t -> EntityInfo.t
+end
+
+and PythonNodeType : sig
+
+  
+   
+  (**
+    * PythonNodeBaseListType.t
+    * VarArgsFlagType.t
+    * KwArgsFlagType.t
+    * StmtType.t
+    * DecoratorType.t
+    * FileNodeType.t
+    * ParamsType.t
+    * SingleParamType.t
+    * RelNameType.t
+    * ImportStarType.t
+    * AsNameNodeType.t
+    * ExprType.t
+    * ElsePartType.t
+    * ExceptPartType.t
+    * CompOpKindType.t
+    * OpType.t
+    * DictAssocType.t
+    * ArgType.t
+    * ComprehensionType.t
+    * CompIfType.t
+    * NLType.t
+    *)
+  type t = [
+    | `ArgAssoc
+        of ArgAssocType.fields
+    | `ArgGen
+        of ArgGenType.fields
+    | `KwArgs
+        of KwArgsType.fields
+    | `VarArgs
+        of VarArgsType.fields
+    | `AsNameNode
+        of AsNameNodeType.fields
+    | `CompIf
+        of CompIfType.fields
+    | `CompOpKindDiamond
+        of CompOpKindDiamondType.fields
+    | `CompOpKindEq
+        of CompOpKindEqType.fields
+    | `CompOpKindGt
+        of CompOpKindGtType.fields
+    | `CompOpKindGte
+        of CompOpKindGteType.fields
+    | `CompOpKindIn
+        of CompOpKindInType.fields
+    | `CompOpKindIs
+        of CompOpKindIsType.fields
+    | `CompOpKindIsnot
+        of CompOpKindIsnotType.fields
+    | `CompOpKindLt
+        of CompOpKindLtType.fields
+    | `CompOpKindLte
+        of CompOpKindLteType.fields
+    | `CompOpKindNoteq
+        of CompOpKindNoteqType.fields
+    | `CompOpKindNotin
+        of CompOpKindNotinType.fields
+    | `CompFor
+        of CompForType.fields
+    | `CompForL
+        of CompForLType.fields
+    | `Decorator
+        of DecoratorType.fields
+    | `DictAssoc
+        of DictAssocType.fields
+    | `ElsePart
+        of ElsePartType.fields
+    | `ExceptPart
+        of ExceptPartType.fields
+    | `AndExpr
+        of AndExprType.fields
+    | `AndOp
+        of AndOpType.fields
+    | `ArithExpr
+        of ArithExprType.fields
+    | `ShiftExpr
+        of ShiftExprType.fields
+    | `Term
+        of TermType.fields
+    | `CallExpr
+        of CallExprType.fields
+    | `CompOp
+        of CompOpType.fields
+    | `ConcatStringLit
+        of ConcatStringLitType.fields
+    | `DictComp
+        of DictCompType.fields
+    | `DictLit
+        of DictLitType.fields
+    | `Dot
+        of DotType.fields
+    | `EllipsisExpr
+        of EllipsisExprType.fields
+    | `Factor
+        of FactorType.fields
+    | `IfExpr
+        of IfExprType.fields
+    | `InlineEval
+        of InlineEvalType.fields
+    | `LambdaDef
+        of LambdaDefType.fields
+    | `ListComp
+        of ListCompType.fields
+    | `ListGen
+        of ListGenType.fields
+    | `ListLit
+        of ListLitType.fields
+    | `DottedName
+        of DottedNameType.fields
+    | `Id
+        of IdType.fields
+    | `NotOp
+        of NotOpType.fields
+    | `NumberLit
+        of NumberLitType.fields
+    | `OrExpr
+        of OrExprType.fields
+    | `OrOp
+        of OrOpType.fields
+    | `Power
+        of PowerType.fields
+    | `SetComp
+        of SetCompType.fields
+    | `SetLit
+        of SetLitType.fields
+    | `SliceExpr
+        of SliceExprType.fields
+    | `ExtSliceExpr
+        of ExtSliceExprType.fields
+    | `StringLit
+        of StringLitType.fields
+    | `SubscriptExpr
+        of SubscriptExprType.fields
+    | `TupleLit
+        of TupleLitType.fields
+    | `XorExpr
+        of XorExprType.fields
+    | `YieldExpr
+        of YieldExprType.fields
+    | `FileNode
+        of FileNodeType.fields
+    | `ImportStar
+        of ImportStarType.fields
+    | `KwArgsFlagAbsent
+        of KwArgsFlagAbsentType.fields
+    | `KwArgsFlagPresent
+        of KwArgsFlagPresentType.fields
+    | `NL
+        of NLType.fields
+    | `Op
+        of OpType.fields
+    | `Params
+        of ParamsType.fields
+    | `ArgList
+        of ArgListType.fields
+    | `AsNameNodeList
+        of AsNameNodeListType.fields
+    | `DecoratorList
+        of DecoratorListType.fields
+    | `DictAssocList
+        of DictAssocListType.fields
+    | `DotList
+        of DotListType.fields
+    | `ElifBranchList
+        of ElifBranchListType.fields
+    | `ExceptPartList
+        of ExceptPartListType.fields
+    | `ExprList
+        of ExprListType.fields
+    | `IdList
+        of IdListType.fields
+    | `NLList
+        of NLListType.fields
+    | `PythonNodeList
+        of PythonNodeListType.fields
+    | `SingleParamList
+        of SingleParamListType.fields
+    | `StringLitList
+        of StringLitListType.fields
+    | `RelName
+        of RelNameType.fields
+    | `SingleParam
+        of SingleParamType.fields
+    | `AssertStmt
+        of AssertStmtType.fields
+    | `AssignStmt
+        of AssignStmtType.fields
+    | `AugAssignStmt
+        of AugAssignStmtType.fields
+    | `BreakStmt
+        of BreakStmtType.fields
+    | `ContinueStmt
+        of ContinueStmtType.fields
+    | `Decorated
+        of DecoratedType.fields
+    | `ClassDef
+        of ClassDefType.fields
+    | `FuncDef
+        of FuncDefType.fields
+    | `DelStmt
+        of DelStmtType.fields
+    | `ElifBranch
+        of ElifBranchType.fields
+    | `ExecStmt
+        of ExecStmtType.fields
+    | `ForStmt
+        of ForStmtType.fields
+    | `GlobalStmt
+        of GlobalStmtType.fields
+    | `IfStmt
+        of IfStmtType.fields
+    | `ImportFrom
+        of ImportFromType.fields
+    | `ImportName
+        of ImportNameType.fields
+    | `PassStmt
+        of PassStmtType.fields
+    | `PrintStmt
+        of PrintStmtType.fields
+    | `RaiseStmt
+        of RaiseStmtType.fields
+    | `ReturnStmt
+        of ReturnStmtType.fields
+    | `StreamPrintStmt
+        of StreamPrintStmtType.fields
+    | `TryStmt
+        of TryStmtType.fields
+    | `WhileStmt
+        of WhileStmtType.fields
+    | `WithStmt
+        of WithStmtType.fields
+    | `VarArgsFlagAbsent
+        of VarArgsFlagAbsentType.fields
+    | `VarArgsFlagPresent
+        of VarArgsFlagPresentType.fields
+  ]
+
+
+end
+and ArgType : sig
+
+  
+   
+  type t = [
+    | `ArgAssoc
+        of ArgAssocType.fields
+    | `ArgGen
+        of ArgGenType.fields
+    | `KwArgs
+        of KwArgsType.fields
+    | `VarArgs
+        of VarArgsType.fields
+  ]
+
+
+end
+and ArgAssocType : sig
+
+  
+   
+  type t = [
+    | `ArgAssoc
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ArgGenType : sig
+
+  
+   
+  type t = [
+    | `ArgGen
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and KwArgsType : sig
+
+  
+   
+  type t = [
+    | `KwArgs
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and VarArgsType : sig
+
+  
+   
+  type t = [
+    | `VarArgs
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and AsNameNodeType : sig
+
+  
+   
+  type t = [
+    | `AsNameNode
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_imported: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_as_name: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CompIfType : sig
+
+  
+   
+  type t = [
+    | `CompIf
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comp: [
+      | `CompFor
+          of CompForType.fields
+      | `CompForL
+          of CompForLType.fields
+      | `CompIf
+          of fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CompOpKindType : sig
+
+  
+   
+  type t = [
+    | `CompOpKindDiamond
+        of CompOpKindDiamondType.fields
+    | `CompOpKindEq
+        of CompOpKindEqType.fields
+    | `CompOpKindGt
+        of CompOpKindGtType.fields
+    | `CompOpKindGte
+        of CompOpKindGteType.fields
+    | `CompOpKindIn
+        of CompOpKindInType.fields
+    | `CompOpKindIs
+        of CompOpKindIsType.fields
+    | `CompOpKindIsnot
+        of CompOpKindIsnotType.fields
+    | `CompOpKindLt
+        of CompOpKindLtType.fields
+    | `CompOpKindLte
+        of CompOpKindLteType.fields
+    | `CompOpKindNoteq
+        of CompOpKindNoteqType.fields
+    | `CompOpKindNotin
+        of CompOpKindNotinType.fields
+  ]
+
+
+end
+and CompOpKindDiamondType : sig
+
+  
+   
+  type t = [
+    | `CompOpKindDiamond
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CompOpKindEqType : sig
+
+  
+   
+  type t = [
+    | `CompOpKindEq
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CompOpKindGtType : sig
+
+  
+   
+  type t = [
+    | `CompOpKindGt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CompOpKindGteType : sig
+
+  
+   
+  type t = [
+    | `CompOpKindGte
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CompOpKindInType : sig
+
+  
+   
+  type t = [
+    | `CompOpKindIn
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CompOpKindIsType : sig
+
+  
+   
+  type t = [
+    | `CompOpKindIs
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CompOpKindIsnotType : sig
+
+  
+   
+  type t = [
+    | `CompOpKindIsnot
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CompOpKindLtType : sig
+
+  
+   
+  type t = [
+    | `CompOpKindLt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CompOpKindLteType : sig
+
+  
+   
+  type t = [
+    | `CompOpKindLte
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CompOpKindNoteqType : sig
+
+  
+   
+  type t = [
+    | `CompOpKindNoteq
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CompOpKindNotinType : sig
+
+  
+   
+  type t = [
+    | `CompOpKindNotin
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ComprehensionType : sig
+
+  
+   
+  type t = [
+    | `CompFor
+        of CompForType.fields
+    | `CompForL
+        of CompForLType.fields
+  ]
+
+
+end
+and CompForType : sig
+
+  
+   
+  type t = [
+    | `CompFor
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+         
+    f_target: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comp: [
+      | `CompFor
+          of fields
+      | `CompIf
+          of CompIfType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CompForLType : sig
+
+  
+   
+  type t = [
+    | `CompForL
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+         
+    f_target: ExprListType.t
+    Lazy.t;
+         
+    f_comp: [
+      | `CompForL
+          of fields
+      | `CompIf
+          of CompIfType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DecoratorType : sig
+
+  
+   
+  type t = [
+    | `Decorator
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_dec_name: NameType.t
+    Lazy.t;
+         
+    f_arg_list: ArgListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DictAssocType : sig
+
+  
+   
+  type t = [
+    | `DictAssoc
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_key: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_value: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ElsePartType : sig
+
+  
+   
+  type t = [
+    | `ElsePart
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ExceptPartType : sig
+
+  
+   
+  type t = [
+    | `ExceptPart
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_as_name: AsNameNodeType.t
+    option
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ExprType : sig
+
+  
+   
+  (**
+    * NameType.t
+    * CallExprType.t
+    * SubscriptExprType.t
+    * IfExprType.t
+    * OrOpType.t
+    * AndOpType.t
+    * NotOpType.t
+    * CompOpType.t
+    * OrExprType.t
+    * XorExprType.t
+    * AndExprType.t
+    * BinOpType.t
+    * FactorType.t
+    * PowerType.t
+    * YieldExprType.t
+    * ListGenType.t
+    * TupleLitType.t
+    * ListCompType.t
+    * ListLitType.t
+    * SetCompType.t
+    * SetLitType.t
+    * DictCompType.t
+    * DictLitType.t
+    * InlineEvalType.t
+    * LambdaDefType.t
+    * EllipsisExprType.t
+    * SliceExprType.t
+    * NumberLitType.t
+    * StringLitType.t
+    * ConcatStringLitType.t
+    * DotType.t
+    *)
+  type t = [
+    | `AndExpr
+        of AndExprType.fields
+    | `AndOp
+        of AndOpType.fields
+    | `ArithExpr
+        of ArithExprType.fields
+    | `ShiftExpr
+        of ShiftExprType.fields
+    | `Term
+        of TermType.fields
+    | `CallExpr
+        of CallExprType.fields
+    | `CompOp
+        of CompOpType.fields
+    | `ConcatStringLit
+        of ConcatStringLitType.fields
+    | `DictComp
+        of DictCompType.fields
+    | `DictLit
+        of DictLitType.fields
+    | `Dot
+        of DotType.fields
+    | `EllipsisExpr
+        of EllipsisExprType.fields
+    | `Factor
+        of FactorType.fields
+    | `IfExpr
+        of IfExprType.fields
+    | `InlineEval
+        of InlineEvalType.fields
+    | `LambdaDef
+        of LambdaDefType.fields
+    | `ListComp
+        of ListCompType.fields
+    | `ListGen
+        of ListGenType.fields
+    | `ListLit
+        of ListLitType.fields
+    | `DottedName
+        of DottedNameType.fields
+    | `Id
+        of IdType.fields
+    | `NotOp
+        of NotOpType.fields
+    | `NumberLit
+        of NumberLitType.fields
+    | `OrExpr
+        of OrExprType.fields
+    | `OrOp
+        of OrOpType.fields
+    | `Power
+        of PowerType.fields
+    | `SetComp
+        of SetCompType.fields
+    | `SetLit
+        of SetLitType.fields
+    | `SliceExpr
+        of SliceExprType.fields
+    | `ExtSliceExpr
+        of ExtSliceExprType.fields
+    | `StringLit
+        of StringLitType.fields
+    | `SubscriptExpr
+        of SubscriptExprType.fields
+    | `TupleLit
+        of TupleLitType.fields
+    | `XorExpr
+        of XorExprType.fields
+    | `YieldExpr
+        of YieldExprType.fields
+  ]
+
+
+end
+and AndExprType : sig
+
+  
+   
+  type t = [
+    | `AndExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and AndOpType : sig
+
+  
+   
+  type t = [
+    | `AndOp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and BinOpType : sig
+
+  
+   
+  type t = [
+    | `ArithExpr
+        of ArithExprType.fields
+    | `ShiftExpr
+        of ShiftExprType.fields
+    | `Term
+        of TermType.fields
+  ]
+
+
+end
+and ArithExprType : sig
+
+  
+   
+  type t = [
+    | `ArithExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `ArithExpr
+          of fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ShiftExprType : sig
+
+  
+   
+  type t = [
+    | `ShiftExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and TermType : sig
+
+  
+   
+  type t = [
+    | `Term
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CallExprType : sig
+
+  
+   
+  type t = [
+    | `CallExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_prefix: [
+      | `CallExpr
+          of fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: ArgListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and CompOpType : sig
+
+  
+   
+  type t = [
+    | `CompOp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: CompOpKindType.t
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ConcatStringLitType : sig
+
+  
+   
+  type t = [
+    | `ConcatStringLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_first_str: StringLitType.t
+    Lazy.t;
+         
+    f_subsequent_str: StringLitListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DictCompType : sig
+
+  
+   
+  type t = [
+    | `DictComp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_assoc: DictAssocType.t
+    Lazy.t;
+         
+    f_comprehension: CompForType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DictLitType : sig
+
+  
+   
+  type t = [
+    | `DictLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_assocs: DictAssocListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DotType : sig
+
+  
+   
+  type t = [
+    | `Dot
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and EllipsisExprType : sig
+
+  
+   
+  type t = [
+    | `EllipsisExpr
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and FactorType : sig
+
+  
+   
+  type t = [
+    | `Factor
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and IfExprType : sig
+
+  
+   
+  type t = [
+    | `IfExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_cond: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_else_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and InlineEvalType : sig
+
+  
+   
+  type t = [
+    | `InlineEval
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and LambdaDefType : sig
+
+  
+   
+  type t = [
+    | `LambdaDef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_args: ParamsType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ListCompType : sig
+
+  
+   
+  type t = [
+    | `ListComp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForLType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ListGenType : sig
+
+  
+   
+  type t = [
+    | `ListGen
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForLType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ListLitType : sig
+
+  
+   
+  type t = [
+    | `ListLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and NameType : sig
+
+  
+   
+  type t = [
+    | `DottedName
+        of DottedNameType.fields
+    | `Id
+        of IdType.fields
+  ]
+
+
+end
+and DottedNameType : sig
+
+  
+   
+  type t = [
+    | `DottedName
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_prefix: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: IdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and IdType : sig
+
+  
+   
+  type t = [
+    | `Id
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and NotOpType : sig
+
+  
+   
+  type t = [
+    | `NotOp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and NumberLitType : sig
+
+  
+   
+  type t = [
+    | `NumberLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and OrExprType : sig
+
+  
+   
+  type t = [
+    | `OrExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and OrOpType : sig
+
+  
+   
+  type t = [
+    | `OrOp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and PowerType : sig
+
+  
+   
+  type t = [
+    | `Power
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and SetCompType : sig
+
+  
+   
+  type t = [
+    | `SetComp
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and SetLitType : sig
+
+  
+   
+  type t = [
+    | `SetLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and SliceExprType : sig
+
+  
+   
+  type t = [
+    | `SliceExpr
+        of fields
+    | `ExtSliceExpr
+        of ExtSliceExprType.fields
+  ]
+  and fields = 
+  {
+         
+    f_first: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_last: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ExtSliceExprType : sig
+
+  
+   
+  type t = [
+    | `ExtSliceExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_first: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_last: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_stride: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and StringLitType : sig
+
+  
+   
+  type t = [
+    | `StringLit
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and SubscriptExprType : sig
+
+  
+   
+  type t = [
+    | `SubscriptExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_prefix: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and TupleLitType : sig
+
+  
+   
+  type t = [
+    | `TupleLit
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and XorExprType : sig
+
+  
+   
+  type t = [
+    | `XorExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and YieldExprType : sig
+
+  
+   
+  type t = [
+    | `YieldExpr
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and FileNodeType : sig
+
+  
+   
+  type t = [
+    | `FileNode
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_statements: PythonNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ImportStarType : sig
+
+  
+   
+  type t = [
+    | `ImportStar
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and KwArgsFlagType : sig
+
+  
+   
+  type t = [
+    | `KwArgsFlagAbsent
+        of KwArgsFlagAbsentType.fields
+    | `KwArgsFlagPresent
+        of KwArgsFlagPresentType.fields
+  ]
+
+
+end
+and KwArgsFlagAbsentType : sig
+
+  
+   
+  type t = [
+    | `KwArgsFlagAbsent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and KwArgsFlagPresentType : sig
+
+  
+   
+  type t = [
+    | `KwArgsFlagPresent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and NLType : sig
+
+  
+   
+  type t = [
+    | `NL
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and OpType : sig
+
+  
+   
+  type t = [
+    | `Op
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ParamsType : sig
+
+  
+   
+  type t = [
+    | `Params
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_single_params: SingleParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and PythonNodeBaseListType : sig
+
+  
+   
+  type t = [
+    | `ArgList
+        of ArgListType.fields
+    | `AsNameNodeList
+        of AsNameNodeListType.fields
+    | `DecoratorList
+        of DecoratorListType.fields
+    | `DictAssocList
+        of DictAssocListType.fields
+    | `DotList
+        of DotListType.fields
+    | `ElifBranchList
+        of ElifBranchListType.fields
+    | `ExceptPartList
+        of ExceptPartListType.fields
+    | `ExprList
+        of ExprListType.fields
+    | `IdList
+        of IdListType.fields
+    | `NLList
+        of NLListType.fields
+    | `PythonNodeList
+        of PythonNodeListType.fields
+    | `SingleParamList
+        of SingleParamListType.fields
+    | `StringLitList
+        of StringLitListType.fields
+  ]
+
+
+end
+and ArgListType : sig
+
+  
+   
+  type t = [
+    | `ArgList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ArgType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and AsNameNodeListType : sig
+
+  
+   
+  type t = [
+    | `AsNameNodeList
+        of fields
+  ]
+  and fields = 
+  {
+    list : AsNameNodeType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DecoratorListType : sig
+
+  
+   
+  type t = [
+    | `DecoratorList
+        of fields
+  ]
+  and fields = 
+  {
+    list : DecoratorType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DictAssocListType : sig
+
+  
+   
+  type t = [
+    | `DictAssocList
+        of fields
+  ]
+  and fields = 
+  {
+    list : DictAssocType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DotListType : sig
+
+  
+   
+  type t = [
+    | `DotList
+        of fields
+  ]
+  and fields = 
+  {
+    list : DotType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ElifBranchListType : sig
+
+  
+   
+  type t = [
+    | `ElifBranchList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ElifBranchType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ExceptPartListType : sig
+
+  
+   
+  type t = [
+    | `ExceptPartList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ExceptPartType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ExprListType : sig
+
+  
+   
+  type t = [
+    | `ExprList
+        of fields
+  ]
+  and fields = 
+  {
+    list : ExprType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and IdListType : sig
+
+  
+   
+  type t = [
+    | `IdList
+        of fields
+  ]
+  and fields = 
+  {
+    list : IdType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and NLListType : sig
+
+  
+   
+  type t = [
+    | `NLList
+        of fields
+  ]
+  and fields = 
+  {
+    list : NLType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and PythonNodeListType : sig
+
+  
+   
+  type t = [
+    | `PythonNodeList
+        of fields
+  ]
+  and fields = 
+  {
+    list : PythonNodeType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and SingleParamListType : sig
+
+  
+   
+  type t = [
+    | `SingleParamList
+        of fields
+  ]
+  and fields = 
+  {
+    list : SingleParamType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and StringLitListType : sig
+
+  
+   
+  type t = [
+    | `StringLitList
+        of fields
+  ]
+  and fields = 
+  {
+    list : StringLitType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and RelNameType : sig
+
+  
+   
+  type t = [
+    | `RelName
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_dots: DotListType.t
+    Lazy.t;
+         
+    f_name: NameType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and SingleParamType : sig
+
+  
+   
+  type t = [
+    | `SingleParam
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_is_varargs: VarArgsFlagType.t
+    Lazy.t;
+         
+    f_is_kwargs: KwArgsFlagType.t
+    Lazy.t;
+         
+    f_name: [
+      | `Id
+          of IdType.fields
+      | `IdList
+          of IdListType.fields
+    ]
+    Lazy.t;
+         
+    f_default_value: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and StmtType : sig
+
+  
+   
+  (**
+    * DecoratedType.t
+    * DefStmtType.t
+    * AugAssignStmtType.t
+    * AssignStmtType.t
+    * PrintStmtType.t
+    * StreamPrintStmtType.t
+    * DelStmtType.t
+    * PassStmtType.t
+    * BreakStmtType.t
+    * ContinueStmtType.t
+    * ReturnStmtType.t
+    * RaiseStmtType.t
+    * ImportNameType.t
+    * ImportFromType.t
+    * GlobalStmtType.t
+    * ExecStmtType.t
+    * AssertStmtType.t
+    * IfStmtType.t
+    * ElifBranchType.t
+    * WhileStmtType.t
+    * ForStmtType.t
+    * TryStmtType.t
+    * WithStmtType.t
+    *)
+  type t = [
+    | `AssertStmt
+        of AssertStmtType.fields
+    | `AssignStmt
+        of AssignStmtType.fields
+    | `AugAssignStmt
+        of AugAssignStmtType.fields
+    | `BreakStmt
+        of BreakStmtType.fields
+    | `ContinueStmt
+        of ContinueStmtType.fields
+    | `Decorated
+        of DecoratedType.fields
+    | `ClassDef
+        of ClassDefType.fields
+    | `FuncDef
+        of FuncDefType.fields
+    | `DelStmt
+        of DelStmtType.fields
+    | `ElifBranch
+        of ElifBranchType.fields
+    | `ExecStmt
+        of ExecStmtType.fields
+    | `ForStmt
+        of ForStmtType.fields
+    | `GlobalStmt
+        of GlobalStmtType.fields
+    | `IfStmt
+        of IfStmtType.fields
+    | `ImportFrom
+        of ImportFromType.fields
+    | `ImportName
+        of ImportNameType.fields
+    | `PassStmt
+        of PassStmtType.fields
+    | `PrintStmt
+        of PrintStmtType.fields
+    | `RaiseStmt
+        of RaiseStmtType.fields
+    | `ReturnStmt
+        of ReturnStmtType.fields
+    | `StreamPrintStmt
+        of StreamPrintStmtType.fields
+    | `TryStmt
+        of TryStmtType.fields
+    | `WhileStmt
+        of WhileStmtType.fields
+    | `WithStmt
+        of WithStmtType.fields
+  ]
+
+
+end
+and AssertStmtType : sig
+
+  
+   
+  type t = [
+    | `AssertStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_test_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_msg: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and AssignStmtType : sig
+
+  
+   
+  type t = [
+    | `AssignStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_l_value: ExprListType.t
+    Lazy.t;
+         
+    f_r_values: PythonNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and AugAssignStmtType : sig
+
+  
+   
+  type t = [
+    | `AugAssignStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_l_value: ExprListType.t
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_r_value: [
+      | `ExprList
+          of ExprListType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and BreakStmtType : sig
+
+  
+   
+  type t = [
+    | `BreakStmt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ContinueStmtType : sig
+
+  
+   
+  type t = [
+    | `ContinueStmt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DecoratedType : sig
+
+  
+   
+  type t = [
+    | `Decorated
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_decorators: DecoratorListType.t
+    Lazy.t;
+         
+    f_defn: DefStmtType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DefStmtType : sig
+
+  
+   
+  type t = [
+    | `ClassDef
+        of ClassDefType.fields
+    | `FuncDef
+        of FuncDefType.fields
+  ]
+
+
+end
+and ClassDefType : sig
+
+  
+   
+  type t = [
+    | `ClassDef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: IdType.t
+    Lazy.t;
+         
+    f_bases: ExprListType.t
+    option
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and FuncDefType : sig
+
+  
+   
+  type t = [
+    | `FuncDef
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_name: IdType.t
+    Lazy.t;
+         
+    f_parameters: ParamsType.t
+    option
+    Lazy.t;
+         
+    f_body: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and DelStmtType : sig
+
+  
+   
+  type t = [
+    | `DelStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ElifBranchType : sig
+
+  
+   
+  type t = [
+    | `ElifBranch
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ExecStmtType : sig
+
+  
+   
+  type t = [
+    | `ExecStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_in_list: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ForStmtType : sig
+
+  
+   
+  type t = [
+    | `ForStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_bindings: ExprListType.t
+    Lazy.t;
+         
+    f_expr: ExprListType.t
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and GlobalStmtType : sig
+
+  
+   
+  type t = [
+    | `GlobalStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_names: IdListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and IfStmtType : sig
+
+  
+   
+  type t = [
+    | `IfStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_elif_branchs: ElifBranchListType.t
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ImportFromType : sig
+
+  
+   
+  type t = [
+    | `ImportFrom
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_rel_name: [
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `RelName
+          of RelNameType.fields
+    ]
+    Lazy.t;
+         
+    f_imported: [
+      | `ImportStar
+          of ImportStarType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ImportNameType : sig
+
+  
+   
+  type t = [
+    | `ImportName
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_imported_names: PythonNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and PassStmtType : sig
+
+  
+   
+  type t = [
+    | `PassStmt
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and PrintStmtType : sig
+
+  
+   
+  type t = [
+    | `PrintStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and RaiseStmtType : sig
+
+  
+   
+  type t = [
+    | `RaiseStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and ReturnStmtType : sig
+
+  
+   
+  type t = [
+    | `ReturnStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and StreamPrintStmtType : sig
+
+  
+   
+  type t = [
+    | `StreamPrintStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_stream_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and TryStmtType : sig
+
+  
+   
+  type t = [
+    | `TryStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_except_parts: ExceptPartListType.t
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+         
+    f_finally_part: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and WhileStmtType : sig
+
+  
+   
+  type t = [
+    | `WhileStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_cond_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and WithStmtType : sig
+
+  
+   
+  type t = [
+    | `WithStmt
+        of fields
+  ]
+  and fields = 
+  {
+         
+    f_bindings: AsNameNodeListType.t
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and VarArgsFlagType : sig
+
+  
+   
+  type t = [
+    | `VarArgsFlagAbsent
+        of VarArgsFlagAbsentType.fields
+    | `VarArgsFlagPresent
+        of VarArgsFlagPresentType.fields
+  ]
+
+
+end
+and VarArgsFlagAbsentType : sig
+
+  
+   
+  type t = [
+    | `VarArgsFlagAbsent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+and VarArgsFlagPresentType : sig
+
+  
+   
+  type t = [
+    | `VarArgsFlagPresent
+        of fields
+  ]
+  and fields = 
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+
+end
+
+and AnalysisUnit : sig
+  (**
+   * This type represents the analysis of a single file.
+  
+   * This type has strong-reference semantics and is ref-counted. Furthermore, a
+   * reference to a unit contains an implicit reference to the context that owns
+   * it. This means that keeping a reference to a unit will keep the context and
+   * all the unit it contains allocated.
+   *)
+
+  type t
+
+  val root : t -> PythonNodeType.t option
+  (**
+   * Return the root node for this unit, or ``None`` if there is none.
+   *)
+
+  val diagnostics : t -> Diagnostic.t list
+  (**
+   * Diagnostics for this unit.
+   *)
+
+  val filename : t -> string
+  (**
+   * Return the filename this unit is associated to.
+   *)
+
+  val reparse : ?charset:string -> ?buffer:string -> t -> unit
+  (**
+   * Reparse an analysis unit from a buffer, if provided, or from the original
+   * file otherwise. If ``Charset`` is empty or ``None``, use the last charset
+   * successfuly used for this unit, otherwise use it to decode the content of
+   * the source file.
+  
+   * If any failure occurs, such as decoding, lexing or parsing failure,
+   * diagnostic are emitted to explain what happened.
+   *)
+
+  val first_token : t -> Token.t
+  (**
+   * Return a reference to the first token scanned in this unit.
+   *)
+
+  val last_token : t -> Token.t
+  (**
+   * Return a reference to the last token scanned in this unit.
+   *)
+
+  val token_count : t -> int
+  (**
+   * Return the number of tokens in this unit.
+   *)
+
+  val trivia_count : t -> int
+  (**
+   * Return the number of trivias in this unit. This is 0 for units that were
+   * parsed with trivia analysis disabled.
+   *)
+
+  val token_table : t -> TokenTable.t
+  (**
+   * Return a columnar representation of all the tokens and trivia in this
+   * unit, computed in a single native call.
+   *)
+
+  
+  val fold_tokens : ('a -> Token.t -> 'a) -> 'a -> t -> 'a
+  (**
+   * Fold all the token this node contains by calling f on each token.
+   *)
+
+  val iter_tokens : (Token.t -> unit) -> t-> unit
+  (**
+   * Iterate over all token this node contains by calling f on each token.
+   *)
+
+  val map_tokens : (Token.t -> 'a) -> t -> 'a list
+  (**
+   * Map each token calling the given function
+   *)
+
+  val tokens : t -> Token.t list
+  (**
+   * Return a list of tokens for the given node
+   *)
+
+end
+
+and AnalysisContext : sig
+  (**
+   * This type represents a context for all source analysis. This is the first
+   * type you need to create to use Libpythonlang. It will contain the results
+   * of all analysis, and is the main holder for all the data.
+  
+   * You can create several analysis contexts if you need to, which enables you,
+   * for example to:
+  
+   * * analyze several different projects at the same time;
+  
+   * * analyze different parts of the same projects in parallel.
+  
+   * In the current design, contexts always keep all of their analysis units
+   * allocated. If you need to get this memory released, the only option at your
+   * disposal is to destroy your analysis context instance.
+   *)
+
+  type t
+
+  val create :
+    ?charset:string
+    -> ?with_trivia:bool
+    -> ?tab_stop:int
+    -> ?unit_provider:UnitProvider.t
+    -> unit
+    -> t
+  (**
+   * Create a new analysis context.
+  
+   * ``Charset`` will be used as a default charset to decode input sources in
+   * analysis units. Please see ``GNATCOLL.Iconv`` for several supported
+   * charsets. Be careful: passing an unsupported charset is not guaranteed to
+   * raise an error here. If no charset is provided, ``"utf-8"`` is the default.
+  
+   * .. todo:: Passing an unsupported charset here is not guaranteed to raise an
+   *    error right here, but this would be really helpful for users.
+  
+   * When ``With_Trivia`` is true, the parsed analysis units will contain
+   * trivias.
+  
+   * If provided, ``Unit_Provider`` will be used to query the file name that
+   * corresponds to a unit reference during semantic analysis. If it is
+   * ``None``, the default one is used instead.
+  
+   * ``Tab_Stop`` is a positive number to describe the effect of tabulation
+   * characters on the column number in source files.
+   *)
+
+  val get_from_file :
+    ?charset:string
+    -> ?reparse:bool
+    -> ?grammar_rule:GrammarRule.t
+    -> t
+    -> string
+    -> AnalysisUnit.t
+  (**
+   * Create a new analysis unit for ``Filename`` or return the existing one if
+   * any. If ``Reparse`` is true and the analysis unit already exists, reparse
+   * it from ``Filename``.
+  
+   * ``Rule`` controls which grammar rule is used to parse the unit.
+  
+   * Use ``Charset`` in order to decode the source. If ``Charset`` is empty then
+   * use the context's default charset.
+  
+   * If any failure occurs, such as file opening, decoding, lexing or parsing
+   * failure, return an analysis unit anyway: errors are described as
+   * diagnostics of the returned analysis unit.
+   *)
+
+  val get_from_buffer :
+    ?charset:string
+    -> ?grammar_rule:GrammarRule.t
+    -> t
+    -> string
+    -> string
+    -> AnalysisUnit.t
+  (**
+   * Create a new analysis unit for ``Filename`` or return the existing one if
+   * any. Whether the analysis unit already exists or not, (re)parse it from the
+   * source code in ``Buffer``.
+  
+   * ``Rule`` controls which grammar rule is used to parse the unit.
+  
+   * Use ``Charset`` in order to decode the source. If ``Charset`` is empty then
+   * use the context's default charset.
+  
+   * If any failure occurs, such as file opening, decoding, lexing or parsing
+   * failure, return an analysis unit anyway: errors are described as
+   * diagnostics of the returned analysis unit.
+   *)
+end
+
+   
+
+   
+and EntityInfo : sig
+  
+
+  
+  type t = {
+      rebindings :
+         Rebindings.t;
+      from_rebound :
+         bool;
+  }
+
+end
+
+
+type _ node =
+  | PythonNode :
+      PythonNodeType.t node
+  | Arg :
+      ArgType.t node
+  | ArgAssoc :
+      ArgAssocType.t node
+  | ArgGen :
+      ArgGenType.t node
+  | KwArgs :
+      KwArgsType.t node
+  | VarArgs :
+      VarArgsType.t node
+  | AsNameNode :
+      AsNameNodeType.t node
+  | CompIf :
+      CompIfType.t node
+  | CompOpKind :
+      CompOpKindType.t node
+  | CompOpKindDiamond :
+      CompOpKindDiamondType.t node
+  | CompOpKindEq :
+      CompOpKindEqType.t node
+  | CompOpKindGt :
+      CompOpKindGtType.t node
+  | CompOpKindGte :
+      CompOpKindGteType.t node
+  | CompOpKindIn :
+      CompOpKindInType.t node
+  | CompOpKindIs :
+      CompOpKindIsType.t node
+  | CompOpKindIsnot :
+      CompOpKindIsnotType.t node
+  | CompOpKindLt :
+      CompOpKindLtType.t node
+  | CompOpKindLte :
+      CompOpKindLteType.t node
+  | CompOpKindNoteq :
+      CompOpKindNoteqType.t node
+  | CompOpKindNotin :
+      CompOpKindNotinType.t node
+  | Comprehension :
+      ComprehensionType.t node
+  | CompFor :
+      CompForType.t node
+  | CompForL :
+      CompForLType.t node
+  | Decorator :
+      DecoratorType.t node
+  | DictAssoc :
+      DictAssocType.t node
+  | ElsePart :
+      ElsePartType.t node
+  | ExceptPart :
+      ExceptPartType.t node
+  | Expr :
+      ExprType.t node
+  | AndExpr :
+      AndExprType.t node
+  | AndOp :
+      AndOpType.t node
+  | BinOp :
+      BinOpType.t node
+  | ArithExpr :
+      ArithExprType.t node
+  | ShiftExpr :
+      ShiftExprType.t node
+  | Term :
+      TermType.t node
+  | CallExpr :
+      CallExprType.t node
+  | CompOp :
+      CompOpType.t node
+  | ConcatStringLit :
+      ConcatStringLitType.t node
+  | DictComp :
+      DictCompType.t node
+  | DictLit :
+      DictLitType.t node
+  | Dot :
+      DotType.t node
+  | EllipsisExpr :
+      EllipsisExprType.t node
+  | Factor :
+      FactorType.t node
+  | IfExpr :
+      IfExprType.t node
+  | InlineEval :
+      InlineEvalType.t node
+  | LambdaDef :
+      LambdaDefType.t node
+  | ListComp :
+      ListCompType.t node
+  | ListGen :
+      ListGenType.t node
+  | ListLit :
+      ListLitType.t node
+  | Name :
+      NameType.t node
+  | DottedName :
+      DottedNameType.t node
+  | Id :
+      IdType.t node
+  | NotOp :
+      NotOpType.t node
+  | NumberLit :
+      NumberLitType.t node
+  | OrExpr :
+      OrExprType.t node
+  | OrOp :
+      OrOpType.t node
+  | Power :
+      PowerType.t node
+  | SetComp :
+      SetCompType.t node
+  | SetLit :
+      SetLitType.t node
+  | SliceExpr :
+      SliceExprType.t node
+  | ExtSliceExpr :
+      ExtSliceExprType.t node
+  | StringLit :
+      StringLitType.t node
+  | SubscriptExpr :
+      SubscriptExprType.t node
+  | TupleLit :
+      TupleLitType.t node
+  | XorExpr :
+      XorExprType.t node
+  | YieldExpr :
+      YieldExprType.t node
+  | FileNode :
+      FileNodeType.t node
+  | ImportStar :
+      ImportStarType.t node
+  | KwArgsFlag :
+      KwArgsFlagType.t node
+  | KwArgsFlagAbsent :
+      KwArgsFlagAbsentType.t node
+  | KwArgsFlagPresent :
+      KwArgsFlagPresentType.t node
+  | NL :
+      NLType.t node
+  | Op :
+      OpType.t node
+  | Params :
+      ParamsType.t node
+  | PythonNodeBaseList :
+      PythonNodeBaseListType.t node
+  | ArgList :
+      ArgListType.t node
+  | AsNameNodeList :
+      AsNameNodeListType.t node
+  | DecoratorList :
+      DecoratorListType.t node
+  | DictAssocList :
+      DictAssocListType.t node
+  | DotList :
+      DotListType.t node
+  | ElifBranchList :
+      ElifBranchListType.t node
+  | ExceptPartList :
+      ExceptPartListType.t node
+  | ExprList :
+      ExprListType.t node
+  | IdList :
+      IdListType.t node
+  | NLList :
+      NLListType.t node
+  | PythonNodeList :
+      PythonNodeListType.t node
+  | SingleParamList :
+      SingleParamListType.t node
+  | StringLitList :
+      StringLitListType.t node
+  | RelName :
+      RelNameType.t node
+  | SingleParam :
+      SingleParamType.t node
+  | Stmt :
+      StmtType.t node
+  | AssertStmt :
+      AssertStmtType.t node
+  | AssignStmt :
+      AssignStmtType.t node
+  | AugAssignStmt :
+      AugAssignStmtType.t node
+  | BreakStmt :
+      BreakStmtType.t node
+  | ContinueStmt :
+      ContinueStmtType.t node
+  | Decorated :
+      DecoratedType.t node
+  | DefStmt :
+      DefStmtType.t node
+  | ClassDef :
+      ClassDefType.t node
+  | FuncDef :
+      FuncDefType.t node
+  | DelStmt :
+      DelStmtType.t node
+  | ElifBranch :
+      ElifBranchType.t node
+  | ExecStmt :
+      ExecStmtType.t node
+  | ForStmt :
+      ForStmtType.t node
+  | GlobalStmt :
+      GlobalStmtType.t node
+  | IfStmt :
+      IfStmtType.t node
+  | ImportFrom :
+      ImportFromType.t node
+  | ImportName :
+      ImportNameType.t node
+  | PassStmt :
+      PassStmtType.t node
+  | PrintStmt :
+      PrintStmtType.t node
+  | RaiseStmt :
+      RaiseStmtType.t node
+  | ReturnStmt :
+      ReturnStmtType.t node
+  | StreamPrintStmt :
+      StreamPrintStmtType.t node
+  | TryStmt :
+      TryStmtType.t node
+  | WhileStmt :
+      WhileStmtType.t node
+  | WithStmt :
+      WithStmtType.t node
+  | VarArgsFlag :
+      VarArgsFlagType.t node
+  | VarArgsFlagAbsent :
+      VarArgsFlagAbsentType.t node
+  | VarArgsFlagPresent :
+      VarArgsFlagPresentType.t node
+
+module VarArgsFlagPresent : sig
+  
+
+  type t =
+    [
+      | `VarArgsFlagPresent of
+          VarArgsFlagPresentType.fields
+    ]
+
+  type fields = VarArgsFlagPresentType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module VarArgsFlagAbsent : sig
+  
+
+  type t =
+    [
+      | `VarArgsFlagAbsent of
+          VarArgsFlagAbsentType.fields
+    ]
+
+  type fields = VarArgsFlagAbsentType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module VarArgsFlag : sig
+  
+
+  type t =
+    [
+      | VarArgsFlagPresent.t
+      | VarArgsFlagAbsent.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+      
+  val p_as_bool :
+    [< VarArgsFlagType.t ]
+    -> bool
+  (**
+   * Return whether this is an instance of VarArgsFlagPresent
+   *)
+
+
+
+end
+
+module WithStmt : sig
+  
+
+  type t =
+    [
+      | `WithStmt of
+          WithStmtType.fields
+    ]
+
+  type fields = WithStmtType.fields =
+    
+  {
+         
+    f_bindings: AsNameNodeListType.t
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_bindings :
+    [< WithStmtType.t]
+    -> AsNameNodeListType.t
+
+      
+  val f_statements :
+    [< WithStmtType.t]
+    -> [AssertStmtType.t | AssignStmtType.t | AugAssignStmtType.t | BreakStmtType.t | ContinueStmtType.t | DelStmtType.t | ExecStmtType.t | ExprListType.t | GlobalStmtType.t | ImportFromType.t | ImportNameType.t | PassStmtType.t | PrintStmtType.t | PythonNodeListType.t | RaiseStmtType.t | ReturnStmtType.t | StreamPrintStmtType.t | YieldExprType.t]
+
+
+end
+
+module WhileStmt : sig
+  
+
+  type t =
+    [
+      | `WhileStmt of
+          WhileStmtType.fields
+    ]
+
+  type fields = WhileStmtType.fields =
+    
+  {
+         
+    f_cond_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_cond_test :
+    [< WhileStmtType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_statements :
+    [< WhileStmtType.t]
+    -> [AssertStmtType.t | AssignStmtType.t | AugAssignStmtType.t | BreakStmtType.t | ContinueStmtType.t | DelStmtType.t | ExecStmtType.t | ExprListType.t | GlobalStmtType.t | ImportFromType.t | ImportNameType.t | PassStmtType.t | PrintStmtType.t | PythonNodeListType.t | RaiseStmtType.t | ReturnStmtType.t | StreamPrintStmtType.t | YieldExprType.t]
+
+      
+  val f_else_part :
+    [< WhileStmtType.t]
+    -> ElsePartType.t option
+
+
+end
+
+module TryStmt : sig
+  
+
+  type t =
+    [
+      | `TryStmt of
+          TryStmtType.fields
+    ]
+
+  type fields = TryStmtType.fields =
+    
+  {
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_except_parts: ExceptPartListType.t
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+         
+    f_finally_part: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_statements :
+    [< TryStmtType.t]
+    -> [AssertStmtType.t | AssignStmtType.t | AugAssignStmtType.t | BreakStmtType.t | ContinueStmtType.t | DelStmtType.t | ExecStmtType.t | ExprListType.t | GlobalStmtType.t | ImportFromType.t | ImportNameType.t | PassStmtType.t | PrintStmtType.t | PythonNodeListType.t | RaiseStmtType.t | ReturnStmtType.t | StreamPrintStmtType.t | YieldExprType.t]
+
+      
+  val f_except_parts :
+    [< TryStmtType.t]
+    -> ExceptPartListType.t
+
+      
+  val f_else_part :
+    [< TryStmtType.t]
+    -> ElsePartType.t option
+
+      
+  val f_finally_part :
+    [< TryStmtType.t]
+    -> [AssertStmtType.t | AssignStmtType.t | AugAssignStmtType.t | BreakStmtType.t | ContinueStmtType.t | DelStmtType.t | ExecStmtType.t | ExprListType.t | GlobalStmtType.t | ImportFromType.t | ImportNameType.t | PassStmtType.t | PrintStmtType.t | PythonNodeListType.t | RaiseStmtType.t | ReturnStmtType.t | StreamPrintStmtType.t | YieldExprType.t] option
+
+
+end
+
+module StreamPrintStmt : sig
+  
+
+  type t =
+    [
+      | `StreamPrintStmt of
+          StreamPrintStmtType.fields
+    ]
+
+  type fields = StreamPrintStmtType.fields =
+    
+  {
+         
+    f_stream_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_stream_expr :
+    [< StreamPrintStmtType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_exprs :
+    [< StreamPrintStmtType.t]
+    -> ExprListType.t
+
+
+end
+
+module ReturnStmt : sig
+  
+
+  type t =
+    [
+      | `ReturnStmt of
+          ReturnStmtType.fields
+    ]
+
+  type fields = ReturnStmtType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_exprs :
+    [< ReturnStmtType.t]
+    -> ExprListType.t option
+
+
+end
+
+module RaiseStmt : sig
+  
+
+  type t =
+    [
+      | `RaiseStmt of
+          RaiseStmtType.fields
+    ]
+
+  type fields = RaiseStmtType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_exprs :
+    [< RaiseStmtType.t]
+    -> ExprListType.t option
+
+
+end
+
+module PrintStmt : sig
+  
+
+  type t =
+    [
+      | `PrintStmt of
+          PrintStmtType.fields
+    ]
+
+  type fields = PrintStmtType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_exprs :
+    [< PrintStmtType.t]
+    -> ExprListType.t
+
+
+end
+
+module PassStmt : sig
+  
+
+  type t =
+    [
+      | `PassStmt of
+          PassStmtType.fields
+    ]
+
+  type fields = PassStmtType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module ImportName : sig
+  
+
+  type t =
+    [
+      | `ImportName of
+          ImportNameType.fields
+    ]
+
+  type fields = ImportNameType.fields =
+    
+  {
+         
+    f_imported_names: PythonNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_imported_names :
+    [< ImportNameType.t]
+    -> PythonNodeListType.t
+
+
+end
+
+module ImportFrom : sig
+  
+
+  type t =
+    [
+      | `ImportFrom of
+          ImportFromType.fields
+    ]
+
+  type fields = ImportFromType.fields =
+    
+  {
+         
+    f_rel_name: [
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `RelName
+          of RelNameType.fields
+    ]
+    Lazy.t;
+         
+    f_imported: [
+      | `ImportStar
+          of ImportStarType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_rel_name :
+    [< ImportFromType.t]
+    -> [NameType.t | RelNameType.t]
+
+      
+  val f_imported :
+    [< ImportFromType.t]
+    -> [ImportStarType.t | PythonNodeListType.t]
+
+
+end
+
+module IfStmt : sig
+  
+
+  type t =
+    [
+      | `IfStmt of
+          IfStmtType.fields
+    ]
+
+  type fields = IfStmtType.fields =
+    
+  {
+         
+    f_cond_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_elif_branchs: ElifBranchListType.t
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_cond_test :
+    [< IfStmtType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_statements :
+    [< IfStmtType.t]
+    -> [AssertStmtType.t | AssignStmtType.t | AugAssignStmtType.t | BreakStmtType.t | ContinueStmtType.t | DelStmtType.t | ExecStmtType.t | ExprListType.t | GlobalStmtType.t | ImportFromType.t | ImportNameType.t | PassStmtType.t | PrintStmtType.t | PythonNodeListType.t | RaiseStmtType.t | ReturnStmtType.t | StreamPrintStmtType.t | YieldExprType.t]
+
+      
+  val f_elif_branchs :
+    [< IfStmtType.t]
+    -> ElifBranchListType.t
+
+      
+  val f_else_part :
+    [< IfStmtType.t]
+    -> ElsePartType.t option
+
+
+end
+
+module GlobalStmt : sig
+  
+
+  type t =
+    [
+      | `GlobalStmt of
+          GlobalStmtType.fields
+    ]
+
+  type fields = GlobalStmtType.fields =
+    
+  {
+         
+    f_names: IdListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_names :
+    [< GlobalStmtType.t]
+    -> IdListType.t
+
+
+end
+
+module ForStmt : sig
+  
+
+  type t =
+    [
+      | `ForStmt of
+          ForStmtType.fields
+    ]
+
+  type fields = ForStmtType.fields =
+    
+  {
+         
+    f_bindings: ExprListType.t
+    Lazy.t;
+         
+    f_expr: ExprListType.t
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_else_part: ElsePartType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_bindings :
+    [< ForStmtType.t]
+    -> ExprListType.t
+
+      
+  val f_expr :
+    [< ForStmtType.t]
+    -> ExprListType.t
+
+      
+  val f_statements :
+    [< ForStmtType.t]
+    -> [AssertStmtType.t | AssignStmtType.t | AugAssignStmtType.t | BreakStmtType.t | ContinueStmtType.t | DelStmtType.t | ExecStmtType.t | ExprListType.t | GlobalStmtType.t | ImportFromType.t | ImportNameType.t | PassStmtType.t | PrintStmtType.t | PythonNodeListType.t | RaiseStmtType.t | ReturnStmtType.t | StreamPrintStmtType.t | YieldExprType.t]
+
+      
+  val f_else_part :
+    [< ForStmtType.t]
+    -> ElsePartType.t option
+
+
+end
+
+module ExecStmt : sig
+  
+
+  type t =
+    [
+      | `ExecStmt of
+          ExecStmtType.fields
+    ]
+
+  type fields = ExecStmtType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_in_list: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< ExecStmtType.t]
+    -> [AndExprType.t | BinOpType.t | CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | OrExprType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_in_list :
+    [< ExecStmtType.t]
+    -> ExprListType.t option
+
+
+end
+
+module ElifBranch : sig
+  
+
+  type t =
+    [
+      | `ElifBranch of
+          ElifBranchType.fields
+    ]
+
+  type fields = ElifBranchType.fields =
+    
+  {
+         
+    f_cond_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_cond_test :
+    [< ElifBranchType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_statements :
+    [< ElifBranchType.t]
+    -> [AssertStmtType.t | AssignStmtType.t | AugAssignStmtType.t | BreakStmtType.t | ContinueStmtType.t | DelStmtType.t | ExecStmtType.t | ExprListType.t | GlobalStmtType.t | ImportFromType.t | ImportNameType.t | PassStmtType.t | PrintStmtType.t | PythonNodeListType.t | RaiseStmtType.t | ReturnStmtType.t | StreamPrintStmtType.t | YieldExprType.t]
+
+
+end
+
+module DelStmt : sig
+  
+
+  type t =
+    [
+      | `DelStmt of
+          DelStmtType.fields
+    ]
+
+  type fields = DelStmtType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_exprs :
+    [< DelStmtType.t]
+    -> ExprListType.t
+
+
+end
+
+module FuncDef : sig
+  
+
+  type t =
+    [
+      | `FuncDef of
+          FuncDefType.fields
+    ]
+
+  type fields = FuncDefType.fields =
+    
+  {
+         
+    f_name: IdType.t
+    Lazy.t;
+         
+    f_parameters: ParamsType.t
+    option
+    Lazy.t;
+         
+    f_body: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_name :
+    [< FuncDefType.t]
+    -> IdType.t
+
+      
+  val f_parameters :
+    [< FuncDefType.t]
+    -> ParamsType.t option
+
+      
+  val f_body :
+    [< FuncDefType.t]
+    -> [AssertStmtType.t | AssignStmtType.t | AugAssignStmtType.t | BreakStmtType.t | ContinueStmtType.t | DelStmtType.t | ExecStmtType.t | ExprListType.t | GlobalStmtType.t | ImportFromType.t | ImportNameType.t | PassStmtType.t | PrintStmtType.t | PythonNodeListType.t | RaiseStmtType.t | ReturnStmtType.t | StreamPrintStmtType.t | YieldExprType.t]
+
+
+end
+
+module ClassDef : sig
+  
+
+  type t =
+    [
+      | `ClassDef of
+          ClassDefType.fields
+    ]
+
+  type fields = ClassDefType.fields =
+    
+  {
+         
+    f_name: IdType.t
+    Lazy.t;
+         
+    f_bases: ExprListType.t
+    option
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_name :
+    [< ClassDefType.t]
+    -> IdType.t
+
+      
+  val f_bases :
+    [< ClassDefType.t]
+    -> ExprListType.t option
+
+      
+  val f_statements :
+    [< ClassDefType.t]
+    -> [AssertStmtType.t | AssignStmtType.t | AugAssignStmtType.t | BreakStmtType.t | ContinueStmtType.t | DelStmtType.t | ExecStmtType.t | ExprListType.t | GlobalStmtType.t | ImportFromType.t | ImportNameType.t | PassStmtType.t | PrintStmtType.t | PythonNodeListType.t | RaiseStmtType.t | ReturnStmtType.t | StreamPrintStmtType.t | YieldExprType.t]
+
+
+end
+
+module DefStmt : sig
+  
+
+  type t =
+    [
+      | FuncDef.t
+      | ClassDef.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module Decorated : sig
+  
+
+  type t =
+    [
+      | `Decorated of
+          DecoratedType.fields
+    ]
+
+  type fields = DecoratedType.fields =
+    
+  {
+         
+    f_decorators: DecoratorListType.t
+    Lazy.t;
+         
+    f_defn: DefStmtType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_decorators :
+    [< DecoratedType.t]
+    -> DecoratorListType.t
+
+      
+  val f_defn :
+    [< DecoratedType.t]
+    -> DefStmtType.t
+
+
+end
+
+module ContinueStmt : sig
+  
+
+  type t =
+    [
+      | `ContinueStmt of
+          ContinueStmtType.fields
+    ]
+
+  type fields = ContinueStmtType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module BreakStmt : sig
+  
+
+  type t =
+    [
+      | `BreakStmt of
+          BreakStmtType.fields
+    ]
+
+  type fields = BreakStmtType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module AugAssignStmt : sig
+  
+
+  type t =
+    [
+      | `AugAssignStmt of
+          AugAssignStmtType.fields
+    ]
+
+  type fields = AugAssignStmtType.fields =
+    
+  {
+         
+    f_l_value: ExprListType.t
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_r_value: [
+      | `ExprList
+          of ExprListType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_l_value :
+    [< AugAssignStmtType.t]
+    -> ExprListType.t
+
+      
+  val f_op :
+    [< AugAssignStmtType.t]
+    -> OpType.t
+
+      
+  val f_r_value :
+    [< AugAssignStmtType.t]
+    -> [ExprListType.t | YieldExprType.t]
+
+
+end
+
+module AssignStmt : sig
+  
+
+  type t =
+    [
+      | `AssignStmt of
+          AssignStmtType.fields
+    ]
+
+  type fields = AssignStmtType.fields =
+    
+  {
+         
+    f_l_value: ExprListType.t
+    Lazy.t;
+         
+    f_r_values: PythonNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_l_value :
+    [< AssignStmtType.t]
+    -> ExprListType.t
+
+      
+  val f_r_values :
+    [< AssignStmtType.t]
+    -> PythonNodeListType.t
+
+
+end
+
+module AssertStmt : sig
+  
+
+  type t =
+    [
+      | `AssertStmt of
+          AssertStmtType.fields
+    ]
+
+  type fields = AssertStmtType.fields =
+    
+  {
+         
+    f_test_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_msg: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_test_expr :
+    [< AssertStmtType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_msg :
+    [< AssertStmtType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t] option
+
+
+end
+
+module Stmt : sig
+  
+
+  type t =
+    [
+      | Decorated.t
+      | DefStmt.t
+      | AugAssignStmt.t
+      | AssignStmt.t
+      | PrintStmt.t
+      | StreamPrintStmt.t
+      | DelStmt.t
+      | PassStmt.t
+      | BreakStmt.t
+      | ContinueStmt.t
+      | ReturnStmt.t
+      | RaiseStmt.t
+      | ImportName.t
+      | ImportFrom.t
+      | GlobalStmt.t
+      | ExecStmt.t
+      | AssertStmt.t
+      | IfStmt.t
+      | ElifBranch.t
+      | WhileStmt.t
+      | ForStmt.t
+      | TryStmt.t
+      | WithStmt.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module SingleParam : sig
+  
+
+  type t =
+    [
+      | `SingleParam of
+          SingleParamType.fields
+    ]
+
+  type fields = SingleParamType.fields =
+    
+  {
+         
+    f_is_varargs: VarArgsFlagType.t
+    Lazy.t;
+         
+    f_is_kwargs: KwArgsFlagType.t
+    Lazy.t;
+         
+    f_name: [
+      | `Id
+          of IdType.fields
+      | `IdList
+          of IdListType.fields
+    ]
+    Lazy.t;
+         
+    f_default_value: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_is_varargs :
+    [< SingleParamType.t]
+    -> VarArgsFlagType.t
+
+      
+  val f_is_kwargs :
+    [< SingleParamType.t]
+    -> KwArgsFlagType.t
+
+      
+  val f_name :
+    [< SingleParamType.t]
+    -> [IdType.t | IdListType.t]
+
+      
+  val f_default_value :
+    [< SingleParamType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t] option
+
+
+end
+
+module RelName : sig
+  
+
+  type t =
+    [
+      | `RelName of
+          RelNameType.fields
+    ]
+
+  type fields = RelNameType.fields =
+    
+  {
+         
+    f_dots: DotListType.t
+    Lazy.t;
+         
+    f_name: NameType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_dots :
+    [< RelNameType.t]
+    -> DotListType.t
+
+      
+  val f_name :
+    [< RelNameType.t]
+    -> NameType.t option
+
+
+end
+
+module StringLitList : sig
+  (**
+   * List of StringLit.
+   *)
+
+  type t =
+    [
+      | `StringLitList of
+          StringLitListType.fields
+    ]
+
+  type fields = StringLitListType.fields =
+    
+  {
+    list : StringLitType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< StringLitListType.t]
+    -> StringLitType.t list
+
+end
+
+module SingleParamList : sig
+  (**
+   * List of SingleParam.
+   *)
+
+  type t =
+    [
+      | `SingleParamList of
+          SingleParamListType.fields
+    ]
+
+  type fields = SingleParamListType.fields =
+    
+  {
+    list : SingleParamType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< SingleParamListType.t]
+    -> SingleParamType.t list
+
+end
+
+module PythonNodeList : sig
+  (**
+   * List of PythonNode.
+  
+   * This list node can contain one of the following nodes:
+  
+   * * AsNameNodeType.t
+  
+   * * AssertStmtType.t
+  
+   * * AssignStmtType.t
+  
+   * * AugAssignStmtType.t
+  
+   * * BreakStmtType.t
+  
+   * * ContinueStmtType.t
+  
+   * * DecoratedType.t
+  
+   * * DefStmtType.t
+  
+   * * DelStmtType.t
+  
+   * * ExecStmtType.t
+  
+   * * ExprListType.t
+  
+   * * ForStmtType.t
+  
+   * * GlobalStmtType.t
+  
+   * * IfStmtType.t
+  
+   * * ImportFromType.t
+  
+   * * ImportNameType.t
+  
+   * * NameType.t
+  
+   * * PassStmtType.t
+  
+   * * PrintStmtType.t
+  
+   * * PythonNodeListType.t
+  
+   * * RaiseStmtType.t
+  
+   * * ReturnStmtType.t
+  
+   * * StreamPrintStmtType.t
+  
+   * * TryStmtType.t
+  
+   * * WhileStmtType.t
+  
+   * * WithStmtType.t
+  
+   * * YieldExprType.t
+   *)
+
+  type t =
+    [
+      | `PythonNodeList of
+          PythonNodeListType.fields
+    ]
+
+  type fields = PythonNodeListType.fields =
+    
+  {
+    list : PythonNodeType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< PythonNodeListType.t]
+    -> PythonNodeType.t list
+
+end
+
+module NLList : sig
+  (**
+   * List of NL.
+   *)
+
+  type t =
+    [
+      | `NLList of
+          NLListType.fields
+    ]
+
+  type fields = NLListType.fields =
+    
+  {
+    list : NLType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< NLListType.t]
+    -> NLType.t list
+
+end
+
+module IdList : sig
+  (**
+   * List of Id.
+   *)
+
+  type t =
+    [
+      | `IdList of
+          IdListType.fields
+    ]
+
+  type fields = IdListType.fields =
+    
+  {
+    list : IdType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< IdListType.t]
+    -> IdType.t list
+
+end
+
+module ExprList : sig
+  (**
+   * List of Expr.
+  
+   * This list node can contain one of the following nodes:
+  
+   * * AndExprType.t
+  
+   * * AndOpType.t
+  
+   * * BinOpType.t
+  
+   * * CallExprType.t
+  
+   * * CompOpType.t
+  
+   * * ConcatStringLitType.t
+  
+   * * DictCompType.t
+  
+   * * DictLitType.t
+  
+   * * EllipsisExprType.t
+  
+   * * FactorType.t
+  
+   * * IfExprType.t
+  
+   * * InlineEvalType.t
+  
+   * * LambdaDefType.t
+  
+   * * ListCompType.t
+  
+   * * ListGenType.t
+  
+   * * ListLitType.t
+  
+   * * NameType.t
+  
+   * * NotOpType.t
+  
+   * * NumberLitType.t
+  
+   * * OrExprType.t
+  
+   * * OrOpType.t
+  
+   * * PowerType.t
+  
+   * * SetCompType.t
+  
+   * * SetLitType.t
+  
+   * * SliceExprType.t
+  
+   * * StringLitType.t
+  
+   * * SubscriptExprType.t
+  
+   * * TupleLitType.t
+  
+   * * XorExprType.t
+  
+   * * YieldExprType.t
+   *)
+
+  type t =
+    [
+      | `ExprList of
+          ExprListType.fields
+    ]
+
+  type fields = ExprListType.fields =
+    
+  {
+    list : ExprType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< ExprListType.t]
+    -> ExprType.t list
+
+end
+
+module ExceptPartList : sig
+  (**
+   * List of ExceptPart.
+   *)
+
+  type t =
+    [
+      | `ExceptPartList of
+          ExceptPartListType.fields
+    ]
+
+  type fields = ExceptPartListType.fields =
+    
+  {
+    list : ExceptPartType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< ExceptPartListType.t]
+    -> ExceptPartType.t list
+
+end
+
+module ElifBranchList : sig
+  (**
+   * List of ElifBranch.
+   *)
+
+  type t =
+    [
+      | `ElifBranchList of
+          ElifBranchListType.fields
+    ]
+
+  type fields = ElifBranchListType.fields =
+    
+  {
+    list : ElifBranchType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< ElifBranchListType.t]
+    -> ElifBranchType.t list
+
+end
+
+module DotList : sig
+  (**
+   * List of Dot.
+   *)
+
+  type t =
+    [
+      | `DotList of
+          DotListType.fields
+    ]
+
+  type fields = DotListType.fields =
+    
+  {
+    list : DotType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< DotListType.t]
+    -> DotType.t list
+
+end
+
+module DictAssocList : sig
+  (**
+   * List of DictAssoc.
+   *)
+
+  type t =
+    [
+      | `DictAssocList of
+          DictAssocListType.fields
+    ]
+
+  type fields = DictAssocListType.fields =
+    
+  {
+    list : DictAssocType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< DictAssocListType.t]
+    -> DictAssocType.t list
+
+end
+
+module DecoratorList : sig
+  (**
+   * List of Decorator.
+   *)
+
+  type t =
+    [
+      | `DecoratorList of
+          DecoratorListType.fields
+    ]
+
+  type fields = DecoratorListType.fields =
+    
+  {
+    list : DecoratorType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< DecoratorListType.t]
+    -> DecoratorType.t list
+
+end
+
+module AsNameNodeList : sig
+  (**
+   * List of AsNameNode.
+   *)
+
+  type t =
+    [
+      | `AsNameNodeList of
+          AsNameNodeListType.fields
+    ]
+
+  type fields = AsNameNodeListType.fields =
+    
+  {
+    list : AsNameNodeType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< AsNameNodeListType.t]
+    -> AsNameNodeType.t list
+
+end
+
+module ArgList : sig
+  (**
+   * List of Arg.
+   *)
+
+  type t =
+    [
+      | `ArgList of
+          ArgListType.fields
+    ]
+
+  type fields = ArgListType.fields =
+    
+  {
+    list : ArgType.t list Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+  val f_list :
+    [< ArgListType.t]
+    -> ArgType.t list
+
+end
+
+module PythonNodeBaseList : sig
+  
+
+  type t =
+    [
+      | ArgList.t
+      | ExprList.t
+      | DictAssocList.t
+      | StringLitList.t
+      | PythonNodeList.t
+      | DecoratorList.t
+      | IdList.t
+      | ElifBranchList.t
+      | DotList.t
+      | NLList.t
+      | ExceptPartList.t
+      | SingleParamList.t
+      | AsNameNodeList.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module Params : sig
+  
+
+  type t =
+    [
+      | `Params of
+          ParamsType.fields
+    ]
+
+  type fields = ParamsType.fields =
+    
+  {
+         
+    f_single_params: SingleParamListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_single_params :
+    [< ParamsType.t]
+    -> SingleParamListType.t
+
+
+end
+
+module Op : sig
+  
+
+  type t =
+    [
+      | `Op of
+          OpType.fields
+    ]
+
+  type fields = OpType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module NL : sig
+  
+
+  type t =
+    [
+      | `NL of
+          NLType.fields
+    ]
+
+  type fields = NLType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module KwArgsFlagPresent : sig
+  
+
+  type t =
+    [
+      | `KwArgsFlagPresent of
+          KwArgsFlagPresentType.fields
+    ]
+
+  type fields = KwArgsFlagPresentType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module KwArgsFlagAbsent : sig
+  
+
+  type t =
+    [
+      | `KwArgsFlagAbsent of
+          KwArgsFlagAbsentType.fields
+    ]
+
+  type fields = KwArgsFlagAbsentType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module KwArgsFlag : sig
+  
+
+  type t =
+    [
+      | KwArgsFlagPresent.t
+      | KwArgsFlagAbsent.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+      
+  val p_as_bool :
+    [< KwArgsFlagType.t ]
+    -> bool
+  (**
+   * Return whether this is an instance of KwArgsFlagPresent
+   *)
+
+
+
+end
+
+module ImportStar : sig
+  
+
+  type t =
+    [
+      | `ImportStar of
+          ImportStarType.fields
+    ]
+
+  type fields = ImportStarType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module FileNode : sig
+  
+
+  type t =
+    [
+      | `FileNode of
+          FileNodeType.fields
+    ]
+
+  type fields = FileNodeType.fields =
+    
+  {
+         
+    f_statements: PythonNodeListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_statements :
+    [< FileNodeType.t]
+    -> PythonNodeListType.t
+
+
+end
+
+module YieldExpr : sig
+  
+
+  type t =
+    [
+      | `YieldExpr of
+          YieldExprType.fields
+    ]
+
+  type fields = YieldExprType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_exprs :
+    [< YieldExprType.t]
+    -> ExprListType.t option
+
+
+end
+
+module XorExpr : sig
+  
+
+  type t =
+    [
+      | `XorExpr of
+          XorExprType.fields
+    ]
+
+  type fields = XorExprType.fields =
+    
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_left :
+    [< XorExprType.t]
+    -> [AndExprType.t | BinOpType.t | CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_right :
+    [< XorExprType.t]
+    -> [AndExprType.t | BinOpType.t | CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | YieldExprType.t]
+
+
+end
+
+module TupleLit : sig
+  
+
+  type t =
+    [
+      | `TupleLit of
+          TupleLitType.fields
+    ]
+
+  type fields = TupleLitType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_exprs :
+    [< TupleLitType.t]
+    -> ExprListType.t option
+
+
+end
+
+module SubscriptExpr : sig
+  
+
+  type t =
+    [
+      | `SubscriptExpr of
+          SubscriptExprType.fields
+    ]
+
+  type fields = SubscriptExprType.fields =
+    
+  {
+         
+    f_prefix: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_prefix :
+    [< SubscriptExprType.t]
+    -> [CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | YieldExprType.t]
+
+      
+  val f_suffix :
+    [< SubscriptExprType.t]
+    -> ExprListType.t
+
+
+end
+
+module StringLit : sig
+  
+
+  type t =
+    [
+      | `StringLit of
+          StringLitType.fields
+    ]
+
+  type fields = StringLitType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module ExtSliceExpr : sig
+  
+
+  type t =
+    [
+      | `ExtSliceExpr of
+          ExtSliceExprType.fields
+    ]
+
+  type fields = ExtSliceExprType.fields =
+    
+  {
+         
+    f_first: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_last: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_stride: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_first :
+    [< ExtSliceExprType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t] option
+
+      
+  val f_last :
+    [< ExtSliceExprType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t] option
+
+      
+  val f_stride :
+    [< ExtSliceExprType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t] option
+
+
+end
+
+module SliceExpr : sig
+  
+
+  type t =
+    [
+      | `SliceExpr of
+          SliceExprType.fields
+      | `ExtSliceExpr of
+          ExtSliceExprType.fields
+    ]
+
+  type fields = SliceExprType.fields =
+    
+  {
+         
+    f_first: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_last: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_first :
+    [< SliceExprType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t] option
+
+      
+  val f_last :
+    [< SliceExprType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t] option
+
+
+end
+
+module SetLit : sig
+  
+
+  type t =
+    [
+      | `SetLit of
+          SetLitType.fields
+    ]
+
+  type fields = SetLitType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_exprs :
+    [< SetLitType.t]
+    -> ExprListType.t
+
+
+end
+
+module SetComp : sig
+  
+
+  type t =
+    [
+      | `SetComp of
+          SetCompType.fields
+    ]
+
+  type fields = SetCompType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< SetCompType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_comprehension :
+    [< SetCompType.t]
+    -> CompForType.t
+
+
+end
+
+module Power : sig
+  
+
+  type t =
+    [
+      | `Power of
+          PowerType.fields
+    ]
+
+  type fields = PowerType.fields =
+    
+  {
+         
+    f_left: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_left :
+    [< PowerType.t]
+    -> [CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | YieldExprType.t]
+
+      
+  val f_right :
+    [< PowerType.t]
+    -> [CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | YieldExprType.t]
+
+
+end
+
+module OrOp : sig
+  
+
+  type t =
+    [
+      | `OrOp of
+          OrOpType.fields
+    ]
+
+  type fields = OrOpType.fields =
+    
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_left :
+    [< OrOpType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_right :
+    [< OrOpType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+
+end
+
+module OrExpr : sig
+  
+
+  type t =
+    [
+      | `OrExpr of
+          OrExprType.fields
+    ]
+
+  type fields = OrExprType.fields =
+    
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_left :
+    [< OrExprType.t]
+    -> [AndExprType.t | BinOpType.t | CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | OrExprType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_right :
+    [< OrExprType.t]
+    -> [AndExprType.t | BinOpType.t | CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+
+end
+
+module NumberLit : sig
+  
+
+  type t =
+    [
+      | `NumberLit of
+          NumberLitType.fields
+    ]
+
+  type fields = NumberLitType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module NotOp : sig
+  
+
+  type t =
+    [
+      | `NotOp of
+          NotOpType.fields
+    ]
+
+  type fields = NotOpType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< NotOpType.t]
+    -> [AndExprType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+
+end
+
+module Id : sig
+  
+
+  type t =
+    [
+      | `Id of
+          IdType.fields
+    ]
+
+  type fields = IdType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module DottedName : sig
+  
+
+  type t =
+    [
+      | `DottedName of
+          DottedNameType.fields
+    ]
+
+  type fields = DottedNameType.fields =
+    
+  {
+         
+    f_prefix: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: IdType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_prefix :
+    [< DottedNameType.t]
+    -> [CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | YieldExprType.t]
+
+      
+  val f_suffix :
+    [< DottedNameType.t]
+    -> IdType.t
+
+
+end
+
+module Name : sig
+  
+
+  type t =
+    [
+      | DottedName.t
+      | Id.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module ListLit : sig
+  
+
+  type t =
+    [
+      | `ListLit of
+          ListLitType.fields
+    ]
+
+  type fields = ListLitType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_exprs :
+    [< ListLitType.t]
+    -> ExprListType.t
+
+
+end
+
+module ListGen : sig
+  
+
+  type t =
+    [
+      | `ListGen of
+          ListGenType.fields
+    ]
+
+  type fields = ListGenType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForLType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< ListGenType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_comprehension :
+    [< ListGenType.t]
+    -> CompForLType.t
+
+
+end
+
+module ListComp : sig
+  
+
+  type t =
+    [
+      | `ListComp of
+          ListCompType.fields
+    ]
+
+  type fields = ListCompType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForLType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< ListCompType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_comprehension :
+    [< ListCompType.t]
+    -> CompForLType.t
+
+
+end
+
+module LambdaDef : sig
+  
+
+  type t =
+    [
+      | `LambdaDef of
+          LambdaDefType.fields
+    ]
+
+  type fields = LambdaDefType.fields =
+    
+  {
+         
+    f_args: ParamsType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_args :
+    [< LambdaDefType.t]
+    -> ParamsType.t
+
+      
+  val f_expr :
+    [< LambdaDefType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+
+end
+
+module InlineEval : sig
+  
+
+  type t =
+    [
+      | `InlineEval of
+          InlineEvalType.fields
+    ]
+
+  type fields = InlineEvalType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_exprs :
+    [< InlineEvalType.t]
+    -> ExprListType.t
+
+
+end
+
+module IfExpr : sig
+  
+
+  type t =
+    [
+      | `IfExpr of
+          IfExprType.fields
+    ]
+
+  type fields = IfExprType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_cond: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_else_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< IfExprType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_cond :
+    [< IfExprType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_else_expr :
+    [< IfExprType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+
+end
+
+module Factor : sig
+  
+
+  type t =
+    [
+      | `Factor of
+          FactorType.fields
+    ]
+
+  type fields = FactorType.fields =
+    
+  {
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_expr: [
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_op :
+    [< FactorType.t]
+    -> OpType.t
+
+      
+  val f_expr :
+    [< FactorType.t]
+    -> [CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | YieldExprType.t]
+
+
+end
+
+module EllipsisExpr : sig
+  
+
+  type t =
+    [
+      | `EllipsisExpr of
+          EllipsisExprType.fields
+    ]
+
+  type fields = EllipsisExprType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module Dot : sig
+  
+
+  type t =
+    [
+      | `Dot of
+          DotType.fields
+    ]
+
+  type fields = DotType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module DictLit : sig
+  
+
+  type t =
+    [
+      | `DictLit of
+          DictLitType.fields
+    ]
+
+  type fields = DictLitType.fields =
+    
+  {
+         
+    f_assocs: DictAssocListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_assocs :
+    [< DictLitType.t]
+    -> DictAssocListType.t
+
+
+end
+
+module DictComp : sig
+  
+
+  type t =
+    [
+      | `DictComp of
+          DictCompType.fields
+    ]
+
+  type fields = DictCompType.fields =
+    
+  {
+         
+    f_assoc: DictAssocType.t
+    Lazy.t;
+         
+    f_comprehension: CompForType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_assoc :
+    [< DictCompType.t]
+    -> DictAssocType.t
+
+      
+  val f_comprehension :
+    [< DictCompType.t]
+    -> CompForType.t
+
+
+end
+
+module ConcatStringLit : sig
+  
+
+  type t =
+    [
+      | `ConcatStringLit of
+          ConcatStringLitType.fields
+    ]
+
+  type fields = ConcatStringLitType.fields =
+    
+  {
+         
+    f_first_str: StringLitType.t
+    Lazy.t;
+         
+    f_subsequent_str: StringLitListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_first_str :
+    [< ConcatStringLitType.t]
+    -> StringLitType.t
+
+      
+  val f_subsequent_str :
+    [< ConcatStringLitType.t]
+    -> StringLitListType.t
+
+
+end
+
+module CompOp : sig
+  
+
+  type t =
+    [
+      | `CompOp of
+          CompOpType.fields
+    ]
+
+  type fields = CompOpType.fields =
+    
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: CompOpKindType.t
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_left :
+    [< CompOpType.t]
+    -> [AndExprType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | OrExprType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_op :
+    [< CompOpType.t]
+    -> CompOpKindType.t
+
+      
+  val f_right :
+    [< CompOpType.t]
+    -> [AndExprType.t | BinOpType.t | CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | OrExprType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+
+end
+
+module CallExpr : sig
+  
+
+  type t =
+    [
+      | `CallExpr of
+          CallExprType.fields
+    ]
+
+  type fields = CallExprType.fields =
+    
+  {
+         
+    f_prefix: [
+      | `CallExpr
+          of fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_suffix: ArgListType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_prefix :
+    [< CallExprType.t]
+    -> [CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | YieldExprType.t]
+
+      
+  val f_suffix :
+    [< CallExprType.t]
+    -> ArgListType.t
+
+
+end
+
+module Term : sig
+  
+
+  type t =
+    [
+      | `Term of
+          TermType.fields
+    ]
+
+  type fields = TermType.fields =
+    
+  {
+         
+    f_left: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_left :
+    [< TermType.t]
+    -> [BinOpType.t | CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | YieldExprType.t]
+
+      
+  val f_op :
+    [< TermType.t]
+    -> OpType.t
+
+      
+  val f_right :
+    [< TermType.t]
+    -> [ArithExprType.t | CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TermType.t | TupleLitType.t | YieldExprType.t]
+
+
+end
+
+module ShiftExpr : sig
+  
+
+  type t =
+    [
+      | `ShiftExpr of
+          ShiftExprType.fields
+    ]
+
+  type fields = ShiftExprType.fields =
+    
+  {
+         
+    f_left: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_left :
+    [< ShiftExprType.t]
+    -> [BinOpType.t | CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | YieldExprType.t]
+
+      
+  val f_op :
+    [< ShiftExprType.t]
+    -> OpType.t
+
+      
+  val f_right :
+    [< ShiftExprType.t]
+    -> [ArithExprType.t | CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TermType.t | TupleLitType.t | YieldExprType.t]
+
+
+end
+
+module ArithExpr : sig
+  
+
+  type t =
+    [
+      | `ArithExpr of
+          ArithExprType.fields
+    ]
+
+  type fields = ArithExprType.fields =
+    
+  {
+         
+    f_left: [
+      | `ArithExpr
+          of fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_op: OpType.t
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_left :
+    [< ArithExprType.t]
+    -> [BinOpType.t | CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | YieldExprType.t]
+
+      
+  val f_op :
+    [< ArithExprType.t]
+    -> OpType.t
+
+      
+  val f_right :
+    [< ArithExprType.t]
+    -> [ArithExprType.t | CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TermType.t | TupleLitType.t | YieldExprType.t]
+
+
+end
+
+module BinOp : sig
+  
+
+  type t =
+    [
+      | ArithExpr.t
+      | Term.t
+      | ShiftExpr.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_left :
+    [< BinOpType.t]
+    -> [BinOpType.t | CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | YieldExprType.t]
+
+      
+  val f_op :
+    [< BinOpType.t]
+    -> OpType.t
+
+      
+  val f_right :
+    [< BinOpType.t]
+    -> [ArithExprType.t | CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TermType.t | TupleLitType.t | YieldExprType.t]
+
+
+end
+
+module AndOp : sig
+  
+
+  type t =
+    [
+      | `AndOp of
+          AndOpType.fields
+    ]
+
+  type fields = AndOpType.fields =
+    
+  {
+         
+    f_left: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `AndExpr
+          of AndExprType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_left :
+    [< AndOpType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_right :
+    [< AndOpType.t]
+    -> [AndExprType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+
+end
+
+module AndExpr : sig
+  
+
+  type t =
+    [
+      | `AndExpr of
+          AndExprType.fields
+    ]
+
+  type fields = AndExprType.fields =
+    
+  {
+         
+    f_left: [
+      | `AndExpr
+          of fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_right: [
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_left :
+    [< AndExprType.t]
+    -> [AndExprType.t | BinOpType.t | CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | YieldExprType.t]
+
+      
+  val f_right :
+    [< AndExprType.t]
+    -> [BinOpType.t | CallExprType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NumberLitType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | YieldExprType.t]
+
+
+end
+
+module Expr : sig
+  
+
+  type t =
+    [
+      | Name.t
+      | CallExpr.t
+      | SubscriptExpr.t
+      | IfExpr.t
+      | OrOp.t
+      | AndOp.t
+      | NotOp.t
+      | CompOp.t
+      | OrExpr.t
+      | XorExpr.t
+      | AndExpr.t
+      | BinOp.t
+      | Factor.t
+      | Power.t
+      | YieldExpr.t
+      | ListGen.t
+      | TupleLit.t
+      | ListComp.t
+      | ListLit.t
+      | SetComp.t
+      | SetLit.t
+      | DictComp.t
+      | DictLit.t
+      | InlineEval.t
+      | LambdaDef.t
+      | EllipsisExpr.t
+      | SliceExpr.t
+      | NumberLit.t
+      | StringLit.t
+      | ConcatStringLit.t
+      | Dot.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module ExceptPart : sig
+  
+
+  type t =
+    [
+      | `ExceptPart of
+          ExceptPartType.fields
+    ]
+
+  type fields = ExceptPartType.fields =
+    
+  {
+         
+    f_as_name: AsNameNodeType.t
+    option
+    Lazy.t;
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_as_name :
+    [< ExceptPartType.t]
+    -> AsNameNodeType.t option
+
+      
+  val f_statements :
+    [< ExceptPartType.t]
+    -> [AssertStmtType.t | AssignStmtType.t | AugAssignStmtType.t | BreakStmtType.t | ContinueStmtType.t | DelStmtType.t | ExecStmtType.t | ExprListType.t | GlobalStmtType.t | ImportFromType.t | ImportNameType.t | PassStmtType.t | PrintStmtType.t | PythonNodeListType.t | RaiseStmtType.t | ReturnStmtType.t | StreamPrintStmtType.t | YieldExprType.t]
+
+
+end
+
+module ElsePart : sig
+  
+
+  type t =
+    [
+      | `ElsePart of
+          ElsePartType.fields
+    ]
+
+  type fields = ElsePartType.fields =
+    
+  {
+         
+    f_statements: [
+      | `AssertStmt
+          of AssertStmtType.fields
+      | `AssignStmt
+          of AssignStmtType.fields
+      | `AugAssignStmt
+          of AugAssignStmtType.fields
+      | `BreakStmt
+          of BreakStmtType.fields
+      | `ContinueStmt
+          of ContinueStmtType.fields
+      | `DelStmt
+          of DelStmtType.fields
+      | `ExecStmt
+          of ExecStmtType.fields
+      | `ExprList
+          of ExprListType.fields
+      | `GlobalStmt
+          of GlobalStmtType.fields
+      | `ImportFrom
+          of ImportFromType.fields
+      | `ImportName
+          of ImportNameType.fields
+      | `PassStmt
+          of PassStmtType.fields
+      | `PrintStmt
+          of PrintStmtType.fields
+      | `PythonNodeList
+          of PythonNodeListType.fields
+      | `RaiseStmt
+          of RaiseStmtType.fields
+      | `ReturnStmt
+          of ReturnStmtType.fields
+      | `StreamPrintStmt
+          of StreamPrintStmtType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_statements :
+    [< ElsePartType.t]
+    -> [AssertStmtType.t | AssignStmtType.t | AugAssignStmtType.t | BreakStmtType.t | ContinueStmtType.t | DelStmtType.t | ExecStmtType.t | ExprListType.t | GlobalStmtType.t | ImportFromType.t | ImportNameType.t | PassStmtType.t | PrintStmtType.t | PythonNodeListType.t | RaiseStmtType.t | ReturnStmtType.t | StreamPrintStmtType.t | YieldExprType.t]
+
+
+end
+
+module DictAssoc : sig
+  
+
+  type t =
+    [
+      | `DictAssoc of
+          DictAssocType.fields
+    ]
+
+  type fields = DictAssocType.fields =
+    
+  {
+         
+    f_key: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_value: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_key :
+    [< DictAssocType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_value :
+    [< DictAssocType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+
+end
+
+module Decorator : sig
+  
+
+  type t =
+    [
+      | `Decorator of
+          DecoratorType.fields
+    ]
+
+  type fields = DecoratorType.fields =
+    
+  {
+         
+    f_dec_name: NameType.t
+    Lazy.t;
+         
+    f_arg_list: ArgListType.t
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_dec_name :
+    [< DecoratorType.t]
+    -> NameType.t
+
+      
+  val f_arg_list :
+    [< DecoratorType.t]
+    -> ArgListType.t option
+
+
+end
+
+module CompForL : sig
+  
+
+  type t =
+    [
+      | `CompForL of
+          CompForLType.fields
+    ]
+
+  type fields = CompForLType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+         
+    f_target: ExprListType.t
+    Lazy.t;
+         
+    f_comp: [
+      | `CompForL
+          of fields
+      | `CompIf
+          of CompIfType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_exprs :
+    [< CompForLType.t]
+    -> ExprListType.t
+
+      
+  val f_target :
+    [< CompForLType.t]
+    -> ExprListType.t
+
+      
+  val f_comp :
+    [< CompForLType.t]
+    -> [CompForLType.t | CompIfType.t] option
+
+
+end
+
+module CompFor : sig
+  
+
+  type t =
+    [
+      | `CompFor of
+          CompForType.fields
+    ]
+
+  type fields = CompForType.fields =
+    
+  {
+         
+    f_exprs: ExprListType.t
+    Lazy.t;
+         
+    f_target: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comp: [
+      | `CompFor
+          of fields
+      | `CompIf
+          of CompIfType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_exprs :
+    [< CompForType.t]
+    -> ExprListType.t
+
+      
+  val f_target :
+    [< CompForType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | InlineEvalType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_comp :
+    [< CompForType.t]
+    -> [CompForType.t | CompIfType.t] option
+
+
+end
+
+module Comprehension : sig
+  
+
+  type t =
+    [
+      | CompFor.t
+      | CompForL.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module CompOpKindNotin : sig
+  
+
+  type t =
+    [
+      | `CompOpKindNotin of
+          CompOpKindNotinType.fields
+    ]
+
+  type fields = CompOpKindNotinType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module CompOpKindNoteq : sig
+  
+
+  type t =
+    [
+      | `CompOpKindNoteq of
+          CompOpKindNoteqType.fields
+    ]
+
+  type fields = CompOpKindNoteqType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module CompOpKindLte : sig
+  
+
+  type t =
+    [
+      | `CompOpKindLte of
+          CompOpKindLteType.fields
+    ]
+
+  type fields = CompOpKindLteType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module CompOpKindLt : sig
+  
+
+  type t =
+    [
+      | `CompOpKindLt of
+          CompOpKindLtType.fields
+    ]
+
+  type fields = CompOpKindLtType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module CompOpKindIsnot : sig
+  
+
+  type t =
+    [
+      | `CompOpKindIsnot of
+          CompOpKindIsnotType.fields
+    ]
+
+  type fields = CompOpKindIsnotType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module CompOpKindIs : sig
+  
+
+  type t =
+    [
+      | `CompOpKindIs of
+          CompOpKindIsType.fields
+    ]
+
+  type fields = CompOpKindIsType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module CompOpKindIn : sig
+  
+
+  type t =
+    [
+      | `CompOpKindIn of
+          CompOpKindInType.fields
+    ]
+
+  type fields = CompOpKindInType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module CompOpKindGte : sig
+  
+
+  type t =
+    [
+      | `CompOpKindGte of
+          CompOpKindGteType.fields
+    ]
+
+  type fields = CompOpKindGteType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module CompOpKindGt : sig
+  
+
+  type t =
+    [
+      | `CompOpKindGt of
+          CompOpKindGtType.fields
+    ]
+
+  type fields = CompOpKindGtType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module CompOpKindEq : sig
+  
+
+  type t =
+    [
+      | `CompOpKindEq of
+          CompOpKindEqType.fields
+    ]
+
+  type fields = CompOpKindEqType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module CompOpKindDiamond : sig
+  
+
+  type t =
+    [
+      | `CompOpKindDiamond of
+          CompOpKindDiamondType.fields
+    ]
+
+  type fields = CompOpKindDiamondType.fields =
+    
+  {
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module CompOpKind : sig
+  
+
+  type t =
+    [
+      | CompOpKindLt.t
+      | CompOpKindGt.t
+      | CompOpKindEq.t
+      | CompOpKindGte.t
+      | CompOpKindLte.t
+      | CompOpKindDiamond.t
+      | CompOpKindNoteq.t
+      | CompOpKindIn.t
+      | CompOpKindNotin.t
+      | CompOpKindIs.t
+      | CompOpKindIsnot.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module CompIf : sig
+  
+
+  type t =
+    [
+      | `CompIf of
+          CompIfType.fields
+    ]
+
+  type fields = CompIfType.fields =
+    
+  {
+         
+    f_test: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comp: [
+      | `CompFor
+          of CompForType.fields
+      | `CompForL
+          of CompForLType.fields
+      | `CompIf
+          of fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_test :
+    [< CompIfType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_comp :
+    [< CompIfType.t]
+    -> [CompIfType.t | ComprehensionType.t] option
+
+
+end
+
+module AsNameNode : sig
+  
+
+  type t =
+    [
+      | `AsNameNode of
+          AsNameNodeType.fields
+    ]
+
+  type fields = AsNameNodeType.fields =
+    
+  {
+         
+    f_imported: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_as_name: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_imported :
+    [< AsNameNodeType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_as_name :
+    [< AsNameNodeType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t] option
+
+
+end
+
+module VarArgs : sig
+  
+
+  type t =
+    [
+      | `VarArgs of
+          VarArgsType.fields
+    ]
+
+  type fields = VarArgsType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< VarArgsType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+
+end
+
+module KwArgs : sig
+  
+
+  type t =
+    [
+      | `KwArgs of
+          KwArgsType.fields
+    ]
+
+  type fields = KwArgsType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< KwArgsType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+
+end
+
+module ArgGen : sig
+  
+
+  type t =
+    [
+      | `ArgGen of
+          ArgGenType.fields
+    ]
+
+  type fields = ArgGenType.fields =
+    
+  {
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+         
+    f_comprehension: CompForType.t
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_expr :
+    [< ArgGenType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+      
+  val f_comprehension :
+    [< ArgGenType.t]
+    -> CompForType.t
+
+
+end
+
+module ArgAssoc : sig
+  
+
+  type t =
+    [
+      | `ArgAssoc of
+          ArgAssocType.fields
+    ]
+
+  type fields = ArgAssocType.fields =
+    
+  {
+         
+    f_name: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    option
+    Lazy.t;
+         
+    f_expr: [
+      | `AndExpr
+          of AndExprType.fields
+      | `AndOp
+          of AndOpType.fields
+      | `ArithExpr
+          of ArithExprType.fields
+      | `CallExpr
+          of CallExprType.fields
+      | `CompOp
+          of CompOpType.fields
+      | `ConcatStringLit
+          of ConcatStringLitType.fields
+      | `DictComp
+          of DictCompType.fields
+      | `DictLit
+          of DictLitType.fields
+      | `DottedName
+          of DottedNameType.fields
+      | `Factor
+          of FactorType.fields
+      | `Id
+          of IdType.fields
+      | `IfExpr
+          of IfExprType.fields
+      | `InlineEval
+          of InlineEvalType.fields
+      | `LambdaDef
+          of LambdaDefType.fields
+      | `ListComp
+          of ListCompType.fields
+      | `ListGen
+          of ListGenType.fields
+      | `ListLit
+          of ListLitType.fields
+      | `NotOp
+          of NotOpType.fields
+      | `NumberLit
+          of NumberLitType.fields
+      | `OrExpr
+          of OrExprType.fields
+      | `OrOp
+          of OrOpType.fields
+      | `Power
+          of PowerType.fields
+      | `SetComp
+          of SetCompType.fields
+      | `SetLit
+          of SetLitType.fields
+      | `ShiftExpr
+          of ShiftExprType.fields
+      | `StringLit
+          of StringLitType.fields
+      | `SubscriptExpr
+          of SubscriptExprType.fields
+      | `Term
+          of TermType.fields
+      | `TupleLit
+          of TupleLitType.fields
+      | `XorExpr
+          of XorExprType.fields
+      | `YieldExpr
+          of YieldExprType.fields
+    ]
+    Lazy.t;
+    c_value : Entity.t;
+    context : AnalysisContext.t
+  }
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+      
+  val f_name :
+    [< ArgAssocType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t] option
+
+      
+  val f_expr :
+    [< ArgAssocType.t]
+    -> [AndExprType.t | AndOpType.t | BinOpType.t | CallExprType.t | CompOpType.t | ConcatStringLitType.t | DictCompType.t | DictLitType.t | FactorType.t | IfExprType.t | InlineEvalType.t | LambdaDefType.t | ListCompType.t | ListGenType.t | ListLitType.t | NameType.t | NotOpType.t | NumberLitType.t | OrExprType.t | OrOpType.t | PowerType.t | SetCompType.t | SetLitType.t | StringLitType.t | SubscriptExprType.t | TupleLitType.t | XorExprType.t | YieldExprType.t]
+
+
+end
+
+module Arg : sig
+  
+
+  type t =
+    [
+      | ArgAssoc.t
+      | ArgGen.t
+      | VarArgs.t
+      | KwArgs.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+
+
+
+end
+
+module PythonNode : sig
+  
+
+  type t =
+    [
+      | PythonNodeBaseList.t
+      | VarArgsFlag.t
+      | KwArgsFlag.t
+      | Stmt.t
+      | Decorator.t
+      | FileNode.t
+      | Params.t
+      | SingleParam.t
+      | RelName.t
+      | ImportStar.t
+      | AsNameNode.t
+      | Expr.t
+      | ElsePart.t
+      | ExceptPart.t
+      | CompOpKind.t
+      | Op.t
+      | DictAssoc.t
+      | Arg.t
+      | Comprehension.t
+      | CompIf.t
+      | NL.t
+    ]
+
+
+  val equal : [< t] -> [< t] -> bool
+
+  val hash : [< t] -> int
+
+  val compare : [< t] -> [< t] -> int
+
+  val kind_name : [< PythonNodeType.t] -> string
+  (**
+   * Return the kind of this node.
+   *)
+
+  val text : [< PythonNodeType.t ] -> string
+  (**
+   * Return the source buffer slice corresponding to the text that spans
+   * between the first and the last tokens of the given node.
+   *)
+
+  val image : [< PythonNodeType.t ] -> string
+  (**
+   * Return a representation of this node as a string.
+   *)
+
+  val sloc_range : [< PythonNodeType.t ] -> SlocRange.t
+  (**
+   * Return the spanning source location range for this node.
+  
+   * Note that this returns the sloc of the parent for synthetic nodes.
+   *)
+
+  val lookup : [< PythonNodeType.t ] -> Sloc.t -> PythonNodeType.t option
+  (**
+   * Return the bottom-most node from in ``Node`` and its children which
+   * contains ``Sloc``, or ``None`` if there is none.
+   *)
+
+  
+  val fold_tokens : ('a -> Token.t -> 'a) -> 'a -> [< PythonNodeType.t] -> 'a
+  (**
+   * Fold all the token this node contains by calling f on each token.
+   *)
+
+  val iter_tokens : (Token.t -> unit) -> [< PythonNodeType.t]-> unit
+  (**
+   * Iterate over all token this node contains by calling f on each token.
+   *)
+
+  val map_tokens : (Token.t -> 'a) -> [< PythonNodeType.t] -> 'a list
+  (**
+   * Map each token calling the given function
+   *)
+
+  val tokens : [< PythonNodeType.t] -> Token.t list
+  (**
+   * Return a list of tokens for the given node
+   *)
+
+
+  val entity_image : [< PythonNodeType.t ] -> string
+
+  val children_opt : [< PythonNodeType.t ] -> PythonNodeType.t option list
+  (**
+   * Return an optional list of nodes which are the children of the given node.
+   * Each child is optional because it can either be because of a syntax error,
+   * or an optional field evaluated to null.
+   *)
+
+  val fold_fields :
+    ('a -> PythonNodeType.t -> 'a) -> 'a -> [< PythonNodeType.t ] -> 'a
+  (**
+   * Fold all fields of the given node. This skips any child that is None
+   * because of a syntax error or because the field is optional
+   *)
+
+  val iter_fields :
+    (PythonNodeType.t -> unit) -> [< PythonNodeType.t ] -> unit
+  (**
+   * Iter all fields of the given node. This skips any child that is None
+   * because of a syntax error or because the field is optional
+   *)
+
+  val exists_fields :
+    (PythonNodeType.t -> bool) -> [< PythonNodeType.t ] -> bool
+  (**
+   * Fold all fields of the given node. Return true if the given predicate is
+   * evaluated to true for at least one node.
+   *)
+
+  val for_all_fields :
+    (PythonNodeType.t -> bool) -> [< PythonNodeType.t ] -> bool
+  (**
+   * Fold all fields of the given node. Return true if the given predicate is
+   * evaluated to true for all nodes.
+   *)
+
+  val fold :
+    ('a -> PythonNodeType.t -> 'a) -> 'a -> [< PythonNodeType.t ] -> 'a
+  (**
+   * Fold the entire AST, below the given node, and call the given function on
+   * each node in prefix order.
+   *)
+
+  val iter :
+    (PythonNodeType.t -> unit) -> [< PythonNodeType.t ] -> unit
+  (**
+   * Iterate over the entire AST, below the given node, and call the given
+   * function on each node in prefix order.
+   *)
+
+  val filter :
+    (PythonNodeType.t -> bool)
+    -> [< PythonNodeType.t ]
+    -> PythonNodeType.t list
+  (**
+   * Fold the entire AST, below the given node, and return the list of node
+   * evaluated to true by the given function
+   *)
+
+  val exists :
+    (PythonNodeType.t -> bool) -> [< PythonNodeType.t ] -> bool
+  (**
+   * Fold the entire AST, below the given node, and return true if the given
+   * predicate is evaluated to true by at least one node.
+   *)
+
+  val for_all :
+    (PythonNodeType.t -> bool) -> [< PythonNodeType.t ] -> bool
+  (**
+   * Fold the entire AST, below the given node, and return true if the given
+   * predicate is evaluated to true for all nodes.
+   *)
+
+  val lookup_with_kind :
+    'a node -> [< PythonNodeType.t] -> Sloc.t -> 'a option
+  (**
+   * Given the kind of a node, a source location and a node, return the deepest
+   * node containing the source location and of the right kind. Returns None if
+   * there is no match.
+   *)
+
+  val as_a : 'a node -> [< PythonNodeType.t ] -> 'a option
+  (**
+   * Given the kind of a node, try to cast the given node to this kind. Return
+   * None if the node is not of this type and thus, cannot be cast.
+   *)
+
+  val find : 'a node -> [< PythonNodeType.t ] -> 'a
+  (**
+   * Given the kind of node, return the first node found by walking the given
+   * node. The type of the resulting node depends on the desired kind
+   *)
+
+
+  val findall : 'a node -> [< PythonNodeType.t ] -> 'a list
+  (**
+   * Given the kind of node, return the all nodes of this kind found by walking
+   * the given node. The type of the resulting nodes depends on the desired
+   * kind
+   *)
+
+  val fields_with_names :
+    [< PythonNodeType.t ] -> (string * PythonNodeType.t option) list
+  (**
+   * Given a node, return the list of it's fields, together with the name of
+   * the field. This function does not raise SyntaxError, but instead the
+   * returned node is None.
+   *)
+
+  val pp_tree : Format.formatter -> [< PythonNodeType.t] -> unit
+  (**
+   * Pretty print the whole tree by completely walking it.
+   *)
+
+
+      
+  val parent :
+    [< PythonNodeType.t ]
+    -> PythonNodeType.t option
+  (**
+   * Return the lexical parent for this node. Return null for the root AST node
+   * or for AST nodes for which no one has a reference to the parent.
+   *)
+
+      
+  val parents :
+    [< PythonNodeType.t ]
+    -> PythonNodeType.t list
+  (**
+   * Return an array that contains the lexical parents (this node included).
+   * Nearer parents are first in the list.
+   *)
+
+      
+  val children :
+    [< PythonNodeType.t ]
+    -> PythonNodeType.t list
+  (**
+   * Return an array that contains the direct lexical children.
+   *)
+
+      
+  val token_start :
+    [< PythonNodeType.t ]
+    -> Token.t
+  (**
+   * Return the first token used to parse this node.
+   *)
+
+      
+  val token_end :
+    [< PythonNodeType.t ]
+    -> Token.t
+  (**
+   * Return the last token used to parse this node.
+   *)
+
+      
+  val child_index :
+    [< PythonNodeType.t ]
+    -> int
+  (**
+   * Return the 0-based index for Node in its parent's children.
+   *)
+
+      
+  val previous_sibling :
+    [< PythonNodeType.t ]
+    -> PythonNodeType.t option
+  (**
+   * Return the node's previous sibling, if there is one.
+   *)
+
+      
+  val next_sibling :
+    [< PythonNodeType.t ]
+    -> PythonNodeType.t option
+  (**
+   * Return the node's next sibling, if there is one.
+   *)
+
+      
+  val unit :
+    [< PythonNodeType.t ]
+    -> AnalysisUnit.t
+  (**
+   * Return the analysis unit owning this node.
+   *)
+
+      
+  val is_ghost :
+    [< PythonNodeType.t ]
+    -> bool
+  (**
+   * Return whether the node is a ghost.
+  
+   * Unlike regular nodes, ghost nodes cover no token in the input source: they
+   * are logically located instead between two tokens. The "token_first" of all
+   * ghost nodes is the token right after this logical position, while they have
+   * no "token_last".
+   *)
+
+      
+  val full_sloc_image :
+    [< PythonNodeType.t ]
+    -> string
+  (**
+   * Return a string containing the filename + the sloc in GNU conformant
+   * format. Useful to create diagnostics from a node.
+   *)
+
+
+
+end
+
+
@@ -0,0 +1,12895 @@
+
+"""
+Python binding of the Libpythonlang API.
+
+Please consider all exported entities whose names that start with an underscore
+("_") as internal implementation details. They are not meant to be used
+directly.
+"""
+
+
+
+
+
+
+from __future__ import absolute_import, division, print_function
+
+
+
+
+
+import argparse
+import collections
+import ctypes
+import json
+import os
+import sys
+import weakref
+
+import libpythonlang._py2to3 as _py2to3
+
+
+#
+# Low-level binding - First part
+#
+
+_so_ext = {
+    'win32':  'dll',
+    'darwin': 'dylib',
+}.get(sys.platform, 'so')
+
+# Loading the shared library here is quite involved as we want to support
+# Python packages that embed all the required shared libraries: if we can
+# find the shared library in the package directory, import it from there
+# directly.
+
+# Directory that contains this __init__.py module
+_self_path = os.path.dirname(os.path.abspath(__file__))
+
+# Base and full names for the shared library to load. Full name assumes the
+# shared lib is in the package directory.
+_c_lib_name = 'libpythonlang.{}'.format(_so_ext)
+_c_lib_path = os.path.join(_self_path, _c_lib_name)
+
+# If we can find the shared lirbray in the package directory, load it from
+# here, otherwise let the dynamic loader find it in the environment. On
+# Windows, there is no RPATH trick, so we need to temporarily alter the PATH
+# environment variable in order to import the whole closure of DLLs.
+_old_env_path = None
+if os.path.exists(_c_lib_path):
+    if sys.platform == 'win32':
+        _old_env_path = os.environ['PATH']
+        os.environ['PATH'] = '{}{}{}'.format(_self_path, os.path.pathsep,
+                                             os.environ['PATH'])
+else:
+    _c_lib_path = _c_lib_name
+
+# Finally load the library
+_c_lib = ctypes.cdll.LoadLibrary(_c_lib_path)
+
+# Restore the PATH environment variable if we altered it
+if _old_env_path is not None:
+    os.environ['PATH'] = _old_env_path
+
+
+def _import_func(name, argtypes, restype, exc_wrap=True):
+    """
+    Import "name" from the C library, set its arguments/return types and return
+    the binding.
+
+    :param str name: Name of the symbol for the function to import.
+    :param list[ctypes._CData] argtypes: Types for function argruments.
+    :param None|ctypes._CData restype: Function return type, or None if it
+        does not return anything.
+    :param bool exc_wrap: If True, wrap the returned function to check for
+      exceptions.
+    """
+    func = getattr(_c_lib, name)
+    func.argtypes = argtypes
+    func.restype = restype
+
+    # Wrapper for "func" that raises a NativeException in case of internal
+    # error.
+    #
+    # These wrappers are on the path of all calls to the C API, so make them
+    # as cheap as possible. First, build them with exactly one parameter per C
+    # function argument: this way, the interpreter itself rejects calls with
+    # an incorrect number of arguments, so there is no need to count them at
+    # each call. Second, checking for errors just reads the exported
+    # "last_exception" variable, which does not require a second native call.
+    params = ', '.join('arg_{}'.format(i) for i in range(len(argtypes)))
+    if exc_wrap:
+        body = ('    result = func({params})\n'
+                '    if _last_exception:\n'
+                '        raise _last_exception.contents._wrap()\n'
+                '    return result\n')
+    else:
+        body = '    return func({params})\n'
+    namespace = {'func': func, '_last_exception': _last_exception}
+    exec('def {name}({params}):\n{body}'.format(
+        name=name, params=params, body=body.format(params=params)
+    ), namespace)
+    return namespace[name]
+
+
+class _Exception(ctypes.Structure):
+    _fields_ = [('kind', ctypes.c_int),
+                ('information', ctypes.c_char_p)]
+
+    def _wrap(self):
+        # In Python3, turn information into native strings, i.e. decode bytes.
+        # These strings are only informative, so do not raise an error if
+        # decoding fails: do best effort decoding instead to be as helpful as
+        # possible.
+        info = self.information
+        if not _py2to3.python2:
+            info = info.decode(errors='replace')
+        return _exception_kind_to_type[self.kind](info)
+
+
+_last_exception = ctypes.POINTER(_Exception).in_dll(
+    _c_lib, 'python_last_exception'
+)
+"""
+Exception information for the last error that happened in the C API, or a
+null pointer if the last call succeeded. This reflects the value of the C
+variable, so reading it does not involve any native call.
+"""
+
+
+def _type_fullname(t):
+    """
+    Return the fully qualified name for the given `t` type.
+    """
+    name = t.__name__
+    module = t.__module__
+    return (name
+            if module in (None, object.__class__.__module__) else
+            '{}.{}'.format(module, name))
+
+
+def _raise_type_error(expected_type_name, actual_value):
+    raise TypeError('{} instance expected, got {} instead'.format(
+        expected_type_name, _type_fullname(type(actual_value))
+    ))
+
+
+_get_last_exception = _import_func(
+   'python_get_last_exception',
+   [], ctypes.POINTER(_Exception),
+   exc_wrap=False
+)
+
+
+def _hashable_c_pointer(pointed_type=None):
+    """
+    Create a "pointer to `pointed_type` type and make it hashable.
+
+    :param pointed_type: ctypes type class. If left to `None`, we return a
+        subclass of `ctypes.c_void_p`.
+    :rtype: ctypes.POINTER
+    """
+
+    if pointed_type is None:
+        class _c_type(ctypes.c_void_p):
+            @property
+            def _pointer_value(self):
+                return self.value or 0
+    else:
+        @property
+        def _pointer_value(self):
+            return ctypes.addressof(self.contents)
+
+        _c_type = ctypes.POINTER(pointed_type)
+        _c_type._pointer_value = _pointer_value
+
+    def __hash__(self):
+        return self._pointer_value
+
+    def __eq__(self, other):
+        return self._pointer_value == other._pointer_value
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    _c_type.__hash__ = __hash__
+    _c_type.__eq__ = __eq__
+    _c_type.__ne__ = __ne__
+    return _c_type
+
+
+class _text(ctypes.Structure):
+    """
+    C value for unicode strings. This object is the owner of the underlying
+    buffer, so the string will be deallocated when ``self`` is destroyed.
+
+    ``_unwrap`` takes a string/unicode object and returns a ``_text`` instance,
+    while ``_wrap`` retuns an unicode instance.
+    """
+    # The chars field really is a uint32_t* but considering it as a char* here
+    # is more convenient for conversion in this binding layer. On the other
+    # side, we have to be careful about converting the length when retrieving
+    # the chars.
+    _fields_ = [("chars", ctypes.POINTER(ctypes.c_char)),
+                ("length", ctypes.c_size_t),
+                ("is_allocated", ctypes.c_int),]
+
+    encoding = 'utf-32le' if sys.byteorder == 'little' else 'utf-32be'
+
+    compact_threshold = 1024
+    """
+    Minimum number of characters for texts to be transferred in a compact
+    encoding (see ``_text_to_bytes``) rather than in UTF-32. For smaller
+    texts, the additional native calls cost more than the bigger copy.
+    """
+
+    # Instances can hold buffers that they own. In this case, the buffer must
+    # be deallocated when the instance is destroyed. Thus instances will hold
+    # a "text_buffer" attribute that will be automatically destroyed.
+    text_buffer = None
+
+    @classmethod
+    def _unwrap(cls, value):
+        value = cls.cast(value)
+
+        # The C API never modifies text arguments, so there is no need to copy
+        # the encoded string: just reference the bytes object's own buffer,
+        # and keep the bytes object alive as long as this text.
+        text = value.encode(cls.encoding)
+        text_buffer_ptr = ctypes.cast(
+            ctypes.c_char_p(text), ctypes.POINTER(ctypes.c_char)
+        )
+        result = _text(text_buffer_ptr, len(value))
+        result.text_buffer = text
+        return result
+
+    def _wrap(self):
+        length = self.length
+        if length == 0:
+            return u''
+
+        elif length < self.compact_threshold:
+            # self.length tells how much UTF-32 chars there are in self.chars
+            # but self.chars is a char* so we have to fetch 4 times more bytes
+            # than characters. Use ctypes.string_at to copy them in one go:
+            # slicing self.chars would copy them one at a time.
+            return ctypes.string_at(self.chars, 4 * length).decode(
+                self.encoding
+            )
+
+        else:
+            # Big texts are usually mostly ASCII: let the library encode them
+            # to Latin-1 (or UTF-8 if needed), which divides the amount of
+            # data to copy by up to four.
+            buffer = ctypes.c_void_p()
+            size = ctypes.c_size_t()
+            is_latin_1 = _text_to_bytes(
+                ctypes.byref(self), ctypes.byref(buffer), ctypes.byref(size)
+            )
+            try:
+                data = ctypes.string_at(buffer.value, size.value)
+            finally:
+                _free(buffer)
+            return data.decode('latin-1' if is_latin_1 else 'utf-8')
+
+    @classmethod
+    def cast(cls, value):
+        """
+        Try to cast ``value`` into an unicode object. Raise a TypeError, or
+        raise a string decoding error when this is not possible.
+        """
+        if isinstance(value, _py2to3.bytes_type):
+            return value.decode('ascii')
+        elif not isinstance(value, _py2to3.text_type):
+            _raise_type_error('text string', value)
+        else:
+            return value
+
+    def __del__(self):
+        # Only texts that own their buffer need to go through the C API
+        if self.is_allocated:
+            _destroy_text(ctypes.byref(self))
+
+
+class _symbol_type(ctypes.Structure):
+    _fields_ = [('data', ctypes.c_void_p),
+                ('bounds', ctypes.c_void_p)]
+
+    @classmethod
+    def wrap(cls, c_value):
+        # First extract the text associated to this symbol in "text"
+        text = _text()
+        _symbol_text(ctypes.byref(c_value), ctypes.byref(text))
+
+        # Then wrap this text
+        return text._wrap()
+
+    @classmethod
+    def unwrap(cls, py_value, context):
+        # Symbols are interned in their analysis context, so the C value for a
+        # given string is the same for the whole context lifetime: look for it
+        # in the context wrapper's cache first.
+        py_value = _text.cast(py_value)
+        context_wrapper = AnalysisContext._context_cache.get(context)
+        cache = (context_wrapper._symbol_cache
+                 if context_wrapper is not None else {})
+        try:
+            return cache[py_value]
+        except KeyError:
+            pass
+
+        # First turn the given symbol into a low-level text object
+        text = _text._unwrap(py_value)
+
+        # Then convert it to a symbol
+        result = cls()
+        if not _context_symbol(context, ctypes.byref(text),
+                               ctypes.byref(result)):
+            raise InvalidSymbolError(py_value)
+        cache[py_value] = result
+        return result
+
+
+class _big_integer(object):
+
+    class c_type(ctypes.c_void_p):
+        pass
+
+    def __init__(self, c_value):
+        self.c_value = c_value
+
+    @classmethod
+    def unwrap(cls, value):
+        if not _py2to3.is_int(value):
+            _raise_type_error('int or long', value)
+
+        text = _text._unwrap(str(value))
+        c_value = cls.create(ctypes.byref(text))
+        return cls(c_value)
+
+    @classmethod
+    def wrap(cls, c_value):
+        helper = cls(c_value)
+        text = _text()
+        cls.text(helper.c_value, ctypes.byref(text))
+        return int(text._wrap())
+
+    def clear(self):
+        self.c_value = None
+
+    def __del__(self):
+        self.decref(self.c_value)
+        self.clear()
+
+    create = staticmethod(_import_func(
+        'python_create_big_integer',
+        [ctypes.POINTER(_text)], c_type
+    ))
+    text = staticmethod(_import_func(
+        'python_big_integer_text',
+        [c_type, ctypes.POINTER(_text)], None
+    ))
+    decref = staticmethod(_import_func(
+        'python_big_integer_decref',
+        [c_type], None
+    ))
+
+
+class _Enum(object):
+
+    _name = None
+    """
+    Name for this enumeration type.
+    :type: str
+    """
+
+    _c_to_py = None
+    """
+    Mapping from C values to user-level Python values.
+    :type: list[str]
+    """
+
+    _py_to_c = None
+    """
+    Mapping from user-level Python values to C values.
+    :type: dict[str, int]
+    """
+
+    @classmethod
+    def _unwrap(cls, py_value):
+        if not isinstance(py_value, str):
+            _raise_type_error('str', py_value)
+        try:
+            return _py2to3.text_to_bytes(cls._py_to_c[py_value])
+        except KeyError:
+            raise ValueError('Invalid {}: {}'.format(cls._name, py_value))
+
+    @classmethod
+    def _wrap(cls, c_value):
+        if isinstance(c_value, ctypes.c_int):
+            c_value = c_value.value
+        return cls._c_to_py[c_value]
+
+
+class AnalysisUnitKind(_Enum):
+    """
+    Specify a kind of analysis unit. Specification units provide an interface
+    to the outer world while body units provide an implementation for the
+    corresponding interface.
+    """
+
+    unit_specification = 'unit_specification'
+    unit_body = 'unit_body'
+
+    _name = 'AnalysisUnitKind'
+    _c_to_py = [
+        unit_specification, unit_body]
+    _py_to_c = {name: index for index, name in enumerate(_c_to_py)}
+class LookupKind(_Enum):
+    """
+    """
+
+    recursive = 'recursive'
+    flat = 'flat'
+    minimal = 'minimal'
+
+    _name = 'LookupKind'
+    _c_to_py = [
+        recursive, flat, minimal]
+    _py_to_c = {name: index for index, name in enumerate(_c_to_py)}
+class GrammarRule(_Enum):
+    """
+    Gramar rule to use for parsing.
+    """
+
+    name_rule = 'name_rule'
+    number_rule = 'number_rule'
+    string_rule = 'string_rule'
+    cat_string_rule = 'cat_string_rule'
+    nl_rule = 'nl_rule'
+    main_rule_rule = 'main_rule_rule'
+    decorator_rule = 'decorator_rule'
+    decorators_rule = 'decorators_rule'
+    decorated_rule = 'decorated_rule'
+    func_def_rule = 'func_def_rule'
+    parameters_rule = 'parameters_rule'
+    varargslist_rule = 'varargslist_rule'
+    fpdef_rule = 'fpdef_rule'
+    name_list_rule = 'name_list_rule'
+    stmt_rule = 'stmt_rule'
+    simple_stmt_rule = 'simple_stmt_rule'
+    small_stmt_rule = 'small_stmt_rule'
+    expr_stmt_rule = 'expr_stmt_rule'
+    print_stmt_rule = 'print_stmt_rule'
+    del_stmt_rule = 'del_stmt_rule'
+    pass_stmt_rule = 'pass_stmt_rule'
+    flow_stmt_rule = 'flow_stmt_rule'
+    break_stmt_rule = 'break_stmt_rule'
+    continue_stmt_rule = 'continue_stmt_rule'
+    return_stmt_rule = 'return_stmt_rule'
+    yield_stmt_rule = 'yield_stmt_rule'
+    raise_stmt_rule = 'raise_stmt_rule'
+    import_stmt_rule = 'import_stmt_rule'
+    import_name_rule = 'import_name_rule'
+    dot_rule = 'dot_rule'
+    import_from_rule = 'import_from_rule'
+    as_name_rule = 'as_name_rule'
+    dotted_as_name_rule = 'dotted_as_name_rule'
+    import_as_names_rule = 'import_as_names_rule'
+    dotted_as_names_rule = 'dotted_as_names_rule'
+    dotted_name_rule = 'dotted_name_rule'
+    global_stmt_rule = 'global_stmt_rule'
+    exec_stmt_rule = 'exec_stmt_rule'
+    assert_stmt_rule = 'assert_stmt_rule'
+    compound_stmt_rule = 'compound_stmt_rule'
+    else_part_rule = 'else_part_rule'
+    if_stmt_rule = 'if_stmt_rule'
+    while_stmt_rule = 'while_stmt_rule'
+    for_stmt_rule = 'for_stmt_rule'
+    try_stmt_rule = 'try_stmt_rule'
+    with_stmt_rule = 'with_stmt_rule'
+    with_item_rule = 'with_item_rule'
+    suite_rule = 'suite_rule'
+    test_rule = 'test_rule'
+    or_test_rule = 'or_test_rule'
+    and_test_rule = 'and_test_rule'
+    not_test_rule = 'not_test_rule'
+    comparison_rule = 'comparison_rule'
+    expr_rule = 'expr_rule'
+    xor_expr_rule = 'xor_expr_rule'
+    and_expr_rule = 'and_expr_rule'
+    shift_expr_rule = 'shift_expr_rule'
+    arith_expr_rule = 'arith_expr_rule'
+    term_rule = 'term_rule'
+    factor_rule = 'factor_rule'
+    power_rule = 'power_rule'
+    atom_expr_rule = 'atom_expr_rule'
+    dict_assoc_rule = 'dict_assoc_rule'
+    yield_expr_rule = 'yield_expr_rule'
+    atom_rule = 'atom_rule'
+    set_lit_rule = 'set_lit_rule'
+    lambdef_rule = 'lambdef_rule'
+    subscript_list_rule = 'subscript_list_rule'
+    subscript_rule = 'subscript_rule'
+    expr_list_rule = 'expr_list_rule'
+    test_list_rule = 'test_list_rule'
+    empty_test_list_rule = 'empty_test_list_rule'
+    class_def_rule = 'class_def_rule'
+    arg_list_rule = 'arg_list_rule'
+    list_iter_rule = 'list_iter_rule'
+    list_for_rule = 'list_for_rule'
+    list_if_rule = 'list_if_rule'
+    comp_iter_rule = 'comp_iter_rule'
+    comp_for_rule = 'comp_for_rule'
+    comp_if_rule = 'comp_if_rule'
+
+    _name = 'GrammarRule'
+    _c_to_py = [
+        name_rule, number_rule, string_rule, cat_string_rule, nl_rule, main_rule_rule, decorator_rule, decorators_rule, decorated_rule, func_def_rule, parameters_rule, varargslist_rule, fpdef_rule, name_list_rule, stmt_rule, simple_stmt_rule, small_stmt_rule, expr_stmt_rule, print_stmt_rule, del_stmt_rule, pass_stmt_rule, flow_stmt_rule, break_stmt_rule, continue_stmt_rule, return_stmt_rule, yield_stmt_rule, raise_stmt_rule, import_stmt_rule, import_name_rule, dot_rule, import_from_rule, as_name_rule, dotted_as_name_rule, import_as_names_rule, dotted_as_names_rule, dotted_name_rule, global_stmt_rule, exec_stmt_rule, assert_stmt_rule, compound_stmt_rule, else_part_rule, if_stmt_rule, while_stmt_rule, for_stmt_rule, try_stmt_rule, with_stmt_rule, with_item_rule, suite_rule, test_rule, or_test_rule, and_test_rule, not_test_rule, comparison_rule, expr_rule, xor_expr_rule, and_expr_rule, shift_expr_rule, arith_expr_rule, term_rule, factor_rule, power_rule, atom_expr_rule, dict_assoc_rule, yield_expr_rule, atom_rule, set_lit_rule, lambdef_rule, subscript_list_rule, subscript_rule, expr_list_rule, test_list_rule, empty_test_list_rule, class_def_rule, arg_list_rule, list_iter_rule, list_for_rule, list_if_rule, comp_iter_rule, comp_for_rule, comp_if_rule]
+    _py_to_c = {name: index for index, name in enumerate(_c_to_py)}
+
+
+default_grammar_rule = GrammarRule.main_rule_rule
+
+
+_unit_provider = _hashable_c_pointer()
+
+
+def _canonicalize_buffer(buffer, charset):
+    """Canonicalize source buffers to be bytes buffers."""
+    if isinstance(buffer, _py2to3.text_type):
+        if charset:
+            raise TypeError('`charset` must be null when the buffer is'
+                            ' Unicode')
+        buffer = buffer.encode('utf-8')
+        charset = b'utf-8'
+    elif not isinstance(buffer, _py2to3.bytes_type):
+        raise TypeError('`buffer` must be a string')
+    return (buffer, charset)
+
+
+#
+# High-level binding
+#
+
+
+class InvalidField(Exception):
+    """
+    Raised when introspection functions (``Libpythonlang.Introspection``) are
+    requested an invalid field.
+    """
+    pass
+class NodeDataEvaluationError(Exception):
+    """
+    Raised when introspection functions (``Libpythonlang.Introspection``) are
+    improperly used to evaluate a node data (field or property).
+    """
+    pass
+class InvalidInput(Exception):
+    """
+    Raised by lexing functions (``Libpythonlang.Lexer``) when the input
+    contains an invalid byte sequence.
+    """
+    pass
+class InvalidSymbolError(Exception):
+    """
+    Exception raise when an invalid symbol is passed to a subprogram.
+    """
+    pass
+class InvalidUnitNameError(Exception):
+    """
+    Raised when an invalid unit name is provided.
+    """
+    pass
+class NativeException(Exception):
+    """
+    Exception raised in language bindings when the underlying C API reports an
+    unexpected error that occurred in the library.
+
+    This kind of exception is raised for internal errors: they should never
+    happen in normal situations and if they are raised at some point, it means
+    the library state is potentially corrupted.
+
+    Nevertheless, the library does its best not to crash the program,
+    materializing internal errors using this kind of exception.
+    """
+    pass
+class PreconditionFailure(Exception):
+    """
+    Exception raised when an API is called while its preconditions are not
+    satisfied.
+    """
+    pass
+class PropertyError(Exception):
+    """
+    Exception that is raised when an error occurs while evaluating any AST node
+    method whose name starts with ``p_``. This is the only exceptions that such
+    functions can raise.
+    """
+    pass
+class TemplateArgsError(Exception):
+    """
+    Exception raised when the provided arguments for a template don't match
+    what the template expects.
+    """
+    pass
+class TemplateFormatError(Exception):
+    """
+    Exception raised when a template has an invalid syntax, such as badly
+    formatted placeholders.
+    """
+    pass
+class TemplateInstantiationError(Exception):
+    """
+    Exception raised when the instantiation of a template cannot be parsed.
+    """
+    pass
+class StaleReferenceError(Exception):
+    """
+    Exception raised while trying to access data that was deallocated. This
+    happens when one tries to use a node whose unit has been reparsed, for
+    instance.
+    """
+    pass
+class UnknownCharset(Exception):
+    """
+    Raised by lexing functions (``Libpythonlang.Lexer``) when the input charset
+    is not supported.
+    """
+    pass
+
+_exception_kind_to_type = [
+    InvalidField,
+    NodeDataEvaluationError,
+    InvalidInput,
+    InvalidSymbolError,
+    InvalidUnitNameError,
+    NativeException,
+    PreconditionFailure,
+    PropertyError,
+    TemplateArgsError,
+    TemplateFormatError,
+    TemplateInstantiationError,
+    StaleReferenceError,
+    UnknownCharset,
+]
+
+
+
+
+
+class AnalysisContext(object):
+    """
+    This type represents a context for all source analysis. This is the first
+    type you need to create to use Libpythonlang. It will contain the results
+    of all analysis, and is the main holder for all the data.
+
+    You can create several analysis contexts if you need to, which enables you,
+    for example to:
+
+    * analyze several different projects at the same time;
+
+    * analyze different parts of the same projects in parallel.
+
+    In the current design, contexts always keep all of their analysis units
+    allocated. If you need to get this memory released, the only option at your
+    disposal is to destroy your analysis context instance.
+    """
+
+    __slots__ = ('_c_value', '_unit_provider', '_serial_number', '_unit_cache',
+                 '_symbol_cache', '__weakref__')
+
+    _context_cache = weakref.WeakValueDictionary()
+    """
+    Cache for analysis context wrappers. Indexed by analysis context addresses,
+    which are known to stay valid forever (and re-used).
+
+    Unlike unit and node caches, this one should contain weak references so
+    that analysis contexts (and their units/nodes) can be free'd when user code
+    does not reference them anymore.
+
+    :type: dict[AnalysisContext._c_type, AnalysisContext]
+    """
+
+    def __init__(self,
+                 charset=None,
+                 unit_provider=None,
+                 with_trivia=True,
+                 tab_stop=8,
+                 _c_value=None):
+        """
+        Create a new analysis context.
+
+        ``Charset`` will be used as a default charset to decode input sources
+        in analysis units. Please see ``GNATCOLL.Iconv`` for several supported
+        charsets. Be careful: passing an unsupported charset is not guaranteed
+        to raise an error here. If no charset is provided, ``"utf-8"`` is the
+        default.
+
+        .. todo:: Passing an unsupported charset here is not guaranteed to
+        raise an error right here, but this would be really helpful for users.
+
+        When ``With_Trivia`` is true, the parsed analysis units will contain
+        trivias.
+
+        If provided, ``Unit_Provider`` will be used to query the file name that
+        corresponds to a unit reference during semantic analysis. If it is
+        ``None``, the default one is used instead.
+
+        ``Tab_Stop`` is a positive number to describe the effect of tabulation
+        characters on the column number in source files.
+        """
+
+        # Initialize this field in case we raise an exception during
+        # construction, so that the destructor can run later on.
+        self._c_value = None
+
+        if _c_value is None:
+            charset = _py2to3.text_to_bytes(charset)
+            if not isinstance(tab_stop, int) or tab_stop < 1:
+                raise ValueError(
+                    'Invalid tab_stop (positive integer expected)')
+            c_unit_provider = unit_provider._c_value if unit_provider else None
+            self._c_value = _create_analysis_context(charset, c_unit_provider,
+                                                     with_trivia, tab_stop)
+        else:
+            self._c_value = _context_incref(_c_value)
+        assert self._c_value not in self._context_cache
+        self._context_cache[self._c_value] = self
+
+        # Keep a reference to the unit provider so that it is live at least as
+        # long as the analysis context is live.
+        self._unit_provider = unit_provider
+
+        self._serial_number = None
+        self._unit_cache = {}
+        """
+        Cache for AnalysisUnit wrappers, indexed by analysis unit addresses,
+        which are known to stay valid as long as the context is alive.
+
+        :type: dict[str, AnalysisUnit]
+        """
+
+        self._symbol_cache = {}
+        """
+        Cache for symbol C values, indexed by symbol text. Symbols stay valid
+        as long as the context is alive.
+
+        :type: dict[str, _symbol_type]
+        """
+
+        self._check_unit_cache()
+
+    def __del__(self):
+        if self._c_value:
+            _context_decref(self._c_value)
+
+    def __eq__(self, other):
+        return self._c_value == other._c_value
+
+    def __hash__(self):
+        return hash(self._c_value)
+
+    def get_from_file(self, filename, charset=None, reparse=False,
+                      rule=default_grammar_rule):
+        """
+        Create a new analysis unit for ``Filename`` or return the existing one
+        if any. If ``Reparse`` is true and the analysis unit already exists,
+        reparse it from ``Filename``.
+
+        ``Rule`` controls which grammar rule is used to parse the unit.
+
+        Use ``Charset`` in order to decode the source. If ``Charset`` is empty
+        then use the context's default charset.
+
+        If any failure occurs, such as file opening, decoding, lexing or
+        parsing failure, return an analysis unit anyway: errors are described
+        as diagnostics of the returned analysis unit.
+        """
+        filename = _py2to3.text_to_bytes(filename)
+        charset = _py2to3.text_to_bytes(charset or '')
+        c_value = _get_analysis_unit_from_file(self._c_value, filename,
+                                               charset, reparse,
+                                               GrammarRule._unwrap(rule))
+        return AnalysisUnit._wrap(c_value)
+
+    def get_from_files(self, filenames, charset=None, reparse=False,
+                       rule=default_grammar_rule, jobs=0):
+        """
+        Create new analysis units for all ``Filenames``, or return the existing
+        ones, as ``Get_From_File`` would do for each of them. Units that need
+        to be (re)parsed are lexed and parsed concurrently on ``Jobs`` worker
+        tasks, or on one task per processor if ``Jobs`` is zero. Only lexing
+        and parsing run concurrently: the rest of the processing (for instance
+        lexical environments updates) is sequential.
+
+        Return the analysis units in the same order as ``Filenames``.
+
+        Note that grammar predicates are evaluated concurrently, so properties
+        they use must not depend on other analysis units.
+        """
+        filenames = [_py2to3.text_to_bytes(f) for f in filenames]
+        charset = _py2to3.text_to_bytes(charset or '')
+        count = len(filenames)
+        c_filenames = (ctypes.c_char_p * count)(*filenames)
+        c_units = (AnalysisUnit._c_type * count)()
+        _get_analysis_units_from_files(self._c_value, c_filenames, count,
+                                       charset, reparse,
+                                       GrammarRule._unwrap(rule), jobs,
+                                       c_units)
+        return [AnalysisUnit._wrap(u) for u in c_units]
+
+    def get_from_buffer(self, filename, buffer, charset=None, reparse=False,
+                        rule=default_grammar_rule):
+        """
+        Create a new analysis unit for ``Filename`` or return the existing one
+        if any. Whether the analysis unit already exists or not, (re)parse it
+        from the source code in ``Buffer``.
+
+        ``Rule`` controls which grammar rule is used to parse the unit.
+
+        Use ``Charset`` in order to decode the source. If ``Charset`` is empty
+        then use the context's default charset.
+
+        If any failure occurs, such as file opening, decoding, lexing or
+        parsing failure, return an analysis unit anyway: errors are described
+        as diagnostics of the returned analysis unit.
+        """
+        filename = _py2to3.text_to_bytes(filename)
+        charset = _py2to3.text_to_bytes(charset or '')
+        buffer, charset = _canonicalize_buffer(buffer, charset)
+        c_value = _get_analysis_unit_from_buffer(self._c_value, filename,
+                                                 charset,
+                                                 buffer, len(buffer),
+                                                 GrammarRule._unwrap(rule))
+        return AnalysisUnit._wrap(c_value)
+
+    def get_from_provider(self, name, kind, charset=None, reparse=False):
+        """
+        Create a new analysis unit for ``Name``/``Kind`` or return the existing
+        one if any. If ``Reparse`` is true and the analysis unit already
+        exists, reparse it from ``Filename``.
+
+        Use ``Charset`` in order to decode the source. If ``Charset`` is empty
+        then use the context's default charset.
+
+        If the unit name cannot be tuned into a file name, raise an
+        ``InvalidUnitNameError`` exception. If any other failure occurs, such
+        as file opening, decoding, lexing or parsing failure, return an
+        analysis unit anyway: errors are described as diagnostics of the
+        returned analysis unit.
+        """
+        name = _py2to3.bytes_to_text(name)
+        charset = _py2to3.text_to_bytes(charset or '')
+
+        _name = _text._unwrap(name)
+        _kind = AnalysisUnitKind._unwrap(kind)
+        c_value = _get_analysis_unit_from_provider(
+            self._c_value, ctypes.byref(_name), _kind, charset, reparse
+        )
+        if c_value:
+            return AnalysisUnit._wrap(c_value)
+        else:
+            raise InvalidUnitNameError('Invalid unit name: {} ({})'.format(
+                repr(name), kind
+            ))
+
+    def discard_errors_in_populate_lexical_env(self, discard):
+        """
+        Debug helper. Set whether ``Property_Error`` exceptions raised in
+        ``Populate_Lexical_Env`` should be discarded. They are by default.
+        """
+        _discard_errors_in_populate_lexical_env(self._c_value, bool(discard))
+
+    def use_memory_mapped_files(self, enabled=True):
+        """
+        Set whether analysis units created from files in this context should be
+        lexed directly from a compact copy of the memory-mapped file. This
+        avoids decoding the file into a wide-character buffer, and thus speeds
+        up parsing and reduces memory usage. It is disabled by default.
+
+        This only applies to files that use a single-byte charset (ASCII or
+        Latin-1) and that do not start with a UTF byte order mark: other files
+        are decoded as usual.
+        """
+        _use_memory_mapped_files(self._c_value, bool(enabled))
+
+    class _c_struct(ctypes.Structure):
+        _fields_ = [('serial_number', ctypes.c_uint64)]
+    _c_type = _hashable_c_pointer(_c_struct)
+
+    @classmethod
+    def _wrap(cls, c_value):
+        try:
+            return cls._context_cache[c_value]
+        except KeyError:
+            return cls(_c_value=c_value)
+
+    def _check_unit_cache(self):
+        """
+        If this context has been re-used, invalidate its unit cache.
+        """
+        serial_number = self._c_value.contents.serial_number
+        if self._serial_number != serial_number:
+            self._unit_cache = {}
+            self._symbol_cache = {}
+            self._serial_number = serial_number
+
+
+class AnalysisUnit(object):
+    """
+    This type represents the analysis of a single file.
+    """
+
+    __slots__ = ('_c_value', '_context_link', '_cache_version_number',
+                 '_node_cache')
+
+    class TokenIterator(object):
+        """
+        Iterator over the tokens in an analysis unit.
+        """
+
+        def __init__(self, first):
+            self.first = first
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            if not self.first:
+                raise StopIteration()
+            result = self.first
+            self.first = self.first.next
+            return result
+        next = __next__
+
+    def __init__(self, context, c_value):
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly. Please use AnalysisContext.get_from_* methods to create
+        analysis unit instances instead.
+        """
+        self._c_value = c_value
+
+        # Keep a reference on the owning context so that we keep it alive at
+        # least as long as this unit is alive.
+        self._context_link = context
+
+        # Store this wrapper in caches for later re-use
+        assert c_value not in context._unit_cache
+        context._unit_cache[c_value] = self
+
+        self._cache_version_number = None
+        """
+        Last version number we saw for this analysis unit wrapper. If it's
+        different from `self._unit_version`, it means that the unit was
+        reparsed: in this case we need to clear the node cache below (see the
+        `_check_node_cache` method).
+
+        :type: int
+        """
+
+        self._node_cache = {}
+        """
+        Cache for all node wrappers in this unit. Indexed by couples:
+        (c_value, metadata, rebindings).
+
+        :type: dict[T, PythonNode]
+        """
+
+        self._check_node_cache()
+
+    def __eq__(self, other):
+        return self._c_value == other._c_value
+
+    def __hash__(self):
+        return hash(self._c_value)
+
+    @property
+    def context(self):
+        """
+        Return the context that owns this unit.
+        """
+        return self._context_link
+
+    def reparse(self, buffer=None, charset=None):
+        """
+        Reparse an analysis unit from a buffer, if provided, or from the
+        original file otherwise. If ``Charset`` is empty or ``None``, use the
+        last charset successfuly used for this unit, otherwise use it to decode
+        the content of the source file.
+
+        If any failure occurs, such as decoding, lexing or parsing failure,
+        diagnostic are emitted to explain what happened.
+        """
+        charset = _py2to3.text_to_bytes(charset or '')
+        if buffer is None:
+            _unit_reparse_from_file(self._c_value, charset)
+        else:
+            buffer, charset = _canonicalize_buffer(buffer, charset)
+            _unit_reparse_from_buffer(self._c_value, charset, buffer,
+                                      len(buffer))
+
+    def reparse_edit(self, edit_range, text):
+        """
+        Replace the source text in ``Edit_Range`` with ``Text`` and reparse the
+        analysis unit accordingly. The end of ``Edit_Range`` is exclusive, so
+        an empty range inserts ``Text``.
+
+        When the edit changes only trivia (whitespaces, comments, ...), the
+        unit keeps its current tree, so its nodes remain valid. Otherwise, this
+        is equivalent to reparsing the whole edited source buffer.
+
+        Raise a ``PreconditionFailure`` exception if the unit has no source
+        buffer or if ``Edit_Range`` is not a valid source location range for
+        it.
+        """
+        c_edit_range = SlocRange._c_type._unwrap(edit_range)
+        c_text = _text._unwrap(text)
+        _unit_reparse_edit(self._c_value, ctypes.byref(c_edit_range),
+                           ctypes.byref(c_text))
+
+    def populate_lexical_env(self):
+        """
+        Create lexical environments for this analysis unit, according to the
+        specifications given in the language spec.
+
+        If not done before, it will be automatically called during semantic
+        analysis. Calling it before enables one to control where the latency
+        occurs.
+
+        Depending on whether errors are discarded (see
+        ``Discard_Errors_In_Populate_Lexical_Env``), raise a ``Property_Error``
+        on failure.
+        """
+        if not _unit_populate_lexical_env(self._c_value):
+            raise PropertyError()
+
+    @property
+    def root(self):
+        """
+        Return the root node for this unit, or ``None`` if there is none.
+
+        :rtype: PythonNode
+        """
+        result = _Entity_c_type()
+        _unit_root(self._c_value, ctypes.byref(result))
+        return PythonNode._wrap(result)
+
+    @property
+    def first_token(self):
+        """
+        Return a reference to the first token scanned in this unit.
+        """
+        result = Token()
+        _unit_first_token(self._c_value, ctypes.byref(result))
+        return result._wrap()
+
+    @property
+    def last_token(self):
+        """
+        Return a reference to the last token scanned in this unit.
+        """
+        result = Token()
+        _unit_last_token(self._c_value, ctypes.byref(result))
+        return result._wrap()
+
+    @property
+    def text(self):
+        """
+        Return the source buffer associated to this unit.
+        """
+        return Token.text_range(self.first_token, self.last_token)
+
+    @property
+    def token_count(self):
+        """
+        Return the number of tokens in this unit.
+        """
+        return _unit_token_count(self._c_value)
+
+    @property
+    def trivia_count(self):
+        """
+        Return the number of trivias in this unit. This is 0 for units that
+        were parsed with trivia analysis disabled.
+        """
+        return _unit_trivia_count(self._c_value)
+
+    def token_table(self):
+        """
+        Return a columnar representation of all the tokens and trivia in this
+        unit.
+
+        Iterating on tokens one at a time is slow: this computes the data for
+        all tokens in a single native call, which is a lot faster.
+
+        :rtype: TokenTable
+        """
+        c_table = _token_table()
+        _unit_export_tokens(self._c_value, ctypes.byref(c_table))
+        return TokenTable(self, c_table)
+
+    def lookup_token(self, sloc):
+        """
+        Look for a token in this unit that contains the given source location.
+        If this falls before the first token, return the first token. If this
+        falls between two tokens, return the token that appears before. If this
+        falls after the last token, return the last token. If there is no token
+        in this unit, return no token.
+        """
+        unit = AnalysisUnit._unwrap(self)
+        _sloc = Sloc._c_type._unwrap(sloc)
+        tok = Token()
+        _unit_lookup_token(unit, ctypes.byref(_sloc), ctypes.byref(tok))
+        return tok._wrap()
+
+    def _dump_lexical_env(self):
+        """
+        Debug helper: output the lexical envs for the given analysis unit.
+        """
+        unit = AnalysisUnit._unwrap(self)
+        _unit_dump_lexical_env(unit)
+
+    def iter_tokens(self):
+        """
+        Iterator over the tokens in an analysis unit.
+        """
+        return self.TokenIterator(self.first_token)
+
+    @property
+    def filename(self):
+        """
+        Return the filename this unit is associated to.
+        """
+        filename = _unit_filename(self._c_value)
+        return _unwrap_str(filename)
+
+    @property
+    def diagnostics(self):
+        """
+        Diagnostics for this unit.
+        """
+        count = _unit_diagnostic_count(self._c_value)
+        result = []
+        diag = Diagnostic._c_type()
+        for i in range(count):
+            assert _unit_diagnostic(self._c_value, i, ctypes.byref(diag))
+            result.append(diag._wrap())
+        return result
+
+    def __repr__(self):
+        return '<AnalysisUnit {}>'.format(repr(
+            os.path.basename(self.filename)
+        ))
+
+    class _c_struct(ctypes.Structure):
+        _fields_ = [('unit_version', ctypes.c_uint64)]
+    _c_type = _hashable_c_pointer(_c_struct)
+
+    @classmethod
+    def _wrap(cls, c_value):
+        if not c_value:
+            return None
+
+        # Invalidate the unit cache if needed, then look for an existing
+        # wrapper for this unit.
+        context = cls._context(c_value)
+        context._check_unit_cache()
+
+        try:
+            return context._unit_cache[c_value]
+        except KeyError:
+            return cls(context, c_value)
+
+    @classmethod
+    def _unwrap(cls, value):
+        if value is None:
+            return value
+        elif not isinstance(value, cls):
+            _raise_type_error(cls.__name__, value)
+        else:
+            return value._c_value
+
+    @classmethod
+    def _context(cls, c_value):
+        ctx = _unit_context(c_value)
+        return AnalysisContext._wrap(ctx)
+
+    @property
+    def _unit_version(self):
+        return self._c_value.contents.unit_version
+
+    def _check_node_cache(self):
+        """
+        If this unit has been reparsed, invalidate its node cache.
+        """
+        if self._cache_version_number != self._unit_version:
+            self._node_cache = {}
+            self._cache_version_number = self._unit_version
+
+
+class Sloc(object):
+    """
+    Location in a source file. Line and column numbers are one-based.
+    """
+
+    def __init__(self, line, column):
+        assert line >= 0 and column >= 0
+        self.line = line
+        self.column = column
+
+    def __bool__(self):
+        return bool(self.line or self.column)
+    __nonzero__ = __bool__
+
+    def __lt__(self, other):
+        # First compare line numbers...
+        if self.line < other.line:
+            return True
+        elif self.line > other.line:
+            return False
+
+        # Past this point, we know that both are on the same line, so now
+        # compare column numbers.
+        else:
+            return self.column < other.column
+
+    def __eq__(self, other):
+        return self.line == other.line and self.column == other.column
+
+    def __hash__(self):
+        return hash((self.line, self.column))
+
+    def __str__(self):
+        return '{}:{}'.format(self.line, self.column)
+
+    def __repr__(self):
+        return '<Sloc {} at {:#x}>'.format(self, id(self))
+
+    class _c_type(ctypes.Structure):
+        _fields_ = [("line", ctypes.c_uint32),
+                    ("column", ctypes.c_uint16)]
+
+        def _wrap(self):
+            return Sloc(self.line, self.column)
+
+        @classmethod
+        def _unwrap(cls, sloc):
+            return cls(sloc.line, sloc.column)
+
+
+class SlocRange(object):
+    """
+    Location of a span of text in a source file.
+    """
+
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+
+    def __bool__(self):
+        return bool(self.start or self.end)
+    __nonzero__ = __bool__
+
+    def __lt__(self, other):
+        raise NotImplementedError('SlocRange comparison not supported')
+
+    def __eq__(self, other):
+        return self.start == other.start and self.end == other.end
+
+    def __hash__(self):
+        return hash((self.start, self.end))
+
+    def __str__(self):
+        return '{}-{}'.format(self.start, self.end)
+
+    def __repr__(self):
+        return "<SlocRange {}:{}-{}:{}>".format(
+            self.start.line, self.start.column,
+            self.end.line, self.end.column
+        )
+
+
+    class _c_type(ctypes.Structure):
+        _fields_ = [("start", Sloc._c_type),
+                    ("end", Sloc._c_type)]
+
+        def _wrap(self):
+            return SlocRange(self.start._wrap(), self.end._wrap())
+
+        @classmethod
+        def _unwrap(cls, sloc_range):
+            return cls(Sloc._c_type._unwrap(sloc_range.start),
+                       Sloc._c_type._unwrap(sloc_range.end))
+
+
+class Diagnostic(object):
+    """
+    Diagnostic for an analysis unit: cannot open the source file, parsing
+    error, ...
+    """
+
+    def __init__(self, sloc_range, message):
+        self.sloc_range = sloc_range
+        self.message = message
+
+    @property
+    def as_text(self):
+        return (u'{}: {}'.format(self.sloc_range, self.message)
+                if self.sloc_range else
+                self.message)
+
+    def __str__(self):
+        result = self.as_text
+        if _py2to3.python2:
+            result = result.encode('ascii', errors='replace')
+        return result
+
+    def __repr__(self):
+        return '<Diagnostic {}>'.format(self)
+
+
+    class _c_type(ctypes.Structure):
+        _fields_ = [('sloc_range', SlocRange._c_type),
+                    ('message', _text)]
+
+        def _wrap(self):
+            return Diagnostic(self.sloc_range._wrap(), self.message._wrap())
+
+
+class Token(ctypes.Structure):
+    """
+    Reference to a token in an analysis unit.
+    """
+
+    _tdh_c_type = _hashable_c_pointer()
+
+    _fields_ = [('_token_data',   _tdh_c_type),
+                ('_token_index',  ctypes.c_int),
+                ('_trivia_index', ctypes.c_int),
+                ('_kind',         ctypes.c_int),
+                ('_text',         _text),
+                ('_sloc_range',   SlocRange._c_type)]
+
+    def _wrap(self):
+        return self if self._token_data else None
+
+    @staticmethod
+    def _check_token(value):
+        if not isinstance(value, Token):
+            raise TypeError('invalid token: {}'.format(value))
+
+    def _check_same_unit(self, other):
+        if self._token_data != other._token_data:
+            raise ValueError('{} and {} come from different analysis units'
+                             .format(self, other))
+
+    @property
+    def next(self):
+        """
+        Return a reference to the next token in the corresponding analysis
+        unit.
+        """
+        t = Token()
+        _token_next(ctypes.byref(self), ctypes.byref(t))
+        return t._wrap()
+
+    @property
+    def previous(self):
+        """
+        Return a reference to the previous token in the corresponding analysis
+        unit.
+        """
+        t = Token()
+        _token_previous(ctypes.byref(self), ctypes.byref(t))
+        return t._wrap()
+
+    def range_until(self, other):
+        """
+        Return an iterator on the list of tokens that spans between `self` and
+        `other` (included). This returns an empty list if the first token
+        appears after the other one in the source code. Raise a ``ValueError``
+        if both tokens come from different analysis units.
+        """
+        self._check_token(other)
+        self._check_same_unit(other)
+
+        # Keep the generator as a nested function so that the above checks are
+        # executed when the generator is created, instead of only when its
+        # first item is requested.
+        def generator():
+            if other < self:
+                return
+
+            yield self
+            current = self
+            while current < other:
+                current = current.next
+                yield current
+        return generator()
+
+    def is_equivalent(self, other):
+        """
+        Return whether ``L`` and ``R`` are structurally equivalent tokens. This
+        means that their position in the stream won't be taken into account,
+        only the kind and text of the token.
+        """
+        self._check_token(other)
+        return bool(_token_is_equivalent(
+            ctypes.byref(self), ctypes.byref(other))
+        )
+
+    @property
+    def kind(self):
+        """
+        Kind for this token.
+        """
+        name = _token_kind_name(self._kind)
+        # The _token_kind_name wrapper is already supposed to handle exceptions
+        # so this should always return a non-null value.
+        assert name
+        return _unwrap_str(name)
+
+    @property
+    def is_trivia(self):
+        """
+        Return whether this token is a trivia. If it's not, it's a regular
+        token.
+        """
+        return self._trivia_index != 0
+
+    @property
+    def index(self):
+        """
+        Zero-based index for this token/trivia. Tokens and trivias get their
+        own index space.
+        """
+        return (self._token_index - 1
+                if self._trivia_index == 0 else
+                self._trivia_index - 1)
+
+    @property
+    def text(self):
+        """
+        Return the text of the given token.
+        """
+        return self._text._wrap()
+
+    @classmethod
+    def text_range(cls, first, last):
+        """
+        Compute the source buffer slice corresponding to the text that spans
+        between the ``First`` and ``Last`` tokens (both included). This yields
+        an empty slice if ``Last`` actually appears before ``First``.
+
+        This raises a ``ValueError`` if ``First`` and ``Last`` don't belong to
+        the same analysis unit.
+        """
+        cls._check_token(first)
+        cls._check_token(last)
+        first._check_same_unit(last)
+        result = _text()
+        assert _token_range_text(ctypes.byref(first), ctypes.byref(last),
+                                 ctypes.byref(result))
+        return result._wrap() or u''
+
+    @property
+    def sloc_range(self):
+        """
+        Return the source location range of the given token.
+        """
+        return self._sloc_range._wrap()
+
+    def __eq__(self, other):
+        """
+        Return whether the two tokens refer to the same token in the same unit.
+
+        Note that this does not actually compares the token data.
+        """
+        return (isinstance(other, Token)
+                and self._identity_tuple == other._identity_tuple)
+
+    def __hash__(self):
+        return hash(self._identity_tuple)
+
+    def __repr__(self):
+        return '<Token {}{} at {}>'.format(
+            self.kind,
+            ' {}'.format(_py2to3.text_repr(self.text)) if self.text else '',
+            self.sloc_range
+        )
+
+    def __lt__(self, other):
+        """
+        Consider that None comes before all tokens. Then, sort by unit, token
+        index, and trivia index.
+        """
+
+        # None always comes first
+        if other is None:
+            return False
+
+        self._check_token(other)
+        self._check_same_unit(other)
+        return self._identity_tuple < other._identity_tuple
+
+    def __le__(self, other):
+        return self == other or self < other
+
+    def __gt__(self, other):
+        return not (self <= other)
+
+    def __ge__(self, other):
+        return not (self < other)
+
+    def to_data(self):
+        """
+        Return a dict representation of this Token.
+        """
+        return {"kind": "Token", "token_kind": self.kind, "text": self.text}
+
+    @property
+    def _identity_tuple(self):
+        """
+        Return a tuple that return a tuple that contains "identity" information
+        for this token. Think of it as a database primary key.
+
+        This property is for internal use only.
+        """
+        return (self._token_data, self._token_index, self._trivia_index)
+
+
+class UnitProvider(object):
+    """
+    Interface to fetch analysis units from a name and a unit kind.
+
+    The unit provider mechanism provides an abstraction which assumes that to
+    any couple (unit name, unit kind) we can associate at most one source file.
+    This means that several couples can be associated to the same source file,
+    but on the other hand, only one one source file can be associated to a
+    couple.
+
+    This is used to make the semantic analysis able to switch from one analysis
+    units to another.
+    """
+
+    def __init__(self, c_value):
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly.
+        """
+        self._c_value = c_value
+
+    def __del__(self):
+        _dec_ref_unit_provider(self._c_value)
+
+
+
+
+
+class PythonNode(object):
+    """
+    """
+
+    is_list_type = False
+    __slots__ = ('_unprotected_c_value', '_node_c_value', '_metadata',
+                 '_rebindings', '_unprotected_getitem_cache', '_unit',
+                 '_unit_version')
+
+    
+    
+
+    
+    @property
+    def parent(self):
+        """
+        Return the lexical parent for this node. Return null for the root AST
+        node or for AST nodes for which no one has a reference to the parent.
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _python_node_parent)
+        result = PythonNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def parents(self):
+        """
+        Return an array that contains the lexical parents (this node included).
+        Nearer parents are first in the list.
+
+        :rtype: List[PythonNode]
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_PythonNodeArrayConverter.c_type(), _python_node_parents)
+        result = _PythonNodeArrayConverter.wrap(c_result, False)
+
+
+        return result
+    
+    @property
+    def children(self):
+        """
+        Return an array that contains the direct lexical children.
+
+        :rtype: List[PythonNode]
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_PythonNodeArrayConverter.c_type(), _python_node_children)
+        result = _PythonNodeArrayConverter.wrap(c_result, False)
+
+
+        return result
+    
+    @property
+    def token_start(self):
+        """
+        Return the first token used to parse this node.
+
+        :rtype: Token
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(Token(), _python_node_token_start)
+        result = c_result
+
+
+        return result
+    
+    @property
+    def token_end(self):
+        """
+        Return the last token used to parse this node.
+
+        :rtype: Token
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(Token(), _python_node_token_end)
+        result = c_result
+
+
+        return result
+    
+    @property
+    def child_index(self):
+        """
+        Return the 0-based index for Node in its parent's children.
+
+        :rtype: int
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(ctypes.c_int(), _python_node_child_index)
+        result = c_result.value
+
+
+        return result
+    
+    @property
+    def previous_sibling(self):
+        """
+        Return the node's previous sibling, if there is one.
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _python_node_previous_sibling)
+        result = PythonNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def next_sibling(self):
+        """
+        Return the node's next sibling, if there is one.
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_Entity_c_type(), _python_node_next_sibling)
+        result = PythonNode._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def unit(self):
+        """
+        Return the analysis unit owning this node.
+
+        :rtype: AnalysisUnit
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(AnalysisUnit._c_type(), _python_node_unit)
+        result = AnalysisUnit._wrap(c_result)
+
+
+        return result
+    
+    @property
+    def is_ghost(self):
+        """
+        Return whether the node is a ghost.
+
+        Unlike regular nodes, ghost nodes cover no token in the input source:
+        they are logically located instead between two tokens. The
+        "token_first" of all ghost nodes is the token right after this logical
+        position, while they have no "token_last".
+
+        :rtype: bool
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(ctypes.c_uint8(), _python_node_is_ghost)
+        result = bool(c_result.value)
+
+
+        return result
+    
+    @property
+    def full_sloc_image(self):
+        """
+        Return a string containing the filename + the sloc in GNU conformant
+        format. Useful to create diagnostics from a node.
+
+        :rtype: str
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(_TextTypeConverter.c_type(), _python_node_full_sloc_image)
+        result = _TextTypeConverter.wrap(c_result, False)
+
+
+        return result
+
+    _field_names = () + (
+    )
+
+
+
+
+    def __init__(self, c_value, node_c_value, metadata, rebindings,
+                 unit=None):
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly. For now, the creation of AST nodes can happen only as
+        part of the parsing of an analysis unit.
+        """
+
+        self._unprotected_c_value = c_value
+
+        # Access to these fields is unprotected from stale references, but it
+        # is supposed to be used only in _id_tuple, which itself should not be
+        # used outside of hashing/equality use cases.
+        self._node_c_value = node_c_value
+        self._rebindings = rebindings
+        self._metadata = metadata
+
+        self._unprotected_getitem_cache = {}
+        """
+        Cache for the __getitem__ override.
+
+        :type: dict[int, PythonNode]
+        """
+
+        # Information to check before accessing node data that it is still
+        # valid.
+        self._unit = (unit if unit is not None
+                      else self._fetch_unit(c_value))
+        self._unit_version = self._unit._unit_version
+
+    def _check_stale_reference(self):
+        # We have a reference to the owning unit, so there is no need to
+        # check that the unit and the context are still valid. Just check that
+        # the unit has not been reparsed.
+        if self._unit._unit_version != self._unit_version:
+            raise StaleReferenceError()
+
+    @property
+    def _c_value(self):
+        self._check_stale_reference()
+        return self._unprotected_c_value
+
+    @property
+    def _getitem_cache(self):
+        self._check_stale_reference()
+        return self._unprotected_getitem_cache
+
+    @property
+    def _id_tuple(self):
+        return (self._node_c_value, self._rebindings)
+
+    def __eq__(self, other):
+        return (isinstance(other, PythonNode) and
+                self._id_tuple == other._id_tuple)
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self._id_tuple)
+
+    @property
+    def kind_name(self):
+        """
+        Return the kind of this node.
+        """
+        return self._kind_name
+
+    @property
+    def is_token_node(self):
+        """
+        Return whether this node is a node that contains only a single token.
+        """
+        node = self._unwrap(self)
+        return bool(_node_is_token_node(ctypes.byref(node)))
+
+    @property
+    def is_synthetic(self):
+        """
+        Return whether this node is synthetic.
+        """
+        node = self._unwrap(self)
+        return bool(_node_is_synthetic(ctypes.byref(node)))
+
+    @property
+    def sloc_range(self):
+        """
+        Return the spanning source location range for this node.
+
+        Note that this returns the sloc of the parent for synthetic nodes.
+        """
+        node = self._unwrap(self)
+        result = SlocRange._c_type()
+        _node_sloc_range(ctypes.byref(node), ctypes.byref(result))
+        return result._wrap()
+
+    @property
+    def text(self):
+        """
+        Return the source buffer slice corresponding to the text that spans
+        between the first and the last tokens of this node.
+
+        Note that this returns the empty string for synthetic nodes.
+        """
+        node = self._unwrap(self)
+        result = _text()
+        _node_text(ctypes.byref(node), ctypes.byref(result))
+        return result._wrap()
+
+    @property
+    def image(self):
+        """
+        Return a representation of this node as a string.
+        """
+        c_node = self._unwrap(self)
+        c_result = _text()
+        _node_image(ctypes.byref(c_node), ctypes.byref(c_result))
+        return c_result._wrap()
+
+    def lookup(self, sloc):
+        """
+        Return the bottom-most node from in ``Node`` and its children which
+        contains ``Sloc``, or ``None`` if there is none.
+        """
+        node = self._unwrap(self)
+        c_sloc = Sloc._c_type._unwrap(sloc)
+        result = _Entity_c_type()
+        _lookup_in_node(ctypes.byref(node), ctypes.byref(c_sloc),
+                        ctypes.byref(result))
+        return PythonNode._wrap(result)
+
+    def __bool__(self):
+        """
+        Return always True so that checking a node against None can be done as
+        simply as::
+
+        if node: ...
+        """
+        return True
+    __nonzero__ = __bool__
+
+    def __iter__(self):
+        """
+        Return an iterator on the children of this node.
+        """
+        for i in range(len(self)):
+            yield self[i]
+
+    def __len__(self):
+        """
+        Return the number of PythonNode children this node has.
+        """
+        node = self._unwrap(self)
+        return _node_children_count(ctypes.byref(node))
+
+    def __getitem__(self, key):
+        """
+        Return the Nth PythonNode child this node has.
+
+        This handles negative indexes the same way Python lists do. Raise an
+        IndexError if "key" is out of range.
+        """
+        if not isinstance(key, int):
+            msg = ('PythonNode children are integer-indexed'
+                   ' (got {})').format(type(key))
+            raise TypeError(msg)
+
+        if key < 0:
+            key += len(self)
+
+        if key in self._getitem_cache:
+            return self._getitem_cache[key]
+
+        node = self._unwrap(self)
+        result = _Entity_c_type()
+        success = _node_child(ctypes.byref(node), key, ctypes.byref(result))
+        if not success:
+            raise IndexError('child index out of range')
+        else:
+            result = PythonNode._wrap(result)
+            self._getitem_cache[key] = result
+            return result
+
+    def iter_fields(self):
+        """
+        Iterate through all the fields this node contains.
+
+        Return an iterator that yields (name, value) couples for all abstract
+        fields in this node. If "self" is a list, field names will be
+        "item_{n}" with "n" being the index.
+        """
+        if self.is_list_type:
+            for i, value in enumerate(self):
+                yield ('item_{}'.format(i), value)
+        else:
+            for field_name in self._field_names:
+                yield (field_name, getattr(self, '{}'.format(field_name)))
+
+    def export_tree(self):
+        """
+        Return a flat representation of the sub-tree rooted at this node.
+
+        Traversing a big tree one node at a time is slow: this computes the
+        data for all nodes in a single native call, which is a lot faster.
+
+        :rtype: NodeTree
+        """
+        node = self._unwrap(self)
+        c_tree = _node_tree()
+        _node_export_tree(ctypes.byref(node), ctypes.byref(c_tree))
+        return NodeTree(self, c_tree)
+
+    def dump_str(self):
+        """
+        Dump the sub-tree to a string in a human-readable format.
+        """
+        output = _py2to3.StringIO()
+        self.dump(file=output)
+        ret = output.getvalue()
+        output.close()
+        return ret
+
+    def dump(self, indent='', file=sys.stdout):
+        """
+        Dump the sub-tree in a human-readable format on the given file.
+
+        :param str indent: Prefix printed on each line during the dump. :param
+        file file: File in which the dump must occur.
+        """
+
+        def print_node(name, value):
+            if isinstance(value, PythonNode):
+                print('{}{}:'.format(indent, name), file=file)
+                value.dump(indent + '  ', file)
+            else:
+                print('{}{}: {}'.format(indent, name, value), file=file)
+
+        erepr = self.entity_repr[1:-1]
+        print('{}{}{}'.format(
+            indent, erepr,
+            ': {}'.format(self.text) if self.is_token_node else ''
+        ), file=file)
+        indent = indent + '|'
+        if self.is_list_type:
+            for i, value in enumerate(self):
+                print_node("item_{}".format(i), value)
+        else:
+            for name, value in self.iter_fields():
+                # Remove the f_ prefix to have the same behavior as the Ada
+                # dumper.
+                print_node(name[2:], value)
+
+    def findall(self, ast_type_or_pred, **kwargs):
+        """
+        Helper for finditer that will return all results as a list. See
+        finditer's documentation for more details.
+        """
+        return list(self.finditer(ast_type_or_pred, **kwargs))
+
+    def find(self, ast_type_or_pred, **kwargs):
+        """
+        Helper for finditer that will return only the first result. See
+        finditer's documentation for more details.
+        """
+        try:
+            return next(self.finditer(ast_type_or_pred, **kwargs))
+        except StopIteration:
+            return None
+
+    def finditer(self, ast_type_or_pred, **kwargs):
+        """
+        Find every node corresponding to the passed predicates.
+
+        :param ast_type_or_pred: If supplied with a subclass of PythonNode,
+        will constrain the resulting collection to only the instances of this
+        type or any subclass. If supplied with a predicate, it will apply the
+        predicate on every node and keep only the ones for which it returns
+        True. If supplied with a list of subclasses of PythonNode, it will
+        match all instances of any of them. :type ast_type_or_pred:
+        type|((PythonNode) -> bool)|list[type]
+
+        :param kwargs: Allows the user to filter on attributes of the node. For
+        every key value association, if the node has an attribute of name key
+        that has the specified value, then the child is kept. :type kwargs:
+        dict[str, Any]
+        """
+        # Create a "pred" function to use as the node filter during the
+        # traversal.
+        if isinstance(ast_type_or_pred, type):
+            sought_type = ast_type_or_pred
+            pred = lambda node: isinstance(node, sought_type)
+        elif isinstance(ast_type_or_pred, collections.Sequence):
+            sought_types = ast_type_or_pred
+            pred = lambda node: isinstance(node, tuple(sought_types))
+        else:
+            pred = ast_type_or_pred
+
+        def match(left, right):
+            """
+            :param left: Node child to match.
+            :param right: Matcher, coming from ``kwargs``.
+            """
+            if left is None:
+                return
+            if hasattr(left, "match"):
+                return left.match(right)
+            else:
+                return left == right
+
+        def helper(node):
+            for child in node:
+                if child is not None:
+                    if pred(child):
+                        if not kwargs:
+                            yield child
+                        elif all([match(getattr(child, key, None), val)
+                                  for key, val in kwargs.items()]):
+                            yield child
+                    for c in helper(child):
+                        if c is not None:
+                            yield c
+
+        return helper(self)
+
+    @property
+    def parent_chain(self):
+        """
+        Return the parent chain of self. Self will be the first element,
+        followed by the first parent, then this parent's parent, etc.
+        """
+        def _parent_chain(node):
+            yield node
+            if node.parent is not None:
+                for p in _parent_chain(node.parent):
+                    yield p
+
+        return list(_parent_chain(self))
+
+    def __repr__(self):
+        return self.image
+
+    @property
+    def entity_repr(self):
+        c_value = self._unwrap(self)
+        c_result = _text()
+        _entity_image(ctypes.byref(c_value), ctypes.byref(c_result))
+        return c_result._wrap()
+
+    @property
+    def tokens(self):
+        """
+        Return an iterator on the range of tokens that self encompasses.
+        """
+        start = self.token_start
+        end = self.token_end
+        while not start == end:
+            yield start
+            start = start.next
+        yield end
+
+    def to_data(self):
+        """
+        Return a nested python data-structure, constituted only of standard
+        data types (dicts, lists, strings, ints, etc), and representing the
+        portion of the AST corresponding to this node.
+        """
+        if self.is_list_type:
+            return [i.to_data() for i in self if i is not None]
+        else:
+            return {n: v.to_data()
+                    for n, v in self.iter_fields()
+                    if v is not None}
+
+    def to_json(self):
+        """
+        Return a JSON representation of this node.
+        """
+        return json.dumps(self.to_data())
+
+    def is_a(self, *types):
+        """
+        Shortcut for isinstance(self, types).
+        :rtype: bool
+        """
+        return isinstance(self, tuple(types))
+
+    def cast(self, typ):
+        """
+        Fluent interface style method. Return ``self``, raise an error if self
+        is not of type ``typ``.
+
+        :type typ: () -> T
+        :rtype: T
+        """
+        assert isinstance(self, typ)
+        return self
+
+    _node_c_type = _hashable_c_pointer()
+
+    @classmethod
+    def _wrap(cls, c_value):
+        """
+        Internal helper to wrap a low-level entity value into an instance of
+        the the appropriate high-level Python wrapper subclass.
+        """
+        node_c_value = c_value.node
+        if not node_c_value:
+            return None
+
+        rebindings = c_value.info.rebindings
+        metadata = c_value.info.md
+
+        # Look for an already existing wrapper for this node
+        cache_key = (node_c_value, metadata, rebindings)
+        unit = cls._fetch_unit(c_value)
+        unit._check_node_cache()
+        try:
+            return unit._node_cache[cache_key]
+        except KeyError:
+            pass
+
+        # Pick the right subclass to materialize this node in Python
+        kind = _node_kind(ctypes.byref(c_value))
+        result = _kind_to_astnode_cls[kind](c_value, node_c_value, metadata,
+                                            rebindings, unit)
+        unit._node_cache[cache_key] = result
+        return result
+
+    @classmethod
+    def _wrap_bare_node(cls, c_value):
+        return cls._wrap(_Entity_c_type.from_bare_node(c_value))
+
+    @classmethod
+    def _unwrap(cls, py_value):
+        """
+        Internal helper to unwrap a high-level ASTNode instance into a
+        low-level value. Raise a TypeError if the input value has unexpected
+        type.
+        """
+        if py_value is None:
+            return _Entity_c_type._null_value
+        elif not isinstance(py_value, PythonNode):
+            _raise_type_error('PythonNode', py_value)
+        else:
+            return py_value._c_value
+
+    @property
+    def _unwrap_einfo(self):
+        return self._c_value.info
+
+    @classmethod
+    def _fetch_unit(cls, c_value):
+        return AnalysisUnit._wrap(_node_unit(ctypes.byref(c_value)))
+
+    def _eval_field(self, c_result, c_accessor, *c_args):
+        """
+        Internal helper to evaluate low-level field accessors/properties.
+
+        This calls "c_accessor" on this node with the input arguments and puts
+        the result in "c_result". This raises a PropertyError if the evaluation
+        failed. Return "c_result" for convenience.
+        """
+        args = (self._unwrap(self), ) + c_args + (ctypes.byref(c_result), )
+        if not c_accessor(*args):
+            raise PropertyError()
+        return c_result
+
+    def _eval_astnode_field(self, c_accessor):
+        """
+        Internal helper. Wrapper around _eval_field for fields that return an
+        AST node and that accept no explicit argument. This is useful as it's
+        the most common case of field, so using this wrapper reduces generated
+        code length.
+        """
+        c_result = self._eval_field(_Entity_c_type(), c_accessor)
+        node_c_value = c_result.node
+        if not node_c_value:
+            return None
+
+        # Fast path: such fields most often return nodes that belong to the
+        # same unit as this node. Look for an existing wrapper in this unit's
+        # node cache first, which saves the native calls that _wrap needs to
+        # fetch the unit of the result. Node addresses are unique among live
+        # nodes, so a cache hit is necessarily the right node.
+        unit = self._unit
+        unit._check_node_cache()
+        cache_key = (node_c_value, c_result.info.md, c_result.info.rebindings)
+        try:
+            return unit._node_cache[cache_key]
+        except KeyError:
+            return PythonNode._wrap(c_result)
+
+
+class _node_tree(ctypes.Structure):
+    """
+    C value for flat trees of nodes. See ``NodeTree``.
+    """
+    _fields_ = [('count', ctypes.c_int),
+                ('nodes', ctypes.c_void_p),
+                ('kinds', ctypes.c_void_p),
+                ('parents', ctypes.c_void_p),
+                ('children_counts', ctypes.c_void_p),
+                ('token_starts', ctypes.c_void_p),
+                ('token_ends', ctypes.c_void_p),
+                ('start_lines', ctypes.c_void_p),
+                ('start_columns', ctypes.c_void_p),
+                ('end_lines', ctypes.c_void_p),
+                ('end_columns', ctypes.c_void_p)]
+
+
+class _ColumnarData(object):
+    """
+    Base class for wrappers of columnar data that the C API allocates in a
+    single memory block: ``NodeTree`` and ``TokenTable``.
+    """
+
+    _columns = []
+    """
+    Name, ctypes element type and memoryview format for each column, in memory
+    order: the last column ends the memory block.
+    """
+
+    def _init_columns(self, c_value, first_field, destroy):
+        """
+        Expose all columns in ``c_value`` as memoryview attributes.
+
+        :param c_value: C value that the C API filled.
+        :param str first_field: Name of the ``c_value`` field for the data
+            that starts the memory block.
+        :param destroy: C API function to free the memory block.
+        """
+        self._count = count = c_value.count
+
+        # Wrap the memory block in a single ctypes array, and free the block
+        # only when this array is garbage collected, i.e. when this wrapper
+        # and all its columns are.
+        base = getattr(c_value, first_field) or 0
+        last_name, last_type, _ = self._columns[-1]
+        size = (
+            (getattr(c_value, last_name) + ctypes.sizeof(last_type) * count
+             - base)
+            if count else 0
+        )
+        self._block = (ctypes.c_char * size).from_address(base)
+        weakref.finalize(self._block, destroy, ctypes.byref(c_value))
+
+        memory = memoryview(self._block).cast('B')
+        for name, c_type, fmt in self._columns:
+            offset = (getattr(c_value, name) or base) - base
+            column = memory[offset:offset + ctypes.sizeof(c_type) * count]
+            setattr(self, name, column.cast(fmt))
+
+    def __len__(self):
+        return self._count
+
+
+class NodeTree(_ColumnarData):
+    """
+    Flat representation of a tree of nodes, as computed by the
+    ``PythonNode.export_tree`` method.
+
+    Nodes are stored in prefix depth-first order, so the root node comes first,
+    and the children of each node come right after it. Null children are
+    skipped. Node data is available as columns: for each column attribute, the
+    Nth item contains the corresponding data for the Nth node. Columns are
+    memoryview objects that reference native memory without copying it, so they
+    can be used in vectorized processing (for instance with
+    ``numpy.frombuffer``). Columns are:
+
+    * ``kinds``: integer kind for each node (see ``PythonNode.kind_name``).
+
+    * ``parents``: index of the parent node (-1 for the root node).
+
+    * ``children_counts``: number of non-null children.
+
+    * ``token_starts``/``token_ends``: indexes of the first and last tokens for
+    each node. Token end is 0 for ghost nodes.
+
+    * ``start_lines``/``start_columns``/``end_lines``/``end_columns``: source
+    location ranges for each node.
+    """
+
+    _columns = [('kinds', ctypes.c_int, 'i'),
+                ('parents', ctypes.c_int, 'i'),
+                ('children_counts', ctypes.c_int, 'i'),
+                ('token_starts', ctypes.c_int, 'i'),
+                ('token_ends', ctypes.c_int, 'i'),
+                ('start_lines', ctypes.c_uint32, 'I'),
+                ('start_columns', ctypes.c_uint16, 'H'),
+                ('end_lines', ctypes.c_uint32, 'I'),
+                ('end_columns', ctypes.c_uint16, 'H')]
+    """
+    Name, ctypes element type and memoryview format for each column.
+    """
+
+    def __init__(self, root, c_value):
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly. Use ``PythonNode.export_tree`` instead.
+        """
+        self._root = root
+
+        # The memory block starts with nodes, followed by all columns
+        self._init_columns(c_value, 'nodes', _destroy_node_tree)
+        self._nodes = (
+            (PythonNode._node_c_type * self._count)
+            .from_address(ctypes.addressof(self._block))
+        )
+
+    def node(self, index):
+        """
+        Return the node at the given index in this tree.
+
+        :param int index: Index of the node to return. :rtype: PythonNode
+        """
+        return PythonNode._wrap(_Entity_c_type(
+            self._nodes[index], self._root._unwrap_einfo
+        ))
+
+    def kind_name(self, index):
+        """
+        Return the kind name for the node at the given index in this tree.
+
+        :param int index: Index of the node. :rtype: str
+        """
+        return _kind_to_astnode_cls[self.kinds[index]]._kind_name
+
+
+class _token_table(ctypes.Structure):
+    """
+    C value for columnar token streams. See ``TokenTable``.
+    """
+    _fields_ = [('count', ctypes.c_int),
+                ('kinds', ctypes.c_void_p),
+                ('start_offsets', ctypes.c_void_p),
+                ('end_offsets', ctypes.c_void_p),
+                ('start_lines', ctypes.c_void_p),
+                ('end_lines', ctypes.c_void_p),
+                ('start_columns', ctypes.c_void_p),
+                ('end_columns', ctypes.c_void_p),
+                ('is_trivia', ctypes.c_void_p)]
+
+
+class TokenTable(_ColumnarData):
+    """
+    Columnar representation of the stream of tokens and trivia in an analysis
+    unit, as computed by the ``AnalysisUnit.token_table`` method.
+
+    Tokens and trivia are stored in the same order as in the source. Token data
+    is available as columns: for each column attribute, the Nth item contains
+    the corresponding data for the Nth token or trivia. Columns are memoryview
+    objects that reference native memory without copying it, so they can be
+    used in vectorized processing (for instance with ``numpy.frombuffer``).
+    Columns are:
+
+    * ``kinds``: integer kind for each token (see ``kind_name``).
+
+    * ``start_offsets``/``end_offsets``: 0-based indexes in the unit text of
+    the first character of each token and of the character that follows the
+    last one.
+
+    * ``start_lines``/``start_columns``/``end_lines``/``end_columns``: source
+    location ranges for each token.
+
+    * ``is_trivia``: 1 for trivia, 0 for regular tokens.
+    """
+
+    _columns = [('kinds', ctypes.c_int, 'i'),
+                ('start_offsets', ctypes.c_int, 'i'),
+                ('end_offsets', ctypes.c_int, 'i'),
+                ('start_lines', ctypes.c_uint32, 'I'),
+                ('end_lines', ctypes.c_uint32, 'I'),
+                ('start_columns', ctypes.c_uint16, 'H'),
+                ('end_columns', ctypes.c_uint16, 'H'),
+                ('is_trivia', ctypes.c_uint8, 'B')]
+    """
+    Name, ctypes element type and memoryview format for each column.
+    """
+
+    def __init__(self, unit, c_value):
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly. Use ``AnalysisUnit.token_table`` instead.
+        """
+        self._unit = unit
+        self._init_columns(c_value, 'kinds', _destroy_token_table)
+
+    def kind_name(self, index):
+        """
+        Return the kind name for the token at the given index in this table.
+
+        :param int index: Index of the token. :rtype: str
+        """
+        return _unwrap_str(_token_kind_name(self.kinds[index]))
+
+
+
+
+class Arg(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNode._field_names + (
+    )
+
+
+
+
+
+
+
+class ArgAssoc(Arg):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_name(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_arg_assoc_f_name)
+
+
+
+        return result
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_arg_assoc_f_expr)
+
+
+
+        return result
+
+    _field_names = Arg._field_names + (
+        "f_name",
+        "f_expr",
+    )
+
+    _kind_name = 'ArgAssoc'
+
+
+
+
+
+
+class ArgGen(Arg):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_arg_gen_f_expr)
+
+
+
+        return result
+    
+    @property
+    def f_comprehension(self):
+        """
+        :rtype: CompFor
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_arg_gen_f_comprehension)
+
+
+
+        return result
+
+    _field_names = Arg._field_names + (
+        "f_expr",
+        "f_comprehension",
+    )
+
+    _kind_name = 'ArgGen'
+
+
+
+
+
+
+class KwArgs(Arg):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_kw_args_f_expr)
+
+
+
+        return result
+
+    _field_names = Arg._field_names + (
+        "f_expr",
+    )
+
+    _kind_name = 'KwArgs'
+
+
+
+
+
+
+class VarArgs(Arg):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_var_args_f_expr)
+
+
+
+        return result
+
+    _field_names = Arg._field_names + (
+        "f_expr",
+    )
+
+    _kind_name = 'VarArgs'
+
+
+
+
+
+
+class AsNameNode(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_imported(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_as_name_node_f_imported)
+
+
+
+        return result
+    
+    @property
+    def f_as_name(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_as_name_node_f_as_name)
+
+
+
+        return result
+
+    _field_names = PythonNode._field_names + (
+        "f_imported",
+        "f_as_name",
+    )
+
+    _kind_name = 'AsNameNode'
+
+
+
+
+
+
+class CompIf(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_test(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_comp_if_f_test)
+
+
+
+        return result
+    
+    @property
+    def f_comp(self):
+        """
+        This field can contain one of the following nodes:
+
+        * CompIf
+
+        * Comprehension
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_comp_if_f_comp)
+
+
+
+        return result
+
+    _field_names = PythonNode._field_names + (
+        "f_test",
+        "f_comp",
+    )
+
+    _kind_name = 'CompIf'
+
+
+
+
+
+
+class CompOpKind(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNode._field_names + (
+    )
+
+
+
+
+
+
+
+class CompOpKindDiamond(CompOpKind):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = CompOpKind._field_names + (
+    )
+
+    _kind_name = 'CompOpKindDiamond'
+
+
+
+
+
+
+class CompOpKindEq(CompOpKind):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = CompOpKind._field_names + (
+    )
+
+    _kind_name = 'CompOpKindEq'
+
+
+
+
+
+
+class CompOpKindGt(CompOpKind):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = CompOpKind._field_names + (
+    )
+
+    _kind_name = 'CompOpKindGt'
+
+
+
+
+
+
+class CompOpKindGte(CompOpKind):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = CompOpKind._field_names + (
+    )
+
+    _kind_name = 'CompOpKindGte'
+
+
+
+
+
+
+class CompOpKindIn(CompOpKind):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = CompOpKind._field_names + (
+    )
+
+    _kind_name = 'CompOpKindIn'
+
+
+
+
+
+
+class CompOpKindIs(CompOpKind):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = CompOpKind._field_names + (
+    )
+
+    _kind_name = 'CompOpKindIs'
+
+
+
+
+
+
+class CompOpKindIsnot(CompOpKind):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = CompOpKind._field_names + (
+    )
+
+    _kind_name = 'CompOpKindIsnot'
+
+
+
+
+
+
+class CompOpKindLt(CompOpKind):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = CompOpKind._field_names + (
+    )
+
+    _kind_name = 'CompOpKindLt'
+
+
+
+
+
+
+class CompOpKindLte(CompOpKind):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = CompOpKind._field_names + (
+    )
+
+    _kind_name = 'CompOpKindLte'
+
+
+
+
+
+
+class CompOpKindNoteq(CompOpKind):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = CompOpKind._field_names + (
+    )
+
+    _kind_name = 'CompOpKindNoteq'
+
+
+
+
+
+
+class CompOpKindNotin(CompOpKind):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = CompOpKind._field_names + (
+    )
+
+    _kind_name = 'CompOpKindNotin'
+
+
+
+
+
+
+class Comprehension(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNode._field_names + (
+    )
+
+
+
+
+
+
+
+class CompFor(Comprehension):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_exprs(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_comp_for_f_exprs)
+
+
+
+        return result
+    
+    @property
+    def f_target(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_comp_for_f_target)
+
+
+
+        return result
+    
+    @property
+    def f_comp(self):
+        """
+        This field can contain one of the following nodes:
+
+        * CompFor
+
+        * CompIf
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_comp_for_f_comp)
+
+
+
+        return result
+
+    _field_names = Comprehension._field_names + (
+        "f_exprs",
+        "f_target",
+        "f_comp",
+    )
+
+    _kind_name = 'CompFor'
+
+
+
+
+
+
+class CompForL(Comprehension):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_exprs(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_comp_forl_f_exprs)
+
+
+
+        return result
+    
+    @property
+    def f_target(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_comp_forl_f_target)
+
+
+
+        return result
+    
+    @property
+    def f_comp(self):
+        """
+        This field can contain one of the following nodes:
+
+        * CompForL
+
+        * CompIf
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_comp_forl_f_comp)
+
+
+
+        return result
+
+    _field_names = Comprehension._field_names + (
+        "f_exprs",
+        "f_target",
+        "f_comp",
+    )
+
+    _kind_name = 'CompForL'
+
+
+
+
+
+
+class Decorator(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_dec_name(self):
+        """
+        :rtype: Name
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_decorator_f_dec_name)
+
+
+
+        return result
+    
+    @property
+    def f_arg_list(self):
+        """
+        :rtype: ArgList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_decorator_f_arg_list)
+
+
+
+        return result
+
+    _field_names = PythonNode._field_names + (
+        "f_dec_name",
+        "f_arg_list",
+    )
+
+    _kind_name = 'Decorator'
+
+
+
+
+
+
+class DictAssoc(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_key(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_dict_assoc_f_key)
+
+
+
+        return result
+    
+    @property
+    def f_value(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_dict_assoc_f_value)
+
+
+
+        return result
+
+    _field_names = PythonNode._field_names + (
+        "f_key",
+        "f_value",
+    )
+
+    _kind_name = 'DictAssoc'
+
+
+
+
+
+
+class ElsePart(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_statements(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_else_part_f_statements)
+
+
+
+        return result
+
+    _field_names = PythonNode._field_names + (
+        "f_statements",
+    )
+
+    _kind_name = 'ElsePart'
+
+
+
+
+
+
+class ExceptPart(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_as_name(self):
+        """
+        :rtype: AsNameNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_except_part_f_as_name)
+
+
+
+        return result
+    
+    @property
+    def f_statements(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_except_part_f_statements)
+
+
+
+        return result
+
+    _field_names = PythonNode._field_names + (
+        "f_as_name",
+        "f_statements",
+    )
+
+    _kind_name = 'ExceptPart'
+
+
+
+
+
+
+class Expr(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNode._field_names + (
+    )
+
+
+
+
+
+
+
+class AndExpr(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_left(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_and_expr_f_left)
+
+
+
+        return result
+    
+    @property
+    def f_right(self):
+        """
+        This field can contain one of the following nodes:
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_and_expr_f_right)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_left",
+        "f_right",
+    )
+
+    _kind_name = 'AndExpr'
+
+
+
+
+
+
+class AndOp(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_left(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_and_op_f_left)
+
+
+
+        return result
+    
+    @property
+    def f_right(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_and_op_f_right)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_left",
+        "f_right",
+    )
+
+    _kind_name = 'AndOp'
+
+
+
+
+
+
+class BinOp(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_left(self):
+        """
+        This field can contain one of the following nodes:
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_bin_op_f_left)
+
+
+
+        return result
+    
+    @property
+    def f_op(self):
+        """
+        :rtype: Op
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_bin_op_f_op)
+
+
+
+        return result
+    
+    @property
+    def f_right(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ArithExpr
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * Term
+
+        * TupleLit
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_bin_op_f_right)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_left",
+        "f_op",
+        "f_right",
+    )
+
+
+
+
+
+
+
+class ArithExpr(BinOp):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = BinOp._field_names + (
+    )
+
+    _kind_name = 'ArithExpr'
+
+
+
+
+
+
+class ShiftExpr(BinOp):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = BinOp._field_names + (
+    )
+
+    _kind_name = 'ShiftExpr'
+
+
+
+
+
+
+class Term(BinOp):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = BinOp._field_names + (
+    )
+
+    _kind_name = 'Term'
+
+
+
+
+
+
+class CallExpr(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_prefix(self):
+        """
+        This field can contain one of the following nodes:
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_call_expr_f_prefix)
+
+
+
+        return result
+    
+    @property
+    def f_suffix(self):
+        """
+        :rtype: ArgList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_call_expr_f_suffix)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_prefix",
+        "f_suffix",
+    )
+
+    _kind_name = 'CallExpr'
+
+
+
+
+
+
+class CompOp(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_left(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_comp_op_f_left)
+
+
+
+        return result
+    
+    @property
+    def f_op(self):
+        """
+        :rtype: CompOpKind
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_comp_op_f_op)
+
+
+
+        return result
+    
+    @property
+    def f_right(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_comp_op_f_right)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_left",
+        "f_op",
+        "f_right",
+    )
+
+    _kind_name = 'CompOp'
+
+
+
+
+
+
+class ConcatStringLit(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_first_str(self):
+        """
+        :rtype: StringLit
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_concat_string_lit_f_first_str)
+
+
+
+        return result
+    
+    @property
+    def f_subsequent_str(self):
+        """
+        :rtype: StringLitList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_concat_string_lit_f_subsequent_str)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_first_str",
+        "f_subsequent_str",
+    )
+
+    _kind_name = 'ConcatStringLit'
+
+
+
+
+
+
+class DictComp(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_assoc(self):
+        """
+        :rtype: DictAssoc
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_dict_comp_f_assoc)
+
+
+
+        return result
+    
+    @property
+    def f_comprehension(self):
+        """
+        :rtype: CompFor
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_dict_comp_f_comprehension)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_assoc",
+        "f_comprehension",
+    )
+
+    _kind_name = 'DictComp'
+
+
+
+
+
+
+class DictLit(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_assocs(self):
+        """
+        :rtype: DictAssocList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_dict_lit_f_assocs)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_assocs",
+    )
+
+    _kind_name = 'DictLit'
+
+
+
+
+
+
+class Dot(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Expr._field_names + (
+    )
+
+    _kind_name = 'Dot'
+
+
+
+
+
+
+class EllipsisExpr(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Expr._field_names + (
+    )
+
+    _kind_name = 'EllipsisExpr'
+
+
+
+
+
+
+class Factor(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_op(self):
+        """
+        :rtype: Op
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_factor_f_op)
+
+
+
+        return result
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_factor_f_expr)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_op",
+        "f_expr",
+    )
+
+    _kind_name = 'Factor'
+
+
+
+
+
+
+class IfExpr(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_if_expr_f_expr)
+
+
+
+        return result
+    
+    @property
+    def f_cond(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_if_expr_f_cond)
+
+
+
+        return result
+    
+    @property
+    def f_else_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_if_expr_f_else_expr)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_expr",
+        "f_cond",
+        "f_else_expr",
+    )
+
+    _kind_name = 'IfExpr'
+
+
+
+
+
+
+class InlineEval(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_exprs(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_inline_eval_f_exprs)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_exprs",
+    )
+
+    _kind_name = 'InlineEval'
+
+
+
+
+
+
+class LambdaDef(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_args(self):
+        """
+        :rtype: Params
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_lambda_def_f_args)
+
+
+
+        return result
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_lambda_def_f_expr)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_args",
+        "f_expr",
+    )
+
+    _kind_name = 'LambdaDef'
+
+
+
+
+
+
+class ListComp(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_list_comp_f_expr)
+
+
+
+        return result
+    
+    @property
+    def f_comprehension(self):
+        """
+        :rtype: CompForL
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_list_comp_f_comprehension)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_expr",
+        "f_comprehension",
+    )
+
+    _kind_name = 'ListComp'
+
+
+
+
+
+
+class ListGen(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_list_gen_f_expr)
+
+
+
+        return result
+    
+    @property
+    def f_comprehension(self):
+        """
+        :rtype: CompForL
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_list_gen_f_comprehension)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_expr",
+        "f_comprehension",
+    )
+
+    _kind_name = 'ListGen'
+
+
+
+
+
+
+class ListLit(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_exprs(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_list_lit_f_exprs)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_exprs",
+    )
+
+    _kind_name = 'ListLit'
+
+
+
+
+
+
+class Name(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Expr._field_names + (
+    )
+
+
+
+
+
+
+
+class DottedName(Name):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_prefix(self):
+        """
+        This field can contain one of the following nodes:
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_dotted_name_f_prefix)
+
+
+
+        return result
+    
+    @property
+    def f_suffix(self):
+        """
+        :rtype: Id
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_dotted_name_f_suffix)
+
+
+
+        return result
+
+    _field_names = Name._field_names + (
+        "f_prefix",
+        "f_suffix",
+    )
+
+    _kind_name = 'DottedName'
+
+
+
+
+
+
+class Id(Name):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Name._field_names + (
+    )
+
+    _kind_name = 'Id'
+
+
+
+
+
+
+class NotOp(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_not_op_f_expr)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_expr",
+    )
+
+    _kind_name = 'NotOp'
+
+
+
+
+
+
+class NumberLit(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Expr._field_names + (
+    )
+
+    _kind_name = 'NumberLit'
+
+
+
+
+
+
+class OrExpr(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_left(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_or_expr_f_left)
+
+
+
+        return result
+    
+    @property
+    def f_right(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_or_expr_f_right)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_left",
+        "f_right",
+    )
+
+    _kind_name = 'OrExpr'
+
+
+
+
+
+
+class OrOp(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_left(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_or_op_f_left)
+
+
+
+        return result
+    
+    @property
+    def f_right(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_or_op_f_right)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_left",
+        "f_right",
+    )
+
+    _kind_name = 'OrOp'
+
+
+
+
+
+
+class Power(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_left(self):
+        """
+        This field can contain one of the following nodes:
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_power_f_left)
+
+
+
+        return result
+    
+    @property
+    def f_right(self):
+        """
+        This field can contain one of the following nodes:
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_power_f_right)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_left",
+        "f_right",
+    )
+
+    _kind_name = 'Power'
+
+
+
+
+
+
+class SetComp(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_set_comp_f_expr)
+
+
+
+        return result
+    
+    @property
+    def f_comprehension(self):
+        """
+        :rtype: CompFor
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_set_comp_f_comprehension)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_expr",
+        "f_comprehension",
+    )
+
+    _kind_name = 'SetComp'
+
+
+
+
+
+
+class SetLit(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_exprs(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_set_lit_f_exprs)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_exprs",
+    )
+
+    _kind_name = 'SetLit'
+
+
+
+
+
+
+class SliceExpr(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_first(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_slice_expr_f_first)
+
+
+
+        return result
+    
+    @property
+    def f_last(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_slice_expr_f_last)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_first",
+        "f_last",
+    )
+
+    _kind_name = 'SliceExpr'
+
+
+
+
+
+
+class ExtSliceExpr(SliceExpr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_stride(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_ext_slice_expr_f_stride)
+
+
+
+        return result
+
+    _field_names = SliceExpr._field_names + (
+        "f_stride",
+    )
+
+    _kind_name = 'ExtSliceExpr'
+
+
+
+
+
+
+class StringLit(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Expr._field_names + (
+    )
+
+    _kind_name = 'StringLit'
+
+
+
+
+
+
+class SubscriptExpr(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_prefix(self):
+        """
+        This field can contain one of the following nodes:
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_subscript_expr_f_prefix)
+
+
+
+        return result
+    
+    @property
+    def f_suffix(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * EllipsisExpr
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * SliceExpr
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_subscript_expr_f_suffix)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_prefix",
+        "f_suffix",
+    )
+
+    _kind_name = 'SubscriptExpr'
+
+
+
+
+
+
+class TupleLit(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_exprs(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_tuple_lit_f_exprs)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_exprs",
+    )
+
+    _kind_name = 'TupleLit'
+
+
+
+
+
+
+class XorExpr(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_left(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_xor_expr_f_left)
+
+
+
+        return result
+    
+    @property
+    def f_right(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_xor_expr_f_right)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_left",
+        "f_right",
+    )
+
+    _kind_name = 'XorExpr'
+
+
+
+
+
+
+class YieldExpr(Expr):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_exprs(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_yield_expr_f_exprs)
+
+
+
+        return result
+
+    _field_names = Expr._field_names + (
+        "f_exprs",
+    )
+
+    _kind_name = 'YieldExpr'
+
+
+
+
+
+
+class FileNode(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_statements(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * Decorated
+
+        * DefStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * ForStmt
+
+        * GlobalStmt
+
+        * IfStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * TryStmt
+
+        * WhileStmt
+
+        * WithStmt
+
+        * YieldExpr
+
+        :rtype: PythonNodeList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_file_node_f_statements)
+
+
+
+        return result
+
+    _field_names = PythonNode._field_names + (
+        "f_statements",
+    )
+
+    _kind_name = 'FileNode'
+
+
+
+
+
+
+class ImportStar(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNode._field_names + (
+    )
+
+    _kind_name = 'ImportStar'
+
+
+
+
+
+
+class KwArgsFlag(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def p_as_bool(self):
+        """
+        Return whether this is an instance of KwArgsFlagPresent
+
+        :rtype: bool
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(ctypes.c_uint8(), _kw_args_flag_p_as_bool)
+        result = bool(c_result.value)
+
+
+        return result
+
+    _field_names = PythonNode._field_names + (
+    )
+
+
+
+
+
+
+
+class KwArgsFlagAbsent(KwArgsFlag):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = KwArgsFlag._field_names + (
+    )
+
+    _kind_name = 'KwArgsFlagAbsent'
+
+
+
+
+
+
+class KwArgsFlagPresent(KwArgsFlag):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = KwArgsFlag._field_names + (
+    )
+
+    _kind_name = 'KwArgsFlagPresent'
+
+
+
+
+
+
+class NL(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNode._field_names + (
+    )
+
+    _kind_name = 'NL'
+
+
+
+
+
+
+class Op(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNode._field_names + (
+    )
+
+    _kind_name = 'Op'
+
+
+
+
+
+
+class Params(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_single_params(self):
+        """
+        :rtype: SingleParamList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_params_f_single_params)
+
+
+
+        return result
+
+    _field_names = PythonNode._field_names + (
+        "f_single_params",
+    )
+
+    _kind_name = 'Params'
+
+
+
+
+
+
+class PythonNodeBaseList(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNode._field_names + (
+    )
+
+
+
+
+
+
+
+class ArgList(PythonNodeBaseList):
+    """
+    List of Arg.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'ArgList'
+
+    is_list_type = True
+
+
+
+
+
+class AsNameNodeList(PythonNodeBaseList):
+    """
+    List of AsNameNode.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'AsNameNodeList'
+
+    is_list_type = True
+
+
+
+
+
+class DecoratorList(PythonNodeBaseList):
+    """
+    List of Decorator.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'DecoratorList'
+
+    is_list_type = True
+
+
+
+
+
+class DictAssocList(PythonNodeBaseList):
+    """
+    List of DictAssoc.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'DictAssocList'
+
+    is_list_type = True
+
+
+
+
+
+class DotList(PythonNodeBaseList):
+    """
+    List of Dot.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'DotList'
+
+    is_list_type = True
+
+
+
+
+
+class ElifBranchList(PythonNodeBaseList):
+    """
+    List of ElifBranch.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'ElifBranchList'
+
+    is_list_type = True
+
+
+
+
+
+class ExceptPartList(PythonNodeBaseList):
+    """
+    List of ExceptPart.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'ExceptPartList'
+
+    is_list_type = True
+
+
+
+
+
+class ExprList(PythonNodeBaseList):
+    """
+    List of Expr.
+
+    This list node can contain one of the following nodes:
+
+    * AndExpr
+
+    * AndOp
+
+    * BinOp
+
+    * CallExpr
+
+    * CompOp
+
+    * ConcatStringLit
+
+    * DictComp
+
+    * DictLit
+
+    * EllipsisExpr
+
+    * Factor
+
+    * IfExpr
+
+    * InlineEval
+
+    * LambdaDef
+
+    * ListComp
+
+    * ListGen
+
+    * ListLit
+
+    * Name
+
+    * NotOp
+
+    * NumberLit
+
+    * OrExpr
+
+    * OrOp
+
+    * Power
+
+    * SetComp
+
+    * SetLit
+
+    * SliceExpr
+
+    * StringLit
+
+    * SubscriptExpr
+
+    * TupleLit
+
+    * XorExpr
+
+    * YieldExpr
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'ExprList'
+
+    is_list_type = True
+
+
+
+
+
+class IdList(PythonNodeBaseList):
+    """
+    List of Id.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'IdList'
+
+    is_list_type = True
+
+
+
+
+
+class NLList(PythonNodeBaseList):
+    """
+    List of NL.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'NLList'
+
+    is_list_type = True
+
+
+
+
+
+class PythonNodeList(PythonNodeBaseList):
+    """
+    List of PythonNode.
+
+    This list node can contain one of the following nodes:
+
+    * AsNameNode
+
+    * AssertStmt
+
+    * AssignStmt
+
+    * AugAssignStmt
+
+    * BreakStmt
+
+    * ContinueStmt
+
+    * Decorated
+
+    * DefStmt
+
+    * DelStmt
+
+    * ExecStmt
+
+    * ExprList
+
+    * ForStmt
+
+    * GlobalStmt
+
+    * IfStmt
+
+    * ImportFrom
+
+    * ImportName
+
+    * Name
+
+    * PassStmt
+
+    * PrintStmt
+
+    * PythonNodeList
+
+    * RaiseStmt
+
+    * ReturnStmt
+
+    * StreamPrintStmt
+
+    * TryStmt
+
+    * WhileStmt
+
+    * WithStmt
+
+    * YieldExpr
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'PythonNodeList'
+
+    is_list_type = True
+
+
+
+
+
+class SingleParamList(PythonNodeBaseList):
+    """
+    List of SingleParam.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'SingleParamList'
+
+    is_list_type = True
+
+
+
+
+
+class StringLitList(PythonNodeBaseList):
+    """
+    List of StringLit.
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNodeBaseList._field_names + (
+    )
+
+    _kind_name = 'StringLitList'
+
+    is_list_type = True
+
+
+
+
+
+class RelName(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_dots(self):
+        """
+        :rtype: DotList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_rel_name_f_dots)
+
+
+
+        return result
+    
+    @property
+    def f_name(self):
+        """
+        :rtype: Name
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_rel_name_f_name)
+
+
+
+        return result
+
+    _field_names = PythonNode._field_names + (
+        "f_dots",
+        "f_name",
+    )
+
+    _kind_name = 'RelName'
+
+
+
+
+
+
+class SingleParam(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_is_varargs(self):
+        """
+        :rtype: VarArgsFlag
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_single_param_f_is_varargs)
+
+
+
+        return result
+    
+    @property
+    def f_is_kwargs(self):
+        """
+        :rtype: KwArgsFlag
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_single_param_f_is_kwargs)
+
+
+
+        return result
+    
+    @property
+    def f_name(self):
+        """
+        This field can contain one of the following nodes:
+
+        * Id
+
+        * IdList
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_single_param_f_name)
+
+
+
+        return result
+    
+    @property
+    def f_default_value(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_single_param_f_default_value)
+
+
+
+        return result
+
+    _field_names = PythonNode._field_names + (
+        "f_is_varargs",
+        "f_is_kwargs",
+        "f_name",
+        "f_default_value",
+    )
+
+    _kind_name = 'SingleParam'
+
+
+
+
+
+
+class Stmt(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = PythonNode._field_names + (
+    )
+
+
+
+
+
+
+
+class AssertStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_test_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_assert_stmt_f_test_expr)
+
+
+
+        return result
+    
+    @property
+    def f_msg(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_assert_stmt_f_msg)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_test_expr",
+        "f_msg",
+    )
+
+    _kind_name = 'AssertStmt'
+
+
+
+
+
+
+class AssignStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_l_value(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_assign_stmt_f_l_value)
+
+
+
+        return result
+    
+    @property
+    def f_r_values(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * ExprList
+
+        * YieldExpr
+
+        :rtype: PythonNodeList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_assign_stmt_f_r_values)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_l_value",
+        "f_r_values",
+    )
+
+    _kind_name = 'AssignStmt'
+
+
+
+
+
+
+class AugAssignStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_l_value(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_aug_assign_stmt_f_l_value)
+
+
+
+        return result
+    
+    @property
+    def f_op(self):
+        """
+        :rtype: Op
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_aug_assign_stmt_f_op)
+
+
+
+        return result
+    
+    @property
+    def f_r_value(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ExprList
+
+        * YieldExpr
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_aug_assign_stmt_f_r_value)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_l_value",
+        "f_op",
+        "f_r_value",
+    )
+
+    _kind_name = 'AugAssignStmt'
+
+
+
+
+
+
+class BreakStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Stmt._field_names + (
+    )
+
+    _kind_name = 'BreakStmt'
+
+
+
+
+
+
+class ContinueStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Stmt._field_names + (
+    )
+
+    _kind_name = 'ContinueStmt'
+
+
+
+
+
+
+class Decorated(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_decorators(self):
+        """
+        :rtype: DecoratorList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_decorated_f_decorators)
+
+
+
+        return result
+    
+    @property
+    def f_defn(self):
+        """
+        :rtype: DefStmt
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_decorated_f_defn)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_decorators",
+        "f_defn",
+    )
+
+    _kind_name = 'Decorated'
+
+
+
+
+
+
+class DefStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Stmt._field_names + (
+    )
+
+
+
+
+
+
+
+class ClassDef(DefStmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_name(self):
+        """
+        :rtype: Id
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_class_def_f_name)
+
+
+
+        return result
+    
+    @property
+    def f_bases(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_class_def_f_bases)
+
+
+
+        return result
+    
+    @property
+    def f_statements(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_class_def_f_statements)
+
+
+
+        return result
+
+    _field_names = DefStmt._field_names + (
+        "f_name",
+        "f_bases",
+        "f_statements",
+    )
+
+    _kind_name = 'ClassDef'
+
+
+
+
+
+
+class FuncDef(DefStmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_name(self):
+        """
+        :rtype: Id
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_func_def_f_name)
+
+
+
+        return result
+    
+    @property
+    def f_parameters(self):
+        """
+        :rtype: Params
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_func_def_f_parameters)
+
+
+
+        return result
+    
+    @property
+    def f_body(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_func_def_f_body)
+
+
+
+        return result
+
+    _field_names = DefStmt._field_names + (
+        "f_name",
+        "f_parameters",
+        "f_body",
+    )
+
+    _kind_name = 'FuncDef'
+
+
+
+
+
+
+class DelStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_exprs(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_del_stmt_f_exprs)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_exprs",
+    )
+
+    _kind_name = 'DelStmt'
+
+
+
+
+
+
+class ElifBranch(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_cond_test(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_elif_branch_f_cond_test)
+
+
+
+        return result
+    
+    @property
+    def f_statements(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_elif_branch_f_statements)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_cond_test",
+        "f_statements",
+    )
+
+    _kind_name = 'ElifBranch'
+
+
+
+
+
+
+class ExecStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_exec_stmt_f_expr)
+
+
+
+        return result
+    
+    @property
+    def f_in_list(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_exec_stmt_f_in_list)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_expr",
+        "f_in_list",
+    )
+
+    _kind_name = 'ExecStmt'
+
+
+
+
+
+
+class ForStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_bindings(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_for_stmt_f_bindings)
+
+
+
+        return result
+    
+    @property
+    def f_expr(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_for_stmt_f_expr)
+
+
+
+        return result
+    
+    @property
+    def f_statements(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_for_stmt_f_statements)
+
+
+
+        return result
+    
+    @property
+    def f_else_part(self):
+        """
+        :rtype: ElsePart
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_for_stmt_f_else_part)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_bindings",
+        "f_expr",
+        "f_statements",
+        "f_else_part",
+    )
+
+    _kind_name = 'ForStmt'
+
+
+
+
+
+
+class GlobalStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_names(self):
+        """
+        :rtype: IdList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_global_stmt_f_names)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_names",
+    )
+
+    _kind_name = 'GlobalStmt'
+
+
+
+
+
+
+class IfStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_cond_test(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_if_stmt_f_cond_test)
+
+
+
+        return result
+    
+    @property
+    def f_statements(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_if_stmt_f_statements)
+
+
+
+        return result
+    
+    @property
+    def f_elif_branchs(self):
+        """
+        :rtype: ElifBranchList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_if_stmt_f_elif_branchs)
+
+
+
+        return result
+    
+    @property
+    def f_else_part(self):
+        """
+        :rtype: ElsePart
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_if_stmt_f_else_part)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_cond_test",
+        "f_statements",
+        "f_elif_branchs",
+        "f_else_part",
+    )
+
+    _kind_name = 'IfStmt'
+
+
+
+
+
+
+class ImportFrom(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_rel_name(self):
+        """
+        This field can contain one of the following nodes:
+
+        * Name
+
+        * RelName
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_import_from_f_rel_name)
+
+
+
+        return result
+    
+    @property
+    def f_imported(self):
+        """
+        This field can contain one of the following nodes:
+
+        * ImportStar
+
+        * PythonNodeList
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_import_from_f_imported)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_rel_name",
+        "f_imported",
+    )
+
+    _kind_name = 'ImportFrom'
+
+
+
+
+
+
+class ImportName(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_imported_names(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AsNameNode
+
+        * Name
+
+        :rtype: PythonNodeList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_import_name_f_imported_names)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_imported_names",
+    )
+
+    _kind_name = 'ImportName'
+
+
+
+
+
+
+class PassStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = Stmt._field_names + (
+    )
+
+    _kind_name = 'PassStmt'
+
+
+
+
+
+
+class PrintStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_exprs(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_print_stmt_f_exprs)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_exprs",
+    )
+
+    _kind_name = 'PrintStmt'
+
+
+
+
+
+
+class RaiseStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_exprs(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_raise_stmt_f_exprs)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_exprs",
+    )
+
+    _kind_name = 'RaiseStmt'
+
+
+
+
+
+
+class ReturnStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_exprs(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_return_stmt_f_exprs)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_exprs",
+    )
+
+    _kind_name = 'ReturnStmt'
+
+
+
+
+
+
+class StreamPrintStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_stream_expr(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_stream_print_stmt_f_stream_expr)
+
+
+
+        return result
+    
+    @property
+    def f_exprs(self):
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: ExprList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_stream_print_stmt_f_exprs)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_stream_expr",
+        "f_exprs",
+    )
+
+    _kind_name = 'StreamPrintStmt'
+
+
+
+
+
+
+class TryStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_statements(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_try_stmt_f_statements)
+
+
+
+        return result
+    
+    @property
+    def f_except_parts(self):
+        """
+        :rtype: ExceptPartList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_try_stmt_f_except_parts)
+
+
+
+        return result
+    
+    @property
+    def f_else_part(self):
+        """
+        :rtype: ElsePart
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_try_stmt_f_else_part)
+
+
+
+        return result
+    
+    @property
+    def f_finally_part(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_try_stmt_f_finally_part)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_statements",
+        "f_except_parts",
+        "f_else_part",
+        "f_finally_part",
+    )
+
+    _kind_name = 'TryStmt'
+
+
+
+
+
+
+class WhileStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_cond_test(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+
+        :rtype: Expr
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_while_stmt_f_cond_test)
+
+
+
+        return result
+    
+    @property
+    def f_statements(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_while_stmt_f_statements)
+
+
+
+        return result
+    
+    @property
+    def f_else_part(self):
+        """
+        :rtype: ElsePart
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_while_stmt_f_else_part)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_cond_test",
+        "f_statements",
+        "f_else_part",
+    )
+
+    _kind_name = 'WhileStmt'
+
+
+
+
+
+
+class WithStmt(Stmt):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def f_bindings(self):
+        """
+        :rtype: AsNameNodeList
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_with_stmt_f_bindings)
+
+
+
+        return result
+    
+    @property
+    def f_statements(self):
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+
+        :rtype: PythonNode
+        """
+        
+
+        
+
+        result = self._eval_astnode_field(_with_stmt_f_statements)
+
+
+
+        return result
+
+    _field_names = Stmt._field_names + (
+        "f_bindings",
+        "f_statements",
+    )
+
+    _kind_name = 'WithStmt'
+
+
+
+
+
+
+class VarArgsFlag(PythonNode):
+    """
+    """
+    __slots__ = []
+
+    
+
+    
+    @property
+    def p_as_bool(self):
+        """
+        Return whether this is an instance of VarArgsFlagPresent
+
+        :rtype: bool
+        """
+        
+
+        
+
+
+        
+        c_result = self._eval_field(ctypes.c_uint8(), _var_args_flag_p_as_bool)
+        result = bool(c_result.value)
+
+
+        return result
+
+    _field_names = PythonNode._field_names + (
+    )
+
+
+
+
+
+
+
+class VarArgsFlagAbsent(VarArgsFlag):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = VarArgsFlag._field_names + (
+    )
+
+    _kind_name = 'VarArgsFlagAbsent'
+
+
+
+
+
+
+class VarArgsFlagPresent(VarArgsFlag):
+    """
+    """
+    __slots__ = []
+
+    
+
+
+    _field_names = VarArgsFlag._field_names + (
+    )
+
+    _kind_name = 'VarArgsFlagPresent'
+
+
+
+
+
+
+_EnvRebindings_c_type = _hashable_c_pointer()
+
+
+
+
+class _BaseStruct(object):
+    """
+    Mixin for Ada struct wrappers.
+    """
+
+    # Subclasses will override this to a subclass of ctypes.Structure
+    _c_type = None
+
+    def __getitem__(self, key):
+      if not isinstance(key, int):
+         raise TypeError('Tuples items are indexed by integers, not {}'.format(
+            type(key)
+         ))
+
+      fields = self._c_type._fields_
+      if 0 <= key < len(fields):
+         field_name, _ = fields[key]
+         return getattr(self, field_name)
+      else:
+         raise IndexError('There is no {}th field'.format(key))
+
+    def __repr__(self):
+        field_names = [name for name, _ in self._c_type._fields_]
+        return '<{} {}>'.format(
+            type(self).__name__,
+            ' '.join('{}={}'.format(name, getattr(self, name))
+                      for name in field_names)
+        )
+
+    @property
+    def as_tuple(self):
+        return tuple(getattr(self, f) for f, _ in self._c_type._fields_)
+
+    def __eq__(self, other):
+        return (isinstance(other, type(self)) and
+                self.as_tuple == other.as_tuple)
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self.as_tuple)
+
+
+
+
+class _Metadata_c_type(ctypes.Structure):
+    _fields_ =  [
+] 
+
+    @property
+    def as_tuple(self):
+        return tuple(getattr(self, f) for f, _ in self._fields_)
+
+    def __eq__(self, other):
+        return (isinstance(other, type(self)) and
+                self.as_tuple == other.as_tuple)
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self.as_tuple)
+class _EntityInfo_c_type(ctypes.Structure):
+    _fields_ =  [
+        ('md',
+            _Metadata_c_type
+         ),
+        ('rebindings',
+            _EnvRebindings_c_type
+         ),
+        ('from_rebound',
+            ctypes.c_uint8
+         ),
+] 
+class _Entity_c_type(ctypes.Structure):
+    _fields_ =  [
+        ('node',
+            PythonNode._node_c_type
+         ),
+        ('info',
+            _EntityInfo_c_type
+         ),
+] 
+
+    @classmethod
+    def from_bare_node(cls, node_c_value):
+        return cls(node_c_value, _EntityInfo_c_type._null_value)
+
+
+_Metadata_c_type._null_value = _Metadata_c_type()
+_EntityInfo_c_type._null_value = _EntityInfo_c_type(_Metadata_c_type._null_value,
+                                                None)
+
+
+#
+# Low-level binding - Second part
+#
+
+# For performance, allocate a single C API entity for all uses of null
+# entities.
+_Entity_c_type._null_value = _Entity_c_type()
+_Entity_c_type._null_value.node = None
+
+
+
+_lazy_arrays = False
+
+
+def use_lazy_arrays(enabled=True):
+    """
+    Enable or disable lazy arrays.
+
+    By default, arrays that properties return are converted to lists, which
+    requires to convert all their items upfront. When lazy arrays are enabled,
+    they are converted to sequences instead: these keep a reference to the
+    native array and convert items only when they are accessed. They support
+    ``len``, indexing, slicing (which returns a list) and iteration. Arrays of
+    integers, booleans and enumerations can also be viewed as memoryview
+    objects without copying them (see ``as_memoryview``).
+
+    :param bool enabled: Whether to enable lazy arrays.
+    """
+    global _lazy_arrays
+    _lazy_arrays = bool(enabled)
+
+
+class _BaseArray(object):
+    """
+    Base class for Ada arrays bindings.
+    """
+
+    c_element_type = None
+    """
+    Ctype class for array elements.
+    """
+
+    items_refcounted = False
+    """
+    Whether items for this arrays are ref-counted.
+    """
+
+    primitive_items = False
+    """
+    Whether items for this arrays are integers, booleans or enumerations, i.e.
+    whether they can be exposed through the buffer protocol.
+    """
+
+    __slots__ = ('c_value', 'length', 'items')
+
+    def __init__(self, c_value):
+        self.c_value = c_value
+
+        self.length = c_value.contents.n
+
+        items_addr = _field_address(c_value.contents, 'items')
+        items = self.c_element_type.from_address(items_addr)
+        self.items = ctypes.pointer(items)
+
+    def __repr__(self):
+        return '<{} {}>'.format(type(self).__name__, list(self))
+
+    def clear(self):
+        self.c_value = None
+        self.length = None
+        self.items = None
+
+    def __del__(self):
+        self.dec_ref(self.c_value)
+        self.clear()
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._get_item(i)
+                    for i in range(*key.indices(self.length))]
+
+        if not isinstance(key, int):
+            _raise_type_error('int', key)
+        index = key + self.length if key < 0 else key
+        if not 0 <= index < self.length:
+            raise IndexError('array index out of range')
+        return self._get_item(index)
+
+    def __iter__(self):
+        for i in range(self.length):
+            yield self._get_item(i)
+
+    def __buffer__(self, flags):
+        return self.as_memoryview()
+
+    def _get_item(self, index):
+        # In ctypes, accessing an array element does not copy it, which means
+        # the the array must live at least as long as the accessed element. We
+        # cannot guarantee that, so we must copy the element so that it is
+        # independent of the array it comes from.
+        #
+        # The try/except block tries to do a copy if "item" is indeed a buffer
+        # to be copied, and will fail if it's a mere integer, which does not
+        # need the buffer copy anyway, hence the "pass".
+        item = self.items[index]
+        try:
+            item = self.c_element_type.from_buffer_copy(item)
+        except TypeError:
+            pass
+        return self.wrap_item(item)
+
+    def as_memoryview(self):
+        """
+        Return a read-only memoryview for the items of this array, without
+        copying them.
+
+        Raise a TypeError if items are not integers, booleans or enumerations.
+        Enumeration values appear as their integer representation.
+
+        :rtype: memoryview
+        """
+        if not self.primitive_items:
+            raise TypeError('{} items cannot be exposed as a buffer'.format(
+                type(self).__name__
+            ))
+
+        items = (self.c_element_type * self.length).from_address(
+            _field_address(self.c_value.contents, 'items')
+        )
+
+        # The memoryview keeps a reference to "items", which must in turn keep
+        # this array alive, as it owns the memory it references.
+        items._array = self
+
+        return (memoryview(items).cast('B')
+                .cast(self.c_element_type._type_)
+                .toreadonly())
+
+    @classmethod
+    def wrap(cls, c_value, from_field_access):
+        helper = cls(c_value)
+
+        # In lazy mode, the array wrapper is the result: it converts items
+        # only on demand. It needs to own a reference to the array, so create
+        # one if this array value comes from a structure field (the structure
+        # owns the current reference).
+        if _lazy_arrays:
+            if from_field_access:
+                cls.inc_ref(c_value)
+            return helper
+
+        result = list(helper)
+
+        # If this array value comes from a structure field, we must not call
+        # its dec_ref primitive, as it is up to the structure's dec_ref
+        # primitive to take care of it.
+        if from_field_access:
+            helper.clear()
+
+        return result
+
+    @classmethod
+    def unwrap(cls, value, context=None):
+        # Accept lazy arrays wherever lists are accepted
+        if isinstance(value, _BaseArray):
+            value = list(value)
+
+        if not isinstance(value, list):
+            _raise_type_error('list', value)
+
+        # Create a holder for the result
+        result = cls(cls.create(len(value)))
+
+        # Unwrap all items at once, preserving their holder so that resources
+        # are deallocated if there is an error at some point.
+        items = [result.unwrap_item(item, context) for item in value]
+
+        # Initialize the resulting array
+        for i, (_, item) in enumerate(items):
+            result.items[i] = item
+
+        # At this point, we know that this is successful. We don't want
+        # holders to dec-ref the content so that the return array takes over
+        # the corresponding refcounting shares.
+        if cls.items_refcounted:
+            for holder, _ in items:
+                holder.clear()
+
+        return result
+
+
+
+
+
+
+class _BarePythonNodeArrayConverter(_BaseArray):
+    """
+    Wrapper class for arrays of BarePythonNode.
+
+    This class is not meant to be directly instantiated: it is only used to
+    convert values that various methods take/return.
+    """
+
+    __slots__ = _BaseArray.__slots__
+    items_refcounted = False
+    primitive_items = False
+
+    @staticmethod
+    def wrap_item(item):
+        return PythonNode._wrap_bare_node(item)
+
+    @staticmethod
+    def unwrap_item(item, context=None):
+        c_holder = item._node_c_value
+        c_value = c_holder
+        return (c_holder, c_value)
+
+
+    c_element_type = PythonNode._node_c_type
+
+    class c_struct(ctypes.Structure):
+        _fields_ = [('n', ctypes.c_int),
+                    ('ref_count', ctypes.c_int),
+                    ('items', PythonNode._node_c_type * 1)]
+
+    c_type = ctypes.POINTER(c_struct)
+
+    create = staticmethod(_import_func(
+        'python_bare_python_node_array_create', [ctypes.c_int], c_type))
+    inc_ref = staticmethod(_import_func(
+        'python_bare_python_node_array_inc_ref', [c_type], None))
+    dec_ref = staticmethod(_import_func(
+        'python_bare_python_node_array_dec_ref', [c_type], None))
+
+
+
+
+
+
+class _PythonNodeArrayConverter(_BaseArray):
+    """
+    Wrapper class for arrays of InternalEntity.
+
+    This class is not meant to be directly instantiated: it is only used to
+    convert values that various methods take/return.
+    """
+
+    __slots__ = _BaseArray.__slots__
+    items_refcounted = False
+    primitive_items = False
+
+    @staticmethod
+    def wrap_item(item):
+        return PythonNode._wrap(item)
+
+    @staticmethod
+    def unwrap_item(item, context=None):
+        c_holder = PythonNode._unwrap(item)
+        c_value = c_holder
+        return (c_holder, c_value)
+
+
+    c_element_type = _Entity_c_type
+
+    class c_struct(ctypes.Structure):
+        _fields_ = [('n', ctypes.c_int),
+                    ('ref_count', ctypes.c_int),
+                    ('items', _Entity_c_type * 1)]
+
+    c_type = ctypes.POINTER(c_struct)
+
+    create = staticmethod(_import_func(
+        'python_python_node_array_create', [ctypes.c_int], c_type))
+    inc_ref = staticmethod(_import_func(
+        'python_python_node_array_inc_ref', [c_type], None))
+    dec_ref = staticmethod(_import_func(
+        'python_python_node_array_dec_ref', [c_type], None))
+
+
+
+
+
+
+class _TextTypeConverter(_BaseArray):
+    """
+    Wrapper class for arrays of CharacterType.
+
+    This class is not meant to be directly instantiated: it is only used to
+    convert values that various methods take/return.
+    """
+
+    __slots__ = _BaseArray.__slots__
+    items_refcounted = False
+    primitive_items = False
+
+    @staticmethod
+    def wrap_item(item):
+        return _py2to3.unicode_character(item)
+
+    @staticmethod
+    def unwrap_item(item, context=None):
+        c_holder = ord(item)
+        c_value = c_holder
+        return (c_holder, c_value)
+
+    @classmethod
+    def wrap(cls, c_value, from_field_access):
+        # Reinterpret this array of uint32_t values as the equivalent array of
+        # characters, then decode it using the appropriate UTF-32 encoding.
+        chars = ctypes.cast(ctypes.pointer(c_value.contents.items),
+                            ctypes.POINTER(ctypes.c_char))
+        return chars[:4 * c_value.contents.n].decode(_text.encoding)
+
+    @classmethod
+    def unwrap(cls, value, context=None):
+        # If `value` is not a list, assume it's a string, and convert it to the
+        # expected list.
+        if not isinstance(value, list):
+            value = list(_text.cast(value))
+
+        return super(_TextTypeConverter, cls).unwrap(value, context)
+
+    c_element_type = ctypes.c_uint32
+
+    class c_struct(ctypes.Structure):
+        _fields_ = [('n', ctypes.c_int),
+                    ('ref_count', ctypes.c_int),
+                    ('items', ctypes.c_uint32 * 1)]
+
+    c_type = ctypes.POINTER(c_struct)
+
+    create = staticmethod(_import_func(
+        'python_text_type_create', [ctypes.c_int], c_type))
+    inc_ref = staticmethod(_import_func(
+        'python_text_type_inc_ref', [c_type], None))
+    dec_ref = staticmethod(_import_func(
+        'python_text_type_dec_ref', [c_type], None))
+
+
+
+
+
+
+class _PythonNodeArrayConverter(_BaseArray):
+    """
+    Wrapper class for arrays of InternalEntity.
+
+    This class is not meant to be directly instantiated: it is only used to
+    convert values that various methods take/return.
+    """
+
+    __slots__ = _BaseArray.__slots__
+    items_refcounted = False
+    primitive_items = False
+
+    @staticmethod
+    def wrap_item(item):
+        return PythonNode._wrap(item)
+
+    @staticmethod
+    def unwrap_item(item, context=None):
+        c_holder = PythonNode._unwrap(item)
+        c_value = c_holder
+        return (c_holder, c_value)
+
+
+    c_element_type = _Entity_c_type
+
+    class c_struct(ctypes.Structure):
+        _fields_ = [('n', ctypes.c_int),
+                    ('ref_count', ctypes.c_int),
+                    ('items', _Entity_c_type * 1)]
+
+    c_type = ctypes.POINTER(c_struct)
+
+    create = staticmethod(_import_func(
+        'python_python_node_array_create', [ctypes.c_int], c_type))
+    inc_ref = staticmethod(_import_func(
+        'python_python_node_array_inc_ref', [c_type], None))
+    dec_ref = staticmethod(_import_func(
+        'python_python_node_array_dec_ref', [c_type], None))
+
+
+
+
+_free = _import_func(
+    'python_free',
+    [ctypes.c_void_p], None
+)
+
+_text_to_bytes = _import_func(
+    'python_text_to_bytes',
+    [ctypes.POINTER(_text),
+     ctypes.POINTER(ctypes.c_void_p),
+     ctypes.POINTER(ctypes.c_size_t)],
+    ctypes.c_int
+)
+
+_destroy_text = _import_func(
+    'python_destroy_text', [ctypes.POINTER(_text)], None
+)
+
+_symbol_text = _import_func(
+    'python_symbol_text',
+    [ctypes.POINTER(_symbol_type), ctypes.POINTER(_text)], None
+)
+
+# Analysis primitives
+_create_analysis_context = _import_func(
+    'python_create_analysis_context',
+    [ctypes.c_char_p, # charset
+     _unit_provider,  # unit_provider
+     ctypes.c_int,    # with_trivia
+     ctypes.c_int],   # tab_stop
+    AnalysisContext._c_type
+)
+_context_incref = _import_func(
+    'python_context_incref',
+    [AnalysisContext._c_type], AnalysisContext._c_type
+)
+_context_decref = _import_func(
+    'python_context_decref',
+    [AnalysisContext._c_type], None
+)
+_context_symbol = _import_func(
+    'python_context_symbol',
+    [AnalysisContext._c_type,
+     ctypes.POINTER(_text),
+     ctypes.POINTER(_symbol_type)], ctypes.c_int
+)
+_discard_errors_in_populate_lexical_env = _import_func(
+   'python_context_discard_errors_in_populate_lexical_env',
+   [AnalysisContext._c_type, ctypes.c_int], None
+)
+_use_memory_mapped_files = _import_func(
+   'python_context_use_memory_mapped_files',
+   [AnalysisContext._c_type, ctypes.c_int], None
+)
+_get_analysis_unit_from_file = _import_func(
+    'python_get_analysis_unit_from_file',
+    [AnalysisContext._c_type,  # context
+     ctypes.c_char_p,          # filename
+     ctypes.c_char_p,          # charset
+     ctypes.c_int,             # reparse
+     ctypes.c_int],            # grammar rule
+    AnalysisUnit._c_type
+)
+_get_analysis_units_from_files = _import_func(
+    'python_get_analysis_units_from_files',
+    [AnalysisContext._c_type,         # context
+     ctypes.POINTER(ctypes.c_char_p),  # filenames
+     ctypes.c_int,                    # count
+     ctypes.c_char_p,                 # charset
+     ctypes.c_int,                    # reparse
+     ctypes.c_int,                    # grammar rule
+     ctypes.c_int,                    # jobs
+     ctypes.POINTER(AnalysisUnit._c_type)],  # units
+    None
+)
+_get_analysis_unit_from_buffer = _import_func(
+    'python_get_analysis_unit_from_buffer',
+    [AnalysisContext._c_type,  # context
+     ctypes.c_char_p,          # filename
+     ctypes.c_char_p,          # charset
+     ctypes.c_char_p,          # buffer
+     ctypes.c_size_t,          # buffer_size
+     ctypes.c_int],            # grammar rule
+    AnalysisUnit._c_type
+)
+_unit_root = _import_func(
+    'python_unit_root',
+    [AnalysisUnit._c_type, ctypes.POINTER(_Entity_c_type)], None
+)
+_unit_first_token = _import_func(
+    "python_unit_first_token",
+    [AnalysisUnit._c_type, ctypes.POINTER(Token)], None
+)
+_unit_last_token = _import_func(
+    "python_unit_last_token",
+    [AnalysisUnit._c_type, ctypes.POINTER(Token)], None
+)
+_unit_token_count = _import_func(
+    "python_unit_token_count",
+    [AnalysisUnit._c_type], ctypes.c_int
+)
+_unit_trivia_count = _import_func(
+    "python_unit_trivia_count",
+    [AnalysisUnit._c_type], ctypes.c_int
+)
+_unit_export_tokens = _import_func(
+    "python_unit_export_tokens",
+    [AnalysisUnit._c_type, ctypes.POINTER(_token_table)], ctypes.c_int
+)
+_destroy_token_table = _import_func(
+    "python_destroy_token_table",
+    [ctypes.POINTER(_token_table)], None
+)
+_unit_lookup_token = _import_func(
+    "python_unit_lookup_token",
+    [AnalysisUnit._c_type,
+     ctypes.POINTER(Sloc._c_type),
+     ctypes.POINTER(Token)],
+    None
+)
+_unit_dump_lexical_env = _import_func(
+    "python_unit_dump_lexical_env",
+    [AnalysisUnit._c_type], None
+)
+_unit_filename = _import_func(
+    "python_unit_filename",
+    [AnalysisUnit._c_type], ctypes.POINTER(ctypes.c_char)
+)
+_unit_diagnostic_count = _import_func(
+    'python_unit_diagnostic_count',
+    [AnalysisUnit._c_type], ctypes.c_uint
+)
+_unit_diagnostic = _import_func(
+    'python_unit_diagnostic',
+    [AnalysisUnit._c_type, ctypes.c_uint, ctypes.POINTER(Diagnostic._c_type)],
+    ctypes.c_int
+)
+_unit_context = _import_func(
+    'python_unit_context',
+    [AnalysisUnit._c_type], AnalysisContext._c_type
+)
+_unit_reparse_from_file = _import_func(
+    'python_unit_reparse_from_file',
+    [AnalysisUnit._c_type,    # unit
+     ctypes.c_char_p],        # charset
+    ctypes.c_int
+)
+_unit_reparse_from_buffer = _import_func(
+    'python_unit_reparse_from_buffer',
+    [AnalysisUnit._c_type, # unit
+     ctypes.c_char_p,      # charset
+     ctypes.c_char_p,      # buffer
+     ctypes.c_size_t],     # buffer_size
+    None
+)
+_unit_reparse_edit = _import_func(
+    'python_unit_reparse_edit',
+    [AnalysisUnit._c_type,
+     ctypes.POINTER(SlocRange._c_type),
+     ctypes.POINTER(_text)],
+    None
+)
+_unit_populate_lexical_env = _import_func(
+    'python_unit_populate_lexical_env',
+    [AnalysisUnit._c_type], ctypes.c_int
+)
+
+# General AST node primitives
+_node_kind = _import_func(
+    'python_node_kind',
+    [ctypes.POINTER(_Entity_c_type)], ctypes.c_int
+)
+_node_unit = _import_func(
+    'python_node_unit',
+    [ctypes.POINTER(_Entity_c_type)], AnalysisUnit._c_type
+)
+_node_is_token_node = _import_func(
+    'python_node_is_token_node',
+    [ctypes.POINTER(_Entity_c_type)], ctypes.c_int
+)
+_node_is_synthetic = _import_func(
+    'python_node_is_synthetic',
+    [ctypes.POINTER(_Entity_c_type)], ctypes.c_int
+)
+_node_image = _import_func(
+    'python_node_image',
+    [ctypes.POINTER(_Entity_c_type), ctypes.POINTER(_text)], None
+)
+_node_text = _import_func(
+    'python_node_text',
+    [ctypes.POINTER(_Entity_c_type), ctypes.POINTER(_text)], None
+)
+_node_sloc_range = _import_func(
+    'python_node_sloc_range',
+    [ctypes.POINTER(_Entity_c_type), ctypes.POINTER(SlocRange._c_type)], None
+)
+_lookup_in_node = _import_func(
+    'python_lookup_in_node',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(Sloc._c_type),
+     ctypes.POINTER(_Entity_c_type)], None
+)
+_node_children_count = _import_func(
+    'python_node_children_count',
+    [ctypes.POINTER(_Entity_c_type)], ctypes.c_uint
+)
+_node_child = _import_func(
+    'python_node_child',
+    [ctypes.POINTER(_Entity_c_type), ctypes.c_uint, ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_node_export_tree = _import_func(
+    'python_node_export_tree',
+    [ctypes.POINTER(_Entity_c_type), ctypes.POINTER(_node_tree)], ctypes.c_int
+)
+_destroy_node_tree = _import_func(
+    'python_destroy_node_tree',
+    [ctypes.POINTER(_node_tree)], None
+)
+
+_python_node_parent = _import_func(
+    'python_python_node_parent',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_python_node_parents = _import_func(
+    'python_python_node_parents',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_PythonNodeArrayConverter.c_type)],
+    ctypes.c_int
+)
+_python_node_children = _import_func(
+    'python_python_node_children',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_PythonNodeArrayConverter.c_type)],
+    ctypes.c_int
+)
+_python_node_token_start = _import_func(
+    'python_python_node_token_start',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(Token)],
+    ctypes.c_int
+)
+_python_node_token_end = _import_func(
+    'python_python_node_token_end',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(Token)],
+    ctypes.c_int
+)
+_python_node_child_index = _import_func(
+    'python_python_node_child_index',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(ctypes.c_int)],
+    ctypes.c_int
+)
+_python_node_previous_sibling = _import_func(
+    'python_python_node_previous_sibling',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_python_node_next_sibling = _import_func(
+    'python_python_node_next_sibling',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_python_node_unit = _import_func(
+    'python_python_node_unit',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(AnalysisUnit._c_type)],
+    ctypes.c_int
+)
+_python_node_is_ghost = _import_func(
+    'python_python_node_is_ghost',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(ctypes.c_uint8)],
+    ctypes.c_int
+)
+_python_node_full_sloc_image = _import_func(
+    'python_python_node_full_sloc_image',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_TextTypeConverter.c_type)],
+    ctypes.c_int
+)
+_arg_assoc_f_name = _import_func(
+    'python_arg_assoc_f_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_arg_assoc_f_expr = _import_func(
+    'python_arg_assoc_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_arg_gen_f_expr = _import_func(
+    'python_arg_gen_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_arg_gen_f_comprehension = _import_func(
+    'python_arg_gen_f_comprehension',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_kw_args_f_expr = _import_func(
+    'python_kw_args_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_var_args_f_expr = _import_func(
+    'python_var_args_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_as_name_node_f_imported = _import_func(
+    'python_as_name_node_f_imported',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_as_name_node_f_as_name = _import_func(
+    'python_as_name_node_f_as_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_comp_if_f_test = _import_func(
+    'python_comp_if_f_test',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_comp_if_f_comp = _import_func(
+    'python_comp_if_f_comp',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_comp_for_f_exprs = _import_func(
+    'python_comp_for_f_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_comp_for_f_target = _import_func(
+    'python_comp_for_f_target',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_comp_for_f_comp = _import_func(
+    'python_comp_for_f_comp',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_comp_forl_f_exprs = _import_func(
+    'python_comp_forl_f_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_comp_forl_f_target = _import_func(
+    'python_comp_forl_f_target',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_comp_forl_f_comp = _import_func(
+    'python_comp_forl_f_comp',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_decorator_f_dec_name = _import_func(
+    'python_decorator_f_dec_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_decorator_f_arg_list = _import_func(
+    'python_decorator_f_arg_list',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_dict_assoc_f_key = _import_func(
+    'python_dict_assoc_f_key',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_dict_assoc_f_value = _import_func(
+    'python_dict_assoc_f_value',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_else_part_f_statements = _import_func(
+    'python_else_part_f_statements',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_except_part_f_as_name = _import_func(
+    'python_except_part_f_as_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_except_part_f_statements = _import_func(
+    'python_except_part_f_statements',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_and_expr_f_left = _import_func(
+    'python_and_expr_f_left',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_and_expr_f_right = _import_func(
+    'python_and_expr_f_right',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_and_op_f_left = _import_func(
+    'python_and_op_f_left',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_and_op_f_right = _import_func(
+    'python_and_op_f_right',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_bin_op_f_left = _import_func(
+    'python_bin_op_f_left',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_bin_op_f_op = _import_func(
+    'python_bin_op_f_op',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_bin_op_f_right = _import_func(
+    'python_bin_op_f_right',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_call_expr_f_prefix = _import_func(
+    'python_call_expr_f_prefix',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_call_expr_f_suffix = _import_func(
+    'python_call_expr_f_suffix',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_comp_op_f_left = _import_func(
+    'python_comp_op_f_left',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_comp_op_f_op = _import_func(
+    'python_comp_op_f_op',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_comp_op_f_right = _import_func(
+    'python_comp_op_f_right',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_concat_string_lit_f_first_str = _import_func(
+    'python_concat_string_lit_f_first_str',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_concat_string_lit_f_subsequent_str = _import_func(
+    'python_concat_string_lit_f_subsequent_str',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_dict_comp_f_assoc = _import_func(
+    'python_dict_comp_f_assoc',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_dict_comp_f_comprehension = _import_func(
+    'python_dict_comp_f_comprehension',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_dict_lit_f_assocs = _import_func(
+    'python_dict_lit_f_assocs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_factor_f_op = _import_func(
+    'python_factor_f_op',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_factor_f_expr = _import_func(
+    'python_factor_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_if_expr_f_expr = _import_func(
+    'python_if_expr_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_if_expr_f_cond = _import_func(
+    'python_if_expr_f_cond',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_if_expr_f_else_expr = _import_func(
+    'python_if_expr_f_else_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_inline_eval_f_exprs = _import_func(
+    'python_inline_eval_f_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lambda_def_f_args = _import_func(
+    'python_lambda_def_f_args',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_lambda_def_f_expr = _import_func(
+    'python_lambda_def_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_list_comp_f_expr = _import_func(
+    'python_list_comp_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_list_comp_f_comprehension = _import_func(
+    'python_list_comp_f_comprehension',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_list_gen_f_expr = _import_func(
+    'python_list_gen_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_list_gen_f_comprehension = _import_func(
+    'python_list_gen_f_comprehension',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_list_lit_f_exprs = _import_func(
+    'python_list_lit_f_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_dotted_name_f_prefix = _import_func(
+    'python_dotted_name_f_prefix',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_dotted_name_f_suffix = _import_func(
+    'python_dotted_name_f_suffix',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_not_op_f_expr = _import_func(
+    'python_not_op_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_or_expr_f_left = _import_func(
+    'python_or_expr_f_left',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_or_expr_f_right = _import_func(
+    'python_or_expr_f_right',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_or_op_f_left = _import_func(
+    'python_or_op_f_left',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_or_op_f_right = _import_func(
+    'python_or_op_f_right',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_power_f_left = _import_func(
+    'python_power_f_left',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_power_f_right = _import_func(
+    'python_power_f_right',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_set_comp_f_expr = _import_func(
+    'python_set_comp_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_set_comp_f_comprehension = _import_func(
+    'python_set_comp_f_comprehension',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_set_lit_f_exprs = _import_func(
+    'python_set_lit_f_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_slice_expr_f_first = _import_func(
+    'python_slice_expr_f_first',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_slice_expr_f_last = _import_func(
+    'python_slice_expr_f_last',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_ext_slice_expr_f_stride = _import_func(
+    'python_ext_slice_expr_f_stride',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_subscript_expr_f_prefix = _import_func(
+    'python_subscript_expr_f_prefix',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_subscript_expr_f_suffix = _import_func(
+    'python_subscript_expr_f_suffix',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_tuple_lit_f_exprs = _import_func(
+    'python_tuple_lit_f_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_xor_expr_f_left = _import_func(
+    'python_xor_expr_f_left',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_xor_expr_f_right = _import_func(
+    'python_xor_expr_f_right',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_yield_expr_f_exprs = _import_func(
+    'python_yield_expr_f_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_file_node_f_statements = _import_func(
+    'python_file_node_f_statements',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_kw_args_flag_p_as_bool = _import_func(
+    'python_kw_args_flag_p_as_bool',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(ctypes.c_uint8)],
+    ctypes.c_int
+)
+_params_f_single_params = _import_func(
+    'python_params_f_single_params',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_rel_name_f_dots = _import_func(
+    'python_rel_name_f_dots',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_rel_name_f_name = _import_func(
+    'python_rel_name_f_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_single_param_f_is_varargs = _import_func(
+    'python_single_param_f_is_varargs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_single_param_f_is_kwargs = _import_func(
+    'python_single_param_f_is_kwargs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_single_param_f_name = _import_func(
+    'python_single_param_f_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_single_param_f_default_value = _import_func(
+    'python_single_param_f_default_value',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_assert_stmt_f_test_expr = _import_func(
+    'python_assert_stmt_f_test_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_assert_stmt_f_msg = _import_func(
+    'python_assert_stmt_f_msg',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_assign_stmt_f_l_value = _import_func(
+    'python_assign_stmt_f_l_value',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_assign_stmt_f_r_values = _import_func(
+    'python_assign_stmt_f_r_values',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_aug_assign_stmt_f_l_value = _import_func(
+    'python_aug_assign_stmt_f_l_value',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_aug_assign_stmt_f_op = _import_func(
+    'python_aug_assign_stmt_f_op',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_aug_assign_stmt_f_r_value = _import_func(
+    'python_aug_assign_stmt_f_r_value',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_decorated_f_decorators = _import_func(
+    'python_decorated_f_decorators',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_decorated_f_defn = _import_func(
+    'python_decorated_f_defn',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_class_def_f_name = _import_func(
+    'python_class_def_f_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_class_def_f_bases = _import_func(
+    'python_class_def_f_bases',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_class_def_f_statements = _import_func(
+    'python_class_def_f_statements',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_func_def_f_name = _import_func(
+    'python_func_def_f_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_func_def_f_parameters = _import_func(
+    'python_func_def_f_parameters',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_func_def_f_body = _import_func(
+    'python_func_def_f_body',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_del_stmt_f_exprs = _import_func(
+    'python_del_stmt_f_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_elif_branch_f_cond_test = _import_func(
+    'python_elif_branch_f_cond_test',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_elif_branch_f_statements = _import_func(
+    'python_elif_branch_f_statements',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_exec_stmt_f_expr = _import_func(
+    'python_exec_stmt_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_exec_stmt_f_in_list = _import_func(
+    'python_exec_stmt_f_in_list',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_for_stmt_f_bindings = _import_func(
+    'python_for_stmt_f_bindings',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_for_stmt_f_expr = _import_func(
+    'python_for_stmt_f_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_for_stmt_f_statements = _import_func(
+    'python_for_stmt_f_statements',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_for_stmt_f_else_part = _import_func(
+    'python_for_stmt_f_else_part',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_global_stmt_f_names = _import_func(
+    'python_global_stmt_f_names',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_if_stmt_f_cond_test = _import_func(
+    'python_if_stmt_f_cond_test',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_if_stmt_f_statements = _import_func(
+    'python_if_stmt_f_statements',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_if_stmt_f_elif_branchs = _import_func(
+    'python_if_stmt_f_elif_branchs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_if_stmt_f_else_part = _import_func(
+    'python_if_stmt_f_else_part',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_import_from_f_rel_name = _import_func(
+    'python_import_from_f_rel_name',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_import_from_f_imported = _import_func(
+    'python_import_from_f_imported',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_import_name_f_imported_names = _import_func(
+    'python_import_name_f_imported_names',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_print_stmt_f_exprs = _import_func(
+    'python_print_stmt_f_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_raise_stmt_f_exprs = _import_func(
+    'python_raise_stmt_f_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_return_stmt_f_exprs = _import_func(
+    'python_return_stmt_f_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_stream_print_stmt_f_stream_expr = _import_func(
+    'python_stream_print_stmt_f_stream_expr',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_stream_print_stmt_f_exprs = _import_func(
+    'python_stream_print_stmt_f_exprs',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_try_stmt_f_statements = _import_func(
+    'python_try_stmt_f_statements',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_try_stmt_f_except_parts = _import_func(
+    'python_try_stmt_f_except_parts',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_try_stmt_f_else_part = _import_func(
+    'python_try_stmt_f_else_part',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_try_stmt_f_finally_part = _import_func(
+    'python_try_stmt_f_finally_part',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_while_stmt_f_cond_test = _import_func(
+    'python_while_stmt_f_cond_test',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_while_stmt_f_statements = _import_func(
+    'python_while_stmt_f_statements',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_while_stmt_f_else_part = _import_func(
+    'python_while_stmt_f_else_part',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_with_stmt_f_bindings = _import_func(
+    'python_with_stmt_f_bindings',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_with_stmt_f_statements = _import_func(
+    'python_with_stmt_f_statements',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(_Entity_c_type)],
+    ctypes.c_int
+)
+_var_args_flag_p_as_bool = _import_func(
+    'python_var_args_flag_p_as_bool',
+    [ctypes.POINTER(_Entity_c_type),
+     ctypes.POINTER(ctypes.c_uint8)],
+    ctypes.c_int
+)
+
+# Unit providers
+_dec_ref_unit_provider = _import_func(
+    'python_dec_ref_unit_provider',
+    [_unit_provider], None
+)
+
+
+
+# Misc
+_token_kind_name = _import_func(
+   "python_token_kind_name",
+   [ctypes.c_int], ctypes.POINTER(ctypes.c_char)
+)
+_token_next = _import_func(
+    "python_token_next",
+    [ctypes.POINTER(Token), ctypes.POINTER(Token)], None
+)
+_token_is_equivalent = _import_func(
+    "python_token_is_equivalent",
+    [ctypes.POINTER(Token), ctypes.POINTER(Token)], ctypes.c_int
+)
+_token_previous = _import_func(
+    "python_token_previous",
+    [ctypes.POINTER(Token), ctypes.POINTER(Token)], None
+)
+_token_range_text = _import_func(
+    "python_token_range_text",
+    [ctypes.POINTER(Token), ctypes.POINTER(Token), ctypes.POINTER(_text)],
+    ctypes.c_int
+)
+_entity_image = _import_func(
+    "python_entity_image",
+    [ctypes.POINTER(_Entity_c_type), ctypes.POINTER(_text)], None
+)
+
+
+#
+# Layering helpers
+#
+
+def _unwrap_str(c_char_p_value):
+    """
+    Assuming c_char_p_value is a valid char*, convert it to a native Python
+    string and free the C pointer.
+    """
+    result = ctypes.c_char_p(ctypes.addressof(c_char_p_value.contents)).value
+    _free(c_char_p_value)
+    return _py2to3.bytes_to_text(result)
+
+
+_kind_to_astnode_cls = {
+    1: ArgAssoc,
+    2: ArgGen,
+    3: KwArgs,
+    4: VarArgs,
+    5: AsNameNode,
+    6: CompIf,
+    7: CompOpKindDiamond,
+    8: CompOpKindEq,
+    9: CompOpKindGt,
+    10: CompOpKindGte,
+    11: CompOpKindIn,
+    12: CompOpKindIs,
+    13: CompOpKindIsnot,
+    14: CompOpKindLt,
+    15: CompOpKindLte,
+    16: CompOpKindNoteq,
+    17: CompOpKindNotin,
+    18: CompFor,
+    19: CompForL,
+    20: Decorator,
+    21: DictAssoc,
+    22: ElsePart,
+    23: ExceptPart,
+    24: AndExpr,
+    25: AndOp,
+    26: ArithExpr,
+    27: ShiftExpr,
+    28: Term,
+    29: CallExpr,
+    30: CompOp,
+    31: ConcatStringLit,
+    32: DictComp,
+    33: DictLit,
+    34: Dot,
+    35: EllipsisExpr,
+    36: Factor,
+    37: IfExpr,
+    38: InlineEval,
+    39: LambdaDef,
+    40: ListComp,
+    41: ListGen,
+    42: ListLit,
+    43: DottedName,
+    44: Id,
+    45: NotOp,
+    46: NumberLit,
+    47: OrExpr,
+    48: OrOp,
+    49: Power,
+    50: SetComp,
+    51: SetLit,
+    52: SliceExpr,
+    53: ExtSliceExpr,
+    54: StringLit,
+    55: SubscriptExpr,
+    56: TupleLit,
+    57: XorExpr,
+    58: YieldExpr,
+    59: FileNode,
+    60: ImportStar,
+    61: KwArgsFlagAbsent,
+    62: KwArgsFlagPresent,
+    63: NL,
+    64: Op,
+    65: Params,
+    66: ArgList,
+    67: AsNameNodeList,
+    68: DecoratorList,
+    69: DictAssocList,
+    70: DotList,
+    71: ElifBranchList,
+    72: ExceptPartList,
+    73: ExprList,
+    74: IdList,
+    75: NLList,
+    76: PythonNodeList,
+    77: SingleParamList,
+    78: StringLitList,
+    79: RelName,
+    80: SingleParam,
+    81: AssertStmt,
+    82: AssignStmt,
+    83: AugAssignStmt,
+    84: BreakStmt,
+    85: ContinueStmt,
+    86: Decorated,
+    87: ClassDef,
+    88: FuncDef,
+    89: DelStmt,
+    90: ElifBranch,
+    91: ExecStmt,
+    92: ForStmt,
+    93: GlobalStmt,
+    94: IfStmt,
+    95: ImportFrom,
+    96: ImportName,
+    97: PassStmt,
+    98: PrintStmt,
+    99: RaiseStmt,
+    100: ReturnStmt,
+    101: StreamPrintStmt,
+    102: TryStmt,
+    103: WhileStmt,
+    104: WithStmt,
+    105: VarArgsFlagAbsent,
+    106: VarArgsFlagPresent,
+}
+
+
+def _field_address(struct, field_name):
+    """
+    Get the address of a structure field from a structure value.
+
+    For instance::
+
+        class Foo(ctypes.Structure):
+            _fields_ = [('i', ctypes.c_int)]
+
+        f = Foo()
+        i_addr =_field_address(f, 'i')
+    """
+    struct_type = type(struct)
+    struct_addr = ctypes.addressof(struct)
+    field = getattr(struct_type, field_name)
+    field_type = None
+    for f_name, f_type in struct_type._fields_:
+        if f_name == field_name:
+            field_type = f_type
+            break
+    assert field_type is not None
+    return struct_addr + field.offset
+
+
+#
+# Language specific extensions #
+#
+
+
+
+
+#
+# App base class
+#
+
+class App(object):
+    """
+    Base class to regroup logic for an app. We use a class so that
+    specific languages implementations can add specific arguments and
+    processing by overriding specific methods:
+
+    - `main`, which will be the main method of the app.
+
+    - `add_arguments` to add arguments to the argparse.Parser instance
+
+    - `create_unit_provider` to return a custom unit provider to be used by the
+      AnalysisContext.
+
+    - `description` to change the description of the app.
+
+    Inside of `main`, the user can access app specific state:
+
+    - `self.units` is a map of filenames to analysis units.
+    - `self.ctx` is the analysis context.
+    - `self.u` is the last parsed unit.
+
+    The user can then run the app by calling `App.run()`.
+
+    Here is a small example of an app subclassing `App`, that will simply print
+    the tree of every unit passed as argument:
+
+    .. code-block:: python
+
+        from libpythonlang import App
+
+
+        class ExampleApp(App):
+            def main(self):
+                for u in self.units.values():
+                    print u.filename
+                    print u.root.dump()
+
+        ExampleApp.run()
+    """
+
+    @property
+    def description(self):
+        """
+        Description for this app. Empty by default.
+        """
+        return ""
+
+    def __init__(self):
+        self.parser = argparse.ArgumentParser(description=self.description)
+        self.parser.add_argument('files', nargs='+', help='Files')
+        self.add_arguments()
+        self.args = self.parser.parse_args()
+        self.ctx = AnalysisContext(
+            'utf-8', with_trivia=True,
+            unit_provider=self.create_unit_provider()
+        )
+
+    def add_arguments(self):
+        """
+        Hook for subclasses to add arguments to self.parser. Default
+        implementation does nothing.
+        """
+        pass
+
+    def create_unit_provider(self):
+        """
+        Hook for subclasses to return a custom unit provider.
+        Default implementation returns None.
+        """
+        return None
+
+    def process_files(self):
+        """
+        Load units for all source files on the command-line in `self.units`.
+        Put the last one in `self.u`.
+        """
+        self.units = {}
+        for file_name in self.args.files:
+            self.u = self.ctx.get_from_file(file_name)
+            self.units[file_name] = self.u
+
+    @classmethod
+    def run(cls):
+        """
+        Instantiate and run this application.
+        """
+        instance = cls()
+        instance.process_files()
+        instance.main()
+
+    
+
@@ -0,0 +1,7829 @@
+
+
+
+
+
+
+import argparse
+import sys
+from typing import (
+    Any, AnyStr, Callable, ClassVar, Dict, IO, Iterator, List, Optional as Opt,
+    Tuple, Type, TypeVar, Union
+)
+
+
+
+
+
+class AnalysisUnitKind(object):
+    """
+    Specify a kind of analysis unit. Specification units provide an interface
+    to the outer world while body units provide an implementation for the
+    corresponding interface.
+    """
+    unit_specification: str
+    unit_body: str
+class LookupKind(object):
+    """
+    """
+    recursive: str
+    flat: str
+    minimal: str
+class GrammarRule(object):
+    """
+    Gramar rule to use for parsing.
+    """
+    name_rule: str
+    number_rule: str
+    string_rule: str
+    cat_string_rule: str
+    nl_rule: str
+    main_rule_rule: str
+    decorator_rule: str
+    decorators_rule: str
+    decorated_rule: str
+    func_def_rule: str
+    parameters_rule: str
+    varargslist_rule: str
+    fpdef_rule: str
+    name_list_rule: str
+    stmt_rule: str
+    simple_stmt_rule: str
+    small_stmt_rule: str
+    expr_stmt_rule: str
+    print_stmt_rule: str
+    del_stmt_rule: str
+    pass_stmt_rule: str
+    flow_stmt_rule: str
+    break_stmt_rule: str
+    continue_stmt_rule: str
+    return_stmt_rule: str
+    yield_stmt_rule: str
+    raise_stmt_rule: str
+    import_stmt_rule: str
+    import_name_rule: str
+    dot_rule: str
+    import_from_rule: str
+    as_name_rule: str
+    dotted_as_name_rule: str
+    import_as_names_rule: str
+    dotted_as_names_rule: str
+    dotted_name_rule: str
+    global_stmt_rule: str
+    exec_stmt_rule: str
+    assert_stmt_rule: str
+    compound_stmt_rule: str
+    else_part_rule: str
+    if_stmt_rule: str
+    while_stmt_rule: str
+    for_stmt_rule: str
+    try_stmt_rule: str
+    with_stmt_rule: str
+    with_item_rule: str
+    suite_rule: str
+    test_rule: str
+    or_test_rule: str
+    and_test_rule: str
+    not_test_rule: str
+    comparison_rule: str
+    expr_rule: str
+    xor_expr_rule: str
+    and_expr_rule: str
+    shift_expr_rule: str
+    arith_expr_rule: str
+    term_rule: str
+    factor_rule: str
+    power_rule: str
+    atom_expr_rule: str
+    dict_assoc_rule: str
+    yield_expr_rule: str
+    atom_rule: str
+    set_lit_rule: str
+    lambdef_rule: str
+    subscript_list_rule: str
+    subscript_rule: str
+    expr_list_rule: str
+    test_list_rule: str
+    empty_test_list_rule: str
+    class_def_rule: str
+    arg_list_rule: str
+    list_iter_rule: str
+    list_for_rule: str
+    list_if_rule: str
+    comp_iter_rule: str
+    comp_for_rule: str
+    comp_if_rule: str
+
+
+default_grammar_rule: str
+
+
+class InvalidField(Exception):
+    pass
+class NodeDataEvaluationError(Exception):
+    pass
+class InvalidInput(Exception):
+    pass
+class InvalidSymbolError(Exception):
+    pass
+class InvalidUnitNameError(Exception):
+    pass
+class NativeException(Exception):
+    pass
+class PreconditionFailure(Exception):
+    pass
+class PropertyError(Exception):
+    pass
+class TemplateArgsError(Exception):
+    pass
+class TemplateFormatError(Exception):
+    pass
+class TemplateInstantiationError(Exception):
+    pass
+class StaleReferenceError(Exception):
+    pass
+class UnknownCharset(Exception):
+    pass
+
+
+
+
+
+
+class AnalysisContext(object):
+    """
+    This type represents a context for all source analysis. This is the first
+    type you need to create to use Libpythonlang. It will contain the results
+    of all analysis, and is the main holder for all the data.
+
+    You can create several analysis contexts if you need to, which enables you,
+    for example to:
+
+    * analyze several different projects at the same time;
+
+    * analyze different parts of the same projects in parallel.
+
+    In the current design, contexts always keep all of their analysis units
+    allocated. If you need to get this memory released, the only option at your
+    disposal is to destroy your analysis context instance.
+    """
+
+    def __init__(self,
+                 charset: Opt[str] = None,
+                 unit_provider: Opt[UnitProvider] = None,
+                 with_trivia: bool = True,
+                 tab_stop: int = 8,
+                 *,
+                 _c_value: Any = None) -> None:
+        """
+        Create a new analysis context.
+
+        ``Charset`` will be used as a default charset to decode input sources
+        in analysis units. Please see ``GNATCOLL.Iconv`` for several supported
+        charsets. Be careful: passing an unsupported charset is not guaranteed
+        to raise an error here. If no charset is provided, ``"utf-8"`` is the
+        default.
+
+        .. todo:: Passing an unsupported charset here is not guaranteed to
+        raise an error right here, but this would be really helpful for users.
+
+        When ``With_Trivia`` is true, the parsed analysis units will contain
+        trivias.
+
+        If provided, ``Unit_Provider`` will be used to query the file name that
+        corresponds to a unit reference during semantic analysis. If it is
+        ``None``, the default one is used instead.
+
+        ``Tab_Stop`` is a positive number to describe the effect of tabulation
+        characters on the column number in source files.
+        """
+
+    def __eq__(self, other: Any) -> bool: ...
+    def __hash__(self) -> int: ...
+
+    def get_from_file(self,
+                      filename: AnyStr,
+                      charset: Opt[str] = None,
+                      reparse: bool = False,
+                      rule: str = default_grammar_rule) -> AnalysisUnit:
+        """
+        Create a new analysis unit for ``Filename`` or return the existing one
+        if any. If ``Reparse`` is true and the analysis unit already exists,
+        reparse it from ``Filename``.
+
+        ``Rule`` controls which grammar rule is used to parse the unit.
+
+        Use ``Charset`` in order to decode the source. If ``Charset`` is empty
+        then use the context's default charset.
+
+        If any failure occurs, such as file opening, decoding, lexing or
+        parsing failure, return an analysis unit anyway: errors are described
+        as diagnostics of the returned analysis unit.
+        """
+
+    def get_from_files(self,
+                       filenames: List[AnyStr],
+                       charset: Opt[str] = None,
+                       reparse: bool = False,
+                       rule: str = default_grammar_rule,
+                       jobs: int = 0) -> List[AnalysisUnit]:
+        """
+        Create new analysis units for all ``Filenames``, or return the existing
+        ones, as ``Get_From_File`` would do for each of them. Units that need
+        to be (re)parsed are lexed and parsed concurrently on ``Jobs`` worker
+        tasks, or on one task per processor if ``Jobs`` is zero. Only lexing
+        and parsing run concurrently: the rest of the processing (for instance
+        lexical environments updates) is sequential.
+
+        Return the analysis units in the same order as ``Filenames``.
+
+        Note that grammar predicates are evaluated concurrently, so properties
+        they use must not depend on other analysis units.
+        """
+
+    def get_from_buffer(self,
+                        filename: AnyStr,
+                        buffer: AnyStr,
+                        charset: Opt[str] = None,
+                        reparse: bool = False,
+                        rule: str = default_grammar_rule) -> AnalysisUnit:
+        """
+        Create a new analysis unit for ``Filename`` or return the existing one
+        if any. Whether the analysis unit already exists or not, (re)parse it
+        from the source code in ``Buffer``.
+
+        ``Rule`` controls which grammar rule is used to parse the unit.
+
+        Use ``Charset`` in order to decode the source. If ``Charset`` is empty
+        then use the context's default charset.
+
+        If any failure occurs, such as file opening, decoding, lexing or
+        parsing failure, return an analysis unit anyway: errors are described
+        as diagnostics of the returned analysis unit.
+        """
+
+    def get_from_provider(
+        self,
+        name: AnyStr,
+        kind: str,
+        charset: Opt[str] = None,
+        reparse: bool = False
+    ) -> AnalysisUnit:
+        """
+        Create a new analysis unit for ``Name``/``Kind`` or return the existing
+        one if any. If ``Reparse`` is true and the analysis unit already
+        exists, reparse it from ``Filename``.
+
+        Use ``Charset`` in order to decode the source. If ``Charset`` is empty
+        then use the context's default charset.
+
+        If the unit name cannot be tuned into a file name, raise an
+        ``InvalidUnitNameError`` exception. If any other failure occurs, such
+        as file opening, decoding, lexing or parsing failure, return an
+        analysis unit anyway: errors are described as diagnostics of the
+        returned analysis unit.
+        """
+
+    def discard_errors_in_populate_lexical_env(self,
+                                               discard: bool) -> None:
+        """
+        Debug helper. Set whether ``Property_Error`` exceptions raised in
+        ``Populate_Lexical_Env`` should be discarded. They are by default.
+        """
+
+    def use_memory_mapped_files(self, enabled: bool = True) -> None:
+        """
+        Set whether analysis units created from files in this context should be
+        lexed directly from a compact copy of the memory-mapped file. This
+        avoids decoding the file into a wide-character buffer, and thus speeds
+        up parsing and reduces memory usage. It is disabled by default.
+
+        This only applies to files that use a single-byte charset (ASCII or
+        Latin-1) and that do not start with a UTF byte order mark: other files
+        are decoded as usual.
+        """
+
+class AnalysisUnit(object):
+    """
+    This type represents the analysis of a single file.
+    """
+
+    class TokenIterator(object):
+        """
+        Iterator over the tokens in an analysis unit.
+        """
+
+        def __init__(self, first: Token) -> None: ...
+        def __iter__(self) -> AnalysisUnit.TokenIterator: ...
+        def __next__(self) -> Token: ...
+        def next(self) -> Token: ...
+
+    def __init__(self, context: AnalysisContext, c_value: Any) -> None: ...
+
+    def __eq__(self, other: Any) -> bool: ...
+    def __hash__(self) -> int: ...
+
+    @property
+    def context(self) -> AnalysisContext:
+        """
+        Return the context that owns this unit.
+        """
+
+    def reparse(self,
+                buffer: Opt[AnyStr] = None,
+                charset: Opt[str] = None) -> None:
+        """
+        Reparse an analysis unit from a buffer, if provided, or from the
+        original file otherwise. If ``Charset`` is empty or ``None``, use the
+        last charset successfuly used for this unit, otherwise use it to decode
+        the content of the source file.
+
+        If any failure occurs, such as decoding, lexing or parsing failure,
+        diagnostic are emitted to explain what happened.
+        """
+
+    def reparse_edit(self, edit_range: SlocRange, text: str) -> None:
+        """
+        Replace the source text in ``Edit_Range`` with ``Text`` and reparse the
+        analysis unit accordingly. The end of ``Edit_Range`` is exclusive, so
+        an empty range inserts ``Text``.
+
+        When the edit changes only trivia (whitespaces, comments, ...), the
+        unit keeps its current tree, so its nodes remain valid. Otherwise, this
+        is equivalent to reparsing the whole edited source buffer.
+
+        Raise a ``PreconditionFailure`` exception if the unit has no source
+        buffer or if ``Edit_Range`` is not a valid source location range for
+        it.
+        """
+
+    def populate_lexical_env(self) -> None:
+        """
+        Create lexical environments for this analysis unit, according to the
+        specifications given in the language spec.
+
+        If not done before, it will be automatically called during semantic
+        analysis. Calling it before enables one to control where the latency
+        occurs.
+
+        Depending on whether errors are discarded (see
+        ``Discard_Errors_In_Populate_Lexical_Env``), raise a ``Property_Error``
+        on failure.
+        """
+
+    @property
+    def root(self) -> PythonNode:
+        """
+        Return the root node for this unit, or ``None`` if there is none.
+
+        :rtype: PythonNode
+        """
+
+    @property
+    def first_token(self) -> Token:
+        """
+        Return a reference to the first token scanned in this unit.
+        """
+
+    @property
+    def last_token(self) -> Token:
+        """
+        Return a reference to the last token scanned in this unit.
+        """
+
+    @property
+    def text(self) -> str:
+        """
+        Return the source buffer associated to this unit.
+        """
+
+    @property
+    def token_count(self) -> int:
+        """
+        Return the number of tokens in this unit.
+        """
+
+    @property
+    def trivia_count(self) -> int:
+        """
+        Return the number of trivias in this unit. This is 0 for units that
+        were parsed with trivia analysis disabled.
+        """
+
+    def token_table(self) -> TokenTable:
+        """
+        Return a columnar representation of all the tokens and trivia in this
+        unit.
+
+        Iterating on tokens one at a time is slow: this computes the data for
+        all tokens in a single native call, which is a lot faster.
+
+        :rtype: TokenTable
+        """
+
+    def lookup_token(self, sloc: Sloc) -> Token:
+        """
+        Look for a token in this unit that contains the given source location.
+        If this falls before the first token, return the first token. If this
+        falls between two tokens, return the token that appears before. If this
+        falls after the last token, return the last token. If there is no token
+        in this unit, return no token.
+        """
+
+    def iter_tokens(self) -> AnalysisUnit.TokenIterator:
+        """
+        Iterator over the tokens in an analysis unit.
+        """
+
+    @property
+    def filename(self) -> str:
+        """
+        Return the filename this unit is associated to.
+        """
+
+    @property
+    def diagnostics(self) -> List[Diagnostic]:
+        """
+        Diagnostics for this unit.
+        """
+
+    def __repr__(self) -> str: ...
+
+
+class Sloc(object):
+    """
+    Location in a source file. Line and column numbers are one-based.
+    """
+
+    line: int
+    column: int
+
+    def __init__(self, line: int, column: int) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __nonzero__(self) -> bool: ...
+    def __lt__(self, other: Sloc) -> bool: ...
+    def __eq__(self, other: Any) -> bool: ...
+    def __hash__(self) -> int: ...
+    def __str__(self) -> str: ...
+    def __repr__(self) -> str: ...
+
+
+class SlocRange(object):
+    """
+    Location of a span of text in a source file.
+    """
+
+    start: Sloc
+    end: Sloc
+
+    def __init__(self, start: Sloc, end: Sloc) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __nonzero__(self) -> bool: ...
+    def __lt__(self, other: SlocRange) -> bool: ...
+    def __eq__(self, other: Any) -> bool: ...
+    def __hash__(self) -> int: ...
+    def __str__(self) -> str: ...
+    def __repr__(self) -> str: ...
+
+
+class Diagnostic(object):
+    """
+    Diagnostic for an analysis unit: cannot open the source file, parsing
+    error, ...
+    """
+
+    sloc_range: SlocRange
+    message: str
+
+    def __init__(self, sloc_range: SlocRange, message: str) -> None: ...
+
+    @property
+    def as_text(self) -> str: ...
+
+    def __str__(self) -> str: ...
+    def __repr__(self) -> str: ...
+
+
+class Token(object):
+    """
+    Reference to a token in an analysis unit.
+    """
+
+    @property
+    def next(self) -> Opt[Token]:
+        """
+        Return a reference to the next token in the corresponding analysis
+        unit.
+        """
+
+    @property
+    def previous(self) -> Opt[Token]:
+        """
+        Return a reference to the previous token in the corresponding analysis
+        unit.
+        """
+
+    def range_until(self, other: Token) -> Iterator[Token]:
+        """
+        Return an iterator on the list of tokens that spans between `self` and
+        `other` (included). This returns an empty list if the first token
+        appears after the other one in the source code. Raise a ``ValueError``
+        if both tokens come from different analysis units.
+        """
+
+    def is_equivalent(self, other: Token) -> bool:
+        """
+        Return whether ``L`` and ``R`` are structurally equivalent tokens. This
+        means that their position in the stream won't be taken into account,
+        only the kind and text of the token.
+        """
+
+    @property
+    def kind(self) -> str:
+        """
+        Kind for this token.
+        """
+
+    @property
+    def is_trivia(self) -> bool:
+        """
+        Return whether this token is a trivia. If it's not, it's a regular
+        token.
+        """
+
+    @property
+    def index(self) -> int:
+        """
+        Zero-based index for this token/trivia. Tokens and trivias get their
+        own index space.
+        """
+
+    @property
+    def text(self) -> str:
+        """
+        Return the text of the given token.
+        """
+
+    @classmethod
+    def text_range(cls, first: Token, last: Token) -> str:
+        """
+        Compute the source buffer slice corresponding to the text that spans
+        between the ``First`` and ``Last`` tokens (both included). This yields
+        an empty slice if ``Last`` actually appears before ``First``.
+
+        This raises a ``ValueError`` if ``First`` and ``Last`` don't belong to
+        the same analysis unit.
+        """
+
+    @property
+    def sloc_range(self) -> SlocRange:
+        """
+        Return the source location range of the given token.
+        """
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Return whether the two tokens refer to the same token in the same unit.
+
+        Note that this does not actually compares the token data.
+        """
+
+    def __hash__(self) -> int: ...
+    def __repr__(self) -> str: ...
+
+    def __lt__(self, other: Opt[Token]) -> bool:
+        """
+        Consider that None comes before all tokens. Then, sort by unit, token
+        index, and trivia index.
+        """
+
+    def __le__(self, other: Opt[Token]) -> bool: ...
+    def __gt__(self, other: Opt[Token]) -> bool: ...
+    def __ge__(self, other: Opt[Token]) -> bool: ...
+
+    def to_data(self) -> dict:
+        """
+        Return a dict representation of this Token.
+        """
+
+
+class UnitProvider(object):
+    """
+    Interface to fetch analysis units from a name and a unit kind.
+
+    The unit provider mechanism provides an abstraction which assumes that to
+    any couple (unit name, unit kind) we can associate at most one source file.
+    This means that several couples can be associated to the same source file,
+    but on the other hand, only one one source file can be associated to a
+    couple.
+
+    This is used to make the semantic analysis able to switch from one analysis
+    units to another.
+    """
+
+    def __init__(self, c_value: Any) -> None:
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly.
+        """
+
+
+
+
+
+class PythonNode(object):
+    """
+    """
+
+    is_list_type: ClassVar[bool]
+
+    
+    
+
+    
+    @property
+    def parent(
+        self
+    ) -> PythonNode:
+        """
+        Return the lexical parent for this node. Return null for the root AST
+        node or for AST nodes for which no one has a reference to the parent.
+        """
+    
+    @property
+    def parents(
+        self
+    ) -> List[PythonNode]:
+        """
+        Return an array that contains the lexical parents (this node included).
+        Nearer parents are first in the list.
+        """
+    
+    @property
+    def children(
+        self
+    ) -> List[PythonNode]:
+        """
+        Return an array that contains the direct lexical children.
+        """
+    
+    @property
+    def token_start(
+        self
+    ) -> Token:
+        """
+        Return the first token used to parse this node.
+        """
+    
+    @property
+    def token_end(
+        self
+    ) -> Token:
+        """
+        Return the last token used to parse this node.
+        """
+    
+    @property
+    def child_index(
+        self
+    ) -> int:
+        """
+        Return the 0-based index for Node in its parent's children.
+        """
+    
+    @property
+    def previous_sibling(
+        self
+    ) -> PythonNode:
+        """
+        Return the node's previous sibling, if there is one.
+        """
+    
+    @property
+    def next_sibling(
+        self
+    ) -> PythonNode:
+        """
+        Return the node's next sibling, if there is one.
+        """
+    
+    @property
+    def unit(
+        self
+    ) -> AnalysisUnit:
+        """
+        Return the analysis unit owning this node.
+        """
+    
+    @property
+    def is_ghost(
+        self
+    ) -> bool:
+        """
+        Return whether the node is a ghost.
+
+        Unlike regular nodes, ghost nodes cover no token in the input source:
+        they are logically located instead between two tokens. The
+        "token_first" of all ghost nodes is the token right after this logical
+        position, while they have no "token_last".
+        """
+    
+    @property
+    def full_sloc_image(
+        self
+    ) -> str:
+        """
+        Return a string containing the filename + the sloc in GNU conformant
+        format. Useful to create diagnostics from a node.
+        """
+
+
+
+
+
+    def __init__(self,
+                 c_value: Any,
+                 node_c_value: Any,
+                 metadata: Any,
+                 rebindings: Any) -> None: ...
+    def __eq__(self, other: Any) -> bool: ...
+    def __ne__(self, other: Any) -> bool: ...
+    def __hash__(self) -> int: ...
+
+    @property
+    def kind_name(self) -> str:
+        """
+        Return the kind of this node.
+        """
+
+    @property
+    def is_token_node(self) -> bool:
+        """
+        Return whether this node is a node that contains only a single token.
+        """
+
+    @property
+    def is_synthetic(self) -> bool:
+        """
+        Return whether this node is synthetic.
+        """
+
+    @property
+    def sloc_range(self) -> SlocRange:
+        """
+        Return the spanning source location range for this node.
+
+        Note that this returns the sloc of the parent for synthetic nodes.
+        """
+
+    @property
+    def text(self) -> str:
+        """
+        Return the source buffer slice corresponding to the text that spans
+        between the first and the last tokens of this node.
+
+        Note that this returns the empty string for synthetic nodes.
+        """
+
+    @property
+    def image(self) -> str:
+        """
+        Return a representation of this node as a string.
+        """
+
+    def lookup(self, sloc: Sloc) -> Opt[PythonNode]:
+        """
+        Return the bottom-most node from in ``Node`` and its children which
+        contains ``Sloc``, or ``None`` if there is none.
+        """
+
+    def __bool__(self) -> bool:
+        """
+        Return always True so that checking a node against None can be done as
+        simply as::
+
+        if node: ...
+        """
+
+    def __nonzero__(self) -> bool: ...
+
+    def __iter__(self) -> Iterator[PythonNode]:
+        """
+        Return an iterator on the children of this node.
+        """
+
+    def __len__(self) -> int:
+        """
+        Return the number of PythonNode children this node has.
+        """
+
+    def __getitem__(self, key: int) -> Opt[PythonNode]:
+        """
+        Return the Nth PythonNode child this node has.
+
+        This handles negative indexes the same way Python lists do. Raise an
+        IndexError if "key" is out of range.
+        """
+
+    def iter_fields(self) -> Iterator[Tuple[str, PythonNode]]:
+        """
+        Iterate through all the fields this node contains.
+
+        Return an iterator that yields (name, value) couples for all abstract
+        fields in this node. If "self" is a list, field names will be
+        "item_{n}" with "n" being the index.
+        """
+
+    def export_tree(self) -> NodeTree:
+        """
+        Return a flat representation of the sub-tree rooted at this node.
+
+        Traversing a big tree one node at a time is slow: this computes the
+        data for all nodes in a single native call, which is a lot faster.
+
+        :rtype: NodeTree
+        """
+
+    def dump_str(self) -> str:
+        """
+        Dump the sub-tree to a string in a human-readable format.
+        """
+
+    def dump(self, indent: str = '', file: IO[str] = sys.stdout) -> None:
+        """
+        Dump the sub-tree in a human-readable format on the given file.
+
+        :param str indent: Prefix printed on each line during the dump. :param
+        file file: File in which the dump must occur.
+        """
+
+    def findall(
+        self,
+        ast_type_or_pred: Union[Type[PythonNode],
+                                Callable[[PythonNode], bool]],
+        **kwargs: Any
+    ) -> List[PythonNode]:
+        """
+        Helper for finditer that will return all results as a list. See
+        finditer's documentation for more details.
+        """
+
+    def find(
+        self,
+        ast_type_or_pred: Union[Type[PythonNode],
+                                Callable[[PythonNode], bool]],
+        **kwargs: Any
+    ) -> Opt[PythonNode]:
+        """
+        Helper for finditer that will return only the first result. See
+        finditer's documentation for more details.
+        """
+
+    def finditer(
+        self,
+        ast_type_or_pred: Union[Type[PythonNode],
+                                Callable[[PythonNode], bool]],
+        **kwargs: Any
+    ) -> Iterator[PythonNode]:
+        """
+        Find every node corresponding to the passed predicates.
+
+        :param ast_type_or_pred: If supplied with a subclass of PythonNode,
+        will constrain the resulting collection to only the instances of this
+        type or any subclass. If supplied with a predicate, it will apply the
+        predicate on every node and keep only the ones for which it returns
+        True. If supplied with a list of subclasses of PythonNode, it will
+        match all instances of any of them. :type ast_type_or_pred:
+        type|((PythonNode) -> bool)|list[type]
+
+        :param kwargs: Allows the user to filter on attributes of the node. For
+        every key value association, if the node has an attribute of name key
+        that has the specified value, then the child is kept. :type kwargs:
+        dict[str, Any]
+        """
+
+    @property
+    def parent_chain(self) -> List[PythonNode]:
+        """
+        Return the parent chain of self. Self will be the first element,
+        followed by the first parent, then this parent's parent, etc.
+        """
+
+    def __repr__(self) -> str: ...
+
+    @property
+    def entity_repr(self) -> str: ...
+
+    @property
+    def tokens(self) -> Iterator[Token]:
+        """
+        Return an iterator on the range of tokens that self encompasses.
+        """
+
+    def to_data(self) -> Union[list, dict]:
+        """
+        Return a nested python data-structure, constituted only of standard
+        data types (dicts, lists, strings, ints, etc), and representing the
+        portion of the AST corresponding to this node.
+        """
+
+    def to_json(self) -> str:
+        """
+        Return a JSON representation of this node.
+        """
+
+    def is_a(self, *types: Type[PythonNode]) -> bool:
+        """
+        Shortcut for isinstance(self, types). :rtype: bool
+        """
+
+    T = TypeVar('T', bound=PythonNode)
+
+    def cast(self, typ: Type[T]) -> T:
+        """
+        Fluent interface style method. Return ``self``, raise an error if self
+        is not of type ``typ``.
+
+        :type typ: () -> T :rtype: T
+        """
+
+
+
+class Arg(PythonNode):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class ArgAssoc(Arg):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_name(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class ArgGen(Arg):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_comprehension(
+        self
+    ) -> CompFor:
+        pass
+
+
+
+
+
+
+
+class KwArgs(Arg):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class VarArgs(Arg):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class AsNameNode(PythonNode):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_imported(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_as_name(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class CompIf(PythonNode):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_test(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_comp(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * CompIf
+
+        * Comprehension
+        """
+
+
+
+
+
+
+
+class CompOpKind(PythonNode):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class CompOpKindDiamond(CompOpKind):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class CompOpKindEq(CompOpKind):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class CompOpKindGt(CompOpKind):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class CompOpKindGte(CompOpKind):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class CompOpKindIn(CompOpKind):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class CompOpKindIs(CompOpKind):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class CompOpKindIsnot(CompOpKind):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class CompOpKindLt(CompOpKind):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class CompOpKindLte(CompOpKind):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class CompOpKindNoteq(CompOpKind):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class CompOpKindNotin(CompOpKind):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class Comprehension(PythonNode):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class CompFor(Comprehension):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_exprs(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_target(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_comp(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * CompFor
+
+        * CompIf
+        """
+
+
+
+
+
+
+
+class CompForL(Comprehension):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_exprs(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_target(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_comp(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * CompForL
+
+        * CompIf
+        """
+
+
+
+
+
+
+
+class Decorator(PythonNode):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_dec_name(
+        self
+    ) -> Name:
+        pass
+    
+    @property
+    def f_arg_list(
+        self
+    ) -> ArgList:
+        pass
+
+
+
+
+
+
+
+class DictAssoc(PythonNode):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_key(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_value(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class ElsePart(PythonNode):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_statements(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class ExceptPart(PythonNode):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_as_name(
+        self
+    ) -> AsNameNode:
+        pass
+    
+    @property
+    def f_statements(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class Expr(PythonNode):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class AndExpr(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_left(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_right(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class AndOp(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_left(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_right(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class BinOp(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_left(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_op(
+        self
+    ) -> Op:
+        pass
+    
+    @property
+    def f_right(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * ArithExpr
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * Term
+
+        * TupleLit
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class ArithExpr(BinOp):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class ShiftExpr(BinOp):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class Term(BinOp):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class CallExpr(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_prefix(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_suffix(
+        self
+    ) -> ArgList:
+        pass
+
+
+
+
+
+
+
+class CompOp(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_left(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_op(
+        self
+    ) -> CompOpKind:
+        pass
+    
+    @property
+    def f_right(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class ConcatStringLit(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_first_str(
+        self
+    ) -> StringLit:
+        pass
+    
+    @property
+    def f_subsequent_str(
+        self
+    ) -> StringLitList:
+        pass
+
+
+
+
+
+
+
+class DictComp(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_assoc(
+        self
+    ) -> DictAssoc:
+        pass
+    
+    @property
+    def f_comprehension(
+        self
+    ) -> CompFor:
+        pass
+
+
+
+
+
+
+
+class DictLit(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_assocs(
+        self
+    ) -> DictAssocList:
+        pass
+
+
+
+
+
+
+
+class Dot(Expr):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class EllipsisExpr(Expr):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class Factor(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_op(
+        self
+    ) -> Op:
+        pass
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class IfExpr(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_cond(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_else_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class InlineEval(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_exprs(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class LambdaDef(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_args(
+        self
+    ) -> Params:
+        pass
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class ListComp(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_comprehension(
+        self
+    ) -> CompForL:
+        pass
+
+
+
+
+
+
+
+class ListGen(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_comprehension(
+        self
+    ) -> CompForL:
+        pass
+
+
+
+
+
+
+
+class ListLit(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_exprs(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class Name(Expr):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class DottedName(Name):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_prefix(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_suffix(
+        self
+    ) -> Id:
+        pass
+
+
+
+
+
+
+
+class Id(Name):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class NotOp(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class NumberLit(Expr):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class OrExpr(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_left(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_right(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class OrOp(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_left(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_right(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class Power(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_left(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_right(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class SetComp(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_comprehension(
+        self
+    ) -> CompFor:
+        pass
+
+
+
+
+
+
+
+class SetLit(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_exprs(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class SliceExpr(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_first(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_last(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class ExtSliceExpr(SliceExpr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_stride(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class StringLit(Expr):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class SubscriptExpr(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_prefix(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_suffix(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * EllipsisExpr
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * SliceExpr
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class TupleLit(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_exprs(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class XorExpr(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_left(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_right(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class YieldExpr(Expr):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_exprs(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class FileNode(PythonNode):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_statements(
+        self
+    ) -> PythonNodeList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * Decorated
+
+        * DefStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * ForStmt
+
+        * GlobalStmt
+
+        * IfStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * TryStmt
+
+        * WhileStmt
+
+        * WithStmt
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class ImportStar(PythonNode):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class KwArgsFlag(PythonNode):
+    """
+    """
+
+    
+
+    
+    @property
+    def p_as_bool(
+        self
+    ) -> bool:
+        """
+        Return whether this is an instance of KwArgsFlagPresent
+        """
+
+
+
+
+
+
+
+class KwArgsFlagAbsent(KwArgsFlag):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class KwArgsFlagPresent(KwArgsFlag):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class NL(PythonNode):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class Op(PythonNode):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class Params(PythonNode):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_single_params(
+        self
+    ) -> SingleParamList:
+        pass
+
+
+
+
+
+
+
+class PythonNodeBaseList(PythonNode):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class ArgList(PythonNodeBaseList):
+    """
+    List of Arg.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[Arg]: ...
+    def __getitem__(self,
+                    index: int) -> Arg: ...
+
+
+
+
+
+
+class AsNameNodeList(PythonNodeBaseList):
+    """
+    List of AsNameNode.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[AsNameNode]: ...
+    def __getitem__(self,
+                    index: int) -> AsNameNode: ...
+
+
+
+
+
+
+class DecoratorList(PythonNodeBaseList):
+    """
+    List of Decorator.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[Decorator]: ...
+    def __getitem__(self,
+                    index: int) -> Decorator: ...
+
+
+
+
+
+
+class DictAssocList(PythonNodeBaseList):
+    """
+    List of DictAssoc.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[DictAssoc]: ...
+    def __getitem__(self,
+                    index: int) -> DictAssoc: ...
+
+
+
+
+
+
+class DotList(PythonNodeBaseList):
+    """
+    List of Dot.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[Dot]: ...
+    def __getitem__(self,
+                    index: int) -> Dot: ...
+
+
+
+
+
+
+class ElifBranchList(PythonNodeBaseList):
+    """
+    List of ElifBranch.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[ElifBranch]: ...
+    def __getitem__(self,
+                    index: int) -> ElifBranch: ...
+
+
+
+
+
+
+class ExceptPartList(PythonNodeBaseList):
+    """
+    List of ExceptPart.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[ExceptPart]: ...
+    def __getitem__(self,
+                    index: int) -> ExceptPart: ...
+
+
+
+
+
+
+class ExprList(PythonNodeBaseList):
+    """
+    List of Expr.
+
+    This list node can contain one of the following nodes:
+
+    * AndExpr
+
+    * AndOp
+
+    * BinOp
+
+    * CallExpr
+
+    * CompOp
+
+    * ConcatStringLit
+
+    * DictComp
+
+    * DictLit
+
+    * EllipsisExpr
+
+    * Factor
+
+    * IfExpr
+
+    * InlineEval
+
+    * LambdaDef
+
+    * ListComp
+
+    * ListGen
+
+    * ListLit
+
+    * Name
+
+    * NotOp
+
+    * NumberLit
+
+    * OrExpr
+
+    * OrOp
+
+    * Power
+
+    * SetComp
+
+    * SetLit
+
+    * SliceExpr
+
+    * StringLit
+
+    * SubscriptExpr
+
+    * TupleLit
+
+    * XorExpr
+
+    * YieldExpr
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[Expr]: ...
+    def __getitem__(self,
+                    index: int) -> Expr: ...
+
+
+
+
+
+
+class IdList(PythonNodeBaseList):
+    """
+    List of Id.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[Id]: ...
+    def __getitem__(self,
+                    index: int) -> Id: ...
+
+
+
+
+
+
+class NLList(PythonNodeBaseList):
+    """
+    List of NL.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[NL]: ...
+    def __getitem__(self,
+                    index: int) -> NL: ...
+
+
+
+
+
+
+class PythonNodeList(PythonNodeBaseList):
+    """
+    List of PythonNode.
+
+    This list node can contain one of the following nodes:
+
+    * AsNameNode
+
+    * AssertStmt
+
+    * AssignStmt
+
+    * AugAssignStmt
+
+    * BreakStmt
+
+    * ContinueStmt
+
+    * Decorated
+
+    * DefStmt
+
+    * DelStmt
+
+    * ExecStmt
+
+    * ExprList
+
+    * ForStmt
+
+    * GlobalStmt
+
+    * IfStmt
+
+    * ImportFrom
+
+    * ImportName
+
+    * Name
+
+    * PassStmt
+
+    * PrintStmt
+
+    * PythonNodeList
+
+    * RaiseStmt
+
+    * ReturnStmt
+
+    * StreamPrintStmt
+
+    * TryStmt
+
+    * WhileStmt
+
+    * WithStmt
+
+    * YieldExpr
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[PythonNode]: ...
+    def __getitem__(self,
+                    index: int) -> PythonNode: ...
+
+
+
+
+
+
+class SingleParamList(PythonNodeBaseList):
+    """
+    List of SingleParam.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[SingleParam]: ...
+    def __getitem__(self,
+                    index: int) -> SingleParam: ...
+
+
+
+
+
+
+class StringLitList(PythonNodeBaseList):
+    """
+    List of StringLit.
+    """
+
+    
+
+
+    def __iter__(self) -> Iterator[StringLit]: ...
+    def __getitem__(self,
+                    index: int) -> StringLit: ...
+
+
+
+
+
+
+class RelName(PythonNode):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_dots(
+        self
+    ) -> DotList:
+        pass
+    
+    @property
+    def f_name(
+        self
+    ) -> Name:
+        pass
+
+
+
+
+
+
+
+class SingleParam(PythonNode):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_is_varargs(
+        self
+    ) -> VarArgsFlag:
+        pass
+    
+    @property
+    def f_is_kwargs(
+        self
+    ) -> KwArgsFlag:
+        pass
+    
+    @property
+    def f_name(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * Id
+
+        * IdList
+        """
+    
+    @property
+    def f_default_value(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class Stmt(PythonNode):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class AssertStmt(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_test_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_msg(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class AssignStmt(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_l_value(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_r_values(
+        self
+    ) -> PythonNodeList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * ExprList
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class AugAssignStmt(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_l_value(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_op(
+        self
+    ) -> Op:
+        pass
+    
+    @property
+    def f_r_value(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * ExprList
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class BreakStmt(Stmt):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class ContinueStmt(Stmt):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class Decorated(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_decorators(
+        self
+    ) -> DecoratorList:
+        pass
+    
+    @property
+    def f_defn(
+        self
+    ) -> DefStmt:
+        pass
+
+
+
+
+
+
+
+class DefStmt(Stmt):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class ClassDef(DefStmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_name(
+        self
+    ) -> Id:
+        pass
+    
+    @property
+    def f_bases(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_statements(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class FuncDef(DefStmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_name(
+        self
+    ) -> Id:
+        pass
+    
+    @property
+    def f_parameters(
+        self
+    ) -> Params:
+        pass
+    
+    @property
+    def f_body(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class DelStmt(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_exprs(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class ElifBranch(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_cond_test(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_statements(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class ExecStmt(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_in_list(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class ForStmt(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_bindings(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * BinOp
+
+        * CallExpr
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * InlineEval
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NumberLit
+
+        * OrExpr
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_expr(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_statements(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_else_part(
+        self
+    ) -> ElsePart:
+        pass
+
+
+
+
+
+
+
+class GlobalStmt(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_names(
+        self
+    ) -> IdList:
+        pass
+
+
+
+
+
+
+
+class IfStmt(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_cond_test(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_statements(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_elif_branchs(
+        self
+    ) -> ElifBranchList:
+        pass
+    
+    @property
+    def f_else_part(
+        self
+    ) -> ElsePart:
+        pass
+
+
+
+
+
+
+
+class ImportFrom(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_rel_name(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * Name
+
+        * RelName
+        """
+    
+    @property
+    def f_imported(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * ImportStar
+
+        * PythonNodeList
+        """
+
+
+
+
+
+
+
+class ImportName(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_imported_names(
+        self
+    ) -> PythonNodeList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AsNameNode
+
+        * Name
+        """
+
+
+
+
+
+
+
+class PassStmt(Stmt):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class PrintStmt(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_exprs(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class RaiseStmt(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_exprs(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class ReturnStmt(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_exprs(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class StreamPrintStmt(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_stream_expr(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_exprs(
+        self
+    ) -> ExprList:
+        """
+        This field contains a list that itself contains one of the following
+        nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class TryStmt(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_statements(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_except_parts(
+        self
+    ) -> ExceptPartList:
+        pass
+    
+    @property
+    def f_else_part(
+        self
+    ) -> ElsePart:
+        pass
+    
+    @property
+    def f_finally_part(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class WhileStmt(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_cond_test(
+        self
+    ) -> Expr:
+        """
+        This field can contain one of the following nodes:
+
+        * AndExpr
+
+        * AndOp
+
+        * BinOp
+
+        * CallExpr
+
+        * CompOp
+
+        * ConcatStringLit
+
+        * DictComp
+
+        * DictLit
+
+        * Factor
+
+        * IfExpr
+
+        * InlineEval
+
+        * LambdaDef
+
+        * ListComp
+
+        * ListGen
+
+        * ListLit
+
+        * Name
+
+        * NotOp
+
+        * NumberLit
+
+        * OrExpr
+
+        * OrOp
+
+        * Power
+
+        * SetComp
+
+        * SetLit
+
+        * StringLit
+
+        * SubscriptExpr
+
+        * TupleLit
+
+        * XorExpr
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_statements(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+        """
+    
+    @property
+    def f_else_part(
+        self
+    ) -> ElsePart:
+        pass
+
+
+
+
+
+
+
+class WithStmt(Stmt):
+    """
+    """
+
+    
+
+    
+    @property
+    def f_bindings(
+        self
+    ) -> AsNameNodeList:
+        pass
+    
+    @property
+    def f_statements(
+        self
+    ) -> PythonNode:
+        """
+        This field can contain one of the following nodes:
+
+        * AssertStmt
+
+        * AssignStmt
+
+        * AugAssignStmt
+
+        * BreakStmt
+
+        * ContinueStmt
+
+        * DelStmt
+
+        * ExecStmt
+
+        * ExprList
+
+        * GlobalStmt
+
+        * ImportFrom
+
+        * ImportName
+
+        * PassStmt
+
+        * PrintStmt
+
+        * PythonNodeList
+
+        * RaiseStmt
+
+        * ReturnStmt
+
+        * StreamPrintStmt
+
+        * YieldExpr
+        """
+
+
+
+
+
+
+
+class VarArgsFlag(PythonNode):
+    """
+    """
+
+    
+
+    
+    @property
+    def p_as_bool(
+        self
+    ) -> bool:
+        """
+        Return whether this is an instance of VarArgsFlagPresent
+        """
+
+
+
+
+
+
+
+class VarArgsFlagAbsent(VarArgsFlag):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+class VarArgsFlagPresent(VarArgsFlag):
+    """
+    """
+
+    
+
+
+
+    pass
+
+
+
+
+
+
+
+
+
+
+
+
+class NodeTree(object):
+    """
+    Flat representation of a tree of nodes, as computed by the
+    ``PythonNode.export_tree`` method.
+
+    Nodes are stored in prefix depth-first order, so the root node comes first,
+    and the children of each node come right after it. Null children are
+    skipped. Node data is available as columns: for each column attribute, the
+    Nth item contains the corresponding data for the Nth node. Columns are
+    memoryview objects that reference native memory without copying it, so they
+    can be used in vectorized processing (for instance with
+    ``numpy.frombuffer``). Columns are:
+
+    * ``kinds``: integer kind for each node (see ``PythonNode.kind_name``).
+
+    * ``parents``: index of the parent node (-1 for the root node).
+
+    * ``children_counts``: number of non-null children.
+
+    * ``token_starts``/``token_ends``: indexes of the first and last tokens for
+    each node. Token end is 0 for ghost nodes.
+
+    * ``start_lines``/``start_columns``/``end_lines``/``end_columns``: source
+    location ranges for each node.
+    """
+
+    kinds: memoryview
+    parents: memoryview
+    children_counts: memoryview
+    token_starts: memoryview
+    token_ends: memoryview
+    start_lines: memoryview
+    start_columns: memoryview
+    end_lines: memoryview
+    end_columns: memoryview
+
+    def __init__(self, root: PythonNode, c_value: Any) -> None: ...
+    def __len__(self) -> int: ...
+
+    def node(self, index: int) -> PythonNode:
+        """
+        Return the node at the given index in this tree.
+
+        :param int index: Index of the node to return. :rtype: PythonNode
+        """
+
+    def kind_name(self, index: int) -> str:
+        """
+        Return the kind name for the node at the given index in this tree.
+
+        :param int index: Index of the node. :rtype: str
+        """
+
+
+class TokenTable(object):
+    """
+    Columnar representation of the stream of tokens and trivia in an analysis
+    unit, as computed by the ``AnalysisUnit.token_table`` method.
+
+    Tokens and trivia are stored in the same order as in the source. Token data
+    is available as columns: for each column attribute, the Nth item contains
+    the corresponding data for the Nth token or trivia. Columns are memoryview
+    objects that reference native memory without copying it, so they can be
+    used in vectorized processing (for instance with ``numpy.frombuffer``).
+    Columns are:
+
+    * ``kinds``: integer kind for each token (see ``kind_name``).
+
+    * ``start_offsets``/``end_offsets``: 0-based indexes in the unit text of
+    the first character of each token and of the character that follows the
+    last one.
+
+    * ``start_lines``/``start_columns``/``end_lines``/``end_columns``: source
+    location ranges for each token.
+
+    * ``is_trivia``: 1 for trivia, 0 for regular tokens.
+    """
+
+    kinds: memoryview
+    start_offsets: memoryview
+    end_offsets: memoryview
+    start_lines: memoryview
+    end_lines: memoryview
+    start_columns: memoryview
+    end_columns: memoryview
+    is_trivia: memoryview
+
+    def __init__(self, unit: AnalysisUnit, c_value: Any) -> None: ...
+    def __len__(self) -> int: ...
+
+    def kind_name(self, index: int) -> str:
+        """
+        Return the kind name for the token at the given index in this table.
+
+        :param int index: Index of the token. :rtype: str
+        """
+
+
+def use_lazy_arrays(enabled: bool = True) -> None:
+    """
+    Enable or disable lazy arrays.
+
+    By default, arrays that properties return are converted to lists, which
+    requires to convert all their items upfront. When lazy arrays are enabled,
+    they are converted to sequences instead: these keep a reference to the
+    native array and convert items only when they are accessed. They support
+    ``len``, indexing, slicing (which returns a list) and iteration. Arrays of
+    integers, booleans and enumerations can also be viewed as memoryview
+    objects without copying them (see ``as_memoryview``).
+
+    :param bool enabled: Whether to enable lazy arrays.
+    """
+
+
+class App(object):
+    parser: argparse.ArgumentParser
+    args: argparse.Namespace
+    u: AnalysisUnit
+    units: Dict[str, AnalysisUnit]
+    ctx: AnalysisContext
+
+    @property
+    def description(self) -> str: ...
+
+    def __init__(self) -> None: ...
+    def add_arguments(self) -> None: ...
+    def create_unit_provider(self) -> Opt[UnitProvider]: ...
+    def process_files(self) -> None: ...
+
+    @classmethod
+    def run(cls) -> None: ...
+
+    
+
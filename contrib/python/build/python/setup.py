@@ -0,0 +1,16 @@
+
+from setuptools import setup, find_packages
+
+
+
+
+setup(
+    name='Libpythonlang',
+    version='0.1',
+    packages=['libpythonlang'],
+    package_data={
+        'libpythonlang':
+            ['*.{}'.format(ext) for ext in ('dll', 'so', 'so.*', 'dylib')],
+    },
+    zip_safe=False,
+)
@@ -1,3 +1,9 @@
+__version__ = '0.1-dev'
+"""
+Version number for Langkit. It is used to key on-disk caches that depend on
+the Langkit release (see for instance ``langkit.template_utils``).
+"""
+
 
 def reset():
     """
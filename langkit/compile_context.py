@@ -757,6 +757,14 @@ class CompileCtx:
         :type: None|langkit.emitter.Emitter
         """
 
+        self.rewritten_files = set()
+        """
+        Once code emission is done, set of paths for the source files that it
+        actually (re)wrote. See langkit.emitter.Emitter.rewritten_files.
+
+        :type: set[str]
+        """
+
         self.gnatcov = None
         """
         During code emission, GNATcov instance if coverage is enabled. None
@@ -1649,6 +1657,19 @@ class CompileCtx:
             allowed in property calls. This is used as a mitigation against
             infinite recursions.
 
+        :param str packrat_memo_kind: Default kind for the packrat
+            memoization tables of parsing rules: see
+            ``langkit.parsers.Grammar.set_memo``. "ring" by default.
+
+        :param int packrat_memo_size: Default number of slots for packrat
+            memoization rings. 16 by default.
+
+        :param bool compact_source_buffers: Whether to store source buffers
+            using one byte per character when possible, once lexing is done.
+            This reduces memory usage for units that contain only Latin-1
+            characters, at the expense of decoding source buffers back to wide
+            characters when their text is requested. False by default.
+
         See langkit.emitter.Emitter's constructor for other supported keyword
         arguments.
         """
@@ -1661,6 +1682,10 @@ class CompileCtx:
         self.generate_unparser = kwargs.pop('generate_unparser', False)
         annotate_fields_types = kwargs.pop('annotate_fields_types', False)
         self.default_max_call_depth = default_max_call_depth
+        self.packrat_memo_kind = kwargs.pop('packrat_memo_kind', 'ring')
+        self.packrat_memo_size = kwargs.pop('packrat_memo_size', 16)
+        self.compact_source_buffers = kwargs.pop('compact_source_buffers',
+                                                 False)
 
         self.report_unused_documentation_entries = (
             report_unused_documentation_entries
@@ -1693,6 +1718,7 @@ class CompileCtx:
             try:
                 self.run_passes(all_passes)
                 if not check_only and self.emitter is not None:
+                    self.rewritten_files = self.emitter.rewritten_files
                     self.emitter.cache.save()
             finally:
                 self.emitter = None
@@ -1861,6 +1887,8 @@ class CompileCtx:
             GrammarPass('check main parsing rule', Grammar.check_main_rule),
             GrammarPass('warn on unreferenced parsing rules',
                         Grammar.warn_unreferenced_parsing_rules),
+            GrammarPass('check memoization options',
+                        Grammar.check_memo_options),
             EnvSpecPass('create internal properties for env specs',
                         EnvSpec.create_properties,
                         iter_metaclass=True),
@@ -1988,6 +2016,9 @@ class CompileCtx:
                         Emitter.emit_python_playground),
             EmitterPass('emit GDB helpers', Emitter.emit_gdb_helpers),
             EmitterPass('emit OCaml API', Emitter.emit_ocaml_api),
+            EmitterPass('render pending sources',
+                        Emitter.render_pending_sources),
+            EmitterPass('emit GDB debug info', Emitter.emit_gdb_debug_info),
             EmitterPass('emit library project file',
                         Emitter.emit_lib_project_file),
             EmitterPass('instrument for code coverage',
@@ -2708,6 +2739,26 @@ class CompileCtx:
         )
         return has_keys
 
+    @property
+    def has_predicate_parsers(self):
+        """
+        Return whether the grammar contains at least one Predicate parser.
+
+        Predicate parsers evaluate properties during parsing, which affects
+        context-wide data (call depth, memoization frames, ...).
+
+        :rtype: bool
+        """
+        from langkit.parsers import Predicate
+
+        def has_predicate(parser):
+            return isinstance(parser, Predicate) or any(
+                has_predicate(child) for child in parser.children
+            )
+
+        return any(has_predicate(rule)
+                   for rule in self.grammar.rules.values())
+
     def check_memoized(self):
         """
         Check that various invariants for memoized properties are respected.
@@ -68,6 +68,8 @@ def template_extensions(ctx):
         'analysis_unit_type':    T.AnalysisUnit.c_type(capi).name,
         'node_kind_type':        CAPIType(capi, 'node_kind_enum').name,
         'node_type':             ctx.root_grammar_class.c_type(capi).name,
+        'node_tree_type':        CAPIType(capi, 'node_tree').name,
+        'token_table_type':      CAPIType(capi, 'token_table').name,
         'entity_type':           T.entity.c_type(capi).name,
         'symbol_type':           T.Symbol.c_type(capi).name,
         'env_rebindings_type':   T.EnvRebindings.c_type(capi).name,
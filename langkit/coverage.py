@@ -518,15 +518,16 @@ class GNATcov:
         ])
 
         # At this point, instrumented sources are located in the object
-        # directory, which depends on the build mode: relocate it somewhere
-        # else (i.e. rename to instr_dir) so that the same set of instrumented
-        # sources applies to all builds.
+        # directory, which depends on the build mode and on the library kind
+        # (the default ones here): relocate it somewhere else (i.e. rename to
+        # instr_dir) so that the same set of instrumented sources applies to
+        # all builds.
         lib_obj_dir = os.path.join(emitter.lib_root, 'obj',
                                    emitter.lib_name_low)
         instr_src_dir = os.path.join(lib_obj_dir, 'gnatcov-instr')
         if os.path.exists(instr_src_dir):
             shutil.rmtree(instr_src_dir)
-        os.rename(os.path.join(lib_obj_dir, 'dev', 'gnatcov-instr'),
+        os.rename(os.path.join(lib_obj_dir, 'dev', 'static', 'gnatcov-instr'),
                   instr_src_dir)
 
         # "gnatcov instrument" instruments only Ada sources, so we need to
@@ -540,7 +541,7 @@ class GNATcov:
         # Create a directory to gather all SID files
         sid_dir = os.path.join(instr_dir, 'sids')
         ensure_clean_dir(sid_dir)
-        for f in glob.glob(os.path.join(lib_obj_dir, '*', '*.sid')):
+        for f in glob.glob(os.path.join(lib_obj_dir, '*', '*', '*.sid')):
             copy_to_dir(f, sid_dir)
 
         # Create a directory to gather all non-instrumented sources (generated
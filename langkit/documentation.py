@@ -24,8 +24,8 @@ All templates can use the "lang" parameter, which contains "ada", "c" or
 from __future__ import annotations
 
 import textwrap
-from typing import (Any, Callable, Dict, List, Optional, Protocol, Set,
-                    TYPE_CHECKING, Tuple, Union, cast)
+from typing import (Any, Callable, Dict, Iterable, List, Optional, Protocol,
+                    Set, TYPE_CHECKING, Tuple, Union, cast)
 
 from mako.template import Template
 
@@ -55,6 +55,21 @@ class DocDatabase:
         self._used.add(key)
         return self._dict[key]
 
+    @property
+    def used_entries(self) -> Set[str]:
+        """
+        Return a copy of the set of names for documentation entries that were
+        used so far.
+        """
+        return set(self._used)
+
+    def mark_used(self, keys: Iterable[str]) -> None:
+        """
+        Consider that the given documentation entries were used. This is
+        useful to merge the usage of entries from worker processes.
+        """
+        self._used.update(keys)
+
     def report_unused(self) -> None:
         """
         Report all documentation entries that have not been used on the
@@ -303,6 +318,16 @@ base_langkit_docs = {
         Debug helper. Set whether ``Property_Error`` exceptions raised in
         ``Populate_Lexical_Env`` should be discarded. They are by default.
     """,
+    'langkit.context_use_memory_mapped_files': """
+        Set whether analysis units created from files in this context should
+        be lexed directly from a compact copy of the memory-mapped file. This
+        avoids decoding the file into a wide-character buffer, and thus speeds
+        up parsing and reduces memory usage. It is disabled by default.
+
+        This only applies to files that use a single-byte charset (ASCII or
+        Latin-1) and that do not start with a UTF byte order mark: other files
+        are decoded as usual.
+    """,
     'langkit.context_set_logic_resolution_timeout': """
         If ``Timeout`` is greater than zero, set a timeout for the resolution
         of logic equations. The unit is the number of steps in ANY/ALL
@@ -324,6 +349,30 @@ base_langkit_docs = {
         parsing failure, return an analysis unit anyway: errors are described
         as diagnostics of the returned analysis unit.
     """,
+    'langkit.get_units_from_files': """
+        Create new analysis units for all ``Filenames``, or return the
+        existing ones, as ``Get_From_File`` would do for each of them. Units
+        that need to be (re)parsed are lexed and parsed concurrently on
+        ``Jobs`` worker tasks, or on one task per processor if ``Jobs`` is
+        zero. Only lexing and parsing run concurrently: the rest of the
+        processing (for instance lexical environments updates) is sequential.
+
+        % if lang == 'ada':
+        Units can then be fetched with ``Get_From_File`` without parsing them
+        again.
+        % elif lang == 'c':
+        ``Filenames`` and ``Units`` must both have ``Count`` elements: store
+        the analysis unit for each filename at the same index in ``Units``.
+        % else:
+        Return the analysis units in the same order as ``Filenames``.
+        % endif
+
+        % if ctx.has_predicate_parsers:
+        Note that the grammar contains predicates, which evaluate properties
+        during parsing. As properties cannot run concurrently, units are
+        always parsed sequentially.
+        % endif
+    """,
     'langkit.get_unit_from_buffer': """
         Create a new analysis unit for ``Filename`` or return the existing one
         if any. Whether the analysis unit already exists or not, (re)parse it
@@ -383,6 +432,26 @@ base_langkit_docs = {
         If any failure occurs, such as decoding, lexing or parsing failure,
         diagnostic are emitted to explain what happened.
     """,
+    'langkit.unit_reparse_edit': """
+        Replace the source text in ``Edit_Range`` with ``Text`` and reparse
+        the analysis unit accordingly. The end of ``Edit_Range`` is exclusive,
+        so an empty range inserts ``Text``.
+
+        This is a fast path for edits that change only trivia (whitespaces,
+        comments, ...): for them, the unit keeps its current tree, so its
+        nodes remain valid and no parsing is needed. Note that the whole
+        edited source buffer is still lexed again, so the cost of this call
+        grows with the size of the unit, not with the size of the edit. Any
+        other edit is equivalent to reparsing the whole edited source buffer.
+
+        % if lang == 'python':
+        Raise a ``PreconditionFailure`` exception
+        % else:
+        Raise a ``Precondition_Failure`` error
+        % endif
+        if the unit has no source buffer or if ``Edit_Range`` is not a valid
+        source location range for it.
+    """,
     'langkit.unit_reparse_generic': """
         Reparse an analysis unit from a buffer, if provided, or from the
         original file otherwise. If ``Charset`` is empty or ``${null}``, use
@@ -408,6 +477,38 @@ base_langkit_docs = {
         Return the number of trivias in this unit. This is 0 for units that
         were parsed with trivia analysis disabled.
     """,
+    'langkit.token_table_type': """
+        Columnar representation of the stream of tokens and trivia in an
+        analysis unit, as computed by
+        ``${capi.get_name('unit_export_tokens')}``.
+
+        Tokens and trivia are stored in the same order as in the source: the
+        Nth item in each column (i.e. each field of this structure, except
+        ``count``) contains the corresponding data for the Nth token or
+        trivia. Offsets are 0-based indexes in the unit's source buffer: end
+        offsets are exclusive.
+    """,
+    'langkit.unit_export_tokens': """
+        Store data for all the tokens and trivia in UNIT into *TABLE_P.
+        Return zero on failure.
+
+        If the columns in *TABLE_P are null, allocate them as a single memory
+        block, which starts at ``kinds``: it is up to the caller to free it
+        with ``${capi.get_name('destroy_token_table')}``. Otherwise, all
+        columns must be provided by the caller, with room for at least
+        TABLE_P->count items (see ``${capi.get_name('unit_token_count')}``
+        and ``${capi.get_name('unit_trivia_count')}``). In both cases,
+        TABLE_P->count is then set to the number of exported tokens and
+        trivia.
+
+        This is meant to process big token streams efficiently: it is a lot
+        faster than iterating on tokens with
+        ``${capi.get_name('token_next')}``.
+    """,
+    'langkit.destroy_token_table': """
+        Free the memory allocated for TABLE by
+        ``${capi.get_name('unit_export_tokens')}``.
+    """,
     'langkit.unit_text': """
         Return the source buffer associated to this unit.
     """,
@@ -498,6 +599,32 @@ base_langkit_docs = {
         Return the Nth child for in this node's fields and store it into
         *CHILD_P.  Return zero on failure (when N is too big).
     """,
+    'langkit.node_tree_type': """
+        Flat representation of a tree of nodes, as computed by
+        ``${capi.get_name('node_export_tree')}``.
+
+        Nodes are stored in prefix depth-first order, so the root node comes
+        first, and the children of each node come right after it. Null
+        children are skipped. Node data is stored in columns: for each field
+        of this structure (except ``count``), the Nth item in the pointed
+        array contains the corresponding data for the Nth node.
+
+        All columns are allocated as a single memory block that starts at
+        ``nodes`` and ends at the end of ``end_columns``. Use
+        ``${capi.get_name('destroy_node_tree')}`` to free it.
+    """,
+    'langkit.node_export_tree': """
+        Compute a flat representation of the tree of nodes rooted at NODE and
+        store it into *TREE_P. Return zero on failure. Otherwise, it is up to
+        the caller to free the result with
+        ``${capi.get_name('destroy_node_tree')}``.
+
+        This is meant to process big trees efficiently: it is a lot faster
+        than traversing the tree with ``${capi.get_name('node_child')}``.
+    """,
+    'langkit.destroy_node_tree': """
+        Free the memory allocated for TREE.
+    """,
     'langkit.node_is_null': """
         Return whether this node is a null node reference.
     """,
@@ -529,6 +656,17 @@ base_langkit_docs = {
         support some characters). Production code should use real conversion
         routines such as libiconv's in order to deal with UTF-32 texts.
     """,
+    'langkit.text_to_bytes': """
+        Encode TEXT into a dynamically allocated buffer, store its address in
+        *BYTES and its size (in bytes) in *LENGTH. It is up to the caller to
+        free it with ``${capi.get_name('free')}`` when done with it.
+
+        If all characters in TEXT are in the Latin-1 range, encode it in
+        Latin-1 and return 1. Otherwise, encode it in UTF-8 and return 0.
+        Compared to UTF-32, these encodings make the buffer up to four times
+        smaller, which makes transferring big texts to languages such as
+        Python cheaper.
+    """,
     'langkit.free': """
         Free dynamically allocated memory.
 
@@ -641,6 +779,12 @@ base_langkit_docs = {
         current thread. Will be automatically allocated on error and free'd on
         the next error.
     """,
+    'langkit.last_exception': """
+        Exception information for the last error that happened, or null if the
+        last call to the library succeeded. This holds the same value as what
+        ``${capi.get_name('get_last_exception')}`` returns: bindings can read
+        it directly to check for errors without an additional function call.
+    """,
     'langkit.synthetic_nodes': """
         Set of nodes that are synthetic.
 
@@ -938,6 +1082,109 @@ base_langkit_docs = {
         fields in this node. If "self" is a list, field names will be
         "item_{n}" with "n" being the index.
     """,
+    'langkit.python.root_node.export_tree': """
+        Return a flat representation of the sub-tree rooted at this node.
+
+        Traversing a big tree one node at a time is slow: this computes the
+        data for all nodes in a single native call, which is a lot faster.
+
+        :rtype: NodeTree
+    """,
+    'langkit.python.NodeTree': """
+        Flat representation of a tree of nodes, as computed by the
+        ``${pyapi.root_astnode_name}.export_tree`` method.
+
+        Nodes are stored in prefix depth-first order, so the root node comes
+        first, and the children of each node come right after it. Null
+        children are skipped. Node data is available as columns: for each
+        column attribute, the Nth item contains the corresponding data for the
+        Nth node. Columns are memoryview objects that reference native memory
+        without copying it, so they can be used in vectorized processing (for
+        instance with ``numpy.frombuffer``). Columns are:
+
+        * ``kinds``: integer kind for each node (see
+          ``${pyapi.root_astnode_name}.kind_name``).
+        * ``parents``: index of the parent node (-1 for the root node).
+        * ``children_counts``: number of non-null children.
+        * ``token_starts``/``token_ends``: indexes of the first and last tokens
+          for each node. Token end is 0 for ghost nodes.
+        * ``start_lines``/``start_columns``/``end_lines``/``end_columns``:
+          source location ranges for each node.
+    """,
+    'langkit.python.use_lazy_arrays': """
+        Enable or disable lazy arrays.
+
+        By default, arrays that properties return are converted to lists,
+        which requires to convert all their items upfront. When lazy arrays
+        are enabled, they are converted to sequences instead: these keep a
+        reference to the native array and convert items only when they are
+        accessed. They support ``len``, indexing, slicing (which returns a
+        list) and iteration. Arrays of integers, booleans and enumerations can
+        also be viewed as memoryview objects without copying them (see
+        ``as_memoryview``).
+
+        Like nodes, lazy arrays of nodes become stale when one of the units
+        that own their nodes is reparsed: accessing their items then raises a
+        ``StaleReferenceError``. Arrays of other values that contain nodes
+        (structures, for instance) are always converted upfront.
+
+        :param bool enabled: Whether to enable lazy arrays.
+    """,
+    'langkit.python.LazyArray.as_memoryview': """
+        Return a read-only memoryview for the items of this array, without
+        copying them.
+
+        Raise a TypeError if items are not integers, booleans or enumerations.
+        Enumeration values appear as their integer representation.
+
+        :rtype: memoryview
+    """,
+    'langkit.python.AnalysisUnit.token_table': """
+        Return a columnar representation of all the tokens and trivia in this
+        unit.
+
+        Iterating on tokens one at a time is slow: this computes the data for
+        all tokens in a single native call, which is a lot faster.
+
+        :rtype: TokenTable
+    """,
+    'langkit.python.TokenTable': """
+        Columnar representation of the stream of tokens and trivia in an
+        analysis unit, as computed by the ``AnalysisUnit.token_table`` method.
+
+        Tokens and trivia are stored in the same order as in the source. Token
+        data is available as columns: for each column attribute, the Nth item
+        contains the corresponding data for the Nth token or trivia. Columns
+        are memoryview objects that reference native memory without copying
+        it, so they can be used in vectorized processing (for instance with
+        ``numpy.frombuffer``). Columns are:
+
+        * ``kinds``: integer kind for each token (see ``kind_name``).
+        * ``start_offsets``/``end_offsets``: 0-based indexes in the unit text
+          of the first character of each token and of the character that
+          follows the last one.
+        * ``start_lines``/``start_columns``/``end_lines``/``end_columns``:
+          source location ranges for each token.
+        * ``is_trivia``: 1 for trivia, 0 for regular tokens.
+    """,
+    'langkit.python.TokenTable.kind_name': """
+        Return the kind name for the token at the given index in this table.
+
+        :param int index: Index of the token.
+        :rtype: str
+    """,
+    'langkit.python.NodeTree.node': """
+        Return the node at the given index in this tree.
+
+        :param int index: Index of the node to return.
+        :rtype: ${pyapi.root_astnode_name}
+    """,
+    'langkit.python.NodeTree.kind_name': """
+        Return the kind name for the node at the given index in this tree.
+
+        :param int index: Index of the node.
+        :rtype: str
+    """,
     'langkit.python.root_node.dump_str': """
         Dump the sub-tree to a string in a human-readable format.
     """,
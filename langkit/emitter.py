@@ -5,9 +5,11 @@ Code emission for Langkit-generated libraries.
 from distutils.spawn import find_executable
 from io import StringIO
 import json
+import multiprocessing
 import os
 from os import path
 import subprocess
+import sys
 
 from funcy import keep
 
@@ -15,8 +17,9 @@ from langkit.caching import Cache
 from langkit.compile_context import ADA_BODY, ADA_SPEC, get_context
 from langkit.coverage import InstrumentationMetadata
 from langkit.diagnostics import Severity, check_source_language
+from langkit.fingerprints import DEFAULT_COMPONENTS, Fingerprints
 import langkit.names as names
-from langkit.template_utils import add_template_dir
+from langkit.template_utils import add_template_dir, set_template_cache_dir
 from langkit.utils import Colors, printcol
 
 
@@ -46,6 +49,7 @@ def write_source_file(file_path, source, post_process=None):
         # current platform.
         with open(file_path, 'w', encoding='utf-8', newline='') as f:
             f.write(source)
+        context.emitter.rewritten_files.add(file_path)
         return True
     return False
 
@@ -74,6 +78,33 @@ def write_ocaml_file(file_path, source, post_process=None):
             subprocess.check_call(['ocamlformat', '-i', file_path])
 
 
+def _render_pending(index):
+    """
+    Run the rendering job at ``index`` in the list of pending renderings for
+    the current emitter. Return the rendered source and the set of
+    documentation entries that rendering used, so that the main process can
+    account for them.
+
+    This is the entry point for worker processes during parallel emission.
+    These are forked from the main process once all rendering jobs are known,
+    so they can access the compile context and the list of jobs directly.
+
+    :param int index: Index of the job in ``Emitter.pending_renderings``.
+    :rtype: (str, set[str])
+    """
+    ctx = get_context()
+    render, _ = ctx.emitter.pending_renderings[index]
+    used_docs = ctx.documentations.used_entries
+    try:
+        source = render()
+        return (source, ctx.documentations.used_entries - used_docs)
+    finally:
+        # Worker processes may be terminated without flushing standard
+        # streams, which would lose diagnostics.
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
 def ada_file_path(out_dir, source_kind, qual_name):
     """
     Return the name of the Ada file for the given unit name/kind.
@@ -125,7 +156,8 @@ class Emitter:
                  pretty_print=False, post_process_ada=None,
                  post_process_cpp=None, post_process_python=None,
                  coverage=False, relative_project=False,
-                 unparse_script=None):
+                 unparse_script=None, template_cache=False,
+                 incremental=False, jobs=1):
         """
         Generate sources for the analysis library. Also emit a tiny program
         useful for testing purposes.
@@ -178,6 +210,17 @@ class Emitter:
 
         :param bool relative_project: See libmanage's --relative-project
             option.
+
+        :param bool template_cache: If true, keep compiled Mako templates in
+            the build directory so that next code generations do not have to
+            compile them again.
+
+        :param bool incremental: If true, do not render generated units whose
+            inputs did not change since the previous generation. See
+            langkit.fingerprints.
+
+        :param int jobs: Number of processes to use in order to render
+            generated units in parallel. If 1, render them sequentially.
         """
         self.context = context
         self.verbosity = context.verbosity
@@ -198,6 +241,11 @@ class Emitter:
         for dirpath in keep(self.context.template_lookup_extra_dirs):
             add_template_dir(dirpath)
 
+        set_template_cache_dir(
+            os.path.join(self.lib_root, 'obj', 'mako_cache')
+            if template_cache else None
+        )
+
         self.no_property_checks = no_property_checks
         self.generate_ada_api = generate_ada_api or bool(main_programs)
         self.generate_astdoc = generate_astdoc
@@ -226,6 +274,53 @@ class Emitter:
         self.main_source_dirs = main_source_dirs
         self.main_programs = main_programs
 
+        self.jobs = jobs
+
+        self.pending_renderings = []
+        """
+        List of rendering jobs to run during the "render pending sources"
+        pass, in parallel if ``jobs`` is greater than 1. Each job is a couple
+        of callbacks: the first one renders a source file (returns its content)
+        and the second one writes this content to the source file.
+
+        :type: list[(() -> str, (str) -> None)]
+        """
+
+        self.rewritten_files = set()
+        """
+        Set of paths for the source files that were actually (re)written during
+        this code emission. Source files left untouched do not need to be
+        post-processed (for instance pretty-printed) again.
+
+        :type: set[str]
+        """
+
+        self.incremental = incremental
+        self.fingerprints = Fingerprints(context, {
+            'lib_root': os.path.abspath(self.lib_root),
+            'no_property_checks': self.no_property_checks,
+            'generate_ada_api': self.generate_ada_api,
+            'generate_astdoc': self.generate_astdoc,
+            'generate_gdb_hook': self.generate_gdb_hook,
+            'pretty_print': self.pretty_print,
+            'coverage': self.coverage,
+            'relative_project': self.relative_project,
+            'extensions_src_dir': self.extensions_src_dir,
+            'main_source_dirs': sorted(self.main_source_dirs),
+            'main_programs': sorted(self.main_programs),
+            'post_process': [
+                getattr(pp, '__qualname__', None)
+                for pp in (post_process_ada, post_process_cpp,
+                           post_process_python)
+            ],
+        })
+        """
+        Fingerprints for the compiled entities that generated units depend on.
+        Used only when ``incremental`` is true.
+
+        :type: langkit.fingerprints.Fingerprints
+        """
+
         self.lib_name_low = context.ada_api_settings.lib_name.lower()
         """
         Lower-case name for the generated library.
@@ -351,6 +446,96 @@ class Emitter:
 
         self.library_interfaces.add(filename)
 
+    def is_up_to_date(self, file_path, components, *args):
+        """
+        Return whether we can skip the rendering of the source file at
+        ``file_path``, i.e. whether incremental emission is enabled, the file
+        exists and its fingerprint has not changed since the previous
+        generation.
+
+        :param str file_path: Path of the source file to generate.
+        :param tuple[str] components: Names of the components this source file
+            depends on. See langkit.fingerprints.
+        :param args: JSON-able data specific to this source file (template
+            name, arguments, ...).
+        :rtype: bool
+        """
+        key = 'fingerprint:{}'.format(file_path)
+
+        # If incremental emission is disabled, make sure we do not keep a
+        # fingerprint for this source file: it will be rewritten, so it would
+        # be outdated for the next incremental emission.
+        if not self.incremental:
+            self.cache.db.pop(key, None)
+            return False
+
+        fingerprint = self.fingerprints.unit(components, *args)
+        if (
+            self.cache.is_stale(key, fingerprint)
+            or not os.path.exists(file_path)
+        ):
+            return False
+
+        if self.verbosity.debug:
+            printcol('Skipping up-to-date source: {}'.format(file_path),
+                     Colors.OKBLUE)
+        return True
+
+    def defer_rendering(self, render, write):
+        """
+        Schedule the rendering of a source file.
+
+        When emitting sources in parallel, ``render`` is run in a worker
+        process during the "render pending sources" pass. Otherwise, it is
+        run immediately. In both cases, ``write`` is run in this process
+        with the result of ``render``, in the order in which renderings were
+        scheduled, so that the output is deterministic.
+
+        :param () -> str render: Callback to render the source file.
+            Side-effects in this callback are lost during parallel emission,
+            except for the use of documentation entries.
+        :param (str) -> None write: Callback to write the rendered source.
+        """
+        if self.jobs > 1:
+            self.pending_renderings.append((render, write))
+        else:
+            write(render())
+
+    def render_pending_sources(self, ctx):
+        """
+        Run all rendering jobs scheduled with ``defer_rendering``, in parallel,
+        and write the corresponding source files.
+        """
+        jobs = self.pending_renderings
+        if not jobs:
+            return
+
+        def write_results(results):
+            # Documentation entries used in worker processes must be
+            # accounted for here, so that the report of unused entries does
+            # not depend on the number of jobs.
+            for (_, write), (source, used_docs) in zip(jobs, results):
+                ctx.documentations.mark_used(used_docs)
+                write(source)
+
+        # Worker processes need access to the compile context, which cannot be
+        # pickled: rely on "fork" so that they inherit it. If it is not
+        # available on this platform, render sources sequentially.
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            write_results(_render_pending(i) for i in range(len(jobs)))
+
+        else:
+            # Flush standard streams before forking so that buffered output
+            # is not duplicated in worker processes.
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+            mp_ctx = multiprocessing.get_context('fork')
+            with mp_ctx.Pool(min(self.jobs, len(jobs))) as pool:
+                write_results(pool.imap(_render_pending, range(len(jobs))))
+
+        self.pending_renderings = []
+
     def setup_directories(self, ctx):
         """
         Make sure the tree of directories needed for code generation exists.
@@ -403,13 +588,20 @@ class Emitter:
         if not self.generate_astdoc:
             return
 
-        from langkit import astdoc
+        astdoc_path = os.path.join(self.share_path, 'ast-types.html')
+        if self.is_up_to_date(astdoc_path, DEFAULT_COMPONENTS, 'astdoc'):
+            return
+
+        def render():
+            from langkit import astdoc
+
+            f = StringIO()
+            astdoc.write_astdoc(ctx, f)
+            return f.getvalue()
 
-        f = StringIO()
-        astdoc.write_astdoc(ctx, f)
-        f.seek(0)
-        write_source_file(os.path.join(self.share_path, 'ast-types.html'),
-                          f.read())
+        self.defer_rendering(
+            render, lambda source: write_source_file(astdoc_path, source)
+        )
 
     def generate_lexer_dfa(self, ctx):
         """
@@ -440,7 +632,7 @@ class Emitter:
         class Unit:
             def __init__(self, template_base_name, rel_qual_name,
                          has_body=True, ada_api=False, unparser=False,
-                         cached_body=False):
+                         cached_body=False, body_components=()):
                 """
                 :param str template_base_name: Common prefix for the name of
                     the templates to use in order to generate spec/body sources
@@ -461,6 +653,10 @@ class Emitter:
                 :param bool cached_body: If true, only register the body as a
                     library interface, i.e. do not generate it, considering
                     that it is cached.
+
+                :param tuple[str] body_components: Components (see
+                    langkit.fingerprints) that the body depends on, in addition
+                    to the default ones.
                 """
                 self.template_base_name = template_base_name
                 self.qual_name = (
@@ -471,6 +667,7 @@ class Emitter:
                 self.unparser = unparser
                 self.has_body = has_body
                 self.cached_body = cached_body
+                self.body_components = body_components
 
         for u in [
             # Top (pure) package
@@ -482,7 +679,8 @@ class Emitter:
             # Unit for converters between public Ada types and C API-level ones
             Unit('pkg_c', 'C', ada_api=True),
             # Unit for implementation of analysis primitives
-            Unit('pkg_implementation', 'Implementation'),
+            Unit('pkg_implementation', 'Implementation',
+                 body_components=('property_bodies', )),
             # Unit for AST introspection public API
             Unit('pkg_introspection', 'Introspection', ada_api=True),
             # Unit for AST introspection internal API
@@ -505,7 +703,8 @@ class Emitter:
             Unit('pkg_unparsing_impl', 'Unparsing_Implementation',
                  unparser=True),
             # Unit for all parsers
-            Unit('parsers/pkg_main', 'Parsers'),
+            Unit('parsers/pkg_main', 'Parsers',
+                 body_components=('parser_bodies', )),
             # Units for the lexer
             Unit('pkg_lexer', 'Lexer', ada_api=True),
             Unit('pkg_lexer_impl', 'Lexer_Implementation'),
@@ -521,7 +720,8 @@ class Emitter:
                 continue
             self.write_ada_module(self.src_path, u.template_base_name,
                                   u.qual_name, u.has_body, u.cached_body,
-                                  in_library=True)
+                                  in_library=True,
+                                  body_components=u.body_components)
 
     def emit_mains(self, ctx):
         """
@@ -550,16 +750,18 @@ class Emitter:
         """
         Generate header and binding body for the external C API.
         """
-        def render(template_name):
-            return ctx.render_template(template_name)
-
-        with names.lower:
-            write_cpp_file(
-                path.join(
-                    self.include_path,
-                    '{}.h'.format(ctx.c_api_settings.lib_name)),
-                render('c_api/header_c'),
-                self.post_process_cpp
+        def render_header():
+            with names.lower:
+                return ctx.render_template('c_api/header_c')
+
+        header_path = path.join(self.include_path,
+                                '{}.h'.format(ctx.c_api_settings.lib_name))
+        if not self.is_up_to_date(header_path, DEFAULT_COMPONENTS,
+                                  'c_api/header_c'):
+            self.defer_rendering(
+                render_header,
+                lambda source: write_cpp_file(header_path, source,
+                                              self.post_process_cpp)
             )
 
         self.write_ada_module(
@@ -595,20 +797,26 @@ class Emitter:
                 return code
 
         def render_python_template(file_path, *args, **kwargs):
-            with names.camel:
-                code = ctx.render_template(*args, **kwargs)
-
-            # If pretty-printing failed, write the original code anyway in
-            # order to ease debugging.
-            exc = None
-            try:
-                pp_code = pretty_print(code)
-            except SyntaxError:
-                pp_code = code
-
-            write_source_file(file_path, pp_code, self.post_process_python)
-            if exc:
-                raise exc
+            if self.is_up_to_date(file_path, DEFAULT_COMPONENTS, args,
+                                  sorted(kwargs)):
+                return
+
+            def render():
+                with names.camel:
+                    code = ctx.render_template(*args, **kwargs)
+
+                # If pretty-printing failed, write the original code anyway in
+                # order to ease debugging.
+                try:
+                    return pretty_print(code)
+                except SyntaxError:
+                    return code
+
+            self.defer_rendering(
+                render,
+                lambda source: write_source_file(file_path, source,
+                                                 self.post_process_python)
+            )
 
         # Emit the Python modules themselves
         render_python_template(
@@ -691,6 +899,19 @@ class Emitter:
             )
             self.project_languages.add('C')
 
+    def emit_gdb_debug_info(self, ctx):
+        """
+        Emit the sidecar file that GDB helpers load instead of parsing the
+        directives in the implementation body at startup.
+
+        This must run once all Ada sources are written.
+        """
+        from langkit.gdb.debug_info import write_sidecar
+
+        impl_body = ada_file_path(self.src_path, ADA_BODY,
+                                  [ctx.lib_name, names.Name('Implementation')])
+        write_sidecar(impl_body)
+
     def emit_ocaml_api(self, ctx):
         """
         Generate binding for the external OCaml API.
@@ -708,29 +929,31 @@ class Emitter:
 
         with names.camel:
             ctx = get_context()
-            code = ctx.render_template(
-                "ocaml_api/module_ocaml",
-                c_api=ctx.c_api_settings,
-                ocaml_api=ctx.ocaml_api_settings
-            )
-
-            ocaml_filename = '{}.ml'.format(ctx.c_api_settings.lib_name)
-            write_ocaml_file(
-                os.path.join(self.ocaml_path, ocaml_filename),
-                code
-            )
-
-            code = ctx.render_template(
-                "ocaml_api/module_sig_ocaml",
-                c_api=ctx.c_api_settings,
-                ocaml_api=ctx.ocaml_api_settings
-            )
 
-            ocaml_filename = '{}.mli'.format(ctx.c_api_settings.lib_name)
-            write_ocaml_file(
-                os.path.join(self.ocaml_path, ocaml_filename),
-                code
-            )
+            for template_name, ext in [('ocaml_api/module_ocaml', 'ml'),
+                                       ('ocaml_api/module_sig_ocaml', 'mli')]:
+                ocaml_path = os.path.join(
+                    self.ocaml_path,
+                    '{}.{}'.format(ctx.c_api_settings.lib_name, ext)
+                )
+                if self.is_up_to_date(ocaml_path, DEFAULT_COMPONENTS,
+                                      template_name):
+                    continue
+
+                def render(template_name=template_name):
+                    with names.camel:
+                        return ctx.render_template(
+                            template_name,
+                            c_api=ctx.c_api_settings,
+                            ocaml_api=ctx.ocaml_api_settings
+                        )
+
+                self.defer_rendering(
+                    render,
+                    lambda source, ocaml_path=ocaml_path: write_ocaml_file(
+                        ocaml_path, source
+                    )
+                )
 
             # Emit dune file to easily compile and install bindings
             code = ctx.render_template(
@@ -751,7 +974,8 @@ class Emitter:
             )
 
     def write_ada_module(self, out_dir, template_base_name, qual_name,
-                         has_body=True, cached_body=False, in_library=False):
+                         has_body=True, cached_body=False, in_library=False,
+                         body_components=()):
         """
         Write an Ada module (both spec and body) using a standardized scheme
         for finding the corresponding templates.
@@ -771,6 +995,10 @@ class Emitter:
 
         :param bool cached_body: If true, only register the body as a library
             interface, i.e. do not generate it, considering that it is cached.
+
+        :param tuple[str] body_components: Components (see
+            langkit.fingerprints) that the body depends on, in addition to the
+            default ones.
         """
         for kind in [ADA_SPEC] + ([ADA_BODY] if has_body else []):
             qual_name_str = '.'.join(n.camel_with_underscores
@@ -788,20 +1016,39 @@ class Emitter:
             if kind == ADA_BODY and cached_body:
                 continue
 
-            with names.camel_with_underscores:
+            template_name = '{}{}_ada'.format(
+                template_base_name +
+                # If the base name ends with a /, we don't put a "_"
+                # separator.
+                ('' if template_base_name.endswith('/') else '_'),
+                kind
+            )
+
+            # Likewise if inputs for this source did not change since the last
+            # generation.
+            components = DEFAULT_COMPONENTS + (
+                body_components if kind == ADA_BODY else ()
+            )
+            if self.is_up_to_date(
+                ada_file_path(out_dir, kind, full_qual_name), components,
+                template_name, with_clauses
+            ):
+                continue
+
+            def render(template_name=template_name,
+                       with_clauses=with_clauses):
+                with names.camel_with_underscores:
+                    return self.context.render_template(
+                        template_name, with_clauses=with_clauses
+                    )
+
+            def write(source, kind=kind, full_qual_name=full_qual_name):
                 write_ada_file(
                     out_dir=out_dir,
                     source_kind=kind,
                     qual_name=full_qual_name,
-                    content=self.context.render_template(
-                        '{}{}_ada'.format(
-                            template_base_name +
-                            # If the base name ends with a /, we don't
-                            # put a "_" separator.
-                            ('' if template_base_name.endswith('/') else '_'),
-                            kind
-                        ),
-                        with_clauses=with_clauses,
-                    ),
+                    content=source,
                     post_process=self.post_process_ada
                 )
+
+            self.defer_rendering(render, write)
@@ -14,9 +14,9 @@ from langkit.diagnostics import (
 )
 from langkit.expressions.base import (
     AbstractExpression, AbstractVariable, CallExpr, ComputingExpr,
-    FieldAccessExpr, NullCheckExpr, PropertyDef, SequenceExpr, T,
-    UncheckedCastExpr, attr_call, attr_expr, auto_attr, auto_attr_custom,
-    construct, render, unsugar
+    FieldAccessExpr, IntegerLiteralExpr, NullCheckExpr, PropertyDef,
+    SequenceExpr, T, UncheckedCastExpr, attr_call, attr_expr, auto_attr,
+    auto_attr_custom, construct, render, unsugar
 )
 from langkit.expressions.envs import make_as_entity
 
@@ -295,6 +295,84 @@ class CollectionExpression(AbstractExpression):
         )
 
 
+class IterationExpr(ComputingExpr):
+    """
+    Base class for resolved expressions that iterate on a collection: map
+    expressions and quantifiers.
+
+    Subclasses must define the "collection", "element_vars", "index_var" and
+    "iter_scope" attributes (see Map.Expr).
+    """
+
+    @property
+    def fused_collection(self):
+        """
+        If the collection to iterate on is a map expression, return it.
+        Return None otherwise.
+
+        The items that map expressions yield can be processed in the loop that
+        computes them, so there is no need to materialize them in an array
+        when they are immediately iterated on: chains of collection operations
+        (for instance ``x.filter(...).map(...).any(...)``) generate a single
+        loop.
+
+        :rtype: Map.Expr|None
+        """
+        return (self.collection
+                if isinstance(self.collection, Map.Expr) else
+                None)
+
+    @property
+    def loop_scopes(self):
+        """
+        Return the scopes for all the loops that this iteration nests, from
+        the innermost to the outermost one.
+
+        :rtype: list[langkit.expressions.base.LocalVars.Scope]
+        """
+        result = [self.iter_scope]
+        if self.fused_collection:
+            result.extend(self.fused_collection.loop_scopes)
+        return result
+
+    @property
+    def loop_label(self):
+        """
+        Name of the loop that the iteration for this expression generates.
+
+        :rtype: names.Name
+        """
+        return self.result_var.name + names.Name('Loop')
+
+    def render_iteration(self, label, body):
+        """
+        Render the loop to iterate on the collection.
+
+        :param names.Name label: Name for the outermost loop.
+        :param () -> str body: Callback to render the statements to run for
+            each collection item, once iteration variables are bound.
+        :rtype: str
+        """
+        return render('properties/iterate_ada', it=self, label=label,
+                      body=body)
+
+    def render_loop_exit(self, label):
+        """
+        Render statements to stop the iteration early.
+
+        :param names.Name label: Name for the outermost loop.
+        :rtype: str
+        """
+        # Leaving the loop early skips the finalization of the scopes it
+        # contains, so do it first.
+        return '\n'.join(
+            ['{};'.format(scope.finalizer_name)
+             for scope in self.loop_scopes
+             if scope.has_refcounted_vars()]
+            + ['exit {};'.format(label)]
+        )
+
+
 @attr_call('contains')
 class Contains(CollectionExpression):
     """
@@ -364,6 +442,19 @@ def map(collection, expr):
     .. code:: python
 
         node_array.map(lambda n: n.parent)
+
+    When the result of a map expression (including :dsl:`filter`,
+    :dsl:`mapcat` and :dsl:`take_while`) is directly used by another
+    collection operation, its items are computed as this operation processes
+    them. Operations that stop early (:dsl:`all`, :dsl:`any`, ``find``,
+    :dsl:`take_while` and :dsl:`at` with a non-negative constant index) thus
+    do not evaluate the remaining items: errors that the evaluation of these
+    items would raise are not propagated. For instance, the following returns
+    0 instead of raising a property error:
+
+    .. code:: python
+
+        int_array.map(lambda i: If(i == 2, PropertyError(T.Int), i)).at(0)
     """
     return Map(collection, expr)
 
@@ -400,7 +491,7 @@ class Map(CollectionExpression):
     Abstract expression that is the result of a map expression evaluation.
     """
 
-    class Expr(ComputingExpr):
+    class Expr(IterationExpr):
         """
         Resolved expression that represents a map expression in the generated
         code.
@@ -431,6 +522,15 @@ class Map(CollectionExpression):
             self.do_concat = do_concat
             self.iter_scope = iter_scope
 
+            self.limit = None
+            """
+            If not None, maximum number of items that consumers of the
+            resulting array will use: stop the iteration as soon as this
+            number is reached.
+
+            :type: int|None
+            """
+
             element_type = (self.expr.type.element_type
                             if self.do_concat else
                             self.expr.type)
@@ -448,7 +548,22 @@ class Map(CollectionExpression):
             )
 
         def _render_pre(self):
-            return render('properties/map_ada', map=self, Name=names.Name)
+            return render('properties/map_ada', map=self, consume=None,
+                          label=self.loop_label, Name=names.Name)
+
+        def render_items(self, label, consume):
+            """
+            Render the iteration for this map expression, without building
+            the resulting array.
+
+            :param names.Name label: Name for the outermost loop.
+            :param (str) -> str consume: Callback to render statements that
+                process each item that this map expression yields. It takes
+                the Ada expression for the item.
+            :rtype: str
+            """
+            return render('properties/map_ada', map=self, consume=consume,
+                          label=label, Name=names.Name)
 
         @property
         def subexprs(self):
@@ -613,9 +728,12 @@ class Quantifier(CollectionExpression):
     .. code:: python
 
         int_array.all(lambda i: i > 0)
+
+    If `collection` is a map expression, its items are evaluated only until
+    the result is known (see :dsl:`map`).
     """
 
-    class Expr(ComputingExpr):
+    class Expr(IterationExpr):
         static_type = T.Bool
         pretty_class_name = 'Quantifier'
 
@@ -662,7 +780,8 @@ class Quantifier(CollectionExpression):
         def _render_pre(self):
             return render(
                 'properties/quantifier_ada', quantifier=self,
-                ALL=Quantifier.ALL, ANY=Quantifier.ANY, Name=names.Name
+                ALL=Quantifier.ALL, ANY=Quantifier.ANY,
+                label=self.loop_label, Name=names.Name
             )
 
         @property
@@ -734,6 +853,10 @@ def collection_get(self, collection, index, or_null):
     elements in reverse order. For instance, ``expr.at(-1)`` will return the
     last element.
 
+    If `collection` is a map expression and `index` is a non-negative
+    constant, items after the requested one are not evaluated (see
+    :dsl:`map`).
+
     :param bool or_null: If true, the expression will return null if the
         index is not valid for the collection. If False, it will raise an
         exception.
@@ -756,6 +879,15 @@ def collection_get(self, collection, index, or_null):
         )
     )
 
+    # If the collection is a map expression and the index is a non-negative
+    # constant, there is no need to compute the items after the one we want.
+    if (
+        isinstance(coll_expr, Map.Expr)
+        and isinstance(index_expr, IntegerLiteralExpr)
+        and index_expr.value >= 0
+    ):
+        coll_expr.limit = index_expr.value + 1
+
     # We process null list nodes as empty lists, so insert a null check before
     # getting the collection item only if asked to raise an exception.
     if not or_null:
@@ -778,6 +910,41 @@ def collection_get(self, collection, index, or_null):
     return result
 
 
+class MapLengthExpr(ComputingExpr):
+    """
+    Resolved expression to compute the number of items that a map expression
+    yields, without building the array for them.
+    """
+    static_type = T.Int
+    pretty_class_name = 'MapLength'
+
+    def __init__(self, map_expr, abstract_expr=None):
+        """
+        :param Map.Expr map_expr: Map expression whose items to count.
+        :param AbstractExpression|None abstract_expr: See ResolvedExpression's
+            constructor.
+        """
+        self.map_expr = map_expr
+        super().__init__('Len', abstract_expr=abstract_expr)
+
+    def _render_pre(self):
+        result_var = self.result_var.name
+        return '{} := 0;\n{}'.format(
+            result_var,
+            self.map_expr.render_items(
+                result_var + names.Name('Loop'),
+                lambda item: '{0} := {0} + 1;'.format(result_var)
+            )
+        )
+
+    @property
+    def subexprs(self):
+        return {'collection': self.map_expr}
+
+    def __repr__(self):
+        return '<MapLengthExpr>'
+
+
 @auto_attr
 def length(self, collection):
     """
@@ -786,6 +953,10 @@ def length(self, collection):
     coll_expr = construct(collection)
     orig_type = coll_expr.type
 
+    # There is no need to build an array just to get its length
+    if isinstance(coll_expr, Map.Expr):
+        return MapLengthExpr(coll_expr, abstract_expr=self)
+
     # Automatically unwrap entities
     if coll_expr.type.is_entity_type:
         coll_expr = FieldAccessExpr(coll_expr, 'Node', coll_expr.type.astnode,
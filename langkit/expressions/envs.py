@@ -151,6 +151,12 @@ class EnvGet(AbstractExpression):
                 result.append(self.sequential_from.render_pre())
                 args.append(('From', self.sequential_from.render_expr()))
 
+            # If there are memoized properties, let the lookup record the
+            # analysis units it depends on, so that memoized results can be
+            # invalidated only when one of these units changes.
+            if get_context().has_memoization:
+                args.append(('Dependencies', 'Mmz_Dependencies (Self)'))
+
             if self.only_first:
                 result_expr = 'AST_Envs.Get_First ({})'.format(
                     ', '.join('{} => {}'.format(n, v) for n, v in args)
@@ -0,0 +1,289 @@
+"""
+Fingerprints of compiled entities, used to skip the rendering of generated
+units whose inputs did not change since the previous code generation.
+
+Each generated unit depends on a set of *components*: the lexer, the
+"interface" of all compiled types (including the declarations of fields and
+properties), the grammar, the code for parsers, the code for property bodies
+and general settings. The fingerprint of a unit is a digest of the
+fingerprints of all components it depends on, plus unit-specific data (template
+name, WITH clauses, ...). If the fingerprint for a unit has not changed since
+the last generation (and the generated file is still present), there is no
+need to render it again.
+
+Fingerprints are designed to be conservative: it is fine to consider a unit as
+stale when it is not (this is just a missed optimization), but it is not fine
+to consider it as up-to-date when it is not.
+"""
+
+import functools
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from mako.template import Template
+
+import langkit
+from langkit.compile_context import CompileCtx
+from langkit.compiled_types import AbstractNodeData, CompiledType
+from langkit.diagnostics import Location
+from langkit.expressions.base import AbstractExpression, ResolvedExpression
+from langkit.lexer import Lexer
+import langkit.names as names
+from langkit.parsers import Parser
+from langkit.template_utils import templates_digest
+
+
+COMPONENTS = ('settings', 'lexer', 'types', 'grammar', 'parser_bodies',
+              'property_bodies')
+"""
+Names of all components on which generated units can depend.
+"""
+
+DEFAULT_COMPONENTS = ('settings', 'lexer', 'types', 'grammar')
+"""
+Components on which generated units depend by default, i.e. everything except
+code for property and parser bodies, which appear only in specific units.
+"""
+
+_IGNORED_ATTRS = {
+    # Source locations and declaration order counters change when unrelated
+    # entities are added before the ones they belong to. Locations that are
+    # relevant to generated code (GDB directives) appear in rendered code
+    # anyway.
+    'location', '_serial',
+
+    # Property bodies, both before and after expression construction: they
+    # are handled by the "property_bodies" component.
+    'expr', 'constructed_expr', 'vars', 'prop_def', 'untyped_wrapper_def',
+}
+"""
+Names of attributes that ``object_signature`` ignores.
+"""
+
+_REFERENCE_TYPES = (CompiledType, AbstractNodeData, Parser, Lexer, CompileCtx,
+                    Location, AbstractExpression, ResolvedExpression)
+"""
+Types for objects that ``object_signature`` serializes as mere references
+instead of serializing their content.
+"""
+
+
+def _reference(obj: Any) -> Any:
+    """
+    Return a JSON-able reference to ``obj``, whose type is in
+    ``_REFERENCE_TYPES``.
+    """
+    if isinstance(obj, CompiledType):
+        return ['type', obj.dsl_name]
+    elif isinstance(obj, AbstractNodeData):
+        return ['field', obj.qualname]
+    elif isinstance(obj, Parser):
+        return ['parser', obj.gen_fn_name.camel_with_underscores]
+    else:
+        return [type(obj).__name__]
+
+
+def object_signature(obj: Any,
+                     depth: int = 0,
+                     _active: Optional[Set[int]] = None) -> Any:
+    """
+    Return a JSON-able and deterministic representation of ``obj``.
+
+    Compiled types, node data, parsers and expressions nested in ``obj`` are
+    represented as references only (see ``_reference``): they are
+    fingerprinted on their own. Other objects are represented as the
+    signature of all their attributes, however deep they are nested. Objects
+    that (transitively) contain themselves are represented by their type name
+    when they are met again.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    elif isinstance(obj, names.Name):
+        return obj.camel_with_underscores
+    elif isinstance(obj, Template):
+        # Templates (for instance for documentation entries) embed addresses
+        # in their compiled code: just use their source.
+        return ['Template', obj.source]
+    elif depth > 0 and isinstance(obj, _REFERENCE_TYPES):
+        return _reference(obj)
+
+    active = set() if _active is None else _active
+    if id(obj) in active:
+        return [type(obj).__name__]
+    active.add(id(obj))
+
+    def recurse(o: Any, nested: bool = False) -> Any:
+        # Items in containers are considered at the same nesting level as
+        # the container itself, attributes of objects one level deeper.
+        return object_signature(o, depth + 1 if nested else depth, active)
+
+    try:
+        if isinstance(obj, (list, tuple)):
+            return [recurse(o) for o in obj]
+        elif isinstance(obj, (set, frozenset)):
+            return sorted((recurse(o) for o in obj),
+                          key=lambda s: json.dumps(s, sort_keys=True))
+        elif isinstance(obj, dict):
+            return sorted(
+                ([recurse(k), recurse(v)] for k, v in obj.items()),
+                key=lambda s: json.dumps(s, sort_keys=True)
+            )
+        elif not hasattr(obj, '__dict__'):
+            return [type(obj).__name__]
+        else:
+            return [type(obj).__name__] + [
+                [k, recurse(v, nested=True)]
+                for k, v in sorted(vars(obj).items())
+                if k not in _IGNORED_ATTRS and not k.startswith('_cache_')
+            ]
+    finally:
+        active.remove(id(obj))
+
+
+def digest(signature: Any) -> str:
+    """
+    Return a hex digest for a JSON-able signature.
+    """
+    return hashlib.sha256(
+        json.dumps(signature, sort_keys=True).encode('utf-8')
+    ).hexdigest()
+
+
+def _dir_digest(dirpath: str, extension: Optional[str] = None) -> str:
+    """
+    Return a digest for the content of all files in the ``dirpath``
+    directory. If ``extension`` is not None, consider only files whose name
+    ends with it.
+    """
+    h = hashlib.sha256()
+    for root, dirs, files in os.walk(dirpath):
+        dirs.sort()
+        for f in sorted(files):
+            if extension is not None and not f.endswith(extension):
+                continue
+            path = os.path.join(root, f)
+            h.update(os.path.relpath(path, dirpath).encode('utf-8'))
+            with open(path, 'rb') as fp:
+                h.update(fp.read())
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def langkit_sources_digest() -> str:
+    """
+    Return a digest for the Python sources of the Langkit package, so that
+    changes in code generators invalidate all fingerprints.
+    """
+    return _dir_digest(os.path.dirname(os.path.abspath(langkit.__file__)),
+                       '.py')
+
+
+class Fingerprints:
+    """
+    Lazily compute fingerprints for the components of a compile context.
+    """
+
+    def __init__(self, context: CompileCtx, emitter_options: Dict[str, Any]):
+        """
+        :param context: Compile context for which to compute fingerprints.
+        :param emitter_options: JSON-able set of options for the emitter that
+            can affect code generation.
+        """
+        self.context = context
+        self.emitter_options = emitter_options
+        self._components: Dict[str, str] = {}
+
+    def component(self, name: str) -> str:
+        """
+        Return the fingerprint for the given component.
+        """
+        assert name in COMPONENTS, 'Invalid component: {}'.format(name)
+        try:
+            return self._components[name]
+        except KeyError:
+            result = digest(getattr(self, '_{}_signature'.format(name))())
+            self._components[name] = result
+            return result
+
+    def unit(self, components: Sequence[str], *args: Any) -> str:
+        """
+        Return the fingerprint for a unit that depends on the given
+        components. ``args`` must be JSON-able data specific to this unit
+        (template name, WITH clauses, ...).
+        """
+        return digest([[c, self.component(c)] for c in sorted(components)]
+                      + [object_signature(a) for a in args])
+
+    def _settings_signature(self) -> Any:
+        ctx = self.context
+        return [
+            templates_digest(),
+            langkit_sources_digest(),
+            [_dir_digest(d) for d in ([ctx.extensions_dir]
+                                      if ctx.extensions_dir else [])],
+            sorted(ctx.additional_source_files),
+            self.emitter_options,
+            object_signature([
+                ctx.lang_name, ctx.lib_name, ctx.short_name,
+                ctx.ada_api_settings, ctx.c_api_settings,
+                ctx.python_api_settings, ctx.ocaml_api_settings,
+                ctx.default_charset, ctx.default_tab_stop,
+                ctx.default_unit_provider, ctx.symbol_canonicalizer,
+                ctx.documentations, ctx.generate_unparser,
+                ctx.default_max_call_depth, ctx.show_property_logging,
+                ctx.packrat_memo_kind, ctx.packrat_memo_size,
+                ctx.compact_source_buffers,
+            ], depth=1),
+        ]
+
+    def _lexer_signature(self) -> Any:
+        return self.context.lexer.signature
+
+    def _types_signature(self) -> Any:
+        ctx = self.context
+        all_types: List[CompiledType] = (
+            list(ctx.astnode_types) + list(ctx.struct_types)
+            + list(ctx.entity_types) + list(ctx.enum_types)
+            + list(ctx.array_types)
+        )
+        seen: Set[int] = set()
+        result = []
+        for t in all_types:
+            if id(t) in seen:
+                continue
+            seen.add(id(t))
+
+            fields = (t.get_abstract_node_data(include_inherited=False)
+                      if t.is_base_struct_type else [])
+            result.append([object_signature(t),
+                           [object_signature(f) for f in fields]])
+
+        return [
+            result,
+            object_signature([
+                ctx.symbol_literals, ctx.memoization_keys,
+                ctx.memoization_values, ctx.env_metadata, ctx.ple_unit_root,
+                ctx.node_kind_constants, ctx.has_env_assoc,
+                ctx.has_env_assoc_array, ctx.has_ref_env, ctx.ref_cats,
+                ctx.exception_types, ctx.logic_binders,
+            ], depth=1),
+        ]
+
+    def _grammar_signature(self) -> Any:
+        ctx = self.context
+        return [
+            ctx.grammar.user_defined_rules,
+            ctx.grammar.main_rule_name,
+            ctx.grammar.memo_options,
+            [p.spec for p in ctx.generated_parsers],
+            object_signature(ctx.unparsers),
+        ]
+
+    def _parser_bodies_signature(self) -> Any:
+        return [p.body for p in self.context.generated_parsers]
+
+    def _property_bodies_signature(self) -> Any:
+        return [[p.qualname, p.prop_def, p.untyped_wrapper_def]
+                for p in self.context.all_properties(include_inherited=False)]
@@ -3,7 +3,10 @@ Data structures for mapping from generated library source lines to the
 properties DSL level.
 """
 
+import hashlib
 import inspect
+import json
+import os.path
 import shlex
 from typing import Dict
 
@@ -17,11 +20,150 @@ except ImportError:
 from langkit.gdb.state import Binding, ExpressionEvaluation
 
 
+SIDECAR_VERSION = 1
+"""
+Version number for the format of debug info sidecar files. Sidecar files that
+have a different version number are ignored.
+"""
+
+
 class ParseError(Exception):
     def __init__(self, line_no, message):
         super().__init__('line {}: {}'.format(line_no, message))
 
 
+def sidecar_filename(filename):
+    """
+    Return the name of the debug info sidecar file for the given
+    "$-implementation.adb" source file.
+
+    :param str filename: Name of the "$-implementation.adb" source file.
+    :rtype: str
+    """
+    return '{}.gdbinfo.json'.format(os.path.splitext(filename)[0])
+
+
+def source_digest(content):
+    """
+    Return the digest of the given source file content, used to check that a
+    sidecar file is up-to-date with respect to its source file.
+
+    :param bytes content: Content of the source file.
+    :rtype: str
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+def decode_source(content):
+    """
+    Return the list of lines in the given source file content.
+
+    :param bytes content: Content of the source file.
+    :rtype: list[str]
+    """
+    # Do not use str.splitlines, as it splits on more than line feeds, so
+    # line numbers would not match the ones GDB uses.
+    return content.decode('utf-8', errors='replace').split('\n')
+
+
+def iter_directives(lines):
+    """
+    Yield the line number, the name and the arguments for all GDB helpers
+    directives in the given source lines. Raise a ParseError if a directive
+    has no name.
+
+    :param iter[str] lines: Iterable that yields all the lines to parse.
+    :rtype: iter[(int, str, list[str])]
+    """
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line.startswith('--#'):
+            continue
+        line = line[3:].strip()
+        args = shlex.split(line)
+
+        try:
+            name = args.pop(0)
+        except IndexError:
+            raise ParseError(line_no, 'directive name is missing')
+
+        yield (line_no, name, args)
+
+
+def write_sidecar(filename):
+    """
+    Write the debug info sidecar file for the given "$-implementation.adb"
+    source file, unless there is already an up-to-date one.
+
+    The sidecar contains the directives of each property, grouped by property,
+    so that GDB helpers can load them lazily, one property at a time, instead
+    of parsing the whole source file at startup. If the source file contains
+    invalid directives, remove the sidecar instead so that GDB helpers fall
+    back to parsing the source file, and report the error.
+
+    :param str filename: Name of the "$-implementation.adb" source file.
+    :return: Whether the sidecar file is now up-to-date.
+    :rtype: bool
+    """
+    sidecar = sidecar_filename(filename)
+    with open(filename, 'rb') as f:
+        content = f.read()
+    source = {'size': len(content), 'sha256': source_digest(content)}
+
+    if DebugInfo._load_sidecar(sidecar, source) is not None:
+        return True
+
+    # Check that directives are valid before grouping them by property:
+    # grouping relies on scopes being properly nested.
+    try:
+        directives = list(iter_directives(decode_source(content)))
+        DebugInfo(context=None)._parse_directives(directives)
+    except ParseError as exc:
+        print('Error while parsing directives in {}:'.format(filename))
+        print(str(exc))
+        if os.path.exists(sidecar):
+            os.remove(sidecar)
+        return False
+
+    properties = []
+    depth = 0
+    for line_no, name, args in directives:
+        if depth == 0:
+            assert name == 'property-start'
+            prop_name, info = args
+            current = {
+                'name': prop_name,
+                'first_line': line_no,
+                'last_line': None,
+                'dsl_sloc': None if info == 'dispatcher' else info,
+                'is_dispatcher': info == 'dispatcher',
+                'body_start': None,
+                'directives': [],
+            }
+            properties.append(current)
+            depth = 1
+            continue
+
+        if name in ('scope-start', 'property-call-start',
+                    'memoization-lookup'):
+            depth += 1
+        elif name == 'end':
+            depth -= 1
+            if depth == 0:
+                current['last_line'] = line_no
+                continue
+        elif name == 'property-body-start':
+            current['body_start'] = line_no
+        current['directives'].append([line_no, name] + args)
+
+    with open(sidecar, 'w') as f:
+        json.dump({'version': SIDECAR_VERSION,
+                   'source': source,
+                   'properties': properties},
+                  f, separators=(',', ':'))
+    return True
+
+
 class DebugInfo:
     """
     Holder for all info that maps generated code to the properties DSL level.
@@ -49,6 +191,14 @@ class DebugInfo:
         :type: list[Property]
         """
 
+        self.sidecar = None
+        """
+        :type: str|None
+
+        Name of the sidecar file from which debug info was loaded, or None if
+        it was parsed from the source file.
+        """
+
         self.properties_dict = {}
         """
         Name-based lookup dictionnary for properties.
@@ -61,29 +211,103 @@ class DebugInfo:
         """
         Try to parse the $-implementation.adb source file that GDB found.
 
-        This extracts mapping information from its GDB helpers directives.
-        Print error messages on standard output if anything goes wrong, but
-        always return a DebugInfo instance anyway.
+        This extracts mapping information from its GDB helpers directives (see
+        ``parse_from_file``). Print error messages on standard output if
+        anything goes wrong, but always return a DebugInfo instance anyway.
 
         :rtype: DebugInfo
         """
-
-        result = cls(context)
-
         # Look for the "$-implementation.adb" file using some symbol that is
         # supposed to be defined there.
         has_unit_sym = gdb.lookup_global_symbol(
             '{}__implementation__is_null'.format(context.lib_name)
         )
         if not has_unit_sym:
-            return result
+            return cls(context)
 
-        filename = has_unit_sym.symtab.fullname()
-        with open(filename, 'r') as f:
-            result._try_parse(filename, f)
+        return cls.parse_from_file(context, has_unit_sym.symtab.fullname())
+
+    @classmethod
+    def parse_from_file(cls, context, filename):
+        """
+        Load debug info for the given $-implementation.adb source file.
+
+        If an up-to-date sidecar file is available for it (see
+        ``write_sidecar``), load the property index from it and defer the
+        loading of each property until it is needed. Otherwise, parse
+        directives in the source file. Print error messages on standard output
+        if anything goes wrong, but always return a DebugInfo instance anyway.
+
+        :param langkit.gdb.context.Context|None context: See the corresponding
+            attribute.
+        :param str filename: Name of the source file.
+        :rtype: DebugInfo
+        """
+        result = cls(context)
+
+        with open(filename, 'rb') as f:
+            content = f.read()
+        sidecar = sidecar_filename(filename)
+        sidecar_content = cls._load_sidecar(
+            sidecar, {'size': len(content), 'sha256': source_digest(content)}
+        )
+        if sidecar_content is None:
+            result._try_parse(filename, decode_source(content))
+        else:
+            result.sidecar = sidecar
+            result._load_properties(filename, sidecar_content['properties'])
 
         return result
 
+    @staticmethod
+    def _load_sidecar(filename, source):
+        """
+        Internal method. Load the given sidecar file and return its decoded
+        content. Return None if it does not exist, is invalid, has an
+        unsupported version or does not match the given source file info.
+
+        :param str filename: Name of the sidecar file to load.
+        :param dict source: Size and digest of the source file.
+        :rtype: dict|None
+        """
+        try:
+            with open(filename, 'r') as f:
+                sidecar = json.load(f)
+        except (IOError, ValueError):
+            return None
+
+        if (
+            not isinstance(sidecar, dict)
+            or sidecar.get('version') != SIDECAR_VERSION
+            or sidecar.get('source') != source
+        ):
+            return None
+        return sidecar
+
+    def _load_properties(self, filename, properties):
+        """
+        Internal method. Fill self with the property index from a sidecar
+        file. The events of each property are loaded on first access.
+
+        :param str filename: Name of the "$-implementation.adb" source file.
+        :param list[dict] properties: Property entries from the sidecar file.
+        """
+        self.filename = filename
+        self.properties = []
+        self.properties_dict = {}
+        for entry in properties:
+            p = Property(
+                LineRange(entry['first_line'], entry['last_line']),
+                entry['name'],
+                (None if entry['dsl_sloc'] is None
+                 else DSLLocation.parse(entry['dsl_sloc'])),
+                entry['is_dispatcher']
+            )
+            p.body_start = entry['body_start']
+            p._pending_directives = (self, entry['directives'])
+            self.properties.append(p)
+            self.properties_dict[p.name] = p
+
     @classmethod
     def parse_from_iterable(cls, filename, lines):
         """
@@ -122,129 +346,160 @@ class DebugInfo:
             a custom iterator, ...
         :rtype: None
         """
+        self._parse_directives(iter_directives(lines))
+
+    def _parse_directives(self, directives):
+        """
+        Internal method. Fill self according to the given GDB helpers
+        directives. Raise a ParseError if anything goes wrong.
+
+        :param iter[(int, str, list[str])] directives: Line number, name and
+            arguments for all directives, as yielded by ``iter_directives``.
+        :rtype: None
+        """
         self.properties = []
         self.properties_dict = {}
         scope_stack = []
         expr_stack = []
+        line_no = 0
 
-        for line_no, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line.startswith('--#'):
-                continue
-            line = line[3:].strip()
-            args = shlex.split(line)
-
-            try:
-                name = args.pop(0)
-            except IndexError:
-                raise ParseError(line_no, 'directive name is missing')
-
-            d = Directive.parse(line_no, name, args)
-
-            if d.is_a(PropertyStart):
-                if scope_stack:
-                    raise ParseError(line_no, 'property-start directive not'
-                                     ' allowed inside another property')
-                p = Property(LineRange(d.line_no, None), d.name, d.dsl_sloc,
-                             d.is_dispatcher)
-                self.properties.append(p)
-                self.properties_dict[p.name] = p
-                scope_stack.append(p)
-
-            elif d.is_a(ScopeStart, PropertyCallStart,
-                        MemoizationLookupDirective):
-                if not scope_stack or not isinstance(scope_stack[-1], Scope):
-                    raise ParseError(
-                        line_no,
-                        '{} directive must occur inside a property or a'
-                        ' property scope'.format(d.directive_name)
-                    )
+        for line_no, name, args in directives:
+            self._process_directive(Directive.parse(line_no, name, args),
+                                    scope_stack, expr_stack)
 
-                line_range = LineRange(d.line_no, None)
-
-                if d.is_a(MemoizationLookupDirective):
-                    new_scope = MemoizationLookup(line_range)
-                elif d.is_a(PropertyCallStart):
-                    new_scope = PropertyCall(line_range, d.name)
-                else:
-                    assert d.is_a(ScopeStart)
-                    new_scope = Scope(line_range)
-
-                scope_stack.append(new_scope)
-
-            elif d.is_a(End):
-                if not scope_stack:
-                    raise ParseError(line_no, 'no scope to end')
-                ended_scope = scope_stack.pop()
-                ended_scope.line_range.last_line = d.line_no
-                if scope_stack:
-                    scope_stack[-1].events.append(ended_scope)
-                else:
-                    assert isinstance(ended_scope, Property), (
-                        'Top-level scopes must all be properties'
-                    )
-                    assert not expr_stack, (
-                        'Some expressions are not done when leaving property'
-                        ' {}: {}'.format(
-                            ended_scope.name,
-                            ', '.join(expr_stack)
-                        )
-                    )
+        if scope_stack:
+            raise ParseError(line_no, 'end of scope expected before end of'
+                                      ' file')
 
-            elif d.is_a(BindDirective):
-                if not scope_stack:
-                    raise ParseError(line_no, 'no scope for binding')
-                scope_stack[-1].events.append(Bind(d.line_no, d.dsl_name,
-                                                   d.gen_name))
-
-            elif d.is_a(ExprStartDirective):
-                if not scope_stack:
-                    raise ParseError(line_no, 'no scope for expression')
-                start_event = ExprStart(d.line_no, d.expr_id, d.expr_repr,
-                                        d.result_var, d.dsl_sloc)
-                scope_stack[-1].events.append(start_event)
-                if expr_stack:
-                    expr_stack[-1].sub_expr_start.append(start_event)
-                expr_stack.append(start_event)
-
-            elif d.is_a(ExprDoneDirective):
-                if not scope_stack:
-                    raise ParseError(line_no, 'no scope for expression')
-                done_event = ExprDone(d.line_no, d.expr_id)
-                start_event = expr_stack.pop()
-                assert start_event.expr_id == done_event.expr_id, (
-                    'Mismatching ExprStart/ExprStop events: {} and {}'.format(
-                        start_event, done_event
-                    )
+    def _load_property_events(self, prop, directives):
+        """
+        Internal method. Fill the events of ``prop`` according to its
+        directives from a sidecar file.
+
+        :param Property prop: Property whose events must be loaded.
+        :param list[list] directives: Line number, name and arguments for all
+            the directives inside this property.
+        """
+        scope_stack = [prop]
+        expr_stack = []
+        for line_no, name, *args in directives:
+            self._process_directive(Directive.parse(line_no, name, args),
+                                    scope_stack, expr_stack)
+        assert scope_stack == [prop] and not expr_stack, (
+            'Unbalanced directives in property {}'.format(prop.name)
+        )
+
+    def _process_directive(self, d, scope_stack, expr_stack):
+        """
+        Internal method. Update self, the stack of open scopes and the stack
+        of open expressions according to the ``d`` directive. Raise a
+        ParseError if anything goes wrong.
+
+        :param Directive d: Directive to process.
+        :param list[Scope|PropertyCall] scope_stack: Stack of open scopes.
+        :param list[ExprStart] expr_stack: Stack of open expressions.
+        """
+        line_no = d.line_no
+        if d.is_a(PropertyStart):
+            if scope_stack:
+                raise ParseError(line_no, 'property-start directive not'
+                                 ' allowed inside another property')
+            p = Property(LineRange(d.line_no, None), d.name, d.dsl_sloc,
+                         d.is_dispatcher)
+            self.properties.append(p)
+            self.properties_dict[p.name] = p
+            scope_stack.append(p)
+
+        elif d.is_a(ScopeStart, PropertyCallStart,
+                    MemoizationLookupDirective):
+            if not scope_stack or not isinstance(scope_stack[-1], Scope):
+                raise ParseError(
+                    line_no,
+                    '{} directive must occur inside a property or a'
+                    ' property scope'.format(d.directive_name)
                 )
-                start_event._done_event = done_event
-                scope_stack[-1].events.append(done_event)
-
-            elif d.is_a(MemoizationReturnDirective):
-                if (not scope_stack or
-                        not isinstance(scope_stack[-1], MemoizationLookup)):
-                    raise ParseError(
-                        line_no,
-                        'memoization-result directive must appear inside a'
-                        ' memoization-lookup scope'
-                    )
-                scope_stack[-1].events.append(d)
-
-            elif d.is_a(PropertyBodyStart):
-                if not scope_stack:
-                    raise ParseError(
-                        line_no,
-                        'property-body-start directive must appear inside a'
-                        ' property'
-                    )
-                scope_stack[0].body_start = d.line_no
 
+            line_range = LineRange(d.line_no, None)
+
+            if d.is_a(MemoizationLookupDirective):
+                new_scope = MemoizationLookup(line_range)
+            elif d.is_a(PropertyCallStart):
+                new_scope = PropertyCall(line_range, d.name)
+            else:
+                assert d.is_a(ScopeStart)
+                new_scope = Scope(line_range)
+
+            scope_stack.append(new_scope)
+
+        elif d.is_a(End):
+            if not scope_stack:
+                raise ParseError(line_no, 'no scope to end')
+            ended_scope = scope_stack.pop()
+            ended_scope.line_range.last_line = d.line_no
+            if scope_stack:
+                scope_stack[-1].events.append(ended_scope)
             else:
-                raise NotImplementedError('Unknown directive: {}'.format(d))
+                assert isinstance(ended_scope, Property), (
+                    'Top-level scopes must all be properties'
+                )
+                assert not expr_stack, (
+                    'Some expressions are not done when leaving property'
+                    ' {}: {}'.format(
+                        ended_scope.name,
+                        ', '.join(expr_stack)
+                    )
+                )
 
-        if scope_stack:
-            raise ParseError(line_no, 'end of scope expected before end of'
-                                      ' file')
+        elif d.is_a(BindDirective):
+            if not scope_stack:
+                raise ParseError(line_no, 'no scope for binding')
+            scope_stack[-1].events.append(Bind(d.line_no, d.dsl_name,
+                                               d.gen_name))
+
+        elif d.is_a(ExprStartDirective):
+            if not scope_stack:
+                raise ParseError(line_no, 'no scope for expression')
+            start_event = ExprStart(d.line_no, d.expr_id, d.expr_repr,
+                                    d.result_var, d.dsl_sloc)
+            scope_stack[-1].events.append(start_event)
+            if expr_stack:
+                expr_stack[-1].sub_expr_start.append(start_event)
+            expr_stack.append(start_event)
+
+        elif d.is_a(ExprDoneDirective):
+            if not scope_stack:
+                raise ParseError(line_no, 'no scope for expression')
+            done_event = ExprDone(d.line_no, d.expr_id)
+            start_event = expr_stack.pop()
+            assert start_event.expr_id == done_event.expr_id, (
+                'Mismatching ExprStart/ExprStop events: {} and {}'.format(
+                    start_event, done_event
+                )
+            )
+            start_event._done_event = done_event
+            scope_stack[-1].events.append(done_event)
+
+        elif d.is_a(MemoizationReturnDirective):
+            if (not scope_stack or
+                    not isinstance(scope_stack[-1], MemoizationLookup)):
+                raise ParseError(
+                    line_no,
+                    'memoization-result directive must appear inside a'
+                    ' memoization-lookup scope'
+                )
+            scope_stack[-1].events.append(d)
+
+        elif d.is_a(PropertyBodyStart):
+            if not scope_stack:
+                raise ParseError(
+                    line_no,
+                    'property-body-start directive must appear inside a'
+                    ' property'
+                )
+            scope_stack[0].body_start = d.line_no
+
+        else:
+            raise NotImplementedError('Unknown directive: {}'.format(d))
 
     def lookup_property(self, line_no):
         """
@@ -424,6 +679,26 @@ class Property(Scope):
         self.dsl_sloc = dsl_sloc
         self.is_dispatcher = is_dispatcher
 
+        self._pending_directives = None
+        """
+        :type: (DebugInfo, list[list])|None
+
+        If this property comes from a sidecar file and its events are not
+        loaded yet, debug info and directives to load them. None otherwise.
+        """
+
+    @property
+    def events(self):
+        if self._pending_directives is not None:
+            debug_info, directives = self._pending_directives
+            self._pending_directives = None
+            debug_info._load_property_events(self, directives)
+        return self._events
+
+    @events.setter
+    def events(self, events):
+        self._events = events
+
     @property
     def memoization_lookup(self):
         """
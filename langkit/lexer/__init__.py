@@ -7,6 +7,7 @@ from langkit.diagnostics import (Context, check_source_language,
                                  extract_library_location)
 from langkit.lexer.regexp import DFACodeGenHolder, NFAState, RegexpCollection
 from langkit.names import Name
+from langkit.utils import Colors, printcol
 
 
 # All "signature" properties in classes below are used to identify the whole
@@ -608,8 +609,16 @@ class Lexer:
             sorted_actions = sorted(labels)
             return sorted_actions[0][1] if sorted_actions else None
 
-        # Compute the corresponding DFA
-        return DFACodeGenHolder(context.nfa_start.to_dfa(), get_action)
+        # Compute the corresponding DFA and minimize it
+        dfa = context.nfa_start.to_dfa()
+        minimal_dfa = dfa.minimize(get_action)
+        if context.verbosity.debug:
+            printcol('Lexer DFA minimization: {} states -> {} states'.format(
+                len(dfa.reachable_states()),
+                len(minimal_dfa.reachable_states())
+            ), Colors.OKBLUE)
+
+        return DFACodeGenHolder(minimal_dfa, get_action)
 
     def get_token(self, literal):
         """
@@ -1,5 +1,11 @@
+from array import array
+import base64
+from bisect import bisect_right
+import itertools
 import os.path
+import sys
 import unicodedata
+import zlib
 
 
 # We don't want to restrict the range of Unicode characters depending on
@@ -37,6 +43,13 @@ def format_char_ranges(ranges):
 class CharSet:
     """
     Set of characters.
+
+    Character sets are represented as flat arrays of integer bounds: a
+    character set that contains the ``[L1, H1]``, ``[L2, H2]``, ... ranges of
+    character ordinals (both bounds included) is represented as the ``[L1, H1
+    + 1, L2, H2 + 1, ...]`` array. This compact representation allows to
+    compute unions, intersections and differences with a single linear merge
+    of the inputs.
     """
 
     _repr_ellipsis = True
@@ -46,34 +59,106 @@ class CharSet:
     :type: bool
     """
 
-    def __init__(self, *items):
-        self.ranges = []
-        """
-        Sorted, disjoint and as merged as possible list of ranges for character
-        ordinals in the set. Both bounds are included in the ranges.
+    _bounds_typecode = 'l'
+    """
+    Type code for the arrays of bounds. See the ``array`` module.
 
-        :type: list[(int, int)]
-        """
+    :type: str
+    """
 
+    def __init__(self, *items):
+        ranges = []
         for item in items:
             if isinstance(item, str):
-                self.add(item)
+                ranges.append((ord(item), ord(item)))
             elif isinstance(item, tuple):
                 low, high = item
-                self.add_range(low, high)
+                ranges.append((ord(low), ord(high)))
             else:
                 raise TypeError('Invalid CharSet item: {}'.format(repr(item)))
 
+        self._bounds = self._bounds_for_ranges(ranges)
+        """
+        Strictly increasing sequence of bounds for the ranges of character
+        ordinals in this set. Even indexes are for the inclusive low bounds
+        while odd indexes are for exclusive high bounds.
+
+        :type: array.array
+        """
+
+    @classmethod
+    def _bounds_for_ranges(cls, ranges):
+        """
+        Return the array of bounds (see ``_bounds``) corresponding to the given
+        list of arbitrary ranges. Empty ranges (low bound greater than the high
+        one) are discarded.
+
+        :type ranges: list[(int, int)]
+        :rtype: array.array
+        """
+        result = array(cls._bounds_typecode)
+        for low, high in sorted(ranges):
+            assert low <= MAXUNICODE and high <= MAXUNICODE
+            if low > high:
+                continue
+            if result and low <= result[-1]:
+                # This range overlaps with or is adjacent to the last one:
+                # extend the latter.
+                if high >= result[-1]:
+                    result[-1] = high + 1
+            else:
+                result.append(low)
+                result.append(high + 1)
+        return result
+
+    @classmethod
+    def _from_bounds(cls, bounds):
+        """
+        Create a character set from an array of bounds (see ``_bounds``).
+
+        :type bounds: array.array
+        :rtype: CharSet
+        """
+        result = cls()
+        result._bounds = bounds
+        return result
+
     @classmethod
     def from_int(cls, item):
         return cls.from_int_ranges((item, item))
 
     @classmethod
     def from_int_ranges(cls, *items):
-        result = cls()
-        for l, h in items:
-            result.add_int_range(l, h)
-        return result
+        return cls._from_bounds(cls._bounds_for_ranges(items))
+
+    @classmethod
+    def from_sorted_int_ranges(cls, ranges):
+        """
+        Create a character set from a list of ranges that are already sorted,
+        disjoint and merged (see the ``ranges`` attribute). This is much
+        faster than adding ranges one by one.
+
+        :type ranges: list[(int, int)]
+        :rtype: CharSet
+        """
+        assert all(l <= h for l, h in ranges)
+        assert all(r1[1] + 1 < r2[0] for r1, r2 in zip(ranges, ranges[1:]))
+        return cls._from_bounds(array(
+            cls._bounds_typecode,
+            (bound for low, high in ranges for bound in (low, high + 1))
+        ))
+
+    @property
+    def ranges(self):
+        """
+        Sorted, disjoint and as merged as possible list of ranges for character
+        ordinals in the set. Both bounds are included in the ranges.
+
+        :rtype: list[(int, int)]
+        """
+        bounds = self._bounds
+        return [(bounds[i], bounds[i + 1] - 1)
+                for i in range(0, len(bounds), 2)]
 
     def __repr__(self):
         ranges = []
@@ -86,17 +171,19 @@ class CharSet:
         return format_char_ranges(ranges)
 
     def __hash__(self):
-        return hash(tuple(self.ranges))
+        return hash(self._bounds.tobytes())
 
     def __eq__(self, other):
-        return isinstance(other, CharSet) and self.ranges == other.ranges
+        return isinstance(other, CharSet) and self._bounds == other._bounds
 
     def __ne__(self, other):
         return not (self == other)
 
     def __lt__(self, other):
+        # Comparing arrays of bounds is equivalent to comparing lists of
+        # ranges.
         assert isinstance(other, CharSet)
-        return self.ranges < other.ranges
+        return self._bounds < other._bounds
 
     def __contains__(self, char):
         """
@@ -105,9 +192,49 @@ class CharSet:
         :type char: str
         :rtype: bool
         """
-        char = ord(char)
-        found, _ = self._lookup(char)
-        return found
+        return bisect_right(self._bounds, ord(char)) % 2 == 1
+
+    @staticmethod
+    def _merge(bounds1, bounds2, operation):
+        """
+        Merge two arrays of bounds (see ``_bounds``) according to a set
+        operation.
+
+        :param array.array bounds1: First operand.
+        :param array.array bounds2: Second operand.
+        :param (bool, bool) -> bool operation: Callback that tells whether a
+            character belongs to the result given whether it belongs to the
+            first and to the second operands.
+        :rtype: array.array
+        """
+        result = array(CharSet._bounds_typecode)
+        len1 = len(bounds1)
+        len2 = len(bounds2)
+        i1 = i2 = 0
+        in_result = False
+
+        # Go through the two sequences of bounds at the same time. For each
+        # bound, track whether we are inside or outside each operand, and emit
+        # a bound in the result when its membership changes.
+        while i1 < len1 or i2 < len2:
+            if i2 == len2 or (i1 < len1 and bounds1[i1] <= bounds2[i2]):
+                char = bounds1[i1]
+            else:
+                char = bounds2[i2]
+
+            if i1 < len1 and bounds1[i1] == char:
+                i1 += 1
+            if i2 < len2 and bounds2[i2] == char:
+                i2 += 1
+
+            # An odd number of bounds before the current position means that
+            # we are in a range.
+            new_in_result = operation(i1 % 2 == 1, i2 % 2 == 1)
+            if new_in_result != in_result:
+                result.append(char)
+                in_result = new_in_result
+
+        return result
 
     def __or__(self, other):
         """
@@ -117,15 +244,38 @@ class CharSet:
         :rtype: CharSet
         """
         assert isinstance(other, CharSet)
-        result = CharSet()
-        for cs in (self, other):
-            for l, h in cs.ranges:
-                result.add_int_range(l, h)
-        return result
+        return CharSet._from_bounds(
+            self._merge(self._bounds, other._bounds, lambda a, b: a or b)
+        )
+
+    def __and__(self, other):
+        """
+        Return the intersection of two character sets.
+
+        :type other: CharSet
+        :rtype: CharSet
+        """
+        assert isinstance(other, CharSet)
+        return CharSet._from_bounds(
+            self._merge(self._bounds, other._bounds, lambda a, b: a and b)
+        )
+
+    def __sub__(self, other):
+        """
+        Return the set of characters in ``self`` that are not in ``other``.
+
+        :type other: CharSet
+        :rtype: CharSet
+        """
+        assert isinstance(other, CharSet)
+        return CharSet._from_bounds(
+            self._merge(self._bounds, other._bounds,
+                        lambda a, b: a and not b)
+        )
 
     @property
     def is_empty(self):
-        return not self.ranges
+        return not self._bounds
 
     @property
     def ada_ranges(self):
@@ -152,9 +302,7 @@ class CharSet:
 
     @classmethod
     def any_char(cls):
-        result = cls()
-        result.add_int_range(0, MAXUNICODE)
-        return result
+        return cls.from_int_ranges((0, MAXUNICODE))
 
     @property
     def negation(self):
@@ -164,22 +312,17 @@ class CharSet:
 
         :rtype: CharSet
         """
-        result = CharSet()
-
-        last = None
-        for l, h in self.ranges:
-            if last is None:
-                if l > 0:
-                    result.add_int_range(0, l - 1)
-            else:
-                result.add_int_range(last + 1, l - 1)
-            last = h
-
-        # Handle the empty character set
-        result.add_int_range(
-            0 if last is None else last + 1,
-            MAXUNICODE)
-        return result
+        # Toggle membership at the bounds of the whole character space
+        bounds = array(self._bounds_typecode, self._bounds)
+        if bounds and bounds[0] == 0:
+            bounds.pop(0)
+        else:
+            bounds.insert(0, 0)
+        if bounds and bounds[-1] == MAXUNICODE + 1:
+            bounds.pop()
+        else:
+            bounds.append(MAXUNICODE + 1)
+        return CharSet._from_bounds(bounds)
 
     @property
     def split_ascii_subsets(self):
@@ -189,22 +332,8 @@ class CharSet:
 
         :rtype: (CharSet, CharSet)
         """
-        ascii = CharSet()
-        non_ascii = CharSet()
-
-        def add_range(char_set, l, h):
-            char_set.add_int_range(l, h)
-
-        for l, h in self.ranges:
-            if h < 128:
-                ascii.add_int_range(l, h)
-            elif l < 128:
-                ascii.add_int_range(l, 127)
-                non_ascii.add_int_range(128, h)
-            else:
-                non_ascii.add_int_range(l, h)
-
-        return (ascii, non_ascii)
+        ascii = CharSet.from_int_ranges((0, 127))
+        return (self & ascii, self - ascii)
 
     def overlaps_with(self, other):
         """
@@ -214,56 +343,21 @@ class CharSet:
         :rtype: bool
         """
         assert isinstance(other, CharSet)
-
-        def overlap(r1, r2):
-            return r1[0] <= r2[1] and r1[1] >= r2[0]
-
-        self_r = list(self.ranges)
-        other_r = list(other.ranges)
-
-        while self_r and other_r:
-            # Remove the first item from one list if it precedes (without
-            # overlapping) the first item from the other list.
-            if self_r[0][0] > other_r[0][1]:
-                other_r.pop(0)
-            elif self_r[0][1] < other_r[0][0]:
-                self_r.pop(0)
+        bounds1 = self._bounds
+        bounds2 = other._bounds
+        i1 = i2 = 0
+
+        # Go through the ranges of both sets at the same time, skipping ranges
+        # that end before the other current range starts.
+        while i1 < len(bounds1) and i2 < len(bounds2):
+            if bounds1[i1 + 1] <= bounds2[i2]:
+                i1 += 2
+            elif bounds2[i2 + 1] <= bounds1[i1]:
+                i2 += 2
             else:
                 return True
         return False
 
-    def _lookup(self, char):
-        """
-        Look for the range that contains ``char``.
-
-        If found, return ``(True, index)`` where ``index`` is the index of the
-        range that contains ``char``. Otherwise, return ``(False, index)``
-        where ``index`` is the index of the range right after the position for
-        ``char`` in the range list, plus 1, or 0 if it comes before the first
-        range.
-
-        :rtype: (bool, int)
-        """
-        # Inclusive bounds for the potential index we are looking for
-        low = 0
-        high = len(self.ranges) - 1
-
-        while low <= high:
-            # Inspect the range right in the middle of [low; high]
-            i = (low + high) // 2
-            r = self.ranges[i]
-
-            # If the range does not include ``char``, update the corresponding
-            # bound. Otherwise, just return the result.
-            if char < r[0]:
-                high = i - 1
-            elif char > r[1]:
-                low = i + 1
-            else:
-                return (True, i)
-
-        return (False, low)
-
     def add(self, char):
         """
         Add a single character to this set.
@@ -280,52 +374,25 @@ class CharSet:
         :type righ: int
         """
         assert low <= MAXUNICODE and high <= MAXUNICODE
-
-        # Look for a range that contains the low bound
-        found, index = self._lookup(low)
-
-        # If we could find one, try to extend its high bound to include
-        # ``high``.
-        if found:
-            if high <= self.ranges[index][1]:
-                # If there is nothing to extend, just stop there
-                return
-            self.ranges[index] = (self.ranges[index][0], high)
-
-        # If the high bound of the range before is next to our low bound,
-        # extend its high bound.
-        elif index > 0 and self.ranges[index - 1][1] == low - 1:
-            self.ranges[index - 1] = (self.ranges[index - 1][0], high)
-            index = index - 1
-
-        # Otherwise just insert a new range
+        if low > high:
+            return
+
+        bounds = self._bounds
+
+        # Adding ranges in increasing order is common: handle it without
+        # going through a full merge.
+        if not bounds or low > bounds[-1]:
+            bounds.append(low)
+            bounds.append(high + 1)
+        elif low >= bounds[-2]:
+            if high >= bounds[-1]:
+                bounds[-1] = high + 1
         else:
-            self.ranges.insert(index, (low, high))
-
-        # Convenient access to the range we added/extended
-        r0 = self.ranges[index]
-
-        # Merge ranges that can overlap with the modified entries
-        to_merge_index = index + 1
-        while to_merge_index < len(self.ranges):
-            r = self.ranges[to_merge_index]
-
-            if r[1] <= high:
-                # This range is completely included in the range we are adding,
-                # so we can remove it from our list.
-                self.ranges.pop(to_merge_index)
-
-            elif r[0] <= high + 1:
-                # The low part of this range overlaps/is adjacent with the
-                # range we are adding, so we can extend the latter and remove
-                # the former.
-                self.ranges[index] = (r0[0], r[1])
-                self.ranges.pop(to_merge_index)
-
-            else:
-                # This range appears after and cannot be merged with the range
-                # we added, so there is nothing else to do.
-                break
+            self._bounds = self._merge(
+                bounds,
+                array(self._bounds_typecode, (low, high + 1)),
+                lambda a, b: a or b
+            )
 
     def add_range(self, low, high):
         """
@@ -336,6 +403,14 @@ class CharSet:
         """
         self.add_int_range(ord(low), ord(high))
 
+    _category_char_sets = {}
+    """
+    Cache for character sets corresponding to Unicode general categories.
+    See ``for_category``.
+
+    :type: dict[str, CharSet]
+    """
+
     @staticmethod
     def for_category(category):
         """
@@ -346,50 +421,109 @@ class CharSet:
             unicodedata.category).
         :rtype: CharSet
         """
-        # The unicode_data module is auto-generated, so import is only when
-        # required.
-        from langkit.lexer.unicode_data import unicode_categories_char_sets
-        return unicode_categories_char_sets[category]
+        try:
+            return CharSet._category_char_sets[category]
+        except KeyError:
+            pass
+
+        # The unicode_data module is auto-generated, so import it only when
+        # required. Character sets are decoded on first use only, as most
+        # lexers use few categories, if any.
+        from langkit.lexer.unicode_data import unicode_categories_data
+        result = CharSet._from_bounds(
+            decode_bounds(unicode_categories_data[category])
+        )
+        CharSet._category_char_sets[category] = result
+        return result
 
 
-def compute_unicode_categories_char_sets():
-    # We assume here that the Python interpreter is built to use UCS-4 to
-    # represent strings. It's fine because this code runs only to precompute
-    # data that will be cached in source code, not on every script using
-    # Langkit.
-    sets = {}
-    for i in range(MAXUNICODE + 1):
-        char = chr(i)
-        cat = unicodedata.category(chr(i))
-        for subcat in (cat, cat[0]):
-            sets.setdefault(subcat, CharSet())
-            sets[subcat].add(char)
+def encode_bounds(bounds):
+    """
+    Encode an array of character set bounds (see ``CharSet._bounds``) into a
+    compact string: the base64 encoding of the zlib-compressed array of
+    differences between consecutive bounds, as little-endian 32-bit unsigned
+    integers.
+
+    :type bounds: array.array
+    :rtype: str
+    """
+    deltas = array('I', (b - prev for prev, b in zip(itertools.chain([0],
+                                                                     bounds),
+                                                     bounds)))
+    if sys.byteorder == 'big':
+        deltas.byteswap()
+    return base64.b64encode(
+        zlib.compress(deltas.tobytes(), 9)
+    ).decode('ascii')
+
+
+def decode_bounds(data):
+    """
+    Decode an array of character set bounds encoded with ``encode_bounds``.
+
+    :type data: str
+    :rtype: array.array
+    """
+    deltas = array('I')
+    deltas.frombytes(zlib.decompress(base64.b64decode(data)))
+    if sys.byteorder == 'big':
+        deltas.byteswap()
+    return array(CharSet._bounds_typecode, itertools.accumulate(deltas))
 
+
+def write_unicode_data(char_sets, filename=None):
+    """
+    Write the "unicode_data" module for the given character sets.
+
+    :param dict[str, CharSet] char_sets: Character set for each Unicode
+        general category.
+    :param str|None filename: Name of the file to write. If left to None, use
+        the "unicode_data.py" module in this package.
+    """
     lines = [
-        'from langkit.lexer.char_set import CharSet',
-        '',
         '# Character sets for Unicode general categories. The following',
         '# literal is precomputed from',
         '# langkit.lexer.char_set.compute_unicode_categories_char_sets to',
         '# avoid taking 6s at startup, even on modern hardware.',
+        '#',
+        '# Character sets are encoded with',
+        '# langkit.lexer.char_set.encode_bounds and decoded on demand by',
+        '# langkit.lexer.char_set.CharSet.for_category.',
         '',
-        'unicode_categories_char_sets = {',
+        'unicode_categories_data = {',
     ]
-    for cat, char_set in sorted(sets.items()):
-        lines.append('    {}: CharSet.from_int_ranges(*['.format(repr(cat)))
-        for low, high in char_set.ranges:
-            lines.append('        ({}, {}),'.format(low, high))
-        lines.append('    ]),')
+    for cat, char_set in sorted(char_sets.items()):
+        data = encode_bounds(char_set._bounds)
+        lines.append('    {}: ('.format(repr(cat)))
+        for i in range(0, len(data), 64):
+            lines.append('        {}'.format(repr(data[i:i + 64])))
+        lines.append('    ),')
     lines.append('}')
 
-    filename = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                            'unicode_data.py')
-    with open(filename, 'wb') as f:
+    if filename is None:
+        filename = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                'unicode_data.py')
+    with open(filename, 'w') as f:
         for l in lines:
             f.write(l)
             f.write('\n')
 
 
+def compute_unicode_categories_char_sets():
+    # We assume here that the Python interpreter is built to use UCS-4 to
+    # represent strings. It's fine because this code runs only to precompute
+    # data that will be cached in source code, not on every script using
+    # Langkit.
+    sets = {}
+    for i in range(MAXUNICODE + 1):
+        cat = unicodedata.category(chr(i))
+        for subcat in (cat, cat[0]):
+            sets.setdefault(subcat, CharSet())
+            sets[subcat].add_int_range(i, i)
+
+    write_unicode_data(sets)
+
+
 if __name__ == '__main__':
     # When executed as the main script, regenerate the unicode_data.py file
     compute_unicode_categories_char_sets()
@@ -6,11 +6,9 @@ import re
 
 from langkit.diagnostics import check_source_language
 from langkit.lexer.char_set import CharSet
-from langkit.lexer.unicode_data import unicode_categories_char_sets
 
 
 rule_name_re = re.compile('[a-zA-Z][a-zA-Z0-9_]*')
-del unicode_categories_char_sets
 
 
 def _to_dot(starting_state, get_transitions, get_state_label):
@@ -536,208 +534,236 @@ class NFAState:
         assert isinstance(next_state, NFAState)
         self.transitions.append((chars, next_state))
 
-    @staticmethod
-    def follow_spontaneous_transitions(states):
+    def to_dfa(self):
         """
-        Return the set of states that can be reached from the given set of
-        states following spontaneous transitions.
+        Return the conversion of this NFA into a DFA.
 
-        :param set[NFAState] states: List of starting states.
-        :rtype: set[NFAState]
+        :rtype: DFAState
         """
-        result = set()
+        return _SubsetConstruction(self).run()
 
-        def process(state):
-            if state in result:
-                return
-            result.add(state)
-            for chars, next_state in state.transitions:
-                if chars is None:
-                    process(next_state)
+    def to_dot(self):
+        """
+        Return a dot script representing this NFA.
 
-        for state in states:
-            process(state)
-        return result
+        :rtype: str
+        """
+        return _to_dot(self, lambda s: s.transitions, lambda s: s.label)
+
+
+def _iter_bits(bitset):
+    """
+    Yield the index of all bits set in ``bitset``, in increasing order.
+
+    :type bitset: int
+    :rtype: collections.Iterable[int]
+    """
+    while bitset:
+        lowest = bitset & -bitset
+        yield lowest.bit_length() - 1
+        bitset ^= lowest
+
+
+class _SubsetConstruction:
+    """
+    Helper to convert a NFA into a DFA using the subset construction.
+
+    All NFA states reachable from the starting state are numbered with
+    consecutive integers, so that sets of NFA states (i.e. DFA states) are
+    represented as bitsets: Python integers in which bit N is set if the
+    set contains the NFA state number N. These are cheap to hash, to compare
+    and to combine.
+    """
 
-    @staticmethod
-    def reachable_nonspontaneous_transitions(states):
+    def __init__(self, start):
         """
-        Return the list of non-spontaneous transitions that can be reached from
-        the given set of states.
+        :param NFAState start: Starting state for the NFA to convert.
+        """
+        self.states = [start]
+        """
+        List of all NFA states reachable from ``start``. The index of a state
+        in this list is its number.
+
+        :type: list[NFAState]
+        """
+
+        state_numbers = {start: 0}
+        i = 0
+        while i < len(self.states):
+            for _, next_state in self.states[i].transitions:
+                if next_state not in state_numbers:
+                    state_numbers[next_state] = len(self.states)
+                    self.states.append(next_state)
+            i += 1
 
-        Computing this is valid if following any spontaneous transition from
-        one given state leads to a state that is also in ``states``, i.e. if
-        ``follow_spontaneous_transitions(states) == states``.
+        self.spontaneous_transitions = [0] * len(self.states)
+        """
+        For each NFA state, bitset for the states that can be reached through
+        one spontaneous transition.
 
-        :param set[NFAState] states: List of starting states.
-        :rtype: list[(CharSet, set[NFAState])]
+        :type: list[int]
         """
-        result = []
-        for state in states:
+
+        self.range_transitions = [[] for _ in self.states]
+        """
+        For each NFA state, list of (low, high, next state number) for all
+        non-spontaneous transitions. Both bounds are included in the character
+        ranges.
+
+        :type: list[list[(int, int, int)]]
+        """
+
+        for i, state in enumerate(self.states):
             for chars, next_state in state.transitions:
+                next_number = state_numbers[next_state]
                 if chars is None:
-                    assert next_state in states
+                    self.spontaneous_transitions[i] |= 1 << next_number
                 else:
-                    result.append((chars, next_state))
+                    self.range_transitions[i].extend(
+                        (low, high, next_number) for low, high in chars.ranges
+                    )
+
+        self._state_closures = [None] * len(self.states)
+        """
+        Cache for closures of single NFA states. See the ``closure`` method.
+
+        :type: list[None|int]
+        """
+
+        self._closures = {}
+        """
+        Cache for closures of sets of NFA states. See the ``closure`` method.
+
+        :type: dict[int, int]
+        """
+
+    def state_closure(self, number):
+        """
+        Return the bitset for the set of NFA states that can be reached from
+        the NFA state number ``number`` following spontaneous transitions.
+
+        :type number: int
+        :rtype: int
+        """
+        result = self._state_closures[number]
+        if result is None:
+            result = pending = 1 << number
+            while pending:
+                reached = 0
+                for i in _iter_bits(pending):
+                    reached |= self.spontaneous_transitions[i]
+                pending = reached & ~result
+                result |= reached
+            self._state_closures[number] = result
         return result
 
-    @staticmethod
-    def hashable_state_set(states):
+    def closure(self, states):
         """
-        Return a value that can be used as a dict key/set element to represent
-        a set of states.
+        Return the bitset for the set of NFA states that can be reached from
+        the ``states`` bitset following spontaneous transitions.
 
-        :rtype: set[states]
+        :type states: int
+        :rtype: int
         """
-        return tuple(sorted(states))
+        try:
+            return self._closures[states]
+        except KeyError:
+            result = 0
+            for i in _iter_bits(states):
+                result |= self.state_closure(i)
+            self._closures[states] = result
+            return result
 
-    @staticmethod
-    def deterministic_transitions(states):
+    def deterministic_transitions(self, states):
         """
         Return the set of deterministic (non-spontaneous and disjoint)
-        transitions that leave the "states" sub-graph.
-
-        This is a major helper in the convertion of NFAs into corresponding
-        DFAs.
-
-        The result is a mapping from sets of NFA states (destination of
-        deterministic transitions) to disjoint character sets (label for
-        transitions).
-
-        :param list[NFAState] states: Set of states from which we compute
-            transitions.
-        :rtype: dict[tuple[NFAState], CharSet]
-        """
-        # First, collect for each reachable state the set of characters that
-        # allow to reach that state.
-        transitions = {}
-        for chars, next_state in NFAState.reachable_nonspontaneous_transitions(
-            states
-        ):
-            assert chars is not None
-            try:
-                other_chars = transitions[next_state]
-            except KeyError:
-                transitions[next_state] = chars
-            else:
-                transitions[next_state] = other_chars | chars
+        transitions that leave the ``states`` sub-graph.
 
-        # Linearize the transition labels: flatten all character sets to have a
-        # stream of "start range"/"end range" of transitions considering all
-        # input characters.
-        #
-        # For instance, for the following transitions: {
-        #    S1: [a:z],
-        #    S2: [a:h, s],
-        #    S3: [f:l]
-        # }
-        # we will get the following stream of events: {
-        #    'a': Event(adding=S1;S2),
-        #    'f': Event(adding=S3),
-        #    'h': Event(removing=S2),
-        #    'l': Event(removing=S3),
-        #    's': Event(adding=S2,removing=S2),
-        #    'z': Event(removing=S1),
-        # }.
-        class Event:
-            def __init__(self):
-                self.adding = set()
-                self.removing = set()
-
-        events = defaultdict(Event)
-        for next_state, chars in transitions.items():
-            for r in chars.ranges:
-                events[r[0]].adding.add(next_state)
-                events[r[1]].removing.add(next_state)
-        events = sorted(events.items())
-
-        # The final step is to compute the set of transitions for which
-        # character sets are disjoint: just follow the stream of events.
-
-        result = defaultdict(CharSet)
-
-        def add_transition(low, high, states):
-            if not states:
-                return
-            states = NFAState.follow_spontaneous_transitions(states)
-            result[NFAState.hashable_state_set(states)].add_int_range(low,
-                                                                      high)
-
-        # Set of states "active" for the current position in the events stream
-        states = set()
-
-        # Character for the last event we processed
-        last_char = None
-
-        for char, event in events:
-            assert event.adding or event.removing
-
-            if event.adding:
-                add_transition(last_char, char - 1, states)
-                states = states.union(event.adding)
-                last_char = char
-
-            if event.removing:
-                add_transition(last_char, char, states)
-                states = states.difference(event.removing)
-                last_char = char + 1
+        The result is a mapping from destination DFA states (closed bitsets)
+        to the sorted list of disjoint character ranges that lead to them.
+
+        :param int states: Closed bitset of NFA states.
+        :rtype: dict[int, list[(int, int)]]
+        """
+        # Linearize all transitions into a single stream of events: "start
+        # range" (+1) and "end range" (-1) events for their destination
+        # states. Then sweep through this stream once, keeping track of the
+        # set of "active" destination states. Note that several transitions
+        # can have overlapping ranges for the same destination, hence the
+        # reference counting.
+        events = []
+        for i in _iter_bits(states):
+            for low, high, next_number in self.range_transitions[i]:
+                events.append((low, 1, next_number))
+                events.append((high + 1, -1, next_number))
+        events.sort()
+
+        result = {}
+        ref_counts = defaultdict(int)
+        active = 0
+        i = 0
+        while i < len(events):
+            # Process all events for the current character
+            char = events[i][0]
+            while i < len(events) and events[i][0] == char:
+                _, delta, next_number = events[i]
+                count = ref_counts[next_number] + delta
+                ref_counts[next_number] = count
+                if count == 0:
+                    active &= ~(1 << next_number)
+                elif count == 1 and delta == 1:
+                    active |= 1 << next_number
+                i += 1
+
+            # All characters until the next event lead to the same set of
+            # states. Note that when some states are active, there is
+            # necessarily a next event to end the corresponding ranges.
+            if active:
+                next_states = self.closure(active)
+                high = events[i][0] - 1
+                ranges = result.setdefault(next_states, [])
+                if ranges and ranges[-1][1] == char - 1:
+                    ranges[-1] = (ranges[-1][0], high)
+                else:
+                    ranges.append((char, high))
 
         return result
 
-    def to_dfa(self):
+    def run(self):
         """
-        Return the conversion of this NFA into a DFA.
+        Return the DFA corresponding to the NFA to convert.
 
         :rtype: DFAState
         """
-        result = None
-
-        # Mapping from sets of NFAState nodes (see NFAState.hashable_state_set)
-        # to the corresponding DFAState nodes.
+        # Mapping from closed bitsets to the corresponding DFA states
         dfa_states = {}
 
-        # List of tuple[NFAState], CharSet and tuple[NFAState] for the
-        # transitions that constitute the DFA.
-        transitions = []
-
-        queue = {
-            self.hashable_state_set(
-                self.follow_spontaneous_transitions([self])
-            )
-        }
+        def get_dfa_state(states):
+            try:
+                return dfa_states[states]
+            except KeyError:
+                result = DFAState(labels={
+                    self.states[i].label for i in _iter_bits(states)
+                    if self.states[i].label is not None
+                })
+                dfa_states[states] = result
+                queue.append(states)
+                return result
+
+        queue = []
+        result = get_dfa_state(self.closure(1))
         while queue:
             states = queue.pop()
-            if states in dfa_states:
-                return
-
-            new_node = DFAState(labels={s.label for s in states
-                                        if s.label is not None})
-            dfa_states[states] = new_node
-            if result is None:
-                result = new_node
-
-            for next_states, char_set in self.deterministic_transitions(
+            dfa_state = dfa_states[states]
+            for next_states, ranges in self.deterministic_transitions(
                 states
             ).items():
-                if next_states not in dfa_states:
-                    queue.add(next_states)
-                transitions.append((states, char_set, next_states))
-
-        for states, char_set, next_states in transitions:
-            dfa_states[states].add_transition(char_set,
-                                              dfa_states[next_states])
-
-        assert result
+                dfa_state.add_transition(
+                    CharSet.from_sorted_int_ranges(ranges),
+                    get_dfa_state(next_states)
+                )
         return result
 
-    def to_dot(self):
-        """
-        Return a dot script representing this NFA.
-
-        :rtype: str
-        """
-        return _to_dot(self, lambda s: s.transitions, lambda s: s.label)
-
 
 class DFAState:
     """
@@ -784,6 +810,132 @@ class DFAState:
 
         self.transitions.append((chars, next_state))
 
+    def reachable_states(self):
+        """
+        Return the list of states reachable from this one (included), in
+        breadth-first order.
+
+        :rtype: list[DFAState]
+        """
+        result = [self]
+        visited = {self}
+        i = 0
+        while i < len(result):
+            for _, next_state in sorted(result[i].transitions):
+                if next_state not in visited:
+                    visited.add(next_state)
+                    result.append(next_state)
+            i += 1
+        return result
+
+    def minimize(self, get_action):
+        """
+        Return a minimal DFA that is equivalent to this one.
+
+        This uses Hopcroft's partition refinement algorithm, adapted to
+        transitions labeled with character sets: blocks of states are split
+        according to the set of characters that allow to reach a given
+        "splitter" block, rather than according to single input symbols.
+
+        Two states can be merged only if they trigger the same action, so the
+        initial partition groups states by the result of ``get_action``.
+
+        :param (set[T]) -> T get_action: Callback that returns the action for
+            a DFA state given its labels.
+        :rtype: DFAState
+        """
+        states = self.reachable_states()
+
+        # For each state, list of (source state, chars) couples for the
+        # transitions that lead to it.
+        predecessors = {s: [] for s in states}
+        for s in states:
+            for chars, next_state in s.transitions:
+                predecessors[next_state].append((s, chars))
+
+        # Initial partition: group states by action. Blocks are lists of
+        # states, and "block_of" maps states to the index of their block.
+        by_action = {}
+        for s in states:
+            by_action.setdefault(get_action(s.labels), []).append(s)
+        blocks = list(by_action.values())
+        block_of = {s: i for i, b in enumerate(blocks) for s in b}
+
+        # Hopcroft's algorithm: the worklist contains indexes for the blocks
+        # that we need to use as splitters.
+        worklist = set(range(len(blocks)))
+        while worklist:
+            splitter = worklist.pop()
+
+            # For each state that has transitions to the splitter block,
+            # compute the set of characters that leads to that block. Group
+            # them by block, and then by character set.
+            chars_to_splitter = defaultdict(CharSet)
+            for target in blocks[splitter]:
+                for source, chars in predecessors[target]:
+                    chars_to_splitter[source] = (chars_to_splitter[source]
+                                                 | chars)
+
+            groups = defaultdict(lambda: defaultdict(list))
+            for source, chars in chars_to_splitter.items():
+                groups[block_of[source]][chars].append(source)
+
+            for block_index, by_chars in sorted(groups.items()):
+                block = blocks[block_index]
+                parts = list(by_chars.values())
+
+                # States in this block that have no transition to the splitter
+                # form an additional part.
+                remaining = [s for s in block if s not in chars_to_splitter]
+                if remaining:
+                    parts.append(remaining)
+
+                if len(parts) == 1:
+                    continue
+
+                # Keep the first part in the existing block and create new
+                # blocks for the others.
+                parts.sort(key=len, reverse=True)
+                new_indexes = [block_index]
+                blocks[block_index] = parts[0]
+                for part in parts[1:]:
+                    new_indexes.append(len(blocks))
+                    for s in part:
+                        block_of[s] = len(blocks)
+                    blocks.append(part)
+
+                # Knowing how to reach all parts but one is enough to know how
+                # to reach the last one, so unless the split block was already
+                # scheduled to be a splitter, we can skip the largest part.
+                if block_index in worklist:
+                    worklist.update(new_indexes)
+                else:
+                    worklist.update(new_indexes[1:])
+
+        # Now create one DFA state per block. States in the same block have
+        # the same action, so merging their labels preserves it.
+        new_states = []
+        for block in blocks:
+            labels = set()
+            for s in block:
+                labels.update(s.labels)
+            assert get_action(labels) == get_action(block[0].labels)
+            new_states.append(DFAState(labels))
+
+        for block_index, block in enumerate(blocks):
+            # All states in the block are equivalent, so use the first one to
+            # compute transitions, merging the ones that lead to the same
+            # block.
+            transitions = defaultdict(CharSet)
+            for chars, next_state in block[0].transitions:
+                next_index = block_of[next_state]
+                transitions[next_index] = transitions[next_index] | chars
+            for next_index, chars in sorted(transitions.items()):
+                new_states[block_index].add_transition(chars,
+                                                       new_states[next_index])
+
+        return new_states[block_of[self]]
+
     def to_dot(self):
         """
         Return a dot script representing this DFA.
@@ -1,8 +1,12 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
 from functools import reduce
 from funcy import keep
 import glob
+import hashlib
 import inspect
+import io
 import json
 import os
 from os import path
@@ -10,8 +14,10 @@ import pdb
 import pipes
 import shlex
 import shutil
+import socket
 import subprocess
 import sys
+import time
 import traceback
 
 from langkit.compile_context import UnparseScript, Verbosity
@@ -19,6 +25,7 @@ from langkit.diagnostics import (
     Context, DiagnosticError, DiagnosticStyle, Diagnostics, Location,
     WarningSet, check_source_language, extract_library_location
 )
+from langkit.gdb.debug_info import write_sidecar
 from langkit.langkit_support import LangkitSupport
 from langkit.packaging import Packager
 from langkit.utils import Colors, Log, col, printcol
@@ -136,6 +143,13 @@ class ManageScript:
     Whether warnings to build the generated library are enabled by default.
     """
 
+    SERVED_COMMANDS = ('do_generate', )
+    """
+    Names of the commands that the generation daemon can run. Other commands
+    run external programs for most of their work (GPRbuild, ...), so clients
+    always run them in their own process.
+    """
+
     def __init__(self):
         self.dirs = Directories(
             # It is assumed that manage.py is at the root of the language
@@ -221,6 +235,12 @@ class ManageScript:
                  ' from langkit.passes.AbstractPass. It will be ran at the end'
                  ' of the pass preexisting order.'
         )
+        args_parser.add_argument(
+            '--daemon', metavar='SOCKET',
+            help='If a generation daemon (see the "serve" command) listens on'
+                 ' the given socket and this is a "generate" command, forward'
+                 ' it to the daemon instead of running it in this process.'
+        )
 
         def create_parser(fn, needs_context=False):
             """
@@ -247,7 +267,7 @@ class ManageScript:
                     self.set_context(*args, **kwargs)
                 fn(*args, **kwargs)
 
-            p.set_defaults(func=internal)
+            p.set_defaults(func=internal, command=fn.__name__)
             return p
 
         ########
@@ -264,6 +284,7 @@ class ManageScript:
             self.do_generate, True
         )
         self.add_generate_args(generate_parser)
+        self.add_jobs_arg(generate_parser)
 
         #########
         # Build #
@@ -371,6 +392,25 @@ class ManageScript:
         self.add_build_args(self.build_lksp_parser)
         self.add_build_args(self.install_lksp_parser)
 
+        #########
+        # Serve #
+        #########
+
+        self.serve_parser = create_parser(self.do_serve)
+        self.serve_parser.add_argument(
+            '--socket',
+            help='Path to the socket to listen on. By default, use'
+                 ' $BUILD_DIR/obj/manage.sock.'
+        )
+
+        # Whether this instance is a generation daemon (see the "serve"
+        # command) and state to avoid recompiling the language spec when
+        # possible.
+        self.serving = False
+        self.served_requests = 0
+        self.served_sources_fingerprint = None
+        self.served_results = {}
+
         # The create_context method will create the context and set it here
         # only right before executing commands.
         self.context = None
@@ -458,6 +498,47 @@ class ManageScript:
                  ' useful in order to get portable generated sources, for'
                  ' releases for instance.'
         )
+        subparser.add_argument(
+            '--template-cache', action='store_true',
+            help='Keep compiled code generation templates in the build'
+                 ' directory, so that next generations do not need to compile'
+                 ' them again.'
+        )
+        subparser.add_argument(
+            '--incremental', action='store_true',
+            help='Do not render generated sources whose inputs (node types,'
+                 ' properties, parsers, lexer, settings) did not change since'
+                 ' the previous generation.'
+        )
+        subparser.add_argument(
+            '--render-jobs', type=int, default=1,
+            help='Number of worker processes to use in order to render'
+                 ' generated sources (default: 1). Worker processes are'
+                 ' forked from the current one, so plugins must be'
+                 ' fork-safe. Rendering is sequential on platforms that do'
+                 ' not support fork.'
+        )
+        subparser.add_argument(
+            '--packrat-memo-kind', choices=['ring', 'adaptive', 'sparse'],
+            default='ring',
+            help='Default kind of packrat memoization tables for parsing'
+                 ' rules: fixed size rings (the default), rings that grow'
+                 ' when the parser backtracks further than their size, or'
+                 ' sparse tables that keep results for all tokens. Grammar'
+                 ' rules can override this default.'
+        )
+        subparser.add_argument(
+            '--packrat-memo-size', type=int, default=16,
+            help='Default number of slots for packrat memoization rings'
+                 ' (16 by default). Grammar rules can override this default.'
+        )
+        subparser.add_argument(
+            '--compact-source-buffers', action='store_true',
+            help='Once lexing is done, store source buffers using one byte'
+                 ' per character when they contain only Latin-1 characters.'
+                 ' This reduces memory usage, but source buffers are then'
+                 ' decoded again when their text is requested.'
+        )
 
         # RA22-015: option to dump the results of the unparsing concrete syntax
         # to a file.
@@ -481,17 +562,20 @@ class ManageScript:
             help='Selects a preset for build options.'
         )
 
+    def add_jobs_arg(self, subparser):
+        subparser.add_argument(
+            '--jobs', '-j', type=int, default=get_cpu_count(),
+            help='Number of parallel jobs to spawn in parallel (default: your'
+                 ' number of cpu).'
+        )
+
     def add_build_args(self, subparser):
         """
         Add arguments to tune code compilation to "subparser".
 
         :type subparser: argparse.ArgumentParser
         """
-        subparser.add_argument(
-            '--jobs', '-j', type=int, default=get_cpu_count(),
-            help='Number of parallel jobs to spawn in parallel (default: your'
-                 ' number of cpu).'
-        )
+        self.add_jobs_arg(subparser)
         self.add_build_mode_arg(subparser)
         subparser.add_argument(
             '--enable-build-warnings',
@@ -595,6 +679,19 @@ class ManageScript:
     def run(self, argv=None):
         parsed_args = self.args_parser.parse_args(argv)
 
+        # If requested to, let the generation daemon run this command. Run it
+        # ourselves if there is no daemon or if the daemon cannot run it.
+        if (
+            parsed_args.daemon
+            and not self.serving
+            and getattr(parsed_args, 'command', None) in self.SERVED_COMMANDS
+        ):
+            status = self.forward_to_daemon(
+                parsed_args.daemon, sys.argv[1:] if argv is None else argv
+            )
+            if status is not None:
+                sys.exit(status)
+
         for trace in parsed_args.trace:
             print("Trace {} is activated".format(trace))
             Log.enable(trace)
@@ -692,6 +789,10 @@ class ManageScript:
             "extensions"
         )
 
+        # Forward the verbosity level so that code generation passes can
+        # report what they do.
+        self.context.verbosity = parsed_args.verbosity
+
     def do_generate(self, args):
         """
         Generate source code for the user language.
@@ -709,10 +810,39 @@ class ManageScript:
         if not getattr(args, 'build_mode', None):
             args.build_mode = self.BUILD_MODES[0]
 
-        def gnatpp(project_file, glob_pattern):
+        def gnatpp(project_file, sources):
             """
             Helper function to pretty-print files from a GPR project.
+
+            To avoid formatting the same content over and over, pretty-printed
+            sources are cached (in $BUILD_DIR/obj/gnatpp_cache), keyed on the
+            digest of their content before pretty-printing: only sources that
+            are not in this cache are passed to gnatpp, sharded across
+            ``args.jobs`` concurrent processes.
             """
+            cache_dir = self.dirs.build_dir('obj', 'gnatpp_cache')
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+
+            def cache_entry(digest):
+                return os.path.join(cache_dir, digest)
+
+            # Restore the sources we can get from the cache, and compute the
+            # list of sources to actually pretty-print.
+            to_format = {}
+            for filename in sources:
+                with open(filename, 'rb') as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+                if os.path.exists(cache_entry(digest)):
+                    self.log_debug(
+                        'Using cached pretty-printing for {}'.format(filename),
+                        Colors.CYAN
+                    )
+                    shutil.copyfile(cache_entry(digest), filename)
+                else:
+                    to_format[filename] = digest
+            if not to_format:
+                return
 
             # In general, don't abort if we can't find gnatpp or if gnatpp
             # crashes: at worst sources will not be pretty-printed, which is
@@ -732,12 +862,24 @@ class ManageScript:
             if self.verbosity.debug:
                 argv.append('-v')
 
-            self.check_call(
-                args, 'Pretty-printing',
-                argv + self.gpr_scenario_vars(args, 'relocatable')
-                + glob.glob(glob_pattern),
-                abort_on_error=False
-            )
+            argv += self.gpr_scenario_vars(args, 'relocatable')
+
+            def run(shard):
+                return self.check_call(args, 'Pretty-printing', argv + shard,
+                                       abort_on_error=False)
+
+            files = sorted(to_format)
+            shard_count = max(1, min(args.jobs, len(files)))
+            shards = [files[i::shard_count] for i in range(shard_count)]
+            with ThreadPoolExecutor(max_workers=shard_count) as executor:
+                results = list(executor.map(run, shards))
+
+            # Update the cache with the output of successful gnatpp runs
+            for shard, success in zip(shards, results):
+                if success:
+                    for filename in shard:
+                        shutil.copyfile(filename,
+                                        cache_entry(to_format[filename]))
 
         self.log_info(
             "Generating source for {}...".format(self.lib_name.lower()),
@@ -779,7 +921,15 @@ class ManageScript:
             pretty_print=not args.no_pretty_print,
             coverage=args.coverage,
             relative_project=args.relative_project,
-            unparse_script=args.unparse_script
+            unparse_script=args.unparse_script,
+            template_cache=args.template_cache,
+            incremental=args.incremental,
+            packrat_memo_kind=args.packrat_memo_kind,
+            packrat_memo_size=args.packrat_memo_size,
+            compact_source_buffers=args.compact_source_buffers,
+            # The generation daemon captures the output of commands in
+            # memory, which worker processes cannot write to.
+            jobs=1 if self.serving else args.render_jobs
         )
 
         if args.check_only:
@@ -792,13 +942,34 @@ class ManageScript:
                 ),
                 Colors.HEADER
             )
+
+            # Only sources that code emission actually rewrote need to be
+            # pretty-printed: the other ones were formatted by a previous run.
+            rewritten_files = {os.path.abspath(f)
+                               for f in self.context.rewritten_files}
+
+            def rewritten_sources(glob_pattern):
+                return sorted(f for f in glob.glob(glob_pattern)
+                              if os.path.abspath(f) in rewritten_files)
+
             gnatpp(
                 self.dirs.build_dir('lib', 'gnat',
                                     '{}.gpr'.format(self.lib_name.lower())),
-                self.dirs.build_dir('include', self.lib_name.lower(), '*.ad*')
+                rewritten_sources(self.dirs.build_dir(
+                    'include', self.lib_name.lower(), '*.ad*'
+                ))
             )
             gnatpp(self.dirs.build_dir('src', 'mains.gpr'),
-                   self.dirs.build_dir('src', '*.ad*'))
+                   rewritten_sources(self.dirs.build_dir('src', '*.ad*')))
+
+            # Pretty-printing changes line numbers in the implementation body,
+            # so refresh the debug info sidecar for GDB helpers.
+            impl_body = self.dirs.build_dir(
+                'include', self.lib_name.lower(),
+                '{}-implementation.adb'.format(self.lib_name.lower())
+            )
+            if path.exists(impl_body):
+                write_sidecar(impl_body)
 
         self.log_info("Generation complete!", Colors.OKGREEN)
 
@@ -870,29 +1041,28 @@ class ManageScript:
 
         :param bool is_library: See the "what_to_build" method.
 
-        :param list[str] obj_dirs: List of paths (relative to the project file
-            directory) to the object directory where gprbuild creates the
-            "*.lexch" files. We will remove all such files before each gprbuild
-            run.
+        :param list[str] obj_dirs: List of paths to the object directories
+            (for the current build mode) of the projects to build. Each
+            library kind has its own object directory (a subdirectory named
+            after the library kind), so the builds for the various library
+            kinds can run concurrently.
+
+            All library kinds are compiled with the same compilation switches
+            (-fPIC everywhere), so once the first library kind is built, we
+            copy its compilation artifacts to the object directories of the
+            other library kinds: GPRbuild considers them up-to-date and only
+            performs the library link/archive step, unless the switches it
+            records differ, in which case it just recompiles what it needs
+            to.
 
-            This allows us to workaround a GPRbuild bug (see SB18-035).
-            Library types share the same object directory, however GPRbuild
-            uses a file in the object directory (*.lexch) to know if the
-            library must be rebuilt. Not removing it will make it skip the
-            "static" build after the "static-pic" was built. So we remove it.
+            Note that "*.lexch" files are not copied, as GPRbuild uses them to
+            know whether the library itself must be rebuilt (see SB18-035).
 
         :param set[str]|None mains: If provided, list of main programs to
             build. By default, GPRbuild builds them all, so this arguments
             makes it possible to build only a subset of them.
         """
-        lexch_patterns = [os.path.join(os.path.dirname(project_file),
-                                       obj_dir, '*.lexch')
-                          for obj_dir in obj_dirs]
-
-        base_argv = [
-            'gprbuild', '-p', '-j{}'.format(args.jobs),
-            '-P{}'.format(project_file),
-        ]
+        base_argv = ['gprbuild', '-p', '-P{}'.format(project_file)]
 
         if not args.with_rpath:
             # Prevent GPRbuild from adding RPATH to links, as paths will not be
@@ -910,18 +1080,9 @@ class ManageScript:
         gargs = getattr(args, 'gargs') or []
         gargs = sum((shlex.split(args) for args in gargs), [])
 
-        def run(library_type):
-            # Remove the "*.lexch" file
-            for pattern in lexch_patterns:
-                files = glob.glob(pattern)
-                for f in files:
-                    self.log_debug('Removing {}'.format(f), Colors.CYAN)
-                    os.remove(f)
-                if not files:
-                    self.log_debug('No *.lexch file to remove from {}'
-                                   .format(pattern), Colors.CYAN)
-
+        def run(library_type, jobs):
             argv = list(base_argv)
+            argv.append('-j{}'.format(jobs))
             argv.extend(
                 self.gpr_scenario_vars(args, library_type=library_type)
             )
@@ -930,16 +1091,82 @@ class ManageScript:
             if Diagnostics.style == DiagnosticStyle.gnu_full:
                 argv.append('-gnatef')
             argv.extend(gargs)
+
+            start_time = time.time()
             self.check_call(args, 'Build', argv)
+            return time.time() - start_time
 
         build_shared, build_static_pic, build_static = self.what_to_build(
             args, is_library)
-        if build_shared:
-            run('relocatable')
-        if build_static_pic:
-            run('static-pic')
-        if build_static:
-            run('static')
+        library_types = [
+            library_type
+            for library_type, enabled in [('relocatable', build_shared),
+                                          ('static-pic', build_static_pic),
+                                          ('static', build_static)]
+            if enabled
+        ]
+        if not library_types:
+            return
+
+        # Build the first library kind alone: it will compile all sources
+        # with the full parallelism available.
+        first_type, other_types = library_types[0], library_types[1:]
+        timings = {first_type: run(first_type, args.jobs)}
+
+        if other_types:
+            # Then share its compilation artifacts with the other library
+            # kinds, and build all of them concurrently. Note that if one
+            # build fails, check_call raises a SystemExit exception in the
+            # worker thread, which executor.map re-raises here.
+            for obj_dir in obj_dirs:
+                for library_type in other_types:
+                    self.seed_obj_dir(os.path.join(obj_dir, first_type),
+                                      os.path.join(obj_dir, library_type))
+
+            jobs = max(1, args.jobs // len(other_types))
+            with ThreadPoolExecutor(max_workers=len(other_types)) as executor:
+                timings.update(zip(
+                    other_types,
+                    executor.map(lambda lt: run(lt, jobs), other_types)
+                ))
+
+        self.log_info(
+            'Build times: {}'.format(', '.join(
+                '{}: {:.1f}s'.format(library_type, timings[library_type])
+                for library_type in library_types
+            )),
+            Colors.OKBLUE
+        )
+
+    def seed_obj_dir(self, src_dir, dest_dir):
+        """
+        Copy compilation artifacts from one object directory to another one,
+        so that a build in the latter can reuse them.
+
+        Only copy files that are missing or that are older in ``dest_dir``.
+        Also preserve timestamps so that GPRbuild's up-to-date checks still
+        work in the destination directory.
+
+        :param str src_dir: Object directory to copy from.
+        :param str dest_dir: Object directory to copy to.
+        """
+        if not os.path.isdir(src_dir):
+            return
+        if not os.path.isdir(dest_dir):
+            os.makedirs(dest_dir)
+
+        for entry in os.scandir(src_dir):
+            if not entry.is_file() or entry.name.endswith('.lexch'):
+                continue
+            dest = os.path.join(dest_dir, entry.name)
+            if (
+                os.path.exists(dest)
+                and os.path.getmtime(dest) >= entry.stat().st_mtime
+            ):
+                continue
+            self.log_debug('Copying {} to {}'.format(entry.path, dest),
+                           Colors.CYAN)
+            shutil.copy2(entry.path, dest)
 
     # noinspection PyIncorrectDocstring
     def gprinstall(self, args, project_file, is_library):
@@ -1164,6 +1391,272 @@ class ManageScript:
         """
         self.gprinstall(args, self.lksp(args).lksp_project_file, True)
 
+    def do_serve(self, args):
+        """
+        Run a generation daemon, which serves manage.py commands on a local
+        socket.
+
+        Forward "generate" commands to this daemon using the --daemon option
+        (other commands always run in the client process). The daemon
+        process keeps Langkit loaded, so that commands do not pay for Python
+        startup, Langkit imports and template compilation. In addition, as
+        long as the language source files do not change, the daemon replays
+        the result of "generate --check-only" commands it already ran, so that
+        IDE check hooks do not have to compile the language spec again.
+
+        :param argparse.Namespace args: The arguments parsed from the command
+            line invocation of manage.py.
+        """
+        if not hasattr(socket, 'AF_UNIX'):
+            print(col('The generation daemon requires Unix sockets',
+                      Colors.FAIL), file=sys.stderr)
+            sys.exit(1)
+
+        socket_path = args.socket or self.dirs.build_dir('obj', 'manage.sock')
+        if not os.path.isdir(os.path.dirname(os.path.abspath(socket_path))):
+            os.makedirs(os.path.dirname(os.path.abspath(socket_path)))
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+        self.serving = True
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            # The daemon runs arbitrary commands on behalf of its clients:
+            # only the current user must be able to connect to it. Create the
+            # socket with restricted permissions so that there is no window
+            # during which other users can connect.
+            old_umask = os.umask(0o177)
+            try:
+                server.bind(socket_path)
+            finally:
+                os.umask(old_umask)
+            os.chmod(socket_path, 0o600)
+            server.listen()
+            self.log_info('Serving on {}'.format(socket_path), Colors.HEADER)
+
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    # Clients may disconnect early or send malformed
+                    # requests: report the error and keep serving the next
+                    # clients.
+                    try:
+                        self.serve_connection(conn)
+                    except Exception:
+                        print(col('Error while serving a request:',
+                                  Colors.FAIL), file=sys.stderr)
+                        traceback.print_exc()
+
+        except KeyboardInterrupt:
+            pass
+
+        finally:
+            self.serving = False
+            server.close()
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+
+    def serve_connection(self, conn):
+        """
+        Read a request from the ``conn`` client connection, run it and send
+        back the result.
+
+        :param socket.socket conn: Connected socket for the client.
+        """
+        request = json.loads(self.recv_message(conn))
+        status, output = self.serve_request(request['argv'], request['cwd'])
+        conn.sendall(json.dumps(
+            {'status': status, 'output': output}
+        ).encode('utf-8'))
+
+    @staticmethod
+    def recv_message(conn):
+        """
+        Read data from ``conn`` until the peer stops sending and return it as
+        a string.
+
+        :param socket.socket conn: Connected socket to read.
+        :rtype: str
+        """
+        chunks = []
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b''.join(chunks).decode('utf-8')
+
+    def forward_to_daemon(self, socket_path, argv):
+        """
+        Ask the generation daemon listening on ``socket_path`` to run the
+        command for ``argv`` and print its output.
+
+        Return the exit status of the command, or None if the daemon could not
+        be reached.
+
+        :param str socket_path: Path to the socket of the daemon.
+        :param list[str] argv: Command-line arguments for the command to run.
+        :rtype: int|None
+        """
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        with conn:
+            try:
+                conn.connect(socket_path)
+            except OSError:
+                return None
+
+            conn.sendall(json.dumps(
+                {'argv': argv, 'cwd': os.getcwd()}
+            ).encode('utf-8'))
+            conn.shutdown(socket.SHUT_WR)
+            response = json.loads(self.recv_message(conn))
+
+        sys.stdout.write(response['output'])
+        sys.stdout.flush()
+        return response['status']
+
+    def serve_request(self, argv, cwd):
+        """
+        Run the command for ``argv`` in the ``cwd`` directory on behalf of a
+        generation daemon client.
+
+        Return the exit status of the command and its output.
+
+        :param list[str] argv: Command-line arguments for the command to run.
+        :param str cwd: Working directory for the command to run.
+        :rtype: (int, str)
+        """
+        # Results for previous requests are valid only as long as language
+        # source files do not change.
+        fingerprint = self.lang_sources_fingerprint()
+        if fingerprint != self.served_sources_fingerprint:
+            self.served_sources_fingerprint = fingerprint
+            self.served_results = {}
+
+        key = (cwd, tuple(argv))
+        try:
+            return self.served_results[key]
+        except KeyError:
+            pass
+
+        output = io.StringIO()
+        old_cwd = os.getcwd()
+        cacheable = False
+        try:
+            os.chdir(cwd)
+            with redirect_stdout(output), redirect_stderr(output), \
+                    self.preserved_global_state():
+                try:
+                    parsed_args = self.args_parser.parse_args(argv)
+                    command = getattr(parsed_args, 'command', None)
+                    if command not in self.SERVED_COMMANDS:
+                        print(col('The generation daemon cannot run this'
+                                  ' command', Colors.FAIL))
+                        sys.exit(1)
+                    cacheable = parsed_args.check_only
+
+                    # Language specs register their types in Langkit's global
+                    # state when they are imported: if we already ran a
+                    # command, reset this global state and make sure language
+                    # modules will be imported again.
+                    if self.served_requests:
+                        import langkit
+                        langkit.reset()
+                        self.unload_language_modules()
+                    self.served_requests += 1
+
+                    self.run(argv)
+                    status = 0
+                except SystemExit as exc:
+                    if exc.code is None:
+                        status = 0
+                    elif isinstance(exc.code, int):
+                        status = exc.code
+                    else:
+                        print(exc.code)
+                        status = 1
+                except Exception:
+                    traceback.print_exc()
+                    status = 1
+        finally:
+            os.chdir(old_cwd)
+
+        result = (status, output.getvalue())
+
+        # "generate --check-only" only emits diagnostics: as long as language
+        # sources do not change, running it again would give the same result.
+        if cacheable:
+            self.served_results[key] = result
+
+        return result
+
+    @staticmethod
+    @contextmanager
+    def preserved_global_state():
+        """
+        Context manager to restore, on exit, the process-wide state that
+        commands modify according to their command-line arguments (enabled
+        traces, diagnostic style, exception hook, ...), so that a command that
+        the generation daemon runs does not affect the next ones.
+        """
+        enabled_traces = dict(Log.enabled)
+        diagnostic_style = Diagnostics.style
+        blacklisted_paths = list(Diagnostics.blacklisted_paths)
+        excepthook = sys.excepthook
+        try:
+            yield
+        finally:
+            Log.enabled.clear()
+            Log.enabled.update(enabled_traces)
+            Log.nesting_level = 0
+            Diagnostics.set_style(diagnostic_style)
+            Diagnostics.blacklisted_paths[:] = blacklisted_paths
+            Diagnostics.has_pending_error = False
+            sys.excepthook = excepthook
+
+    def lang_sources_fingerprint(self):
+        """
+        Return a fingerprint for language source files (Python and Lkt
+        sources), which changes whenever one of them is modified.
+
+        :rtype: list[(str, int, int)]
+        """
+        build_dir = os.path.abspath(self.dirs.build_dir())
+        result = []
+        lang_dir = self.dirs.lang_source_dir()
+        for dirpath, dirnames, filenames in os.walk(lang_dir):
+            dirnames[:] = sorted(
+                d for d in dirnames
+                if not d.startswith('.')
+                and os.path.abspath(os.path.join(dirpath, d)) != build_dir
+            )
+            for f in sorted(filenames):
+                if f.endswith(('.py', '.lkt')):
+                    filename = os.path.join(dirpath, f)
+                    stat = os.stat(filename)
+                    result.append((filename, stat.st_mtime_ns, stat.st_size))
+        return result
+
+    def unload_language_modules(self):
+        """
+        Remove modules that come from the language source directory from
+        Python's module cache, so that the next import reloads them.
+        """
+        lang_dir = os.path.abspath(self.dirs.lang_source_dir()) + os.path.sep
+        langkit_dir = self.dirs.langkit_source_dir() + os.path.sep
+        manage_module = inspect.getmodule(self.__class__)
+
+        for name, module in list(sys.modules.items()):
+            filename = getattr(module, '__file__', None)
+            if module is manage_module or not filename:
+                continue
+            filename = os.path.abspath(filename)
+            if (
+                filename.startswith(lang_dir)
+                and not filename.startswith(langkit_dir)
+            ):
+                del sys.modules[name]
+
     def do_help(self, args):
         """
         Print usage and exit.
@@ -1251,7 +1744,16 @@ class ManageScript:
         if env is None:
             env = self.derived_env(args.build_mode)
         try:
-            subprocess.check_call(argv, env=env)
+            if self.serving:
+                # The generation daemon sends the output of commands to its
+                # clients, so it must capture the output of subprocesses too
+                # instead of letting them write to its own standard streams.
+                p = subprocess.run(argv, env=env, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT)
+                sys.stdout.write(p.stdout.decode('utf-8', 'replace'))
+                p.check_returncode()
+            else:
+                subprocess.check_call(argv, env=env)
         except (subprocess.CalledProcessError, OSError) as exc:
             print(
                 '{color}{name} failed:{reset}'
@@ -365,6 +365,57 @@ class WithLexerAnnotationSpec(AnnotationSpec):
         return lexer_decl
 
 
+class MemoAnnotationSpec(AnnotationSpec):
+    """
+    Interpreter for @memo annotations for grammar rules.
+    """
+    def __init__(self) -> None:
+        super().__init__('memo', unique=True, require_args=True)
+
+    def interpret(self,
+                  ctx: CompileCtx,
+                  args: List[L.Expr],
+                  kwargs: Dict[str, L.Expr]) -> Tuple[Optional[str],
+                                                      Optional[int]]:
+        check_source_language(not args, 'No positional argument allowed')
+
+        kind: Optional[str] = None
+        size: Optional[int] = None
+
+        try:
+            expr = kwargs.pop('kind')
+        except KeyError:
+            pass
+        else:
+            with ctx.lkt_context(expr):
+                check_source_language(isinstance(expr, L.StringLit),
+                                      'String literal expected')
+                kind = denoted_string_lit(expr)
+                check_source_language(
+                    kind in Grammar.MEMO_KINDS,
+                    'Invalid memoization table kind: {}'.format(kind)
+                )
+
+        try:
+            expr = kwargs.pop('size')
+        except KeyError:
+            pass
+        else:
+            with ctx.lkt_context(expr):
+                check_source_language(
+                    isinstance(expr, L.NumLit) and int(expr.text) > 0,
+                    'Positive integer literal expected'
+                )
+                size = int(expr.text)
+
+        check_source_language(
+            not kwargs,
+            'Invalid arguments: {}'.format(', '.join(sorted(kwargs)))
+        )
+
+        return (kind, size)
+
+
 token_cls_map = {'text': WithText,
                  'trivia': WithTrivia,
                  'symbol': WithSymbol}
@@ -388,7 +439,8 @@ class GrammarAnnotations(ParsedAnnotations):
 @dataclass
 class GrammarRuleAnnotations(ParsedAnnotations):
     main_rule: bool
-    annotations = [FlagAnnotationSpec('main_rule')]
+    memo: Optional[Tuple[Optional[str], Optional[int]]]
+    annotations = [FlagAnnotationSpec('main_rule'), MemoAnnotationSpec()]
 
 
 @dataclass
@@ -840,6 +892,7 @@ def create_grammar(ctx: CompileCtx,
     # grammar rules, that their names are unique, and that they have valid
     # annotations.
     all_rules = OrderedDict()
+    memo_options = {}
     main_rule_name = None
     for full_rule in full_grammar.f_decl.f_rules:
         with ctx.lkt_context(full_rule):
@@ -857,6 +910,9 @@ def create_grammar(ctx: CompileCtx,
                                       'only one main rule allowed')
                 main_rule_name = rule_name
 
+            if anns.memo:
+                memo_options[rule_name] = anns.memo
+
             all_rules[rule_name] = r.f_expr
 
     # Now create the result grammar. We need exactly one main rule for that.
@@ -864,6 +920,8 @@ def create_grammar(ctx: CompileCtx,
         check_source_language(main_rule_name is not None,
                               'Missing main rule (@main_rule annotation)')
     result = Grammar(main_rule_name, Location.from_lkt_node(full_grammar))
+    for rule_name, (kind, size) in memo_options.items():
+        result.set_memo(rule_name, kind=kind, size=size)
 
     # Translate rules (all_rules) later, as node types are not available yet
     result._all_lkt_rules.update(all_rules)
@@ -202,6 +202,22 @@ class Grammar:
         :type: dict[str, liblktlang.GrammarRuleExpr]
         """
 
+        self.memo_options = {}
+        """
+        Options for the packrat memoization tables of grammar rules. See the
+        ``set_memo`` method.
+
+        :type: dict[str, (str|None, int|None)]
+        """
+
+    MEMO_KINDS = {'ring': 'Ring',
+                  'adaptive': 'Adaptive_Ring',
+                  'sparse': 'Sparse'}
+    """
+    Mapping from kinds of packrat memoization tables to the corresponding
+    Langkit_Support.Types.Packrat_Memo_Kind literals.
+    """
+
     def context(self):
         return Context(self.location)
 
@@ -274,6 +290,44 @@ class Grammar:
                 rule.set_location(Location(loc.file, keywords[name].lineno))
             self._add_rule(name, rule)
 
+    def set_memo(self, *rule_names, kind=None, size=None):
+        """
+        Set options for the packrat memoization tables of the given rules.
+
+        Each parsing rule memoizes its results in a table indexed by token.
+        There are three kinds of tables:
+
+        * "ring": fixed size table, indexed by token index modulo its size.
+          Results for tokens that map to the same slot evict each other, so
+          rules that backtrack a lot need bigger rings, while simple rules can
+          save memory with smaller ones.
+
+        * "adaptive": ring that grows when the parser backtracks further than
+          its size.
+
+        * "sparse": table that keeps the results for all tokens. Lookups are
+          more expensive than for rings.
+
+        Options that are left to None are taken from the ``packrat_memo_kind``
+        and ``packrat_memo_size`` arguments for ``CompileCtx.emit``.
+
+        :param list[str] rule_names: Names of the rules to configure.
+        :param str|None kind: Kind of memoization table for these rules.
+        :param int|None size: Number of slots (initial number for adaptive
+            rings) for these rules. Ignored for sparse tables.
+        """
+        with Context(extract_library_location()):
+            check_source_language(
+                kind is None or kind in self.MEMO_KINDS,
+                'Invalid memoization table kind: {}'.format(kind)
+            )
+            check_source_language(
+                size is None or (isinstance(size, int) and size > 0),
+                'Memoization table size must be a positive integer'
+            )
+        for name in rule_names:
+            self.memo_options[name] = (kind, size)
+
     def get_rule(self, rule_name):
         """
         Helper to return the rule corresponding to rule_name. The benefit of
@@ -373,6 +427,19 @@ class Grammar:
             severity=Severity.warning
         )
 
+    def check_memo_options(self, context):
+        """
+        Emit an error if memoization options were set for missing rules.
+
+        :type context: langkit.compile_context.CompileCtx
+        """
+        with self.context():
+            for name in sorted(self.memo_options):
+                check_source_language(
+                    name in self.rules,
+                    'Memoization options set for unknown rule: {}'.format(name)
+                )
+
     def check_main_rule(self, context):
         """
         Emit an error if the main parsing rule is missing.
@@ -668,6 +735,20 @@ class Parser:
         self._name = name
         self.gen_fn_name = gen_name(name + self.base_name)
 
+    @property
+    def memo_settings(self):
+        """
+        Return the kind and the size of the packrat memoization table for the
+        function that implements this parser. The kind is the corresponding
+        Langkit_Support.Types.Packrat_Memo_Kind literal.
+
+        :rtype: (str, int)
+        """
+        ctx = get_context()
+        kind, size = self.grammar.memo_options.get(self.name, (None, None))
+        return (Grammar.MEMO_KINDS[kind or ctx.packrat_memo_kind],
+                size or ctx.packrat_memo_size)
+
     def is_left_recursive(self):
         """Return whether this parser is left-recursive."""
         return self._is_left_recursive(self.name)
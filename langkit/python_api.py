@@ -170,6 +170,24 @@ class PythonAPISettings(AbstractAPISettings):
                 if array_type.element_type.is_entity_type else
                 array_type).py_converter
 
+    def references_nodes(self, type: CompiledType) -> bool:
+        """
+        Return whether values of the given type may reference nodes, and thus
+        become invalid when the corresponding analysis units are reparsed.
+
+        :param type: Type to inspect.
+        """
+        if type.is_ast_node or type.is_entity_type:
+            return True
+        elif type.is_struct_type:
+            return any(self.references_nodes(f.type)
+                       for f in type.get_fields())
+        elif type.is_array_type:
+            return self.references_nodes(
+                cast(ArrayType, type).element_type
+            )
+        return False
+
     def type_public_name(self, type: CompiledType) -> str:
         """
         Python specific helper. Return the public API name for a given
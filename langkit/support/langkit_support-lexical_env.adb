@@ -94,7 +94,12 @@ package body Langkit_Support.Lexical_Env is
       Rebindings    : Env_Rebindings := null;
       Metadata      : Node_Metadata := Empty_Metadata;
       Categories    : Ref_Categories;
-      Local_Results : in out Lookup_Result_Vector);
+      Local_Results : in out Lookup_Result_Vector;
+      Dependencies  : access Dependency_Set);
+
+   procedure Add_Dependency
+     (Dependencies : access Dependency_Set; Unit : Unit_T);
+   --  If Dependencies is not null, add Unit to it (if not already present)
 
    procedure Reset_Lookup_Cache (Self : Lexical_Env);
    --  Reset Self's lexical environment lookup cache
@@ -137,6 +142,80 @@ package body Langkit_Support.Lexical_Env is
       end if;
    end Is_Lookup_Cache_Valid;
 
+   --------------------
+   -- Add_Dependency --
+   --------------------
+
+   procedure Add_Dependency
+     (Dependencies : access Dependency_Set; Unit : Unit_T) is
+   begin
+      if Dependencies /= null then
+         Add_Dependency (Dependencies.all, Unit);
+      end if;
+   end Add_Dependency;
+
+   --------------------
+   -- Add_Dependency --
+   --------------------
+
+   procedure Add_Dependency (Self : in out Dependency_Set; Unit : Unit_T) is
+      Position : Unit_Sets.Cursor;
+      Inserted : Boolean;
+   begin
+      --  Lookups tend to visit the same units in a row, so check the last
+      --  added unit first.
+
+      if not Self.Units.Is_Empty
+         and then Self.Units.Get (Self.Units.Last_Index) = Unit
+      then
+         return;
+      end if;
+
+      if Self.Units.Length < Dependency_Set_Index_Threshold then
+         for U of Self.Units loop
+            if U = Unit then
+               return;
+            end if;
+         end loop;
+
+      else
+         --  Build the index the first time the set gets large enough
+
+         if Self.Index.Is_Empty then
+            for U of Self.Units loop
+               Self.Index.Insert (U);
+            end loop;
+         end if;
+
+         Self.Index.Insert (Unit, Position, Inserted);
+         if not Inserted then
+            return;
+         end if;
+      end if;
+
+      Self.Units.Append (Unit);
+   end Add_Dependency;
+
+   -----------
+   -- Clear --
+   -----------
+
+   procedure Clear (Self : in out Dependency_Set) is
+   begin
+      Self.Units.Clear;
+      Self.Index.Clear;
+   end Clear;
+
+   -------------
+   -- Destroy --
+   -------------
+
+   procedure Destroy (Self : in out Dependency_Set) is
+   begin
+      Self.Units.Destroy;
+      Self.Index.Clear;
+   end Destroy;
+
    ------------------------
    -- Reset_Lookup_Cache --
    ------------------------
@@ -145,6 +224,7 @@ package body Langkit_Support.Lexical_Env is
    begin
       for C of Self.Env.Lookup_Cache loop
          C.Elements.Destroy;
+         C.Dependencies.Destroy;
       end loop;
 
       Self.Env.Lookup_Cache.Clear;
@@ -598,16 +678,45 @@ package body Langkit_Support.Lexical_Env is
       Rebindings    : Env_Rebindings := null;
       Metadata      : Node_Metadata := Empty_Metadata;
       Categories    : Ref_Categories;
-      Local_Results : in out Lookup_Result_Vector)
+      Local_Results : in out Lookup_Result_Vector;
+      Dependencies  : access Dependency_Set)
    is
       Outer_Results :  Lookup_Result_Vector :=
         Lookup_Result_Item_Vectors.Empty_Vector;
       Need_Cache  : Boolean := False;
 
+      Cache_Dependencies : aliased Dependency_Set;
+      --  If we need to add an entry to Self's lookup cache, units involved in
+      --  this lookup, so that later cache hits can report them as well
+
+      Deps : access Dependency_Set := Dependencies;
+      --  Set of units to which dependencies for this lookup must be added:
+      --  Dependencies, or Cache_Dependencies if we are computing a cache
+      --  entry for a caller that tracks dependencies. Null if dependencies
+      --  are not tracked.
+
       Current_Rebindings : Env_Rebindings;
 
       procedure Get_Refd_Nodes (Self : in out Referenced_Env);
 
+      procedure Add_To_Deps (Unit : Unit_T);
+      --  Add Unit to Deps
+
+      function Resolve_Entity
+        (Resolver : Entity_Resolver; E : Entity) return Entity;
+      --  Return Resolver.all (E). If we collect dependencies, record the units
+      --  that this resolution depends on in Deps.
+
+      function Resolve_Getter
+        (Getter : in out Env_Getter; Info : Entity_Info) return Lexical_Env;
+      --  Return Get_Env (Getter, Info). If Getter is dynamic and we collect
+      --  dependencies, record the units that the resolution depends on in
+      --  Deps. This means the cache in Getter cannot be used, as it does not
+      --  keep these units.
+
+      function Resolve_Parent return Lexical_Env;
+      --  Like Parent (Self), but resolve the parent with Resolve_Getter
+
       procedure Append_Result
         (Node         : Internal_Map_Node;
          MD           : Node_Metadata;
@@ -693,6 +802,7 @@ package body Langkit_Support.Lexical_Env is
          Map : constant Internal_Map := Env.Env.Map;
          C   : Cursor := Internal_Envs.No_Element;
       begin
+         Add_Dependency (Deps, Env.Owner);
 
          if Env.Env.Map /= null then
 
@@ -733,6 +843,82 @@ package body Langkit_Support.Lexical_Env is
          return False;
       end Get_Nodes;
 
+      -----------------
+      -- Add_To_Deps --
+      -----------------
+
+      procedure Add_To_Deps (Unit : Unit_T) is
+      begin
+         Add_Dependency (Deps, Unit);
+      end Add_To_Deps;
+
+      --------------------
+      -- Resolve_Entity --
+      --------------------
+
+      function Resolve_Entity
+        (Resolver : Entity_Resolver; E : Entity) return Entity
+      is
+         Frame  : Natural;
+         Result : Entity;
+      begin
+         if Deps = null then
+            return Resolver.all (E);
+         end if;
+
+         --  Lookups that the resolver does record their dependencies in a
+         --  dedicated frame: move them to Deps once it is done.
+
+         Frame := Push_Dependencies_Frame (E.Node);
+         begin
+            Result := Resolver.all (E);
+         exception
+            when others =>
+               Pop_Dependencies_Frame (E.Node, Frame, null);
+               raise;
+         end;
+         Pop_Dependencies_Frame (E.Node, Frame, Add_To_Deps'Access);
+         return Result;
+      end Resolve_Entity;
+
+      --------------------
+      -- Resolve_Getter --
+      --------------------
+
+      function Resolve_Getter
+        (Getter : in out Env_Getter; Info : Entity_Info) return Lexical_Env
+      is
+         Frame  : Natural;
+         Result : Lexical_Env;
+      begin
+         if not Getter.Dynamic or else Deps = null then
+            return Get_Env (Getter, Info);
+         end if;
+
+         Frame := Push_Dependencies_Frame (Getter.Node);
+         begin
+            Result := Getter.Resolver.all
+              (Entity'(Node => Getter.Node, Info => Info));
+         exception
+            when others =>
+               Pop_Dependencies_Frame (Getter.Node, Frame, null);
+               raise;
+         end;
+         Pop_Dependencies_Frame (Getter.Node, Frame, Add_To_Deps'Access);
+         return Result;
+      end Resolve_Getter;
+
+      --------------------
+      -- Resolve_Parent --
+      --------------------
+
+      function Resolve_Parent return Lexical_Env is
+         Result : constant Lexical_Env :=
+           Resolve_Getter (Self.Env.Parent, No_Entity_Info);
+      begin
+         return (if Result = Null_Lexical_Env then Empty_Env else Result);
+      end Resolve_Parent;
+
       -------------------
       -- Append_Result --
       -------------------
@@ -749,6 +935,7 @@ package body Langkit_Support.Lexical_Env is
                      Rebindings => Rebindings,
                      From_Rebound => From_Rebound));
       begin
+         Add_Dependency (Deps, Node_Unit (E.Node));
 
          if Has_Trace then
             Traces.Trace
@@ -760,7 +947,7 @@ package body Langkit_Support.Lexical_Env is
             Resolved_Entity : Entity :=
               (if Node.Resolver = null
                then E
-               else Node.Resolver.all (E));
+               else Resolve_Entity (Node.Resolver, E));
          begin
             Resolved_Entity.Info.From_Rebound := From_Rebound;
             Local_Results.Append
@@ -805,7 +992,7 @@ package body Langkit_Support.Lexical_Env is
 
          --  Get the env for the referenced env getter. Pass the metadata and
          --  current_rebindings, if relevant.
-         Env := Get_Env
+         Env := Resolve_Getter
            (Self.Getter, Entity_Info'(Metadata, Current_Rebindings, False));
 
          --  TODO: Do not create a temp vector here, rather keep track of prior
@@ -825,7 +1012,8 @@ package body Langkit_Support.Lexical_Env is
                Rebindings  => Shed_Rebindings (Env, Current_Rebindings),
                Metadata    => Metadata,
                Categories  => Categories,
-               Local_Results => Refd_Results);
+               Local_Results => Refd_Results,
+               Dependencies  => Deps);
 
             if Self.Getter.Dynamic then
                for Res of Refd_Results loop
@@ -859,6 +1047,9 @@ package body Langkit_Support.Lexical_Env is
 
       Res_Key           : constant Lookup_Cache_Key :=
         (Key, Rebindings, Metadata, Categories);
+      Computing_Entry   : constant Lookup_Cache_Entry :=
+        (Computing, Empty_Lookup_Result_Vector, Unit_Vectors.Empty_Vector,
+         Has_Dependencies => False);
       Cached_Res_Cursor : Lookup_Cache_Maps.Cursor;
       Res_Val           : Lookup_Cache_Entry;
       Inserted, Dummy   : Boolean;
@@ -883,7 +1074,7 @@ package body Langkit_Support.Lexical_Env is
          when Orphaned =>
             Get_Internal
               (Self.Env.Orphaned_Env, Key, Flat, Rebindings, Metadata,
-               Categories, Local_Results);
+               Categories, Local_Results, Dependencies);
             return;
 
          when Grouped =>
@@ -895,7 +1086,7 @@ package body Langkit_Support.Lexical_Env is
             begin
                for E of Self.Env.Grouped_Envs.all loop
                   Get_Internal (E, Key, Lookup_Kind, Rebindings, MD,
-                                Categories, Local_Results);
+                                Categories, Local_Results, Dependencies);
                end loop;
             end;
             Traces.Decrease_Indent (Rec);
@@ -906,7 +1097,7 @@ package body Langkit_Support.Lexical_Env is
             Get_Internal
               (Self.Env.Rebound_Env, Key, Lookup_Kind,
                Combine (Self.Env.Rebindings, Rebindings),
-               Metadata, Categories, Local_Results);
+               Metadata, Categories, Local_Results, Dependencies);
             return;
 
          when Primary => null; --  Handled below to avoid extra nesting levels
@@ -914,25 +1105,18 @@ package body Langkit_Support.Lexical_Env is
 
       --  At this point, we know that Self is a primary lexical environment
 
+      Add_Dependency (Dependencies, Self.Owner);
+
       if Has_Lookup_Cache (Self) and then Lookup_Kind = Recursive then
 
          if not Is_Lookup_Cache_Valid (Self) then
             Reset_Lookup_Cache (Self);
          end if;
 
-         declare
-            Val : constant Lookup_Cache_Entry :=
-              (Computing, Empty_Lookup_Result_Vector);
-         begin
-            Self.Env.Lookup_Cache.Insert
-              (Res_Key, Val, Cached_Res_Cursor, Inserted);
-         end;
+         Self.Env.Lookup_Cache.Insert
+           (Res_Key, Computing_Entry, Cached_Res_Cursor, Inserted);
 
-         if Inserted then
-            Need_Cache := True;
-            Outer_Results := Local_Results;
-            Local_Results := Lookup_Result_Item_Vectors.Empty_Vector;
-         else
+         if not Inserted then
 
             Res_Val := Element (Cached_Res_Cursor);
 
@@ -946,14 +1130,38 @@ package body Langkit_Support.Lexical_Env is
                when Computing =>
                   return;
                when Computed =>
-                  Local_Results.Concat (Res_Val.Elements);
-                  return;
+                  if Dependencies = null or else Res_Val.Has_Dependencies then
+                     Local_Results.Concat (Res_Val.Elements);
+                     for U of Res_Val.Dependencies loop
+                        Add_Dependency (Dependencies, U);
+                     end loop;
+                     return;
+                  end if;
+
+                  --  This entry was computed without tracking dependencies,
+                  --  but our caller needs them: compute it again.
+
+                  Res_Val.Elements.Destroy;
+                  Res_Val.Dependencies.Destroy;
+                  Self.Env.Lookup_Cache.Replace_Element
+                    (Cached_Res_Cursor, Computing_Entry);
                when None =>
-                  Need_Cache := True;
-                  Outer_Results := Local_Results;
-                  Local_Results := Lookup_Result_Item_Vectors.Empty_Vector;
+                  null;
             end case;
          end if;
+
+         Need_Cache := True;
+         Outer_Results := Local_Results;
+         Local_Results := Lookup_Result_Item_Vectors.Empty_Vector;
+
+         --  Collect the dependencies of the new cache entry only if our
+         --  caller tracks dependencies. Doing so is costly (it requires to
+         --  bypass the caches of dynamic env getters, see Resolve_Getter),
+         --  and lookups outside of memoized properties do not need them.
+
+         if Dependencies /= null then
+            Deps := Cache_Dependencies'Access;
+         end if;
       end if;
 
       --  If there is an environment corresponding to Self in env rebindings,
@@ -1000,7 +1208,7 @@ package body Langkit_Support.Lexical_Env is
          if Lookup_Kind = Recursive or else Self.Env.Transitive_Parent
          then
             declare
-               Parent_Env        : Lexical_Env := Parent (Self);
+               Parent_Env        : Lexical_Env := Resolve_Parent;
                Parent_Rebindings : constant Env_Rebindings :=
                  Shed_Rebindings (Parent_Env, Current_Rebindings);
             begin
@@ -1012,7 +1220,7 @@ package body Langkit_Support.Lexical_Env is
                Get_Internal
                  (Parent_Env, Key, Lookup_Kind,
                   Parent_Rebindings,
-                  Metadata, Categories, Local_Results);
+                  Metadata, Categories, Local_Results, Deps);
                if Has_Trace then
                   Traces.Decrease_Indent (Rec);
                end if;
@@ -1052,22 +1260,29 @@ package body Langkit_Support.Lexical_Env is
         and then Lookup_Kind = Recursive
         and then Need_Cache
       then
-         Self.Env.Lookup_Cache.Include (Res_Key, (Computed, Local_Results));
+         Self.Env.Lookup_Cache.Include
+           (Res_Key,
+            (Computed, Local_Results, Cache_Dependencies.Units,
+             Has_Dependencies => Dependencies /= null));
          Outer_Results.Concat (Local_Results);
          Local_Results := Outer_Results;
+         for U of Cache_Dependencies.Units loop
+            Add_Dependency (Dependencies, U);
+         end loop;
       end if;
 
    end Get_Internal;
 
    function Get
-     (Self        : Lexical_Env;
-      Key         : Symbol_Type;
-      From        : Node_Type := No_Node;
-      Lookup_Kind : Lookup_Kind_Type := Recursive;
-      Categories  : Ref_Categories := All_Cats) return Entity_Array
+     (Self         : Lexical_Env;
+      Key          : Symbol_Type;
+      From         : Node_Type := No_Node;
+      Lookup_Kind  : Lookup_Kind_Type := Recursive;
+      Categories   : Ref_Categories := All_Cats;
+      Dependencies : access Dependency_Set := null) return Entity_Array
    is
       Vec : Entity_Vectors.Vector :=
-        Get (Self, Key, From, Lookup_Kind, Categories);
+        Get (Self, Key, From, Lookup_Kind, Categories, Dependencies);
    begin
       return Ret : constant Entity_Array := Vec.To_Array do
          Vec.Destroy;
@@ -1079,11 +1294,12 @@ package body Langkit_Support.Lexical_Env is
    ---------
 
    function Get
-     (Self        : Lexical_Env;
-      Key         : Symbol_Type;
-      From        : Node_Type := No_Node;
-      Lookup_Kind : Lookup_Kind_Type := Recursive;
-      Categories  : Ref_Categories := All_Cats)
+     (Self         : Lexical_Env;
+      Key          : Symbol_Type;
+      From         : Node_Type := No_Node;
+      Lookup_Kind  : Lookup_Kind_Type := Recursive;
+      Categories   : Ref_Categories := All_Cats;
+      Dependencies : access Dependency_Set := null)
       return Entity_Vectors.Vector
    is
       FV : Entity_Vectors.Vector;
@@ -1102,7 +1318,8 @@ package body Langkit_Support.Lexical_Env is
          Results : Lookup_Result_Vector;
       begin
          Get_Internal
-           (Self, Key, Lookup_Kind, null, Empty_Metadata, Categories, Results);
+           (Self, Key, Lookup_Kind, null, Empty_Metadata, Categories, Results,
+            Dependencies);
 
          for El of Results loop
             if From = No_Node
@@ -1135,11 +1352,12 @@ package body Langkit_Support.Lexical_Env is
    ---------
 
    function Get_First
-     (Self        : Lexical_Env;
-      Key         : Symbol_Type;
-      From        : Node_Type := No_Node;
-      Lookup_Kind : Lookup_Kind_Type := Recursive;
-      Categories  : Ref_Categories := All_Cats) return Entity
+     (Self         : Lexical_Env;
+      Key          : Symbol_Type;
+      From         : Node_Type := No_Node;
+      Lookup_Kind  : Lookup_Kind_Type := Recursive;
+      Categories   : Ref_Categories := All_Cats;
+      Dependencies : access Dependency_Set := null) return Entity
    is
       FV : Entity_Vectors.Vector;
    begin
@@ -1154,7 +1372,8 @@ package body Langkit_Support.Lexical_Env is
          V : Lookup_Result_Vector;
       begin
          Get_Internal
-           (Self, Key, Lookup_Kind, null, Empty_Metadata, Categories, V);
+           (Self, Key, Lookup_Kind, null, Empty_Metadata, Categories, V,
+            Dependencies);
 
          for El of V loop
             if From = No_Node
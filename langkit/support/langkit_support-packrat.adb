@@ -21,10 +21,123 @@
 -- <http://www.gnu.org/licenses/>.                                          --
 ------------------------------------------------------------------------------
 
+with Ada.Containers.Hashed_Maps;
+with Ada.Unchecked_Deallocation;
+
 package body Langkit_Support.Packrat is
 
-   function Entry_Index (Offset : Token_Index) return Natural is
-     (Integer (Offset) mod Memo_Size);
+   type Memo_Entry_Array is array (Natural range <>) of Memo_Entry;
+   type Memo_Entry_Array_Access is access Memo_Entry_Array;
+
+   procedure Free is new Ada.Unchecked_Deallocation
+     (Memo_Entry_Array, Memo_Entry_Array_Access);
+
+   function Hash (Offset : Token_Index) return Ada.Containers.Hash_Type is
+     (Ada.Containers.Hash_Type'Mod (Offset));
+
+   package Memo_Entry_Maps is new Ada.Containers.Hashed_Maps
+     (Key_Type        => Token_Index,
+      Element_Type    => Memo_Entry,
+      Hash            => Hash,
+      Equivalent_Keys => "=");
+
+   type Memo_Table_Type (Kind : Packrat_Memo_Kind) is record
+      Collect_Statistics : Boolean;
+      --  Whether to update Stats during lookups
+
+      Stats : Packrat_Statistics;
+      --  Usage statistics for this table. Note that Stats.Size is computed
+      --  only in the Statistics function.
+
+      case Kind is
+         when Ring | Adaptive_Ring =>
+            Entries : Memo_Entry_Array_Access;
+            --  Slots for this ring
+
+            Far_Misses : Natural := 0;
+            --  For adaptive rings, number of lookups that missed since the
+            --  last resize because the slot contained the result for a
+            --  further token.
+
+         when Sparse =>
+            Map : Memo_Entry_Maps.Map;
+      end case;
+   end record;
+
+   procedure Free is new Ada.Unchecked_Deallocation
+     (Memo_Table_Type, Memo_Type);
+
+   No_Entry : constant Memo_Entry := (State => No_Result, others => <>);
+
+   function Entry_Index
+     (Entries : Memo_Entry_Array_Access; Offset : Token_Index) return Natural
+   is (Integer (Offset) mod Entries'Length)
+     with Inline;
+
+   procedure Grow (Table : in out Memo_Table_Type)
+     with Pre => Table.Kind = Adaptive_Ring;
+   --  Double the number of slots in Table (up to Max_Adaptive_Size),
+   --  preserving the results it contains.
+
+   ----------
+   -- Grow --
+   ----------
+
+   procedure Grow (Table : in out Memo_Table_Type) is
+      Old_Entries : Memo_Entry_Array_Access := Table.Entries;
+      New_Size    : constant Positive :=
+        Natural'Min (2 * Old_Entries'Length, Max_Adaptive_Size);
+   begin
+      Table.Far_Misses := 0;
+      if New_Size <= Old_Entries'Length then
+         return;
+      end if;
+
+      Table.Entries := new Memo_Entry_Array (0 .. New_Size - 1);
+      for E of Old_Entries.all loop
+         if E.State /= No_Result then
+            Table.Entries (Entry_Index (Table.Entries, E.Offset)) := E;
+         end if;
+      end loop;
+      Free (Old_Entries);
+   end Grow;
+
+   ----------------
+   -- Initialize --
+   ----------------
+
+   procedure Initialize
+     (Memo               : in out Memo_Type;
+      Kind               : Packrat_Memo_Kind := Ring;
+      Size               : Positive := Memo_Size;
+      Collect_Statistics : Boolean := False) is
+   begin
+      Destroy (Memo);
+      Memo := new Memo_Table_Type (Kind);
+      Memo.Collect_Statistics := Collect_Statistics;
+      if Kind in Ring | Adaptive_Ring then
+         Memo.Entries := new Memo_Entry_Array (0 .. Size - 1);
+      end if;
+   end Initialize;
+
+   -------------
+   -- Destroy --
+   -------------
+
+   procedure Destroy (Memo : in out Memo_Type) is
+   begin
+      if Memo = null then
+         return;
+      end if;
+
+      case Memo.Kind is
+         when Ring | Adaptive_Ring =>
+            Free (Memo.Entries);
+         when Sparse =>
+            Memo.Map.Clear;
+      end case;
+      Free (Memo);
+   end Destroy;
 
    -----------
    -- Clear --
@@ -32,9 +145,16 @@ package body Langkit_Support.Packrat is
 
    procedure Clear (Memo : in out Memo_Type) is
    begin
-      for E of Memo loop
-         E.State := No_Result;
-      end loop;
+      case Memo.Kind is
+         when Ring | Adaptive_Ring =>
+            for E of Memo.Entries.all loop
+               E.State := No_Result;
+            end loop;
+            Memo.Far_Misses := 0;
+
+         when Sparse =>
+            Memo.Map.Clear;
+      end case;
    end Clear;
 
    ---------
@@ -42,13 +162,64 @@ package body Langkit_Support.Packrat is
    ---------
 
    function Get (Memo : Memo_Type; Offset : Token_Index) return Memo_Entry is
-      E : Memo_Entry renames Memo (Entry_Index (Offset));
+      Table : Memo_Table_Type renames Memo.all;
    begin
-      if E.Offset = Offset then
-         return E;
-      else
-         return (State => No_Result, others => <>);
-      end if;
+      case Table.Kind is
+         when Ring | Adaptive_Ring =>
+            declare
+               E : Memo_Entry renames
+                 Table.Entries (Entry_Index (Table.Entries, Offset));
+            begin
+               if E.Offset = Offset and then E.State /= No_Result then
+                  if Table.Collect_Statistics then
+                     Table.Stats.Hits := Table.Stats.Hits + 1;
+                  end if;
+                  return E;
+               end if;
+               if Table.Collect_Statistics then
+                  Table.Stats.Misses := Table.Stats.Misses + 1;
+               end if;
+
+               --  If this slot holds the result for a further token, the
+               --  parser backtracked more than the size of the ring, so the
+               --  result we are looking for may have been evicted: count
+               --  such misses for adaptive rings.
+
+               if Table.Kind = Adaptive_Ring
+                  and then E.State /= No_Result
+                  and then E.Offset > Offset
+               then
+                  Table.Far_Misses := Table.Far_Misses + 1;
+               end if;
+            end;
+
+            --  Grow adaptive rings when these misses become too frequent
+
+            if Table.Kind = Adaptive_Ring
+               and then Table.Far_Misses > Table.Entries'Length / 4
+            then
+               Grow (Table);
+            end if;
+
+         when Sparse =>
+            declare
+               use Memo_Entry_Maps;
+
+               Cur : constant Cursor := Table.Map.Find (Offset);
+            begin
+               if Has_Element (Cur) then
+                  if Table.Collect_Statistics then
+                     Table.Stats.Hits := Table.Stats.Hits + 1;
+                  end if;
+                  return Element (Cur);
+               end if;
+               if Table.Collect_Statistics then
+                  Table.Stats.Misses := Table.Stats.Misses + 1;
+               end if;
+            end;
+      end case;
+
+      return No_Entry;
    end Get;
 
    ---------
@@ -60,12 +231,55 @@ package body Langkit_Support.Packrat is
                   Instance          : T;
                   Offset, Final_Pos : Token_Index)
    is
-      E : Memo_Entry renames Memo (Entry_Index (Offset));
+      New_Entry : constant Memo_Entry :=
+        (State     => (if Is_Success then Success else Failure),
+         Instance  => Instance,
+         Offset    => Offset,
+         Final_Pos => Final_Pos);
    begin
-      E := (State     => (if Is_Success then Success else Failure),
-            Instance  => Instance,
-            Offset    => Offset,
-            Final_Pos => Final_Pos);
+      case Memo.Kind is
+         when Ring | Adaptive_Ring =>
+            declare
+               E : Memo_Entry renames
+                 Memo.Entries (Entry_Index (Memo.Entries, Offset));
+            begin
+               if Memo.Collect_Statistics
+                  and then E.State /= No_Result
+                  and then E.Offset /= Offset
+               then
+                  Memo.Stats.Collisions := Memo.Stats.Collisions + 1;
+               end if;
+               E := New_Entry;
+            end;
+
+         when Sparse =>
+            Memo.Map.Include (Offset, New_Entry);
+      end case;
    end Set;
 
+   ----------------
+   -- Statistics --
+   ----------------
+
+   function Statistics (Memo : Memo_Type) return Packrat_Statistics is
+   begin
+      return Result : Packrat_Statistics := Memo.Stats do
+         case Memo.Kind is
+            when Ring | Adaptive_Ring =>
+               Result.Size := Memo.Entries'Length;
+            when Sparse =>
+               Result.Size := Natural (Memo.Map.Length);
+         end case;
+      end return;
+   end Statistics;
+
+   ----------------------
+   -- Reset_Statistics --
+   ----------------------
+
+   procedure Reset_Statistics (Memo : in out Memo_Type) is
+   begin
+      Memo.Stats := (others => <>);
+   end Reset_Statistics;
+
 end Langkit_Support.Packrat;
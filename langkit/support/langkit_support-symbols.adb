@@ -30,6 +30,28 @@ package body Langkit_Support.Symbols is
 
    procedure Deallocate is new Ada.Unchecked_Deallocation
      (Symbol_Table_Record, Symbol_Table);
+   procedure Free is new Ada.Unchecked_Deallocation
+     (Slot_Table, Slot_Table_Access);
+   procedure Free is new Ada.Unchecked_Deallocation
+     (Symbol_Entry, Symbol_Entry_Access);
+
+   Initial_Slot_Table_Last : constant Hash_Type := 63;
+   --  Index of the last slot in the initial slot table of each shard
+
+   function Shard_For (H : Hash_Type) return Shard_Index
+   is (Shard_Index'Mod (H));
+   --  Return the index of the shard that contains symbols whose hash is H
+
+   function Lookup
+     (Table : Slot_Table_Access;
+      T     : Text_Type;
+      H     : Hash_Type) return Symbol_Type;
+   --  Look for T (whose hash is H) in Table. Return the corresponding symbol
+   --  if found, null otherwise. This can run concurrently with insertions.
+
+   procedure Insert (Table : in out Slot_Table; E : Symbol_Entry_Access);
+   --  Store E in the first free slot for it in Table, which must have at
+   --  least one free slot.
 
    -----------
    -- Image --
@@ -61,6 +83,13 @@ package body Langkit_Support.Symbols is
    function Create_Symbol_Table return Symbol_Table is
    begin
       return Result : constant Symbol_Table := new Symbol_Table_Record do
+         for Shard of Result.Shards loop
+            Shard.Table := new Slot_Table'
+              (Last     => Initial_Slot_Table_Last,
+               Slots    => (others => null),
+               Count    => 0,
+               Previous => null);
+         end loop;
          for I in Precomputed_Symbol_Index'Range loop
             Result.Precomputed (I) := Find (Result, Precomputed_Symbol (I));
          end loop;
@@ -82,6 +111,46 @@ package body Langkit_Support.Symbols is
       pragma Warnings (On, "value not in range");
    end Precomputed_Symbol;
 
+   ------------
+   -- Lookup --
+   ------------
+
+   function Lookup
+     (Table : Slot_Table_Access;
+      T     : Text_Type;
+      H     : Hash_Type) return Symbol_Type
+   is
+      --  The low bits of H are used to select the shard, so use the other
+      --  ones to select the first slot to probe.
+
+      I : Hash_Type := (H / Shard_Count) and Table.Last;
+      E : Symbol_Entry_Access;
+   begin
+      loop
+         E := Table.Slots (I);
+         if E = null then
+            return null;
+         elsif E.Text_Hash = H and then E.Symbol.all = T then
+            return E.Symbol;
+         end if;
+         I := (I + 1) and Table.Last;
+      end loop;
+   end Lookup;
+
+   ------------
+   -- Insert --
+   ------------
+
+   procedure Insert (Table : in out Slot_Table; E : Symbol_Entry_Access) is
+      I : Hash_Type := (E.Text_Hash / Shard_Count) and Table.Last;
+   begin
+      while Table.Slots (I) /= null loop
+         I := (I + 1) and Table.Last;
+      end loop;
+      Table.Slots (I) := E;
+      Table.Count := Table.Count + 1;
+   end Insert;
+
    ----------
    -- Find --
    ----------
@@ -92,49 +161,122 @@ package body Langkit_Support.Symbols is
       Create : Boolean := True)
       return Symbol_Type
    is
-      use Sets;
-
-      T_Acc  : Symbol_Type := T'Unrestricted_Access;
-      Result : constant Cursor := ST.Symbols.Find (T_Acc);
+      H      : constant Hash_Type := Hash (T);
+      S      : constant Shard_Index := Shard_For (H);
+      Result : Symbol_Type := Lookup (ST.Shards (S).Table, T, H);
    begin
-      --  If we already have such a symbol, return the access we already
-      --  internalized. Otherwise, give up if asked to.
+      --  Symbols are never removed from a table, so if we found one, we are
+      --  done. Otherwise, give up if asked to, or go through the shard lock
+      --  to create it (another task may have done it in the meantime).
 
-      if Has_Element (Result) then
-         return Element (Result);
-      elsif not Create then
-         return null;
+      if Result = null and then Create then
+         ST.Locks (S).Intern (ST.Shards (S), T, H, Result);
       end if;
+      return Result;
+   end Find;
 
-      --  At this point, we know we have to internalize a new symbol
+   ----------------
+   -- Shard_Lock --
+   ----------------
 
-      T_Acc := new Text_Type'(T);
-      ST.Symbols.Insert (T_Acc);
-      return T_Acc;
-   end Find;
+   protected body Shard_Lock is
+
+      ------------
+      -- Intern --
+      ------------
+
+      procedure Intern
+        (Shard  : in out Shard_Type;
+         T      : Text_Type;
+         H      : Hash_Type;
+         Result : out Symbol_Type)
+      is
+         Table : Slot_Table_Access := Shard.Table;
+         E     : Symbol_Entry_Access;
+      begin
+         --  If we already have such a symbol, return the access we already
+         --  internalized.
+
+         Result := Lookup (Table, T, H);
+         if Result /= null then
+            return;
+         end if;
+
+         --  At this point, we know we have to internalize a new symbol. Keep
+         --  the load factor of the slot table under 3/4: if adding this
+         --  symbol would exceed it, create a bigger table, fill it with
+         --  existing entries and only then make it visible to lookups.
+
+         if (Table.Count + 1) * 4 > (Table.Last + 1) * 3 then
+            declare
+               Old_Table : constant Slot_Table_Access := Table;
+            begin
+               Table := new Slot_Table'
+                 (Last     => 2 * Old_Table.Last + 1,
+                  Slots    => (others => null),
+                  Count    => 0,
+                  Previous => Old_Table);
+               for Old_E of Old_Table.Slots loop
+                  if Old_E /= null then
+                     Insert (Table.all, Old_E);
+                  end if;
+               end loop;
+               Shard.Table := Table;
+            end;
+         end if;
+
+         Result := new Text_Type'(T);
+         E := new Symbol_Entry'(Symbol => Result, Text_Hash => H);
+         Insert (Table.all, E);
+      end Intern;
+
+   end Shard_Lock;
 
    -------------
    -- Destroy --
    -------------
 
    procedure Destroy (ST : in out Symbol_Table) is
-      use Sets;
-      C : Cursor := ST.Symbols.First;
+
+      --  We keep Symbol_Type to be a constant access everywhere for
+      --  simplification, but we know symbol tables are the only owners of
+      --  these, so stripping the "constant" attribute away here is known to
+      --  be safe.
+
+      function Convert is new Ada.Unchecked_Conversion
+        (Symbol_Type, Text_Access);
+
    begin
-      while Has_Element (C) loop
+      for Shard of ST.Shards loop
+
+         --  The current slot table references all the entries of this shard:
+         --  free them (and the symbols they hold) through it.
+
+         for E of Shard.Table.Slots loop
+            if E /= null then
+               declare
+                  To_Free : Text_Access := Convert (E.Symbol);
+               begin
+                  Free (To_Free);
+                  Free (E);
+               end;
+            end if;
+         end loop;
+
+         --  Older slot tables only reference entries we just freed, so just
+         --  free the tables themselves.
+
          declare
-            --  We keep Symbol_Type to be a constant access everywhere for
-            --  simplification, but we know symbol tables are the only owners
-            --  of these, so stripping the "constant" attribute away here is
-            --  known to be safe.
-
-            function Convert is new Ada.Unchecked_Conversion
-              (Symbol_Type, Text_Access);
-            To_Free : Text_Access := Convert (Element (C));
+            Table : Slot_Table_Access := Shard.Table;
+            Next  : Slot_Table_Access;
          begin
-            Next (C);
-            Free (To_Free);
+            while Table /= null loop
+               Next := Table.Previous;
+               Free (Table);
+               Table := Next;
+            end loop;
          end;
+         Shard.Table := null;
       end loop;
       Deallocate (ST);
    end Destroy;
@@ -27,6 +27,18 @@ package body Langkit_Support.Token_Data_Handlers is
      (TDH   : Token_Data_Handler;
       Index : Token_Index) return Token_Index_Vectors.Elements_Array;
 
+   function Widen (Buffer : String) return Text_Type;
+   --  Decode Buffer, a Latin-1 encoded string, into text. The result has the
+   --  same bounds as Buffer.
+
+   function Next_Column
+     (TDH    : Token_Data_Handler;
+      Column : Column_Number;
+      Index  : Positive) return Column_Number;
+   --  Return the column number for the character that follows the one at
+   --  Index in TDH's source buffer, Column being the column number for the
+   --  latter.
+
    generic
       type Key_Type is private;
       --  Type of the value used to sort vector elements
@@ -93,6 +105,19 @@ package body Langkit_Support.Token_Data_Handlers is
       return Before;
    end Floor;
 
+   -----------
+   -- Widen --
+   -----------
+
+   function Widen (Buffer : String) return Text_Type is
+   begin
+      return Result : Text_Type (Buffer'Range) do
+         for I in Buffer'Range loop
+            Result (I) := Character_Type'Val (Character'Pos (Buffer (I)));
+         end loop;
+      end return;
+   end Widen;
+
    -----------------
    -- Initialized --
    -----------------
@@ -108,7 +133,7 @@ package body Langkit_Support.Token_Data_Handlers is
 
    function Has_Source_Buffer (TDH : Token_Data_Handler) return Boolean is
    begin
-      return TDH.Source_Buffer /= null;
+      return TDH.Source_Buffer /= null or else TDH.Compact_Buffer /= null;
    end Has_Source_Buffer;
 
    ----------------
@@ -119,6 +144,7 @@ package body Langkit_Support.Token_Data_Handlers is
    is
    begin
       TDH := (Source_Buffer     => null,
+              Compact_Buffer    => null,
               Source_First      => <>,
               Source_Last       => <>,
               Filename          => <>,
@@ -126,7 +152,10 @@ package body Langkit_Support.Token_Data_Handlers is
               Tokens            => <>,
               Symbols           => Symbols,
               Tokens_To_Trivias => <>,
-              Trivias           => <>);
+              Trivias           => <>,
+              Lines_Starts      => <>,
+              Lines_First_Tabs  => <>,
+              Tab_Stop          => Default_Tab_Stop);
    end Initialize;
 
    -----------
@@ -137,16 +166,37 @@ package body Langkit_Support.Token_Data_Handlers is
      (TDH           : in out Token_Data_Handler;
       Source_Buffer : Text_Access;
       Source_First  : Positive;
-      Source_Last   : Natural) is
+      Source_Last   : Natural;
+      Tab_Stop      : Positive := Default_Tab_Stop) is
    begin
       Free (TDH.Source_Buffer);
+      GNAT.Strings.Free (TDH.Compact_Buffer);
       TDH.Source_Buffer := Source_Buffer;
       TDH.Source_First := Source_First;
       TDH.Source_Last := Source_Last;
+      TDH.Tab_Stop := Tab_Stop;
 
       Clear (TDH.Tokens);
       Clear (TDH.Trivias);
       Clear (TDH.Tokens_To_Trivias);
+
+      --  The first line always starts at the beginning of the source buffer
+
+      Clear (TDH.Lines_Starts);
+      Append (TDH.Lines_Starts, Source_First);
+      Clear (TDH.Lines_First_Tabs);
+      Append (TDH.Lines_First_Tabs, 0);
+   end Reset;
+
+   procedure Reset
+     (TDH            : in out Token_Data_Handler;
+      Compact_Buffer : GNAT.Strings.String_Access;
+      Source_First   : Positive;
+      Source_Last    : Natural;
+      Tab_Stop       : Positive := Default_Tab_Stop) is
+   begin
+      Reset (TDH, Text_Access'(null), Source_First, Source_Last, Tab_Stop);
+      TDH.Compact_Buffer := Compact_Buffer;
    end Reset;
 
    ----------
@@ -156,12 +206,58 @@ package body Langkit_Support.Token_Data_Handlers is
    procedure Free (TDH : in out Token_Data_Handler) is
    begin
       Free (TDH.Source_Buffer);
+      GNAT.Strings.Free (TDH.Compact_Buffer);
       Destroy (TDH.Tokens);
       Destroy (TDH.Trivias);
       Destroy (TDH.Tokens_To_Trivias);
+      Destroy (TDH.Lines_Starts);
+      Destroy (TDH.Lines_First_Tabs);
       TDH.Symbols := No_Symbol_Table;
    end Free;
 
+   -------------
+   -- Compact --
+   -------------
+
+   procedure Compact (TDH : in out Token_Data_Handler) is
+   begin
+      if TDH.Source_Buffer = null then
+         return;
+      end if;
+
+      declare
+         Text : Text_Type renames
+           TDH.Source_Buffer.all (TDH.Source_First .. TDH.Source_Last);
+      begin
+         for C of Text loop
+            if Character_Type'Pos (C) > Character'Pos (Character'Last) then
+               return;
+            end if;
+         end loop;
+
+         TDH.Compact_Buffer := new String (Text'Range);
+         for I in Text'Range loop
+            TDH.Compact_Buffer (I) :=
+              Character'Val (Character_Type'Pos (Text (I)));
+         end loop;
+      end;
+      Free (TDH.Source_Buffer);
+   end Compact;
+
+   ---------------
+   -- Decompact --
+   ---------------
+
+   procedure Decompact (TDH : in out Token_Data_Handler) is
+   begin
+      if TDH.Source_Buffer = null then
+         TDH.Source_Buffer := new Text_Type (TDH.Compact_Buffer'Range);
+         Copy_Text (TDH, TDH.Compact_Buffer'First, TDH.Compact_Buffer'Last,
+                    TDH.Source_Buffer.all);
+         GNAT.Strings.Free (TDH.Compact_Buffer);
+      end if;
+   end Decompact;
+
    ----------
    -- Move --
    ----------
@@ -170,6 +266,7 @@ package body Langkit_Support.Token_Data_Handlers is
    begin
       Destination := Source;
       Source := (Source_Buffer     => null,
+                 Compact_Buffer    => null,
                  Source_First      => <>,
                  Source_Last       => <>,
                  Filename          => <>,
@@ -177,7 +274,10 @@ package body Langkit_Support.Token_Data_Handlers is
                  Tokens            => <>,
                  Symbols           => No_Symbol_Table,
                  Tokens_To_Trivias => <>,
-                 Trivias           => <>);
+                 Trivias           => <>,
+                 Lines_Starts      => <>,
+                 Lines_First_Tabs  => <>,
+                 Tab_Stop          => Default_Tab_Stop);
    end Move;
 
    --------------------------
@@ -219,6 +319,159 @@ package body Langkit_Support.Token_Data_Handlers is
       return Token_Index_Vectors.Empty_Array;
    end Internal_Get_Trivias;
 
+   --------------------
+   -- Add_Line_Start --
+   --------------------
+
+   procedure Add_Line_Start (TDH : in out Token_Data_Handler; Index : Positive)
+   is
+   begin
+      Append (TDH.Lines_Starts, Index);
+      Append (TDH.Lines_First_Tabs, 0);
+   end Add_Line_Start;
+
+   -------------
+   -- Add_Tab --
+   -------------
+
+   procedure Add_Tab (TDH : in out Token_Data_Handler; Index : Positive) is
+      First_Tab : Integer renames TDH.Lines_First_Tabs.Last_Element.all;
+   begin
+      if First_Tab = 0 then
+         First_Tab := Index;
+      end if;
+   end Add_Tab;
+
+   -----------------
+   -- Next_Column --
+   -----------------
+
+   function Next_Column
+     (TDH    : Token_Data_Handler;
+      Column : Column_Number;
+      Index  : Positive) return Column_Number
+   is
+   begin
+      --  TODO: use the Unicode algorithm to account for grapheme clusters
+
+      if (if TDH.Source_Buffer = null
+          then TDH.Compact_Buffer (Index) = ASCII.HT
+          else TDH.Source_Buffer (Index) = Chars.HT)
+      then
+         --  Make horizontal tabulations move by stride of Tab_Stop columns,
+         --  as usually implemented in code editors.
+
+         declare
+            Zero_Based : constant Natural := Natural (Column - 1);
+            Aligned    : constant Natural :=
+              (Zero_Based + TDH.Tab_Stop) / TDH.Tab_Stop * TDH.Tab_Stop;
+         begin
+            return Column_Number (Aligned + 1);
+         end;
+      else
+         return Column + 1;
+      end if;
+   end Next_Column;
+
+   --------------
+   -- Get_Sloc --
+   --------------
+
+   function Get_Sloc
+     (TDH : Token_Data_Handler; Index : Natural) return Source_Location
+   is
+      Lines  : Integer_Vectors.Vector renames TDH.Lines_Starts;
+      Before : Positive := Lines.First_Index;
+      After  : Positive := Lines.Last_Index;
+   begin
+      --  Look for the last line that starts before Index (or at Index)
+
+      while Before < After loop
+         declare
+            Middle : constant Positive := (Before + After + 1) / 2;
+         begin
+            if Lines.Get (Middle) <= Index then
+               Before := Middle;
+            else
+               After := Middle - 1;
+            end if;
+         end;
+      end loop;
+
+      --  Then compute the column number from the start of this line. Until
+      --  the first tabulation, each character takes exactly one column, so
+      --  only the part of the line after it needs to be scanned.
+
+      declare
+         Line_Start : constant Positive := Lines.Get (Before);
+         First_Tab  : constant Natural := TDH.Lines_First_Tabs.Get (Before);
+      begin
+         if First_Tab = 0 or else Index <= First_Tab then
+            return (Line_Number (Before),
+                    Column_Number (Index - Line_Start + 1));
+         end if;
+
+         return Result : Source_Location :=
+           (Line_Number (Before), Column_Number (First_Tab - Line_Start + 1))
+         do
+            for I in First_Tab .. Index - 1 loop
+               Result.Column := Next_Column (TDH, Result.Column, I);
+            end loop;
+         end return;
+      end;
+   end Get_Sloc;
+
+   ---------------
+   -- Get_Index --
+   ---------------
+
+   function Get_Index
+     (TDH : Token_Data_Handler; Sloc : Source_Location) return Natural
+   is
+      Lines  : Integer_Vectors.Vector renames TDH.Lines_Starts;
+      Column : Column_Number := 1;
+      Last   : Natural;
+   begin
+      if Sloc.Line = 0 or else Sloc.Line > Line_Number (Lines.Last_Index) then
+         return 0;
+      end if;
+
+      --  Compute the index of the last position in this line: its line
+      --  terminator for all lines but the last one, or the position right
+      --  after the source buffer.
+
+      declare
+         Line : constant Positive := Positive (Sloc.Line);
+      begin
+         Last := (if Line = Lines.Last_Index
+                  then TDH.Source_Last + 1
+                  else Lines.Get (Line + 1) - 1);
+
+         for I in Lines.Get (Line) .. Last loop
+            if Column = Sloc.Column then
+               return I;
+            elsif Column > Sloc.Column or else I > TDH.Source_Last then
+               exit;
+            end if;
+            Column := Next_Column (TDH, Column, I);
+         end loop;
+      end;
+
+      return 0;
+   end Get_Index;
+
+   ----------------
+   -- Sloc_Range --
+   ----------------
+
+   function Sloc_Range
+     (TDH   : Token_Data_Handler;
+      Token : Stored_Token_Data) return Source_Location_Range is
+   begin
+      return Make_Range (Get_Sloc (TDH, Token.Source_First),
+                         Get_Sloc (TDH, Token.Source_Last + 1));
+   end Sloc_Range;
+
    ---------------
    -- Get_Token --
    ---------------
@@ -498,10 +751,11 @@ package body Langkit_Support.Token_Data_Handlers is
                Triv_Index     : constant Natural := Natural (Key_Trivia);
                Tok_Index      : constant Natural := Element_Index - 1;
                Key_Start_Sloc : constant Source_Location := Start_Sloc
-                 (TDH.Trivias.Get (Triv_Index).T.Sloc_Range);
+                 (Sloc_Range (TDH, TDH.Trivias.Get (Triv_Index).T));
             begin
                return Compare
-                 (TDH.Tokens.Get (Tok_Index).Sloc_Range, Key_Start_Sloc);
+                 (Sloc_Range (TDH, TDH.Tokens.Get (Tok_Index)),
+                  Key_Start_Sloc);
             end;
          end if;
 
@@ -543,13 +797,13 @@ package body Langkit_Support.Token_Data_Handlers is
         (Sloc        : Source_Location;
          Dummy_Index : Positive;
          Token       : Stored_Token_Data) return Relative_Position
-      is (Compare (Token.Sloc_Range, Sloc));
+      is (Compare (Sloc_Range (TDH, Token), Sloc));
 
       function Compare
         (Sloc        : Source_Location;
          Dummy_Index : Positive;
          Trivia      : Trivia_Node) return Relative_Position
-      is (Compare (Trivia.T.Sloc_Range, Sloc));
+      is (Compare (Sloc_Range (TDH, Trivia.T), Sloc));
 
       function Token_Floor is new Floor
         (Key_Type        => Source_Location,
@@ -580,7 +834,7 @@ package body Langkit_Support.Token_Data_Handlers is
 
       declare
          function SS (Token : Stored_Token_Data) return Source_Location is
-           (Start_Sloc (Token.Sloc_Range));
+           (Start_Sloc (Sloc_Range (TDH, Token)));
 
          Tok_Sloc  : constant Source_Location := SS (TDH.Tokens.Get (Token));
          Triv_Sloc : constant Source_Location :=
@@ -611,6 +865,47 @@ package body Langkit_Support.Token_Data_Handlers is
               else TDH.Trivias.Get (Natural (Token.Trivia)).T);
    end Data;
 
+   ----------
+   -- Text --
+   ----------
+
+   function Text
+     (TDH : Token_Data_Handler;
+      T   : Stored_Token_Data) return Text_Type is
+   begin
+      return Text (TDH, T.Source_First, T.Source_Last);
+   end Text;
+
+   function Text
+     (TDH   : Token_Data_Handler;
+      First : Positive;
+      Last  : Natural) return Text_Type is
+   begin
+      return (if TDH.Source_Buffer = null
+              then Widen (TDH.Compact_Buffer (First .. Last))
+              else TDH.Source_Buffer (First .. Last));
+   end Text;
+
+   ---------------
+   -- Copy_Text --
+   ---------------
+
+   procedure Copy_Text
+     (TDH    : Token_Data_Handler;
+      First  : Positive;
+      Last   : Natural;
+      Result : out Text_Type) is
+   begin
+      if TDH.Source_Buffer = null then
+         for I in First .. Last loop
+            Result (Result'First + I - First) :=
+              Character_Type'Val (Character'Pos (TDH.Compact_Buffer (I)));
+         end loop;
+      else
+         Result := TDH.Source_Buffer (First .. Last);
+      end if;
+   end Copy_Text;
+
    -----------------
    -- Get_Trivias --
    -----------------
@@ -1,9 +1,12 @@
+import hashlib
 import os.path
 import sys
 
+import mako
 import mako.exceptions
 from mako.lookup import TemplateLookup
 
+import langkit
 from langkit.common import string_repr
 from langkit.diagnostics import DiagnosticError
 from langkit.names import Name
@@ -45,12 +48,93 @@ _template_dirs = []
 _template_lookup = None
 ":type: mako.utils.TemplateLookup"
 
+_template_cache_dir = None
+"""
+If not None, path to the directory in which compiled templates are cached
+across runs.
 
-def add_template_dir(path):
+:type: str|None
+"""
+
+
+def _cached_module_filename(filename, uri):
+    """
+    Return the path to the file that caches the compiled module for the given
+    template. This is used as the ``modulename_callable`` hook of Mako's
+    template lookup.
+
+    The name of this file is computed from the template URI and content, and
+    from the Langkit and Mako versions so that cache entries are never reused
+    across different versions of the code generators.
+
+    :param str filename: Path to the template source file.
+    :param str uri: URI for the template, as passed to
+        ``TemplateLookup.get_template``.
+    :rtype: str
+    """
+    h = hashlib.sha256()
+    h.update('{}:{}:{}:'.format(langkit.__version__, mako.__version__,
+                                uri).encode('utf-8'))
+    with open(filename, 'rb') as f:
+        h.update(f.read())
+
+    base_name = os.path.splitext(os.path.basename(filename))[0]
+    return os.path.join(_template_cache_dir,
+                        '{}-{}.py'.format(base_name, h.hexdigest()))
+
+
+def _update_template_lookup():
     global _template_lookup
+    _template_lookup = TemplateLookup(
+        directories=_template_dirs,
+        strict_undefined=True,
+        modulename_callable=(_cached_module_filename
+                             if _template_cache_dir else None)
+    )
+
+
+def add_template_dir(path):
     _template_dirs.append(path)
-    _template_lookup = TemplateLookup(directories=_template_dirs,
-                                      strict_undefined=True)
+    _update_template_lookup()
+
+
+def set_template_cache_dir(path):
+    """
+    Enable or disable the persistent cache for compiled templates.
+
+    When enabled, each template is compiled only once, and the resulting
+    Python module is saved in ``path``: later runs (for instance
+    ``manage.py generate`` runs on the same build directory) load it instead
+    of compiling the template again.
+
+    :param str|None path: Directory in which to store compiled templates, or
+        None to disable the cache.
+    """
+    global _template_cache_dir
+    _template_cache_dir = path
+    _update_template_lookup()
+
+
+def templates_digest():
+    """
+    Return a digest for the content of all templates available for code
+    generation, and for the Langkit version.
+
+    :rtype: str
+    """
+    h = hashlib.sha256()
+    h.update(langkit.__version__.encode('ascii'))
+    for dirpath in _template_dirs:
+        for root, dirs, files in os.walk(dirpath):
+            dirs.sort()
+            for f in sorted(files):
+                if not f.endswith('.mako'):
+                    continue
+                path = os.path.join(root, f)
+                h.update(os.path.relpath(path, dirpath).encode('utf-8'))
+                with open(path, 'rb') as fp:
+                    h.update(fp.read())
+    return h.hexdigest()
 
 
 add_template_dir(os.path.join(os.path.dirname(os.path.realpath(__file__)),
@@ -110,6 +110,56 @@ typedef struct {
 } ${token_type};
 
 
+${c_doc('langkit.node_tree_type')}
+typedef struct {
+    /* Number of nodes in the tree.  */
+    int count;
+
+    /* Nodes themselves.  */
+    ${node_type} *nodes;
+
+    /* Kind for each node.  */
+    int *kinds;
+
+    /* Index of the parent for each node (-1 for the root).  */
+    int *parents;
+
+    /* Number of non-null children for each node.  */
+    int *children_counts;
+
+    /* Indexes of the first/last token for each node (the last token index is
+       0 for ghost nodes).  */
+    int *token_starts, *token_ends;
+
+    /* Source location range for each node.  */
+    uint32_t *start_lines;
+    uint16_t *start_columns;
+    uint32_t *end_lines;
+    uint16_t *end_columns;
+} ${node_tree_type};
+
+${c_doc('langkit.token_table_type')}
+typedef struct {
+    /* Number of tokens and trivia in the table.  */
+    int count;
+
+    /* Kind for each token.  */
+    int *kinds;
+
+    /* Offsets for the first character of each token and for the character
+       that follows the last one.  */
+    int *start_offsets, *end_offsets;
+
+    /* Source location range for each token.  */
+    uint32_t *start_lines;
+    uint32_t *end_lines;
+    uint16_t *start_columns;
+    uint16_t *end_columns;
+
+    /* Whether each token is a trivia (1) or a regular token (0).  */
+    uint8_t *is_trivia;
+} ${token_table_type};
+
 ${c_doc('langkit.diagnostic_type')}
 typedef struct {
     ${sloc_range_type} sloc_range;
@@ -253,6 +303,12 @@ ${capi.get_name("context_discard_errors_in_populate_lexical_env")}(
         ${analysis_context_type} context,
         int discard);
 
+${c_doc('langkit.context_use_memory_mapped_files')}
+extern void
+${capi.get_name("context_use_memory_mapped_files")}(
+        ${analysis_context_type} context,
+        int enabled);
+
 ${c_doc('langkit.get_unit_from_file')}
 extern ${analysis_unit_type}
 ${capi.get_name("get_analysis_unit_from_file")}(
@@ -262,6 +318,18 @@ ${capi.get_name("get_analysis_unit_from_file")}(
         int reparse,
         ${grammar_rule_type} rule);
 
+${c_doc('langkit.get_units_from_files')}
+extern void
+${capi.get_name("get_analysis_units_from_files")}(
+        ${analysis_context_type} context,
+        const char **filenames,
+        int count,
+        const char *charset,
+        int reparse,
+        ${grammar_rule_type} rule,
+        int jobs,
+        ${analysis_unit_type} *units);
+
 ${c_doc('langkit.get_unit_from_buffer')}
 extern ${analysis_unit_type}
 ${capi.get_name("get_analysis_unit_from_buffer")}(
@@ -306,6 +374,15 @@ ${c_doc('langkit.unit_trivia_count')}
 extern int
 ${capi.get_name('unit_trivia_count')}(${analysis_unit_type} unit);
 
+${c_doc('langkit.unit_export_tokens')}
+extern int
+${capi.get_name('unit_export_tokens')}(${analysis_unit_type} unit,
+                                       ${token_table_type} *table_p);
+
+${c_doc('langkit.destroy_token_table')}
+extern void
+${capi.get_name('destroy_token_table')}(${token_table_type} *table);
+
 ${c_doc('langkit.unit_dump_lexical_env')}
 extern void
 ${capi.get_name('unit_dump_lexical_env')}(${analysis_unit_type} unit);
@@ -340,6 +417,12 @@ ${capi.get_name("unit_reparse_from_buffer")} (${analysis_unit_type} unit,
                                               const char *buffer,
                                               size_t buffer_size);
 
+${c_doc('langkit.unit_reparse_edit')}
+extern void
+${capi.get_name("unit_reparse_edit")}(${analysis_unit_type} unit,
+                                      ${sloc_range_type} *edit_range,
+                                      ${text_type} *text);
+
 ${c_doc('langkit.unit_populate_lexical_env')}
 extern int
 ${capi.get_name("unit_populate_lexical_env")}(${analysis_unit_type} unit);
@@ -406,10 +489,25 @@ ${capi.get_name("node_child")}(${entity_type} *node,
                                unsigned n,
                                ${entity_type}* child_p);
 
+${c_doc('langkit.node_export_tree')}
+extern int
+${capi.get_name("node_export_tree")}(${entity_type} *node,
+                                     ${node_tree_type} *tree_p);
+
+${c_doc('langkit.destroy_node_tree')}
+extern void
+${capi.get_name("destroy_node_tree")}(${node_tree_type} *tree);
+
 ${c_doc('langkit.text_to_locale_string')}
 extern char *
 ${capi.get_name("text_to_locale_string")}(${text_type} *text);
 
+${c_doc('langkit.text_to_bytes')}
+extern int
+${capi.get_name("text_to_bytes")}(${text_type} *text,
+                                  char **bytes,
+                                  size_t *length);
+
 ${c_doc('langkit.free')}
 extern void
 ${capi.get_name("free")}(void *address);
@@ -480,6 +578,9 @@ ${c_doc('langkit.get_last_exception')}
 extern const ${exception_type} *
 ${capi.get_name('get_last_exception')}(void);
 
+${c_doc('langkit.last_exception')}
+extern const ${exception_type} *${capi.get_name('last_exception')};
+
 ${c_doc('langkit.token_kind_name')}
 extern char *
 ${capi.get_name('token_kind_name')}(${token_kind} kind);
@@ -7,6 +7,7 @@
 
 <% entity_type = root_entity.c_type(capi).name %>
 
+with Ada.Containers.Vectors;
 with Ada.Finalization;
 pragma Warnings (Off, "is an internal GNAT unit");
 with Ada.Strings.Wide_Wide_Unbounded.Aux;
@@ -15,6 +16,9 @@ pragma Warnings (On, "is an internal GNAT unit");
 
 with System.Memory;
 use type System.Address;
+with System.Storage_Elements; use System.Storage_Elements;
+
+with GNAT.Strings;
 
 with GNATCOLL.Iconv;
 
@@ -167,6 +171,17 @@ package body ${ada_lib_name}.Implementation.C is
          Set_Last_Exception (Exc);
    end;
 
+   procedure ${capi.get_name("context_use_memory_mapped_files")}
+     (Context : ${analysis_context_type};
+      Enabled : int) is
+   begin
+      Clear_Last_Exception;
+      Use_Memory_Mapped_Files (Context, Enabled /= 0);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
    function ${capi.get_name("get_analysis_unit_from_file")}
      (Context           : ${analysis_context_type};
       Filename, Charset : chars_ptr;
@@ -187,6 +202,50 @@ package body ${ada_lib_name}.Implementation.C is
          return null;
    end;
 
+   procedure ${capi.get_name("get_analysis_units_from_files")}
+     (Context   : ${analysis_context_type};
+      Filenames : System.Address;
+      Count     : int;
+      Charset   : chars_ptr;
+      Reparse   : int;
+      Rule      : ${grammar_rule_type};
+      Jobs      : int;
+      Units     : System.Address) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         C_Filenames : array (1 .. Natural (Count)) of chars_ptr
+            with Import, Address => Filenames;
+         C_Units     : Internal_Unit_Array (1 .. Natural (Count))
+            with Import, Address => Units;
+
+         Ada_Filenames : GNAT.Strings.String_List (1 .. Natural (Count));
+      begin
+         for I in Ada_Filenames'Range loop
+            Ada_Filenames (I) := new String'(Value (C_Filenames (I)));
+         end loop;
+
+         begin
+            C_Units := Get_From_Files
+              (Context,
+               Ada_Filenames,
+               Value_Or_Empty (Charset),
+               Reparse /= 0,
+               Rule,
+               Natural (Jobs));
+         exception
+            when others =>
+               GNAT.Strings.Free (Ada_Filenames);
+               raise;
+         end;
+         GNAT.Strings.Free (Ada_Filenames);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
    function ${capi.get_name("get_analysis_unit_from_buffer")}
      (Context           : ${analysis_context_type};
       Filename, Charset : chars_ptr;
@@ -311,6 +370,124 @@ package body ${ada_lib_name}.Implementation.C is
          return -1;
    end;
 
+   function ${capi.get_name('unit_export_tokens')}
+     (Unit    : ${analysis_unit_type};
+      Table_P : access ${token_table_type}) return int is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         TDH    : Token_Data_Handler renames Unit.TDH;
+         Count  : constant Natural :=
+           Token_Count (Unit) + Trivia_Count (Unit);
+         Length : constant Storage_Offset := Storage_Offset (Count);
+
+         Table : ${token_table_type} := Table_P.all;
+
+         procedure Fill;
+         --  Store data for all tokens and trivia in the columns of Table
+
+         ----------
+         -- Fill --
+         ----------
+
+         procedure Fill is
+            subtype Index_Range is Integer range 0 .. Count - 1;
+            type Int_Column is array (Index_Range) of int
+              with Convention => C;
+            type Line_Column is array (Index_Range) of Unsigned_32
+              with Convention => C;
+            type Column_Column is array (Index_Range) of Unsigned_16
+              with Convention => C;
+            type Flag_Column is array (Index_Range) of Unsigned_8
+              with Convention => C;
+
+            Kinds         : Int_Column with Import, Address => Table.Kinds;
+            Start_Offsets : Int_Column
+              with Import, Address => Table.Start_Offsets;
+            End_Offsets   : Int_Column
+              with Import, Address => Table.End_Offsets;
+            Start_Lines   : Line_Column
+              with Import, Address => Table.Start_Lines;
+            End_Lines     : Line_Column
+              with Import, Address => Table.End_Lines;
+            Start_Columns : Column_Column
+              with Import, Address => Table.Start_Columns;
+            End_Columns   : Column_Column
+              with Import, Address => Table.End_Columns;
+            Is_Trivia     : Flag_Column
+              with Import, Address => Table.Is_Trivia;
+
+            Current : Token_Or_Trivia_Index := First_Token_Or_Trivia (TDH);
+         begin
+            for I in Index_Range loop
+               declare
+                  D    : constant Stored_Token_Data := Data (Current, TDH);
+                  Sloc : constant Source_Location_Range :=
+                    Sloc_Range (TDH, D);
+               begin
+                  Kinds (I) := int (To_Token_Kind (D.Kind)'Enum_Rep);
+                  Start_Offsets (I) := int (D.Source_First - TDH.Source_First);
+                  End_Offsets (I) :=
+                    int (D.Source_Last - TDH.Source_First + 1);
+                  Start_Lines (I) := Unsigned_32 (Sloc.Start_Line);
+                  Start_Columns (I) := Unsigned_16 (Sloc.Start_Column);
+                  End_Lines (I) := Unsigned_32 (Sloc.End_Line);
+                  End_Columns (I) := Unsigned_16 (Sloc.End_Column);
+                  Is_Trivia (I) :=
+                    (if Current.Trivia = No_Token_Index then 0 else 1);
+               end;
+               Current := Next (Current, TDH);
+            end loop;
+         end Fill;
+
+      begin
+         if Table.Kinds = System.Null_Address then
+
+            --  Allocate all columns in a single memory block: first 32-bit
+            --  columns, then 16-bit columns and finally 8-bit columns, so
+            --  that all columns are properly aligned.
+
+            Table.Kinds := System.Memory.Alloc
+              (System.Memory.size_t (Length * (5 * 4 + 2 * 2 + 1)));
+            Table.Start_Offsets := Table.Kinds + Length * 4;
+            Table.End_Offsets := Table.Start_Offsets + Length * 4;
+            Table.Start_Lines := Table.End_Offsets + Length * 4;
+            Table.End_Lines := Table.Start_Lines + Length * 4;
+            Table.Start_Columns := Table.End_Lines + Length * 4;
+            Table.End_Columns := Table.Start_Columns + Length * 2;
+            Table.Is_Trivia := Table.End_Columns + Length * 2;
+
+         elsif Natural (Table.Count) < Count then
+            raise Precondition_Failure with "token table is too small";
+         end if;
+
+         Table.Count := int (Count);
+         if Count > 0 then
+            Fill;
+         end if;
+
+         Table_P.all := Table;
+         return 1;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   procedure ${capi.get_name('destroy_token_table')}
+     (Table : access ${token_table_type}) is
+   begin
+      Clear_Last_Exception;
+
+      System.Memory.Free (Table.Kinds);
+      Table.all := (Count => 0, others => System.Null_Address);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
    procedure ${capi.get_name('unit_lookup_token')}
      (Unit   : ${analysis_unit_type};
       Sloc   : access ${sloc_type};
@@ -430,6 +607,24 @@ package body ${ada_lib_name}.Implementation.C is
          Set_Last_Exception (Exc);
    end;
 
+   procedure ${capi.get_name("unit_reparse_edit")}
+     (Unit       : ${analysis_unit_type};
+      Edit_Range : access ${sloc_range_type};
+      Text       : access ${text_type}) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Raw_Text : Text_Type (1 .. Natural (Text.Length))
+            with Import, Address => Text.Chars;
+      begin
+         Reparse (Unit, Unwrap (Edit_Range.all), Raw_Text);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
    function ${capi.get_name("unit_populate_lexical_env")}
      (Unit : ${analysis_unit_type}) return int is
    begin
@@ -614,6 +809,202 @@ package body ${ada_lib_name}.Implementation.C is
          return 0;
    end;
 
+   function ${capi.get_name('node_export_tree')}
+     (Node   : ${entity_type}_Ptr;
+      Tree_P : access ${node_tree_type}) return int is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         --  Trees can be arbitrarily deep: walk them using an explicit stack
+         --  rather than recursion, so that exporting a deep tree cannot
+         --  overflow the stack of the calling thread.
+
+         type Stack_Entry is record
+            Node : ${T.root_node.name};
+            --  Node that remains to be processed
+
+            Parent : int;
+            --  Index of Node's parent in columns, or -1 for the root
+         end record;
+
+         package Entry_Vectors is new Ada.Containers.Vectors
+           (Positive, Stack_Entry);
+
+         Stack : Entry_Vectors.Vector;
+
+         function Count_Nodes (Root : ${T.root_node.name}) return Natural;
+         --  Return the number of nodes in the tree rooted at Root
+
+         -----------------
+         -- Count_Nodes --
+         -----------------
+
+         function Count_Nodes (Root : ${T.root_node.name}) return Natural is
+            Result : Natural := 0;
+            N, C   : ${T.root_node.name};
+         begin
+            Stack.Append (Stack_Entry'(Root, -1));
+            while not Stack.Is_Empty loop
+               N := Stack.Last_Element.Node;
+               Stack.Delete_Last;
+               Result := Result + 1;
+
+               for I in 1 .. Children_Count (N) loop
+                  C := Child (N, I);
+                  if C /= null then
+                     Stack.Append (Stack_Entry'(C, -1));
+                  end if;
+               end loop;
+            end loop;
+            return Result;
+         end Count_Nodes;
+
+         Count  : constant Natural :=
+           (if Node.Node = null then 0 else Count_Nodes (Node.Node));
+         Length : constant Storage_Offset := Storage_Offset (Count);
+
+         Node_Size : constant Storage_Offset :=
+           ${T.root_node.name}'Size / System.Storage_Unit;
+
+         --  Allocate all columns in a single memory block: first the nodes,
+         --  then 32-bit columns and finally 16-bit columns, so that all
+         --  columns are properly aligned.
+
+         Nodes_Addr : constant System.Address := System.Memory.Alloc
+           (System.Memory.size_t (Length * (Node_Size + 7 * 4 + 2 * 2)));
+         Kinds_Addr           : constant System.Address :=
+           Nodes_Addr + Length * Node_Size;
+         Parents_Addr         : constant System.Address :=
+           Kinds_Addr + Length * 4;
+         Children_Counts_Addr : constant System.Address :=
+           Parents_Addr + Length * 4;
+         Token_Starts_Addr    : constant System.Address :=
+           Children_Counts_Addr + Length * 4;
+         Token_Ends_Addr      : constant System.Address :=
+           Token_Starts_Addr + Length * 4;
+         Start_Lines_Addr     : constant System.Address :=
+           Token_Ends_Addr + Length * 4;
+         End_Lines_Addr       : constant System.Address :=
+           Start_Lines_Addr + Length * 4;
+         Start_Columns_Addr   : constant System.Address :=
+           End_Lines_Addr + Length * 4;
+         End_Columns_Addr     : constant System.Address :=
+           Start_Columns_Addr + Length * 2;
+
+         subtype Index_Range is Integer range 0 .. Count - 1;
+         type Node_Column is array (Index_Range) of ${T.root_node.name}
+           with Convention => C;
+         type Int_Column is array (Index_Range) of int
+           with Convention => C;
+         type Line_Column is array (Index_Range) of Unsigned_32
+           with Convention => C;
+         type Column_Column is array (Index_Range) of Unsigned_16
+           with Convention => C;
+
+         Nodes           : Node_Column with Import, Address => Nodes_Addr;
+         Kinds           : Int_Column with Import, Address => Kinds_Addr;
+         Parents         : Int_Column with Import, Address => Parents_Addr;
+         Children_Counts : Int_Column
+           with Import, Address => Children_Counts_Addr;
+         Token_Starts    : Int_Column
+           with Import, Address => Token_Starts_Addr;
+         Token_Ends      : Int_Column with Import, Address => Token_Ends_Addr;
+         Start_Lines     : Line_Column
+           with Import, Address => Start_Lines_Addr;
+         End_Lines       : Line_Column with Import, Address => End_Lines_Addr;
+         Start_Columns   : Column_Column
+           with Import, Address => Start_Columns_Addr;
+         End_Columns     : Column_Column
+           with Import, Address => End_Columns_Addr;
+
+         procedure Export (Root : ${T.root_node.name});
+         --  Store data for all nodes in the tree rooted at Root in columns,
+         --  in depth-first order.
+
+         ------------
+         -- Export --
+         ------------
+
+         procedure Export (Root : ${T.root_node.name}) is
+            Index    : Natural := 0;
+            E        : Stack_Entry;
+            Children : Natural;
+            C        : ${T.root_node.name};
+         begin
+            Stack.Append (Stack_Entry'(Root, -1));
+            while not Stack.Is_Empty loop
+               E := Stack.Last_Element;
+               Stack.Delete_Last;
+
+               declare
+                  N    : ${T.root_node.name} renames E.Node;
+                  Sloc : constant Source_Location_Range := Sloc_Range (N);
+               begin
+                  Nodes (Index) := N;
+                  Kinds (Index) := int (N.Kind'Enum_Rep);
+                  Parents (Index) := E.Parent;
+                  Token_Starts (Index) := int (N.Token_Start_Index);
+                  Token_Ends (Index) := int (N.Token_End_Index);
+                  Start_Lines (Index) := Unsigned_32 (Sloc.Start_Line);
+                  Start_Columns (Index) := Unsigned_16 (Sloc.Start_Column);
+                  End_Lines (Index) := Unsigned_32 (Sloc.End_Line);
+                  End_Columns (Index) := Unsigned_16 (Sloc.End_Column);
+
+                  --  Push children in reverse order, so that they are popped
+                  --  (and thus exported) in order, right after N.
+
+                  Children := 0;
+                  for I in reverse 1 .. Children_Count (N) loop
+                     C := Child (N, I);
+                     if C /= null then
+                        Children := Children + 1;
+                        Stack.Append (Stack_Entry'(C, int (Index)));
+                     end if;
+                  end loop;
+                  Children_Counts (Index) := int (Children);
+               end;
+
+               Index := Index + 1;
+            end loop;
+         end Export;
+
+      begin
+         if Count > 0 then
+            Export (Node.Node);
+         end if;
+
+         Tree_P.all := (Count           => int (Count),
+                        Nodes           => Nodes_Addr,
+                        Kinds           => Kinds_Addr,
+                        Parents         => Parents_Addr,
+                        Children_Counts => Children_Counts_Addr,
+                        Token_Starts    => Token_Starts_Addr,
+                        Token_Ends      => Token_Ends_Addr,
+                        Start_Lines     => Start_Lines_Addr,
+                        Start_Columns   => Start_Columns_Addr,
+                        End_Lines       => End_Lines_Addr,
+                        End_Columns     => End_Columns_Addr);
+         return 1;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   procedure ${capi.get_name('destroy_node_tree')}
+     (Tree : access ${node_tree_type}) is
+   begin
+      Clear_Last_Exception;
+
+      System.Memory.Free (Tree.Nodes);
+      Tree.all := (Count => 0, others => System.Null_Address);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
    function ${capi.get_name("text_to_locale_string")}
      (Text : ${text_type}) return System.Address is
    begin
@@ -681,6 +1072,59 @@ package body ${ada_lib_name}.Implementation.C is
          return System.Null_Address;
    end;
 
+   function ${capi.get_name("text_to_bytes")}
+     (Text   : access ${text_type};
+      Bytes  : access System.Address;
+      Length : access size_t) return int is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Chars : Text_Type (1 .. Natural (Text.Length))
+           with Import, Address => Text.Chars;
+
+         Is_Latin_1 : constant Boolean :=
+           (for all C of Chars => Wide_Wide_Character'Pos (C) < 256);
+      begin
+         if Is_Latin_1 then
+
+            --  Fast path: one byte per character, no need for a transcoder
+
+            Bytes.all := System.Memory.Alloc
+              (System.Memory.size_t (Natural'Max (1, Chars'Length)));
+            Length.all := size_t (Chars'Length);
+            declare
+               Result : String (Chars'Range)
+                 with Import, Address => Bytes.all;
+            begin
+               for I in Chars'Range loop
+                  Result (I) :=
+                    Character'Val (Wide_Wide_Character'Pos (Chars (I)));
+               end loop;
+            end;
+            return 1;
+
+         else
+            declare
+               Encoded : constant String := To_UTF8 (Chars);
+               Buffer  : constant System.Address := System.Memory.Alloc
+                 (System.Memory.size_t (Encoded'Length));
+               Result  : String (Encoded'Range)
+                 with Import, Address => Buffer;
+            begin
+               Result := Encoded;
+               Bytes.all := Buffer;
+               Length.all := size_t (Encoded'Length);
+            end;
+            return 0;
+         end if;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
    ----------
    -- Wrap --
    ----------
@@ -731,6 +1175,7 @@ package body ${ada_lib_name}.Implementation.C is
          end if;
       end;
 
+      Current_Exception := Last_Exception;
    end Set_Last_Exception;
 
    --------------------------
@@ -739,21 +1184,16 @@ package body ${ada_lib_name}.Implementation.C is
 
    procedure Clear_Last_Exception is
    begin
-      if Last_Exception /= null then
+      if Current_Exception /= null then
          Free (Last_Exception.Information);
+         Current_Exception := null;
       end if;
    end Clear_Last_Exception;
 
    function ${capi.get_name("get_last_exception")} return ${exception_type}_Ptr
    is
    begin
-      if Last_Exception = null
-         or else Last_Exception.Information = Null_Ptr
-      then
-         return null;
-      else
-         return Last_Exception;
-      end if;
+      return Current_Exception;
    end;
 
    function ${capi.get_name('token_kind_name')} (Kind : int) return chars_ptr
@@ -811,6 +1251,11 @@ package body ${ada_lib_name}.Implementation.C is
    is
    begin
       Clear_Last_Exception;
+
+      --  The result is a slice of the source buffer: make sure it is decoded
+
+      Decompact (Get_Token_TDH (Unwrap (First)).all);
+
       declare
          FD : constant Token_Data_Type := Data (Unwrap (First));
          LD : constant Token_Data_Type := Data (Unwrap (Last));
@@ -1129,6 +1574,11 @@ package body ${ada_lib_name}.Implementation.C is
                  others       => <>);
       end if;
 
+      --  C tokens reference their text in the source buffer: make sure it is
+      --  decoded.
+
+      Decompact (Get_Token_TDH (Token).all);
+
       declare
          D : constant Token_Data_Type := Data (Token);
          K : constant Token_Kind := Kind (D);
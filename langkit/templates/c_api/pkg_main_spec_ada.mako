@@ -88,6 +88,28 @@ private package ${ada_lib_name}.Implementation.C is
      with Convention => C;
    ${ada_c_doc('langkit.token_reference_type', 3)}
 
+   type ${node_tree_type} is record
+      Count : int;
+
+      Nodes, Kinds, Parents, Children_Counts, Token_Starts, Token_Ends,
+      Start_Lines, Start_Columns, End_Lines, End_Columns : System.Address;
+      --  Columns for node data. See the C header for the type of their
+      --  elements.
+   end record
+     with Convention => C;
+   ${ada_c_doc('langkit.node_tree_type', 3)}
+
+   type ${token_table_type} is record
+      Count : int;
+
+      Kinds, Start_Offsets, End_Offsets, Start_Lines, End_Lines,
+      Start_Columns, End_Columns, Is_Trivia : System.Address;
+      --  Columns for token data. See the C header for the type of their
+      --  elements.
+   end record
+     with Convention => C;
+   ${ada_c_doc('langkit.token_table_type', 3)}
+
    type ${diagnostic_type} is record
       Sloc_Range : ${sloc_range_type};
       Message    : ${text_type};
@@ -230,6 +252,15 @@ private package ${ada_lib_name}.Implementation.C is
               'context_discard_errors_in_populate_lexical_env')}";
    ${ada_c_doc('langkit.context_discard_errors_in_populate_lexical_env', 3)}
 
+   procedure ${capi.get_name("context_use_memory_mapped_files")}
+     (Context : ${analysis_context_type};
+      Enabled : int)
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name(
+              'context_use_memory_mapped_files')}";
+   ${ada_c_doc('langkit.context_use_memory_mapped_files', 3)}
+
    function ${capi.get_name('get_analysis_unit_from_file')}
      (Context           : ${analysis_context_type};
       Filename, Charset : chars_ptr;
@@ -242,6 +273,21 @@ private package ${ada_lib_name}.Implementation.C is
               "${capi.get_name('get_analysis_unit_from_file')}";
    ${ada_c_doc('langkit.get_unit_from_file', 3)}
 
+   procedure ${capi.get_name('get_analysis_units_from_files')}
+     (Context   : ${analysis_context_type};
+      Filenames : System.Address;
+      Count     : int;
+      Charset   : chars_ptr;
+      Reparse   : int;
+      Rule      : ${grammar_rule_type};
+      Jobs      : int;
+      Units     : System.Address)
+      with Export        => True,
+           Convention    => C,
+           External_name =>
+              "${capi.get_name('get_analysis_units_from_files')}";
+   ${ada_c_doc('langkit.get_units_from_files', 3)}
+
    function ${capi.get_name('get_analysis_unit_from_buffer')}
      (Context           : ${analysis_context_type};
       Filename, Charset : chars_ptr;
@@ -307,6 +353,21 @@ private package ${ada_lib_name}.Implementation.C is
            External_Name => "${capi.get_name('unit_trivia_count')}";
    ${ada_c_doc('langkit.unit_trivia_count', 3)}
 
+   function ${capi.get_name('unit_export_tokens')}
+     (Unit    : ${analysis_unit_type};
+      Table_P : access ${token_table_type}) return int
+      with Export        => True,
+           Convention    => C,
+           External_Name => "${capi.get_name('unit_export_tokens')}";
+   ${ada_c_doc('langkit.unit_export_tokens', 3)}
+
+   procedure ${capi.get_name('destroy_token_table')}
+     (Table : access ${token_table_type})
+      with Export        => True,
+           Convention    => C,
+           External_Name => "${capi.get_name('destroy_token_table')}";
+   ${ada_c_doc('langkit.destroy_token_table', 3)}
+
    procedure ${capi.get_name('unit_lookup_token')}
      (Unit   : ${analysis_unit_type};
       Sloc   : access ${sloc_type};
@@ -371,6 +432,15 @@ private package ${ada_lib_name}.Implementation.C is
            External_name => "${capi.get_name('unit_reparse_from_buffer')}";
    ${ada_c_doc('langkit.unit_reparse_buffer', 3)}
 
+   procedure ${capi.get_name('unit_reparse_edit')}
+     (Unit       : ${analysis_unit_type};
+      Edit_Range : access ${sloc_range_type};
+      Text       : access ${text_type})
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('unit_reparse_edit')}";
+   ${ada_c_doc('langkit.unit_reparse_edit', 3)}
+
    function ${capi.get_name('unit_populate_lexical_env')}
      (Unit : ${analysis_unit_type})
       return int
@@ -465,6 +535,21 @@ private package ${ada_lib_name}.Implementation.C is
            External_name => "${capi.get_name('node_child')}";
    ${ada_c_doc('langkit.node_child', 3)}
 
+   function ${capi.get_name('node_export_tree')}
+     (Node   : ${entity_type}_Ptr;
+      Tree_P : access ${node_tree_type}) return int
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('node_export_tree')}";
+   ${ada_c_doc('langkit.node_export_tree', 3)}
+
+   procedure ${capi.get_name('destroy_node_tree')}
+     (Tree : access ${node_tree_type})
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('destroy_node_tree')}";
+   ${ada_c_doc('langkit.destroy_node_tree', 3)}
+
    function ${capi.get_name('text_to_locale_string')}
      (Text : ${text_type}) return System.Address
       with Export        => True,
@@ -472,6 +557,15 @@ private package ${ada_lib_name}.Implementation.C is
            External_name => "${capi.get_name('text_to_locale_string')}";
    ${ada_c_doc('langkit.text_to_locale_string', 3)}
 
+   function ${capi.get_name('text_to_bytes')}
+     (Text   : access ${text_type};
+      Bytes  : access System.Address;
+      Length : access size_t) return int
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('text_to_bytes')}";
+   ${ada_c_doc('langkit.text_to_bytes', 3)}
+
    ${array_types.decl(T.root_node.array)}
    ${array_types.decl(T.root_node.entity.array)}
 
@@ -536,6 +630,12 @@ private package ${ada_lib_name}.Implementation.C is
           External_Name => "${capi.get_name('get_last_exception')}";
    ${ada_c_doc('langkit.get_last_exception', 3)}
 
+   Current_Exception : ${exception_type}_Ptr := null
+     with Export        => True,
+          Convention    => C,
+          External_Name => "${capi.get_name('last_exception')}";
+   ${ada_c_doc('langkit.last_exception', 3)}
+
    procedure Clear_Last_Exception;
    --  Free the information contained in Last_Exception
 
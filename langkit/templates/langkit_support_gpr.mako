@@ -56,7 +56,8 @@ library project Langkit_Support is
    for Source_Dirs use (${string_repr(source_dir)});
    for Library_Dir use
       "../langkit_support/" & Library_Kind_Param & "/" & Build_Mode;
-   for Object_Dir use "../../obj/langkit_support/" & Build_Mode;
+   for Object_Dir use
+      "../../obj/langkit_support/" & Build_Mode & "/" & Library_Kind_Param;
 
    Common_Ada_Cargs := ("-gnatwa", "-gnatyg", "-fPIC");
 
@@ -48,16 +48,46 @@ type Mmz_Value (Kind : Mmz_Value_Kind := Mmz_Evaluating) is record
    end case;
 end record;
 
+type Mmz_Dependencies_Access is access all AST_Envs.Dependency_Set;
+--  Set of analysis units that a memoized result depends on.
+--  No_Analysis_Unit stands for lexical environments that belong to no unit
+--  (i.e. the root scope).
+
+procedure Free is new Ada.Unchecked_Deallocation
+  (AST_Envs.Dependency_Set, Mmz_Dependencies_Access);
+
+package Mmz_Frame_Vectors is new Langkit_Support.Vectors
+  (Mmz_Dependencies_Access);
+
+type Mmz_Entry is record
+   Value : Mmz_Value;
+   --  Memoized result (or evaluation status) for this entry
+
+   Version : Natural := 0;
+   --  Value of Context.Cache_Version when the evaluation of this entry
+   --  started.
+
+   Dependencies : AST_Envs.Unit_Vectors.Vector;
+   --  Set of analysis units whose content was involved in the computation of
+   --  Value. This entry becomes stale as soon as one of them changes.
+end record;
+
 function Hash (Key : Mmz_Key) return Hash_Type;
 function Equivalent (L, R : Mmz_Key) return Boolean;
 
 package Memoization_Maps is new Ada.Containers.Hashed_Maps
-  (Mmz_Key, Mmz_Value, Hash, Equivalent_Keys => Equivalent);
+  (Mmz_Key, Mmz_Entry, Hash, Equivalent_Keys => Equivalent);
 
 procedure Destroy (Map : in out Memoization_Maps.Map);
 --  Free all resources stored in a memoization map. This includes destroying
 --  ref-count shares the map owns.
 
+subtype Mmz_Counter is Long_Long_Integer range 0 .. Long_Long_Integer'Last;
+
+Mmz_Trace : constant GNATCOLL.Traces.Trace_Handle :=
+  GNATCOLL.Traces.Create
+    ("${ctx.lib_name.upper}.MEMOIZATION", GNATCOLL.Traces.From_Config);
+
 type Memoization_Handle is record
    Key : Mmz_Key;
    --  Key for the memoization
@@ -70,6 +100,10 @@ type Memoization_Handle is record
    --  Version of the unit memoization table at the time Key/Cur were created.
    --  When using this record, if the version has changed, both Key and Cur are
    --  invalid and must be recomputed.
+
+   Frame : Natural := 0;
+   --  If not zero, index (in Context.Mmz_Frames) of the set of dependencies
+   --  for the evaluation that will produce the memoized value.
 end record;
 --  Wrapper for memoization state, to be used in memoized properties.
 --  Please use high-level functions below instead of accessing fields
@@ -91,6 +125,37 @@ procedure Add_Memoized_Value
 --  Insert the Handle.Key/Value entry in UNit.Memoization_Map (replacing the
 --  previous entry, if present). If the key in Handle is stale (i.e. caches
 --  were reset since it was created), recompute it using Create_Key.
+--
+--  The dependencies collected during the evaluation are stored in the entry
+--  and added to the dependencies of the enclosing memoized evaluation, if
+--  any.
+
+procedure Cancel_Memoized_Value
+  (Unit   : Internal_Unit;
+   Handle : in out Memoization_Handle);
+--  Stop collecting dependencies for Handle. This must be called instead of
+--  Add_Memoized_Value when the evaluation is aborted.
+
+function Mmz_Dependencies
+  (Node : ${T.root_node.name}) return access AST_Envs.Dependency_Set;
+--  If Node is not null and a memoized property is being evaluated in its
+--  analysis context, return the set of dependencies for the innermost
+--  evaluation. Return null otherwise. This is meant to be passed to lexical
+--  environment lookups, so that memoized results record the units they
+--  depend on.
+
+procedure Register_Mmz_Dependency
+  (Context : Internal_Context; Unit : Internal_Unit);
+--  If a memoized property is being evaluated in Context, add Unit to the set
+--  of dependencies of the innermost one.
+
+function Push_Mmz_Frame (Context : Internal_Context) return Positive;
+--  Start collecting dependencies in a new (empty) frame in Context. Return
+--  the index of this frame in Context.Mmz_Frames.
+
+procedure Evict_Stale_Memoized_Values (Unit : Internal_Unit);
+--  Remove from Unit.Memoization_Map all entries that depend on a unit that
+--  changed since they were computed.
 
 </%def>
 
@@ -104,6 +169,23 @@ procedure Add_Memoized_Value
 function Hash (Key : Mmz_Key_Item) return Hash_Type;
 function Equivalent (L, R : Mmz_Key_Item) return Boolean;
 procedure Destroy (Key : in out Mmz_Key_Array_Access);
+procedure Destroy (Item : in out Mmz_Entry);
+
+procedure Add_Dependency
+  (Dependencies : in out AST_Envs.Dependency_Set; Unit : Internal_Unit)
+   renames AST_Envs.Add_Dependency;
+--  Add Unit to Dependencies, if not already present
+
+procedure Add_Dependencies
+  (Dependencies : in out AST_Envs.Dependency_Set;
+   Rebindings   : Env_Rebindings);
+--  Add to Dependencies the units that own environments in Rebindings
+
+function Is_Stale
+  (Context : Internal_Context; Item : Mmz_Entry) return Boolean;
+--  Return whether one of the units Item depends on changed since Item was
+--  computed. Entries for evaluations that are still running are considered
+--  stale.
 
 ----------------
 -- Equivalent --
@@ -199,18 +281,18 @@ procedure Destroy (Map : in out Memoization_Maps.Map) is
    procedure Free is new Ada.Unchecked_Deallocation
      (Key_Array, Key_Array_Access);
 
-   type Value_Array is array (1 .. Length) of Mmz_Value;
-   type Value_Array_Access is access Value_Array;
+   type Entry_Array is array (1 .. Length) of Mmz_Entry;
+   type Entry_Array_Access is access Entry_Array;
    procedure Free is new Ada.Unchecked_Deallocation
-     (Value_Array, Value_Array_Access);
+     (Entry_Array, Entry_Array_Access);
 
-   Keys   : Key_Array_Access := new Key_Array;
-   Values : Value_Array_Access := new Value_Array;
-   I      : Positive := 1;
+   Keys    : Key_Array_Access := new Key_Array;
+   Entries : Entry_Array_Access := new Entry_Array;
+   I       : Positive := 1;
 begin
    for Cur in Map.Iterate loop
       Keys (I) := Key (Cur).Items;
-      Values (I) := Element (Cur);
+      Entries (I) := Element (Cur);
       I := I + 1;
    end loop;
 
@@ -220,22 +302,32 @@ begin
       Destroy (K_Array);
    end loop;
 
+   for E of Entries.all loop
+      Destroy (E);
+   end loop;
+
+   Free (Keys);
+   Free (Entries);
+end Destroy;
+
+-------------
+-- Destroy --
+-------------
+
+procedure Destroy (Item : in out Mmz_Entry) is
+begin
    <% refcounted_value_types = [t for t in value_types if t.is_refcounted] %>
    % if refcounted_value_types:
-      for V of Values.all loop
-         case V.Kind is
-            % for t in refcounted_value_types:
-               when ${t.memoization_kind} =>
-                  Dec_Ref (V.As_${t.name});
-            % endfor
-
-            when others => null;
-         end case;
-      end loop;
+      case Item.Value.Kind is
+         % for t in refcounted_value_types:
+            when ${t.memoization_kind} =>
+               Dec_Ref (Item.Value.As_${t.name});
+         % endfor
+
+         when others => null;
+      end case;
    % endif
-
-   Free (Keys);
-   Free (Values);
+   Item.Dependencies.Destroy;
 end Destroy;
 
 -------------
@@ -264,6 +356,91 @@ begin
    Free (Key);
 end Destroy;
 
+----------------------
+-- Add_Dependencies --
+----------------------
+
+procedure Add_Dependencies
+  (Dependencies : in out AST_Envs.Dependency_Set;
+   Rebindings   : Env_Rebindings)
+is
+   R : Env_Rebindings := Rebindings;
+begin
+   while R /= null loop
+      Add_Dependency (Dependencies, R.Old_Env.Owner);
+      Add_Dependency (Dependencies, R.New_Env.Owner);
+      R := R.Parent;
+   end loop;
+end Add_Dependencies;
+
+--------------
+-- Is_Stale --
+--------------
+
+function Is_Stale
+  (Context : Internal_Context; Item : Mmz_Entry) return Boolean is
+begin
+   if Item.Value.Kind = Mmz_Evaluating then
+      return True;
+   end if;
+
+   for U of Item.Dependencies loop
+      if (if U = No_Analysis_Unit
+          then Context.Root_Scope_Change_Version
+          else U.Last_Change_Version) > Item.Version
+      then
+         return True;
+      end if;
+   end loop;
+   return False;
+end Is_Stale;
+
+----------------------
+-- Mmz_Dependencies --
+----------------------
+
+function Mmz_Dependencies
+  (Node : ${T.root_node.name}) return access AST_Envs.Dependency_Set is
+begin
+   if Node = null or else Node.Unit.Context.Mmz_Frame_Count = 0 then
+      return null;
+   end if;
+
+   declare
+      Context : constant Internal_Context := Node.Unit.Context;
+   begin
+      return Context.Mmz_Frames.Get (Context.Mmz_Frame_Count);
+   end;
+end Mmz_Dependencies;
+
+-----------------------------
+-- Register_Mmz_Dependency --
+-----------------------------
+
+procedure Register_Mmz_Dependency
+  (Context : Internal_Context; Unit : Internal_Unit) is
+begin
+   if Context.Mmz_Frame_Count > 0 then
+      Add_Dependency
+        (Context.Mmz_Frames.Get (Context.Mmz_Frame_Count).all, Unit);
+   end if;
+end Register_Mmz_Dependency;
+
+--------------------
+-- Push_Mmz_Frame --
+--------------------
+
+function Push_Mmz_Frame (Context : Internal_Context) return Positive is
+begin
+   --  Re-use frames allocated for previous evaluations when possible
+   Context.Mmz_Frame_Count := Context.Mmz_Frame_Count + 1;
+   if Context.Mmz_Frame_Count > Context.Mmz_Frames.Length then
+      Context.Mmz_Frames.Append (new AST_Envs.Dependency_Set);
+   end if;
+   AST_Envs.Clear (Context.Mmz_Frames.Get (Context.Mmz_Frame_Count).all);
+   return Context.Mmz_Frame_Count;
+end Push_Mmz_Frame;
+
 -------------------------
 -- Find_Memoized_Value --
 -------------------------
@@ -274,6 +451,7 @@ function Find_Memoized_Value
    Value      : out Mmz_Value;
    Create_Key : access function return Mmz_Key) return Boolean
 is
+   Context  : constant Internal_Context := Unit.Context;
    Inserted : Boolean;
 begin
    --  Make sure that we don't lookup stale caches
@@ -283,18 +461,91 @@ begin
    --  existing entry.
    Handle.Key := Create_Key.all;
    Handle.Cache_Version := Unit.Cache_Version;
+   Handle.Frame := 0;
    Value := (Kind => Mmz_Evaluating);
-   Unit.Memoization_Map.Insert (Handle.Key, Value, Handle.Cur, Inserted);
+   Unit.Memoization_Map.Insert
+     (Handle.Key,
+      (Value        => Value,
+       Version      => Handle.Cache_Version,
+       Dependencies => AST_Envs.Unit_Vectors.Empty_Vector),
+      Handle.Cur,
+      Inserted);
 
    --  No existing entry yet? The above just created one. Otherwise, destroy
    --  our key and reuse the existing entry's.
    if not Inserted then
       Destroy (Handle.Key.Items);
       Handle.Key := Memoization_Maps.Key (Handle.Cur);
-      Value := Memoization_Maps.Element (Handle.Cur);
+
+      declare
+         Item : constant Mmz_Entry := Memoization_Maps.Element (Handle.Cur);
+      begin
+         Value := Item.Value;
+
+         --  The enclosing evaluation (if any) depends on what this entry
+         --  depends on.
+         if Context.Mmz_Frame_Count > 0 then
+            declare
+               Deps : AST_Envs.Dependency_Set renames
+                  Context.Mmz_Frames.Get (Context.Mmz_Frame_Count).all;
+            begin
+               for U of Item.Dependencies loop
+                  Add_Dependency (Deps, U);
+               end loop;
+            end;
+         end if;
+      end;
+
+      return True;
    end if;
 
-   return not Inserted;
+   --  We are about to evaluate the property: start collecting its
+   --  dependencies in a new frame.
+   Handle.Frame := Push_Mmz_Frame (Context);
+
+   declare
+      Deps : AST_Envs.Dependency_Set renames
+         Context.Mmz_Frames.Get (Handle.Frame).all;
+   begin
+      --  The result obviously depends on Unit, and on the units of all nodes
+      --  and environments it is given.
+      Add_Dependency (Deps, Unit);
+      for Item of Handle.Key.Items.all loop
+         case Item.Kind is
+            <%
+               node_key_types = [t for t in key_types
+                                 if t.is_ast_node or t.is_entity_type]
+            %>
+            % for t in node_key_types:
+               when ${t.memoization_kind} =>
+                  % if t.is_ast_node:
+                     if Item.As_${t.name} /= null then
+                        Add_Dependency (Deps, Item.As_${t.name}.Unit);
+                     end if;
+                  % else:
+                     if Item.As_${t.name}.Node /= null then
+                        Add_Dependency (Deps, Item.As_${t.name}.Node.Unit);
+                     end if;
+                     Add_Dependencies
+                       (Deps, Item.As_${t.name}.Info.Rebindings);
+                  % endif
+            % endfor
+            % if T.entity_info in key_types:
+               when ${T.entity_info.memoization_kind} =>
+                  Add_Dependencies
+                    (Deps, Item.As_${T.entity_info.name}.Rebindings);
+            % endif
+            % if T.LexicalEnv in key_types:
+               when ${T.LexicalEnv.memoization_kind} =>
+                  Add_Dependency (Deps, Item.As_${T.LexicalEnv.name}.Owner);
+            % endif
+
+            when others => null;
+         end case;
+      end loop;
+   end;
+
+   return False;
 end Find_Memoized_Value;
 
 ------------------------
@@ -304,17 +555,143 @@ end Find_Memoized_Value;
 procedure Add_Memoized_Value
   (Unit       : Internal_Unit;
    Handle     : in out Memoization_Handle;
-   Value      : Mmz_Value) is
+   Value      : Mmz_Value)
+is
+   Context : constant Internal_Context := Unit.Context;
 begin
    --  If Handle was created using a memoization map that has been since then
-   --  reset, do nothing: the result can be partly stale due to the event that
-   --  triggered the memoization tables reset.
-
-   if Handle.Cache_Version < Unit.Cache_Version then
+   --  reset, do not store the result: it can be partly stale due to the event
+   --  that triggered the memoization tables reset.
+
+   --  If there is no dependency frame, we did not evaluate the property (the
+   --  value comes from the memoization map, or the evaluation did not even
+   --  start): just update the value, keeping the existing dependencies.
+
+   if Handle.Frame = 0 then
+      if Handle.Cache_Version >= Unit.Cache_Version
+         and then Memoization_Maps.Has_Element (Handle.Cur)
+      then
+         declare
+            Item : Mmz_Entry := Memoization_Maps.Element (Handle.Cur);
+         begin
+            Item.Value := Value;
+            Unit.Memoization_Map.Replace_Element (Handle.Cur, Item);
+         end;
+      end if;
       return;
    end if;
 
-   Unit.Memoization_Map.Replace_Element (Handle.Cur, Value);
+   declare
+      Deps : AST_Envs.Dependency_Set renames
+         Context.Mmz_Frames.Get (Handle.Frame).all;
+   begin
+      <% node_value_types = [t for t in value_types
+                             if t.is_ast_node or t.is_entity_type] %>
+      % if node_value_types:
+         --  Make sure that the result does not outlive the nodes it contains
+         case Value.Kind is
+            % for t in node_value_types:
+               when ${t.memoization_kind} =>
+                  % if t.is_ast_node:
+                     if Value.As_${t.name} /= null then
+                        Add_Dependency (Deps, Value.As_${t.name}.Unit);
+                     end if;
+                  % else:
+                     if Value.As_${t.name}.Node /= null then
+                        Add_Dependency (Deps, Value.As_${t.name}.Node.Unit);
+                     end if;
+                  % endif
+            % endfor
+
+            when others => null;
+         end case;
+      % endif
+
+      if Handle.Cache_Version >= Unit.Cache_Version then
+         Unit.Memoization_Map.Replace_Element
+           (Handle.Cur, (Value, Handle.Cache_Version, Deps.Units.Copy));
+      end if;
+
+      --  In any case, the enclosing evaluation depends on everything this
+      --  one depends on.
+
+      if Handle.Frame > 1 then
+         declare
+            Outer_Deps : AST_Envs.Dependency_Set renames
+               Context.Mmz_Frames.Get (Handle.Frame - 1).all;
+         begin
+            for U of Deps.Units loop
+               Add_Dependency (Outer_Deps, U);
+            end loop;
+         end;
+      end if;
+   end;
+
+   Cancel_Memoized_Value (Unit, Handle);
 end Add_Memoized_Value;
 
+---------------------------
+-- Cancel_Memoized_Value --
+---------------------------
+
+procedure Cancel_Memoized_Value
+  (Unit   : Internal_Unit;
+   Handle : in out Memoization_Handle) is
+begin
+   --  Also discard frames that nested evaluations could have left if they
+   --  were aborted.
+
+   if Handle.Frame > 0 then
+      Unit.Context.Mmz_Frame_Count := Handle.Frame - 1;
+      Handle.Frame := 0;
+   end if;
+end Cancel_Memoized_Value;
+
+---------------------------------
+-- Evict_Stale_Memoized_Values --
+---------------------------------
+
+procedure Evict_Stale_Memoized_Values (Unit : Internal_Unit) is
+   use Memoization_Maps;
+
+   Context  : constant Internal_Context := Unit.Context;
+   Map      : Memoization_Maps.Map renames Unit.Memoization_Map;
+   Cur      : Cursor := Map.First;
+   Next_Cur : Cursor;
+   Kept     : Natural := 0;
+   Evicted  : Natural := 0;
+begin
+   --  Deleting an element from a hashed map does not invalidate cursors to
+   --  other elements, so we can remove stale entries as we go.
+
+   while Has_Element (Cur) loop
+      Next_Cur := Next (Cur);
+      if Is_Stale (Context, Element (Cur)) then
+         declare
+            K : Mmz_Key_Array_Access := Key (Cur).Items;
+            E : Mmz_Entry := Element (Cur);
+         begin
+            Map.Delete (Cur);
+            Destroy (K);
+            Destroy (E);
+         end;
+         Evicted := Evicted + 1;
+      else
+         Kept := Kept + 1;
+      end if;
+      Cur := Next_Cur;
+   end loop;
+
+   Context.Mmz_Kept_Entries :=
+     Context.Mmz_Kept_Entries + Mmz_Counter (Kept);
+   Context.Mmz_Evicted_Entries :=
+     Context.Mmz_Evicted_Entries + Mmz_Counter (Evicted);
+
+   if Evicted > 0 then
+      GNATCOLL.Traces.Trace
+        (Mmz_Trace, Basename (Unit) & ": kept" & Kept'Image
+                    & " memoized values, evicted" & Evicted'Image);
+   end if;
+end Evict_Stale_Memoized_Values;
+
 </%def>
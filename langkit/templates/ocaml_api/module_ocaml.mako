@@ -491,6 +491,75 @@ module Token = struct
 
 end
 
+module TokenTable = struct
+  type int32_column = (int32, Bigarray.int32_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+  type uint16_column = (int, Bigarray.int16_unsigned_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+  type uint8_column = (int, Bigarray.int8_unsigned_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+
+  type t = {
+    kinds : int32_column;
+    start_offsets : int32_column;
+    end_offsets : int32_column;
+    start_lines : int32_column;
+    end_lines : int32_column;
+    start_columns : uint16_column;
+    end_columns : uint16_column;
+    is_trivia : uint8_column;
+  }
+
+  let c_struct : t structure typ = structure "token_table"
+  let count = field c_struct "count" int
+  let kinds = field c_struct "kinds" (ptr void)
+  let start_offsets = field c_struct "start_offsets" (ptr void)
+  let end_offsets = field c_struct "end_offsets" (ptr void)
+  let start_lines = field c_struct "start_lines" (ptr void)
+  let end_lines = field c_struct "end_lines" (ptr void)
+  let start_columns = field c_struct "start_columns" (ptr void)
+  let end_columns = field c_struct "end_columns" (ptr void)
+  let is_trivia = field c_struct "is_trivia" (ptr void)
+  let () = seal c_struct
+
+  let create length =
+    let column kind = Bigarray.Array1.create kind Bigarray.c_layout length in
+    {
+      kinds = column Bigarray.int32;
+      start_offsets = column Bigarray.int32;
+      end_offsets = column Bigarray.int32;
+      start_lines = column Bigarray.int32;
+      end_lines = column Bigarray.int32;
+      start_columns = column Bigarray.int16_unsigned;
+      end_columns = column Bigarray.int16_unsigned;
+      is_trivia = column Bigarray.int8_unsigned;
+    }
+
+  let length table = Bigarray.Array1.dim table.kinds
+
+  let unwrap (value : t) : t structure =
+    (* Bigarrays are allocated out of the OCaml heap, so the C API can fill
+       them in place: no copy is required. *)
+    let start column = to_voidp (bigarray_start array1 column) in
+    let c_value = make c_struct in
+    setf c_value count (length value);
+    setf c_value kinds (start value.kinds);
+    setf c_value start_offsets (start value.start_offsets);
+    setf c_value end_offsets (start value.end_offsets);
+    setf c_value start_lines (start value.start_lines);
+    setf c_value end_lines (start value.end_lines);
+    setf c_value start_columns (start value.start_columns);
+    setf c_value end_columns (start value.end_columns);
+    setf c_value is_trivia (start value.is_trivia);
+    c_value
+
+  let kind_name table index =
+    let kind = Bigarray.Array1.get table.kinds index in
+    Token.token_kind_name (Int32.to_int kind)
+
+  let is_trivia table index = Bigarray.Array1.get table.is_trivia index <> 0
+end
+
 module UnitProvider = struct
   (* The real C type of a context is a void*. But we use a pointer to this
      type, to be able to allocate a value of t and attach a finalizer to it. *)
@@ -701,6 +770,7 @@ and AnalysisUnit : sig
   val last_token : t -> Token.t
   val token_count : t -> int
   val trivia_count : t -> int
+  val token_table : t -> TokenTable.t
 
   ${token_iterator.sig("t")}
 
@@ -763,6 +833,22 @@ end = struct
     AnalysisUnitStruct.unit_trivia_count
       (${ocaml_api.unwrap_value("unit", T.AnalysisUnit, None)})
 
+  let token_table unit =
+    let c_unit = ${ocaml_api.unwrap_value("unit", T.AnalysisUnit, None)} in
+    let table =
+      TokenTable.create
+        (AnalysisUnitStruct.unit_token_count c_unit
+         + AnalysisUnitStruct.unit_trivia_count c_unit)
+    in
+    if TokenTable.length table > 0 then begin
+      let c_table = TokenTable.unwrap table in
+      let _ : int =
+        AnalysisUnitStruct.unit_export_tokens c_unit (addr c_table)
+      in
+      ()
+    end;
+    table
+
   ${token_iterator.struct("first_token", "last_token")}
 
   let wrap context c_value = {
@@ -115,6 +115,43 @@ module Token : sig
   val pp : Format.formatter -> t -> unit
 end
 
+module TokenTable : sig
+  ${ocaml_doc('langkit.token_table_type', 1)}
+
+  type int32_column = (int32, Bigarray.int32_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+  type uint16_column = (int, Bigarray.int16_unsigned_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+  type uint8_column = (int, Bigarray.int8_unsigned_elt, Bigarray.c_layout)
+    Bigarray.Array1.t
+
+  type t = {
+    kinds : int32_column;
+    start_offsets : int32_column;
+    end_offsets : int32_column;
+    start_lines : int32_column;
+    end_lines : int32_column;
+    start_columns : uint16_column;
+    end_columns : uint16_column;
+    is_trivia : uint8_column;
+  }
+
+  val length : t -> int
+  (**
+   * Number of tokens and trivia in this table.
+   *)
+
+  val kind_name : t -> int -> string
+  (**
+   * Return the kind name for the token at the given index in this table.
+   *)
+
+  val is_trivia : t -> int -> bool
+  (**
+   * Return whether the token at the given index in this table is a trivia.
+   *)
+end
+
 module BigInteger : sig
   type t = Z.t
 end
@@ -182,6 +219,12 @@ and AnalysisUnit : sig
   val trivia_count : t -> int
   ${ocaml_doc('langkit.unit_trivia_count', 1)}
 
+  val token_table : t -> TokenTable.t
+  (**
+   * Return a columnar representation of all the tokens and trivia in this
+   * unit, computed in a single native call.
+   *)
+
   ${token_iterator.sig("t")}
 end
 
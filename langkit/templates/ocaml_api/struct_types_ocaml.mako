@@ -134,6 +134,8 @@ module AnalysisUnitStruct : sig
   val unit_token_count : t -> int
 
   val unit_trivia_count : t -> int
+
+  val unit_export_tokens : t -> TokenTable.t structure ptr -> int
 end = struct
   (* Module defining the c structure of an analysis unit *)
 
@@ -188,6 +190,10 @@ end = struct
   let unit_trivia_count = foreign ~from:c_lib
     "${capi.get_name('unit_trivia_count')}"
     (c_type @-> raisable int)
+
+  let unit_export_tokens = foreign ~from:c_lib
+    "${capi.get_name('unit_export_tokens')}"
+    (c_type @-> ptr TokenTable.c_struct @-> raisable int)
 end
 
 </%def>
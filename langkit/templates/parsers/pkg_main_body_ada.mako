@@ -3,6 +3,8 @@
 with Ada.Containers.Vectors;
 with Ada.Unchecked_Deallocation;
 
+with GNATCOLL.Traces;
+
 with Langkit_Support.Diagnostics; use Langkit_Support.Diagnostics;
 with Langkit_Support.Packrat;
 with Langkit_Support.Text;        use Langkit_Support.Text;
@@ -17,6 +19,12 @@ with ${ada_lib_name}.Private_Converters; use ${ada_lib_name}.Private_Converters;
 package body ${ada_lib_name}.Parsers is
    use all type Symbols.Symbol_Type;
 
+   Packrat_Trace : constant GNATCOLL.Traces.Trace_Handle :=
+     GNATCOLL.Traces.Create
+       ("${ctx.lib_name.upper}.PACKRAT", GNATCOLL.Traces.From_Config);
+   --  Trace to log usage statistics for packrat memoization tables when
+   --  destroying parsers.
+
    --  Prepare packrat instantiations: one per enum type and onefor each kind
    --  of node (including lists). Likewise for bump ptr. allocators, except
    --  we need them only for non-abstract AST nodes.
@@ -172,13 +180,13 @@ package body ${ada_lib_name}.Parsers is
          Get_Token (Parser.TDH.all, Parser.Last_Fail.Pos);
       D : constant Diagnostic :=
         (if Parser.Last_Fail.Kind = Token_Fail then
-          Create (Last_Token.Sloc_Range, To_Text
+          Create (Sloc_Range (Parser.TDH.all, Last_Token), To_Text
             ("Expected "
              & Token_Error_Image (Parser.Last_Fail.Expected_Token_Id)
              & ", got "
              & Token_Error_Image (Parser.Last_Fail.Found_Token_Id)))
          else
-           Create (Last_Token.Sloc_Range,
+           Create (Sloc_Range (Parser.TDH.all, Last_Token),
                    To_Text (Parser.Last_Fail.Custom_Message.all)));
    begin
       Parser.Diagnostics.Append (D);
@@ -208,7 +216,7 @@ package body ${ada_lib_name}.Parsers is
             begin
                Append
                  (Parser.Diagnostics,
-                  First_Garbage_Token.Sloc_Range,
+                  Sloc_Range (Parser.TDH.all, First_Garbage_Token),
                   To_Text
                     ("End of input expected, got """
                      & Token_Kind_Name
@@ -285,7 +293,31 @@ package body ${ada_lib_name}.Parsers is
         (Free_Parse_List_Record, Free_Parse_List);
 
       Cur : Free_Parse_List renames Parser.Private_Part.Parse_Lists;
+
+      procedure Trace_Statistics
+        (Rule_Name : String; Stats : Packrat_Statistics);
+      --  Log Stats to Packrat_Trace
+
+      ----------------------
+      -- Trace_Statistics --
+      ----------------------
+
+      procedure Trace_Statistics
+        (Rule_Name : String; Stats : Packrat_Statistics) is
+      begin
+         GNATCOLL.Traces.Trace
+           (Packrat_Trace,
+            Rule_Name & ": size" & Stats.Size'Image
+            & ", hits" & Stats.Hits'Image
+            & ", misses" & Stats.Misses'Image
+            & ", collisions" & Stats.Collisions'Image);
+      end Trace_Statistics;
+
    begin
+      if Packrat_Trace.Is_Active then
+         Iterate_Memo_Statistics (Parser, Trace_Statistics'Access);
+      end if;
+
       while Cur /= null loop
          declare
             Next : constant Free_Parse_List := Cur.Next;
@@ -295,6 +327,12 @@ package body ${ada_lib_name}.Parsers is
             Cur := Next;
          end;
       end loop;
+
+      % for fn in sorted_fns:
+         ${fn.type.storage_type_name}_Memos.Destroy
+           (Parser.Private_Part.${fn.gen_fn_name}_Memo);
+      % endfor
+
       Free (Parser.Private_Part);
    end Destroy;
 
@@ -305,8 +343,35 @@ package body ${ada_lib_name}.Parsers is
    procedure Initialize (Parser : in out Parser_Type) is
    begin
       Parser.Private_Part := new Parser_Private_Part_Type'(others => <>);
+
+      --  Create memo tables according to per-rule settings. Updating usage
+      --  statistics has a cost on every lookup, so collect them only when
+      --  they are going to be logged.
+      % for fn in sorted_fns:
+         <% kind, size = fn.memo_settings %>
+         ${fn.type.storage_type_name}_Memos.Initialize
+           (Parser.Private_Part.${fn.gen_fn_name}_Memo, ${kind}, ${size},
+            Collect_Statistics => Packrat_Trace.Is_Active);
+      % endfor
    end Initialize;
 
+   -----------------------------
+   -- Iterate_Memo_Statistics --
+   -----------------------------
+
+   procedure Iterate_Memo_Statistics
+     (Parser  : Parser_Type;
+      Process : access procedure
+        (Rule_Name : String; Stats : Packrat_Statistics)) is
+   begin
+      % for fn in sorted_fns:
+         Process
+           ("${fn.name}",
+            ${fn.type.storage_type_name}_Memos.Statistics
+              (Parser.Private_Part.${fn.gen_fn_name}_Memo));
+      % endfor
+   end Iterate_Memo_Statistics;
+
    --------------------
    -- Get_Parse_List --
    --------------------
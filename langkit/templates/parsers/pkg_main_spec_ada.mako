@@ -2,6 +2,7 @@
 
 with Langkit_Support.Bump_Ptr;    use Langkit_Support.Bump_Ptr;
 with Langkit_Support.Diagnostics; use Langkit_Support.Diagnostics;
+with Langkit_Support.Types;       use Langkit_Support.Types;
 
 with ${ada_lib_name}.Common; use ${ada_lib_name}.Common;
 use ${ada_lib_name}.Common.Token_Data_Handlers;
@@ -90,6 +91,17 @@ private package ${ada_lib_name}.Parsers is
    procedure Destroy (Parser : in out Parser_Type);
    --  Destroy resources associated with the parser
 
+   procedure Iterate_Memo_Statistics
+     (Parser  : Parser_Type;
+      Process : access procedure
+        (Rule_Name : String; Stats : Packrat_Statistics));
+   --  Call Process on usage statistics for the packrat memoization table of
+   --  each parsing rule in Parser, accumulated since its initialization.
+   --
+   --  Statistics are collected only if the GNATCOLL trace
+   --  "${ctx.lib_name.upper}.PACKRAT" is active when the parser is
+   --  initialized: this trace logs them when the parser is destroyed.
+
 private
 
    type Parser_Private_Part_Type;
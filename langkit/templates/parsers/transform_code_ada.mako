@@ -64,7 +64,8 @@ if ${parser.pos_var} /= No_Token_Index then
          ${parser.parser.progress_var if is_row(parser.parser) else 1};
 
       Append (Parser.Diagnostics,
-              Get_Token (Parser.TDH.all, ${parser.start_pos}).Sloc_Range,
+              Sloc_Range (Parser.TDH.all,
+                          Get_Token (Parser.TDH.all, ${parser.start_pos})),
               To_Text ("Cannot parse <${parser.name}>"));
 
       Add_Last_Fail_Diagnostic (Parser);
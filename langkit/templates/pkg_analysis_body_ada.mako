@@ -132,6 +132,24 @@ package body ${ada_lib_name}.Analysis is
                         Reparse, Rule));
    end Get_From_File;
 
+   --------------------
+   -- Get_From_Files --
+   --------------------
+
+   procedure Get_From_Files
+     (Context   : Analysis_Context'Class;
+      Filenames : GNAT.Strings.String_List;
+      Charset   : String := "";
+      Reparse   : Boolean := False;
+      Rule      : Grammar_Rule := Default_Grammar_Rule;
+      Jobs      : Natural := 0)
+   is
+      Dummy : constant Internal_Unit_Array := Get_From_Files
+        (Unwrap_Context (Context), Filenames, Charset, Reparse, Rule, Jobs);
+   begin
+      null;
+   end Get_From_Files;
+
    ---------------------
    -- Get_From_Buffer --
    ---------------------
@@ -256,6 +274,16 @@ package body ${ada_lib_name}.Analysis is
         (Unwrap_Context (Context), Discard);
    end Discard_Errors_In_Populate_Lexical_Env;
 
+   -----------------------------
+   -- Use_Memory_Mapped_Files --
+   -----------------------------
+
+   procedure Use_Memory_Mapped_Files
+     (Context : Analysis_Context'Class; Enabled : Boolean := True) is
+   begin
+      Use_Memory_Mapped_Files (Unwrap_Context (Context), Enabled);
+   end Use_Memory_Mapped_Files;
+
    ----------------------------------
    -- Set_Logic_Resolution_Timeout --
    ----------------------------------
@@ -323,6 +351,18 @@ package body ${ada_lib_name}.Analysis is
       Reparse (Unwrap_Unit (Unit), Charset, Buffer);
    end Reparse;
 
+   -------------
+   -- Reparse --
+   -------------
+
+   procedure Reparse
+     (Unit       : Analysis_Unit'Class;
+      Edit_Range : Source_Location_Range;
+      Text       : Text_Type) is
+   begin
+      Reparse (Unwrap_Unit (Unit), Edit_Range, Text);
+   end Reparse;
+
    --------------------------
    -- Populate_Lexical_Env --
    --------------------------
@@ -16,6 +16,8 @@ with Ada.Strings.Unbounded;
    private with Ada.Unchecked_Deallocation;
 % endif
 
+with GNAT.Strings;
+
 with GNATCOLL.Refcount;
 
 % if any(s.exposed and not s.is_entity_type for s in ctx.struct_types):
@@ -172,6 +174,16 @@ package ${ada_lib_name}.Analysis is
       with Pre => not Reparse or else not Has_Rewriting_Handle (Context);
    ${ada_doc('langkit.get_unit_from_file', 3)}
 
+   procedure Get_From_Files
+     (Context   : Analysis_Context'Class;
+      Filenames : GNAT.Strings.String_List;
+      Charset   : String := "";
+      Reparse   : Boolean := False;
+      Rule      : Grammar_Rule := Default_Grammar_Rule;
+      Jobs      : Natural := 0)
+      with Pre => not Reparse or else not Has_Rewriting_Handle (Context);
+   ${ada_doc('langkit.get_units_from_files', 3)}
+
    function Get_From_Buffer
      (Context  : Analysis_Context'Class;
       Filename : String;
@@ -229,6 +241,10 @@ package ${ada_lib_name}.Analysis is
      (Context : Analysis_Context'Class; Discard : Boolean);
    ${ada_doc('langkit.context_discard_errors_in_populate_lexical_env', 3)}
 
+   procedure Use_Memory_Mapped_Files
+     (Context : Analysis_Context'Class; Enabled : Boolean := True);
+   ${ada_doc('langkit.context_use_memory_mapped_files', 3)}
+
    procedure Set_Logic_Resolution_Timeout
      (Context : Analysis_Context'Class; Timeout : Natural);
    ${ada_doc('langkit.context_set_logic_resolution_timeout', 3)}
@@ -263,6 +279,12 @@ package ${ada_lib_name}.Analysis is
       Buffer  : String);
    ${ada_doc('langkit.unit_reparse_buffer', 3)}
 
+   procedure Reparse
+     (Unit       : Analysis_Unit'Class;
+      Edit_Range : Source_Location_Range;
+      Text       : Text_Type);
+   ${ada_doc('langkit.unit_reparse_edit', 3)}
+
    procedure Populate_Lexical_Env (Unit : Analysis_Unit'Class);
    ${ada_doc('langkit.unit_populate_lexical_env', 3)}
 
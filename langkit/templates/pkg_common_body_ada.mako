@@ -233,7 +233,7 @@ package body ${ada_lib_name}.Common is
    function Text (Token : Token_Reference) return Text_Type is
       RD : constant Stored_Token_Data := Raw_Data (Token);
    begin
-      return Token.TDH.Source_Buffer (RD.Source_First .. RD.Source_Last);
+      return Text (Token.TDH.all, RD);
    end Text;
 
    ----------
@@ -241,13 +241,13 @@ package body ${ada_lib_name}.Common is
    ----------
 
    function Text (First, Last : Token_Reference) return Text_Type is
-      FD : constant Token_Data_Type := Data (First);
-      LD : constant Token_Data_Type := Data (Last);
+      FD : constant Stored_Token_Data := Raw_Data (First);
+      LD : constant Stored_Token_Data := Raw_Data (Last);
    begin
       if First.TDH /= Last.TDH then
          raise Constraint_Error;
       end if;
-      return FD.Source_Buffer.all (FD.Source_First .. LD.Source_Last);
+      return Text (First.TDH.all, FD.Source_First, LD.Source_Last);
    end Text;
 
    ----------
@@ -376,7 +376,7 @@ package body ${ada_lib_name}.Common is
               Source_Buffer => Text_Cst_Access (TDH.Source_Buffer),
               Source_First  => Raw_Data.Source_First,
               Source_Last   => Raw_Data.Source_Last,
-              Sloc_Range    => Raw_Data.Sloc_Range);
+              Sloc_Range    => Sloc_Range (TDH, Raw_Data));
    end Convert;
 
    --------------------------
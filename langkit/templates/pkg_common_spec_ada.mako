@@ -438,7 +438,9 @@ private
       --  See documentation for the Index accessor
 
       Source_Buffer : Text_Cst_Access;
-      --  Text for the original source file
+      --  Text for the original source file. Null if the token data handler
+      --  stores it in compact form: in that case, the text for this token
+      --  must be decoded from the token data handler.
 
       Source_First : Positive;
       Source_Last  : Natural;
@@ -10,6 +10,7 @@
 
 with Ada.Containers;                  use Ada.Containers;
 with Ada.Containers.Hashed_Maps;
+with Ada.Containers.Hashed_Sets;
 with Ada.Containers.Vectors;
 with Ada.Directories;
 with Ada.Exceptions;
@@ -25,6 +26,9 @@ with Ada.Text_IO;                     use Ada.Text_IO;
 with Ada.Unchecked_Conversion;
 with Ada.Unchecked_Deallocation;
 with System;
+% if not ctx.has_predicate_parsers:
+with System.Multiprocessors;
+% endif
 
 with GNATCOLL.Traces;
 
@@ -385,10 +389,18 @@ package body ${ada_lib_name}.Implementation is
       Initialize (Context.Parser);
 
       Context.Discard_Errors_In_Populate_Lexical_Env := True;
+      Context.Use_Memory_Mapped_Files := False;
       Context.Logic_Resolution_Timeout := 100_000;
       Context.In_Populate_Lexical_Env := False;
       Context.Cache_Version := 0;
       Context.Reparse_Cache_Version := 0;
+      % if ctx.has_memoization:
+         Context.Full_Invalidation_Version := 0;
+         Context.Root_Scope_Change_Version := 0;
+         Context.Mmz_Frame_Count := 0;
+         Context.Mmz_Kept_Entries := 0;
+         Context.Mmz_Evicted_Entries := 0;
+      % endif
 
       Context.Rewriting_Handle := No_Rewriting_Handle_Pointer;
       Context.Templates_Unit := No_Analysis_Unit;
@@ -420,31 +432,31 @@ package body ${ada_lib_name}.Implementation is
       return Unit;
    end Create_Unit;
 
-   --------------
-   -- Get_Unit --
-   --------------
+   ------------------
+   -- Prepare_Unit --
+   ------------------
 
-   function Get_Unit
+   procedure Prepare_Unit
      (Context           : Internal_Context;
       Filename, Charset : String;
-      Reparse           : Boolean;
       Input             : Internal_Lexer_Input;
-      Rule              : Grammar_Rule) return Internal_Unit
+      Rule              : Grammar_Rule;
+      Unit              : out Internal_Unit;
+      Refined_Input     : out Internal_Lexer_Input;
+      Created           : out Boolean)
    is
       use Units_Maps;
 
       Normalized_Filename : constant GNATCOLL.VFS.Virtual_File :=
          Normalized_Unit_Filename (Context, Filename);
 
-      Cur     : constant Cursor :=
-         Context.Units.Find (Normalized_Filename);
-      Created : constant Boolean := Cur = No_Element;
-      Unit    : Internal_Unit;
+      Cur : constant Cursor := Context.Units.Find (Normalized_Filename);
 
       Actual_Charset : Unbounded_String;
-      Refined_Input  : Internal_Lexer_Input := Input;
-
    begin
+      Created := Cur = No_Element;
+      Refined_Input := Input;
+
       --  Determine which encoding to use. Use the Charset parameter (if
       --  provided), otherwise use the context-wide default.
 
@@ -454,6 +466,7 @@ package body ${ada_lib_name}.Implementation is
 
       if Refined_Input.Kind = File then
          Refined_Input.Filename := Normalized_Filename;
+         Refined_Input.Memory_Mapped := Context.Use_Memory_Mapped_Files;
       end if;
 
       if Refined_Input.Kind in File | Bytes_Buffer then
@@ -475,6 +488,26 @@ package body ${ada_lib_name}.Implementation is
                            To_String (Actual_Charset), Rule)
          else Element (Cur));
       Unit.Charset := Actual_Charset;
+   end Prepare_Unit;
+
+   --------------
+   -- Get_Unit --
+   --------------
+
+   function Get_Unit
+     (Context           : Internal_Context;
+      Filename, Charset : String;
+      Reparse           : Boolean;
+      Input             : Internal_Lexer_Input;
+      Rule              : Grammar_Rule) return Internal_Unit
+   is
+      Unit          : Internal_Unit;
+      Refined_Input : Internal_Lexer_Input (Input.Kind);
+      Created       : Boolean;
+   begin
+      Prepare_Unit
+        (Context, Filename, Charset, Input, Rule, Unit, Refined_Input,
+         Created);
 
       --  (Re)parse it if needed
 
@@ -487,6 +520,12 @@ package body ${ada_lib_name}.Implementation is
          end;
       end if;
 
+      % if ctx.has_memoization:
+         --  If a memoized property is fetching this unit, its result is likely
+         --  to depend on it.
+         Register_Mmz_Dependency (Context, Unit);
+      % endif
+
       return Unit;
    end Get_Unit;
 
@@ -514,14 +553,264 @@ package body ${ada_lib_name}.Implementation is
       Rule     : Grammar_Rule) return Internal_Unit
    is
       Input : constant Internal_Lexer_Input :=
-        (Kind     => File,
-         Charset  => <>,
-         Read_BOM => False,
-         Filename => <>);
+        (Kind          => File,
+         Charset       => <>,
+         Read_BOM      => False,
+         Filename      => <>,
+         Memory_Mapped => <>);
    begin
       return Get_Unit (Context, Filename, Charset, Reparse, Input, Rule);
    end Get_From_File;
 
+   --------------------
+   -- Get_From_Files --
+   --------------------
+
+   function Get_From_Files
+     (Context   : Internal_Context;
+      Filenames : GNAT.Strings.String_List;
+      Charset   : String;
+      Reparse   : Boolean;
+      Rule      : Grammar_Rule;
+      Jobs      : Natural) return Internal_Unit_Array
+   is
+      use Ada.Exceptions;
+
+      package Unit_Sets is new Ada.Containers.Hashed_Sets
+        (Element_Type        => Internal_Unit,
+         Hash                => Hash,
+         Equivalent_Elements => "=");
+
+      subtype File_Input is Internal_Lexer_Input (File);
+
+      type Batch_Entry is record
+         Unit : Internal_Unit;
+         --  Unit for the corresponding filename
+
+         Input : File_Input;
+         --  Lexer input to use in order to parse Unit
+
+         Must_Parse : Boolean;
+         --  Whether this entry is responsible for (re)parsing Unit
+
+         Result : Reparsed_Unit;
+         --  Parsing result for Unit, if Must_Parse is true
+
+         Failed : Boolean := False;
+         --  Whether parsing Unit raised an exception
+      end record;
+
+      type Batch_Entry_Array is array (Positive range <>) of Batch_Entry;
+      type Batch_Entry_Array_Access is access Batch_Entry_Array;
+      procedure Free is new Ada.Unchecked_Deallocation
+        (Batch_Entry_Array, Batch_Entry_Array_Access);
+
+      Entries : Batch_Entry_Array_Access :=
+         new Batch_Entry_Array (Filenames'Range);
+      --  Parsing state for all requested units. Allocate it dynamically as
+      --  it can be big.
+
+      Parse_Count : Natural := 0;
+      --  Number of entries for which Must_Parse is true
+
+      % if ctx.has_predicate_parsers:
+      Worker_Count : Natural := 1;
+      --  Number of tasks to use for parsing. Predicate parsers evaluate
+      --  properties, and these update context-wide data (call depth,
+      --  memoization frames, caches) without synchronization: parse all
+      --  units sequentially, regardless of Jobs.
+
+      pragma Unreferenced (Jobs);
+      % else:
+      Worker_Count : Natural :=
+        (if Jobs = 0
+         then Natural (System.Multiprocessors.Number_Of_CPUs)
+         else Jobs);
+      --  Number of tasks to use for parsing
+      % endif
+
+      Worker_Stack_Size : constant := 8 * 1024 * 1024;
+      --  Parsers are recursive: give workers as much stack as the environment
+      --  task usually gets.
+
+      protected Queue is
+         procedure Next (Index : out Natural);
+         --  Set Index to the next entry to parse, or to 0 if there is nothing
+         --  left to parse.
+
+         procedure Set_Error (Exc : Exception_Occurrence);
+         --  Save Exc unless an error was already saved
+
+         procedure Reraise_Error;
+         --  Re-raise the saved error, if any
+      private
+         Last  : Natural := Filenames'First - 1;
+         Error : Exception_Occurrence;
+      end Queue;
+
+      task type Worker with Storage_Size => Worker_Stack_Size;
+      --  Parse entries from Queue until it is exhausted. Each worker uses its
+      --  own parser, so that parsers never share data: all units have their
+      --  own token data handler and memory pool, and the only data shared
+      --  between units is the symbol table, which is thread-safe. Note that
+      --  this does not hold for grammars with predicates, which are never
+      --  parsed by workers.
+
+      procedure Parse (I : Positive; Parser : in out Parser_Type);
+      --  Parse the unit for Entries (I) and store the result in it. If this
+      --  raises an exception, flag the entry and save the exception in Queue.
+
+      -----------
+      -- Queue --
+      -----------
+
+      protected body Queue is
+
+         procedure Next (Index : out Natural) is
+         begin
+            while Last < Entries'Last loop
+               Last := Last + 1;
+               if Entries (Last).Must_Parse then
+                  Index := Last;
+                  return;
+               end if;
+            end loop;
+            Index := 0;
+         end Next;
+
+         procedure Set_Error (Exc : Exception_Occurrence) is
+         begin
+            if Exception_Identity (Error) = Null_Id then
+               Save_Occurrence (Error, Exc);
+            end if;
+         end Set_Error;
+
+         procedure Reraise_Error is
+         begin
+            --  Reraise_Occurrence does nothing if no error was saved
+            Reraise_Occurrence (Error);
+         end Reraise_Error;
+
+      end Queue;
+
+      -----------
+      -- Parse --
+      -----------
+
+      procedure Parse (I : Positive; Parser : in out Parser_Type) is
+         E : Batch_Entry renames Entries (I);
+      begin
+         Do_Parsing (E.Unit, E.Input, E.Result, Parser);
+      exception
+         when Exc : others =>
+            E.Failed := True;
+            Queue.Set_Error (Exc);
+      end Parse;
+
+      ------------
+      -- Worker --
+      ------------
+
+      task body Worker is
+         Parser : Parser_Type;
+         I      : Natural;
+      begin
+         Initialize (Parser);
+         loop
+            Queue.Next (I);
+            exit when I = 0;
+            Parse (I, Parser);
+         end loop;
+         Destroy (Parser);
+      end Worker;
+
+      Scheduled : Unit_Sets.Set;
+      Result    : Internal_Unit_Array (Filenames'Range);
+   begin
+      --  First create the units that do not exist yet and determine which
+      --  ones need to be parsed. This modifies the context, so this must be
+      --  done sequentially. Take care of parsing each unit at most once.
+
+      for I in Filenames'Range loop
+         declare
+            E       : Batch_Entry renames Entries (I);
+            Created : Boolean;
+         begin
+            Prepare_Unit
+              (Context, Filenames (I).all, Charset,
+               File_Input'(Kind          => File,
+                           Charset       => <>,
+                           Read_BOM      => False,
+                           Filename      => <>,
+                           Memory_Mapped => <>),
+               Rule, E.Unit, E.Input, Created);
+
+            E.Must_Parse := (Created or else Reparse)
+                            and then not Scheduled.Contains (E.Unit);
+            if E.Must_Parse then
+               Scheduled.Insert (E.Unit);
+               Parse_Count := Parse_Count + 1;
+            end if;
+         end;
+      end loop;
+
+      --  Then lex and parse units concurrently. There is no need to create
+      --  tasks if there is only one job to run.
+
+      Worker_Count := Natural'Min (Worker_Count, Parse_Count);
+      if Worker_Count <= 1 then
+         declare
+            I : Natural;
+         begin
+            loop
+               Queue.Next (I);
+               exit when I = 0;
+               Parse (I, Context.Parser);
+            end loop;
+         end;
+      else
+         declare
+            Workers : array (1 .. Worker_Count) of Worker
+               with Unreferenced;
+         begin
+            --  Leaving this block waits for the termination of all workers
+            null;
+         end;
+      end if;
+
+      --  Finally, install parsing results in units. This invalidates caches
+      --  and may populate lexical environments, so this is sequential too.
+
+      for I in Entries'Range loop
+         declare
+            E : Batch_Entry renames Entries (I);
+         begin
+            if E.Must_Parse then
+               if E.Failed then
+                  Destroy (E.Result);
+               else
+                  Update_After_Reparse (E.Unit, E.Result);
+               end if;
+            end if;
+
+            % if ctx.has_memoization:
+               --  If a memoized property is fetching this unit, its result is
+               --  likely to depend on it.
+               Register_Mmz_Dependency (Context, E.Unit);
+            % endif
+
+            Result (I) := E.Unit;
+         end;
+      end loop;
+      Free (Entries);
+
+      --  If parsing a unit raised an error, propagate it now that the context
+      --  is in a consistent state.
+
+      Queue.Reraise_Error;
+      return Result;
+   end Get_From_Files;
+
    ---------------------
    -- Get_From_Buffer --
    ---------------------
@@ -636,6 +925,16 @@ package body ${ada_lib_name}.Implementation is
       Context.Discard_Errors_In_Populate_Lexical_Env := Discard;
    end Discard_Errors_In_Populate_Lexical_Env;
 
+   -----------------------------
+   -- Use_Memory_Mapped_Files --
+   -----------------------------
+
+   procedure Use_Memory_Mapped_Files
+     (Context : Internal_Context; Enabled : Boolean) is
+   begin
+      Context.Use_Memory_Mapped_Files := Enabled;
+   end Use_Memory_Mapped_Files;
+
    ----------------------------------
    -- Set_Logic_Resolution_Timeout --
    ----------------------------------
@@ -697,6 +996,13 @@ package body ${ada_lib_name}.Implementation is
       Destroy (Context.Templates_Unit);
       AST_Envs.Destroy (Context.Root_Scope);
       Destroy (Context.Symbols);
+      % if ctx.has_memoization:
+         for F of Context.Mmz_Frames loop
+            AST_Envs.Destroy (F.all);
+            Free (F);
+         end loop;
+         Context.Mmz_Frames.Destroy;
+      % endif
       Destroy (Context.Parser);
       Dec_Ref (Context.Unit_Provider);
       Context_Pool.Release (Context);
@@ -746,6 +1052,161 @@ package body ${ada_lib_name}.Implementation is
       null;
    end Reparse;
 
+   -------------
+   -- Reparse --
+   -------------
+
+   procedure Reparse
+     (Unit       : Internal_Unit;
+      Edit_Range : Source_Location_Range;
+      Text       : Text_Type)
+   is
+      procedure Free is new Ada.Unchecked_Deallocation
+        (Text_Type, Text_Access);
+
+      TDH : Token_Data_Handler renames Unit.TDH;
+
+      function Same_Tokens (Other : Token_Data_Handler) return Boolean;
+      --  Return whether Other has the same tokens (not considering trivia) as
+      --  TDH.
+
+      -----------------
+      -- Same_Tokens --
+      -----------------
+
+      function Same_Tokens (Other : Token_Data_Handler) return Boolean is
+      begin
+         if Last_Token (Other) /= Last_Token (TDH) then
+            return False;
+         end if;
+
+         for I in First_Token_Index .. Last_Token (TDH) loop
+            declare
+               T       : constant Stored_Token_Data := Get_Token (TDH, I);
+               Other_T : constant Stored_Token_Data := Get_Token (Other, I);
+            begin
+               if T.Kind /= Other_T.Kind
+                  or else Token_Data_Handlers.Text (TDH, T)
+                          /= Token_Data_Handlers.Text (Other, Other_T)
+               then
+                  return False;
+               end if;
+            end;
+         end loop;
+         return True;
+      end Same_Tokens;
+
+      First, Last : Natural;
+      --  Bounds in TDH's source buffer of the text to replace
+
+      New_Buffer : Text_Access;
+   begin
+      if not Has_Source_Buffer (TDH) then
+         raise Precondition_Failure with "unit has no source buffer";
+      end if;
+
+      First := Get_Index (TDH, Start_Sloc (Edit_Range));
+      Last := Get_Index (TDH, End_Sloc (Edit_Range));
+      if First = 0 or else Last < First then
+         raise Precondition_Failure with "invalid edit range";
+      end if;
+      Last := Last - 1;
+
+      --  If the edit does not change the source buffer, there is nothing to
+      --  do.
+
+      if Token_Data_Handlers.Text (TDH, First, Last) = Text then
+         return;
+      end if;
+
+      --  Compute the new source buffer. Allocate it on the heap, as sources
+      --  can be big. Decode the unchanged parts directly into it, so that the
+      --  current source buffer can stay compact.
+
+      declare
+         Before_Length : constant Natural := First - TDH.Source_First;
+         After_Length  : constant Natural := TDH.Source_Last - Last;
+         Text_Last     : constant Natural := Before_Length + Text'Length;
+      begin
+         New_Buffer := new Text_Type (1 .. Text_Last + After_Length);
+         Copy_Text (TDH, TDH.Source_First, First - 1,
+                    New_Buffer (1 .. Before_Length));
+         New_Buffer (Before_Length + 1 .. Text_Last) := Text;
+         Copy_Text (TDH, Last + 1, TDH.Source_Last,
+                    New_Buffer (Text_Last + 1 .. New_Buffer'Last));
+      end;
+
+      declare
+         Input : constant Internal_Lexer_Input :=
+           (Kind       => Text_Buffer,
+            Text       => New_Buffer.all'Address,
+            Text_Count => New_Buffer'Length);
+
+         New_TDH     : Token_Data_Handler;
+         Diagnostics : Diagnostics_Vectors.Vector;
+      begin
+         --  Relex the new source buffer. If this yields exactly the same
+         --  tokens as before (i.e. the edit changed only trivia and
+         --  formatting), parsing would create the same tree: just update the
+         --  token data and keep the current tree, so that nodes are preserved.
+         --
+         --  Do this only if there were no diagnostics, as these would need to
+         --  be recomputed.
+         --
+         --  Note that we relex the whole buffer: lexers keep no state
+         --  snapshots that would allow to relex only the edited window and
+         --  splice the resulting tokens, so this is only a fast path to avoid
+         --  parsing for trivia-only edits.
+
+         Initialize (New_TDH, TDH.Symbols);
+         Extract_Tokens
+           (Input, Unit.Context.Tab_Stop, Unit.Context.With_Trivia, New_TDH,
+            Diagnostics);
+
+         if Unit.AST_Root /= null
+            and then Unit.Diagnostics.Is_Empty
+            and then Diagnostics.Is_Empty
+            and then Same_Tokens (New_TDH)
+         then
+            GNATCOLL.Traces.Trace
+              (Main_Trace, "Keeping the tree of " & Basename (Unit)
+                           & " after edit");
+
+            --  Source locations may have changed, so invalidate memoized
+            --  properties that depend on this unit.
+
+            Invalidate_Unit_Caches
+              (Unit.Context, Unit, Invalidate_Envs => False);
+            New_TDH.Filename := TDH.Filename;
+            New_TDH.Charset := TDH.Charset;
+            Free (TDH);
+            Move (TDH, New_TDH);
+
+         --  Otherwise, do a regular reparse
+
+         else
+            Free (New_TDH);
+            declare
+               Dummy : constant Internal_Unit := Get_Unit
+                 (Context  => Unit.Context,
+                  Filename => +Unit.Filename.Full_Name,
+                  Charset  => To_String (Unit.Charset),
+                  Reparse  => True,
+                  Input    => Input,
+                  Rule     => Unit.Rule);
+            begin
+               null;
+            end;
+         end if;
+      end;
+
+      Free (New_Buffer);
+   exception
+      when others =>
+         Free (New_Buffer);
+         raise;
+   end Reparse;
+
    --------------------------
    -- Populate_Lexical_Env --
    --------------------------
@@ -926,6 +1387,9 @@ package body ${ada_lib_name}.Implementation is
 
    function Text (Unit : Internal_Unit) return Text_Cst_Access is
    begin
+      --  Callers need the whole source buffer as wide characters
+
+      Decompact (Unit.TDH);
       return Text_Cst_Access (Unit.TDH.Source_Buffer);
    end Text;
 
@@ -1657,8 +2121,8 @@ package body ${ada_lib_name}.Implementation is
 
       function Sloc (T : Token_Pos) return Source_Location is
         (if T.Anchor = T_Start
-         then Start_Sloc (Get (T.Pos).Sloc_Range)
-         else End_Sloc (Get (T.Pos).Sloc_Range));
+         then Start_Sloc (Sloc_Range (TDH, Get (T.Pos)))
+         else End_Sloc (Sloc_Range (TDH, Get (T.Pos))));
 
    begin
       if Is_Synthetic (Node) then
@@ -2059,6 +2523,46 @@ package body ${ada_lib_name}.Implementation is
       Node.Unit.Rebindings.Append (Convert (Rebinding));
    end Register_Rebinding;
 
+   -----------------------------
+   -- Push_Dependencies_Frame --
+   -----------------------------
+
+   function Push_Dependencies_Frame
+     (Node : ${T.root_node.name}) return Natural is
+   begin
+      % if ctx.has_memoization:
+         return Push_Mmz_Frame (Node.Unit.Context);
+      % else:
+         pragma Unreferenced (Node);
+         return 0;
+      % endif
+   end Push_Dependencies_Frame;
+
+   ----------------------------
+   -- Pop_Dependencies_Frame --
+   ----------------------------
+
+   procedure Pop_Dependencies_Frame
+     (Node       : ${T.root_node.name};
+      Frame      : Natural;
+      Dependency : access procedure (Unit : Internal_Unit)) is
+   begin
+      % if ctx.has_memoization:
+         declare
+            Context : constant Internal_Context := Node.Unit.Context;
+         begin
+            if Dependency /= null then
+               for U of Context.Mmz_Frames.Get (Frame).Units loop
+                  Dependency.all (U);
+               end loop;
+            end if;
+            Context.Mmz_Frame_Count := Frame - 1;
+         end;
+      % else:
+         pragma Unreferenced (Node, Frame, Dependency);
+      % endif
+   end Pop_Dependencies_Frame;
+
    --------------------
    -- Element_Parent --
    --------------------
@@ -3614,25 +4118,80 @@ package body ${ada_lib_name}.Implementation is
    -- Invalidate_Caches --
    -----------------------
 
-   procedure Invalidate_Caches
-     (Context : Internal_Context; Invalidate_Envs : Boolean) is
+   procedure Increment_Cache_Version (Context : Internal_Context);
+   --  Increase Context's version number. If we are about to overflow, reset
+   --  all version numbers from analysis units: this invalidates all caches.
+
+   -----------------------------
+   -- Increment_Cache_Version --
+   -----------------------------
+
+   procedure Increment_Cache_Version (Context : Internal_Context) is
    begin
-      --  Increase Context's version number. If we are about to overflow, reset
-      --  all version numbers from analysis units.
       if Context.Cache_Version = Natural'Last then
          Context.Cache_Version := 1;
          for Unit of Context.Units loop
             Unit.Cache_Version := 0;
+            % if ctx.has_memoization:
+               Unit.Last_Change_Version := 0;
+            % endif
          end loop;
+         Context.Reparse_Cache_Version := 0;
+         % if ctx.has_memoization:
+            Context.Full_Invalidation_Version := 1;
+            Context.Root_Scope_Change_Version := 0;
+         % endif
       else
          Context.Cache_Version := Context.Cache_Version + 1;
       end if;
+   end Increment_Cache_Version;
+
+   -----------------------
+   -- Invalidate_Caches --
+   -----------------------
+
+   procedure Invalidate_Caches
+     (Context : Internal_Context; Invalidate_Envs : Boolean) is
+   begin
+      Increment_Cache_Version (Context);
+      % if ctx.has_memoization:
+         Context.Full_Invalidation_Version := Context.Cache_Version;
+      % endif
 
       if Invalidate_Envs then
          Context.Reparse_Cache_Version := Context.Cache_Version;
       end if;
    end Invalidate_Caches;
 
+   ----------------------------
+   -- Invalidate_Unit_Caches --
+   ----------------------------
+
+   procedure Invalidate_Unit_Caches
+     (Context         : Internal_Context;
+      Unit            : Internal_Unit;
+      Invalidate_Envs : Boolean) is
+   begin
+      % if ctx.has_memoization:
+         Increment_Cache_Version (Context);
+         if Unit = No_Analysis_Unit then
+            Context.Root_Scope_Change_Version := Context.Cache_Version;
+         else
+            Unit.Last_Change_Version := Context.Cache_Version;
+         end if;
+
+         if Invalidate_Envs then
+            Context.Reparse_Cache_Version := Context.Cache_Version;
+         end if;
+      % else:
+         pragma Unreferenced (Unit);
+
+         --  Without memoization, there is no point in tracking which unit
+         --  changed.
+         Invalidate_Caches (Context, Invalidate_Envs);
+      % endif
+   end Invalidate_Unit_Caches;
+
    ------------------
    --  Reset_Envs  --
    ------------------
@@ -3726,7 +4285,11 @@ package body ${ada_lib_name}.Implementation is
       if Cache_Version < Unit.Context.Cache_Version then
          Unit.Cache_Version := Unit.Context.Cache_Version;
          % if ctx.has_memoization:
-            Destroy (Unit.Memoization_Map);
+            if Cache_Version < Unit.Context.Full_Invalidation_Version then
+               Destroy (Unit.Memoization_Map);
+            else
+               Evict_Stale_Memoized_Values (Unit);
+            end if;
          % endif
       end if;
    end Reset_Caches;
@@ -3764,7 +4327,16 @@ package body ${ada_lib_name}.Implementation is
    procedure Do_Parsing
      (Unit   : Internal_Unit;
       Input  : Internal_Lexer_Input;
-      Result : out Reparsed_Unit)
+      Result : out Reparsed_Unit) is
+   begin
+      Do_Parsing (Unit, Input, Result, Unit.Context.Parser);
+   end Do_Parsing;
+
+   procedure Do_Parsing
+     (Unit   : Internal_Unit;
+      Input  : Internal_Lexer_Input;
+      Result : out Reparsed_Unit;
+      Parser : in out Parser_Type)
    is
       Context  : constant Internal_Context := Unit.Context;
       Unit_TDH : constant Token_Data_Handler_Access := Token_Data (Unit);
@@ -3845,7 +4417,7 @@ package body ${ada_lib_name}.Implementation is
       begin
          Init_Parser
            (Actual_Input, Context.Tab_Stop, Context.With_Trivia, Unit,
-            Unit_TDH, Unit.Context.Parser);
+            Unit_TDH, Parser);
       exception
          when Exc : Name_Error =>
             --  This happens when we cannot open the source file for lexing:
@@ -3879,11 +4451,11 @@ package body ${ada_lib_name}.Implementation is
       --  get.
 
       Result.AST_Mem_Pool := Create;
-      Unit.Context.Parser.Mem_Pool := Result.AST_Mem_Pool;
+      Parser.Mem_Pool := Result.AST_Mem_Pool;
 
       Result.AST_Root := ${T.root_node.name}
-        (Parse (Unit.Context.Parser, Rule => Unit.Rule));
-      Result.Diagnostics.Append (Unit.Context.Parser.Diagnostics);
+        (Parse (Parser, Rule => Unit.Rule));
+      Result.Diagnostics.Append (Parser.Diagnostics);
       Rotate_TDH;
    end Do_Parsing;
 
@@ -3892,7 +4464,14 @@ package body ${ada_lib_name}.Implementation is
    --------------------------
 
    procedure Update_After_Reparse
-     (Unit : Internal_Unit; Reparsed : in out Reparsed_Unit) is
+     (Unit : Internal_Unit; Reparsed : in out Reparsed_Unit)
+   is
+      % if ctx.has_memoization:
+         Old_Exiled_Entries : Exiled_Entry_Vectors.Vector :=
+            Unit.Exiled_Entries.Copy;
+         --  Entries Unit had in foreign lexical environments before the
+         --  reparse. Used to determine which environments actually change.
+      % endif
    begin
       --  Remove the `symbol -> AST node` associations for Unit's nodes in
       --  foreign lexical environments. Do this before any deallocation because
@@ -3905,13 +4484,22 @@ package body ${ada_lib_name}.Implementation is
       Reparsed.Diagnostics.Clear;
 
       --  As (re-)loading a unit can change how any AST node property in the
-      --  whole analysis context behaves, we have to invalidate caches. This
-      --  is likely overkill, but kill all caches here as it's easy to do.
+      --  whole analysis context behaves, we have to invalidate caches.
       --
-      --  As an optimization, invalidate referenced envs cache only if this is
-      --  not the first time we parse Unit.
-      Invalidate_Caches
-        (Unit.Context, Invalidate_Envs => Unit.AST_Root /= null);
+      --  Loading a unit for the first time can affect any lexical environment,
+      --  so kill all caches in that case. There is no need to invalidate
+      --  referenced envs caches, though.
+      --
+      --  Otherwise, only invalidate memoization entries that depend on Unit.
+      --  Entries that depend on lexical environments from other units in
+      --  which Unit has exiled entries are invalidated after lexical
+      --  environments are re-populated (see Invalidate_Changed_Envs).
+      if Unit.AST_Root = null then
+         Invalidate_Caches (Unit.Context, Invalidate_Envs => False);
+      else
+         Invalidate_Unit_Caches
+           (Unit.Context, Unit, Invalidate_Envs => True);
+      end if;
 
       --  Likewise for token data
       Free (Unit.TDH);
@@ -3940,6 +4528,9 @@ package body ${ada_lib_name}.Implementation is
 
       --  If Unit had its lexical environments populated, re-populate them
       if not Unit.Is_Env_Populated then
+         % if ctx.has_memoization:
+            Old_Exiled_Entries.Destroy;
+         % endif
          return;
       end if;
 
@@ -3988,6 +4579,12 @@ package body ${ada_lib_name}.Implementation is
          Populate_Lexical_Env (Unit);
          Context.In_Populate_Lexical_Env := Saved_In_Populate_Lexical_Env;
          GNATCOLL.Traces.Decrease_Indent (Main_Trace);
+
+         % if ctx.has_memoization:
+            Invalidate_Changed_Envs
+              (Context, Old_Exiled_Entries, Unit.Exiled_Entries);
+            Old_Exiled_Entries.Destroy;
+         % endif
       end;
    end Update_After_Reparse;
 
@@ -4035,6 +4632,83 @@ package body ${ada_lib_name}.Implementation is
       Unit.Exiled_Entries.Clear;
    end Remove_Exiled_Entries;
 
+   % if ctx.has_memoization:
+   -----------------------------
+   -- Invalidate_Changed_Envs --
+   -----------------------------
+
+   procedure Invalidate_Changed_Envs
+     (Context                  : Internal_Context;
+      Old_Entries, New_Entries : Exiled_Entry_Vectors.Vector)
+   is
+      type Env_Key is record
+         Env : Lexical_Env;
+         Key : Symbol_Type;
+      end record;
+
+      function Hash (Self : Env_Key) return Hash_Type
+      is (Combine (Hash (Self.Env), Hash (Self.Key)));
+
+      function Equivalent (Left, Right : Env_Key) return Boolean
+      is (Left.Env.Env = Right.Env.Env and then Left.Key = Right.Key);
+
+      package Env_Key_Maps is new Ada.Containers.Hashed_Maps
+        (Key_Type        => Env_Key,
+         Element_Type    => Positive,
+         Hash            => Hash,
+         Equivalent_Keys => Equivalent);
+      use Env_Key_Maps;
+
+      New_Keys : Map;
+      --  For each (environment, key) couple in New_Entries, number of new
+      --  entries that are not matched by an old entry yet.
+
+      procedure Invalidate (Env : Lexical_Env);
+      --  Invalidate memoization entries that depend on Env
+
+      ----------------
+      -- Invalidate --
+      ----------------
+
+      procedure Invalidate (Env : Lexical_Env) is
+      begin
+         Invalidate_Unit_Caches (Context, Env.Owner, Invalidate_Envs => False);
+      end Invalidate;
+
+      Position : Cursor;
+      Inserted : Boolean;
+   begin
+      --  Entries that are both in the old and new sets (same environment,
+      --  same key) only replace old nodes with new ones: lookups that return
+      --  them already depend on the reparsed unit. Other entries change the
+      --  result of lookups in their environment.
+
+      for New_EE of New_Entries loop
+         New_Keys.Insert ((New_EE.Env, New_EE.Key), 1, Position, Inserted);
+         if not Inserted then
+            New_Keys.Replace_Element (Position, Element (Position) + 1);
+         end if;
+      end loop;
+
+      for Old_EE of Old_Entries loop
+         Position := New_Keys.Find ((Old_EE.Env, Old_EE.Key));
+         if not Has_Element (Position) then
+            Invalidate (Old_EE.Env);
+         elsif Element (Position) = 1 then
+            New_Keys.Delete (Position);
+         else
+            New_Keys.Replace_Element (Position, Element (Position) - 1);
+         end if;
+      end loop;
+
+      --  Remaining new entries have no old counterpart
+
+      for C in New_Keys.Iterate loop
+         Invalidate (Key (C).Env);
+      end loop;
+   end Invalidate_Changed_Envs;
+   % endif
+
    ---------------------------
    -- Extract_Foreign_Nodes --
    ---------------------------
@@ -17,6 +17,8 @@ with Ada.Unchecked_Deallocation;
 
 with System;
 
+with GNAT.Strings;
+
 % if ctx.properties_logging:
    with GNATCOLL.Traces;
 % endif
@@ -163,6 +165,16 @@ private package ${ada_lib_name}.Implementation is
    --  Langkit_Support.Lexical_Env a procedure that has visibility on both
    --  Env_Rebindings and on the analysis unit record.
 
+   function Push_Dependencies_Frame
+     (Node : ${T.root_node.name}) return Natural;
+   procedure Pop_Dependencies_Frame
+     (Node       : ${T.root_node.name};
+      Frame      : Natural;
+      Dependency : access procedure (Unit : Internal_Unit));
+   --  Implementations for the corresponding Langkit_Support.Lexical_Env
+   --  formals. Dependency frames are the ones used to collect dependencies
+   --  for memoized properties.
+
    function Element_Parent
      (Node : ${T.root_node.name}) return ${T.root_node.name};
 
@@ -180,6 +192,9 @@ private package ${ada_lib_name}.Implementation is
    function Context_Version (Unit : Internal_Unit) return Integer;
    --  Return the version of the analysis context associated with Unit
 
+   function Hash (Unit : Internal_Unit) return Hash_Type;
+   --  Implementation for Analysis.Hash
+
    type Ref_Category is
      (${", ".join(sorted(str(cat) for cat in ctx.ref_cats))});
    type Ref_Categories is array (Ref_Category) of Boolean;
@@ -193,6 +208,7 @@ private package ${ada_lib_name}.Implementation is
       No_Unit                  => No_Analysis_Unit,
       Get_Unit_Version         => Unit_Version,
       Get_Context_Version      => Context_Version,
+      Unit_Hash                => Hash,
       Node_Type                => ${T.root_node.name},
       Node_Metadata            => ${T.env_md.name},
       No_Node                  => null,
@@ -203,6 +219,8 @@ private package ${ada_lib_name}.Implementation is
       Combine                  => Combine,
       Node_Text_Image          => AST_Envs_Node_Text_Image,
       Register_Rebinding       => Register_Rebinding,
+      Push_Dependencies_Frame  => Push_Dependencies_Frame,
+      Pop_Dependencies_Frame   => Pop_Dependencies_Frame,
       Ref_Category             => Ref_Category,
       Ref_Categories           => Ref_Categories);
 
@@ -970,6 +988,9 @@ private package ${ada_lib_name}.Implementation is
       Discard_Errors_In_Populate_Lexical_Env : Boolean;
       --  See the eponym procedure
 
+      Use_Memory_Mapped_Files : Boolean;
+      --  See the eponym procedure
+
       In_Populate_Lexical_Env : Boolean;
       --  Flag to tell whether we are running the Populate_Lexical_Env pass.
       --  When it's on, we must not use the memoization map as the hash of
@@ -990,6 +1011,31 @@ private package ${ada_lib_name}.Implementation is
       --  Version number used to invalidate referenced envs caches. It is
       --  incremented only when a unit is reparsed in the context.
 
+      % if ctx.has_memoization:
+      Full_Invalidation_Version : Natural;
+      --  Value of Cache_Version the last time all memoization caches were
+      --  invalidated. Units whose version number is strictly inferior to this
+      --  must destroy their whole memoization map. Otherwise, they just need
+      --  to evict entries that depend on units that changed.
+
+      Root_Scope_Change_Version : Natural;
+      --  Value of Cache_Version the last time the content of lexical
+      --  environments that belong to no unit (i.e. the root scope) changed.
+      --  See Analysis_Unit_Type.Last_Change_Version.
+
+      Mmz_Frames : Mmz_Frame_Vectors.Vector;
+      --  Sets of dependencies for the memoized properties currently being
+      --  evaluated, innermost last. Only the first Mmz_Frame_Count elements
+      --  are in use: we keep the others to avoid re-allocating them.
+
+      Mmz_Frame_Count : Natural;
+      --  Number of memoized properties currently being evaluated
+
+      Mmz_Kept_Entries, Mmz_Evicted_Entries : Mmz_Counter;
+      --  Number of memoization entries that were kept (respectively evicted)
+      --  when invalidating caches for a unit change.
+      % endif
+
       Rewriting_Handle : Rewriting_Handle_Pointer :=
          No_Rewriting_Handle_Pointer;
       --  Rewriting handle for this context's current rewriting session.
@@ -1090,6 +1136,14 @@ private package ${ada_lib_name}.Implementation is
 
       Cache_Version : Natural := 0;
       --  See the eponym field in Analysis_Context_Type
+
+      % if ctx.has_memoization:
+      Last_Change_Version : Natural := 0;
+      --  Value of Context.Cache_Version the last time this unit changed, i.e.
+      --  it was reparsed or the content of its lexical environments changed.
+      --  Memoization entries that depend on this unit and which were computed
+      --  before that version are stale.
+      % endif
    end record;
 
    procedure Free is new Ada.Unchecked_Deallocation
@@ -1143,6 +1197,19 @@ private package ${ada_lib_name}.Implementation is
    --  Helper for Get_From_File and Get_From_Buffer. Return the resulting
    --  analysis unit.
 
+   procedure Prepare_Unit
+     (Context           : Internal_Context;
+      Filename, Charset : String;
+      Input             : Internal_Lexer_Input;
+      Rule              : Grammar_Rule;
+      Unit              : out Internal_Unit;
+      Refined_Input     : out Internal_Lexer_Input;
+      Created           : out Boolean);
+   --  Helper for Get_Unit and Get_From_Files. Create the analysis unit for
+   --  Filename if it does not exist yet and set Created accordingly. Set Unit
+   --  to it and Refined_Input to the lexer input (derived from Input) to use
+   --  in order to (re)parse it.
+
    function Has_Unit
      (Context       : Internal_Context;
       Unit_Filename : String) return Boolean;
@@ -1157,6 +1224,18 @@ private package ${ada_lib_name}.Implementation is
       with Pre => not Reparse or else not Has_Rewriting_Handle (Context);
    --  Implementation for Analysis.Get_From_File
 
+   type Internal_Unit_Array is array (Positive range <>) of Internal_Unit;
+
+   function Get_From_Files
+     (Context   : Internal_Context;
+      Filenames : GNAT.Strings.String_List;
+      Charset   : String;
+      Reparse   : Boolean;
+      Rule      : Grammar_Rule;
+      Jobs      : Natural) return Internal_Unit_Array
+      with Pre => not Reparse or else not Has_Rewriting_Handle (Context);
+   --  Implementation for Analysis.Get_From_Files
+
    function Get_From_Buffer
      (Context  : Internal_Context;
       Filename : String;
@@ -1201,6 +1280,10 @@ private package ${ada_lib_name}.Implementation is
      (Context : Internal_Context; Discard : Boolean);
    --  Implementation for Analysis.Discard_Errors_In_Populate_Lexical_Env
 
+   procedure Use_Memory_Mapped_Files
+     (Context : Internal_Context; Enabled : Boolean);
+   --  Implementation for Analysis.Use_Memory_Mapped_Files
+
    procedure Set_Logic_Resolution_Timeout
      (Context : Internal_Context; Timeout : Natural);
    --  Implementation for Analysis.Set_Logic_Resolution_Timeout
@@ -1227,9 +1310,6 @@ private package ${ada_lib_name}.Implementation is
    function Context (Unit : Internal_Unit) return Internal_Context;
    --  Implementation for Analysis.Context
 
-   function Hash (Unit : Internal_Unit) return Hash_Type;
-   --  Implementation for Analysis.Hash
-
    procedure Reparse (Unit : Internal_Unit; Charset : String);
    --  Implementation for Analysis.Reparse
 
@@ -1237,6 +1317,13 @@ private package ${ada_lib_name}.Implementation is
      (Unit : Internal_Unit; Charset : String; Buffer  : String);
    --  Implementation for Analysis.Reparse
 
+   procedure Reparse
+     (Unit       : Internal_Unit;
+      Edit_Range : Source_Location_Range;
+      Text       : Text_Type);
+   --  Implementation for Analysis.Reparse. This relexes the whole edited
+   --  buffer: only trivia-only edits avoid parsing and keep the tree.
+
    procedure Populate_Lexical_Env (Unit : Internal_Unit);
    --  Implementation for Analysis.Populate_Lexical_Env
 
@@ -1301,9 +1388,17 @@ private package ${ada_lib_name}.Implementation is
    --  Invalidate memoization caches. If Invalidate_Envs is true, also
    --  invalidate referenced envs caches.
 
+   procedure Invalidate_Unit_Caches
+     (Context         : Internal_Context;
+      Unit            : Internal_Unit;
+      Invalidate_Envs : Boolean);
+   --  Like Invalidate_Caches, but invalidate only the memoization entries
+   --  that depend on Unit. If Unit is No_Analysis_Unit, invalidate the ones
+   --  that depend on lexical environments that belong to no unit.
+
    procedure Reset_Caches (Unit : Internal_Unit);
-   --  Destroy Unit's memoization cache. This resets Unit's version number to
-   --  Unit.Context.Cache_Version.
+   --  Remove stale entries from Unit's memoization cache. This resets Unit's
+   --  version number to Unit.Context.Cache_Version.
 
    procedure Reference_Unit (From, Referenced : Internal_Unit);
    --  Set the Referenced unit as being referenced from the From unit. This is
@@ -1320,6 +1415,15 @@ private package ${ada_lib_name}.Implementation is
    --  Parse text for Unit using Input and store the result in Result. This
    --  leaves Unit unchanged.
 
+   procedure Do_Parsing
+     (Unit   : Internal_Unit;
+      Input  : Internal_Lexer_Input;
+      Result : out Reparsed_Unit;
+      Parser : in out Parser_Type);
+   --  Likewise, but use Parser instead of the context's parser. Unless they
+   --  use the same parser, it is safe to run this concurrently for different
+   --  units of the same context.
+
    procedure Update_After_Reparse
      (Unit : Internal_Unit; Reparsed : in out Reparsed_Unit);
    --  Update Unit's AST from Reparsed and update stale lexical environment
@@ -1334,6 +1438,15 @@ private package ${ada_lib_name}.Implementation is
    --  foreign units that correspond to these exiled entries. Clear
    --  Unit.Exiled_Entries afterwards.
 
+   % if ctx.has_memoization:
+   procedure Invalidate_Changed_Envs
+     (Context                  : Internal_Context;
+      Old_Entries, New_Entries : Exiled_Entry_Vectors.Vector);
+   --  Given the exiled entries of a unit before and after it was reparsed,
+   --  invalidate memoization entries that depend on the units that own the
+   --  lexical environments whose set of keys changed.
+   % endif
+
    procedure Extract_Foreign_Nodes
      (Unit          : Internal_Unit;
       Foreign_Nodes : in out ${T.root_node.name}_Vectors.Vector);
@@ -11,11 +11,13 @@
    with_trivia_actions = token_actions('WithTrivia')
 %>
 
+with Ada.Characters.Handling;
 with Ada.Unchecked_Conversion;
 
 with System;
 
 with GNAT.Byte_Order_Mark;
+with GNAT.Strings;
 
 with GNATCOLL.Iconv;
 with GNATCOLL.Mmap;    use GNATCOLL.Mmap;
@@ -52,6 +54,16 @@ package body ${ada_lib_name}.Lexer_Implementation is
    --  Invalid_Input if Buffer contains invalid byte sequences according to
    --  Charset.
 
+   type Single_Byte_Charset is
+     (Other_Charset, ASCII_Charset, Latin_1_Charset);
+   --  Single-byte charsets that Decode_Buffer can decode without iconv.
+   --  Other_Charset stands for all other charsets.
+
+   function Get_Single_Byte_Charset
+     (Charset : String) return Single_Byte_Charset;
+   --  Return the single-byte charset that Charset designates, or
+   --  Other_Charset if it designates another charset.
+
    procedure Extract_Tokens_From_Text_Buffer
      (Decoded_Buffer : Text_Access;
       Source_First   : Positive;
@@ -71,13 +83,30 @@ package body ${ada_lib_name}.Lexer_Implementation is
       Diagnostics     : in out Diagnostics_Vectors.Vector);
    --  Helper for the Extract_Token procedure
 
+   function Create_Compact_Buffer
+     (Buffer, Charset : String;
+      Read_BOM        : Boolean) return GNAT.Strings.String_Access;
+   --  If Buffer can be lexed without decoding (i.e. if Charset designates a
+   --  single-byte charset and if Buffer does not start with a UTF byte order
+   --  mark), return a copy of the source text it contains, which uses one
+   --  byte per character. Return null otherwise. It is up to the caller to
+   --  deallocate the result when done with it.
+   --
+   --  Raise Invalid_Input if Buffer contains bytes that are invalid according
+   --  to Charset.
+
+   procedure Lex_Source_Buffer
+     (Tab_Stop    : Positive;
+      With_Trivia : Boolean;
+      TDH         : in out Token_Data_Handler;
+      Diagnostics : in out Diagnostics_Vectors.Vector);
+   --  Lex the source buffer that was just associated to TDH (see
+   --  Token_Data_Handlers.Reset) and store the resulting tokens in TDH.
+
    generic
       With_Trivia : Boolean;
    procedure Process_All_Tokens
-     (Input       : Text_Access;
-      Input_First : Positive;
-      Input_Last  : Natural;
-      Tab_Stop    : Positive;
+     (Tab_Stop    : Positive;
       TDH         : in out Token_Data_Handler;
       Diagnostics : in out Diagnostics_Vectors.Vector);
 
@@ -92,10 +121,7 @@ package body ${ada_lib_name}.Lexer_Implementation is
    ------------------------
 
    procedure Process_All_Tokens
-     (Input       : Text_Access;
-      Input_First : Positive;
-      Input_Last  : Natural;
-      Tab_Stop    : Positive;
+     (Tab_Stop    : Positive;
       TDH         : in out Token_Data_Handler;
       Diagnostics : in out Diagnostics_Vectors.Vector)
    is
@@ -113,8 +139,8 @@ package body ${ada_lib_name}.Lexer_Implementation is
       Next_Sloc : Source_Location;
       --  Source location after scanning the current token
 
-      Last_Token_Last : Natural := Input'First - 1;
-      --  Index in TDH.Source_Buffer for the last character of the previous
+      Last_Token_Last : Natural := TDH.Source_First - 1;
+      --  Index in TDH's source buffer for the last character of the previous
       --  token. Used to process chunks of ignored text.
 
       ## Variables specific to indentation tracking
@@ -150,8 +176,8 @@ package body ${ada_lib_name}.Lexer_Implementation is
       --  accordingly.
 
       function Source_First return Positive is (Token.Text_First);
-      --  Index in TDH.Source_Buffer for the first character corresponding to
-      --  the current token.
+      --  Index in TDH's source buffer for the first character corresponding
+      --  to the current token.
 
       function Source_Last return Natural is (Token.Text_Last);
       --  Likewise, for the last character
@@ -160,9 +186,21 @@ package body ${ada_lib_name}.Lexer_Implementation is
         (Make_Range (Current_Sloc, Next_Sloc));
       --  Create a sloc range value corresponding to Token
 
+      function Source_Char (Index : Positive) return Character_Type
+      is (if TDH.Source_Buffer = null
+          then Character_Type'Val (Character'Pos (TDH.Compact_Buffer (Index)))
+          else TDH.Source_Buffer (Index))
+      with Inline;
+      --  Return the character at Index in TDH's source buffer, whether it is
+      --  compact or not.
+
       function Sloc_After
-        (Base_Sloc : Source_Location; Text : Text_Type) return Source_Location;
-      --  Return Base_Sloc updated as if Text was appended
+        (Base_Sloc : Source_Location;
+         First     : Positive;
+         Last      : Natural) return Source_Location;
+      --  Return Base_Sloc updated as if the First .. Last slice of TDH's
+      --  source buffer was appended. Also register in TDH the start of the
+      --  lines this slice contains.
 
       ------------------
       -- Append_Token --
@@ -208,18 +246,22 @@ package body ${ada_lib_name}.Lexer_Implementation is
       ----------------
 
       function Sloc_After
-        (Base_Sloc : Source_Location; Text : Text_Type) return Source_Location
-      is
+        (Base_Sloc : Source_Location;
+         First     : Positive;
+         Last      : Natural) return Source_Location is
       begin
          return Result : Source_Location := Base_Sloc do
             --  TODO: use the Unicode algorithm to account for grapheme
             --  clusters.
-            for T of Text loop
-               case T is
+            for I in First .. Last loop
+               case Source_Char (I) is
                   when Chars.LF =>
                      Result := (Result.Line + 1, 1);
+                     Add_Line_Start (TDH, I + 1);
 
                   when Chars.HT =>
+                     Add_Tab (TDH, I);
+
                      --  Make horizontal tabulations move by stride of 8
                      --  columns, as usually implemented in code editors.
                      declare
@@ -241,7 +283,13 @@ package body ${ada_lib_name}.Lexer_Implementation is
       State : Lexer_State;
 
    begin
-      Initialize (State, Input, Input_First, Input_Last);
+      if TDH.Source_Buffer = null then
+         Initialize
+           (State, TDH.Compact_Buffer, TDH.Source_First, TDH.Source_Last);
+      else
+         Initialize
+           (State, TDH.Source_Buffer, TDH.Source_First, TDH.Source_Last);
+      end if;
       Token := Last_Token (State);
 
       --  The first entry in the Tokens_To_Trivias map is for leading trivias
@@ -260,21 +308,13 @@ package body ${ada_lib_name}.Lexer_Implementation is
 
          --  Initialize the first sloc for the token to come. For this, process
          --  the text that was ignored since the last token.
-         declare
-            Ignored_Text : Text_Type renames
-               TDH.Source_Buffer (Last_Token_Last + 1 .. Source_First - 1);
-         begin
-            Current_Sloc := Sloc_After (Current_Sloc, Ignored_Text);
-            Last_Token_Last := Source_Last;
-         end;
+         Current_Sloc :=
+           Sloc_After (Current_Sloc, Last_Token_Last + 1, Source_First - 1);
+         Last_Token_Last := Source_Last;
 
          --  Then update Next_Sloc according to Token's text
          if Token_Id /= ${termination} then
-            declare
-               Text : Text_Type renames Input (Source_First .. Source_Last);
-            begin
-               Next_Sloc := Sloc_After (Current_Sloc, Text);
-            end;
+            Next_Sloc := Sloc_After (Current_Sloc, Source_First, Source_Last);
          end if;
 
          case Token_Id is
@@ -285,8 +325,9 @@ package body ${ada_lib_name}.Lexer_Implementation is
             when ${' | '.join(with_symbol_actions)} =>
                if TDH.Symbols /= No_Symbol_Table then
                   declare
-                     Bounded_Text : Text_Type renames
-                        Input (Token.Text_First .. Token.Text_Last);
+                     Bounded_Text : constant Text_Type :=
+                        Token_Data_Handlers.Text
+                          (TDH, Token.Text_First, Token.Text_Last);
 
                      Symbol_Res : constant Symbolization_Result :=
                         % if ctx.symbol_canonicalizer:
@@ -310,8 +351,7 @@ package body ${ada_lib_name}.Lexer_Implementation is
                Append_Trivia ((Kind         => From_Token_Kind (Token_Id),
                                Source_First => Source_First,
                                Source_Last  => Source_Last,
-                               Symbol       => null,
-                               Sloc_Range   => Sloc_Range));
+                               Symbol       => null));
 
                if Token_Id = ${lexer.LexingFailure.ada_name} then
                   Append (Diagnostics, Sloc_Range, "Invalid token, ignored");
@@ -331,8 +371,7 @@ package body ${ada_lib_name}.Lexer_Implementation is
            ((Kind         => From_Token_Kind (Token_Id),
              Source_First => Source_First,
              Source_Last  => Source_Last,
-             Symbol       => Symbol,
-             Sloc_Range   => Sloc_Range));
+             Symbol       => Symbol));
 
          ##  This whole section is only emitted if the user chose to track
          ##  indentation in the lexer. It has complex machinery to emit
@@ -347,8 +386,7 @@ package body ${ada_lib_name}.Lexer_Implementation is
                  ((Kind         => From_Token_Kind (${lexer.Dedent.ada_name}),
                    Source_First => TDH.Source_Last + 1,
                    Source_Last  => TDH.Source_Last,
-                   Symbol       => null,
-                   Sloc_Range   => Sloc_Range));
+                   Symbol       => null));
                Columns_Stack_Len := Columns_Stack_Len - 1;
             end loop;
          end if;
@@ -381,12 +419,9 @@ package body ${ada_lib_name}.Lexer_Implementation is
             declare
                T : Stored_Token_Data :=
                  (Kind         => <>,
-                  Source_First => Source_First + 1,
-                  Source_Last  => Source_First,
-                  Symbol       => null,
-                  Sloc_Range   =>
-                    (Sloc_Range.Start_Line, Sloc_Range.Start_Line,
-                     Sloc_Range.Start_Column, Sloc_Range.Start_Column));
+                  Source_First => Source_First,
+                  Source_Last  => Source_First - 1,
+                  Symbol       => null);
             begin
                if Sloc_Range.Start_Column < Get_Col then
                   --  Emit every necessary dedent token if the line is
@@ -426,8 +461,7 @@ package body ${ada_lib_name}.Lexer_Implementation is
               ((Kind         => From_Token_Kind (Token_Id),
                 Source_First => Source_First,
                 Source_Last  => Source_Last,
-                Symbol       => Symbol,
-                Sloc_Range   => Sloc_Range));
+                Symbol       => Symbol));
          end if;
          % endif
 
@@ -442,6 +476,23 @@ package body ${ada_lib_name}.Lexer_Implementation is
    procedure Process_All_Tokens_With_Trivia is new Process_All_Tokens (True);
    procedure Process_All_Tokens_No_Trivia is new Process_All_Tokens (False);
 
+   -----------------------
+   -- Lex_Source_Buffer --
+   -----------------------
+
+   procedure Lex_Source_Buffer
+     (Tab_Stop    : Positive;
+      With_Trivia : Boolean;
+      TDH         : in out Token_Data_Handler;
+      Diagnostics : in out Diagnostics_Vectors.Vector) is
+   begin
+      if With_Trivia then
+         Process_All_Tokens_With_Trivia (Tab_Stop, TDH, Diagnostics);
+      else
+         Process_All_Tokens_No_Trivia (Tab_Stop, TDH, Diagnostics);
+      end if;
+   end Lex_Source_Buffer;
+
    ----------------------------
    -- Lex_From_Buffer_Helper --
    ----------------------------
@@ -459,17 +510,16 @@ package body ${ada_lib_name}.Lexer_Implementation is
       --  In the case we are reparsing an analysis unit, we want to get rid of
       --  the tokens from the old one.
 
-      Reset (TDH, Decoded_Buffer, Source_First, Source_Last);
+      Reset (TDH, Decoded_Buffer, Source_First, Source_Last, Tab_Stop);
+      Lex_Source_Buffer (Tab_Stop, With_Trivia, TDH, Diagnostics);
 
-      if With_Trivia then
-         Process_All_Tokens_With_Trivia
-           (Decoded_Buffer, Source_First, Source_Last, Tab_Stop, TDH,
-            Diagnostics);
-      else
-         Process_All_Tokens_No_Trivia
-           (Decoded_Buffer, Source_First, Source_Last, Tab_Stop, TDH,
-            Diagnostics);
-      end if;
+      % if ctx.compact_source_buffers:
+      --  Lexing is over, so wide characters are not needed anymore until
+      --  some text is requested: reduce the memory footprint of the source
+      --  buffer if possible.
+
+      Compact (TDH);
+      % endif
    end Extract_Tokens_From_Text_Buffer;
 
    --------------------------------------
@@ -509,32 +559,59 @@ package body ${ada_lib_name}.Lexer_Implementation is
       case Input.Kind is
          when File =>
             declare
-               use GNATCOLL.VFS;
-
-               --  The following call to Open_Read may fail with a Name_Error
-               --  exception: just let it propagate to the caller as there is
-               --  no resource to release yet here.
-
-               File : Mapped_File := Open_Read (+Input.Filename.Full_Name.all);
-
-               Region      : Mapped_Region := Read (File);
-               Buffer_Addr : constant System.Address :=
-                  Data (Region).all'Address;
-
-               Buffer : String (1 .. Last (Region))
-                  with Import  => True,
-                       Address => Buffer_Addr;
+               Compact_Buffer : GNAT.Strings.String_Access;
             begin
-               Extract_Tokens_From_Bytes_Buffer
-                 (Buffer, To_String (Input.Charset), Input.Read_BOM, Tab_Stop,
-                  With_Trivia, TDH, Diagnostics);
-               Free (Region);
-               Close (File);
-            exception
-               when Unknown_Charset | Invalid_Input =>
+               declare
+                  use GNATCOLL.VFS;
+
+                  --  The following call to Open_Read may fail with a
+                  --  Name_Error exception: just let it propagate to the caller
+                  --  as there is no resource to release yet here.
+
+                  File : Mapped_File :=
+                     Open_Read (+Input.Filename.Full_Name.all);
+
+                  Region      : Mapped_Region := Read (File);
+                  Buffer_Addr : constant System.Address :=
+                     Data (Region).all'Address;
+
+                  Buffer : String (1 .. Last (Region))
+                     with Import  => True,
+                          Address => Buffer_Addr;
+               begin
+                  --  If requested, lex a compact copy of the mapped bytes
+                  --  instead of decoding them, when possible.
+
+                  if Input.Memory_Mapped then
+                     Compact_Buffer := Create_Compact_Buffer
+                       (Buffer, To_String (Input.Charset), Input.Read_BOM);
+                  end if;
+
+                  if Compact_Buffer = null then
+                     Extract_Tokens_From_Bytes_Buffer
+                       (Buffer, To_String (Input.Charset), Input.Read_BOM,
+                        Tab_Stop, With_Trivia, TDH, Diagnostics);
+                  end if;
                   Free (Region);
                   Close (File);
-                  raise;
+               exception
+                  when Unknown_Charset | Invalid_Input =>
+                     Free (Region);
+                     Close (File);
+                     raise;
+               end;
+
+               --  The file mapping is released at this point, so lexing the
+               --  compact copy does not keep the file open.
+
+               if Compact_Buffer /= null then
+                  Reset (TDH,
+                         Compact_Buffer,
+                         Compact_Buffer'First,
+                         Compact_Buffer'Last,
+                         Tab_Stop);
+                  Lex_Source_Buffer (Tab_Stop, With_Trivia, TDH, Diagnostics);
+               end if;
             end;
             TDH.Filename := Input.Filename;
             TDH.Charset := Input.Charset;
@@ -556,7 +633,7 @@ package body ${ada_lib_name}.Lexer_Implementation is
                Decoded_Buffer : Text_Access := new Text_Type
                  (1 .. Input.Text_Count);
                Source_First  : constant Positive := Decoded_Buffer'First;
-               Source_Last   : constant Positive := Decoded_Buffer'Last;
+               Source_Last   : constant Natural := Decoded_Buffer'Last;
 
                Text_View : Text_Type (1 .. Input.Text_Count)
                   with Import, Address => Input.Text;
@@ -571,6 +648,72 @@ package body ${ada_lib_name}.Lexer_Implementation is
       end case;
    end Extract_Tokens;
 
+   ---------------------------
+   -- Create_Compact_Buffer --
+   ---------------------------
+
+   function Create_Compact_Buffer
+     (Buffer, Charset : String;
+      Read_BOM        : Boolean) return GNAT.Strings.String_Access
+   is
+      use GNAT.Byte_Order_Mark;
+
+      Single_Byte : constant Single_Byte_Charset :=
+         Get_Single_Byte_Charset (Charset);
+      BOM         : BOM_Kind := Unknown;
+      Len         : Natural := 0;
+   begin
+      if Single_Byte = Other_Charset then
+         return null;
+      end if;
+
+      --  A UTF byte order mark overrides the requested charset: let
+      --  Decode_Buffer handle it.
+
+      if Read_BOM then
+         GNAT.Byte_Order_Mark.Read_BOM (Buffer, Len, BOM);
+         if BOM in UTF8_All .. UTF32_BE then
+            return null;
+         end if;
+      end if;
+
+      declare
+         Source : String renames Buffer (Buffer'First + Len .. Buffer'Last);
+      begin
+         if Single_Byte = ASCII_Charset then
+            for C of Source loop
+               if Character'Pos (C) > 127 then
+                  raise Invalid_Input;
+               end if;
+            end loop;
+         end if;
+
+         return Result : constant GNAT.Strings.String_Access :=
+           new String (1 .. Source'Length)
+         do
+            Result.all := Source;
+         end return;
+      end;
+   end Create_Compact_Buffer;
+
+   -----------------------------
+   -- Get_Single_Byte_Charset --
+   -----------------------------
+
+   function Get_Single_Byte_Charset
+     (Charset : String) return Single_Byte_Charset
+   is
+      Name : constant String := Ada.Characters.Handling.To_Lower (Charset);
+   begin
+      if Name in "ascii" | "us-ascii" then
+         return ASCII_Charset;
+      elsif Name in "iso-8859-1" | "iso8859-1" | "latin1" | "latin-1" then
+         return Latin_1_Charset;
+      else
+         return Other_Charset;
+      end if;
+   end Get_Single_Byte_Charset;
+
    -------------------
    -- Decode_Buffer --
    -------------------
@@ -627,6 +770,33 @@ package body ${ada_lib_name}.Lexer_Implementation is
          return;
       end if;
 
+      --  Single-byte charsets are the common case: decode them directly, to
+      --  avoid the overhead of iconv.
+
+      if BOM not in UTF8_All .. UTF32_BE then
+         declare
+            Single_Byte : constant Single_Byte_Charset :=
+               Get_Single_Byte_Charset (Charset);
+         begin
+            if Single_Byte /= Other_Charset then
+               Source_Last := Source_First - 1;
+               for C of Buffer (Input_Index .. Buffer'Last) loop
+                  if Single_Byte = ASCII_Charset
+                     and then Character'Pos (C) > 127
+                  then
+                     Free (Result);
+                     raise Invalid_Input;
+                  end if;
+
+                  Source_Last := Source_Last + 1;
+                  Result (Source_Last) :=
+                     Character_Type'Val (Character'Pos (C));
+               end loop;
+               return;
+            end if;
+         end;
+      end if;
+
       --  Create the Iconv converter. We will notice unknown charsets here
 
       declare
@@ -715,8 +885,7 @@ package body ${ada_lib_name}.Lexer_Implementation is
    begin
       if T.Symbol = null then
          declare
-            Text   : Text_Type renames
-               TDH.Source_Buffer (T.Source_First ..  T.Source_Last);
+            Text   : constant Text_Type := Token_Data_Handlers.Text (TDH, T);
             Symbol : constant Symbolization_Result :=
                % if ctx.symbol_canonicalizer:
                   ${ctx.symbol_canonicalizer.fqn} (Text)
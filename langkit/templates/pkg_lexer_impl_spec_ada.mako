@@ -21,6 +21,10 @@ private package ${ada_lib_name}.Lexer_Implementation is
          case Kind is
             when File =>
                Filename : GNATCOLL.VFS.Virtual_File;
+
+               Memory_Mapped : Boolean := False;
+               --  Whether to lex a compact copy of the memory-mapped file
+               --  when its charset allows it, instead of decoding it.
             when Bytes_Buffer =>
                Bytes       : System.Address;
                Bytes_Count : Natural;
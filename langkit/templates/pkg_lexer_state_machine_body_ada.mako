@@ -35,6 +35,7 @@ package body ${ada_lib_name}.Lexer_State_Machine is
       Input_Last  : Natural) is
    begin
       Self.Input := Input;
+      Self.Compact_Input := null;
       Self.Input_First := Input_First;
       Self.Input_Last := Input_Last;
       Self.Has_Next := True;
@@ -44,6 +45,16 @@ package body ${ada_lib_name}.Lexer_State_Machine is
       Self.Last_Token_Kind := ${termination};
    end Initialize;
 
+   procedure Initialize
+     (Self        : out Lexer_State;
+      Input       : GNAT.Strings.String_Access;
+      Input_First : Positive;
+      Input_Last  : Natural) is
+   begin
+      Initialize (Self, Text_Access'(null), Input_First, Input_Last);
+      Self.Compact_Input := Input;
+   end Initialize;
+
    ----------------
    -- Last_Token --
    ----------------
@@ -91,15 +102,32 @@ package body ${ada_lib_name}.Lexer_State_Machine is
 
 ${emitter.dfa_code.ada_table_decls('   ')}
 
-   ----------------
-   -- Next_Token --
-   ----------------
-
-   procedure Next_Token
+   function Get_Wide_Char
+     (Self : Lexer_State; Index : Positive) return Character_Type
+   is (Self.Input (Index))
+      with Inline;
+   function Get_Compact_Char
+     (Self : Lexer_State; Index : Positive) return Character_Type
+   is (Character_Type'Val (Character'Pos (Self.Compact_Input (Index))))
+      with Inline;
+   --  Return the input character at Index in Self
+
+   generic
+      with function Get_Char
+        (Self : Lexer_State; Index : Positive) return Character_Type;
+   procedure Generic_Next_Token
+     (Self : in out Lexer_State; Token : out Lexed_Token);
+   --  Implementation for Next_Token. Get_Char is used to read Self's input,
+   --  so that the state machine can work on both input representations
+   --  without extra overhead.
+
+   ------------------------
+   -- Generic_Next_Token --
+   ------------------------
+
+   procedure Generic_Next_Token
      (Self : in out Lexer_State; Token : out Lexed_Token)
    is
-      Input : constant Text_Access := Self.Input;
-
       First_Index : Positive;
       --  Index of the first input character for the token to return
 
@@ -168,7 +196,7 @@ ${emitter.dfa_code.ada_table_decls('   ')}
          ## stop if there is no transition for that character.
          % if state.has_transitions:
          declare
-            Input_Char : constant Character_Type := Input (Index);
+            Input_Char : constant Character_Type := Get_Char (Self, Index);
          begin
             Index := Index + 1;
 
@@ -234,6 +262,23 @@ ${emitter.dfa_code.ada_table_decls('   ')}
       if not Is_Trivia (Token.Kind) then
          Self.Last_Token_Kind := Token.Kind;
       end if;
+   end Generic_Next_Token;
+
+   procedure Wide_Next_Token is new Generic_Next_Token (Get_Wide_Char);
+   procedure Compact_Next_Token is new Generic_Next_Token (Get_Compact_Char);
+
+   ----------------
+   -- Next_Token --
+   ----------------
+
+   procedure Next_Token
+     (Self : in out Lexer_State; Token : out Lexed_Token) is
+   begin
+      if Self.Input = null then
+         Compact_Next_Token (Self, Token);
+      else
+         Wide_Next_Token (Self, Token);
+      end if;
    end Next_Token;
 
 end ${ada_lib_name}.Lexer_State_Machine;
@@ -5,6 +5,8 @@
    termination = lexer.Termination.ada_name
 %>
 
+with GNAT.Strings;
+
 with ${ada_lib_name}.Common; use ${ada_lib_name}.Common;
 
 private package ${ada_lib_name}.Lexer_State_Machine is
@@ -31,6 +33,13 @@ private package ${ada_lib_name}.Lexer_State_Machine is
    --  to Input to be used for each call to Next_Token, so the caller must keep
    --  it point to allocated memory.
 
+   procedure Initialize
+     (Self        : out Lexer_State;
+      Input       : GNAT.Strings.String_Access;
+      Input_First : Positive;
+      Input_Last  : Natural);
+   --  Likewise, for an input that contains Latin-1 encoded characters
+
    function Last_Token (Self : Lexer_State) return Lexed_Token;
    --  Return the last token that Self scanned. This is the termination token
    --  with the Input'First - 1 .. Input'Last index range when Next_Token
@@ -48,10 +57,13 @@ private package ${ada_lib_name}.Lexer_State_Machine is
 private
 
    type Lexer_State is limited record
-      Input       : Text_Access;
-      Input_First : Positive;
-      Input_Last  : Natural;
-      --  Input buffer and buffer bounds for the content to scan
+      Input         : Text_Access;
+      Compact_Input : GNAT.Strings.String_Access;
+      Input_First   : Positive;
+      Input_Last    : Natural;
+      --  Input buffer and buffer bounds for the content to scan. Only one of
+      --  Input and Compact_Input is not null, depending on the Initialize
+      --  procedure that was called.
 
       Has_Next   : Boolean;
       Last_Token : Lexed_Token;
@@ -107,7 +107,8 @@ library project ${lib_name} is
 
    for Library_Dir use
       "../${lib_name.lower()}/" & Library_Kind_Param & "/" & Build_Mode;
-   for Object_Dir use "../../obj/${lib_name.lower()}/" & Build_Mode;
+   for Object_Dir use
+      "../../obj/${lib_name.lower()}/" & Build_Mode & "/" & Library_Kind_Param;
 
    Target := ${lib_name}'Target;
 
@@ -326,6 +326,9 @@ exception
 
    when others =>
       if Self /= null then
+         % if memoized:
+            Cancel_Memoized_Value (Self.Unit, Mmz_Handle);
+         % endif
          Exit_Call (Self.Unit.Context, Call_Depth);
       end if;
       raise;
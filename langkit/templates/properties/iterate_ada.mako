@@ -0,0 +1,95 @@
+## vim: filetype=makoada
+
+## Render the loop that binds the iteration variables of "it" (a Map.Expr or
+## a Quantifier.Expr) to each item of its collection and then runs the
+## statements that "body" returns.
+##
+## If the collection is itself a map expression that can be fused (see
+## Map.Expr.fused_collection), do not materialize its result array: run the
+## loop body directly for each item it produces.
+
+<%namespace name="scopes" file="scopes_ada.mako" />
+
+<%
+   codegen_element_var = it.element_vars[-1][0]
+   user_element_var = it.element_vars[0][0]
+   producer = it.fused_collection
+%>
+
+<%def name="loop_body()">
+   ## Initialize all element variables
+   % for elt_var, init_expr in reversed(it.element_vars):
+      % if init_expr:
+         ${init_expr.render_pre()}
+         ${assign_var(elt_var, init_expr.render_expr())}
+      % endif
+   % endfor
+
+   ${scopes.start_scope(it.iter_scope)}
+
+   ## Bind user iteration variables
+   % if user_element_var.source_name:
+      ${gdb_bind_var(user_element_var)}
+   % endif
+   % if it.index_var:
+      ${gdb_bind_var(it.index_var)}
+   % endif
+
+   ${body()}
+
+   % if it.index_var:
+      ${it.index_var.name} := ${it.index_var.name} + 1;
+   % endif
+   ${scopes.finalize_scope(it.iter_scope)}
+</%def>
+
+<%def name="fused_loop_body(item)">
+   declare
+      ${codegen_element_var.name} : constant
+         ${codegen_element_var.type.name} := ${item};
+   begin
+      ${loop_body()}
+   end;
+</%def>
+
+% if it.index_var:
+   ${it.index_var.name} := 0;
+% endif
+
+% if producer:
+   ${producer.render_items(
+        label, lambda item: capture(fused_loop_body, item)
+   )}
+
+% else:
+   ${it.collection.render_pre()}
+   <%
+      coll_expr = it.collection.render_expr()
+      coll_type = it.collection.type
+   %>
+
+   ## Empty lists are null: handle this pecularity here to make it easier for
+   ## property writers.
+   % if coll_type.is_list_type:
+   if ${coll_expr} /= null then
+   % endif
+
+   declare
+      Collection : constant ${coll_type.name} := ${coll_expr};
+   begin
+      ${label} :
+      for ${codegen_element_var.name} of
+         % if coll_type.is_list_type:
+            Collection.Nodes (1 .. Children_Count (Collection))
+         % else:
+            Collection.Items
+         % endif
+      loop
+         ${loop_body()}
+      end loop ${label};
+   end;
+
+   % if coll_type.is_list_type:
+   end if;
+   % endif
+% endif
@@ -2,6 +2,15 @@
 
 <%def name="base_decl()">
 
+_lazy_arrays = False
+
+
+def use_lazy_arrays(enabled=True):
+    ${py_doc('langkit.python.use_lazy_arrays', 4)}
+    global _lazy_arrays
+    _lazy_arrays = bool(enabled)
+
+
 class _BaseArray(object):
     """
     Base class for Ada arrays bindings.
@@ -17,7 +26,26 @@ class _BaseArray(object):
     Whether items for this arrays are ref-counted.
     """
 
-    __slots__ = ('c_value', 'length', 'items')
+    primitive_items = False
+    """
+    Whether items for this arrays are integers, booleans or enumerations, i.e.
+    whether they can be exposed through the buffer protocol.
+    """
+
+    entity_items = False
+    """
+    Whether items for this arrays are entities.
+    """
+
+    eager_items = False
+    """
+    Whether items for this arrays must be wrapped eagerly, even when lazy
+    arrays are enabled. This is the case for items that reference nodes
+    (other than entities): wrapping them after the corresponding units are
+    reparsed would access deallocated nodes.
+    """
+
+    __slots__ = ('c_value', 'length', 'items', 'units')
 
     def __init__(self, c_value):
         self.c_value = c_value
@@ -28,6 +56,14 @@ class _BaseArray(object):
         items = self.c_element_type.from_address(items_addr)
         self.items = ctypes.pointer(items)
 
+        self.units = None
+        """
+        For lazy arrays of entities, list of units that own the nodes in this
+        array, and their version at the time this array was created.
+
+        :type: None|list[(AnalysisUnit, int)]
+        """
+
     def __repr__(self):
         return '<{} {}>'.format(type(self).__name__, list(self))
 
@@ -35,31 +71,110 @@ class _BaseArray(object):
         self.c_value = None
         self.length = None
         self.items = None
+        self.units = None
 
     def __del__(self):
         self.dec_ref(self.c_value)
         self.clear()
 
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._get_item(i)
+                    for i in range(*key.indices(self.length))]
+
+        if not isinstance(key, int):
+            _raise_type_error('int', key)
+        index = key + self.length if key < 0 else key
+        if not 0 <= index < self.length:
+            raise IndexError('array index out of range')
+        return self._get_item(index)
+
+    def __iter__(self):
+        for i in range(self.length):
+            yield self._get_item(i)
+
+    def __buffer__(self, flags):
+        return self.as_memoryview()
+
+    def _record_units(self):
+        """
+        Record the units that own the nodes in this array, so that accessing
+        items after one of these units is reparsed raises a
+        StaleReferenceError instead of wrapping deallocated nodes. The unit
+        wrappers also keep the owning context alive.
+        """
+        units = {}
+        for i in range(self.length):
+            item = self.items[i]
+            if item.node:
+                c_unit = _node_unit(ctypes.byref(item))
+                if c_unit not in units:
+                    unit = AnalysisUnit._wrap(c_unit)
+                    units[c_unit] = (unit, unit._unit_version)
+        self.units = list(units.values())
+
+    def _check_stale_reference(self):
+        if self.units:
+            for unit, version in self.units:
+                if unit._unit_version != version:
+                    raise StaleReferenceError()
+
+    def _get_item(self, index):
+        self._check_stale_reference()
+
+        # In ctypes, accessing an array element does not copy it, which means
+        # the the array must live at least as long as the accessed element. We
+        # cannot guarantee that, so we must copy the element so that it is
+        # independent of the array it comes from.
+        #
+        # The try/except block tries to do a copy if "item" is indeed a buffer
+        # to be copied, and will fail if it's a mere integer, which does not
+        # need the buffer copy anyway, hence the "pass".
+        item = self.items[index]
+        try:
+            item = self.c_element_type.from_buffer_copy(item)
+        except TypeError:
+            pass
+        return self.wrap_item(item)
+
+    def as_memoryview(self):
+        ${py_doc('langkit.python.LazyArray.as_memoryview', 8)}
+        if not self.primitive_items:
+            raise TypeError('{} items cannot be exposed as a buffer'.format(
+                type(self).__name__
+            ))
+
+        items = (self.c_element_type * self.length).from_address(
+            _field_address(self.c_value.contents, 'items')
+        )
+
+        # The memoryview keeps a reference to "items", which must in turn keep
+        # this array alive, as it owns the memory it references.
+        items._array = self
+
+        return (memoryview(items).cast('B')
+                .cast(self.c_element_type._type_)
+                .toreadonly())
+
     @classmethod
     def wrap(cls, c_value, from_field_access):
         helper = cls(c_value)
 
-        result = []
-        for i in range(helper.length):
-            # In ctypes, accessing an array element does not copy it, which
-            # means the the array must live at least as long as the accessed
-            # element. We cannot guarantee that, so we must copy the element so
-            # that it is independent of the array it comes from.
-            #
-            # The try/except block tries to do a copy if "item" is indeed a
-            # buffer to be copied, and will fail if it's a mere integer, which
-            # does not need the buffer copy anyway, hence the "pass".
-            item = helper.items[i]
-            try:
-                item = cls.c_element_type.from_buffer_copy(item)
-            except TypeError:
-                pass
-            result.append(helper.wrap_item(item))
+        # In lazy mode, the array wrapper is the result: it converts items
+        # only on demand. It needs to own a reference to the array, so create
+        # one if this array value comes from a structure field (the structure
+        # owns the current reference).
+        if _lazy_arrays and not cls.eager_items:
+            if from_field_access:
+                cls.inc_ref(c_value)
+            if cls.entity_items:
+                helper._record_units()
+            return helper
+
+        result = list(helper)
 
         # If this array value comes from a structure field, we must not call
         # its dec_ref primitive, as it is up to the structure's dec_ref
@@ -71,6 +186,10 @@ class _BaseArray(object):
 
     @classmethod
     def unwrap(cls, value, context=None):
+        # Accept lazy arrays wherever lists are accepted
+        if isinstance(value, _BaseArray):
+            value = list(value)
+
         if not isinstance(value, list):
             _raise_type_error('list', value)
 
@@ -113,6 +232,12 @@ class ${cls.py_converter}(_BaseArray):
 
     __slots__ = _BaseArray.__slots__
     items_refcounted = ${cls.element_type.is_refcounted}
+    primitive_items = ${(element_type.is_int_type
+                         or element_type.is_bool_type
+                         or element_type.is_enum_type)}
+    entity_items = ${element_type.is_entity_type}
+    eager_items = ${(not element_type.is_entity_type
+                     and pyapi.references_nodes(element_type))}
 
     @staticmethod
     def wrap_item(item):
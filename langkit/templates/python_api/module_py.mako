@@ -95,30 +95,28 @@ def _import_func(name, argtypes, restype, exc_wrap=True):
     func.argtypes = argtypes
     func.restype = restype
 
-    def check_argcount(args, kwargs):
-        argcount = len(args) + len(kwargs)
-        if argcount != len(argtypes):
-            raise TypeError(
-                '{} takes {} positional arguments but {} was given'
-                .format(name, len(argtypes), argcount))
-
     # Wrapper for "func" that raises a NativeException in case of internal
     # error.
-
+    #
+    # These wrappers are on the path of all calls to the C API, so make them
+    # as cheap as possible. First, build them with exactly one parameter per C
+    # function argument: this way, the interpreter itself rejects calls with
+    # an incorrect number of arguments, so there is no need to count them at
+    # each call. Second, checking for errors just reads the exported
+    # "last_exception" variable, which does not require a second native call.
+    params = ', '.join('arg_{}'.format(i) for i in range(len(argtypes)))
     if exc_wrap:
-        def wrapper(*args, **kwargs):
-            check_argcount(args, kwargs)
-            result = func(*args, **kwargs)
-            exc = _get_last_exception()
-            if exc:
-                raise exc.contents._wrap()
-            return result
+        body = ('    result = func({params})\n'
+                '    if _last_exception:\n'
+                '        raise _last_exception.contents._wrap()\n'
+                '    return result\n')
     else:
-        def wrapper(*args, **kwargs):
-            check_argcount(args, kwargs)
-            return func(*args, **kwargs)
-
-    return wrapper
+        body = '    return func({params})\n'
+    namespace = {'func': func, '_last_exception': _last_exception}
+    exec('def {name}({params}):\n{body}'.format(
+        name=name, params=params, body=body.format(params=params)
+    ), namespace)
+    return namespace[name]
 
 
 class _Exception(ctypes.Structure):
@@ -136,6 +134,16 @@ class _Exception(ctypes.Structure):
         return _exception_kind_to_type[self.kind](info)
 
 
+_last_exception = ctypes.POINTER(_Exception).in_dll(
+    _c_lib, '${capi.get_name("last_exception")}'
+)
+"""
+Exception information for the last error that happened in the C API, or a
+null pointer if the last call succeeded. This reflects the value of the C
+variable, so reading it does not involve any native call.
+"""
+
+
 def _type_fullname(t):
     """
     Return the fully qualified name for the given `t` type.
@@ -215,6 +223,13 @@ class _text(ctypes.Structure):
 
     encoding = 'utf-32le' if sys.byteorder == 'little' else 'utf-32be'
 
+    compact_threshold = 1024
+    """
+    Minimum number of characters for texts to be transferred in a compact
+    encoding (see ``_text_to_bytes``) rather than in UTF-32. For smaller
+    texts, the additional native calls cost more than the bigger copy.
+    """
+
     # Instances can hold buffers that they own. In this case, the buffer must
     # be deallocated when the instance is destroyed. Thus instances will hold
     # a "text_buffer" attribute that will be automatically destroyed.
@@ -224,24 +239,45 @@ class _text(ctypes.Structure):
     def _unwrap(cls, value):
         value = cls.cast(value)
 
+        # The C API never modifies text arguments, so there is no need to copy
+        # the encoded string: just reference the bytes object's own buffer,
+        # and keep the bytes object alive as long as this text.
         text = value.encode(cls.encoding)
-        text_buffer = ctypes.create_string_buffer(text)
         text_buffer_ptr = ctypes.cast(
-            ctypes.pointer(text_buffer),
-            ctypes.POINTER(ctypes.c_char)
+            ctypes.c_char_p(text), ctypes.POINTER(ctypes.c_char)
         )
         result = _text(text_buffer_ptr, len(value))
-        result.text_buffer = text_buffer
+        result.text_buffer = text
         return result
 
     def _wrap(self):
-        if self.length > 0:
+        length = self.length
+        if length == 0:
+            return u''
+
+        elif length < self.compact_threshold:
             # self.length tells how much UTF-32 chars there are in self.chars
             # but self.chars is a char* so we have to fetch 4 times more bytes
-            # than characters.
-            return self.chars[:4 * self.length].decode(self.encoding)
+            # than characters. Use ctypes.string_at to copy them in one go:
+            # slicing self.chars would copy them one at a time.
+            return ctypes.string_at(self.chars, 4 * length).decode(
+                self.encoding
+            )
+
         else:
-            return u''
+            # Big texts are usually mostly ASCII: let the library encode them
+            # to Latin-1 (or UTF-8 if needed), which divides the amount of
+            # data to copy by up to four.
+            buffer = ctypes.c_void_p()
+            size = ctypes.c_size_t()
+            is_latin_1 = _text_to_bytes(
+                ctypes.byref(self), ctypes.byref(buffer), ctypes.byref(size)
+            )
+            try:
+                data = ctypes.string_at(buffer.value, size.value)
+            finally:
+                _free(buffer)
+            return data.decode('latin-1' if is_latin_1 else 'utf-8')
 
     @classmethod
     def cast(cls, value):
@@ -257,7 +293,9 @@ class _text(ctypes.Structure):
             return value
 
     def __del__(self):
-        _destroy_text(ctypes.byref(self))
+        # Only texts that own their buffer need to go through the C API
+        if self.is_allocated:
+            _destroy_text(ctypes.byref(self))
 
 
 class _symbol_type(ctypes.Structure):
@@ -275,6 +313,18 @@ class _symbol_type(ctypes.Structure):
 
     @classmethod
     def unwrap(cls, py_value, context):
+        # Symbols are interned in their analysis context, so the C value for a
+        # given string is the same for the whole context lifetime: look for it
+        # in the context wrapper's cache first.
+        py_value = _text.cast(py_value)
+        context_wrapper = AnalysisContext._context_cache.get(context)
+        cache = (context_wrapper._symbol_cache
+                 if context_wrapper is not None else {})
+        try:
+            return cache[py_value]
+        except KeyError:
+            pass
+
         # First turn the given symbol into a low-level text object
         text = _text._unwrap(py_value)
 
@@ -283,6 +333,7 @@ class _symbol_type(ctypes.Structure):
         if not _context_symbol(context, ctypes.byref(text),
                                ctypes.byref(result)):
             raise InvalidSymbolError(py_value)
+        cache[py_value] = result
         return result
 
 
@@ -427,7 +478,7 @@ class AnalysisContext(object):
     ${py_doc('langkit.analysis_context_type', 4)}
 
     __slots__ = ('_c_value', '_unit_provider', '_serial_number', '_unit_cache',
-                 '__weakref__')
+                 '_symbol_cache', '__weakref__')
 
     _context_cache = weakref.WeakValueDictionary()
     """
@@ -479,6 +530,14 @@ class AnalysisContext(object):
         :type: dict[str, AnalysisUnit]
         """
 
+        self._symbol_cache = {}
+        """
+        Cache for symbol C values, indexed by symbol text. Symbols stay valid
+        as long as the context is alive.
+
+        :type: dict[str, _symbol_type]
+        """
+
         self._check_unit_cache()
 
     def __del__(self):
@@ -501,6 +560,20 @@ class AnalysisContext(object):
                                                GrammarRule._unwrap(rule))
         return AnalysisUnit._wrap(c_value)
 
+    def get_from_files(self, filenames, charset=None, reparse=False,
+                       rule=default_grammar_rule, jobs=0):
+        ${py_doc('langkit.get_units_from_files', 8)}
+        filenames = [_py2to3.text_to_bytes(f) for f in filenames]
+        charset = _py2to3.text_to_bytes(charset or '')
+        count = len(filenames)
+        c_filenames = (ctypes.c_char_p * count)(*filenames)
+        c_units = (AnalysisUnit._c_type * count)()
+        _get_analysis_units_from_files(self._c_value, c_filenames, count,
+                                       charset, reparse,
+                                       GrammarRule._unwrap(rule), jobs,
+                                       c_units)
+        return [AnalysisUnit._wrap(u) for u in c_units]
+
     def get_from_buffer(self, filename, buffer, charset=None, reparse=False,
                         rule=default_grammar_rule):
         ${py_doc('langkit.get_unit_from_buffer', 8)}
@@ -534,6 +607,10 @@ class AnalysisContext(object):
         ${py_doc('langkit.context_discard_errors_in_populate_lexical_env', 8)}
         _discard_errors_in_populate_lexical_env(self._c_value, bool(discard))
 
+    def use_memory_mapped_files(self, enabled=True):
+        ${py_doc('langkit.context_use_memory_mapped_files', 8)}
+        _use_memory_mapped_files(self._c_value, bool(enabled))
+
     class _c_struct(ctypes.Structure):
         _fields_ = [('serial_number', ctypes.c_uint64)]
     _c_type = _hashable_c_pointer(_c_struct)
@@ -552,6 +629,7 @@ class AnalysisContext(object):
         serial_number = self._c_value.contents.serial_number
         if self._serial_number != serial_number:
             self._unit_cache = {}
+            self._symbol_cache = {}
             self._serial_number = serial_number
 
 
@@ -635,6 +713,13 @@ class AnalysisUnit(object):
             _unit_reparse_from_buffer(self._c_value, charset, buffer,
                                       len(buffer))
 
+    def reparse_edit(self, edit_range, text):
+        ${py_doc('langkit.unit_reparse_edit', 8)}
+        c_edit_range = SlocRange._c_type._unwrap(edit_range)
+        c_text = _text._unwrap(text)
+        _unit_reparse_edit(self._c_value, ctypes.byref(c_edit_range),
+                           ctypes.byref(c_text))
+
     def populate_lexical_env(self):
         ${py_doc('langkit.unit_populate_lexical_env', 8)}
         if not _unit_populate_lexical_env(self._c_value):
@@ -676,6 +761,12 @@ class AnalysisUnit(object):
         ${py_doc('langkit.unit_trivia_count', 8)}
         return _unit_trivia_count(self._c_value)
 
+    def token_table(self):
+        ${py_doc('langkit.python.AnalysisUnit.token_table', 8)}
+        c_table = _token_table()
+        _unit_export_tokens(self._c_value, ctypes.byref(c_table))
+        return TokenTable(self, c_table)
+
     def lookup_token(self, sloc):
         ${py_doc('langkit.unit_lookup_token', 8)}
         unit = AnalysisUnit._unwrap(self)
@@ -846,6 +937,11 @@ class SlocRange(object):
         def _wrap(self):
             return SlocRange(self.start._wrap(), self.end._wrap())
 
+        @classmethod
+        def _unwrap(cls, sloc_range):
+            return cls(Sloc._c_type._unwrap(sloc_range.start),
+                       Sloc._c_type._unwrap(sloc_range.end))
+
 
 class Diagnostic(object):
     ${py_doc('langkit.diagnostic_type', 4)}
@@ -1062,7 +1158,8 @@ class ${root_astnode_name}(object):
 
     ${astnode_types.subclass_decls(T.root_node)}
 
-    def __init__(self, c_value, node_c_value, metadata, rebindings):
+    def __init__(self, c_value, node_c_value, metadata, rebindings,
+                 unit=None):
         """
         This constructor is an implementation detail, and is not meant to be
         used directly. For now, the creation of AST nodes can happen only as
@@ -1087,7 +1184,8 @@ class ${root_astnode_name}(object):
 
         # Information to check before accessing node data that it is still
         # valid.
-        self._unit = self._fetch_unit(c_value)
+        self._unit = (unit if unit is not None
+                      else self._fetch_unit(c_value))
         self._unit_version = self._unit._unit_version
 
     def _check_stale_reference(self):
@@ -1218,6 +1316,13 @@ class ${root_astnode_name}(object):
             for field_name in self._field_names:
                 yield (field_name, getattr(self, '{}'.format(field_name)))
 
+    def export_tree(self):
+        ${py_doc('langkit.python.root_node.export_tree', 8)}
+        node = self._unwrap(self)
+        c_tree = _node_tree()
+        _node_export_tree(ctypes.byref(node), ctypes.byref(c_tree))
+        return NodeTree(self, c_tree)
+
     def dump_str(self):
         ${py_doc('langkit.python.root_node.dump_str', 8)}
         output = _py2to3.StringIO()
@@ -1393,7 +1498,7 @@ class ${root_astnode_name}(object):
         # Pick the right subclass to materialize this node in Python
         kind = _node_kind(ctypes.byref(c_value))
         result = _kind_to_astnode_cls[kind](c_value, node_c_value, metadata,
-                                            rebindings)
+                                            rebindings, unit)
         unit._node_cache[cache_key] = result
         return result
 
@@ -1444,10 +1549,171 @@ class ${root_astnode_name}(object):
         the most common case of field, so using this wrapper reduces generated
         code length.
         """
-        return ${root_astnode_name}._wrap(
-            self._eval_field(${c_entity}(), c_accessor)
+        c_result = self._eval_field(${c_entity}(), c_accessor)
+        node_c_value = c_result.node
+        if not node_c_value:
+            return None
+
+        # Fast path: such fields most often return nodes that belong to the
+        # same unit as this node. Look for an existing wrapper in this unit's
+        # node cache first, which saves the native calls that _wrap needs to
+        # fetch the unit of the result. Node addresses are unique among live
+        # nodes, so a cache hit is necessarily the right node.
+        unit = self._unit
+        unit._check_node_cache()
+        cache_key = (node_c_value, c_result.info.md, c_result.info.rebindings)
+        try:
+            return unit._node_cache[cache_key]
+        except KeyError:
+            return ${root_astnode_name}._wrap(c_result)
+
+
+class _node_tree(ctypes.Structure):
+    """
+    C value for flat trees of nodes. See ``NodeTree``.
+    """
+    _fields_ = [('count', ctypes.c_int),
+                ('nodes', ctypes.c_void_p),
+                ('kinds', ctypes.c_void_p),
+                ('parents', ctypes.c_void_p),
+                ('children_counts', ctypes.c_void_p),
+                ('token_starts', ctypes.c_void_p),
+                ('token_ends', ctypes.c_void_p),
+                ('start_lines', ctypes.c_void_p),
+                ('start_columns', ctypes.c_void_p),
+                ('end_lines', ctypes.c_void_p),
+                ('end_columns', ctypes.c_void_p)]
+
+
+class _ColumnarData(object):
+    """
+    Base class for wrappers of columnar data that the C API allocates in a
+    single memory block: ``NodeTree`` and ``TokenTable``.
+    """
+
+    _columns = []
+    """
+    Name, ctypes element type and memoryview format for each column, in memory
+    order: the last column ends the memory block.
+    """
+
+    def _init_columns(self, c_value, first_field, destroy):
+        """
+        Expose all columns in ``c_value`` as memoryview attributes.
+
+        :param c_value: C value that the C API filled.
+        :param str first_field: Name of the ``c_value`` field for the data
+            that starts the memory block.
+        :param destroy: C API function to free the memory block.
+        """
+        self._count = count = c_value.count
+
+        # Wrap the memory block in a single ctypes array, and free the block
+        # only when this array is garbage collected, i.e. when this wrapper
+        # and all its columns are.
+        base = getattr(c_value, first_field) or 0
+        last_name, last_type, _ = self._columns[-1]
+        size = (
+            (getattr(c_value, last_name) + ctypes.sizeof(last_type) * count
+             - base)
+            if count else 0
+        )
+        self._block = (ctypes.c_char * size).from_address(base)
+        weakref.finalize(self._block, destroy, ctypes.byref(c_value))
+
+        memory = memoryview(self._block).cast('B')
+        for name, c_type, fmt in self._columns:
+            offset = (getattr(c_value, name) or base) - base
+            column = memory[offset:offset + ctypes.sizeof(c_type) * count]
+            setattr(self, name, column.cast(fmt))
+
+    def __len__(self):
+        return self._count
+
+
+class NodeTree(_ColumnarData):
+    ${py_doc('langkit.python.NodeTree', 4)}
+
+    _columns = [('kinds', ctypes.c_int, 'i'),
+                ('parents', ctypes.c_int, 'i'),
+                ('children_counts', ctypes.c_int, 'i'),
+                ('token_starts', ctypes.c_int, 'i'),
+                ('token_ends', ctypes.c_int, 'i'),
+                ('start_lines', ctypes.c_uint32, 'I'),
+                ('start_columns', ctypes.c_uint16, 'H'),
+                ('end_lines', ctypes.c_uint32, 'I'),
+                ('end_columns', ctypes.c_uint16, 'H')]
+    """
+    Name, ctypes element type and memoryview format for each column.
+    """
+
+    def __init__(self, root, c_value):
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly. Use ``${root_astnode_name}.export_tree`` instead.
+        """
+        self._root = root
+
+        # The memory block starts with nodes, followed by all columns
+        self._init_columns(c_value, 'nodes', _destroy_node_tree)
+        self._nodes = (
+            (${root_astnode_name}._node_c_type * self._count)
+            .from_address(ctypes.addressof(self._block))
         )
 
+    def node(self, index):
+        ${py_doc('langkit.python.NodeTree.node', 8)}
+        return ${root_astnode_name}._wrap(${c_entity}(
+            self._nodes[index], self._root._unwrap_einfo
+        ))
+
+    def kind_name(self, index):
+        ${py_doc('langkit.python.NodeTree.kind_name', 8)}
+        return _kind_to_astnode_cls[self.kinds[index]]._kind_name
+
+
+class _token_table(ctypes.Structure):
+    """
+    C value for columnar token streams. See ``TokenTable``.
+    """
+    _fields_ = [('count', ctypes.c_int),
+                ('kinds', ctypes.c_void_p),
+                ('start_offsets', ctypes.c_void_p),
+                ('end_offsets', ctypes.c_void_p),
+                ('start_lines', ctypes.c_void_p),
+                ('end_lines', ctypes.c_void_p),
+                ('start_columns', ctypes.c_void_p),
+                ('end_columns', ctypes.c_void_p),
+                ('is_trivia', ctypes.c_void_p)]
+
+
+class TokenTable(_ColumnarData):
+    ${py_doc('langkit.python.TokenTable', 4)}
+
+    _columns = [('kinds', ctypes.c_int, 'i'),
+                ('start_offsets', ctypes.c_int, 'i'),
+                ('end_offsets', ctypes.c_int, 'i'),
+                ('start_lines', ctypes.c_uint32, 'I'),
+                ('end_lines', ctypes.c_uint32, 'I'),
+                ('start_columns', ctypes.c_uint16, 'H'),
+                ('end_columns', ctypes.c_uint16, 'H'),
+                ('is_trivia', ctypes.c_uint8, 'B')]
+    """
+    Name, ctypes element type and memoryview format for each column.
+    """
+
+    def __init__(self, unit, c_value):
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly. Use ``AnalysisUnit.token_table`` instead.
+        """
+        self._unit = unit
+        self._init_columns(c_value, 'kinds', _destroy_token_table)
+
+    def kind_name(self, index):
+        ${py_doc('langkit.python.TokenTable.kind_name', 8)}
+        return _unwrap_str(_token_kind_name(self.kinds[index]))
+
 
 % for astnode in ctx.astnode_types:
     % if astnode != T.root_node:
@@ -1535,6 +1801,14 @@ _free = _import_func(
     [ctypes.c_void_p], None
 )
 
+_text_to_bytes = _import_func(
+    '${capi.get_name("text_to_bytes")}',
+    [ctypes.POINTER(_text),
+     ctypes.POINTER(ctypes.c_void_p),
+     ctypes.POINTER(ctypes.c_size_t)],
+    ctypes.c_int
+)
+
 _destroy_text = _import_func(
     '${capi.get_name("destroy_text")}', [ctypes.POINTER(_text)], None
 )
@@ -1571,6 +1845,10 @@ _discard_errors_in_populate_lexical_env = _import_func(
    '${capi.get_name("context_discard_errors_in_populate_lexical_env")}',
    [AnalysisContext._c_type, ctypes.c_int], None
 )
+_use_memory_mapped_files = _import_func(
+   '${capi.get_name("context_use_memory_mapped_files")}',
+   [AnalysisContext._c_type, ctypes.c_int], None
+)
 _get_analysis_unit_from_file = _import_func(
     '${capi.get_name("get_analysis_unit_from_file")}',
     [AnalysisContext._c_type,  # context
@@ -1580,6 +1858,18 @@ _get_analysis_unit_from_file = _import_func(
      ctypes.c_int],            # grammar rule
     AnalysisUnit._c_type
 )
+_get_analysis_units_from_files = _import_func(
+    '${capi.get_name("get_analysis_units_from_files")}',
+    [AnalysisContext._c_type,         # context
+     ctypes.POINTER(ctypes.c_char_p),  # filenames
+     ctypes.c_int,                    # count
+     ctypes.c_char_p,                 # charset
+     ctypes.c_int,                    # reparse
+     ctypes.c_int,                    # grammar rule
+     ctypes.c_int,                    # jobs
+     ctypes.POINTER(AnalysisUnit._c_type)],  # units
+    None
+)
 _get_analysis_unit_from_buffer = _import_func(
     '${capi.get_name("get_analysis_unit_from_buffer")}',
     [AnalysisContext._c_type,  # context
@@ -1621,6 +1911,14 @@ _unit_trivia_count = _import_func(
     "${capi.get_name('unit_trivia_count')}",
     [AnalysisUnit._c_type], ctypes.c_int
 )
+_unit_export_tokens = _import_func(
+    "${capi.get_name('unit_export_tokens')}",
+    [AnalysisUnit._c_type, ctypes.POINTER(_token_table)], ctypes.c_int
+)
+_destroy_token_table = _import_func(
+    "${capi.get_name('destroy_token_table')}",
+    [ctypes.POINTER(_token_table)], None
+)
 _unit_lookup_token = _import_func(
     "${capi.get_name('unit_lookup_token')}",
     [AnalysisUnit._c_type,
@@ -1663,6 +1961,13 @@ _unit_reparse_from_buffer = _import_func(
      ctypes.c_size_t],     # buffer_size
     None
 )
+_unit_reparse_edit = _import_func(
+    '${capi.get_name("unit_reparse_edit")}',
+    [AnalysisUnit._c_type,
+     ctypes.POINTER(SlocRange._c_type),
+     ctypes.POINTER(_text)],
+    None
+)
 _unit_populate_lexical_env = _import_func(
     '${capi.get_name("unit_populate_lexical_env")}',
     [AnalysisUnit._c_type], ctypes.c_int
@@ -1712,6 +2017,14 @@ _node_child = _import_func(
     [ctypes.POINTER(${c_entity}), ctypes.c_uint, ctypes.POINTER(${c_entity})],
     ctypes.c_int
 )
+_node_export_tree = _import_func(
+    '${capi.get_name("node_export_tree")}',
+    [ctypes.POINTER(${c_entity}), ctypes.POINTER(_node_tree)], ctypes.c_int
+)
+_destroy_node_tree = _import_func(
+    '${capi.get_name("destroy_node_tree")}',
+    [ctypes.POINTER(_node_tree)], None
+)
 
 % for astnode in ctx.astnode_types:
     % for field in astnode.fields_with_accessors():
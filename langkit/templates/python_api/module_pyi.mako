@@ -63,6 +63,14 @@ class AnalysisContext(object):
                       rule: str = default_grammar_rule) -> AnalysisUnit:
         ${py_doc('langkit.get_unit_from_file', 8, or_pass=True)}
 
+    def get_from_files(self,
+                       filenames: List[AnyStr],
+                       charset: Opt[str] = None,
+                       reparse: bool = False,
+                       rule: str = default_grammar_rule,
+                       jobs: int = 0) -> List[AnalysisUnit]:
+        ${py_doc('langkit.get_units_from_files', 8, or_pass=True)}
+
     def get_from_buffer(self,
                         filename: AnyStr,
                         buffer: AnyStr,
@@ -85,6 +93,9 @@ class AnalysisContext(object):
         ${py_doc('langkit.context_discard_errors_in_populate_lexical_env', 8,
                  or_pass=True)}
 
+    def use_memory_mapped_files(self, enabled: bool = True) -> None:
+        ${py_doc('langkit.context_use_memory_mapped_files', 8, or_pass=True)}
+
 class AnalysisUnit(object):
     ${py_doc('langkit.analysis_unit_type', 4)}
 
@@ -110,6 +121,9 @@ class AnalysisUnit(object):
                 charset: Opt[str] = None) -> None:
         ${py_doc('langkit.unit_reparse_generic', 8, or_pass=True)}
 
+    def reparse_edit(self, edit_range: SlocRange, text: str) -> None:
+        ${py_doc('langkit.unit_reparse_edit', 8, or_pass=True)}
+
     def populate_lexical_env(self) -> None:
         ${py_doc('langkit.unit_populate_lexical_env', 8, or_pass=True)}
 
@@ -137,6 +151,9 @@ class AnalysisUnit(object):
     def trivia_count(self) -> int:
         ${py_doc('langkit.unit_trivia_count', 8, or_pass=True)}
 
+    def token_table(self) -> TokenTable:
+        ${py_doc('langkit.python.AnalysisUnit.token_table', 8, or_pass=True)}
+
     def lookup_token(self, sloc: Sloc) -> Token:
         ${py_doc('langkit.unit_lookup_token', 8, or_pass=True)}
 
@@ -330,6 +347,9 @@ class ${root_astnode_name}(object):
     def iter_fields(self) -> Iterator[Tuple[str, ${root_astnode_name}]]:
         ${py_doc('langkit.python.root_node.iter_fields', 8, or_pass=True)}
 
+    def export_tree(self) -> NodeTree:
+        ${py_doc('langkit.python.root_node.export_tree', 8, or_pass=True)}
+
     def dump_str(self) -> str:
         ${py_doc('langkit.python.root_node.dump_str', 8, or_pass=True)}
 
@@ -407,6 +427,52 @@ ${struct_types.mypy_decl(struct_type)}
 ${exts.include_extension(ctx.ext('mypy_python'))}
 
 
+class NodeTree(object):
+    ${py_doc('langkit.python.NodeTree', 4)}
+
+    kinds: memoryview
+    parents: memoryview
+    children_counts: memoryview
+    token_starts: memoryview
+    token_ends: memoryview
+    start_lines: memoryview
+    start_columns: memoryview
+    end_lines: memoryview
+    end_columns: memoryview
+
+    def __init__(self, root: ${root_astnode_name}, c_value: Any) -> None: ...
+    def __len__(self) -> int: ...
+
+    def node(self, index: int) -> ${root_astnode_name}:
+        ${py_doc('langkit.python.NodeTree.node', 8, or_pass=True)}
+
+    def kind_name(self, index: int) -> str:
+        ${py_doc('langkit.python.NodeTree.kind_name', 8, or_pass=True)}
+
+
+class TokenTable(object):
+    ${py_doc('langkit.python.TokenTable', 4)}
+
+    kinds: memoryview
+    start_offsets: memoryview
+    end_offsets: memoryview
+    start_lines: memoryview
+    end_lines: memoryview
+    start_columns: memoryview
+    end_columns: memoryview
+    is_trivia: memoryview
+
+    def __init__(self, unit: AnalysisUnit, c_value: Any) -> None: ...
+    def __len__(self) -> int: ...
+
+    def kind_name(self, index: int) -> str:
+        ${py_doc('langkit.python.TokenTable.kind_name', 8, or_pass=True)}
+
+
+def use_lazy_arrays(enabled: bool = True) -> None:
+    ${py_doc('langkit.python.use_lazy_arrays', 4, or_pass=True)}
+
+
 class App(object):
     parser: argparse.ArgumentParser
     args: argparse.Namespace
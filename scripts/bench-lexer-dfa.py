@@ -0,0 +1,111 @@
+#! /usr/bin/env python
+
+"""
+Benchmarks for the construction of lexer state machines.
+
+This measures the time it takes to convert the NFA of a lexer into a DFA
+(subset construction) and to minimize the result, so that changes in
+langkit.lexer.regexp can be compared. By default, this runs on the lexers of
+the Python and Lkt languages in the "contrib" directory. Other lexers can be
+passed as FILE:NAME arguments, for instance::
+
+    bench-lexer-dfa.py contrib/python/language/lexer.py:python_lexer
+"""
+
+import argparse
+import importlib.util
+import os.path
+import time
+import types
+
+
+LANGKIT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_LEXERS = [
+    os.path.join(LANGKIT_ROOT, 'contrib', 'python', 'language', 'lexer.py')
+    + ':python_lexer',
+    os.path.join(LANGKIT_ROOT, 'contrib', 'lkt', 'language', 'lexer.py')
+    + ':lkt_lexer',
+]
+"""
+FILE:NAME specifications for the lexers to use when none is passed on the
+command line.
+"""
+
+
+def load_lexer(spec):
+    """
+    Load the lexer designated by ``spec`` (FILE:NAME): the Lexer instance
+    called NAME in the Python source file FILE.
+    """
+    filename, name = spec.rsplit(':', 1)
+    module_spec = importlib.util.spec_from_file_location(
+        'bench_lexer_{}'.format(name), filename
+    )
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return name, getattr(module, name)
+
+
+def get_action(labels):
+    # Same as in Lexer.build_dfa_code: labels are (priority, action) couples
+    sorted_actions = sorted(labels)
+    return sorted_actions[0][1] if sorted_actions else None
+
+
+def best_time(operation, repeat):
+    """
+    Run ``operation`` ``repeat`` times and return the best duration (in
+    seconds) along with the result of the last run.
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = operation()
+        duration = time.perf_counter() - start
+        if best is None or duration < best:
+            best = duration
+    return best, result
+
+
+def main():
+    args_parser = argparse.ArgumentParser(
+        description='Benchmarks for the construction of lexer state'
+                    ' machines.'
+    )
+    args_parser.add_argument(
+        '--repeat', '-r', type=int, default=5,
+        help='Number of times to run each benchmark. The best run is'
+             ' reported.'
+    )
+    args_parser.add_argument(
+        'lexers', nargs='*', metavar='FILE:NAME',
+        help='Lexers to use, as the name of a Lexer instance in a Python'
+             ' source file. Use the Python and Lkt lexers by default.'
+    )
+    args = args_parser.parse_args()
+
+    for spec in args.lexers or DEFAULT_LEXERS:
+        name, lexer = load_lexer(spec)
+
+        # Lexer.compile_rules only needs the "nfa_start" attribute of the
+        # compile context, to store the resulting NFA.
+        context = types.SimpleNamespace(nfa_start=None)
+        lexer.compile_rules(context)
+        nfa = context.nfa_start
+
+        to_dfa_time, dfa = best_time(nfa.to_dfa, args.repeat)
+        minimize_time, minimal_dfa = best_time(
+            lambda: dfa.minimize(get_action), args.repeat
+        )
+        print('{}: {} DFA states, {} after minimization'.format(
+            name, len(dfa.reachable_states()),
+            len(minimal_dfa.reachable_states())
+        ))
+        print('  to_dfa:   {:8.2f} ms'.format(to_dfa_time * 1000))
+        print('  minimize: {:8.2f} ms'.format(minimize_time * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+#! /usr/bin/env python
+
+"""
+Micro-benchmarks for the Python bindings of a generated library.
+
+This measures the throughput of the most common operations on nodes (field
+accesses, property calls, text and source location retrieval) so that changes
+in the binding layer can be compared. For instance::
+
+    bench-python-bindings.py libfoolang src/*.foo
+"""
+
+import argparse
+import importlib
+import time
+
+
+BENCHMARKS = [
+    ('parent', 'property call that returns a node',
+     lambda node: node.parent),
+    ('children', 'iteration on children',
+     lambda node: list(node)),
+    ('token_start', 'property call that returns a token',
+     lambda node: node.token_start),
+    ('sloc_range', 'source location range retrieval',
+     lambda node: node.sloc_range),
+    ('text', 'text retrieval',
+     lambda node: node.text),
+]
+"""
+Name, description and operation for each benchmark. Each operation is run on
+all nodes of the input units.
+"""
+
+
+def run_benchmark(nodes, operation, repeat):
+    """
+    Run ``operation`` on all ``nodes``, ``repeat`` times, and return the best
+    throughput (in operations per second).
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for node in nodes:
+            operation(node)
+        duration = time.perf_counter() - start
+        if best is None or duration < best:
+            best = duration
+    return len(nodes) / best if best else float('inf')
+
+
+def main():
+    args_parser = argparse.ArgumentParser(
+        description='Micro-benchmarks for the Python bindings of a generated'
+                    ' library.'
+    )
+    args_parser.add_argument(
+        '--repeat', '-r', type=int, default=5,
+        help='Number of times to run each benchmark. The best run is'
+             ' reported.'
+    )
+    args_parser.add_argument(
+        '--only', action='append', default=[],
+        choices=[name for name, _, _ in BENCHMARKS],
+        help='Run only the given benchmark. Can be passed multiple times.'
+    )
+    args_parser.add_argument(
+        'library',
+        help='Name of the Python module for the generated library (for'
+             ' instance: libfoolang).'
+    )
+    args_parser.add_argument(
+        'files', nargs='+',
+        help='Source files to parse and whose nodes to use in benchmarks.'
+    )
+    args = args_parser.parse_args()
+
+    lib = importlib.import_module(args.library)
+    ctx = lib.AnalysisContext()
+
+    units = []
+    for filename in args.files:
+        unit = ctx.get_from_file(filename)
+        for d in unit.diagnostics:
+            print('{}: {}'.format(filename, d))
+        if unit.root is not None:
+            units.append(unit)
+
+    nodes = [node
+             for unit in units
+             for node in unit.root.findall(lambda _: True)]
+    print('Running benchmarks on {} nodes from {} units'
+          .format(len(nodes), len(units)))
+
+    # Run each operation once before measuring, so that measures do not
+    # include the creation of wrappers for all nodes.
+    for name, description, operation in BENCHMARKS:
+        if args.only and name not in args.only:
+            continue
+        for node in nodes:
+            operation(node)
+        throughput = run_benchmark(nodes, operation, args.repeat)
+        print('{:<12} {:>12,.0f} ops/s  ({})'.format(name, throughput,
+                                                     description))
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,8 @@
 from distutils.core import setup
 import os
 
+from langkit import __version__
+
 
 ROOT_DIR = os.path.dirname(__file__)
 
@@ -14,7 +16,7 @@ if ROOT_DIR != '':
 # Run the setup tools
 setup(
     name='Langkit',
-    version='0.1-dev',
+    version=__version__,
     author='AdaCore',
     author_email='report@adacore.com',
     url='https://www.adacore.com',
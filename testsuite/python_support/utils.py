@@ -168,7 +168,8 @@ def build_and_run(grammar=None, py_script=None, ada_main=None, lexer=None,
                   lkt_semantic_checks=False, ocaml_main=None,
                   warning_set=default_warning_set, generate_unparser=False,
                   symbol_canonicalizer=None, mains=False,
-                  show_property_logging=False, unparse_script=unparse_script):
+                  show_property_logging=False, unparse_script=unparse_script,
+                  compact_source_buffers=False):
     """
     Compile and emit code for `ctx` and build the generated library. Then,
     execute the provided scripts/programs, if any.
@@ -210,6 +211,9 @@ def build_and_run(grammar=None, py_script=None, ada_main=None, lexer=None,
         without need for any config file.
 
     :param None|str unparse_script: Script to unparse the language spec.
+
+    :param bool compact_source_buffers: Whether to store source buffers using
+        one byte per character when possible.
     """
     assert not types_from_lkt or lkt_file is not None
 
@@ -260,6 +264,8 @@ def build_and_run(grammar=None, py_script=None, ada_main=None, lexer=None,
             argv.append('--no-pretty-print')
         if generate_unparser:
             argv.append('--generate-unparser')
+        if compact_source_buffers:
+            argv.append('--compact-source-buffers')
 
         # For testsuite performance, do not generate mains unless told
         # otherwise.
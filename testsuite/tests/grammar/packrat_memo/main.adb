@@ -0,0 +1,30 @@
+with Ada.Text_IO; use Ada.Text_IO;
+
+with GNATCOLL.Traces;
+
+with Libfoolang.Analysis; use Libfoolang.Analysis;
+
+procedure Main is
+begin
+   GNATCOLL.Traces.Parse_Config_File;
+   Put_Line ("main.adb: Running...");
+
+   --  Parse the same buffer as main.py. Memo table statistics are logged to
+   --  the LIBFOOLANG.PACKRAT trace when the context (and thus its parser) is
+   --  destroyed, i.e. when leaving this block.
+
+   declare
+      Ctx : constant Analysis_Context := Create_Context;
+      U   : constant Analysis_Unit := Ctx.Get_From_Buffer
+        (Filename => "main.txt",
+         Buffer   => "a = (b + 1);" & ASCII.LF
+                     & "(x + (y + 2)) + 3;" & ASCII.LF);
+   begin
+      if U.Has_Diagnostics then
+         raise Program_Error;
+      end if;
+   end;
+
+   GNATCOLL.Traces.Finalize;
+   Put_Line ("main.adb: Done.");
+end Main;
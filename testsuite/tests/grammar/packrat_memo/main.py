@@ -0,0 +1,16 @@
+import libfoolang
+
+
+print('main.py: Running...')
+
+ctx = libfoolang.AnalysisContext()
+
+# Assignments and expression statements share their prefix, so parsing the
+# latter requires backtracking over whole expressions, possibly further than
+# the size of rings.
+u = ctx.get_from_buffer('main.txt', 'a = (b + 1);\n(x + (y + 2)) + 3;\n')
+for d in u.diagnostics:
+    print(d)
+u.root.dump()
+
+print('main.py: Done.')
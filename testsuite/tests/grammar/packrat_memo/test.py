@@ -0,0 +1,96 @@
+"""
+Test that the various kinds of packrat memoization tables, as requested with
+@memo annotations on grammar rules, correctly memoize parsing results, and
+that their usage statistics (logged to the PACKRAT trace) reflect the
+requested table kinds.
+"""
+
+import re
+
+from langkit.dsl import ASTNode, Field, abstract
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+@abstract
+class Stmt(FooNode):
+    pass
+
+
+class Assign(Stmt):
+    dest = Field()
+    value = Field()
+
+
+class ExprStmt(Stmt):
+    expr = Field()
+
+
+@abstract
+class Expr(FooNode):
+    pass
+
+
+class Plus(Expr):
+    lhs = Field()
+    rhs = Field()
+
+
+class ParenExpr(Expr):
+    expr = Field()
+
+
+class Name(Expr):
+    token_node = True
+
+
+class Number(Expr):
+    token_node = True
+
+
+build_and_run(lkt_file='foo.lkt', py_script='main.py', ada_main='main.adb')
+
+# main.adb enables the PACKRAT trace (see .gnatdebug), which logs memo table
+# statistics to "packrat.log" when the analysis context is destroyed.
+# Statistics for each rule: (size, hits, misses, collisions).
+stats = {}
+with open('packrat.log') as f:
+    for line in f:
+        m = re.search(r'(\w+): size (\d+), hits (\d+), misses (\d+),'
+                      r' collisions (\d+)', line)
+        if m:
+            stats[m.group(1)] = tuple(int(g) for g in m.groups()[1:])
+
+print('Statistics logged for stmt, expr and atom:',
+      all(rule in stats for rule in ('stmt', 'expr', 'atom')))
+
+# Ring tables keep their requested size. The adaptive ring for "stmt" never
+# misses because of a further token (statements are only parsed forward), so
+# it has no reason to grow: statements at different offsets share its only
+# slot and collide.
+size, hits, misses, collisions = stats['stmt']
+print('stmt (adaptive ring): size = 1:', size == 1)
+print('stmt (adaptive ring): misses > 0:', misses > 0)
+print('stmt (adaptive ring): collisions > 0:', collisions > 0)
+
+# Parsing the expression statement first tries the assignment alternative:
+# the second alternative must re-use the "expr" result from the sparse table,
+# which never collides.
+size, hits, misses, collisions = stats['expr']
+print('expr (sparse): size > 0:', size > 0)
+print('expr (sparse): hits > 0:', hits > 0)
+print('expr (sparse): collisions = 0:', collisions == 0)
+
+# "Plus" fails after parsing its "atom" when there is no "+" token: the
+# second alternative gets the "atom" result from the ring. Atoms at offsets
+# with the same parity share the same slot in this 2-slot ring.
+size, hits, misses, collisions = stats['atom']
+print('atom (ring): size = 2:', size == 2)
+print('atom (ring): hits > 0:', hits > 0)
+print('atom (ring): collisions > 0:', collisions > 0)
+
+print('Done')
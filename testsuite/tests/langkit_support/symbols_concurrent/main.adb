@@ -0,0 +1,105 @@
+--  Test that symbol tables return a single symbol for each text when several
+--  tasks concurrently look up and create overlapping sets of symbols.
+
+with Ada.Text_IO; use Ada.Text_IO;
+
+with Langkit_Support.Symbols;
+with Langkit_Support.Text; use Langkit_Support.Text;
+
+procedure Main is
+
+   type Precomputed_Symbol_Index is new Integer range 1 .. 0;
+   function Precomputed_Symbol
+     (Dummy : Precomputed_Symbol_Index) return Text_Type
+   is (raise Program_Error);
+
+   package Symbols is new Langkit_Support.Symbols
+     (Precomputed_Symbol_Index, Precomputed_Symbol);
+   use Symbols;
+
+   Symbol_Count : constant := 5_000;
+   --  Number of distinct symbols to create. This is big enough to make
+   --  shards grow while tasks are looking them up.
+
+   Task_Count : constant := 8;
+
+   subtype Symbol_Index is Positive range 1 .. Symbol_Count;
+   type Symbol_Array is array (Symbol_Index) of Symbol_Type;
+   type Task_Index is range 1 .. Task_Count;
+
+   function Symbol_Text (I : Symbol_Index) return Text_Type
+   is (To_Text ("Sym" & I'Image));
+
+   ST      : Symbol_Table := Create_Symbol_Table;
+   Results : array (Task_Index) of Symbol_Array;
+   --  For each task, symbols it got for each text
+
+   task type Interner is
+      entry Start (Id : Task_Index);
+   end Interner;
+
+   --------------
+   -- Interner --
+   --------------
+
+   task body Interner is
+      Self   : Task_Index;
+      Offset : Natural;
+      I      : Symbol_Index;
+   begin
+      accept Start (Id : Task_Index) do
+         Self := Id;
+      end Start;
+
+      --  Go through all symbols starting at a different offset in each
+      --  task, half of them in reverse order, so that tasks race to create
+      --  the same symbols.
+
+      Offset := (Natural (Self) - 1) * Symbol_Count / Task_Count;
+      for J in Symbol_Index loop
+         I := (J - 1 + Offset) mod Symbol_Count + 1;
+         if Self mod 2 = 0 then
+            I := Symbol_Count + 1 - I;
+         end if;
+         Results (Self) (I) := Find (ST, Symbol_Text (I));
+      end loop;
+   end Interner;
+
+   Errors : Natural := 0;
+
+begin
+   declare
+      Interners : array (Task_Index) of Interner;
+   begin
+      for T in Task_Index loop
+         Interners (T).Start (T);
+      end loop;
+   end;
+
+   --  Now that all tasks have completed, check that all of them got the
+   --  symbol that the table holds for each text.
+
+   for I in Symbol_Index loop
+      declare
+         S : constant Symbol_Type :=
+           Find (ST, Symbol_Text (I), Create => False);
+      begin
+         if S = null or else S.all /= Symbol_Text (I) then
+            Put_Line ("Wrong symbol for " & Image (Symbol_Text (I)));
+            Errors := Errors + 1;
+         end if;
+
+         for T in Task_Index loop
+            if Results (T) (I) /= S then
+               Put_Line ("Task" & T'Image & " got a different symbol for "
+                         & Image (Symbol_Text (I)));
+               Errors := Errors + 1;
+            end if;
+         end loop;
+      end;
+   end loop;
+
+   Destroy (ST);
+   Put_Line ("Errors:" & Errors'Image);
+   Put_Line ("Done");
+end Main;
@@ -39,6 +39,24 @@ for c in ('i', 'j', 'k'):
     check_ranges('Overlappingranges (2)', CharSet(('i', 'o'), (c, 'p')))
 
 check_ranges('Negation', CharSet(('\x00', '\x10'), ('b', 'y')).negation)
+check_ranges('Empty negation', CharSet().negation.negation)
+
+left = CharSet(('a', 'f'), ('m', 'p'), 'x')
+right = CharSet(('d', 'n'), ('x', 'z'))
+check_ranges('Union', left | right)
+check_ranges('Intersection', left & right)
+check_ranges('Difference', left - right)
+check_ranges('Reverted difference', right - left)
+check_ranges('ASCII subset',
+             CharSet(('a', 'c'), ('~', '\u0100')).split_ascii_subsets[0])
+check_ranges('Non-ASCII subset',
+             CharSet(('a', 'c'), ('~', '\u0100')).split_ascii_subsets[1])
+
+print('== Overlaps ==')
+for other in [CharSet(('g', 'l')), CharSet(('g', 'm')), CharSet('x'),
+              CharSet()]:
+    print('{} / {}: {}'.format(left, other, left.overlaps_with(other)))
+print('')
 
 
 print('Done')
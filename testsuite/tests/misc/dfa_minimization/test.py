@@ -0,0 +1,66 @@
+"""
+Test that the minimization of lexer DFAs merges equivalent states while
+preserving the actions associated to states.
+"""
+
+from langkit.lexer.regexp import NFAState, RegexpCollection
+
+
+def get_action(labels):
+    # Labels are (priority, action) couples, just like in Lexer.compile_rules
+    sorted_labels = sorted(labels)
+    return sorted_labels[0][1] if sorted_labels else None
+
+
+def match(dfa, text):
+    """
+    Return the list of actions for all states reached when processing
+    ``text``, or None if the DFA rejects it.
+    """
+    result = []
+    state = dfa
+    for char in text:
+        for chars, next_state in state.transitions:
+            if char in chars:
+                state = next_state
+                break
+        else:
+            return None
+        result.append(get_action(state.labels))
+    return result
+
+
+def check(label, rules, inputs):
+    print('== {} =='.format(label))
+
+    regexps = RegexpCollection()
+    nfa = NFAState()
+    for i, (regexp, action) in enumerate(rules):
+        start, end = regexps.nfa_for(regexp)
+        end.label = (i, action)
+        nfa.add_transition(None, start)
+
+    dfa = nfa.to_dfa()
+    minimal_dfa = dfa.minimize(get_action)
+    print('{} states -> {} states'.format(len(dfa.reachable_states()),
+                                          len(minimal_dfa.reachable_states())))
+
+    for text in inputs:
+        actions = match(dfa, text)
+        assert actions == match(minimal_dfa, text)
+        print('  {!r}: {}'.format(text, actions))
+    print('')
+
+
+check('Redundant alternatives', [('ab|cb', 'T')],
+      ['ab', 'cb', 'bb'])
+check('Common suffixes', [('abc|bbc', 'T'), ('c', 'U')],
+      ['abc', 'bbc', 'c', 'cb'])
+check('Distinct actions', [('ab', 'T'), ('cb', 'U')],
+      ['ab', 'cb', 'ac'])
+check('Priorities', [('if', 'Keyword'), ('[a-z]+', 'Id')],
+      ['if', 'iff', 'id', 'x'])
+check('Loops', [('(ab)*c|(ab)*d', 'T')],
+      ['c', 'abd', 'ababc', 'aba'])
+
+print('Done')
@@ -0,0 +1,88 @@
+"""
+Test that the conversion of lexer NFAs into DFAs (subset construction) splits
+overlapping character classes into disjoint transitions, and that DFA states
+get the labels of all the NFA states they represent.
+"""
+
+from langkit.lexer.char_set import CharSet
+from langkit.lexer.regexp import NFAState, RegexpCollection
+
+
+def char_set_image(chars):
+    return ' '.join(
+        repr(chr(low)) if low == high
+        else '{!r}-{!r}'.format(chr(low), chr(high))
+        for low, high in chars.ranges
+    )
+
+
+def dump(dfa):
+    """
+    Print all states reachable from ``dfa``, with their sorted labels and
+    transitions.
+    """
+    states = dfa.reachable_states()
+    numbers = {state: i for i, state in enumerate(states)}
+    for state in states:
+        print('  State {}: {}'.format(
+            numbers[state], sorted(state.labels) or 'no label'
+        ))
+        for chars, next_state in sorted(
+            state.transitions, key=lambda t: t[0].ranges
+        ):
+            print('    {} -> {}'.format(char_set_image(chars),
+                                        numbers[next_state]))
+
+
+def check_regexps(label, rules):
+    """
+    Build a NFA that matches any of the given regexps, with the given labels,
+    convert it into a DFA and print the result.
+    """
+    print('== {} =='.format(label))
+    regexps = RegexpCollection()
+    nfa = NFAState()
+    for regexp, state_label in rules:
+        start, end = regexps.nfa_for(regexp)
+        end.label = state_label
+        nfa.add_transition(None, start)
+    dump(nfa.to_dfa())
+    print('')
+
+
+# Overlapping ranges in transitions that leave the same NFA state, leading to
+# distinct NFA states.
+print('== Overlapping transitions ==')
+start = NFAState()
+lower = NFAState()
+lower.label = 'lower'
+middle = NFAState()
+middle.label = 'middle'
+digit = NFAState()
+digit.label = 'digit'
+start.add_transition(CharSet(('a', 'm')), lower)
+start.add_transition(CharSet(('h', 'z')), middle)
+start.add_transition(CharSet(('k', 'k'), ('0', '9')), digit)
+dump(start.to_dfa())
+print('')
+
+# Overlapping transitions that lead to the same NFA state must yield a single
+# DFA transition, with merged character ranges.
+print('== Same destination ==')
+start = NFAState()
+end = NFAState()
+end.label = 'end'
+start.add_transition(CharSet(('a', 'f')), end)
+start.add_transition(CharSet(('d', 'k')), end)
+start.add_transition(CharSet(('m', 'm')), end)
+dump(start.to_dfa())
+print('')
+
+check_regexps('Keyword and identifier', [('if', 'Keyword'),
+                                          ('[a-z][a-z0-9]*', 'Id'),
+                                          ('[0-9]+', 'Number')])
+check_regexps('Nested classes', [('[a-z]+', 'Lower'),
+                                 ('[a-fA-F0-9]+', 'Hex'),
+                                 ('[c-e]x', 'Special')])
+
+print('Done')
@@ -0,0 +1,117 @@
+"""
+Test that GDB helpers load debug info from the sidecar file when it is
+up-to-date, and that it yields the same debug info as parsing directives in
+the source file. Also check that they fall back to parsing when the sidecar is
+missing or stale.
+"""
+
+import os
+
+from langkit.gdb.debug_info import (
+    DebugInfo, ExprStart, MemoizationReturnDirective, PropertyCall,
+    sidecar_filename, write_sidecar
+)
+
+
+source = """\
+--# property-start Foo.p foo.py:10
+procedure Foo_P is
+   --# bind self Self
+   --# bind entity_name Entity_Name
+begin
+   if Find_Memoized_Value then
+      --# memoization-lookup
+      if Evaluating then
+         --# memoization-return
+         raise Property_Error;
+      end if;
+      --# end
+   end if;
+   --# property-body-start
+   --# scope-start
+   --# expr-start 2 '<Block>' Let_Result None
+   --# scope-start
+   --# expr-start 1 '<FieldAccess .q(...)>' Fld foo.py:11
+   --# property-call-start '[dispatcher]Foo.q'
+   Fld := Foo_Q (Self);
+   --# end
+   --# expr-done 1
+   --# end
+   --# expr-done 2
+   --# end
+end Foo_P;
+--# end
+
+--# property-start [dispatcher]Foo.q dispatcher
+function Foo_Q return Boolean is
+   --# bind self Self
+begin
+   --# property-body-start
+   return True;
+end Foo_Q;
+--# end
+"""
+
+
+def dump_event(e):
+    result = repr(e)
+    if isinstance(e, MemoizationReturnDirective):
+        result = '<MemoizationReturn, line {}>'.format(e.line_no)
+    elif isinstance(e, PropertyCall):
+        result = '<PropertyCall {}, lines {}>'.format(e.name, e.line_range)
+    elif isinstance(e, ExprStart):
+        result += ' {} {} {} lines {} sub-exprs {}'.format(
+            e.expr_repr, e.result_var, e.dsl_sloc, e.line_range,
+            [s.expr_id for s in e.sub_expr_start]
+        )
+    return result
+
+
+def dump(debug_info):
+    """
+    Return a textual representation of all properties and their events.
+    """
+    result = []
+    for p in debug_info.properties:
+        result.append('{} {} {} dispatcher={} body_start={}'.format(
+            p.name, p.line_range, p.dsl_sloc, p.is_dispatcher, p.body_start
+        ))
+        result.extend('  {}'.format(dump_event(e)) for e in p.iter_events())
+    return result
+
+
+def load(label):
+    print('== {} =='.format(label))
+    result = DebugInfo.parse_from_file(None, filename)
+    print('From sidecar:', result.sidecar is not None)
+    if result.sidecar is not None:
+        print('Pending properties:', sum(
+            1 for p in result.properties if p._pending_directives is not None
+        ))
+    print('Matches source parsing:', dump(result) == expected)
+    print('')
+    return result
+
+
+filename = os.path.abspath('foo-implementation.adb')
+with open(filename, 'w') as f:
+    f.write(source)
+
+expected = dump(DebugInfo.parse_from_iterable(filename, source.split('\n')))
+print('\n'.join(expected))
+print('')
+
+load('Missing sidecar')
+
+print('Sidecar written:', write_sidecar(filename))
+print('Sidecar name:', os.path.basename(sidecar_filename(filename)))
+print('')
+di = load('Up-to-date sidecar')
+print('Property at line 20:', di.lookup_property(20).name)
+print('')
+
+with open(filename, 'a') as f:
+    f.write('--  Some comment\n')
+load('Stale sidecar')
+
+print('Done')
@@ -0,0 +1,105 @@
+"""
+Test that "manage.py generate" runs gnatpp only on the sources it rewrote,
+and that it restores sources whose pretty-printed version is already in
+$BUILD_DIR/obj/gnatpp_cache instead of running gnatpp on them again.
+"""
+
+import os.path
+import stat
+import subprocess
+import sys
+
+from utils import langkit_root
+
+
+create_project_py = os.path.join(langkit_root, 'scripts', 'create-project.py')
+subprocess.check_call([sys.executable, create_project_py, 'Mylang'])
+lang_dir = os.path.abspath('mylang')
+include_dir = os.path.join(lang_dir, 'build', 'include', 'libmylanglang')
+analysis_spec = os.path.join(include_dir, 'libmylanglang-analysis.ads')
+
+# Put on the PATH a fake gnatpp program, which logs the sources it gets and
+# appends a comment to them, so that we know which sources it processed.
+bin_dir = os.path.abspath('bin')
+pp_log = os.path.abspath('gnatpp.log')
+os.mkdir(bin_dir)
+with open(os.path.join(bin_dir, 'gnatpp.py'), 'w') as f:
+    f.write("""
+import os.path
+import sys
+
+with open({!r}, 'a') as log:
+    for arg in sys.argv[1:]:
+        if not arg.startswith('-'):
+            log.write(os.path.basename(arg) + '\\n')
+            with open(arg, 'a') as f:
+                f.write('--  Pretty-printed\\n')
+""".format(pp_log))
+gnatpp = os.path.join(bin_dir, 'gnatpp')
+with open(gnatpp, 'w') as f:
+    f.write('#! /bin/sh\nexec "{}" "{}" "$@"\n'.format(
+        sys.executable, os.path.join(bin_dir, 'gnatpp.py')
+    ))
+os.chmod(gnatpp, os.stat(gnatpp).st_mode | stat.S_IXUSR)
+
+env = dict(os.environ)
+env['PATH'] = os.path.pathsep.join([bin_dir, env['PATH']])
+
+
+def generate(label):
+    """
+    Run "manage.py generate" and print the sources that gnatpp processed.
+    """
+    if os.path.exists(pp_log):
+        os.remove(pp_log)
+    subprocess.check_call(
+        [sys.executable, 'manage.py', '-vnone', 'generate'],
+        cwd=lang_dir, env=env
+    )
+
+    processed = []
+    if os.path.exists(pp_log):
+        with open(pp_log) as f:
+            processed = sorted(f.read().split())
+    print('== {} =='.format(label))
+    print('gnatpp ran:', bool(processed))
+    return processed
+
+
+def is_pretty_printed(filename):
+    with open(filename) as f:
+        return f.read().endswith('--  Pretty-printed\n')
+
+
+# The first run pretty-prints all sources
+first = generate('First run')
+print('Analysis spec processed:', 'libmylanglang-analysis.ads' in first)
+print('Analysis spec pretty-printed:', is_pretty_printed(analysis_spec))
+print('')
+
+# Nothing changed, so generation does not rewrite any source: nothing to
+# pretty-print.
+generate('Unchanged language')
+print('Analysis spec pretty-printed:', is_pretty_printed(analysis_spec))
+print('')
+
+# Generation rewrites the removed source with the same content as in the
+# first run: it must be restored from the cache.
+os.remove(analysis_spec)
+generate('Removed source')
+print('Analysis spec pretty-printed:', is_pretty_printed(analysis_spec))
+print('')
+
+# Changing the documentation of a node changes the analysis spec, which must
+# be pretty-printed again. The other sources are unchanged.
+parser_py = os.path.join(lang_dir, 'language', 'parser.py')
+with open(parser_py) as f:
+    parser_source = f.read()
+with open(parser_py, 'w') as f:
+    f.write(parser_source.replace('Example node.', 'Documented node.'))
+print('Processed:', generate('Changed language'))
+with open(analysis_spec) as f:
+    print('Analysis spec updated:', 'Documented node.' in f.read())
+print('Analysis spec pretty-printed:', is_pretty_printed(analysis_spec))
+
+print('Done')
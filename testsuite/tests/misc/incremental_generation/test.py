@@ -0,0 +1,121 @@
+"""
+Test that "manage.py generate --incremental" renders again the generated
+units affected by a change deep inside a property expression, and only them.
+"""
+
+import os.path
+import subprocess
+import sys
+
+from utils import langkit_root
+
+
+create_project_py = os.path.join(langkit_root, 'scripts', 'create-project.py')
+subprocess.check_call([sys.executable, create_project_py, 'Mylang'])
+lang_dir = os.path.abspath('mylang')
+build_dir = os.path.join(lang_dir, 'build')
+include_dir = os.path.join(build_dir, 'include', 'libmylanglang')
+impl_body = os.path.join(include_dir, 'libmylanglang-implementation.adb')
+analysis_spec = os.path.join(include_dir, 'libmylanglang-analysis.ads')
+
+# Add to the example node a property whose innermost expression is several
+# levels deep.
+parser_py = os.path.join(lang_dir, 'language', 'parser.py')
+with open(parser_py) as f:
+    parser_source = f.read()
+parser_source = parser_source.replace(
+    'from langkit.dsl import ASTNode, abstract',
+    'from langkit.dsl import ASTNode, T, abstract\n'
+    'from langkit.expressions import If, Let, Self, langkit_property'
+).replace(
+    '''    Example node.
+    """
+    pass''',
+    '''    Example node.
+    """
+
+    @langkit_property(public=True, return_type=T.Int)
+    def prop():
+        """
+        Nested computation.
+        """
+        return If(
+            Self.is_null,
+            1,
+            Let(lambda a=2: If(
+                a == 3,
+                4,
+                Let(lambda b=a + 5: If(b == 6, 7, b + 1000))
+            ))
+        )'''
+)
+
+
+def write_parser(source):
+    with open(parser_py, 'w') as f:
+        f.write(source)
+
+
+def snapshot():
+    """
+    Return a mapping from paths to contents for all the sources that the
+    emitter generates for the library and its Python bindings.
+    """
+    result = {}
+    for subdir in ('include', 'python'):
+        for root, _, files in os.walk(os.path.join(build_dir, subdir)):
+            for f in files:
+                path = os.path.join(root, f)
+                with open(path, 'rb') as fp:
+                    result[path] = fp.read()
+    return result
+
+
+def generate(label, show_changes=True):
+    """
+    Run "manage.py generate --incremental" and print the generated sources
+    whose content changed.
+    """
+    before = snapshot()
+    subprocess.check_call(
+        [sys.executable, 'manage.py', '-vnone', 'generate', '--incremental',
+         '--no-pretty-print'],
+        cwd=lang_dir
+    )
+    after = snapshot()
+    print('== {} =='.format(label))
+    if show_changes:
+        print('Changed:', sorted(
+            os.path.basename(p) for p, content in after.items()
+            if before.get(p) != content
+        ))
+
+
+def contains(filename, text):
+    with open(filename) as f:
+        return text in f.read()
+
+
+write_parser(parser_source)
+generate('First run', show_changes=False)
+print('Implementation body has 1000:', contains(impl_body, '1000'))
+print('')
+
+# Nothing changed: no generated source must change. The analysis spec must
+# not even be rewritten.
+analysis_mtime = os.stat(analysis_spec).st_mtime_ns
+generate('Unchanged language')
+print('Analysis spec rewritten:',
+      os.stat(analysis_spec).st_mtime_ns != analysis_mtime)
+print('')
+
+# Change the innermost literal of the property: the implementation body must
+# be rendered again to reflect it, while the analysis spec (which contains
+# only the property declaration) must not be rewritten.
+write_parser(parser_source.replace('b + 1000', 'b + 2000'))
+generate('Changed nested expression')
+print('Implementation body has 2000:', contains(impl_body, '2000'))
+print('Analysis spec rewritten:',
+      os.stat(analysis_spec).st_mtime_ns != analysis_mtime)
+
+print('Done')
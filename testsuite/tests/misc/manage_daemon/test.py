@@ -0,0 +1,124 @@
+"""
+Test the generation daemon of manage.py: requests round-trip through its
+socket, it runs only "generate" commands, it survives misbehaving clients and
+commands it runs do not leak global state to the next ones.
+"""
+
+import json
+import os.path
+import socket
+import stat
+import subprocess
+import sys
+import time
+
+from langkit.diagnostics import DiagnosticStyle, Diagnostics
+from langkit.utils import Log
+
+from utils import langkit_root
+
+
+create_project_py = os.path.join(langkit_root, 'scripts', 'create-project.py')
+subprocess.check_call([sys.executable, create_project_py, 'Mylang'])
+lang_dir = os.path.abspath('mylang')
+socket_path = os.path.join(lang_dir, 'daemon.sock')
+
+
+def request(argv=None, raw=None):
+    """
+    Send a request to the daemon and return its status and output.
+
+    If ``raw`` is not None, send it instead of a well-formed request for
+    ``argv``.
+    """
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with conn:
+        conn.connect(socket_path)
+        if raw is None:
+            raw = json.dumps({'argv': argv, 'cwd': lang_dir}).encode('utf-8')
+        conn.sendall(raw)
+        conn.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    if not chunks:
+        return None
+    response = json.loads(b''.join(chunks).decode('utf-8'))
+    return response['status'], response['output']
+
+
+print('== Round-trip ==')
+daemon_stderr = open('daemon.err', 'w')
+daemon = subprocess.Popen(
+    [sys.executable, 'manage.py', '-vnone', 'serve', '--socket',
+     socket_path],
+    cwd=lang_dir, stderr=daemon_stderr,
+)
+try:
+    for _ in range(600):
+        if os.path.exists(socket_path):
+            break
+        time.sleep(0.1)
+    else:
+        raise RuntimeError('The daemon did not start')
+
+    print('Socket permissions:',
+          oct(stat.S_IMODE(os.stat(socket_path).st_mode)))
+
+    for _ in range(2):
+        status, output = request(['-vnone', 'generate', '--check-only'])
+        print('generate --check-only:', status, repr(output))
+
+    status, output = request(['-vnone', 'build'])
+    print('build:', status, 'cannot run' in output)
+
+    # Misbehaving clients must not bring the daemon down
+    print('Malformed JSON:', request(raw=b'{"argv": '))
+    print('Missing keys:', request(raw=b'{}'))
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.connect(socket_path)
+    conn.close()
+    status, output = request(['-vnone', 'generate', '--check-only'])
+    print('After errors:', status, repr(output))
+
+    # Clients forward only "generate" commands to the daemon
+    p = subprocess.run(
+        [sys.executable, 'manage.py', '--daemon', socket_path, '-vnone',
+         'generate', '--check-only'],
+        cwd=lang_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        encoding='utf-8'
+    )
+    print('Client:', p.returncode, repr(p.stdout))
+
+finally:
+    daemon.terminate()
+    daemon.wait()
+    daemon_stderr.close()
+
+with open('daemon.err') as f:
+    print('Reported errors:', f.read().count('Error while serving a request'))
+
+print('')
+print('== Global state ==')
+
+sys.path.insert(0, lang_dir)
+from manage import Manage  # noqa: E402
+
+m = Manage()
+m.dirs.set_build_dir(os.path.join(lang_dir, 'build'))
+m.serving = True
+excepthook = sys.excepthook
+status, _ = m.serve_request(
+    ['-vnone', '--trace', 'some-trace', '--diagnostic-style', 'gnu-full',
+     '--debug', 'generate', '--check-only'],
+    lang_dir
+)
+print('Status:', status)
+print('Trace enabled:', Log.enabled['some-trace'])
+print('Diagnostic style:', Diagnostics.style)
+print('Exception hook restored:', sys.excepthook is excepthook)
+
+print('Done')
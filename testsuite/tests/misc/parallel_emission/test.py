@@ -0,0 +1,76 @@
+"""
+Test that rendering generated sources in parallel yields the same sources and
+the same diagnostics as rendering them sequentially.
+"""
+
+import os
+import subprocess
+import sys
+
+import langkit
+from langkit.dsl import ASTNode, Field, abstract
+from langkit.expressions import Property, Self
+from langkit.parsers import Grammar, List
+
+from lexer_example import Token, foo_lexer
+from utils import prepare_context
+
+
+def emit(jobs):
+    """
+    Emit a library for a simple language in the "build" directory, rendering
+    sources with ``jobs`` processes.
+    """
+    @abstract
+    class FooNode(ASTNode):
+        pass
+
+    class Number(FooNode):
+        token_node = True
+
+    class Sequence(FooNode):
+        items = Field()
+        count = Property(Self.items.length, public=True)
+        first = Property(Self.items.at(0), public=True)
+
+    grammar = Grammar('main_rule')
+    grammar.add_rules(main_rule=Sequence(List(Number(Token.Number))))
+
+    ctx = prepare_context(grammar, foo_lexer)
+    ctx.emit('build', jobs=jobs, report_unused_documentation_entries=True)
+    langkit.reset()
+
+
+def run(jobs):
+    """
+    Run code generation in a separate process (so that both generations start
+    from the same state) and in a separate directory. Return the diagnostics
+    it printed and the content of all generated Ada sources.
+    """
+    work_dir = 'j{}'.format(jobs)
+    os.mkdir(work_dir)
+    p = subprocess.run([sys.executable, os.path.abspath(__file__), str(jobs)],
+                       cwd=work_dir, stdout=subprocess.PIPE, check=True,
+                       encoding='utf-8')
+
+    src_dir = os.path.join(work_dir, 'build', 'include', 'libfoolang')
+    sources = {}
+    for f in sorted(os.listdir(src_dir)):
+        with open(os.path.join(src_dir, f)) as fp:
+            sources[f] = fp.read()
+
+    return p.stdout, sources
+
+
+if len(sys.argv) > 1:
+    emit(int(sys.argv[1]))
+    sys.exit(0)
+
+seq_diags, seq_sources = run(jobs=1)
+par_diags, par_sources = run(jobs=4)
+
+print('Unused documentation entries reported:',
+      'The following documentation entries were not used' in seq_diags)
+print('Same diagnostics:', seq_diags == par_diags)
+print('Same sources:', seq_sources == par_sources)
+print('Done')
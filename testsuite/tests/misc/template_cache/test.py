@@ -0,0 +1,30 @@
+"""
+Test that the persistent cache for compiled templates works as expected.
+"""
+
+import os
+import os.path
+
+from langkit import template_utils
+
+
+cache_dir = os.path.abspath('mako_cache')
+
+
+def load(label):
+    print('== {} =='.format(label))
+    template_utils.set_template_cache_dir(cache_dir)
+    t = template_utils.mako_template('langkit_support_gpr')
+    module_file = t.module.__file__
+    print('Module file in cache dir:',
+          os.path.dirname(os.path.abspath(module_file)) == cache_dir)
+    print('Cache entries:', len(os.listdir(cache_dir)))
+    print('')
+    return os.path.getmtime(module_file)
+
+
+first_mtime = load('First load')
+second_mtime = load('Second load')
+print('Compiled module reused:', first_mtime == second_mtime)
+
+print('Done')
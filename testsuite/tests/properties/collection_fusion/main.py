@@ -0,0 +1,27 @@
+import sys
+
+import libfoolang
+
+
+print('main.py: Running...')
+
+ctx = libfoolang.AnalysisContext()
+u = ctx.get_from_buffer('main.txt', b'1 2 3 4')
+if u.diagnostics:
+    for d in u.diagnostics:
+        print(d)
+    sys.exit(1)
+
+for prop in ('filter_map', 'filter_index', 'take_while_map', 'mapcat_map',
+             'filter_find', 'map_first', 'map_last', 'filter_length',
+             'filter_any', 'filter_all', 'take_while_contains',
+             'raising_first', 'raising_find', 'raising_any', 'raising_all',
+             'raising_take_while', 'raising_last', 'raising_length'):
+    try:
+        value = getattr(u.root, 'p_' + prop)
+    except libfoolang.PropertyError:
+        print('root.p_{} raised a PropertyError'.format(prop))
+    else:
+        print('root.p_{} = {}'.format(prop, value))
+
+print('main.py: Done.')
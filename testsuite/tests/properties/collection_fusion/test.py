@@ -0,0 +1,84 @@
+"""
+Check that chains of collection operations, which are fused into a single
+loop in the generated code, behave as if intermediate arrays were computed.
+
+Also check that consumers which stop early do not evaluate the remaining items
+of the map expression they consume, and thus do not propagate errors that the
+evaluation of these items would raise.
+"""
+
+from langkit.dsl import ASTNode, Field, T
+from langkit.expressions import If, Property, PropertyError, Self
+
+from utils import build_and_run
+
+
+def raising_map():
+    """
+    Return a map expression that raises a property error when evaluating its
+    third item.
+    """
+    return Self.indexes.map(lambda i: If(i == 2, PropertyError(T.Int), i))
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class ListNode(FooNode):
+    nb_list = Field()
+
+    indexes = Property(Self.nb_list.map(lambda i, _: i))
+
+    filter_map = Property(
+        Self.indexes.filter(lambda i: i > 0).map(lambda i: i + 10),
+        public=True
+    )
+    filter_index = Property(
+        Self.indexes.filter(lambda i: i > 1).map(lambda i, _: i),
+        public=True
+    )
+    take_while_map = Property(
+        Self.indexes.take_while(lambda i: i < 2).map(lambda i: i + 10),
+        public=True
+    )
+    mapcat_map = Property(
+        Self.indexes.mapcat(lambda i: i.singleton).map(lambda i: i + 10),
+        public=True
+    )
+    filter_find = Property(Self.indexes.find(lambda i: i > 1), public=True)
+    map_first = Property(Self.indexes.map(lambda i: i + 10).at(0), public=True)
+    map_last = Property(Self.indexes.map(lambda i: i + 10).at(-1), public=True)
+    filter_length = Property(
+        Self.indexes.filter(lambda i: i > 0).length, public=True
+    )
+    filter_any = Property(
+        Self.indexes.filter(lambda i: i > 1).any(lambda i: i == 3),
+        public=True
+    )
+    filter_all = Property(
+        Self.indexes.filter(lambda i: i > 1).all(lambda i: i > 2),
+        public=True
+    )
+    take_while_contains = Property(
+        Self.indexes.take_while(lambda i: i < 2).contains(3), public=True
+    )
+
+    raising_first = Property(raising_map().at(0), public=True)
+    raising_find = Property(raising_map().find(lambda i: i == 1), public=True)
+    raising_any = Property(raising_map().any(lambda i: i == 1), public=True)
+    raising_all = Property(raising_map().all(lambda i: i > 0), public=True)
+    raising_take_while = Property(
+        raising_map().take_while(lambda i: i < 1), public=True
+    )
+    raising_last = Property(raising_map().at(-1), public=True)
+    raising_length = Property(raising_map().length, public=True)
+
+
+class NumberNode(FooNode):
+    token_node = True
+
+
+build_and_run(lkt_file='expected_concrete_syntax.lkt', py_script='main.py',
+              types_from_lkt=True)
+print('Done')
@@ -0,0 +1,53 @@
+import sys
+
+import libfoolang
+
+
+print('main.py: Running...')
+
+
+def load_unit(filename, content):
+    unit = ctx.get_from_buffer(filename, content)
+    if unit.diagnostics:
+        for d in unit.diagnostics:
+            print(d)
+        sys.exit(1)
+    unit.populate_lexical_env()
+    return unit
+
+
+def reparse(unit, content):
+    print('Reparse {} as {}'.format(unit.filename.split('/')[-1], content))
+    unit.reparse(content)
+    unit.populate_lexical_env()
+
+
+def check():
+    print('  b.txt: {}'.format(
+        [n.p_referenced_size for n in unit_b.root.f_content]
+    ))
+
+
+ctx = libfoolang.AnalysisContext()
+ctx.discard_errors_in_populate_lexical_env(False)
+
+# Both references to "a" in b.txt go through the entity resolver for the "a"
+# alias, which looks up "c": c.txt is reached only through this resolver. The
+# first reference computes the lookup cache entry for "a", the second one
+# uses it.
+unit_a = load_unit('a.txt', b'a = c ()')
+unit_b = load_unit('b.txt', b'b (a a)')
+unit_c = load_unit('c.txt', b'c (x)')
+check()
+
+# Reparsing c without changing its declarations must still invalidate both
+# memoized results.
+reparse(unit_c, b'c (x y)')
+check()
+
+# Likewise when the alias changes
+load_unit('d.txt', b'd ()')
+reparse(unit_a, b'a = d ()')
+check()
+
+print('main.py: Done.')
@@ -0,0 +1,56 @@
+"""
+Check that memoized results depend on the analysis units that entity resolvers
+use during lexical environment lookups, even when the lookup is a cache hit.
+"""
+
+from langkit.dsl import ASTNode, Field, T
+from langkit.envs import EnvSpec, add_env, add_to_env_kv
+from langkit.expressions import If, No, Self, langkit_property
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+
+    @langkit_property()
+    def resolve_alias():
+        return Self.match(
+            lambda b=T.Block: If(
+                b.alias.is_null,
+                b.as_bare_entity.cast(T.FooNode),
+                b.node_env.get_first(b.alias.symbol),
+            ),
+            lambda _: No(T.FooNode.entity),
+        )
+
+
+class Name(FooNode):
+    token_node = True
+
+
+class Ref(FooNode):
+    name = Field(type=Name)
+
+    @langkit_property(public=True, memoized=True)
+    def referenced_size():
+        return Self.node_env.get_first(Self.name.symbol).cast(T.Block).then(
+            lambda b: b.content.length,
+            default_val=-1,
+        )
+
+
+class Block(FooNode):
+    name = Field(type=Name)
+    alias = Field(type=Name)
+    content = Field(type=Ref.list)
+
+    env_spec = EnvSpec(
+        add_env(),
+        add_to_env_kv(key=Self.name.symbol, val=Self,
+                      dest_env=Self.node_env,
+                      resolver=FooNode.resolve_alias),
+    )
+
+
+build_and_run(lkt_file='expected_concrete_syntax.lkt', py_script='main.py')
+print('Done')
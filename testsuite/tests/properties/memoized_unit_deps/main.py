@@ -0,0 +1,54 @@
+import sys
+
+import libfoolang
+
+
+print('main.py: Running...')
+
+
+def load_unit(filename, content):
+    unit = ctx.get_from_buffer(filename, content)
+    if unit.diagnostics:
+        for d in unit.diagnostics:
+            print(d)
+        sys.exit(1)
+    unit.populate_lexical_env()
+    return unit
+
+
+def reparse(unit, content):
+    print('Reparse {} as {}'.format(unit.filename.split('/')[-1], content))
+    unit.reparse(content)
+    unit.populate_lexical_env()
+
+
+def check():
+    for u in units:
+        print('  {}: {}'.format(
+            u.filename.split('/')[-1],
+            [n.p_referenced for n in u.root.f_content]
+        ))
+
+
+ctx = libfoolang.AnalysisContext()
+ctx.discard_errors_in_populate_lexical_env(False)
+units = [load_unit('a.txt', b'a (b x)'),
+         load_unit('b.txt', b'b (a)'),
+         load_unit('c.txt', b'c (c)')]
+unit_a, unit_b, unit_c = units
+check()
+
+# Reparsing c without changing its declarations must not affect references in
+# a and b.
+reparse(unit_c, b'c (a)')
+check()
+
+# Reparsing b creates a new "b" block: references to it must be updated
+reparse(unit_b, b'b (b)')
+check()
+
+# Now c declares "x": the reference in a must see it
+reparse(unit_c, b'x (a)')
+check()
+
+print('main.py: Done.')
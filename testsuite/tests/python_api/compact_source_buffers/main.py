@@ -0,0 +1,37 @@
+import libfoolang
+from libfoolang import _py2to3
+
+
+print('main.py: Running...')
+
+ctx = libfoolang.AnalysisContext()
+
+for buffer, charset in [
+    # Latin-1 sources are compacted: check that tabulations are correctly
+    # handled in source locations.
+    (b'\texample\t# H\xe9llo\n', 'iso-8859-1'),
+    (b'\texample\t# Hello\n', 'ascii'),
+
+    # Other sources keep using wide characters
+    (b'example # \xe2\x82\xac\n', 'utf-8'),
+]:
+    print('== {} ({}) =='.format(_py2to3.bytes_repr(buffer), charset))
+    u = ctx.get_from_buffer('foo.txt', buffer, charset)
+    if u.diagnostics:
+        for d in u.diagnostics:
+            print('  {}'.format(d))
+        continue
+
+    # Compute source locations before anything else requests the source
+    # buffer, then look at texts.
+    print('  root: {}'.format(u.root))
+    print('  lookup_token: {}'.format(
+        u.lookup_token(libfoolang.Sloc(1, 12))
+    ))
+    print('  root text: {}'.format(_py2to3.text_repr(u.root.text)))
+    print('  unit text: {}'.format(_py2to3.text_repr(u.text)))
+    for t in u.iter_tokens():
+        print('  {}'.format(t))
+    print('')
+
+print('main.py: Done.')
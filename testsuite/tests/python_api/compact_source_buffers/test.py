@@ -0,0 +1,21 @@
+"""
+Test that source buffers stored with one byte per character behave as regular
+ones.
+"""
+
+from langkit.dsl import ASTNode
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Example(FooNode):
+    token_node = True
+
+
+build_and_run(lkt_file='expected_concrete_syntax.lkt', py_script='main.py',
+              types_from_lkt=True, compact_source_buffers=True)
+print('Done')
@@ -0,0 +1,39 @@
+import gc
+
+import libfoolang
+
+
+ctx = libfoolang.AnalysisContext()
+unit = ctx.get_from_file('foo.txt')
+tree = unit.root.export_tree()
+print('Exported {} nodes'.format(len(tree)))
+
+# Check that the exported tree matches the regular tree traversal
+nodes = list(unit.root.findall(lambda _: True))
+assert len(nodes) == len(tree)
+assert tree.node(0) == unit.root
+assert tree.parents[0] == -1
+
+for i, node in enumerate(nodes):
+    assert tree.node(i) == node
+    assert tree.kind_name(i) == node.kind_name
+    assert tree.children_counts[i] == len([c for c in node if c is not None])
+    sloc_range = node.sloc_range
+    assert (tree.start_lines[i], tree.start_columns[i],
+            tree.end_lines[i], tree.end_columns[i]) == (
+        sloc_range.start.line, sloc_range.start.column,
+        sloc_range.end.line, sloc_range.end.column
+    )
+    if i > 0:
+        assert tree.node(tree.parents[i]) == node.parent
+        print('{} (parent: {}, children: {}): {}'.format(
+            i, tree.parents[i], tree.children_counts[i], node))
+
+# Columns must outlive the tree they come from
+kinds = tree.kinds
+expected_kinds = list(kinds)
+del tree
+gc.collect()
+assert list(kinds) == expected_kinds
+
+print('Done.')
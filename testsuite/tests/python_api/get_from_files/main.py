@@ -0,0 +1,53 @@
+import os.path
+
+import libfoolang
+
+
+print('main.py: Running...')
+
+
+def write(filename, content):
+    with open(filename, 'w') as f:
+        f.write(content)
+
+
+def summary(u):
+    return '{}: {}'.format(
+        os.path.basename(u.filename),
+        ', '.join(str(d) for d in u.diagnostics) if u.diagnostics else u.root
+    )
+
+
+filenames = []
+for i in range(20):
+    filename = 'foo{}.txt'.format(i)
+    write(filename, 'example' if i % 5 else 'example example')
+    filenames.append(filename)
+
+# Also process a missing file and a duplicate one
+filenames += ['nosuchfile.txt', 'foo1.txt']
+
+for jobs in (1, 4, 0):
+    print('== jobs={} =='.format(jobs))
+    ctx = libfoolang.AnalysisContext()
+    units = ctx.get_from_files(filenames, jobs=jobs)
+    for u in units:
+        print('  {}'.format(summary(u)))
+    print('')
+
+    # Units must be the same as the ones get_from_file returns, and they must
+    # not be parsed again.
+    assert all(u == ctx.get_from_file(f) for u, f in zip(units, filenames))
+
+print('== reparse ==')
+for i in range(20):
+    write('foo{}.txt'.format(i), '# comment\nexample')
+units = ctx.get_from_files(filenames[:3], jobs=2)
+for u in units:
+    print('  {}'.format(summary(u)))
+units = ctx.get_from_files(filenames[:3], reparse=True, jobs=2)
+for u in units:
+    print('  {}'.format(summary(u)))
+print('')
+
+print('main.py: Done.')
@@ -0,0 +1,37 @@
+import libfoolang
+
+
+print('main.py: Running...')
+
+
+def write(filename, content):
+    with open(filename, 'w') as f:
+        f.write(content)
+
+
+def summary(u):
+    return ('; '.join(str(d) for d in u.diagnostics)
+            if u.diagnostics else
+            ' '.join(n.text for n in u.root))
+
+
+filenames = []
+for i in range(200):
+    filename = 'foo{}.txt'.format(i)
+    write(filename, 'a b class c' if i % 10 == 0 else 'a b c d e f g h')
+    filenames.append(filename)
+
+results = {}
+for jobs in (1, 4, 0):
+    ctx = libfoolang.AnalysisContext()
+    units = ctx.get_from_files(filenames, jobs=jobs)
+    results[jobs] = [summary(u) for u in units]
+
+print('Same results:', results[1] == results[4] == results[0])
+print('Units with errors:',
+      sum(1 for s in results[1] if s != 'a b c d e f g h'))
+print('Sample results:')
+for s in results[1][:2]:
+    print('  {}'.format(s))
+
+print('main.py: Done.')
@@ -0,0 +1,31 @@
+"""
+Test that AnalysisContext.get_from_files correctly parses many units at once
+when the grammar contains predicates, which evaluate properties during
+parsing.
+"""
+
+from langkit.dsl import ASTNode
+from langkit.expressions import Not, Self, langkit_property
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Name(FooNode):
+    token_node = True
+
+    @langkit_property()
+    def is_class_id():
+        return Self.symbol == 'class'
+
+    @langkit_property()
+    def is_not_class_id():
+        return Not(Self.is_class_id)
+
+
+build_and_run(lkt_file='expected_concrete_syntax.lkt', py_script='main.py',
+              types_from_lkt=True)
+print('Done')
@@ -0,0 +1,64 @@
+import libfoolang
+
+
+print('main.py: Running...')
+
+ctx = libfoolang.AnalysisContext()
+u = ctx.get_from_buffer('main.txt', b'example null example')
+
+print('Eager arrays:')
+print('  all_items = {}'.format(u.root.p_all_items))
+print('  indexes = {}'.format(u.root.p_indexes))
+
+libfoolang.use_lazy_arrays()
+
+print('Lazy arrays:')
+items = u.root.p_all_items
+print('  len(all_items) = {}'.format(len(items)))
+print('  all_items[0] = {}'.format(items[0]))
+print('  all_items[-1] = {}'.format(items[-1]))
+print('  all_items[1:] = {}'.format(items[1:]))
+print('  list(all_items) = {}'.format(list(items)))
+try:
+    items[3]
+except IndexError as exc:
+    print('  all_items[3] = <IndexError: {}>'.format(exc))
+print('  count(all_items) = {}'.format(u.root.p_count(items)))
+
+indexes = u.root.p_indexes
+print('  indexes = {}'.format(list(indexes)))
+print('  indexes as memoryview = {}'.format(
+    indexes.as_memoryview().tolist()
+))
+
+# The memoryview must keep the array alive
+view = u.root.p_is_example.as_memoryview()
+print('  is_example as memoryview = {}'.format(view.tolist()))
+
+try:
+    items.as_memoryview()
+except TypeError as exc:
+    print('  all_items as memoryview = <TypeError>')
+
+# Lazy arrays of nodes become stale when the units of their nodes are
+# reparsed. Arrays of integers own their items, so they remain valid.
+indexes = u.root.p_indexes
+u.reparse(b'example example')
+try:
+    items[0]
+except libfoolang.StaleReferenceError:
+    print('  all_items[0] after reparse = <StaleReferenceError>')
+try:
+    list(items)
+except libfoolang.StaleReferenceError:
+    print('  list(all_items) after reparse = <StaleReferenceError>')
+print('  indexes after reparse = {}'.format(list(indexes)))
+
+items = u.root.p_all_items
+print('  all_items from the new tree = {}'.format(list(items)))
+
+libfoolang.use_lazy_arrays(False)
+print('Back to eager arrays:')
+print('  indexes = {}'.format(u.root.p_indexes))
+
+print('main.py: Done.')
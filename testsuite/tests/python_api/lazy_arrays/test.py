@@ -0,0 +1,31 @@
+"""
+Test that lazy arrays in the Python API behave like the lists that the default
+eager conversion returns, and that lazy arrays of nodes become stale when
+their units are reparsed.
+"""
+
+from langkit.dsl import ASTNode, has_abstract_list
+
+from utils import build_and_run
+
+
+@has_abstract_list
+class FooNode(ASTNode):
+    pass
+
+
+class Sequence(FooNode.list):
+    pass
+
+
+class Example(FooNode):
+    pass
+
+
+class NullNode(FooNode):
+    pass
+
+
+build_and_run(lkt_file='expected_concrete_syntax.lkt', py_script='main.py',
+              types_from_lkt=True)
+print('Done')
@@ -0,0 +1,39 @@
+import libfoolang
+from libfoolang import _py2to3
+
+
+print('main.py: Running...')
+
+ctx = libfoolang.AnalysisContext()
+ctx.use_memory_mapped_files(True)
+
+
+def process(filename, content, charset):
+    with open(filename, 'wb') as f:
+        f.write(content)
+
+    print('== {} ({}) =='.format(_py2to3.bytes_repr(content), charset))
+    u = ctx.get_from_file(filename, charset, reparse=True)
+    if u.diagnostics:
+        for d in u.diagnostics:
+            print('  {}'.format(d.message))
+        print('')
+        return
+
+    print('  root: {}'.format(u.root))
+    print('  unit text: {}'.format(_py2to3.text_repr(u.text)))
+    for t in u.iter_tokens():
+        print('  {}'.format(t))
+    print('')
+
+
+# Single-byte charsets are lexed from the mapped file
+process('foo.txt', b'\texample\t# H\xe9llo\n', 'iso-8859-1')
+process('foo.txt', b'example # Hello\n\t# World\n', 'ascii')
+process('foo.txt', b'example # H\xe9llo\n', 'ascii')
+
+# Other charsets and byte order marks go through the regular decoding
+process('foo.txt', b'example # \xe2\x82\xac\n', 'utf-8')
+process('foo.txt', b'\xef\xbb\xbfexample # \xe2\x82\xac\n', '')
+
+print('main.py: Done.')
@@ -0,0 +1,47 @@
+import libfoolang
+from libfoolang import _py2to3
+
+
+print('main.py: Running...')
+
+ctx = libfoolang.AnalysisContext()
+u = ctx.get_from_buffer('main.txt', b'example # Hello\n')
+root = u.root
+
+
+def edit(start, end, text):
+    sloc_range = libfoolang.SlocRange(libfoolang.Sloc(*start),
+                                      libfoolang.Sloc(*end))
+    print('== Replace {} with {} =='.format(sloc_range,
+                                           _py2to3.text_repr(text)))
+    try:
+        u.reparse_edit(sloc_range, text)
+    except libfoolang.PreconditionFailure as exc:
+        print('  PreconditionFailure: {}'.format(exc))
+        print('')
+        return
+
+    print('  unit text: {}'.format(_py2to3.text_repr(u.text)))
+    for d in u.diagnostics:
+        print('  {}'.format(d.message))
+    try:
+        print('  old root: {}'.format(root))
+        print('  same root: {}'.format(root == u.root))
+    except libfoolang.StaleReferenceError:
+        print('  old root: <stale>')
+    print('')
+
+
+# Edits that change only trivia keep the tree
+edit((1, 11), (1, 16), u'World')
+edit((1, 1), (1, 1), u'  ')
+edit((1, 3), (1, 3), u'')
+
+# Other edits trigger a regular reparse
+edit((1, 10), (1, 10), u' example')
+
+# Invalid edit ranges are rejected
+edit((3, 1), (3, 1), u'example')
+edit((1, 5), (1, 2), u'example')
+
+print('main.py: Done.')
@@ -23,4 +23,9 @@ for s in (None, 42, 'my_ident', 'MY_IDENT', 'no_such_symbol',
         result = 'raised <InvalidSymbolError: {}>'.format(exc)
     print('u.root.p_sym({}) {}'.format(repr(s), result))
 
+# Symbols are cached per context: check that looking them up again yields
+# the same results.
+for s in ('my_ident', 'MY_IDENT', b'my_ident'):
+    assert u.root.p_sym(s) == 'my_ident'
+
 print('main.py: Done.')
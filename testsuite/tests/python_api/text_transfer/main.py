@@ -0,0 +1,26 @@
+import libfoolang
+
+
+print('main.py: Running...')
+
+ctx = libfoolang.AnalysisContext()
+
+# Small texts are transferred in UTF-32 while big ones are transferred in
+# Latin-1 or UTF-8: check all combinations.
+for label, comment in [
+    ('small ASCII', u'# hello'),
+    ('small Latin-1', u'# h\xe9llo'),
+    ('small non-Latin-1', u'# h☃llo'),
+    ('big ASCII', u'# ' + u'hello' * 1000),
+    ('big Latin-1', u'# ' + u'h\xe9llo' * 1000),
+    ('big non-Latin-1', u'# ' + u'h☃llo' * 1000),
+]:
+    buffer = comment + u'\n(a b)\n'
+    u = ctx.get_from_buffer('{}.txt'.format(label), buffer.encode('utf-8'),
+                            charset='utf-8')
+    assert u.text == buffer
+    assert u.first_token.text == comment
+    assert u.root.text == u'(a b)'
+    print('{}: {} characters'.format(label, len(u.text)))
+
+print('main.py: Done.')
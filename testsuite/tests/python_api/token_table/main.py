@@ -0,0 +1,49 @@
+import gc
+import sys
+
+import libfoolang
+
+
+print('main.py: Running...')
+
+ctx = libfoolang.AnalysisContext()
+u = ctx.get_from_buffer('foo.txt', b' (a (b c) d) ')
+if u.diagnostics:
+    for d in u.diagnostics:
+        print(d)
+    sys.exit(1)
+
+table = u.token_table()
+print('Exported {} tokens and trivia'.format(len(table)))
+
+# Check that the table matches the regular token iteration
+tokens = list(u.iter_tokens())
+assert len(tokens) == len(table) == u.token_count + u.trivia_count
+
+text = u.text
+for i, tok in enumerate(tokens):
+    assert table.kind_name(i) == tok.kind
+    assert bool(table.is_trivia[i]) == tok.is_trivia
+    assert text[table.start_offsets[i]:table.end_offsets[i]] == tok.text
+    sloc_range = tok.sloc_range
+    assert (table.start_lines[i], table.start_columns[i],
+            table.end_lines[i], table.end_columns[i]) == (
+        sloc_range.start.line, sloc_range.start.column,
+        sloc_range.end.line, sloc_range.end.column
+    )
+    print('{}: {}{} {!r}'.format(i, table.kind_name(i),
+                                 ' (trivia)' if table.is_trivia[i] else '',
+                                 tok.text))
+
+# Columns must outlive the table they come from
+kinds = table.kinds
+expected_kinds = list(kinds)
+del table
+gc.collect()
+assert list(kinds) == expected_kinds
+
+# Empty units yield empty tables
+empty = ctx.get_from_buffer('empty.txt', b'')
+print('Empty unit: {} tokens'.format(len(empty.token_table())))
+
+print('main.py: Done.')